@@ -0,0 +1,28 @@
+#include <lib/oomph.h>
+#include "1plus2_0cc083d2c1.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            struct class_Str var3;
+            var3.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+(void)0;
+var2 = oomph_int_add(var0,var1);
+string_decref(var3);
+var3.buf = NULL;
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+out: (void)0;
+string_decref(var3);
+(void)0;
+(void)0;
+(void)0;
+}
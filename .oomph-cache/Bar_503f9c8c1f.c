@@ -0,0 +1,83 @@
+#include <lib/oomph.h>
+#include "Bar_503f9c8c1f.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0Bar_ddc35f88fa_buf = {
+                .refcount = -1,
+                .data = (char[]){ 66,97,114 },
+                .malloced = false,
+            };
+            static struct class_Str string0Bar_ddc35f88fa = {
+                .buf = &string0Bar_ddc35f88fa_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+                struct class_Str meth_Bar_503f9c8c1f_to_string(struct class_Bar_503f9c8c1f obj)
+                {
+                    struct class_Str valstr;
+                    switch(obj.membernum) {
+                        
+                        case 0:
+                            valstr = meth_Int_to_string(obj.val.item0);
+                            break;
+                        
+                        case 1:
+                            valstr = meth_Str_to_string(obj.val.item1);
+                            break;
+                        
+                        default:
+                            panic_printf(
+                                "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                                string_to_cstr(string0Bar_ddc35f88fa), (int)obj.membernum);
+                    }
+
+                    struct class_Str res = string0Bar_ddc35f88fa;
+                    string_incref(res);
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    oomph_string_concat_inplace(&res, valstr);
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    string_decref(valstr);
+                    return res;
+                }
+
+                bool meth_Bar_503f9c8c1f_equals(struct class_Bar_503f9c8c1f a, struct class_Bar_503f9c8c1f b)
+                {
+                    if (a.membernum != b.membernum)
+                        return false;
+                    switch(a.membernum) {
+                        
+                        case 0:
+                            return meth_Int_equals(a.val.item0, b.val.item0);
+                        
+                        case 1:
+                            return meth_Str_equals(a.val.item1, b.val.item1);
+                        
+                        default:
+                            panic_printf(
+                                "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                                string_to_cstr(string0Bar_ddc35f88fa), (int)a.membernum);
+                    }
+                }
+                
+                void incref_Bar_503f9c8c1f(struct class_Bar_503f9c8c1f obj) {
+                    switch(obj.membernum) {
+                        case 0: (void)0; break;
+case 1: string_incref(obj.val.item1); break;
+
+                        default:
+                            assert(0);
+                    }
+                }
+                void decref_Bar_503f9c8c1f(struct class_Bar_503f9c8c1f obj) {
+                    switch(obj.membernum) {
+                        case -1:   // variable not in use (see UnSet)
+                            break;
+                        case 0: (void)0; break;
+case 1: string_decref(obj.val.item1); break;
+
+                        default:
+                            assert(0);
+                    }
+                }
+                
\ No newline at end of file
@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Bar_503f9c8c1f
+            #define HEADER_GUARD_Bar_503f9c8c1f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+                struct class_Bar_503f9c8c1f {
+                    union {
+                        int64_t item0;
+struct class_Str item1;
+
+                    } val;
+                    short membernum;
+                };
+                
+                struct class_Str meth_Bar_503f9c8c1f_to_string(struct class_Bar_503f9c8c1f obj);
+                bool meth_Bar_503f9c8c1f_equals(struct class_Bar_503f9c8c1f a, struct class_Bar_503f9c8c1f b);
+                
+                void incref_Bar_503f9c8c1f(struct class_Bar_503f9c8c1f obj);
+                void decref_Bar_503f9c8c1f(struct class_Bar_503f9c8c1f obj);
+                
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_Bar_7bb3f2569c
+            #define HEADER_GUARD_Bar_7bb3f2569c
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+struct class_Foo_1356c67d7a;
+
+                struct class_Bar_7bb3f2569c {
+                    union {
+                        struct class_Foo_1356c67d7a* item0;
+struct class_Str item1;
+
+                    } val;
+                    short membernum;
+                };
+                
+                struct class_Str meth_Bar_7bb3f2569c_to_string(struct class_Bar_7bb3f2569c obj);
+                bool meth_Bar_7bb3f2569c_equals(struct class_Bar_7bb3f2569c a, struct class_Bar_7bb3f2569c b);
+                
+                void incref_Bar_7bb3f2569c(struct class_Bar_7bb3f2569c obj);
+                void decref_Bar_7bb3f2569c(struct class_Bar_7bb3f2569c obj);
+                
+            #endif
+            
\ No newline at end of file
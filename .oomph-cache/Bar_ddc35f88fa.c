@@ -0,0 +1,54 @@
+#include <lib/oomph.h>
+#include "Bar_ddc35f88fa.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0Bar_ddc35f88fa_buf = {
+                .refcount = -1,
+                .data = (char[]){ 66,97,114 },
+                .malloced = false,
+            };
+            static struct class_Str string0Bar_ddc35f88fa = {
+                .buf = &string0Bar_ddc35f88fa_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+                    struct class_Bar_ddc35f88fa* ctor_Bar_ddc35f88fa(void)
+                    {
+                        struct class_Bar_ddc35f88fa* obj = malloc(sizeof(*obj));
+                        assert(obj);
+                        obj->refcount = 1;
+                        
+                        
+                        return obj;
+                    }
+
+                    void dtor_Bar_ddc35f88fa(void *ptr)
+                    {
+                        struct class_Bar_ddc35f88fa *obj = ptr;
+                        
+                        free(obj);
+                    }
+                    
+                        struct class_Str meth_Bar_ddc35f88fa_to_string(struct class_Bar_ddc35f88fa* self)
+                        {
+                            struct class_Str res = string0Bar_ddc35f88fa;
+                            struct class_Str tmp;
+                            oomph_string_concat_inplace_cstr(&res, "(");
+                            
+                            oomph_string_concat_inplace_cstr(&res, ")");
+                            return res;
+                        }
+                        bool meth_Bar_ddc35f88fa_equals(struct class_Bar_ddc35f88fa* var0,struct class_Bar_ddc35f88fa* var1){
+            bool var2;
+            
+            bool retval;
+            var2 = (var0 == var1);
+
+                        (void)0;
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_Bar_ddc35f88fa
+            #define HEADER_GUARD_Bar_ddc35f88fa
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+                    struct class_Bar_ddc35f88fa {
+                        REFCOUNT_HEADER
+                        
+                    };
+                    
+                    struct class_Bar_ddc35f88fa* ctor_Bar_ddc35f88fa(void);
+                    void dtor_Bar_ddc35f88fa(void *ptr);
+                    
+                        struct class_Str meth_Bar_ddc35f88fa_to_string(struct class_Bar_ddc35f88fa* obj);
+                        bool meth_Bar_ddc35f88fa_equals(struct class_Bar_ddc35f88fa* var0,struct class_Bar_ddc35f88fa* var1);
+
+            #endif
+            
\ No newline at end of file
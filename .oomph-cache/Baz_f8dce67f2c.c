@@ -0,0 +1,54 @@
+#include <lib/oomph.h>
+#include "Baz_f8dce67f2c.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0Baz_f8dce67f2c_buf = {
+                .refcount = -1,
+                .data = (char[]){ 66,97,122 },
+                .malloced = false,
+            };
+            static struct class_Str string0Baz_f8dce67f2c = {
+                .buf = &string0Baz_f8dce67f2c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+                    struct class_Baz_f8dce67f2c* ctor_Baz_f8dce67f2c(void)
+                    {
+                        struct class_Baz_f8dce67f2c* obj = malloc(sizeof(*obj));
+                        assert(obj);
+                        obj->refcount = 1;
+                        
+                        
+                        return obj;
+                    }
+
+                    void dtor_Baz_f8dce67f2c(void *ptr)
+                    {
+                        struct class_Baz_f8dce67f2c *obj = ptr;
+                        
+                        free(obj);
+                    }
+                    
+                        struct class_Str meth_Baz_f8dce67f2c_to_string(struct class_Baz_f8dce67f2c* self)
+                        {
+                            struct class_Str res = string0Baz_f8dce67f2c;
+                            struct class_Str tmp;
+                            oomph_string_concat_inplace_cstr(&res, "(");
+                            
+                            oomph_string_concat_inplace_cstr(&res, ")");
+                            return res;
+                        }
+                        bool meth_Baz_f8dce67f2c_equals(struct class_Baz_f8dce67f2c* var0,struct class_Baz_f8dce67f2c* var1){
+            bool var2;
+            
+            bool retval;
+            var2 = (var0 == var1);
+
+                        (void)0;
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_Baz_f8dce67f2c
+            #define HEADER_GUARD_Baz_f8dce67f2c
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+                    struct class_Baz_f8dce67f2c {
+                        REFCOUNT_HEADER
+                        
+                    };
+                    
+                    struct class_Baz_f8dce67f2c* ctor_Baz_f8dce67f2c(void);
+                    void dtor_Baz_f8dce67f2c(void *ptr);
+                    
+                        struct class_Str meth_Baz_f8dce67f2c_to_string(struct class_Baz_f8dce67f2c* obj);
+                        bool meth_Baz_f8dce67f2c_equals(struct class_Baz_f8dce67f2c* var0,struct class_Baz_f8dce67f2c* var1);
+
+            #endif
+            
\ No newline at end of file
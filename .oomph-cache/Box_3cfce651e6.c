@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "Box_3cfce651e6.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0Box_3cfce651e6_buf = {
+                .refcount = -1,
+                .data = (char[]){ 66,111,120 },
+                .malloced = false,
+            };
+            static struct class_Str string0Box_3cfce651e6 = {
+                .buf = &string0Box_3cfce651e6_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+                    struct class_Box_3cfce651e6* ctor_Box_3cfce651e6(struct class_Str arg_name)
+                    {
+                        struct class_Box_3cfce651e6* obj = malloc(sizeof(*obj));
+                        assert(obj);
+                        obj->refcount = 1;
+                        obj->memb_name = arg_name;
+
+                        string_incref(obj->memb_name);
+
+                        return obj;
+                    }
+
+                    void dtor_Box_3cfce651e6(void *ptr)
+                    {
+                        struct class_Box_3cfce651e6 *obj = ptr;
+                        string_decref(obj->memb_name);
+
+                        free(obj);
+                    }
+                    
+                        struct class_Str meth_Box_3cfce651e6_to_string(struct class_Box_3cfce651e6* self)
+                        {
+                            struct class_Str res = string0Box_3cfce651e6;
+                            struct class_Str tmp;
+                            oomph_string_concat_inplace_cstr(&res, "(");
+                            
+                                tmp = meth_Str_to_string(self->memb_name);
+                                oomph_string_concat_inplace(&res, tmp);
+                                string_decref(tmp);
+                                
+                            oomph_string_concat_inplace_cstr(&res, ")");
+                            return res;
+                        }
+                        bool meth_Box_3cfce651e6_equals(struct class_Box_3cfce651e6* var0,struct class_Box_3cfce651e6* var1){
+            bool var2;
+            
+            bool retval;
+            var2 = (var0 == var1);
+
+                        (void)0;
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+(void)0;
+return retval;
+}
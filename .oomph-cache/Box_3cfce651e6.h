@@ -0,0 +1,20 @@
+
+            #ifndef HEADER_GUARD_Box_3cfce651e6
+            #define HEADER_GUARD_Box_3cfce651e6
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+                    struct class_Box_3cfce651e6 {
+                        REFCOUNT_HEADER
+                        struct class_Str memb_name;
+
+                    };
+                    
+                    struct class_Box_3cfce651e6* ctor_Box_3cfce651e6(struct class_Str arg_name);
+                    void dtor_Box_3cfce651e6(void *ptr);
+                    
+                        struct class_Str meth_Box_3cfce651e6_to_string(struct class_Box_3cfce651e6* obj);
+                        bool meth_Box_3cfce651e6_equals(struct class_Box_3cfce651e6* var0,struct class_Box_3cfce651e6* var1);
+
+            #endif
+            
\ No newline at end of file
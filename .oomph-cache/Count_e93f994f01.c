@@ -0,0 +1,168 @@
+#include <lib/oomph.h>
+#include "Count_e93f994f01.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0Count_e93f994f01_buf = {
+                .refcount = -1,
+                .data = (char[]){ 67,111,117,110,116 },
+                .malloced = false,
+            };
+            static struct class_Str string0Count_e93f994f01 = {
+                .buf = &string0Count_e93f994f01_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+                    struct class_Count_e93f994f01* ctor_Count_e93f994f01(void)
+                    {
+                        struct class_Count_e93f994f01* obj = malloc(sizeof(*obj));
+                        assert(obj);
+                        obj->refcount = 1;
+                        
+                        
+                        return obj;
+                    }
+
+                    void dtor_Count_e93f994f01(void *ptr)
+                    {
+                        struct class_Count_e93f994f01 *obj = ptr;
+                        
+                        free(obj);
+                    }
+                    
+                        struct class_Str meth_Count_e93f994f01_to_string(struct class_Count_e93f994f01* self)
+                        {
+                            struct class_Str res = string0Count_e93f994f01;
+                            struct class_Str tmp;
+                            oomph_string_concat_inplace_cstr(&res, "(");
+                            
+                            oomph_string_concat_inplace_cstr(&res, ")");
+                            return res;
+                        }
+                        bool meth_Count_e93f994f01_equals(struct class_Count_e93f994f01* var0,struct class_Count_e93f994f01* var1){
+            bool var2;
+            
+            bool retval;
+            var2 = (var0 == var1);
+
+                        (void)0;
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+(void)0;
+return retval;
+}
+void meth_Count_e93f994f01_down(struct class_Count_e93f994f01* var0,int64_t var1){
+            struct class_Count_e93f994f01* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            int64_t var9;
+            
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            struct class_Count_e93f994f01* var12;
+            var12 = NULL;
+var2 = var0;
+incref(var2);
+var3 = var1;
+(void)0;
+(void)0;
+var4 = var3;
+(void)0;
+(void)0;
+var5 = 0LL;
+(void)0;
+var6 = meth_Int_equals(var4,var5);
+(void)0;
+var7 = oomph_bool_not(var6);
+
+                if (var7)
+                    goto label0;
+                (void)0;
+var8 = oomph_true;
+
+                if (var8)
+                    goto label1;
+                label0: (void)0;
+(void)0;
+var9 = var3;
+(void)0;
+string_decref(var10);
+var10.buf = NULL;
+var10 = meth_Int_to_string(var9);
+oomph_print(var10);
+(void)0;
+var11 = var3;
+(void)0;
+decref((var12), dtor_Count_e93f994f01);
+var12 = NULL;
+var12 = var2;
+incref(var12);
+meth_Count_e93f994f01_down2(var12,var11);
+label1: (void)0;
+out: (void)0;
+decref((var12), dtor_Count_e93f994f01);
+(void)0;
+string_decref(var10);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_Count_e93f994f01);
+}
+void meth_Count_e93f994f01_down2(struct class_Count_e93f994f01* var0,int64_t var1){
+            struct class_Count_e93f994f01* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            
+            int64_t var6;
+            
+            struct class_Count_e93f994f01* var7;
+            var7 = NULL;
+var2 = var0;
+incref(var2);
+var3 = var1;
+(void)0;
+(void)0;
+var4 = var3;
+(void)0;
+(void)0;
+var5 = 1LL;
+(void)0;
+var6 = oomph_int_sub(var4,var5);
+decref((var7), dtor_Count_e93f994f01);
+var7 = NULL;
+var7 = var2;
+incref(var7);
+meth_Count_e93f994f01_down(var7,var6);
+out: (void)0;
+decref((var7), dtor_Count_e93f994f01);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_Count_e93f994f01);
+}
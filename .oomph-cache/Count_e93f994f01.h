@@ -0,0 +1,21 @@
+
+            #ifndef HEADER_GUARD_Count_e93f994f01
+            #define HEADER_GUARD_Count_e93f994f01
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+                    struct class_Count_e93f994f01 {
+                        REFCOUNT_HEADER
+                        
+                    };
+                    
+                    struct class_Count_e93f994f01* ctor_Count_e93f994f01(void);
+                    void dtor_Count_e93f994f01(void *ptr);
+                    
+                        struct class_Str meth_Count_e93f994f01_to_string(struct class_Count_e93f994f01* obj);
+                        bool meth_Count_e93f994f01_equals(struct class_Count_e93f994f01* var0,struct class_Count_e93f994f01* var1);
+void meth_Count_e93f994f01_down(struct class_Count_e93f994f01* var0,int64_t var1);
+void meth_Count_e93f994f01_down2(struct class_Count_e93f994f01* var0,int64_t var1);
+
+            #endif
+            
\ No newline at end of file
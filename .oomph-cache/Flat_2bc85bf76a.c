@@ -0,0 +1,95 @@
+#include <lib/oomph.h>
+#include "Flat_2bc85bf76a.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+#include "Bar_ddc35f88fa.h"
+#include "Baz_f8dce67f2c.h"
+
+            static struct StringBuf string0Flat_745e3db6a7_buf = {
+                .refcount = -1,
+                .data = (char[]){ 70,108,97,116 },
+                .malloced = false,
+            };
+            static struct class_Str string0Flat_745e3db6a7 = {
+                .buf = &string0Flat_745e3db6a7_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+                struct class_Str meth_Flat_2bc85bf76a_to_string(struct class_Flat_2bc85bf76a obj)
+                {
+                    struct class_Str valstr;
+                    switch(obj.membernum) {
+                        
+                        case 0:
+                            valstr = meth_Foo_1356c67d7a_to_string(obj.val.item0);
+                            break;
+                        
+                        case 1:
+                            valstr = meth_Bar_ddc35f88fa_to_string(obj.val.item1);
+                            break;
+                        
+                        case 2:
+                            valstr = meth_Baz_f8dce67f2c_to_string(obj.val.item2);
+                            break;
+                        
+                        default:
+                            panic_printf(
+                                "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                                string_to_cstr(string0Flat_745e3db6a7), (int)obj.membernum);
+                    }
+
+                    struct class_Str res = string0Flat_745e3db6a7;
+                    string_incref(res);
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    oomph_string_concat_inplace(&res, valstr);
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    string_decref(valstr);
+                    return res;
+                }
+
+                bool meth_Flat_2bc85bf76a_equals(struct class_Flat_2bc85bf76a a, struct class_Flat_2bc85bf76a b)
+                {
+                    if (a.membernum != b.membernum)
+                        return false;
+                    switch(a.membernum) {
+                        
+                        case 0:
+                            return meth_Foo_1356c67d7a_equals(a.val.item0, b.val.item0);
+                        
+                        case 1:
+                            return meth_Bar_ddc35f88fa_equals(a.val.item1, b.val.item1);
+                        
+                        case 2:
+                            return meth_Baz_f8dce67f2c_equals(a.val.item2, b.val.item2);
+                        
+                        default:
+                            panic_printf(
+                                "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                                string_to_cstr(string0Flat_745e3db6a7), (int)a.membernum);
+                    }
+                }
+                
+                void incref_Flat_2bc85bf76a(struct class_Flat_2bc85bf76a obj) {
+                    switch(obj.membernum) {
+                        case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+case 2: incref(obj.val.item2); break;
+
+                        default:
+                            assert(0);
+                    }
+                }
+                void decref_Flat_2bc85bf76a(struct class_Flat_2bc85bf76a obj) {
+                    switch(obj.membernum) {
+                        case -1:   // variable not in use (see UnSet)
+                            break;
+                        case 0: decref((obj.val.item0), dtor_Foo_1356c67d7a); break;
+case 1: decref((obj.val.item1), dtor_Bar_ddc35f88fa); break;
+case 2: decref((obj.val.item2), dtor_Baz_f8dce67f2c); break;
+
+                        default:
+                            assert(0);
+                    }
+                }
+                
\ No newline at end of file
@@ -0,0 +1,30 @@
+
+            #ifndef HEADER_GUARD_Flat_2bc85bf76a
+            #define HEADER_GUARD_Flat_2bc85bf76a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+#include "Bar_ddc35f88fa.h"
+#include "Baz_f8dce67f2c.h"
+struct class_Foo_1356c67d7a;
+struct class_Bar_ddc35f88fa;
+struct class_Baz_f8dce67f2c;
+
+                struct class_Flat_2bc85bf76a {
+                    union {
+                        struct class_Foo_1356c67d7a* item0;
+struct class_Bar_ddc35f88fa* item1;
+struct class_Baz_f8dce67f2c* item2;
+
+                    } val;
+                    short membernum;
+                };
+                
+                struct class_Str meth_Flat_2bc85bf76a_to_string(struct class_Flat_2bc85bf76a obj);
+                bool meth_Flat_2bc85bf76a_equals(struct class_Flat_2bc85bf76a a, struct class_Flat_2bc85bf76a b);
+                
+                void incref_Flat_2bc85bf76a(struct class_Flat_2bc85bf76a obj);
+                void decref_Flat_2bc85bf76a(struct class_Flat_2bc85bf76a obj);
+                
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,54 @@
+#include <lib/oomph.h>
+#include "Foo0_5e77621507.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0Foo0_5e77621507_buf = {
+                .refcount = -1,
+                .data = (char[]){ 70,111,111,48 },
+                .malloced = false,
+            };
+            static struct class_Str string0Foo0_5e77621507 = {
+                .buf = &string0Foo0_5e77621507_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+                    struct class_Foo0_5e77621507* ctor_Foo0_5e77621507(void)
+                    {
+                        struct class_Foo0_5e77621507* obj = malloc(sizeof(*obj));
+                        assert(obj);
+                        obj->refcount = 1;
+                        
+                        
+                        return obj;
+                    }
+
+                    void dtor_Foo0_5e77621507(void *ptr)
+                    {
+                        struct class_Foo0_5e77621507 *obj = ptr;
+                        
+                        free(obj);
+                    }
+                    
+                        struct class_Str meth_Foo0_5e77621507_to_string(struct class_Foo0_5e77621507* self)
+                        {
+                            struct class_Str res = string0Foo0_5e77621507;
+                            struct class_Str tmp;
+                            oomph_string_concat_inplace_cstr(&res, "(");
+                            
+                            oomph_string_concat_inplace_cstr(&res, ")");
+                            return res;
+                        }
+                        bool meth_Foo0_5e77621507_equals(struct class_Foo0_5e77621507* var0,struct class_Foo0_5e77621507* var1){
+            bool var2;
+            
+            bool retval;
+            var2 = (var0 == var1);
+
+                        (void)0;
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_Foo0_5e77621507
+            #define HEADER_GUARD_Foo0_5e77621507
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+                    struct class_Foo0_5e77621507 {
+                        REFCOUNT_HEADER
+                        
+                    };
+                    
+                    struct class_Foo0_5e77621507* ctor_Foo0_5e77621507(void);
+                    void dtor_Foo0_5e77621507(void *ptr);
+                    
+                        struct class_Str meth_Foo0_5e77621507_to_string(struct class_Foo0_5e77621507* obj);
+                        bool meth_Foo0_5e77621507_equals(struct class_Foo0_5e77621507* var0,struct class_Foo0_5e77621507* var1);
+
+            #endif
+            
\ No newline at end of file
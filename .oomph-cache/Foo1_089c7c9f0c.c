@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "Foo1_089c7c9f0c.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0Foo1_089c7c9f0c_buf = {
+                .refcount = -1,
+                .data = (char[]){ 70,111,111,49 },
+                .malloced = false,
+            };
+            static struct class_Str string0Foo1_089c7c9f0c = {
+                .buf = &string0Foo1_089c7c9f0c_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+                    struct class_Foo1_089c7c9f0c* ctor_Foo1_089c7c9f0c(int64_t arg_x)
+                    {
+                        struct class_Foo1_089c7c9f0c* obj = malloc(sizeof(*obj));
+                        assert(obj);
+                        obj->refcount = 1;
+                        obj->memb_x = arg_x;
+
+                        (void)0;
+
+                        return obj;
+                    }
+
+                    void dtor_Foo1_089c7c9f0c(void *ptr)
+                    {
+                        struct class_Foo1_089c7c9f0c *obj = ptr;
+                        (void)0;
+
+                        free(obj);
+                    }
+                    
+                        struct class_Str meth_Foo1_089c7c9f0c_to_string(struct class_Foo1_089c7c9f0c* self)
+                        {
+                            struct class_Str res = string0Foo1_089c7c9f0c;
+                            struct class_Str tmp;
+                            oomph_string_concat_inplace_cstr(&res, "(");
+                            
+                                tmp = meth_Int_to_string(self->memb_x);
+                                oomph_string_concat_inplace(&res, tmp);
+                                string_decref(tmp);
+                                
+                            oomph_string_concat_inplace_cstr(&res, ")");
+                            return res;
+                        }
+                        bool meth_Foo1_089c7c9f0c_equals(struct class_Foo1_089c7c9f0c* var0,struct class_Foo1_089c7c9f0c* var1){
+            bool var2;
+            
+            bool retval;
+            var2 = (var0 == var1);
+
+                        (void)0;
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+(void)0;
+return retval;
+}
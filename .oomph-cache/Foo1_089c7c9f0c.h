@@ -0,0 +1,20 @@
+
+            #ifndef HEADER_GUARD_Foo1_089c7c9f0c
+            #define HEADER_GUARD_Foo1_089c7c9f0c
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+                    struct class_Foo1_089c7c9f0c {
+                        REFCOUNT_HEADER
+                        int64_t memb_x;
+
+                    };
+                    
+                    struct class_Foo1_089c7c9f0c* ctor_Foo1_089c7c9f0c(int64_t arg_x);
+                    void dtor_Foo1_089c7c9f0c(void *ptr);
+                    
+                        struct class_Str meth_Foo1_089c7c9f0c_to_string(struct class_Foo1_089c7c9f0c* obj);
+                        bool meth_Foo1_089c7c9f0c_equals(struct class_Foo1_089c7c9f0c* var0,struct class_Foo1_089c7c9f0c* var1);
+
+            #endif
+            
\ No newline at end of file
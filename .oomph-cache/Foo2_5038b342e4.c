@@ -0,0 +1,68 @@
+#include <lib/oomph.h>
+#include "Foo2_5038b342e4.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0Foo2_5038b342e4_buf = {
+                .refcount = -1,
+                .data = (char[]){ 70,111,111,50 },
+                .malloced = false,
+            };
+            static struct class_Str string0Foo2_5038b342e4 = {
+                .buf = &string0Foo2_5038b342e4_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+                    struct class_Foo2_5038b342e4* ctor_Foo2_5038b342e4(int64_t arg_x,struct class_Str arg_y)
+                    {
+                        struct class_Foo2_5038b342e4* obj = malloc(sizeof(*obj));
+                        assert(obj);
+                        obj->refcount = 1;
+                        obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+                        (void)0;
+string_incref(obj->memb_y);
+
+                        return obj;
+                    }
+
+                    void dtor_Foo2_5038b342e4(void *ptr)
+                    {
+                        struct class_Foo2_5038b342e4 *obj = ptr;
+                        (void)0;
+string_decref(obj->memb_y);
+
+                        free(obj);
+                    }
+                    
+                        struct class_Str meth_Foo2_5038b342e4_to_string(struct class_Foo2_5038b342e4* self)
+                        {
+                            struct class_Str res = string0Foo2_5038b342e4;
+                            struct class_Str tmp;
+                            oomph_string_concat_inplace_cstr(&res, "(");
+                            
+                                tmp = meth_Int_to_string(self->memb_x);
+                                oomph_string_concat_inplace(&res, tmp);
+                                string_decref(tmp);
+                                oomph_string_concat_inplace_cstr(&res, ", ");
+                                tmp = meth_Str_to_string(self->memb_y);
+                                oomph_string_concat_inplace(&res, tmp);
+                                string_decref(tmp);
+                                
+                            oomph_string_concat_inplace_cstr(&res, ")");
+                            return res;
+                        }
+                        bool meth_Foo2_5038b342e4_equals(struct class_Foo2_5038b342e4* var0,struct class_Foo2_5038b342e4* var1){
+            bool var2;
+            
+            bool retval;
+            var2 = (var0 == var1);
+
+                        (void)0;
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+(void)0;
+return retval;
+}
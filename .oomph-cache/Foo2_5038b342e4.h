@@ -0,0 +1,21 @@
+
+            #ifndef HEADER_GUARD_Foo2_5038b342e4
+            #define HEADER_GUARD_Foo2_5038b342e4
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+                    struct class_Foo2_5038b342e4 {
+                        REFCOUNT_HEADER
+                        int64_t memb_x;
+struct class_Str memb_y;
+
+                    };
+                    
+                    struct class_Foo2_5038b342e4* ctor_Foo2_5038b342e4(int64_t arg_x,struct class_Str arg_y);
+                    void dtor_Foo2_5038b342e4(void *ptr);
+                    
+                        struct class_Str meth_Foo2_5038b342e4_to_string(struct class_Foo2_5038b342e4* obj);
+                        bool meth_Foo2_5038b342e4_equals(struct class_Foo2_5038b342e4* var0,struct class_Foo2_5038b342e4* var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,75 @@
+#include <lib/oomph.h>
+#include "Foo3_d3de4e7edb.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0Foo3_d3de4e7edb_buf = {
+                .refcount = -1,
+                .data = (char[]){ 70,111,111,51 },
+                .malloced = false,
+            };
+            static struct class_Str string0Foo3_d3de4e7edb = {
+                .buf = &string0Foo3_d3de4e7edb_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+                    struct class_Foo3_d3de4e7edb* ctor_Foo3_d3de4e7edb(int64_t arg_x,struct class_Str arg_y,bool arg_z)
+                    {
+                        struct class_Foo3_d3de4e7edb* obj = malloc(sizeof(*obj));
+                        assert(obj);
+                        obj->refcount = 1;
+                        obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+obj->memb_z = arg_z;
+
+                        (void)0;
+string_incref(obj->memb_y);
+(void)0;
+
+                        return obj;
+                    }
+
+                    void dtor_Foo3_d3de4e7edb(void *ptr)
+                    {
+                        struct class_Foo3_d3de4e7edb *obj = ptr;
+                        (void)0;
+string_decref(obj->memb_y);
+(void)0;
+
+                        free(obj);
+                    }
+                    
+                        struct class_Str meth_Foo3_d3de4e7edb_to_string(struct class_Foo3_d3de4e7edb* self)
+                        {
+                            struct class_Str res = string0Foo3_d3de4e7edb;
+                            struct class_Str tmp;
+                            oomph_string_concat_inplace_cstr(&res, "(");
+                            
+                                tmp = meth_Int_to_string(self->memb_x);
+                                oomph_string_concat_inplace(&res, tmp);
+                                string_decref(tmp);
+                                oomph_string_concat_inplace_cstr(&res, ", ");
+                                tmp = meth_Str_to_string(self->memb_y);
+                                oomph_string_concat_inplace(&res, tmp);
+                                string_decref(tmp);
+                                oomph_string_concat_inplace_cstr(&res, ", ");
+                                tmp = meth_Bool_to_string(self->memb_z);
+                                oomph_string_concat_inplace(&res, tmp);
+                                string_decref(tmp);
+                                
+                            oomph_string_concat_inplace_cstr(&res, ")");
+                            return res;
+                        }
+                        bool meth_Foo3_d3de4e7edb_equals(struct class_Foo3_d3de4e7edb* var0,struct class_Foo3_d3de4e7edb* var1){
+            bool var2;
+            
+            bool retval;
+            var2 = (var0 == var1);
+
+                        (void)0;
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,22 @@
+
+            #ifndef HEADER_GUARD_Foo3_d3de4e7edb
+            #define HEADER_GUARD_Foo3_d3de4e7edb
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+                    struct class_Foo3_d3de4e7edb {
+                        REFCOUNT_HEADER
+                        int64_t memb_x;
+struct class_Str memb_y;
+bool memb_z;
+
+                    };
+                    
+                    struct class_Foo3_d3de4e7edb* ctor_Foo3_d3de4e7edb(int64_t arg_x,struct class_Str arg_y,bool arg_z);
+                    void dtor_Foo3_d3de4e7edb(void *ptr);
+                    
+                        struct class_Str meth_Foo3_d3de4e7edb_to_string(struct class_Foo3_d3de4e7edb* obj);
+                        bool meth_Foo3_d3de4e7edb_equals(struct class_Foo3_d3de4e7edb* var0,struct class_Foo3_d3de4e7edb* var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,54 @@
+#include <lib/oomph.h>
+#include "Foo_1356c67d7a.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ 70,111,111 },
+                .malloced = false,
+            };
+            static struct class_Str string0Foo_1356c67d7a = {
+                .buf = &string0Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+                    struct class_Foo_1356c67d7a* ctor_Foo_1356c67d7a(void)
+                    {
+                        struct class_Foo_1356c67d7a* obj = malloc(sizeof(*obj));
+                        assert(obj);
+                        obj->refcount = 1;
+                        
+                        
+                        return obj;
+                    }
+
+                    void dtor_Foo_1356c67d7a(void *ptr)
+                    {
+                        struct class_Foo_1356c67d7a *obj = ptr;
+                        
+                        free(obj);
+                    }
+                    
+                        struct class_Str meth_Foo_1356c67d7a_to_string(struct class_Foo_1356c67d7a* self)
+                        {
+                            struct class_Str res = string0Foo_1356c67d7a;
+                            struct class_Str tmp;
+                            oomph_string_concat_inplace_cstr(&res, "(");
+                            
+                            oomph_string_concat_inplace_cstr(&res, ")");
+                            return res;
+                        }
+                        bool meth_Foo_1356c67d7a_equals(struct class_Foo_1356c67d7a* var0,struct class_Foo_1356c67d7a* var1){
+            bool var2;
+            
+            bool retval;
+            var2 = (var0 == var1);
+
+                        (void)0;
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_Foo_1356c67d7a
+            #define HEADER_GUARD_Foo_1356c67d7a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+                    struct class_Foo_1356c67d7a {
+                        REFCOUNT_HEADER
+                        
+                    };
+                    
+                    struct class_Foo_1356c67d7a* ctor_Foo_1356c67d7a(void);
+                    void dtor_Foo_1356c67d7a(void *ptr);
+                    
+                        struct class_Str meth_Foo_1356c67d7a_to_string(struct class_Foo_1356c67d7a* obj);
+                        bool meth_Foo_1356c67d7a_equals(struct class_Foo_1356c67d7a* var0,struct class_Foo_1356c67d7a* var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,83 @@
+#include <lib/oomph.h>
+#include "Foo_395a93451f.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ 70,111,111 },
+                .malloced = false,
+            };
+            static struct class_Str string0Foo_1356c67d7a = {
+                .buf = &string0Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+                struct class_Str meth_Foo_395a93451f_to_string(struct class_Foo_395a93451f obj)
+                {
+                    struct class_Str valstr;
+                    switch(obj.membernum) {
+                        
+                        case 0:
+                            valstr = meth_Str_to_string(obj.val.item0);
+                            break;
+                        
+                        case 1:
+                            valstr = meth_Int_to_string(obj.val.item1);
+                            break;
+                        
+                        default:
+                            panic_printf(
+                                "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                                string_to_cstr(string0Foo_1356c67d7a), (int)obj.membernum);
+                    }
+
+                    struct class_Str res = string0Foo_1356c67d7a;
+                    string_incref(res);
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    oomph_string_concat_inplace(&res, valstr);
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    string_decref(valstr);
+                    return res;
+                }
+
+                bool meth_Foo_395a93451f_equals(struct class_Foo_395a93451f a, struct class_Foo_395a93451f b)
+                {
+                    if (a.membernum != b.membernum)
+                        return false;
+                    switch(a.membernum) {
+                        
+                        case 0:
+                            return meth_Str_equals(a.val.item0, b.val.item0);
+                        
+                        case 1:
+                            return meth_Int_equals(a.val.item1, b.val.item1);
+                        
+                        default:
+                            panic_printf(
+                                "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                                string_to_cstr(string0Foo_1356c67d7a), (int)a.membernum);
+                    }
+                }
+                
+                void incref_Foo_395a93451f(struct class_Foo_395a93451f obj) {
+                    switch(obj.membernum) {
+                        case 0: string_incref(obj.val.item0); break;
+case 1: (void)0; break;
+
+                        default:
+                            assert(0);
+                    }
+                }
+                void decref_Foo_395a93451f(struct class_Foo_395a93451f obj) {
+                    switch(obj.membernum) {
+                        case -1:   // variable not in use (see UnSet)
+                            break;
+                        case 0: string_decref(obj.val.item0); break;
+case 1: (void)0; break;
+
+                        default:
+                            assert(0);
+                    }
+                }
+                
\ No newline at end of file
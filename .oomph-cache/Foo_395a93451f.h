@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Foo_395a93451f
+            #define HEADER_GUARD_Foo_395a93451f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+                struct class_Foo_395a93451f {
+                    union {
+                        struct class_Str item0;
+int64_t item1;
+
+                    } val;
+                    short membernum;
+                };
+                
+                struct class_Str meth_Foo_395a93451f_to_string(struct class_Foo_395a93451f obj);
+                bool meth_Foo_395a93451f_equals(struct class_Foo_395a93451f a, struct class_Foo_395a93451f b);
+                
+                void incref_Foo_395a93451f(struct class_Foo_395a93451f obj);
+                void decref_Foo_395a93451f(struct class_Foo_395a93451f obj);
+                
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,100 @@
+
+            #ifndef HEADER_GUARD_List_Box__a0270328c2
+            #define HEADER_GUARD_List_Box__a0270328c2
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Box_3cfce651e6.h"
+struct class_Box_3cfce651e6;
+struct class_Box_3cfce651e6;
+struct class_Box_3cfce651e6;
+struct class_Box_3cfce651e6;
+struct class_Box_3cfce651e6;
+struct class_Box_3cfce651e6;
+struct class_Box_3cfce651e6;
+struct class_Box_3cfce651e6;
+struct class_Box_3cfce651e6;
+struct class_Box_3cfce651e6;
+struct class_Box_3cfce651e6;
+struct class_Box_3cfce651e6;
+struct class_Box_3cfce651e6;
+struct class_Box_3cfce651e6;
+
+#define CONSTRUCTOR ctor_List_Box__a0270328c2
+#define DESTRUCTOR dtor_List_Box__a0270328c2
+#define TYPE struct class_List_Box__a0270328c2 *
+#define TYPE_STRUCT class_List_Box__a0270328c2
+#define METHOD(name) meth_List_Box__a0270328c2_##name
+#define ITEMTYPE struct class_Box_3cfce651e6*
+#define ITEMTYPE_METHOD(name) meth_Box_3cfce651e6_##name
+#define INCREF_ITEM(val) incref((val))
+#define DECREF_ITEM(val) decref(((val)), dtor_Box_3cfce651e6)
+#define ITEMTYPE_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+#undef DESTRUCTOR
+#undef TYPE
+#undef TYPE_STRUCT
+#undef METHOD
+#undef ITEMTYPE
+#undef ITEMTYPE_METHOD
+#undef INCREF_ITEM
+#undef DECREF_ITEM
+#undef ITEMTYPE_IS_STRING
+bool meth_List_Box__a0270328c2___contains(struct class_List_Box__a0270328c2*,struct class_Box_3cfce651e6*);
+void meth_List_Box__a0270328c2___reserve(struct class_List_Box__a0270328c2*,int64_t);
+struct class_Box_3cfce651e6* meth_List_Box__a0270328c2_delete_at_index(struct class_List_Box__a0270328c2*,int64_t);
+void meth_List_Box__a0270328c2_delete_first(struct class_List_Box__a0270328c2*,struct class_Box_3cfce651e6*);
+void meth_List_Box__a0270328c2_delete_first(struct class_List_Box__a0270328c2*,struct class_Box_3cfce651e6*);
+void meth_List_Box__a0270328c2_delete_only(struct class_List_Box__a0270328c2*,struct class_Box_3cfce651e6*);
+struct class_List_Box__a0270328c2* meth_List_Box__a0270328c2_delete_slice(struct class_List_Box__a0270328c2*,int64_t,int64_t);
+bool meth_List_Box__a0270328c2_ends_with(struct class_List_Box__a0270328c2*,struct class_List_Box__a0270328c2*);
+bool meth_List_Box__a0270328c2_equals(struct class_List_Box__a0270328c2*,struct class_List_Box__a0270328c2*);
+int64_t meth_List_Box__a0270328c2_find_first(struct class_List_Box__a0270328c2*,struct class_Box_3cfce651e6*);
+int64_t meth_List_Box__a0270328c2_find_last(struct class_List_Box__a0270328c2*,struct class_Box_3cfce651e6*);
+int64_t meth_List_Box__a0270328c2_find_only(struct class_List_Box__a0270328c2*,struct class_Box_3cfce651e6*);
+struct class_Box_3cfce651e6* meth_List_Box__a0270328c2_first(struct class_List_Box__a0270328c2*);
+struct class_Box_3cfce651e6* meth_List_Box__a0270328c2_get(struct class_List_Box__a0270328c2*,int64_t);
+void meth_List_Box__a0270328c2_insert(struct class_List_Box__a0270328c2*,int64_t,struct class_Box_3cfce651e6*);
+struct class_Box_3cfce651e6* meth_List_Box__a0270328c2_last(struct class_List_Box__a0270328c2*);
+int64_t meth_List_Box__a0270328c2_length(struct class_List_Box__a0270328c2*);
+struct class_Box_3cfce651e6* meth_List_Box__a0270328c2_pop(struct class_List_Box__a0270328c2*);
+void meth_List_Box__a0270328c2_push(struct class_List_Box__a0270328c2*,struct class_Box_3cfce651e6*);
+void meth_List_Box__a0270328c2_push_all(struct class_List_Box__a0270328c2*,struct class_List_Box__a0270328c2*);
+struct class_List_Box__a0270328c2* meth_List_Box__a0270328c2_reversed(struct class_List_Box__a0270328c2*);
+struct class_List_Box__a0270328c2* meth_List_Box__a0270328c2_slice(struct class_List_Box__a0270328c2*,int64_t,int64_t);
+bool meth_List_Box__a0270328c2_starts_with(struct class_List_Box__a0270328c2*,struct class_List_Box__a0270328c2*);
+struct class_Str meth_List_Box__a0270328c2_to_string(struct class_List_Box__a0270328c2*);
+struct class_Str meth_List_Box__a0270328c2_join(struct class_List_Box__a0270328c2*,struct class_Str);
+
+#define CONSTRUCTOR ctor_List_Box__a0270328c2
+#define DESTRUCTOR dtor_List_Box__a0270328c2
+#define TYPE struct class_List_Box__a0270328c2 *
+#define TYPE_STRUCT class_List_Box__a0270328c2
+#define METHOD(name) meth_List_Box__a0270328c2_##name
+#define ITEMTYPE struct class_Box_3cfce651e6*
+#define ITEMTYPE_METHOD(name) meth_Box_3cfce651e6_##name
+#define INCREF_ITEM(val) incref((val))
+#define DECREF_ITEM(val) decref(((val)), dtor_Box_3cfce651e6)
+#define ITEMTYPE_IS_STRING 0
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+#undef DESTRUCTOR
+#undef TYPE
+#undef TYPE_STRUCT
+#undef METHOD
+#undef ITEMTYPE
+#undef ITEMTYPE_METHOD
+#undef INCREF_ITEM
+#undef DECREF_ITEM
+#undef ITEMTYPE_IS_STRING
+
+            #endif
+            
\ No newline at end of file
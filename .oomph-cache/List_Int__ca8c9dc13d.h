@@ -0,0 +1,85 @@
+
+            #ifndef HEADER_GUARD_List_Int__ca8c9dc13d
+            #define HEADER_GUARD_List_Int__ca8c9dc13d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+#define CONSTRUCTOR ctor_List_Int__ca8c9dc13d
+#define DESTRUCTOR dtor_List_Int__ca8c9dc13d
+#define TYPE struct class_List_Int__ca8c9dc13d *
+#define TYPE_STRUCT class_List_Int__ca8c9dc13d
+#define METHOD(name) meth_List_Int__ca8c9dc13d_##name
+#define ITEMTYPE int64_t
+#define ITEMTYPE_METHOD(name) meth_Int_##name
+#define INCREF_ITEM(val) (void)0
+#define DECREF_ITEM(val) (void)0
+#define ITEMTYPE_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+#undef DESTRUCTOR
+#undef TYPE
+#undef TYPE_STRUCT
+#undef METHOD
+#undef ITEMTYPE
+#undef ITEMTYPE_METHOD
+#undef INCREF_ITEM
+#undef DECREF_ITEM
+#undef ITEMTYPE_IS_STRING
+bool meth_List_Int__ca8c9dc13d___contains(struct class_List_Int__ca8c9dc13d*,int64_t);
+void meth_List_Int__ca8c9dc13d___reserve(struct class_List_Int__ca8c9dc13d*,int64_t);
+int64_t meth_List_Int__ca8c9dc13d_delete_at_index(struct class_List_Int__ca8c9dc13d*,int64_t);
+void meth_List_Int__ca8c9dc13d_delete_first(struct class_List_Int__ca8c9dc13d*,int64_t);
+void meth_List_Int__ca8c9dc13d_delete_first(struct class_List_Int__ca8c9dc13d*,int64_t);
+void meth_List_Int__ca8c9dc13d_delete_only(struct class_List_Int__ca8c9dc13d*,int64_t);
+struct class_List_Int__ca8c9dc13d* meth_List_Int__ca8c9dc13d_delete_slice(struct class_List_Int__ca8c9dc13d*,int64_t,int64_t);
+bool meth_List_Int__ca8c9dc13d_ends_with(struct class_List_Int__ca8c9dc13d*,struct class_List_Int__ca8c9dc13d*);
+bool meth_List_Int__ca8c9dc13d_equals(struct class_List_Int__ca8c9dc13d*,struct class_List_Int__ca8c9dc13d*);
+int64_t meth_List_Int__ca8c9dc13d_find_first(struct class_List_Int__ca8c9dc13d*,int64_t);
+int64_t meth_List_Int__ca8c9dc13d_find_last(struct class_List_Int__ca8c9dc13d*,int64_t);
+int64_t meth_List_Int__ca8c9dc13d_find_only(struct class_List_Int__ca8c9dc13d*,int64_t);
+int64_t meth_List_Int__ca8c9dc13d_first(struct class_List_Int__ca8c9dc13d*);
+int64_t meth_List_Int__ca8c9dc13d_get(struct class_List_Int__ca8c9dc13d*,int64_t);
+void meth_List_Int__ca8c9dc13d_insert(struct class_List_Int__ca8c9dc13d*,int64_t,int64_t);
+int64_t meth_List_Int__ca8c9dc13d_last(struct class_List_Int__ca8c9dc13d*);
+int64_t meth_List_Int__ca8c9dc13d_length(struct class_List_Int__ca8c9dc13d*);
+int64_t meth_List_Int__ca8c9dc13d_pop(struct class_List_Int__ca8c9dc13d*);
+void meth_List_Int__ca8c9dc13d_push(struct class_List_Int__ca8c9dc13d*,int64_t);
+void meth_List_Int__ca8c9dc13d_push_all(struct class_List_Int__ca8c9dc13d*,struct class_List_Int__ca8c9dc13d*);
+struct class_List_Int__ca8c9dc13d* meth_List_Int__ca8c9dc13d_reversed(struct class_List_Int__ca8c9dc13d*);
+struct class_List_Int__ca8c9dc13d* meth_List_Int__ca8c9dc13d_slice(struct class_List_Int__ca8c9dc13d*,int64_t,int64_t);
+bool meth_List_Int__ca8c9dc13d_starts_with(struct class_List_Int__ca8c9dc13d*,struct class_List_Int__ca8c9dc13d*);
+struct class_Str meth_List_Int__ca8c9dc13d_to_string(struct class_List_Int__ca8c9dc13d*);
+struct class_Str meth_List_Int__ca8c9dc13d_join(struct class_List_Int__ca8c9dc13d*,struct class_Str);
+
+#define CONSTRUCTOR ctor_List_Int__ca8c9dc13d
+#define DESTRUCTOR dtor_List_Int__ca8c9dc13d
+#define TYPE struct class_List_Int__ca8c9dc13d *
+#define TYPE_STRUCT class_List_Int__ca8c9dc13d
+#define METHOD(name) meth_List_Int__ca8c9dc13d_##name
+#define ITEMTYPE int64_t
+#define ITEMTYPE_METHOD(name) meth_Int_##name
+#define INCREF_ITEM(val) (void)0
+#define DECREF_ITEM(val) (void)0
+#define ITEMTYPE_IS_STRING 0
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+#undef DESTRUCTOR
+#undef TYPE
+#undef TYPE_STRUCT
+#undef METHOD
+#undef ITEMTYPE
+#undef ITEMTYPE_METHOD
+#undef INCREF_ITEM
+#undef DECREF_ITEM
+#undef ITEMTYPE_IS_STRING
+
+            #endif
+            
\ No newline at end of file
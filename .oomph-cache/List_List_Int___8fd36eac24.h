@@ -0,0 +1,100 @@
+
+            #ifndef HEADER_GUARD_List_List_Int___8fd36eac24
+            #define HEADER_GUARD_List_List_Int___8fd36eac24
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Int__ca8c9dc13d.h"
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+
+#define CONSTRUCTOR ctor_List_List_Int___8fd36eac24
+#define DESTRUCTOR dtor_List_List_Int___8fd36eac24
+#define TYPE struct class_List_List_Int___8fd36eac24 *
+#define TYPE_STRUCT class_List_List_Int___8fd36eac24
+#define METHOD(name) meth_List_List_Int___8fd36eac24_##name
+#define ITEMTYPE struct class_List_Int__ca8c9dc13d*
+#define ITEMTYPE_METHOD(name) meth_List_Int__ca8c9dc13d_##name
+#define INCREF_ITEM(val) incref((val))
+#define DECREF_ITEM(val) decref(((val)), dtor_List_Int__ca8c9dc13d)
+#define ITEMTYPE_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+#undef DESTRUCTOR
+#undef TYPE
+#undef TYPE_STRUCT
+#undef METHOD
+#undef ITEMTYPE
+#undef ITEMTYPE_METHOD
+#undef INCREF_ITEM
+#undef DECREF_ITEM
+#undef ITEMTYPE_IS_STRING
+bool meth_List_List_Int___8fd36eac24___contains(struct class_List_List_Int___8fd36eac24*,struct class_List_Int__ca8c9dc13d*);
+void meth_List_List_Int___8fd36eac24___reserve(struct class_List_List_Int___8fd36eac24*,int64_t);
+struct class_List_Int__ca8c9dc13d* meth_List_List_Int___8fd36eac24_delete_at_index(struct class_List_List_Int___8fd36eac24*,int64_t);
+void meth_List_List_Int___8fd36eac24_delete_first(struct class_List_List_Int___8fd36eac24*,struct class_List_Int__ca8c9dc13d*);
+void meth_List_List_Int___8fd36eac24_delete_first(struct class_List_List_Int___8fd36eac24*,struct class_List_Int__ca8c9dc13d*);
+void meth_List_List_Int___8fd36eac24_delete_only(struct class_List_List_Int___8fd36eac24*,struct class_List_Int__ca8c9dc13d*);
+struct class_List_List_Int___8fd36eac24* meth_List_List_Int___8fd36eac24_delete_slice(struct class_List_List_Int___8fd36eac24*,int64_t,int64_t);
+bool meth_List_List_Int___8fd36eac24_ends_with(struct class_List_List_Int___8fd36eac24*,struct class_List_List_Int___8fd36eac24*);
+bool meth_List_List_Int___8fd36eac24_equals(struct class_List_List_Int___8fd36eac24*,struct class_List_List_Int___8fd36eac24*);
+int64_t meth_List_List_Int___8fd36eac24_find_first(struct class_List_List_Int___8fd36eac24*,struct class_List_Int__ca8c9dc13d*);
+int64_t meth_List_List_Int___8fd36eac24_find_last(struct class_List_List_Int___8fd36eac24*,struct class_List_Int__ca8c9dc13d*);
+int64_t meth_List_List_Int___8fd36eac24_find_only(struct class_List_List_Int___8fd36eac24*,struct class_List_Int__ca8c9dc13d*);
+struct class_List_Int__ca8c9dc13d* meth_List_List_Int___8fd36eac24_first(struct class_List_List_Int___8fd36eac24*);
+struct class_List_Int__ca8c9dc13d* meth_List_List_Int___8fd36eac24_get(struct class_List_List_Int___8fd36eac24*,int64_t);
+void meth_List_List_Int___8fd36eac24_insert(struct class_List_List_Int___8fd36eac24*,int64_t,struct class_List_Int__ca8c9dc13d*);
+struct class_List_Int__ca8c9dc13d* meth_List_List_Int___8fd36eac24_last(struct class_List_List_Int___8fd36eac24*);
+int64_t meth_List_List_Int___8fd36eac24_length(struct class_List_List_Int___8fd36eac24*);
+struct class_List_Int__ca8c9dc13d* meth_List_List_Int___8fd36eac24_pop(struct class_List_List_Int___8fd36eac24*);
+void meth_List_List_Int___8fd36eac24_push(struct class_List_List_Int___8fd36eac24*,struct class_List_Int__ca8c9dc13d*);
+void meth_List_List_Int___8fd36eac24_push_all(struct class_List_List_Int___8fd36eac24*,struct class_List_List_Int___8fd36eac24*);
+struct class_List_List_Int___8fd36eac24* meth_List_List_Int___8fd36eac24_reversed(struct class_List_List_Int___8fd36eac24*);
+struct class_List_List_Int___8fd36eac24* meth_List_List_Int___8fd36eac24_slice(struct class_List_List_Int___8fd36eac24*,int64_t,int64_t);
+bool meth_List_List_Int___8fd36eac24_starts_with(struct class_List_List_Int___8fd36eac24*,struct class_List_List_Int___8fd36eac24*);
+struct class_Str meth_List_List_Int___8fd36eac24_to_string(struct class_List_List_Int___8fd36eac24*);
+struct class_Str meth_List_List_Int___8fd36eac24_join(struct class_List_List_Int___8fd36eac24*,struct class_Str);
+
+#define CONSTRUCTOR ctor_List_List_Int___8fd36eac24
+#define DESTRUCTOR dtor_List_List_Int___8fd36eac24
+#define TYPE struct class_List_List_Int___8fd36eac24 *
+#define TYPE_STRUCT class_List_List_Int___8fd36eac24
+#define METHOD(name) meth_List_List_Int___8fd36eac24_##name
+#define ITEMTYPE struct class_List_Int__ca8c9dc13d*
+#define ITEMTYPE_METHOD(name) meth_List_Int__ca8c9dc13d_##name
+#define INCREF_ITEM(val) incref((val))
+#define DECREF_ITEM(val) decref(((val)), dtor_List_Int__ca8c9dc13d)
+#define ITEMTYPE_IS_STRING 0
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+#undef DESTRUCTOR
+#undef TYPE
+#undef TYPE_STRUCT
+#undef METHOD
+#undef ITEMTYPE
+#undef ITEMTYPE_METHOD
+#undef INCREF_ITEM
+#undef DECREF_ITEM
+#undef ITEMTYPE_IS_STRING
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,85 @@
+
+            #ifndef HEADER_GUARD_List_Str__d1ecbd3335
+            #define HEADER_GUARD_List_Str__d1ecbd3335
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+#define CONSTRUCTOR ctor_List_Str__d1ecbd3335
+#define DESTRUCTOR dtor_List_Str__d1ecbd3335
+#define TYPE struct class_List_Str__d1ecbd3335 *
+#define TYPE_STRUCT class_List_Str__d1ecbd3335
+#define METHOD(name) meth_List_Str__d1ecbd3335_##name
+#define ITEMTYPE struct class_Str
+#define ITEMTYPE_METHOD(name) meth_Str_##name
+#define INCREF_ITEM(val) string_incref((val))
+#define DECREF_ITEM(val) string_decref((val))
+#define ITEMTYPE_IS_STRING 1
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+#undef DESTRUCTOR
+#undef TYPE
+#undef TYPE_STRUCT
+#undef METHOD
+#undef ITEMTYPE
+#undef ITEMTYPE_METHOD
+#undef INCREF_ITEM
+#undef DECREF_ITEM
+#undef ITEMTYPE_IS_STRING
+bool meth_List_Str__d1ecbd3335___contains(struct class_List_Str__d1ecbd3335*,struct class_Str);
+void meth_List_Str__d1ecbd3335___reserve(struct class_List_Str__d1ecbd3335*,int64_t);
+struct class_Str meth_List_Str__d1ecbd3335_delete_at_index(struct class_List_Str__d1ecbd3335*,int64_t);
+void meth_List_Str__d1ecbd3335_delete_first(struct class_List_Str__d1ecbd3335*,struct class_Str);
+void meth_List_Str__d1ecbd3335_delete_first(struct class_List_Str__d1ecbd3335*,struct class_Str);
+void meth_List_Str__d1ecbd3335_delete_only(struct class_List_Str__d1ecbd3335*,struct class_Str);
+struct class_List_Str__d1ecbd3335* meth_List_Str__d1ecbd3335_delete_slice(struct class_List_Str__d1ecbd3335*,int64_t,int64_t);
+bool meth_List_Str__d1ecbd3335_ends_with(struct class_List_Str__d1ecbd3335*,struct class_List_Str__d1ecbd3335*);
+bool meth_List_Str__d1ecbd3335_equals(struct class_List_Str__d1ecbd3335*,struct class_List_Str__d1ecbd3335*);
+int64_t meth_List_Str__d1ecbd3335_find_first(struct class_List_Str__d1ecbd3335*,struct class_Str);
+int64_t meth_List_Str__d1ecbd3335_find_last(struct class_List_Str__d1ecbd3335*,struct class_Str);
+int64_t meth_List_Str__d1ecbd3335_find_only(struct class_List_Str__d1ecbd3335*,struct class_Str);
+struct class_Str meth_List_Str__d1ecbd3335_first(struct class_List_Str__d1ecbd3335*);
+struct class_Str meth_List_Str__d1ecbd3335_get(struct class_List_Str__d1ecbd3335*,int64_t);
+void meth_List_Str__d1ecbd3335_insert(struct class_List_Str__d1ecbd3335*,int64_t,struct class_Str);
+struct class_Str meth_List_Str__d1ecbd3335_last(struct class_List_Str__d1ecbd3335*);
+int64_t meth_List_Str__d1ecbd3335_length(struct class_List_Str__d1ecbd3335*);
+struct class_Str meth_List_Str__d1ecbd3335_pop(struct class_List_Str__d1ecbd3335*);
+void meth_List_Str__d1ecbd3335_push(struct class_List_Str__d1ecbd3335*,struct class_Str);
+void meth_List_Str__d1ecbd3335_push_all(struct class_List_Str__d1ecbd3335*,struct class_List_Str__d1ecbd3335*);
+struct class_List_Str__d1ecbd3335* meth_List_Str__d1ecbd3335_reversed(struct class_List_Str__d1ecbd3335*);
+struct class_List_Str__d1ecbd3335* meth_List_Str__d1ecbd3335_slice(struct class_List_Str__d1ecbd3335*,int64_t,int64_t);
+bool meth_List_Str__d1ecbd3335_starts_with(struct class_List_Str__d1ecbd3335*,struct class_List_Str__d1ecbd3335*);
+struct class_Str meth_List_Str__d1ecbd3335_to_string(struct class_List_Str__d1ecbd3335*);
+struct class_Str meth_List_Str__d1ecbd3335_join(struct class_List_Str__d1ecbd3335*,struct class_Str);
+
+#define CONSTRUCTOR ctor_List_Str__d1ecbd3335
+#define DESTRUCTOR dtor_List_Str__d1ecbd3335
+#define TYPE struct class_List_Str__d1ecbd3335 *
+#define TYPE_STRUCT class_List_Str__d1ecbd3335
+#define METHOD(name) meth_List_Str__d1ecbd3335_##name
+#define ITEMTYPE struct class_Str
+#define ITEMTYPE_METHOD(name) meth_Str_##name
+#define INCREF_ITEM(val) string_incref((val))
+#define DECREF_ITEM(val) string_decref((val))
+#define ITEMTYPE_IS_STRING 1
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+#undef DESTRUCTOR
+#undef TYPE
+#undef TYPE_STRUCT
+#undef METHOD
+#undef ITEMTYPE
+#undef ITEMTYPE_METHOD
+#undef INCREF_ITEM
+#undef DECREF_ITEM
+#undef ITEMTYPE_IS_STRING
+
+            #endif
+            
\ No newline at end of file
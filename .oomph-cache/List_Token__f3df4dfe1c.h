@@ -0,0 +1,100 @@
+
+            #ifndef HEADER_GUARD_List_Token__f3df4dfe1c
+            #define HEADER_GUARD_List_Token__f3df4dfe1c
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Token_459a6f79ad.h"
+struct class_Token_459a6f79ad;
+struct class_Token_459a6f79ad;
+struct class_Token_459a6f79ad;
+struct class_Token_459a6f79ad;
+struct class_Token_459a6f79ad;
+struct class_Token_459a6f79ad;
+struct class_Token_459a6f79ad;
+struct class_Token_459a6f79ad;
+struct class_Token_459a6f79ad;
+struct class_Token_459a6f79ad;
+struct class_Token_459a6f79ad;
+struct class_Token_459a6f79ad;
+struct class_Token_459a6f79ad;
+struct class_Token_459a6f79ad;
+
+#define CONSTRUCTOR ctor_List_Token__f3df4dfe1c
+#define DESTRUCTOR dtor_List_Token__f3df4dfe1c
+#define TYPE struct class_List_Token__f3df4dfe1c *
+#define TYPE_STRUCT class_List_Token__f3df4dfe1c
+#define METHOD(name) meth_List_Token__f3df4dfe1c_##name
+#define ITEMTYPE struct class_Token_459a6f79ad*
+#define ITEMTYPE_METHOD(name) meth_Token_459a6f79ad_##name
+#define INCREF_ITEM(val) incref((val))
+#define DECREF_ITEM(val) decref(((val)), dtor_Token_459a6f79ad)
+#define ITEMTYPE_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+#undef DESTRUCTOR
+#undef TYPE
+#undef TYPE_STRUCT
+#undef METHOD
+#undef ITEMTYPE
+#undef ITEMTYPE_METHOD
+#undef INCREF_ITEM
+#undef DECREF_ITEM
+#undef ITEMTYPE_IS_STRING
+bool meth_List_Token__f3df4dfe1c___contains(struct class_List_Token__f3df4dfe1c*,struct class_Token_459a6f79ad*);
+void meth_List_Token__f3df4dfe1c___reserve(struct class_List_Token__f3df4dfe1c*,int64_t);
+struct class_Token_459a6f79ad* meth_List_Token__f3df4dfe1c_delete_at_index(struct class_List_Token__f3df4dfe1c*,int64_t);
+void meth_List_Token__f3df4dfe1c_delete_first(struct class_List_Token__f3df4dfe1c*,struct class_Token_459a6f79ad*);
+void meth_List_Token__f3df4dfe1c_delete_first(struct class_List_Token__f3df4dfe1c*,struct class_Token_459a6f79ad*);
+void meth_List_Token__f3df4dfe1c_delete_only(struct class_List_Token__f3df4dfe1c*,struct class_Token_459a6f79ad*);
+struct class_List_Token__f3df4dfe1c* meth_List_Token__f3df4dfe1c_delete_slice(struct class_List_Token__f3df4dfe1c*,int64_t,int64_t);
+bool meth_List_Token__f3df4dfe1c_ends_with(struct class_List_Token__f3df4dfe1c*,struct class_List_Token__f3df4dfe1c*);
+bool meth_List_Token__f3df4dfe1c_equals(struct class_List_Token__f3df4dfe1c*,struct class_List_Token__f3df4dfe1c*);
+int64_t meth_List_Token__f3df4dfe1c_find_first(struct class_List_Token__f3df4dfe1c*,struct class_Token_459a6f79ad*);
+int64_t meth_List_Token__f3df4dfe1c_find_last(struct class_List_Token__f3df4dfe1c*,struct class_Token_459a6f79ad*);
+int64_t meth_List_Token__f3df4dfe1c_find_only(struct class_List_Token__f3df4dfe1c*,struct class_Token_459a6f79ad*);
+struct class_Token_459a6f79ad* meth_List_Token__f3df4dfe1c_first(struct class_List_Token__f3df4dfe1c*);
+struct class_Token_459a6f79ad* meth_List_Token__f3df4dfe1c_get(struct class_List_Token__f3df4dfe1c*,int64_t);
+void meth_List_Token__f3df4dfe1c_insert(struct class_List_Token__f3df4dfe1c*,int64_t,struct class_Token_459a6f79ad*);
+struct class_Token_459a6f79ad* meth_List_Token__f3df4dfe1c_last(struct class_List_Token__f3df4dfe1c*);
+int64_t meth_List_Token__f3df4dfe1c_length(struct class_List_Token__f3df4dfe1c*);
+struct class_Token_459a6f79ad* meth_List_Token__f3df4dfe1c_pop(struct class_List_Token__f3df4dfe1c*);
+void meth_List_Token__f3df4dfe1c_push(struct class_List_Token__f3df4dfe1c*,struct class_Token_459a6f79ad*);
+void meth_List_Token__f3df4dfe1c_push_all(struct class_List_Token__f3df4dfe1c*,struct class_List_Token__f3df4dfe1c*);
+struct class_List_Token__f3df4dfe1c* meth_List_Token__f3df4dfe1c_reversed(struct class_List_Token__f3df4dfe1c*);
+struct class_List_Token__f3df4dfe1c* meth_List_Token__f3df4dfe1c_slice(struct class_List_Token__f3df4dfe1c*,int64_t,int64_t);
+bool meth_List_Token__f3df4dfe1c_starts_with(struct class_List_Token__f3df4dfe1c*,struct class_List_Token__f3df4dfe1c*);
+struct class_Str meth_List_Token__f3df4dfe1c_to_string(struct class_List_Token__f3df4dfe1c*);
+struct class_Str meth_List_Token__f3df4dfe1c_join(struct class_List_Token__f3df4dfe1c*,struct class_Str);
+
+#define CONSTRUCTOR ctor_List_Token__f3df4dfe1c
+#define DESTRUCTOR dtor_List_Token__f3df4dfe1c
+#define TYPE struct class_List_Token__f3df4dfe1c *
+#define TYPE_STRUCT class_List_Token__f3df4dfe1c
+#define METHOD(name) meth_List_Token__f3df4dfe1c_##name
+#define ITEMTYPE struct class_Token_459a6f79ad*
+#define ITEMTYPE_METHOD(name) meth_Token_459a6f79ad_##name
+#define INCREF_ITEM(val) incref((val))
+#define DECREF_ITEM(val) decref(((val)), dtor_Token_459a6f79ad)
+#define ITEMTYPE_IS_STRING 0
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+#undef DESTRUCTOR
+#undef TYPE
+#undef TYPE_STRUCT
+#undef METHOD
+#undef ITEMTYPE
+#undef ITEMTYPE_METHOD
+#undef INCREF_ITEM
+#undef DECREF_ITEM
+#undef ITEMTYPE_IS_STRING
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,85 @@
+#include <lib/oomph.h>
+#include "Nested_2bc85bf76a.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+#include "_Bar___Baz__3fac7276da.h"
+
+            static struct StringBuf string0Nested_13c479c348_buf = {
+                .refcount = -1,
+                .data = (char[]){ 78,101,115,116,101,100 },
+                .malloced = false,
+            };
+            static struct class_Str string0Nested_13c479c348 = {
+                .buf = &string0Nested_13c479c348_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+                struct class_Str meth_Nested_2bc85bf76a_to_string(struct class_Nested_2bc85bf76a obj)
+                {
+                    struct class_Str valstr;
+                    switch(obj.membernum) {
+                        
+                        case 0:
+                            valstr = meth_Foo_1356c67d7a_to_string(obj.val.item0);
+                            break;
+                        
+                        case 1:
+                            valstr = meth__Bar___Baz__3fac7276da_to_string(obj.val.item1);
+                            break;
+                        
+                        default:
+                            panic_printf(
+                                "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                                string_to_cstr(string0Nested_13c479c348), (int)obj.membernum);
+                    }
+
+                    struct class_Str res = string0Nested_13c479c348;
+                    string_incref(res);
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    oomph_string_concat_inplace(&res, valstr);
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    string_decref(valstr);
+                    return res;
+                }
+
+                bool meth_Nested_2bc85bf76a_equals(struct class_Nested_2bc85bf76a a, struct class_Nested_2bc85bf76a b)
+                {
+                    if (a.membernum != b.membernum)
+                        return false;
+                    switch(a.membernum) {
+                        
+                        case 0:
+                            return meth_Foo_1356c67d7a_equals(a.val.item0, b.val.item0);
+                        
+                        case 1:
+                            return meth__Bar___Baz__3fac7276da_equals(a.val.item1, b.val.item1);
+                        
+                        default:
+                            panic_printf(
+                                "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                                string_to_cstr(string0Nested_13c479c348), (int)a.membernum);
+                    }
+                }
+                
+                void incref_Nested_2bc85bf76a(struct class_Nested_2bc85bf76a obj) {
+                    switch(obj.membernum) {
+                        case 0: incref(obj.val.item0); break;
+case 1: incref__Bar___Baz__3fac7276da(obj.val.item1); break;
+
+                        default:
+                            assert(0);
+                    }
+                }
+                void decref_Nested_2bc85bf76a(struct class_Nested_2bc85bf76a obj) {
+                    switch(obj.membernum) {
+                        case -1:   // variable not in use (see UnSet)
+                            break;
+                        case 0: decref((obj.val.item0), dtor_Foo_1356c67d7a); break;
+case 1: decref__Bar___Baz__3fac7276da(obj.val.item1); break;
+
+                        default:
+                            assert(0);
+                    }
+                }
+                
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_Nested_2bc85bf76a
+            #define HEADER_GUARD_Nested_2bc85bf76a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+#include "_Bar___Baz__3fac7276da.h"
+struct class_Foo_1356c67d7a;
+
+                struct class_Nested_2bc85bf76a {
+                    union {
+                        struct class_Foo_1356c67d7a* item0;
+struct class__Bar___Baz__3fac7276da item1;
+
+                    } val;
+                    short membernum;
+                };
+                
+                struct class_Str meth_Nested_2bc85bf76a_to_string(struct class_Nested_2bc85bf76a obj);
+                bool meth_Nested_2bc85bf76a_equals(struct class_Nested_2bc85bf76a a, struct class_Nested_2bc85bf76a b);
+                
+                void incref_Nested_2bc85bf76a(struct class_Nested_2bc85bf76a obj);
+                void decref_Nested_2bc85bf76a(struct class_Nested_2bc85bf76a obj);
+                
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,214 @@
+#include <lib/oomph.h>
+#include "Point_2a3cd5946c.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0Point_2a3cd5946c_buf = {
+                .refcount = -1,
+                .data = (char[]){ 80,111,105,110,116 },
+                .malloced = false,
+            };
+            static struct class_Str string0Point_2a3cd5946c = {
+                .buf = &string0Point_2a3cd5946c_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+                    struct class_Point_2a3cd5946c* ctor_Point_2a3cd5946c(int64_t arg_x,int64_t arg_y)
+                    {
+                        struct class_Point_2a3cd5946c* obj = malloc(sizeof(*obj));
+                        assert(obj);
+                        obj->refcount = 1;
+                        obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+                        (void)0;
+(void)0;
+
+                        return obj;
+                    }
+
+                    void dtor_Point_2a3cd5946c(void *ptr)
+                    {
+                        struct class_Point_2a3cd5946c *obj = ptr;
+                        (void)0;
+(void)0;
+
+                        free(obj);
+                    }
+                    
+                        struct class_Str meth_Point_2a3cd5946c_to_string(struct class_Point_2a3cd5946c* self)
+                        {
+                            struct class_Str res = string0Point_2a3cd5946c;
+                            struct class_Str tmp;
+                            oomph_string_concat_inplace_cstr(&res, "(");
+                            
+                                tmp = meth_Int_to_string(self->memb_x);
+                                oomph_string_concat_inplace(&res, tmp);
+                                string_decref(tmp);
+                                oomph_string_concat_inplace_cstr(&res, ", ");
+                                tmp = meth_Int_to_string(self->memb_y);
+                                oomph_string_concat_inplace(&res, tmp);
+                                string_decref(tmp);
+                                
+                            oomph_string_concat_inplace_cstr(&res, ")");
+                            return res;
+                        }
+                        bool meth_Point_2a3cd5946c_equals(struct class_Point_2a3cd5946c* var0,struct class_Point_2a3cd5946c* var1){
+            bool var2;
+            
+            bool retval;
+            var2 = (var0 == var1);
+
+                        (void)0;
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+(void)0;
+return retval;
+}
+void meth_Point_2a3cd5946c_print(struct class_Point_2a3cd5946c* var0){
+            struct class_Point_2a3cd5946c* var1;
+            var1 = NULL;
+
+            struct class_Point_2a3cd5946c* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Point_2a3cd5946c* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct class_Str var7;
+            var7.buf = NULL;
+var1 = var0;
+incref(var1);
+decref((var2), dtor_Point_2a3cd5946c);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+(void)0;
+var3 = var2->memb_x;
+(void)0;
+string_decref(var4);
+var4.buf = NULL;
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+decref((var5), dtor_Point_2a3cd5946c);
+var5 = NULL;
+var5 = var1;
+incref(var5);
+(void)0;
+var6 = var5->memb_y;
+(void)0;
+string_decref(var7);
+var7.buf = NULL;
+var7 = meth_Int_to_string(var6);
+oomph_print(var7);
+out: (void)0;
+string_decref(var7);
+(void)0;
+decref((var5), dtor_Point_2a3cd5946c);
+string_decref(var4);
+(void)0;
+decref((var2), dtor_Point_2a3cd5946c);
+decref((var1), dtor_Point_2a3cd5946c);
+}
+struct class_Point_2a3cd5946c* meth_Point_2a3cd5946c_add(struct class_Point_2a3cd5946c* var0,struct class_Point_2a3cd5946c* var1){
+            struct class_Point_2a3cd5946c* var2;
+            var2 = NULL;
+
+            struct class_Point_2a3cd5946c* var3;
+            var3 = NULL;
+
+            struct class_Point_2a3cd5946c* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            struct class_Point_2a3cd5946c* var6;
+            var6 = NULL;
+
+            int64_t var7;
+            
+            int64_t var8;
+            
+            struct class_Point_2a3cd5946c* var9;
+            var9 = NULL;
+
+            int64_t var10;
+            
+            struct class_Point_2a3cd5946c* var11;
+            var11 = NULL;
+
+            int64_t var12;
+            
+            int64_t var13;
+            
+            struct class_Point_2a3cd5946c* var14;
+            var14 = NULL;
+
+            struct class_Point_2a3cd5946c* retval;
+            var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+decref((var4), dtor_Point_2a3cd5946c);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+(void)0;
+var5 = var4->memb_x;
+(void)0;
+decref((var6), dtor_Point_2a3cd5946c);
+var6 = NULL;
+var6 = var3;
+incref(var6);
+(void)0;
+var7 = var6->memb_x;
+(void)0;
+(void)0;
+var8 = oomph_int_add(var5,var7);
+decref((var9), dtor_Point_2a3cd5946c);
+var9 = NULL;
+var9 = var2;
+incref(var9);
+(void)0;
+var10 = var9->memb_y;
+(void)0;
+decref((var11), dtor_Point_2a3cd5946c);
+var11 = NULL;
+var11 = var3;
+incref(var11);
+(void)0;
+var12 = var11->memb_y;
+(void)0;
+(void)0;
+var13 = oomph_int_add(var10,var12);
+decref((var14), dtor_Point_2a3cd5946c);
+var14 = NULL;
+var14 = ctor_Point_2a3cd5946c(var8,var13);
+
+                        incref(var14);
+                        retval = var14;
+                        goto out;
+                        out: (void)0;
+decref((var14), dtor_Point_2a3cd5946c);
+(void)0;
+(void)0;
+decref((var11), dtor_Point_2a3cd5946c);
+(void)0;
+decref((var9), dtor_Point_2a3cd5946c);
+(void)0;
+(void)0;
+decref((var6), dtor_Point_2a3cd5946c);
+(void)0;
+decref((var4), dtor_Point_2a3cd5946c);
+decref((var3), dtor_Point_2a3cd5946c);
+decref((var2), dtor_Point_2a3cd5946c);
+return retval;
+}
@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Point_2a3cd5946c
+            #define HEADER_GUARD_Point_2a3cd5946c
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+                    struct class_Point_2a3cd5946c {
+                        REFCOUNT_HEADER
+                        int64_t memb_x;
+int64_t memb_y;
+
+                    };
+                    
+                    struct class_Point_2a3cd5946c* ctor_Point_2a3cd5946c(int64_t arg_x,int64_t arg_y);
+                    void dtor_Point_2a3cd5946c(void *ptr);
+                    
+                        struct class_Str meth_Point_2a3cd5946c_to_string(struct class_Point_2a3cd5946c* obj);
+                        bool meth_Point_2a3cd5946c_equals(struct class_Point_2a3cd5946c* var0,struct class_Point_2a3cd5946c* var1);
+void meth_Point_2a3cd5946c_print(struct class_Point_2a3cd5946c* var0);
+struct class_Point_2a3cd5946c* meth_Point_2a3cd5946c_add(struct class_Point_2a3cd5946c* var0,struct class_Point_2a3cd5946c* var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "SelfRef_b7f9ba4716.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0SelfRef_b7f9ba4716_buf = {
+                .refcount = -1,
+                .data = (char[]){ 83,101,108,102,82,101,102 },
+                .malloced = false,
+            };
+            static struct class_Str string0SelfRef_b7f9ba4716 = {
+                .buf = &string0SelfRef_b7f9ba4716_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+                    struct class_SelfRef_b7f9ba4716* ctor_SelfRef_b7f9ba4716(struct class_SelfRef_b7f9ba4716* arg_x)
+                    {
+                        struct class_SelfRef_b7f9ba4716* obj = malloc(sizeof(*obj));
+                        assert(obj);
+                        obj->refcount = 1;
+                        obj->memb_x = arg_x;
+
+                        incref(obj->memb_x);
+
+                        return obj;
+                    }
+
+                    void dtor_SelfRef_b7f9ba4716(void *ptr)
+                    {
+                        struct class_SelfRef_b7f9ba4716 *obj = ptr;
+                        decref((obj->memb_x), dtor_SelfRef_b7f9ba4716);
+
+                        free(obj);
+                    }
+                    
+                        struct class_Str meth_SelfRef_b7f9ba4716_to_string(struct class_SelfRef_b7f9ba4716* self)
+                        {
+                            struct class_Str res = string0SelfRef_b7f9ba4716;
+                            struct class_Str tmp;
+                            oomph_string_concat_inplace_cstr(&res, "(");
+                            
+                                tmp = meth_SelfRef_b7f9ba4716_to_string(self->memb_x);
+                                oomph_string_concat_inplace(&res, tmp);
+                                string_decref(tmp);
+                                
+                            oomph_string_concat_inplace_cstr(&res, ")");
+                            return res;
+                        }
+                        bool meth_SelfRef_b7f9ba4716_equals(struct class_SelfRef_b7f9ba4716* var0,struct class_SelfRef_b7f9ba4716* var1){
+            bool var2;
+            
+            bool retval;
+            var2 = (var0 == var1);
+
+                        (void)0;
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,20 @@
+
+            #ifndef HEADER_GUARD_SelfRef_b7f9ba4716
+            #define HEADER_GUARD_SelfRef_b7f9ba4716
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+                    struct class_SelfRef_b7f9ba4716 {
+                        REFCOUNT_HEADER
+                        struct class_SelfRef_b7f9ba4716* memb_x;
+
+                    };
+                    
+                    struct class_SelfRef_b7f9ba4716* ctor_SelfRef_b7f9ba4716(struct class_SelfRef_b7f9ba4716* arg_x);
+                    void dtor_SelfRef_b7f9ba4716(void *ptr);
+                    
+                        struct class_Str meth_SelfRef_b7f9ba4716_to_string(struct class_SelfRef_b7f9ba4716* obj);
+                        bool meth_SelfRef_b7f9ba4716_equals(struct class_SelfRef_b7f9ba4716* var0,struct class_SelfRef_b7f9ba4716* var1);
+
+            #endif
+            
\ No newline at end of file
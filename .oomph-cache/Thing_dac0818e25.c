@@ -0,0 +1,85 @@
+#include <lib/oomph.h>
+#include "Thing_dac0818e25.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+#include "Bar_ddc35f88fa.h"
+
+            static struct StringBuf string0Thing_dfca0e7187_buf = {
+                .refcount = -1,
+                .data = (char[]){ 84,104,105,110,103 },
+                .malloced = false,
+            };
+            static struct class_Str string0Thing_dfca0e7187 = {
+                .buf = &string0Thing_dfca0e7187_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+                struct class_Str meth_Thing_dac0818e25_to_string(struct class_Thing_dac0818e25 obj)
+                {
+                    struct class_Str valstr;
+                    switch(obj.membernum) {
+                        
+                        case 0:
+                            valstr = meth_Foo_1356c67d7a_to_string(obj.val.item0);
+                            break;
+                        
+                        case 1:
+                            valstr = meth_Bar_ddc35f88fa_to_string(obj.val.item1);
+                            break;
+                        
+                        default:
+                            panic_printf(
+                                "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                                string_to_cstr(string0Thing_dfca0e7187), (int)obj.membernum);
+                    }
+
+                    struct class_Str res = string0Thing_dfca0e7187;
+                    string_incref(res);
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    oomph_string_concat_inplace(&res, valstr);
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    string_decref(valstr);
+                    return res;
+                }
+
+                bool meth_Thing_dac0818e25_equals(struct class_Thing_dac0818e25 a, struct class_Thing_dac0818e25 b)
+                {
+                    if (a.membernum != b.membernum)
+                        return false;
+                    switch(a.membernum) {
+                        
+                        case 0:
+                            return meth_Foo_1356c67d7a_equals(a.val.item0, b.val.item0);
+                        
+                        case 1:
+                            return meth_Bar_ddc35f88fa_equals(a.val.item1, b.val.item1);
+                        
+                        default:
+                            panic_printf(
+                                "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                                string_to_cstr(string0Thing_dfca0e7187), (int)a.membernum);
+                    }
+                }
+                
+                void incref_Thing_dac0818e25(struct class_Thing_dac0818e25 obj) {
+                    switch(obj.membernum) {
+                        case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+
+                        default:
+                            assert(0);
+                    }
+                }
+                void decref_Thing_dac0818e25(struct class_Thing_dac0818e25 obj) {
+                    switch(obj.membernum) {
+                        case -1:   // variable not in use (see UnSet)
+                            break;
+                        case 0: decref((obj.val.item0), dtor_Foo_1356c67d7a); break;
+case 1: decref((obj.val.item1), dtor_Bar_ddc35f88fa); break;
+
+                        default:
+                            assert(0);
+                    }
+                }
+                
\ No newline at end of file
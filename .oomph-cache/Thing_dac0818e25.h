@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_Thing_dac0818e25
+            #define HEADER_GUARD_Thing_dac0818e25
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+#include "Bar_ddc35f88fa.h"
+struct class_Foo_1356c67d7a;
+struct class_Bar_ddc35f88fa;
+
+                struct class_Thing_dac0818e25 {
+                    union {
+                        struct class_Foo_1356c67d7a* item0;
+struct class_Bar_ddc35f88fa* item1;
+
+                    } val;
+                    short membernum;
+                };
+                
+                struct class_Str meth_Thing_dac0818e25_to_string(struct class_Thing_dac0818e25 obj);
+                bool meth_Thing_dac0818e25_equals(struct class_Thing_dac0818e25 a, struct class_Thing_dac0818e25 b);
+                
+                void incref_Thing_dac0818e25(struct class_Thing_dac0818e25 obj);
+                void decref_Thing_dac0818e25(struct class_Thing_dac0818e25 obj);
+                
+            #endif
+            
\ No newline at end of file
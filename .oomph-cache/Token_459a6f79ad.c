@@ -0,0 +1,54 @@
+#include <lib/oomph.h>
+#include "Token_459a6f79ad.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0Token_459a6f79ad_buf = {
+                .refcount = -1,
+                .data = (char[]){ 84,111,107,101,110 },
+                .malloced = false,
+            };
+            static struct class_Str string0Token_459a6f79ad = {
+                .buf = &string0Token_459a6f79ad_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+                    struct class_Token_459a6f79ad* ctor_Token_459a6f79ad(void)
+                    {
+                        struct class_Token_459a6f79ad* obj = malloc(sizeof(*obj));
+                        assert(obj);
+                        obj->refcount = 1;
+                        
+                        
+                        return obj;
+                    }
+
+                    void dtor_Token_459a6f79ad(void *ptr)
+                    {
+                        struct class_Token_459a6f79ad *obj = ptr;
+                        
+                        free(obj);
+                    }
+                    
+                        struct class_Str meth_Token_459a6f79ad_to_string(struct class_Token_459a6f79ad* self)
+                        {
+                            struct class_Str res = string0Token_459a6f79ad;
+                            struct class_Str tmp;
+                            oomph_string_concat_inplace_cstr(&res, "(");
+                            
+                            oomph_string_concat_inplace_cstr(&res, ")");
+                            return res;
+                        }
+                        bool meth_Token_459a6f79ad_equals(struct class_Token_459a6f79ad* var0,struct class_Token_459a6f79ad* var1){
+            bool var2;
+            
+            bool retval;
+            var2 = (var0 == var1);
+
+                        (void)0;
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+(void)0;
+return retval;
+}
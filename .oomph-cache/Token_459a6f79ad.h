@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_Token_459a6f79ad
+            #define HEADER_GUARD_Token_459a6f79ad
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+                    struct class_Token_459a6f79ad {
+                        REFCOUNT_HEADER
+                        
+                    };
+                    
+                    struct class_Token_459a6f79ad* ctor_Token_459a6f79ad(void);
+                    void dtor_Token_459a6f79ad(void *ptr);
+                    
+                        struct class_Str meth_Token_459a6f79ad_to_string(struct class_Token_459a6f79ad* obj);
+                        bool meth_Token_459a6f79ad_equals(struct class_Token_459a6f79ad* var0,struct class_Token_459a6f79ad* var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,85 @@
+#include <lib/oomph.h>
+#include "_Bar___Baz__3fac7276da.h"
+#include "builtins_8da1dac06a.h"
+#include "Bar_ddc35f88fa.h"
+#include "Baz_f8dce67f2c.h"
+
+            static struct StringBuf string0_Bar___Baz__af8e3c79af_buf = {
+                .refcount = -1,
+                .data = (char[]){ 40,66,97,114,32,124,32,66,97,122,41 },
+                .malloced = false,
+            };
+            static struct class_Str string0_Bar___Baz__af8e3c79af = {
+                .buf = &string0_Bar___Baz__af8e3c79af_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+                struct class_Str meth__Bar___Baz__3fac7276da_to_string(struct class__Bar___Baz__3fac7276da obj)
+                {
+                    struct class_Str valstr;
+                    switch(obj.membernum) {
+                        
+                        case 0:
+                            valstr = meth_Bar_ddc35f88fa_to_string(obj.val.item0);
+                            break;
+                        
+                        case 1:
+                            valstr = meth_Baz_f8dce67f2c_to_string(obj.val.item1);
+                            break;
+                        
+                        default:
+                            panic_printf(
+                                "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                                string_to_cstr(string0_Bar___Baz__af8e3c79af), (int)obj.membernum);
+                    }
+
+                    struct class_Str res = string0_Bar___Baz__af8e3c79af;
+                    string_incref(res);
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    oomph_string_concat_inplace(&res, valstr);
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    string_decref(valstr);
+                    return res;
+                }
+
+                bool meth__Bar___Baz__3fac7276da_equals(struct class__Bar___Baz__3fac7276da a, struct class__Bar___Baz__3fac7276da b)
+                {
+                    if (a.membernum != b.membernum)
+                        return false;
+                    switch(a.membernum) {
+                        
+                        case 0:
+                            return meth_Bar_ddc35f88fa_equals(a.val.item0, b.val.item0);
+                        
+                        case 1:
+                            return meth_Baz_f8dce67f2c_equals(a.val.item1, b.val.item1);
+                        
+                        default:
+                            panic_printf(
+                                "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                                string_to_cstr(string0_Bar___Baz__af8e3c79af), (int)a.membernum);
+                    }
+                }
+                
+                void incref__Bar___Baz__3fac7276da(struct class__Bar___Baz__3fac7276da obj) {
+                    switch(obj.membernum) {
+                        case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+
+                        default:
+                            assert(0);
+                    }
+                }
+                void decref__Bar___Baz__3fac7276da(struct class__Bar___Baz__3fac7276da obj) {
+                    switch(obj.membernum) {
+                        case -1:   // variable not in use (see UnSet)
+                            break;
+                        case 0: decref((obj.val.item0), dtor_Bar_ddc35f88fa); break;
+case 1: decref((obj.val.item1), dtor_Baz_f8dce67f2c); break;
+
+                        default:
+                            assert(0);
+                    }
+                }
+                
\ No newline at end of file
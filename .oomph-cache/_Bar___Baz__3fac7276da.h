@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD__Bar___Baz__3fac7276da
+            #define HEADER_GUARD__Bar___Baz__3fac7276da
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Bar_ddc35f88fa.h"
+#include "Baz_f8dce67f2c.h"
+struct class_Bar_ddc35f88fa;
+struct class_Baz_f8dce67f2c;
+
+                struct class__Bar___Baz__3fac7276da {
+                    union {
+                        struct class_Bar_ddc35f88fa* item0;
+struct class_Baz_f8dce67f2c* item1;
+
+                    } val;
+                    short membernum;
+                };
+                
+                struct class_Str meth__Bar___Baz__3fac7276da_to_string(struct class__Bar___Baz__3fac7276da obj);
+                bool meth__Bar___Baz__3fac7276da_equals(struct class__Bar___Baz__3fac7276da a, struct class__Bar___Baz__3fac7276da b);
+                
+                void incref__Bar___Baz__3fac7276da(struct class__Bar___Baz__3fac7276da obj);
+                void decref__Bar___Baz__3fac7276da(struct class__Bar___Baz__3fac7276da obj);
+                
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,92 @@
+#include <lib/oomph.h>
+#include "_null___Int__080690ac15.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0_null___Int__7e26fdad87_buf = {
+                .refcount = -1,
+                .data = (char[]){ 40,110,117,108,108,32,124,32,73,110,116,41 },
+                .malloced = false,
+            };
+            static struct class_Str string0_null___Int__7e26fdad87 = {
+                .buf = &string0_null___Int__7e26fdad87_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+                struct class_Str meth__null___Int__080690ac15_to_string(struct class__null___Int__080690ac15 obj)
+                {
+                    struct class_Str valstr;
+                    switch(obj.membernum) {
+                        
+                        case 0:
+                            valstr = meth_null_to_string(obj.val.item0);
+                            break;
+                        
+                        case 1:
+                            valstr = meth_Int_to_string(obj.val.item1);
+                            break;
+                        
+                        default:
+                            panic_printf(
+                                "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                                string_to_cstr(string0_null___Int__7e26fdad87), (int)obj.membernum);
+                    }
+
+                    struct class_Str res = string0_null___Int__7e26fdad87;
+                    string_incref(res);
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    oomph_string_concat_inplace(&res, valstr);
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    string_decref(valstr);
+                    return res;
+                }
+
+                bool meth__null___Int__080690ac15_equals(struct class__null___Int__080690ac15 a, struct class__null___Int__080690ac15 b)
+                {
+                    if (a.membernum != b.membernum)
+                        return false;
+                    switch(a.membernum) {
+                        
+                        case 0:
+                            return meth_null_equals(a.val.item0, b.val.item0);
+                        
+                        case 1:
+                            return meth_Int_equals(a.val.item1, b.val.item1);
+                        
+                        default:
+                            panic_printf(
+                                "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                                string_to_cstr(string0_null___Int__7e26fdad87), (int)a.membernum);
+                    }
+                }
+                
+                void incref__null___Int__080690ac15(struct class__null___Int__080690ac15 obj) {
+                    switch(obj.membernum) {
+                        case 0: (void)0; break;
+case 1: (void)0; break;
+
+                        default:
+                            assert(0);
+                    }
+                }
+                void decref__null___Int__080690ac15(struct class__null___Int__080690ac15 obj) {
+                    switch(obj.membernum) {
+                        case -1:   // variable not in use (see UnSet)
+                            break;
+                        case 0: (void)0; break;
+case 1: (void)0; break;
+
+                        default:
+                            assert(0);
+                    }
+                }
+                
+                    int64_t meth__null___Int__080690ac15_get(struct class__null___Int__080690ac15 obj)
+                    {
+                        if (obj.membernum == 0)
+                            panic_printf("Error: null.get() was called");
+                        assert(obj.membernum == 1);
+                        (void)0;
+                        return obj.val.item1;
+                    }
+                    
\ No newline at end of file
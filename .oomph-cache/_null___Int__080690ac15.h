@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD__null___Int__080690ac15
+            #define HEADER_GUARD__null___Int__080690ac15
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+                struct class__null___Int__080690ac15 {
+                    union {
+                        char item0;
+int64_t item1;
+
+                    } val;
+                    short membernum;
+                };
+                
+                struct class_Str meth__null___Int__080690ac15_to_string(struct class__null___Int__080690ac15 obj);
+                bool meth__null___Int__080690ac15_equals(struct class__null___Int__080690ac15 a, struct class__null___Int__080690ac15 b);
+                
+                void incref__null___Int__080690ac15(struct class__null___Int__080690ac15 obj);
+                void decref__null___Int__080690ac15(struct class__null___Int__080690ac15 obj);
+                int64_t meth__null___Int__080690ac15_get(struct class__null___Int__080690ac15 obj);
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,92 @@
+#include <lib/oomph.h>
+#include "_null___Str__3674d0c701.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0_null___Str__d4edfa4f28_buf = {
+                .refcount = -1,
+                .data = (char[]){ 40,110,117,108,108,32,124,32,83,116,114,41 },
+                .malloced = false,
+            };
+            static struct class_Str string0_null___Str__d4edfa4f28 = {
+                .buf = &string0_null___Str__d4edfa4f28_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+                struct class_Str meth__null___Str__3674d0c701_to_string(struct class__null___Str__3674d0c701 obj)
+                {
+                    struct class_Str valstr;
+                    switch(obj.membernum) {
+                        
+                        case 0:
+                            valstr = meth_null_to_string(obj.val.item0);
+                            break;
+                        
+                        case 1:
+                            valstr = meth_Str_to_string(obj.val.item1);
+                            break;
+                        
+                        default:
+                            panic_printf(
+                                "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                                string_to_cstr(string0_null___Str__d4edfa4f28), (int)obj.membernum);
+                    }
+
+                    struct class_Str res = string0_null___Str__d4edfa4f28;
+                    string_incref(res);
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    oomph_string_concat_inplace(&res, valstr);
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    string_decref(valstr);
+                    return res;
+                }
+
+                bool meth__null___Str__3674d0c701_equals(struct class__null___Str__3674d0c701 a, struct class__null___Str__3674d0c701 b)
+                {
+                    if (a.membernum != b.membernum)
+                        return false;
+                    switch(a.membernum) {
+                        
+                        case 0:
+                            return meth_null_equals(a.val.item0, b.val.item0);
+                        
+                        case 1:
+                            return meth_Str_equals(a.val.item1, b.val.item1);
+                        
+                        default:
+                            panic_printf(
+                                "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                                string_to_cstr(string0_null___Str__d4edfa4f28), (int)a.membernum);
+                    }
+                }
+                
+                void incref__null___Str__3674d0c701(struct class__null___Str__3674d0c701 obj) {
+                    switch(obj.membernum) {
+                        case 0: (void)0; break;
+case 1: string_incref(obj.val.item1); break;
+
+                        default:
+                            assert(0);
+                    }
+                }
+                void decref__null___Str__3674d0c701(struct class__null___Str__3674d0c701 obj) {
+                    switch(obj.membernum) {
+                        case -1:   // variable not in use (see UnSet)
+                            break;
+                        case 0: (void)0; break;
+case 1: string_decref(obj.val.item1); break;
+
+                        default:
+                            assert(0);
+                    }
+                }
+                
+                    struct class_Str meth__null___Str__3674d0c701_get(struct class__null___Str__3674d0c701 obj)
+                    {
+                        if (obj.membernum == 0)
+                            panic_printf("Error: null.get() was called");
+                        assert(obj.membernum == 1);
+                        string_incref(obj.val.item1);
+                        return obj.val.item1;
+                    }
+                    
\ No newline at end of file
@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD__null___Str__3674d0c701
+            #define HEADER_GUARD__null___Str__3674d0c701
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+                struct class__null___Str__3674d0c701 {
+                    union {
+                        char item0;
+struct class_Str item1;
+
+                    } val;
+                    short membernum;
+                };
+                
+                struct class_Str meth__null___Str__3674d0c701_to_string(struct class__null___Str__3674d0c701 obj);
+                bool meth__null___Str__3674d0c701_equals(struct class__null___Str__3674d0c701 a, struct class__null___Str__3674d0c701 b);
+                
+                void incref__null___Str__3674d0c701(struct class__null___Str__3674d0c701 obj);
+                void decref__null___Str__3674d0c701(struct class__null___Str__3674d0c701 obj);
+                struct class_Str meth__null___Str__3674d0c701_get(struct class__null___Str__3674d0c701 obj);
+            #endif
+            
\ No newline at end of file
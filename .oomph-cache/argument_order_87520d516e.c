@@ -0,0 +1,87 @@
+#include <lib/oomph.h>
+#include "argument_order_87520d516e.h"
+#include "builtins_8da1dac06a.h"
+int64_t argument_order_87520d516e_do_thing(int64_t var0){
+            int64_t var1;
+            
+            int64_t var2;
+            
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            int64_t retval;
+            var1 = var0;
+(void)0;
+(void)0;
+var2 = var1;
+(void)0;
+string_decref(var3);
+var3.buf = NULL;
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+(void)0;
+var4 = var1;
+(void)0;
+
+                        (void)0;
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+(void)0;
+string_decref(var3);
+(void)0;
+(void)0;
+return retval;
+}
+void argument_order_87520d516e_ignore_all_args(int64_t var0,int64_t var1,int64_t var2){
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            var3 = var0;
+(void)0;
+var4 = var1;
+(void)0;
+var5 = var2;
+(void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+}
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            (void)0;
+var0 = 1LL;
+(void)0;
+var1 = argument_order_87520d516e_do_thing(var0);
+(void)0;
+var2 = 2LL;
+(void)0;
+var3 = argument_order_87520d516e_do_thing(var2);
+(void)0;
+var4 = 3LL;
+(void)0;
+var5 = argument_order_87520d516e_do_thing(var4);
+argument_order_87520d516e_ignore_all_args(var1,var3,var5);
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,11 @@
+
+            #ifndef HEADER_GUARD_argument_order_87520d516e
+            #define HEADER_GUARD_argument_order_87520d516e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+int64_t argument_order_87520d516e_do_thing(int64_t var0);
+void argument_order_87520d516e_ignore_all_args(int64_t var0,int64_t var1,int64_t var2);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,51 @@
+#include <lib/oomph.h>
+#include "as_3b4a0b540c.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+#include "Bar_7bb3f2569c.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            struct class_Foo_1356c67d7a* var1;
+            var1 = NULL;
+
+            struct class_Bar_7bb3f2569c var2;
+            var2.membernum = -1;
+
+            struct class_Foo_1356c67d7a* var3;
+            var3 = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+(void)0;
+var0 = 123LL;
+decref((var1), dtor_Foo_1356c67d7a);
+var1 = NULL;
+var1 = ctor_Foo_1356c67d7a(var0);
+decref_Bar_7bb3f2569c(var2);
+var2.membernum = -1;
+
+                var2 = (struct class_Bar_7bb3f2569c) {
+                    .val = { .item0 = var1 },
+                    .membernum = 0,
+                };
+                incref(var1);
+decref((var3), dtor_Foo_1356c67d7a);
+var3 = NULL;
+
+                if (var2.membernum != 0)
+                    panic_printf("'as' failed");   // TODO: better message?
+
+                var3 = var2.val.item0;
+                incref(var3);
+string_decref(var4);
+var4.buf = NULL;
+var4 = meth_Foo_1356c67d7a_to_string(var3);
+oomph_print(var4);
+out: (void)0;
+string_decref(var4);
+decref((var3), dtor_Foo_1356c67d7a);
+decref_Bar_7bb3f2569c(var2);
+decref((var1), dtor_Foo_1356c67d7a);
+(void)0;
+}
@@ -0,0 +1,13 @@
+
+            #ifndef HEADER_GUARD_as_3b4a0b540c
+            #define HEADER_GUARD_as_3b4a0b540c
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+#include "Bar_7bb3f2569c.h"
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
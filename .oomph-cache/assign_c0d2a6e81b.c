@@ -0,0 +1,51 @@
+#include <lib/oomph.h>
+#include "assign_c0d2a6e81b.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            struct class_Foo_1356c67d7a* var1;
+            var1 = NULL;
+
+            struct class_Foo_1356c67d7a* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct class_Foo_1356c67d7a* var4;
+            var4 = NULL;
+
+            struct class_Foo_1356c67d7a* var5;
+            var5 = NULL;
+(void)0;
+var0 = 1LL;
+decref((var1), dtor_Foo_1356c67d7a);
+var1 = NULL;
+var1 = ctor_Foo_1356c67d7a(var0);
+decref((var2), dtor_Foo_1356c67d7a);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+meth_Foo_1356c67d7a_show(var2);
+(void)0;
+var3 = 2LL;
+decref((var4), dtor_Foo_1356c67d7a);
+var4 = NULL;
+var4 = ctor_Foo_1356c67d7a(var3);
+decref((var1), dtor_Foo_1356c67d7a);
+var1 = var4;
+incref(var1);
+decref((var5), dtor_Foo_1356c67d7a);
+var5 = NULL;
+var5 = var1;
+incref(var5);
+meth_Foo_1356c67d7a_show(var5);
+out: (void)0;
+decref((var5), dtor_Foo_1356c67d7a);
+decref((var4), dtor_Foo_1356c67d7a);
+(void)0;
+decref((var2), dtor_Foo_1356c67d7a);
+decref((var1), dtor_Foo_1356c67d7a);
+(void)0;
+}
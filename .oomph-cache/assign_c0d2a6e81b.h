@@ -0,0 +1,14 @@
+
+            #ifndef HEADER_GUARD_assign_c0d2a6e81b
+            #define HEADER_GUARD_assign_c0d2a6e81b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
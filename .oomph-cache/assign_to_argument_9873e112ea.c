@@ -0,0 +1,139 @@
+#include <lib/oomph.h>
+#include "assign_to_argument_9873e112ea.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+
+            static struct StringBuf string0a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97 },
+                .malloced = false,
+            };
+            static struct class_Str string0a_0cc175b9c0 = {
+                .buf = &string0a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string1_d41d8cd98f = {
+                .buf = &string1_d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ 98 },
+                .malloced = false,
+            };
+            static struct class_Str string2b_92eb5ffee6 = {
+                .buf = &string2b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3c_4a8a08f09d_buf = {
+                .refcount = -1,
+                .data = (char[]){ 99 },
+                .malloced = false,
+            };
+            static struct class_Str string3c_4a8a08f09d = {
+                .buf = &string3c_4a8a08f09d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            void assign_to_argument_9873e112ea_foo(struct class_Str var0){
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+var1 = var0;
+string_incref(var1);
+string_decref(var2);
+var2.buf = NULL;
+
+                var2 = string0a_0cc175b9c0;
+                string_incref(var2);
+                string_decref(var3);
+var3.buf = NULL;
+var3 = var1;
+string_incref(var3);
+string_decref(var4);
+var4.buf = NULL;
+var4 = meth_Str_remove_prefix(var3,var2);
+string_decref(var1);
+var1 = var4;
+string_incref(var1);
+out: (void)0;
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+}
+void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var4;
+            var4 = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string1_d41d8cd98f;
+                string_incref(var0);
+                string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string0a_0cc175b9c0;
+                string_incref(var1);
+                string_decref(var2);
+var2.buf = NULL;
+
+                var2 = string2b_92eb5ffee6;
+                string_incref(var2);
+                string_decref(var3);
+var3.buf = NULL;
+
+                var3 = string3c_4a8a08f09d;
+                string_incref(var3);
+                decref((var4), dtor_List_Str__d1ecbd3335);
+var4 = NULL;
+var4 = ctor_List_Str__d1ecbd3335();
+meth_List_Str__d1ecbd3335_push(var4,var1);
+meth_List_Str__d1ecbd3335_push(var4,var2);
+meth_List_Str__d1ecbd3335_push(var4,var3);
+string_decref(var5);
+var5.buf = NULL;
+var5 = meth_List_Str__d1ecbd3335_join(var4,var0);
+assign_to_argument_9873e112ea_foo(var5);
+out: (void)0;
+string_decref(var5);
+decref((var4), dtor_List_Str__d1ecbd3335);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+string_decref(var0);
+}
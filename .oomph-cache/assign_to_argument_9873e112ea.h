@@ -0,0 +1,12 @@
+
+            #ifndef HEADER_GUARD_assign_to_argument_9873e112ea
+            #define HEADER_GUARD_assign_to_argument_9873e112ea
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+struct class_List_Str__d1ecbd3335;
+void assign_to_argument_9873e112ea_foo(struct class_Str var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
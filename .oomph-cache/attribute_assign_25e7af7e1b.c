@@ -0,0 +1,387 @@
+#include <lib/oomph.h>
+#include "attribute_assign_25e7af7e1b.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+#include "Foo_1356c67d7a.h"
+
+            static struct StringBuf string0_d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string0_d41d8cd98f = {
+                .buf = &string0_d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1l_2db95e8e1a_buf = {
+                .refcount = -1,
+                .data = (char[]){ 108 },
+                .malloced = false,
+            };
+            static struct class_Str string1l_2db95e8e1a = {
+                .buf = &string1l_2db95e8e1a_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2o_d956797521_buf = {
+                .refcount = -1,
+                .data = (char[]){ 111 },
+                .malloced = false,
+            };
+            static struct class_Str string2o_d956797521 = {
+                .buf = &string2o_d956797521_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3w_f1290186a5_buf = {
+                .refcount = -1,
+                .data = (char[]){ 119 },
+                .malloced = false,
+            };
+            static struct class_Str string3w_f1290186a5 = {
+                .buf = &string3w_f1290186a5_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4u_7b774effe4_buf = {
+                .refcount = -1,
+                .data = (char[]){ 117 },
+                .malloced = false,
+            };
+            static struct class_Str string4u_7b774effe4 = {
+                .buf = &string4u_7b774effe4_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5t_e358efa489_buf = {
+                .refcount = -1,
+                .data = (char[]){ 116 },
+                .malloced = false,
+            };
+            static struct class_Str string5t_e358efa489 = {
+                .buf = &string5t_e358efa489_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6blah_6f1ed002ab_buf = {
+                .refcount = -1,
+                .data = (char[]){ 98,108,97,104 },
+                .malloced = false,
+            };
+            static struct class_Str string6blah_6f1ed002ab = {
+                .buf = &string6blah_6f1ed002ab_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var4;
+            var4 = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_Foo_1356c67d7a* var6;
+            var6 = NULL;
+
+            struct class_Foo_1356c67d7a* var7;
+            var7 = NULL;
+
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            struct class_Foo_1356c67d7a* var9;
+            var9 = NULL;
+
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            struct class_Str var11;
+            var11.buf = NULL;
+
+            struct class_Str var12;
+            var12.buf = NULL;
+
+            struct class_Str var13;
+            var13.buf = NULL;
+
+            struct class_Str var14;
+            var14.buf = NULL;
+
+            struct class_Str var15;
+            var15.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var16;
+            var16 = NULL;
+
+            struct class_Str var17;
+            var17.buf = NULL;
+
+            struct class_Str var18;
+            var18.buf = NULL;
+
+            struct class_Foo_1356c67d7a* var19;
+            var19 = NULL;
+
+            struct class_Str var20;
+            var20.buf = NULL;
+
+            int64_t var21;
+            
+            int64_t var22;
+            
+            int64_t var23;
+            
+            bool var24;
+            
+            bool var25;
+            
+            struct class_Foo_1356c67d7a* var26;
+            var26 = NULL;
+
+            struct class_Str var27;
+            var27.buf = NULL;
+
+            int64_t var28;
+            
+            struct class_Str var29;
+            var29.buf = NULL;
+
+            struct class_Str var30;
+            var30.buf = NULL;
+
+            struct class_Str var31;
+            var31.buf = NULL;
+
+            struct class_Foo_1356c67d7a* var32;
+            var32 = NULL;
+
+            struct class_Str var33;
+            var33.buf = NULL;
+
+            int64_t var34;
+            
+            int64_t var35;
+            
+            int64_t var36;
+            
+            bool var37;
+            string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0_d41d8cd98f;
+                string_incref(var0);
+                string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string1l_2db95e8e1a;
+                string_incref(var1);
+                string_decref(var2);
+var2.buf = NULL;
+
+                var2 = string2o_d956797521;
+                string_incref(var2);
+                string_decref(var3);
+var3.buf = NULL;
+
+                var3 = string1l_2db95e8e1a;
+                string_incref(var3);
+                decref((var4), dtor_List_Str__d1ecbd3335);
+var4 = NULL;
+var4 = ctor_List_Str__d1ecbd3335();
+meth_List_Str__d1ecbd3335_push(var4,var1);
+meth_List_Str__d1ecbd3335_push(var4,var2);
+meth_List_Str__d1ecbd3335_push(var4,var3);
+string_decref(var5);
+var5.buf = NULL;
+var5 = meth_List_Str__d1ecbd3335_join(var4,var0);
+decref((var6), dtor_Foo_1356c67d7a);
+var6 = NULL;
+var6 = ctor_Foo_1356c67d7a(var5);
+decref((var7), dtor_Foo_1356c67d7a);
+var7 = NULL;
+var7 = var6;
+incref(var7);
+string_decref(var8);
+var8.buf = NULL;
+var8 = meth_Foo_1356c67d7a_to_string(var7);
+oomph_print(var8);
+decref((var9), dtor_Foo_1356c67d7a);
+var9 = NULL;
+var9 = var6;
+incref(var9);
+string_decref(var10);
+var10.buf = NULL;
+
+                var10 = string0_d41d8cd98f;
+                string_incref(var10);
+                string_decref(var11);
+var11.buf = NULL;
+
+                var11 = string3w_f1290186a5;
+                string_incref(var11);
+                string_decref(var12);
+var12.buf = NULL;
+
+                var12 = string4u_7b774effe4;
+                string_incref(var12);
+                string_decref(var13);
+var13.buf = NULL;
+
+                var13 = string5t_e358efa489;
+                string_incref(var13);
+                string_decref(var14);
+var14.buf = NULL;
+
+                var14 = string5t_e358efa489;
+                string_incref(var14);
+                string_decref(var15);
+var15.buf = NULL;
+
+                var15 = string5t_e358efa489;
+                string_incref(var15);
+                decref((var16), dtor_List_Str__d1ecbd3335);
+var16 = NULL;
+var16 = ctor_List_Str__d1ecbd3335();
+meth_List_Str__d1ecbd3335_push(var16,var11);
+meth_List_Str__d1ecbd3335_push(var16,var12);
+meth_List_Str__d1ecbd3335_push(var16,var13);
+meth_List_Str__d1ecbd3335_push(var16,var14);
+meth_List_Str__d1ecbd3335_push(var16,var15);
+string_decref(var17);
+var17.buf = NULL;
+var17 = meth_List_Str__d1ecbd3335_join(var16,var10);
+string_decref(var18);
+var18.buf = NULL;
+var18 = var9->memb_s;
+var9->memb_s = var17;
+string_incref(var17);
+decref((var19), dtor_Foo_1356c67d7a);
+var19 = NULL;
+var19 = var6;
+incref(var19);
+string_decref(var20);
+var20.buf = NULL;
+var20 = meth_Foo_1356c67d7a_to_string(var19);
+oomph_print(var20);
+(void)0;
+var21 = 0LL;
+label0: (void)0;
+(void)0;
+var22 = var21;
+(void)0;
+(void)0;
+var23 = 10LL;
+(void)0;
+var24 = oomph_int_gt(var23,var22);
+(void)0;
+var25 = oomph_bool_not(var24);
+
+                if (var25)
+                    goto label1;
+                decref((var26), dtor_Foo_1356c67d7a);
+var26 = NULL;
+var26 = var6;
+incref(var26);
+string_decref(var27);
+var27.buf = NULL;
+
+                var27 = string6blah_6f1ed002ab;
+                string_incref(var27);
+                (void)0;
+var28 = var21;
+(void)0;
+string_decref(var29);
+var29.buf = NULL;
+var29 = meth_Int_to_string(var28);
+string_decref(var30);
+var30.buf = NULL;
+var30 = oomph_string_concat(var27,var29);
+string_decref(var31);
+var31.buf = NULL;
+var31 = var26->memb_s;
+var26->memb_s = var30;
+string_incref(var30);
+decref((var32), dtor_Foo_1356c67d7a);
+var32 = NULL;
+var32 = var6;
+incref(var32);
+string_decref(var33);
+var33.buf = NULL;
+var33 = meth_Foo_1356c67d7a_to_string(var32);
+oomph_print(var33);
+label2: (void)0;
+(void)0;
+var34 = var21;
+(void)0;
+(void)0;
+var35 = 1LL;
+(void)0;
+var36 = oomph_int_add(var34,var35);
+(void)0;
+var21 = var36;
+(void)0;
+(void)0;
+var37 = oomph_true;
+
+                if (var37)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var33);
+decref((var32), dtor_Foo_1356c67d7a);
+string_decref(var31);
+string_decref(var30);
+string_decref(var29);
+(void)0;
+string_decref(var27);
+decref((var26), dtor_Foo_1356c67d7a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var20);
+decref((var19), dtor_Foo_1356c67d7a);
+string_decref(var18);
+string_decref(var17);
+decref((var16), dtor_List_Str__d1ecbd3335);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+string_decref(var10);
+decref((var9), dtor_Foo_1356c67d7a);
+string_decref(var8);
+decref((var7), dtor_Foo_1356c67d7a);
+decref((var6), dtor_Foo_1356c67d7a);
+string_decref(var5);
+decref((var4), dtor_List_Str__d1ecbd3335);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+string_decref(var0);
+}
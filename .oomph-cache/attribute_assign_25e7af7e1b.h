@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_attribute_assign_25e7af7e1b
+            #define HEADER_GUARD_attribute_assign_25e7af7e1b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+#include "Foo_1356c67d7a.h"
+struct class_List_Str__d1ecbd3335;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_List_Str__d1ecbd3335;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "attributes_10cc50f77a.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+#include "Bar_ddc35f88fa.h"
+struct class_Bar_ddc35f88fa* attributes_10cc50f77a_blah(void){
+            struct class_Foo_1356c67d7a* var0;
+            var0 = NULL;
+
+            struct class_Bar_ddc35f88fa* var1;
+            var1 = NULL;
+
+            struct class_Bar_ddc35f88fa* var2;
+            var2 = NULL;
+
+            struct class_Bar_ddc35f88fa* retval;
+            decref((var0), dtor_Foo_1356c67d7a);
+var0 = NULL;
+var0 = ctor_Foo_1356c67d7a();
+decref((var1), dtor_Bar_ddc35f88fa);
+var1 = NULL;
+var1 = ctor_Bar_ddc35f88fa(var0);
+decref((var2), dtor_Bar_ddc35f88fa);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+
+                        incref(var2);
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+decref((var2), dtor_Bar_ddc35f88fa);
+decref((var1), dtor_Bar_ddc35f88fa);
+decref((var0), dtor_Foo_1356c67d7a);
+return retval;
+}
+void oomph_main(void){
+            struct class_Bar_ddc35f88fa* var0;
+            var0 = NULL;
+
+            struct class_Foo_1356c67d7a* var1;
+            var1 = NULL;
+decref((var0), dtor_Bar_ddc35f88fa);
+var0 = NULL;
+var0 = attributes_10cc50f77a_blah();
+decref((var1), dtor_Foo_1356c67d7a);
+var1 = NULL;
+var1 = var0->memb_foo;
+incref(var1);
+out: (void)0;
+decref((var1), dtor_Foo_1356c67d7a);
+decref((var0), dtor_Bar_ddc35f88fa);
+}
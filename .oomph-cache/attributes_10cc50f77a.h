@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_attributes_10cc50f77a
+            #define HEADER_GUARD_attributes_10cc50f77a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+#include "Bar_ddc35f88fa.h"
+struct class_Foo_1356c67d7a;
+struct class_Bar_ddc35f88fa;
+struct class_Bar_ddc35f88fa;
+struct class_Bar_ddc35f88fa;
+struct class_Bar_ddc35f88fa;
+struct class_Bar_ddc35f88fa;
+struct class_Foo_1356c67d7a;
+struct class_Bar_ddc35f88fa* attributes_10cc50f77a_blah(void);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
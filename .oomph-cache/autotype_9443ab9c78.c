@@ -0,0 +1,105 @@
+#include <lib/oomph.h>
+#include "autotype_9443ab9c78.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__ca8c9dc13d.h"
+#include "List_Str__d1ecbd3335.h"
+
+            static struct StringBuf string0lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ 108,111,108 },
+                .malloced = false,
+            };
+            static struct class_Str string0lol_9cdfb439c7 = {
+                .buf = &string0lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            struct class_List_Str__d1ecbd3335* autotype_9443ab9c78_auto_inside_list(void){
+            struct class_List_Int__ca8c9dc13d* var0;
+            var0 = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var1;
+            var1 = NULL;
+
+            struct class_List_Str__d1ecbd3335* var2;
+            var2 = NULL;
+
+            struct class_List_Str__d1ecbd3335* retval;
+            decref((var0), dtor_List_Int__ca8c9dc13d);
+var0 = NULL;
+var0 = ctor_List_Int__ca8c9dc13d();
+decref((var1), dtor_List_Int__ca8c9dc13d);
+var1 = NULL;
+var1 = ctor_List_Int__ca8c9dc13d();
+decref((var0), dtor_List_Int__ca8c9dc13d);
+var0 = var1;
+incref(var0);
+decref((var2), dtor_List_Str__d1ecbd3335);
+var2 = NULL;
+var2 = ctor_List_Str__d1ecbd3335();
+
+                        incref(var2);
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+decref((var2), dtor_List_Str__d1ecbd3335);
+decref((var1), dtor_List_Int__ca8c9dc13d);
+decref((var0), dtor_List_Int__ca8c9dc13d);
+return retval;
+}
+void oomph_main(void){
+            struct class_List_Int__ca8c9dc13d* var0;
+            var0 = NULL;
+
+            int64_t var1;
+            
+            struct class_List_Int__ca8c9dc13d* var2;
+            var2 = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var3;
+            var3 = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var6;
+            var6 = NULL;
+decref((var0), dtor_List_Int__ca8c9dc13d);
+var0 = NULL;
+var0 = ctor_List_Int__ca8c9dc13d();
+(void)0;
+var1 = 1LL;
+decref((var2), dtor_List_Int__ca8c9dc13d);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+meth_List_Int__ca8c9dc13d_push(var2,var1);
+decref((var3), dtor_List_Int__ca8c9dc13d);
+var3 = NULL;
+var3 = var0;
+incref(var3);
+string_decref(var4);
+var4.buf = NULL;
+var4 = meth_List_Int__ca8c9dc13d_to_string(var3);
+oomph_print(var4);
+string_decref(var5);
+var5.buf = NULL;
+
+                var5 = string0lol_9cdfb439c7;
+                string_incref(var5);
+                decref((var6), dtor_List_Str__d1ecbd3335);
+var6 = NULL;
+var6 = autotype_9443ab9c78_auto_inside_list();
+meth_List_Str__d1ecbd3335_push(var6,var5);
+out: (void)0;
+decref((var6), dtor_List_Str__d1ecbd3335);
+string_decref(var5);
+string_decref(var4);
+decref((var3), dtor_List_Int__ca8c9dc13d);
+decref((var2), dtor_List_Int__ca8c9dc13d);
+(void)0;
+decref((var0), dtor_List_Int__ca8c9dc13d);
+}
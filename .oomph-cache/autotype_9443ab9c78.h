@@ -0,0 +1,21 @@
+
+            #ifndef HEADER_GUARD_autotype_9443ab9c78
+            #define HEADER_GUARD_autotype_9443ab9c78
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Int__ca8c9dc13d.h"
+#include "List_Str__d1ecbd3335.h"
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335* autotype_9443ab9c78_auto_inside_list(void);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
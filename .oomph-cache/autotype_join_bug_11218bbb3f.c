@@ -0,0 +1,107 @@
+#include <lib/oomph.h>
+#include "autotype_join_bug_11218bbb3f.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+
+            static struct StringBuf string0a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97 },
+                .malloced = false,
+            };
+            static struct class_Str string0a_0cc175b9c0 = {
+                .buf = &string0a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ 98 },
+                .malloced = false,
+            };
+            static struct class_Str string1b_92eb5ffee6 = {
+                .buf = &string1b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_and__0060636b44_buf = {
+                .refcount = -1,
+                .data = (char[]){ 32,97,110,100,32 },
+                .malloced = false,
+            };
+            static struct class_Str string2_and__0060636b44 = {
+                .buf = &string2_and__0060636b44_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_List_Str__d1ecbd3335* var0;
+            var0 = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var2;
+            var2 = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var4;
+            var4 = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var6;
+            var6 = NULL;
+
+            struct class_Str var7;
+            var7.buf = NULL;
+decref((var0), dtor_List_Str__d1ecbd3335);
+var0 = NULL;
+var0 = ctor_List_Str__d1ecbd3335();
+string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string0a_0cc175b9c0;
+                string_incref(var1);
+                decref((var2), dtor_List_Str__d1ecbd3335);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+meth_List_Str__d1ecbd3335_push(var2,var1);
+string_decref(var3);
+var3.buf = NULL;
+
+                var3 = string1b_92eb5ffee6;
+                string_incref(var3);
+                decref((var4), dtor_List_Str__d1ecbd3335);
+var4 = NULL;
+var4 = var0;
+incref(var4);
+meth_List_Str__d1ecbd3335_push(var4,var3);
+string_decref(var5);
+var5.buf = NULL;
+
+                var5 = string2_and__0060636b44;
+                string_incref(var5);
+                decref((var6), dtor_List_Str__d1ecbd3335);
+var6 = NULL;
+var6 = var0;
+incref(var6);
+string_decref(var7);
+var7.buf = NULL;
+var7 = meth_List_Str__d1ecbd3335_join(var6,var5);
+oomph_print(var7);
+out: (void)0;
+string_decref(var7);
+decref((var6), dtor_List_Str__d1ecbd3335);
+string_decref(var5);
+decref((var4), dtor_List_Str__d1ecbd3335);
+string_decref(var3);
+decref((var2), dtor_List_Str__d1ecbd3335);
+string_decref(var1);
+decref((var0), dtor_List_Str__d1ecbd3335);
+}
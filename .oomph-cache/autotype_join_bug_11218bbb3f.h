@@ -0,0 +1,14 @@
+
+            #ifndef HEADER_GUARD_autotype_join_bug_11218bbb3f
+            #define HEADER_GUARD_autotype_join_bug_11218bbb3f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
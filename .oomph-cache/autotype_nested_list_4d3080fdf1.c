@@ -0,0 +1,80 @@
+#include <lib/oomph.h>
+#include "autotype_nested_list_4d3080fdf1.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__ca8c9dc13d.h"
+#include "List_List_Int___8fd36eac24.h"
+void oomph_main(void){
+            struct class_List_Int__ca8c9dc13d* var0;
+            var0 = NULL;
+
+            struct class_List_List_Int___8fd36eac24* var1;
+            var1 = NULL;
+
+            struct class_List_List_Int___8fd36eac24* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct class_List_Int__ca8c9dc13d* var4;
+            var4 = NULL;
+
+            struct class_List_List_Int___8fd36eac24* var5;
+            var5 = NULL;
+
+            bool var6;
+            
+            struct class_Str var7;
+            var7.buf = NULL;
+
+            struct class_List_List_Int___8fd36eac24* var8;
+            var8 = NULL;
+
+            struct class_Str var9;
+            var9.buf = NULL;
+decref((var0), dtor_List_Int__ca8c9dc13d);
+var0 = NULL;
+var0 = ctor_List_Int__ca8c9dc13d();
+decref((var1), dtor_List_List_Int___8fd36eac24);
+var1 = NULL;
+var1 = ctor_List_List_Int___8fd36eac24();
+meth_List_List_Int___8fd36eac24_push(var1,var0);
+decref((var2), dtor_List_List_Int___8fd36eac24);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+(void)0;
+var3 = 1LL;
+decref((var4), dtor_List_Int__ca8c9dc13d);
+var4 = NULL;
+var4 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var4,var3);
+decref((var5), dtor_List_List_Int___8fd36eac24);
+var5 = NULL;
+var5 = ctor_List_List_Int___8fd36eac24();
+meth_List_List_Int___8fd36eac24_push(var5,var4);
+(void)0;
+var6 = meth_List_List_Int___8fd36eac24_equals(var2,var5);
+string_decref(var7);
+var7.buf = NULL;
+var7 = meth_Bool_to_string(var6);
+oomph_print(var7);
+decref((var8), dtor_List_List_Int___8fd36eac24);
+var8 = NULL;
+var8 = var1;
+incref(var8);
+string_decref(var9);
+var9.buf = NULL;
+var9 = meth_List_List_Int___8fd36eac24_to_string(var8);
+oomph_print(var9);
+out: (void)0;
+string_decref(var9);
+decref((var8), dtor_List_List_Int___8fd36eac24);
+string_decref(var7);
+(void)0;
+decref((var5), dtor_List_List_Int___8fd36eac24);
+decref((var4), dtor_List_Int__ca8c9dc13d);
+(void)0;
+decref((var2), dtor_List_List_Int___8fd36eac24);
+decref((var1), dtor_List_List_Int___8fd36eac24);
+decref((var0), dtor_List_Int__ca8c9dc13d);
+}
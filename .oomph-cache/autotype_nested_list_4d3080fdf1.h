@@ -0,0 +1,17 @@
+
+            #ifndef HEADER_GUARD_autotype_nested_list_4d3080fdf1
+            #define HEADER_GUARD_autotype_nested_list_4d3080fdf1
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Int__ca8c9dc13d.h"
+#include "List_List_Int___8fd36eac24.h"
+struct class_List_Int__ca8c9dc13d;
+struct class_List_List_Int___8fd36eac24;
+struct class_List_List_Int___8fd36eac24;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_List_Int___8fd36eac24;
+struct class_List_List_Int___8fd36eac24;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,579 @@
+#include <lib/oomph.h>
+#include "bool_deac3f6a18.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            bool var0;
+            
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            bool var2;
+            
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            bool var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            bool var12;
+            
+            struct class_Str var13;
+            var13.buf = NULL;
+
+            bool var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            bool var17;
+            
+            struct class_Str var18;
+            var18.buf = NULL;
+
+            bool var19;
+            
+            bool var20;
+            
+            bool var21;
+            
+            bool var22;
+            
+            struct class_Str var23;
+            var23.buf = NULL;
+
+            bool var24;
+            
+            bool var25;
+            
+            bool var26;
+            
+            bool var27;
+            
+            struct class_Str var28;
+            var28.buf = NULL;
+
+            bool var29;
+            
+            bool var30;
+            
+            bool var31;
+            
+            bool var32;
+            
+            struct class_Str var33;
+            var33.buf = NULL;
+
+            bool var34;
+            
+            bool var35;
+            
+            bool var36;
+            
+            bool var37;
+            
+            struct class_Str var38;
+            var38.buf = NULL;
+
+            bool var39;
+            
+            bool var40;
+            
+            bool var41;
+            
+            bool var42;
+            
+            struct class_Str var43;
+            var43.buf = NULL;
+
+            bool var44;
+            
+            bool var45;
+            
+            struct class_Str var46;
+            var46.buf = NULL;
+
+            bool var47;
+            
+            bool var48;
+            
+            struct class_Str var49;
+            var49.buf = NULL;
+
+            bool var50;
+            
+            bool var51;
+            
+            bool var52;
+            
+            bool var53;
+            
+            bool var54;
+            
+            bool var55;
+            
+            struct class_Str var56;
+            var56.buf = NULL;
+
+            bool var57;
+            
+            bool var58;
+            
+            bool var59;
+            
+            bool var60;
+            
+            bool var61;
+            
+            bool var62;
+            
+            struct class_Str var63;
+            var63.buf = NULL;
+
+            bool var64;
+            
+            bool var65;
+            
+            bool var66;
+            
+            bool var67;
+            
+            bool var68;
+            
+            bool var69;
+            
+            struct class_Str var70;
+            var70.buf = NULL;
+
+            bool var71;
+            
+            bool var72;
+            
+            bool var73;
+            
+            bool var74;
+            
+            bool var75;
+            
+            bool var76;
+            
+            struct class_Str var77;
+            var77.buf = NULL;
+(void)0;
+var0 = oomph_true;
+(void)0;
+string_decref(var1);
+var1.buf = NULL;
+var1 = meth_Bool_to_string(var0);
+oomph_print(var1);
+(void)0;
+var2 = oomph_false;
+(void)0;
+string_decref(var3);
+var3.buf = NULL;
+var3 = meth_Bool_to_string(var2);
+oomph_print(var3);
+(void)0;
+var4 = oomph_true;
+(void)0;
+(void)0;
+
+                if (var4)
+                    goto label0;
+                var5 = oomph_false;
+(void)0;
+var6 = oomph_true;
+
+                if (var6)
+                    goto label1;
+                label0: (void)0;
+(void)0;
+var7 = oomph_true;
+(void)0;
+var5 = var7;
+label1: (void)0;
+string_decref(var8);
+var8.buf = NULL;
+var8 = meth_Bool_to_string(var5);
+oomph_print(var8);
+(void)0;
+var9 = oomph_true;
+(void)0;
+(void)0;
+
+                if (var9)
+                    goto label2;
+                var10 = oomph_false;
+(void)0;
+var11 = oomph_true;
+
+                if (var11)
+                    goto label3;
+                label2: (void)0;
+(void)0;
+var12 = oomph_false;
+(void)0;
+var10 = var12;
+label3: (void)0;
+string_decref(var13);
+var13.buf = NULL;
+var13 = meth_Bool_to_string(var10);
+oomph_print(var13);
+(void)0;
+var14 = oomph_false;
+(void)0;
+(void)0;
+
+                if (var14)
+                    goto label4;
+                var15 = oomph_false;
+(void)0;
+var16 = oomph_true;
+
+                if (var16)
+                    goto label5;
+                label4: (void)0;
+(void)0;
+var17 = oomph_true;
+(void)0;
+var15 = var17;
+label5: (void)0;
+string_decref(var18);
+var18.buf = NULL;
+var18 = meth_Bool_to_string(var15);
+oomph_print(var18);
+(void)0;
+var19 = oomph_false;
+(void)0;
+(void)0;
+
+                if (var19)
+                    goto label6;
+                var20 = oomph_false;
+(void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label7;
+                label6: (void)0;
+(void)0;
+var22 = oomph_false;
+(void)0;
+var20 = var22;
+label7: (void)0;
+string_decref(var23);
+var23.buf = NULL;
+var23 = meth_Bool_to_string(var20);
+oomph_print(var23);
+(void)0;
+var24 = oomph_true;
+(void)0;
+(void)0;
+
+                if (var24)
+                    goto label8;
+                (void)0;
+var26 = oomph_true;
+(void)0;
+var25 = var26;
+(void)0;
+var27 = oomph_true;
+
+                if (var27)
+                    goto label9;
+                label8: (void)0;
+var25 = oomph_true;
+label9: (void)0;
+string_decref(var28);
+var28.buf = NULL;
+var28 = meth_Bool_to_string(var25);
+oomph_print(var28);
+(void)0;
+var29 = oomph_true;
+(void)0;
+(void)0;
+
+                if (var29)
+                    goto label10;
+                (void)0;
+var31 = oomph_false;
+(void)0;
+var30 = var31;
+(void)0;
+var32 = oomph_true;
+
+                if (var32)
+                    goto label11;
+                label10: (void)0;
+var30 = oomph_true;
+label11: (void)0;
+string_decref(var33);
+var33.buf = NULL;
+var33 = meth_Bool_to_string(var30);
+oomph_print(var33);
+(void)0;
+var34 = oomph_false;
+(void)0;
+(void)0;
+
+                if (var34)
+                    goto label12;
+                (void)0;
+var36 = oomph_true;
+(void)0;
+var35 = var36;
+(void)0;
+var37 = oomph_true;
+
+                if (var37)
+                    goto label13;
+                label12: (void)0;
+var35 = oomph_true;
+label13: (void)0;
+string_decref(var38);
+var38.buf = NULL;
+var38 = meth_Bool_to_string(var35);
+oomph_print(var38);
+(void)0;
+var39 = oomph_false;
+(void)0;
+(void)0;
+
+                if (var39)
+                    goto label14;
+                (void)0;
+var41 = oomph_false;
+(void)0;
+var40 = var41;
+(void)0;
+var42 = oomph_true;
+
+                if (var42)
+                    goto label15;
+                label14: (void)0;
+var40 = oomph_true;
+label15: (void)0;
+string_decref(var43);
+var43.buf = NULL;
+var43 = meth_Bool_to_string(var40);
+oomph_print(var43);
+(void)0;
+var44 = oomph_true;
+(void)0;
+(void)0;
+var45 = oomph_bool_not(var44);
+string_decref(var46);
+var46.buf = NULL;
+var46 = meth_Bool_to_string(var45);
+oomph_print(var46);
+(void)0;
+var47 = oomph_false;
+(void)0;
+(void)0;
+var48 = oomph_bool_not(var47);
+string_decref(var49);
+var49.buf = NULL;
+var49 = meth_Bool_to_string(var48);
+oomph_print(var49);
+(void)0;
+var50 = oomph_true;
+(void)0;
+(void)0;
+var51 = oomph_bool_not(var50);
+(void)0;
+
+                if (var51)
+                    goto label16;
+                var52 = oomph_false;
+(void)0;
+var53 = oomph_true;
+
+                if (var53)
+                    goto label17;
+                label16: (void)0;
+(void)0;
+var54 = oomph_true;
+(void)0;
+(void)0;
+var55 = oomph_bool_not(var54);
+var52 = var55;
+label17: (void)0;
+string_decref(var56);
+var56.buf = NULL;
+var56 = meth_Bool_to_string(var52);
+oomph_print(var56);
+(void)0;
+var57 = oomph_true;
+(void)0;
+(void)0;
+var58 = oomph_bool_not(var57);
+(void)0;
+
+                if (var58)
+                    goto label18;
+                var59 = oomph_false;
+(void)0;
+var60 = oomph_true;
+
+                if (var60)
+                    goto label19;
+                label18: (void)0;
+(void)0;
+var61 = oomph_false;
+(void)0;
+(void)0;
+var62 = oomph_bool_not(var61);
+var59 = var62;
+label19: (void)0;
+string_decref(var63);
+var63.buf = NULL;
+var63 = meth_Bool_to_string(var59);
+oomph_print(var63);
+(void)0;
+var64 = oomph_false;
+(void)0;
+(void)0;
+var65 = oomph_bool_not(var64);
+(void)0;
+
+                if (var65)
+                    goto label20;
+                var66 = oomph_false;
+(void)0;
+var67 = oomph_true;
+
+                if (var67)
+                    goto label21;
+                label20: (void)0;
+(void)0;
+var68 = oomph_true;
+(void)0;
+(void)0;
+var69 = oomph_bool_not(var68);
+var66 = var69;
+label21: (void)0;
+string_decref(var70);
+var70.buf = NULL;
+var70 = meth_Bool_to_string(var66);
+oomph_print(var70);
+(void)0;
+var71 = oomph_false;
+(void)0;
+(void)0;
+var72 = oomph_bool_not(var71);
+(void)0;
+
+                if (var72)
+                    goto label22;
+                var73 = oomph_false;
+(void)0;
+var74 = oomph_true;
+
+                if (var74)
+                    goto label23;
+                label22: (void)0;
+(void)0;
+var75 = oomph_false;
+(void)0;
+(void)0;
+var76 = oomph_bool_not(var75);
+var73 = var76;
+label23: (void)0;
+string_decref(var77);
+var77.buf = NULL;
+var77 = meth_Bool_to_string(var73);
+oomph_print(var77);
+out: (void)0;
+string_decref(var77);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var70);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var63);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var56);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var49);
+(void)0;
+(void)0;
+string_decref(var46);
+(void)0;
+(void)0;
+string_decref(var43);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var38);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var33);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var28);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var23);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var18);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var13);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var8);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var3);
+(void)0;
+string_decref(var1);
+(void)0;
+}
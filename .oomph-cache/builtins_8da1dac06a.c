@@ -0,0 +1,2284 @@
+#include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Int__ca8c9dc13d.h"
+#include "List_Str__d1ecbd3335.h"
+
+            static struct StringBuf string0true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ 116,114,117,101 },
+                .malloced = false,
+            };
+            static struct class_Str string0true_b326b5062b = {
+                .buf = &string0true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ 102,97,108,115,101 },
+                .malloced = false,
+            };
+            static struct class_Str string1false_68934a3e94 = {
+                .buf = &string1false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string2_d41d8cd98f = {
+                .buf = &string2_d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3__7215ee9c7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ 32 },
+                .malloced = false,
+            };
+            static struct class_Str string3__7215ee9c7d = {
+                .buf = &string3__7215ee9c7d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4__68b329da98_buf = {
+                .refcount = -1,
+                .data = (char[]){ 10 },
+                .malloced = false,
+            };
+            static struct class_Str string4__68b329da98 = {
+                .buf = &string4__68b329da98_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            struct class_Str meth_Bool_to_string(bool var0){
+            bool var1;
+            
+            bool var2;
+            
+            bool var3;
+            
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_Str retval;
+            var1 = var0;
+(void)0;
+(void)0;
+var2 = var1;
+(void)0;
+
+                if (var2)
+                    goto label0;
+                (void)0;
+var3 = oomph_true;
+
+                if (var3)
+                    goto label1;
+                label0: (void)0;
+string_decref(var4);
+var4.buf = NULL;
+
+                var4 = string0true_b326b5062b;
+                string_incref(var4);
+                
+                        string_incref(var4);
+                        retval = var4;
+                        goto out;
+                        label1: (void)0;
+string_decref(var5);
+var5.buf = NULL;
+
+                var5 = string1false_68934a3e94;
+                string_incref(var5);
+                
+                        string_incref(var5);
+                        retval = var5;
+                        goto out;
+                        out: (void)0;
+string_decref(var5);
+string_decref(var4);
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}
+struct class_List_Int__ca8c9dc13d* meth_Str_get_utf8(struct class_Str var0){
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var2;
+            var2 = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            struct class_List_Int__ca8c9dc13d* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            int64_t var7;
+            
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            int64_t var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            struct class_Str var12;
+            var12.buf = NULL;
+
+            int64_t var13;
+            
+            int64_t var14;
+            
+            struct class_List_Int__ca8c9dc13d* var15;
+            var15 = NULL;
+
+            int64_t var16;
+            
+            int64_t var17;
+            
+            int64_t var18;
+            
+            bool var19;
+            
+            struct class_List_Int__ca8c9dc13d* var20;
+            var20 = NULL;
+
+            struct class_List_Int__ca8c9dc13d* retval;
+            var1 = var0;
+string_incref(var1);
+decref((var2), dtor_List_Int__ca8c9dc13d);
+var2 = NULL;
+var2 = ctor_List_Int__ca8c9dc13d();
+string_decref(var3);
+var3.buf = NULL;
+var3 = var1;
+string_incref(var3);
+(void)0;
+var4 = oomph_utf8_len(var3);
+decref((var5), dtor_List_Int__ca8c9dc13d);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+meth_List_Int__ca8c9dc13d___reserve(var5,var4);
+(void)0;
+var6 = 0LL;
+label0: (void)0;
+(void)0;
+var7 = var6;
+(void)0;
+string_decref(var8);
+var8.buf = NULL;
+var8 = var1;
+string_incref(var8);
+(void)0;
+var9 = oomph_utf8_len(var8);
+(void)0;
+var10 = oomph_int_gt(var9,var7);
+(void)0;
+var11 = oomph_bool_not(var10);
+
+                if (var11)
+                    goto label1;
+                string_decref(var12);
+var12.buf = NULL;
+var12 = var1;
+string_incref(var12);
+(void)0;
+var13 = var6;
+(void)0;
+(void)0;
+var14 = oomph_get_utf8_byte(var12,var13);
+decref((var15), dtor_List_Int__ca8c9dc13d);
+var15 = NULL;
+var15 = var2;
+incref(var15);
+meth_List_Int__ca8c9dc13d_push(var15,var14);
+label2: (void)0;
+(void)0;
+var16 = var6;
+(void)0;
+(void)0;
+var17 = 1LL;
+(void)0;
+var18 = oomph_int_add(var16,var17);
+(void)0;
+var6 = var18;
+(void)0;
+(void)0;
+var19 = oomph_true;
+
+                if (var19)
+                    goto label0;
+                label1: (void)0;
+decref((var20), dtor_List_Int__ca8c9dc13d);
+var20 = NULL;
+var20 = var2;
+incref(var20);
+
+                        incref(var20);
+                        retval = var20;
+                        goto out;
+                        out: (void)0;
+decref((var20), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var15), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+string_decref(var12);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var8);
+(void)0;
+(void)0;
+decref((var5), dtor_List_Int__ca8c9dc13d);
+(void)0;
+string_decref(var3);
+decref((var2), dtor_List_Int__ca8c9dc13d);
+string_decref(var1);
+return retval;
+}
+struct class_Str meth_Str_repeat(struct class_Str var0,int64_t var1){
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            int64_t var3;
+            
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            int64_t var6;
+            
+            int64_t var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+            int64_t var10;
+            
+            int64_t var11;
+            
+            int64_t var12;
+            
+            int64_t var13;
+            
+            bool var14;
+            
+            bool var15;
+            
+            struct class_Str var16;
+            var16.buf = NULL;
+
+            struct class_Str var17;
+            var17.buf = NULL;
+
+            struct class_Str var18;
+            var18.buf = NULL;
+
+            int64_t var19;
+            
+            int64_t var20;
+            
+            double var21;
+            
+            double var22;
+            
+            double var23;
+            
+            int64_t var24;
+            
+            struct class_Str var25;
+            var25.buf = NULL;
+
+            struct class_Str var26;
+            var26.buf = NULL;
+
+            struct class_Str var27;
+            var27.buf = NULL;
+
+            bool var28;
+            
+            struct class_Str var29;
+            var29.buf = NULL;
+
+            struct class_Str retval;
+            var2 = var0;
+string_incref(var2);
+var3 = var1;
+(void)0;
+string_decref(var4);
+var4.buf = NULL;
+
+                var4 = string2_d41d8cd98f;
+                string_incref(var4);
+                string_decref(var5);
+var5.buf = NULL;
+var5 = var2;
+string_incref(var5);
+label0: (void)0;
+(void)0;
+var6 = var3;
+(void)0;
+(void)0;
+var7 = 0LL;
+(void)0;
+var8 = oomph_int_gt(var6,var7);
+(void)0;
+var9 = oomph_bool_not(var8);
+
+                if (var9)
+                    goto label1;
+                (void)0;
+var10 = var3;
+(void)0;
+(void)0;
+var11 = 2LL;
+(void)0;
+var12 = oomph_int_mod(var10,var11);
+(void)0;
+var13 = 1LL;
+(void)0;
+var14 = meth_Int_equals(var12,var13);
+
+                if (var14)
+                    goto label2;
+                (void)0;
+var15 = oomph_true;
+
+                if (var15)
+                    goto label3;
+                label2: (void)0;
+string_decref(var16);
+var16.buf = NULL;
+var16 = var4;
+string_incref(var16);
+string_decref(var17);
+var17.buf = NULL;
+var17 = var5;
+string_incref(var17);
+string_decref(var18);
+var18.buf = NULL;
+var18 = oomph_string_concat(var16,var17);
+string_decref(var4);
+var4 = var18;
+string_incref(var4);
+label3: (void)0;
+(void)0;
+var19 = var3;
+(void)0;
+(void)0;
+var20 = 2LL;
+(void)0;
+var21 = oomph_int2float(var19);
+(void)0;
+var22 = oomph_int2float(var20);
+(void)0;
+var23 = oomph_float_div(var21,var22);
+(void)0;
+var24 = meth_Float_floor(var23);
+(void)0;
+var3 = var24;
+(void)0;
+string_decref(var25);
+var25.buf = NULL;
+var25 = var5;
+string_incref(var25);
+string_decref(var26);
+var26.buf = NULL;
+var26 = var5;
+string_incref(var26);
+string_decref(var27);
+var27.buf = NULL;
+var27 = oomph_string_concat(var25,var26);
+string_decref(var5);
+var5 = var27;
+string_incref(var5);
+label4: (void)0;
+(void)0;
+var28 = oomph_true;
+
+                if (var28)
+                    goto label0;
+                label1: (void)0;
+string_decref(var29);
+var29.buf = NULL;
+var29 = var4;
+string_incref(var29);
+
+                        string_incref(var29);
+                        retval = var29;
+                        goto out;
+                        out: (void)0;
+string_decref(var29);
+(void)0;
+string_decref(var27);
+string_decref(var26);
+string_decref(var25);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var18);
+string_decref(var17);
+string_decref(var16);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var5);
+string_decref(var4);
+(void)0;
+string_decref(var2);
+return retval;
+}
+bool meth_Str_starts_with(struct class_Str var0,struct class_Str var1){
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            bool var6;
+            
+            bool var7;
+            
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            struct class_Str var9;
+            var9.buf = NULL;
+
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            struct class_Str var11;
+            var11.buf = NULL;
+
+            bool var12;
+            
+            bool var13;
+            
+            bool var14;
+            
+            bool retval;
+            var2 = var0;
+string_incref(var2);
+var3 = var1;
+string_incref(var3);
+string_decref(var4);
+var4.buf = NULL;
+var4 = var3;
+string_incref(var4);
+string_decref(var5);
+var5.buf = NULL;
+
+                var5 = string2_d41d8cd98f;
+                string_incref(var5);
+                (void)0;
+var6 = meth_Str_equals(var4,var5);
+(void)0;
+
+                if (var6)
+                    goto label0;
+                string_decref(var8);
+var8.buf = NULL;
+var8 = var3;
+string_incref(var8);
+string_decref(var9);
+var9.buf = NULL;
+var9 = var2;
+string_incref(var9);
+string_decref(var10);
+var10.buf = NULL;
+var10 = meth_Str_remove_prefix(var9,var8);
+string_decref(var11);
+var11.buf = NULL;
+var11 = var2;
+string_incref(var11);
+(void)0;
+var12 = meth_Str_equals(var10,var11);
+(void)0;
+var13 = oomph_bool_not(var12);
+var7 = var13;
+(void)0;
+var14 = oomph_true;
+
+                if (var14)
+                    goto label1;
+                label0: (void)0;
+var7 = oomph_true;
+label1: (void)0;
+
+                        (void)0;
+                        retval = var7;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var11);
+string_decref(var10);
+string_decref(var9);
+string_decref(var8);
+(void)0;
+(void)0;
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+return retval;
+}
+bool meth_Str_ends_with(struct class_Str var0,struct class_Str var1){
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            bool var6;
+            
+            bool var7;
+            
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            struct class_Str var9;
+            var9.buf = NULL;
+
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            struct class_Str var11;
+            var11.buf = NULL;
+
+            bool var12;
+            
+            bool var13;
+            
+            bool var14;
+            
+            bool retval;
+            var2 = var0;
+string_incref(var2);
+var3 = var1;
+string_incref(var3);
+string_decref(var4);
+var4.buf = NULL;
+var4 = var3;
+string_incref(var4);
+string_decref(var5);
+var5.buf = NULL;
+
+                var5 = string2_d41d8cd98f;
+                string_incref(var5);
+                (void)0;
+var6 = meth_Str_equals(var4,var5);
+(void)0;
+
+                if (var6)
+                    goto label0;
+                string_decref(var8);
+var8.buf = NULL;
+var8 = var3;
+string_incref(var8);
+string_decref(var9);
+var9.buf = NULL;
+var9 = var2;
+string_incref(var9);
+string_decref(var10);
+var10.buf = NULL;
+var10 = meth_Str_remove_suffix(var9,var8);
+string_decref(var11);
+var11.buf = NULL;
+var11 = var2;
+string_incref(var11);
+(void)0;
+var12 = meth_Str_equals(var10,var11);
+(void)0;
+var13 = oomph_bool_not(var12);
+var7 = var13;
+(void)0;
+var14 = oomph_true;
+
+                if (var14)
+                    goto label1;
+                label0: (void)0;
+var7 = oomph_true;
+label1: (void)0;
+
+                        (void)0;
+                        retval = var7;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var11);
+string_decref(var10);
+string_decref(var9);
+string_decref(var8);
+(void)0;
+(void)0;
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+return retval;
+}
+bool meth_Str___contains(struct class_Str var0,struct class_Str var1){
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            struct class_Str var9;
+            var9.buf = NULL;
+
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            bool var11;
+            
+            bool var12;
+            
+            struct class_Str var13;
+            var13.buf = NULL;
+
+            struct class_Str var14;
+            var14.buf = NULL;
+
+            struct class_Str var15;
+            var15.buf = NULL;
+
+            struct class_Str var16;
+            var16.buf = NULL;
+
+            bool var17;
+            
+            bool var18;
+            
+            bool var19;
+            
+            bool retval;
+            var2 = var0;
+string_incref(var2);
+var3 = var1;
+string_incref(var3);
+string_decref(var4);
+var4.buf = NULL;
+var4 = var2;
+string_incref(var4);
+string_decref(var5);
+var5.buf = NULL;
+
+                var5 = string2_d41d8cd98f;
+                string_incref(var5);
+                (void)0;
+var6 = meth_Str_equals(var4,var5);
+(void)0;
+
+                if (var6)
+                    goto label0;
+                var7 = oomph_false;
+(void)0;
+var8 = oomph_true;
+
+                if (var8)
+                    goto label1;
+                label0: (void)0;
+string_decref(var9);
+var9.buf = NULL;
+var9 = var3;
+string_incref(var9);
+string_decref(var10);
+var10.buf = NULL;
+
+                var10 = string2_d41d8cd98f;
+                string_incref(var10);
+                (void)0;
+var11 = meth_Str_equals(var9,var10);
+var7 = var11;
+label1: (void)0;
+(void)0;
+
+                if (var7)
+                    goto label2;
+                string_decref(var13);
+var13.buf = NULL;
+var13 = var2;
+string_incref(var13);
+string_decref(var14);
+var14.buf = NULL;
+var14 = var3;
+string_incref(var14);
+string_decref(var15);
+var15.buf = NULL;
+var15 = oomph_slice_until_substring(var13,var14);
+string_decref(var16);
+var16.buf = NULL;
+var16 = var2;
+string_incref(var16);
+(void)0;
+var17 = meth_Str_equals(var15,var16);
+(void)0;
+var18 = oomph_bool_not(var17);
+var12 = var18;
+(void)0;
+var19 = oomph_true;
+
+                if (var19)
+                    goto label3;
+                label2: (void)0;
+var12 = oomph_true;
+label3: (void)0;
+
+                        (void)0;
+                        retval = var12;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var16);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+(void)0;
+(void)0;
+string_decref(var10);
+string_decref(var9);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+return retval;
+}
+struct class_Str meth_Str_left_pad(struct class_Str var0,int64_t var1,struct class_Str var2){
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            int64_t var6;
+            
+            struct class_Str var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            int64_t var9;
+            
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            struct class_Str var11;
+            var11.buf = NULL;
+
+            struct class_Str var12;
+            var12.buf = NULL;
+
+            struct class_Str var13;
+            var13.buf = NULL;
+
+            struct class_Str retval;
+            var3 = var0;
+string_incref(var3);
+var4 = var1;
+(void)0;
+var5 = var2;
+string_incref(var5);
+(void)0;
+var6 = var4;
+(void)0;
+string_decref(var7);
+var7.buf = NULL;
+var7 = var3;
+string_incref(var7);
+(void)0;
+var8 = meth_Str_length(var7);
+(void)0;
+var9 = oomph_int_sub(var6,var8);
+string_decref(var10);
+var10.buf = NULL;
+var10 = var5;
+string_incref(var10);
+string_decref(var11);
+var11.buf = NULL;
+var11 = meth_Str_repeat(var10,var9);
+string_decref(var12);
+var12.buf = NULL;
+var12 = var3;
+string_incref(var12);
+string_decref(var13);
+var13.buf = NULL;
+var13 = oomph_string_concat(var11,var12);
+
+                        string_incref(var13);
+                        retval = var13;
+                        goto out;
+                        out: (void)0;
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+string_decref(var10);
+(void)0;
+(void)0;
+string_decref(var7);
+(void)0;
+string_decref(var5);
+(void)0;
+string_decref(var3);
+return retval;
+}
+struct class_Str meth_Str_right_pad(struct class_Str var0,int64_t var1,struct class_Str var2){
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_Str var6;
+            var6.buf = NULL;
+
+            int64_t var7;
+            
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            int64_t var9;
+            
+            int64_t var10;
+            
+            struct class_Str var11;
+            var11.buf = NULL;
+
+            struct class_Str var12;
+            var12.buf = NULL;
+
+            struct class_Str var13;
+            var13.buf = NULL;
+
+            struct class_Str retval;
+            var3 = var0;
+string_incref(var3);
+var4 = var1;
+(void)0;
+var5 = var2;
+string_incref(var5);
+string_decref(var6);
+var6.buf = NULL;
+var6 = var3;
+string_incref(var6);
+(void)0;
+var7 = var4;
+(void)0;
+string_decref(var8);
+var8.buf = NULL;
+var8 = var3;
+string_incref(var8);
+(void)0;
+var9 = meth_Str_length(var8);
+(void)0;
+var10 = oomph_int_sub(var7,var9);
+string_decref(var11);
+var11.buf = NULL;
+var11 = var5;
+string_incref(var11);
+string_decref(var12);
+var12.buf = NULL;
+var12 = meth_Str_repeat(var11,var10);
+string_decref(var13);
+var13.buf = NULL;
+var13 = oomph_string_concat(var6,var12);
+
+                        string_incref(var13);
+                        retval = var13;
+                        goto out;
+                        out: (void)0;
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+(void)0;
+(void)0;
+string_decref(var8);
+(void)0;
+string_decref(var6);
+string_decref(var5);
+(void)0;
+string_decref(var3);
+return retval;
+}
+struct class_Str meth_Str_center_pad(struct class_Str var0,int64_t var1,struct class_Str var2){
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_Str var6;
+            var6.buf = NULL;
+
+            int64_t var7;
+            
+            int64_t var8;
+            
+            int64_t var9;
+            
+            int64_t var10;
+            
+            double var11;
+            
+            double var12;
+            
+            double var13;
+            
+            int64_t var14;
+            
+            int64_t var15;
+            
+            struct class_Str var16;
+            var16.buf = NULL;
+
+            int64_t var17;
+            
+            struct class_Str var18;
+            var18.buf = NULL;
+
+            struct class_Str var19;
+            var19.buf = NULL;
+
+            struct class_Str var20;
+            var20.buf = NULL;
+
+            struct class_Str var21;
+            var21.buf = NULL;
+
+            struct class_Str retval;
+            var3 = var0;
+string_incref(var3);
+var4 = var1;
+(void)0;
+var5 = var2;
+string_incref(var5);
+string_decref(var6);
+var6.buf = NULL;
+var6 = var3;
+string_incref(var6);
+(void)0;
+var7 = meth_Str_length(var6);
+(void)0;
+var8 = var4;
+(void)0;
+(void)0;
+var9 = oomph_int_add(var7,var8);
+(void)0;
+var10 = 2LL;
+(void)0;
+var11 = oomph_int2float(var9);
+(void)0;
+var12 = oomph_int2float(var10);
+(void)0;
+var13 = oomph_float_div(var11,var12);
+(void)0;
+var14 = meth_Float_floor(var13);
+(void)0;
+var15 = var4;
+(void)0;
+string_decref(var16);
+var16.buf = NULL;
+var16 = var5;
+string_incref(var16);
+(void)0;
+var17 = var14;
+(void)0;
+string_decref(var18);
+var18.buf = NULL;
+var18 = var5;
+string_incref(var18);
+string_decref(var19);
+var19.buf = NULL;
+var19 = var3;
+string_incref(var19);
+string_decref(var20);
+var20.buf = NULL;
+var20 = meth_Str_left_pad(var19,var17,var18);
+string_decref(var21);
+var21.buf = NULL;
+var21 = meth_Str_right_pad(var20,var15,var16);
+
+                        string_incref(var21);
+                        retval = var21;
+                        goto out;
+                        out: (void)0;
+string_decref(var21);
+string_decref(var20);
+string_decref(var19);
+string_decref(var18);
+(void)0;
+string_decref(var16);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var6);
+string_decref(var5);
+(void)0;
+string_decref(var3);
+return retval;
+}
+int64_t meth_Str_count(struct class_Str var0,struct class_Str var1){
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            bool var6;
+            
+            bool var7;
+            
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            int64_t var9;
+            
+            int64_t var10;
+            
+            int64_t var11;
+            
+            int64_t var12;
+            
+            bool var13;
+            
+            bool var14;
+            
+            struct class_Str var15;
+            var15.buf = NULL;
+
+            struct class_Str var16;
+            var16.buf = NULL;
+
+            struct class_Str var17;
+            var17.buf = NULL;
+
+            struct class_Str var18;
+            var18.buf = NULL;
+
+            struct class_Str var19;
+            var19.buf = NULL;
+
+            bool var20;
+            
+            bool var21;
+            
+            int64_t var22;
+            
+            int64_t var23;
+            
+            int64_t var24;
+            
+            int64_t var25;
+            
+            struct class_Str var26;
+            var26.buf = NULL;
+
+            struct class_Str var27;
+            var27.buf = NULL;
+
+            struct class_Str var28;
+            var28.buf = NULL;
+
+            struct class_Str var29;
+            var29.buf = NULL;
+
+            struct class_Str var30;
+            var30.buf = NULL;
+
+            bool var31;
+            
+            int64_t retval;
+            var2 = var0;
+string_incref(var2);
+var3 = var1;
+string_incref(var3);
+string_decref(var4);
+var4.buf = NULL;
+var4 = var3;
+string_incref(var4);
+string_decref(var5);
+var5.buf = NULL;
+
+                var5 = string2_d41d8cd98f;
+                string_incref(var5);
+                (void)0;
+var6 = meth_Str_equals(var4,var5);
+
+                if (var6)
+                    goto label0;
+                (void)0;
+var7 = oomph_true;
+
+                if (var7)
+                    goto label1;
+                label0: (void)0;
+string_decref(var8);
+var8.buf = NULL;
+var8 = var2;
+string_incref(var8);
+(void)0;
+var9 = meth_Str_length(var8);
+(void)0;
+var10 = 1LL;
+(void)0;
+var11 = oomph_int_sub(var9,var10);
+
+                        (void)0;
+                        retval = var11;
+                        goto out;
+                        label1: (void)0;
+(void)0;
+var12 = 0LL;
+label2: (void)0;
+(void)0;
+var13 = oomph_true;
+(void)0;
+(void)0;
+var14 = oomph_bool_not(var13);
+
+                if (var14)
+                    goto label3;
+                string_decref(var15);
+var15.buf = NULL;
+var15 = var2;
+string_incref(var15);
+string_decref(var16);
+var16.buf = NULL;
+var16 = var3;
+string_incref(var16);
+string_decref(var17);
+var17.buf = NULL;
+var17 = oomph_slice_until_substring(var15,var16);
+string_decref(var18);
+var18.buf = NULL;
+var18 = var17;
+string_incref(var18);
+string_decref(var19);
+var19.buf = NULL;
+var19 = var2;
+string_incref(var19);
+(void)0;
+var20 = meth_Str_equals(var18,var19);
+
+                if (var20)
+                    goto label4;
+                (void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label5;
+                label4: (void)0;
+(void)0;
+var22 = var12;
+(void)0;
+
+                        (void)0;
+                        retval = var22;
+                        goto out;
+                        label5: (void)0;
+(void)0;
+var23 = var12;
+(void)0;
+(void)0;
+var24 = 1LL;
+(void)0;
+var25 = oomph_int_add(var23,var24);
+(void)0;
+var12 = var25;
+(void)0;
+string_decref(var26);
+var26.buf = NULL;
+var26 = var3;
+string_incref(var26);
+string_decref(var27);
+var27.buf = NULL;
+var27 = var17;
+string_incref(var27);
+string_decref(var28);
+var28.buf = NULL;
+var28 = var2;
+string_incref(var28);
+string_decref(var29);
+var29.buf = NULL;
+var29 = meth_Str_remove_prefix(var28,var27);
+string_decref(var30);
+var30.buf = NULL;
+var30 = meth_Str_remove_prefix(var29,var26);
+string_decref(var2);
+var2 = var30;
+string_incref(var2);
+label6: (void)0;
+(void)0;
+var31 = oomph_true;
+
+                if (var31)
+                    goto label2;
+                label3: (void)0;
+out: (void)0;
+(void)0;
+string_decref(var30);
+string_decref(var29);
+string_decref(var28);
+string_decref(var27);
+string_decref(var26);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var19);
+string_decref(var18);
+string_decref(var17);
+string_decref(var16);
+string_decref(var15);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var8);
+(void)0;
+(void)0;
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+return retval;
+}
+struct class_Str meth_Str_left_trim(struct class_Str var0){
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            bool var4;
+            
+            bool var5;
+            
+            struct class_Str var6;
+            var6.buf = NULL;
+
+            struct class_Str var7;
+            var7.buf = NULL;
+
+            bool var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            struct class_Str var11;
+            var11.buf = NULL;
+
+            struct class_Str var12;
+            var12.buf = NULL;
+
+            struct class_Str var13;
+            var13.buf = NULL;
+
+            struct class_Str var14;
+            var14.buf = NULL;
+
+            struct class_Str var15;
+            var15.buf = NULL;
+
+            bool var16;
+            
+            struct class_Str var17;
+            var17.buf = NULL;
+
+            struct class_Str retval;
+            var1 = var0;
+string_incref(var1);
+label0: (void)0;
+string_decref(var2);
+var2.buf = NULL;
+
+                var2 = string3__7215ee9c7d;
+                string_incref(var2);
+                string_decref(var3);
+var3.buf = NULL;
+var3 = var1;
+string_incref(var3);
+(void)0;
+var4 = meth_Str_starts_with(var3,var2);
+(void)0;
+
+                if (var4)
+                    goto label1;
+                string_decref(var6);
+var6.buf = NULL;
+
+                var6 = string4__68b329da98;
+                string_incref(var6);
+                string_decref(var7);
+var7.buf = NULL;
+var7 = var1;
+string_incref(var7);
+(void)0;
+var8 = meth_Str_starts_with(var7,var6);
+var5 = var8;
+(void)0;
+var9 = oomph_true;
+
+                if (var9)
+                    goto label2;
+                label1: (void)0;
+var5 = oomph_true;
+label2: (void)0;
+(void)0;
+var10 = oomph_bool_not(var5);
+
+                if (var10)
+                    goto label3;
+                string_decref(var11);
+var11.buf = NULL;
+
+                var11 = string4__68b329da98;
+                string_incref(var11);
+                string_decref(var12);
+var12.buf = NULL;
+
+                var12 = string3__7215ee9c7d;
+                string_incref(var12);
+                string_decref(var13);
+var13.buf = NULL;
+var13 = var1;
+string_incref(var13);
+string_decref(var14);
+var14.buf = NULL;
+var14 = meth_Str_remove_prefix(var13,var12);
+string_decref(var15);
+var15.buf = NULL;
+var15 = meth_Str_remove_prefix(var14,var11);
+string_decref(var1);
+var1 = var15;
+string_incref(var1);
+label4: (void)0;
+(void)0;
+var16 = oomph_true;
+
+                if (var16)
+                    goto label0;
+                label3: (void)0;
+string_decref(var17);
+var17.buf = NULL;
+var17 = var1;
+string_incref(var17);
+
+                        string_incref(var17);
+                        retval = var17;
+                        goto out;
+                        out: (void)0;
+string_decref(var17);
+(void)0;
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var7);
+string_decref(var6);
+(void)0;
+(void)0;
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+return retval;
+}
+struct class_Str meth_Str_right_trim(struct class_Str var0){
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            bool var4;
+            
+            bool var5;
+            
+            struct class_Str var6;
+            var6.buf = NULL;
+
+            struct class_Str var7;
+            var7.buf = NULL;
+
+            bool var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            struct class_Str var11;
+            var11.buf = NULL;
+
+            struct class_Str var12;
+            var12.buf = NULL;
+
+            struct class_Str var13;
+            var13.buf = NULL;
+
+            struct class_Str var14;
+            var14.buf = NULL;
+
+            struct class_Str var15;
+            var15.buf = NULL;
+
+            bool var16;
+            
+            struct class_Str var17;
+            var17.buf = NULL;
+
+            struct class_Str retval;
+            var1 = var0;
+string_incref(var1);
+label0: (void)0;
+string_decref(var2);
+var2.buf = NULL;
+
+                var2 = string3__7215ee9c7d;
+                string_incref(var2);
+                string_decref(var3);
+var3.buf = NULL;
+var3 = var1;
+string_incref(var3);
+(void)0;
+var4 = meth_Str_ends_with(var3,var2);
+(void)0;
+
+                if (var4)
+                    goto label1;
+                string_decref(var6);
+var6.buf = NULL;
+
+                var6 = string4__68b329da98;
+                string_incref(var6);
+                string_decref(var7);
+var7.buf = NULL;
+var7 = var1;
+string_incref(var7);
+(void)0;
+var8 = meth_Str_ends_with(var7,var6);
+var5 = var8;
+(void)0;
+var9 = oomph_true;
+
+                if (var9)
+                    goto label2;
+                label1: (void)0;
+var5 = oomph_true;
+label2: (void)0;
+(void)0;
+var10 = oomph_bool_not(var5);
+
+                if (var10)
+                    goto label3;
+                string_decref(var11);
+var11.buf = NULL;
+
+                var11 = string4__68b329da98;
+                string_incref(var11);
+                string_decref(var12);
+var12.buf = NULL;
+
+                var12 = string3__7215ee9c7d;
+                string_incref(var12);
+                string_decref(var13);
+var13.buf = NULL;
+var13 = var1;
+string_incref(var13);
+string_decref(var14);
+var14.buf = NULL;
+var14 = meth_Str_remove_suffix(var13,var12);
+string_decref(var15);
+var15.buf = NULL;
+var15 = meth_Str_remove_suffix(var14,var11);
+string_decref(var1);
+var1 = var15;
+string_incref(var1);
+label4: (void)0;
+(void)0;
+var16 = oomph_true;
+
+                if (var16)
+                    goto label0;
+                label3: (void)0;
+string_decref(var17);
+var17.buf = NULL;
+var17 = var1;
+string_incref(var17);
+
+                        string_incref(var17);
+                        retval = var17;
+                        goto out;
+                        out: (void)0;
+string_decref(var17);
+(void)0;
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var7);
+string_decref(var6);
+(void)0;
+(void)0;
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+return retval;
+}
+struct class_Str meth_Str_trim(struct class_Str var0){
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str retval;
+            var1 = var0;
+string_incref(var1);
+string_decref(var2);
+var2.buf = NULL;
+var2 = var1;
+string_incref(var2);
+string_decref(var3);
+var3.buf = NULL;
+var3 = meth_Str_left_trim(var2);
+string_decref(var4);
+var4.buf = NULL;
+var4 = meth_Str_right_trim(var3);
+
+                        string_incref(var4);
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+return retval;
+}
+struct class_Str meth_Str_replace(struct class_Str var0,struct class_Str var1,struct class_Str var2){
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_Str var6;
+            var6.buf = NULL;
+
+            struct class_Str var7;
+            var7.buf = NULL;
+
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var9;
+            var9 = NULL;
+
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            struct class_Str retval;
+            var3 = var0;
+string_incref(var3);
+var4 = var1;
+string_incref(var4);
+var5 = var2;
+string_incref(var5);
+string_decref(var6);
+var6.buf = NULL;
+var6 = var5;
+string_incref(var6);
+string_decref(var7);
+var7.buf = NULL;
+var7 = var4;
+string_incref(var7);
+string_decref(var8);
+var8.buf = NULL;
+var8 = var3;
+string_incref(var8);
+decref((var9), dtor_List_Str__d1ecbd3335);
+var9 = NULL;
+var9 = meth_Str_split(var8,var7);
+string_decref(var10);
+var10.buf = NULL;
+var10 = meth_List_Str__d1ecbd3335_join(var9,var6);
+
+                        string_incref(var10);
+                        retval = var10;
+                        goto out;
+                        out: (void)0;
+string_decref(var10);
+decref((var9), dtor_List_Str__d1ecbd3335);
+string_decref(var8);
+string_decref(var7);
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+return retval;
+}
+struct class_List_Str__d1ecbd3335* meth_Str_split(struct class_Str var0,struct class_Str var1){
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var4;
+            var4 = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_Str var6;
+            var6.buf = NULL;
+
+            bool var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            struct class_Str var11;
+            var11.buf = NULL;
+
+            struct class_Str var12;
+            var12.buf = NULL;
+
+            struct class_Str var13;
+            var13.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var14;
+            var14 = NULL;
+
+            struct class_Str var15;
+            var15.buf = NULL;
+
+            struct class_Str var16;
+            var16.buf = NULL;
+
+            struct class_Str var17;
+            var17.buf = NULL;
+
+            struct class_Str var18;
+            var18.buf = NULL;
+
+            struct class_Str var19;
+            var19.buf = NULL;
+
+            bool var20;
+            
+            bool var21;
+            
+            struct class_List_Str__d1ecbd3335* var22;
+            var22 = NULL;
+
+            struct class_Str var23;
+            var23.buf = NULL;
+
+            struct class_Str var24;
+            var24.buf = NULL;
+
+            struct class_Str var25;
+            var25.buf = NULL;
+
+            bool var26;
+            
+            bool var27;
+            
+            struct class_Str var28;
+            var28.buf = NULL;
+
+            struct class_Str var29;
+            var29.buf = NULL;
+
+            bool var30;
+            
+            bool var31;
+            
+            bool var32;
+            
+            struct class_Str var33;
+            var33.buf = NULL;
+
+            struct class_Str var34;
+            var34.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var35;
+            var35 = NULL;
+
+            struct class_List_Str__d1ecbd3335* var36;
+            var36 = NULL;
+
+            struct class_Str var37;
+            var37.buf = NULL;
+
+            struct class_Str var38;
+            var38.buf = NULL;
+
+            struct class_Str var39;
+            var39.buf = NULL;
+
+            bool var40;
+            
+            struct class_List_Str__d1ecbd3335* var41;
+            var41 = NULL;
+
+            struct class_List_Str__d1ecbd3335* retval;
+            var2 = var0;
+string_incref(var2);
+var3 = var1;
+string_incref(var3);
+decref((var4), dtor_List_Str__d1ecbd3335);
+var4 = NULL;
+var4 = ctor_List_Str__d1ecbd3335();
+string_decref(var5);
+var5.buf = NULL;
+var5 = var3;
+string_incref(var5);
+string_decref(var6);
+var6.buf = NULL;
+
+                var6 = string2_d41d8cd98f;
+                string_incref(var6);
+                (void)0;
+var7 = meth_Str_equals(var5,var6);
+
+                if (var7)
+                    goto label0;
+                label1: (void)0;
+(void)0;
+var8 = oomph_true;
+(void)0;
+(void)0;
+var9 = oomph_bool_not(var8);
+
+                if (var9)
+                    goto label2;
+                string_decref(var10);
+var10.buf = NULL;
+var10 = var2;
+string_incref(var10);
+string_decref(var11);
+var11.buf = NULL;
+var11 = var3;
+string_incref(var11);
+string_decref(var12);
+var12.buf = NULL;
+var12 = oomph_slice_until_substring(var10,var11);
+string_decref(var13);
+var13.buf = NULL;
+var13 = var12;
+string_incref(var13);
+decref((var14), dtor_List_Str__d1ecbd3335);
+var14 = NULL;
+var14 = var4;
+incref(var14);
+meth_List_Str__d1ecbd3335_push(var14,var13);
+string_decref(var15);
+var15.buf = NULL;
+var15 = var12;
+string_incref(var15);
+string_decref(var16);
+var16.buf = NULL;
+var16 = var2;
+string_incref(var16);
+string_decref(var17);
+var17.buf = NULL;
+var17 = meth_Str_remove_prefix(var16,var15);
+string_decref(var2);
+var2 = var17;
+string_incref(var2);
+string_decref(var18);
+var18.buf = NULL;
+var18 = var2;
+string_incref(var18);
+string_decref(var19);
+var19.buf = NULL;
+
+                var19 = string2_d41d8cd98f;
+                string_incref(var19);
+                (void)0;
+var20 = meth_Str_equals(var18,var19);
+
+                if (var20)
+                    goto label3;
+                (void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label4;
+                label3: (void)0;
+decref((var22), dtor_List_Str__d1ecbd3335);
+var22 = NULL;
+var22 = var4;
+incref(var22);
+
+                        incref(var22);
+                        retval = var22;
+                        goto out;
+                        label4: (void)0;
+string_decref(var23);
+var23.buf = NULL;
+var23 = var3;
+string_incref(var23);
+string_decref(var24);
+var24.buf = NULL;
+var24 = var2;
+string_incref(var24);
+string_decref(var25);
+var25.buf = NULL;
+var25 = meth_Str_remove_prefix(var24,var23);
+string_decref(var2);
+var2 = var25;
+string_incref(var2);
+label5: (void)0;
+(void)0;
+var26 = oomph_true;
+
+                if (var26)
+                    goto label1;
+                label2: (void)0;
+(void)0;
+var27 = oomph_true;
+
+                if (var27)
+                    goto label6;
+                label0: (void)0;
+label7: (void)0;
+string_decref(var28);
+var28.buf = NULL;
+var28 = var2;
+string_incref(var28);
+string_decref(var29);
+var29.buf = NULL;
+
+                var29 = string2_d41d8cd98f;
+                string_incref(var29);
+                (void)0;
+var30 = meth_Str_equals(var28,var29);
+(void)0;
+var31 = oomph_bool_not(var30);
+(void)0;
+var32 = oomph_bool_not(var31);
+
+                if (var32)
+                    goto label8;
+                string_decref(var33);
+var33.buf = NULL;
+var33 = var2;
+string_incref(var33);
+string_decref(var34);
+var34.buf = NULL;
+var34 = oomph_get_first_char(var33);
+decref((var35), dtor_List_Str__d1ecbd3335);
+var35 = NULL;
+var35 = var4;
+incref(var35);
+meth_List_Str__d1ecbd3335_push(var35,var34);
+decref((var36), dtor_List_Str__d1ecbd3335);
+var36 = NULL;
+var36 = var4;
+incref(var36);
+string_decref(var37);
+var37.buf = NULL;
+var37 = meth_List_Str__d1ecbd3335_last(var36);
+string_decref(var38);
+var38.buf = NULL;
+var38 = var2;
+string_incref(var38);
+string_decref(var39);
+var39.buf = NULL;
+var39 = meth_Str_remove_prefix(var38,var37);
+string_decref(var2);
+var2 = var39;
+string_incref(var2);
+label9: (void)0;
+(void)0;
+var40 = oomph_true;
+
+                if (var40)
+                    goto label7;
+                label8: (void)0;
+decref((var41), dtor_List_Str__d1ecbd3335);
+var41 = NULL;
+var41 = var4;
+incref(var41);
+
+                        incref(var41);
+                        retval = var41;
+                        goto out;
+                        label6: (void)0;
+out: (void)0;
+decref((var41), dtor_List_Str__d1ecbd3335);
+(void)0;
+string_decref(var39);
+string_decref(var38);
+string_decref(var37);
+decref((var36), dtor_List_Str__d1ecbd3335);
+decref((var35), dtor_List_Str__d1ecbd3335);
+string_decref(var34);
+string_decref(var33);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var29);
+string_decref(var28);
+(void)0;
+(void)0;
+string_decref(var25);
+string_decref(var24);
+string_decref(var23);
+decref((var22), dtor_List_Str__d1ecbd3335);
+(void)0;
+(void)0;
+string_decref(var19);
+string_decref(var18);
+string_decref(var17);
+string_decref(var16);
+string_decref(var15);
+decref((var14), dtor_List_Str__d1ecbd3335);
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+string_decref(var10);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var6);
+string_decref(var5);
+decref((var4), dtor_List_Str__d1ecbd3335);
+string_decref(var3);
+string_decref(var2);
+return retval;
+}
+struct class_Str meth_List_Str_join(struct class_List_Str__d1ecbd3335* var0,struct class_Str var1){
+            struct class_List_Str__d1ecbd3335* var2;
+            var2 = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var4;
+            var4 = NULL;
+
+            struct class_List_Str__d1ecbd3335* var5;
+            var5 = NULL;
+
+            bool var6;
+            
+            bool var7;
+            
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var9;
+            var9 = NULL;
+
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            int64_t var12;
+            
+            struct class_List_Str__d1ecbd3335* var13;
+            var13 = NULL;
+
+            int64_t var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            struct class_Str var17;
+            var17.buf = NULL;
+
+            struct class_Str var18;
+            var18.buf = NULL;
+
+            struct class_Str var19;
+            var19.buf = NULL;
+
+            int64_t var20;
+            
+            struct class_List_Str__d1ecbd3335* var21;
+            var21 = NULL;
+
+            struct class_Str var22;
+            var22.buf = NULL;
+
+            struct class_Str var23;
+            var23.buf = NULL;
+
+            int64_t var24;
+            
+            int64_t var25;
+            
+            int64_t var26;
+            
+            bool var27;
+            
+            struct class_Str var28;
+            var28.buf = NULL;
+
+            struct class_Str retval;
+            var2 = var0;
+incref(var2);
+var3 = var1;
+string_incref(var3);
+decref((var4), dtor_List_Str__d1ecbd3335);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+decref((var5), dtor_List_Str__d1ecbd3335);
+var5 = NULL;
+var5 = ctor_List_Str__d1ecbd3335();
+(void)0;
+var6 = meth_List_Str__d1ecbd3335_equals(var4,var5);
+
+                if (var6)
+                    goto label0;
+                (void)0;
+var7 = oomph_true;
+
+                if (var7)
+                    goto label1;
+                label0: (void)0;
+string_decref(var8);
+var8.buf = NULL;
+
+                var8 = string2_d41d8cd98f;
+                string_incref(var8);
+                
+                        string_incref(var8);
+                        retval = var8;
+                        goto out;
+                        label1: (void)0;
+decref((var9), dtor_List_Str__d1ecbd3335);
+var9 = NULL;
+var9 = var2;
+incref(var9);
+string_decref(var10);
+var10.buf = NULL;
+var10 = meth_List_Str__d1ecbd3335_first(var9);
+(void)0;
+var11 = 1LL;
+label2: (void)0;
+(void)0;
+var12 = var11;
+(void)0;
+decref((var13), dtor_List_Str__d1ecbd3335);
+var13 = NULL;
+var13 = var2;
+incref(var13);
+(void)0;
+var14 = meth_List_Str__d1ecbd3335_length(var13);
+(void)0;
+var15 = oomph_int_gt(var14,var12);
+(void)0;
+var16 = oomph_bool_not(var15);
+
+                if (var16)
+                    goto label3;
+                string_decref(var17);
+var17.buf = NULL;
+var17 = var10;
+string_incref(var17);
+string_decref(var18);
+var18.buf = NULL;
+var18 = var3;
+string_incref(var18);
+string_decref(var19);
+var19.buf = NULL;
+var19 = oomph_string_concat(var17,var18);
+(void)0;
+var20 = var11;
+(void)0;
+decref((var21), dtor_List_Str__d1ecbd3335);
+var21 = NULL;
+var21 = var2;
+incref(var21);
+string_decref(var22);
+var22.buf = NULL;
+var22 = meth_List_Str__d1ecbd3335_get(var21,var20);
+string_decref(var23);
+var23.buf = NULL;
+var23 = oomph_string_concat(var19,var22);
+string_decref(var10);
+var10 = var23;
+string_incref(var10);
+label4: (void)0;
+(void)0;
+var24 = var11;
+(void)0;
+(void)0;
+var25 = 1LL;
+(void)0;
+var26 = oomph_int_add(var24,var25);
+(void)0;
+var11 = var26;
+(void)0;
+(void)0;
+var27 = oomph_true;
+
+                if (var27)
+                    goto label2;
+                label3: (void)0;
+string_decref(var28);
+var28.buf = NULL;
+var28 = var10;
+string_incref(var28);
+
+                        string_incref(var28);
+                        retval = var28;
+                        goto out;
+                        out: (void)0;
+string_decref(var28);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var23);
+string_decref(var22);
+decref((var21), dtor_List_Str__d1ecbd3335);
+(void)0;
+string_decref(var19);
+string_decref(var18);
+string_decref(var17);
+(void)0;
+(void)0;
+(void)0;
+decref((var13), dtor_List_Str__d1ecbd3335);
+(void)0;
+(void)0;
+string_decref(var10);
+decref((var9), dtor_List_Str__d1ecbd3335);
+string_decref(var8);
+(void)0;
+(void)0;
+decref((var5), dtor_List_Str__d1ecbd3335);
+decref((var4), dtor_List_Str__d1ecbd3335);
+string_decref(var3);
+decref((var2), dtor_List_Str__d1ecbd3335);
+return retval;
+}
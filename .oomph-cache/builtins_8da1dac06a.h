@@ -0,0 +1,47 @@
+
+            #ifndef HEADER_GUARD_builtins_8da1dac06a
+            #define HEADER_GUARD_builtins_8da1dac06a
+            #include <lib/oomph.h>
+#include "List_Int__ca8c9dc13d.h"
+#include "List_Str__d1ecbd3335.h"
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_Str meth_Bool_to_string(bool var0);
+struct class_List_Int__ca8c9dc13d* meth_Str_get_utf8(struct class_Str var0);
+struct class_Str meth_Str_repeat(struct class_Str var0,int64_t var1);
+bool meth_Str_starts_with(struct class_Str var0,struct class_Str var1);
+bool meth_Str_ends_with(struct class_Str var0,struct class_Str var1);
+bool meth_Str___contains(struct class_Str var0,struct class_Str var1);
+struct class_Str meth_Str_left_pad(struct class_Str var0,int64_t var1,struct class_Str var2);
+struct class_Str meth_Str_right_pad(struct class_Str var0,int64_t var1,struct class_Str var2);
+struct class_Str meth_Str_center_pad(struct class_Str var0,int64_t var1,struct class_Str var2);
+int64_t meth_Str_count(struct class_Str var0,struct class_Str var1);
+struct class_Str meth_Str_left_trim(struct class_Str var0);
+struct class_Str meth_Str_right_trim(struct class_Str var0);
+struct class_Str meth_Str_trim(struct class_Str var0);
+struct class_Str meth_Str_replace(struct class_Str var0,struct class_Str var1,struct class_Str var2);
+struct class_List_Str__d1ecbd3335* meth_Str_split(struct class_Str var0,struct class_Str var1);
+struct class_Str meth_List_Str_join(struct class_List_Str__d1ecbd3335* var0,struct class_Str var1);
+
+            #endif
+            
\ No newline at end of file
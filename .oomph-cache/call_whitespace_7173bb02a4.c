@@ -0,0 +1,26 @@
+#include <lib/oomph.h>
+#include "call_whitespace_7173bb02a4.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0hello_world_5eb63bbbe0_buf = {
+                .refcount = -1,
+                .data = (char[]){ 104,101,108,108,111,32,119,111,114,108,100 },
+                .malloced = false,
+            };
+            static struct class_Str string0hello_world_5eb63bbbe0 = {
+                .buf = &string0hello_world_5eb63bbbe0_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0hello_world_5eb63bbbe0;
+                string_incref(var0);
+                oomph_print(var0);
+out: (void)0;
+string_decref(var0);
+}
@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_call_whitespace_7173bb02a4
+            #define HEADER_GUARD_call_whitespace_7173bb02a4
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
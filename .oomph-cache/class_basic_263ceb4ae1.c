@@ -0,0 +1,119 @@
+#include <lib/oomph.h>
+#include "class_basic_263ceb4ae1.h"
+#include "builtins_8da1dac06a.h"
+#include "Point_2a3cd5946c.h"
+void class_basic_263ceb4ae1_print_point(struct class_Point_2a3cd5946c* var0){
+            struct class_Point_2a3cd5946c* var1;
+            var1 = NULL;
+
+            struct class_Point_2a3cd5946c* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Point_2a3cd5946c* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct class_Str var7;
+            var7.buf = NULL;
+var1 = var0;
+incref(var1);
+decref((var2), dtor_Point_2a3cd5946c);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+(void)0;
+var3 = var2->memb_x;
+(void)0;
+string_decref(var4);
+var4.buf = NULL;
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+decref((var5), dtor_Point_2a3cd5946c);
+var5 = NULL;
+var5 = var1;
+incref(var5);
+(void)0;
+var6 = var5->memb_y;
+(void)0;
+string_decref(var7);
+var7.buf = NULL;
+var7 = meth_Int_to_string(var6);
+oomph_print(var7);
+out: (void)0;
+string_decref(var7);
+(void)0;
+decref((var5), dtor_Point_2a3cd5946c);
+string_decref(var4);
+(void)0;
+decref((var2), dtor_Point_2a3cd5946c);
+decref((var1), dtor_Point_2a3cd5946c);
+}
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            struct class_Point_2a3cd5946c* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            struct class_Point_2a3cd5946c* var5;
+            var5 = NULL;
+
+            struct class_Point_2a3cd5946c* var6;
+            var6 = NULL;
+
+            int64_t var7;
+            
+            int64_t var8;
+            
+            struct class_Point_2a3cd5946c* var9;
+            var9 = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+decref((var2), dtor_Point_2a3cd5946c);
+var2 = NULL;
+var2 = ctor_Point_2a3cd5946c(var0,var1);
+(void)0;
+var3 = 123LL;
+(void)0;
+var4 = 456LL;
+decref((var5), dtor_Point_2a3cd5946c);
+var5 = NULL;
+var5 = ctor_Point_2a3cd5946c(var3,var4);
+decref((var6), dtor_Point_2a3cd5946c);
+var6 = NULL;
+var6 = var5;
+incref(var6);
+class_basic_263ceb4ae1_print_point(var6);
+(void)0;
+var7 = 111LL;
+(void)0;
+var8 = 222LL;
+decref((var9), dtor_Point_2a3cd5946c);
+var9 = NULL;
+var9 = ctor_Point_2a3cd5946c(var7,var8);
+class_basic_263ceb4ae1_print_point(var9);
+out: (void)0;
+decref((var9), dtor_Point_2a3cd5946c);
+(void)0;
+(void)0;
+decref((var6), dtor_Point_2a3cd5946c);
+decref((var5), dtor_Point_2a3cd5946c);
+(void)0;
+(void)0;
+decref((var2), dtor_Point_2a3cd5946c);
+(void)0;
+(void)0;
+}
@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_class_basic_263ceb4ae1
+            #define HEADER_GUARD_class_basic_263ceb4ae1
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Point_2a3cd5946c.h"
+struct class_Point_2a3cd5946c;
+struct class_Point_2a3cd5946c;
+struct class_Point_2a3cd5946c;
+struct class_Point_2a3cd5946c;
+struct class_Point_2a3cd5946c;
+struct class_Point_2a3cd5946c;
+struct class_Point_2a3cd5946c;
+struct class_Point_2a3cd5946c;
+void class_basic_263ceb4ae1_print_point(struct class_Point_2a3cd5946c* var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
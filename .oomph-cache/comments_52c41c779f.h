@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_comments_52c41c779f
+            #define HEADER_GUARD_comments_52c41c779f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
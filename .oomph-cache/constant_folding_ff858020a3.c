@@ -0,0 +1,680 @@
+#include <lib/oomph.h>
+#include "constant_folding_ff858020a3.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0returned_c7e704db61_buf = {
+                .refcount = -1,
+                .data = (char[]){ 114,101,116,117,114,110,101,100 },
+                .malloced = false,
+            };
+            static struct class_Str string0returned_c7e704db61 = {
+                .buf = &string0returned_c7e704db61_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1this_doesn_t_run_91841bde3f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 116,104,105,115,32,100,111,101,115,110,39,116,32,114,117,110 },
+                .malloced = false,
+            };
+            static struct class_Str string1this_doesn_t_run_91841bde3f = {
+                .buf = &string1this_doesn_t_run_91841bde3f_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2foo_acbd18db4c_buf = {
+                .refcount = -1,
+                .data = (char[]){ 102,111,111 },
+                .malloced = false,
+            };
+            static struct class_Str string2foo_acbd18db4c = {
+                .buf = &string2foo_acbd18db4c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3bar_37b51d194a_buf = {
+                .refcount = -1,
+                .data = (char[]){ 98,97,114 },
+                .malloced = false,
+            };
+            static struct class_Str string3bar_37b51d194a = {
+                .buf = &string3bar_37b51d194a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4foobar_3858f62230_buf = {
+                .refcount = -1,
+                .data = (char[]){ 102,111,111,98,97,114 },
+                .malloced = false,
+            };
+            static struct class_Str string4foobar_3858f62230 = {
+                .buf = &string4foobar_3858f62230_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5elif_39be3faa67_buf = {
+                .refcount = -1,
+                .data = (char[]){ 101,108,105,102 },
+                .malloced = false,
+            };
+            static struct class_Str string5elif_39be3faa67 = {
+                .buf = &string5elif_39be3faa67_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            struct class_Str constant_folding_ff858020a3_after_return(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_Str retval;
+            string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0returned_c7e704db61;
+                string_incref(var0);
+                
+                        string_incref(var0);
+                        retval = var0;
+                        goto out;
+                        string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string1this_doesn_t_run_91841bde3f;
+                string_incref(var1);
+                oomph_print(var1);
+out: (void)0;
+string_decref(var1);
+string_decref(var0);
+return retval;
+}
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            
+            int64_t var6;
+            
+            struct class_Str var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            int64_t var9;
+            
+            int64_t var10;
+            
+            int64_t var11;
+            
+            struct class_Str var12;
+            var12.buf = NULL;
+
+            int64_t var13;
+            
+            int64_t var14;
+            
+            int64_t var15;
+            
+            struct class_Str var16;
+            var16.buf = NULL;
+
+            int64_t var17;
+            
+            int64_t var18;
+            
+            int64_t var19;
+            
+            int64_t var20;
+            
+            struct class_Str var21;
+            var21.buf = NULL;
+
+            int64_t var22;
+            
+            int64_t var23;
+            
+            double var24;
+            
+            double var25;
+            
+            double var26;
+            
+            struct class_Str var27;
+            var27.buf = NULL;
+
+            double var28;
+            
+            double var29;
+            
+            double var30;
+            
+            struct class_Str var31;
+            var31.buf = NULL;
+
+            int64_t var32;
+            
+            int64_t var33;
+            
+            bool var34;
+            
+            struct class_Str var35;
+            var35.buf = NULL;
+
+            int64_t var36;
+            
+            int64_t var37;
+            
+            bool var38;
+            
+            bool var39;
+            
+            int64_t var40;
+            
+            int64_t var41;
+            
+            bool var42;
+            
+            bool var43;
+            
+            struct class_Str var44;
+            var44.buf = NULL;
+
+            struct class_Str var45;
+            var45.buf = NULL;
+
+            struct class_Str var46;
+            var46.buf = NULL;
+
+            struct class_Str var47;
+            var47.buf = NULL;
+
+            struct class_Str var48;
+            var48.buf = NULL;
+
+            bool var49;
+            
+            struct class_Str var50;
+            var50.buf = NULL;
+
+            struct class_Str var51;
+            var51.buf = NULL;
+
+            struct class_Str var52;
+            var52.buf = NULL;
+
+            struct class_Str var53;
+            var53.buf = NULL;
+
+            struct class_Str var54;
+            var54.buf = NULL;
+
+            bool var55;
+            
+            bool var56;
+            
+            struct class_Str var57;
+            var57.buf = NULL;
+
+            int64_t var58;
+            
+            int64_t var59;
+            
+            bool var60;
+            
+            int64_t var61;
+            
+            int64_t var62;
+            
+            int64_t var63;
+            
+            int64_t var64;
+            
+            bool var65;
+            
+            struct class_Str var66;
+            var66.buf = NULL;
+
+            bool var67;
+            
+            struct class_Str var68;
+            var68.buf = NULL;
+
+            bool var69;
+            
+            struct class_Str var70;
+            var70.buf = NULL;
+
+            int64_t var71;
+            
+            int64_t var72;
+            
+            bool var73;
+            
+            bool var74;
+            
+            int64_t var75;
+            
+            int64_t var76;
+            
+            int64_t var77;
+            
+            int64_t var78;
+            
+            int64_t var79;
+            
+            bool var80;
+            
+            bool var81;
+            
+            bool var82;
+            
+            bool var83;
+            
+            int64_t var84;
+            
+            struct class_Str var85;
+            var85.buf = NULL;
+
+            int64_t var86;
+            
+            struct class_Str var87;
+            var87.buf = NULL;
+
+            struct class_Str var88;
+            var88.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+(void)0;
+var2 = 3LL;
+(void)0;
+var3 = oomph_int_mul(var1,var2);
+(void)0;
+var4 = oomph_int_add(var0,var3);
+(void)0;
+var5 = 4LL;
+(void)0;
+var6 = oomph_int_sub(var4,var5);
+string_decref(var7);
+var7.buf = NULL;
+var7 = meth_Int_to_string(var6);
+oomph_print(var7);
+(void)0;
+var8 = 2LL;
+(void)0;
+var9 = 5LL;
+(void)0;
+var10 = oomph_int_sub(var8,var9);
+(void)0;
+var11 = oomph_int_neg(var10);
+string_decref(var12);
+var12.buf = NULL;
+var12 = meth_Int_to_string(var11);
+oomph_print(var12);
+(void)0;
+var13 = 9223372036854775806LL;
+(void)0;
+var14 = 1LL;
+(void)0;
+var15 = oomph_int_add(var13,var14);
+string_decref(var16);
+var16.buf = NULL;
+var16 = meth_Int_to_string(var15);
+oomph_print(var16);
+(void)0;
+var17 = 9223372036854775807LL;
+(void)0;
+var18 = oomph_int_neg(var17);
+(void)0;
+var19 = 0LL;
+(void)0;
+var20 = oomph_int_sub(var18,var19);
+string_decref(var21);
+var21.buf = NULL;
+var21 = meth_Int_to_string(var20);
+oomph_print(var21);
+(void)0;
+var22 = 1LL;
+(void)0;
+var23 = 4LL;
+(void)0;
+var24 = oomph_int2float(var22);
+(void)0;
+var25 = oomph_int2float(var23);
+(void)0;
+var26 = oomph_float_div(var24,var25);
+string_decref(var27);
+var27.buf = NULL;
+var27 = meth_Float_to_string(var26);
+oomph_print(var27);
+(void)0;
+var28 = 0.1;
+(void)0;
+var29 = 0.2;
+(void)0;
+var30 = oomph_float_add(var28,var29);
+string_decref(var31);
+var31.buf = NULL;
+var31 = meth_Float_to_string(var30);
+oomph_print(var31);
+(void)0;
+var32 = 3LL;
+(void)0;
+var33 = 2LL;
+(void)0;
+var34 = oomph_int_gt(var32,var33);
+string_decref(var35);
+var35.buf = NULL;
+var35 = meth_Bool_to_string(var34);
+oomph_print(var35);
+(void)0;
+var36 = 3LL;
+(void)0;
+var37 = 2LL;
+(void)0;
+var38 = oomph_int_gt(var37,var36);
+(void)0;
+
+                if (var38)
+                    goto label0;
+                (void)0;
+var40 = 1LL;
+(void)0;
+var41 = 1LL;
+(void)0;
+var42 = meth_Int_equals(var40,var41);
+var39 = var42;
+(void)0;
+var43 = oomph_true;
+
+                if (var43)
+                    goto label1;
+                label0: (void)0;
+var39 = oomph_true;
+label1: (void)0;
+string_decref(var44);
+var44.buf = NULL;
+var44 = meth_Bool_to_string(var39);
+oomph_print(var44);
+string_decref(var45);
+var45.buf = NULL;
+
+                var45 = string2foo_acbd18db4c;
+                string_incref(var45);
+                string_decref(var46);
+var46.buf = NULL;
+
+                var46 = string3bar_37b51d194a;
+                string_incref(var46);
+                string_decref(var47);
+var47.buf = NULL;
+var47 = oomph_string_concat(var45,var46);
+string_decref(var48);
+var48.buf = NULL;
+
+                var48 = string4foobar_3858f62230;
+                string_incref(var48);
+                (void)0;
+var49 = meth_Str_equals(var47,var48);
+string_decref(var50);
+var50.buf = NULL;
+var50 = meth_Bool_to_string(var49);
+oomph_print(var50);
+string_decref(var51);
+var51.buf = NULL;
+
+                var51 = string2foo_acbd18db4c;
+                string_incref(var51);
+                string_decref(var52);
+var52.buf = NULL;
+
+                var52 = string3bar_37b51d194a;
+                string_incref(var52);
+                string_decref(var53);
+var53.buf = NULL;
+var53 = oomph_string_concat(var51,var52);
+string_decref(var54);
+var54.buf = NULL;
+
+                var54 = string4foobar_3858f62230;
+                string_incref(var54);
+                (void)0;
+var55 = meth_Str_equals(var53,var54);
+(void)0;
+var56 = oomph_bool_not(var55);
+string_decref(var57);
+var57.buf = NULL;
+var57 = meth_Bool_to_string(var56);
+oomph_print(var57);
+(void)0;
+var58 = 1LL;
+(void)0;
+var59 = 2LL;
+(void)0;
+var60 = meth_Int_equals(var58,var59);
+
+                if (var60)
+                    goto label2;
+                (void)0;
+var61 = 2LL;
+(void)0;
+var62 = 2LL;
+(void)0;
+var63 = oomph_int_add(var61,var62);
+(void)0;
+var64 = 4LL;
+(void)0;
+var65 = meth_Int_equals(var63,var64);
+
+                if (var65)
+                    goto label3;
+                string_decref(var66);
+var66.buf = NULL;
+
+                var66 = string1this_doesn_t_run_91841bde3f;
+                string_incref(var66);
+                oomph_print(var66);
+(void)0;
+var67 = oomph_true;
+
+                if (var67)
+                    goto label4;
+                label3: (void)0;
+string_decref(var68);
+var68.buf = NULL;
+
+                var68 = string5elif_39be3faa67;
+                string_incref(var68);
+                oomph_print(var68);
+label4: (void)0;
+(void)0;
+var69 = oomph_true;
+
+                if (var69)
+                    goto label5;
+                label2: (void)0;
+string_decref(var70);
+var70.buf = NULL;
+
+                var70 = string1this_doesn_t_run_91841bde3f;
+                string_incref(var70);
+                oomph_print(var70);
+label5: (void)0;
+(void)0;
+var71 = 10LL;
+(void)0;
+var72 = var71;
+(void)0;
+label6: (void)0;
+(void)0;
+var73 = oomph_true;
+(void)0;
+(void)0;
+var74 = oomph_bool_not(var73);
+
+                if (var74)
+                    goto label7;
+                (void)0;
+var75 = var72;
+(void)0;
+(void)0;
+var76 = 3LL;
+(void)0;
+var77 = oomph_int_sub(var75,var76);
+(void)0;
+var72 = var77;
+(void)0;
+(void)0;
+var78 = var72;
+(void)0;
+(void)0;
+var79 = 0LL;
+(void)0;
+var80 = oomph_int_gt(var79,var78);
+
+                if (var80)
+                    goto label8;
+                (void)0;
+var81 = oomph_true;
+
+                if (var81)
+                    goto label9;
+                label8: (void)0;
+(void)0;
+var82 = oomph_true;
+
+                if (var82)
+                    goto label7;
+                label9: (void)0;
+label10: (void)0;
+(void)0;
+var83 = oomph_true;
+
+                if (var83)
+                    goto label6;
+                label7: (void)0;
+(void)0;
+var84 = var72;
+(void)0;
+string_decref(var85);
+var85.buf = NULL;
+var85 = meth_Int_to_string(var84);
+oomph_print(var85);
+(void)0;
+var86 = var71;
+(void)0;
+string_decref(var87);
+var87.buf = NULL;
+var87 = meth_Int_to_string(var86);
+oomph_print(var87);
+string_decref(var88);
+var88.buf = NULL;
+var88 = constant_folding_ff858020a3_after_return();
+oomph_print(var88);
+out: (void)0;
+string_decref(var88);
+string_decref(var87);
+(void)0;
+string_decref(var85);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var70);
+(void)0;
+string_decref(var68);
+(void)0;
+string_decref(var66);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var57);
+(void)0;
+(void)0;
+string_decref(var54);
+string_decref(var53);
+string_decref(var52);
+string_decref(var51);
+string_decref(var50);
+(void)0;
+string_decref(var48);
+string_decref(var47);
+string_decref(var46);
+string_decref(var45);
+string_decref(var44);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var35);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var31);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var27);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var21);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var16);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var7);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
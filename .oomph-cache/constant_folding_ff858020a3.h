@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_constant_folding_ff858020a3
+            #define HEADER_GUARD_constant_folding_ff858020a3
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct class_Str constant_folding_ff858020a3_after_return(void);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,246 @@
+#include <lib/oomph.h>
+#include "count_and_splitlen_eadc010561.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+
+            static struct StringBuf string0b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ 98 },
+                .malloced = false,
+            };
+            static struct class_Str string0b_92eb5ffee6 = {
+                .buf = &string0b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1abcb_6a620e2aed_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97,98,99,98 },
+                .malloced = false,
+            };
+            static struct class_Str string1abcb_6a620e2aed = {
+                .buf = &string1abcb_6a620e2aed_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string2_d41d8cd98f = {
+                .buf = &string2_d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            int64_t var2;
+            
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var6;
+            var6 = NULL;
+
+            int64_t var7;
+            
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            struct class_Str var9;
+            var9.buf = NULL;
+
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            struct class_Str var12;
+            var12.buf = NULL;
+
+            struct class_Str var13;
+            var13.buf = NULL;
+
+            struct class_Str var14;
+            var14.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var15;
+            var15 = NULL;
+
+            int64_t var16;
+            
+            struct class_Str var17;
+            var17.buf = NULL;
+
+            struct class_Str var18;
+            var18.buf = NULL;
+
+            struct class_Str var19;
+            var19.buf = NULL;
+
+            int64_t var20;
+            
+            struct class_Str var21;
+            var21.buf = NULL;
+
+            struct class_Str var22;
+            var22.buf = NULL;
+
+            struct class_Str var23;
+            var23.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var24;
+            var24 = NULL;
+
+            int64_t var25;
+            
+            struct class_Str var26;
+            var26.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0b_92eb5ffee6;
+                string_incref(var0);
+                string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string1abcb_6a620e2aed;
+                string_incref(var1);
+                (void)0;
+var2 = meth_Str_count(var1,var0);
+string_decref(var3);
+var3.buf = NULL;
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+string_decref(var4);
+var4.buf = NULL;
+
+                var4 = string0b_92eb5ffee6;
+                string_incref(var4);
+                string_decref(var5);
+var5.buf = NULL;
+
+                var5 = string1abcb_6a620e2aed;
+                string_incref(var5);
+                decref((var6), dtor_List_Str__d1ecbd3335);
+var6 = NULL;
+var6 = meth_Str_split(var5,var4);
+(void)0;
+var7 = meth_List_Str__d1ecbd3335_length(var6);
+string_decref(var8);
+var8.buf = NULL;
+var8 = meth_Int_to_string(var7);
+oomph_print(var8);
+string_decref(var9);
+var9.buf = NULL;
+
+                var9 = string2_d41d8cd98f;
+                string_incref(var9);
+                string_decref(var10);
+var10.buf = NULL;
+
+                var10 = string1abcb_6a620e2aed;
+                string_incref(var10);
+                (void)0;
+var11 = meth_Str_count(var10,var9);
+string_decref(var12);
+var12.buf = NULL;
+var12 = meth_Int_to_string(var11);
+oomph_print(var12);
+string_decref(var13);
+var13.buf = NULL;
+
+                var13 = string2_d41d8cd98f;
+                string_incref(var13);
+                string_decref(var14);
+var14.buf = NULL;
+
+                var14 = string1abcb_6a620e2aed;
+                string_incref(var14);
+                decref((var15), dtor_List_Str__d1ecbd3335);
+var15 = NULL;
+var15 = meth_Str_split(var14,var13);
+(void)0;
+var16 = meth_List_Str__d1ecbd3335_length(var15);
+string_decref(var17);
+var17.buf = NULL;
+var17 = meth_Int_to_string(var16);
+oomph_print(var17);
+string_decref(var18);
+var18.buf = NULL;
+
+                var18 = string0b_92eb5ffee6;
+                string_incref(var18);
+                string_decref(var19);
+var19.buf = NULL;
+
+                var19 = string2_d41d8cd98f;
+                string_incref(var19);
+                (void)0;
+var20 = meth_Str_count(var19,var18);
+string_decref(var21);
+var21.buf = NULL;
+var21 = meth_Int_to_string(var20);
+oomph_print(var21);
+string_decref(var22);
+var22.buf = NULL;
+
+                var22 = string0b_92eb5ffee6;
+                string_incref(var22);
+                string_decref(var23);
+var23.buf = NULL;
+
+                var23 = string2_d41d8cd98f;
+                string_incref(var23);
+                decref((var24), dtor_List_Str__d1ecbd3335);
+var24 = NULL;
+var24 = meth_Str_split(var23,var22);
+(void)0;
+var25 = meth_List_Str__d1ecbd3335_length(var24);
+string_decref(var26);
+var26.buf = NULL;
+var26 = meth_Int_to_string(var25);
+oomph_print(var26);
+out: (void)0;
+string_decref(var26);
+(void)0;
+decref((var24), dtor_List_Str__d1ecbd3335);
+string_decref(var23);
+string_decref(var22);
+string_decref(var21);
+(void)0;
+string_decref(var19);
+string_decref(var18);
+string_decref(var17);
+(void)0;
+decref((var15), dtor_List_Str__d1ecbd3335);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+(void)0;
+string_decref(var10);
+string_decref(var9);
+string_decref(var8);
+(void)0;
+decref((var6), dtor_List_Str__d1ecbd3335);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+(void)0;
+string_decref(var1);
+string_decref(var0);
+}
@@ -0,0 +1,13 @@
+
+            #ifndef HEADER_GUARD_count_and_splitlen_eadc010561
+            #define HEADER_GUARD_count_and_splitlen_eadc010561
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,49 @@
+#include <lib/oomph.h>
+#include "custom_eq_38f0779961.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+void oomph_main(void){
+            struct class_Foo_1356c67d7a* var0;
+            var0 = NULL;
+
+            struct class_Foo_1356c67d7a* var1;
+            var1 = NULL;
+
+            struct class_Foo_1356c67d7a* var2;
+            var2 = NULL;
+
+            struct class_Foo_1356c67d7a* var3;
+            var3 = NULL;
+
+            bool var4;
+            
+            struct class_Str var5;
+            var5.buf = NULL;
+decref((var0), dtor_Foo_1356c67d7a);
+var0 = NULL;
+var0 = ctor_Foo_1356c67d7a();
+decref((var1), dtor_Foo_1356c67d7a);
+var1 = NULL;
+var1 = ctor_Foo_1356c67d7a();
+decref((var2), dtor_Foo_1356c67d7a);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+decref((var3), dtor_Foo_1356c67d7a);
+var3 = NULL;
+var3 = var1;
+incref(var3);
+(void)0;
+var4 = meth_Foo_1356c67d7a_equals(var2,var3);
+string_decref(var5);
+var5.buf = NULL;
+var5 = meth_Bool_to_string(var4);
+oomph_print(var5);
+out: (void)0;
+string_decref(var5);
+(void)0;
+decref((var3), dtor_Foo_1356c67d7a);
+decref((var2), dtor_Foo_1356c67d7a);
+decref((var1), dtor_Foo_1356c67d7a);
+decref((var0), dtor_Foo_1356c67d7a);
+}
@@ -0,0 +1,21 @@
+#include <lib/oomph.h>
+#include "custom_tostring_0e5805a16b.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+void oomph_main(void){
+            struct class_Foo_1356c67d7a* var0;
+            var0 = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+decref((var0), dtor_Foo_1356c67d7a);
+var0 = NULL;
+var0 = ctor_Foo_1356c67d7a();
+string_decref(var1);
+var1.buf = NULL;
+var1 = meth_Foo_1356c67d7a_to_string(var0);
+oomph_print(var1);
+out: (void)0;
+string_decref(var1);
+decref((var0), dtor_Foo_1356c67d7a);
+}
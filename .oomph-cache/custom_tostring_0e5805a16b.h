@@ -0,0 +1,11 @@
+
+            #ifndef HEADER_GUARD_custom_tostring_0e5805a16b
+            #define HEADER_GUARD_custom_tostring_0e5805a16b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+struct class_Foo_1356c67d7a;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
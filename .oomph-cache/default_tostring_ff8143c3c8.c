@@ -0,0 +1,130 @@
+#include <lib/oomph.h>
+#include "default_tostring_ff8143c3c8.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo0_5e77621507.h"
+#include "Foo1_089c7c9f0c.h"
+#include "Foo2_5038b342e4.h"
+#include "Foo3_d3de4e7edb.h"
+
+            static struct StringBuf string0lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ 108,111,108 },
+                .malloced = false,
+            };
+            static struct class_Str string0lol_9cdfb439c7 = {
+                .buf = &string0lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1wat_611c59af56_buf = {
+                .refcount = -1,
+                .data = (char[]){ 119,97,116 },
+                .malloced = false,
+            };
+            static struct class_Str string1wat_611c59af56 = {
+                .buf = &string1wat_611c59af56_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Foo0_5e77621507* var0;
+            var0 = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            int64_t var2;
+            
+            struct class_Foo1_089c7c9f0c* var3;
+            var3 = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            int64_t var5;
+            
+            struct class_Str var6;
+            var6.buf = NULL;
+
+            struct class_Foo2_5038b342e4* var7;
+            var7 = NULL;
+
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            int64_t var9;
+            
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            bool var11;
+            
+            struct class_Foo3_d3de4e7edb* var12;
+            var12 = NULL;
+
+            struct class_Str var13;
+            var13.buf = NULL;
+decref((var0), dtor_Foo0_5e77621507);
+var0 = NULL;
+var0 = ctor_Foo0_5e77621507();
+string_decref(var1);
+var1.buf = NULL;
+var1 = meth_Foo0_5e77621507_to_string(var0);
+oomph_print(var1);
+(void)0;
+var2 = 1LL;
+decref((var3), dtor_Foo1_089c7c9f0c);
+var3 = NULL;
+var3 = ctor_Foo1_089c7c9f0c(var2);
+string_decref(var4);
+var4.buf = NULL;
+var4 = meth_Foo1_089c7c9f0c_to_string(var3);
+oomph_print(var4);
+(void)0;
+var5 = 2LL;
+string_decref(var6);
+var6.buf = NULL;
+
+                var6 = string0lol_9cdfb439c7;
+                string_incref(var6);
+                decref((var7), dtor_Foo2_5038b342e4);
+var7 = NULL;
+var7 = ctor_Foo2_5038b342e4(var5,var6);
+string_decref(var8);
+var8.buf = NULL;
+var8 = meth_Foo2_5038b342e4_to_string(var7);
+oomph_print(var8);
+(void)0;
+var9 = 3LL;
+string_decref(var10);
+var10.buf = NULL;
+
+                var10 = string1wat_611c59af56;
+                string_incref(var10);
+                (void)0;
+var11 = oomph_true;
+(void)0;
+decref((var12), dtor_Foo3_d3de4e7edb);
+var12 = NULL;
+var12 = ctor_Foo3_d3de4e7edb(var9,var10,var11);
+string_decref(var13);
+var13.buf = NULL;
+var13 = meth_Foo3_d3de4e7edb_to_string(var12);
+oomph_print(var13);
+out: (void)0;
+string_decref(var13);
+decref((var12), dtor_Foo3_d3de4e7edb);
+(void)0;
+string_decref(var10);
+(void)0;
+string_decref(var8);
+decref((var7), dtor_Foo2_5038b342e4);
+string_decref(var6);
+(void)0;
+string_decref(var4);
+decref((var3), dtor_Foo1_089c7c9f0c);
+(void)0;
+string_decref(var1);
+decref((var0), dtor_Foo0_5e77621507);
+}
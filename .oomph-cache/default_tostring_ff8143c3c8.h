@@ -0,0 +1,17 @@
+
+            #ifndef HEADER_GUARD_default_tostring_ff8143c3c8
+            #define HEADER_GUARD_default_tostring_ff8143c3c8
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo0_5e77621507.h"
+#include "Foo1_089c7c9f0c.h"
+#include "Foo2_5038b342e4.h"
+#include "Foo3_d3de4e7edb.h"
+struct class_Foo0_5e77621507;
+struct class_Foo1_089c7c9f0c;
+struct class_Foo2_5038b342e4;
+struct class_Foo3_d3de4e7edb;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
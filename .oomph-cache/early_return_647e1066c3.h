@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_early_return_647e1066c3
+            #define HEADER_GUARD_early_return_647e1066c3
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,169 @@
+#include <lib/oomph.h>
+#include "elif_8cbe960187.h"
+#include "builtins_8da1dac06a.h"
+void elif_8cbe960187_foo(int64_t var0){
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            bool var4;
+            
+            int64_t var5;
+            
+            int64_t var6;
+            
+            bool var7;
+            
+            int64_t var8;
+            
+            int64_t var9;
+            
+            bool var10;
+            
+            int64_t var11;
+            
+            struct class_Str var12;
+            var12.buf = NULL;
+
+            bool var13;
+            
+            int64_t var14;
+            
+            struct class_Str var15;
+            var15.buf = NULL;
+
+            bool var16;
+            
+            int64_t var17;
+            
+            struct class_Str var18;
+            var18.buf = NULL;
+
+            bool var19;
+            
+            int64_t var20;
+            
+            struct class_Str var21;
+            var21.buf = NULL;
+var1 = var0;
+(void)0;
+(void)0;
+var2 = var1;
+(void)0;
+(void)0;
+var3 = 1LL;
+(void)0;
+var4 = meth_Int_equals(var2,var3);
+
+                if (var4)
+                    goto label0;
+                (void)0;
+var5 = var1;
+(void)0;
+(void)0;
+var6 = 2LL;
+(void)0;
+var7 = meth_Int_equals(var5,var6);
+
+                if (var7)
+                    goto label1;
+                (void)0;
+var8 = var1;
+(void)0;
+(void)0;
+var9 = 1LL;
+(void)0;
+var10 = meth_Int_equals(var8,var9);
+
+                if (var10)
+                    goto label2;
+                (void)0;
+var11 = 1234LL;
+string_decref(var12);
+var12.buf = NULL;
+var12 = meth_Int_to_string(var11);
+oomph_print(var12);
+(void)0;
+var13 = oomph_true;
+
+                if (var13)
+                    goto label3;
+                label2: (void)0;
+(void)0;
+var14 = 666LL;
+string_decref(var15);
+var15.buf = NULL;
+var15 = meth_Int_to_string(var14);
+oomph_print(var15);
+label3: (void)0;
+(void)0;
+var16 = oomph_true;
+
+                if (var16)
+                    goto label4;
+                label1: (void)0;
+(void)0;
+var17 = 222LL;
+string_decref(var18);
+var18.buf = NULL;
+var18 = meth_Int_to_string(var17);
+oomph_print(var18);
+label4: (void)0;
+(void)0;
+var19 = oomph_true;
+
+                if (var19)
+                    goto label5;
+                label0: (void)0;
+(void)0;
+var20 = 111LL;
+string_decref(var21);
+var21.buf = NULL;
+var21 = meth_Int_to_string(var20);
+oomph_print(var21);
+label5: (void)0;
+out: (void)0;
+string_decref(var21);
+(void)0;
+(void)0;
+string_decref(var18);
+(void)0;
+(void)0;
+string_decref(var15);
+(void)0;
+(void)0;
+string_decref(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            (void)0;
+var0 = 1LL;
+elif_8cbe960187_foo(var0);
+(void)0;
+var1 = 2LL;
+elif_8cbe960187_foo(var1);
+(void)0;
+var2 = 3LL;
+elif_8cbe960187_foo(var2);
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+}
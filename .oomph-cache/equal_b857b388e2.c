@@ -0,0 +1,769 @@
+#include <lib/oomph.h>
+#include "equal_b857b388e2.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+
+            static struct StringBuf string0____________5b8acbc8f0_buf = {
+                .refcount = -1,
+                .data = (char[]){ 45,45,45,45,45,45,45,45,45,45,45 },
+                .malloced = false,
+            };
+            static struct class_Str string0____________5b8acbc8f0 = {
+                .buf = &string0____________5b8acbc8f0_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1left_811882fecd_buf = {
+                .refcount = -1,
+                .data = (char[]){ 108,101,102,116 },
+                .malloced = false,
+            };
+            static struct class_Str string1left_811882fecd = {
+                .buf = &string1left_811882fecd_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2right_7c4f294078_buf = {
+                .refcount = -1,
+                .data = (char[]){ 114,105,103,104,116 },
+                .malloced = false,
+            };
+            static struct class_Str string2right_7c4f294078 = {
+                .buf = &string2right_7c4f294078_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            int64_t equal_b857b388e2_bar(struct class_Str var0){
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            int64_t var3;
+            
+            int64_t retval;
+            var1 = var0;
+string_incref(var1);
+string_decref(var2);
+var2.buf = NULL;
+var2 = var1;
+string_incref(var2);
+oomph_print(var2);
+(void)0;
+var3 = 123LL;
+
+                        (void)0;
+                        retval = var3;
+                        goto out;
+                        out: (void)0;
+(void)0;
+string_decref(var2);
+string_decref(var1);
+return retval;
+}
+void oomph_main(void){
+            struct class_Foo_1356c67d7a* var0;
+            var0 = NULL;
+
+            struct class_Foo_1356c67d7a* var1;
+            var1 = NULL;
+
+            struct class_Foo_1356c67d7a* var2;
+            var2 = NULL;
+
+            struct class_Foo_1356c67d7a* var3;
+            var3 = NULL;
+
+            bool var4;
+            
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_Foo_1356c67d7a* var6;
+            var6 = NULL;
+
+            struct class_Foo_1356c67d7a* var7;
+            var7 = NULL;
+
+            bool var8;
+            
+            struct class_Str var9;
+            var9.buf = NULL;
+
+            int64_t var10;
+            
+            int64_t var11;
+            
+            bool var12;
+            
+            struct class_Str var13;
+            var13.buf = NULL;
+
+            int64_t var14;
+            
+            int64_t var15;
+            
+            bool var16;
+            
+            struct class_Str var17;
+            var17.buf = NULL;
+
+            double var18;
+            
+            int64_t var19;
+            
+            double var20;
+            
+            bool var21;
+            
+            struct class_Str var22;
+            var22.buf = NULL;
+
+            double var23;
+            
+            double var24;
+            
+            double var25;
+            
+            double var26;
+            
+            bool var27;
+            
+            struct class_Str var28;
+            var28.buf = NULL;
+
+            bool var29;
+            
+            bool var30;
+            
+            bool var31;
+            
+            struct class_Str var32;
+            var32.buf = NULL;
+
+            bool var33;
+            
+            bool var34;
+            
+            bool var35;
+            
+            struct class_Str var36;
+            var36.buf = NULL;
+
+            bool var37;
+            
+            bool var38;
+            
+            bool var39;
+            
+            struct class_Str var40;
+            var40.buf = NULL;
+
+            bool var41;
+            
+            bool var42;
+            
+            bool var43;
+            
+            struct class_Str var44;
+            var44.buf = NULL;
+
+            struct class_Str var45;
+            var45.buf = NULL;
+
+            struct class_Foo_1356c67d7a* var46;
+            var46 = NULL;
+
+            struct class_Foo_1356c67d7a* var47;
+            var47 = NULL;
+
+            bool var48;
+            
+            bool var49;
+            
+            struct class_Str var50;
+            var50.buf = NULL;
+
+            struct class_Foo_1356c67d7a* var51;
+            var51 = NULL;
+
+            struct class_Foo_1356c67d7a* var52;
+            var52 = NULL;
+
+            bool var53;
+            
+            bool var54;
+            
+            struct class_Str var55;
+            var55.buf = NULL;
+
+            int64_t var56;
+            
+            int64_t var57;
+            
+            bool var58;
+            
+            bool var59;
+            
+            struct class_Str var60;
+            var60.buf = NULL;
+
+            int64_t var61;
+            
+            int64_t var62;
+            
+            bool var63;
+            
+            bool var64;
+            
+            struct class_Str var65;
+            var65.buf = NULL;
+
+            double var66;
+            
+            int64_t var67;
+            
+            double var68;
+            
+            bool var69;
+            
+            bool var70;
+            
+            struct class_Str var71;
+            var71.buf = NULL;
+
+            double var72;
+            
+            double var73;
+            
+            double var74;
+            
+            double var75;
+            
+            bool var76;
+            
+            bool var77;
+            
+            struct class_Str var78;
+            var78.buf = NULL;
+
+            bool var79;
+            
+            bool var80;
+            
+            bool var81;
+            
+            bool var82;
+            
+            struct class_Str var83;
+            var83.buf = NULL;
+
+            bool var84;
+            
+            bool var85;
+            
+            bool var86;
+            
+            bool var87;
+            
+            struct class_Str var88;
+            var88.buf = NULL;
+
+            bool var89;
+            
+            bool var90;
+            
+            bool var91;
+            
+            bool var92;
+            
+            struct class_Str var93;
+            var93.buf = NULL;
+
+            bool var94;
+            
+            bool var95;
+            
+            bool var96;
+            
+            bool var97;
+            
+            struct class_Str var98;
+            var98.buf = NULL;
+
+            struct class_Str var99;
+            var99.buf = NULL;
+
+            struct class_Str var100;
+            var100.buf = NULL;
+
+            int64_t var101;
+            
+            struct class_Str var102;
+            var102.buf = NULL;
+
+            int64_t var103;
+            
+            bool var104;
+            
+            struct class_Str var105;
+            var105.buf = NULL;
+
+            struct class_Str var106;
+            var106.buf = NULL;
+
+            int64_t var107;
+            
+            struct class_Str var108;
+            var108.buf = NULL;
+
+            int64_t var109;
+            
+            bool var110;
+            
+            bool var111;
+            
+            struct class_Str var112;
+            var112.buf = NULL;
+decref((var0), dtor_Foo_1356c67d7a);
+var0 = NULL;
+var0 = ctor_Foo_1356c67d7a();
+decref((var1), dtor_Foo_1356c67d7a);
+var1 = NULL;
+var1 = ctor_Foo_1356c67d7a();
+decref((var2), dtor_Foo_1356c67d7a);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+decref((var3), dtor_Foo_1356c67d7a);
+var3 = NULL;
+var3 = var0;
+incref(var3);
+(void)0;
+var4 = meth_Foo_1356c67d7a_equals(var2,var3);
+string_decref(var5);
+var5.buf = NULL;
+var5 = meth_Bool_to_string(var4);
+oomph_print(var5);
+decref((var6), dtor_Foo_1356c67d7a);
+var6 = NULL;
+var6 = var0;
+incref(var6);
+decref((var7), dtor_Foo_1356c67d7a);
+var7 = NULL;
+var7 = var1;
+incref(var7);
+(void)0;
+var8 = meth_Foo_1356c67d7a_equals(var6,var7);
+string_decref(var9);
+var9.buf = NULL;
+var9 = meth_Bool_to_string(var8);
+oomph_print(var9);
+(void)0;
+var10 = 1LL;
+(void)0;
+var11 = 1LL;
+(void)0;
+var12 = meth_Int_equals(var10,var11);
+string_decref(var13);
+var13.buf = NULL;
+var13 = meth_Bool_to_string(var12);
+oomph_print(var13);
+(void)0;
+var14 = 1LL;
+(void)0;
+var15 = 2LL;
+(void)0;
+var16 = meth_Int_equals(var14,var15);
+string_decref(var17);
+var17.buf = NULL;
+var17 = meth_Bool_to_string(var16);
+oomph_print(var17);
+(void)0;
+var18 = 1.0;
+(void)0;
+var19 = 1LL;
+(void)0;
+var20 = oomph_int2float(var19);
+(void)0;
+var21 = meth_Float_equals(var18,var20);
+string_decref(var22);
+var22.buf = NULL;
+var22 = meth_Bool_to_string(var21);
+oomph_print(var22);
+(void)0;
+var23 = 0.1;
+(void)0;
+var24 = 0.2;
+(void)0;
+var25 = oomph_float_add(var23,var24);
+(void)0;
+var26 = 0.3;
+(void)0;
+var27 = meth_Float_equals(var25,var26);
+string_decref(var28);
+var28.buf = NULL;
+var28 = meth_Bool_to_string(var27);
+oomph_print(var28);
+(void)0;
+var29 = oomph_true;
+(void)0;
+(void)0;
+var30 = oomph_true;
+(void)0;
+(void)0;
+var31 = meth_Bool_equals(var29,var30);
+string_decref(var32);
+var32.buf = NULL;
+var32 = meth_Bool_to_string(var31);
+oomph_print(var32);
+(void)0;
+var33 = oomph_true;
+(void)0;
+(void)0;
+var34 = oomph_false;
+(void)0;
+(void)0;
+var35 = meth_Bool_equals(var33,var34);
+string_decref(var36);
+var36.buf = NULL;
+var36 = meth_Bool_to_string(var35);
+oomph_print(var36);
+(void)0;
+var37 = oomph_false;
+(void)0;
+(void)0;
+var38 = oomph_false;
+(void)0;
+(void)0;
+var39 = meth_Bool_equals(var37,var38);
+string_decref(var40);
+var40.buf = NULL;
+var40 = meth_Bool_to_string(var39);
+oomph_print(var40);
+(void)0;
+var41 = oomph_false;
+(void)0;
+(void)0;
+var42 = oomph_true;
+(void)0;
+(void)0;
+var43 = meth_Bool_equals(var41,var42);
+string_decref(var44);
+var44.buf = NULL;
+var44 = meth_Bool_to_string(var43);
+oomph_print(var44);
+string_decref(var45);
+var45.buf = NULL;
+
+                var45 = string0____________5b8acbc8f0;
+                string_incref(var45);
+                oomph_print(var45);
+decref((var46), dtor_Foo_1356c67d7a);
+var46 = NULL;
+var46 = var0;
+incref(var46);
+decref((var47), dtor_Foo_1356c67d7a);
+var47 = NULL;
+var47 = var0;
+incref(var47);
+(void)0;
+var48 = meth_Foo_1356c67d7a_equals(var46,var47);
+(void)0;
+var49 = oomph_bool_not(var48);
+string_decref(var50);
+var50.buf = NULL;
+var50 = meth_Bool_to_string(var49);
+oomph_print(var50);
+decref((var51), dtor_Foo_1356c67d7a);
+var51 = NULL;
+var51 = var0;
+incref(var51);
+decref((var52), dtor_Foo_1356c67d7a);
+var52 = NULL;
+var52 = var1;
+incref(var52);
+(void)0;
+var53 = meth_Foo_1356c67d7a_equals(var51,var52);
+(void)0;
+var54 = oomph_bool_not(var53);
+string_decref(var55);
+var55.buf = NULL;
+var55 = meth_Bool_to_string(var54);
+oomph_print(var55);
+(void)0;
+var56 = 1LL;
+(void)0;
+var57 = 1LL;
+(void)0;
+var58 = meth_Int_equals(var56,var57);
+(void)0;
+var59 = oomph_bool_not(var58);
+string_decref(var60);
+var60.buf = NULL;
+var60 = meth_Bool_to_string(var59);
+oomph_print(var60);
+(void)0;
+var61 = 1LL;
+(void)0;
+var62 = 2LL;
+(void)0;
+var63 = meth_Int_equals(var61,var62);
+(void)0;
+var64 = oomph_bool_not(var63);
+string_decref(var65);
+var65.buf = NULL;
+var65 = meth_Bool_to_string(var64);
+oomph_print(var65);
+(void)0;
+var66 = 1.0;
+(void)0;
+var67 = 1LL;
+(void)0;
+var68 = oomph_int2float(var67);
+(void)0;
+var69 = meth_Float_equals(var66,var68);
+(void)0;
+var70 = oomph_bool_not(var69);
+string_decref(var71);
+var71.buf = NULL;
+var71 = meth_Bool_to_string(var70);
+oomph_print(var71);
+(void)0;
+var72 = 0.1;
+(void)0;
+var73 = 0.2;
+(void)0;
+var74 = oomph_float_add(var72,var73);
+(void)0;
+var75 = 0.3;
+(void)0;
+var76 = meth_Float_equals(var74,var75);
+(void)0;
+var77 = oomph_bool_not(var76);
+string_decref(var78);
+var78.buf = NULL;
+var78 = meth_Bool_to_string(var77);
+oomph_print(var78);
+(void)0;
+var79 = oomph_true;
+(void)0;
+(void)0;
+var80 = oomph_true;
+(void)0;
+(void)0;
+var81 = meth_Bool_equals(var79,var80);
+(void)0;
+var82 = oomph_bool_not(var81);
+string_decref(var83);
+var83.buf = NULL;
+var83 = meth_Bool_to_string(var82);
+oomph_print(var83);
+(void)0;
+var84 = oomph_true;
+(void)0;
+(void)0;
+var85 = oomph_false;
+(void)0;
+(void)0;
+var86 = meth_Bool_equals(var84,var85);
+(void)0;
+var87 = oomph_bool_not(var86);
+string_decref(var88);
+var88.buf = NULL;
+var88 = meth_Bool_to_string(var87);
+oomph_print(var88);
+(void)0;
+var89 = oomph_false;
+(void)0;
+(void)0;
+var90 = oomph_false;
+(void)0;
+(void)0;
+var91 = meth_Bool_equals(var89,var90);
+(void)0;
+var92 = oomph_bool_not(var91);
+string_decref(var93);
+var93.buf = NULL;
+var93 = meth_Bool_to_string(var92);
+oomph_print(var93);
+(void)0;
+var94 = oomph_false;
+(void)0;
+(void)0;
+var95 = oomph_true;
+(void)0;
+(void)0;
+var96 = meth_Bool_equals(var94,var95);
+(void)0;
+var97 = oomph_bool_not(var96);
+string_decref(var98);
+var98.buf = NULL;
+var98 = meth_Bool_to_string(var97);
+oomph_print(var98);
+string_decref(var99);
+var99.buf = NULL;
+
+                var99 = string0____________5b8acbc8f0;
+                string_incref(var99);
+                oomph_print(var99);
+string_decref(var100);
+var100.buf = NULL;
+
+                var100 = string1left_811882fecd;
+                string_incref(var100);
+                (void)0;
+var101 = equal_b857b388e2_bar(var100);
+string_decref(var102);
+var102.buf = NULL;
+
+                var102 = string2right_7c4f294078;
+                string_incref(var102);
+                (void)0;
+var103 = equal_b857b388e2_bar(var102);
+(void)0;
+var104 = meth_Int_equals(var101,var103);
+string_decref(var105);
+var105.buf = NULL;
+var105 = meth_Bool_to_string(var104);
+oomph_print(var105);
+string_decref(var106);
+var106.buf = NULL;
+
+                var106 = string1left_811882fecd;
+                string_incref(var106);
+                (void)0;
+var107 = equal_b857b388e2_bar(var106);
+string_decref(var108);
+var108.buf = NULL;
+
+                var108 = string2right_7c4f294078;
+                string_incref(var108);
+                (void)0;
+var109 = equal_b857b388e2_bar(var108);
+(void)0;
+var110 = meth_Int_equals(var107,var109);
+(void)0;
+var111 = oomph_bool_not(var110);
+string_decref(var112);
+var112.buf = NULL;
+var112 = meth_Bool_to_string(var111);
+oomph_print(var112);
+out: (void)0;
+string_decref(var112);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var108);
+(void)0;
+string_decref(var106);
+string_decref(var105);
+(void)0;
+(void)0;
+string_decref(var102);
+(void)0;
+string_decref(var100);
+string_decref(var99);
+string_decref(var98);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var93);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var88);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var83);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var78);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var71);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var65);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var60);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var55);
+(void)0;
+(void)0;
+decref((var52), dtor_Foo_1356c67d7a);
+decref((var51), dtor_Foo_1356c67d7a);
+string_decref(var50);
+(void)0;
+(void)0;
+decref((var47), dtor_Foo_1356c67d7a);
+decref((var46), dtor_Foo_1356c67d7a);
+string_decref(var45);
+string_decref(var44);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var40);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var36);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var32);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var28);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var22);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var17);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var13);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var9);
+(void)0;
+decref((var7), dtor_Foo_1356c67d7a);
+decref((var6), dtor_Foo_1356c67d7a);
+string_decref(var5);
+(void)0;
+decref((var3), dtor_Foo_1356c67d7a);
+decref((var2), dtor_Foo_1356c67d7a);
+decref((var1), dtor_Foo_1356c67d7a);
+decref((var0), dtor_Foo_1356c67d7a);
+}
@@ -0,0 +1,21 @@
+
+            #ifndef HEADER_GUARD_equal_b857b388e2
+            #define HEADER_GUARD_equal_b857b388e2
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+int64_t equal_b857b388e2_bar(struct class_Str var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,89 @@
+#include <lib/oomph.h>
+#include "escape_135b51f194.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0a_b_2b28f46e64_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97,92,98 },
+                .malloced = false,
+            };
+            static struct class_Str string0a_b_2b28f46e64 = {
+                .buf = &string0a_b_2b28f46e64_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1a_b_c_d_e_f_g_38b41b7baf_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97,123,98,125,99,92,100,10,101,9,102,34,103 },
+                .malloced = false,
+            };
+            static struct class_Str string1a_b_c_d_e_f_g_38b41b7baf = {
+                .buf = &string1a_b_c_d_e_f_g_38b41b7baf_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2__b15835f133_buf = {
+                .refcount = -1,
+                .data = (char[]){ 34 },
+                .malloced = false,
+            };
+            static struct class_Str string2__b15835f133 = {
+                .buf = &string2__b15835f133_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_n_1d78758685_buf = {
+                .refcount = -1,
+                .data = (char[]){ 92,110 },
+                .malloced = false,
+            };
+            static struct class_Str string3_n_1d78758685 = {
+                .buf = &string3_n_1d78758685_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0a_b_2b28f46e64;
+                string_incref(var0);
+                oomph_print(var0);
+string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string1a_b_c_d_e_f_g_38b41b7baf;
+                string_incref(var1);
+                oomph_print(var1);
+string_decref(var2);
+var2.buf = NULL;
+
+                var2 = string2__b15835f133;
+                string_incref(var2);
+                oomph_print(var2);
+string_decref(var3);
+var3.buf = NULL;
+
+                var3 = string3_n_1d78758685;
+                string_incref(var3);
+                oomph_print(var3);
+out: (void)0;
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+string_decref(var0);
+}
@@ -0,0 +1,258 @@
+#include <lib/oomph.h>
+#include "format_7ec25db62b.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0World_f5a7924e62_buf = {
+                .refcount = -1,
+                .data = (char[]){ 87,111,114,108,100 },
+                .malloced = false,
+            };
+            static struct class_Str string0World_f5a7924e62 = {
+                .buf = &string0World_f5a7924e62_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1Hello__d1a7fb5eab_buf = {
+                .refcount = -1,
+                .data = (char[]){ 72,101,108,108,111,32 },
+                .malloced = false,
+            };
+            static struct class_Str string1Hello__d1a7fb5eab = {
+                .buf = &string1Hello__d1a7fb5eab_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2__9033e0e305_buf = {
+                .refcount = -1,
+                .data = (char[]){ 33 },
+                .malloced = false,
+            };
+            static struct class_Str string2__9033e0e305 = {
+                .buf = &string2__9033e0e305_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string31___2____0d3f4c8ae2_buf = {
+                .refcount = -1,
+                .data = (char[]){ 49,32,43,32,50,32,61,32 },
+                .malloced = false,
+            };
+            static struct class_Str string31___2____0d3f4c8ae2 = {
+                .buf = &string31___2____0d3f4c8ae2_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string41_4____92d5e006e9_buf = {
+                .refcount = -1,
+                .data = (char[]){ 49,47,52,32,61,32 },
+                .malloced = false,
+            };
+            static struct class_Str string41_4____92d5e006e9 = {
+                .buf = &string41_4____92d5e006e9_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5Is_0_1_0_2____0_3___b151493356_buf = {
+                .refcount = -1,
+                .data = (char[]){ 73,115,32,48,46,49,43,48,46,50,32,61,61,32,48,46,51,63,32 },
+                .malloced = false,
+            };
+            static struct class_Str string5Is_0_1_0_2____0_3___b151493356 = {
+                .buf = &string5Is_0_1_0_2____0_3___b151493356_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_Str var6;
+            var6.buf = NULL;
+
+            int64_t var7;
+            
+            int64_t var8;
+            
+            int64_t var9;
+            
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            struct class_Str var11;
+            var11.buf = NULL;
+
+            struct class_Str var12;
+            var12.buf = NULL;
+
+            int64_t var13;
+            
+            int64_t var14;
+            
+            double var15;
+            
+            double var16;
+            
+            double var17;
+            
+            struct class_Str var18;
+            var18.buf = NULL;
+
+            struct class_Str var19;
+            var19.buf = NULL;
+
+            struct class_Str var20;
+            var20.buf = NULL;
+
+            double var21;
+            
+            double var22;
+            
+            double var23;
+            
+            double var24;
+            
+            bool var25;
+            
+            struct class_Str var26;
+            var26.buf = NULL;
+
+            struct class_Str var27;
+            var27.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0World_f5a7924e62;
+                string_incref(var0);
+                string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string1Hello__d1a7fb5eab;
+                string_incref(var1);
+                string_decref(var2);
+var2.buf = NULL;
+var2 = var0;
+string_incref(var2);
+string_decref(var3);
+var3.buf = NULL;
+var3 = oomph_string_concat(var1,var2);
+string_decref(var4);
+var4.buf = NULL;
+
+                var4 = string2__9033e0e305;
+                string_incref(var4);
+                string_decref(var5);
+var5.buf = NULL;
+var5 = oomph_string_concat(var3,var4);
+oomph_print(var5);
+string_decref(var6);
+var6.buf = NULL;
+
+                var6 = string31___2____0d3f4c8ae2;
+                string_incref(var6);
+                (void)0;
+var7 = 1LL;
+(void)0;
+var8 = 2LL;
+(void)0;
+var9 = oomph_int_add(var7,var8);
+string_decref(var10);
+var10.buf = NULL;
+var10 = meth_Int_to_string(var9);
+string_decref(var11);
+var11.buf = NULL;
+var11 = oomph_string_concat(var6,var10);
+oomph_print(var11);
+string_decref(var12);
+var12.buf = NULL;
+
+                var12 = string41_4____92d5e006e9;
+                string_incref(var12);
+                (void)0;
+var13 = 1LL;
+(void)0;
+var14 = 4LL;
+(void)0;
+var15 = oomph_int2float(var13);
+(void)0;
+var16 = oomph_int2float(var14);
+(void)0;
+var17 = oomph_float_div(var15,var16);
+string_decref(var18);
+var18.buf = NULL;
+var18 = meth_Float_to_string(var17);
+string_decref(var19);
+var19.buf = NULL;
+var19 = oomph_string_concat(var12,var18);
+oomph_print(var19);
+string_decref(var20);
+var20.buf = NULL;
+
+                var20 = string5Is_0_1_0_2____0_3___b151493356;
+                string_incref(var20);
+                (void)0;
+var21 = 0.1;
+(void)0;
+var22 = 0.2;
+(void)0;
+var23 = oomph_float_add(var21,var22);
+(void)0;
+var24 = 0.3;
+(void)0;
+var25 = meth_Float_equals(var23,var24);
+string_decref(var26);
+var26.buf = NULL;
+var26 = meth_Bool_to_string(var25);
+string_decref(var27);
+var27.buf = NULL;
+var27 = oomph_string_concat(var20,var26);
+oomph_print(var27);
+out: (void)0;
+string_decref(var27);
+string_decref(var26);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var20);
+string_decref(var19);
+string_decref(var18);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var12);
+string_decref(var11);
+string_decref(var10);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+string_decref(var0);
+}
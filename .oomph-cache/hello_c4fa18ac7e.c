@@ -0,0 +1,26 @@
+#include <lib/oomph.h>
+#include "hello_c4fa18ac7e.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ 104,101,108,108,111 },
+                .malloced = false,
+            };
+            static struct class_Str string0hello_5d41402abc = {
+                .buf = &string0hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0hello_5d41402abc;
+                string_incref(var0);
+                oomph_print(var0);
+out: (void)0;
+string_decref(var0);
+}
@@ -0,0 +1,87 @@
+#include <lib/oomph.h>
+#include "if_ef2ed02fb7.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            bool var2;
+            
+            bool var3;
+            
+            int64_t var4;
+            
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            int64_t var6;
+            
+            int64_t var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+            int64_t var10;
+            
+            struct class_Str var11;
+            var11.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 1LL;
+(void)0;
+var2 = meth_Int_equals(var0,var1);
+
+                if (var2)
+                    goto label0;
+                (void)0;
+var3 = oomph_true;
+
+                if (var3)
+                    goto label1;
+                label0: (void)0;
+(void)0;
+var4 = 123LL;
+string_decref(var5);
+var5.buf = NULL;
+var5 = meth_Int_to_string(var4);
+oomph_print(var5);
+label1: (void)0;
+(void)0;
+var6 = 1LL;
+(void)0;
+var7 = 2LL;
+(void)0;
+var8 = meth_Int_equals(var6,var7);
+
+                if (var8)
+                    goto label2;
+                (void)0;
+var9 = oomph_true;
+
+                if (var9)
+                    goto label3;
+                label2: (void)0;
+(void)0;
+var10 = 666LL;
+string_decref(var11);
+var11.buf = NULL;
+var11 = meth_Int_to_string(var10);
+oomph_print(var11);
+label3: (void)0;
+out: (void)0;
+string_decref(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var5);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
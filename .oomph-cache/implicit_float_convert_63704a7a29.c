@@ -0,0 +1,69 @@
+#include <lib/oomph.h>
+#include "implicit_float_convert_63704a7a29.h"
+#include "builtins_8da1dac06a.h"
+void implicit_float_convert_63704a7a29_foo(double var0){
+            double var1;
+            
+            double var2;
+            
+            struct class_Str var3;
+            var3.buf = NULL;
+var1 = var0;
+(void)0;
+(void)0;
+var2 = var1;
+(void)0;
+string_decref(var3);
+var3.buf = NULL;
+var3 = meth_Float_to_string(var2);
+oomph_print(var3);
+out: (void)0;
+string_decref(var3);
+(void)0;
+(void)0;
+}
+void oomph_main(void){
+            int64_t var0;
+            
+            double var1;
+            
+            double var2;
+            
+            int64_t var3;
+            
+            double var4;
+            
+            double var5;
+            
+            struct class_Str var6;
+            var6.buf = NULL;
+(void)0;
+var0 = 123LL;
+(void)0;
+var1 = oomph_int2float(var0);
+implicit_float_convert_63704a7a29_foo(var1);
+(void)0;
+var2 = 1.23;
+(void)0;
+var3 = 45LL;
+(void)0;
+(void)0;
+var4 = oomph_int2float(var3);
+var2 = var4;
+(void)0;
+(void)0;
+var5 = var2;
+(void)0;
+string_decref(var6);
+var6.buf = NULL;
+var6 = meth_Float_to_string(var5);
+oomph_print(var6);
+out: (void)0;
+string_decref(var6);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,308 @@
+#include <lib/oomph.h>
+#include "in_a5e24276b8.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__ca8c9dc13d.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            struct class_List_Int__ca8c9dc13d* var2;
+            var2 = NULL;
+
+            bool var3;
+            
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            int64_t var5;
+            
+            int64_t var6;
+            
+            struct class_List_Int__ca8c9dc13d* var7;
+            var7 = NULL;
+
+            bool var8;
+            
+            struct class_Str var9;
+            var9.buf = NULL;
+
+            int64_t var10;
+            
+            int64_t var11;
+            
+            int64_t var12;
+            
+            int64_t var13;
+            
+            bool var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            int64_t var17;
+            
+            int64_t var18;
+            
+            int64_t var19;
+            
+            struct class_List_Int__ca8c9dc13d* var20;
+            var20 = NULL;
+
+            bool var21;
+            
+            bool var22;
+            
+            struct class_Str var23;
+            var23.buf = NULL;
+
+            int64_t var24;
+            
+            int64_t var25;
+            
+            struct class_List_Int__ca8c9dc13d* var26;
+            var26 = NULL;
+
+            bool var27;
+            
+            bool var28;
+            
+            struct class_Str var29;
+            var29.buf = NULL;
+
+            int64_t var30;
+            
+            int64_t var31;
+            
+            struct class_List_Int__ca8c9dc13d* var32;
+            var32 = NULL;
+
+            bool var33;
+            
+            bool var34;
+            
+            struct class_Str var35;
+            var35.buf = NULL;
+
+            int64_t var36;
+            
+            int64_t var37;
+            
+            int64_t var38;
+            
+            int64_t var39;
+            
+            bool var40;
+            
+            bool var41;
+            
+            bool var42;
+            
+            int64_t var43;
+            
+            int64_t var44;
+            
+            int64_t var45;
+            
+            struct class_List_Int__ca8c9dc13d* var46;
+            var46 = NULL;
+
+            bool var47;
+            
+            bool var48;
+            
+            struct class_Str var49;
+            var49.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+decref((var2), dtor_List_Int__ca8c9dc13d);
+var2 = NULL;
+var2 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var2,var1);
+(void)0;
+var3 = meth_List_Int__ca8c9dc13d___contains(var2,var0);
+string_decref(var4);
+var4.buf = NULL;
+var4 = meth_Bool_to_string(var3);
+oomph_print(var4);
+(void)0;
+var5 = 2LL;
+(void)0;
+var6 = 2LL;
+decref((var7), dtor_List_Int__ca8c9dc13d);
+var7 = NULL;
+var7 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var7,var6);
+(void)0;
+var8 = meth_List_Int__ca8c9dc13d___contains(var7,var5);
+string_decref(var9);
+var9.buf = NULL;
+var9 = meth_Bool_to_string(var8);
+oomph_print(var9);
+(void)0;
+var10 = 1LL;
+(void)0;
+var11 = 2LL;
+(void)0;
+var12 = oomph_int_add(var10,var11);
+(void)0;
+var13 = 3LL;
+(void)0;
+var14 = meth_Int_equals(var12,var13);
+(void)0;
+
+                if (var14)
+                    goto label0;
+                var15 = oomph_false;
+(void)0;
+var16 = oomph_true;
+
+                if (var16)
+                    goto label1;
+                label0: (void)0;
+(void)0;
+var17 = 1LL;
+(void)0;
+var18 = 2LL;
+(void)0;
+var19 = oomph_int_add(var17,var18);
+decref((var20), dtor_List_Int__ca8c9dc13d);
+var20 = NULL;
+var20 = ctor_List_Int__ca8c9dc13d();
+(void)0;
+var21 = meth_List_Int__ca8c9dc13d___contains(var20,var19);
+(void)0;
+var22 = oomph_bool_not(var21);
+var15 = var22;
+label1: (void)0;
+string_decref(var23);
+var23.buf = NULL;
+var23 = meth_Bool_to_string(var15);
+oomph_print(var23);
+(void)0;
+var24 = 1LL;
+(void)0;
+var25 = 2LL;
+decref((var26), dtor_List_Int__ca8c9dc13d);
+var26 = NULL;
+var26 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var26,var25);
+(void)0;
+var27 = meth_List_Int__ca8c9dc13d___contains(var26,var24);
+(void)0;
+var28 = oomph_bool_not(var27);
+string_decref(var29);
+var29.buf = NULL;
+var29 = meth_Bool_to_string(var28);
+oomph_print(var29);
+(void)0;
+var30 = 2LL;
+(void)0;
+var31 = 2LL;
+decref((var32), dtor_List_Int__ca8c9dc13d);
+var32 = NULL;
+var32 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var32,var31);
+(void)0;
+var33 = meth_List_Int__ca8c9dc13d___contains(var32,var30);
+(void)0;
+var34 = oomph_bool_not(var33);
+string_decref(var35);
+var35.buf = NULL;
+var35 = meth_Bool_to_string(var34);
+oomph_print(var35);
+(void)0;
+var36 = 1LL;
+(void)0;
+var37 = 2LL;
+(void)0;
+var38 = oomph_int_add(var36,var37);
+(void)0;
+var39 = 3LL;
+(void)0;
+var40 = meth_Int_equals(var38,var39);
+(void)0;
+
+                if (var40)
+                    goto label2;
+                var41 = oomph_false;
+(void)0;
+var42 = oomph_true;
+
+                if (var42)
+                    goto label3;
+                label2: (void)0;
+(void)0;
+var43 = 1LL;
+(void)0;
+var44 = 2LL;
+(void)0;
+var45 = oomph_int_add(var43,var44);
+decref((var46), dtor_List_Int__ca8c9dc13d);
+var46 = NULL;
+var46 = ctor_List_Int__ca8c9dc13d();
+(void)0;
+var47 = meth_List_Int__ca8c9dc13d___contains(var46,var45);
+(void)0;
+var48 = oomph_bool_not(var47);
+var41 = var48;
+label3: (void)0;
+string_decref(var49);
+var49.buf = NULL;
+var49 = meth_Bool_to_string(var41);
+oomph_print(var49);
+out: (void)0;
+string_decref(var49);
+(void)0;
+(void)0;
+decref((var46), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var35);
+(void)0;
+(void)0;
+decref((var32), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+string_decref(var29);
+(void)0;
+(void)0;
+decref((var26), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+string_decref(var23);
+(void)0;
+(void)0;
+decref((var20), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var9);
+(void)0;
+decref((var7), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+string_decref(var4);
+(void)0;
+decref((var2), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+}
@@ -0,0 +1,16 @@
+
+            #ifndef HEADER_GUARD_in_a5e24276b8
+            #define HEADER_GUARD_in_a5e24276b8
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Int__ca8c9dc13d.h"
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,246 @@
+#include <lib/oomph.h>
+#include "insert_02a3145832.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+
+            static struct StringBuf string0a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97 },
+                .malloced = false,
+            };
+            static struct class_Str string0a_0cc175b9c0 = {
+                .buf = &string0a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ 98 },
+                .malloced = false,
+            };
+            static struct class_Str string1b_92eb5ffee6 = {
+                .buf = &string1b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2c_4a8a08f09d_buf = {
+                .refcount = -1,
+                .data = (char[]){ 99 },
+                .malloced = false,
+            };
+            static struct class_Str string2c_4a8a08f09d = {
+                .buf = &string2c_4a8a08f09d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3d_8277e0910d_buf = {
+                .refcount = -1,
+                .data = (char[]){ 100 },
+                .malloced = false,
+            };
+            static struct class_Str string3d_8277e0910d = {
+                .buf = &string3d_8277e0910d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4e_e1671797c5_buf = {
+                .refcount = -1,
+                .data = (char[]){ 101 },
+                .malloced = false,
+            };
+            static struct class_Str string4e_e1671797c5 = {
+                .buf = &string4e_e1671797c5_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5beginning_e3587f6620_buf = {
+                .refcount = -1,
+                .data = (char[]){ 98,101,103,105,110,110,105,110,103 },
+                .malloced = false,
+            };
+            static struct class_Str string5beginning_e3587f6620 = {
+                .buf = &string5beginning_e3587f6620_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6end_7f021a1415_buf = {
+                .refcount = -1,
+                .data = (char[]){ 101,110,100 },
+                .malloced = false,
+            };
+            static struct class_Str string6end_7f021a1415 = {
+                .buf = &string6end_7f021a1415_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct class_Str var7;
+            var7.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var8;
+            var8 = NULL;
+
+            int64_t var9;
+            
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var11;
+            var11 = NULL;
+
+            int64_t var12;
+            
+            int64_t var13;
+            
+            struct class_Str var14;
+            var14.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var15;
+            var15 = NULL;
+
+            int64_t var16;
+            
+            struct class_Str var17;
+            var17.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var18;
+            var18 = NULL;
+
+            struct class_List_Str__d1ecbd3335* var19;
+            var19 = NULL;
+
+            struct class_Str var20;
+            var20.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0a_0cc175b9c0;
+                string_incref(var0);
+                string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string1b_92eb5ffee6;
+                string_incref(var1);
+                decref((var2), dtor_List_Str__d1ecbd3335);
+var2 = NULL;
+var2 = ctor_List_Str__d1ecbd3335();
+meth_List_Str__d1ecbd3335_push(var2,var0);
+meth_List_Str__d1ecbd3335_push(var2,var1);
+(void)0;
+var3 = 0LL;
+string_decref(var4);
+var4.buf = NULL;
+
+                var4 = string2c_4a8a08f09d;
+                string_incref(var4);
+                decref((var5), dtor_List_Str__d1ecbd3335);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+meth_List_Str__d1ecbd3335_insert(var5,var3,var4);
+(void)0;
+var6 = 3LL;
+string_decref(var7);
+var7.buf = NULL;
+
+                var7 = string3d_8277e0910d;
+                string_incref(var7);
+                decref((var8), dtor_List_Str__d1ecbd3335);
+var8 = NULL;
+var8 = var2;
+incref(var8);
+meth_List_Str__d1ecbd3335_insert(var8,var6,var7);
+(void)0;
+var9 = 1LL;
+string_decref(var10);
+var10.buf = NULL;
+
+                var10 = string4e_e1671797c5;
+                string_incref(var10);
+                decref((var11), dtor_List_Str__d1ecbd3335);
+var11 = NULL;
+var11 = var2;
+incref(var11);
+meth_List_Str__d1ecbd3335_insert(var11,var9,var10);
+(void)0;
+var12 = 2LL;
+(void)0;
+var13 = oomph_int_neg(var12);
+string_decref(var14);
+var14.buf = NULL;
+
+                var14 = string5beginning_e3587f6620;
+                string_incref(var14);
+                decref((var15), dtor_List_Str__d1ecbd3335);
+var15 = NULL;
+var15 = var2;
+incref(var15);
+meth_List_Str__d1ecbd3335_insert(var15,var13,var14);
+(void)0;
+var16 = 69LL;
+string_decref(var17);
+var17.buf = NULL;
+
+                var17 = string6end_7f021a1415;
+                string_incref(var17);
+                decref((var18), dtor_List_Str__d1ecbd3335);
+var18 = NULL;
+var18 = var2;
+incref(var18);
+meth_List_Str__d1ecbd3335_insert(var18,var16,var17);
+decref((var19), dtor_List_Str__d1ecbd3335);
+var19 = NULL;
+var19 = var2;
+incref(var19);
+string_decref(var20);
+var20.buf = NULL;
+var20 = meth_List_Str__d1ecbd3335_to_string(var19);
+oomph_print(var20);
+out: (void)0;
+string_decref(var20);
+decref((var19), dtor_List_Str__d1ecbd3335);
+decref((var18), dtor_List_Str__d1ecbd3335);
+string_decref(var17);
+(void)0;
+decref((var15), dtor_List_Str__d1ecbd3335);
+string_decref(var14);
+(void)0;
+(void)0;
+decref((var11), dtor_List_Str__d1ecbd3335);
+string_decref(var10);
+(void)0;
+decref((var8), dtor_List_Str__d1ecbd3335);
+string_decref(var7);
+(void)0;
+decref((var5), dtor_List_Str__d1ecbd3335);
+string_decref(var4);
+(void)0;
+decref((var2), dtor_List_Str__d1ecbd3335);
+string_decref(var1);
+string_decref(var0);
+}
@@ -0,0 +1,17 @@
+
+            #ifndef HEADER_GUARD_insert_02a3145832
+            #define HEADER_GUARD_insert_02a3145832
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,526 @@
+#include <lib/oomph.h>
+#include "join_and_split_e5be79bba4.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+
+            static struct StringBuf string0ll_5b54c0a045_buf = {
+                .refcount = -1,
+                .data = (char[]){ 108,108 },
+                .malloced = false,
+            };
+            static struct class_Str string0ll_5b54c0a045 = {
+                .buf = &string0ll_5b54c0a045_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1hello_world_5eb63bbbe0_buf = {
+                .refcount = -1,
+                .data = (char[]){ 104,101,108,108,111,32,119,111,114,108,100 },
+                .malloced = false,
+            };
+            static struct class_Str string1hello_world_5eb63bbbe0 = {
+                .buf = &string1hello_world_5eb63bbbe0_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2o_d956797521_buf = {
+                .refcount = -1,
+                .data = (char[]){ 111 },
+                .malloced = false,
+            };
+            static struct class_Str string2o_d956797521 = {
+                .buf = &string2o_d956797521_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3l_2db95e8e1a_buf = {
+                .refcount = -1,
+                .data = (char[]){ 108 },
+                .malloced = false,
+            };
+            static struct class_Str string3l_2db95e8e1a = {
+                .buf = &string3l_2db95e8e1a_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4x_9dd4e46126_buf = {
+                .refcount = -1,
+                .data = (char[]){ 120 },
+                .malloced = false,
+            };
+            static struct class_Str string4x_9dd4e46126 = {
+                .buf = &string4x_9dd4e46126_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string5_d41d8cd98f = {
+                .buf = &string5_d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97 },
+                .malloced = false,
+            };
+            static struct class_Str string6a_0cc175b9c0 = {
+                .buf = &string6a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7hell__86fe9b6467_buf = {
+                .refcount = -1,
+                .data = (char[]){ 104,101,108,108,195,182 },
+                .malloced = false,
+            };
+            static struct class_Str string7hell__86fe9b6467 = {
+                .buf = &string7hell__86fe9b6467_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var2;
+            var2 = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var6;
+            var6 = NULL;
+
+            struct class_Str var7;
+            var7.buf = NULL;
+
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            struct class_Str var9;
+            var9.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var10;
+            var10 = NULL;
+
+            struct class_Str var11;
+            var11.buf = NULL;
+
+            struct class_Str var12;
+            var12.buf = NULL;
+
+            struct class_Str var13;
+            var13.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var14;
+            var14 = NULL;
+
+            struct class_Str var15;
+            var15.buf = NULL;
+
+            struct class_Str var16;
+            var16.buf = NULL;
+
+            struct class_Str var17;
+            var17.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var18;
+            var18 = NULL;
+
+            struct class_Str var19;
+            var19.buf = NULL;
+
+            struct class_Str var20;
+            var20.buf = NULL;
+
+            struct class_Str var21;
+            var21.buf = NULL;
+
+            struct class_Str var22;
+            var22.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var23;
+            var23 = NULL;
+
+            struct class_Str var24;
+            var24.buf = NULL;
+
+            struct class_Str var25;
+            var25.buf = NULL;
+
+            struct class_Str var26;
+            var26.buf = NULL;
+
+            struct class_Str var27;
+            var27.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var28;
+            var28 = NULL;
+
+            struct class_Str var29;
+            var29.buf = NULL;
+
+            struct class_Str var30;
+            var30.buf = NULL;
+
+            struct class_Str var31;
+            var31.buf = NULL;
+
+            struct class_Str var32;
+            var32.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var33;
+            var33 = NULL;
+
+            struct class_Str var34;
+            var34.buf = NULL;
+
+            struct class_Str var35;
+            var35.buf = NULL;
+
+            struct class_Str var36;
+            var36.buf = NULL;
+
+            struct class_Str var37;
+            var37.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var38;
+            var38 = NULL;
+
+            struct class_Str var39;
+            var39.buf = NULL;
+
+            struct class_Str var40;
+            var40.buf = NULL;
+
+            struct class_Str var41;
+            var41.buf = NULL;
+
+            struct class_Str var42;
+            var42.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var43;
+            var43 = NULL;
+
+            struct class_Str var44;
+            var44.buf = NULL;
+
+            struct class_Str var45;
+            var45.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var46;
+            var46 = NULL;
+
+            struct class_Str var47;
+            var47.buf = NULL;
+
+            struct class_Str var48;
+            var48.buf = NULL;
+
+            struct class_Str var49;
+            var49.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var50;
+            var50 = NULL;
+
+            struct class_Str var51;
+            var51.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0ll_5b54c0a045;
+                string_incref(var0);
+                string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string1hello_world_5eb63bbbe0;
+                string_incref(var1);
+                decref((var2), dtor_List_Str__d1ecbd3335);
+var2 = NULL;
+var2 = meth_Str_split(var1,var0);
+string_decref(var3);
+var3.buf = NULL;
+var3 = meth_List_Str__d1ecbd3335_to_string(var2);
+oomph_print(var3);
+string_decref(var4);
+var4.buf = NULL;
+
+                var4 = string2o_d956797521;
+                string_incref(var4);
+                string_decref(var5);
+var5.buf = NULL;
+
+                var5 = string1hello_world_5eb63bbbe0;
+                string_incref(var5);
+                decref((var6), dtor_List_Str__d1ecbd3335);
+var6 = NULL;
+var6 = meth_Str_split(var5,var4);
+string_decref(var7);
+var7.buf = NULL;
+var7 = meth_List_Str__d1ecbd3335_to_string(var6);
+oomph_print(var7);
+string_decref(var8);
+var8.buf = NULL;
+
+                var8 = string3l_2db95e8e1a;
+                string_incref(var8);
+                string_decref(var9);
+var9.buf = NULL;
+
+                var9 = string1hello_world_5eb63bbbe0;
+                string_incref(var9);
+                decref((var10), dtor_List_Str__d1ecbd3335);
+var10 = NULL;
+var10 = meth_Str_split(var9,var8);
+string_decref(var11);
+var11.buf = NULL;
+var11 = meth_List_Str__d1ecbd3335_to_string(var10);
+oomph_print(var11);
+string_decref(var12);
+var12.buf = NULL;
+
+                var12 = string4x_9dd4e46126;
+                string_incref(var12);
+                string_decref(var13);
+var13.buf = NULL;
+
+                var13 = string1hello_world_5eb63bbbe0;
+                string_incref(var13);
+                decref((var14), dtor_List_Str__d1ecbd3335);
+var14 = NULL;
+var14 = meth_Str_split(var13,var12);
+string_decref(var15);
+var15.buf = NULL;
+var15 = meth_List_Str__d1ecbd3335_to_string(var14);
+oomph_print(var15);
+string_decref(var16);
+var16.buf = NULL;
+
+                var16 = string5_d41d8cd98f;
+                string_incref(var16);
+                string_decref(var17);
+var17.buf = NULL;
+
+                var17 = string1hello_world_5eb63bbbe0;
+                string_incref(var17);
+                decref((var18), dtor_List_Str__d1ecbd3335);
+var18 = NULL;
+var18 = meth_Str_split(var17,var16);
+string_decref(var19);
+var19.buf = NULL;
+var19 = meth_List_Str__d1ecbd3335_to_string(var18);
+oomph_print(var19);
+string_decref(var20);
+var20.buf = NULL;
+
+                var20 = string0ll_5b54c0a045;
+                string_incref(var20);
+                string_decref(var21);
+var21.buf = NULL;
+
+                var21 = string0ll_5b54c0a045;
+                string_incref(var21);
+                string_decref(var22);
+var22.buf = NULL;
+
+                var22 = string1hello_world_5eb63bbbe0;
+                string_incref(var22);
+                decref((var23), dtor_List_Str__d1ecbd3335);
+var23 = NULL;
+var23 = meth_Str_split(var22,var21);
+string_decref(var24);
+var24.buf = NULL;
+var24 = meth_List_Str__d1ecbd3335_join(var23,var20);
+oomph_print(var24);
+string_decref(var25);
+var25.buf = NULL;
+
+                var25 = string2o_d956797521;
+                string_incref(var25);
+                string_decref(var26);
+var26.buf = NULL;
+
+                var26 = string2o_d956797521;
+                string_incref(var26);
+                string_decref(var27);
+var27.buf = NULL;
+
+                var27 = string1hello_world_5eb63bbbe0;
+                string_incref(var27);
+                decref((var28), dtor_List_Str__d1ecbd3335);
+var28 = NULL;
+var28 = meth_Str_split(var27,var26);
+string_decref(var29);
+var29.buf = NULL;
+var29 = meth_List_Str__d1ecbd3335_join(var28,var25);
+oomph_print(var29);
+string_decref(var30);
+var30.buf = NULL;
+
+                var30 = string3l_2db95e8e1a;
+                string_incref(var30);
+                string_decref(var31);
+var31.buf = NULL;
+
+                var31 = string3l_2db95e8e1a;
+                string_incref(var31);
+                string_decref(var32);
+var32.buf = NULL;
+
+                var32 = string1hello_world_5eb63bbbe0;
+                string_incref(var32);
+                decref((var33), dtor_List_Str__d1ecbd3335);
+var33 = NULL;
+var33 = meth_Str_split(var32,var31);
+string_decref(var34);
+var34.buf = NULL;
+var34 = meth_List_Str__d1ecbd3335_join(var33,var30);
+oomph_print(var34);
+string_decref(var35);
+var35.buf = NULL;
+
+                var35 = string4x_9dd4e46126;
+                string_incref(var35);
+                string_decref(var36);
+var36.buf = NULL;
+
+                var36 = string4x_9dd4e46126;
+                string_incref(var36);
+                string_decref(var37);
+var37.buf = NULL;
+
+                var37 = string1hello_world_5eb63bbbe0;
+                string_incref(var37);
+                decref((var38), dtor_List_Str__d1ecbd3335);
+var38 = NULL;
+var38 = meth_Str_split(var37,var36);
+string_decref(var39);
+var39.buf = NULL;
+var39 = meth_List_Str__d1ecbd3335_join(var38,var35);
+oomph_print(var39);
+string_decref(var40);
+var40.buf = NULL;
+
+                var40 = string5_d41d8cd98f;
+                string_incref(var40);
+                string_decref(var41);
+var41.buf = NULL;
+
+                var41 = string5_d41d8cd98f;
+                string_incref(var41);
+                string_decref(var42);
+var42.buf = NULL;
+
+                var42 = string1hello_world_5eb63bbbe0;
+                string_incref(var42);
+                decref((var43), dtor_List_Str__d1ecbd3335);
+var43 = NULL;
+var43 = meth_Str_split(var42,var41);
+string_decref(var44);
+var44.buf = NULL;
+var44 = meth_List_Str__d1ecbd3335_join(var43,var40);
+oomph_print(var44);
+string_decref(var45);
+var45.buf = NULL;
+
+                var45 = string6a_0cc175b9c0;
+                string_incref(var45);
+                decref((var46), dtor_List_Str__d1ecbd3335);
+var46 = NULL;
+var46 = ctor_List_Str__d1ecbd3335();
+string_decref(var47);
+var47.buf = NULL;
+var47 = meth_List_Str__d1ecbd3335_join(var46,var45);
+oomph_print(var47);
+string_decref(var48);
+var48.buf = NULL;
+
+                var48 = string5_d41d8cd98f;
+                string_incref(var48);
+                string_decref(var49);
+var49.buf = NULL;
+
+                var49 = string7hell__86fe9b6467;
+                string_incref(var49);
+                decref((var50), dtor_List_Str__d1ecbd3335);
+var50 = NULL;
+var50 = meth_Str_split(var49,var48);
+string_decref(var51);
+var51.buf = NULL;
+var51 = meth_List_Str__d1ecbd3335_to_string(var50);
+oomph_print(var51);
+out: (void)0;
+string_decref(var51);
+decref((var50), dtor_List_Str__d1ecbd3335);
+string_decref(var49);
+string_decref(var48);
+string_decref(var47);
+decref((var46), dtor_List_Str__d1ecbd3335);
+string_decref(var45);
+string_decref(var44);
+decref((var43), dtor_List_Str__d1ecbd3335);
+string_decref(var42);
+string_decref(var41);
+string_decref(var40);
+string_decref(var39);
+decref((var38), dtor_List_Str__d1ecbd3335);
+string_decref(var37);
+string_decref(var36);
+string_decref(var35);
+string_decref(var34);
+decref((var33), dtor_List_Str__d1ecbd3335);
+string_decref(var32);
+string_decref(var31);
+string_decref(var30);
+string_decref(var29);
+decref((var28), dtor_List_Str__d1ecbd3335);
+string_decref(var27);
+string_decref(var26);
+string_decref(var25);
+string_decref(var24);
+decref((var23), dtor_List_Str__d1ecbd3335);
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+string_decref(var19);
+decref((var18), dtor_List_Str__d1ecbd3335);
+string_decref(var17);
+string_decref(var16);
+string_decref(var15);
+decref((var14), dtor_List_Str__d1ecbd3335);
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+decref((var10), dtor_List_Str__d1ecbd3335);
+string_decref(var9);
+string_decref(var8);
+string_decref(var7);
+decref((var6), dtor_List_Str__d1ecbd3335);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+decref((var2), dtor_List_Str__d1ecbd3335);
+string_decref(var1);
+string_decref(var0);
+}
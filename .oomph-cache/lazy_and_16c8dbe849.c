@@ -0,0 +1,179 @@
+#include <lib/oomph.h>
+#include "lazy_and_16c8dbe849.h"
+#include "builtins_8da1dac06a.h"
+bool lazy_and_16c8dbe849_foo(int64_t var0){
+            int64_t var1;
+            
+            int64_t var2;
+            
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            bool var4;
+            
+            bool retval;
+            var1 = var0;
+(void)0;
+(void)0;
+var2 = var1;
+(void)0;
+string_decref(var3);
+var3.buf = NULL;
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+(void)0;
+var4 = oomph_true;
+(void)0;
+
+                        (void)0;
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+(void)0;
+string_decref(var3);
+(void)0;
+(void)0;
+return retval;
+}
+void oomph_main(void){
+            bool var0;
+            
+            bool var1;
+            
+            bool var2;
+            
+            int64_t var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            bool var13;
+            
+            bool var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            int64_t var17;
+            
+            bool var18;
+            
+            bool var19;
+            (void)0;
+var0 = oomph_true;
+(void)0;
+(void)0;
+
+                if (var0)
+                    goto label0;
+                var1 = oomph_false;
+(void)0;
+var2 = oomph_true;
+
+                if (var2)
+                    goto label1;
+                label0: (void)0;
+(void)0;
+var3 = 1LL;
+(void)0;
+var4 = lazy_and_16c8dbe849_foo(var3);
+var1 = var4;
+label1: (void)0;
+(void)0;
+var5 = oomph_false;
+(void)0;
+(void)0;
+
+                if (var5)
+                    goto label2;
+                var6 = oomph_false;
+(void)0;
+var7 = oomph_true;
+
+                if (var7)
+                    goto label3;
+                label2: (void)0;
+(void)0;
+var8 = 2LL;
+(void)0;
+var9 = lazy_and_16c8dbe849_foo(var8);
+var6 = var9;
+label3: (void)0;
+(void)0;
+var10 = oomph_true;
+(void)0;
+(void)0;
+
+                if (var10)
+                    goto label4;
+                (void)0;
+var12 = 3LL;
+(void)0;
+var13 = lazy_and_16c8dbe849_foo(var12);
+var11 = var13;
+(void)0;
+var14 = oomph_true;
+
+                if (var14)
+                    goto label5;
+                label4: (void)0;
+var11 = oomph_true;
+label5: (void)0;
+(void)0;
+var15 = oomph_false;
+(void)0;
+(void)0;
+
+                if (var15)
+                    goto label6;
+                (void)0;
+var17 = 4LL;
+(void)0;
+var18 = lazy_and_16c8dbe849_foo(var17);
+var16 = var18;
+(void)0;
+var19 = oomph_true;
+
+                if (var19)
+                    goto label7;
+                label6: (void)0;
+var16 = oomph_true;
+label7: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_lazy_and_16c8dbe849
+            #define HEADER_GUARD_lazy_and_16c8dbe849
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+bool lazy_and_16c8dbe849_foo(int64_t var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,193 @@
+#include <lib/oomph.h>
+#include "list_delete_79eddf0cf8.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+
+            static struct StringBuf string0a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97 },
+                .malloced = false,
+            };
+            static struct class_Str string0a_0cc175b9c0 = {
+                .buf = &string0a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ 98 },
+                .malloced = false,
+            };
+            static struct class_Str string1b_92eb5ffee6 = {
+                .buf = &string1b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2c_4a8a08f09d_buf = {
+                .refcount = -1,
+                .data = (char[]){ 99 },
+                .malloced = false,
+            };
+            static struct class_Str string2c_4a8a08f09d = {
+                .buf = &string2c_4a8a08f09d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3Deleted___6c99798573_buf = {
+                .refcount = -1,
+                .data = (char[]){ 68,101,108,101,116,101,100,58,32 },
+                .malloced = false,
+            };
+            static struct class_Str string3Deleted___6c99798573 = {
+                .buf = &string3Deleted___6c99798573_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var3;
+            var3 = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            int64_t var5;
+            
+            struct class_List_Str__d1ecbd3335* var6;
+            var6 = NULL;
+
+            struct class_Str var7;
+            var7.buf = NULL;
+
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var9;
+            var9 = NULL;
+
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            struct class_Str var11;
+            var11.buf = NULL;
+
+            int64_t var12;
+            
+            struct class_List_Str__d1ecbd3335* var13;
+            var13 = NULL;
+
+            struct class_Str var14;
+            var14.buf = NULL;
+
+            struct class_Str var15;
+            var15.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var16;
+            var16 = NULL;
+
+            struct class_Str var17;
+            var17.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0a_0cc175b9c0;
+                string_incref(var0);
+                string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string1b_92eb5ffee6;
+                string_incref(var1);
+                string_decref(var2);
+var2.buf = NULL;
+
+                var2 = string2c_4a8a08f09d;
+                string_incref(var2);
+                decref((var3), dtor_List_Str__d1ecbd3335);
+var3 = NULL;
+var3 = ctor_List_Str__d1ecbd3335();
+meth_List_Str__d1ecbd3335_push(var3,var0);
+meth_List_Str__d1ecbd3335_push(var3,var1);
+meth_List_Str__d1ecbd3335_push(var3,var2);
+string_decref(var4);
+var4.buf = NULL;
+
+                var4 = string3Deleted___6c99798573;
+                string_incref(var4);
+                (void)0;
+var5 = 0LL;
+decref((var6), dtor_List_Str__d1ecbd3335);
+var6 = NULL;
+var6 = var3;
+incref(var6);
+string_decref(var7);
+var7.buf = NULL;
+var7 = meth_List_Str__d1ecbd3335_delete_at_index(var6,var5);
+string_decref(var8);
+var8.buf = NULL;
+var8 = oomph_string_concat(var4,var7);
+oomph_print(var8);
+decref((var9), dtor_List_Str__d1ecbd3335);
+var9 = NULL;
+var9 = var3;
+incref(var9);
+string_decref(var10);
+var10.buf = NULL;
+var10 = meth_List_Str__d1ecbd3335_to_string(var9);
+oomph_print(var10);
+string_decref(var11);
+var11.buf = NULL;
+
+                var11 = string3Deleted___6c99798573;
+                string_incref(var11);
+                (void)0;
+var12 = 1LL;
+decref((var13), dtor_List_Str__d1ecbd3335);
+var13 = NULL;
+var13 = var3;
+incref(var13);
+string_decref(var14);
+var14.buf = NULL;
+var14 = meth_List_Str__d1ecbd3335_delete_at_index(var13,var12);
+string_decref(var15);
+var15.buf = NULL;
+var15 = oomph_string_concat(var11,var14);
+oomph_print(var15);
+decref((var16), dtor_List_Str__d1ecbd3335);
+var16 = NULL;
+var16 = var3;
+incref(var16);
+string_decref(var17);
+var17.buf = NULL;
+var17 = meth_List_Str__d1ecbd3335_to_string(var16);
+oomph_print(var17);
+out: (void)0;
+string_decref(var17);
+decref((var16), dtor_List_Str__d1ecbd3335);
+string_decref(var15);
+string_decref(var14);
+decref((var13), dtor_List_Str__d1ecbd3335);
+(void)0;
+string_decref(var11);
+string_decref(var10);
+decref((var9), dtor_List_Str__d1ecbd3335);
+string_decref(var8);
+string_decref(var7);
+decref((var6), dtor_List_Str__d1ecbd3335);
+(void)0;
+string_decref(var4);
+decref((var3), dtor_List_Str__d1ecbd3335);
+string_decref(var2);
+string_decref(var1);
+string_decref(var0);
+}
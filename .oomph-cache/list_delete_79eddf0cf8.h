@@ -0,0 +1,15 @@
+
+            #ifndef HEADER_GUARD_list_delete_79eddf0cf8
+            #define HEADER_GUARD_list_delete_79eddf0cf8
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+struct class_List_Str__d1ecbd3335;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,516 @@
+#include <lib/oomph.h>
+#include "list_e1ed406dfc.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__ca8c9dc13d.h"
+void oomph_main(void){
+            struct class_List_Int__ca8c9dc13d* var0;
+            var0 = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var1;
+            var1 = NULL;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var3;
+            var3 = NULL;
+
+            int64_t var4;
+            
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            int64_t var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            int64_t var11;
+            
+            int64_t var12;
+            
+            int64_t var13;
+            
+            struct class_List_Int__ca8c9dc13d* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            int64_t var16;
+            
+            int64_t var17;
+            
+            bool var18;
+            
+            struct class_List_Int__ca8c9dc13d* var19;
+            var19 = NULL;
+
+            struct class_Str var20;
+            var20.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var21;
+            var21 = NULL;
+
+            int64_t var22;
+            
+            struct class_Str var23;
+            var23.buf = NULL;
+
+            int64_t var24;
+            
+            int64_t var25;
+            
+            struct class_List_Int__ca8c9dc13d* var26;
+            var26 = NULL;
+
+            int64_t var27;
+            
+            bool var28;
+            
+            bool var29;
+            
+            int64_t var30;
+            
+            struct class_List_Int__ca8c9dc13d* var31;
+            var31 = NULL;
+
+            int64_t var32;
+            
+            struct class_Str var33;
+            var33.buf = NULL;
+
+            int64_t var34;
+            
+            int64_t var35;
+            
+            int64_t var36;
+            
+            bool var37;
+            
+            struct class_List_Int__ca8c9dc13d* var38;
+            var38 = NULL;
+
+            struct class_Str var39;
+            var39.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var40;
+            var40 = NULL;
+
+            int64_t var41;
+            
+            struct class_Str var42;
+            var42.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var43;
+            var43 = NULL;
+
+            int64_t var44;
+            
+            struct class_Str var45;
+            var45.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var46;
+            var46 = NULL;
+
+            struct class_Str var47;
+            var47.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var48;
+            var48 = NULL;
+
+            int64_t var49;
+            
+            struct class_List_Int__ca8c9dc13d* var50;
+            var50 = NULL;
+
+            int64_t var51;
+            
+            struct class_List_Int__ca8c9dc13d* var52;
+            var52 = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var53;
+            var53 = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var54;
+            var54 = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var55;
+            var55 = NULL;
+
+            struct class_Str var56;
+            var56.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var57;
+            var57 = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var58;
+            var58 = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var59;
+            var59 = NULL;
+
+            struct class_Str var60;
+            var60.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var61;
+            var61 = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var62;
+            var62 = NULL;
+
+            struct class_Str var63;
+            var63.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var64;
+            var64 = NULL;
+
+            struct class_Str var65;
+            var65.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var66;
+            var66 = NULL;
+
+            int64_t var67;
+            
+            struct class_Str var68;
+            var68.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var69;
+            var69 = NULL;
+
+            struct class_Str var70;
+            var70.buf = NULL;
+decref((var0), dtor_List_Int__ca8c9dc13d);
+var0 = NULL;
+var0 = ctor_List_Int__ca8c9dc13d();
+decref((var1), dtor_List_Int__ca8c9dc13d);
+var1 = NULL;
+var1 = var0;
+incref(var1);
+string_decref(var2);
+var2.buf = NULL;
+var2 = meth_List_Int__ca8c9dc13d_to_string(var1);
+oomph_print(var2);
+decref((var3), dtor_List_Int__ca8c9dc13d);
+var3 = NULL;
+var3 = var0;
+incref(var3);
+(void)0;
+var4 = meth_List_Int__ca8c9dc13d_length(var3);
+string_decref(var5);
+var5.buf = NULL;
+var5 = meth_Int_to_string(var4);
+oomph_print(var5);
+(void)0;
+var6 = 0LL;
+label0: (void)0;
+(void)0;
+var7 = var6;
+(void)0;
+(void)0;
+var8 = 10LL;
+(void)0;
+var9 = oomph_int_gt(var8,var7);
+(void)0;
+var10 = oomph_bool_not(var9);
+
+                if (var10)
+                    goto label1;
+                (void)0;
+var11 = 100LL;
+(void)0;
+var12 = var6;
+(void)0;
+(void)0;
+var13 = oomph_int_add(var11,var12);
+decref((var14), dtor_List_Int__ca8c9dc13d);
+var14 = NULL;
+var14 = var0;
+incref(var14);
+meth_List_Int__ca8c9dc13d_push(var14,var13);
+label2: (void)0;
+(void)0;
+var15 = var6;
+(void)0;
+(void)0;
+var16 = 1LL;
+(void)0;
+var17 = oomph_int_add(var15,var16);
+(void)0;
+var6 = var17;
+(void)0;
+(void)0;
+var18 = oomph_true;
+
+                if (var18)
+                    goto label0;
+                label1: (void)0;
+decref((var19), dtor_List_Int__ca8c9dc13d);
+var19 = NULL;
+var19 = var0;
+incref(var19);
+string_decref(var20);
+var20.buf = NULL;
+var20 = meth_List_Int__ca8c9dc13d_to_string(var19);
+oomph_print(var20);
+decref((var21), dtor_List_Int__ca8c9dc13d);
+var21 = NULL;
+var21 = var0;
+incref(var21);
+(void)0;
+var22 = meth_List_Int__ca8c9dc13d_length(var21);
+string_decref(var23);
+var23.buf = NULL;
+var23 = meth_Int_to_string(var22);
+oomph_print(var23);
+(void)0;
+var24 = 0LL;
+label3: (void)0;
+(void)0;
+var25 = var24;
+(void)0;
+decref((var26), dtor_List_Int__ca8c9dc13d);
+var26 = NULL;
+var26 = var0;
+incref(var26);
+(void)0;
+var27 = meth_List_Int__ca8c9dc13d_length(var26);
+(void)0;
+var28 = oomph_int_gt(var27,var25);
+(void)0;
+var29 = oomph_bool_not(var28);
+
+                if (var29)
+                    goto label4;
+                (void)0;
+var30 = var24;
+(void)0;
+decref((var31), dtor_List_Int__ca8c9dc13d);
+var31 = NULL;
+var31 = var0;
+incref(var31);
+(void)0;
+var32 = meth_List_Int__ca8c9dc13d_get(var31,var30);
+string_decref(var33);
+var33.buf = NULL;
+var33 = meth_Int_to_string(var32);
+oomph_print(var33);
+label5: (void)0;
+(void)0;
+var34 = var24;
+(void)0;
+(void)0;
+var35 = 1LL;
+(void)0;
+var36 = oomph_int_add(var34,var35);
+(void)0;
+var24 = var36;
+(void)0;
+(void)0;
+var37 = oomph_true;
+
+                if (var37)
+                    goto label3;
+                label4: (void)0;
+decref((var38), dtor_List_Int__ca8c9dc13d);
+var38 = NULL;
+var38 = var0;
+incref(var38);
+string_decref(var39);
+var39.buf = NULL;
+var39 = meth_List_Int__ca8c9dc13d_to_string(var38);
+oomph_print(var39);
+decref((var40), dtor_List_Int__ca8c9dc13d);
+var40 = NULL;
+var40 = var0;
+incref(var40);
+(void)0;
+var41 = meth_List_Int__ca8c9dc13d_first(var40);
+string_decref(var42);
+var42.buf = NULL;
+var42 = meth_Int_to_string(var41);
+oomph_print(var42);
+decref((var43), dtor_List_Int__ca8c9dc13d);
+var43 = NULL;
+var43 = var0;
+incref(var43);
+(void)0;
+var44 = meth_List_Int__ca8c9dc13d_last(var43);
+string_decref(var45);
+var45.buf = NULL;
+var45 = meth_Int_to_string(var44);
+oomph_print(var45);
+decref((var46), dtor_List_Int__ca8c9dc13d);
+var46 = NULL;
+var46 = var0;
+incref(var46);
+string_decref(var47);
+var47.buf = NULL;
+var47 = meth_List_Int__ca8c9dc13d_to_string(var46);
+oomph_print(var47);
+decref((var48), dtor_List_Int__ca8c9dc13d);
+var48 = NULL;
+var48 = ctor_List_Int__ca8c9dc13d();
+(void)0;
+var49 = 69LL;
+decref((var50), dtor_List_Int__ca8c9dc13d);
+var50 = NULL;
+var50 = var48;
+incref(var50);
+meth_List_Int__ca8c9dc13d_push(var50,var49);
+(void)0;
+var51 = 123LL;
+decref((var52), dtor_List_Int__ca8c9dc13d);
+var52 = NULL;
+var52 = var48;
+incref(var52);
+meth_List_Int__ca8c9dc13d_push(var52,var51);
+decref((var53), dtor_List_Int__ca8c9dc13d);
+var53 = NULL;
+var53 = var48;
+incref(var53);
+decref((var54), dtor_List_Int__ca8c9dc13d);
+var54 = NULL;
+var54 = var0;
+incref(var54);
+meth_List_Int__ca8c9dc13d_push_all(var54,var53);
+decref((var55), dtor_List_Int__ca8c9dc13d);
+var55 = NULL;
+var55 = var0;
+incref(var55);
+string_decref(var56);
+var56.buf = NULL;
+var56 = meth_List_Int__ca8c9dc13d_to_string(var55);
+oomph_print(var56);
+decref((var57), dtor_List_Int__ca8c9dc13d);
+var57 = NULL;
+var57 = var48;
+incref(var57);
+decref((var58), dtor_List_Int__ca8c9dc13d);
+var58 = NULL;
+var58 = var48;
+incref(var58);
+meth_List_Int__ca8c9dc13d_push_all(var58,var57);
+decref((var59), dtor_List_Int__ca8c9dc13d);
+var59 = NULL;
+var59 = var48;
+incref(var59);
+string_decref(var60);
+var60.buf = NULL;
+var60 = meth_List_Int__ca8c9dc13d_to_string(var59);
+oomph_print(var60);
+decref((var61), dtor_List_Int__ca8c9dc13d);
+var61 = NULL;
+var61 = var48;
+incref(var61);
+decref((var62), dtor_List_Int__ca8c9dc13d);
+var62 = NULL;
+var62 = meth_List_Int__ca8c9dc13d_reversed(var61);
+string_decref(var63);
+var63.buf = NULL;
+var63 = meth_List_Int__ca8c9dc13d_to_string(var62);
+oomph_print(var63);
+decref((var64), dtor_List_Int__ca8c9dc13d);
+var64 = NULL;
+var64 = var48;
+incref(var64);
+string_decref(var65);
+var65.buf = NULL;
+var65 = meth_List_Int__ca8c9dc13d_to_string(var64);
+oomph_print(var65);
+decref((var66), dtor_List_Int__ca8c9dc13d);
+var66 = NULL;
+var66 = var48;
+incref(var66);
+(void)0;
+var67 = meth_List_Int__ca8c9dc13d_pop(var66);
+string_decref(var68);
+var68.buf = NULL;
+var68 = meth_Int_to_string(var67);
+oomph_print(var68);
+decref((var69), dtor_List_Int__ca8c9dc13d);
+var69 = NULL;
+var69 = var48;
+incref(var69);
+string_decref(var70);
+var70.buf = NULL;
+var70 = meth_List_Int__ca8c9dc13d_to_string(var69);
+oomph_print(var70);
+out: (void)0;
+string_decref(var70);
+decref((var69), dtor_List_Int__ca8c9dc13d);
+string_decref(var68);
+(void)0;
+decref((var66), dtor_List_Int__ca8c9dc13d);
+string_decref(var65);
+decref((var64), dtor_List_Int__ca8c9dc13d);
+string_decref(var63);
+decref((var62), dtor_List_Int__ca8c9dc13d);
+decref((var61), dtor_List_Int__ca8c9dc13d);
+string_decref(var60);
+decref((var59), dtor_List_Int__ca8c9dc13d);
+decref((var58), dtor_List_Int__ca8c9dc13d);
+decref((var57), dtor_List_Int__ca8c9dc13d);
+string_decref(var56);
+decref((var55), dtor_List_Int__ca8c9dc13d);
+decref((var54), dtor_List_Int__ca8c9dc13d);
+decref((var53), dtor_List_Int__ca8c9dc13d);
+decref((var52), dtor_List_Int__ca8c9dc13d);
+(void)0;
+decref((var50), dtor_List_Int__ca8c9dc13d);
+(void)0;
+decref((var48), dtor_List_Int__ca8c9dc13d);
+string_decref(var47);
+decref((var46), dtor_List_Int__ca8c9dc13d);
+string_decref(var45);
+(void)0;
+decref((var43), dtor_List_Int__ca8c9dc13d);
+string_decref(var42);
+(void)0;
+decref((var40), dtor_List_Int__ca8c9dc13d);
+string_decref(var39);
+decref((var38), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var33);
+(void)0;
+decref((var31), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var26), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+string_decref(var23);
+(void)0;
+decref((var21), dtor_List_Int__ca8c9dc13d);
+string_decref(var20);
+decref((var19), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var14), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var5);
+(void)0;
+decref((var3), dtor_List_Int__ca8c9dc13d);
+string_decref(var2);
+decref((var1), dtor_List_Int__ca8c9dc13d);
+decref((var0), dtor_List_Int__ca8c9dc13d);
+}
@@ -0,0 +1,231 @@
+#include <lib/oomph.h>
+#include "list_equal_94414e22e8.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__ca8c9dc13d.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            struct class_List_Int__ca8c9dc13d* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            struct class_List_Int__ca8c9dc13d* var5;
+            var5 = NULL;
+
+            bool var6;
+            
+            struct class_Str var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            int64_t var9;
+            
+            struct class_List_Int__ca8c9dc13d* var10;
+            var10 = NULL;
+
+            int64_t var11;
+            
+            int64_t var12;
+            
+            struct class_List_Int__ca8c9dc13d* var13;
+            var13 = NULL;
+
+            bool var14;
+            
+            struct class_Str var15;
+            var15.buf = NULL;
+
+            int64_t var16;
+            
+            int64_t var17;
+            
+            struct class_List_Int__ca8c9dc13d* var18;
+            var18 = NULL;
+
+            int64_t var19;
+            
+            int64_t var20;
+            
+            int64_t var21;
+            
+            struct class_List_Int__ca8c9dc13d* var22;
+            var22 = NULL;
+
+            bool var23;
+            
+            struct class_Str var24;
+            var24.buf = NULL;
+
+            int64_t var25;
+            
+            int64_t var26;
+            
+            struct class_List_Int__ca8c9dc13d* var27;
+            var27 = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var28;
+            var28 = NULL;
+
+            bool var29;
+            
+            struct class_Str var30;
+            var30.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var31;
+            var31 = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var32;
+            var32 = NULL;
+
+            bool var33;
+            
+            struct class_Str var34;
+            var34.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+decref((var2), dtor_List_Int__ca8c9dc13d);
+var2 = NULL;
+var2 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var2,var0);
+meth_List_Int__ca8c9dc13d_push(var2,var1);
+(void)0;
+var3 = 1LL;
+(void)0;
+var4 = 2LL;
+decref((var5), dtor_List_Int__ca8c9dc13d);
+var5 = NULL;
+var5 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var5,var3);
+meth_List_Int__ca8c9dc13d_push(var5,var4);
+(void)0;
+var6 = meth_List_Int__ca8c9dc13d_equals(var2,var5);
+string_decref(var7);
+var7.buf = NULL;
+var7 = meth_Bool_to_string(var6);
+oomph_print(var7);
+(void)0;
+var8 = 1LL;
+(void)0;
+var9 = 2LL;
+decref((var10), dtor_List_Int__ca8c9dc13d);
+var10 = NULL;
+var10 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var10,var8);
+meth_List_Int__ca8c9dc13d_push(var10,var9);
+(void)0;
+var11 = 2LL;
+(void)0;
+var12 = 2LL;
+decref((var13), dtor_List_Int__ca8c9dc13d);
+var13 = NULL;
+var13 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var13,var11);
+meth_List_Int__ca8c9dc13d_push(var13,var12);
+(void)0;
+var14 = meth_List_Int__ca8c9dc13d_equals(var10,var13);
+string_decref(var15);
+var15.buf = NULL;
+var15 = meth_Bool_to_string(var14);
+oomph_print(var15);
+(void)0;
+var16 = 1LL;
+(void)0;
+var17 = 2LL;
+decref((var18), dtor_List_Int__ca8c9dc13d);
+var18 = NULL;
+var18 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var18,var16);
+meth_List_Int__ca8c9dc13d_push(var18,var17);
+(void)0;
+var19 = 1LL;
+(void)0;
+var20 = 2LL;
+(void)0;
+var21 = 3LL;
+decref((var22), dtor_List_Int__ca8c9dc13d);
+var22 = NULL;
+var22 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var22,var19);
+meth_List_Int__ca8c9dc13d_push(var22,var20);
+meth_List_Int__ca8c9dc13d_push(var22,var21);
+(void)0;
+var23 = meth_List_Int__ca8c9dc13d_equals(var18,var22);
+string_decref(var24);
+var24.buf = NULL;
+var24 = meth_Bool_to_string(var23);
+oomph_print(var24);
+(void)0;
+var25 = 1LL;
+(void)0;
+var26 = 2LL;
+decref((var27), dtor_List_Int__ca8c9dc13d);
+var27 = NULL;
+var27 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var27,var25);
+meth_List_Int__ca8c9dc13d_push(var27,var26);
+decref((var28), dtor_List_Int__ca8c9dc13d);
+var28 = NULL;
+var28 = ctor_List_Int__ca8c9dc13d();
+(void)0;
+var29 = meth_List_Int__ca8c9dc13d_equals(var27,var28);
+string_decref(var30);
+var30.buf = NULL;
+var30 = meth_Bool_to_string(var29);
+oomph_print(var30);
+decref((var31), dtor_List_Int__ca8c9dc13d);
+var31 = NULL;
+var31 = ctor_List_Int__ca8c9dc13d();
+decref((var32), dtor_List_Int__ca8c9dc13d);
+var32 = NULL;
+var32 = ctor_List_Int__ca8c9dc13d();
+(void)0;
+var33 = meth_List_Int__ca8c9dc13d_equals(var31,var32);
+string_decref(var34);
+var34.buf = NULL;
+var34 = meth_Bool_to_string(var33);
+oomph_print(var34);
+out: (void)0;
+string_decref(var34);
+(void)0;
+decref((var32), dtor_List_Int__ca8c9dc13d);
+decref((var31), dtor_List_Int__ca8c9dc13d);
+string_decref(var30);
+(void)0;
+decref((var28), dtor_List_Int__ca8c9dc13d);
+decref((var27), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+string_decref(var24);
+(void)0;
+decref((var22), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+(void)0;
+decref((var18), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+string_decref(var15);
+(void)0;
+decref((var13), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+decref((var10), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+string_decref(var7);
+(void)0;
+decref((var5), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+decref((var2), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+}
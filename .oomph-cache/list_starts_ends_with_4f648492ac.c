@@ -0,0 +1,366 @@
+#include <lib/oomph.h>
+#include "list_starts_ends_with_4f648492ac.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__ca8c9dc13d.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            struct class_List_Int__ca8c9dc13d* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            struct class_List_Int__ca8c9dc13d* var5;
+            var5 = NULL;
+
+            bool var6;
+            
+            struct class_Str var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            struct class_List_Int__ca8c9dc13d* var9;
+            var9 = NULL;
+
+            int64_t var10;
+            
+            int64_t var11;
+            
+            struct class_List_Int__ca8c9dc13d* var12;
+            var12 = NULL;
+
+            bool var13;
+            
+            struct class_Str var14;
+            var14.buf = NULL;
+
+            int64_t var15;
+            
+            struct class_List_Int__ca8c9dc13d* var16;
+            var16 = NULL;
+
+            int64_t var17;
+            
+            int64_t var18;
+            
+            struct class_List_Int__ca8c9dc13d* var19;
+            var19 = NULL;
+
+            bool var20;
+            
+            struct class_Str var21;
+            var21.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var22;
+            var22 = NULL;
+
+            int64_t var23;
+            
+            int64_t var24;
+            
+            struct class_List_Int__ca8c9dc13d* var25;
+            var25 = NULL;
+
+            bool var26;
+            
+            struct class_Str var27;
+            var27.buf = NULL;
+
+            int64_t var28;
+            
+            int64_t var29;
+            
+            struct class_List_Int__ca8c9dc13d* var30;
+            var30 = NULL;
+
+            int64_t var31;
+            
+            int64_t var32;
+            
+            struct class_List_Int__ca8c9dc13d* var33;
+            var33 = NULL;
+
+            bool var34;
+            
+            struct class_Str var35;
+            var35.buf = NULL;
+
+            int64_t var36;
+            
+            struct class_List_Int__ca8c9dc13d* var37;
+            var37 = NULL;
+
+            int64_t var38;
+            
+            int64_t var39;
+            
+            struct class_List_Int__ca8c9dc13d* var40;
+            var40 = NULL;
+
+            bool var41;
+            
+            struct class_Str var42;
+            var42.buf = NULL;
+
+            int64_t var43;
+            
+            struct class_List_Int__ca8c9dc13d* var44;
+            var44 = NULL;
+
+            int64_t var45;
+            
+            int64_t var46;
+            
+            struct class_List_Int__ca8c9dc13d* var47;
+            var47 = NULL;
+
+            bool var48;
+            
+            struct class_Str var49;
+            var49.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var50;
+            var50 = NULL;
+
+            int64_t var51;
+            
+            int64_t var52;
+            
+            struct class_List_Int__ca8c9dc13d* var53;
+            var53 = NULL;
+
+            bool var54;
+            
+            struct class_Str var55;
+            var55.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+decref((var2), dtor_List_Int__ca8c9dc13d);
+var2 = NULL;
+var2 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var2,var0);
+meth_List_Int__ca8c9dc13d_push(var2,var1);
+(void)0;
+var3 = 1LL;
+(void)0;
+var4 = 2LL;
+decref((var5), dtor_List_Int__ca8c9dc13d);
+var5 = NULL;
+var5 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var5,var3);
+meth_List_Int__ca8c9dc13d_push(var5,var4);
+(void)0;
+var6 = meth_List_Int__ca8c9dc13d_starts_with(var5,var2);
+string_decref(var7);
+var7.buf = NULL;
+var7 = meth_Bool_to_string(var6);
+oomph_print(var7);
+(void)0;
+var8 = 1LL;
+decref((var9), dtor_List_Int__ca8c9dc13d);
+var9 = NULL;
+var9 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var9,var8);
+(void)0;
+var10 = 1LL;
+(void)0;
+var11 = 2LL;
+decref((var12), dtor_List_Int__ca8c9dc13d);
+var12 = NULL;
+var12 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var12,var10);
+meth_List_Int__ca8c9dc13d_push(var12,var11);
+(void)0;
+var13 = meth_List_Int__ca8c9dc13d_starts_with(var12,var9);
+string_decref(var14);
+var14.buf = NULL;
+var14 = meth_Bool_to_string(var13);
+oomph_print(var14);
+(void)0;
+var15 = 2LL;
+decref((var16), dtor_List_Int__ca8c9dc13d);
+var16 = NULL;
+var16 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var16,var15);
+(void)0;
+var17 = 1LL;
+(void)0;
+var18 = 2LL;
+decref((var19), dtor_List_Int__ca8c9dc13d);
+var19 = NULL;
+var19 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var19,var17);
+meth_List_Int__ca8c9dc13d_push(var19,var18);
+(void)0;
+var20 = meth_List_Int__ca8c9dc13d_starts_with(var19,var16);
+string_decref(var21);
+var21.buf = NULL;
+var21 = meth_Bool_to_string(var20);
+oomph_print(var21);
+decref((var22), dtor_List_Int__ca8c9dc13d);
+var22 = NULL;
+var22 = ctor_List_Int__ca8c9dc13d();
+(void)0;
+var23 = 1LL;
+(void)0;
+var24 = 2LL;
+decref((var25), dtor_List_Int__ca8c9dc13d);
+var25 = NULL;
+var25 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var25,var23);
+meth_List_Int__ca8c9dc13d_push(var25,var24);
+(void)0;
+var26 = meth_List_Int__ca8c9dc13d_starts_with(var25,var22);
+string_decref(var27);
+var27.buf = NULL;
+var27 = meth_Bool_to_string(var26);
+oomph_print(var27);
+(void)0;
+var28 = 1LL;
+(void)0;
+var29 = 2LL;
+decref((var30), dtor_List_Int__ca8c9dc13d);
+var30 = NULL;
+var30 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var30,var28);
+meth_List_Int__ca8c9dc13d_push(var30,var29);
+(void)0;
+var31 = 1LL;
+(void)0;
+var32 = 2LL;
+decref((var33), dtor_List_Int__ca8c9dc13d);
+var33 = NULL;
+var33 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var33,var31);
+meth_List_Int__ca8c9dc13d_push(var33,var32);
+(void)0;
+var34 = meth_List_Int__ca8c9dc13d_ends_with(var33,var30);
+string_decref(var35);
+var35.buf = NULL;
+var35 = meth_Bool_to_string(var34);
+oomph_print(var35);
+(void)0;
+var36 = 1LL;
+decref((var37), dtor_List_Int__ca8c9dc13d);
+var37 = NULL;
+var37 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var37,var36);
+(void)0;
+var38 = 1LL;
+(void)0;
+var39 = 2LL;
+decref((var40), dtor_List_Int__ca8c9dc13d);
+var40 = NULL;
+var40 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var40,var38);
+meth_List_Int__ca8c9dc13d_push(var40,var39);
+(void)0;
+var41 = meth_List_Int__ca8c9dc13d_ends_with(var40,var37);
+string_decref(var42);
+var42.buf = NULL;
+var42 = meth_Bool_to_string(var41);
+oomph_print(var42);
+(void)0;
+var43 = 2LL;
+decref((var44), dtor_List_Int__ca8c9dc13d);
+var44 = NULL;
+var44 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var44,var43);
+(void)0;
+var45 = 1LL;
+(void)0;
+var46 = 2LL;
+decref((var47), dtor_List_Int__ca8c9dc13d);
+var47 = NULL;
+var47 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var47,var45);
+meth_List_Int__ca8c9dc13d_push(var47,var46);
+(void)0;
+var48 = meth_List_Int__ca8c9dc13d_ends_with(var47,var44);
+string_decref(var49);
+var49.buf = NULL;
+var49 = meth_Bool_to_string(var48);
+oomph_print(var49);
+decref((var50), dtor_List_Int__ca8c9dc13d);
+var50 = NULL;
+var50 = ctor_List_Int__ca8c9dc13d();
+(void)0;
+var51 = 1LL;
+(void)0;
+var52 = 2LL;
+decref((var53), dtor_List_Int__ca8c9dc13d);
+var53 = NULL;
+var53 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var53,var51);
+meth_List_Int__ca8c9dc13d_push(var53,var52);
+(void)0;
+var54 = meth_List_Int__ca8c9dc13d_ends_with(var53,var50);
+string_decref(var55);
+var55.buf = NULL;
+var55 = meth_Bool_to_string(var54);
+oomph_print(var55);
+out: (void)0;
+string_decref(var55);
+(void)0;
+decref((var53), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+decref((var50), dtor_List_Int__ca8c9dc13d);
+string_decref(var49);
+(void)0;
+decref((var47), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+decref((var44), dtor_List_Int__ca8c9dc13d);
+(void)0;
+string_decref(var42);
+(void)0;
+decref((var40), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+decref((var37), dtor_List_Int__ca8c9dc13d);
+(void)0;
+string_decref(var35);
+(void)0;
+decref((var33), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+decref((var30), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+string_decref(var27);
+(void)0;
+decref((var25), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+decref((var22), dtor_List_Int__ca8c9dc13d);
+string_decref(var21);
+(void)0;
+decref((var19), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+decref((var16), dtor_List_Int__ca8c9dc13d);
+(void)0;
+string_decref(var14);
+(void)0;
+decref((var12), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+decref((var9), dtor_List_Int__ca8c9dc13d);
+(void)0;
+string_decref(var7);
+(void)0;
+decref((var5), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+decref((var2), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+}
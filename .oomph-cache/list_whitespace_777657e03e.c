@@ -0,0 +1,63 @@
+#include <lib/oomph.h>
+#include "list_whitespace_777657e03e.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+
+            static struct StringBuf string0lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ 108,111,108 },
+                .malloced = false,
+            };
+            static struct class_Str string0lol_9cdfb439c7 = {
+                .buf = &string0lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1wat_611c59af56_buf = {
+                .refcount = -1,
+                .data = (char[]){ 119,97,116 },
+                .malloced = false,
+            };
+            static struct class_Str string1wat_611c59af56 = {
+                .buf = &string1wat_611c59af56_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var2;
+            var2 = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0lol_9cdfb439c7;
+                string_incref(var0);
+                string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string1wat_611c59af56;
+                string_incref(var1);
+                decref((var2), dtor_List_Str__d1ecbd3335);
+var2 = NULL;
+var2 = ctor_List_Str__d1ecbd3335();
+meth_List_Str__d1ecbd3335_push(var2,var0);
+meth_List_Str__d1ecbd3335_push(var2,var1);
+string_decref(var3);
+var3.buf = NULL;
+var3 = meth_List_Str__d1ecbd3335_to_string(var2);
+oomph_print(var3);
+out: (void)0;
+string_decref(var3);
+decref((var2), dtor_List_Str__d1ecbd3335);
+string_decref(var1);
+string_decref(var0);
+}
@@ -0,0 +1,11 @@
+
+            #ifndef HEADER_GUARD_list_whitespace_777657e03e
+            #define HEADER_GUARD_list_whitespace_777657e03e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+struct class_List_Str__d1ecbd3335;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
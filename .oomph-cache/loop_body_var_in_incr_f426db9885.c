@@ -0,0 +1,93 @@
+#include <lib/oomph.h>
+#include "loop_body_var_in_incr_f426db9885.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ 108,111,108 },
+                .malloced = false,
+            };
+            static struct class_Str string0lol_9cdfb439c7 = {
+                .buf = &string0lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            bool var3;
+            
+            bool var4;
+            
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            int64_t var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            struct class_Str var9;
+            var9.buf = NULL;
+
+            bool var10;
+            (void)0;
+var0 = 0LL;
+label0: (void)0;
+(void)0;
+var1 = var0;
+(void)0;
+(void)0;
+var2 = 10LL;
+(void)0;
+var3 = oomph_int_gt(var2,var1);
+(void)0;
+var4 = oomph_bool_not(var3);
+
+                if (var4)
+                    goto label1;
+                string_decref(var5);
+var5.buf = NULL;
+
+                var5 = string0lol_9cdfb439c7;
+                string_incref(var5);
+                (void)0;
+var6 = var0;
+(void)0;
+(void)0;
+var7 = 1LL;
+(void)0;
+var8 = oomph_int_add(var6,var7);
+(void)0;
+var0 = var8;
+(void)0;
+label2: (void)0;
+string_decref(var9);
+var9.buf = NULL;
+var9 = var5;
+string_incref(var9);
+oomph_print(var9);
+(void)0;
+var10 = oomph_true;
+
+                if (var10)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+string_decref(var9);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var5);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_loop_body_var_in_incr_f426db9885
+            #define HEADER_GUARD_loop_body_var_in_incr_f426db9885
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,215 @@
+#include <lib/oomph.h>
+#include "loop_reference_bug_2c49b5b050.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+
+            static struct StringBuf string0_d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string0_d41d8cd98f = {
+                .buf = &string0_d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1c_4a8a08f09d_buf = {
+                .refcount = -1,
+                .data = (char[]){ 99 },
+                .malloced = false,
+            };
+            static struct class_Str string1c_4a8a08f09d = {
+                .buf = &string1c_4a8a08f09d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2cc___4c833bd44b_buf = {
+                .refcount = -1,
+                .data = (char[]){ 99,99,58,32 },
+                .malloced = false,
+            };
+            static struct class_Str string2cc___4c833bd44b = {
+                .buf = &string2cc___4c833bd44b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            struct class_Str var6;
+            var6.buf = NULL;
+
+            struct class_Str var7;
+            var7.buf = NULL;
+
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var9;
+            var9 = NULL;
+
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            int64_t var12;
+            
+            bool var13;
+            
+            bool var14;
+            
+            struct class_Str var15;
+            var15.buf = NULL;
+
+            int64_t var16;
+            
+            int64_t var17;
+            
+            int64_t var18;
+            
+            bool var19;
+            
+            struct class_Str var20;
+            var20.buf = NULL;
+
+            struct class_Str var21;
+            var21.buf = NULL;
+
+            struct class_Str var22;
+            var22.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0_d41d8cd98f;
+                string_incref(var0);
+                (void)0;
+var1 = 0LL;
+label0: (void)0;
+(void)0;
+var2 = var1;
+(void)0;
+(void)0;
+var3 = 2LL;
+(void)0;
+var4 = oomph_int_gt(var3,var2);
+(void)0;
+var5 = oomph_bool_not(var4);
+
+                if (var5)
+                    goto label1;
+                string_decref(var6);
+var6.buf = NULL;
+
+                var6 = string0_d41d8cd98f;
+                string_incref(var6);
+                string_decref(var7);
+var7.buf = NULL;
+
+                var7 = string1c_4a8a08f09d;
+                string_incref(var7);
+                string_decref(var8);
+var8.buf = NULL;
+
+                var8 = string1c_4a8a08f09d;
+                string_incref(var8);
+                decref((var9), dtor_List_Str__d1ecbd3335);
+var9 = NULL;
+var9 = ctor_List_Str__d1ecbd3335();
+meth_List_Str__d1ecbd3335_push(var9,var7);
+meth_List_Str__d1ecbd3335_push(var9,var8);
+string_decref(var10);
+var10.buf = NULL;
+var10 = meth_List_Str__d1ecbd3335_join(var9,var6);
+(void)0;
+var11 = var1;
+(void)0;
+(void)0;
+var12 = 0LL;
+(void)0;
+var13 = meth_Int_equals(var11,var12);
+
+                if (var13)
+                    goto label2;
+                (void)0;
+var14 = oomph_true;
+
+                if (var14)
+                    goto label3;
+                label2: (void)0;
+string_decref(var15);
+var15.buf = NULL;
+var15 = var10;
+string_incref(var15);
+string_decref(var0);
+var0 = var15;
+string_incref(var0);
+label3: (void)0;
+label4: (void)0;
+(void)0;
+var16 = var1;
+(void)0;
+(void)0;
+var17 = 1LL;
+(void)0;
+var18 = oomph_int_add(var16,var17);
+(void)0;
+var1 = var18;
+(void)0;
+(void)0;
+var19 = oomph_true;
+
+                if (var19)
+                    goto label0;
+                label1: (void)0;
+string_decref(var20);
+var20.buf = NULL;
+
+                var20 = string2cc___4c833bd44b;
+                string_incref(var20);
+                string_decref(var21);
+var21.buf = NULL;
+var21 = var0;
+string_incref(var21);
+string_decref(var22);
+var22.buf = NULL;
+var22 = oomph_string_concat(var20,var21);
+oomph_print(var22);
+out: (void)0;
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var15);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var10);
+decref((var9), dtor_List_Str__d1ecbd3335);
+string_decref(var8);
+string_decref(var7);
+string_decref(var6);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var0);
+}
@@ -0,0 +1,74 @@
+#include <lib/oomph.h>
+#include "method_e56b7f25e9.h"
+#include "builtins_8da1dac06a.h"
+#include "Point_2a3cd5946c.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            struct class_Point_2a3cd5946c* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            struct class_Point_2a3cd5946c* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            int64_t var7;
+            
+            struct class_Point_2a3cd5946c* var8;
+            var8 = NULL;
+
+            struct class_Point_2a3cd5946c* var9;
+            var9 = NULL;
+
+            struct class_Point_2a3cd5946c* var10;
+            var10 = NULL;
+(void)0;
+var0 = 100LL;
+(void)0;
+var1 = 200LL;
+decref((var2), dtor_Point_2a3cd5946c);
+var2 = NULL;
+var2 = ctor_Point_2a3cd5946c(var0,var1);
+meth_Point_2a3cd5946c_print(var2);
+(void)0;
+var3 = 100LL;
+(void)0;
+var4 = 200LL;
+decref((var5), dtor_Point_2a3cd5946c);
+var5 = NULL;
+var5 = ctor_Point_2a3cd5946c(var3,var4);
+(void)0;
+var6 = 1LL;
+(void)0;
+var7 = 2LL;
+decref((var8), dtor_Point_2a3cd5946c);
+var8 = NULL;
+var8 = ctor_Point_2a3cd5946c(var6,var7);
+decref((var9), dtor_Point_2a3cd5946c);
+var9 = NULL;
+var9 = var5;
+incref(var9);
+decref((var10), dtor_Point_2a3cd5946c);
+var10 = NULL;
+var10 = meth_Point_2a3cd5946c_add(var9,var8);
+meth_Point_2a3cd5946c_print(var10);
+out: (void)0;
+decref((var10), dtor_Point_2a3cd5946c);
+decref((var9), dtor_Point_2a3cd5946c);
+decref((var8), dtor_Point_2a3cd5946c);
+(void)0;
+(void)0;
+decref((var5), dtor_Point_2a3cd5946c);
+(void)0;
+(void)0;
+decref((var2), dtor_Point_2a3cd5946c);
+(void)0;
+(void)0;
+}
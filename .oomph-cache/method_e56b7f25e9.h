@@ -0,0 +1,15 @@
+
+            #ifndef HEADER_GUARD_method_e56b7f25e9
+            #define HEADER_GUARD_method_e56b7f25e9
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Point_2a3cd5946c.h"
+struct class_Point_2a3cd5946c;
+struct class_Point_2a3cd5946c;
+struct class_Point_2a3cd5946c;
+struct class_Point_2a3cd5946c;
+struct class_Point_2a3cd5946c;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
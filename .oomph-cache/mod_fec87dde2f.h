@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_mod_fec87dde2f
+            #define HEADER_GUARD_mod_fec87dde2f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
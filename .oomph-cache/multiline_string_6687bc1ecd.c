@@ -0,0 +1,207 @@
+#include <lib/oomph.h>
+#include "multiline_string_6687bc1ecd.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0Hello_world__This_is_2b47790fd2_buf = {
+                .refcount = -1,
+                .data = (char[]){ 72,101,108,108,111,32,119,111,114,108,100,33,10,84,104,105,115,32,105,115,32,97,32,34,109,117,108,116,105,108,105,110,101,32,115,116,114,105,110,103,34,46,10,66,108,97,104,32,98,108,97,104,32,98,108,97,104,46,32,89,97,100,100,97,32,121,97,100,100,97,32,121,97,100,100,97,46,32 },
+                .malloced = false,
+            };
+            static struct class_Str string0Hello_world__This_is_2b47790fd2 = {
+                .buf = &string0Hello_world__This_is_2b47790fd2_buf,
+                .nbytes = 78,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1Some_695c6ae413_buf = {
+                .refcount = -1,
+                .data = (char[]){ 83,111,109,101 },
+                .malloced = false,
+            };
+            static struct class_Str string1Some_695c6ae413 = {
+                .buf = &string1Some_695c6ae413_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2__7215ee9c7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ 32 },
+                .malloced = false,
+            };
+            static struct class_Str string2__7215ee9c7d = {
+                .buf = &string2__7215ee9c7d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3code_c13367945d_buf = {
+                .refcount = -1,
+                .data = (char[]){ 99,111,100,101 },
+                .malloced = false,
+            };
+            static struct class_Str string3code_c13367945d = {
+                .buf = &string3code_c13367945d_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4__Lol_856f550ec3_buf = {
+                .refcount = -1,
+                .data = (char[]){ 46,10,76,111,108 },
+                .malloced = false,
+            };
+            static struct class_Str string4__Lol_856f550ec3 = {
+                .buf = &string4__Lol_856f550ec3_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5This_is_another_mult_0e0a0b7292_buf = {
+                .refcount = -1,
+                .data = (char[]){ 84,104,105,115,32,105,115,32,97,110,111,116,104,101,114,32,109,117,108,116,105,108,105,110,101,32,115,116,114,105,110,103,46,10,86,97,108,117,101,32,111,102,32,120,32,105,115,32 },
+                .malloced = false,
+            };
+            static struct class_Str string5This_is_another_mult_0e0a0b7292 = {
+                .buf = &string5This_is_another_mult_0e0a0b7292_buf,
+                .nbytes = 48,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6__5058f1af83_buf = {
+                .refcount = -1,
+                .data = (char[]){ 46 },
+                .malloced = false,
+            };
+            static struct class_Str string6__5058f1af83 = {
+                .buf = &string6__5058f1af83_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_Str var6;
+            var6.buf = NULL;
+
+            struct class_Str var7;
+            var7.buf = NULL;
+
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            int64_t var9;
+            
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            struct class_Str var12;
+            var12.buf = NULL;
+
+            struct class_Str var13;
+            var13.buf = NULL;
+
+            struct class_Str var14;
+            var14.buf = NULL;
+
+            struct class_Str var15;
+            var15.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0Hello_world__This_is_2b47790fd2;
+                string_incref(var0);
+                string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string1Some_695c6ae413;
+                string_incref(var1);
+                string_decref(var2);
+var2.buf = NULL;
+
+                var2 = string2__7215ee9c7d;
+                string_incref(var2);
+                string_decref(var3);
+var3.buf = NULL;
+var3 = oomph_string_concat(var1,var2);
+string_decref(var4);
+var4.buf = NULL;
+
+                var4 = string3code_c13367945d;
+                string_incref(var4);
+                string_decref(var5);
+var5.buf = NULL;
+var5 = oomph_string_concat(var3,var4);
+string_decref(var6);
+var6.buf = NULL;
+var6 = oomph_string_concat(var0,var5);
+string_decref(var7);
+var7.buf = NULL;
+
+                var7 = string4__Lol_856f550ec3;
+                string_incref(var7);
+                string_decref(var8);
+var8.buf = NULL;
+var8 = oomph_string_concat(var6,var7);
+oomph_print(var8);
+(void)0;
+var9 = 1LL;
+string_decref(var10);
+var10.buf = NULL;
+
+                var10 = string5This_is_another_mult_0e0a0b7292;
+                string_incref(var10);
+                (void)0;
+var11 = var9;
+(void)0;
+string_decref(var12);
+var12.buf = NULL;
+var12 = meth_Int_to_string(var11);
+string_decref(var13);
+var13.buf = NULL;
+var13 = oomph_string_concat(var10,var12);
+string_decref(var14);
+var14.buf = NULL;
+
+                var14 = string6__5058f1af83;
+                string_incref(var14);
+                string_decref(var15);
+var15.buf = NULL;
+var15 = oomph_string_concat(var13,var14);
+oomph_print(var15);
+out: (void)0;
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+(void)0;
+string_decref(var10);
+(void)0;
+string_decref(var8);
+string_decref(var7);
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+string_decref(var0);
+}
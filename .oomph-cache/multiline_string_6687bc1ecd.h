@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_multiline_string_6687bc1ecd
+            #define HEADER_GUARD_multiline_string_6687bc1ecd
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,75 @@
+#include <lib/oomph.h>
+#include "nested_union_b80ec375fa.h"
+#include "builtins_8da1dac06a.h"
+#include "Bar_ddc35f88fa.h"
+#include "Flat_2bc85bf76a.h"
+#include "_Bar___Baz__3fac7276da.h"
+#include "Nested_2bc85bf76a.h"
+void oomph_main(void){
+            struct class_Bar_ddc35f88fa* var0;
+            var0 = NULL;
+
+            struct class_Flat_2bc85bf76a var1;
+            var1.membernum = -1;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Bar_ddc35f88fa* var3;
+            var3 = NULL;
+
+            struct class__Bar___Baz__3fac7276da var4;
+            var4.membernum = -1;
+
+            struct class_Nested_2bc85bf76a var5;
+            var5.membernum = -1;
+
+            struct class_Str var6;
+            var6.buf = NULL;
+decref((var0), dtor_Bar_ddc35f88fa);
+var0 = NULL;
+var0 = ctor_Bar_ddc35f88fa();
+decref_Flat_2bc85bf76a(var1);
+var1.membernum = -1;
+
+                var1 = (struct class_Flat_2bc85bf76a) {
+                    .val = { .item1 = var0 },
+                    .membernum = 1,
+                };
+                incref(var0);
+string_decref(var2);
+var2.buf = NULL;
+var2 = meth_Flat_2bc85bf76a_to_string(var1);
+oomph_print(var2);
+decref((var3), dtor_Bar_ddc35f88fa);
+var3 = NULL;
+var3 = ctor_Bar_ddc35f88fa();
+decref__Bar___Baz__3fac7276da(var4);
+var4.membernum = -1;
+
+                var4 = (struct class__Bar___Baz__3fac7276da) {
+                    .val = { .item0 = var3 },
+                    .membernum = 0,
+                };
+                incref(var3);
+decref_Nested_2bc85bf76a(var5);
+var5.membernum = -1;
+
+                var5 = (struct class_Nested_2bc85bf76a) {
+                    .val = { .item1 = var4 },
+                    .membernum = 1,
+                };
+                incref__Bar___Baz__3fac7276da(var4);
+string_decref(var6);
+var6.buf = NULL;
+var6 = meth_Nested_2bc85bf76a_to_string(var5);
+oomph_print(var6);
+out: (void)0;
+string_decref(var6);
+decref_Nested_2bc85bf76a(var5);
+decref__Bar___Baz__3fac7276da(var4);
+decref((var3), dtor_Bar_ddc35f88fa);
+string_decref(var2);
+decref_Flat_2bc85bf76a(var1);
+decref((var0), dtor_Bar_ddc35f88fa);
+}
@@ -0,0 +1,15 @@
+
+            #ifndef HEADER_GUARD_nested_union_b80ec375fa
+            #define HEADER_GUARD_nested_union_b80ec375fa
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Bar_ddc35f88fa.h"
+#include "Flat_2bc85bf76a.h"
+#include "_Bar___Baz__3fac7276da.h"
+#include "Nested_2bc85bf76a.h"
+struct class_Bar_ddc35f88fa;
+struct class_Bar_ddc35f88fa;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
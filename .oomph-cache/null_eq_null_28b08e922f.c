@@ -0,0 +1,30 @@
+#include <lib/oomph.h>
+#include "null_eq_null_28b08e922f.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            char var0;
+            
+            char var1;
+            
+            bool var2;
+            
+            struct class_Str var3;
+            var3.buf = NULL;
+(void)0;
+var0 = oomph_null;
+(void)0;
+(void)0;
+var1 = oomph_null;
+(void)0;
+(void)0;
+var2 = meth_null_equals(var0,var1);
+string_decref(var3);
+var3.buf = NULL;
+var3 = meth_Bool_to_string(var2);
+oomph_print(var3);
+out: (void)0;
+string_decref(var3);
+(void)0;
+(void)0;
+(void)0;
+}
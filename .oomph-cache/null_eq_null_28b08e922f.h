@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_null_eq_null_28b08e922f
+            #define HEADER_GUARD_null_eq_null_28b08e922f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,559 @@
+#include <lib/oomph.h>
+#include "optional_f4cf392861.h"
+#include "builtins_8da1dac06a.h"
+#include "_null___Str__3674d0c701.h"
+
+            static struct StringBuf string0show___4d6dce5bac_buf = {
+                .refcount = -1,
+                .data = (char[]){ 115,104,111,119,58,32 },
+                .malloced = false,
+            };
+            static struct class_Str string0show___4d6dce5bac = {
+                .buf = &string0show___4d6dce5bac_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1__7215ee9c7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ 32 },
+                .malloced = false,
+            };
+            static struct class_Str string1__7215ee9c7d = {
+                .buf = &string1__7215ee9c7d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ 108,111,108 },
+                .malloced = false,
+            };
+            static struct class_Str string2lol_9cdfb439c7 = {
+                .buf = &string2lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3wat_611c59af56_buf = {
+                .refcount = -1,
+                .data = (char[]){ 119,97,116 },
+                .malloced = false,
+            };
+            static struct class_Str string3wat_611c59af56 = {
+                .buf = &string3wat_611c59af56_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4main___e18ee3dadc_buf = {
+                .refcount = -1,
+                .data = (char[]){ 109,97,105,110,58,32 },
+                .malloced = false,
+            };
+            static struct class_Str string4main___e18ee3dadc = {
+                .buf = &string4main___e18ee3dadc_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5lolwat_c096629f2f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 108,111,108,119,97,116 },
+                .malloced = false,
+            };
+            static struct class_Str string5lolwat_c096629f2f = {
+                .buf = &string5lolwat_c096629f2f_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            void optional_f4cf392861_show(struct class__null___Str__3674d0c701 var0){
+            struct class__null___Str__3674d0c701 var1;
+            var1.membernum = -1;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class__null___Str__3674d0c701 var3;
+            var3.membernum = -1;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_Str var6;
+            var6.buf = NULL;
+
+            struct class_Str var7;
+            var7.buf = NULL;
+
+            struct class__null___Str__3674d0c701 var8;
+            var8.membernum = -1;
+
+            char var9;
+            
+            struct class__null___Str__3674d0c701 var10;
+            var10.membernum = -1;
+
+            bool var11;
+            
+            struct class_Str var12;
+            var12.buf = NULL;
+
+            struct class_Str var13;
+            var13.buf = NULL;
+var1 = var0;
+incref__null___Str__3674d0c701(var1);
+string_decref(var2);
+var2.buf = NULL;
+
+                var2 = string0show___4d6dce5bac;
+                string_incref(var2);
+                decref__null___Str__3674d0c701(var3);
+var3.membernum = -1;
+var3 = var1;
+incref__null___Str__3674d0c701(var3);
+string_decref(var4);
+var4.buf = NULL;
+var4 = meth__null___Str__3674d0c701_to_string(var3);
+string_decref(var5);
+var5.buf = NULL;
+var5 = oomph_string_concat(var2,var4);
+string_decref(var6);
+var6.buf = NULL;
+
+                var6 = string1__7215ee9c7d;
+                string_incref(var6);
+                string_decref(var7);
+var7.buf = NULL;
+var7 = oomph_string_concat(var5,var6);
+decref__null___Str__3674d0c701(var8);
+var8.membernum = -1;
+var8 = var1;
+incref__null___Str__3674d0c701(var8);
+(void)0;
+var9 = oomph_null;
+(void)0;
+decref__null___Str__3674d0c701(var10);
+var10.membernum = -1;
+
+                var10 = (struct class__null___Str__3674d0c701) {
+                    .val = { .item0 = var9 },
+                    .membernum = 0,
+                };
+                (void)0;
+(void)0;
+var11 = meth__null___Str__3674d0c701_equals(var8,var10);
+string_decref(var12);
+var12.buf = NULL;
+var12 = meth_Bool_to_string(var11);
+string_decref(var13);
+var13.buf = NULL;
+var13 = oomph_string_concat(var7,var12);
+oomph_print(var13);
+out: (void)0;
+string_decref(var13);
+string_decref(var12);
+(void)0;
+decref__null___Str__3674d0c701(var10);
+(void)0;
+decref__null___Str__3674d0c701(var8);
+string_decref(var7);
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+decref__null___Str__3674d0c701(var3);
+string_decref(var2);
+decref__null___Str__3674d0c701(var1);
+}
+void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class__null___Str__3674d0c701 var3;
+            var3.membernum = -1;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class__null___Str__3674d0c701 var5;
+            var5.membernum = -1;
+
+            struct class_Str var6;
+            var6.buf = NULL;
+
+            struct class_Str var7;
+            var7.buf = NULL;
+
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            struct class_Str var9;
+            var9.buf = NULL;
+
+            struct class__null___Str__3674d0c701 var10;
+            var10.membernum = -1;
+
+            char var11;
+            
+            struct class__null___Str__3674d0c701 var12;
+            var12.membernum = -1;
+
+            bool var13;
+            
+            struct class_Str var14;
+            var14.buf = NULL;
+
+            struct class_Str var15;
+            var15.buf = NULL;
+
+            struct class__null___Str__3674d0c701 var16;
+            var16.membernum = -1;
+
+            char var17;
+            
+            struct class__null___Str__3674d0c701 var18;
+            var18.membernum = -1;
+
+            char var19;
+            
+            struct class__null___Str__3674d0c701 var20;
+            var20.membernum = -1;
+
+            char var21;
+            
+            struct class__null___Str__3674d0c701 var22;
+            var22.membernum = -1;
+
+            bool var23;
+            
+            struct class_Str var24;
+            var24.buf = NULL;
+
+            char var25;
+            
+            struct class__null___Str__3674d0c701 var26;
+            var26.membernum = -1;
+
+            char var27;
+            
+            struct class__null___Str__3674d0c701 var28;
+            var28.membernum = -1;
+
+            bool var29;
+            
+            struct class_Str var30;
+            var30.buf = NULL;
+
+            char var31;
+            
+            char var32;
+            
+            struct class__null___Str__3674d0c701 var33;
+            var33.membernum = -1;
+
+            struct class__null___Str__3674d0c701 var34;
+            var34.membernum = -1;
+
+            bool var35;
+            
+            struct class_Str var36;
+            var36.buf = NULL;
+
+            struct class__null___Str__3674d0c701 var37;
+            var37.membernum = -1;
+
+            char var38;
+            
+            struct class__null___Str__3674d0c701 var39;
+            var39.membernum = -1;
+
+            bool var40;
+            
+            struct class_Str var41;
+            var41.buf = NULL;
+
+            struct class__null___Str__3674d0c701 var42;
+            var42.membernum = -1;
+
+            struct class_Str var43;
+            var43.buf = NULL;
+
+            struct class__null___Str__3674d0c701 var44;
+            var44.membernum = -1;
+
+            bool var45;
+            
+            struct class_Str var46;
+            var46.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string2lol_9cdfb439c7;
+                string_incref(var0);
+                string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string3wat_611c59af56;
+                string_incref(var1);
+                string_decref(var2);
+var2.buf = NULL;
+var2 = oomph_string_concat(var0,var1);
+decref__null___Str__3674d0c701(var3);
+var3.membernum = -1;
+
+                var3 = (struct class__null___Str__3674d0c701) {
+                    .val = { .item1 = var2 },
+                    .membernum = 1,
+                };
+                string_incref(var2);
+string_decref(var4);
+var4.buf = NULL;
+
+                var4 = string4main___e18ee3dadc;
+                string_incref(var4);
+                decref__null___Str__3674d0c701(var5);
+var5.membernum = -1;
+var5 = var3;
+incref__null___Str__3674d0c701(var5);
+string_decref(var6);
+var6.buf = NULL;
+var6 = meth__null___Str__3674d0c701_to_string(var5);
+string_decref(var7);
+var7.buf = NULL;
+var7 = oomph_string_concat(var4,var6);
+string_decref(var8);
+var8.buf = NULL;
+
+                var8 = string1__7215ee9c7d;
+                string_incref(var8);
+                string_decref(var9);
+var9.buf = NULL;
+var9 = oomph_string_concat(var7,var8);
+decref__null___Str__3674d0c701(var10);
+var10.membernum = -1;
+var10 = var3;
+incref__null___Str__3674d0c701(var10);
+(void)0;
+var11 = oomph_null;
+(void)0;
+decref__null___Str__3674d0c701(var12);
+var12.membernum = -1;
+
+                var12 = (struct class__null___Str__3674d0c701) {
+                    .val = { .item0 = var11 },
+                    .membernum = 0,
+                };
+                (void)0;
+(void)0;
+var13 = meth__null___Str__3674d0c701_equals(var10,var12);
+string_decref(var14);
+var14.buf = NULL;
+var14 = meth_Bool_to_string(var13);
+string_decref(var15);
+var15.buf = NULL;
+var15 = oomph_string_concat(var9,var14);
+oomph_print(var15);
+decref__null___Str__3674d0c701(var16);
+var16.membernum = -1;
+var16 = var3;
+incref__null___Str__3674d0c701(var16);
+optional_f4cf392861_show(var16);
+(void)0;
+var17 = oomph_null;
+(void)0;
+decref__null___Str__3674d0c701(var18);
+var18.membernum = -1;
+
+                var18 = (struct class__null___Str__3674d0c701) {
+                    .val = { .item0 = var17 },
+                    .membernum = 0,
+                };
+                (void)0;
+optional_f4cf392861_show(var18);
+(void)0;
+var19 = oomph_null;
+(void)0;
+decref__null___Str__3674d0c701(var20);
+var20.membernum = -1;
+
+                var20 = (struct class__null___Str__3674d0c701) {
+                    .val = { .item0 = var19 },
+                    .membernum = 0,
+                };
+                (void)0;
+(void)0;
+var21 = oomph_null;
+(void)0;
+decref__null___Str__3674d0c701(var22);
+var22.membernum = -1;
+
+                var22 = (struct class__null___Str__3674d0c701) {
+                    .val = { .item0 = var21 },
+                    .membernum = 0,
+                };
+                (void)0;
+(void)0;
+var23 = meth__null___Str__3674d0c701_equals(var20,var22);
+string_decref(var24);
+var24.buf = NULL;
+var24 = meth_Bool_to_string(var23);
+oomph_print(var24);
+(void)0;
+var25 = oomph_null;
+(void)0;
+decref__null___Str__3674d0c701(var26);
+var26.membernum = -1;
+
+                var26 = (struct class__null___Str__3674d0c701) {
+                    .val = { .item0 = var25 },
+                    .membernum = 0,
+                };
+                (void)0;
+(void)0;
+var27 = oomph_null;
+(void)0;
+decref__null___Str__3674d0c701(var28);
+var28.membernum = -1;
+
+                var28 = (struct class__null___Str__3674d0c701) {
+                    .val = { .item0 = var27 },
+                    .membernum = 0,
+                };
+                (void)0;
+(void)0;
+var29 = meth__null___Str__3674d0c701_equals(var26,var28);
+string_decref(var30);
+var30.buf = NULL;
+var30 = meth_Bool_to_string(var29);
+oomph_print(var30);
+(void)0;
+var31 = oomph_null;
+(void)0;
+(void)0;
+var32 = oomph_null;
+(void)0;
+decref__null___Str__3674d0c701(var33);
+var33.membernum = -1;
+
+                var33 = (struct class__null___Str__3674d0c701) {
+                    .val = { .item0 = var32 },
+                    .membernum = 0,
+                };
+                (void)0;
+decref__null___Str__3674d0c701(var34);
+var34.membernum = -1;
+
+                var34 = (struct class__null___Str__3674d0c701) {
+                    .val = { .item0 = var31 },
+                    .membernum = 0,
+                };
+                (void)0;
+(void)0;
+var35 = meth__null___Str__3674d0c701_equals(var34,var33);
+string_decref(var36);
+var36.buf = NULL;
+var36 = meth_Bool_to_string(var35);
+oomph_print(var36);
+decref__null___Str__3674d0c701(var37);
+var37.membernum = -1;
+var37 = var3;
+incref__null___Str__3674d0c701(var37);
+(void)0;
+var38 = oomph_null;
+(void)0;
+decref__null___Str__3674d0c701(var39);
+var39.membernum = -1;
+
+                var39 = (struct class__null___Str__3674d0c701) {
+                    .val = { .item0 = var38 },
+                    .membernum = 0,
+                };
+                (void)0;
+(void)0;
+var40 = meth__null___Str__3674d0c701_equals(var37,var39);
+string_decref(var41);
+var41.buf = NULL;
+var41 = meth_Bool_to_string(var40);
+oomph_print(var41);
+decref__null___Str__3674d0c701(var42);
+var42.membernum = -1;
+var42 = var3;
+incref__null___Str__3674d0c701(var42);
+string_decref(var43);
+var43.buf = NULL;
+
+                var43 = string5lolwat_c096629f2f;
+                string_incref(var43);
+                decref__null___Str__3674d0c701(var44);
+var44.membernum = -1;
+
+                var44 = (struct class__null___Str__3674d0c701) {
+                    .val = { .item1 = var43 },
+                    .membernum = 1,
+                };
+                string_incref(var43);
+(void)0;
+var45 = meth__null___Str__3674d0c701_equals(var42,var44);
+string_decref(var46);
+var46.buf = NULL;
+var46 = meth_Bool_to_string(var45);
+oomph_print(var46);
+out: (void)0;
+string_decref(var46);
+(void)0;
+decref__null___Str__3674d0c701(var44);
+string_decref(var43);
+decref__null___Str__3674d0c701(var42);
+string_decref(var41);
+(void)0;
+decref__null___Str__3674d0c701(var39);
+(void)0;
+decref__null___Str__3674d0c701(var37);
+string_decref(var36);
+(void)0;
+decref__null___Str__3674d0c701(var34);
+decref__null___Str__3674d0c701(var33);
+(void)0;
+(void)0;
+string_decref(var30);
+(void)0;
+decref__null___Str__3674d0c701(var28);
+(void)0;
+decref__null___Str__3674d0c701(var26);
+(void)0;
+string_decref(var24);
+(void)0;
+decref__null___Str__3674d0c701(var22);
+(void)0;
+decref__null___Str__3674d0c701(var20);
+(void)0;
+decref__null___Str__3674d0c701(var18);
+(void)0;
+decref__null___Str__3674d0c701(var16);
+string_decref(var15);
+string_decref(var14);
+(void)0;
+decref__null___Str__3674d0c701(var12);
+(void)0;
+decref__null___Str__3674d0c701(var10);
+string_decref(var9);
+string_decref(var8);
+string_decref(var7);
+string_decref(var6);
+decref__null___Str__3674d0c701(var5);
+string_decref(var4);
+decref__null___Str__3674d0c701(var3);
+string_decref(var2);
+string_decref(var1);
+string_decref(var0);
+}
@@ -0,0 +1,97 @@
+#include <lib/oomph.h>
+#include "optional_refcount_bug_ab6e005b33.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+#include "_null___Str__3674d0c701.h"
+
+            static struct StringBuf string0_d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string0_d41d8cd98f = {
+                .buf = &string0_d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1aaa_47bce5c74f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97,97,97 },
+                .malloced = false,
+            };
+            static struct class_Str string1aaa_47bce5c74f = {
+                .buf = &string1aaa_47bce5c74f_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            struct class__null___Str__3674d0c701 optional_refcount_bug_ab6e005b33_foo(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var2;
+            var2 = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class__null___Str__3674d0c701 var4;
+            var4.membernum = -1;
+
+            struct class__null___Str__3674d0c701 retval;
+            string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0_d41d8cd98f;
+                string_incref(var0);
+                string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string1aaa_47bce5c74f;
+                string_incref(var1);
+                decref((var2), dtor_List_Str__d1ecbd3335);
+var2 = NULL;
+var2 = meth_Str_split(var1,var0);
+string_decref(var3);
+var3.buf = NULL;
+var3 = meth_List_Str__d1ecbd3335_first(var2);
+decref__null___Str__3674d0c701(var4);
+var4.membernum = -1;
+
+                var4 = (struct class__null___Str__3674d0c701) {
+                    .val = { .item1 = var3 },
+                    .membernum = 1,
+                };
+                string_incref(var3);
+
+                        incref__null___Str__3674d0c701(var4);
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+decref__null___Str__3674d0c701(var4);
+string_decref(var3);
+decref((var2), dtor_List_Str__d1ecbd3335);
+string_decref(var1);
+string_decref(var0);
+return retval;
+}
+void oomph_main(void){
+            struct class__null___Str__3674d0c701 var0;
+            var0.membernum = -1;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+decref__null___Str__3674d0c701(var0);
+var0.membernum = -1;
+var0 = optional_refcount_bug_ab6e005b33_foo();
+string_decref(var1);
+var1.buf = NULL;
+var1 = meth__null___Str__3674d0c701_to_string(var0);
+oomph_print(var1);
+out: (void)0;
+string_decref(var1);
+decref__null___Str__3674d0c701(var0);
+}
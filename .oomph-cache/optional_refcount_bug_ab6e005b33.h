@@ -0,0 +1,13 @@
+
+            #ifndef HEADER_GUARD_optional_refcount_bug_ab6e005b33
+            #define HEADER_GUARD_optional_refcount_bug_ab6e005b33
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+#include "_null___Str__3674d0c701.h"
+struct class_List_Str__d1ecbd3335;
+struct class__null___Str__3674d0c701 optional_refcount_bug_ab6e005b33_foo(void);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,45 @@
+#include <lib/oomph.h>
+#include "pop_refcount_bug_66dce8526b.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Token__f3df4dfe1c.h"
+#include "Token_459a6f79ad.h"
+void oomph_main(void){
+            struct class_List_Token__f3df4dfe1c* var0;
+            var0 = NULL;
+
+            struct class_Token_459a6f79ad* var1;
+            var1 = NULL;
+
+            struct class_List_Token__f3df4dfe1c* var2;
+            var2 = NULL;
+
+            struct class_List_Token__f3df4dfe1c* var3;
+            var3 = NULL;
+
+            struct class_Token_459a6f79ad* var4;
+            var4 = NULL;
+decref((var0), dtor_List_Token__f3df4dfe1c);
+var0 = NULL;
+var0 = ctor_List_Token__f3df4dfe1c();
+decref((var1), dtor_Token_459a6f79ad);
+var1 = NULL;
+var1 = ctor_Token_459a6f79ad();
+decref((var2), dtor_List_Token__f3df4dfe1c);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+meth_List_Token__f3df4dfe1c_push(var2,var1);
+decref((var3), dtor_List_Token__f3df4dfe1c);
+var3 = NULL;
+var3 = var0;
+incref(var3);
+decref((var4), dtor_Token_459a6f79ad);
+var4 = NULL;
+var4 = meth_List_Token__f3df4dfe1c_pop(var3);
+out: (void)0;
+decref((var4), dtor_Token_459a6f79ad);
+decref((var3), dtor_List_Token__f3df4dfe1c);
+decref((var2), dtor_List_Token__f3df4dfe1c);
+decref((var1), dtor_Token_459a6f79ad);
+decref((var0), dtor_List_Token__f3df4dfe1c);
+}
@@ -0,0 +1,16 @@
+
+            #ifndef HEADER_GUARD_pop_refcount_bug_66dce8526b
+            #define HEADER_GUARD_pop_refcount_bug_66dce8526b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Token__f3df4dfe1c.h"
+#include "Token_459a6f79ad.h"
+struct class_List_Token__f3df4dfe1c;
+struct class_Token_459a6f79ad;
+struct class_List_Token__f3df4dfe1c;
+struct class_List_Token__f3df4dfe1c;
+struct class_Token_459a6f79ad;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
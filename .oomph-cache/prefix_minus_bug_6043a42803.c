@@ -0,0 +1,67 @@
+#include <lib/oomph.h>
+#include "prefix_minus_bug_6043a42803.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            bool var2;
+            
+            bool var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            
+            int64_t var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            struct class_Str var9;
+            var9.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+(void)0;
+var2 = meth_Int_equals(var0,var1);
+(void)0;
+
+                if (var2)
+                    goto label0;
+                (void)0;
+var4 = 1LL;
+(void)0;
+var5 = oomph_int_neg(var4);
+(void)0;
+var6 = 2LL;
+(void)0;
+var7 = meth_Int_equals(var5,var6);
+var3 = var7;
+(void)0;
+var8 = oomph_true;
+
+                if (var8)
+                    goto label1;
+                label0: (void)0;
+var3 = oomph_true;
+label1: (void)0;
+string_decref(var9);
+var9.buf = NULL;
+var9 = meth_Bool_to_string(var3);
+oomph_print(var9);
+out: (void)0;
+string_decref(var9);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
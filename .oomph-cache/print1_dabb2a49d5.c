@@ -0,0 +1,18 @@
+#include <lib/oomph.h>
+#include "print1_dabb2a49d5.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            struct class_Str var1;
+            var1.buf = NULL;
+(void)0;
+var0 = 1LL;
+string_decref(var1);
+var1.buf = NULL;
+var1 = meth_Int_to_string(var0);
+oomph_print(var1);
+out: (void)0;
+string_decref(var1);
+(void)0;
+}
@@ -0,0 +1,111 @@
+#include <lib/oomph.h>
+#include "recurse_596b67bd2d.h"
+#include "builtins_8da1dac06a.h"
+#include "Count_e93f994f01.h"
+void recurse_596b67bd2d_countdown(int64_t var0){
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            int64_t var7;
+            
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            int64_t var9;
+            var1 = var0;
+(void)0;
+(void)0;
+var2 = var1;
+(void)0;
+(void)0;
+var3 = 0LL;
+(void)0;
+var4 = meth_Int_equals(var2,var3);
+(void)0;
+var5 = oomph_bool_not(var4);
+
+                if (var5)
+                    goto label0;
+                (void)0;
+var6 = oomph_true;
+
+                if (var6)
+                    goto label1;
+                label0: (void)0;
+(void)0;
+var7 = var1;
+(void)0;
+string_decref(var8);
+var8.buf = NULL;
+var8 = meth_Int_to_string(var7);
+oomph_print(var8);
+(void)0;
+var9 = var1;
+(void)0;
+recurse_596b67bd2d_countdown2(var9);
+label1: (void)0;
+out: (void)0;
+(void)0;
+string_decref(var8);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
+void recurse_596b67bd2d_countdown2(int64_t var0){
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            int64_t var4;
+            var1 = var0;
+(void)0;
+(void)0;
+var2 = var1;
+(void)0;
+(void)0;
+var3 = 1LL;
+(void)0;
+var4 = oomph_int_sub(var2,var3);
+recurse_596b67bd2d_countdown(var4);
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            struct class_Count_e93f994f01* var2;
+            var2 = NULL;
+(void)0;
+var0 = 10LL;
+recurse_596b67bd2d_countdown(var0);
+(void)0;
+var1 = 20LL;
+decref((var2), dtor_Count_e93f994f01);
+var2 = NULL;
+var2 = ctor_Count_e93f994f01();
+meth_Count_e93f994f01_down(var2,var1);
+out: (void)0;
+decref((var2), dtor_Count_e93f994f01);
+(void)0;
+(void)0;
+}
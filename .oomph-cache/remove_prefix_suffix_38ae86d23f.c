@@ -0,0 +1,257 @@
+#include <lib/oomph.h>
+#include "remove_prefix_suffix_38ae86d23f.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0l_2db95e8e1a_buf = {
+                .refcount = -1,
+                .data = (char[]){ 108 },
+                .malloced = false,
+            };
+            static struct class_Str string0l_2db95e8e1a = {
+                .buf = &string0l_2db95e8e1a_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1lllol_ca7601918b_buf = {
+                .refcount = -1,
+                .data = (char[]){ 108,108,108,111,108 },
+                .malloced = false,
+            };
+            static struct class_Str string1lllol_ca7601918b = {
+                .buf = &string1lllol_ca7601918b_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2x_9dd4e46126_buf = {
+                .refcount = -1,
+                .data = (char[]){ 120 },
+                .malloced = false,
+            };
+            static struct class_Str string2x_9dd4e46126 = {
+                .buf = &string2x_9dd4e46126_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3lolll_273146670a_buf = {
+                .refcount = -1,
+                .data = (char[]){ 108,111,108,108,108 },
+                .malloced = false,
+            };
+            static struct class_Str string3lolll_273146670a = {
+                .buf = &string3lolll_273146670a_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_Str var6;
+            var6.buf = NULL;
+
+            struct class_Str var7;
+            var7.buf = NULL;
+
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            struct class_Str var9;
+            var9.buf = NULL;
+
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            struct class_Str var11;
+            var11.buf = NULL;
+
+            struct class_Str var12;
+            var12.buf = NULL;
+
+            struct class_Str var13;
+            var13.buf = NULL;
+
+            struct class_Str var14;
+            var14.buf = NULL;
+
+            struct class_Str var15;
+            var15.buf = NULL;
+
+            struct class_Str var16;
+            var16.buf = NULL;
+
+            struct class_Str var17;
+            var17.buf = NULL;
+
+            struct class_Str var18;
+            var18.buf = NULL;
+
+            struct class_Str var19;
+            var19.buf = NULL;
+
+            struct class_Str var20;
+            var20.buf = NULL;
+
+            struct class_Str var21;
+            var21.buf = NULL;
+
+            struct class_Str var22;
+            var22.buf = NULL;
+
+            struct class_Str var23;
+            var23.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0l_2db95e8e1a;
+                string_incref(var0);
+                string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string1lllol_ca7601918b;
+                string_incref(var1);
+                string_decref(var2);
+var2.buf = NULL;
+var2 = meth_Str_remove_prefix(var1,var0);
+oomph_print(var2);
+string_decref(var3);
+var3.buf = NULL;
+
+                var3 = string2x_9dd4e46126;
+                string_incref(var3);
+                string_decref(var4);
+var4.buf = NULL;
+
+                var4 = string1lllol_ca7601918b;
+                string_incref(var4);
+                string_decref(var5);
+var5.buf = NULL;
+var5 = meth_Str_remove_prefix(var4,var3);
+oomph_print(var5);
+string_decref(var6);
+var6.buf = NULL;
+
+                var6 = string0l_2db95e8e1a;
+                string_incref(var6);
+                string_decref(var7);
+var7.buf = NULL;
+
+                var7 = string1lllol_ca7601918b;
+                string_incref(var7);
+                string_decref(var8);
+var8.buf = NULL;
+var8 = meth_Str_remove_suffix(var7,var6);
+oomph_print(var8);
+string_decref(var9);
+var9.buf = NULL;
+
+                var9 = string2x_9dd4e46126;
+                string_incref(var9);
+                string_decref(var10);
+var10.buf = NULL;
+
+                var10 = string1lllol_ca7601918b;
+                string_incref(var10);
+                string_decref(var11);
+var11.buf = NULL;
+var11 = meth_Str_remove_suffix(var10,var9);
+oomph_print(var11);
+string_decref(var12);
+var12.buf = NULL;
+
+                var12 = string0l_2db95e8e1a;
+                string_incref(var12);
+                string_decref(var13);
+var13.buf = NULL;
+
+                var13 = string3lolll_273146670a;
+                string_incref(var13);
+                string_decref(var14);
+var14.buf = NULL;
+var14 = meth_Str_remove_prefix(var13,var12);
+oomph_print(var14);
+string_decref(var15);
+var15.buf = NULL;
+
+                var15 = string2x_9dd4e46126;
+                string_incref(var15);
+                string_decref(var16);
+var16.buf = NULL;
+
+                var16 = string3lolll_273146670a;
+                string_incref(var16);
+                string_decref(var17);
+var17.buf = NULL;
+var17 = meth_Str_remove_prefix(var16,var15);
+oomph_print(var17);
+string_decref(var18);
+var18.buf = NULL;
+
+                var18 = string0l_2db95e8e1a;
+                string_incref(var18);
+                string_decref(var19);
+var19.buf = NULL;
+
+                var19 = string3lolll_273146670a;
+                string_incref(var19);
+                string_decref(var20);
+var20.buf = NULL;
+var20 = meth_Str_remove_suffix(var19,var18);
+oomph_print(var20);
+string_decref(var21);
+var21.buf = NULL;
+
+                var21 = string2x_9dd4e46126;
+                string_incref(var21);
+                string_decref(var22);
+var22.buf = NULL;
+
+                var22 = string3lolll_273146670a;
+                string_incref(var22);
+                string_decref(var23);
+var23.buf = NULL;
+var23 = meth_Str_remove_suffix(var22,var21);
+oomph_print(var23);
+out: (void)0;
+string_decref(var23);
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+string_decref(var19);
+string_decref(var18);
+string_decref(var17);
+string_decref(var16);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+string_decref(var10);
+string_decref(var9);
+string_decref(var8);
+string_decref(var7);
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+string_decref(var0);
+}
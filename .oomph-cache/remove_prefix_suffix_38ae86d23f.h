@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_remove_prefix_suffix_38ae86d23f
+            #define HEADER_GUARD_remove_prefix_suffix_38ae86d23f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
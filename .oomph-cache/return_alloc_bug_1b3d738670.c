@@ -0,0 +1,44 @@
+#include <lib/oomph.h>
+#include "return_alloc_bug_1b3d738670.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+struct class_Foo_1356c67d7a* return_alloc_bug_1b3d738670_bar(void){
+            struct class_Foo_1356c67d7a* var0;
+            var0 = NULL;
+
+            struct class_Foo_1356c67d7a* var1;
+            var1 = NULL;
+
+            struct class_Foo_1356c67d7a* var2;
+            var2 = NULL;
+
+            struct class_Foo_1356c67d7a* retval;
+            decref((var0), dtor_Foo_1356c67d7a);
+var0 = NULL;
+var0 = ctor_Foo_1356c67d7a();
+decref((var1), dtor_Foo_1356c67d7a);
+var1 = NULL;
+var1 = ctor_Foo_1356c67d7a();
+decref((var2), dtor_Foo_1356c67d7a);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+
+                        incref(var2);
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+decref((var2), dtor_Foo_1356c67d7a);
+decref((var1), dtor_Foo_1356c67d7a);
+decref((var0), dtor_Foo_1356c67d7a);
+return retval;
+}
+void oomph_main(void){
+            struct class_Foo_1356c67d7a* var0;
+            var0 = NULL;
+decref((var0), dtor_Foo_1356c67d7a);
+var0 = NULL;
+var0 = return_alloc_bug_1b3d738670_bar();
+out: (void)0;
+decref((var0), dtor_Foo_1356c67d7a);
+}
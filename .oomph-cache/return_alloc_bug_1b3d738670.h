@@ -0,0 +1,17 @@
+
+            #ifndef HEADER_GUARD_return_alloc_bug_1b3d738670
+            #define HEADER_GUARD_return_alloc_bug_1b3d738670
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_1356c67d7a.h"
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a;
+struct class_Foo_1356c67d7a* return_alloc_bug_1b3d738670_bar(void);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_return_int_b92205c2ca
+            #define HEADER_GUARD_return_int_b92205c2ca
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+int64_t return_int_b92205c2ca_foo(void);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
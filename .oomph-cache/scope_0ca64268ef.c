@@ -0,0 +1,52 @@
+#include <lib/oomph.h>
+#include "scope_0ca64268ef.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            bool var2;
+            
+            bool var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            
+            struct class_Str var6;
+            var6.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 1LL;
+(void)0;
+var2 = meth_Int_equals(var0,var1);
+
+                if (var2)
+                    goto label0;
+                (void)0;
+var3 = oomph_true;
+
+                if (var3)
+                    goto label1;
+                label0: (void)0;
+(void)0;
+var4 = 123LL;
+label1: (void)0;
+(void)0;
+var5 = var4;
+(void)0;
+string_decref(var6);
+var6.buf = NULL;
+var6 = meth_Int_to_string(var5);
+oomph_print(var6);
+out: (void)0;
+string_decref(var6);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,5 @@
+#include <lib/oomph.h>
+#include "selfref_f2019325fb.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){out: (void)0;
+}
@@ -0,0 +1,477 @@
+#include <lib/oomph.h>
+#include "slice_1aa2ab7248.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+
+            static struct StringBuf string0a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97 },
+                .malloced = false,
+            };
+            static struct class_Str string0a_0cc175b9c0 = {
+                .buf = &string0a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ 98 },
+                .malloced = false,
+            };
+            static struct class_Str string1b_92eb5ffee6 = {
+                .buf = &string1b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2c_4a8a08f09d_buf = {
+                .refcount = -1,
+                .data = (char[]){ 99 },
+                .malloced = false,
+            };
+            static struct class_Str string2c_4a8a08f09d = {
+                .buf = &string2c_4a8a08f09d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3d_8277e0910d_buf = {
+                .refcount = -1,
+                .data = (char[]){ 100 },
+                .malloced = false,
+            };
+            static struct class_Str string3d_8277e0910d = {
+                .buf = &string3d_8277e0910d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4e_e1671797c5_buf = {
+                .refcount = -1,
+                .data = (char[]){ 101 },
+                .malloced = false,
+            };
+            static struct class_Str string4e_e1671797c5 = {
+                .buf = &string4e_e1671797c5_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_____________________4e064dcfda_buf = {
+                .refcount = -1,
+                .data = (char[]){ 45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45 },
+                .malloced = false,
+            };
+            static struct class_Str string5_____________________4e064dcfda = {
+                .buf = &string5_____________________4e064dcfda_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            int64_t var7;
+            
+            struct class_List_Str__d1ecbd3335* var8;
+            var8 = NULL;
+
+            struct class_List_Str__d1ecbd3335* var9;
+            var9 = NULL;
+
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            int64_t var12;
+            
+            struct class_List_Str__d1ecbd3335* var13;
+            var13 = NULL;
+
+            struct class_List_Str__d1ecbd3335* var14;
+            var14 = NULL;
+
+            struct class_Str var15;
+            var15.buf = NULL;
+
+            int64_t var16;
+            
+            int64_t var17;
+            
+            struct class_List_Str__d1ecbd3335* var18;
+            var18 = NULL;
+
+            struct class_List_Str__d1ecbd3335* var19;
+            var19 = NULL;
+
+            struct class_Str var20;
+            var20.buf = NULL;
+
+            int64_t var21;
+            
+            int64_t var22;
+            
+            int64_t var23;
+            
+            struct class_List_Str__d1ecbd3335* var24;
+            var24 = NULL;
+
+            struct class_List_Str__d1ecbd3335* var25;
+            var25 = NULL;
+
+            struct class_Str var26;
+            var26.buf = NULL;
+
+            struct class_Str var27;
+            var27.buf = NULL;
+
+            int64_t var28;
+            
+            int64_t var29;
+            
+            struct class_List_Str__d1ecbd3335* var30;
+            var30 = NULL;
+
+            struct class_List_Str__d1ecbd3335* var31;
+            var31 = NULL;
+
+            struct class_Str var32;
+            var32.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var33;
+            var33 = NULL;
+
+            struct class_Str var34;
+            var34.buf = NULL;
+
+            int64_t var35;
+            
+            int64_t var36;
+            
+            struct class_List_Str__d1ecbd3335* var37;
+            var37 = NULL;
+
+            struct class_List_Str__d1ecbd3335* var38;
+            var38 = NULL;
+
+            struct class_Str var39;
+            var39.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var40;
+            var40 = NULL;
+
+            struct class_Str var41;
+            var41.buf = NULL;
+
+            int64_t var42;
+            
+            int64_t var43;
+            
+            struct class_List_Str__d1ecbd3335* var44;
+            var44 = NULL;
+
+            struct class_List_Str__d1ecbd3335* var45;
+            var45 = NULL;
+
+            struct class_Str var46;
+            var46.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var47;
+            var47 = NULL;
+
+            struct class_Str var48;
+            var48.buf = NULL;
+
+            int64_t var49;
+            
+            int64_t var50;
+            
+            int64_t var51;
+            
+            struct class_List_Str__d1ecbd3335* var52;
+            var52 = NULL;
+
+            struct class_List_Str__d1ecbd3335* var53;
+            var53 = NULL;
+
+            struct class_Str var54;
+            var54.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var55;
+            var55 = NULL;
+
+            struct class_Str var56;
+            var56.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0a_0cc175b9c0;
+                string_incref(var0);
+                string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string1b_92eb5ffee6;
+                string_incref(var1);
+                string_decref(var2);
+var2.buf = NULL;
+
+                var2 = string2c_4a8a08f09d;
+                string_incref(var2);
+                string_decref(var3);
+var3.buf = NULL;
+
+                var3 = string3d_8277e0910d;
+                string_incref(var3);
+                string_decref(var4);
+var4.buf = NULL;
+
+                var4 = string4e_e1671797c5;
+                string_incref(var4);
+                decref((var5), dtor_List_Str__d1ecbd3335);
+var5 = NULL;
+var5 = ctor_List_Str__d1ecbd3335();
+meth_List_Str__d1ecbd3335_push(var5,var0);
+meth_List_Str__d1ecbd3335_push(var5,var1);
+meth_List_Str__d1ecbd3335_push(var5,var2);
+meth_List_Str__d1ecbd3335_push(var5,var3);
+meth_List_Str__d1ecbd3335_push(var5,var4);
+(void)0;
+var6 = 3LL;
+(void)0;
+var7 = 2LL;
+decref((var8), dtor_List_Str__d1ecbd3335);
+var8 = NULL;
+var8 = var5;
+incref(var8);
+decref((var9), dtor_List_Str__d1ecbd3335);
+var9 = NULL;
+var9 = meth_List_Str__d1ecbd3335_slice(var8,var6,var7);
+string_decref(var10);
+var10.buf = NULL;
+var10 = meth_List_Str__d1ecbd3335_to_string(var9);
+oomph_print(var10);
+(void)0;
+var11 = 3LL;
+(void)0;
+var12 = 3LL;
+decref((var13), dtor_List_Str__d1ecbd3335);
+var13 = NULL;
+var13 = var5;
+incref(var13);
+decref((var14), dtor_List_Str__d1ecbd3335);
+var14 = NULL;
+var14 = meth_List_Str__d1ecbd3335_slice(var13,var11,var12);
+string_decref(var15);
+var15.buf = NULL;
+var15 = meth_List_Str__d1ecbd3335_to_string(var14);
+oomph_print(var15);
+(void)0;
+var16 = 3LL;
+(void)0;
+var17 = 7LL;
+decref((var18), dtor_List_Str__d1ecbd3335);
+var18 = NULL;
+var18 = var5;
+incref(var18);
+decref((var19), dtor_List_Str__d1ecbd3335);
+var19 = NULL;
+var19 = meth_List_Str__d1ecbd3335_slice(var18,var16,var17);
+string_decref(var20);
+var20.buf = NULL;
+var20 = meth_List_Str__d1ecbd3335_to_string(var19);
+oomph_print(var20);
+(void)0;
+var21 = 1LL;
+(void)0;
+var22 = oomph_int_neg(var21);
+(void)0;
+var23 = 2LL;
+decref((var24), dtor_List_Str__d1ecbd3335);
+var24 = NULL;
+var24 = var5;
+incref(var24);
+decref((var25), dtor_List_Str__d1ecbd3335);
+var25 = NULL;
+var25 = meth_List_Str__d1ecbd3335_slice(var24,var22,var23);
+string_decref(var26);
+var26.buf = NULL;
+var26 = meth_List_Str__d1ecbd3335_to_string(var25);
+oomph_print(var26);
+string_decref(var27);
+var27.buf = NULL;
+
+                var27 = string5_____________________4e064dcfda;
+                string_incref(var27);
+                oomph_print(var27);
+(void)0;
+var28 = 3LL;
+(void)0;
+var29 = 2LL;
+decref((var30), dtor_List_Str__d1ecbd3335);
+var30 = NULL;
+var30 = var5;
+incref(var30);
+decref((var31), dtor_List_Str__d1ecbd3335);
+var31 = NULL;
+var31 = meth_List_Str__d1ecbd3335_delete_slice(var30,var28,var29);
+string_decref(var32);
+var32.buf = NULL;
+var32 = meth_List_Str__d1ecbd3335_to_string(var31);
+oomph_print(var32);
+decref((var33), dtor_List_Str__d1ecbd3335);
+var33 = NULL;
+var33 = var5;
+incref(var33);
+string_decref(var34);
+var34.buf = NULL;
+var34 = meth_List_Str__d1ecbd3335_to_string(var33);
+oomph_print(var34);
+(void)0;
+var35 = 3LL;
+(void)0;
+var36 = 3LL;
+decref((var37), dtor_List_Str__d1ecbd3335);
+var37 = NULL;
+var37 = var5;
+incref(var37);
+decref((var38), dtor_List_Str__d1ecbd3335);
+var38 = NULL;
+var38 = meth_List_Str__d1ecbd3335_delete_slice(var37,var35,var36);
+string_decref(var39);
+var39.buf = NULL;
+var39 = meth_List_Str__d1ecbd3335_to_string(var38);
+oomph_print(var39);
+decref((var40), dtor_List_Str__d1ecbd3335);
+var40 = NULL;
+var40 = var5;
+incref(var40);
+string_decref(var41);
+var41.buf = NULL;
+var41 = meth_List_Str__d1ecbd3335_to_string(var40);
+oomph_print(var41);
+(void)0;
+var42 = 3LL;
+(void)0;
+var43 = 7LL;
+decref((var44), dtor_List_Str__d1ecbd3335);
+var44 = NULL;
+var44 = var5;
+incref(var44);
+decref((var45), dtor_List_Str__d1ecbd3335);
+var45 = NULL;
+var45 = meth_List_Str__d1ecbd3335_delete_slice(var44,var42,var43);
+string_decref(var46);
+var46.buf = NULL;
+var46 = meth_List_Str__d1ecbd3335_to_string(var45);
+oomph_print(var46);
+decref((var47), dtor_List_Str__d1ecbd3335);
+var47 = NULL;
+var47 = var5;
+incref(var47);
+string_decref(var48);
+var48.buf = NULL;
+var48 = meth_List_Str__d1ecbd3335_to_string(var47);
+oomph_print(var48);
+(void)0;
+var49 = 1LL;
+(void)0;
+var50 = oomph_int_neg(var49);
+(void)0;
+var51 = 2LL;
+decref((var52), dtor_List_Str__d1ecbd3335);
+var52 = NULL;
+var52 = var5;
+incref(var52);
+decref((var53), dtor_List_Str__d1ecbd3335);
+var53 = NULL;
+var53 = meth_List_Str__d1ecbd3335_delete_slice(var52,var50,var51);
+string_decref(var54);
+var54.buf = NULL;
+var54 = meth_List_Str__d1ecbd3335_to_string(var53);
+oomph_print(var54);
+decref((var55), dtor_List_Str__d1ecbd3335);
+var55 = NULL;
+var55 = var5;
+incref(var55);
+string_decref(var56);
+var56.buf = NULL;
+var56 = meth_List_Str__d1ecbd3335_to_string(var55);
+oomph_print(var56);
+out: (void)0;
+string_decref(var56);
+decref((var55), dtor_List_Str__d1ecbd3335);
+string_decref(var54);
+decref((var53), dtor_List_Str__d1ecbd3335);
+decref((var52), dtor_List_Str__d1ecbd3335);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var48);
+decref((var47), dtor_List_Str__d1ecbd3335);
+string_decref(var46);
+decref((var45), dtor_List_Str__d1ecbd3335);
+decref((var44), dtor_List_Str__d1ecbd3335);
+(void)0;
+(void)0;
+string_decref(var41);
+decref((var40), dtor_List_Str__d1ecbd3335);
+string_decref(var39);
+decref((var38), dtor_List_Str__d1ecbd3335);
+decref((var37), dtor_List_Str__d1ecbd3335);
+(void)0;
+(void)0;
+string_decref(var34);
+decref((var33), dtor_List_Str__d1ecbd3335);
+string_decref(var32);
+decref((var31), dtor_List_Str__d1ecbd3335);
+decref((var30), dtor_List_Str__d1ecbd3335);
+(void)0;
+(void)0;
+string_decref(var27);
+string_decref(var26);
+decref((var25), dtor_List_Str__d1ecbd3335);
+decref((var24), dtor_List_Str__d1ecbd3335);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var20);
+decref((var19), dtor_List_Str__d1ecbd3335);
+decref((var18), dtor_List_Str__d1ecbd3335);
+(void)0;
+(void)0;
+string_decref(var15);
+decref((var14), dtor_List_Str__d1ecbd3335);
+decref((var13), dtor_List_Str__d1ecbd3335);
+(void)0;
+(void)0;
+string_decref(var10);
+decref((var9), dtor_List_Str__d1ecbd3335);
+decref((var8), dtor_List_Str__d1ecbd3335);
+(void)0;
+(void)0;
+decref((var5), dtor_List_Str__d1ecbd3335);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+string_decref(var0);
+}
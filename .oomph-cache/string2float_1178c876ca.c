@@ -0,0 +1,96 @@
+#include <lib/oomph.h>
+#include "string2float_1178c876ca.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string012_345_ab24a9c537_buf = {
+                .refcount = -1,
+                .data = (char[]){ 49,50,46,51,52,53 },
+                .malloced = false,
+            };
+            static struct class_Str string012_345_ab24a9c537 = {
+                .buf = &string012_345_ab24a9c537_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_69_0_e26d00853b_buf = {
+                .refcount = -1,
+                .data = (char[]){ 45,54,57,46,48 },
+                .malloced = false,
+            };
+            static struct class_Str string1_69_0_e26d00853b = {
+                .buf = &string1_69_0_e26d00853b_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            double var1;
+            
+            double var2;
+            
+            bool var3;
+            
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            double var6;
+            
+            double var7;
+            
+            double var8;
+            
+            bool var9;
+            
+            struct class_Str var10;
+            var10.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string012_345_ab24a9c537;
+                string_incref(var0);
+                (void)0;
+var1 = meth_Str_to_float(var0);
+(void)0;
+var2 = 12.345;
+(void)0;
+var3 = meth_Float_equals(var1,var2);
+string_decref(var4);
+var4.buf = NULL;
+var4 = meth_Bool_to_string(var3);
+oomph_print(var4);
+string_decref(var5);
+var5.buf = NULL;
+
+                var5 = string1_69_0_e26d00853b;
+                string_incref(var5);
+                (void)0;
+var6 = meth_Str_to_float(var5);
+(void)0;
+var7 = 69.0;
+(void)0;
+var8 = oomph_float_neg(var7);
+(void)0;
+var9 = meth_Float_equals(var6,var8);
+string_decref(var10);
+var10.buf = NULL;
+var10 = meth_Bool_to_string(var9);
+oomph_print(var10);
+out: (void)0;
+string_decref(var10);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var5);
+string_decref(var4);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var0);
+}
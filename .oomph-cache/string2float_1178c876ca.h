@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_string2float_1178c876ca
+            #define HEADER_GUARD_string2float_1178c876ca
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "string2int_17fd0ff6b4.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0123_202cb962ac_buf = {
+                .refcount = -1,
+                .data = (char[]){ 49,50,51 },
+                .malloced = false,
+            };
+            static struct class_Str string0123_202cb962ac = {
+                .buf = &string0123_202cb962ac_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_123_ca044838c4_buf = {
+                .refcount = -1,
+                .data = (char[]){ 45,49,50,51 },
+                .malloced = false,
+            };
+            static struct class_Str string1_123_ca044838c4 = {
+                .buf = &string1_123_ca044838c4_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            int64_t var1;
+            
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            struct class_Str var5;
+            var5.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0123_202cb962ac;
+                string_incref(var0);
+                (void)0;
+var1 = meth_Str_to_int(var0);
+string_decref(var2);
+var2.buf = NULL;
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+string_decref(var3);
+var3.buf = NULL;
+
+                var3 = string1_123_ca044838c4;
+                string_incref(var3);
+                (void)0;
+var4 = meth_Str_to_int(var3);
+string_decref(var5);
+var5.buf = NULL;
+var5 = meth_Int_to_string(var4);
+oomph_print(var5);
+out: (void)0;
+string_decref(var5);
+(void)0;
+string_decref(var3);
+string_decref(var2);
+(void)0;
+string_decref(var0);
+}
@@ -0,0 +1,2018 @@
+#include <lib/oomph.h>
+#include "string_428d6caeba.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__ca8c9dc13d.h"
+
+            static struct StringBuf string0hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ 104,101,108,108,111 },
+                .malloced = false,
+            };
+            static struct class_Str string0hello_5d41402abc = {
+                .buf = &string0hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1__7215ee9c7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ 32 },
+                .malloced = false,
+            };
+            static struct class_Str string1__7215ee9c7d = {
+                .buf = &string1__7215ee9c7d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2world_7d793037a0_buf = {
+                .refcount = -1,
+                .data = (char[]){ 119,111,114,108,100 },
+                .malloced = false,
+            };
+            static struct class_Str string2world_7d793037a0 = {
+                .buf = &string2world_7d793037a0_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3hell_4229d691b0_buf = {
+                .refcount = -1,
+                .data = (char[]){ 104,101,108,108 },
+                .malloced = false,
+            };
+            static struct class_Str string3hell_4229d691b0 = {
+                .buf = &string3hell_4229d691b0_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4hallo_598d4c2004_buf = {
+                .refcount = -1,
+                .data = (char[]){ 104,97,108,108,111 },
+                .malloced = false,
+            };
+            static struct class_Str string4hallo_598d4c2004 = {
+                .buf = &string4hallo_598d4c2004_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5__3590cb8af0_buf = {
+                .refcount = -1,
+                .data = (char[]){ 39 },
+                .malloced = false,
+            };
+            static struct class_Str string5__3590cb8af0 = {
+                .buf = &string5__3590cb8af0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6Length__64b334c692_buf = {
+                .refcount = -1,
+                .data = (char[]){ 76,101,110,103,116,104,58 },
+                .malloced = false,
+            };
+            static struct class_Str string6Length__64b334c692 = {
+                .buf = &string6Length__64b334c692_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7hell__86fe9b6467_buf = {
+                .refcount = -1,
+                .data = (char[]){ 104,101,108,108,195,182 },
+                .malloced = false,
+            };
+            static struct class_Str string7hell__86fe9b6467 = {
+                .buf = &string7hell__86fe9b6467_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string8_d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string8_d41d8cd98f = {
+                .buf = &string8_d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string9UTF_8__65aa9810b9_buf = {
+                .refcount = -1,
+                .data = (char[]){ 85,84,70,45,56,58 },
+                .malloced = false,
+            };
+            static struct class_Str string9UTF_8__65aa9810b9 = {
+                .buf = &string9UTF_8__65aa9810b9_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string10Repeats__1f6bfd3e83_buf = {
+                .refcount = -1,
+                .data = (char[]){ 82,101,112,101,97,116,115,58 },
+                .malloced = false,
+            };
+            static struct class_Str string10Repeats__1f6bfd3e83 = {
+                .buf = &string10Repeats__1f6bfd3e83_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string11abc_900150983c_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97,98,99 },
+                .malloced = false,
+            };
+            static struct class_Str string11abc_900150983c = {
+                .buf = &string11abc_900150983c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string12_in__operator__0d0008e4b2_buf = {
+                .refcount = -1,
+                .data = (char[]){ 39,105,110,39,32,111,112,101,114,97,116,111,114,58 },
+                .malloced = false,
+            };
+            static struct class_Str string12_in__operator__0d0008e4b2 = {
+                .buf = &string12_in__operator__0d0008e4b2_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string13a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97 },
+                .malloced = false,
+            };
+            static struct class_Str string13a_0cc175b9c0 = {
+                .buf = &string13a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string14x_9dd4e46126_buf = {
+                .refcount = -1,
+                .data = (char[]){ 120 },
+                .malloced = false,
+            };
+            static struct class_Str string14x_9dd4e46126 = {
+                .buf = &string14x_9dd4e46126_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string15abcd_e2fc714c47_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97,98,99,100 },
+                .malloced = false,
+            };
+            static struct class_Str string15abcd_e2fc714c47 = {
+                .buf = &string15abcd_e2fc714c47_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string16Starts_with__a2982c6c33_buf = {
+                .refcount = -1,
+                .data = (char[]){ 83,116,97,114,116,115,32,119,105,116,104,58 },
+                .malloced = false,
+            };
+            static struct class_Str string16Starts_with__a2982c6c33 = {
+                .buf = &string16Starts_with__a2982c6c33_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string17ab_187ef44361_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97,98 },
+                .malloced = false,
+            };
+            static struct class_Str string17ab_187ef44361 = {
+                .buf = &string17ab_187ef44361_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string18bc_5360af35bd_buf = {
+                .refcount = -1,
+                .data = (char[]){ 98,99 },
+                .malloced = false,
+            };
+            static struct class_Str string18bc_5360af35bd = {
+                .buf = &string18bc_5360af35bd_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string19abcx_b1a85930d2_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97,98,99,120 },
+                .malloced = false,
+            };
+            static struct class_Str string19abcx_b1a85930d2 = {
+                .buf = &string19abcx_b1a85930d2_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string20xabc_6ffeb24dbe_buf = {
+                .refcount = -1,
+                .data = (char[]){ 120,97,98,99 },
+                .malloced = false,
+            };
+            static struct class_Str string20xabc_6ffeb24dbe = {
+                .buf = &string20xabc_6ffeb24dbe_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string21Ends_with__b00aea687b_buf = {
+                .refcount = -1,
+                .data = (char[]){ 69,110,100,115,32,119,105,116,104,58 },
+                .malloced = false,
+            };
+            static struct class_Str string21Ends_with__b00aea687b = {
+                .buf = &string21Ends_with__b00aea687b_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string22Pad__bb7865f409_buf = {
+                .refcount = -1,
+                .data = (char[]){ 80,97,100,58 },
+                .malloced = false,
+            };
+            static struct class_Str string22Pad__bb7865f409 = {
+                .buf = &string22Pad__bb7865f409_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string23__3389dae361_buf = {
+                .refcount = -1,
+                .data = (char[]){ 42 },
+                .malloced = false,
+            };
+            static struct class_Str string23__3389dae361 = {
+                .buf = &string23__3389dae361_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string24Count__003a36f091_buf = {
+                .refcount = -1,
+                .data = (char[]){ 67,111,117,110,116,58 },
+                .malloced = false,
+            };
+            static struct class_Str string24Count__003a36f091 = {
+                .buf = &string24Count__003a36f091_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string25lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ 108,111,108 },
+                .malloced = false,
+            };
+            static struct class_Str string25lol_9cdfb439c7 = {
+                .buf = &string25lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string26abclolwatlolabc_4bfc9ac00e_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97,98,99,108,111,108,119,97,116,108,111,108,97,98,99 },
+                .malloced = false,
+            };
+            static struct class_Str string26abclolwatlolabc_4bfc9ac00e = {
+                .buf = &string26abclolwatlolabc_4bfc9ac00e_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string27aa_4124bc0a93_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97,97 },
+                .malloced = false,
+            };
+            static struct class_Str string27aa_4124bc0a93 = {
+                .buf = &string27aa_4124bc0a93_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string28aaaa_74b8733745_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97,97,97,97 },
+                .malloced = false,
+            };
+            static struct class_Str string28aaaa_74b8733745 = {
+                .buf = &string28aaaa_74b8733745_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string29b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ 98 },
+                .malloced = false,
+            };
+            static struct class_Str string29b_92eb5ffee6 = {
+                .buf = &string29b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string30Trim__340b46f8ba_buf = {
+                .refcount = -1,
+                .data = (char[]){ 84,114,105,109,58 },
+                .malloced = false,
+            };
+            static struct class_Str string30Trim__340b46f8ba = {
+                .buf = &string30Trim__340b46f8ba_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string31_a__e49736f09a_buf = {
+                .refcount = -1,
+                .data = (char[]){ 32,97,32 },
+                .malloced = false,
+            };
+            static struct class_Str string31_a__e49736f09a = {
+                .buf = &string31_a__e49736f09a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string32Replace__acd2735ded_buf = {
+                .refcount = -1,
+                .data = (char[]){ 82,101,112,108,97,99,101,58 },
+                .malloced = false,
+            };
+            static struct class_Str string32Replace__acd2735ded = {
+                .buf = &string32Replace__acd2735ded_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string33abcab_62f0032f39_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97,98,99,97,98 },
+                .malloced = false,
+            };
+            static struct class_Str string33abcab_62f0032f39 = {
+                .buf = &string33abcab_62f0032f39_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string34aaaaa_594f803b38_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97,97,97,97,97 },
+                .malloced = false,
+            };
+            static struct class_Str string34aaaaa_594f803b38 = {
+                .buf = &string34aaaaa_594f803b38_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string35xxxx_ea416ed075_buf = {
+                .refcount = -1,
+                .data = (char[]){ 120,120,120,120 },
+                .malloced = false,
+            };
+            static struct class_Str string35xxxx_ea416ed075 = {
+                .buf = &string35xxxx_ea416ed075_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string36asdf_912ec803b2_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97,115,100,102 },
+                .malloced = false,
+            };
+            static struct class_Str string36asdf_912ec803b2 = {
+                .buf = &string36asdf_912ec803b2_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_Str var6;
+            var6.buf = NULL;
+
+            bool var7;
+            
+            struct class_Str var8;
+            var8.buf = NULL;
+
+            struct class_Str var9;
+            var9.buf = NULL;
+
+            struct class_Str var10;
+            var10.buf = NULL;
+
+            bool var11;
+            
+            struct class_Str var12;
+            var12.buf = NULL;
+
+            struct class_Str var13;
+            var13.buf = NULL;
+
+            struct class_Str var14;
+            var14.buf = NULL;
+
+            bool var15;
+            
+            struct class_Str var16;
+            var16.buf = NULL;
+
+            struct class_Str var17;
+            var17.buf = NULL;
+
+            struct class_Str var18;
+            var18.buf = NULL;
+
+            struct class_Str var19;
+            var19.buf = NULL;
+
+            int64_t var20;
+            
+            struct class_Str var21;
+            var21.buf = NULL;
+
+            struct class_Str var22;
+            var22.buf = NULL;
+
+            int64_t var23;
+            
+            struct class_Str var24;
+            var24.buf = NULL;
+
+            struct class_Str var25;
+            var25.buf = NULL;
+
+            int64_t var26;
+            
+            struct class_Str var27;
+            var27.buf = NULL;
+
+            struct class_Str var28;
+            var28.buf = NULL;
+
+            struct class_Str var29;
+            var29.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var30;
+            var30 = NULL;
+
+            struct class_Str var31;
+            var31.buf = NULL;
+
+            struct class_Str var32;
+            var32.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var33;
+            var33 = NULL;
+
+            struct class_Str var34;
+            var34.buf = NULL;
+
+            struct class_Str var35;
+            var35.buf = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var36;
+            var36 = NULL;
+
+            struct class_Str var37;
+            var37.buf = NULL;
+
+            struct class_Str var38;
+            var38.buf = NULL;
+
+            int64_t var39;
+            
+            int64_t var40;
+            
+            struct class_Str var41;
+            var41.buf = NULL;
+
+            struct class_Str var42;
+            var42.buf = NULL;
+
+            int64_t var43;
+            
+            struct class_Str var44;
+            var44.buf = NULL;
+
+            struct class_Str var45;
+            var45.buf = NULL;
+
+            int64_t var46;
+            
+            struct class_Str var47;
+            var47.buf = NULL;
+
+            struct class_Str var48;
+            var48.buf = NULL;
+
+            int64_t var49;
+            
+            struct class_Str var50;
+            var50.buf = NULL;
+
+            struct class_Str var51;
+            var51.buf = NULL;
+
+            int64_t var52;
+            
+            struct class_Str var53;
+            var53.buf = NULL;
+
+            struct class_Str var54;
+            var54.buf = NULL;
+
+            int64_t var55;
+            
+            struct class_Str var56;
+            var56.buf = NULL;
+
+            struct class_Str var57;
+            var57.buf = NULL;
+
+            int64_t var58;
+            
+            struct class_Str var59;
+            var59.buf = NULL;
+
+            struct class_Str var60;
+            var60.buf = NULL;
+
+            struct class_Str var61;
+            var61.buf = NULL;
+
+            struct class_Str var62;
+            var62.buf = NULL;
+
+            struct class_Str var63;
+            var63.buf = NULL;
+
+            bool var64;
+            
+            struct class_Str var65;
+            var65.buf = NULL;
+
+            struct class_Str var66;
+            var66.buf = NULL;
+
+            struct class_Str var67;
+            var67.buf = NULL;
+
+            bool var68;
+            
+            struct class_Str var69;
+            var69.buf = NULL;
+
+            struct class_Str var70;
+            var70.buf = NULL;
+
+            struct class_Str var71;
+            var71.buf = NULL;
+
+            bool var72;
+            
+            struct class_Str var73;
+            var73.buf = NULL;
+
+            struct class_Str var74;
+            var74.buf = NULL;
+
+            struct class_Str var75;
+            var75.buf = NULL;
+
+            bool var76;
+            
+            struct class_Str var77;
+            var77.buf = NULL;
+
+            struct class_Str var78;
+            var78.buf = NULL;
+
+            struct class_Str var79;
+            var79.buf = NULL;
+
+            bool var80;
+            
+            struct class_Str var81;
+            var81.buf = NULL;
+
+            struct class_Str var82;
+            var82.buf = NULL;
+
+            struct class_Str var83;
+            var83.buf = NULL;
+
+            bool var84;
+            
+            struct class_Str var85;
+            var85.buf = NULL;
+
+            struct class_Str var86;
+            var86.buf = NULL;
+
+            struct class_Str var87;
+            var87.buf = NULL;
+
+            bool var88;
+            
+            struct class_Str var89;
+            var89.buf = NULL;
+
+            struct class_Str var90;
+            var90.buf = NULL;
+
+            struct class_Str var91;
+            var91.buf = NULL;
+
+            struct class_Str var92;
+            var92.buf = NULL;
+
+            bool var93;
+            
+            struct class_Str var94;
+            var94.buf = NULL;
+
+            struct class_Str var95;
+            var95.buf = NULL;
+
+            struct class_Str var96;
+            var96.buf = NULL;
+
+            bool var97;
+            
+            struct class_Str var98;
+            var98.buf = NULL;
+
+            struct class_Str var99;
+            var99.buf = NULL;
+
+            struct class_Str var100;
+            var100.buf = NULL;
+
+            bool var101;
+            
+            struct class_Str var102;
+            var102.buf = NULL;
+
+            struct class_Str var103;
+            var103.buf = NULL;
+
+            struct class_Str var104;
+            var104.buf = NULL;
+
+            bool var105;
+            
+            struct class_Str var106;
+            var106.buf = NULL;
+
+            struct class_Str var107;
+            var107.buf = NULL;
+
+            struct class_Str var108;
+            var108.buf = NULL;
+
+            bool var109;
+            
+            struct class_Str var110;
+            var110.buf = NULL;
+
+            struct class_Str var111;
+            var111.buf = NULL;
+
+            struct class_Str var112;
+            var112.buf = NULL;
+
+            bool var113;
+            
+            struct class_Str var114;
+            var114.buf = NULL;
+
+            struct class_Str var115;
+            var115.buf = NULL;
+
+            struct class_Str var116;
+            var116.buf = NULL;
+
+            struct class_Str var117;
+            var117.buf = NULL;
+
+            bool var118;
+            
+            struct class_Str var119;
+            var119.buf = NULL;
+
+            struct class_Str var120;
+            var120.buf = NULL;
+
+            struct class_Str var121;
+            var121.buf = NULL;
+
+            bool var122;
+            
+            struct class_Str var123;
+            var123.buf = NULL;
+
+            struct class_Str var124;
+            var124.buf = NULL;
+
+            struct class_Str var125;
+            var125.buf = NULL;
+
+            bool var126;
+            
+            struct class_Str var127;
+            var127.buf = NULL;
+
+            struct class_Str var128;
+            var128.buf = NULL;
+
+            struct class_Str var129;
+            var129.buf = NULL;
+
+            bool var130;
+            
+            struct class_Str var131;
+            var131.buf = NULL;
+
+            struct class_Str var132;
+            var132.buf = NULL;
+
+            struct class_Str var133;
+            var133.buf = NULL;
+
+            bool var134;
+            
+            struct class_Str var135;
+            var135.buf = NULL;
+
+            struct class_Str var136;
+            var136.buf = NULL;
+
+            struct class_Str var137;
+            var137.buf = NULL;
+
+            bool var138;
+            
+            struct class_Str var139;
+            var139.buf = NULL;
+
+            struct class_Str var140;
+            var140.buf = NULL;
+
+            int64_t var141;
+            
+            struct class_Str var142;
+            var142.buf = NULL;
+
+            struct class_Str var143;
+            var143.buf = NULL;
+
+            struct class_Str var144;
+            var144.buf = NULL;
+
+            int64_t var145;
+            
+            struct class_Str var146;
+            var146.buf = NULL;
+
+            struct class_Str var147;
+            var147.buf = NULL;
+
+            struct class_Str var148;
+            var148.buf = NULL;
+
+            int64_t var149;
+            
+            struct class_Str var150;
+            var150.buf = NULL;
+
+            struct class_Str var151;
+            var151.buf = NULL;
+
+            struct class_Str var152;
+            var152.buf = NULL;
+
+            int64_t var153;
+            
+            struct class_Str var154;
+            var154.buf = NULL;
+
+            struct class_Str var155;
+            var155.buf = NULL;
+
+            struct class_Str var156;
+            var156.buf = NULL;
+
+            struct class_Str var157;
+            var157.buf = NULL;
+
+            struct class_Str var158;
+            var158.buf = NULL;
+
+            struct class_Str var159;
+            var159.buf = NULL;
+
+            int64_t var160;
+            
+            struct class_Str var161;
+            var161.buf = NULL;
+
+            struct class_Str var162;
+            var162.buf = NULL;
+
+            struct class_Str var163;
+            var163.buf = NULL;
+
+            int64_t var164;
+            
+            struct class_Str var165;
+            var165.buf = NULL;
+
+            struct class_Str var166;
+            var166.buf = NULL;
+
+            struct class_Str var167;
+            var167.buf = NULL;
+
+            int64_t var168;
+            
+            struct class_Str var169;
+            var169.buf = NULL;
+
+            struct class_Str var170;
+            var170.buf = NULL;
+
+            struct class_Str var171;
+            var171.buf = NULL;
+
+            int64_t var172;
+            
+            struct class_Str var173;
+            var173.buf = NULL;
+
+            struct class_Str var174;
+            var174.buf = NULL;
+
+            struct class_Str var175;
+            var175.buf = NULL;
+
+            struct class_Str var176;
+            var176.buf = NULL;
+
+            struct class_Str var177;
+            var177.buf = NULL;
+
+            struct class_Str var178;
+            var178.buf = NULL;
+
+            struct class_Str var179;
+            var179.buf = NULL;
+
+            struct class_Str var180;
+            var180.buf = NULL;
+
+            struct class_Str var181;
+            var181.buf = NULL;
+
+            struct class_Str var182;
+            var182.buf = NULL;
+
+            struct class_Str var183;
+            var183.buf = NULL;
+
+            struct class_Str var184;
+            var184.buf = NULL;
+
+            struct class_Str var185;
+            var185.buf = NULL;
+
+            struct class_Str var186;
+            var186.buf = NULL;
+
+            struct class_Str var187;
+            var187.buf = NULL;
+
+            struct class_Str var188;
+            var188.buf = NULL;
+
+            struct class_Str var189;
+            var189.buf = NULL;
+
+            struct class_Str var190;
+            var190.buf = NULL;
+
+            struct class_Str var191;
+            var191.buf = NULL;
+
+            struct class_Str var192;
+            var192.buf = NULL;
+
+            struct class_Str var193;
+            var193.buf = NULL;
+
+            struct class_Str var194;
+            var194.buf = NULL;
+
+            struct class_Str var195;
+            var195.buf = NULL;
+
+            struct class_Str var196;
+            var196.buf = NULL;
+
+            struct class_Str var197;
+            var197.buf = NULL;
+
+            struct class_Str var198;
+            var198.buf = NULL;
+
+            struct class_Str var199;
+            var199.buf = NULL;
+
+            struct class_Str var200;
+            var200.buf = NULL;
+
+            struct class_Str var201;
+            var201.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0hello_5d41402abc;
+                string_incref(var0);
+                string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string1__7215ee9c7d;
+                string_incref(var1);
+                string_decref(var2);
+var2.buf = NULL;
+var2 = oomph_string_concat(var0,var1);
+string_decref(var3);
+var3.buf = NULL;
+
+                var3 = string2world_7d793037a0;
+                string_incref(var3);
+                string_decref(var4);
+var4.buf = NULL;
+var4 = oomph_string_concat(var2,var3);
+oomph_print(var4);
+string_decref(var5);
+var5.buf = NULL;
+
+                var5 = string0hello_5d41402abc;
+                string_incref(var5);
+                string_decref(var6);
+var6.buf = NULL;
+
+                var6 = string0hello_5d41402abc;
+                string_incref(var6);
+                (void)0;
+var7 = meth_Str_equals(var5,var6);
+string_decref(var8);
+var8.buf = NULL;
+var8 = meth_Bool_to_string(var7);
+oomph_print(var8);
+string_decref(var9);
+var9.buf = NULL;
+
+                var9 = string0hello_5d41402abc;
+                string_incref(var9);
+                string_decref(var10);
+var10.buf = NULL;
+
+                var10 = string3hell_4229d691b0;
+                string_incref(var10);
+                (void)0;
+var11 = meth_Str_equals(var9,var10);
+string_decref(var12);
+var12.buf = NULL;
+var12 = meth_Bool_to_string(var11);
+oomph_print(var12);
+string_decref(var13);
+var13.buf = NULL;
+
+                var13 = string0hello_5d41402abc;
+                string_incref(var13);
+                string_decref(var14);
+var14.buf = NULL;
+
+                var14 = string4hallo_598d4c2004;
+                string_incref(var14);
+                (void)0;
+var15 = meth_Str_equals(var13,var14);
+string_decref(var16);
+var16.buf = NULL;
+var16 = meth_Bool_to_string(var15);
+oomph_print(var16);
+string_decref(var17);
+var17.buf = NULL;
+
+                var17 = string5__3590cb8af0;
+                string_incref(var17);
+                oomph_print(var17);
+string_decref(var18);
+var18.buf = NULL;
+
+                var18 = string6Length__64b334c692;
+                string_incref(var18);
+                oomph_print(var18);
+string_decref(var19);
+var19.buf = NULL;
+
+                var19 = string0hello_5d41402abc;
+                string_incref(var19);
+                (void)0;
+var20 = meth_Str_length(var19);
+string_decref(var21);
+var21.buf = NULL;
+var21 = meth_Int_to_string(var20);
+oomph_print(var21);
+string_decref(var22);
+var22.buf = NULL;
+
+                var22 = string7hell__86fe9b6467;
+                string_incref(var22);
+                (void)0;
+var23 = meth_Str_length(var22);
+string_decref(var24);
+var24.buf = NULL;
+var24 = meth_Int_to_string(var23);
+oomph_print(var24);
+string_decref(var25);
+var25.buf = NULL;
+
+                var25 = string8_d41d8cd98f;
+                string_incref(var25);
+                (void)0;
+var26 = meth_Str_length(var25);
+string_decref(var27);
+var27.buf = NULL;
+var27 = meth_Int_to_string(var26);
+oomph_print(var27);
+string_decref(var28);
+var28.buf = NULL;
+
+                var28 = string9UTF_8__65aa9810b9;
+                string_incref(var28);
+                oomph_print(var28);
+string_decref(var29);
+var29.buf = NULL;
+
+                var29 = string0hello_5d41402abc;
+                string_incref(var29);
+                decref((var30), dtor_List_Int__ca8c9dc13d);
+var30 = NULL;
+var30 = meth_Str_get_utf8(var29);
+string_decref(var31);
+var31.buf = NULL;
+var31 = meth_List_Int__ca8c9dc13d_to_string(var30);
+oomph_print(var31);
+string_decref(var32);
+var32.buf = NULL;
+
+                var32 = string7hell__86fe9b6467;
+                string_incref(var32);
+                decref((var33), dtor_List_Int__ca8c9dc13d);
+var33 = NULL;
+var33 = meth_Str_get_utf8(var32);
+string_decref(var34);
+var34.buf = NULL;
+var34 = meth_List_Int__ca8c9dc13d_to_string(var33);
+oomph_print(var34);
+string_decref(var35);
+var35.buf = NULL;
+
+                var35 = string8_d41d8cd98f;
+                string_incref(var35);
+                decref((var36), dtor_List_Int__ca8c9dc13d);
+var36 = NULL;
+var36 = meth_Str_get_utf8(var35);
+string_decref(var37);
+var37.buf = NULL;
+var37 = meth_List_Int__ca8c9dc13d_to_string(var36);
+oomph_print(var37);
+string_decref(var38);
+var38.buf = NULL;
+
+                var38 = string10Repeats__1f6bfd3e83;
+                string_incref(var38);
+                oomph_print(var38);
+(void)0;
+var39 = 5LL;
+(void)0;
+var40 = oomph_int_neg(var39);
+string_decref(var41);
+var41.buf = NULL;
+
+                var41 = string11abc_900150983c;
+                string_incref(var41);
+                string_decref(var42);
+var42.buf = NULL;
+var42 = meth_Str_repeat(var41,var40);
+oomph_print(var42);
+(void)0;
+var43 = 0LL;
+string_decref(var44);
+var44.buf = NULL;
+
+                var44 = string11abc_900150983c;
+                string_incref(var44);
+                string_decref(var45);
+var45.buf = NULL;
+var45 = meth_Str_repeat(var44,var43);
+oomph_print(var45);
+(void)0;
+var46 = 1LL;
+string_decref(var47);
+var47.buf = NULL;
+
+                var47 = string11abc_900150983c;
+                string_incref(var47);
+                string_decref(var48);
+var48.buf = NULL;
+var48 = meth_Str_repeat(var47,var46);
+oomph_print(var48);
+(void)0;
+var49 = 2LL;
+string_decref(var50);
+var50.buf = NULL;
+
+                var50 = string11abc_900150983c;
+                string_incref(var50);
+                string_decref(var51);
+var51.buf = NULL;
+var51 = meth_Str_repeat(var50,var49);
+oomph_print(var51);
+(void)0;
+var52 = 3LL;
+string_decref(var53);
+var53.buf = NULL;
+
+                var53 = string11abc_900150983c;
+                string_incref(var53);
+                string_decref(var54);
+var54.buf = NULL;
+var54 = meth_Str_repeat(var53,var52);
+oomph_print(var54);
+(void)0;
+var55 = 4LL;
+string_decref(var56);
+var56.buf = NULL;
+
+                var56 = string11abc_900150983c;
+                string_incref(var56);
+                string_decref(var57);
+var57.buf = NULL;
+var57 = meth_Str_repeat(var56,var55);
+oomph_print(var57);
+(void)0;
+var58 = 5LL;
+string_decref(var59);
+var59.buf = NULL;
+
+                var59 = string11abc_900150983c;
+                string_incref(var59);
+                string_decref(var60);
+var60.buf = NULL;
+var60 = meth_Str_repeat(var59,var58);
+oomph_print(var60);
+string_decref(var61);
+var61.buf = NULL;
+
+                var61 = string12_in__operator__0d0008e4b2;
+                string_incref(var61);
+                oomph_print(var61);
+string_decref(var62);
+var62.buf = NULL;
+
+                var62 = string13a_0cc175b9c0;
+                string_incref(var62);
+                string_decref(var63);
+var63.buf = NULL;
+
+                var63 = string11abc_900150983c;
+                string_incref(var63);
+                (void)0;
+var64 = meth_Str___contains(var63,var62);
+string_decref(var65);
+var65.buf = NULL;
+var65 = meth_Bool_to_string(var64);
+oomph_print(var65);
+string_decref(var66);
+var66.buf = NULL;
+
+                var66 = string14x_9dd4e46126;
+                string_incref(var66);
+                string_decref(var67);
+var67.buf = NULL;
+
+                var67 = string11abc_900150983c;
+                string_incref(var67);
+                (void)0;
+var68 = meth_Str___contains(var67,var66);
+string_decref(var69);
+var69.buf = NULL;
+var69 = meth_Bool_to_string(var68);
+oomph_print(var69);
+string_decref(var70);
+var70.buf = NULL;
+
+                var70 = string11abc_900150983c;
+                string_incref(var70);
+                string_decref(var71);
+var71.buf = NULL;
+
+                var71 = string11abc_900150983c;
+                string_incref(var71);
+                (void)0;
+var72 = meth_Str___contains(var71,var70);
+string_decref(var73);
+var73.buf = NULL;
+var73 = meth_Bool_to_string(var72);
+oomph_print(var73);
+string_decref(var74);
+var74.buf = NULL;
+
+                var74 = string15abcd_e2fc714c47;
+                string_incref(var74);
+                string_decref(var75);
+var75.buf = NULL;
+
+                var75 = string11abc_900150983c;
+                string_incref(var75);
+                (void)0;
+var76 = meth_Str___contains(var75,var74);
+string_decref(var77);
+var77.buf = NULL;
+var77 = meth_Bool_to_string(var76);
+oomph_print(var77);
+string_decref(var78);
+var78.buf = NULL;
+
+                var78 = string8_d41d8cd98f;
+                string_incref(var78);
+                string_decref(var79);
+var79.buf = NULL;
+
+                var79 = string11abc_900150983c;
+                string_incref(var79);
+                (void)0;
+var80 = meth_Str___contains(var79,var78);
+string_decref(var81);
+var81.buf = NULL;
+var81 = meth_Bool_to_string(var80);
+oomph_print(var81);
+string_decref(var82);
+var82.buf = NULL;
+
+                var82 = string13a_0cc175b9c0;
+                string_incref(var82);
+                string_decref(var83);
+var83.buf = NULL;
+
+                var83 = string8_d41d8cd98f;
+                string_incref(var83);
+                (void)0;
+var84 = meth_Str___contains(var83,var82);
+string_decref(var85);
+var85.buf = NULL;
+var85 = meth_Bool_to_string(var84);
+oomph_print(var85);
+string_decref(var86);
+var86.buf = NULL;
+
+                var86 = string8_d41d8cd98f;
+                string_incref(var86);
+                string_decref(var87);
+var87.buf = NULL;
+
+                var87 = string8_d41d8cd98f;
+                string_incref(var87);
+                (void)0;
+var88 = meth_Str___contains(var87,var86);
+string_decref(var89);
+var89.buf = NULL;
+var89 = meth_Bool_to_string(var88);
+oomph_print(var89);
+string_decref(var90);
+var90.buf = NULL;
+
+                var90 = string16Starts_with__a2982c6c33;
+                string_incref(var90);
+                oomph_print(var90);
+string_decref(var91);
+var91.buf = NULL;
+
+                var91 = string17ab_187ef44361;
+                string_incref(var91);
+                string_decref(var92);
+var92.buf = NULL;
+
+                var92 = string11abc_900150983c;
+                string_incref(var92);
+                (void)0;
+var93 = meth_Str_starts_with(var92,var91);
+string_decref(var94);
+var94.buf = NULL;
+var94 = meth_Bool_to_string(var93);
+oomph_print(var94);
+string_decref(var95);
+var95.buf = NULL;
+
+                var95 = string18bc_5360af35bd;
+                string_incref(var95);
+                string_decref(var96);
+var96.buf = NULL;
+
+                var96 = string11abc_900150983c;
+                string_incref(var96);
+                (void)0;
+var97 = meth_Str_starts_with(var96,var95);
+string_decref(var98);
+var98.buf = NULL;
+var98 = meth_Bool_to_string(var97);
+oomph_print(var98);
+string_decref(var99);
+var99.buf = NULL;
+
+                var99 = string11abc_900150983c;
+                string_incref(var99);
+                string_decref(var100);
+var100.buf = NULL;
+
+                var100 = string11abc_900150983c;
+                string_incref(var100);
+                (void)0;
+var101 = meth_Str_starts_with(var100,var99);
+string_decref(var102);
+var102.buf = NULL;
+var102 = meth_Bool_to_string(var101);
+oomph_print(var102);
+string_decref(var103);
+var103.buf = NULL;
+
+                var103 = string8_d41d8cd98f;
+                string_incref(var103);
+                string_decref(var104);
+var104.buf = NULL;
+
+                var104 = string11abc_900150983c;
+                string_incref(var104);
+                (void)0;
+var105 = meth_Str_starts_with(var104,var103);
+string_decref(var106);
+var106.buf = NULL;
+var106 = meth_Bool_to_string(var105);
+oomph_print(var106);
+string_decref(var107);
+var107.buf = NULL;
+
+                var107 = string19abcx_b1a85930d2;
+                string_incref(var107);
+                string_decref(var108);
+var108.buf = NULL;
+
+                var108 = string11abc_900150983c;
+                string_incref(var108);
+                (void)0;
+var109 = meth_Str_starts_with(var108,var107);
+string_decref(var110);
+var110.buf = NULL;
+var110 = meth_Bool_to_string(var109);
+oomph_print(var110);
+string_decref(var111);
+var111.buf = NULL;
+
+                var111 = string20xabc_6ffeb24dbe;
+                string_incref(var111);
+                string_decref(var112);
+var112.buf = NULL;
+
+                var112 = string11abc_900150983c;
+                string_incref(var112);
+                (void)0;
+var113 = meth_Str_starts_with(var112,var111);
+string_decref(var114);
+var114.buf = NULL;
+var114 = meth_Bool_to_string(var113);
+oomph_print(var114);
+string_decref(var115);
+var115.buf = NULL;
+
+                var115 = string21Ends_with__b00aea687b;
+                string_incref(var115);
+                oomph_print(var115);
+string_decref(var116);
+var116.buf = NULL;
+
+                var116 = string17ab_187ef44361;
+                string_incref(var116);
+                string_decref(var117);
+var117.buf = NULL;
+
+                var117 = string11abc_900150983c;
+                string_incref(var117);
+                (void)0;
+var118 = meth_Str_ends_with(var117,var116);
+string_decref(var119);
+var119.buf = NULL;
+var119 = meth_Bool_to_string(var118);
+oomph_print(var119);
+string_decref(var120);
+var120.buf = NULL;
+
+                var120 = string18bc_5360af35bd;
+                string_incref(var120);
+                string_decref(var121);
+var121.buf = NULL;
+
+                var121 = string11abc_900150983c;
+                string_incref(var121);
+                (void)0;
+var122 = meth_Str_ends_with(var121,var120);
+string_decref(var123);
+var123.buf = NULL;
+var123 = meth_Bool_to_string(var122);
+oomph_print(var123);
+string_decref(var124);
+var124.buf = NULL;
+
+                var124 = string11abc_900150983c;
+                string_incref(var124);
+                string_decref(var125);
+var125.buf = NULL;
+
+                var125 = string11abc_900150983c;
+                string_incref(var125);
+                (void)0;
+var126 = meth_Str_ends_with(var125,var124);
+string_decref(var127);
+var127.buf = NULL;
+var127 = meth_Bool_to_string(var126);
+oomph_print(var127);
+string_decref(var128);
+var128.buf = NULL;
+
+                var128 = string8_d41d8cd98f;
+                string_incref(var128);
+                string_decref(var129);
+var129.buf = NULL;
+
+                var129 = string11abc_900150983c;
+                string_incref(var129);
+                (void)0;
+var130 = meth_Str_ends_with(var129,var128);
+string_decref(var131);
+var131.buf = NULL;
+var131 = meth_Bool_to_string(var130);
+oomph_print(var131);
+string_decref(var132);
+var132.buf = NULL;
+
+                var132 = string19abcx_b1a85930d2;
+                string_incref(var132);
+                string_decref(var133);
+var133.buf = NULL;
+
+                var133 = string11abc_900150983c;
+                string_incref(var133);
+                (void)0;
+var134 = meth_Str_ends_with(var133,var132);
+string_decref(var135);
+var135.buf = NULL;
+var135 = meth_Bool_to_string(var134);
+oomph_print(var135);
+string_decref(var136);
+var136.buf = NULL;
+
+                var136 = string20xabc_6ffeb24dbe;
+                string_incref(var136);
+                string_decref(var137);
+var137.buf = NULL;
+
+                var137 = string11abc_900150983c;
+                string_incref(var137);
+                (void)0;
+var138 = meth_Str_ends_with(var137,var136);
+string_decref(var139);
+var139.buf = NULL;
+var139 = meth_Bool_to_string(var138);
+oomph_print(var139);
+string_decref(var140);
+var140.buf = NULL;
+
+                var140 = string22Pad__bb7865f409;
+                string_incref(var140);
+                oomph_print(var140);
+(void)0;
+var141 = 5LL;
+string_decref(var142);
+var142.buf = NULL;
+
+                var142 = string23__3389dae361;
+                string_incref(var142);
+                string_decref(var143);
+var143.buf = NULL;
+
+                var143 = string11abc_900150983c;
+                string_incref(var143);
+                string_decref(var144);
+var144.buf = NULL;
+var144 = meth_Str_left_pad(var143,var141,var142);
+oomph_print(var144);
+(void)0;
+var145 = 5LL;
+string_decref(var146);
+var146.buf = NULL;
+
+                var146 = string23__3389dae361;
+                string_incref(var146);
+                string_decref(var147);
+var147.buf = NULL;
+
+                var147 = string11abc_900150983c;
+                string_incref(var147);
+                string_decref(var148);
+var148.buf = NULL;
+var148 = meth_Str_right_pad(var147,var145,var146);
+oomph_print(var148);
+(void)0;
+var149 = 5LL;
+string_decref(var150);
+var150.buf = NULL;
+
+                var150 = string23__3389dae361;
+                string_incref(var150);
+                string_decref(var151);
+var151.buf = NULL;
+
+                var151 = string11abc_900150983c;
+                string_incref(var151);
+                string_decref(var152);
+var152.buf = NULL;
+var152 = meth_Str_center_pad(var151,var149,var150);
+oomph_print(var152);
+(void)0;
+var153 = 6LL;
+string_decref(var154);
+var154.buf = NULL;
+
+                var154 = string23__3389dae361;
+                string_incref(var154);
+                string_decref(var155);
+var155.buf = NULL;
+
+                var155 = string11abc_900150983c;
+                string_incref(var155);
+                string_decref(var156);
+var156.buf = NULL;
+var156 = meth_Str_center_pad(var155,var153,var154);
+oomph_print(var156);
+string_decref(var157);
+var157.buf = NULL;
+
+                var157 = string24Count__003a36f091;
+                string_incref(var157);
+                oomph_print(var157);
+string_decref(var158);
+var158.buf = NULL;
+
+                var158 = string25lol_9cdfb439c7;
+                string_incref(var158);
+                string_decref(var159);
+var159.buf = NULL;
+
+                var159 = string26abclolwatlolabc_4bfc9ac00e;
+                string_incref(var159);
+                (void)0;
+var160 = meth_Str_count(var159,var158);
+string_decref(var161);
+var161.buf = NULL;
+var161 = meth_Int_to_string(var160);
+oomph_print(var161);
+string_decref(var162);
+var162.buf = NULL;
+
+                var162 = string27aa_4124bc0a93;
+                string_incref(var162);
+                string_decref(var163);
+var163.buf = NULL;
+
+                var163 = string28aaaa_74b8733745;
+                string_incref(var163);
+                (void)0;
+var164 = meth_Str_count(var163,var162);
+string_decref(var165);
+var165.buf = NULL;
+var165 = meth_Int_to_string(var164);
+oomph_print(var165);
+string_decref(var166);
+var166.buf = NULL;
+
+                var166 = string29b_92eb5ffee6;
+                string_incref(var166);
+                string_decref(var167);
+var167.buf = NULL;
+
+                var167 = string28aaaa_74b8733745;
+                string_incref(var167);
+                (void)0;
+var168 = meth_Str_count(var167,var166);
+string_decref(var169);
+var169.buf = NULL;
+var169 = meth_Int_to_string(var168);
+oomph_print(var169);
+string_decref(var170);
+var170.buf = NULL;
+
+                var170 = string8_d41d8cd98f;
+                string_incref(var170);
+                string_decref(var171);
+var171.buf = NULL;
+
+                var171 = string28aaaa_74b8733745;
+                string_incref(var171);
+                (void)0;
+var172 = meth_Str_count(var171,var170);
+string_decref(var173);
+var173.buf = NULL;
+var173 = meth_Int_to_string(var172);
+oomph_print(var173);
+string_decref(var174);
+var174.buf = NULL;
+
+                var174 = string30Trim__340b46f8ba;
+                string_incref(var174);
+                oomph_print(var174);
+string_decref(var175);
+var175.buf = NULL;
+
+                var175 = string31_a__e49736f09a;
+                string_incref(var175);
+                string_decref(var176);
+var176.buf = NULL;
+var176 = meth_Str_left_trim(var175);
+oomph_print(var176);
+string_decref(var177);
+var177.buf = NULL;
+
+                var177 = string31_a__e49736f09a;
+                string_incref(var177);
+                string_decref(var178);
+var178.buf = NULL;
+var178 = meth_Str_right_trim(var177);
+oomph_print(var178);
+string_decref(var179);
+var179.buf = NULL;
+
+                var179 = string31_a__e49736f09a;
+                string_incref(var179);
+                string_decref(var180);
+var180.buf = NULL;
+var180 = meth_Str_trim(var179);
+oomph_print(var180);
+string_decref(var181);
+var181.buf = NULL;
+
+                var181 = string32Replace__acd2735ded;
+                string_incref(var181);
+                oomph_print(var181);
+string_decref(var182);
+var182.buf = NULL;
+
+                var182 = string17ab_187ef44361;
+                string_incref(var182);
+                string_decref(var183);
+var183.buf = NULL;
+
+                var183 = string14x_9dd4e46126;
+                string_incref(var183);
+                string_decref(var184);
+var184.buf = NULL;
+
+                var184 = string33abcab_62f0032f39;
+                string_incref(var184);
+                string_decref(var185);
+var185.buf = NULL;
+var185 = meth_Str_replace(var184,var182,var183);
+oomph_print(var185);
+string_decref(var186);
+var186.buf = NULL;
+
+                var186 = string27aa_4124bc0a93;
+                string_incref(var186);
+                string_decref(var187);
+var187.buf = NULL;
+
+                var187 = string14x_9dd4e46126;
+                string_incref(var187);
+                string_decref(var188);
+var188.buf = NULL;
+
+                var188 = string34aaaaa_594f803b38;
+                string_incref(var188);
+                string_decref(var189);
+var189.buf = NULL;
+var189 = meth_Str_replace(var188,var186,var187);
+oomph_print(var189);
+string_decref(var190);
+var190.buf = NULL;
+
+                var190 = string27aa_4124bc0a93;
+                string_incref(var190);
+                string_decref(var191);
+var191.buf = NULL;
+
+                var191 = string14x_9dd4e46126;
+                string_incref(var191);
+                string_decref(var192);
+var192.buf = NULL;
+
+                var192 = string28aaaa_74b8733745;
+                string_incref(var192);
+                string_decref(var193);
+var193.buf = NULL;
+var193 = meth_Str_replace(var192,var190,var191);
+oomph_print(var193);
+string_decref(var194);
+var194.buf = NULL;
+
+                var194 = string27aa_4124bc0a93;
+                string_incref(var194);
+                string_decref(var195);
+var195.buf = NULL;
+
+                var195 = string35xxxx_ea416ed075;
+                string_incref(var195);
+                string_decref(var196);
+var196.buf = NULL;
+
+                var196 = string28aaaa_74b8733745;
+                string_incref(var196);
+                string_decref(var197);
+var197.buf = NULL;
+var197 = meth_Str_replace(var196,var194,var195);
+oomph_print(var197);
+string_decref(var198);
+var198.buf = NULL;
+
+                var198 = string8_d41d8cd98f;
+                string_incref(var198);
+                string_decref(var199);
+var199.buf = NULL;
+
+                var199 = string14x_9dd4e46126;
+                string_incref(var199);
+                string_decref(var200);
+var200.buf = NULL;
+
+                var200 = string36asdf_912ec803b2;
+                string_incref(var200);
+                string_decref(var201);
+var201.buf = NULL;
+var201 = meth_Str_replace(var200,var198,var199);
+oomph_print(var201);
+out: (void)0;
+string_decref(var201);
+string_decref(var200);
+string_decref(var199);
+string_decref(var198);
+string_decref(var197);
+string_decref(var196);
+string_decref(var195);
+string_decref(var194);
+string_decref(var193);
+string_decref(var192);
+string_decref(var191);
+string_decref(var190);
+string_decref(var189);
+string_decref(var188);
+string_decref(var187);
+string_decref(var186);
+string_decref(var185);
+string_decref(var184);
+string_decref(var183);
+string_decref(var182);
+string_decref(var181);
+string_decref(var180);
+string_decref(var179);
+string_decref(var178);
+string_decref(var177);
+string_decref(var176);
+string_decref(var175);
+string_decref(var174);
+string_decref(var173);
+(void)0;
+string_decref(var171);
+string_decref(var170);
+string_decref(var169);
+(void)0;
+string_decref(var167);
+string_decref(var166);
+string_decref(var165);
+(void)0;
+string_decref(var163);
+string_decref(var162);
+string_decref(var161);
+(void)0;
+string_decref(var159);
+string_decref(var158);
+string_decref(var157);
+string_decref(var156);
+string_decref(var155);
+string_decref(var154);
+(void)0;
+string_decref(var152);
+string_decref(var151);
+string_decref(var150);
+(void)0;
+string_decref(var148);
+string_decref(var147);
+string_decref(var146);
+(void)0;
+string_decref(var144);
+string_decref(var143);
+string_decref(var142);
+(void)0;
+string_decref(var140);
+string_decref(var139);
+(void)0;
+string_decref(var137);
+string_decref(var136);
+string_decref(var135);
+(void)0;
+string_decref(var133);
+string_decref(var132);
+string_decref(var131);
+(void)0;
+string_decref(var129);
+string_decref(var128);
+string_decref(var127);
+(void)0;
+string_decref(var125);
+string_decref(var124);
+string_decref(var123);
+(void)0;
+string_decref(var121);
+string_decref(var120);
+string_decref(var119);
+(void)0;
+string_decref(var117);
+string_decref(var116);
+string_decref(var115);
+string_decref(var114);
+(void)0;
+string_decref(var112);
+string_decref(var111);
+string_decref(var110);
+(void)0;
+string_decref(var108);
+string_decref(var107);
+string_decref(var106);
+(void)0;
+string_decref(var104);
+string_decref(var103);
+string_decref(var102);
+(void)0;
+string_decref(var100);
+string_decref(var99);
+string_decref(var98);
+(void)0;
+string_decref(var96);
+string_decref(var95);
+string_decref(var94);
+(void)0;
+string_decref(var92);
+string_decref(var91);
+string_decref(var90);
+string_decref(var89);
+(void)0;
+string_decref(var87);
+string_decref(var86);
+string_decref(var85);
+(void)0;
+string_decref(var83);
+string_decref(var82);
+string_decref(var81);
+(void)0;
+string_decref(var79);
+string_decref(var78);
+string_decref(var77);
+(void)0;
+string_decref(var75);
+string_decref(var74);
+string_decref(var73);
+(void)0;
+string_decref(var71);
+string_decref(var70);
+string_decref(var69);
+(void)0;
+string_decref(var67);
+string_decref(var66);
+string_decref(var65);
+(void)0;
+string_decref(var63);
+string_decref(var62);
+string_decref(var61);
+string_decref(var60);
+string_decref(var59);
+(void)0;
+string_decref(var57);
+string_decref(var56);
+(void)0;
+string_decref(var54);
+string_decref(var53);
+(void)0;
+string_decref(var51);
+string_decref(var50);
+(void)0;
+string_decref(var48);
+string_decref(var47);
+(void)0;
+string_decref(var45);
+string_decref(var44);
+(void)0;
+string_decref(var42);
+string_decref(var41);
+(void)0;
+(void)0;
+string_decref(var38);
+string_decref(var37);
+decref((var36), dtor_List_Int__ca8c9dc13d);
+string_decref(var35);
+string_decref(var34);
+decref((var33), dtor_List_Int__ca8c9dc13d);
+string_decref(var32);
+string_decref(var31);
+decref((var30), dtor_List_Int__ca8c9dc13d);
+string_decref(var29);
+string_decref(var28);
+string_decref(var27);
+(void)0;
+string_decref(var25);
+string_decref(var24);
+(void)0;
+string_decref(var22);
+string_decref(var21);
+(void)0;
+string_decref(var19);
+string_decref(var18);
+string_decref(var17);
+string_decref(var16);
+(void)0;
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+(void)0;
+string_decref(var10);
+string_decref(var9);
+string_decref(var8);
+(void)0;
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+string_decref(var0);
+}
@@ -0,0 +1,13 @@
+
+            #ifndef HEADER_GUARD_string_428d6caeba
+            #define HEADER_GUARD_string_428d6caeba
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Int__ca8c9dc13d.h"
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+struct class_List_Int__ca8c9dc13d;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
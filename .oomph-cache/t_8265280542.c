@@ -0,0 +1,41 @@
+#include <lib/oomph.h>
+#include "t_8265280542.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__ca8c9dc13d.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            struct class_List_Int__ca8c9dc13d* var2;
+            var2 = NULL;
+
+            struct class_List_Int__ca8c9dc13d* var3;
+            var3 = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+decref((var2), dtor_List_Int__ca8c9dc13d);
+var2 = NULL;
+var2 = ctor_List_Int__ca8c9dc13d();
+meth_List_Int__ca8c9dc13d_push(var2,var0);
+meth_List_Int__ca8c9dc13d_push(var2,var1);
+decref((var3), dtor_List_Int__ca8c9dc13d);
+var3 = NULL;
+var3 = var2;
+incref(var3);
+string_decref(var4);
+var4.buf = NULL;
+var4 = meth_List_Int__ca8c9dc13d_to_string(var3);
+oomph_print(var4);
+out: (void)0;
+string_decref(var4);
+decref((var3), dtor_List_Int__ca8c9dc13d);
+decref((var2), dtor_List_Int__ca8c9dc13d);
+(void)0;
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_to_string_3e110e7d02
+            #define HEADER_GUARD_to_string_3e110e7d02
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,98 @@
+#include <lib/oomph.h>
+#include "trailing_comma_8b21ec9237.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__d1ecbd3335.h"
+
+            static struct StringBuf string0hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ 104,101,108,108,111 },
+                .malloced = false,
+            };
+            static struct class_Str string0hello_5d41402abc = {
+                .buf = &string0hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1world_7d793037a0_buf = {
+                .refcount = -1,
+                .data = (char[]){ 119,111,114,108,100 },
+                .malloced = false,
+            };
+            static struct class_Str string1world_7d793037a0 = {
+                .buf = &string1world_7d793037a0_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var2;
+            var2 = NULL;
+
+            struct class_Str var3;
+            var3.buf = NULL;
+
+            struct class_Str var4;
+            var4.buf = NULL;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+
+            struct class_List_Str__d1ecbd3335* var6;
+            var6 = NULL;
+
+            struct class_Str var7;
+            var7.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0hello_5d41402abc;
+                string_incref(var0);
+                oomph_print(var0);
+string_decref(var1);
+var1.buf = NULL;
+
+                var1 = string0hello_5d41402abc;
+                string_incref(var1);
+                decref((var2), dtor_List_Str__d1ecbd3335);
+var2 = NULL;
+var2 = ctor_List_Str__d1ecbd3335();
+meth_List_Str__d1ecbd3335_push(var2,var1);
+string_decref(var3);
+var3.buf = NULL;
+var3 = meth_List_Str__d1ecbd3335_to_string(var2);
+oomph_print(var3);
+string_decref(var4);
+var4.buf = NULL;
+
+                var4 = string0hello_5d41402abc;
+                string_incref(var4);
+                string_decref(var5);
+var5.buf = NULL;
+
+                var5 = string1world_7d793037a0;
+                string_incref(var5);
+                decref((var6), dtor_List_Str__d1ecbd3335);
+var6 = NULL;
+var6 = ctor_List_Str__d1ecbd3335();
+meth_List_Str__d1ecbd3335_push(var6,var4);
+meth_List_Str__d1ecbd3335_push(var6,var5);
+string_decref(var7);
+var7.buf = NULL;
+var7 = meth_List_Str__d1ecbd3335_to_string(var6);
+oomph_print(var7);
+out: (void)0;
+string_decref(var7);
+decref((var6), dtor_List_Str__d1ecbd3335);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+decref((var2), dtor_List_Str__d1ecbd3335);
+string_decref(var1);
+string_decref(var0);
+}
@@ -0,0 +1,31 @@
+#include <lib/oomph.h>
+#include "trailing_ws_51b944733a.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            struct class_Str var1;
+            var1.buf = NULL;
+
+            int64_t var2;
+            
+            struct class_Str var3;
+            var3.buf = NULL;
+(void)0;
+var0 = 1LL;
+string_decref(var1);
+var1.buf = NULL;
+var1 = meth_Int_to_string(var0);
+oomph_print(var1);
+(void)0;
+var2 = 2LL;
+string_decref(var3);
+var3.buf = NULL;
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+out: (void)0;
+string_decref(var3);
+(void)0;
+string_decref(var1);
+(void)0;
+}
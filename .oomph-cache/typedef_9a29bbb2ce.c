@@ -0,0 +1,31 @@
+#include <lib/oomph.h>
+#include "typedef_9a29bbb2ce.h"
+#include "builtins_8da1dac06a.h"
+#include "_null___Int__080690ac15.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            struct class__null___Int__080690ac15 var1;
+            var1.membernum = -1;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+(void)0;
+var0 = 123LL;
+decref__null___Int__080690ac15(var1);
+var1.membernum = -1;
+
+                var1 = (struct class__null___Int__080690ac15) {
+                    .val = { .item1 = var0 },
+                    .membernum = 1,
+                };
+                (void)0;
+string_decref(var2);
+var2.buf = NULL;
+var2 = meth__null___Int__080690ac15_to_string(var1);
+oomph_print(var2);
+out: (void)0;
+string_decref(var2);
+decref__null___Int__080690ac15(var1);
+(void)0;
+}
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_typedef_9a29bbb2ce
+            #define HEADER_GUARD_typedef_9a29bbb2ce
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_null___Int__080690ac15.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
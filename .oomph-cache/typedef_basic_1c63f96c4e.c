@@ -0,0 +1,26 @@
+#include <lib/oomph.h>
+#include "typedef_basic_1c63f96c4e.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string0lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ 108,111,108 },
+                .malloced = false,
+            };
+            static struct class_Str string0lol_9cdfb439c7 = {
+                .buf = &string0lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0lol_9cdfb439c7;
+                string_incref(var0);
+                oomph_print(var0);
+out: (void)0;
+string_decref(var0);
+}
@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_typedef_basic_1c63f96c4e
+            #define HEADER_GUARD_typedef_basic_1c63f96c4e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "typedef_optional_d44af7b69a.h"
+#include "builtins_8da1dac06a.h"
+#include "_null___Int__080690ac15.h"
+#include "Bar_503f9c8c1f.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            struct class__null___Int__080690ac15 var1;
+            var1.membernum = -1;
+
+            struct class_Str var2;
+            var2.buf = NULL;
+
+            int64_t var3;
+            
+            struct class_Bar_503f9c8c1f var4;
+            var4.membernum = -1;
+
+            struct class_Str var5;
+            var5.buf = NULL;
+(void)0;
+var0 = 123LL;
+decref__null___Int__080690ac15(var1);
+var1.membernum = -1;
+
+                var1 = (struct class__null___Int__080690ac15) {
+                    .val = { .item1 = var0 },
+                    .membernum = 1,
+                };
+                (void)0;
+string_decref(var2);
+var2.buf = NULL;
+var2 = meth__null___Int__080690ac15_to_string(var1);
+oomph_print(var2);
+(void)0;
+var3 = 123LL;
+decref_Bar_503f9c8c1f(var4);
+var4.membernum = -1;
+
+                var4 = (struct class_Bar_503f9c8c1f) {
+                    .val = { .item0 = var3 },
+                    .membernum = 0,
+                };
+                (void)0;
+string_decref(var5);
+var5.buf = NULL;
+var5 = meth_Bar_503f9c8c1f_to_string(var4);
+oomph_print(var5);
+out: (void)0;
+string_decref(var5);
+decref_Bar_503f9c8c1f(var4);
+(void)0;
+string_decref(var2);
+decref__null___Int__080690ac15(var1);
+(void)0;
+}
@@ -0,0 +1,11 @@
+
+            #ifndef HEADER_GUARD_typedef_optional_d44af7b69a
+            #define HEADER_GUARD_typedef_optional_d44af7b69a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_null___Int__080690ac15.h"
+#include "Bar_503f9c8c1f.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
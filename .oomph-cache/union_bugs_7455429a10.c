@@ -0,0 +1,92 @@
+#include <lib/oomph.h>
+#include "union_bugs_7455429a10.h"
+#include "builtins_8da1dac06a.h"
+#include "Thing_dac0818e25.h"
+#include "Bar_ddc35f88fa.h"
+#include "Foo_1356c67d7a.h"
+struct class_Thing_dac0818e25 union_bugs_7455429a10_do_nothing(struct class_Thing_dac0818e25 var0){
+            struct class_Thing_dac0818e25 var1;
+            var1.membernum = -1;
+
+            struct class_Thing_dac0818e25 var2;
+            var2.membernum = -1;
+
+            struct class_Thing_dac0818e25 retval;
+            var1 = var0;
+incref_Thing_dac0818e25(var1);
+decref_Thing_dac0818e25(var2);
+var2.membernum = -1;
+var2 = var1;
+incref_Thing_dac0818e25(var2);
+
+                        incref_Thing_dac0818e25(var2);
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+decref_Thing_dac0818e25(var2);
+decref_Thing_dac0818e25(var1);
+return retval;
+}
+struct class_Thing_dac0818e25 union_bugs_7455429a10_make_thing(void){
+            struct class_Bar_ddc35f88fa* var0;
+            var0 = NULL;
+
+            struct class_Thing_dac0818e25 var1;
+            var1.membernum = -1;
+
+            struct class_Thing_dac0818e25 retval;
+            decref((var0), dtor_Bar_ddc35f88fa);
+var0 = NULL;
+var0 = ctor_Bar_ddc35f88fa();
+decref_Thing_dac0818e25(var1);
+var1.membernum = -1;
+
+                var1 = (struct class_Thing_dac0818e25) {
+                    .val = { .item1 = var0 },
+                    .membernum = 1,
+                };
+                incref(var0);
+
+                        incref_Thing_dac0818e25(var1);
+                        retval = var1;
+                        goto out;
+                        out: (void)0;
+decref_Thing_dac0818e25(var1);
+decref((var0), dtor_Bar_ddc35f88fa);
+return retval;
+}
+void oomph_main(void){
+            struct class_Foo_1356c67d7a* var0;
+            var0 = NULL;
+
+            struct class_Thing_dac0818e25 var1;
+            var1.membernum = -1;
+
+            struct class_Thing_dac0818e25 var2;
+            var2.membernum = -1;
+
+            struct class_Thing_dac0818e25 var3;
+            var3.membernum = -1;
+decref((var0), dtor_Foo_1356c67d7a);
+var0 = NULL;
+var0 = ctor_Foo_1356c67d7a();
+decref_Thing_dac0818e25(var1);
+var1.membernum = -1;
+
+                var1 = (struct class_Thing_dac0818e25) {
+                    .val = { .item0 = var0 },
+                    .membernum = 0,
+                };
+                incref(var0);
+decref_Thing_dac0818e25(var2);
+var2.membernum = -1;
+var2 = union_bugs_7455429a10_do_nothing(var1);
+decref_Thing_dac0818e25(var3);
+var3.membernum = -1;
+var3 = union_bugs_7455429a10_make_thing();
+out: (void)0;
+decref_Thing_dac0818e25(var3);
+decref_Thing_dac0818e25(var2);
+decref_Thing_dac0818e25(var1);
+decref((var0), dtor_Foo_1356c67d7a);
+}
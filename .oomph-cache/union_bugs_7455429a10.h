@@ -0,0 +1,16 @@
+
+            #ifndef HEADER_GUARD_union_bugs_7455429a10
+            #define HEADER_GUARD_union_bugs_7455429a10
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Thing_dac0818e25.h"
+#include "Bar_ddc35f88fa.h"
+#include "Foo_1356c67d7a.h"
+struct class_Bar_ddc35f88fa;
+struct class_Foo_1356c67d7a;
+struct class_Thing_dac0818e25 union_bugs_7455429a10_do_nothing(struct class_Thing_dac0818e25 var0);
+struct class_Thing_dac0818e25 union_bugs_7455429a10_make_thing(void);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,68 @@
+#include <lib/oomph.h>
+#include "union_segfault_bug_e59117c25b.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_395a93451f.h"
+
+            static struct StringBuf string0a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ 97 },
+                .malloced = false,
+            };
+            static struct class_Str string0a_0cc175b9c0 = {
+                .buf = &string0a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            void oomph_main(void){
+            struct class_Str var0;
+            var0.buf = NULL;
+
+            struct class_Foo_395a93451f var1;
+            var1.membernum = -1;
+
+            int64_t var2;
+            
+            struct class_Foo_395a93451f var3;
+            var3.membernum = -1;
+
+            bool var4;
+            
+            struct class_Str var5;
+            var5.buf = NULL;
+string_decref(var0);
+var0.buf = NULL;
+
+                var0 = string0a_0cc175b9c0;
+                string_incref(var0);
+                decref_Foo_395a93451f(var1);
+var1.membernum = -1;
+
+                var1 = (struct class_Foo_395a93451f) {
+                    .val = { .item0 = var0 },
+                    .membernum = 0,
+                };
+                string_incref(var0);
+(void)0;
+var2 = 1LL;
+decref_Foo_395a93451f(var3);
+var3.membernum = -1;
+
+                var3 = (struct class_Foo_395a93451f) {
+                    .val = { .item1 = var2 },
+                    .membernum = 1,
+                };
+                (void)0;
+(void)0;
+var4 = meth_Foo_395a93451f_equals(var1,var3);
+string_decref(var5);
+var5.buf = NULL;
+var5 = meth_Bool_to_string(var4);
+oomph_print(var5);
+out: (void)0;
+string_decref(var5);
+(void)0;
+decref_Foo_395a93451f(var3);
+(void)0;
+decref_Foo_395a93451f(var1);
+string_decref(var0);
+}
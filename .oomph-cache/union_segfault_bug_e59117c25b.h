@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_union_segfault_bug_e59117c25b
+            #define HEADER_GUARD_union_segfault_bug_e59117c25b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_395a93451f.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pathlib
+import time
+from typing import List
+
+from pyoomph import ast2ir, ast_transformer, parser
+
+# Usage: python3 -m benchmarks.ast2ir
+#
+# Converts generated functions of different lengths to IR. Every few lines
+# create lists whose item types are figured out later, so the automatic types
+# must be matched and resolved. The time per line should stay about the same,
+# because the conversion should take linear time.
+
+_ROUNDS = 3
+_PATH = pathlib.Path("generated.oomph")
+
+
+def _long_function(block_count: int) -> str:
+    code = "func f():\n"
+    for i in range(block_count):
+        code += f"    let a{i} = []\n"
+        code += f"    let b{i} = []\n"
+        code += f"    a{i} = b{i}\n"
+        code += f"    b{i}.push({i})\n"
+        code += f"    print(a{i}.length())\n"
+    return code
+
+
+def main() -> None:
+    for block_count in [250, 500, 1000, 2000]:
+        code = _long_function(block_count)
+        times: List[float] = []
+        for i in range(_ROUNDS):
+            # The conversion changes the AST, so it needs a new AST every time
+            decls = parser.parse_file(code, _PATH, None)
+            ast_transformer.transform_file(decls)
+            start = time.perf_counter()
+            ast2ir.convert_program(decls, _PATH, [])
+            times.append(time.perf_counter() - start)
+
+        line_count = len(code.splitlines())
+        best = min(times)
+        print(
+            f"{line_count} lines: best of {_ROUNDS}: {best * 1000:.1f}ms,"
+            f" {best / line_count * 1e6:.1f}us per line"
+        )
+
+
+if __name__ == "__main__":
+    main()
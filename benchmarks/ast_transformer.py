@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pathlib
+import time
+from typing import List
+
+from pyoomph import ast_transformer, parser
+
+# Usage: python3 -m benchmarks.ast_transformer
+#
+# Transforms the ASTs of the self-hosted compiler files put together 1, 2, 4
+# and 8 times. The time per line should stay about the same, because the
+# transform should take linear time.
+
+_ROUNDS = 5
+
+
+def main() -> None:
+    code = ""
+    for path in sorted(pathlib.Path("self_hosted").glob("*.oomph")):
+        lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+        code += "".join(line for line in lines if not line.startswith("import "))
+    path = pathlib.Path("big.oomph")
+
+    for copies in [1, 2, 4, 8]:
+        times: List[float] = []
+        for i in range(_ROUNDS):
+            # The transform changes the AST, so it needs a new AST every time
+            decls = parser.parse_file(code * copies, path, None)
+            start = time.perf_counter()
+            ast_transformer.transform_file(decls)
+            times.append(time.perf_counter() - start)
+
+        line_count = len(code.splitlines()) * copies
+        best = min(times)
+        print(
+            f"{line_count} lines: best of {_ROUNDS}: {best * 1000:.1f}ms,"
+            f" {best / line_count * 1e6:.2f}us per line"
+        )
+
+
+if __name__ == "__main__":
+    main()
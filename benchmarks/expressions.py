@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pathlib
+import time
+from typing import List
+
+from pyoomph import parser
+
+# Usage: python3 -m benchmarks.expressions
+#
+# Parses generated code with long expressions, and generated code with lots
+# of string formatting. String formatting should be about as fast as the same
+# expressions without a string.
+
+_ROUNDS = 3
+_PATH = pathlib.Path("generated.oomph")
+
+
+def _long_expressions(operand_count: int) -> str:
+    operators = ["+", "*", "-", "/", "mod"]
+    expr = "x0"
+    for i in range(1, operand_count):
+        expr += f" {operators[i % len(operators)]} x{i}"
+    return "func f():\n" + f"    let a = {expr}\n" * 10
+
+
+def _string_formatting(line_count: int) -> str:
+    line = '    print("x = {x}, y = {y + 1}, z = {foo(z) * 2} and {a.b}")\n'
+    return "func f():\n" + line * line_count
+
+
+def _same_without_string(line_count: int) -> str:
+    line = "    print(x, y + 1, foo(z) * 2, a.b)\n"
+    return "func f():\n" + line * line_count
+
+
+def _benchmark(name: str, code: str) -> None:
+    times: List[float] = []
+    for i in range(_ROUNDS):
+        start = time.perf_counter()
+        parser.parse_file(code, _PATH, None)
+        times.append(time.perf_counter() - start)
+    print(f"{name}: best of {_ROUNDS}: {min(times) * 1000:.1f}ms")
+
+
+def main() -> None:
+    for operand_count in [100, 1000, 5000]:
+        _benchmark(
+            f"10 expressions with {operand_count} operands",
+            _long_expressions(operand_count),
+        )
+    _benchmark("5000 lines of string formatting", _string_formatting(5000))
+    _benchmark(
+        "5000 lines of the same expressions without strings",
+        _same_without_string(5000),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pathlib
+import time
+
+from pyoomph import incremental
+
+# Usage: python3 -m benchmarks.incremental
+#
+# Renames variables all around the self-hosted compiler, one key press at a
+# time, and parses after each key press. The variables are spread evenly, so
+# some of them are in small functions and some are in big classes.
+
+_STDLIB = pathlib.Path("stdlib")
+_EDITS_PER_FILE = 10
+_TYPED = "_new"
+
+
+def main() -> None:
+    full_time = 0.0
+    incremental_time = 0.0
+    key_presses = 0
+
+    for path in sorted(pathlib.Path("self_hosted").glob("*.oomph")):
+        code = path.read_text(encoding="utf-8")
+        parsed = incremental.parse(code, path, _STDLIB)
+
+        for edit in range(_EDITS_PER_FILE):
+            # Add characters to end of a variable name
+            position = code.find("let ", len(code) * edit // _EDITS_PER_FILE)
+            if position == -1:
+                continue
+            position = code.index(" ", position + len("let "))
+
+            for character in _TYPED:
+                new_code = code[:position] + character + code[position:]
+
+                start = time.perf_counter()
+                incremental.parse(new_code, path, _STDLIB)
+                full_time += time.perf_counter() - start
+
+                start = time.perf_counter()
+                parsed = incremental.reparse(
+                    parsed, new_code, position, position, position + 1
+                )
+                incremental_time += time.perf_counter() - start
+
+                code = new_code
+                position += 1
+                key_presses += 1
+
+        assert repr(parsed.decls) == repr(incremental.parse(code, path, _STDLIB).decls)
+
+    print(f"{key_presses} key presses")
+    print(f"parsing everything: {full_time / key_presses * 1000:.1f}ms per key press")
+    print(
+        f"incremental:        {incremental_time / key_presses * 1000:.1f}ms per key press"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pathlib
+import time
+import tracemalloc
+from typing import List
+
+from pyoomph import parser
+
+# Usage: python3 -m benchmarks.parser
+#
+# Tokenizes and parses one big file, made by putting together the files of
+# the self-hosted compiler a few times. Imports are left out, because they
+# must be at the start of the file.
+
+_ROUNDS = 5
+_COPIES = 4
+
+
+def main() -> None:
+    code = ""
+    for path in sorted(pathlib.Path("self_hosted").glob("*.oomph")):
+        lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+        code += "".join(line for line in lines if not line.startswith("import "))
+    code *= _COPIES
+    path = pathlib.Path("big.oomph")
+
+    times: List[float] = []
+    for i in range(_ROUNDS):
+        start = time.perf_counter()
+        parser.parse_file(code, path, None)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    parser.parse_file(code, path, None)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{len(code.splitlines())} lines")
+    print(f"best of {_ROUNDS}: {min(times) * 1000:.1f}ms")
+    print(f"peak memory usage: {peak / (1024 * 1024):.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
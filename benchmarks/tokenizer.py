@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import pathlib
+import time
+from typing import List
+
+from pyoomph import tokenizer
+
+# Usage: python3 -m benchmarks.tokenizer
+#
+# Tokenizes the self-hosted compiler, which is the biggest oomph code base
+# there is. Prints the best of a few runs, because other programs running
+# at the same time can only make things slower.
+
+_ROUNDS = 10
+
+
+def main() -> None:
+    paths = sorted(pathlib.Path("self_hosted").glob("*.oomph"))
+    codes = [path.read_text(encoding="utf-8") for path in paths]
+    token_count = sum(len(tokenizer.tokenize(code)) for code in codes)
+
+    times: List[float] = []
+    for i in range(_ROUNDS):
+        start = time.perf_counter()
+        for code in codes:
+            tokenizer.tokenize(code)
+        times.append(time.perf_counter() - start)
+
+    best = min(times)
+    print(f"{len(paths)} files, {token_count} tokens")
+    print(f"best of {_ROUNDS}: {best * 1000:.1f}ms ({token_count / best:.0f} tokens/s)")
+
+
+if __name__ == "__main__":
+    main()
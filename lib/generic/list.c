@@ -37,15 +37,12 @@ bool METHOD(equals)(TYPE self, TYPE other)
 	return true;
 }
 
-static void set_length(TYPE self, int64_t n)
+// Helper functions are named with METHOD() too, so that they don't conflict
+// when lists of different types end up in the same .c file (see --unity)
+static void METHOD(_set_alloc)(TYPE self, int64_t alloc)
 {
-	assert(n >= 0);
-	self->len = n;
-
-	if (self->alloc >= n)
-		return;
-	while (self->alloc < n)
-		self->alloc *= 2;
+	assert(alloc > self->alloc);
+	self->alloc = alloc;
 
 	if (self->data == self->smalldata) {
 		self->data = malloc(self->alloc * sizeof(self->data[0]));
@@ -57,9 +54,30 @@ static void set_length(TYPE self, int64_t n)
 	}
 }
 
+static void METHOD(_set_length)(TYPE self, int64_t n)
+{
+	assert(n >= 0);
+	self->len = n;
+
+	if (self->alloc >= n)
+		return;
+	int64_t alloc = self->alloc;
+	while (alloc < n)
+		alloc *= 2;
+	METHOD(_set_alloc)(self, alloc);
+}
+
+// Makes room for n items in total, so that pushing up to n items doesn't
+// allocate. Used when the length is known beforehand (list comprehensions).
+void METHOD(__reserve)(TYPE self, int64_t n)
+{
+	if (n > self->alloc)
+		METHOD(_set_alloc)(self, n);
+}
+
 void METHOD(push)(TYPE self, ITEMTYPE val)
 {
-	set_length(self, self->len + 1);
+	METHOD(_set_length)(self, self->len + 1);
 	self->data[self->len - 1] = val;
 	INCREF_ITEM(val);
 }
@@ -67,7 +85,7 @@ void METHOD(push)(TYPE self, ITEMTYPE val)
 void METHOD(push_all)(TYPE self, TYPE src)
 {
 	int64_t oldlen = self->len;
-	set_length(self, self->len + src->len);
+	METHOD(_set_length)(self, self->len + src->len);
 	memcpy(self->data + oldlen, src->data, sizeof(src->data[0]) * src->len);
 	for (int64_t i = 0; i < src->len; i++)
 		INCREF_ITEM(src->data[i]);
@@ -80,7 +98,7 @@ void METHOD(insert)(TYPE self, int64_t index, ITEMTYPE val)
 	if (index > self->len)
 		index = self->len;
 
-	set_length(self, self->len + 1);
+	METHOD(_set_length)(self, self->len + 1);
 	memmove(self->data + index + 1, self->data + index, (self->len - index - 1)*sizeof(self->data[0]));
 	self->data[index] = val;
 	INCREF_ITEM(val);
@@ -93,7 +111,7 @@ ITEMTYPE METHOD(pop)(TYPE self)
 	return self->data[--self->len];
 }
 
-static void validate_index(TYPE self, int64_t i)
+static void METHOD(_validate_index)(TYPE self, int64_t i)
 {
 	if (i < 0)
 		panic_printf("negative list index %%d", (long)i);
@@ -103,21 +121,21 @@ static void validate_index(TYPE self, int64_t i)
 
 ITEMTYPE METHOD(get)(TYPE self, int64_t i)
 {
-	validate_index(self, i);
+	METHOD(_validate_index)(self, i);
 	INCREF_ITEM(self->data[i]);
 	return self->data[i];
 }
 
 ITEMTYPE METHOD(delete_at_index)(TYPE self, int64_t i)
 {
-	validate_index(self, i);
+	METHOD(_validate_index)(self, i);
 	ITEMTYPE item = self->data[i];
 	self->len--;
 	memmove(self->data+i, self->data+i+1, (self->len - i)*sizeof(self->data[0]));
 	return item;
 }
 
-static TYPE slice(TYPE self, int64_t start, int64_t end, bool del)
+static TYPE METHOD(_slice)(TYPE self, int64_t start, int64_t end, bool del)
 {
 	if (start < 0)
 		start = 0;
@@ -126,7 +144,7 @@ static TYPE slice(TYPE self, int64_t start, int64_t end, bool del)
 
 	TYPE res = CONSTRUCTOR();
 	if (start < end) {
-		set_length(res, end-start);
+		METHOD(_set_length)(res, end-start);
 		memcpy(res->data, &self->data[start], res->len*sizeof(self->data[0]));
 		if (del) {
 			memmove(&self->data[start], &self->data[end], (self->len - end)*sizeof(self->data[0]));
@@ -141,12 +159,12 @@ static TYPE slice(TYPE self, int64_t start, int64_t end, bool del)
 
 TYPE METHOD(slice)(TYPE self, int64_t start, int64_t end)
 {
-	return slice(self, start, end, false);
+	return METHOD(_slice)(self, start, end, false);
 }
 
 TYPE METHOD(delete_slice)(TYPE self, int64_t start, int64_t end)
 {
-	return slice(self, start, end, true);
+	return METHOD(_slice)(self, start, end, true);
 }
 
 ITEMTYPE METHOD(first)(TYPE self)
@@ -271,7 +289,7 @@ struct class_Str METHOD(to_string)(TYPE self)
 TYPE METHOD(reversed)(TYPE self)
 {
 	TYPE res = CONSTRUCTOR();
-	set_length(res, self->len);
+	METHOD(_set_length)(res, self->len);
 	for (int64_t i = 0; i < self->len; i++) {
 		res->data[i] = self->data[self->len - 1 - i];
 		INCREF_ITEM(res->data[i]);
@@ -0,0 +1,121 @@
+
+                #ifndef HEADER_GUARD_List_Int__df8a64abf3
+                #define HEADER_GUARD_List_Int__df8a64abf3
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+#define CONSTRUCTOR ctor_List_Int__df8a64abf3
+
+#define DESTRUCTOR dtor_List_Int__df8a64abf3
+
+#define TYPE struct class_List_Int__df8a64abf3 *
+
+#define TYPE_STRUCT class_List_Int__df8a64abf3
+
+#define METHOD(name) meth_List_Int__df8a64abf3_##name
+
+#define ITEMTYPE int64_t
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Int_##name
+
+#define INCREF_ITEM(val) (void)0
+
+#define DECREF_ITEM(val) (void)0
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Int__df8a64abf3___contains(struct class_List_Int__df8a64abf3*, int64_t);
+void meth_List_Int__df8a64abf3___reserve(struct class_List_Int__df8a64abf3*, int64_t);
+int64_t meth_List_Int__df8a64abf3_delete_at_index(struct class_List_Int__df8a64abf3*, int64_t);
+struct class_List_Int__df8a64abf3* meth_List_Int__df8a64abf3_delete_slice(struct class_List_Int__df8a64abf3*, int64_t, int64_t);
+bool meth_List_Int__df8a64abf3_ends_with(struct class_List_Int__df8a64abf3*, struct class_List_Int__df8a64abf3*);
+int64_t meth_List_Int__df8a64abf3_find_first(struct class_List_Int__df8a64abf3*, int64_t);
+int64_t meth_List_Int__df8a64abf3_find_last(struct class_List_Int__df8a64abf3*, int64_t);
+int64_t meth_List_Int__df8a64abf3_find_only(struct class_List_Int__df8a64abf3*, int64_t);
+int64_t meth_List_Int__df8a64abf3_first(struct class_List_Int__df8a64abf3*);
+int64_t meth_List_Int__df8a64abf3_get(struct class_List_Int__df8a64abf3*, int64_t);
+void meth_List_Int__df8a64abf3_insert(struct class_List_Int__df8a64abf3*, int64_t, int64_t);
+int64_t meth_List_Int__df8a64abf3_last(struct class_List_Int__df8a64abf3*);
+int64_t meth_List_Int__df8a64abf3_length(struct class_List_Int__df8a64abf3*);
+int64_t meth_List_Int__df8a64abf3_pop(struct class_List_Int__df8a64abf3*);
+void meth_List_Int__df8a64abf3_push(struct class_List_Int__df8a64abf3*, int64_t);
+void meth_List_Int__df8a64abf3_push_all(struct class_List_Int__df8a64abf3*, struct class_List_Int__df8a64abf3*);
+void meth_List_Int__df8a64abf3_delete_first(struct class_List_Int__df8a64abf3*, int64_t);
+void meth_List_Int__df8a64abf3_delete_last(struct class_List_Int__df8a64abf3*, int64_t);
+void meth_List_Int__df8a64abf3_delete_only(struct class_List_Int__df8a64abf3*, int64_t);
+struct class_List_Int__df8a64abf3* meth_List_Int__df8a64abf3_reversed(struct class_List_Int__df8a64abf3*);
+struct class_List_Int__df8a64abf3* meth_List_Int__df8a64abf3_slice(struct class_List_Int__df8a64abf3*, int64_t, int64_t);
+bool meth_List_Int__df8a64abf3_starts_with(struct class_List_Int__df8a64abf3*, struct class_List_Int__df8a64abf3*);
+struct class_Str meth_List_Int__df8a64abf3_to_string(struct class_List_Int__df8a64abf3*);
+struct class_Str meth_List_Int__df8a64abf3_join(struct class_List_Int__df8a64abf3*, struct class_Str);
+bool meth_List_Int__df8a64abf3_equals(struct class_List_Int__df8a64abf3*, struct class_List_Int__df8a64abf3*);
+
+#define CONSTRUCTOR ctor_List_Int__df8a64abf3
+
+#define DESTRUCTOR dtor_List_Int__df8a64abf3
+
+#define TYPE struct class_List_Int__df8a64abf3 *
+
+#define TYPE_STRUCT class_List_Int__df8a64abf3
+
+#define METHOD(name) meth_List_Int__df8a64abf3_##name
+
+#define ITEMTYPE int64_t
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Int_##name
+
+#define INCREF_ITEM(val) (void)0
+
+#define DECREF_ITEM(val) (void)0
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
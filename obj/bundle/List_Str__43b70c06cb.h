@@ -0,0 +1,121 @@
+
+                #ifndef HEADER_GUARD_List_Str__43b70c06cb
+                #define HEADER_GUARD_List_Str__43b70c06cb
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+#define CONSTRUCTOR ctor_List_Str__43b70c06cb
+
+#define DESTRUCTOR dtor_List_Str__43b70c06cb
+
+#define TYPE struct class_List_Str__43b70c06cb *
+
+#define TYPE_STRUCT class_List_Str__43b70c06cb
+
+#define METHOD(name) meth_List_Str__43b70c06cb_##name
+
+#define ITEMTYPE struct class_Str
+
+#define ITEMTYPE_IS_STRING 1
+
+#define ITEMTYPE_METHOD(name) meth_Str_##name
+
+#define INCREF_ITEM(val) string_incref((val))
+
+#define DECREF_ITEM(val) string_decref((val))
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Str__43b70c06cb___contains(struct class_List_Str__43b70c06cb*, struct class_Str);
+void meth_List_Str__43b70c06cb___reserve(struct class_List_Str__43b70c06cb*, int64_t);
+struct class_Str meth_List_Str__43b70c06cb_delete_at_index(struct class_List_Str__43b70c06cb*, int64_t);
+struct class_List_Str__43b70c06cb* meth_List_Str__43b70c06cb_delete_slice(struct class_List_Str__43b70c06cb*, int64_t, int64_t);
+bool meth_List_Str__43b70c06cb_ends_with(struct class_List_Str__43b70c06cb*, struct class_List_Str__43b70c06cb*);
+int64_t meth_List_Str__43b70c06cb_find_first(struct class_List_Str__43b70c06cb*, struct class_Str);
+int64_t meth_List_Str__43b70c06cb_find_last(struct class_List_Str__43b70c06cb*, struct class_Str);
+int64_t meth_List_Str__43b70c06cb_find_only(struct class_List_Str__43b70c06cb*, struct class_Str);
+struct class_Str meth_List_Str__43b70c06cb_first(struct class_List_Str__43b70c06cb*);
+struct class_Str meth_List_Str__43b70c06cb_get(struct class_List_Str__43b70c06cb*, int64_t);
+void meth_List_Str__43b70c06cb_insert(struct class_List_Str__43b70c06cb*, int64_t, struct class_Str);
+struct class_Str meth_List_Str__43b70c06cb_last(struct class_List_Str__43b70c06cb*);
+int64_t meth_List_Str__43b70c06cb_length(struct class_List_Str__43b70c06cb*);
+struct class_Str meth_List_Str__43b70c06cb_pop(struct class_List_Str__43b70c06cb*);
+void meth_List_Str__43b70c06cb_push(struct class_List_Str__43b70c06cb*, struct class_Str);
+void meth_List_Str__43b70c06cb_push_all(struct class_List_Str__43b70c06cb*, struct class_List_Str__43b70c06cb*);
+void meth_List_Str__43b70c06cb_delete_first(struct class_List_Str__43b70c06cb*, struct class_Str);
+void meth_List_Str__43b70c06cb_delete_last(struct class_List_Str__43b70c06cb*, struct class_Str);
+void meth_List_Str__43b70c06cb_delete_only(struct class_List_Str__43b70c06cb*, struct class_Str);
+struct class_List_Str__43b70c06cb* meth_List_Str__43b70c06cb_reversed(struct class_List_Str__43b70c06cb*);
+struct class_List_Str__43b70c06cb* meth_List_Str__43b70c06cb_slice(struct class_List_Str__43b70c06cb*, int64_t, int64_t);
+bool meth_List_Str__43b70c06cb_starts_with(struct class_List_Str__43b70c06cb*, struct class_List_Str__43b70c06cb*);
+struct class_Str meth_List_Str__43b70c06cb_to_string(struct class_List_Str__43b70c06cb*);
+struct class_Str meth_List_Str__43b70c06cb_join(struct class_List_Str__43b70c06cb*, struct class_Str);
+bool meth_List_Str__43b70c06cb_equals(struct class_List_Str__43b70c06cb*, struct class_List_Str__43b70c06cb*);
+
+#define CONSTRUCTOR ctor_List_Str__43b70c06cb
+
+#define DESTRUCTOR dtor_List_Str__43b70c06cb
+
+#define TYPE struct class_List_Str__43b70c06cb *
+
+#define TYPE_STRUCT class_List_Str__43b70c06cb
+
+#define METHOD(name) meth_List_Str__43b70c06cb_##name
+
+#define ITEMTYPE struct class_Str
+
+#define ITEMTYPE_IS_STRING 1
+
+#define ITEMTYPE_METHOD(name) meth_Str_##name
+
+#define INCREF_ITEM(val) string_incref((val))
+
+#define DECREF_ITEM(val) string_decref((val))
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,32 @@
+
+                #ifndef HEADER_GUARD_bundle_builtins_c399a735f1
+                #define HEADER_GUARD_bundle_builtins_c399a735f1
+                #include <lib/oomph.h>
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_Str meth_Bool_to_string(bool var1);
+struct class_List_Int__df8a64abf3* meth_Str_get_utf8(struct class_Str var1);
+struct class_Str meth_Str_repeat(struct class_Str var1, int64_t var2);
+bool meth_Str_starts_with(struct class_Str var1, struct class_Str var2);
+bool meth_Str_ends_with(struct class_Str var1, struct class_Str var2);
+bool meth_Str___contains(struct class_Str var1, struct class_Str var2);
+struct class_Str meth_Str_left_pad(struct class_Str var1, int64_t var2, struct class_Str var3);
+struct class_Str meth_Str_right_pad(struct class_Str var1, int64_t var2, struct class_Str var3);
+struct class_Str meth_Str_center_pad(struct class_Str var1, int64_t var2, struct class_Str var3);
+int64_t meth_Str_count(struct class_Str var1, struct class_Str var2);
+struct class_Str meth_Str_left_trim(struct class_Str var1);
+struct class_Str meth_Str_right_trim(struct class_Str var1);
+struct class_Str meth_Str_trim(struct class_Str var1);
+struct class_Str meth_Str_replace(struct class_Str var1, struct class_Str var2, struct class_Str var3);
+struct class_List_Str__43b70c06cb* meth_Str_split(struct class_Str var1, struct class_Str var2);
+struct class_Str meth_List_Str_join(struct class_List_Str__43b70c06cb* var1, struct class_Str var2);
+
+                #endif
+                
@@ -0,0 +1,100 @@
+#include <lib/oomph.h>
+#include "bundle_hash_1d0f330ece.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_md5_20993b0fec_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x64', '\x35' },
+                .malloced = false,
+            };
+            static struct class_Str string0_md5_20993b0fec = {
+                .buf = &string0_md5_20993b0fec_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_sha1_1f83ee7bd0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x68', '\x61', '\x31' },
+                .malloced = false,
+            };
+            static struct class_Str string1_sha1_1f83ee7bd0 = {
+                .buf = &string1_sha1_1f83ee7bd0_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_sha256_5537de7355_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x68', '\x61', '\x32', '\x35', '\x36' },
+                .malloced = false,
+            };
+            static struct class_Str string2_sha256_5537de7355 = {
+                .buf = &string2_sha256_5537de7355_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_sha512_1f2dcf283e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x68', '\x61', '\x35', '\x31', '\x32' },
+                .malloced = false,
+            };
+            static struct class_Str string3_sha512_1f2dcf283e = {
+                .buf = &string3_sha512_1f2dcf283e_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            struct class_Str bundle_hash_1d0f330ece_md5(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str retval;
+var2 = string0_md5_20993b0fec; string_incref(var2);
+var3 = oomph_hash(var1,var2);
+retval = var3; var3.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var3);
+string_decref(var2);
+return retval;
+}struct class_Str bundle_hash_1d0f330ece_sha1(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str retval;
+var2 = string1_sha1_1f83ee7bd0; string_incref(var2);
+var3 = oomph_hash(var1,var2);
+retval = var3; var3.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var3);
+string_decref(var2);
+return retval;
+}struct class_Str bundle_hash_1d0f330ece_sha256(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str retval;
+var2 = string2_sha256_5537de7355; string_incref(var2);
+var3 = oomph_hash(var1,var2);
+retval = var3; var3.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var3);
+string_decref(var2);
+return retval;
+}struct class_Str bundle_hash_1d0f330ece_sha512(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str retval;
+var2 = string3_sha512_1f2dcf283e; string_incref(var2);
+var3 = oomph_hash(var1,var2);
+retval = var3; var3.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var3);
+string_decref(var2);
+return retval;
+}
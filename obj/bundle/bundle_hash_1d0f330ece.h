@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_bundle_hash_1d0f330ece
+                #define HEADER_GUARD_bundle_hash_1d0f330ece
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Str bundle_hash_1d0f330ece_md5(struct class_Str var1);
+struct class_Str bundle_hash_1d0f330ece_sha1(struct class_Str var1);
+struct class_Str bundle_hash_1d0f330ece_sha256(struct class_Str var1);
+struct class_Str bundle_hash_1d0f330ece_sha512(struct class_Str var1);
+
+                #endif
+                
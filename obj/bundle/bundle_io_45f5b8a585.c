@@ -0,0 +1,17 @@
+#include <lib/oomph.h>
+#include "bundle_io_45f5b8a585.h"
+#include "bundle_builtins_c399a735f1.h"
+struct class_Str bundle_io_45f5b8a585_read_file(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str retval;
+var2 = oomph_io_read_file(var1);
+retval = var2; var2.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var2);
+return retval;
+}void bundle_io_45f5b8a585_write_file(struct class_Str var1, struct class_Str var2){oomph_io_write_file(var1,var2);
+out: (void)0;
+}void bundle_io_45f5b8a585_mkdir(struct class_Str var1){oomph_io_mkdir(var1);
+out: (void)0;
+}
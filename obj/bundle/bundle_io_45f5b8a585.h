@@ -0,0 +1,11 @@
+
+                #ifndef HEADER_GUARD_bundle_io_45f5b8a585
+                #define HEADER_GUARD_bundle_io_45f5b8a585
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Str bundle_io_45f5b8a585_read_file(struct class_Str var1);
+void bundle_io_45f5b8a585_write_file(struct class_Str var1, struct class_Str var2);
+void bundle_io_45f5b8a585_mkdir(struct class_Str var1);
+
+                #endif
+                
@@ -0,0 +1,51 @@
+#include <lib/oomph.h>
+#include "bundle_process_e29aff3881.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+int64_t bundle_process_e29aff3881_run(struct class_List_Str__43b70c06cb* var1){int64_t var2;
+int64_t retval;
+var2 = oomph_run_subprocess(var1);
+(void)0; retval = var2; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}struct class_List_Str__43b70c06cb* bundle_process_e29aff3881_get_args(void){int64_t var1;
+struct class_List_Str__43b70c06cb* var2;
+var2 = NULL;
+int64_t var3;
+bool var5;
+bool var6;
+struct class_Str var8;
+var8.buf = NULL;
+int64_t var9;
+int64_t var10;
+struct class_List_Str__43b70c06cb* retval;
+var1 = oomph_argv_count();
+var2 = ctor_List_Str__43b70c06cb();
+var3 = 1LL;
+label4: (void)0;
+var5 = oomph_int_gt(var1,var3);
+var6 = oomph_bool_not(var5);
+if (var6) goto label7;
+string_decref(var8);
+var8.buf = NULL;
+var8 = oomph_argv_get(var3);
+meth_List_Str__43b70c06cb_push(var2,var8);
+var9 = 1LL;
+var10 = oomph_int_add(var3,var9);
+var3 = var10;
+if (oomph_true) goto label4;
+label7: (void)0;
+retval = var2; var2 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+string_decref(var8);
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Str__43b70c06cb);
+(void)0;
+return retval;
+}
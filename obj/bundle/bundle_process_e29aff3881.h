@@ -0,0 +1,14 @@
+
+                #ifndef HEADER_GUARD_bundle_process_e29aff3881
+                #define HEADER_GUARD_bundle_process_e29aff3881
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+int64_t bundle_process_e29aff3881_run(struct class_List_Str__43b70c06cb* var1);
+struct class_List_Str__43b70c06cb* bundle_process_e29aff3881_get_args(void);
+
+                #endif
+                
@@ -4,6 +4,8 @@ import pathlib
 from dataclasses import dataclass
 from typing import List, Optional, Tuple, Union
 
+from pyoomph.tokenizer import Location
+
 
 @dataclass(eq=False)
 class Type:
@@ -44,7 +46,7 @@ class Statement:
 @dataclass(eq=False)
 class GetVar(Expression):
     varname: str
-    lineno: Optional[int] = None
+    location: Optional[Location] = None  # None when not from source code
 
 
 @dataclass(eq=False)
@@ -131,6 +133,7 @@ class Constructor(Expression):
 class Call(Expression, Statement):
     func: Expression
     args: List[Expression]
+    location: Optional[Location] = None
 
 
 @dataclass(eq=False)
@@ -157,6 +160,7 @@ class Break(Statement):
 @dataclass(eq=False)
 class Return(Statement):
     value: Optional[Expression]
+    location: Optional[Location] = None
 
 
 @dataclass(eq=False)
@@ -202,6 +206,7 @@ class Case:
 class Switch(Statement):
     union_obj: Expression
     cases: List[Case]
+    location: Optional[Location] = None
 
 
 @dataclass(eq=False)
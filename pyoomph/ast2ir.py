@@ -2,17 +2,20 @@ from __future__ import annotations
 
 import contextlib
 import pathlib
-from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from pyoomph import ast, ir
+from pyoomph.tokenizer import Location
 from pyoomph.types import (
     BOOL,
     FLOAT,
     INT,
     LIST,
+    NULL_TYPE,
     STRING,
     AutoType,
     FunctionType,
+    Generic,
     Type,
     UnionType,
     builtin_generic_types,
@@ -26,6 +29,86 @@ class ConversionError(Exception):
     pass
 
 
+# For error messages about a part of the code
+def _on_line(location: Optional[Location]) -> str:
+    if location is None:
+        return ""
+    return f" on line {location.lineno}"
+
+
+# Values of these types can't refer to lists or other mutable objects, and
+# their methods are implemented in the compiler, C or builtins.oomph.
+def _is_immutable(the_type: Type) -> bool:
+    if isinstance(the_type, UnionType):
+        return all(map(_is_immutable, the_type.type_members))
+    return the_type in {INT, FLOAT, BOOL, STRING, NULL_TYPE}
+
+
+# List methods that don't remove items and don't call methods of items
+_LIST_METHODS_KEEPING_ITEMS = {
+    "__reserve",
+    "first",
+    "get",
+    "insert",
+    "last",
+    "length",
+    "push",
+    "push_all",
+    "reversed",
+    "slice",
+}
+# List methods that call methods of items, but don't remove items
+_LIST_METHODS_USING_ITEMS = {
+    "__contains",
+    "ends_with",
+    "equals",
+    "find_first",
+    "find_last",
+    "find_only",
+    "join",
+    "starts_with",
+    "to_string",
+}
+
+
+# A foreach loop can borrow items from the list, if the loop body can't
+# remove items from the list and doesn't decref the loop variable. The loop
+# itself holds a reference to the list, so the list stays alive.
+#
+# This is conservative: calling anything that might run arbitrary code with
+# access to the list, such as a method of a class, prevents borrowing.
+def _can_borrow_items(
+    list_type: Type, item_var: ir.LocalVariable, body: List[ir.Instruction]
+) -> bool:
+    for ins in body:
+        if isinstance(ins, (ir.DecRef, ir.UnSet)) and ins.var is item_var:
+            return False
+        if isinstance(ins, ir.VarCpy) and ins.dest is item_var:
+            return False
+        if isinstance(ins, ir.CallFunction) and isinstance(ins.func, ir.FileVariable):
+            if not all(_is_immutable(arg.type) for arg in ins.args):
+                return False
+        if isinstance(ins, ir.CallMethod) and not _method_keeps_items(ins, list_type):
+            return False
+    return True
+
+
+def _method_keeps_items(call: ir.CallMethod, list_type: Type) -> bool:
+    obj_type = call.obj.type
+    if _is_immutable(obj_type) and all(_is_immutable(arg.type) for arg in call.args):
+        return True
+    if isinstance(obj_type, UnionType) and call.method_name == "get":
+        return True
+    if obj_type.generic_origin is not None and obj_type.generic_origin.generic is LIST:
+        if call.method_name in _LIST_METHODS_KEEPING_ITEMS:
+            return True
+        if call.method_name in _LIST_METHODS_USING_ITEMS:
+            return _is_immutable(obj_type.generic_origin.arg)
+        # Removes items, but not from a list of a different type
+        return obj_type != list_type
+    return False
+
+
 class _FunctionOrMethodConverter:
     def __init__(
         self,
@@ -38,39 +121,69 @@ class _FunctionOrMethodConverter:
         self.return_type = return_type
         self.loop_stack: List[Tuple[ir.GotoLabel, ir.GotoLabel]] = []
         self.code: List[ir.Instruction] = []
+        # Automatic types that must be the same type are in the same set of a
+        # union-find structure. Each set is represented by its root, and only
+        # roots appear in resolved_autotypes.
+        self.autotype_parents: Dict[AutoType, AutoType] = {}
         self.resolved_autotypes: Dict[AutoType, Type] = {}
-        self.matching_autotypes: List[Tuple[AutoType, AutoType]] = []
-
-    def _get_matching_autotype_set(self, auto: AutoType) -> Set[AutoType]:
-        # TODO: transitivity? if (A,B) and (B,C) in matching_autotypes then A --> {A,B,C}
-        matches = {
-            typ for pair in self.matching_autotypes for typ in pair if auto in pair
-        }
-        return matches | {auto}
+        # Creating a type is slow, and many variables get the same type when
+        # an autotype is resolved
+        self.generic_types: Dict[Tuple[Generic, Type], Type] = {}
+
+    def _find_autotype_root(self, auto: AutoType) -> AutoType:
+        root = auto
+        while root in self.autotype_parents:
+            root = self.autotype_parents[root]
+        # Path compression: make everything on the way point directly to root
+        while auto is not root:
+            self.autotype_parents[auto], auto = root, self.autotype_parents[auto]
+        return root
+
+    def _get_resolved_autotype(self, auto: AutoType) -> Optional[Type]:
+        return self.resolved_autotypes.get(self._find_autotype_root(auto))
+
+    def _match_autotypes(self, auto1: AutoType, auto2: AutoType) -> None:
+        root1 = self._find_autotype_root(auto1)
+        root2 = self._find_autotype_root(auto2)
+        if root1 is not root2:
+            assert root1 not in self.resolved_autotypes
+            assert root2 not in self.resolved_autotypes
+            self.autotype_parents[root2] = root1
 
     def _resolve_autotype(self, auto: AutoType, actual: Type) -> None:
         assert not isinstance(actual, AutoType)
-        if auto in self.resolved_autotypes:
-            assert self.resolved_autotypes[auto] == actual
+        root = self._find_autotype_root(auto)
+        if root in self.resolved_autotypes:
+            assert self.resolved_autotypes[root] == actual
         else:
-            for matching in self._get_matching_autotype_set(auto):
-                self.resolved_autotypes[matching] = actual
+            self.resolved_autotypes[root] = actual
 
     def _substitute_autotypes(self, the_type: Type, must_succeed: bool = False) -> Type:
         if isinstance(the_type, AutoType):
+            root = self._find_autotype_root(the_type)
             try:
-                return self.resolved_autotypes[the_type]
+                return self.resolved_autotypes[root]
             except KeyError:
                 if must_succeed:
                     raise RuntimeError("can't determine automatic type")
-                # Return exactly one of all matching autotypes consistently
-                return min(self._get_matching_autotype_set(the_type), key=id)
+                # All matching autotypes are represented by the same root
+                return root
 
         if the_type.generic_origin is None:
             return the_type
-        return the_type.generic_origin.generic.get_type(
-            self._substitute_autotypes(the_type.generic_origin.arg, must_succeed)
-        )
+        arg = the_type.generic_origin.arg
+        new_arg = self._substitute_autotypes(arg, must_succeed)
+        if new_arg is arg:
+            return the_type
+        return self._get_generic_type(the_type.generic_origin.generic, new_arg)
+
+    def _get_generic_type(self, generic: Generic, arg: Type) -> Type:
+        try:
+            return self.generic_types[generic, arg]
+        except KeyError:
+            result = generic.get_type(arg)
+            self.generic_types[generic, arg] = result
+            return result
 
     def get_type(self, raw_type: ast.Type) -> ir.Type:
         if isinstance(raw_type, ast.AutoType):
@@ -116,28 +229,28 @@ class _FunctionOrMethodConverter:
     def _do_the_autotype_thing(self, type1: Type, type2: Type) -> Tuple[Type, Type]:
         if isinstance(type1, AutoType) and isinstance(type2, AutoType):
             if type1 != type2:
-                if type1 in self.resolved_autotypes or type2 in self.resolved_autotypes:
+                resolved1 = self._get_resolved_autotype(type1)
+                resolved2 = self._get_resolved_autotype(type2)
+                if resolved1 is not None or resolved2 is not None:
                     return (
-                        self.resolved_autotypes.get(type1, type1),
-                        self.resolved_autotypes.get(type2, type2),
+                        type1 if resolved1 is None else resolved1,
+                        type2 if resolved2 is None else resolved2,
                     )
                 else:
-                    self.matching_autotypes.append((type1, type2))
+                    self._match_autotypes(type1, type2)
                     return (type1, type1)
         elif isinstance(type1, AutoType):
-            try:
-                type1 = self.resolved_autotypes[type1]
-            except KeyError:
-                assert isinstance(type1, AutoType)  # fuck you mypy
+            resolved = self._get_resolved_autotype(type1)
+            if resolved is None:
                 self._resolve_autotype(type1, type2)
                 return (type2, type2)
+            type1 = resolved
         elif isinstance(type2, AutoType):
-            try:
-                type2 = self.resolved_autotypes[type2]
-            except KeyError:
-                assert isinstance(type2, AutoType)  # saatana
+            resolved = self._get_resolved_autotype(type2)
+            if resolved is None:
                 self._resolve_autotype(type2, type1)
                 return (type1, type1)
+            type2 = resolved
         elif (
             type1.generic_origin is not None
             and type2.generic_origin is not None
@@ -148,7 +261,10 @@ class _FunctionOrMethodConverter:
             type1_arg, type2_arg = self._do_the_autotype_thing(
                 type1.generic_origin.arg, type2.generic_origin.arg
             )
-            return (generic.get_type(type1_arg), generic.get_type(type2_arg))
+            if type1_arg is not type1.generic_origin.arg:
+                type1 = self._get_generic_type(generic, type1_arg)
+            if type2_arg is not type2.generic_origin.arg:
+                type2 = self._get_generic_type(generic, type2_arg)
         return (type1, type2)
 
     def implicit_conversion(
@@ -201,11 +317,14 @@ class _FunctionOrMethodConverter:
         target_types: List[Type],
         self_var: Optional[ir.LocalVariable],
         func_name: str,
+        location: Optional[Location] = None,
     ) -> List[ir.LocalVariable]:
         if self_var is not None:
             args = [self_var] + args
 
-        assert len(args) == len(target_types), f"wrong number of args to {func_name}"
+        assert len(args) == len(
+            target_types
+        ), f"wrong number of args to {func_name}{_on_line(location)}"
         return [
             self.implicit_conversion(var, typ) for var, typ in zip(args, target_types)
         ]
@@ -245,7 +364,11 @@ class _FunctionOrMethodConverter:
                 else:
                     result_var = self.create_var(functype.returntype)
                 args = self.do_args(
-                    args, functype.argtypes, self_var, call.func.attribute
+                    args,
+                    functype.argtypes,
+                    self_var,
+                    call.func.attribute,
+                    call.location,
                 )[1:]
             self.code.append(
                 ir.CallMethod(self_var, call.func.attribute, args, result_var)
@@ -267,18 +390,19 @@ class _FunctionOrMethodConverter:
             else:
                 raw_args = call.args.copy()
                 if func is ir.visible_builtins["assert"]:
-                    assert call.func.lineno is not None
+                    assert call.location is not None
                     # Why relative path:
                     #   - less noise, still enough information
                     #   - tests don't have to include paths like /home/akuli/oomph/...
                     path = self.file_converter.path.relative_to(pathlib.Path.cwd())
                     raw_args.append(ast.StringConstant(str(path)))
-                    raw_args.append(ast.IntConstant(call.func.lineno))
+                    raw_args.append(ast.IntConstant(call.location.lineno))
                 args = self.do_args(
                     list(map(self.do_expression, raw_args)),
                     func.type.argtypes,
                     None,
                     call.func.varname,
+                    call.location,
                 )
             self.code.append(ir.CallFunction(func, args, result_var))
 
@@ -290,6 +414,7 @@ class _FunctionOrMethodConverter:
                 the_class.constructor_argtypes,
                 None,
                 f"constructor of {the_class.name}",
+                call.location,
             )
             result_var = self.create_var(the_class)
             self.code.append(ir.CallConstructor(result_var, args))
@@ -482,7 +607,9 @@ class _FunctionOrMethodConverter:
                     return self.implicit_conversion(obj, union_type)
 
             call = self.do_call(expr, True)
-            assert call is not None, f"return value of void function {expr.func} used"
+            assert (
+                call is not None
+            ), f"return value of void function used{_on_line(expr.location)}"
             return call
 
         if isinstance(expr, ast.GetVar):
@@ -583,11 +710,15 @@ class _FunctionOrMethodConverter:
 
         elif isinstance(stmt, ast.Return):
             if self.return_type is None:
-                assert stmt.value is None, "unexpected return value"
+                assert (
+                    stmt.value is None
+                ), f"unexpected return value{_on_line(stmt.location)}"
                 self.code.append(ir.Return(None))
             else:
                 # TODO: return statements not in every possible branch
-                assert stmt.value is not None, "missing return value"
+                assert (
+                    stmt.value is not None
+                ), f"missing return value{_on_line(stmt.location)}"
                 self.code.append(
                     ir.Return(
                         self.implicit_conversion(
@@ -610,6 +741,11 @@ class _FunctionOrMethodConverter:
                 otherwise = self.do_block(stmt.else_block)
             self.do_if(condition, body, otherwise)
 
+        elif isinstance(stmt, ast.Loop) and isinstance(
+            stmt.loop_header, ast.ForeachLoopHeader
+        ):
+            self.do_foreach_loop(stmt.loop_header, stmt.body)
+
         elif isinstance(stmt, ast.Loop):
             cond_label = ir.GotoLabel()
             continue_label = ir.GotoLabel()
@@ -687,7 +823,9 @@ class _FunctionOrMethodConverter:
                     self.code.append(ir.UnionMemberCheck(member_check, union_var, typ))
                     self.code.append(ir.Goto(label, member_check))
 
-            assert not types_to_do, f"switch does not handle: {types_to_do}"
+            assert (
+                not types_to_do
+            ), f"switch{_on_line(stmt.location)} does not handle: {types_to_do}"
 
             # TODO: add panic here (since no union members matched)
             self.code.extend(cases)
@@ -696,6 +834,46 @@ class _FunctionOrMethodConverter:
         else:
             raise NotImplementedError(stmt)
 
+    def do_foreach_loop(
+        self, header: ast.ForeachLoopHeader, body: List[ast.Statement]
+    ) -> None:
+        # The list is evaluated into a new variable that holds a reference, so
+        # assigning to a variable in the loop body can't destroy the list
+        list_var = self.do_expression(header.list)
+        list_var.type = self._substitute_autotypes(list_var.type)
+        if (
+            list_var.type.generic_origin is None
+            or list_var.type.generic_origin.generic is not LIST
+        ):
+            raise RuntimeError(f"foreach loop over {list_var.type.name}, not a list")
+
+        index_var = self.create_var(INT)
+        self.code.append(ir.IntConstant(index_var, 0))
+        item_var = ir.LocalVariable(list_var.type.generic_origin.arg)
+        next_label = ir.GotoLabel()
+        done_label = ir.GotoLabel()
+        get_next = ir.GetNextFromList(list_var, index_var, item_var, done_label)
+        self.code.append(next_label)
+        self.code.append(get_next)
+
+        # Like the variable of a for loop, the loop variable is not visible
+        # after the loop. A borrowed item could be destroyed after the loop.
+        old_var = self.variables.get(header.varname)
+        self.variables[header.varname] = item_var
+        self.loop_stack.append((next_label, done_label))
+        body_code = self.do_block(body)
+        popped = self.loop_stack.pop()
+        assert popped == (next_label, done_label)
+        if old_var is None:
+            del self.variables[header.varname]
+        else:
+            self.variables[header.varname] = old_var
+
+        get_next.borrow = _can_borrow_items(list_var.type, item_var, body_code)
+        self.code.extend(body_code)
+        self.code.append(ir.Goto(next_label, ir.visible_builtins["true"]))
+        self.code.append(done_label)
+
     def do_block(self, block: List[ast.Statement]) -> List[ir.Instruction]:
         with self.code_to_separate_list() as result:
             for statement in block:
@@ -709,7 +887,11 @@ class _FunctionOrMethodConverter:
     def get_rid_of_auto_everywhere(self) -> None:
         # Method calls can happen before the type is known. Here we assume that
         # the types got figured out.
-        for ins in self.code.copy():
+        #
+        # Converting arguments of a method call can add instructions before
+        # it, so the code is copied to a new list as it gets processed.
+        new_code: List[ir.Instruction] = []
+        for ins in self.code:
             if isinstance(ins, ir.CallMethod):
                 self._get_rid_of_auto_in_var(ins.obj)
                 functype = self._get_method_functype(ins.obj.type, ins.method_name)
@@ -717,8 +899,7 @@ class _FunctionOrMethodConverter:
                     ins.args = self.do_args(
                         ins.args, functype.argtypes, ins.obj, ins.method_name
                     )[1:]
-                where = self.code.index(ins)
-                self.code[where:where] = front_code
+                new_code.extend(front_code)
 
                 if functype.returntype is None:
                     assert ins.result is None
@@ -741,6 +922,9 @@ class _FunctionOrMethodConverter:
                 else:
                     self._get_rid_of_auto_in_var(ins.result)
 
+            new_code.append(ins)
+        self.code = new_code
+
         for ins in self.code:
             if isinstance(
                 ins,
@@ -785,6 +969,9 @@ class _FunctionOrMethodConverter:
             elif isinstance(ins, (ir.GetFromUnion, ir.UnionMemberCheck)):
                 self._get_rid_of_auto_in_var(ins.result)
                 self._get_rid_of_auto_in_var(ins.union)
+            elif isinstance(ins, ir.GetNextFromList):
+                self._get_rid_of_auto_in_var(ins.list)
+                self._get_rid_of_auto_in_var(ins.item)
             elif isinstance(ins, ir.GotoLabel):
                 pass
             else:
@@ -999,9 +1186,10 @@ class _FileConverter:
         return []
 
 
-def convert_program(
+# Steps 1 to 3. After this, other files can use the symbols of this file.
+def convert_declarations(
     program: List[ast.ToplevelDeclaration], path: pathlib.Path, symbols: List[ir.Symbol]
-) -> List[ir.ToplevelDeclaration]:
+) -> _FileConverter:
     converter = _FileConverter(path, symbols)
 
     for top in program:
@@ -1011,8 +1199,21 @@ def convert_program(
     assert not converter.typedef_laziness
     for top in program:
         converter.do_step3(top)
+    return converter
+
 
+# Step 4. Doesn't need anything from other files that wasn't available in step 3.
+def convert_function_bodies(
+    converter: _FileConverter, program: List[ast.ToplevelDeclaration]
+) -> List[ir.ToplevelDeclaration]:
     result = []
     for top in program:
         result.extend(converter.do_step4(top))
     return result
+
+
+def convert_program(
+    program: List[ast.ToplevelDeclaration], path: pathlib.Path, symbols: List[ir.Symbol]
+) -> List[ir.ToplevelDeclaration]:
+    converter = convert_declarations(program, path, symbols)
+    return convert_function_bodies(converter, program)
@@ -1,6 +1,6 @@
 import dataclasses
 import pathlib
-from typing import Any, List
+from typing import Any, Callable, Dict, List, Tuple
 
 from pyoomph import ast
 
@@ -14,80 +14,126 @@ class _AstTransformer:
         # Actally using this variable name would be invalid syntax, which is great
         return f"<var{self.varname_counter}>"
 
-    def foreach_loop_to_for_loop(self, loop: ast.Loop) -> ast.Loop:
-        assert isinstance(loop.loop_header, ast.ForeachLoopHeader)
-        list_var = self.get_var_name()
-        index_var = self.get_var_name()
-
-        let: ast.Statement = ast.Let(
-            loop.loop_header.varname,
-            ast.Call(
-                ast.GetAttribute(ast.GetVar(list_var), "get"),
-                [ast.GetVar(index_var)],
-            ),
-        )
-        return ast.Loop(
-            ast.ForLoopHeader(
-                [
-                    ast.Let(index_var, ast.IntConstant(0)),
-                    ast.Let(list_var, loop.loop_header.list),
-                ],
-                ast.BinaryOperator(
-                    ast.GetVar(index_var),
-                    "<",
-                    ast.Call(ast.GetAttribute(ast.GetVar(list_var), "length"), []),
-                ),
+    def list_comprehension_to_statements(
+        self, comprehension: ast.ListComprehension
+    ) -> ast.StatementsAndExpression:
+        var = self.get_var_name()
+        header = comprehension.loop_header
+        statements: List[ast.Statement] = []
+
+        if isinstance(header, ast.ForeachLoopHeader):
+            # The result has as many items as the list being looped over, so
+            # allocate it all at once instead of growing it while pushing
+            source_var = self.get_var_name()
+            statements.append(ast.Let(source_var, header.list))
+            statements.append(ast.Let(var, ast.ListLiteral([])))
+            statements.append(
+                ast.Call(
+                    ast.GetAttribute(ast.GetVar(var), "__reserve"),
+                    [ast.Call(ast.GetAttribute(ast.GetVar(source_var), "length"), [])],
+                )
+            )
+            header = ast.ForeachLoopHeader(header.varname, ast.GetVar(source_var))
+        else:
+            statements.append(ast.Let(var, ast.ListLiteral([])))
+
+        statements.append(
+            ast.Loop(
+                header,
                 [
-                    ast.SetVar(
-                        index_var,
-                        ast.BinaryOperator(
-                            ast.GetVar(index_var), "+", ast.IntConstant(1)
-                        ),
+                    ast.Call(
+                        ast.GetAttribute(ast.GetVar(var), "push"), [comprehension.value]
                     )
                 ],
-            ),
-            [let] + loop.body,
+            )
         )
+        return ast.StatementsAndExpression(statements, ast.GetVar(var))
 
+    # Returns ast_thing, or something to use instead of it. Lists are changed
+    # in place, and objects are created only for things that change.
     def visit(self, ast_thing: object) -> Any:
-        if isinstance(ast_thing, ast.ListComprehension):
-            var = self.get_var_name()
-            ast_thing = ast.StatementsAndExpression(
-                [
-                    ast.Let(var, ast.ListLiteral([])),
-                    ast.Loop(
-                        ast_thing.loop_header,
-                        [
-                            ast.Call(
-                                ast.GetAttribute(ast.GetVar(var), "push"),
-                                [ast_thing.value],
-                            )
-                        ],
-                    ),
-                ],
-                ast.GetVar(var),
-            )
+        try:
+            visitor = _visitors[type(ast_thing)]
+        except KeyError:
+            raise NotImplementedError(type(ast_thing))
+        return visitor(self, ast_thing)
+
+    def visit_list(self, the_list: List[object]) -> List[object]:
+        for index, item in enumerate(the_list):
+            new_item = self.visit(item)
+            if new_item is not item:
+                the_list[index] = new_item
+        return the_list
+
+    def visit_tuple(self, the_tuple: Tuple[object, ...]) -> Tuple[object, ...]:
+        new_items = [self.visit(item) for item in the_tuple]
+        if all(new is old for new, old in zip(new_items, the_tuple)):
+            return the_tuple
+        return tuple(new_items)
+
+    def visit_list_comprehension(
+        self, comprehension: ast.ListComprehension
+    ) -> ast.StatementsAndExpression:
+        return self.visit(self.list_comprehension_to_statements(comprehension))
+
+
+_Visitor = Callable[[_AstTransformer, Any], Any]
+
+# Types of dataclass fields that never contain anything to transform. These
+# are strings, because the ast module uses "from __future__ import annotations".
+_LEAF_FIELD_TYPES = {
+    "str",
+    "int",
+    "float",
+    "bool",
+    "pathlib.Path",
+    "Optional[Location]",
+}
+
+# Names of fields to visit for each AST class, found from type annotations
+_child_fields: Dict[type, List[str]] = {
+    klass: [
+        field.name
+        for field in dataclasses.fields(klass)
+        if field.type not in _LEAF_FIELD_TYPES
+    ]
+    for klass in vars(ast).values()
+    if isinstance(klass, type) and dataclasses.is_dataclass(klass)
+}
 
-        if isinstance(ast_thing, ast.Loop) and isinstance(
-            ast_thing.loop_header, ast.ForeachLoopHeader
-        ):
-            ast_thing = self.foreach_loop_to_for_loop(ast_thing)
 
-        if dataclasses.is_dataclass(ast_thing):
-            for name, value in vars(ast_thing).items():
-                setattr(ast_thing, name, self.visit(value))
-            return ast_thing
+def _visit_leaf(transformer: _AstTransformer, leaf: object) -> object:
+    return leaf
 
-        if isinstance(ast_thing, list):
-            return [self.visit(item) for item in ast_thing]
 
-        if isinstance(ast_thing, tuple):
-            return tuple(self.visit(item) for item in ast_thing)
+def _visit_fields(transformer: _AstTransformer, node: Any) -> Any:
+    for name in _child_fields[type(node)]:
+        value = getattr(node, name)
+        new_value = transformer.visit(value)
+        if new_value is not value:
+            setattr(node, name, new_value)
+    return node
 
-        if ast_thing is None or isinstance(ast_thing, (str, int, float, pathlib.Path)):
-            return ast_thing
 
-        raise NotImplementedError(type(ast_thing))
+_visitors: Dict[type, _Visitor] = {
+    klass: (_visit_fields if fields else _visit_leaf)
+    for klass, fields in _child_fields.items()
+}
+_visitors.update(
+    {
+        type(None): _visit_leaf,
+        str: _visit_leaf,
+        int: _visit_leaf,
+        float: _visit_leaf,
+        bool: _visit_leaf,
+        type(pathlib.Path()): _visit_leaf,
+        # Location is a tuple, but it contains nothing to transform
+        ast.Location: _visit_leaf,
+        list: _AstTransformer.visit_list,
+        tuple: _AstTransformer.visit_tuple,
+        ast.ListComprehension: _AstTransformer.visit_list_comprehension,
+    }
+)
 
 
 def transform_file(
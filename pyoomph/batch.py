@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import contextlib
+import io
+import os
+import pathlib
+import shlex
+import sys
+import tempfile
+import traceback
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+from pyoomph import driver, frontend_cache
+
+# Compiles many programs with a few long-running worker processes. Each
+# worker imports the compiler only once, and keeps builtins, stdlib and
+# other cached files in memory between programs.
+
+# Per worker process, like --server-memory of the compile server
+_MEMORY_CACHE_BYTES = 256 * 1024 * 1024
+_memory_cache: Optional[frontend_cache.MemoryCache] = None
+
+
+@dataclass
+class BatchResult:
+    args: List[str]
+    status: int
+    output: str  # everything the compiler printed
+
+
+def _init_worker() -> None:
+    global _memory_cache
+    _memory_cache = frontend_cache.MemoryCache(_MEMORY_CACHE_BYTES)
+
+
+def _compile(args: List[str]) -> int:
+    assert _memory_cache is not None
+
+    arg_parser = argparse.ArgumentParser(prog="pyoomph")
+    driver.add_compiler_arguments(arg_parser)
+    # Programs are compiled in parallel, so by default don't also run many
+    # C compilers for each program
+    compiler_args = arg_parser.parse_args(["--jobs=1"] + args)
+    driver.check_compiler_arguments(arg_parser, compiler_args)
+    if compiler_args.valgrind:
+        arg_parser.error("--valgrind can't be used in a batch, programs are not run")
+
+    with driver.compile_from_args(compiler_args, _memory_cache) as (result, session):
+        if result == 0 and compiler_args.outfile is not None:
+            driver.move_executable(
+                session,
+                compiler_args.infile,
+                compiler_args.outfile,
+                compiler_args.verbose,
+            )
+        return result
+
+
+@contextlib.contextmanager
+def _redirect_file_descriptors(target_fd: int) -> Iterator[None]:
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_fds = [os.dup(1), os.dup(2)]
+    try:
+        os.dup2(target_fd, 1)
+        os.dup2(target_fd, 2)
+        yield
+    finally:
+        for fd, saved_fd in zip([1, 2], saved_fds):
+            os.dup2(saved_fd, fd)
+            os.close(saved_fd)
+
+
+def _compile_and_get_status(args: List[str]) -> int:
+    try:
+        return _compile(args)
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+
+# Output is captured from file descriptors 1 and 2 too, because that's
+# where subprocesses (e.g. worker processes of --parallel-frontend) write.
+# The file is unbuffered, so that output from Python and subprocesses
+# stays in the order it was written.
+def _compile_in_worker(args: List[str]) -> BatchResult:
+    with tempfile.TemporaryFile(buffering=0) as file:
+        output = io.TextIOWrapper(
+            file,
+            encoding="utf-8",
+            errors="replace",
+            line_buffering=True,
+            write_through=True,
+        )
+        with _redirect_file_descriptors(file.fileno()), contextlib.redirect_stdout(
+            output
+        ), contextlib.redirect_stderr(output):
+            status = _compile_and_get_status(args)
+        output.flush()
+        file.seek(0)
+        text = file.read().decode("utf-8", errors="replace")
+        output.detach()
+    return BatchResult(args, status, text)
+
+
+# Each item of arg_lists contains compiler arguments for one program, e.g.
+# ["tests/hello.oomph", "-o", "hello"]. Without -o, the program is compiled
+# but the executable is not kept. Results come in the same order as
+# arg_lists, each as soon as it and everything before it are done.
+def compile_many(arg_lists: List[List[str]], jobs: int) -> Iterator[BatchResult]:
+    with concurrent.futures.ProcessPoolExecutor(
+        jobs, initializer=_init_worker
+    ) as executor:
+        futures = [executor.submit(_compile_in_worker, args) for args in arg_lists]
+        for future in futures:
+            yield future.result()
+
+
+# Each line of the manifest file contains compiler arguments for one
+# program. Empty lines and lines starting with '#' are ignored.
+def read_manifest(path: pathlib.Path) -> List[List[str]]:
+    result = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.strip() and not line.lstrip().startswith("#"):
+            result.append(shlex.split(line))
+    return result
+
+
+# Returns exit status for the whole batch
+def run_batch(manifest_path: pathlib.Path, jobs: int) -> int:
+    succeeded = 0
+    failed = 0
+    for result in compile_many(read_manifest(manifest_path), jobs):
+        sys.stdout.write(result.output)
+        command = " ".join(map(shlex.quote, result.args))
+        if result.status == 0:
+            print("ok:", command)
+            succeeded += 1
+        else:
+            print(f"failed with status {result.status}:", command)
+            failed += 1
+        sys.stdout.flush()
+
+    print(f"{succeeded} succeeded, {failed} failed")
+    return 0 if failed == 0 else 1
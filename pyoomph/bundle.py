@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from pyoomph import (
+    c_compiler,
+    c_output,
+    frontend,
+    frontend_cache,
+    ir,
+    optimizer,
+    timing,
+)
+from pyoomph.types import Type
+
+# builtins.oomph and stdlib rarely change, so "make" compiles them ahead of
+# time into a bundle. Compiling a program then only needs to load symbols
+# from the bundle and link with its object files.
+
+project_root = pathlib.Path(__file__).absolute().parent.parent
+bundle_dir = project_root / "obj" / "bundle"
+_info_path = bundle_dir / "bundle.pickle"
+
+
+@dataclass
+class Bundle:
+    key: str
+    symbols: List[ir.Symbol]
+    source_pair_ids: Dict[pathlib.Path, str]
+    type_pair_ids: List[Tuple[Type, str]]
+    object_paths: List[pathlib.Path]
+
+
+def _get_source_paths() -> List[pathlib.Path]:
+    return [frontend.builtins_path] + sorted(frontend.stdlib_path.glob("*.oomph"))
+
+
+# Changes whenever something changes that would make the bundle different
+def get_bundle_key() -> str:
+    sha = hashlib.sha256(frontend_cache.get_compiler_version().encode("ascii"))
+    paths = (
+        [project_root / "obj" / "compile_info.txt"]
+        + sorted((project_root / "lib").rglob("*"))
+        + _get_source_paths()
+    )
+    for path in paths:
+        if path.is_file():
+            sha.update(str(path).encode("utf-8") + b"\0")
+            sha.update(path.read_bytes() + b"\0")
+    return sha.hexdigest()
+
+
+# Returns None if there's no bundle or it's out of date
+def load(verbose: bool) -> Optional[Bundle]:
+    try:
+        key, pickled = _info_path.read_bytes().split(b"\n", maxsplit=1)
+    except (OSError, ValueError):
+        return None
+
+    # Check key before unpickling, because unpickling may fail if the
+    # compiler has changed
+    if key.decode("ascii") != get_bundle_key():
+        if verbose:
+            print("Prebuilt builtins and stdlib are out of date, run 'make' to fix")
+        return None
+
+    try:
+        result: Bundle = frontend_cache.loads(pickled, [])
+    except Exception:
+        return None
+    if not all(path.is_file() for path in result.object_paths):
+        return None
+    return result
+
+
+def build(verbose: bool, jobs: int) -> None:
+    key = get_bundle_key()
+    shutil.rmtree(bundle_dir, ignore_errors=True)
+    bundle_dir.mkdir(parents=True)
+
+    # With an id prefix, bundled files can't conflict with user's files.
+    # For example, user could have a file named builtins.oomph.
+    session = c_output.Session(bundle_dir, id_prefix="bundle_")
+    units: List[frontend.CompilationUnit] = []
+    for path in _get_source_paths():
+        units += frontend.create_untyped_asts(
+            path,
+            session,
+            None,
+            timing.PassTimer(False),
+            verbose,
+            prebuilt_paths={unit.source_path for unit in units},
+        )
+    graph = frontend.create_dependency_graph(units)
+    frontend.create_c_code(
+        frontend.get_compilation_order(units, graph, verbose),
+        optimizer.PassManager(optimizer.DEFAULT_LEVEL),
+        verbose,
+    )
+
+    c_paths = session.write_everything(frontend.builtins_path)
+    object_compiler = c_compiler.ObjectCompiler(
+        c_compiler.read_compile_info(project_root / "obj" / "compile_info.txt"),
+        [project_root],
+        verbose,
+        timing.PassTimer(False),
+    )
+    status = object_compiler.compile_objects(c_paths, jobs)
+    if status != 0:
+        sys.exit(status)
+
+    source_pair_ids, type_pair_ids = session.export_file_pairs()
+    bundle = Bundle(
+        key,
+        session.symbols,
+        source_pair_ids,
+        type_pair_ids,
+        [object_compiler.get_object_path(path) for path in c_paths],
+    )
+
+    # Compilers running at the same time must not see a half-written file
+    fd, temp_path = tempfile.mkstemp(dir=bundle_dir)
+    with open(fd, "wb") as file:
+        file.write(key.encode("ascii") + b"\n" + frontend_cache.dumps(bundle, []))
+    os.replace(temp_path, _info_path)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(
+        description="Compile builtins.oomph and stdlib ahead of time"
+    )
+    arg_parser.add_argument("-v", "--verbose", action="store_true")
+    arg_parser.add_argument("-j", "--jobs", type=int, default=(os.cpu_count() or 1))
+    args = arg_parser.parse_args()
+    build(args.verbose, args.jobs)
+
+
+if __name__ == "__main__":
+    # Bundle objects must be pickled as pyoomph.bundle.Bundle, not __main__.Bundle
+    from pyoomph import bundle
+
+    bundle.main()
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import concurrent.futures
+import hashlib
+import os
+import pathlib
+import re
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from pyoomph import timing
+
+_include_regex = re.compile(r'^[ \t]*#[ \t]*include[ \t]*([<"])([^>"\n]+)[>"]', re.M)
+
+
+def read_compile_info(path: pathlib.Path) -> Dict[str, str]:
+    compile_info = {}
+    with path.open() as file:
+        for line in file:
+            key, value = line.rstrip("\n").split("=", maxsplit=1)
+            compile_info[key] = value
+    return compile_info
+
+
+# Compiles each .c file to a separate .o file, next to the .c file or in
+# object_dir. A .o file is recompiled only if the .c file, a header it
+# includes (directly or indirectly) or the compiler command has changed since
+# it was compiled.
+#
+# Other oomph compilers can use a shared object_dir (e.g. obj/release) in
+# parallel. Then objects are compiled to temporary files and renamed into
+# place, so that nothing ever links with a half-written object file. This
+# isn't done otherwise, because with PGO, the profile data file is named
+# after the object file.
+class ObjectCompiler:
+    def __init__(
+        self,
+        compile_info: Dict[str, str],
+        include_dirs: List[pathlib.Path],
+        verbose: bool,
+        timer: timing.PassTimer,
+        extra_cflags: Sequence[str] = (),
+        object_dir: Optional[pathlib.Path] = None,
+        shared_object_dir: bool = False,
+    ):
+        self.cc = compile_info["cc"]
+        self.cflags = shlex.split(compile_info["cflags"]) + list(extra_cflags)
+        self.ldflags = shlex.split(compile_info["ldflags"])
+        self.include_dirs = include_dirs
+        self.object_dir = object_dir
+        self.shared_object_dir = shared_object_dir
+        self.verbose = verbose
+        self.timer = timer
+        self._direct_includes: Dict[pathlib.Path, List[pathlib.Path]] = {}
+        self._file_hashes: Dict[pathlib.Path, str] = {}
+
+    def _find_include(
+        self, including_file: pathlib.Path, name: str, quoted: bool
+    ) -> Optional[pathlib.Path]:
+        search_dirs = self.include_dirs
+        if quoted:
+            search_dirs = [including_file.parent] + search_dirs
+        for directory in search_dirs:
+            if (directory / name).is_file():
+                return directory / name
+        # System headers like <stdio.h> don't change between compilations
+        return None
+
+    def _get_direct_includes(self, path: pathlib.Path) -> List[pathlib.Path]:
+        if path not in self._direct_includes:
+            result = []
+            for match in _include_regex.finditer(path.read_text("utf-8")):
+                found = self._find_include(path, match.group(2), match.group(1) == '"')
+                if found is not None:
+                    result.append(found)
+            self._direct_includes[path] = result
+        return self._direct_includes[path]
+
+    def get_dependencies(self, c_path: pathlib.Path) -> Set[pathlib.Path]:
+        result = {c_path}
+        todo = [c_path]
+        while todo:
+            for header in self._get_direct_includes(todo.pop()):
+                if header not in result:
+                    result.add(header)
+                    todo.append(header)
+        return result
+
+    def _hash_file(self, path: pathlib.Path) -> str:
+        if path not in self._file_hashes:
+            self._file_hashes[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+        return self._file_hashes[path]
+
+    def get_object_path(self, c_path: pathlib.Path) -> pathlib.Path:
+        if self.object_dir is None:
+            return c_path.with_suffix(".o")
+        return self.object_dir / (c_path.stem + ".o")
+
+    def get_compile_command(
+        self, c_path: pathlib.Path, object_path: Optional[pathlib.Path] = None
+    ) -> List[str]:
+        if object_path is None:
+            object_path = self.get_object_path(c_path)
+        command = [self.cc] + self.cflags + ["-c", str(c_path)]
+        command += ["-o", str(object_path)]
+        for directory in self.include_dirs:
+            command += ["-I", str(directory)]
+        return command
+
+    def _get_key(self, c_path: pathlib.Path) -> str:
+        sha = hashlib.sha256()
+        for arg in self.get_compile_command(c_path):
+            sha.update(arg.encode("utf-8") + b"\0")
+        for path in sorted(self.get_dependencies(c_path)):
+            sha.update(f"{path}\0{self._hash_file(path)}\0".encode("utf-8"))
+        return sha.hexdigest()
+
+    def _get_key_path(self, c_path: pathlib.Path) -> pathlib.Path:
+        return self.get_object_path(c_path).with_suffix(".o.key")
+
+    def needs_compiling(self, c_path: pathlib.Path) -> bool:
+        try:
+            old_key = self._get_key_path(c_path).read_text("ascii")
+        except OSError:
+            return True
+        return not self.get_object_path(c_path).is_file() or old_key != self._get_key(
+            c_path
+        )
+
+    def _print_command(
+        self, command: List[str], human_readable: Optional[str] = None
+    ) -> None:
+        if self.verbose:
+            if human_readable is None:
+                human_readable = " ".join(map(shlex.quote, command))
+            print("Running:", human_readable, file=sys.stderr)
+
+    def _run_compiler(
+        self, command: List[str]
+    ) -> Tuple[subprocess.CompletedProcess[str], float]:
+        start = time.perf_counter()
+        process = subprocess.run(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+            errors="replace",
+        )
+        return (process, time.perf_counter() - start)
+
+    def _compile_object(
+        self, c_path: pathlib.Path
+    ) -> Tuple[subprocess.CompletedProcess[str], float]:
+        if not self.shared_object_dir:
+            return self._run_compiler(self.get_compile_command(c_path))
+
+        object_path = self.get_object_path(c_path)
+        fd, temp_path = tempfile.mkstemp(dir=object_path.parent, suffix=".o.tmp")
+        os.close(fd)
+        try:
+            result = self._run_compiler(
+                self.get_compile_command(c_path, pathlib.Path(temp_path))
+            )
+            if result[0].returncode == 0:
+                os.replace(temp_path, object_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return result
+
+    def _write_key(self, c_path: pathlib.Path) -> None:
+        key_path = self._get_key_path(c_path)
+        if not self.shared_object_dir:
+            key_path.write_text(self._get_key(c_path), "ascii")
+            return
+
+        fd, temp_path = tempfile.mkstemp(dir=key_path.parent, suffix=".key.tmp")
+        try:
+            with open(fd, "w", encoding="ascii") as file:
+                file.write(self._get_key(c_path))
+            os.replace(temp_path, key_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    # Returns exit status of the first failing C compiler, or 0 if everything
+    # compiled successfully (or nothing needed compiling)
+    def compile_objects(self, c_paths: List[pathlib.Path], jobs: int) -> int:
+        with self.timer.measure("object cache"):
+            to_compile = [path for path in c_paths if self.needs_compiling(path)]
+        for c_path in to_compile:
+            # Make sure that a failed compilation is never considered up to date
+            try:
+                self._get_key_path(c_path).unlink()
+            except FileNotFoundError:
+                pass
+
+        # Threads are enough here, because they just wait for compiler processes.
+        # The pool size limits how many compilers run at the same time.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(self._compile_object, c_path) for c_path in to_compile
+            ]
+
+            # Output compiler messages in the same order regardless of which
+            # compiler happens to finish first
+            status = 0
+            for c_path, future in zip(to_compile, futures):
+                process, wall_time = future.result()
+                # CPU time of the C compiler is not measured, because it runs
+                # in a separate process
+                self.timer.add("C compiler", c_path, timing.Time(wall_time, None))
+                self._print_command(process.args)
+                sys.stderr.write(process.stdout)
+                if process.returncode == 0:
+                    with self.timer.measure("object cache"):
+                        self._write_key(c_path)
+                elif status == 0:
+                    status = process.returncode
+        return status
+
+    def link(
+        self,
+        object_paths: List[pathlib.Path],
+        runtime_object_paths: List[pathlib.Path],
+        exe_path: pathlib.Path,
+    ) -> int:
+        before_files = [self.cc] + self.cflags + list(map(str, runtime_object_paths))
+        after_files = ["-o", str(exe_path)] + self.ldflags
+        command = before_files + list(map(str, object_paths)) + after_files
+        self._print_command(
+            command,
+            " ".join(
+                [shlex.quote(arg) for arg in before_files]
+                + [f"<{len(object_paths)} files>"]
+                + [shlex.quote(arg) for arg in after_files]
+            ),
+        )
+        # Output goes through sys.stderr, so that the compile server can capture it
+        process, wall_time = self._run_compiler(command)
+        self.timer.add("link", None, timing.Time(wall_time, None))
+        sys.stderr.write(process.stdout)
+        return process.returncode
@@ -4,7 +4,7 @@ import hashlib
 import os
 import pathlib
 import re
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from pyoomph import ir
 from pyoomph.types import (
@@ -99,9 +99,11 @@ class _FunctionEmitter:
             )
 
         if isinstance(ins, ir.Return):
-            if ins.value is not None:
-                return f"{self.incref_var(ins.value)}; retval = {self.emit_var(ins.value)}; goto out;\n"
-            return "goto out;\n"
+            if ins.value is None:
+                return "goto out;\n"
+            if ins.move:
+                return f"retval = {self.emit_var(ins.value)}; {self.emit_instruction(ir.UnSet(ins.value))}goto out;\n"
+            return f"{self.incref_var(ins.value)}; retval = {self.emit_var(ins.value)}; goto out;\n"
 
         if isinstance(ins, ir.GetAttribute):
             return f"{self.emit_var(ins.result)} = {self.emit_var(ins.obj)}->memb_{ins.attribute};\n"
@@ -149,6 +151,26 @@ class _FunctionEmitter:
         if isinstance(ins, ir.Goto):
             return f"if ({self.emit_var(ins.cond)}) goto {self.get_label_name(ins.label)};\n"
 
+        if isinstance(ins, ir.GetNextFromList):
+            if ins.borrow:
+                self.add_local_var(ins.item, need_decref=False)
+            list_c = self.emit_var(ins.list)
+            index_c = self.emit_var(ins.index)
+            item_c = self.emit_var(ins.item)
+            # No bounds check needed, because index was just compared to
+            # the length. The length is read again for every item, because
+            # the loop body can change the list.
+            code = f"if ({index_c} >= {list_c}->len) goto {self.get_label_name(ins.done_label)};\n"
+            if ins.borrow:
+                return code + f"{item_c} = {list_c}->data[{index_c}++];\n"
+            return (
+                code
+                + self.session.emit_decref(item_c, ins.item.type)
+                + f"; {item_c} = {list_c}->data[{index_c}++]; "
+                + self.incref_var(ins.item)
+                + ";\n"
+            )
+
         if isinstance(ins, ir.UnionMemberCheck):
             assert isinstance(ins.union.type, UnionType)
             return f"""
@@ -374,8 +396,9 @@ class _FilePair:
 
     def emit_string(self, value: str) -> str:
         if value not in self.strings:
+            # Names must differ between files, for --unity
             self.strings[value] = _create_id(
-                f"string{len(self.strings)}_" + value, value
+                f"string{len(self.strings)}_" + value, self.id + "\0" + value
             )
 
             array_content = ", ".join(
@@ -659,13 +682,28 @@ class _FilePair:
             raise NotImplementedError(top_declaration)
 
 
+# Leaves the file untouched if it already contains the right content
+def _write_if_changed(path: pathlib.Path, content: str) -> None:
+    encoded = content.encode("utf-8")
+    try:
+        if path.read_bytes() == encoded:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_bytes(encoded)
+
+
 # This state is shared between different files
 class Session:
-    def __init__(self, compilation_dir: pathlib.Path) -> None:
+    # Use id_prefix to make sure that file names and C names don't conflict
+    # with other sessions whose C code is linked together with this session
+    def __init__(self, compilation_dir: pathlib.Path, id_prefix: str = "") -> None:
         self.compilation_dir = compilation_dir
+        self.id_prefix = id_prefix
         self.symbols: List[ir.Symbol] = []
         self._type_to_file_pair: Dict[Type, _FilePair] = {}
         self.source_path_to_file_pair: Dict[pathlib.Path, _FilePair] = {}
+        self._prebuilt_file_pairs: Set[_FilePair] = set()
 
     def get_file_pair_for_type(self, the_type: Type) -> _FilePair:
         if the_type not in self._type_to_file_pair:
@@ -706,8 +744,9 @@ class Session:
         pair = _FilePair(
             self,
             _create_id(
-                source_path.stem,
-                os.path.relpath(source_path, self.compilation_dir.parent),
+                self.id_prefix + source_path.stem,
+                self.id_prefix
+                + os.path.relpath(source_path, self.compilation_dir.parent),
             ),
         )
         assert source_path not in self.source_path_to_file_pair
@@ -715,6 +754,34 @@ class Session:
         for top_declaration in top_decls:
             pair.emit_toplevel_declaration(top_declaration)
 
+    # Returns ids of file pairs, for passing to import_file_pairs()
+    def export_file_pairs(
+        self,
+    ) -> Tuple[Dict[pathlib.Path, str], List[Tuple[Type, str]]]:
+        return (
+            {path: pair.id for path, pair in self.source_path_to_file_pair.items()},
+            [(the_type, pair.id) for the_type, pair in self._type_to_file_pair.items()],
+        )
+
+    # For files compiled ahead of time, see bundle.py. They are not written
+    # again, but C code of other files can use what they define.
+    def import_file_pairs(
+        self,
+        source_pair_ids: Dict[pathlib.Path, str],
+        type_pair_ids: List[Tuple[Type, str]],
+    ) -> None:
+        for path, pair_id in source_pair_ids.items():
+            assert path not in self.source_path_to_file_pair
+            pair = _FilePair(self, pair_id)
+            self.source_path_to_file_pair[path] = pair
+            self._prebuilt_file_pairs.add(pair)
+
+        for the_type, pair_id in type_pair_ids:
+            assert the_type not in self._type_to_file_pair
+            pair = _FilePair(self, pair_id)
+            self._type_to_file_pair[the_type] = pair
+            self._prebuilt_file_pairs.add(pair)
+
     # TODO: don't keep stuff in memory so much
     def write_everything(self, builtins_path: pathlib.Path) -> List[pathlib.Path]:
         builtins_pair = self.source_path_to_file_pair[builtins_path]
@@ -723,6 +790,9 @@ class Session:
         for file_pair in list(self._type_to_file_pair.values()) + list(
             self.source_path_to_file_pair.values()
         ):
+            if file_pair in self._prebuilt_file_pairs:
+                continue
+
             c_path = self.compilation_dir / (file_pair.id + ".c")
             h_path = self.compilation_dir / (file_pair.id + ".h")
             c_paths.append(c_path)
@@ -734,11 +804,15 @@ class Session:
                 c_includes += f'#include "{builtins_pair.id}.h"\n'
                 h_includes += f'#include "{builtins_pair.id}.h"\n'
 
+            # Sorting makes the output the same every time, so that
+            # unchanged files don't need to be compiled again
             c_includes += "".join(
-                f'#include "{pair.id}.h"\n' for pair in file_pair.c_includes
+                f'#include "{pair.id}.h"\n'
+                for pair in sorted(file_pair.c_includes, key=(lambda p: p.id))
             )
             h_includes += "".join(
-                f'#include "{pair.id}.h"\n' for pair in file_pair.h_includes
+                f'#include "{pair.id}.h"\n'
+                for pair in sorted(file_pair.h_includes, key=(lambda p: p.id))
             )
 
             h_code = (
@@ -750,15 +824,25 @@ class Session:
             c_code = c_includes + file_pair.string_defs + file_pair.function_defs
 
             header_guard = "HEADER_GUARD_" + file_pair.id
-            c_path.write_text(c_code + "\n", encoding="utf-8")
-            h_path.write_text(
+            _write_if_changed(c_path, c_code + "\n")
+            _write_if_changed(
+                h_path,
                 f"""
                 #ifndef {header_guard}
                 #define {header_guard}
                 {h_code}
                 #endif
                 \n""",
-                encoding="utf-8",
             )
 
         return c_paths
+
+    # For --unity. Includes all given .c files into one file, so that the C
+    # compiler sees the whole program at once and can inline across files.
+    def write_unity_file(self, c_paths: List[pathlib.Path]) -> pathlib.Path:
+        unity_path = self.compilation_dir / "unity.c"
+        _write_if_changed(
+            unity_path,
+            "".join(f'#include "{path.absolute()}"\n' for path in c_paths),
+        )
+        return unity_path
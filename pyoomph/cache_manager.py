@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import re
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+# Everything in .oomph-cache can be recreated, so it's fine to delete least
+# recently used things when the cache gets too big or things get too old.
+#
+# Compilation directories are locked with a "compiling" file (see
+# driver.get_compilation_dir) while a compiler uses them. Creating or deleting
+# the lock file updates the directory's mtime, which is used as the time of
+# last use. Before deleting a directory, it is locked just like a compiler
+# would lock it, and then renamed, so that a compiler never gets a directory
+# that is half-deleted.
+#
+# Frontend cache files are written atomically, and a file disappearing is
+# just a cache miss, so they can be deleted at any time. Reading a cached
+# file updates its mtime.
+
+_compilation_dir_regex = re.compile(r"^.+_compilation[0-9]+$")
+_DELETING_PREFIX = ".deleting-"
+_LAST_PRUNE_FILE = ".last-prune"
+
+# Automatic pruning happens at most this often
+_PRUNE_INTERVAL = 60 * 60
+
+# A compiler that gets killed with SIGKILL leaves its lock behind. Compilers
+# hold the lock while the compiled program runs, so this can't be short.
+_STALE_LOCK_AGE = 24 * 60 * 60
+
+
+@dataclass
+class CacheEntry:
+    path: pathlib.Path
+    size: int  # in bytes
+    last_used: float  # as returned by time.time()
+    is_compilation_dir: bool
+    in_use: bool
+
+
+def _get_tree_size(path: pathlib.Path) -> int:
+    result = 0
+    for dirpath, dirnames, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                result += os.lstat(os.path.join(dirpath, name)).st_size
+            except OSError:
+                # Deleted while looping
+                pass
+    return result
+
+
+def _is_locked(compilation_dir: pathlib.Path, now: float) -> bool:
+    try:
+        lock_mtime = (compilation_dir / "compiling").stat().st_mtime
+    except OSError:
+        return False
+    return now - lock_mtime < _STALE_LOCK_AGE
+
+
+# Entries that disappear while scanning (e.g. another process is pruning)
+# are skipped.
+def scan(cache_dir: pathlib.Path, now: Optional[float] = None) -> List[CacheEntry]:
+    if now is None:
+        now = time.time()
+
+    result = []
+    try:
+        paths = list(cache_dir.iterdir())
+    except OSError:
+        return []
+
+    for path in paths:
+        try:
+            if path.name.startswith(_DELETING_PREFIX):
+                # Left behind by a pruner that got interrupted
+                result.append(CacheEntry(path, _get_tree_size(path), 0, False, False))
+            elif path.is_dir() and _compilation_dir_regex.match(path.name):
+                result.append(
+                    CacheEntry(
+                        path,
+                        _get_tree_size(path),
+                        path.stat().st_mtime,
+                        True,
+                        _is_locked(path, now),
+                    )
+                )
+            elif path.name == "frontend" and path.is_dir():
+                for file in path.iterdir():
+                    stat = file.stat()
+                    # Temporary files are being written by a compiler
+                    in_use = file.suffix == ".tmp" and now - stat.st_mtime < 60 * 60
+                    result.append(
+                        CacheEntry(file, stat.st_size, stat.st_mtime, False, in_use)
+                    )
+        except OSError:
+            pass
+    return result
+
+
+def _delete_compilation_dir(entry: CacheEntry, now: float) -> bool:
+    lock = entry.path / "compiling"
+    try:
+        lock.touch(exist_ok=False)
+        created_lock = True
+    except FileExistsError:
+        # Someone else is using it, unless the lock is stale
+        if _is_locked(entry.path, now):
+            return False
+        created_lock = False
+    except OSError:
+        return False
+
+    # Renaming is atomic, and a compiler that sees the directory disappear
+    # creates it again
+    temp_dir = pathlib.Path(
+        tempfile.mkdtemp(prefix=_DELETING_PREFIX, dir=entry.path.parent)
+    )
+    try:
+        entry.path.rename(temp_dir / entry.path.name)
+    except OSError:
+        temp_dir.rmdir()
+        if created_lock:
+            lock.unlink()
+        return False
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+
+def _delete(entry: CacheEntry, now: float) -> bool:
+    if entry.is_compilation_dir:
+        return _delete_compilation_dir(entry, now)
+    try:
+        if entry.path.is_dir():
+            shutil.rmtree(entry.path)
+        else:
+            entry.path.unlink()
+    except OSError:
+        return False
+    return True
+
+
+# Deletes entries not used within max_age seconds, and then least recently
+# used entries until the cache is at most max_bytes. Returns deleted entries.
+def prune(cache_dir: pathlib.Path, max_bytes: int, max_age: float) -> List[CacheEntry]:
+    now = time.time()
+    entries = sorted(scan(cache_dir, now), key=(lambda entry: entry.last_used))
+    total_size = sum(entry.size for entry in entries)
+
+    deleted = []
+    for entry in entries:
+        if entry.in_use:
+            continue
+        if now - entry.last_used < max_age and total_size <= max_bytes:
+            # Entries are sorted, so the rest are newer than this
+            break
+        if _delete(entry, now):
+            deleted.append(entry)
+            total_size -= entry.size
+    return deleted
+
+
+# Called after each compilation. Scanning the cache is too slow to do every
+# time, so this does nothing if the cache was pruned recently.
+def prune_if_needed(cache_dir: pathlib.Path, max_bytes: int, max_age: float) -> None:
+    marker = cache_dir / _LAST_PRUNE_FILE
+    try:
+        if time.time() - marker.stat().st_mtime < _PRUNE_INTERVAL:
+            return
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return
+
+    try:
+        marker.touch()
+    except OSError:
+        # Read-only cache directory, can't delete anything anyway
+        return
+    prune(cache_dir, max_bytes, max_age)
+
+
+def _format_size(size: float) -> str:
+    for unit in ["B", "KB", "MB"]:
+        if size < 1024:
+            return f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+def format_stats(cache_dir: pathlib.Path, entries: List[CacheEntry]) -> str:
+    now = time.time()
+    compilation_dirs = [entry for entry in entries if entry.is_compilation_dir]
+    other = [entry for entry in entries if not entry.is_compilation_dir]
+
+    result = f"Cache directory: {cache_dir}\n"
+    result += "Compilation directories: %d (%s), %d in use\n" % (
+        len(compilation_dirs),
+        _format_size(sum(entry.size for entry in compilation_dirs)),
+        sum(entry.in_use for entry in compilation_dirs),
+    )
+    result += "Other files: %d (%s)\n" % (
+        len(other),
+        _format_size(sum(entry.size for entry in other)),
+    )
+    result += f"Total: {_format_size(sum(entry.size for entry in entries))}\n"
+    if entries:
+        oldest = min(entry.last_used for entry in entries)
+        result += (
+            f"Least recently used: {(now - oldest) / (24 * 60 * 60):.1f} days ago\n"
+        )
+    return result
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import os
+import shlex
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+from typing import List
+
+# This file is imported when starting a client, so it must not import
+# the compiler. That would make starting the client as slow as compiling.
+
+
+# Runs a compiled oomph program and returns its exit status
+def run_program(command: List[str], verbose: bool) -> int:
+    if verbose:
+        print("Running:", " ".join(map(shlex.quote, command)), file=sys.stderr)
+
+    result = subprocess.run(command).returncode
+    if result < 0:  # killed by signal
+        message = f"Program killed by signal {abs(result)}"
+        try:
+            message += f" ({signal.Signals(abs(result)).name})"
+        except ValueError:  # e.g. SIGRTMIN + 1
+            pass
+        print(message, file=sys.stderr)
+    elif result > 0:
+        print(f"Program exited with status {result}", file=sys.stderr)
+    return result
+
+
+def main() -> None:
+    if len(sys.argv) < 2 or sys.argv[1].startswith("-"):
+        print(
+            "Usage: python3 -m pyoomph.client SOCKET [compiler args]",
+            file=sys.stderr,
+        )
+        print(
+            "The server is started with: python3 -m pyoomph --server SOCKET",
+            file=sys.stderr,
+        )
+        sys.exit(2)
+
+    request = {"args": sys.argv[2:], "cwd": os.getcwd()}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(sys.argv[1])
+        sock.sendall(json.dumps(request).encode("utf-8"))
+        sock.shutdown(socket.SHUT_WR)
+        response_chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            response_chunks.append(chunk)
+
+    response = json.loads(b"".join(response_chunks).decode("utf-8"))
+    sys.stdout.write(response["stdout"])
+    sys.stdout.flush()
+    sys.stderr.write(response["stderr"])
+    sys.stderr.flush()
+
+    run_info = response["run"]
+    if run_info is None:
+        sys.exit(response["status"])
+
+    # Server compiled the program to a temporary directory, so that its
+    # stdin, stdout and stderr are ours when it runs
+    try:
+        result = run_program(run_info["command"], run_info["verbose"])
+    finally:
+        shutil.rmtree(run_info["temp_dir"])
+    sys.exit(result)
+
+
+if __name__ == "__main__":
+    main()
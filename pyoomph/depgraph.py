@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import collections
+import json
+import pathlib
+from typing import Dict, List, Optional, Set
+
+
+# Nodes are files, and edges go from a file to the files it imports. Nodes
+# and dependencies stay in the order they were added, so that everything
+# computed from the graph is deterministic.
+class DependencyGraph:
+    def __init__(self) -> None:
+        self.dependencies: Dict[pathlib.Path, List[pathlib.Path]] = {}
+
+    def add(self, path: pathlib.Path, dependencies: List[pathlib.Path]) -> None:
+        assert path not in self.dependencies
+        # dict.fromkeys() removes duplicates (a file imported twice)
+        self.dependencies[path] = list(dict.fromkeys(dependencies))
+
+    # Kahn's algorithm. Returns an order where dependencies come before the
+    # files that need them, or None if there are cyclic imports.
+    def toposort(self) -> Optional[List[pathlib.Path]]:
+        dependents: Dict[pathlib.Path, List[pathlib.Path]] = {
+            path: [] for path in self.dependencies
+        }
+        waiting_for: Dict[pathlib.Path, int] = {}
+        for path, deps in self.dependencies.items():
+            for dep in deps:
+                dependents[dep].append(path)
+            waiting_for[path] = len(deps)
+
+        ready = collections.deque(
+            path for path, count in waiting_for.items() if count == 0
+        )
+        result = []
+        while ready:
+            path = ready.popleft()
+            result.append(path)
+            for dependent in dependents[path]:
+                waiting_for[dependent] -= 1
+                if waiting_for[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(result) != len(self.dependencies):
+            return None
+        return result
+
+    # Returns a list of files where each file imports the next one, and the
+    # last file appears twice, or None if there are no cyclic imports
+    def find_cycle(self) -> Optional[List[pathlib.Path]]:
+        done: Set[pathlib.Path] = set()
+        for start in self.dependencies:
+            if start in done:
+                continue
+
+            # Depth-first search with an explicit stack, so that long import
+            # chains don't hit Python's recursion limit
+            chain = [start]
+            in_chain = {start}
+            iterators = [iter(self.dependencies[start])]
+            while iterators:
+                for dep in iterators[-1]:
+                    if dep in in_chain:
+                        return chain + [dep]
+                    if dep not in done:
+                        chain.append(dep)
+                        in_chain.add(dep)
+                        iterators.append(iter(self.dependencies[dep]))
+                        break
+                else:
+                    in_chain.remove(chain[-1])
+                    done.add(chain.pop())
+                    iterators.pop()
+        return None
+
+    def to_json(self) -> str:
+        return json.dumps(
+            [
+                [str(path), [str(dep) for dep in deps]]
+                for path, deps in self.dependencies.items()
+            ]
+        )
+
+    @classmethod
+    def from_json(cls, json_string: str) -> DependencyGraph:
+        graph = cls()
+        for path, deps in json.loads(json_string):
+            graph.add(pathlib.Path(path), [pathlib.Path(dep) for dep in deps])
+        return graph
@@ -0,0 +1,568 @@
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import contextlib
+import os
+import pathlib
+import shutil
+import subprocess
+import sys
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pyoomph import (
+    bundle,
+    c_compiler,
+    c_output,
+    cache_manager,
+    depgraph,
+    frontend,
+    frontend_cache,
+    optimizer,
+    timing,
+)
+
+python_code_dir = pathlib.Path(__file__).absolute().parent
+project_root = python_code_dir.parent
+
+
+# Arguments are same for "python3 -m pyoomph" and the compile server
+def add_compiler_arguments(arg_parser: argparse.ArgumentParser) -> None:
+    arg_parser.add_argument("infile", type=pathlib.Path, nargs="?")
+    arg_parser.add_argument("-o", "--outfile", type=pathlib.Path)
+    arg_parser.add_argument("--valgrind", default="")
+    arg_parser.add_argument("-v", "--verbose", action="store_true")
+    arg_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=(os.cpu_count() or 1),
+        help="how many processes to run in parallel (default: number of CPUs)",
+    )
+    arg_parser.add_argument(
+        "--parallel-frontend",
+        action="store_true",
+        help="parse files and convert function bodies in --jobs processes",
+    )
+    arg_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="don't reuse parsed and typed files from previous compilations",
+    )
+    arg_parser.add_argument(
+        "--no-bundle",
+        action="store_true",
+        help="compile builtins and stdlib even if 'make' has compiled them already",
+    )
+    arg_parser.add_argument(
+        "--time-passes",
+        action="store_true",
+        help="print how long each part of the compiler takes for each file",
+    )
+    arg_parser.add_argument(
+        "--time-passes-json",
+        type=pathlib.Path,
+        metavar="FILE",
+        help="write the times of --time-passes to a JSON file",
+    )
+    arg_parser.add_argument(
+        "--unity",
+        action="store_true",
+        help="compile everything as one C file, slower to compile but may run faster",
+    )
+    arg_parser.add_argument(
+        "-O",
+        "--opt-level",
+        type=int,
+        choices=optimizer.LEVELS,
+        default=optimizer.DEFAULT_LEVEL,
+        help=(
+            "0 doesn't optimize the IR, 1 runs each optimization once, 2 runs"
+            f" them until nothing changes (default: {optimizer.DEFAULT_LEVEL});"
+            " other levels imply --no-bundle"
+        ),
+    )
+    arg_parser.add_argument(
+        "--opt-stats",
+        action="store_true",
+        help="print how many instructions each optimization changed",
+    )
+    arg_parser.add_argument(
+        "--profile",
+        choices=["debug", "release", "pgo"],
+        default="debug",
+        help=(
+            "debug compiles fast, release runs fast, pgo (profile-guided"
+            " optimization) runs --pgo-train and then optimizes based on"
+            " what ran (default: debug)"
+        ),
+    )
+    arg_parser.add_argument(
+        "--pgo-train",
+        metavar="COMMAND",
+        help=(
+            "shell command to run with --profile=pgo, with $OOMPH_EXE set to the"
+            ' program being compiled (default: "$OOMPH_EXE")'
+        ),
+    )
+    arg_parser.add_argument(
+        "--cache-max-size",
+        type=int,
+        default=1024,
+        metavar="MEGABYTES",
+        help="size limit of .oomph-cache, least recently used files go first (default: 1024)",
+    )
+    arg_parser.add_argument(
+        "--cache-max-age",
+        type=float,
+        default=30,
+        metavar="DAYS",
+        help="delete files not used for this long from .oomph-cache (default: 30)",
+    )
+
+
+# Returns options like "--opt-level" that were given with a non-default
+# value, for modes that don't compile a program given on the command line
+def get_given_compiler_options(compiler_args: argparse.Namespace) -> List[str]:
+    default_parser = argparse.ArgumentParser()
+    add_compiler_arguments(default_parser)
+    defaults = vars(default_parser.parse_args([]))
+    return [
+        "--" + name.replace("_", "-")
+        for name, default in defaults.items()
+        if name != "infile" and getattr(compiler_args, name) != default
+    ]
+
+
+def check_compiler_arguments(
+    arg_parser: argparse.ArgumentParser, compiler_args: argparse.Namespace
+) -> None:
+    if compiler_args.infile is None:
+        arg_parser.error("the following arguments are required: infile")
+    if compiler_args.jobs < 1:
+        arg_parser.error("--jobs must be at least 1")
+    if compiler_args.pgo_train is not None and compiler_args.profile != "pgo":
+        arg_parser.error("--pgo-train can only be used with --profile=pgo")
+    if compiler_args.cache_max_size < 0:
+        arg_parser.error("--cache-max-size must not be negative")
+    if compiler_args.cache_max_age < 0:
+        arg_parser.error("--cache-max-age must not be negative")
+
+
+def get_cache_dir(source_path: pathlib.Path) -> pathlib.Path:
+    try:
+        cache_dir = source_path.parent / ".oomph-cache"
+        cache_dir.mkdir(exist_ok=True)
+    except OSError:
+        cache_dir = pathlib.Path.cwd() / ".oomph-cache"
+        cache_dir.mkdir(exist_ok=True)
+    return cache_dir
+
+
+# Returns (max_bytes, max_age_in_seconds) for cache_manager
+def get_cache_limits(compiler_args: argparse.Namespace) -> Tuple[int, float]:
+    return (
+        compiler_args.cache_max_size * 1024 * 1024,
+        compiler_args.cache_max_age * 24 * 60 * 60,
+    )
+
+
+# Caller must delete the "compiling" file when done with the directory
+def get_compilation_dir(parent_dir: pathlib.Path, name_hint: str) -> pathlib.Path:
+    i = 0
+    while True:
+        path = parent_dir / (name_hint + str(i))
+        path.mkdir(parents=True, exist_ok=True)
+        try:
+            (path / "compiling").touch(exist_ok=False)
+        except FileExistsError:
+            # Another instance of oomph compiler running in parallel
+            i += 1
+        except FileNotFoundError:
+            # Deleted by cache_manager after mkdir, try again
+            pass
+        else:
+            return path
+
+
+# Returns None if a file can't be read
+def _get_current_ast_keys(graph: depgraph.DependencyGraph) -> Optional[List[str]]:
+    result = []
+    for path in graph.dependencies:
+        try:
+            source_code = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+        result.append(
+            frontend_cache.get_ast_key(path, source_code, frontend.stdlib_path)
+        )
+    return result
+
+
+# Creates executable to session.compilation_dir / source_path.stem.
+# Returns exit status of the C compiler or linker, or 0 on success.
+# Errors in oomph code make this exit with sys.exit().
+def compile_program(
+    source_path: pathlib.Path,
+    *,
+    session: c_output.Session,
+    cache: Optional[frontend_cache.FrontendCache],
+    timer: timing.PassTimer,
+    verbose: bool,
+    jobs: int,
+    parallel_frontend: bool,
+    no_bundle: bool,
+    unity: bool,
+    profile: str,
+    pgo_train: Optional[str],
+    passes: optimizer.PassManager,
+) -> int:
+    # The bundle was optimized with the default level, so other levels
+    # compile builtins and stdlib too, as if --no-bundle was given
+    if passes.level != optimizer.DEFAULT_LEVEL:
+        no_bundle = True
+
+    main_path = source_path.absolute()
+    old_graph = None if cache is None else cache.load_depgraph(main_path)
+
+    # Executable key includes everything that affects the executable
+    def get_executable_key(ast_keys: List[str]) -> str:
+        options = [
+            bundle.get_bundle_key(),
+            str(no_bundle),
+            str(unity),
+            profile,
+            str(passes.level),
+        ]
+        if profile != "debug":
+            options.append(str(_read_profile_compile_info(profile)))
+        if profile == "pgo":
+            options.append(str(pgo_train))
+        return frontend_cache.get_executable_key(str(main_path), ast_keys, options)
+
+    if cache is not None and old_graph is not None:
+        with timer.measure("executable cache"):
+            # A stale graph is fine. The files it contains would have to
+            # change for the set of imported files to change.
+            ast_keys = _get_current_ast_keys(old_graph)
+            found = ast_keys is not None and cache.load_executable(
+                get_executable_key(ast_keys),
+                session.compilation_dir / source_path.stem,
+            )
+        if found:
+            if verbose:
+                print("Nothing changed since last compilation, using old executable")
+            return 0
+
+    if parallel_frontend:
+        executor: Optional[
+            concurrent.futures.Executor
+        ] = concurrent.futures.ProcessPoolExecutor(jobs)
+    else:
+        executor = None
+
+    with timer.measure("load bundle"):
+        prebuilt = None if no_bundle else bundle.load(verbose)
+    prebuilt_ir_keys: Dict[pathlib.Path, str] = {}
+    if prebuilt is not None:
+        session.symbols.extend(prebuilt.symbols)
+        session.import_file_pairs(prebuilt.source_pair_ids, prebuilt.type_pair_ids)
+        prebuilt_ir_keys = {path: prebuilt.key for path in prebuilt.source_pair_ids}
+
+    try:
+        units = frontend.create_untyped_asts(
+            main_path,
+            session,
+            cache,
+            timer,
+            verbose,
+            executor,
+            prefetch=([] if old_graph is None else list(old_graph.dependencies)),
+            prebuilt_paths=prebuilt_ir_keys.keys(),
+        )
+        graph = frontend.create_dependency_graph(units)
+        if cache is not None:
+            cache.store_depgraph(main_path, graph)
+
+        frontend.create_c_code(
+            frontend.get_compilation_order(units, graph, verbose),
+            passes,
+            verbose,
+            executor,
+            prebuilt_ir_keys,
+        )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    with timer.measure("write_everything"):
+        c_paths = session.write_everything(project_root / "builtins.oomph")
+        runtime_c_paths = sorted((project_root / "lib").glob("*.c"))
+        if prebuilt is not None:
+            runtime_c_paths += [
+                path.with_suffix(".c") for path in prebuilt.object_paths
+            ]
+        if unity:
+            # The runtime goes in too, so that nothing is left to link with
+            c_paths = [session.write_unity_file(runtime_c_paths + c_paths)]
+            runtime_c_paths = []
+
+    result = _create_executable(
+        source_path,
+        session,
+        c_paths,
+        runtime_c_paths,
+        prebuilt,
+        unity,
+        profile,
+        pgo_train,
+        timer,
+        verbose,
+        jobs,
+    )
+    if result == 0 and cache is not None:
+        with timer.measure("executable cache"):
+            cache.store_executable(
+                get_executable_key([unit.ast_key for unit in units]),
+                session.compilation_dir / source_path.stem,
+            )
+    return result
+
+
+def _create_executable(
+    source_path: pathlib.Path,
+    session: c_output.Session,
+    c_paths: List[pathlib.Path],
+    runtime_c_paths: List[pathlib.Path],
+    prebuilt: Optional[bundle.Bundle],
+    unity: bool,
+    profile: str,
+    pgo_train: Optional[str],
+    timer: timing.PassTimer,
+    verbose: bool,
+    jobs: int,
+) -> int:
+    # Everything except main() gets internal linkage, so that the C compiler
+    # can inline and delete functions freely. Compilers other than gcc ignore
+    # this, with a warning at most.
+    extra_cflags = ["-fwhole-program"] if unity else []
+
+    if profile != "pgo":
+        return _compile_and_link(
+            source_path,
+            session,
+            c_paths,
+            runtime_c_paths,
+            prebuilt,
+            profile,
+            extra_cflags,
+            timer,
+            verbose,
+            jobs,
+        )
+
+    # Build and run a program that records what code runs often, and then
+    # build again optimizing based on that
+    for path in session.compilation_dir.rglob("*.gcda"):
+        path.unlink()
+    result = _compile_and_link(
+        source_path,
+        session,
+        c_paths,
+        runtime_c_paths,
+        prebuilt,
+        profile,
+        extra_cflags + ["-fprofile-generate"],
+        timer,
+        verbose,
+        jobs,
+    )
+    if result == 0:
+        with timer.measure("PGO training"):
+            result = _run_pgo_training(
+                session.compilation_dir / source_path.stem,
+                ('"$OOMPH_EXE"' if pgo_train is None else pgo_train),
+                verbose,
+            )
+    if result == 0:
+        result = _compile_and_link(
+            source_path,
+            session,
+            c_paths,
+            runtime_c_paths,
+            prebuilt,
+            profile,
+            # Functions that training didn't run have no profile data
+            extra_cflags + ["-fprofile-use", "-Wno-missing-profile"],
+            timer,
+            verbose,
+            jobs,
+        )
+    return result
+
+
+def _read_profile_compile_info(profile: str) -> Dict[str, str]:
+    if profile == "debug":
+        path = project_root / "obj" / "compile_info.txt"
+    else:
+        path = project_root / "obj" / "release" / "compile_info.txt"
+    try:
+        return c_compiler.read_compile_info(path)
+    except FileNotFoundError:
+        sys.exit(f"{path} not found, run 'make' to create it")
+
+
+def _compile_and_link(
+    source_path: pathlib.Path,
+    session: c_output.Session,
+    c_paths: List[pathlib.Path],
+    runtime_c_paths: List[pathlib.Path],
+    prebuilt: Optional[bundle.Bundle],
+    profile: str,
+    extra_cflags: List[str],
+    timer: timing.PassTimer,
+    verbose: bool,
+    jobs: int,
+) -> int:
+    compile_info = _read_profile_compile_info(profile)
+    include_dirs = [project_root, bundle.bundle_dir]
+    object_compiler = c_compiler.ObjectCompiler(
+        compile_info, include_dirs, verbose, timer, extra_cflags
+    )
+
+    if not runtime_c_paths:
+        runtime_object_paths = []
+    elif profile == "debug":
+        # Compiled by make
+        runtime_object_paths = sorted(project_root.glob("obj/*.o"))
+        if prebuilt is not None:
+            runtime_object_paths += prebuilt.object_paths
+    else:
+        # Release builds of the runtime can be shared between programs.
+        # With PGO, the runtime is optimized differently for each program.
+        if profile == "release":
+            runtime_object_dir = project_root / "obj" / "release"
+        else:
+            runtime_object_dir = session.compilation_dir / "runtime"
+        runtime_object_dir.mkdir(parents=True, exist_ok=True)
+        runtime_compiler = c_compiler.ObjectCompiler(
+            compile_info,
+            include_dirs,
+            verbose,
+            timer,
+            extra_cflags,
+            object_dir=runtime_object_dir,
+            shared_object_dir=(profile == "release"),
+        )
+        result = runtime_compiler.compile_objects(runtime_c_paths, jobs)
+        if result != 0:
+            return result
+        runtime_object_paths = [
+            runtime_compiler.get_object_path(path) for path in runtime_c_paths
+        ]
+
+    result = object_compiler.compile_objects(c_paths, jobs)
+    if result != 0:
+        return result
+    return object_compiler.link(
+        [object_compiler.get_object_path(path) for path in c_paths],
+        runtime_object_paths,
+        session.compilation_dir / source_path.stem,
+    )
+
+
+# Output of the training command is shown only if it fails
+def _run_pgo_training(exe_path: pathlib.Path, command: str, verbose: bool) -> int:
+    if verbose:
+        print("Running PGO training command:", command, file=sys.stderr)
+    process = subprocess.run(
+        command,
+        shell=True,
+        env=dict(os.environ, OOMPH_EXE=str(exe_path)),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+        errors="replace",
+    )
+    if process.returncode != 0:
+        sys.stderr.write(process.stdout)
+        print(
+            f"PGO training command failed with exit status {process.returncode}",
+            file=sys.stderr,
+        )
+    return process.returncode
+
+
+def _report_pass_times(
+    timer: timing.PassTimer, print_table: bool, json_path: Optional[pathlib.Path]
+) -> None:
+    if print_table:
+        print(file=sys.stderr)
+        sys.stderr.write(timer.format_table())
+    if json_path is not None:
+        json_path.write_text(timer.to_json() + "\n", encoding="utf-8")
+
+
+def _report_optimizer_stats(passes: optimizer.PassManager, print_table: bool) -> None:
+    if print_table:
+        print(file=sys.stderr)
+        sys.stderr.write(passes.format_stats())
+
+
+def move_executable(
+    session: c_output.Session,
+    source_path: pathlib.Path,
+    outfile: pathlib.Path,
+    verbose: bool,
+) -> None:
+    assert not outfile.is_dir()  # shutil.move is weird for dirs
+    shutil.move(str(session.compilation_dir / source_path.stem), str(outfile))
+    if verbose:
+        print("Moved executable to", outfile)
+
+
+# Compiles compiler_args.infile with the options in compiler_args, as given
+# by add_compiler_arguments(). Yields (exit status, session). The
+# compilation directory is reserved until the with statement ends, so the
+# executable can be moved or run before that.
+@contextlib.contextmanager
+def compile_from_args(
+    compiler_args: argparse.Namespace,
+    memory_cache: Optional[frontend_cache.MemoryCache] = None,
+) -> Iterator[Tuple[int, c_output.Session]]:
+    cache_dir = get_cache_dir(compiler_args.infile)
+    if compiler_args.no_cache:
+        cache = None
+    else:
+        cache = frontend_cache.FrontendCache(cache_dir / "frontend", memory_cache)
+
+    session = c_output.Session(
+        get_compilation_dir(cache_dir, compiler_args.infile.stem + "_compilation")
+    )
+    try:
+        timer = timing.PassTimer(
+            compiler_args.time_passes or compiler_args.time_passes_json is not None
+        )
+        passes = optimizer.PassManager(compiler_args.opt_level)
+        result = compile_program(
+            compiler_args.infile,
+            session=session,
+            cache=cache,
+            timer=timer,
+            verbose=compiler_args.verbose,
+            jobs=compiler_args.jobs,
+            parallel_frontend=compiler_args.parallel_frontend,
+            no_bundle=compiler_args.no_bundle,
+            unity=compiler_args.unity,
+            profile=compiler_args.profile,
+            pgo_train=compiler_args.pgo_train,
+            passes=passes,
+        )
+        _report_pass_times(
+            timer, compiler_args.time_passes, compiler_args.time_passes_json
+        )
+        _report_optimizer_stats(passes, compiler_args.opt_stats)
+        cache_manager.prune_if_needed(cache_dir, *get_cache_limits(compiler_args))
+        yield (result, session)
+    finally:
+        (session.compilation_dir / "compiling").unlink()
@@ -0,0 +1,398 @@
+from __future__ import annotations
+
+import concurrent.futures
+import pathlib
+import sys
+import traceback
+from typing import Collection, Dict, List, Optional, Sequence, Set, Tuple
+
+from pyoomph import (
+    ast,
+    ast2ir,
+    ast_transformer,
+    c_output,
+    depgraph,
+    frontend_cache,
+    ir,
+    optimizer,
+    parser,
+    timing,
+    tokenizer,
+)
+
+project_root = pathlib.Path(__file__).absolute().parent.parent
+builtins_path = project_root / "builtins.oomph"
+stdlib_path = project_root / "stdlib"
+
+_Times = Dict[Tuple[str, str], timing.Time]
+
+
+def _create_untyped_ast(
+    source_path: pathlib.Path,
+    cache: Optional[frontend_cache.FrontendCache],
+    timer: timing.PassTimer,
+) -> Tuple[str, List[ast.ToplevelDeclaration]]:
+    with timer.measure("read source", source_path):
+        source_code = source_path.read_text(encoding="utf-8")
+    ast_key = frontend_cache.get_ast_key(source_path, source_code, stdlib_path)
+    if cache is not None:
+        with timer.measure("frontend cache", source_path):
+            cached_ast = cache.load_ast(ast_key)
+        if cached_ast is not None:
+            return (ast_key, cached_ast)
+
+    with timer.measure("tokenize", source_path):
+        tokens = tokenizer.tokenize(source_code)
+    with timer.measure("parse", source_path):
+        parsed = parser.parse_tokens(tokens, source_path, stdlib_path)
+    with timer.measure("ast_transformer", source_path):
+        result = ast_transformer.transform_file(parsed)
+    if cache is not None:
+        # Must be done before ast2ir, because it modifies the AST
+        with timer.measure("frontend cache", source_path):
+            cache.store_ast(ast_key, result)
+    return (ast_key, result)
+
+
+# Functions that run in worker processes return tracebacks as strings,
+# because then the error messages look the same as without parallelism.
+# They also return the times measured in the worker.
+def _create_untyped_ast_in_worker(
+    source_path: pathlib.Path,
+    cache: Optional[frontend_cache.FrontendCache],
+    time_passes: bool,
+) -> Tuple[Optional[str], str, List[ast.ToplevelDeclaration], _Times]:
+    timer = timing.PassTimer(time_passes)
+    try:
+        ast_key, result = _create_untyped_ast(source_path, cache, timer)
+    except Exception:
+        return (traceback.format_exc(), "", [], timer.times)
+    return (None, ast_key, result, timer.times)
+
+
+def _convert_function_bodies_in_worker(
+    pickled: bytes, source_path: pathlib.Path, time_passes: bool
+) -> Tuple[Optional[str], bytes, _Times]:
+    timer = timing.PassTimer(time_passes)
+    try:
+        with timer.measure("pickle", source_path):
+            converter, program = frontend_cache.loads(pickled, [])
+        old_symbols = converter.symbols.copy()
+        with timer.measure("ast2ir", source_path):
+            top_decls = ast2ir.convert_function_bodies(converter, program)
+        new_symbols = converter.symbols[len(old_symbols) :]
+        # Sending back a copy of an existing symbol would confuse the compiler
+        with timer.measure("pickle", source_path):
+            result = frontend_cache.dumps((top_decls, new_symbols), old_symbols)
+        return (None, result, timer.times)
+    except Exception:
+        return (traceback.format_exc(), b"", timer.times)
+
+
+class CompilationUnit:
+    ast_key: str
+    ir_key: str
+    dependencies: List[pathlib.Path]
+
+    def __init__(
+        self,
+        source_path: pathlib.Path,
+        session: c_output.Session,
+        cache: Optional[frontend_cache.FrontendCache],
+        timer: timing.PassTimer,
+    ):
+        self.source_path = source_path
+        self.session = session
+        self.cache = cache
+        self.timer = timer
+
+    def _handle_error(self, traceback_string: Optional[str] = None) -> None:
+        if traceback_string is None:
+            traceback.print_exc()
+        else:
+            sys.stderr.write(traceback_string)
+        print(f"\nThis happened while compiling {self.source_path}", file=sys.stderr)
+        sys.exit(1)
+
+    def _set_untyped_ast(
+        self, ast_key: str, decls: List[ast.ToplevelDeclaration]
+    ) -> None:
+        self.ast_key = ast_key
+        self.ast = decls
+        self.dependencies = [
+            top_declaration.path
+            for top_declaration in decls
+            if isinstance(top_declaration, ast.Import)
+        ]
+        if self.source_path != builtins_path:
+            self.dependencies.append(builtins_path)
+
+    def create_untyped_ast(self) -> None:
+        try:
+            self._set_untyped_ast(
+                *_create_untyped_ast(self.source_path, self.cache, self.timer)
+            )
+        except Exception:
+            self._handle_error()
+
+    def _set_ir_key(self, ir_keys: Dict[pathlib.Path, str]) -> None:
+        self.ir_key = frontend_cache.get_ir_key(
+            self.ast_key, [ir_keys[path] for path in self.dependencies]
+        )
+
+    def _load_cached_ir(self) -> Optional[List[ir.ToplevelDeclaration]]:
+        if self.cache is None:
+            return None
+        with self.timer.measure("frontend cache", self.source_path):
+            cached = self.cache.load_ir(self.ir_key, self.session.symbols)
+        if cached is None:
+            return None
+        top_decls, new_symbols = cached
+        self.session.symbols.extend(new_symbols)
+        return top_decls
+
+    # Dependencies must be done before calling this, and their IR keys must
+    # be in ir_keys
+    def create_c_code(
+        self, ir_keys: Dict[pathlib.Path, str], passes: optimizer.PassManager
+    ) -> None:
+        try:
+            self._set_ir_key(ir_keys)
+            the_ir = self._load_cached_ir()
+            if the_ir is None:
+                foreign_symbols = self.session.symbols.copy()
+                with self.timer.measure("ast2ir", self.source_path):
+                    the_ir = ast2ir.convert_program(
+                        self.ast, self.source_path, self.session.symbols
+                    )
+                if self.cache is not None:
+                    with self.timer.measure("frontend cache", self.source_path):
+                        self.cache.store_ir(
+                            self.ir_key,
+                            the_ir,
+                            self.session.symbols[len(foreign_symbols) :],
+                            foreign_symbols,
+                        )
+            self._emit_c_code(the_ir, passes)
+        except Exception:
+            self._handle_error()
+
+    # The cache has the IR before optimizing, so that changing the
+    # optimization level doesn't need ast2ir again
+    def _emit_c_code(
+        self, the_ir: List[ir.ToplevelDeclaration], passes: optimizer.PassManager
+    ) -> None:
+        passes.optimize(the_ir, self.source_path, self.timer)
+        with self.timer.measure("c_output", self.source_path):
+            self.session.create_c_code(the_ir, self.source_path)
+
+
+# Returns all files needed to compile the given file, except prebuilt files
+# (see bundle.py). With an executor, files are parsed in parallel as soon as
+# an import is found. Files listed in prefetch (typically from the previous
+# compilation) are parsed right away, without waiting for the files that
+# import them.
+def create_untyped_asts(
+    main_path: pathlib.Path,
+    session: c_output.Session,
+    cache: Optional[frontend_cache.FrontendCache],
+    timer: timing.PassTimer,
+    verbose: bool,
+    executor: Optional[concurrent.futures.Executor] = None,
+    prefetch: Sequence[pathlib.Path] = (),
+    prebuilt_paths: Collection[pathlib.Path] = (),
+) -> List[CompilationUnit]:
+    units: Dict[pathlib.Path, CompilationUnit] = {}
+    futures: Dict[
+        pathlib.Path,
+        concurrent.futures.Future[
+            Tuple[Optional[str], str, List[ast.ToplevelDeclaration], _Times]
+        ],
+    ] = {}
+    if executor is not None:
+        for source_path in prefetch:
+            # A prefetched file may no longer exist or be imported
+            if (
+                source_path not in futures
+                and source_path not in prebuilt_paths
+                and source_path.is_file()
+            ):
+                futures[source_path] = executor.submit(
+                    _create_untyped_ast_in_worker, source_path, cache, timer.enabled
+                )
+
+    pending: Dict[
+        concurrent.futures.Future[
+            Tuple[Optional[str], str, List[ast.ToplevelDeclaration], _Times]
+        ],
+        CompilationUnit,
+    ] = {}
+    todo_list = [main_path]
+
+    while todo_list or pending:
+        while todo_list:
+            source_path = todo_list.pop()
+            if source_path in units or source_path in prebuilt_paths:
+                continue
+
+            if verbose:
+                print("Parsing", source_path)
+
+            unit = CompilationUnit(source_path, session, cache, timer)
+            units[source_path] = unit
+            if executor is None:
+                unit.create_untyped_ast()
+                todo_list.extend(unit.dependencies)
+            else:
+                if source_path not in futures:
+                    futures[source_path] = executor.submit(
+                        _create_untyped_ast_in_worker,
+                        source_path,
+                        cache,
+                        timer.enabled,
+                    )
+                pending[futures[source_path]] = unit
+
+        if pending:
+            done, not_done = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                unit = pending.pop(future)
+                error, ast_key, decls, times = future.result()
+                timer.merge(times)
+                if error is not None:
+                    unit._handle_error(error)
+                unit._set_untyped_ast(ast_key, decls)
+                todo_list.extend(unit.dependencies)
+
+    for source_path, future in futures.items():
+        if source_path not in units:
+            future.cancel()
+
+    # Same order as without parallelism, regardless of which file was parsed first
+    result: List[CompilationUnit] = []
+    visited: Set[pathlib.Path] = set()
+    todo_list = [main_path]
+    while todo_list:
+        source_path = todo_list.pop()
+        if source_path not in visited and source_path not in prebuilt_paths:
+            visited.add(source_path)
+            result.append(units[source_path])
+            todo_list.extend(units[source_path].dependencies)
+    return result
+
+
+def create_dependency_graph(units: List[CompilationUnit]) -> depgraph.DependencyGraph:
+    paths = {unit.source_path for unit in units}
+    graph = depgraph.DependencyGraph()
+    for unit in units:
+        # Prebuilt files are already compiled, no need to order them
+        graph.add(
+            unit.source_path, [path for path in unit.dependencies if path in paths]
+        )
+    return graph
+
+
+# Dependencies come before the units that need them
+def get_compilation_order(
+    units: List[CompilationUnit], graph: depgraph.DependencyGraph, verbose: bool
+) -> List[CompilationUnit]:
+    sorted_paths = graph.toposort()
+    if sorted_paths is None:
+        cycle = graph.find_cycle()
+        assert cycle is not None
+        message = " --> ".join(path.name for path in cycle)
+        raise RuntimeError("cyclic imports: " + message)
+
+    if verbose:
+        print("Compilation order:", ", ".join(path.name for path in sorted_paths))
+    units_by_path = {unit.source_path: unit for unit in units}
+    return [units_by_path[path] for path in sorted_paths]
+
+
+# Dependencies of a unit must come before it in compilation_order. With an
+# executor, function and method bodies are converted in parallel; they need
+# only the declarations of other files, and those are created here first.
+def create_c_code(
+    compilation_order: List[CompilationUnit],
+    passes: optimizer.PassManager,
+    verbose: bool,
+    executor: Optional[concurrent.futures.Executor] = None,
+    prebuilt_ir_keys: Optional[Dict[pathlib.Path, str]] = None,
+) -> None:
+    ir_keys = {} if prebuilt_ir_keys is None else prebuilt_ir_keys.copy()
+    if executor is None:
+        for unit in compilation_order:
+            if verbose:
+                print("Creating C code:", unit.source_path)
+            unit.create_c_code(ir_keys, passes)
+            ir_keys[unit.source_path] = unit.ir_key
+        return
+
+    irs: Dict[CompilationUnit, List[ir.ToplevelDeclaration]] = {}
+    pending: Dict[
+        CompilationUnit,
+        Tuple[concurrent.futures.Future[Tuple[Optional[str], bytes, _Times]], int, int],
+    ] = {}
+
+    for unit in compilation_order:
+        try:
+            unit._set_ir_key(ir_keys)
+            ir_keys[unit.source_path] = unit.ir_key
+            cached_ir = unit._load_cached_ir()
+            if cached_ir is not None:
+                irs[unit] = cached_ir
+                continue
+
+            if verbose:
+                print("Converting declarations:", unit.source_path)
+            symbols = unit.session.symbols
+            symbols_before = len(symbols)
+            with unit.timer.measure("ast2ir", unit.source_path):
+                converter = ast2ir.convert_declarations(
+                    unit.ast, unit.source_path, symbols
+                )
+            # Pickle now, because the converter changes when more files are done
+            with unit.timer.measure("pickle", unit.source_path):
+                pickled = frontend_cache.dumps((converter, unit.ast), [])
+            future = executor.submit(
+                _convert_function_bodies_in_worker,
+                pickled,
+                unit.source_path,
+                unit.timer.enabled,
+            )
+            pending[unit] = (future, symbols_before, len(symbols))
+        except Exception:
+            unit._handle_error()
+
+    for unit, (future, symbols_start, symbols_end) in pending.items():
+        error, pickled, times = future.result()
+        unit.timer.merge(times)
+        if error is not None:
+            unit._handle_error(error)
+
+        symbols = unit.session.symbols
+        try:
+            with unit.timer.measure("pickle", unit.source_path):
+                top_decls, body_symbols = frontend_cache.loads(pickled, symbols)
+        except Exception:
+            unit._handle_error()
+        symbols.extend(body_symbols)
+        irs[unit] = top_decls
+        if unit.cache is not None:
+            with unit.timer.measure("frontend cache", unit.source_path):
+                unit.cache.store_ir(
+                    unit.ir_key,
+                    top_decls,
+                    symbols[symbols_start:symbols_end] + body_symbols,
+                    symbols[:symbols_start],
+                )
+
+    for unit in compilation_order:
+        if verbose:
+            print("Creating C code:", unit.source_path)
+        try:
+            unit._emit_c_code(irs[unit], passes)
+        except Exception:
+            unit._handle_error()
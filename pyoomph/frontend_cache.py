@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import collections
+import functools
+import hashlib
+import io
+import os
+import pathlib
+import pickle
+import shutil
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from pyoomph import ast, depgraph, ir
+from pyoomph.types import LIST, builtin_types
+
+_python_code_dir = pathlib.Path(__file__).absolute().parent
+
+
+# Changes whenever any part of the compiler changes. Also includes python
+# version, because pickles are not guaranteed to work across versions.
+@functools.lru_cache(maxsize=None)
+def get_compiler_version() -> str:
+    sha = hashlib.sha256(sys.version.encode("utf-8"))
+    for path in sorted(_python_code_dir.glob("*.py")):
+        sha.update(path.name.encode("utf-8") + b"\0")
+        sha.update(path.read_bytes() + b"\0")
+    return sha.hexdigest()
+
+
+def _hash_strings(*strings: str) -> str:
+    sha = hashlib.sha256()
+    for string in strings:
+        sha.update(string.encode("utf-8") + b"\0")
+    return sha.hexdigest()
+
+
+def get_ast_key(
+    source_path: pathlib.Path, source_code: str, stdlib: pathlib.Path
+) -> str:
+    # Import paths in the AST depend on source_path and stdlib
+    return _hash_strings(
+        "ast", get_compiler_version(), str(source_path), str(stdlib), source_code
+    )
+
+
+# Depends on the imported files through their keys, so transitive imports matter too
+def get_ir_key(ast_key: str, dependency_keys: List[str]) -> str:
+    # assert messages contain paths relative to current working directory
+    return _hash_strings("ir", ast_key, os.getcwd(), *dependency_keys)
+
+
+# Depends on all files of a program through their keys, and on other things
+# that affect the resulting executable
+def get_executable_key(main_path: str, ast_keys: List[str], options: List[str]) -> str:
+    return _hash_strings(
+        "executable",
+        main_path,
+        os.getcwd(),
+        str(len(ast_keys)),
+        *sorted(ast_keys),
+        *options,
+    )
+
+
+# Objects that must not be copied when unpickling, because the compiler
+# compares them with 'is' or relies on their identity in some other way.
+def _get_builtin_persistent_ids() -> Dict[int, Tuple[str, ...]]:
+    result: Dict[int, Tuple[str, ...]] = {}
+    for name, the_type in builtin_types.items():
+        result[id(the_type)] = ("type", name)
+    result[id(LIST)] = ("generic", LIST.name)
+    for name, var in ir.visible_builtins.items():
+        result[id(var)] = ("visible_builtin", name)
+    for name, var in ir.hidden_builtins.items():
+        result[id(var)] = ("hidden_builtin", name)
+    return result
+
+
+def _resolve_builtin(persistent_id: Tuple[str, ...]) -> object:
+    kind, name = persistent_id
+    if kind == "type":
+        return builtin_types[name]
+    if kind == "generic":
+        assert name == LIST.name
+        return LIST
+    if kind == "visible_builtin":
+        return ir.visible_builtins[name]
+    if kind == "hidden_builtin":
+        return ir.hidden_builtins[name]
+    raise ValueError(persistent_id)
+
+
+# A file can define a type and a function with the same name
+def _get_symbol_id(symbol: ir.Symbol) -> Tuple[str, ...]:
+    kind = "variable" if isinstance(symbol.value, ir.FileVariable) else "type"
+    return ("symbol", str(symbol.path), symbol.name, kind)
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, foreign_symbols: List[ir.Symbol]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._persistent_ids = _get_builtin_persistent_ids()
+        for symbol in foreign_symbols:
+            self._persistent_ids.setdefault(id(symbol.value), _get_symbol_id(symbol))
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple[str, ...]]:
+        return self._persistent_ids.get(id(obj))
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, foreign_symbols: List[ir.Symbol]):
+        super().__init__(file)
+        self._foreign_symbols = foreign_symbols
+        self._symbol_lookup: Optional[Dict[Tuple[str, ...], object]] = None
+
+    def persistent_load(self, pid: Any) -> object:
+        if pid[0] != "symbol":
+            return _resolve_builtin(pid)
+
+        if self._symbol_lookup is None:
+            self._symbol_lookup = {
+                _get_symbol_id(symbol): symbol.value for symbol in self._foreign_symbols
+            }
+        try:
+            return self._symbol_lookup[pid]
+        except KeyError:
+            raise pickle.UnpicklingError(f"symbol not available: {pid}")
+
+
+# Objects that are values of foreign_symbols are not pickled. Instead,
+# the corresponding symbols are looked up by path and name when loading.
+def dumps(obj: object, foreign_symbols: List[ir.Symbol]) -> bytes:
+    file = io.BytesIO()
+    _Pickler(file, foreign_symbols).dump(obj)
+    return file.getvalue()
+
+
+def loads(data: bytes, foreign_symbols: List[ir.Symbol]) -> Any:
+    return _Unpickler(io.BytesIO(data), foreign_symbols).load()
+
+
+# Keeps recently used cache files in memory, for compilers that compile many
+# programs (see server.py). Least recently used files are forgotten first.
+class MemoryCache:
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._total_bytes = 0
+        self._files: collections.OrderedDict[str, bytes] = collections.OrderedDict()
+
+    def get(self, name: str) -> Optional[bytes]:
+        try:
+            self._files.move_to_end(name)
+        except KeyError:
+            return None
+        return self._files[name]
+
+    def put(self, name: str, data: bytes) -> None:
+        old_data = self._files.pop(name, None)
+        if old_data is not None:
+            self._total_bytes -= len(old_data)
+        self._files[name] = data
+        self._total_bytes += len(data)
+        while self._total_bytes > self.max_bytes:
+            name, old_data = self._files.popitem(last=False)
+            self._total_bytes -= len(old_data)
+
+
+class FrontendCache:
+    def __init__(
+        self, cache_dir: pathlib.Path, memory_cache: Optional[MemoryCache] = None
+    ):
+        self.cache_dir = cache_dir
+        self.memory_cache = memory_cache
+
+    def _get_path(self, key: str, suffix: str) -> pathlib.Path:
+        return self.cache_dir / (key + suffix)
+
+    def _read(self, key: str, suffix: str) -> Optional[bytes]:
+        # Keys are hashes of everything that matters, so it's fine to share
+        # a memory cache between different cache directories
+        if self.memory_cache is not None:
+            data = self.memory_cache.get(key + suffix)
+            if data is not None:
+                return data
+
+        path = self._get_path(key, suffix)
+        try:
+            data = path.read_bytes()
+            # cache_manager deletes least recently used files first
+            os.utime(path)
+        except OSError:
+            return None
+        if self.memory_cache is not None:
+            self.memory_cache.put(key + suffix, data)
+        return data
+
+    def _write(self, key: str, suffix: str, data: bytes) -> None:
+        if self.memory_cache is not None:
+            self.memory_cache.put(key + suffix, data)
+
+        # Other oomph compilers can run in parallel, so don't leave
+        # half-written files into the cache directory.
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with open(fd, "wb") as file:
+                    file.write(data)
+                os.replace(temp_path, self._get_path(key, suffix))
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError:
+            # Caching is an optimization, compiling should work without it
+            pass
+
+    def load_ast(self, key: str) -> Optional[List[ast.ToplevelDeclaration]]:
+        data = self._read(key, ".ast.pickle")
+        if data is None:
+            return None
+        try:
+            result: List[ast.ToplevelDeclaration] = loads(data, [])
+        except Exception:
+            return None
+        return result
+
+    def store_ast(self, key: str, decls: List[ast.ToplevelDeclaration]) -> None:
+        self._write(key, ".ast.pickle", dumps(decls, []))
+
+    # Returns typed IR and the symbols that the file added
+    def load_ir(
+        self, key: str, foreign_symbols: List[ir.Symbol]
+    ) -> Optional[Tuple[List[ir.ToplevelDeclaration], List[ir.Symbol]]]:
+        data = self._read(key, ".ir.pickle")
+        if data is None:
+            return None
+        try:
+            result: Tuple[List[ir.ToplevelDeclaration], List[ir.Symbol]] = loads(
+                data, foreign_symbols
+            )
+        except Exception:
+            return None
+        return result
+
+    def store_ir(
+        self,
+        key: str,
+        top_decls: List[ir.ToplevelDeclaration],
+        new_symbols: List[ir.Symbol],
+        foreign_symbols: List[ir.Symbol],
+    ) -> None:
+        self._write(key, ".ir.pickle", dumps((top_decls, new_symbols), foreign_symbols))
+
+    # Imports found when the file was compiled last time, used as a hint for
+    # what to parse before it's known to be needed
+    def load_depgraph(
+        self, main_path: pathlib.Path
+    ) -> Optional[depgraph.DependencyGraph]:
+        data = self._read(_hash_strings("depgraph", str(main_path)), ".json")
+        if data is None:
+            return None
+        try:
+            return depgraph.DependencyGraph.from_json(data.decode("utf-8"))
+        except Exception:
+            return None
+
+    def store_depgraph(
+        self, main_path: pathlib.Path, graph: depgraph.DependencyGraph
+    ) -> None:
+        key = _hash_strings("depgraph", str(main_path))
+        self._write(key, ".json", graph.to_json().encode("utf-8"))
+
+    # Compiled programs, so that running a program again doesn't compile it
+    # again when nothing has changed. These are not kept in memory_cache,
+    # because they are big and copied straight from file to file.
+    def load_executable(self, key: str, destination: pathlib.Path) -> bool:
+        path = self._get_path(key, ".executable")
+        try:
+            shutil.copy(path, destination)
+            os.utime(path)
+        except OSError:
+            return False
+        return True
+
+    def store_executable(self, key: str, executable: pathlib.Path) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            os.close(fd)
+            try:
+                shutil.copy(executable, temp_path)
+                os.replace(temp_path, self._get_path(key, ".executable"))
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError:
+            pass
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import bisect
+import dataclasses
+import pathlib
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from pyoomph import ast, parser, tokenizer
+
+# Parses a file again after a small change, e.g. in an editor after each key
+# press. Only the toplevel declarations (func, class, typedef, import) that
+# the change touches are tokenized and parsed again, and the rest are reused.
+#
+# A toplevel declaration starts at the beginning of a line, where the
+# tokenizer is in its initial state: no parentheses, no indentation. So
+# tokenizing from the start of a declaration to the start of a later
+# declaration gives the same tokens as tokenizing the whole file, as long as
+# that part of the code tokenizes and parses without errors on its own. For
+# example, it doesn't if the change adds a "(" without a matching ")", and
+# in that case everything after the change is parsed again.
+
+
+@dataclass
+class ParsedFile:
+    code: str
+    path: pathlib.Path
+    stdlib: Optional[pathlib.Path]
+    tokens: tokenizer.TokenBuffer
+    decls: List[ast.ToplevelDeclaration]
+    decl_starts: List[int]  # index of first token of each declaration
+
+
+def parse(code: str, path: pathlib.Path, stdlib: Optional[pathlib.Path]) -> ParsedFile:
+    tokens = tokenizer.tokenize(code)
+    decls, decl_starts = parser.parse_declarations(tokens, path, stdlib)
+    return ParsedFile(code, path, stdlib, tokens, decls, decl_starts)
+
+
+def _move_locations(ast_thing: object, offset_change: int, line_change: int) -> None:
+    if isinstance(ast_thing, tokenizer.Location):
+        pass
+    elif isinstance(ast_thing, (list, tuple)):
+        for item in ast_thing:
+            _move_locations(item, offset_change, line_change)
+    elif dataclasses.is_dataclass(ast_thing):
+        for value in vars(ast_thing).values():
+            _move_locations(value, offset_change, line_change)
+        location = getattr(ast_thing, "location", None)
+        if location is not None:
+            offset, lineno, column = location
+            setattr(
+                ast_thing,
+                "location",
+                tokenizer.Location(
+                    offset + offset_change, lineno + line_change, column
+                ),
+            )
+
+
+def _parse_part(
+    old: ParsedFile,
+    code: str,
+    location: tokenizer.Location,
+    end_offset: int,
+    imports_allowed: bool,
+) -> Tuple[tokenizer.TokenBuffer, List[ast.ToplevelDeclaration], List[int]]:
+    tokens = tokenizer.tokenize(code[location.offset : end_offset], location)
+    decls, decl_starts = parser.parse_declarations(
+        tokens, old.path, old.stdlib, imports_allowed
+    )
+    return (tokens, decls, decl_starts)
+
+
+# Returns the same thing as parse(new_code, ...), when new_code is old.code
+# with old.code[start:old_end] replaced by new_code[start:new_end]. Raises
+# the same errors as parse() if new_code doesn't parse.
+#
+# Declarations before and after the change are reused, and locations in them
+# are updated, so old must not be used after calling this.
+def reparse(
+    old: ParsedFile, new_code: str, start: int, old_end: int, new_end: int
+) -> ParsedFile:
+    assert 0 <= start <= old_end <= len(old.code)
+    assert start <= new_end <= len(new_code)
+    assert len(new_code) - new_end == len(old.code) - old_end
+
+    offset_change = new_end - old_end
+    line_change = new_code.count("\n", start, new_end) - old.code.count(
+        "\n", start, old_end
+    )
+    decl_offsets = [old.tokens.starts[index] for index in old.decl_starts]
+
+    # Start at the last declaration that starts before the change. If the
+    # change is at the start of a declaration, it can affect the previous
+    # declaration, e.g. when adding indentation.
+    first_decl = bisect.bisect_left(decl_offsets, start) - 1
+    if first_decl >= 0:
+        first_token = old.decl_starts[first_decl]
+        location = old.tokens.get_location(first_token)
+    else:
+        first_decl = 0
+        first_token = 0
+        location = tokenizer.Location(0, 1, 1)
+    imports_allowed = all(
+        isinstance(decl, ast.Import) for decl in old.decls[:first_decl]
+    )
+
+    # Stop at the first declaration that starts after the change, or at the
+    # end of the file if that doesn't work
+    end_decl = bisect.bisect_right(decl_offsets, old_end)
+    part = None
+    if end_decl < len(old.decls):
+        try:
+            part = _parse_part(
+                old,
+                new_code,
+                location,
+                decl_offsets[end_decl] + offset_change,
+                imports_allowed,
+            )
+        except Exception:
+            # Tokenizer and parser errors can be of any type
+            pass
+        else:
+            # An import after the change would be an error
+            if isinstance(old.decls[end_decl], ast.Import) and not all(
+                isinstance(decl, ast.Import) for decl in part[1]
+            ):
+                part = None
+    if part is None:
+        end_decl = len(old.decls)
+        part = _parse_part(old, new_code, location, len(new_code), imports_allowed)
+    part_tokens, part_decls, part_decl_starts = part
+
+    tokens = tokenizer.TokenBuffer(new_code)
+    tokens.extend(old.tokens, 0, first_token)
+    tokens.extend(part_tokens, 0, len(part_tokens), location.offset)
+    decl_starts = old.decl_starts[:first_decl]
+    decl_starts.extend(first_token + index for index in part_decl_starts)
+
+    reused_decls = old.decls[end_decl:]
+    if reused_decls:
+        old_end_token = old.decl_starts[end_decl]
+        token_index_change = len(tokens) - old_end_token
+        tokens.extend(
+            old.tokens, old_end_token, len(old.tokens), offset_change, line_change
+        )
+        decl_starts.extend(
+            index + token_index_change for index in old.decl_starts[end_decl:]
+        )
+        if offset_change != 0 or line_change != 0:
+            _move_locations(reused_decls, offset_change, line_change)
+
+    decls = old.decls[:first_decl] + part_decls + reused_decls
+    return ParsedFile(new_code, old.path, old.stdlib, tokens, decls, decl_starts)
@@ -229,9 +229,14 @@ class UnSet(Instruction):
 
 
 # TODO: replace Return with gotos?
+#
+# If move is False, the returned value is increffed, and value keeps its
+# reference. If move is True, the reference that value holds goes to the
+# caller, and value is unset so that it won't be decreffed.
 @dataclass(eq=False)
 class Return(Instruction):
     value: Optional[LocalVariable]
+    move: bool = False
 
 
 @dataclass(eq=False, repr=False)
@@ -248,6 +253,24 @@ class Goto(Instruction):
         assert self.cond.type == BOOL
 
 
+# For foreach loops. Goes to done_label if there are no more items in the
+# list, otherwise sets item to list.get(index) and increments index.
+#
+# If borrow is False, item holds a reference, and the old value of item is
+# decreffed. If borrow is True, item doesn't hold a reference. It must not be
+# decreffed, and the list must keep the item alive while item is used.
+@dataclass(eq=False)
+class GetNextFromList(Instruction):
+    list: LocalVariable
+    index: LocalVariable
+    item: LocalVariable
+    done_label: GotoLabel
+    borrow: bool = False
+
+    def __post_init__(self) -> None:
+        assert self.index.type == INT
+
+
 # Runtime error if trying to get wrong union member
 # think of it as VarCpy for unions
 @dataclass(eq=False)
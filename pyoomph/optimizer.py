@@ -0,0 +1,804 @@
+from __future__ import annotations
+
+import math
+import pathlib
+from dataclasses import dataclass, field
+from typing import Callable, Collection, Dict, List, Optional, Set, Tuple, Union
+
+from pyoomph import ir, timing
+from pyoomph.types import BOOL, FLOAT, INT, STRING
+
+# Cleans up the IR of function and method bodies before c_output turns it
+# into C. To keep ast2ir simple, it creates a new local variable for every
+# value, and operators become calls to hidden builtins even when all
+# operands are constants.
+#
+# The passes rely on how ast2ir creates IR. A local variable is always set
+# before it's used, by an instruction that comes before the uses in the
+# list of instructions. When a loop sets a variable again, the old value is
+# decreffed and unset first, before the instruction that sets it.
+#
+# Optimization levels:
+#   0   don't optimize
+#   1   run each pass once
+#   2   run the passes until they no longer change anything
+
+DEFAULT_LEVEL = 1
+LEVELS = [0, 1, 2]
+_MAX_ROUNDS = 10
+
+_FunctionDef = Union[ir.FuncDef, ir.MethodDef]
+_Constant = Union[bool, int, float, str]
+
+
+# Variables that the instruction sets, not including UnSet
+def _get_set_vars(ins: ir.Instruction) -> List[ir.LocalVariable]:
+    if isinstance(ins, (ir.IntConstant, ir.FloatConstant, ir.StringConstant)):
+        return [ins.var]
+    if isinstance(ins, ir.VarCpy):
+        return [ins.dest]
+    if isinstance(
+        ins,
+        (
+            ir.GetAttribute,
+            ir.CallConstructor,
+            ir.PointersEqual,
+            ir.InstantiateUnion,
+            ir.GetFromUnion,
+            ir.UnionMemberCheck,
+        ),
+    ):
+        return [ins.result]
+    if isinstance(ins, (ir.CallFunction, ir.CallMethod)):
+        return [] if ins.result is None else [ins.result]
+    if isinstance(ins, ir.GetNextFromList):
+        return [ins.index, ins.item]
+    return []
+
+
+# Calls replace() for each variable whose value the instruction uses, and
+# puts the return value in its place. IncRef, DecRef and UnSet only change
+# reference counts, and they don't count as using the value.
+def _replace_used_vars(
+    ins: ir.Instruction, replace: Callable[[ir.LocalVariable], ir.LocalVariable]
+) -> None:
+    if isinstance(ins, ir.VarCpy):
+        if isinstance(ins.source, ir.LocalVariable):
+            ins.source = replace(ins.source)
+    elif isinstance(ins, ir.GetAttribute):
+        ins.obj = replace(ins.obj)
+    elif isinstance(ins, ir.SetAttribute):
+        ins.obj = replace(ins.obj)
+        ins.value = replace(ins.value)
+    elif isinstance(ins, ir.CallMethod):
+        ins.obj = replace(ins.obj)
+        ins.args = [replace(arg) for arg in ins.args]
+    elif isinstance(ins, (ir.CallFunction, ir.CallConstructor)):
+        ins.args = [replace(arg) for arg in ins.args]
+    elif isinstance(ins, ir.PointersEqual):
+        ins.lhs = replace(ins.lhs)
+        ins.rhs = replace(ins.rhs)
+    elif isinstance(ins, ir.InstantiateUnion):
+        ins.value = replace(ins.value)
+    elif isinstance(ins, ir.Return):
+        if ins.value is not None:
+            ins.value = replace(ins.value)
+    elif isinstance(ins, ir.Goto):
+        if isinstance(ins.cond, ir.LocalVariable):
+            ins.cond = replace(ins.cond)
+    elif isinstance(ins, ir.GetNextFromList):
+        ins.list = replace(ins.list)
+        ins.index = replace(ins.index)
+    elif isinstance(ins, (ir.GetFromUnion, ir.UnionMemberCheck)):
+        ins.union = replace(ins.union)
+
+
+def _get_used_vars(ins: ir.Instruction) -> List[ir.LocalVariable]:
+    result: List[ir.LocalVariable] = []
+
+    def add(var: ir.LocalVariable) -> ir.LocalVariable:
+        result.append(var)
+        return var
+
+    _replace_used_vars(ins, add)
+    return result
+
+
+# Indexes of the instructions that mention a variable
+@dataclass
+class _VarInfo:
+    sets: List[int] = field(default_factory=list)
+    uses: List[int] = field(default_factory=list)
+    increfs: List[int] = field(default_factory=list)
+    decrefs_and_unsets: List[int] = field(default_factory=list)
+
+
+def _analyze(body: List[ir.Instruction]) -> Dict[ir.LocalVariable, _VarInfo]:
+    infos: Dict[ir.LocalVariable, _VarInfo] = {}
+    for index, ins in enumerate(body):
+        if isinstance(ins, ir.IncRef):
+            infos.setdefault(ins.var, _VarInfo()).increfs.append(index)
+        elif isinstance(ins, (ir.DecRef, ir.UnSet)):
+            infos.setdefault(ins.var, _VarInfo()).decrefs_and_unsets.append(index)
+        else:
+            for var in _get_used_vars(ins):
+                infos.setdefault(var, _VarInfo()).uses.append(index)
+            for var in _get_set_vars(ins):
+                infos.setdefault(var, _VarInfo()).sets.append(index)
+    return infos
+
+
+_INT_MIN = -(2 ** 63)
+_INT_MAX = 2 ** 63 - 1
+
+
+# Overflowing is undefined behaviour in C, so it's left to happen at runtime.
+# The smallest Int isn't folded either, because a C literal can't be it.
+def _int(value: int) -> Optional[int]:
+    return value if _INT_MIN < value <= _INT_MAX else None
+
+
+# There are no C literals for infinity and nan
+def _float(value: float) -> Optional[float]:
+    return value if math.isfinite(value) else None
+
+
+# Must do the same as the C code in lib/oomph.h. Returns None if the result
+# can't be known at compile time.
+_FOLDERS: Dict[str, Callable[..., Optional[_Constant]]] = {
+    "bool_eq": (lambda a, b: a == b),
+    "bool_not": (lambda a: not a),
+    "float_add": (lambda a, b: _float(a + b)),
+    "float_div": (lambda a, b: None if b == 0 else _float(a / b)),
+    "float_eq": (lambda a, b: a == b),
+    "float_gt": (lambda a, b: a > b),
+    "float_mul": (lambda a, b: _float(a * b)),
+    "float_neg": (lambda a: -a),
+    "float_sub": (lambda a, b: _float(a - b)),
+    "int2float": float,
+    "int_add": (lambda a, b: _int(a + b)),
+    "int_eq": (lambda a, b: a == b),
+    "int_gt": (lambda a, b: a > b),
+    # Python's % and oomph_int_mod both give a result with the sign of b
+    "int_mod": (lambda a, b: None if b == 0 else a % b),
+    "int_mul": (lambda a, b: _int(a * b)),
+    "int_neg": (lambda a: _int(-a)),
+    "int_sub": (lambda a, b: _int(a - b)),
+    "string_concat": (lambda a, b: a + b),
+    "string_eq": (lambda a, b: a == b),
+}
+_EQUALS_TYPES = {BOOL, FLOAT, INT, STRING}
+
+
+def _is_hidden_builtin(var: ir.Variable, names: Collection[str]) -> bool:
+    return (
+        isinstance(var, ir.BuiltinVariable)
+        and var.name in names
+        and ir.hidden_builtins.get(var.name) is var
+    )
+
+
+def _get_constant(
+    ins: ir.Instruction, constants: Dict[ir.LocalVariable, _Constant]
+) -> Optional[Tuple[ir.LocalVariable, _Constant]]:
+    if isinstance(ins, (ir.IntConstant, ir.StringConstant)):
+        return (ins.var, ins.value)
+    if isinstance(ins, ir.FloatConstant):
+        return (ins.var, float(ins.value))
+    if isinstance(ins, ir.VarCpy):
+        if ins.source is ir.visible_builtins["true"]:
+            return (ins.dest, True)
+        if ins.source is ir.visible_builtins["false"]:
+            return (ins.dest, False)
+        if isinstance(ins.source, ir.LocalVariable) and ins.source in constants:
+            return (ins.dest, constants[ins.source])
+    return None
+
+
+def _create_constant(var: ir.LocalVariable, value: _Constant) -> ir.Instruction:
+    if var.type is BOOL:
+        assert isinstance(value, bool)
+        return ir.VarCpy(var, ir.visible_builtins["true" if value else "false"])
+    if var.type is INT:
+        assert isinstance(value, int)
+        return ir.IntConstant(var, value)
+    if var.type is FLOAT:
+        assert isinstance(value, float)
+        # repr() gives the shortest string that parses back to the same float
+        return ir.FloatConstant(var, repr(value))
+    assert var.type is STRING and isinstance(value, str)
+    return ir.StringConstant(var, value)
+
+
+def _fold(
+    ins: ir.Instruction, constants: Dict[ir.LocalVariable, _Constant]
+) -> Optional[ir.Instruction]:
+    if isinstance(ins, ir.CallFunction) and _is_hidden_builtin(ins.func, _FOLDERS):
+        assert isinstance(ins.func, ir.BuiltinVariable)
+        folder = _FOLDERS[ins.func.name]
+        args = ins.args
+    elif (
+        isinstance(ins, ir.CallMethod)
+        and ins.method_name == "equals"
+        and ins.obj.type in _EQUALS_TYPES
+    ):
+        folder = _FOLDERS["string_eq"]  # any of the *_eq would do
+        args = [ins.obj] + ins.args
+    else:
+        return None
+
+    assert ins.result is not None
+    if not all(arg in constants for arg in args):
+        return None
+    arg_values = [constants[arg] for arg in args]
+    if any(
+        isinstance(value, int) and not isinstance(value, bool) and _int(value) is None
+        for value in arg_values
+    ):
+        return None
+
+    result = folder(*arg_values)
+    if result is None:
+        return None
+    return _create_constant(ins.result, result)
+
+
+# Calls of hidden builtins with constant arguments are computed at compile
+# time, and gotos with a constant condition become unconditional or go away.
+# Only variables that are set once are treated as constants.
+def _fold_constants(funcdef: _FunctionDef) -> int:
+    infos = _analyze(funcdef.body)
+    constants: Dict[ir.LocalVariable, _Constant] = {}
+    changes = 0
+    new_body: List[ir.Instruction] = []
+
+    for ins in funcdef.body:
+        if isinstance(ins, ir.Goto) and ins.cond in constants:
+            assert isinstance(ins.cond, ir.LocalVariable)
+            changes += 1
+            if constants[ins.cond]:
+                new_body.append(ir.Goto(ins.label, ir.visible_builtins["true"]))
+            continue
+
+        folded = _fold(ins, constants)
+        if folded is not None:
+            ins = folded
+            changes += 1
+        new_body.append(ins)
+
+        constant = _get_constant(ins, constants)
+        if constant is not None:
+            var, value = constant
+            if len(infos[var].sets) == 1:
+                constants[var] = value
+
+    funcdef.body = new_body
+    return changes
+
+
+# A variable that never changes, from the given instruction onwards
+def _is_stable_from(
+    var: ir.LocalVariable,
+    index: int,
+    infos: Dict[ir.LocalVariable, _VarInfo],
+    argvars: Set[ir.LocalVariable],
+) -> bool:
+    info = infos[var]
+    if var in argvars:
+        # Arguments are borrowed from the caller and copied to other variables
+        # before assigning to them
+        return not info.sets and not info.decrefs_and_unsets
+    return (
+        len(info.sets) == 1
+        and info.sets[0] < index
+        and all(i < info.sets[0] for i in info.decrefs_and_unsets)
+    )
+
+
+# Like _is_stable_from(), but only until the end instruction, and only
+# within one basic block
+def _is_unchanged_until(
+    var: ir.LocalVariable, start: int, end: int, body: List[ir.Instruction]
+) -> bool:
+    for ins in body[start + 1 : end]:
+        if isinstance(ins, (ir.GotoLabel, ir.Goto, ir.Return, ir.GetNextFromList)):
+            return False
+        if isinstance(ins, (ir.DecRef, ir.UnSet)):
+            if ins.var is var:
+                return False
+        elif var in _get_set_vars(ins):
+            return False
+    return True
+
+
+# After "VarCpy(copy, original)", uses of copy are replaced with original,
+# if neither variable changes while copy is used. This leaves copy unused,
+# and dead local elimination can then remove it with its IncRef and DecRef.
+def _propagate_copies(funcdef: _FunctionDef) -> int:
+    body = funcdef.body
+    infos = _analyze(body)
+    argvars = set(funcdef.argvars)
+    replacements: Dict[ir.LocalVariable, ir.LocalVariable] = {}
+    own_increfs: Set[int] = set()
+
+    for index, ins in enumerate(body):
+        if not isinstance(ins, ir.VarCpy) or not isinstance(
+            ins.source, ir.LocalVariable
+        ):
+            continue
+        copy = ins.dest
+        original = replacements.get(ins.source, ins.source)
+        if copy in argvars or copy.type != original.type:
+            continue
+
+        info = infos[copy]
+        if info.sets != [index] or any(i < index for i in info.uses + info.increfs):
+            continue
+        # Often the original never changes, e.g. it's an argument. If it's a
+        # variable that the code assigns to, the copy is usually used right
+        # away, before the next assignment.
+        if not _is_stable_from(original, index, infos, argvars):
+            last_use = max(info.uses + info.increfs, default=index)
+            if not _is_unchanged_until(original, index, last_use, body):
+                continue
+
+        # The copy holds a reference of its own, with an IncRef right after
+        # the copying. Other increfs move a reference elsewhere, e.g. to an
+        # attribute, and can incref the original instead.
+        if copy.type.refcounted:
+            next_ins = body[index + 1] if index + 1 < len(body) else None
+            if not (isinstance(next_ins, ir.IncRef) and next_ins.var is copy):
+                continue
+            own_increfs.add(index + 1)
+        replacements[copy] = original
+
+    if not replacements:
+        return 0
+
+    def replace(var: ir.LocalVariable) -> ir.LocalVariable:
+        return replacements.get(var, var)
+
+    for index, ins in enumerate(body):
+        if isinstance(ins, ir.IncRef):
+            if ins.var.type.refcounted and index not in own_increfs:
+                ins.var = replace(ins.var)
+        elif not isinstance(ins, (ir.DecRef, ir.UnSet)):
+            _replace_used_vars(ins, replace)
+    return len(replacements)
+
+
+_PURE_BUILTINS = set(_FOLDERS) - {"int_mod"}  # int_mod crashes when dividing by zero
+
+
+def _is_removable_set(ins: ir.Instruction) -> bool:
+    if isinstance(ins, ir.CallFunction):
+        return _is_hidden_builtin(ins.func, _PURE_BUILTINS)
+    if isinstance(ins, ir.CallMethod):
+        return ins.method_name == "equals" and ins.obj.type in _EQUALS_TYPES
+    return isinstance(
+        ins,
+        (
+            ir.VarCpy,
+            ir.GetAttribute,
+            ir.IntConstant,
+            ir.FloatConstant,
+            ir.StringConstant,
+            ir.PointersEqual,
+            ir.UnionMemberCheck,
+        ),
+    )
+
+
+# For reference counted variables, every reference that the variable holds
+# must go away with it. The variable holds a reference from the instruction
+# that sets it (e.g. a call), or from an IncRef right after VarCpy or
+# GetAttribute. Any other IncRef gives a reference to something else.
+def _increfs_go_away(
+    var: ir.LocalVariable, info: _VarInfo, body: List[ir.Instruction]
+) -> bool:
+    if not var.type.refcounted:
+        return True
+    borrowing_sets = [
+        i for i in info.sets if isinstance(body[i], (ir.VarCpy, ir.GetAttribute))
+    ]
+    return [i + 1 for i in borrowing_sets] == info.increfs
+
+
+# Removes local variables whose values are never used, together with the
+# instructions that set them and change their reference counts. Reference
+# counting instructions of types that aren't reference counted do nothing,
+# so they are removed too.
+def _remove_dead_locals(funcdef: _FunctionDef) -> int:
+    body = funcdef.body
+    infos = _analyze(body)
+    argvars = set(funcdef.argvars)
+    removed: Set[int] = set()
+    for var, info in infos.items():
+        dead = (
+            var not in argvars
+            and not info.uses
+            and all(_is_removable_set(body[i]) for i in info.sets)
+            and _increfs_go_away(var, info, body)
+        )
+        if dead:
+            removed.update(info.sets)
+        if dead or not var.type.refcounted:
+            removed.update(info.increfs)
+            removed.update(info.decrefs_and_unsets)
+    funcdef.body = [ins for index, ins in enumerate(body) if index not in removed]
+    return len(removed)
+
+
+def _is_unconditional_jump(ins: ir.Instruction) -> bool:
+    return isinstance(ins, ir.Return) or (
+        isinstance(ins, ir.Goto) and ins.cond is ir.visible_builtins["true"]
+    )
+
+
+# Removes code after an unconditional jump until the next label that some
+# goto jumps to, labels that nothing jumps to, and gotos to the label right
+# after the goto
+def _remove_unreachable_code(funcdef: _FunctionDef) -> int:
+    body = funcdef.body
+    targets: Set[ir.GotoLabel] = set()
+    for ins in body:
+        if isinstance(ins, ir.Goto):
+            targets.add(ins.label)
+        elif isinstance(ins, ir.GetNextFromList):
+            targets.add(ins.done_label)
+
+    new_body: List[ir.Instruction] = []
+    reachable = True
+    for index, ins in enumerate(body):
+        if isinstance(ins, ir.GotoLabel):
+            if ins not in targets:
+                continue
+            reachable = True
+        if not reachable:
+            continue
+        if (
+            isinstance(ins, ir.Goto)
+            and index + 1 < len(body)
+            and body[index + 1] is ins.label
+        ):
+            continue
+        new_body.append(ins)
+        if _is_unconditional_jump(ins):
+            reachable = False
+
+    funcdef.body = new_body
+    return len(body) - len(new_body)
+
+
+# Basic blocks start at labels and after jumps. Block 0 is where the
+# function starts.
+@dataclass
+class _Block:
+    start: int
+    end: int
+    successors: List[int] = field(default_factory=list)
+    predecessors: List[int] = field(default_factory=list)
+
+
+def _create_blocks(body: List[ir.Instruction]) -> List[_Block]:
+    starts = {0}
+    for index, ins in enumerate(body):
+        if isinstance(ins, ir.GotoLabel):
+            starts.add(index)
+        elif isinstance(ins, (ir.Goto, ir.Return, ir.GetNextFromList)):
+            starts.add(index + 1)
+    sorted_starts = sorted(start for start in starts if start < len(body))
+    blocks = [
+        _Block(start, end)
+        for start, end in zip(sorted_starts, sorted_starts[1:] + [len(body)])
+    ]
+
+    label_blocks = {
+        body[block.start]: block_index
+        for block_index, block in enumerate(blocks)
+        if isinstance(body[block.start], ir.GotoLabel)
+    }
+    for block_index, block in enumerate(blocks):
+        last = body[block.end - 1]
+        if isinstance(last, ir.Goto):
+            block.successors.append(label_blocks[last.label])
+        elif isinstance(last, ir.GetNextFromList):
+            block.successors.append(label_blocks[last.done_label])
+        if not _is_unconditional_jump(last) and block_index + 1 < len(blocks):
+            block.successors.append(block_index + 1)
+        for successor in block.successors:
+            blocks[successor].predecessors.append(block_index)
+    return blocks
+
+
+# Data flow analyses use ints as sets of variables, with one bit for each
+# variable
+class _VarBits:
+    def __init__(self) -> None:
+        self._bits: Dict[ir.LocalVariable, int] = {}
+
+    def get(self, var: ir.LocalVariable) -> int:
+        try:
+            return self._bits[var]
+        except KeyError:
+            bit = 1 << len(self._bits)
+            self._bits[var] = bit
+            return bit
+
+    def get_all(self, variables: List[ir.LocalVariable]) -> int:
+        result = 0
+        for var in variables:
+            result |= self.get(var)
+        return result
+
+
+# A variable is live if its value may be needed later. Here IncRef counts as
+# needing the value, because it gives a reference to something else, but
+# DecRef doesn't, because it does nothing after the reference is moved away.
+# Returns the live variables after each instruction.
+def _find_live_variables(
+    body: List[ir.Instruction], blocks: List[_Block], bits: _VarBits
+) -> List[int]:
+    uses = []
+    kills = []
+    for ins in body:
+        if isinstance(ins, ir.IncRef):
+            uses.append(bits.get(ins.var))
+            kills.append(0)
+        elif isinstance(ins, ir.UnSet):
+            uses.append(0)
+            kills.append(bits.get(ins.var))
+        elif isinstance(ins, ir.DecRef):
+            uses.append(0)
+            kills.append(0)
+        else:
+            uses.append(bits.get_all(_get_used_vars(ins)))
+            kills.append(bits.get_all(_get_set_vars(ins)))
+
+    live_in = [0] * len(blocks)
+    live_after = [0] * len(body)
+    changed = True
+    while changed:
+        changed = False
+        for block_index in reversed(range(len(blocks))):
+            block = blocks[block_index]
+            live = 0
+            for successor in block.successors:
+                live |= live_in[successor]
+            for index in reversed(range(block.start, block.end)):
+                live_after[index] = live
+                live = (live & ~kills[index]) | uses[index]
+            if live != live_in[block_index]:
+                live_in[block_index] = live
+                changed = True
+    return live_after
+
+
+# Local variables that hold a reference. Arguments and items of borrowing
+# foreach loops don't.
+def _get_owning_vars(funcdef: _FunctionDef) -> Set[ir.LocalVariable]:
+    result: Set[ir.LocalVariable] = set()
+    borrowed = set(funcdef.argvars)
+    for ins in funcdef.body:
+        if isinstance(ins, ir.GetNextFromList) and ins.borrow:
+            borrowed.add(ins.item)
+        result.update(var for var in _get_set_vars(ins) if var.type.refcounted)
+    return result - borrowed
+
+
+# When a variable isn't needed after copying it to another variable, an
+# attribute or a union, or returning it, the reference it holds can move
+# instead of increffing for the copy and later decreffing the variable.
+# Moving a reference unsets the variable, so the DecRef does nothing.
+def _move_last_uses(funcdef: _FunctionDef) -> int:
+    body = funcdef.body
+    owning = _get_owning_vars(funcdef)
+    bits = _VarBits()
+    live_after = _find_live_variables(body, _create_blocks(body), bits)
+    changes = 0
+
+    for index, ins in enumerate(body):
+        if isinstance(ins, ir.Return):
+            if ins.value in owning and not ins.move:
+                ins.move = True
+                changes += 1
+            continue
+
+        if index + 1 == len(body) or not isinstance(body[index + 1], ir.IncRef):
+            continue
+        incref = body[index + 1]
+        assert isinstance(incref, ir.IncRef)
+
+        if (
+            isinstance(ins, ir.VarCpy)
+            and isinstance(ins.source, ir.LocalVariable)
+            and ins.source is not ins.dest
+            and incref.var is ins.dest
+        ):
+            moving = ins.source
+        elif (
+            isinstance(ins, (ir.InstantiateUnion, ir.SetAttribute))
+            and incref.var is ins.value
+        ):
+            moving = ins.value
+        else:
+            continue
+
+        # The IncRef doesn't count as needing the value, because it goes away
+        if moving in owning and not (live_after[index + 1] & bits.get(moving)):
+            body[index + 1] = ir.UnSet(moving)
+            changes += 1
+    return changes
+
+
+# Instructions that can be between getting an attribute and using it
+# without an IncRef. They can't change attributes or run any other code, and
+# they can't destroy the object that has the attribute.
+def _can_be_between_borrowing(
+    ins: ir.Instruction, obj: ir.LocalVariable, var: ir.LocalVariable
+) -> bool:
+    if isinstance(ins, (ir.DecRef, ir.UnSet)):
+        return ins.var is not obj and ins.var is not var
+    return isinstance(ins, (ir.GetAttribute, ir.IncRef)) and obj not in _get_set_vars(
+        ins
+    )
+
+
+# A variable set with GetAttribute doesn't need a reference of its own, if
+# it's only used to get attributes from it right away, as in "a.b.c".
+# Instead of increffing, the variable is unset after the last use, so that
+# it won't be decreffed. The object that has the attribute must hold a
+# reference, so it can't be one of these variables.
+def _borrow_attributes(funcdef: _FunctionDef) -> int:
+    body = funcdef.body
+    infos = _analyze(body)
+    removed: Set[int] = set()
+    unset_after: Dict[int, ir.LocalVariable] = {}
+
+    for index, ins in enumerate(body[:-1]):
+        if not isinstance(ins, ir.GetAttribute):
+            continue
+        var = ins.result
+        info = infos[var]
+        if (
+            not var.type.refcounted
+            or info.sets != [index]
+            or info.increfs != [index + 1]
+            or not info.uses
+            or min(info.uses) < index
+        ):
+            continue
+        if any(isinstance(body[i], ir.GetAttribute) for i in infos[ins.obj].sets):
+            continue
+
+        uses = [body[i] for i in info.uses]
+        if all(
+            isinstance(use, ir.GetAttribute) and use.obj is var for use in uses
+        ) and all(
+            _can_be_between_borrowing(between, ins.obj, var)
+            for between in body[index + 2 : max(info.uses)]
+        ):
+            removed.add(index + 1)
+            unset_after[max(info.uses)] = var
+
+    if not removed:
+        return 0
+
+    new_body: List[ir.Instruction] = []
+    for index, ins in enumerate(body):
+        if index not in removed:
+            new_body.append(ins)
+        if index in unset_after:
+            new_body.append(ir.UnSet(unset_after[index]))
+    funcdef.body = new_body
+    return len(removed)
+
+
+# Removes DecRef and UnSet of variables that are already unset on every path
+# to the instruction. This includes decreffing the old value before setting a
+# variable, when the code doesn't run in a loop.
+def _remove_decrefs_of_unset(funcdef: _FunctionDef) -> int:
+    body = funcdef.body
+    if not body:
+        return 0
+    blocks = _create_blocks(body)
+    bits = _VarBits()
+    all_vars = bits.get_all(
+        [var for var in _analyze(body) if var not in funcdef.argvars]
+    )
+
+    # Local variables are unset at the start of the function. Unreachable
+    # blocks stay at all_vars, and everything in them gets removed.
+    unset_at_end = [all_vars] * len(blocks)
+    unset_at_start = [all_vars] * len(blocks)
+    changed = True
+    while changed:
+        changed = False
+        for block_index, block in enumerate(blocks):
+            unset = all_vars
+            for predecessor in block.predecessors:
+                unset &= unset_at_end[predecessor]
+            unset_at_start[block_index] = unset
+            for ins in body[block.start : block.end]:
+                if isinstance(ins, ir.UnSet):
+                    unset |= bits.get(ins.var)
+                elif not isinstance(ins, (ir.IncRef, ir.DecRef)):
+                    unset &= ~bits.get_all(_get_set_vars(ins))
+            if unset != unset_at_end[block_index]:
+                unset_at_end[block_index] = unset
+                changed = True
+
+    new_body: List[ir.Instruction] = []
+    for block_index, block in enumerate(blocks):
+        unset = unset_at_start[block_index]
+        for ins in body[block.start : block.end]:
+            if isinstance(ins, (ir.DecRef, ir.UnSet)) and unset & bits.get(ins.var):
+                continue
+            new_body.append(ins)
+            if isinstance(ins, ir.UnSet):
+                unset |= bits.get(ins.var)
+            elif not isinstance(ins, (ir.IncRef, ir.DecRef)):
+                unset &= ~bits.get_all(_get_set_vars(ins))
+
+    funcdef.body = new_body
+    return len(body) - len(new_body)
+
+
+_PASSES: List[Tuple[str, Callable[[_FunctionDef], int]]] = [
+    ("constant folding", _fold_constants),
+    ("copy propagation", _propagate_copies),
+    ("dead local elimination", _remove_dead_locals),
+    ("unreachable code removal", _remove_unreachable_code),
+    ("borrowing attributes", _borrow_attributes),
+    ("moving last uses", _move_last_uses),
+    ("decref of unset removal", _remove_decrefs_of_unset),
+]
+
+
+# Runs the passes of the optimization level, and counts how many
+# instructions each pass changed or removed over all optimized files
+class PassManager:
+    def __init__(self, level: int):
+        assert level in LEVELS
+        self.level = level
+        self.changes = {name: 0 for name, pass_function in _PASSES}
+        self.instructions_before = 0
+        self.instructions_after = 0
+
+    def optimize(
+        self,
+        top_decls: List[ir.ToplevelDeclaration],
+        source_path: pathlib.Path,
+        timer: timing.PassTimer,
+    ) -> None:
+        funcdefs = [
+            top_declaration
+            for top_declaration in top_decls
+            if isinstance(top_declaration, (ir.FuncDef, ir.MethodDef))
+        ]
+        self.instructions_before += sum(len(funcdef.body) for funcdef in funcdefs)
+
+        rounds = 0 if self.level == 0 else 1 if self.level == 1 else _MAX_ROUNDS
+        for i in range(rounds):
+            changed = False
+            for name, pass_function in _PASSES:
+                with timer.measure(name, source_path):
+                    for funcdef in funcdefs:
+                        changes = pass_function(funcdef)
+                        self.changes[name] += changes
+                        changed = changed or changes != 0
+            if not changed:
+                break
+
+        self.instructions_after += sum(len(funcdef.body) for funcdef in funcdefs)
+
+    def format_stats(self) -> str:
+        name_width = max(len(name) for name in self.changes)
+        result = f"{'Pass':<{name_width}}  {'Changes':>9}\n"
+        for name, count in self.changes.items():
+            result += f"{name:<{name_width}}  {count:>9}\n"
+        result += (
+            f"\nOptimization level {self.level}: {self.instructions_before}"
+            f" instructions before, {self.instructions_after} after\n"
+        )
+        return result
@@ -1,24 +1,205 @@
 import pathlib
 import re
-from typing import Callable, Iterator, List, Optional, Tuple, TypeVar, Union
-
-import more_itertools
+from typing import Callable, Iterator, List, Optional, Set, Tuple, TypeVar, Union
 
 from pyoomph import ast, tokenizer
 
 _T = TypeVar("_T")
+_FlatList = List[Union[Tuple[int, str], ast.Expression, ast.Type]]
+
+# Operators with a smaller number are evaluated first, and operators with the
+# same number are evaluated from left to right. A unary operator applies to
+# everything after it with a smaller number, e.g. "not a == b" means
+# "not (a == b)", and "-a*b" means "-(a*b)".
+_PRECEDENCES = {
+    (2, "*"): 1,
+    (2, "/"): 1,
+    (2, "+"): 2,
+    (2, "-"): 2,
+    (1, "-"): 2,
+    (2, "mod"): 3,
+    (2, "=="): 4,
+    (2, "!="): 4,
+    (2, "<"): 5,
+    (2, ">"): 5,
+    (2, "<="): 5,
+    (2, ">="): 5,
+    (2, "as"): 6,
+    (2, "in"): 7,
+    (2, "not in"): 7,
+    (1, "not"): 8,
+    (2, "and"): 9,
+    (2, "or"): 9,
+}
+_LOOSEST = max(_PRECEDENCES.values())
+
+_UNARY_OPERATOR_KINDS = {
+    tokenizer.get_kind("keyword", "not"),
+    tokenizer.get_kind("op", "-"),
+}
+_BINARY_OPERATOR_KINDS = {
+    tokenizer.get_kind(tokentype, value)
+    for tokentype, value in [
+        ("op", "+"),
+        ("op", "-"),
+        ("op", "*"),
+        ("op", "/"),
+        ("op", "=="),
+        ("op", "!="),
+        ("op", "<"),
+        ("op", ">"),
+        ("op", "<="),
+        ("op", ">="),
+        ("keyword", "in"),
+        ("keyword", "not in"),
+        ("keyword", "and"),
+        ("keyword", "or"),
+        ("keyword", "as"),
+        ("keyword", "mod"),
+    ]
+}
+
+
+def _check_operators(flat: _FlatList) -> None:
+    and_found = False
+    or_found = False
+    equality_chained = False
+    double_minus = False
+    for index, item in enumerate(flat):
+        if item == (2, "and"):
+            and_found = True
+        elif item == (2, "or"):
+            or_found = True
+        elif item in [(2, "=="), (2, "!=")]:
+            equality_chained = equality_chained or (
+                index >= 2 and flat[index - 2] in [(2, "=="), (2, "!=")]
+            )
+        elif item == (1, "-"):
+            double_minus = double_minus or (
+                index >= 1 and flat[index - 1] in [(1, "-"), (2, "-")]
+            )
+
+    # A common python beginner mistake is writing "a and b or c", thinking it
+    # means "a and (b or c)"
+    assert not (and_found and or_found), (
+        "instead of 'a and b or c', write '(a and b) or c', "
+        "or write 'a and (b or c)'"
+    )
+
+    # a==b==c is not supported yet
+    # TODO: this test is broken for a == -b == c
+    # TODO: prevent other chainings as well
+    assert not equality_chained, "chaining '==' and '!=' is not supported yet"
+
+    # Disallow a--b and --a, require a-(-b) or -(-a)
+    assert not double_minus
+
+    # TODO: warning about 'x == y mod 3' which is likely intended to be 'x mod 3 == y mod 3'
+
+
+# Precedence climbing. Returns the expression that starts at flat[index] and
+# contains binary operators with precedence number less than limit, and the
+# index where it ends.
+#
+# Operators must not be next to something that is evaluated after them, e.g.
+# "a == not b" is an error, because "==" would be evaluated first.
+def _build_expression(
+    flat: _FlatList, index: int, limit: int
+) -> Tuple[ast.Expression, int]:
+    first = flat[index]
+    if isinstance(first, tuple):
+        # Unary operator
+        precedence = _PRECEDENCES[first]
+        operand = flat[index + 1]
+        assert not (isinstance(operand, tuple) and _PRECEDENCES[operand] >= precedence)
+        operand_expr, index = _build_expression(flat, index + 1, precedence)
+        result: ast.Expression = ast.UnaryOperator(first[1], operand_expr)
+    else:
+        assert isinstance(first, ast.Expression)
+        result = first
+        index += 1
+
+    while index < len(flat):
+        op = flat[index]
+        assert isinstance(op, tuple)
+        precedence = _PRECEDENCES[op]
+        if precedence >= limit:
+            break
+
+        if op == (2, "as"):
+            the_type = flat[index + 1]
+            assert isinstance(the_type, ast.Type)
+            result = ast.As(result, the_type)
+            index += 2
+            if index < len(flat):
+                next_op = flat[index]
+                assert isinstance(next_op, tuple)
+                assert _PRECEDENCES[next_op] >= precedence
+        else:
+            rhs = flat[index + 1]
+            assert not (isinstance(rhs, tuple) and _PRECEDENCES[rhs] >= precedence)
+            rhs_expr, index = _build_expression(flat, index + 1, precedence)
+            result = ast.BinaryOperator(result, op[1], rhs_expr)
+
+    return (result, index)
+
+
+_FORMAT_TEXT = tokenizer.get_kind("format_text")
+_END_FORMAT = tokenizer.get_kind("end_format")
+
+_ESCAPES = {
+    r"\n": "\n",
+    r"\t": "\t",
+    r"\{": "{",
+    r"\}": "}",
+    r"\"": '"',
+    r"\\": "\\",
+}
+_escape_regex = re.compile(r"\\.")
+
+
+# The tokenizer checks that all escapes are valid
+def _replace_escapes(text: str) -> str:
+    if "\\" not in text:
+        return text
+    return _escape_regex.sub(lambda match: _ESCAPES[match.group()], text)
 
 
 class _Parser:
-    def __init__(self, token_iter: Iterator[Tuple[str, str]]):
-        self.token_iter = more_itertools.peekable(token_iter)
+    def __init__(self, tokens: tokenizer.TokenBuffer):
+        self.tokens = tokens
+        self.index = 0  # of the next token
+
+    def at_end(self) -> bool:
+        return self.index == len(self.tokens)
+
+    # Creates strings and a tuple, so peek_is() and peek_type() are faster
+    def peek(self, ahead: int = 0) -> Tuple[str, str]:
+        return self.tokens.get(self.index + ahead)
+
+    def peek_is(self, tokentype: str, value: str) -> bool:
+        return self.index < len(self.tokens.kinds) and self.tokens.kinds[
+            self.index
+        ] == tokenizer.get_kind(tokentype, value)
+
+    def peek_in(self, kinds: Set[int]) -> bool:
+        return self.index < len(self.tokens.kinds) and (
+            self.tokens.kinds[self.index] in kinds
+        )
+
+    def peek_type(self) -> str:
+        return self.tokens.get_type(self.index)
+
+    def peek_location(self) -> tokenizer.Location:
+        return self.tokens.get_location(self.index)
 
     def get_token(
         self,
         required_type: Optional[str] = None,
         required_value: Optional[str] = None,
     ) -> Tuple[str, str]:
-        tokentype, value = next(self.token_iter)
+        tokentype, value = self.peek()
+        self.index += 1
         if required_type is not None:
             assert tokentype == required_type, (
                 required_type,
@@ -57,49 +238,31 @@ class _Parser:
         left, right = list(parens)
         self.get_token("op", left)
         result = []
-        if self.token_iter.peek() != ("op", right):
+        if not self.peek_is("op", right):
             result.append(content_callback())
-            while self.token_iter.peek() == ("op", ","):
+            while self.peek_is("op", ","):
                 self.get_token("op", ",")
-                if self.token_iter.peek() == ("op", right):
+                if self.peek_is("op", right):
                     break
                 result.append(content_callback())
         self.get_token("op", right)
         return result
 
-    def tokenize_and_parse_expression(self, code: str) -> ast.Expression:
-        parser = _Parser(tokenizer.tokenize(code))
-        result = parser.parse_expression()
-        parser.get_token("op", "\n")
-        assert not parser.token_iter, parser.token_iter.peek()
-        return result
-
-    def do_string_formatting(self, string: str) -> ast.Expression:
-        parts = []
-        while string:
-            if string[0] == "{":
-                end = string.index("}")
-                parts.append(self.tokenize_and_parse_expression(string[1:end]))
-                string = string[end + 1 :]
-            elif string.startswith("\\"):
-                parts.append(
-                    ast.StringConstant(
-                        {
-                            r"\n": "\n",
-                            r"\t": "\t",
-                            r"\{": "{",
-                            r"\}": "}",
-                            r"\"": '"',
-                            r"\\": "\\",
-                        }[string[:2]]
-                    )
-                )
-                string = string[2:]
+    # String literals containing braces, see tokenizer.py
+    def parse_format_string(self) -> ast.Expression:
+        self.get_token("begin_format")
+        parts: List[ast.Expression] = []
+        kinds = self.tokens.kinds
+        while kinds[self.index] != _END_FORMAT:
+            if kinds[self.index] == _FORMAT_TEXT:
+                text = self.tokens.get_value(self.index)
+                parts.append(ast.StringConstant(_replace_escapes(text)))
+                self.index += 1
             else:
-                match = re.match(r"[^{}\\]+", string)
-                assert match is not None
-                parts.append(ast.StringConstant(match.group(0)))
-                string = string[len(match.group(0)) :]
+                self.get_token("begin_interpolation")
+                parts.append(self.parse_expression())
+                self.get_token("end_interpolation")
+        self.index += 1
 
         if len(parts) == 0:
             return ast.StringConstant("")
@@ -108,67 +271,59 @@ class _Parser:
         return ast.StringFormatJoin(parts)
 
     def parse_loop_header(self) -> Union[ast.ForLoopHeader, ast.ForeachLoopHeader]:
-        if self.token_iter.peek() == ("keyword", "while"):
+        if self.peek_is("keyword", "while"):
             self.get_token("keyword", "while")
             return ast.ForLoopHeader([], self.parse_expression(), [])
 
-        if self.token_iter.peek() == ("keyword", "for"):
+        if self.peek_is("keyword", "for"):
             self.get_token("keyword", "for")
             init = (
-                []
-                if self.token_iter.peek() == ("op", ";")
-                else [self.parse_oneline_ish_statement()]
+                [] if self.peek_is("op", ";") else [self.parse_oneline_ish_statement()]
             )
             self.get_token("op", ";")
-            cond = (
-                None
-                if self.token_iter.peek() == ("op", ";")
-                else self.parse_expression()
-            )
+            cond = None if self.peek_is("op", ";") else self.parse_expression()
             self.get_token("op", ";")
             incr = (
                 []
-                if self.token_iter.peek() == ("begin_block", ":")
+                if self.peek_is("begin_block", ":")
                 else [self.parse_oneline_ish_statement()]
             )
             return ast.ForLoopHeader(init, cond, incr)
 
-        if self.token_iter.peek() == ("keyword", "foreach"):
+        if self.peek_is("keyword", "foreach"):
             self.get_token("keyword", "foreach")
             varname = self.get_token("identifier")[1]
             self.get_token("keyword", "of")
             return ast.ForeachLoopHeader(varname, self.parse_expression())
 
-        raise NotImplementedError(self.token_iter.peek())
+        raise NotImplementedError(self.peek())
 
     def parse_simple_expression(self) -> ast.Expression:
+        location = self.peek_location()
         result: ast.Expression
-        if self.token_iter.peek()[0] == "oneline_string":
-            result = self.do_string_formatting(
-                self.get_token("oneline_string")[1][1:-1]
-            )
-        elif self.token_iter.peek()[0] == "multiline_string":
-            result = self.do_string_formatting(
-                self.get_token("multiline_string")[1][3:-3]
-            )
-        elif self.token_iter.peek()[0] == "identifier":
-            result = ast.GetVar(self.get_token("identifier")[1])
-        elif self.token_iter.peek()[0] == "int":
+        if self.peek_type() == "oneline_string":
+            string = self.get_token("oneline_string")[1]
+            result = ast.StringConstant(_replace_escapes(string[1:-1]))
+        elif self.peek_type() == "multiline_string":
+            string = self.get_token("multiline_string")[1]
+            result = ast.StringConstant(_replace_escapes(string[3:-3]))
+        elif self.peek_type() == "begin_format":
+            result = self.parse_format_string()
+        elif self.peek_type() == "identifier":
+            result = ast.GetVar(self.get_token("identifier")[1], location)
+        elif self.peek_type() == "int":
             result = ast.IntConstant(int(self.get_token("int")[1]))
-        elif self.token_iter.peek()[0] == "float":
+        elif self.peek_type() == "float":
             result = ast.FloatConstant(self.get_token("float")[1])
-        elif self.token_iter.peek()[0].startswith("assert_"):  # TODO: is haxor
-            lineno = int(self.token_iter.peek()[0].split("_")[1])
-            result = ast.GetVar(self.get_token()[1], lineno)
-        elif self.token_iter.peek() == ("keyword", "new"):
+        elif self.peek_is("keyword", "new"):
             self.get_token("keyword", "new")
             result = ast.Constructor(self.parse_type())
-        elif self.token_iter.peek() == ("op", "("):
+        elif self.peek_is("op", "("):
             self.get_token("op", "(")
             result = self.parse_expression()
             self.get_token("op", ")")
-        elif self.token_iter.peek() == ("op", "["):
-            if self.token_iter[1] in {
+        elif self.peek_is("op", "["):
+            if self.peek(1) in {
                 ("keyword", "while"),
                 ("keyword", "for"),
                 ("keyword", "foreach"),
@@ -185,124 +340,50 @@ class _Parser:
                     self.parse_commasep_in_parens(self.parse_expression, parens="[]")
                 )
         else:
-            raise NotImplementedError(self.token_iter.peek())
+            raise NotImplementedError(self.peek())
 
         while True:
-            if self.token_iter.peek() == ("op", "("):
+            if self.peek_is("op", "("):
                 result = ast.Call(
-                    result, self.parse_commasep_in_parens(self.parse_expression)
+                    result,
+                    self.parse_commasep_in_parens(self.parse_expression),
+                    location,
                 )
-            elif self.token_iter.peek() == ("op", "."):
+            elif self.peek_is("op", "."):
                 self.get_token("op", ".")
                 result = ast.GetAttribute(result, self.get_token("identifier")[1])
             else:
                 return result
 
     def get_unary_operators(self) -> Iterator[Tuple[int, str]]:
-        while self.token_iter.peek() in {("keyword", "not"), ("op", "-")}:
+        while self.peek_in(_UNARY_OPERATOR_KINDS):
             yield (1, self.get_token()[1])
 
+    # Operators and operands are first collected into a flat list, such as
+    # [(1, "-"), a, (2, "*"), b], which is then turned into a tree
     def parse_expression(self) -> ast.Expression:
-        magic_list: List[Union[Tuple[int, str], ast.Expression, ast.Type]] = []
-        magic_list.extend(self.get_unary_operators())
-        magic_list.append(self.parse_simple_expression())
-
-        while self.token_iter.peek() in {
-            ("op", "+"),
-            ("op", "-"),
-            ("op", "*"),
-            ("op", "/"),
-            ("op", "=="),
-            ("op", "!="),
-            ("op", "<"),
-            ("op", ">"),
-            ("op", "<="),
-            ("op", ">="),
-            ("keyword", "in"),
-            ("keyword", "not in"),
-            ("keyword", "and"),
-            ("keyword", "or"),
-            ("keyword", "as"),
-            ("keyword", "mod"),
-        }:
+        flat: _FlatList = []
+        flat.extend(self.get_unary_operators())
+        flat.append(self.parse_simple_expression())
+
+        while self.peek_in(_BINARY_OPERATOR_KINDS):
             keyword = self.get_token()[1]
-            magic_list.append((2, keyword))
+            flat.append((2, keyword))
             if keyword == "as":
-                magic_list.append(self.parse_type())
+                flat.append(self.parse_type())
             else:
-                magic_list.extend(self.get_unary_operators())
-                magic_list.append(self.parse_simple_expression())
-
-        # A common python beginner mistake is writing "a and b or c", thinking it
-        # means "a and (b or c)"
-        assert not ((2, "and") in magic_list and (2, "or") in magic_list), (
-            "instead of 'a and b or c', write '(a and b) or c', "
-            "or write 'a and (b or c)'"
-        )
-
-        # a==b==c is not supported yet
-        # TODO: this test is broken for a == -b == c
-        # TODO: prevent other chainings as well
-        assert not any(
-            first in [(2, "=="), (2, "!=")] and second in [(2, "=="), (2, "!=")]
-            for first, second in zip(magic_list, magic_list[2:])
-        ), "chaining '==' and '!=' is not supported yet"
-
-        # Disallow a--b and --a, require a-(-b) or -(-a)
-        assert not any(
-            first in [(1, "-"), (2, "-")] and second == (1, "-")
-            for first, second in zip(magic_list, magic_list[1:])
-        )
+                flat.extend(self.get_unary_operators())
+                flat.append(self.parse_simple_expression())
 
-        # TODO: warning about 'x == y mod 3' which is likely intended to be 'x mod 3 == y mod 3'
-
-        # each operator of a group is considered to have same precedence
-        for op_group in [
-            [(2, "*"), (2, "/")],
-            [(2, "+"), (2, "-"), (1, "-")],
-            [(2, "mod")],
-            [(2, "=="), (2, "!=")],
-            [(2, "<"), (2, ">"), (2, "<="), (2, ">=")],
-            [(2, "as")],
-            [(2, "in"), (2, "not in")],
-            [(1, "not")],
-            [(2, "and"), (2, "or")],
-        ]:
-            while any(op in magic_list for op in op_group):
-                where = min(magic_list.index(op) for op in op_group if op in magic_list)
-                op = magic_list[where]
-                assert isinstance(op, tuple)
-                op_kind, op_string = op
-
-                if op_kind == 1:  # Unary operator
-                    operand = magic_list[where + 1]
-                    assert isinstance(operand, ast.Expression)
-                    magic_list[where : where + 2] = [
-                        ast.UnaryOperator(op_string, operand)
-                    ]
-                elif op_kind == 2:  # Binary operator
-                    lhs = magic_list[where - 1]
-                    rhs = magic_list[where + 1]
-                    if op_string == "as":
-                        assert isinstance(lhs, ast.Expression)
-                        assert isinstance(rhs, ast.Type)
-                        result: ast.Expression = ast.As(lhs, rhs)
-                    else:
-                        assert isinstance(lhs, ast.Expression)
-                        assert isinstance(rhs, ast.Expression)
-                        result = ast.BinaryOperator(lhs, op_string, rhs)
-                    magic_list[where - 1 : where + 2] = [result]
-                else:
-                    raise NotImplementedError(op_kind)
-
-        [expr] = magic_list
-        assert isinstance(expr, ast.Expression)
+        _check_operators(flat)
+        expr, end = _build_expression(flat, 0, _LOOSEST + 1)
+        assert end == len(flat)
         return expr
 
     def parse_block(self, callback: Callable[[], _T]) -> List[_T]:
         self.get_token("begin_block", ":")
         result = []
-        while self.token_iter and self.token_iter.peek(None) != ("end_block", ""):
+        while not self.at_end() and not self.peek_is("end_block", ""):
             result.append(callback())
         self.get_token("end_block", "")
         return result
@@ -314,39 +395,37 @@ class _Parser:
         return result
 
     def parse_oneline_ish_statement(self) -> ast.Statement:
-        if self.token_iter.peek() == ("keyword", "let"):
+        if self.peek_is("keyword", "let"):
             self.get_token("keyword", "let")
             varname = self.get_token("identifier")[1]
             self.get_token("op", "=")
             value = self.parse_expression()
             return ast.Let(varname, value)
 
-        if self.token_iter.peek() == ("keyword", "return"):
+        if self.peek_is("keyword", "return"):
+            location = self.peek_location()
             self.get_token("keyword", "return")
             # This is a weird way to check whether an expression is coming up.
             # It doesn't work in e.g. first line of for loop, but if you think
             # that returning there is a good idea, then wtf lol.
-            if self.token_iter.peek() == ("op", "\n"):
-                return ast.Return(None)
-            return ast.Return(self.parse_expression())
+            if self.peek_is("op", "\n"):
+                return ast.Return(None, location)
+            return ast.Return(self.parse_expression(), location)
 
-        if self.token_iter.peek() == ("keyword", "pass"):
+        if self.peek_is("keyword", "pass"):
             self.get_token("keyword", "pass")
             return ast.Pass()
 
-        if self.token_iter.peek() == ("keyword", "continue"):
+        if self.peek_is("keyword", "continue"):
             self.get_token("keyword", "continue")
             return ast.Continue()
 
-        if self.token_iter.peek() == ("keyword", "break"):
+        if self.peek_is("keyword", "break"):
             self.get_token("keyword", "break")
             return ast.Break()
 
         expr = self.parse_expression()
-        if self.token_iter.peek(None) == (
-            "op",
-            "=",
-        ):
+        if self.peek_is("op", "="):
             self.get_token("op", "=")
             value = self.parse_expression()
             if isinstance(expr, ast.GetVar):
@@ -360,7 +439,7 @@ class _Parser:
 
     def parse_case(self) -> ast.Case:
         self.get_token("keyword", "case")
-        if self.token_iter.peek() == ("op", "*"):
+        if self.peek_is("op", "*"):
             self.get_token("op", "*")
             type_and_varname = None
         else:
@@ -369,19 +448,19 @@ class _Parser:
         return ast.Case(type_and_varname, body)
 
     def parse_statement(self) -> List[ast.Statement]:
-        if self.token_iter.peek() == ("keyword", "if"):
+        if self.peek_is("keyword", "if"):
             self.get_token("keyword", "if")
             condition = self.parse_expression()
             body = self.parse_block_of_statements()
             ifs = [(condition, body)]
 
-            while self.token_iter.peek() == ("keyword", "elif"):
+            while self.peek_is("keyword", "elif"):
                 self.get_token("keyword", "elif")
                 condition = self.parse_expression()
                 body = self.parse_block_of_statements()
                 ifs.append((condition, body))
 
-            if self.token_iter.peek() == ("keyword", "else"):
+            if self.peek_is("keyword", "else"):
                 self.get_token("keyword", "else")
                 else_body = self.parse_block_of_statements()
             else:
@@ -389,7 +468,7 @@ class _Parser:
 
             return [ast.If(ifs, else_body)]
 
-        if self.token_iter.peek() in {
+        if self.peek() in {
             ("keyword", "while"),
             ("keyword", "for"),
             ("keyword", "foreach"),
@@ -398,29 +477,30 @@ class _Parser:
             body = self.parse_block_of_statements()
             return [ast.Loop(header, body)]
 
-        if self.token_iter.peek() == ("keyword", "switch"):
+        if self.peek_is("keyword", "switch"):
+            location = self.peek_location()
             self.get_token("keyword", "switch")
             union_obj = self.parse_expression()
             cases = self.parse_block(self.parse_case)
-            return [ast.Switch(union_obj, cases)]
+            return [ast.Switch(union_obj, cases, location)]
 
         result = self.parse_oneline_ish_statement()
         self.get_token("op", "\n")
         return [result]
 
     def parse_type_without_unions(self) -> ast.Type:
-        if self.token_iter.peek() == ("op", "("):
+        if self.peek_is("op", "("):
             self.get_token("op", "(")
             result = self.parse_type()
             self.get_token("op", ")")
             return result
 
-        if self.token_iter.peek() == ("keyword", "auto"):
+        if self.peek_is("keyword", "auto"):
             self.get_token("keyword", "auto")
             return ast.AutoType()
 
         name = self.get_token("identifier")[1]
-        if self.token_iter.peek() == ("op", "["):
+        if self.peek_is("op", "["):
             self.get_token("op", "[")
             arg = self.parse_type()
             self.get_token("op", "]")
@@ -430,11 +510,11 @@ class _Parser:
 
     def parse_type(self) -> ast.Type:
         first_member = self.parse_type_without_unions()
-        if self.token_iter.peek() != ("op", "|"):
+        if not self.peek_is("op", "|"):
             return first_member
 
         result = ast.UnionType([first_member])
-        while self.token_iter.peek() == ("op", "|"):
+        while self.peek_is("op", "|"):
             self.get_token("op", "|")
             result.unioned.append(self.parse_type_without_unions())
         return result
@@ -448,7 +528,7 @@ class _Parser:
         name = self.get_token("identifier")[1]
         args = self.parse_commasep_in_parens(self.parse_funcdef_arg)
 
-        if self.token_iter.peek() == ("op", "->"):
+        if self.peek_is("op", "->"):
             self.get_token("op", "->")
             returntype: Optional[ast.Type] = self.parse_type()
         else:
@@ -463,30 +543,30 @@ class _Parser:
         return self.parse_function_or_method()
 
     def parse_toplevel(self) -> ast.ToplevelDeclaration:
-        if self.token_iter.peek() == ("keyword", "export"):
+        if self.peek_is("keyword", "export"):
             self.get_token("keyword", "export")
             export = True
         else:
             export = False
 
-        if self.token_iter.peek() == ("keyword", "func"):
+        if self.peek_is("keyword", "func"):
             self.get_token("keyword", "func")
             result = self.parse_function_or_method()
             result.export = export
             return result
 
-        if self.token_iter.peek() == ("keyword", "class"):
+        if self.peek_is("keyword", "class"):
             self.get_token("keyword", "class")
             name = self.get_token("identifier")[1]
             args = self.parse_commasep_in_parens(self.parse_funcdef_arg)
-            if self.token_iter.peek(None) == ("begin_block", ":"):
+            if self.peek_is("begin_block", ":"):
                 body = self.parse_block(self.parse_method)
             else:
                 body = []
                 self.get_token("op", "\n")
             return ast.ClassDef(name, args, body, export)
 
-        if self.token_iter.peek() == ("keyword", "typedef"):
+        if self.peek_is("keyword", "typedef"):
             self.get_token("keyword", "typedef")
             name = self.get_token("identifier")[1]
             assert "::" not in name
@@ -495,19 +575,43 @@ class _Parser:
             self.get_token("op", "\n")
             return ast.TypeDef(name, the_type)
 
-        raise NotImplementedError(self.token_iter.peek())
+        raise NotImplementedError(self.peek())
 
 
 def parse_file(
     code: str, path: pathlib.Path, stdlib: Optional[pathlib.Path]
 ) -> List[ast.ToplevelDeclaration]:
-    parser = _Parser(tokenizer.tokenize(code))
+    return parse_tokens(tokenizer.tokenize(code), path, stdlib)
+
+
+def parse_tokens(
+    tokens: tokenizer.TokenBuffer,
+    path: pathlib.Path,
+    stdlib: Optional[pathlib.Path],
+) -> List[ast.ToplevelDeclaration]:
+    return parse_declarations(tokens, path, stdlib)[0]
+
+
+# Returns declarations and the index of the first token of each declaration.
+# Imports must be before other declarations, so use imports_allowed=False when
+# parsing something that comes after a non-import declaration.
+def parse_declarations(
+    tokens: tokenizer.TokenBuffer,
+    path: pathlib.Path,
+    stdlib: Optional[pathlib.Path],
+    imports_allowed: bool = True,
+) -> Tuple[List[ast.ToplevelDeclaration], List[int]]:
+    parser = _Parser(tokens)
 
     result: List[ast.ToplevelDeclaration] = []
-    while parser.token_iter.peek(None) == ("keyword", "import"):
-        assert stdlib is not None
-        result.append(parser.parse_import(path, stdlib))
-    while parser.token_iter:
-        result.append(parser.parse_toplevel())
+    starts = []
+    while not parser.at_end():
+        starts.append(parser.index)
+        if imports_allowed and parser.peek_is("keyword", "import"):
+            assert stdlib is not None
+            result.append(parser.parse_import(path, stdlib))
+        else:
+            imports_allowed = False
+            result.append(parser.parse_toplevel())
 
-    return result
+    return (result, starts)
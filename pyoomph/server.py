@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import pathlib
+import shlex
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+import traceback
+from typing import Any, Dict, List, Optional, Tuple
+
+from pyoomph import driver, frontend_cache
+
+# Compiling many small programs is mostly starting python, importing the
+# compiler and loading builtins and stdlib from the cache. A compile server
+# does all that only once. The client (client.py) sends compiler arguments
+# to the server, and the server sends back compiler output and, unless -o
+# is given, a command that runs the compiled program.
+
+
+def _compile(
+    args: List[str], memory_cache: frontend_cache.MemoryCache
+) -> Tuple[int, Optional[Dict[str, Any]]]:
+    arg_parser = argparse.ArgumentParser(prog="pyoomph")
+    driver.add_compiler_arguments(arg_parser)
+    compiler_args, program_args = arg_parser.parse_known_args(args)
+    driver.check_compiler_arguments(arg_parser, compiler_args)
+
+    with driver.compile_from_args(compiler_args, memory_cache) as (result, session):
+        if result != 0:
+            return (result, None)
+
+        if compiler_args.outfile is not None:
+            driver.move_executable(
+                session,
+                compiler_args.infile,
+                compiler_args.outfile,
+                compiler_args.verbose,
+            )
+            return (0, None)
+
+        # Client deletes the temporary directory after running the program
+        temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="oomph-"))
+        exe_path = temp_dir / compiler_args.infile.stem
+        driver.move_executable(session, compiler_args.infile, exe_path, False)
+        command = shlex.split(compiler_args.valgrind) + [str(exe_path)] + program_args
+        return (
+            0,
+            {
+                "command": command,
+                "verbose": compiler_args.verbose,
+                "temp_dir": str(temp_dir),
+            },
+        )
+
+
+class _Server(socketserver.UnixStreamServer):
+    memory_cache: frontend_cache.MemoryCache
+
+
+# Requests are handled one at a time, because compiler output is captured
+# by replacing sys.stdout and sys.stderr, and the working directory changes
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: _Server
+
+    def handle(self) -> None:
+        data = self.rfile.read()
+        if not data:
+            # Connected just to check whether the server is running
+            return
+        request = json.loads(data.decode("utf-8"))
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        run_info = None
+        old_cwd = os.getcwd()
+
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                os.chdir(request["cwd"])
+                status, run_info = _compile(request["args"], self.server.memory_cache)
+            except SystemExit as e:
+                if e.code is None:
+                    status = 0
+                elif isinstance(e.code, int):
+                    status = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    status = 1
+            except Exception:
+                traceback.print_exc()
+                status = 1
+            finally:
+                os.chdir(old_cwd)
+
+        response = {
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+            "status": status,
+            "run": run_info,
+        }
+        self.wfile.write(json.dumps(response).encode("utf-8"))
+
+
+def _socket_is_in_use(socket_path: pathlib.Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def serve(socket_path: pathlib.Path, memory_cache_bytes: int) -> None:
+    socket_path = socket_path.absolute()
+    if socket_path.exists():
+        if _socket_is_in_use(socket_path):
+            sys.exit(f"{socket_path} is already used by another server")
+        # Left behind by a server that didn't exit cleanly
+        socket_path.unlink()
+
+    # Make sure that the socket file gets deleted when killed
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    with _Server(str(socket_path), _RequestHandler) as server:
+        server.memory_cache = frontend_cache.MemoryCache(memory_cache_bytes)
+        print(f"Listening on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink()
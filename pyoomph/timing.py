@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import pathlib
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class Time:
+    wall: float
+    # None for things that don't run in the compiler process, e.g. C compiler
+    cpu: Optional[float]
+
+    def __add__(self, other: Time) -> Time:
+        if self.cpu is None or other.cpu is None:
+            return Time(self.wall + other.wall, None)
+        return Time(self.wall + other.wall, self.cpu + other.cpu)
+
+
+def _get_module_name(path: Optional[pathlib.Path]) -> str:
+    if path is None:
+        return ""
+    return os.path.relpath(path)
+
+
+# Records wall time and CPU time of each compiler phase (e.g. parsing) for
+# each file. When measurements are nested, only the innermost phase gets the
+# time, so that the same time isn't counted twice. When not enabled, nothing
+# is measured.
+class PassTimer:
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.times: Dict[Tuple[str, str], Time] = {}  # keys are (phase, module)
+        self._nested_stack: List[Time] = []
+
+    def add(self, phase: str, module: Optional[pathlib.Path], the_time: Time) -> None:
+        key = (phase, _get_module_name(module))
+        self.times[key] = self.times.get(key, Time(0, 0)) + the_time
+
+    # For combining with times measured in another process
+    def merge(self, times: Dict[Tuple[str, str], Time]) -> None:
+        for key, the_time in times.items():
+            self.times[key] = self.times.get(key, Time(0, 0)) + the_time
+
+    @contextlib.contextmanager
+    def measure(
+        self, phase: str, module: Optional[pathlib.Path] = None
+    ) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        self._nested_stack.append(Time(0, 0))
+        try:
+            yield
+        finally:
+            total = Time(
+                time.perf_counter() - wall_start, time.process_time() - cpu_start
+            )
+            nested = self._nested_stack.pop()
+            assert total.cpu is not None and nested.cpu is not None
+            self.add(
+                phase, module, Time(total.wall - nested.wall, total.cpu - nested.cpu)
+            )
+            if self._nested_stack:
+                self._nested_stack[-1] += total
+
+    def get_phase_totals(self) -> Dict[str, Time]:
+        result: Dict[str, Time] = {}
+        for (phase, module), the_time in self.times.items():
+            result[phase] = result.get(phase, Time(0, 0)) + the_time
+        return result
+
+    # Slowest first
+    def format_table(self) -> str:
+        phase_width = max([len("Phase")] + [len(phase) for phase, module in self.times])
+        module_width = max(
+            [len("(total)")] + [len(module) for phase, module in self.times]
+        )
+
+        def format_row(phase: str, module: str, wall: str, cpu: str) -> str:
+            return f"{phase:<{phase_width}}  {module:<{module_width}}  {wall:>9}  {cpu:>9}\n"
+
+        def format_time_row(phase: str, module: str, the_time: Time) -> str:
+            cpu = "-" if the_time.cpu is None else f"{the_time.cpu:.3f}"
+            return format_row(phase, module, f"{the_time.wall:.3f}", cpu)
+
+        result = format_row("Phase", "Module", "Wall (s)", "CPU (s)")
+        totals = self.get_phase_totals()
+        for phase in sorted(totals, key=(lambda phase: -totals[phase].wall)):
+            result += format_time_row(phase, "(total)", totals[phase])
+
+        result += "\n"
+        for phase, module in sorted(
+            self.times, key=(lambda key: -self.times[key].wall)
+        ):
+            if module:
+                result += format_time_row(phase, module, self.times[phase, module])
+        return result
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "phases": {
+                    phase: {"wall": the_time.wall, "cpu": the_time.cpu}
+                    for phase, the_time in self.get_phase_totals().items()
+                },
+                "modules": [
+                    {
+                        "phase": phase,
+                        "module": module,
+                        "wall": the_time.wall,
+                        "cpu": the_time.cpu,
+                    }
+                    for (phase, module), the_time in self.times.items()
+                ],
+            },
+            indent=4,
+        )
@@ -1,7 +1,8 @@
-import re
-from typing import Iterator, List, Tuple
+from __future__ import annotations
 
-import more_itertools
+import array
+import re
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 TOKEN_REGEX = r'''
 (?P<keyword>
@@ -84,128 +85,372 @@ TOKEN_REGEX = r'''
 | (?P<ignore>
     # Ignore space not in start of file
     # Ignore comments
-    (?<=[\S\s])[ ] | [#].*
+    (?<=[\S\s])[ ]+ | [#].*
 )
 | (?P<error> .{1,15} )
 '''
+_token_regex = re.compile(TOKEN_REGEX, re.VERBOSE)
 
+# Parts of the content of a string literal, between the quotes
+_format_piece_regex = re.compile(
+    r"(?P<text> ( [^{}\\] | \\[\S\s] )+ ) | { [^{}]* }", re.VERBOSE
+)
 
-def raw_tokenize(code: str) -> Iterator[Tuple[str, str]]:
-    if not code.endswith("\n"):
-        code += "\n"
 
-    for match in re.finditer(TOKEN_REGEX, code, flags=re.VERBOSE):
-        tokentype = match.lastgroup
-        assert tokentype is not None
-        value = match.group()
-        assert tokentype != "error", repr(value)
-        if tokentype != "ignore":
-            # TODO: this is a "temporary" hack to track line numbers in asserts
-            if tokentype == "identifier" and value == "assert":
-                lineno = code[: match.start()].count("\n") + 1
-                tokentype = f"assert_{lineno}"
-            # Add this for very verbose tokenizing or parsing debugging:
-            # print(repr(match.group()))
-            yield (tokentype, match.group())
-
-
-def _ignore_whitespace_in_parens(
-    tokens: Iterator[Tuple[str, str]]
-) -> Iterator[Tuple[str, str]]:
-    paren_stack: List[str] = []
-    for token in tokens:
-        if token == ("op", "("):
-            paren_stack.append(")")
-        elif token == ("op", "["):
-            paren_stack.append("]")
-        elif token == ("op", ")") or token == ("op", "]"):
-            popped = paren_stack.pop()
-            assert token == ("op", popped)
-
-        if token[1].strip(" \n") or not paren_stack:
-            yield token
+# Where a token starts in the source code. Line and column numbers start at 1.
+class Location(NamedTuple):
+    offset: int
+    lineno: int
+    column: int
+
+
+Token = Tuple[str, str, Location]
 
-    assert not paren_stack
 
+_FILE_START = Location(0, 1, 1)
 
-def _combine_not_in(tokens: Iterator[Tuple[str, str]]) -> Iterator[Tuple[str, str]]:
-    while True:
-        head, tokens = more_itertools.spy(tokens, 2)
-        if not head:
-            break
 
-        if head == [("keyword", "not"), ("keyword", "in")]:
-            yield ("keyword", "not in")
-            next(tokens)
-            next(tokens)
+# Token kinds are small integers. Keywords, operators, "begin_block" and
+# "end_block" have a separate kind for each value, so their values don't need
+# to be stored anywhere. Other kinds are just token types, such as
+# "identifier", and the values of those tokens are in the source code.
+_FIXED_VALUE_TYPES = {"keyword", "op", "begin_block", "end_block"}
+_kind_list: List[Tuple[str, Optional[str]]] = []
+_kind_ids: Dict[Tuple[str, Optional[str]], int] = {}
+
+
+# Value is ignored for token types that don't have a kind for each value.
+# The parser calls this a lot, so the common case must be fast.
+def get_kind(tokentype: str, value: Optional[str] = None) -> int:
+    try:
+        return _kind_ids[tokentype, value]
+    except KeyError:
+        pass
+
+    if tokentype not in _FIXED_VALUE_TYPES:
+        value = None
+    key = (tokentype, value)
+    if key not in _kind_ids:
+        _kind_ids[key] = len(_kind_list)
+        _kind_list.append(key)
+    return _kind_ids[key]
+
+
+_NEWLINE = get_kind("op", "\n")
+_COLON = get_kind("op", ":")
+_NOT = get_kind("keyword", "not")
+_NOT_IN = get_kind("keyword", "not in")
+_BEGIN_BLOCK = get_kind("begin_block", ":")
+_END_BLOCK = get_kind("end_block", "")
+_BEGIN_FORMAT = get_kind("begin_format")
+_FORMAT_TEXT = get_kind("format_text")
+_BEGIN_INTERPOLATION = get_kind("begin_interpolation")
+_END_INTERPOLATION = get_kind("end_interpolation")
+_END_FORMAT = get_kind("end_format")
+
+
+# Tokens of some code, stored as arrays that contain one item for each token.
+# This uses a lot less memory than a tuple, Location and value string for
+# each token. Values are created only when needed.
+class TokenBuffer:
+    def __init__(self, code: str, start: Location = _FILE_START):
+        self.code = code
+        self._start_offset = start.offset
+        self.kinds = array.array("H")
+        # Where the token is in self.code
+        self.starts = array.array("q")
+        self.ends = array.array("q")
+        self.linenos = array.array("q")
+        self.columns = array.array("q")
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def append(self, kind: int, start: int, end: int, lineno: int, column: int) -> None:
+        self.kinds.append(kind)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.linenos.append(lineno)
+        self.columns.append(column)
+
+    # Appends tokens other[start:end], moved forward by the given number of
+    # characters and lines. Used for reusing tokens when code changes.
+    def extend(
+        self,
+        other: TokenBuffer,
+        start: int,
+        end: int,
+        offset_change: int = 0,
+        line_change: int = 0,
+    ) -> None:
+        self.kinds.extend(other.kinds[start:end])
+        self.columns.extend(other.columns[start:end])
+        if offset_change == 0:
+            self.starts.extend(other.starts[start:end])
+            self.ends.extend(other.ends[start:end])
+        else:
+            self.starts.extend(i + offset_change for i in other.starts[start:end])
+            self.ends.extend(i + offset_change for i in other.ends[start:end])
+        if line_change == 0:
+            self.linenos.extend(other.linenos[start:end])
         else:
-            yield next(tokens)
+            self.linenos.extend(i + line_change for i in other.linenos[start:end])
 
+    # Returns (type, value)
+    def get(self, index: int) -> Tuple[str, str]:
+        tokentype, value = _kind_list[self.kinds[index]]
+        if value is None:
+            return (tokentype, self.code[self.starts[index] : self.ends[index]])
+        return (tokentype, value)
 
-def _find_blocks(tokens: Iterator[Tuple[str, str]]) -> Iterator[Tuple[str, str]]:
-    indent_level = 0
-    while True:
-        head, tokens = more_itertools.spy(tokens, 3)
-        if not head:
-            break
-
-        if (
-            len(head) >= 3
-            and head[:2] == [("op", ":"), ("op", "\n")]
-            and head[2][0] == "indent"
-        ):
-            indent_level += 1
-            assert head[2][1] == " " * 4 * indent_level
-            yield ("begin_block", ":")
-            next(tokens)
-            next(tokens)
-            next(tokens)
+    def get_type(self, index: int) -> str:
+        return _kind_list[self.kinds[index]][0]
+
+    def get_value(self, index: int) -> str:
+        value = _kind_list[self.kinds[index]][1]
+        if value is None:
+            return self.code[self.starts[index] : self.ends[index]]
+        return value
+
+    def get_location(self, index: int) -> Location:
+        return Location(
+            self._start_offset + self.starts[index],
+            self.linenos[index],
+            self.columns[index],
+        )
+
+    # Creates tuples for all tokens, useful for debugging
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(len(self)):
+            yield (*self.get(index), self.get_location(index))
+
+
+# A string literal containing braces becomes several tokens:
+#
+#   "foo {x} bar"   -->   begin_format          "
+#                         format_text           foo
+#                         begin_interpolation   {
+#                         identifier            x
+#                         end_interpolation     }
+#                         format_text           bar
+#                         end_format            "
+#
+# Values of format_text tokens are as in the source code, with backslash
+# escapes not yet replaced. The code between braces is tokenized in place,
+# without copying it to a separate string. It can't contain newlines, so
+# there are no blocks or newline tokens.
+def _tokenize_format_string(
+    tokens: TokenBuffer,
+    code: str,
+    start: int,
+    end: int,
+    quote_length: int,
+    lineno: int,
+    line_start: int,  # index of first character of current line
+) -> None:
+    kinds = tokens.kinds
+    append_kind = tokens.kinds.append
+    append_start = tokens.starts.append
+    append_end = tokens.ends.append
+    append_lineno = tokens.linenos.append
+    append_column = tokens.columns.append
+
+    tokens.append(
+        _BEGIN_FORMAT, start, start + quote_length, lineno, start - line_start + 1
+    )
+    for piece in _format_piece_regex.finditer(
+        code, start + quote_length, end - quote_length
+    ):
+        piece_start = piece.start()
+        piece_end = piece.end()
+        if piece.lastgroup == "text":
+            tokens.append(
+                _FORMAT_TEXT,
+                piece_start,
+                piece_end,
+                lineno,
+                piece_start - line_start + 1,
+            )
+            newline_count = code.count("\n", piece_start, piece_end)
+            if newline_count != 0:
+                lineno += newline_count
+                line_start = code.rindex("\n", piece_start, piece_end) + 1
             continue
 
-        yield next(tokens)
+        tokens.append(
+            _BEGIN_INTERPOLATION,
+            piece_start,
+            piece_start + 1,
+            lineno,
+            piece_start - line_start + 1,
+        )
+        # Tokenizing the code separately would make this an error, because
+        # the code would start with space
+        assert code[piece_start + 1] != " ", repr(
+            code[piece_start + 1 : min(piece_start + 16, piece_end - 1)]
+        )
+
+        paren_stack: List[str] = []
+        for match in _token_regex.finditer(code, piece_start + 1, piece_end - 1):
+            tokentype = match.lastgroup
+            assert tokentype is not None
+            value = match.group()
+            assert tokentype != "error", repr(value)
+            if tokentype == "ignore":
+                continue
 
-        if head[0] == ("op", "\n"):
-            if len(head) >= 2 and head[1][0] == "indent":
-                new_level = len(head[1][1]) // 4
-                assert head[1][1] == " " * 4 * new_level
-                next(tokens)  # skip indent
+            if tokentype == "op":
+                if value == "(":
+                    paren_stack.append(")")
+                elif value == "[":
+                    paren_stack.append("]")
+                elif value == ")" or value == "]":
+                    popped = paren_stack.pop()
+                    assert value == popped
+
+            if tokentype == "keyword" and value == "in" and kinds[-1] == _NOT:
+                kinds[-1] = _NOT_IN
+                tokens.ends[-1] = match.end()
             else:
-                new_level = 0
-            assert new_level <= indent_level
-            while indent_level != new_level:
-                yield ("end_block", "")
-                indent_level -= 1
+                if tokentype in _FIXED_VALUE_TYPES:
+                    append_kind(get_kind(tokentype, value))
+                else:
+                    append_kind(get_kind(tokentype))
+                offset = match.start()
+                append_start(offset)
+                append_end(match.end())
+                append_lineno(lineno)
+                append_column(offset - line_start + 1)
+        assert not paren_stack
 
+        tokens.append(
+            _END_INTERPOLATION, piece_end - 1, piece_end, lineno, piece_end - line_start
+        )
 
-def _clean_newlines(tokens: Iterator[Tuple[str, str]]) -> Iterator[Tuple[str, str]]:
-    token_iter = more_itertools.peekable(tokens)
+    quote_start = end - quote_length
+    tokens.append(_END_FORMAT, quote_start, end, lineno, quote_start - line_start + 1)
 
-    # Ignore newlines in beginning
-    while token_iter.peek(None) == ("op", "\n"):
-        next(token_iter)
 
-    while True:
-        try:
-            token = next(token_iter)
-        except StopIteration:
-            break
+# Does everything in one pass over the regex matches:
+#   - keep track of line numbers, instead of counting newlines from the start
+#     of the file for each token
+#   - ignore newlines and indentation inside parentheses and brackets
+#   - combine "not" followed by "in" into one "not in" token
+#   - replace colon, newline, indent with "begin_block", and add "end_block"
+#     tokens when indentation decreases
+#   - split string literals containing braces into several tokens
+#   - ignore newlines in the beginning and repeated newlines
+#
+# A newline is held back until the next token shows what to do with it. For
+# example, a newline followed by an indent token means that the next line is
+# indented, and a newline followed by anything else means that it isn't.
+# Colons and "not" are added right away, and changed later if needed.
+#
+# If code is a part of a bigger file, start is its location in that file.
+def tokenize(code: str, start: Location = _FILE_START) -> TokenBuffer:
+    if not code.endswith("\n"):
+        code += "\n"
 
-        # Ignore newlines after beginning of block, end of block, or another newline
-        # https://github.com/psf/black/issues/2007
-        # fmt: off
-        while (token in {('op', '\n'), ('begin_block', ':'), ('end_block', '')} and
-               token_iter.peek(None) == ('op', '\n')):
-            next(token_iter)
-        # fmt: on
+    tokens = TokenBuffer(code, start)
+    # Most tokens are added without calling tokens.append(), for speed
+    kinds = tokens.kinds
+    append_kind = tokens.kinds.append
+    append_start = tokens.starts.append
+    append_end = tokens.ends.append
+    append_lineno = tokens.linenos.append
+    append_column = tokens.columns.append
+    paren_stack: List[str] = []
+    indent_level = 0
+    lineno = start.lineno
+    line_start = 1 - start.column  # index of first character of current line
+    # Arguments for tokens.append(), except kind
+    held_newline: Optional[Tuple[int, int, int, int]] = None
 
-        yield token
+    for match in _token_regex.finditer(code):
+        tokentype = match.lastgroup
+        assert tokentype is not None
+        value = match.group()
+        assert tokentype != "error", repr(value)
+        offset = match.start()
+        token_lineno = lineno
+        column = offset - line_start + 1
+        if "\n" in value:
+            lineno += value.count("\n")
+            line_start = offset + value.rindex("\n") + 1
+
+        if tokentype == "ignore":
+            continue
+        # Add this for very verbose tokenizing or parsing debugging:
+        # print(repr(value))
 
+        if tokentype == "op":
+            if value == "(":
+                paren_stack.append(")")
+            elif value == "[":
+                paren_stack.append("]")
+            elif value == ")" or value == "]":
+                popped = paren_stack.pop()
+                assert value == popped
+            elif value == "\n":
+                if not paren_stack and kinds and held_newline is None:
+                    held_newline = (offset, offset + 1, token_lineno, column)
+                continue
+        elif tokentype == "indent":
+            if paren_stack:
+                continue
+            if held_newline is not None:
+                if kinds[-1] == _COLON:
+                    indent_level += 1
+                    assert value == " " * 4 * indent_level
+                    kinds[-1] = _BEGIN_BLOCK
+                else:
+                    tokens.append(_NEWLINE, *held_newline)
+                    new_level = len(value) // 4
+                    assert value == " " * 4 * new_level
+                    assert new_level <= indent_level
+                    while indent_level != new_level:
+                        tokens.append(_END_BLOCK, offset, offset, token_lineno, column)
+                        indent_level -= 1
+                held_newline = None
+                continue
 
-def tokenize(code: str) -> Iterator[Tuple[str, str]]:
-    tokens = raw_tokenize(code)
-    tokens = _ignore_whitespace_in_parens(tokens)
-    tokens = _combine_not_in(tokens)
-    tokens = _clean_newlines(tokens)
-    tokens = _find_blocks(tokens)
-    tokens = _clean_newlines(tokens)
+        if held_newline is not None:
+            # Not followed by indent, so next line is not indented
+            tokens.append(_NEWLINE, *held_newline)
+            held_newline = None
+            while indent_level != 0:
+                tokens.append(_END_BLOCK, offset, offset, token_lineno, column)
+                indent_level -= 1
+
+        if tokentype == "keyword" and value == "in" and kinds and kinds[-1] == _NOT:
+            kinds[-1] = _NOT_IN
+            tokens.ends[-1] = match.end()
+        elif "{" in value and tokentype.endswith("_string"):
+            _tokenize_format_string(
+                tokens,
+                code,
+                offset,
+                match.end(),
+                3 if tokentype == "multiline_string" else 1,
+                token_lineno,
+                offset - column + 1,
+            )
+        else:
+            if tokentype in _FIXED_VALUE_TYPES:
+                append_kind(get_kind(tokentype, value))
+            else:
+                append_kind(get_kind(tokentype))
+            append_start(offset)
+            append_end(match.end())
+            append_lineno(token_lineno)
+            append_column(column)
+
+    assert not paren_stack
+    if held_newline is not None:
+        tokens.append(_NEWLINE, *held_newline)
+        # End all blocks where the next token would be, so that tokenizing a
+        # part of a file gives the same tokens as tokenizing the whole file
+        end = len(code)
+        for i in range(indent_level):
+            tokens.append(_END_BLOCK, end, end, lineno, end - line_start + 1)
     return tokens
@@ -119,6 +119,7 @@ class Generic:
         result.constructor_argtypes = []
         # TODO: hide __contains better?
         result.methods["__contains"] = FunctionType([result, generic_arg], BOOL)
+        result.methods["__reserve"] = FunctionType([result, INT], None)
         result.methods["delete_at_index"] = FunctionType([result, INT], generic_arg)
         result.methods["delete_slice"] = FunctionType([result, INT, INT], result)
         result.methods["ends_with"] = FunctionType([result, result], BOOL)
@@ -0,0 +1,73 @@
+#include <lib/oomph.h>
+#include "As_a05f1f16b6.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "Location_500c4434c9.h"
+#include "Type_e6cf7dd4e5.h"
+
+            static struct StringBuf string0_As_ea2d68ac72_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x41', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string0_As_ea2d68ac72 = {
+                .buf = &string0_As_ea2d68ac72_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            struct class_As_a05f1f16b6* ctor_As_a05f1f16b6(struct class_Location_500c4434c9* arg_location,struct class_Expression_35f2052bf4 arg_expr,struct class_Type_e6cf7dd4e5 arg_type)
+            {
+                struct class_As_a05f1f16b6* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_expr = arg_expr;
+obj->memb_type = arg_type;
+
+                incref(arg_location);
+incref_Expression_35f2052bf4(arg_expr);
+incref_Type_e6cf7dd4e5(arg_type);
+
+                return obj;
+            }
+
+            void dtor_As_a05f1f16b6(void *ptr)
+            {
+                struct class_As_a05f1f16b6 *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+decref_Expression_35f2052bf4(obj->memb_expr);
+decref_Type_e6cf7dd4e5(obj->memb_type);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_As_a05f1f16b6_to_string(struct class_As_a05f1f16b6* self)
+                {
+                    struct class_Str res = string0_As_ea2d68ac72;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_35f2052bf4_to_string(self->memb_expr);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_e6cf7dd4e5_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_As_a05f1f16b6_equals(struct class_As_a05f1f16b6* var1, struct class_As_a05f1f16b6* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,26 @@
+
+                #ifndef HEADER_GUARD_As_a05f1f16b6
+                #define HEADER_GUARD_As_a05f1f16b6
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "Type_e6cf7dd4e5.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_As_a05f1f16b6 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Expression_35f2052bf4 memb_expr;
+struct class_Type_e6cf7dd4e5 memb_type;
+
+            };
+            
+            struct class_As_a05f1f16b6* ctor_As_a05f1f16b6(struct class_Location_500c4434c9* arg_location,struct class_Expression_35f2052bf4 arg_expr,struct class_Type_e6cf7dd4e5 arg_type);
+            void dtor_As_a05f1f16b6(void *ptr);
+            
+                struct class_Str meth_As_a05f1f16b6_to_string(struct class_As_a05f1f16b6* obj);
+                bool meth_As_a05f1f16b6_equals(struct class_As_a05f1f16b6* var1, struct class_As_a05f1f16b6* var2);
+
+                #endif
+                
@@ -0,0 +1,72 @@
+#include <lib/oomph.h>
+#include "AutoTypeNode_203f67ecfa.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "AutoType_33a5d572cb.h"
+#include "_null___Type__8438ac3dcf.h"
+
+            static struct StringBuf string0_AutoTypeNode_0bd14f32b7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x41', '\x75', '\x74', '\x6f', '\x54', '\x79', '\x70', '\x65', '\x4e', '\x6f', '\x64', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_AutoTypeNode_0bd14f32b7 = {
+                .buf = &string0_AutoTypeNode_0bd14f32b7_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            struct class_AutoTypeNode_203f67ecfa* ctor_AutoTypeNode_203f67ecfa(struct class_AutoType_33a5d572cb* arg_autotype,int64_t arg_parent_id,struct class__null___Type__8438ac3dcf arg_resolved)
+            {
+                struct class_AutoTypeNode_203f67ecfa* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_autotype = arg_autotype;
+obj->memb_parent_id = arg_parent_id;
+obj->memb_resolved = arg_resolved;
+
+                incref(arg_autotype);
+(void)0;
+incref__null___Type__8438ac3dcf(arg_resolved);
+
+                return obj;
+            }
+
+            void dtor_AutoTypeNode_203f67ecfa(void *ptr)
+            {
+                struct class_AutoTypeNode_203f67ecfa *obj = ptr;
+                decref((obj->memb_autotype), dtor_AutoType_33a5d572cb);
+(void)0;
+decref__null___Type__8438ac3dcf(obj->memb_resolved);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_AutoTypeNode_203f67ecfa_to_string(struct class_AutoTypeNode_203f67ecfa* self)
+                {
+                    struct class_Str res = string0_AutoTypeNode_0bd14f32b7;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_AutoType_33a5d572cb_to_string(self->memb_autotype);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Int_to_string(self->memb_parent_id);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__null___Type__8438ac3dcf_to_string(self->memb_resolved);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_AutoTypeNode_203f67ecfa_equals(struct class_AutoTypeNode_203f67ecfa* var1, struct class_AutoTypeNode_203f67ecfa* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_AutoTypeNode_203f67ecfa
+                #define HEADER_GUARD_AutoTypeNode_203f67ecfa
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Type__8438ac3dcf.h"
+struct class_AutoType_33a5d572cb;
+struct class_AutoType_33a5d572cb;
+
+            struct class_AutoTypeNode_203f67ecfa {
+                REFCOUNT_HEADER
+                struct class_AutoType_33a5d572cb* memb_autotype;
+int64_t memb_parent_id;
+struct class__null___Type__8438ac3dcf memb_resolved;
+
+            };
+            
+            struct class_AutoTypeNode_203f67ecfa* ctor_AutoTypeNode_203f67ecfa(struct class_AutoType_33a5d572cb* arg_autotype,int64_t arg_parent_id,struct class__null___Type__8438ac3dcf arg_resolved);
+            void dtor_AutoTypeNode_203f67ecfa(void *ptr);
+            
+                struct class_Str meth_AutoTypeNode_203f67ecfa_to_string(struct class_AutoTypeNode_203f67ecfa* obj);
+                bool meth_AutoTypeNode_203f67ecfa_equals(struct class_AutoTypeNode_203f67ecfa* var1, struct class_AutoTypeNode_203f67ecfa* var2);
+
+                #endif
+                
@@ -0,0 +1,56 @@
+#include <lib/oomph.h>
+#include "AutoType_33a5d572cb.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_AutoType_8dc5c8388b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x41', '\x75', '\x74', '\x6f', '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_AutoType_8dc5c8388b = {
+                .buf = &string0_AutoType_8dc5c8388b_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            struct class_AutoType_33a5d572cb* ctor_AutoType_33a5d572cb(int64_t arg_id)
+            {
+                struct class_AutoType_33a5d572cb* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_id = arg_id;
+
+                (void)0;
+
+                return obj;
+            }
+
+            void dtor_AutoType_33a5d572cb(void *ptr)
+            {
+                struct class_AutoType_33a5d572cb *obj = ptr;
+                (void)0;
+
+                free(obj);
+            }
+            
+                struct class_Str meth_AutoType_33a5d572cb_to_string(struct class_AutoType_33a5d572cb* self)
+                {
+                    struct class_Str res = string0_AutoType_8dc5c8388b;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_id);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_AutoType_33a5d572cb_equals(struct class_AutoType_33a5d572cb* var1, struct class_AutoType_33a5d572cb* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,20 @@
+
+                #ifndef HEADER_GUARD_AutoType_33a5d572cb
+                #define HEADER_GUARD_AutoType_33a5d572cb
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_AutoType_33a5d572cb {
+                REFCOUNT_HEADER
+                int64_t memb_id;
+
+            };
+            
+            struct class_AutoType_33a5d572cb* ctor_AutoType_33a5d572cb(int64_t arg_id);
+            void dtor_AutoType_33a5d572cb(void *ptr);
+            
+                struct class_Str meth_AutoType_33a5d572cb_to_string(struct class_AutoType_33a5d572cb* obj);
+                bool meth_AutoType_33a5d572cb_equals(struct class_AutoType_33a5d572cb* var1, struct class_AutoType_33a5d572cb* var2);
+
+                #endif
+                
@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "AutoType_39f5d793d6.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_AutoType_aca6c410d2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x41', '\x75', '\x74', '\x6f', '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_AutoType_aca6c410d2 = {
+                .buf = &string0_AutoType_aca6c410d2_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            struct class_AutoType_39f5d793d6* ctor_AutoType_39f5d793d6(struct class_Location_500c4434c9* arg_location)
+            {
+                struct class_AutoType_39f5d793d6* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+
+                incref(arg_location);
+
+                return obj;
+            }
+
+            void dtor_AutoType_39f5d793d6(void *ptr)
+            {
+                struct class_AutoType_39f5d793d6 *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_AutoType_39f5d793d6_to_string(struct class_AutoType_39f5d793d6* self)
+                {
+                    struct class_Str res = string0_AutoType_aca6c410d2;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_AutoType_39f5d793d6_equals(struct class_AutoType_39f5d793d6* var1, struct class_AutoType_39f5d793d6* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_AutoType_39f5d793d6
+                #define HEADER_GUARD_AutoType_39f5d793d6
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_AutoType_39f5d793d6 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+
+            };
+            
+            struct class_AutoType_39f5d793d6* ctor_AutoType_39f5d793d6(struct class_Location_500c4434c9* arg_location);
+            void dtor_AutoType_39f5d793d6(void *ptr);
+            
+                struct class_Str meth_AutoType_39f5d793d6_to_string(struct class_AutoType_39f5d793d6* obj);
+                bool meth_AutoType_39f5d793d6_equals(struct class_AutoType_39f5d793d6* var1, struct class_AutoType_39f5d793d6* var2);
+
+                #endif
+                
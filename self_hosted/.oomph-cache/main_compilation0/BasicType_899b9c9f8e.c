@@ -0,0 +1,132 @@
+#include <lib/oomph.h>
+#include "BasicType_899b9c9f8e.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Member__7525bf27e3.h"
+#include "List_Method__1e0ab9c757.h"
+#include "_null___GenericSource__4440b6073d.h"
+#include "_null___List_Type___114a421a91.h"
+
+            static struct StringBuf string0__BasicType___824e6aeac8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3c', '\x42', '\x61', '\x73', '\x69', '\x63', '\x54', '\x79', '\x70', '\x65', '\x3a', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string0__BasicType___824e6aeac8 = {
+                .buf = &string0__BasicType___824e6aeac8_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1___35a1d51370_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3e' },
+                .malloced = false,
+            };
+            static struct class_Str string1___35a1d51370 = {
+                .buf = &string1___35a1d51370_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            struct class_BasicType_899b9c9f8e* ctor_BasicType_899b9c9f8e(struct class_Str arg_name,bool arg_refcounted,struct class_List_Method__1e0ab9c757* arg_methods,struct class_List_Member__7525bf27e3* arg_members,struct class__null___List_Type___114a421a91 arg_constructor_argtypes,struct class__null___GenericSource__4440b6073d arg_generic_source,bool arg_create_to_string_method)
+            {
+                struct class_BasicType_899b9c9f8e* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_name = arg_name;
+obj->memb_refcounted = arg_refcounted;
+obj->memb_methods = arg_methods;
+obj->memb_members = arg_members;
+obj->memb_constructor_argtypes = arg_constructor_argtypes;
+obj->memb_generic_source = arg_generic_source;
+obj->memb_create_to_string_method = arg_create_to_string_method;
+
+                string_incref(arg_name);
+(void)0;
+incref(arg_methods);
+incref(arg_members);
+incref__null___List_Type___114a421a91(arg_constructor_argtypes);
+incref__null___GenericSource__4440b6073d(arg_generic_source);
+(void)0;
+
+                return obj;
+            }
+
+            void dtor_BasicType_899b9c9f8e(void *ptr)
+            {
+                struct class_BasicType_899b9c9f8e *obj = ptr;
+                string_decref(obj->memb_name);
+(void)0;
+decref((obj->memb_methods), dtor_List_Method__1e0ab9c757);
+decref((obj->memb_members), dtor_List_Member__7525bf27e3);
+decref__null___List_Type___114a421a91(obj->memb_constructor_argtypes);
+decref__null___GenericSource__4440b6073d(obj->memb_generic_source);
+(void)0;
+
+                free(obj);
+            }
+            struct class_Str meth_BasicType_899b9c9f8e_to_string(struct class_BasicType_899b9c9f8e* var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str retval;
+var2 = string0__BasicType___824e6aeac8; string_incref(var2);
+var3 = var1->memb_name;
+string_incref(var3);
+var4 = oomph_string_concat(var2,var3);
+var5 = string1___35a1d51370; string_incref(var5);
+var6 = oomph_string_concat(var4,var5);
+retval = var6; var6.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+return retval;
+}bool meth_BasicType_899b9c9f8e_equals(struct class_BasicType_899b9c9f8e* var1, struct class_BasicType_899b9c9f8e* var2){struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+bool var5;
+bool var7;
+struct class__null___GenericSource__4440b6073d var9;
+var9.membernum = -1;
+struct class__null___GenericSource__4440b6073d var10;
+var10.membernum = -1;
+bool var11;
+bool retval;
+var3 = var1->memb_name;
+string_incref(var3);
+var4 = var2->memb_name;
+string_incref(var4);
+var5 = meth_Str_equals(var3,var4);
+if (var5) goto label6;
+var7 = oomph_false;
+if (oomph_true) goto label8;
+label6: (void)0;
+var9 = var1->memb_generic_source;
+incref__null___GenericSource__4440b6073d(var9);
+var10 = var2->memb_generic_source;
+incref__null___GenericSource__4440b6073d(var10);
+var11 = meth__null___GenericSource__4440b6073d_equals(var9,var10);
+var7 = var11;
+label8: (void)0;
+(void)0; retval = var7; goto out;
+out: (void)0;
+(void)0;
+decref__null___GenericSource__4440b6073d(var10);
+decref__null___GenericSource__4440b6073d(var9);
+(void)0;
+(void)0;
+string_decref(var4);
+string_decref(var3);
+return retval;
+}
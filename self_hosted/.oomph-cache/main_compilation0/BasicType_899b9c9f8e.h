@@ -0,0 +1,31 @@
+
+                #ifndef HEADER_GUARD_BasicType_899b9c9f8e
+                #define HEADER_GUARD_BasicType_899b9c9f8e
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___GenericSource__4440b6073d.h"
+#include "_null___List_Type___114a421a91.h"
+struct class_List_Method__1e0ab9c757;
+struct class_List_Member__7525bf27e3;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Member__7525bf27e3;
+
+            struct class_BasicType_899b9c9f8e {
+                REFCOUNT_HEADER
+                struct class_Str memb_name;
+bool memb_refcounted;
+struct class_List_Method__1e0ab9c757* memb_methods;
+struct class_List_Member__7525bf27e3* memb_members;
+struct class__null___List_Type___114a421a91 memb_constructor_argtypes;
+struct class__null___GenericSource__4440b6073d memb_generic_source;
+bool memb_create_to_string_method;
+
+            };
+            
+            struct class_BasicType_899b9c9f8e* ctor_BasicType_899b9c9f8e(struct class_Str arg_name,bool arg_refcounted,struct class_List_Method__1e0ab9c757* arg_methods,struct class_List_Member__7525bf27e3* arg_members,struct class__null___List_Type___114a421a91 arg_constructor_argtypes,struct class__null___GenericSource__4440b6073d arg_generic_source,bool arg_create_to_string_method);
+            void dtor_BasicType_899b9c9f8e(void *ptr);
+            struct class_Str meth_BasicType_899b9c9f8e_to_string(struct class_BasicType_899b9c9f8e* var1);
+bool meth_BasicType_899b9c9f8e_equals(struct class_BasicType_899b9c9f8e* var1, struct class_BasicType_899b9c9f8e* var2);
+
+                #endif
+                
@@ -0,0 +1,79 @@
+#include <lib/oomph.h>
+#include "BinaryOperator_e25f87d1b5.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_BinaryOperator_3adb0581dc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x69', '\x6e', '\x61', '\x72', '\x79', '\x4f', '\x70', '\x65', '\x72', '\x61', '\x74', '\x6f', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_BinaryOperator_3adb0581dc = {
+                .buf = &string0_BinaryOperator_3adb0581dc_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            struct class_BinaryOperator_e25f87d1b5* ctor_BinaryOperator_e25f87d1b5(struct class_Location_500c4434c9* arg_location,struct class_Expression_35f2052bf4 arg_lhs,struct class_Str arg_op,struct class_Expression_35f2052bf4 arg_rhs)
+            {
+                struct class_BinaryOperator_e25f87d1b5* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_lhs = arg_lhs;
+obj->memb_op = arg_op;
+obj->memb_rhs = arg_rhs;
+
+                incref(arg_location);
+incref_Expression_35f2052bf4(arg_lhs);
+string_incref(arg_op);
+incref_Expression_35f2052bf4(arg_rhs);
+
+                return obj;
+            }
+
+            void dtor_BinaryOperator_e25f87d1b5(void *ptr)
+            {
+                struct class_BinaryOperator_e25f87d1b5 *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+decref_Expression_35f2052bf4(obj->memb_lhs);
+string_decref(obj->memb_op);
+decref_Expression_35f2052bf4(obj->memb_rhs);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_BinaryOperator_e25f87d1b5_to_string(struct class_BinaryOperator_e25f87d1b5* self)
+                {
+                    struct class_Str res = string0_BinaryOperator_3adb0581dc;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_35f2052bf4_to_string(self->memb_lhs);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_op);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_35f2052bf4_to_string(self->memb_rhs);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_BinaryOperator_e25f87d1b5_equals(struct class_BinaryOperator_e25f87d1b5* var1, struct class_BinaryOperator_e25f87d1b5* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,26 @@
+
+                #ifndef HEADER_GUARD_BinaryOperator_e25f87d1b5
+                #define HEADER_GUARD_BinaryOperator_e25f87d1b5
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_BinaryOperator_e25f87d1b5 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Expression_35f2052bf4 memb_lhs;
+struct class_Str memb_op;
+struct class_Expression_35f2052bf4 memb_rhs;
+
+            };
+            
+            struct class_BinaryOperator_e25f87d1b5* ctor_BinaryOperator_e25f87d1b5(struct class_Location_500c4434c9* arg_location,struct class_Expression_35f2052bf4 arg_lhs,struct class_Str arg_op,struct class_Expression_35f2052bf4 arg_rhs);
+            void dtor_BinaryOperator_e25f87d1b5(void *ptr);
+            
+                struct class_Str meth_BinaryOperator_e25f87d1b5_to_string(struct class_BinaryOperator_e25f87d1b5* obj);
+                bool meth_BinaryOperator_e25f87d1b5_equals(struct class_BinaryOperator_e25f87d1b5* var1, struct class_BinaryOperator_e25f87d1b5* var2);
+
+                #endif
+                
@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "Break_2f9897f5fd.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_Break_2885c10f24_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x72', '\x65', '\x61', '\x6b' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Break_2885c10f24 = {
+                .buf = &string0_Break_2885c10f24_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            struct class_Break_2f9897f5fd* ctor_Break_2f9897f5fd(struct class_Location_500c4434c9* arg_location)
+            {
+                struct class_Break_2f9897f5fd* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+
+                incref(arg_location);
+
+                return obj;
+            }
+
+            void dtor_Break_2f9897f5fd(void *ptr)
+            {
+                struct class_Break_2f9897f5fd *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Break_2f9897f5fd_to_string(struct class_Break_2f9897f5fd* self)
+                {
+                    struct class_Str res = string0_Break_2885c10f24;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Break_2f9897f5fd_equals(struct class_Break_2f9897f5fd* var1, struct class_Break_2f9897f5fd* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_Break_2f9897f5fd
+                #define HEADER_GUARD_Break_2f9897f5fd
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_Break_2f9897f5fd {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+
+            };
+            
+            struct class_Break_2f9897f5fd* ctor_Break_2f9897f5fd(struct class_Location_500c4434c9* arg_location);
+            void dtor_Break_2f9897f5fd(void *ptr);
+            
+                struct class_Str meth_Break_2f9897f5fd_to_string(struct class_Break_2f9897f5fd* obj);
+                bool meth_Break_2f9897f5fd_equals(struct class_Break_2f9897f5fd* var1, struct class_Break_2f9897f5fd* var2);
+
+                #endif
+                
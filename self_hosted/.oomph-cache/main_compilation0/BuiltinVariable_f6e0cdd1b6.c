@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "BuiltinVariable_f6e0cdd1b6.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+
+            static struct StringBuf string0_BuiltinVariable_b39f4f8ebf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x75', '\x69', '\x6c', '\x74', '\x69', '\x6e', '\x56', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_BuiltinVariable_b39f4f8ebf = {
+                .buf = &string0_BuiltinVariable_b39f4f8ebf_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            struct class_BuiltinVariable_f6e0cdd1b6* ctor_BuiltinVariable_f6e0cdd1b6(struct class_Str arg_name,struct class_Type_87e1ce5c5e arg_type)
+            {
+                struct class_BuiltinVariable_f6e0cdd1b6* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+
+                string_incref(arg_name);
+incref_Type_87e1ce5c5e(arg_type);
+
+                return obj;
+            }
+
+            void dtor_BuiltinVariable_f6e0cdd1b6(void *ptr)
+            {
+                struct class_BuiltinVariable_f6e0cdd1b6 *obj = ptr;
+                string_decref(obj->memb_name);
+decref_Type_87e1ce5c5e(obj->memb_type);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_BuiltinVariable_f6e0cdd1b6_to_string(struct class_BuiltinVariable_f6e0cdd1b6* self)
+                {
+                    struct class_Str res = string0_BuiltinVariable_b39f4f8ebf;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_BuiltinVariable_f6e0cdd1b6_equals(struct class_BuiltinVariable_f6e0cdd1b6* var1, struct class_BuiltinVariable_f6e0cdd1b6* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
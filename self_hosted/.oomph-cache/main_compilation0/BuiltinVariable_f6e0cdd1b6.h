@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_BuiltinVariable_f6e0cdd1b6
+                #define HEADER_GUARD_BuiltinVariable_f6e0cdd1b6
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+
+            struct class_BuiltinVariable_f6e0cdd1b6 {
+                REFCOUNT_HEADER
+                struct class_Str memb_name;
+struct class_Type_87e1ce5c5e memb_type;
+
+            };
+            
+            struct class_BuiltinVariable_f6e0cdd1b6* ctor_BuiltinVariable_f6e0cdd1b6(struct class_Str arg_name,struct class_Type_87e1ce5c5e arg_type);
+            void dtor_BuiltinVariable_f6e0cdd1b6(void *ptr);
+            
+                struct class_Str meth_BuiltinVariable_f6e0cdd1b6_to_string(struct class_BuiltinVariable_f6e0cdd1b6* obj);
+                bool meth_BuiltinVariable_f6e0cdd1b6_equals(struct class_BuiltinVariable_f6e0cdd1b6* var1, struct class_BuiltinVariable_f6e0cdd1b6* var2);
+
+                #endif
+                
@@ -0,0 +1,1482 @@
+#include <lib/oomph.h>
+#include "Builtins_bd980a9f08.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "BasicType_899b9c9f8e.h"
+#include "BuiltinVariable_f6e0cdd1b6.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "GenericSource_35cfcd932e.h"
+#include "Generic_c39b95ec73.h"
+#include "List_BasicType__d02960f5a1.h"
+#include "List_BuiltinVariable__27288a8fae.h"
+#include "List_Member__7525bf27e3.h"
+#include "List_Method__1e0ab9c757.h"
+#include "List_Type__057f9c6088.h"
+#include "Method_bfbd73ad15.h"
+#include "Type_87e1ce5c5e.h"
+#include "_null___GenericSource__4440b6073d.h"
+#include "_null___List_Type___114a421a91.h"
+#include "_null___Type__8438ac3dcf.h"
+#include "ir_4b1a3e0393.h"
+
+            static struct StringBuf string0_Builtins_efddb09249_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x75', '\x69', '\x6c', '\x74', '\x69', '\x6e', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Builtins_efddb09249 = {
+                .buf = &string0_Builtins_efddb09249_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_variable__b2366ded05_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x76', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string1_variable__b2366ded05 = {
+                .buf = &string1_variable__b2366ded05_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2__not_found_f3f3fc0a41_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6e', '\x6f', '\x74', '\x20', '\x66', '\x6f', '\x75', '\x6e', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string2__not_found_f3f3fc0a41 = {
+                .buf = &string2__not_found_f3f3fc0a41_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_self_hosted_ir_oomph_73d0b0bb05_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x69', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string3_self_hosted_ir_oomph_73d0b0bb05 = {
+                .buf = &string3_self_hosted_ir_oomph_73d0b0bb05_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_INTERNAL_ERROR__hidden_variable__4017399345_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x4e', '\x54', '\x45', '\x52', '\x4e', '\x41', '\x4c', '\x20', '\x45', '\x52', '\x52', '\x4f', '\x52', '\x3a', '\x20', '\x68', '\x69', '\x64', '\x64', '\x65', '\x6e', '\x20', '\x76', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string4_INTERNAL_ERROR__hidden_variable__4017399345 = {
+                .buf = &string4_INTERNAL_ERROR__hidden_variable__4017399345_buf,
+                .nbytes = 32,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_List__c7451df6fe_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x69', '\x73', '\x74', '\x5b' },
+                .malloced = false,
+            };
+            static struct class_Str string5_List__c7451df6fe = {
+                .buf = &string5_List__c7451df6fe_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6___e9f08d9187_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5d' },
+                .malloced = false,
+            };
+            static struct class_Str string6___e9f08d9187 = {
+                .buf = &string6___e9f08d9187_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7___contains_128d1d4f79_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x63', '\x6f', '\x6e', '\x74', '\x61', '\x69', '\x6e', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string7___contains_128d1d4f79 = {
+                .buf = &string7___contains_128d1d4f79_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string8___reserve_dd3ba34da2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x72', '\x65', '\x73', '\x65', '\x72', '\x76', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string8___reserve_dd3ba34da2 = {
+                .buf = &string8___reserve_dd3ba34da2_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string9_delete_at_index_7df8992e1a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x65', '\x6c', '\x65', '\x74', '\x65', '\x5f', '\x61', '\x74', '\x5f', '\x69', '\x6e', '\x64', '\x65', '\x78' },
+                .malloced = false,
+            };
+            static struct class_Str string9_delete_at_index_7df8992e1a = {
+                .buf = &string9_delete_at_index_7df8992e1a_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string10_delete_first_c8ed90b920_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x65', '\x6c', '\x65', '\x74', '\x65', '\x5f', '\x66', '\x69', '\x72', '\x73', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string10_delete_first_c8ed90b920 = {
+                .buf = &string10_delete_first_c8ed90b920_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string11_delete_only_448c9aec3d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x65', '\x6c', '\x65', '\x74', '\x65', '\x5f', '\x6f', '\x6e', '\x6c', '\x79' },
+                .malloced = false,
+            };
+            static struct class_Str string11_delete_only_448c9aec3d = {
+                .buf = &string11_delete_only_448c9aec3d_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string12_delete_slice_9e4f33476c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x65', '\x6c', '\x65', '\x74', '\x65', '\x5f', '\x73', '\x6c', '\x69', '\x63', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string12_delete_slice_9e4f33476c = {
+                .buf = &string12_delete_slice_9e4f33476c_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string13_ends_with_9b5b221c36_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x6e', '\x64', '\x73', '\x5f', '\x77', '\x69', '\x74', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string13_ends_with_9b5b221c36 = {
+                .buf = &string13_ends_with_9b5b221c36_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string14_equals_4f73a08080_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x71', '\x75', '\x61', '\x6c', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string14_equals_4f73a08080 = {
+                .buf = &string14_equals_4f73a08080_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string15_find_first_c51ec6fd4d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x69', '\x6e', '\x64', '\x5f', '\x66', '\x69', '\x72', '\x73', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string15_find_first_c51ec6fd4d = {
+                .buf = &string15_find_first_c51ec6fd4d_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string16_find_last_9fbe0bad3b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x69', '\x6e', '\x64', '\x5f', '\x6c', '\x61', '\x73', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string16_find_last_9fbe0bad3b = {
+                .buf = &string16_find_last_9fbe0bad3b_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string17_find_only_8d45e9dd40_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x69', '\x6e', '\x64', '\x5f', '\x6f', '\x6e', '\x6c', '\x79' },
+                .malloced = false,
+            };
+            static struct class_Str string17_find_only_8d45e9dd40 = {
+                .buf = &string17_find_only_8d45e9dd40_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string18_first_0054ff31c2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x69', '\x72', '\x73', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string18_first_0054ff31c2 = {
+                .buf = &string18_first_0054ff31c2_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string19_get_15f63b9a2c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x67', '\x65', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string19_get_15f63b9a2c = {
+                .buf = &string19_get_15f63b9a2c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string20_insert_5dd2e4f180_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x73', '\x65', '\x72', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string20_insert_5dd2e4f180 = {
+                .buf = &string20_insert_5dd2e4f180_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string21_last_e4854f7a01_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x61', '\x73', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string21_last_e4854f7a01 = {
+                .buf = &string21_last_e4854f7a01_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string22_length_4662e65518_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x65', '\x6e', '\x67', '\x74', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string22_length_4662e65518 = {
+                .buf = &string22_length_4662e65518_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string23_pop_8e19017e9d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x6f', '\x70' },
+                .malloced = false,
+            };
+            static struct class_Str string23_pop_8e19017e9d = {
+                .buf = &string23_pop_8e19017e9d_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string24_push_bc94ad77e1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x75', '\x73', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string24_push_bc94ad77e1 = {
+                .buf = &string24_push_bc94ad77e1_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string25_push_all_3b521fa6fa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x75', '\x73', '\x68', '\x5f', '\x61', '\x6c', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string25_push_all_3b521fa6fa = {
+                .buf = &string25_push_all_3b521fa6fa_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string26_reversed_1a02c3cec8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x76', '\x65', '\x72', '\x73', '\x65', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string26_reversed_1a02c3cec8 = {
+                .buf = &string26_reversed_1a02c3cec8_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string27_slice_164b6b8807_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x6c', '\x69', '\x63', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string27_slice_164b6b8807 = {
+                .buf = &string27_slice_164b6b8807_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string28_starts_with_43f9405f8f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x61', '\x72', '\x74', '\x73', '\x5f', '\x77', '\x69', '\x74', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string28_starts_with_43f9405f8f = {
+                .buf = &string28_starts_with_43f9405f8f_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string29_to_string_bf014e86f0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string29_to_string_bf014e86f0 = {
+                .buf = &string29_to_string_bf014e86f0_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string30_join_7a9c2f6a04_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6a', '\x6f', '\x69', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string30_join_7a9c2f6a04 = {
+                .buf = &string30_join_7a9c2f6a04_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            struct class_Builtins_bd980a9f08* ctor_Builtins_bd980a9f08(struct class_Type_87e1ce5c5e arg_BOOL,struct class_Type_87e1ce5c5e arg_FLOAT,struct class_Type_87e1ce5c5e arg_INT,struct class_Type_87e1ce5c5e arg_NULL_TYPE,struct class_Type_87e1ce5c5e arg_STR,struct class_Generic_c39b95ec73* arg_LIST,struct class_List_BuiltinVariable__27288a8fae* arg_visible_vars,struct class_List_BuiltinVariable__27288a8fae* arg_hidden_vars,struct class_List_BasicType__d02960f5a1* arg_cleanup_list)
+            {
+                struct class_Builtins_bd980a9f08* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_BOOL = arg_BOOL;
+obj->memb_FLOAT = arg_FLOAT;
+obj->memb_INT = arg_INT;
+obj->memb_NULL_TYPE = arg_NULL_TYPE;
+obj->memb_STR = arg_STR;
+obj->memb_LIST = arg_LIST;
+obj->memb_visible_vars = arg_visible_vars;
+obj->memb_hidden_vars = arg_hidden_vars;
+obj->memb_cleanup_list = arg_cleanup_list;
+
+                incref_Type_87e1ce5c5e(arg_BOOL);
+incref_Type_87e1ce5c5e(arg_FLOAT);
+incref_Type_87e1ce5c5e(arg_INT);
+incref_Type_87e1ce5c5e(arg_NULL_TYPE);
+incref_Type_87e1ce5c5e(arg_STR);
+incref(arg_LIST);
+incref(arg_visible_vars);
+incref(arg_hidden_vars);
+incref(arg_cleanup_list);
+
+                return obj;
+            }
+
+            void dtor_Builtins_bd980a9f08(void *ptr)
+            {
+                struct class_Builtins_bd980a9f08 *obj = ptr;
+                decref_Type_87e1ce5c5e(obj->memb_BOOL);
+decref_Type_87e1ce5c5e(obj->memb_FLOAT);
+decref_Type_87e1ce5c5e(obj->memb_INT);
+decref_Type_87e1ce5c5e(obj->memb_NULL_TYPE);
+decref_Type_87e1ce5c5e(obj->memb_STR);
+decref((obj->memb_LIST), dtor_Generic_c39b95ec73);
+decref((obj->memb_visible_vars), dtor_List_BuiltinVariable__27288a8fae);
+decref((obj->memb_hidden_vars), dtor_List_BuiltinVariable__27288a8fae);
+decref((obj->memb_cleanup_list), dtor_List_BasicType__d02960f5a1);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Builtins_bd980a9f08_to_string(struct class_Builtins_bd980a9f08* self)
+                {
+                    struct class_Str res = string0_Builtins_efddb09249;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_BOOL);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_FLOAT);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_INT);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_NULL_TYPE);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_STR);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Generic_c39b95ec73_to_string(self->memb_LIST);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_BuiltinVariable__27288a8fae_to_string(self->memb_visible_vars);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_BuiltinVariable__27288a8fae_to_string(self->memb_hidden_vars);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_BasicType__d02960f5a1_to_string(self->memb_cleanup_list);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Builtins_bd980a9f08_equals(struct class_Builtins_bd980a9f08* var1, struct class_Builtins_bd980a9f08* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}void meth_Builtins_bd980a9f08_destroy(struct class_Builtins_bd980a9f08* var1){struct class_List_BasicType__d02960f5a1* var2;
+var2 = NULL;
+int64_t var3;
+struct class_BasicType_899b9c9f8e* var5;
+var5 = NULL;
+struct class_List_Method__1e0ab9c757* var7;
+var7 = NULL;
+struct class_List_Method__1e0ab9c757* var8;
+var8 = NULL;
+struct class_List_Member__7525bf27e3* var9;
+var9 = NULL;
+struct class_List_Member__7525bf27e3* var10;
+var10 = NULL;
+char var11;
+struct class__null___List_Type___114a421a91 var12;
+var12.membernum = -1;
+struct class__null___List_Type___114a421a91 var13;
+var13.membernum = -1;
+var2 = var1->memb_cleanup_list;
+incref(var2);
+var3 = 0LL;
+label4: (void)0;
+if (var3 >= var2->len) goto label6;
+var5 = var2->data[var3++];
+var7 = ctor_List_Method__1e0ab9c757();
+decref((var8), dtor_List_Method__1e0ab9c757);
+var8 = NULL;
+var8 = var5->memb_methods;
+var5->memb_methods = var7;
+var7 = NULL;
+var9 = ctor_List_Member__7525bf27e3();
+decref((var10), dtor_List_Member__7525bf27e3);
+var10 = NULL;
+var10 = var5->memb_members;
+var5->memb_members = var9;
+var9 = NULL;
+var11 = oomph_null;
+var12 = (struct class__null___List_Type___114a421a91){ .val = { .item0 = var11 }, .membernum = 0 };
+decref__null___List_Type___114a421a91(var13);
+var13.membernum = -1;
+var13 = var5->memb_constructor_argtypes;
+var5->memb_constructor_argtypes = var12;
+var12.membernum = -1;
+if (oomph_true) goto label4;
+label6: (void)0;
+out: (void)0;
+decref__null___List_Type___114a421a91(var13);
+decref__null___List_Type___114a421a91(var12);
+(void)0;
+decref((var10), dtor_List_Member__7525bf27e3);
+decref((var9), dtor_List_Member__7525bf27e3);
+decref((var8), dtor_List_Method__1e0ab9c757);
+decref((var7), dtor_List_Method__1e0ab9c757);
+(void)0;
+decref((var2), dtor_List_BasicType__d02960f5a1);
+}struct class_BuiltinVariable_f6e0cdd1b6* meth_Builtins_bd980a9f08_get_visible_var(struct class_Builtins_bd980a9f08* var1, struct class_Str var2){struct class_List_BuiltinVariable__27288a8fae* var3;
+var3 = NULL;
+int64_t var4;
+struct class_BuiltinVariable_f6e0cdd1b6* var6;
+var6 = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+bool var9;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+bool var16;
+struct class_Str var17;
+var17.buf = NULL;
+int64_t var18;
+struct class_BuiltinVariable_f6e0cdd1b6* retval;
+var3 = var1->memb_visible_vars;
+incref(var3);
+var4 = 0LL;
+label5: (void)0;
+if (var4 >= var3->len) goto label7;
+var6 = var3->data[var4++];
+string_decref(var8);
+var8.buf = NULL;
+var8 = var6->memb_name;
+string_incref(var8);
+var9 = meth_Str_equals(var8,var2);
+if (var9) goto label10;
+if (oomph_true) goto label11;
+label10: (void)0;
+incref(var6); retval = var6; goto out;
+label11: (void)0;
+if (oomph_true) goto label5;
+label7: (void)0;
+var12 = string1_variable__b2366ded05; string_incref(var12);
+var13 = oomph_string_concat(var12,var2);
+var14 = string2__not_found_f3f3fc0a41; string_incref(var14);
+var15 = oomph_string_concat(var13,var14);
+oomph_print(var15);
+var16 = oomph_false;
+var17 = string3_self_hosted_ir_oomph_73d0b0bb05; string_incref(var17);
+var18 = 190LL;
+oomph_assert(var16,var17,var18);
+out: (void)0;
+(void)0;
+string_decref(var17);
+(void)0;
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+(void)0;
+string_decref(var8);
+(void)0;
+decref((var3), dtor_List_BuiltinVariable__27288a8fae);
+return retval;
+}struct class_BuiltinVariable_f6e0cdd1b6* meth_Builtins_bd980a9f08_get_hidden_var(struct class_Builtins_bd980a9f08* var1, struct class_Str var2){struct class_List_BuiltinVariable__27288a8fae* var3;
+var3 = NULL;
+int64_t var4;
+struct class_BuiltinVariable_f6e0cdd1b6* var6;
+var6 = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+bool var9;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+bool var16;
+struct class_Str var17;
+var17.buf = NULL;
+int64_t var18;
+struct class_BuiltinVariable_f6e0cdd1b6* retval;
+var3 = var1->memb_hidden_vars;
+incref(var3);
+var4 = 0LL;
+label5: (void)0;
+if (var4 >= var3->len) goto label7;
+var6 = var3->data[var4++];
+string_decref(var8);
+var8.buf = NULL;
+var8 = var6->memb_name;
+string_incref(var8);
+var9 = meth_Str_equals(var8,var2);
+if (var9) goto label10;
+if (oomph_true) goto label11;
+label10: (void)0;
+incref(var6); retval = var6; goto out;
+label11: (void)0;
+if (oomph_true) goto label5;
+label7: (void)0;
+var12 = string4_INTERNAL_ERROR__hidden_variable__4017399345; string_incref(var12);
+var13 = oomph_string_concat(var12,var2);
+var14 = string2__not_found_f3f3fc0a41; string_incref(var14);
+var15 = oomph_string_concat(var13,var14);
+oomph_print(var15);
+var16 = oomph_false;
+var17 = string3_self_hosted_ir_oomph_73d0b0bb05; string_incref(var17);
+var18 = 197LL;
+oomph_assert(var16,var17,var18);
+out: (void)0;
+(void)0;
+string_decref(var17);
+(void)0;
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+(void)0;
+string_decref(var8);
+(void)0;
+decref((var3), dtor_List_BuiltinVariable__27288a8fae);
+return retval;
+}struct class_List_Type__057f9c6088* meth_Builtins_bd980a9f08_get_builtin_types(struct class_Builtins_bd980a9f08* var1){struct class_Type_87e1ce5c5e var2;
+var2.membernum = -1;
+struct class_Type_87e1ce5c5e var3;
+var3.membernum = -1;
+struct class_Type_87e1ce5c5e var4;
+var4.membernum = -1;
+struct class_Type_87e1ce5c5e var5;
+var5.membernum = -1;
+struct class_Type_87e1ce5c5e var6;
+var6.membernum = -1;
+struct class_List_Type__057f9c6088* var7;
+var7 = NULL;
+struct class_List_Type__057f9c6088* retval;
+var2 = var1->memb_BOOL;
+incref_Type_87e1ce5c5e(var2);
+var3 = var1->memb_FLOAT;
+incref_Type_87e1ce5c5e(var3);
+var4 = var1->memb_INT;
+incref_Type_87e1ce5c5e(var4);
+var5 = var1->memb_NULL_TYPE;
+incref_Type_87e1ce5c5e(var5);
+var6 = var1->memb_STR;
+incref_Type_87e1ce5c5e(var6);
+var7 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var7,var2);
+meth_List_Type__057f9c6088_push(var7,var3);
+meth_List_Type__057f9c6088_push(var7,var4);
+meth_List_Type__057f9c6088_push(var7,var5);
+meth_List_Type__057f9c6088_push(var7,var6);
+retval = var7; var7 = NULL;
+goto out;
+out: (void)0;
+decref((var7), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var6);
+decref_Type_87e1ce5c5e(var5);
+decref_Type_87e1ce5c5e(var4);
+decref_Type_87e1ce5c5e(var3);
+decref_Type_87e1ce5c5e(var2);
+return retval;
+}struct class_Type_87e1ce5c5e meth_Builtins_bd980a9f08_generic2type(struct class_Builtins_bd980a9f08* var1, struct class_Generic_c39b95ec73* var2, struct class_Type_87e1ce5c5e var3){struct class_GenericSource_35cfcd932e* var4;
+var4 = NULL;
+struct class_Generic_c39b95ec73* var5;
+var5 = NULL;
+bool var6;
+struct class_Str var7;
+var7.buf = NULL;
+int64_t var8;
+struct class_List_Method__1e0ab9c757* var9;
+var9 = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+bool var15;
+struct class_List_Member__7525bf27e3* var16;
+var16 = NULL;
+struct class_List_Type__057f9c6088* var17;
+var17 = NULL;
+struct class_GenericSource_35cfcd932e* var18;
+var18 = NULL;
+bool var19;
+struct class__null___List_Type___114a421a91 var20;
+var20.membernum = -1;
+struct class__null___GenericSource__4440b6073d var21;
+var21.membernum = -1;
+struct class_BasicType_899b9c9f8e* var22;
+var22 = NULL;
+struct class_Type_87e1ce5c5e var23;
+var23.membernum = -1;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_List_Type__057f9c6088* var25;
+var25 = NULL;
+struct class_Type_87e1ce5c5e var26;
+var26.membernum = -1;
+struct class__null___Type__8438ac3dcf var27;
+var27.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var28;
+var28 = NULL;
+struct class_Method_bfbd73ad15* var29;
+var29 = NULL;
+struct class_Str var30;
+var30.buf = NULL;
+struct class_Type_87e1ce5c5e var31;
+var31.membernum = -1;
+struct class_List_Type__057f9c6088* var32;
+var32 = NULL;
+char var33;
+struct class__null___Type__8438ac3dcf var34;
+var34.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var35;
+var35 = NULL;
+struct class_Method_bfbd73ad15* var36;
+var36 = NULL;
+struct class_Str var37;
+var37.buf = NULL;
+struct class_Type_87e1ce5c5e var38;
+var38.membernum = -1;
+struct class_List_Type__057f9c6088* var39;
+var39 = NULL;
+struct class__null___Type__8438ac3dcf var40;
+var40.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var41;
+var41 = NULL;
+struct class_Method_bfbd73ad15* var42;
+var42 = NULL;
+struct class_Str var43;
+var43.buf = NULL;
+struct class_List_Type__057f9c6088* var44;
+var44 = NULL;
+char var45;
+struct class__null___Type__8438ac3dcf var46;
+var46.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var47;
+var47 = NULL;
+struct class_Method_bfbd73ad15* var48;
+var48 = NULL;
+struct class_Str var49;
+var49.buf = NULL;
+struct class_List_Type__057f9c6088* var50;
+var50 = NULL;
+char var51;
+struct class__null___Type__8438ac3dcf var52;
+var52.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var53;
+var53 = NULL;
+struct class_Method_bfbd73ad15* var54;
+var54 = NULL;
+struct class_Str var55;
+var55.buf = NULL;
+struct class_List_Type__057f9c6088* var56;
+var56 = NULL;
+char var57;
+struct class__null___Type__8438ac3dcf var58;
+var58.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var59;
+var59 = NULL;
+struct class_Method_bfbd73ad15* var60;
+var60 = NULL;
+struct class_Str var61;
+var61.buf = NULL;
+struct class_Type_87e1ce5c5e var62;
+var62.membernum = -1;
+struct class_Type_87e1ce5c5e var63;
+var63.membernum = -1;
+struct class_List_Type__057f9c6088* var64;
+var64 = NULL;
+struct class__null___Type__8438ac3dcf var65;
+var65.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var66;
+var66 = NULL;
+struct class_Method_bfbd73ad15* var67;
+var67 = NULL;
+struct class_Str var68;
+var68.buf = NULL;
+struct class_List_Type__057f9c6088* var69;
+var69 = NULL;
+struct class_Type_87e1ce5c5e var70;
+var70.membernum = -1;
+struct class__null___Type__8438ac3dcf var71;
+var71.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var72;
+var72 = NULL;
+struct class_Method_bfbd73ad15* var73;
+var73 = NULL;
+struct class_Str var74;
+var74.buf = NULL;
+struct class_List_Type__057f9c6088* var75;
+var75 = NULL;
+struct class_Type_87e1ce5c5e var76;
+var76.membernum = -1;
+struct class__null___Type__8438ac3dcf var77;
+var77.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var78;
+var78 = NULL;
+struct class_Method_bfbd73ad15* var79;
+var79 = NULL;
+struct class_Str var80;
+var80.buf = NULL;
+struct class_List_Type__057f9c6088* var81;
+var81 = NULL;
+struct class_Type_87e1ce5c5e var82;
+var82.membernum = -1;
+struct class__null___Type__8438ac3dcf var83;
+var83.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var84;
+var84 = NULL;
+struct class_Method_bfbd73ad15* var85;
+var85 = NULL;
+struct class_Str var86;
+var86.buf = NULL;
+struct class_List_Type__057f9c6088* var87;
+var87 = NULL;
+struct class_Type_87e1ce5c5e var88;
+var88.membernum = -1;
+struct class__null___Type__8438ac3dcf var89;
+var89.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var90;
+var90 = NULL;
+struct class_Method_bfbd73ad15* var91;
+var91 = NULL;
+struct class_Str var92;
+var92.buf = NULL;
+struct class_List_Type__057f9c6088* var93;
+var93 = NULL;
+struct class_Type_87e1ce5c5e var94;
+var94.membernum = -1;
+struct class__null___Type__8438ac3dcf var95;
+var95.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var96;
+var96 = NULL;
+struct class_Method_bfbd73ad15* var97;
+var97 = NULL;
+struct class_Str var98;
+var98.buf = NULL;
+struct class_List_Type__057f9c6088* var99;
+var99 = NULL;
+struct class__null___Type__8438ac3dcf var100;
+var100.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var101;
+var101 = NULL;
+struct class_Method_bfbd73ad15* var102;
+var102 = NULL;
+struct class_Str var103;
+var103.buf = NULL;
+struct class_Type_87e1ce5c5e var104;
+var104.membernum = -1;
+struct class_List_Type__057f9c6088* var105;
+var105 = NULL;
+struct class__null___Type__8438ac3dcf var106;
+var106.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var107;
+var107 = NULL;
+struct class_Method_bfbd73ad15* var108;
+var108 = NULL;
+struct class_Str var109;
+var109.buf = NULL;
+struct class_Type_87e1ce5c5e var110;
+var110.membernum = -1;
+struct class_List_Type__057f9c6088* var111;
+var111 = NULL;
+char var112;
+struct class__null___Type__8438ac3dcf var113;
+var113.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var114;
+var114 = NULL;
+struct class_Method_bfbd73ad15* var115;
+var115 = NULL;
+struct class_Str var116;
+var116.buf = NULL;
+struct class_List_Type__057f9c6088* var117;
+var117 = NULL;
+struct class__null___Type__8438ac3dcf var118;
+var118.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var119;
+var119 = NULL;
+struct class_Method_bfbd73ad15* var120;
+var120 = NULL;
+struct class_Str var121;
+var121.buf = NULL;
+struct class_List_Type__057f9c6088* var122;
+var122 = NULL;
+struct class_Type_87e1ce5c5e var123;
+var123.membernum = -1;
+struct class__null___Type__8438ac3dcf var124;
+var124.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var125;
+var125 = NULL;
+struct class_Method_bfbd73ad15* var126;
+var126 = NULL;
+struct class_Str var127;
+var127.buf = NULL;
+struct class_List_Type__057f9c6088* var128;
+var128 = NULL;
+struct class__null___Type__8438ac3dcf var129;
+var129.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var130;
+var130 = NULL;
+struct class_Method_bfbd73ad15* var131;
+var131 = NULL;
+struct class_Str var132;
+var132.buf = NULL;
+struct class_List_Type__057f9c6088* var133;
+var133 = NULL;
+char var134;
+struct class__null___Type__8438ac3dcf var135;
+var135.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var136;
+var136 = NULL;
+struct class_Method_bfbd73ad15* var137;
+var137 = NULL;
+struct class_Str var138;
+var138.buf = NULL;
+struct class_List_Type__057f9c6088* var139;
+var139 = NULL;
+char var140;
+struct class__null___Type__8438ac3dcf var141;
+var141.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var142;
+var142 = NULL;
+struct class_Method_bfbd73ad15* var143;
+var143 = NULL;
+struct class_Str var144;
+var144.buf = NULL;
+struct class_List_Type__057f9c6088* var145;
+var145 = NULL;
+struct class__null___Type__8438ac3dcf var146;
+var146.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var147;
+var147 = NULL;
+struct class_Method_bfbd73ad15* var148;
+var148 = NULL;
+struct class_Str var149;
+var149.buf = NULL;
+struct class_Type_87e1ce5c5e var150;
+var150.membernum = -1;
+struct class_Type_87e1ce5c5e var151;
+var151.membernum = -1;
+struct class_List_Type__057f9c6088* var152;
+var152 = NULL;
+struct class__null___Type__8438ac3dcf var153;
+var153.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var154;
+var154 = NULL;
+struct class_Method_bfbd73ad15* var155;
+var155 = NULL;
+struct class_Str var156;
+var156.buf = NULL;
+struct class_List_Type__057f9c6088* var157;
+var157 = NULL;
+struct class_Type_87e1ce5c5e var158;
+var158.membernum = -1;
+struct class__null___Type__8438ac3dcf var159;
+var159.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var160;
+var160 = NULL;
+struct class_Method_bfbd73ad15* var161;
+var161 = NULL;
+struct class_Str var162;
+var162.buf = NULL;
+struct class_List_Type__057f9c6088* var163;
+var163 = NULL;
+struct class_Type_87e1ce5c5e var164;
+var164.membernum = -1;
+struct class__null___Type__8438ac3dcf var165;
+var165.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var166;
+var166 = NULL;
+struct class_Method_bfbd73ad15* var167;
+var167 = NULL;
+struct class_Str var168;
+var168.buf = NULL;
+struct class_Type_87e1ce5c5e var169;
+var169.membernum = -1;
+struct class_List_Type__057f9c6088* var170;
+var170 = NULL;
+struct class_Type_87e1ce5c5e var171;
+var171.membernum = -1;
+struct class__null___Type__8438ac3dcf var172;
+var172.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var173;
+var173 = NULL;
+struct class_Method_bfbd73ad15* var174;
+var174 = NULL;
+struct class_List_Method__1e0ab9c757* var175;
+var175 = NULL;
+struct class_List_BasicType__d02960f5a1* var176;
+var176 = NULL;
+struct class_Type_87e1ce5c5e var177;
+var177.membernum = -1;
+struct class_Type_87e1ce5c5e retval;
+var4 = ctor_GenericSource_35cfcd932e(var2,var3);
+var5 = var1->memb_LIST;
+incref(var5);
+var6 = meth_Generic_c39b95ec73_equals(var2,var5);
+var7 = string3_self_hosted_ir_oomph_73d0b0bb05; string_incref(var7);
+var8 = 205LL;
+oomph_assert(var6,var7,var8);
+var9 = ctor_List_Method__1e0ab9c757();
+var10 = string5_List__c7451df6fe; string_incref(var10);
+var11 = ir_4b1a3e0393_type_name(var3);
+var12 = oomph_string_concat(var10,var11);
+var13 = string6___e9f08d9187; string_incref(var13);
+var14 = oomph_string_concat(var12,var13);
+var15 = oomph_true;
+var16 = ctor_List_Member__7525bf27e3();
+var17 = ctor_List_Type__057f9c6088();
+var18 = ctor_GenericSource_35cfcd932e(var2,var3);
+var19 = oomph_false;
+var20 = (struct class__null___List_Type___114a421a91){ .val = { .item1 = var17 }, .membernum = 1 };
+var17 = NULL;
+var21 = (struct class__null___GenericSource__4440b6073d){ .val = { .item1 = var18 }, .membernum = 1 };
+var18 = NULL;
+var22 = ctor_BasicType_899b9c9f8e(var14,var15,var9,var16,var20,var21,var19);
+var23 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var22 }, .membernum = 1 };
+incref(var22);
+var24 = string7___contains_128d1d4f79; string_incref(var24);
+var25 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var25,var23);
+meth_List_Type__057f9c6088_push(var25,var3);
+var26 = var1->memb_BOOL;
+incref_Type_87e1ce5c5e(var26);
+var27 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var26 }, .membernum = 1 };
+var26.membernum = -1;
+var28 = ctor_FunctionType_4e16d0ea53(var25,var27);
+var29 = ctor_Method_bfbd73ad15(var24,var28);
+var30 = string8___reserve_dd3ba34da2; string_incref(var30);
+var31 = var1->memb_INT;
+incref_Type_87e1ce5c5e(var31);
+var32 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var32,var23);
+meth_List_Type__057f9c6088_push(var32,var31);
+var33 = oomph_null;
+var34 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var33 }, .membernum = 0 };
+var35 = ctor_FunctionType_4e16d0ea53(var32,var34);
+var36 = ctor_Method_bfbd73ad15(var30,var35);
+var37 = string9_delete_at_index_7df8992e1a; string_incref(var37);
+var38 = var1->memb_INT;
+incref_Type_87e1ce5c5e(var38);
+var39 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var39,var23);
+meth_List_Type__057f9c6088_push(var39,var38);
+var40 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var3 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var3);
+var41 = ctor_FunctionType_4e16d0ea53(var39,var40);
+var42 = ctor_Method_bfbd73ad15(var37,var41);
+var43 = string10_delete_first_c8ed90b920; string_incref(var43);
+var44 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var44,var23);
+meth_List_Type__057f9c6088_push(var44,var3);
+var45 = oomph_null;
+var46 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var45 }, .membernum = 0 };
+var47 = ctor_FunctionType_4e16d0ea53(var44,var46);
+var48 = ctor_Method_bfbd73ad15(var43,var47);
+var49 = string10_delete_first_c8ed90b920; string_incref(var49);
+var50 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var50,var23);
+meth_List_Type__057f9c6088_push(var50,var3);
+var51 = oomph_null;
+var52 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var51 }, .membernum = 0 };
+var53 = ctor_FunctionType_4e16d0ea53(var50,var52);
+var54 = ctor_Method_bfbd73ad15(var49,var53);
+var55 = string11_delete_only_448c9aec3d; string_incref(var55);
+var56 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var56,var23);
+meth_List_Type__057f9c6088_push(var56,var3);
+var57 = oomph_null;
+var58 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var57 }, .membernum = 0 };
+var59 = ctor_FunctionType_4e16d0ea53(var56,var58);
+var60 = ctor_Method_bfbd73ad15(var55,var59);
+var61 = string12_delete_slice_9e4f33476c; string_incref(var61);
+var62 = var1->memb_INT;
+incref_Type_87e1ce5c5e(var62);
+var63 = var1->memb_INT;
+incref_Type_87e1ce5c5e(var63);
+var64 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var64,var23);
+meth_List_Type__057f9c6088_push(var64,var62);
+meth_List_Type__057f9c6088_push(var64,var63);
+var65 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var23 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var23);
+var66 = ctor_FunctionType_4e16d0ea53(var64,var65);
+var67 = ctor_Method_bfbd73ad15(var61,var66);
+var68 = string13_ends_with_9b5b221c36; string_incref(var68);
+var69 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var69,var23);
+meth_List_Type__057f9c6088_push(var69,var23);
+var70 = var1->memb_BOOL;
+incref_Type_87e1ce5c5e(var70);
+var71 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var70 }, .membernum = 1 };
+var70.membernum = -1;
+var72 = ctor_FunctionType_4e16d0ea53(var69,var71);
+var73 = ctor_Method_bfbd73ad15(var68,var72);
+var74 = string14_equals_4f73a08080; string_incref(var74);
+var75 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var75,var23);
+meth_List_Type__057f9c6088_push(var75,var23);
+var76 = var1->memb_BOOL;
+incref_Type_87e1ce5c5e(var76);
+var77 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var76 }, .membernum = 1 };
+var76.membernum = -1;
+var78 = ctor_FunctionType_4e16d0ea53(var75,var77);
+var79 = ctor_Method_bfbd73ad15(var74,var78);
+var80 = string15_find_first_c51ec6fd4d; string_incref(var80);
+var81 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var81,var23);
+meth_List_Type__057f9c6088_push(var81,var3);
+var82 = var1->memb_INT;
+incref_Type_87e1ce5c5e(var82);
+var83 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var82 }, .membernum = 1 };
+var82.membernum = -1;
+var84 = ctor_FunctionType_4e16d0ea53(var81,var83);
+var85 = ctor_Method_bfbd73ad15(var80,var84);
+var86 = string16_find_last_9fbe0bad3b; string_incref(var86);
+var87 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var87,var23);
+meth_List_Type__057f9c6088_push(var87,var3);
+var88 = var1->memb_INT;
+incref_Type_87e1ce5c5e(var88);
+var89 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var88 }, .membernum = 1 };
+var88.membernum = -1;
+var90 = ctor_FunctionType_4e16d0ea53(var87,var89);
+var91 = ctor_Method_bfbd73ad15(var86,var90);
+var92 = string17_find_only_8d45e9dd40; string_incref(var92);
+var93 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var93,var23);
+meth_List_Type__057f9c6088_push(var93,var3);
+var94 = var1->memb_INT;
+incref_Type_87e1ce5c5e(var94);
+var95 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var94 }, .membernum = 1 };
+var94.membernum = -1;
+var96 = ctor_FunctionType_4e16d0ea53(var93,var95);
+var97 = ctor_Method_bfbd73ad15(var92,var96);
+var98 = string18_first_0054ff31c2; string_incref(var98);
+var99 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var99,var23);
+var100 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var3 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var3);
+var101 = ctor_FunctionType_4e16d0ea53(var99,var100);
+var102 = ctor_Method_bfbd73ad15(var98,var101);
+var103 = string19_get_15f63b9a2c; string_incref(var103);
+var104 = var1->memb_INT;
+incref_Type_87e1ce5c5e(var104);
+var105 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var105,var23);
+meth_List_Type__057f9c6088_push(var105,var104);
+var106 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var3 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var3);
+var107 = ctor_FunctionType_4e16d0ea53(var105,var106);
+var108 = ctor_Method_bfbd73ad15(var103,var107);
+var109 = string20_insert_5dd2e4f180; string_incref(var109);
+var110 = var1->memb_INT;
+incref_Type_87e1ce5c5e(var110);
+var111 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var111,var23);
+meth_List_Type__057f9c6088_push(var111,var110);
+meth_List_Type__057f9c6088_push(var111,var3);
+var112 = oomph_null;
+var113 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var112 }, .membernum = 0 };
+var114 = ctor_FunctionType_4e16d0ea53(var111,var113);
+var115 = ctor_Method_bfbd73ad15(var109,var114);
+var116 = string21_last_e4854f7a01; string_incref(var116);
+var117 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var117,var23);
+var118 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var3 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var3);
+var119 = ctor_FunctionType_4e16d0ea53(var117,var118);
+var120 = ctor_Method_bfbd73ad15(var116,var119);
+var121 = string22_length_4662e65518; string_incref(var121);
+var122 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var122,var23);
+var123 = var1->memb_INT;
+incref_Type_87e1ce5c5e(var123);
+var124 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var123 }, .membernum = 1 };
+var123.membernum = -1;
+var125 = ctor_FunctionType_4e16d0ea53(var122,var124);
+var126 = ctor_Method_bfbd73ad15(var121,var125);
+var127 = string23_pop_8e19017e9d; string_incref(var127);
+var128 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var128,var23);
+var129 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var3 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var3);
+var130 = ctor_FunctionType_4e16d0ea53(var128,var129);
+var131 = ctor_Method_bfbd73ad15(var127,var130);
+var132 = string24_push_bc94ad77e1; string_incref(var132);
+var133 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var133,var23);
+meth_List_Type__057f9c6088_push(var133,var3);
+var134 = oomph_null;
+var135 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var134 }, .membernum = 0 };
+var136 = ctor_FunctionType_4e16d0ea53(var133,var135);
+var137 = ctor_Method_bfbd73ad15(var132,var136);
+var138 = string25_push_all_3b521fa6fa; string_incref(var138);
+var139 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var139,var23);
+meth_List_Type__057f9c6088_push(var139,var23);
+var140 = oomph_null;
+var141 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var140 }, .membernum = 0 };
+var142 = ctor_FunctionType_4e16d0ea53(var139,var141);
+var143 = ctor_Method_bfbd73ad15(var138,var142);
+var144 = string26_reversed_1a02c3cec8; string_incref(var144);
+var145 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var145,var23);
+var146 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var23 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var23);
+var147 = ctor_FunctionType_4e16d0ea53(var145,var146);
+var148 = ctor_Method_bfbd73ad15(var144,var147);
+var149 = string27_slice_164b6b8807; string_incref(var149);
+var150 = var1->memb_INT;
+incref_Type_87e1ce5c5e(var150);
+var151 = var1->memb_INT;
+incref_Type_87e1ce5c5e(var151);
+var152 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var152,var23);
+meth_List_Type__057f9c6088_push(var152,var150);
+meth_List_Type__057f9c6088_push(var152,var151);
+var153 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var23 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var23);
+var154 = ctor_FunctionType_4e16d0ea53(var152,var153);
+var155 = ctor_Method_bfbd73ad15(var149,var154);
+var156 = string28_starts_with_43f9405f8f; string_incref(var156);
+var157 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var157,var23);
+meth_List_Type__057f9c6088_push(var157,var23);
+var158 = var1->memb_BOOL;
+incref_Type_87e1ce5c5e(var158);
+var159 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var158 }, .membernum = 1 };
+var158.membernum = -1;
+var160 = ctor_FunctionType_4e16d0ea53(var157,var159);
+var161 = ctor_Method_bfbd73ad15(var156,var160);
+var162 = string29_to_string_bf014e86f0; string_incref(var162);
+var163 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var163,var23);
+var164 = var1->memb_STR;
+incref_Type_87e1ce5c5e(var164);
+var165 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var164 }, .membernum = 1 };
+var164.membernum = -1;
+var166 = ctor_FunctionType_4e16d0ea53(var163,var165);
+var167 = ctor_Method_bfbd73ad15(var162,var166);
+var168 = string30_join_7a9c2f6a04; string_incref(var168);
+var169 = var1->memb_STR;
+incref_Type_87e1ce5c5e(var169);
+var170 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var170,var23);
+meth_List_Type__057f9c6088_push(var170,var169);
+var171 = var1->memb_STR;
+incref_Type_87e1ce5c5e(var171);
+var172 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var171 }, .membernum = 1 };
+var171.membernum = -1;
+var173 = ctor_FunctionType_4e16d0ea53(var170,var172);
+var174 = ctor_Method_bfbd73ad15(var168,var173);
+var175 = ctor_List_Method__1e0ab9c757();
+meth_List_Method__1e0ab9c757_push(var175,var29);
+meth_List_Method__1e0ab9c757_push(var175,var36);
+meth_List_Method__1e0ab9c757_push(var175,var42);
+meth_List_Method__1e0ab9c757_push(var175,var48);
+meth_List_Method__1e0ab9c757_push(var175,var54);
+meth_List_Method__1e0ab9c757_push(var175,var60);
+meth_List_Method__1e0ab9c757_push(var175,var67);
+meth_List_Method__1e0ab9c757_push(var175,var73);
+meth_List_Method__1e0ab9c757_push(var175,var79);
+meth_List_Method__1e0ab9c757_push(var175,var85);
+meth_List_Method__1e0ab9c757_push(var175,var91);
+meth_List_Method__1e0ab9c757_push(var175,var97);
+meth_List_Method__1e0ab9c757_push(var175,var102);
+meth_List_Method__1e0ab9c757_push(var175,var108);
+meth_List_Method__1e0ab9c757_push(var175,var115);
+meth_List_Method__1e0ab9c757_push(var175,var120);
+meth_List_Method__1e0ab9c757_push(var175,var126);
+meth_List_Method__1e0ab9c757_push(var175,var131);
+meth_List_Method__1e0ab9c757_push(var175,var137);
+meth_List_Method__1e0ab9c757_push(var175,var143);
+meth_List_Method__1e0ab9c757_push(var175,var148);
+meth_List_Method__1e0ab9c757_push(var175,var155);
+meth_List_Method__1e0ab9c757_push(var175,var161);
+meth_List_Method__1e0ab9c757_push(var175,var167);
+meth_List_Method__1e0ab9c757_push(var175,var174);
+meth_List_Method__1e0ab9c757_push_all(var9,var175);
+var176 = var1->memb_cleanup_list;
+incref(var176);
+meth_List_BasicType__d02960f5a1_push(var176,var22);
+var177 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var22 }, .membernum = 1 };
+var22 = NULL;
+retval = var177; var177.membernum = -1;
+goto out;
+out: (void)0;
+decref_Type_87e1ce5c5e(var177);
+decref((var176), dtor_List_BasicType__d02960f5a1);
+decref((var175), dtor_List_Method__1e0ab9c757);
+decref((var174), dtor_Method_bfbd73ad15);
+decref((var173), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var172);
+decref_Type_87e1ce5c5e(var171);
+decref((var170), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var169);
+string_decref(var168);
+decref((var167), dtor_Method_bfbd73ad15);
+decref((var166), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var165);
+decref_Type_87e1ce5c5e(var164);
+decref((var163), dtor_List_Type__057f9c6088);
+string_decref(var162);
+decref((var161), dtor_Method_bfbd73ad15);
+decref((var160), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var159);
+decref_Type_87e1ce5c5e(var158);
+decref((var157), dtor_List_Type__057f9c6088);
+string_decref(var156);
+decref((var155), dtor_Method_bfbd73ad15);
+decref((var154), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var153);
+decref((var152), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var151);
+decref_Type_87e1ce5c5e(var150);
+string_decref(var149);
+decref((var148), dtor_Method_bfbd73ad15);
+decref((var147), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var146);
+decref((var145), dtor_List_Type__057f9c6088);
+string_decref(var144);
+decref((var143), dtor_Method_bfbd73ad15);
+decref((var142), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var141);
+(void)0;
+decref((var139), dtor_List_Type__057f9c6088);
+string_decref(var138);
+decref((var137), dtor_Method_bfbd73ad15);
+decref((var136), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var135);
+(void)0;
+decref((var133), dtor_List_Type__057f9c6088);
+string_decref(var132);
+decref((var131), dtor_Method_bfbd73ad15);
+decref((var130), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var129);
+decref((var128), dtor_List_Type__057f9c6088);
+string_decref(var127);
+decref((var126), dtor_Method_bfbd73ad15);
+decref((var125), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var124);
+decref_Type_87e1ce5c5e(var123);
+decref((var122), dtor_List_Type__057f9c6088);
+string_decref(var121);
+decref((var120), dtor_Method_bfbd73ad15);
+decref((var119), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var118);
+decref((var117), dtor_List_Type__057f9c6088);
+string_decref(var116);
+decref((var115), dtor_Method_bfbd73ad15);
+decref((var114), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var113);
+(void)0;
+decref((var111), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var110);
+string_decref(var109);
+decref((var108), dtor_Method_bfbd73ad15);
+decref((var107), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var106);
+decref((var105), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var104);
+string_decref(var103);
+decref((var102), dtor_Method_bfbd73ad15);
+decref((var101), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var100);
+decref((var99), dtor_List_Type__057f9c6088);
+string_decref(var98);
+decref((var97), dtor_Method_bfbd73ad15);
+decref((var96), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var95);
+decref_Type_87e1ce5c5e(var94);
+decref((var93), dtor_List_Type__057f9c6088);
+string_decref(var92);
+decref((var91), dtor_Method_bfbd73ad15);
+decref((var90), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var89);
+decref_Type_87e1ce5c5e(var88);
+decref((var87), dtor_List_Type__057f9c6088);
+string_decref(var86);
+decref((var85), dtor_Method_bfbd73ad15);
+decref((var84), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var83);
+decref_Type_87e1ce5c5e(var82);
+decref((var81), dtor_List_Type__057f9c6088);
+string_decref(var80);
+decref((var79), dtor_Method_bfbd73ad15);
+decref((var78), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var77);
+decref_Type_87e1ce5c5e(var76);
+decref((var75), dtor_List_Type__057f9c6088);
+string_decref(var74);
+decref((var73), dtor_Method_bfbd73ad15);
+decref((var72), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var71);
+decref_Type_87e1ce5c5e(var70);
+decref((var69), dtor_List_Type__057f9c6088);
+string_decref(var68);
+decref((var67), dtor_Method_bfbd73ad15);
+decref((var66), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var65);
+decref((var64), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var63);
+decref_Type_87e1ce5c5e(var62);
+string_decref(var61);
+decref((var60), dtor_Method_bfbd73ad15);
+decref((var59), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var58);
+(void)0;
+decref((var56), dtor_List_Type__057f9c6088);
+string_decref(var55);
+decref((var54), dtor_Method_bfbd73ad15);
+decref((var53), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var52);
+(void)0;
+decref((var50), dtor_List_Type__057f9c6088);
+string_decref(var49);
+decref((var48), dtor_Method_bfbd73ad15);
+decref((var47), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var46);
+(void)0;
+decref((var44), dtor_List_Type__057f9c6088);
+string_decref(var43);
+decref((var42), dtor_Method_bfbd73ad15);
+decref((var41), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var40);
+decref((var39), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var38);
+string_decref(var37);
+decref((var36), dtor_Method_bfbd73ad15);
+decref((var35), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var34);
+(void)0;
+decref((var32), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var31);
+string_decref(var30);
+decref((var29), dtor_Method_bfbd73ad15);
+decref((var28), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var27);
+decref_Type_87e1ce5c5e(var26);
+decref((var25), dtor_List_Type__057f9c6088);
+string_decref(var24);
+decref_Type_87e1ce5c5e(var23);
+decref((var22), dtor_BasicType_899b9c9f8e);
+decref__null___GenericSource__4440b6073d(var21);
+decref__null___List_Type___114a421a91(var20);
+(void)0;
+decref((var18), dtor_GenericSource_35cfcd932e);
+decref((var17), dtor_List_Type__057f9c6088);
+decref((var16), dtor_List_Member__7525bf27e3);
+(void)0;
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+string_decref(var10);
+decref((var9), dtor_List_Method__1e0ab9c757);
+(void)0;
+string_decref(var7);
+(void)0;
+decref((var5), dtor_Generic_c39b95ec73);
+decref((var4), dtor_GenericSource_35cfcd932e);
+return retval;
+}
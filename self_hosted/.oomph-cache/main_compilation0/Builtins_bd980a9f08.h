@@ -0,0 +1,148 @@
+
+                #ifndef HEADER_GUARD_Builtins_bd980a9f08
+                #define HEADER_GUARD_Builtins_bd980a9f08
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+#include "_null___GenericSource__4440b6073d.h"
+#include "_null___List_Type___114a421a91.h"
+#include "_null___Type__8438ac3dcf.h"
+#include "ir_4b1a3e0393.h"
+struct class_Generic_c39b95ec73;
+struct class_List_BuiltinVariable__27288a8fae;
+struct class_List_BuiltinVariable__27288a8fae;
+struct class_List_BasicType__d02960f5a1;
+struct class_Generic_c39b95ec73;
+struct class_List_BuiltinVariable__27288a8fae;
+struct class_List_BuiltinVariable__27288a8fae;
+struct class_List_BasicType__d02960f5a1;
+struct class_List_BasicType__d02960f5a1;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Member__7525bf27e3;
+struct class_List_Member__7525bf27e3;
+struct class_List_BuiltinVariable__27288a8fae;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_BuiltinVariable__27288a8fae;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_GenericSource_35cfcd932e;
+struct class_Generic_c39b95ec73;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Member__7525bf27e3;
+struct class_List_Type__057f9c6088;
+struct class_GenericSource_35cfcd932e;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Method__1e0ab9c757;
+struct class_List_BasicType__d02960f5a1;
+struct class_Generic_c39b95ec73;
+
+            struct class_Builtins_bd980a9f08 {
+                REFCOUNT_HEADER
+                struct class_Type_87e1ce5c5e memb_BOOL;
+struct class_Type_87e1ce5c5e memb_FLOAT;
+struct class_Type_87e1ce5c5e memb_INT;
+struct class_Type_87e1ce5c5e memb_NULL_TYPE;
+struct class_Type_87e1ce5c5e memb_STR;
+struct class_Generic_c39b95ec73* memb_LIST;
+struct class_List_BuiltinVariable__27288a8fae* memb_visible_vars;
+struct class_List_BuiltinVariable__27288a8fae* memb_hidden_vars;
+struct class_List_BasicType__d02960f5a1* memb_cleanup_list;
+
+            };
+            
+            struct class_Builtins_bd980a9f08* ctor_Builtins_bd980a9f08(struct class_Type_87e1ce5c5e arg_BOOL,struct class_Type_87e1ce5c5e arg_FLOAT,struct class_Type_87e1ce5c5e arg_INT,struct class_Type_87e1ce5c5e arg_NULL_TYPE,struct class_Type_87e1ce5c5e arg_STR,struct class_Generic_c39b95ec73* arg_LIST,struct class_List_BuiltinVariable__27288a8fae* arg_visible_vars,struct class_List_BuiltinVariable__27288a8fae* arg_hidden_vars,struct class_List_BasicType__d02960f5a1* arg_cleanup_list);
+            void dtor_Builtins_bd980a9f08(void *ptr);
+            
+                struct class_Str meth_Builtins_bd980a9f08_to_string(struct class_Builtins_bd980a9f08* obj);
+                bool meth_Builtins_bd980a9f08_equals(struct class_Builtins_bd980a9f08* var1, struct class_Builtins_bd980a9f08* var2);
+void meth_Builtins_bd980a9f08_destroy(struct class_Builtins_bd980a9f08* var1);
+struct class_BuiltinVariable_f6e0cdd1b6* meth_Builtins_bd980a9f08_get_visible_var(struct class_Builtins_bd980a9f08* var1, struct class_Str var2);
+struct class_BuiltinVariable_f6e0cdd1b6* meth_Builtins_bd980a9f08_get_hidden_var(struct class_Builtins_bd980a9f08* var1, struct class_Str var2);
+struct class_List_Type__057f9c6088* meth_Builtins_bd980a9f08_get_builtin_types(struct class_Builtins_bd980a9f08* var1);
+struct class_Type_87e1ce5c5e meth_Builtins_bd980a9f08_generic2type(struct class_Builtins_bd980a9f08* var1, struct class_Generic_c39b95ec73* var2, struct class_Type_87e1ce5c5e var3);
+
+                #endif
+                
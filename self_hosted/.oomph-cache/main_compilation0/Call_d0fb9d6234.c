@@ -0,0 +1,73 @@
+#include <lib/oomph.h>
+#include "Call_d0fb9d6234.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "List_Expression__d162784c9e.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_Call_6cb0e4b38c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x61', '\x6c', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Call_6cb0e4b38c = {
+                .buf = &string0_Call_6cb0e4b38c_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            struct class_Call_d0fb9d6234* ctor_Call_d0fb9d6234(struct class_Location_500c4434c9* arg_location,struct class_Expression_35f2052bf4 arg_function,struct class_List_Expression__d162784c9e* arg_args)
+            {
+                struct class_Call_d0fb9d6234* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_function = arg_function;
+obj->memb_args = arg_args;
+
+                incref(arg_location);
+incref_Expression_35f2052bf4(arg_function);
+incref(arg_args);
+
+                return obj;
+            }
+
+            void dtor_Call_d0fb9d6234(void *ptr)
+            {
+                struct class_Call_d0fb9d6234 *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+decref_Expression_35f2052bf4(obj->memb_function);
+decref((obj->memb_args), dtor_List_Expression__d162784c9e);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Call_d0fb9d6234_to_string(struct class_Call_d0fb9d6234* self)
+                {
+                    struct class_Str res = string0_Call_6cb0e4b38c;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_35f2052bf4_to_string(self->memb_function);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Expression__d162784c9e_to_string(self->memb_args);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Call_d0fb9d6234_equals(struct class_Call_d0fb9d6234* var1, struct class_Call_d0fb9d6234* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
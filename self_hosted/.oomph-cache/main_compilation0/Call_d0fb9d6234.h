@@ -0,0 +1,27 @@
+
+                #ifndef HEADER_GUARD_Call_d0fb9d6234
+                #define HEADER_GUARD_Call_d0fb9d6234
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+struct class_Location_500c4434c9;
+struct class_List_Expression__d162784c9e;
+struct class_Location_500c4434c9;
+struct class_List_Expression__d162784c9e;
+
+            struct class_Call_d0fb9d6234 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Expression_35f2052bf4 memb_function;
+struct class_List_Expression__d162784c9e* memb_args;
+
+            };
+            
+            struct class_Call_d0fb9d6234* ctor_Call_d0fb9d6234(struct class_Location_500c4434c9* arg_location,struct class_Expression_35f2052bf4 arg_function,struct class_List_Expression__d162784c9e* arg_args);
+            void dtor_Call_d0fb9d6234(void *ptr);
+            
+                struct class_Str meth_Call_d0fb9d6234_to_string(struct class_Call_d0fb9d6234* obj);
+                bool meth_Call_d0fb9d6234_equals(struct class_Call_d0fb9d6234* var1, struct class_Call_d0fb9d6234* var2);
+
+                #endif
+                
@@ -0,0 +1,73 @@
+#include <lib/oomph.h>
+#include "Case_458b8eeee1.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Statement__5d7503c104.h"
+#include "Location_500c4434c9.h"
+#include "_null___TypeAndName__d7958d7e85.h"
+
+            static struct StringBuf string0_Case_58c0679380_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x61', '\x73', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Case_58c0679380 = {
+                .buf = &string0_Case_58c0679380_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            struct class_Case_458b8eeee1* ctor_Case_458b8eeee1(struct class_Location_500c4434c9* arg_location,struct class__null___TypeAndName__d7958d7e85 arg_type_and_name,struct class_List_Statement__5d7503c104* arg_body)
+            {
+                struct class_Case_458b8eeee1* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_type_and_name = arg_type_and_name;
+obj->memb_body = arg_body;
+
+                incref(arg_location);
+incref__null___TypeAndName__d7958d7e85(arg_type_and_name);
+incref(arg_body);
+
+                return obj;
+            }
+
+            void dtor_Case_458b8eeee1(void *ptr)
+            {
+                struct class_Case_458b8eeee1 *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+decref__null___TypeAndName__d7958d7e85(obj->memb_type_and_name);
+decref((obj->memb_body), dtor_List_Statement__5d7503c104);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Case_458b8eeee1_to_string(struct class_Case_458b8eeee1* self)
+                {
+                    struct class_Str res = string0_Case_58c0679380;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__null___TypeAndName__d7958d7e85_to_string(self->memb_type_and_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Statement__5d7503c104_to_string(self->memb_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Case_458b8eeee1_equals(struct class_Case_458b8eeee1* var1, struct class_Case_458b8eeee1* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
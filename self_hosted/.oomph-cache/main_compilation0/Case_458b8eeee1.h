@@ -0,0 +1,27 @@
+
+                #ifndef HEADER_GUARD_Case_458b8eeee1
+                #define HEADER_GUARD_Case_458b8eeee1
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___TypeAndName__d7958d7e85.h"
+struct class_Location_500c4434c9;
+struct class_List_Statement__5d7503c104;
+struct class_Location_500c4434c9;
+struct class_List_Statement__5d7503c104;
+
+            struct class_Case_458b8eeee1 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class__null___TypeAndName__d7958d7e85 memb_type_and_name;
+struct class_List_Statement__5d7503c104* memb_body;
+
+            };
+            
+            struct class_Case_458b8eeee1* ctor_Case_458b8eeee1(struct class_Location_500c4434c9* arg_location,struct class__null___TypeAndName__d7958d7e85 arg_type_and_name,struct class_List_Statement__5d7503c104* arg_body);
+            void dtor_Case_458b8eeee1(void *ptr);
+            
+                struct class_Str meth_Case_458b8eeee1_to_string(struct class_Case_458b8eeee1* obj);
+                bool meth_Case_458b8eeee1_equals(struct class_Case_458b8eeee1* var1, struct class_Case_458b8eeee1* var2);
+
+                #endif
+                
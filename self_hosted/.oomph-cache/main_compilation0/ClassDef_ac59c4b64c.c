@@ -0,0 +1,80 @@
+#include <lib/oomph.h>
+#include "ClassDef_ac59c4b64c.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_FuncOrMethodDef__af5379b09e.h"
+#include "List_TypeAndName__74be4dae93.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_ClassDef_10f42cca10_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6c', '\x61', '\x73', '\x73', '\x44', '\x65', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string0_ClassDef_10f42cca10 = {
+                .buf = &string0_ClassDef_10f42cca10_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            struct class_ClassDef_ac59c4b64c* ctor_ClassDef_ac59c4b64c(struct class_Location_500c4434c9* arg_location,struct class_Str arg_name,struct class_List_TypeAndName__74be4dae93* arg_members,struct class_List_FuncOrMethodDef__af5379b09e* arg_body)
+            {
+                struct class_ClassDef_ac59c4b64c* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+obj->memb_members = arg_members;
+obj->memb_body = arg_body;
+
+                incref(arg_location);
+string_incref(arg_name);
+incref(arg_members);
+incref(arg_body);
+
+                return obj;
+            }
+
+            void dtor_ClassDef_ac59c4b64c(void *ptr)
+            {
+                struct class_ClassDef_ac59c4b64c *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+string_decref(obj->memb_name);
+decref((obj->memb_members), dtor_List_TypeAndName__74be4dae93);
+decref((obj->memb_body), dtor_List_FuncOrMethodDef__af5379b09e);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_ClassDef_ac59c4b64c_to_string(struct class_ClassDef_ac59c4b64c* self)
+                {
+                    struct class_Str res = string0_ClassDef_10f42cca10;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_TypeAndName__74be4dae93_to_string(self->memb_members);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_FuncOrMethodDef__af5379b09e_to_string(self->memb_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_ClassDef_ac59c4b64c_equals(struct class_ClassDef_ac59c4b64c* var1, struct class_ClassDef_ac59c4b64c* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,29 @@
+
+                #ifndef HEADER_GUARD_ClassDef_ac59c4b64c
+                #define HEADER_GUARD_ClassDef_ac59c4b64c
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_500c4434c9;
+struct class_List_TypeAndName__74be4dae93;
+struct class_List_FuncOrMethodDef__af5379b09e;
+struct class_Location_500c4434c9;
+struct class_List_TypeAndName__74be4dae93;
+struct class_List_FuncOrMethodDef__af5379b09e;
+
+            struct class_ClassDef_ac59c4b64c {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Str memb_name;
+struct class_List_TypeAndName__74be4dae93* memb_members;
+struct class_List_FuncOrMethodDef__af5379b09e* memb_body;
+
+            };
+            
+            struct class_ClassDef_ac59c4b64c* ctor_ClassDef_ac59c4b64c(struct class_Location_500c4434c9* arg_location,struct class_Str arg_name,struct class_List_TypeAndName__74be4dae93* arg_members,struct class_List_FuncOrMethodDef__af5379b09e* arg_body);
+            void dtor_ClassDef_ac59c4b64c(void *ptr);
+            
+                struct class_Str meth_ClassDef_ac59c4b64c_to_string(struct class_ClassDef_ac59c4b64c* obj);
+                bool meth_ClassDef_ac59c4b64c_equals(struct class_ClassDef_ac59c4b64c* var1, struct class_ClassDef_ac59c4b64c* var2);
+
+                #endif
+                
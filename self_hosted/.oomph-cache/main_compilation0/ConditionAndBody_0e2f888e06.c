@@ -0,0 +1,73 @@
+#include <lib/oomph.h>
+#include "ConditionAndBody_0e2f888e06.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "List_Statement__5d7503c104.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_ConditionAndBody_f0fd68fa6d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6f', '\x6e', '\x64', '\x69', '\x74', '\x69', '\x6f', '\x6e', '\x41', '\x6e', '\x64', '\x42', '\x6f', '\x64', '\x79' },
+                .malloced = false,
+            };
+            static struct class_Str string0_ConditionAndBody_f0fd68fa6d = {
+                .buf = &string0_ConditionAndBody_f0fd68fa6d_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            struct class_ConditionAndBody_0e2f888e06* ctor_ConditionAndBody_0e2f888e06(struct class_Location_500c4434c9* arg_location,struct class_Expression_35f2052bf4 arg_cond,struct class_List_Statement__5d7503c104* arg_body)
+            {
+                struct class_ConditionAndBody_0e2f888e06* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_cond = arg_cond;
+obj->memb_body = arg_body;
+
+                incref(arg_location);
+incref_Expression_35f2052bf4(arg_cond);
+incref(arg_body);
+
+                return obj;
+            }
+
+            void dtor_ConditionAndBody_0e2f888e06(void *ptr)
+            {
+                struct class_ConditionAndBody_0e2f888e06 *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+decref_Expression_35f2052bf4(obj->memb_cond);
+decref((obj->memb_body), dtor_List_Statement__5d7503c104);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_ConditionAndBody_0e2f888e06_to_string(struct class_ConditionAndBody_0e2f888e06* self)
+                {
+                    struct class_Str res = string0_ConditionAndBody_f0fd68fa6d;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_35f2052bf4_to_string(self->memb_cond);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Statement__5d7503c104_to_string(self->memb_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_ConditionAndBody_0e2f888e06_equals(struct class_ConditionAndBody_0e2f888e06* var1, struct class_ConditionAndBody_0e2f888e06* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,27 @@
+
+                #ifndef HEADER_GUARD_ConditionAndBody_0e2f888e06
+                #define HEADER_GUARD_ConditionAndBody_0e2f888e06
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+struct class_Location_500c4434c9;
+struct class_List_Statement__5d7503c104;
+struct class_Location_500c4434c9;
+struct class_List_Statement__5d7503c104;
+
+            struct class_ConditionAndBody_0e2f888e06 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Expression_35f2052bf4 memb_cond;
+struct class_List_Statement__5d7503c104* memb_body;
+
+            };
+            
+            struct class_ConditionAndBody_0e2f888e06* ctor_ConditionAndBody_0e2f888e06(struct class_Location_500c4434c9* arg_location,struct class_Expression_35f2052bf4 arg_cond,struct class_List_Statement__5d7503c104* arg_body);
+            void dtor_ConditionAndBody_0e2f888e06(void *ptr);
+            
+                struct class_Str meth_ConditionAndBody_0e2f888e06_to_string(struct class_ConditionAndBody_0e2f888e06* obj);
+                bool meth_ConditionAndBody_0e2f888e06_equals(struct class_ConditionAndBody_0e2f888e06* var1, struct class_ConditionAndBody_0e2f888e06* var2);
+
+                #endif
+                
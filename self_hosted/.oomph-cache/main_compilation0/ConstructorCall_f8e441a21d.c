@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "ConstructorCall_f8e441a21d.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_LocalVariable__81e23234f3.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf string0_ConstructorCall_12b4440410_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x6f', '\x72', '\x43', '\x61', '\x6c', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_ConstructorCall_12b4440410 = {
+                .buf = &string0_ConstructorCall_12b4440410_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            struct class_ConstructorCall_f8e441a21d* ctor_ConstructorCall_f8e441a21d(struct class_LocalVariable_846080e5ae* arg_result,struct class_List_LocalVariable__81e23234f3* arg_args)
+            {
+                struct class_ConstructorCall_f8e441a21d* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_result = arg_result;
+obj->memb_args = arg_args;
+
+                incref(arg_result);
+incref(arg_args);
+
+                return obj;
+            }
+
+            void dtor_ConstructorCall_f8e441a21d(void *ptr)
+            {
+                struct class_ConstructorCall_f8e441a21d *obj = ptr;
+                decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_args), dtor_List_LocalVariable__81e23234f3);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_ConstructorCall_f8e441a21d_to_string(struct class_ConstructorCall_f8e441a21d* self)
+                {
+                    struct class_Str res = string0_ConstructorCall_12b4440410;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_result);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_LocalVariable__81e23234f3_to_string(self->memb_args);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_ConstructorCall_f8e441a21d_equals(struct class_ConstructorCall_f8e441a21d* var1, struct class_ConstructorCall_f8e441a21d* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
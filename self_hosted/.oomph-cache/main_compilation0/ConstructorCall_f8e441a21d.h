@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_ConstructorCall_f8e441a21d
+                #define HEADER_GUARD_ConstructorCall_f8e441a21d
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+
+            struct class_ConstructorCall_f8e441a21d {
+                REFCOUNT_HEADER
+                struct class_LocalVariable_846080e5ae* memb_result;
+struct class_List_LocalVariable__81e23234f3* memb_args;
+
+            };
+            
+            struct class_ConstructorCall_f8e441a21d* ctor_ConstructorCall_f8e441a21d(struct class_LocalVariable_846080e5ae* arg_result,struct class_List_LocalVariable__81e23234f3* arg_args);
+            void dtor_ConstructorCall_f8e441a21d(void *ptr);
+            
+                struct class_Str meth_ConstructorCall_f8e441a21d_to_string(struct class_ConstructorCall_f8e441a21d* obj);
+                bool meth_ConstructorCall_f8e441a21d_equals(struct class_ConstructorCall_f8e441a21d* var1, struct class_ConstructorCall_f8e441a21d* var2);
+
+                #endif
+                
@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "Constructor_0c896e4031.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_500c4434c9.h"
+#include "Type_e6cf7dd4e5.h"
+
+            static struct StringBuf string0_Constructor_c6c3967c8b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x6f', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Constructor_c6c3967c8b = {
+                .buf = &string0_Constructor_c6c3967c8b_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            struct class_Constructor_0c896e4031* ctor_Constructor_0c896e4031(struct class_Location_500c4434c9* arg_location,struct class_Type_e6cf7dd4e5 arg_type)
+            {
+                struct class_Constructor_0c896e4031* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_type = arg_type;
+
+                incref(arg_location);
+incref_Type_e6cf7dd4e5(arg_type);
+
+                return obj;
+            }
+
+            void dtor_Constructor_0c896e4031(void *ptr)
+            {
+                struct class_Constructor_0c896e4031 *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+decref_Type_e6cf7dd4e5(obj->memb_type);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Constructor_0c896e4031_to_string(struct class_Constructor_0c896e4031* self)
+                {
+                    struct class_Str res = string0_Constructor_c6c3967c8b;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_e6cf7dd4e5_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Constructor_0c896e4031_equals(struct class_Constructor_0c896e4031* var1, struct class_Constructor_0c896e4031* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,24 @@
+
+                #ifndef HEADER_GUARD_Constructor_0c896e4031
+                #define HEADER_GUARD_Constructor_0c896e4031
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_e6cf7dd4e5.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_Constructor_0c896e4031 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Type_e6cf7dd4e5 memb_type;
+
+            };
+            
+            struct class_Constructor_0c896e4031* ctor_Constructor_0c896e4031(struct class_Location_500c4434c9* arg_location,struct class_Type_e6cf7dd4e5 arg_type);
+            void dtor_Constructor_0c896e4031(void *ptr);
+            
+                struct class_Str meth_Constructor_0c896e4031_to_string(struct class_Constructor_0c896e4031* obj);
+                bool meth_Constructor_0c896e4031_equals(struct class_Constructor_0c896e4031* var1, struct class_Constructor_0c896e4031* var2);
+
+                #endif
+                
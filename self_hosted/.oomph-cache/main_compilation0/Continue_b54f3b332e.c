@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "Continue_b54f3b332e.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_Continue_c4ab3878f2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6f', '\x6e', '\x74', '\x69', '\x6e', '\x75', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Continue_c4ab3878f2 = {
+                .buf = &string0_Continue_c4ab3878f2_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            struct class_Continue_b54f3b332e* ctor_Continue_b54f3b332e(struct class_Location_500c4434c9* arg_location)
+            {
+                struct class_Continue_b54f3b332e* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+
+                incref(arg_location);
+
+                return obj;
+            }
+
+            void dtor_Continue_b54f3b332e(void *ptr)
+            {
+                struct class_Continue_b54f3b332e *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Continue_b54f3b332e_to_string(struct class_Continue_b54f3b332e* self)
+                {
+                    struct class_Str res = string0_Continue_c4ab3878f2;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Continue_b54f3b332e_equals(struct class_Continue_b54f3b332e* var1, struct class_Continue_b54f3b332e* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
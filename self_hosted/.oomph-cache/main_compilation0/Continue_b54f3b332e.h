@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_Continue_b54f3b332e
+                #define HEADER_GUARD_Continue_b54f3b332e
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_Continue_b54f3b332e {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+
+            };
+            
+            struct class_Continue_b54f3b332e* ctor_Continue_b54f3b332e(struct class_Location_500c4434c9* arg_location);
+            void dtor_Continue_b54f3b332e(void *ptr);
+            
+                struct class_Str meth_Continue_b54f3b332e_to_string(struct class_Continue_b54f3b332e* obj);
+                bool meth_Continue_b54f3b332e_equals(struct class_Continue_b54f3b332e* var1, struct class_Continue_b54f3b332e* var2);
+
+                #endif
+                
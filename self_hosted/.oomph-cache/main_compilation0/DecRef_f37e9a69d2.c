@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "DecRef_f37e9a69d2.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf string0_DecRef_c52a098d88_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x44', '\x65', '\x63', '\x52', '\x65', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string0_DecRef_c52a098d88 = {
+                .buf = &string0_DecRef_c52a098d88_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_DecRef_f37e9a69d2* ctor_DecRef_f37e9a69d2(struct class_LocalVariable_846080e5ae* arg_var)
+            {
+                struct class_DecRef_f37e9a69d2* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_var = arg_var;
+
+                incref(arg_var);
+
+                return obj;
+            }
+
+            void dtor_DecRef_f37e9a69d2(void *ptr)
+            {
+                struct class_DecRef_f37e9a69d2 *obj = ptr;
+                decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_DecRef_f37e9a69d2_to_string(struct class_DecRef_f37e9a69d2* self)
+                {
+                    struct class_Str res = string0_DecRef_c52a098d88;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_DecRef_f37e9a69d2_equals(struct class_DecRef_f37e9a69d2* var1, struct class_DecRef_f37e9a69d2* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_DecRef_f37e9a69d2
+                #define HEADER_GUARD_DecRef_f37e9a69d2
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+
+            struct class_DecRef_f37e9a69d2 {
+                REFCOUNT_HEADER
+                struct class_LocalVariable_846080e5ae* memb_var;
+
+            };
+            
+            struct class_DecRef_f37e9a69d2* ctor_DecRef_f37e9a69d2(struct class_LocalVariable_846080e5ae* arg_var);
+            void dtor_DecRef_f37e9a69d2(void *ptr);
+            
+                struct class_Str meth_DecRef_f37e9a69d2_to_string(struct class_DecRef_f37e9a69d2* obj);
+                bool meth_DecRef_f37e9a69d2_equals(struct class_DecRef_f37e9a69d2* var1, struct class_DecRef_f37e9a69d2* var2);
+
+                #endif
+                
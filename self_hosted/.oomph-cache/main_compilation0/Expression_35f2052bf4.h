@@ -0,0 +1,49 @@
+
+                #ifndef HEADER_GUARD_Expression_35f2052bf4
+                #define HEADER_GUARD_Expression_35f2052bf4
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_As_a05f1f16b6;
+struct class_BinaryOperator_e25f87d1b5;
+struct class_Call_d0fb9d6234;
+struct class_Constructor_0c896e4031;
+struct class_FloatConstant_4759845694;
+struct class_GetAttribute_0758070446;
+struct class_GetVar_642f116a6c;
+struct class_IntConstant_4cbc4c5420;
+struct class_ListComprehension_10c913d2dd;
+struct class_ListLiteral_66e426dc17;
+struct class_StatementsAndExpression_964cbccc5e;
+struct class_StringConstant_c2b1c10b4f;
+struct class_StringFormatJoin_bc28806767;
+struct class_UnaryOperator_348525ebbe;
+
+            struct class_Expression_35f2052bf4 {
+                union {
+                    	struct class_As_a05f1f16b6* item0;
+	struct class_BinaryOperator_e25f87d1b5* item1;
+	struct class_Call_d0fb9d6234* item2;
+	struct class_Constructor_0c896e4031* item3;
+	struct class_FloatConstant_4759845694* item4;
+	struct class_GetAttribute_0758070446* item5;
+	struct class_GetVar_642f116a6c* item6;
+	struct class_IntConstant_4cbc4c5420* item7;
+	struct class_ListComprehension_10c913d2dd* item8;
+	struct class_ListLiteral_66e426dc17* item9;
+	struct class_StatementsAndExpression_964cbccc5e* item10;
+	struct class_StringConstant_c2b1c10b4f* item11;
+	struct class_StringFormatJoin_bc28806767* item12;
+	struct class_UnaryOperator_348525ebbe* item13;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_Expression_35f2052bf4_to_string(struct class_Expression_35f2052bf4 obj);
+            bool meth_Expression_35f2052bf4_equals(struct class_Expression_35f2052bf4 a, struct class_Expression_35f2052bf4 b);
+            
+            void incref_Expression_35f2052bf4(struct class_Expression_35f2052bf4 obj);
+            void decref_Expression_35f2052bf4(struct class_Expression_35f2052bf4 obj);
+            
+                #endif
+                
@@ -0,0 +1,3030 @@
+#include <lib/oomph.h>
+#include "FileConverter_c79636dcc7.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "AutoType_39f5d793d6.h"
+#include "BasicType_899b9c9f8e.h"
+#include "Builtins_bd980a9f08.h"
+#include "ClassDef_ac59c4b64c.h"
+#include "FileVariable_a7b8ca651f.h"
+#include "FuncDef_2bd6886a53.h"
+#include "FuncOrMethodDef_533c7b75ab.h"
+#include "FunctionOrMethodConverter_14d05c56fc.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "GenericType_f44d8197cb.h"
+#include "Generic_c39b95ec73.h"
+#include "Import_6056d7e9c9.h"
+#include "IncRef_54322428a7.h"
+#include "Instruction_b0fafb4d55.h"
+#include "List_AutoTypeNode__28b2c8eb14.h"
+#include "List_BasicType__d02960f5a1.h"
+#include "List_FuncOrMethodDef__af5379b09e.h"
+#include "List_Instruction__6e475c861a.h"
+#include "List_List_Instruction___d2e1d3bdd4.h"
+#include "List_LocalVariable__81e23234f3.h"
+#include "List_LoopLabels__74a48e6cc9.h"
+#include "List_Member__7525bf27e3.h"
+#include "List_Method__1e0ab9c757.h"
+#include "List_NamedAstType__23f1f6ad88.h"
+#include "List_NamedGeneric__fd1333dbd0.h"
+#include "List_NamedType__d1143722a6.h"
+#include "List_NamedVariable__2ad9e9e312.h"
+#include "List_Statement__5d7503c104.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Symbol__9a01330177.h"
+#include "List_ToplevelDeclaration__35f88ef566.h"
+#include "List_TypeAndName__74be4dae93.h"
+#include "List_Type__057f9c6088.h"
+#include "List_Type__b06c7a2bb6.h"
+#include "LocalVariable_846080e5ae.h"
+#include "Location_500c4434c9.h"
+#include "Member_a3dd2b1b39.h"
+#include "MethodDef_28b65923b5.h"
+#include "Method_bfbd73ad15.h"
+#include "NamedAstType_601829e0d0.h"
+#include "NamedGeneric_b3d994eaa0.h"
+#include "NamedType_0d620e38a7.h"
+#include "NamedType_fe3e45e722.h"
+#include "NamedVariable_ac0761c28d.h"
+#include "Statement_1dc2e7090f.h"
+#include "SymbolValue_b2eed984e4.h"
+#include "Symbol_037dd39afd.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "ToplevelDeclaration_5505a52ad0.h"
+#include "TypeAndName_fec99b5f94.h"
+#include "TypeDef_44471836ba.h"
+#include "Type_87e1ce5c5e.h"
+#include "Type_e6cf7dd4e5.h"
+#include "UnionType_0c977b4168.h"
+#include "UnionType_7f899bced1.h"
+#include "VarCpy_e77a538911.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_null___BasicType__3303ac43c9.h"
+#include "_null___FunctionOrMethodConverter__7dc768c0a0.h"
+#include "_null___GenericSource__4440b6073d.h"
+#include "_null___List_Type___114a421a91.h"
+#include "_null___Location__87aaae6467.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "_null___Type__7de1ddce50.h"
+#include "_null___Type__8438ac3dcf.h"
+#include "ast2ir_d819fcc31b.h"
+#include "ast_91af7cbb25.h"
+#include "ir_4b1a3e0393.h"
+
+            static struct StringBuf string0_FileConverter_08b9f78b9c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x69', '\x6c', '\x65', '\x43', '\x6f', '\x6e', '\x76', '\x65', '\x72', '\x74', '\x65', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_FileConverter_08b9f78b9c = {
+                .buf = &string0_FileConverter_08b9f78b9c_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_self_hosted_ast2ir_oomph_9b4ddfeec7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x61', '\x73', '\x74', '\x32', '\x69', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string1_self_hosted_ast2ir_oomph_9b4ddfeec7 = {
+                .buf = &string1_self_hosted_ast2ir_oomph_9b4ddfeec7_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_no_type_named___427c5c8f30_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x6f', '\x20', '\x74', '\x79', '\x70', '\x65', '\x20', '\x6e', '\x61', '\x6d', '\x65', '\x64', '\x20', '\x27' },
+                .malloced = false,
+            };
+            static struct class_Str string2_no_type_named___427c5c8f30 = {
+                .buf = &string2_no_type_named___427c5c8f30_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3___2e0e983d7b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27' },
+                .malloced = false,
+            };
+            static struct class_Str string3___2e0e983d7b = {
+                .buf = &string3___2e0e983d7b_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_can_t_use_auto_type_here_97e5be7b27_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x61', '\x6e', '\x27', '\x74', '\x20', '\x75', '\x73', '\x65', '\x20', '\x61', '\x75', '\x74', '\x6f', '\x20', '\x74', '\x79', '\x70', '\x65', '\x20', '\x68', '\x65', '\x72', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string4_can_t_use_auto_type_here_97e5be7b27 = {
+                .buf = &string4_can_t_use_auto_type_here_97e5be7b27_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_no_generic_type_named__21bf437027_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x6f', '\x20', '\x67', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x20', '\x74', '\x79', '\x70', '\x65', '\x20', '\x6e', '\x61', '\x6d', '\x65', '\x64', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string5_no_generic_type_named__21bf437027 = {
+                .buf = &string5_no_generic_type_named__21bf437027_buf,
+                .nbytes = 22,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6_type___cc9dd12cb4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x79', '\x70', '\x65', '\x20', '\x27' },
+                .malloced = false,
+            };
+            static struct class_Str string6_type___cc9dd12cb4 = {
+                .buf = &string6_type___cc9dd12cb4_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7___already_exists_df1deb8ffd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x20', '\x61', '\x6c', '\x72', '\x65', '\x61', '\x64', '\x79', '\x20', '\x65', '\x78', '\x69', '\x73', '\x74', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string7___already_exists_df1deb8ffd = {
+                .buf = &string7___already_exists_df1deb8ffd_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string8____a789be8914_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string8____a789be8914 = {
+                .buf = &string8____a789be8914_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string9_to_string_0c1dadc6d5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string9_to_string_0c1dadc6d5 = {
+                .buf = &string9_to_string_0c1dadc6d5_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string10_equals_d07c59c1ca_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x71', '\x75', '\x61', '\x6c', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string10_equals_d07c59c1ca = {
+                .buf = &string10_equals_d07c59c1ca_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string11_self_87e957c1c5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string11_self_87e957c1c5 = {
+                .buf = &string11_self_87e957c1c5_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            struct class_FileConverter_c79636dcc7* ctor_FileConverter_c79636dcc7(struct class_Builtins_bd980a9f08* arg_builtins,struct class_Str arg_path,struct class_List_Symbol__9a01330177* arg_symbols,struct class_List_NamedType__d1143722a6* arg_types,struct class_List_NamedGeneric__fd1333dbd0* arg_generics,struct class_List_NamedVariable__2ad9e9e312* arg_variables,struct class_List_NamedAstType__23f1f6ad88* arg_typedef_laziness)
+            {
+                struct class_FileConverter_c79636dcc7* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_builtins = arg_builtins;
+obj->memb_path = arg_path;
+obj->memb_symbols = arg_symbols;
+obj->memb_types = arg_types;
+obj->memb_generics = arg_generics;
+obj->memb_variables = arg_variables;
+obj->memb_typedef_laziness = arg_typedef_laziness;
+
+                incref(arg_builtins);
+string_incref(arg_path);
+incref(arg_symbols);
+incref(arg_types);
+incref(arg_generics);
+incref(arg_variables);
+incref(arg_typedef_laziness);
+
+                return obj;
+            }
+
+            void dtor_FileConverter_c79636dcc7(void *ptr)
+            {
+                struct class_FileConverter_c79636dcc7 *obj = ptr;
+                decref((obj->memb_builtins), dtor_Builtins_bd980a9f08);
+string_decref(obj->memb_path);
+decref((obj->memb_symbols), dtor_List_Symbol__9a01330177);
+decref((obj->memb_types), dtor_List_NamedType__d1143722a6);
+decref((obj->memb_generics), dtor_List_NamedGeneric__fd1333dbd0);
+decref((obj->memb_variables), dtor_List_NamedVariable__2ad9e9e312);
+decref((obj->memb_typedef_laziness), dtor_List_NamedAstType__23f1f6ad88);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_FileConverter_c79636dcc7_to_string(struct class_FileConverter_c79636dcc7* self)
+                {
+                    struct class_Str res = string0_FileConverter_08b9f78b9c;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Builtins_bd980a9f08_to_string(self->memb_builtins);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_path);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Symbol__9a01330177_to_string(self->memb_symbols);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_NamedType__d1143722a6_to_string(self->memb_types);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_NamedGeneric__fd1333dbd0_to_string(self->memb_generics);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_NamedVariable__2ad9e9e312_to_string(self->memb_variables);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_NamedAstType__23f1f6ad88_to_string(self->memb_typedef_laziness);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_FileConverter_c79636dcc7_equals(struct class_FileConverter_c79636dcc7* var1, struct class_FileConverter_c79636dcc7* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}void meth_FileConverter_c79636dcc7_add_var(struct class_FileConverter_c79636dcc7* var1, struct class_Variable_1aaa81c8d2 var2, struct class_Str var3){struct class_List_NamedVariable__2ad9e9e312* var4;
+var4 = NULL;
+int64_t var5;
+struct class_NamedVariable_ac0761c28d* var7;
+var7 = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+bool var10;
+bool var11;
+struct class_Str var12;
+var12.buf = NULL;
+int64_t var13;
+struct class_List_NamedVariable__2ad9e9e312* var14;
+var14 = NULL;
+struct class_NamedVariable_ac0761c28d* var15;
+var15 = NULL;
+var4 = var1->memb_variables;
+incref(var4);
+var5 = 0LL;
+label6: (void)0;
+if (var5 >= var4->len) goto label8;
+var7 = var4->data[var5++];
+string_decref(var9);
+var9.buf = NULL;
+var9 = var7->memb_name;
+string_incref(var9);
+var10 = meth_Str_equals(var9,var3);
+var11 = oomph_bool_not(var10);
+string_decref(var12);
+var12.buf = NULL;
+var12 = string1_self_hosted_ast2ir_oomph_9b4ddfeec7; string_incref(var12);
+var13 = 972LL;
+oomph_assert(var11,var12,var13);
+if (oomph_true) goto label6;
+label8: (void)0;
+var14 = var1->memb_variables;
+incref(var14);
+var15 = ctor_NamedVariable_ac0761c28d(var3,var2);
+meth_List_NamedVariable__2ad9e9e312_push(var14,var15);
+out: (void)0;
+decref((var15), dtor_NamedVariable_ac0761c28d);
+decref((var14), dtor_List_NamedVariable__2ad9e9e312);
+(void)0;
+string_decref(var12);
+(void)0;
+(void)0;
+string_decref(var9);
+(void)0;
+decref((var4), dtor_List_NamedVariable__2ad9e9e312);
+}struct class_Variable_1aaa81c8d2 meth_FileConverter_c79636dcc7_get_var(struct class_FileConverter_c79636dcc7* var1, struct class_Str var2, struct class__null___Location__87aaae6467 var3){struct class_List_NamedVariable__2ad9e9e312* var4;
+var4 = NULL;
+struct class_Variable_1aaa81c8d2 var5;
+var5.membernum = -1;
+struct class_Variable_1aaa81c8d2 retval;
+var4 = var1->memb_variables;
+incref(var4);
+var5 = ast2ir_d819fcc31b_find_variable(var4,var2,var3);
+retval = var5; var5.membernum = -1;
+goto out;
+out: (void)0;
+decref_Variable_1aaa81c8d2(var5);
+decref((var4), dtor_List_NamedVariable__2ad9e9e312);
+return retval;
+}struct class_Type_87e1ce5c5e meth_FileConverter_c79636dcc7_get_named_type(struct class_FileConverter_c79636dcc7* var1, struct class_Str var2){struct class_List_NamedAstType__23f1f6ad88* var3;
+var3 = NULL;
+struct class_List_Str__43b70c06cb* var4;
+var4 = NULL;
+int64_t var5;
+int64_t var6;
+struct class_NamedAstType_601829e0d0* var8;
+var8 = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+bool var11;
+struct class_List_NamedAstType__23f1f6ad88* var14;
+var14 = NULL;
+int64_t var15;
+struct class_NamedAstType_601829e0d0* var16;
+var16 = NULL;
+struct class_List_NamedType__d1143722a6* var17;
+var17 = NULL;
+struct class_List_Str__43b70c06cb* var18;
+var18 = NULL;
+int64_t var19;
+int64_t var20;
+struct class_NamedType_fe3e45e722* var22;
+var22 = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+bool var25;
+bool var26;
+struct class_Str var27;
+var27.buf = NULL;
+int64_t var28;
+struct class_List_NamedType__d1143722a6* var29;
+var29 = NULL;
+struct class_Type_e6cf7dd4e5 var30;
+var30.membernum = -1;
+char var31;
+struct class__null___FunctionOrMethodConverter__7dc768c0a0 var32;
+var32.membernum = -1;
+struct class_Type_87e1ce5c5e var33;
+var33.membernum = -1;
+struct class_NamedType_fe3e45e722* var34;
+var34 = NULL;
+struct class_List_NamedType__d1143722a6* var35;
+var35 = NULL;
+int64_t var36;
+struct class_NamedType_fe3e45e722* var38;
+var38 = NULL;
+struct class_Str var40;
+var40.buf = NULL;
+bool var41;
+struct class_Type_87e1ce5c5e var44;
+var44.membernum = -1;
+struct class_Str var45;
+var45.buf = NULL;
+struct class_Str var46;
+var46.buf = NULL;
+struct class_Str var47;
+var47.buf = NULL;
+struct class_Str var48;
+var48.buf = NULL;
+bool var49;
+struct class_Str var50;
+var50.buf = NULL;
+int64_t var51;
+struct class_Type_87e1ce5c5e retval;
+var3 = var1->memb_typedef_laziness;
+incref(var3);
+var4 = ctor_List_Str__43b70c06cb();
+var5 = meth_List_NamedAstType__23f1f6ad88_length(var3);
+meth_List_Str__43b70c06cb___reserve(var4,var5);
+var6 = 0LL;
+label7: (void)0;
+if (var6 >= var3->len) goto label9;
+var8 = var3->data[var6++];
+string_decref(var10);
+var10.buf = NULL;
+var10 = var8->memb_name;
+string_incref(var10);
+meth_List_Str__43b70c06cb_push(var4,var10);
+if (oomph_true) goto label7;
+label9: (void)0;
+var11 = meth_List_Str__43b70c06cb___contains(var4,var2);
+if (var11) goto label12;
+if (oomph_true) goto label13;
+label12: (void)0;
+var14 = var1->memb_typedef_laziness;
+incref(var14);
+var15 = meth_List_Str__43b70c06cb_find_only(var4,var2);
+var16 = meth_List_NamedAstType__23f1f6ad88_delete_at_index(var14,var15);
+var17 = var1->memb_types;
+incref(var17);
+var18 = ctor_List_Str__43b70c06cb();
+var19 = meth_List_NamedType__d1143722a6_length(var17);
+meth_List_Str__43b70c06cb___reserve(var18,var19);
+var20 = 0LL;
+label21: (void)0;
+if (var20 >= var17->len) goto label23;
+var22 = var17->data[var20++];
+string_decref(var24);
+var24.buf = NULL;
+var24 = var22->memb_name;
+string_incref(var24);
+meth_List_Str__43b70c06cb_push(var18,var24);
+if (oomph_true) goto label21;
+label23: (void)0;
+var25 = meth_List_Str__43b70c06cb___contains(var18,var2);
+var26 = oomph_bool_not(var25);
+var27 = string1_self_hosted_ast2ir_oomph_9b4ddfeec7; string_incref(var27);
+var28 = 984LL;
+oomph_assert(var26,var27,var28);
+var29 = var1->memb_types;
+incref(var29);
+var30 = var16->memb_type;
+incref_Type_e6cf7dd4e5(var30);
+var31 = oomph_null;
+var32 = (struct class__null___FunctionOrMethodConverter__7dc768c0a0){ .val = { .item0 = var31 }, .membernum = 0 };
+var33 = meth_FileConverter_c79636dcc7_get_type(var1,var30,var32);
+var34 = ctor_NamedType_fe3e45e722(var2,var33);
+meth_List_NamedType__d1143722a6_push(var29,var34);
+label13: (void)0;
+var35 = var1->memb_types;
+incref(var35);
+var36 = 0LL;
+label37: (void)0;
+if (var36 >= var35->len) goto label39;
+var38 = var35->data[var36++];
+string_decref(var40);
+var40.buf = NULL;
+var40 = var38->memb_name;
+string_incref(var40);
+var41 = meth_Str_equals(var40,var2);
+if (var41) goto label42;
+if (oomph_true) goto label43;
+label42: (void)0;
+var44 = var38->memb_type;
+incref_Type_87e1ce5c5e(var44);
+retval = var44; var44.membernum = -1;
+goto out;
+label43: (void)0;
+if (oomph_true) goto label37;
+label39: (void)0;
+var45 = string2_no_type_named___427c5c8f30; string_incref(var45);
+var46 = oomph_string_concat(var45,var2);
+var47 = string3___2e0e983d7b; string_incref(var47);
+var48 = oomph_string_concat(var46,var47);
+oomph_print(var48);
+var49 = oomph_false;
+var50 = string1_self_hosted_ast2ir_oomph_9b4ddfeec7; string_incref(var50);
+var51 = 991LL;
+oomph_assert(var49,var50,var51);
+out: (void)0;
+(void)0;
+string_decref(var50);
+(void)0;
+string_decref(var48);
+string_decref(var47);
+string_decref(var46);
+string_decref(var45);
+decref_Type_87e1ce5c5e(var44);
+(void)0;
+string_decref(var40);
+(void)0;
+decref((var35), dtor_List_NamedType__d1143722a6);
+decref((var34), dtor_NamedType_fe3e45e722);
+decref_Type_87e1ce5c5e(var33);
+decref__null___FunctionOrMethodConverter__7dc768c0a0(var32);
+(void)0;
+decref_Type_e6cf7dd4e5(var30);
+decref((var29), dtor_List_NamedType__d1143722a6);
+(void)0;
+string_decref(var27);
+(void)0;
+(void)0;
+string_decref(var24);
+(void)0;
+(void)0;
+decref((var18), dtor_List_Str__43b70c06cb);
+decref((var17), dtor_List_NamedType__d1143722a6);
+decref((var16), dtor_NamedAstType_601829e0d0);
+(void)0;
+decref((var14), dtor_List_NamedAstType__23f1f6ad88);
+(void)0;
+string_decref(var10);
+(void)0;
+(void)0;
+decref((var4), dtor_List_Str__43b70c06cb);
+decref((var3), dtor_List_NamedAstType__23f1f6ad88);
+return retval;
+}struct class_Type_87e1ce5c5e meth_FileConverter_c79636dcc7_get_type(struct class_FileConverter_c79636dcc7* var1, struct class_Type_e6cf7dd4e5 var2, struct class__null___FunctionOrMethodConverter__7dc768c0a0 var3){bool var4;
+struct class_AutoType_39f5d793d6* var9;
+var9 = NULL;
+struct class_Location_500c4434c9* var10;
+var10 = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_NamedType_0d620e38a7* var13;
+var13 = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Type_87e1ce5c5e var15;
+var15.membernum = -1;
+struct class_UnionType_0c977b4168* var16;
+var16 = NULL;
+char var17;
+struct class__null___FunctionOrMethodConverter__7dc768c0a0 var18;
+var18.membernum = -1;
+bool var19;
+struct class_List_Type__b06c7a2bb6* var21;
+var21 = NULL;
+struct class_List_Type__057f9c6088* var22;
+var22 = NULL;
+int64_t var23;
+int64_t var24;
+struct class_Type_e6cf7dd4e5 var26;
+var26.membernum = -1;
+struct class_FunctionOrMethodConverter_14d05c56fc* var28;
+var28 = NULL;
+struct class_Type_87e1ce5c5e var29;
+var29.membernum = -1;
+struct class_List_Type__057f9c6088* var30;
+var30 = NULL;
+struct class_List_Type__b06c7a2bb6* var32;
+var32 = NULL;
+struct class_List_Type__057f9c6088* var33;
+var33 = NULL;
+int64_t var34;
+int64_t var35;
+struct class_Type_e6cf7dd4e5 var37;
+var37.membernum = -1;
+char var39;
+struct class_Type_87e1ce5c5e var40;
+var40.membernum = -1;
+struct class__null___FunctionOrMethodConverter__7dc768c0a0 var41;
+var41.membernum = -1;
+struct class_Builtins_bd980a9f08* var42;
+var42 = NULL;
+struct class_Type_e6cf7dd4e5 var43;
+var43.membernum = -1;
+struct class_Location_500c4434c9* var44;
+var44 = NULL;
+struct class_UnionType_7f899bced1* var45;
+var45 = NULL;
+struct class_Type_87e1ce5c5e var46;
+var46.membernum = -1;
+struct class_GenericType_f44d8197cb* var47;
+var47 = NULL;
+struct class_List_NamedGeneric__fd1333dbd0* var48;
+var48 = NULL;
+int64_t var49;
+struct class_NamedGeneric_b3d994eaa0* var51;
+var51 = NULL;
+struct class_Str var53;
+var53.buf = NULL;
+struct class_Str var54;
+var54.buf = NULL;
+bool var55;
+char var58;
+struct class__null___FunctionOrMethodConverter__7dc768c0a0 var59;
+var59.membernum = -1;
+bool var60;
+struct class_FunctionOrMethodConverter_14d05c56fc* var62;
+var62 = NULL;
+struct class_Type_e6cf7dd4e5 var63;
+var63.membernum = -1;
+struct class_Type_87e1ce5c5e var64;
+var64.membernum = -1;
+struct class_Type_87e1ce5c5e var65;
+var65.membernum = -1;
+struct class_Type_e6cf7dd4e5 var67;
+var67.membernum = -1;
+char var68;
+struct class__null___FunctionOrMethodConverter__7dc768c0a0 var69;
+var69.membernum = -1;
+struct class_Builtins_bd980a9f08* var70;
+var70 = NULL;
+struct class_Generic_c39b95ec73* var71;
+var71 = NULL;
+struct class_Type_87e1ce5c5e var72;
+var72.membernum = -1;
+struct class_Str var73;
+var73.buf = NULL;
+struct class_Str var74;
+var74.buf = NULL;
+struct class_Str var75;
+var75.buf = NULL;
+bool var76;
+struct class_Str var77;
+var77.buf = NULL;
+int64_t var78;
+struct class_Type_87e1ce5c5e retval;
+
+            var4 = (
+                var2.membernum == 0
+            );
+            if (var4) goto label5;
+
+            var4 = (
+                var2.membernum == 2
+            );
+            if (var4) goto label6;
+
+            var4 = (
+                var2.membernum == 3
+            );
+            if (var4) goto label7;
+
+            var4 = (
+                var2.membernum == 1
+            );
+            if (var4) goto label8;
+label5: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var9 = var2.val.item0;
+            incref(var9);
+var10 = var9->memb_location;
+incref(var10);
+var11 = string4_can_t_use_auto_type_here_97e5be7b27; string_incref(var11);
+meth_Location_500c4434c9_error(var10,var11);
+if (oomph_true) goto label12;
+label6: (void)0;
+
+            if (var2.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var13 = var2.val.item2;
+            incref(var13);
+var14 = var13->memb_name;
+string_incref(var14);
+var15 = meth_FileConverter_c79636dcc7_get_named_type(var1,var14);
+retval = var15; var15.membernum = -1;
+goto out;
+label7: (void)0;
+
+            if (var2.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var16 = var2.val.item3;
+            incref(var16);
+var17 = oomph_null;
+var18 = (struct class__null___FunctionOrMethodConverter__7dc768c0a0){ .val = { .item0 = var17 }, .membernum = 0 };
+var19 = meth__null___FunctionOrMethodConverter__7dc768c0a0_equals(var3,var18);
+if (var19) goto label20;
+var21 = var16->memb_unioned;
+incref(var21);
+var22 = ctor_List_Type__057f9c6088();
+var23 = meth_List_Type__b06c7a2bb6_length(var21);
+meth_List_Type__057f9c6088___reserve(var22,var23);
+var24 = 0LL;
+label25: (void)0;
+if (var24 >= var21->len) goto label27;
+decref_Type_e6cf7dd4e5(var26); var26 = var21->data[var24++]; incref_Type_e6cf7dd4e5(var26);
+decref((var28), dtor_FunctionOrMethodConverter_14d05c56fc);
+var28 = NULL;
+var28 = meth__null___FunctionOrMethodConverter__7dc768c0a0_get(var3);
+decref_Type_87e1ce5c5e(var29);
+var29.membernum = -1;
+var29 = meth_FunctionOrMethodConverter_14d05c56fc_get_type(var28,var26);
+meth_List_Type__057f9c6088_push(var22,var29);
+if (oomph_true) goto label25;
+label27: (void)0;
+var30 = var22;
+var22 = NULL;
+if (oomph_true) goto label31;
+label20: (void)0;
+var32 = var16->memb_unioned;
+incref(var32);
+var33 = ctor_List_Type__057f9c6088();
+var34 = meth_List_Type__b06c7a2bb6_length(var32);
+meth_List_Type__057f9c6088___reserve(var33,var34);
+var35 = 0LL;
+label36: (void)0;
+if (var35 >= var32->len) goto label38;
+decref_Type_e6cf7dd4e5(var37); var37 = var32->data[var35++]; incref_Type_e6cf7dd4e5(var37);
+var39 = oomph_null;
+decref_Type_87e1ce5c5e(var40);
+var40.membernum = -1;
+decref__null___FunctionOrMethodConverter__7dc768c0a0(var41);
+var41.membernum = -1;
+var41 = (struct class__null___FunctionOrMethodConverter__7dc768c0a0){ .val = { .item0 = var39 }, .membernum = 0 };
+var40 = meth_FileConverter_c79636dcc7_get_type(var1,var37,var41);
+meth_List_Type__057f9c6088_push(var33,var40);
+if (oomph_true) goto label36;
+label38: (void)0;
+var30 = var33;
+var33 = NULL;
+label31: (void)0;
+var42 = var1->memb_builtins;
+incref(var42);
+var43 = (struct class_Type_e6cf7dd4e5){ .val = { .item3 = var16 }, .membernum = 3 };
+var16 = NULL;
+var44 = ast_91af7cbb25_locate_type(var43);
+var45 = ir_4b1a3e0393_make_union(var42,var30,var44);
+var46 = (struct class_Type_87e1ce5c5e){ .val = { .item3 = var45 }, .membernum = 3 };
+var45 = NULL;
+retval = var46; var46.membernum = -1;
+goto out;
+label8: (void)0;
+
+            if (var2.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var47 = var2.val.item1;
+            incref(var47);
+var48 = var1->memb_generics;
+incref(var48);
+var49 = 0LL;
+label50: (void)0;
+if (var49 >= var48->len) goto label52;
+decref((var51), dtor_NamedGeneric_b3d994eaa0); var51 = var48->data[var49++]; incref(var51);
+string_decref(var53);
+var53.buf = NULL;
+var53 = var51->memb_name;
+string_incref(var53);
+string_decref(var54);
+var54.buf = NULL;
+var54 = var47->memb_name;
+string_incref(var54);
+var55 = meth_Str_equals(var53,var54);
+if (var55) goto label56;
+if (oomph_true) goto label57;
+label56: (void)0;
+var58 = oomph_null;
+var59 = (struct class__null___FunctionOrMethodConverter__7dc768c0a0){ .val = { .item0 = var58 }, .membernum = 0 };
+var60 = meth__null___FunctionOrMethodConverter__7dc768c0a0_equals(var3,var59);
+if (var60) goto label61;
+var62 = meth__null___FunctionOrMethodConverter__7dc768c0a0_get(var3);
+var63 = var47->memb_arg;
+incref_Type_e6cf7dd4e5(var63);
+var64 = meth_FunctionOrMethodConverter_14d05c56fc_get_type(var62,var63);
+var65 = var64;
+var64.membernum = -1;
+if (oomph_true) goto label66;
+label61: (void)0;
+var67 = var47->memb_arg;
+incref_Type_e6cf7dd4e5(var67);
+var68 = oomph_null;
+var69 = (struct class__null___FunctionOrMethodConverter__7dc768c0a0){ .val = { .item0 = var68 }, .membernum = 0 };
+var65 = meth_FileConverter_c79636dcc7_get_type(var1,var67,var69);
+label66: (void)0;
+var70 = var1->memb_builtins;
+incref(var70);
+var71 = var51->memb_generik;
+incref(var71);
+var72 = meth_Builtins_bd980a9f08_generic2type(var70,var71,var65);
+retval = var72; var72.membernum = -1;
+goto out;
+label57: (void)0;
+if (oomph_true) goto label50;
+label52: (void)0;
+var73 = string5_no_generic_type_named__21bf437027; string_incref(var73);
+var74 = var47->memb_name;
+string_incref(var74);
+var75 = oomph_string_concat(var73,var74);
+oomph_print(var75);
+var76 = oomph_false;
+var77 = string1_self_hosted_ast2ir_oomph_9b4ddfeec7; string_incref(var77);
+var78 = 1019LL;
+oomph_assert(var76,var77,var78);
+label12: (void)0;
+out: (void)0;
+(void)0;
+string_decref(var77);
+(void)0;
+string_decref(var75);
+string_decref(var74);
+string_decref(var73);
+decref_Type_87e1ce5c5e(var72);
+decref((var71), dtor_Generic_c39b95ec73);
+decref((var70), dtor_Builtins_bd980a9f08);
+decref__null___FunctionOrMethodConverter__7dc768c0a0(var69);
+(void)0;
+decref_Type_e6cf7dd4e5(var67);
+decref_Type_87e1ce5c5e(var65);
+decref_Type_87e1ce5c5e(var64);
+decref_Type_e6cf7dd4e5(var63);
+decref((var62), dtor_FunctionOrMethodConverter_14d05c56fc);
+(void)0;
+decref__null___FunctionOrMethodConverter__7dc768c0a0(var59);
+(void)0;
+(void)0;
+string_decref(var54);
+string_decref(var53);
+decref((var51), dtor_NamedGeneric_b3d994eaa0);
+(void)0;
+decref((var48), dtor_List_NamedGeneric__fd1333dbd0);
+decref((var47), dtor_GenericType_f44d8197cb);
+decref_Type_87e1ce5c5e(var46);
+decref((var45), dtor_UnionType_7f899bced1);
+decref((var44), dtor_Location_500c4434c9);
+decref_Type_e6cf7dd4e5(var43);
+decref((var42), dtor_Builtins_bd980a9f08);
+decref__null___FunctionOrMethodConverter__7dc768c0a0(var41);
+decref_Type_87e1ce5c5e(var40);
+(void)0;
+decref_Type_e6cf7dd4e5(var37);
+(void)0;
+(void)0;
+decref((var33), dtor_List_Type__057f9c6088);
+decref((var32), dtor_List_Type__b06c7a2bb6);
+decref((var30), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var29);
+decref((var28), dtor_FunctionOrMethodConverter_14d05c56fc);
+decref_Type_e6cf7dd4e5(var26);
+(void)0;
+(void)0;
+decref((var22), dtor_List_Type__057f9c6088);
+decref((var21), dtor_List_Type__b06c7a2bb6);
+(void)0;
+decref__null___FunctionOrMethodConverter__7dc768c0a0(var18);
+(void)0;
+decref((var16), dtor_UnionType_0c977b4168);
+decref_Type_87e1ce5c5e(var15);
+string_decref(var14);
+decref((var13), dtor_NamedType_0d620e38a7);
+string_decref(var11);
+decref((var10), dtor_Location_500c4434c9);
+decref((var9), dtor_AutoType_39f5d793d6);
+(void)0;
+return retval;
+}void meth_FileConverter_c79636dcc7_check_type_not_exists(struct class_FileConverter_c79636dcc7* var1, struct class_Str var2, struct class_Location_500c4434c9* var3){struct class_List_NamedType__d1143722a6* var4;
+var4 = NULL;
+struct class_List_Str__43b70c06cb* var5;
+var5 = NULL;
+int64_t var6;
+int64_t var7;
+struct class_NamedType_fe3e45e722* var9;
+var9 = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+bool var12;
+struct class_List_NamedAstType__23f1f6ad88* var14;
+var14 = NULL;
+struct class_List_Str__43b70c06cb* var15;
+var15 = NULL;
+int64_t var16;
+int64_t var17;
+struct class_NamedAstType_601829e0d0* var19;
+var19 = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+bool var22;
+bool var23;
+struct class_Str var27;
+var27.buf = NULL;
+struct class_Str var28;
+var28.buf = NULL;
+struct class_Str var29;
+var29.buf = NULL;
+struct class_Str var30;
+var30.buf = NULL;
+var4 = var1->memb_types;
+incref(var4);
+var5 = ctor_List_Str__43b70c06cb();
+var6 = meth_List_NamedType__d1143722a6_length(var4);
+meth_List_Str__43b70c06cb___reserve(var5,var6);
+var7 = 0LL;
+label8: (void)0;
+if (var7 >= var4->len) goto label10;
+var9 = var4->data[var7++];
+string_decref(var11);
+var11.buf = NULL;
+var11 = var9->memb_name;
+string_incref(var11);
+meth_List_Str__43b70c06cb_push(var5,var11);
+if (oomph_true) goto label8;
+label10: (void)0;
+var12 = meth_List_Str__43b70c06cb___contains(var5,var2);
+if (var12) goto label13;
+var14 = var1->memb_typedef_laziness;
+incref(var14);
+var15 = ctor_List_Str__43b70c06cb();
+var16 = meth_List_NamedAstType__23f1f6ad88_length(var14);
+meth_List_Str__43b70c06cb___reserve(var15,var16);
+var17 = 0LL;
+label18: (void)0;
+if (var17 >= var14->len) goto label20;
+var19 = var14->data[var17++];
+string_decref(var21);
+var21.buf = NULL;
+var21 = var19->memb_name;
+string_incref(var21);
+meth_List_Str__43b70c06cb_push(var15,var21);
+if (oomph_true) goto label18;
+label20: (void)0;
+var22 = meth_List_Str__43b70c06cb___contains(var15,var2);
+var23 = var22;
+if (oomph_true) goto label24;
+label13: (void)0;
+var23 = oomph_true;
+label24: (void)0;
+if (var23) goto label25;
+if (oomph_true) goto label26;
+label25: (void)0;
+var27 = string6_type___cc9dd12cb4; string_incref(var27);
+var28 = oomph_string_concat(var27,var2);
+var29 = string7___already_exists_df1deb8ffd; string_incref(var29);
+var30 = oomph_string_concat(var28,var29);
+meth_Location_500c4434c9_error(var3,var30);
+label26: (void)0;
+out: (void)0;
+string_decref(var30);
+string_decref(var29);
+string_decref(var28);
+string_decref(var27);
+(void)0;
+(void)0;
+string_decref(var21);
+(void)0;
+(void)0;
+decref((var15), dtor_List_Str__43b70c06cb);
+decref((var14), dtor_List_NamedAstType__23f1f6ad88);
+(void)0;
+string_decref(var11);
+(void)0;
+(void)0;
+decref((var5), dtor_List_Str__43b70c06cb);
+decref((var4), dtor_List_NamedType__d1143722a6);
+}void meth_FileConverter_c79636dcc7_do_step1(struct class_FileConverter_c79636dcc7* var1, struct class_ToplevelDeclaration_054352d1cf var2){bool var3;
+struct class_Import_6056d7e9c9* var8;
+var8 = NULL;
+struct class_List_Symbol__9a01330177* var9;
+var9 = NULL;
+int64_t var10;
+struct class_Symbol_037dd39afd* var12;
+var12 = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+bool var16;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_SymbolValue_b2eed984e4 var24;
+var24.membernum = -1;
+bool var25;
+struct class_Type_87e1ce5c5e var27;
+var27.membernum = -1;
+struct class_FileVariable_a7b8ca651f* var29;
+var29 = NULL;
+struct class_Variable_1aaa81c8d2 var30;
+var30.membernum = -1;
+struct class_List_NamedType__d1143722a6* var32;
+var32 = NULL;
+struct class_List_Str__43b70c06cb* var33;
+var33 = NULL;
+int64_t var34;
+int64_t var35;
+struct class_NamedType_fe3e45e722* var37;
+var37 = NULL;
+struct class_Str var39;
+var39.buf = NULL;
+bool var40;
+bool var41;
+struct class_Str var42;
+var42.buf = NULL;
+int64_t var43;
+struct class_List_NamedType__d1143722a6* var44;
+var44 = NULL;
+struct class_NamedType_fe3e45e722* var45;
+var45 = NULL;
+struct class_ClassDef_ac59c4b64c* var47;
+var47 = NULL;
+struct class_Str var48;
+var48.buf = NULL;
+struct class_Location_500c4434c9* var49;
+var49 = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_List_FuncOrMethodDef__af5379b09e* var51;
+var51 = NULL;
+struct class_List_Str__43b70c06cb* var52;
+var52 = NULL;
+int64_t var53;
+int64_t var54;
+struct class_FuncOrMethodDef_533c7b75ab* var56;
+var56 = NULL;
+struct class_Str var58;
+var58.buf = NULL;
+bool var59;
+bool var60;
+struct class_Str var61;
+var61.buf = NULL;
+bool var62;
+struct class_List_Method__1e0ab9c757* var63;
+var63 = NULL;
+struct class_List_Member__7525bf27e3* var64;
+var64 = NULL;
+char var65;
+char var66;
+struct class__null___List_Type___114a421a91 var67;
+var67.membernum = -1;
+struct class__null___GenericSource__4440b6073d var68;
+var68.membernum = -1;
+struct class_BasicType_899b9c9f8e* var69;
+var69 = NULL;
+struct class_Builtins_bd980a9f08* var70;
+var70 = NULL;
+struct class_List_BasicType__d02960f5a1* var71;
+var71 = NULL;
+struct class_Str var72;
+var72.buf = NULL;
+struct class_List_NamedType__d1143722a6* var73;
+var73 = NULL;
+struct class_List_Str__43b70c06cb* var74;
+var74 = NULL;
+int64_t var75;
+int64_t var76;
+struct class_NamedType_fe3e45e722* var78;
+var78 = NULL;
+struct class_Str var80;
+var80.buf = NULL;
+bool var81;
+bool var82;
+struct class_Str var83;
+var83.buf = NULL;
+int64_t var84;
+struct class_List_NamedType__d1143722a6* var85;
+var85 = NULL;
+struct class_Str var86;
+var86.buf = NULL;
+struct class_Type_87e1ce5c5e var87;
+var87.membernum = -1;
+struct class_NamedType_fe3e45e722* var88;
+var88 = NULL;
+struct class_TypeDef_44471836ba* var89;
+var89 = NULL;
+struct class_Str var90;
+var90.buf = NULL;
+struct class_Location_500c4434c9* var91;
+var91 = NULL;
+struct class_List_NamedAstType__23f1f6ad88* var92;
+var92 = NULL;
+struct class_Str var93;
+var93.buf = NULL;
+struct class_Type_e6cf7dd4e5 var94;
+var94.membernum = -1;
+struct class_NamedAstType_601829e0d0* var95;
+var95 = NULL;
+struct class_FuncOrMethodDef_533c7b75ab* var96;
+var96 = NULL;
+
+            var3 = (
+                var2.membernum == 2
+            );
+            if (var3) goto label4;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) goto label5;
+
+            var3 = (
+                var2.membernum == 3
+            );
+            if (var3) goto label6;
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) goto label7;
+label4: (void)0;
+
+            if (var2.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var8 = var2.val.item2;
+            incref(var8);
+var9 = var1->memb_symbols;
+incref(var9);
+var10 = 0LL;
+label11: (void)0;
+if (var10 >= var9->len) goto label13;
+decref((var12), dtor_Symbol_037dd39afd); var12 = var9->data[var10++]; incref(var12);
+string_decref(var14);
+var14.buf = NULL;
+var14 = var12->memb_path;
+string_incref(var14);
+string_decref(var15);
+var15.buf = NULL;
+var15 = var8->memb_path;
+string_incref(var15);
+var16 = meth_Str_equals(var14,var15);
+if (var16) goto label17;
+if (oomph_true) goto label18;
+label17: (void)0;
+string_decref(var19);
+var19.buf = NULL;
+var19 = var8->memb_name;
+string_incref(var19);
+string_decref(var20);
+var20.buf = NULL;
+var20 = string8____a789be8914; string_incref(var20);
+string_decref(var21);
+var21.buf = NULL;
+var21 = oomph_string_concat(var19,var20);
+string_decref(var22);
+var22.buf = NULL;
+var22 = var12->memb_name;
+string_incref(var22);
+string_decref(var23);
+var23.buf = NULL;
+var23 = oomph_string_concat(var21,var22);
+decref_SymbolValue_b2eed984e4(var24);
+var24.membernum = -1;
+var24 = var12->memb_value;
+incref_SymbolValue_b2eed984e4(var24);
+
+            var25 = (
+                var24.membernum == 1
+            );
+            if (var25) goto label26;
+decref_Type_87e1ce5c5e(var27);
+var27.membernum = -1;
+
+            var25 = (
+                var24.membernum == 0
+            );
+            if (var25) goto label28;
+label26: (void)0;
+
+            if (var24.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var29 = var24.val.item1;
+            incref(var29);
+decref_Variable_1aaa81c8d2(var30);
+var30.membernum = -1;
+var30 = (struct class_Variable_1aaa81c8d2){ .val = { .item1 = var29 }, .membernum = 1 };
+var29 = NULL;
+meth_FileConverter_c79636dcc7_add_var(var1,var30,var23);
+if (oomph_true) goto label31;
+label28: (void)0;
+
+            if (var24.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var27 = var24.val.item0;
+            incref_Type_87e1ce5c5e(var27);
+decref((var32), dtor_List_NamedType__d1143722a6);
+var32 = NULL;
+var32 = var1->memb_types;
+incref(var32);
+decref((var33), dtor_List_Str__43b70c06cb);
+var33 = NULL;
+var33 = ctor_List_Str__43b70c06cb();
+var34 = meth_List_NamedType__d1143722a6_length(var32);
+meth_List_Str__43b70c06cb___reserve(var33,var34);
+var35 = 0LL;
+label36: (void)0;
+if (var35 >= var32->len) goto label38;
+var37 = var32->data[var35++];
+string_decref(var39);
+var39.buf = NULL;
+var39 = var37->memb_name;
+string_incref(var39);
+meth_List_Str__43b70c06cb_push(var33,var39);
+if (oomph_true) goto label36;
+label38: (void)0;
+var40 = meth_List_Str__43b70c06cb___contains(var33,var23);
+var41 = oomph_bool_not(var40);
+string_decref(var42);
+var42.buf = NULL;
+var42 = string1_self_hosted_ast2ir_oomph_9b4ddfeec7; string_incref(var42);
+var43 = 1045LL;
+oomph_assert(var41,var42,var43);
+decref((var44), dtor_List_NamedType__d1143722a6);
+var44 = NULL;
+var44 = var1->memb_types;
+incref(var44);
+decref((var45), dtor_NamedType_fe3e45e722);
+var45 = NULL;
+var45 = ctor_NamedType_fe3e45e722(var23,var27);
+meth_List_NamedType__d1143722a6_push(var44,var45);
+label31: (void)0;
+label18: (void)0;
+if (oomph_true) goto label11;
+label13: (void)0;
+if (oomph_true) goto label46;
+label5: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var47 = var2.val.item0;
+            incref(var47);
+var48 = var47->memb_name;
+string_incref(var48);
+var49 = var47->memb_location;
+incref(var49);
+meth_FileConverter_c79636dcc7_check_type_not_exists(var1,var48,var49);
+var50 = string9_to_string_0c1dadc6d5; string_incref(var50);
+var51 = var47->memb_body;
+incref(var51);
+var52 = ctor_List_Str__43b70c06cb();
+var53 = meth_List_FuncOrMethodDef__af5379b09e_length(var51);
+meth_List_Str__43b70c06cb___reserve(var52,var53);
+var54 = 0LL;
+label55: (void)0;
+if (var54 >= var51->len) goto label57;
+var56 = var51->data[var54++];
+string_decref(var58);
+var58.buf = NULL;
+var58 = var56->memb_name;
+string_incref(var58);
+meth_List_Str__43b70c06cb_push(var52,var58);
+if (oomph_true) goto label55;
+label57: (void)0;
+var59 = meth_List_Str__43b70c06cb___contains(var52,var50);
+var60 = oomph_bool_not(var59);
+var61 = var47->memb_name;
+string_incref(var61);
+var62 = oomph_true;
+var63 = ctor_List_Method__1e0ab9c757();
+var64 = ctor_List_Member__7525bf27e3();
+var65 = oomph_null;
+var66 = oomph_null;
+var67 = (struct class__null___List_Type___114a421a91){ .val = { .item0 = var65 }, .membernum = 0 };
+var68 = (struct class__null___GenericSource__4440b6073d){ .val = { .item0 = var66 }, .membernum = 0 };
+var69 = ctor_BasicType_899b9c9f8e(var61,var62,var63,var64,var67,var68,var60);
+var70 = var1->memb_builtins;
+var71 = var70->memb_cleanup_list;
+var70 = NULL;
+incref(var71);
+meth_List_BasicType__d02960f5a1_push(var71,var69);
+var72 = var47->memb_name;
+string_incref(var72);
+var73 = var1->memb_types;
+incref(var73);
+var74 = ctor_List_Str__43b70c06cb();
+var75 = meth_List_NamedType__d1143722a6_length(var73);
+meth_List_Str__43b70c06cb___reserve(var74,var75);
+var76 = 0LL;
+label77: (void)0;
+if (var76 >= var73->len) goto label79;
+var78 = var73->data[var76++];
+string_decref(var80);
+var80.buf = NULL;
+var80 = var78->memb_name;
+string_incref(var80);
+meth_List_Str__43b70c06cb_push(var74,var80);
+if (oomph_true) goto label77;
+label79: (void)0;
+var81 = meth_List_Str__43b70c06cb___contains(var74,var72);
+var82 = oomph_bool_not(var81);
+var83 = string1_self_hosted_ast2ir_oomph_9b4ddfeec7; string_incref(var83);
+var84 = 1056LL;
+oomph_assert(var82,var83,var84);
+var85 = var1->memb_types;
+incref(var85);
+var86 = var47->memb_name;
+string_incref(var86);
+var87 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var69 }, .membernum = 1 };
+var69 = NULL;
+var88 = ctor_NamedType_fe3e45e722(var86,var87);
+meth_List_NamedType__d1143722a6_push(var85,var88);
+if (oomph_true) goto label46;
+label6: (void)0;
+
+            if (var2.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var89 = var2.val.item3;
+            incref(var89);
+var90 = var89->memb_name;
+string_incref(var90);
+var91 = var89->memb_location;
+incref(var91);
+meth_FileConverter_c79636dcc7_check_type_not_exists(var1,var90,var91);
+var92 = var1->memb_typedef_laziness;
+incref(var92);
+var93 = var89->memb_name;
+string_incref(var93);
+var94 = var89->memb_type;
+incref_Type_e6cf7dd4e5(var94);
+var95 = ctor_NamedAstType_601829e0d0(var93,var94);
+meth_List_NamedAstType__23f1f6ad88_push(var92,var95);
+if (oomph_true) goto label46;
+label7: (void)0;
+
+            if (var2.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var96 = var2.val.item1;
+            incref(var96);
+label46: (void)0;
+out: (void)0;
+decref((var96), dtor_FuncOrMethodDef_533c7b75ab);
+decref((var95), dtor_NamedAstType_601829e0d0);
+decref_Type_e6cf7dd4e5(var94);
+string_decref(var93);
+decref((var92), dtor_List_NamedAstType__23f1f6ad88);
+decref((var91), dtor_Location_500c4434c9);
+string_decref(var90);
+decref((var89), dtor_TypeDef_44471836ba);
+decref((var88), dtor_NamedType_fe3e45e722);
+decref_Type_87e1ce5c5e(var87);
+string_decref(var86);
+decref((var85), dtor_List_NamedType__d1143722a6);
+(void)0;
+string_decref(var83);
+(void)0;
+(void)0;
+string_decref(var80);
+(void)0;
+(void)0;
+decref((var74), dtor_List_Str__43b70c06cb);
+decref((var73), dtor_List_NamedType__d1143722a6);
+string_decref(var72);
+decref((var71), dtor_List_BasicType__d02960f5a1);
+decref((var70), dtor_Builtins_bd980a9f08);
+decref((var69), dtor_BasicType_899b9c9f8e);
+decref__null___GenericSource__4440b6073d(var68);
+decref__null___List_Type___114a421a91(var67);
+(void)0;
+(void)0;
+decref((var64), dtor_List_Member__7525bf27e3);
+decref((var63), dtor_List_Method__1e0ab9c757);
+(void)0;
+string_decref(var61);
+(void)0;
+(void)0;
+string_decref(var58);
+(void)0;
+(void)0;
+decref((var52), dtor_List_Str__43b70c06cb);
+decref((var51), dtor_List_FuncOrMethodDef__af5379b09e);
+string_decref(var50);
+decref((var49), dtor_Location_500c4434c9);
+string_decref(var48);
+decref((var47), dtor_ClassDef_ac59c4b64c);
+decref((var45), dtor_NamedType_fe3e45e722);
+decref((var44), dtor_List_NamedType__d1143722a6);
+(void)0;
+string_decref(var42);
+(void)0;
+(void)0;
+string_decref(var39);
+(void)0;
+(void)0;
+decref((var33), dtor_List_Str__43b70c06cb);
+decref((var32), dtor_List_NamedType__d1143722a6);
+decref_Variable_1aaa81c8d2(var30);
+decref((var29), dtor_FileVariable_a7b8ca651f);
+decref_Type_87e1ce5c5e(var27);
+(void)0;
+decref_SymbolValue_b2eed984e4(var24);
+string_decref(var23);
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+string_decref(var19);
+(void)0;
+string_decref(var15);
+string_decref(var14);
+decref((var12), dtor_Symbol_037dd39afd);
+(void)0;
+decref((var9), dtor_List_Symbol__9a01330177);
+decref((var8), dtor_Import_6056d7e9c9);
+(void)0;
+}void meth_FileConverter_c79636dcc7_do_step2(struct class_FileConverter_c79636dcc7* var1, struct class_ToplevelDeclaration_054352d1cf var2){bool var3;
+struct class_TypeDef_44471836ba* var7;
+var7 = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Type_87e1ce5c5e var9;
+var9.membernum = -1;
+struct class_List_Symbol__9a01330177* var10;
+var10 = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_SymbolValue_b2eed984e4 var13;
+var13.membernum = -1;
+struct class_Symbol_037dd39afd* var14;
+var14 = NULL;
+bool var15;
+struct class_UnionType_7f899bced1* var18;
+var18 = NULL;
+struct class__null___Str__5eca9cec4f var19;
+var19.membernum = -1;
+char var20;
+struct class__null___Str__5eca9cec4f var21;
+var21.membernum = -1;
+bool var22;
+struct class_Str var23;
+var23.buf = NULL;
+int64_t var24;
+struct class_Str var25;
+var25.buf = NULL;
+struct class__null___Str__5eca9cec4f var26;
+var26.membernum = -1;
+struct class__null___Str__5eca9cec4f var27;
+var27.membernum = -1;
+struct class_ClassDef_ac59c4b64c* var30;
+var30 = NULL;
+struct class_List_Symbol__9a01330177* var31;
+var31 = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_Type_87e1ce5c5e var35;
+var35.membernum = -1;
+struct class_SymbolValue_b2eed984e4 var36;
+var36.membernum = -1;
+struct class_Symbol_037dd39afd* var37;
+var37 = NULL;
+
+            var3 = (
+                var2.membernum == 3
+            );
+            if (var3) goto label4;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) goto label5;
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) goto label6;
+
+            var3 = (
+                var2.membernum == 2
+            );
+            if (var3) goto label6;
+label4: (void)0;
+
+            if (var2.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var7 = var2.val.item3;
+            incref(var7);
+var8 = var7->memb_name;
+string_incref(var8);
+var9 = meth_FileConverter_c79636dcc7_get_named_type(var1,var8);
+var10 = var1->memb_symbols;
+incref(var10);
+var11 = var1->memb_path;
+string_incref(var11);
+var12 = var7->memb_name;
+string_incref(var12);
+var13 = (struct class_SymbolValue_b2eed984e4){ .val = { .item0 = var9 }, .membernum = 0 };
+incref_Type_87e1ce5c5e(var9);
+var14 = ctor_Symbol_037dd39afd(var11,var12,var13);
+meth_List_Symbol__9a01330177_push(var10,var14);
+
+            var15 = (
+                var9.membernum == 3
+            );
+            if (var15) goto label16;
+
+            var15 = (
+                var9.membernum == 0
+            );
+            if (var15) goto label17;
+
+            var15 = (
+                var9.membernum == 1
+            );
+            if (var15) goto label17;
+
+            var15 = (
+                var9.membernum == 2
+            );
+            if (var15) goto label17;
+label16: (void)0;
+
+            if (var9.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var18 = var9.val.item3;
+            incref(var18);
+var19 = var18->memb_custom_name;
+incref__null___Str__5eca9cec4f(var19);
+var20 = oomph_null;
+var21 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var20 }, .membernum = 0 };
+var22 = meth__null___Str__5eca9cec4f_equals(var19,var21);
+var23 = string1_self_hosted_ast2ir_oomph_9b4ddfeec7; string_incref(var23);
+var24 = 1076LL;
+oomph_assert(var22,var23,var24);
+var25 = var7->memb_name;
+string_incref(var25);
+var26 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var25 }, .membernum = 1 };
+var25.buf = NULL;
+var27 = var18->memb_custom_name;
+var18->memb_custom_name = var26;
+var26.membernum = -1;
+if (oomph_true) goto label28;
+label17: (void)0;
+label28: (void)0;
+if (oomph_true) goto label29;
+label5: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var30 = var2.val.item0;
+            incref(var30);
+var31 = var1->memb_symbols;
+incref(var31);
+var32 = var1->memb_path;
+string_incref(var32);
+var33 = var30->memb_name;
+string_incref(var33);
+var34 = var30->memb_name;
+string_incref(var34);
+var35 = meth_FileConverter_c79636dcc7_get_named_type(var1,var34);
+var36 = (struct class_SymbolValue_b2eed984e4){ .val = { .item0 = var35 }, .membernum = 0 };
+var35.membernum = -1;
+var37 = ctor_Symbol_037dd39afd(var32,var33,var36);
+meth_List_Symbol__9a01330177_push(var31,var37);
+if (oomph_true) goto label29;
+label6: (void)0;
+label29: (void)0;
+out: (void)0;
+decref((var37), dtor_Symbol_037dd39afd);
+decref_SymbolValue_b2eed984e4(var36);
+decref_Type_87e1ce5c5e(var35);
+string_decref(var34);
+string_decref(var33);
+string_decref(var32);
+decref((var31), dtor_List_Symbol__9a01330177);
+decref((var30), dtor_ClassDef_ac59c4b64c);
+decref__null___Str__5eca9cec4f(var27);
+decref__null___Str__5eca9cec4f(var26);
+string_decref(var25);
+(void)0;
+string_decref(var23);
+(void)0;
+decref__null___Str__5eca9cec4f(var21);
+(void)0;
+decref__null___Str__5eca9cec4f(var19);
+decref((var18), dtor_UnionType_7f899bced1);
+(void)0;
+decref((var14), dtor_Symbol_037dd39afd);
+decref_SymbolValue_b2eed984e4(var13);
+string_decref(var12);
+string_decref(var11);
+decref((var10), dtor_List_Symbol__9a01330177);
+decref_Type_87e1ce5c5e(var9);
+string_decref(var8);
+decref((var7), dtor_TypeDef_44471836ba);
+(void)0;
+}void meth_FileConverter_c79636dcc7_func_or_meth_step3(struct class_FileConverter_c79636dcc7* var1, struct class_FuncOrMethodDef_533c7b75ab* var2, struct class__null___BasicType__3303ac43c9 var3){struct class__null___Type__7de1ddce50 var4;
+var4.membernum = -1;
+char var5;
+struct class__null___Type__7de1ddce50 var6;
+var6.membernum = -1;
+bool var7;
+struct class__null___Type__7de1ddce50 var9;
+var9.membernum = -1;
+struct class_Type_e6cf7dd4e5 var10;
+var10.membernum = -1;
+char var11;
+struct class__null___FunctionOrMethodConverter__7dc768c0a0 var12;
+var12.membernum = -1;
+struct class_Type_87e1ce5c5e var13;
+var13.membernum = -1;
+struct class__null___Type__8438ac3dcf var14;
+var14.membernum = -1;
+struct class__null___Type__8438ac3dcf var15;
+var15.membernum = -1;
+char var17;
+struct class_List_TypeAndName__74be4dae93* var18;
+var18 = NULL;
+struct class_List_Type__057f9c6088* var19;
+var19 = NULL;
+int64_t var20;
+int64_t var21;
+struct class_TypeAndName_fec99b5f94* var23;
+var23 = NULL;
+struct class_Type_e6cf7dd4e5 var25;
+var25.membernum = -1;
+char var26;
+struct class_Type_87e1ce5c5e var27;
+var27.membernum = -1;
+struct class__null___FunctionOrMethodConverter__7dc768c0a0 var28;
+var28.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var29;
+var29 = NULL;
+char var30;
+struct class__null___BasicType__3303ac43c9 var31;
+var31.membernum = -1;
+bool var32;
+struct class_BasicType_899b9c9f8e* var34;
+var34 = NULL;
+struct class_List_Method__1e0ab9c757* var35;
+var35 = NULL;
+int64_t var36;
+struct class_Method_bfbd73ad15* var38;
+var38 = NULL;
+struct class_Str var40;
+var40.buf = NULL;
+struct class_Str var41;
+var41.buf = NULL;
+bool var42;
+bool var43;
+struct class_Str var44;
+var44.buf = NULL;
+int64_t var45;
+struct class_BasicType_899b9c9f8e* var46;
+var46 = NULL;
+struct class_List_Method__1e0ab9c757* var47;
+var47 = NULL;
+struct class_Str var48;
+var48.buf = NULL;
+struct class_Method_bfbd73ad15* var49;
+var49 = NULL;
+struct class_List_NamedVariable__2ad9e9e312* var51;
+var51 = NULL;
+int64_t var52;
+struct class_NamedVariable_ac0761c28d* var54;
+var54 = NULL;
+struct class_Str var56;
+var56.buf = NULL;
+struct class_Str var57;
+var57.buf = NULL;
+bool var58;
+bool var59;
+struct class_Str var60;
+var60.buf = NULL;
+int64_t var61;
+struct class_Str var62;
+var62.buf = NULL;
+struct class_Type_87e1ce5c5e var63;
+var63.membernum = -1;
+struct class_FileVariable_a7b8ca651f* var64;
+var64 = NULL;
+struct class_List_Symbol__9a01330177* var65;
+var65 = NULL;
+struct class_Str var66;
+var66.buf = NULL;
+struct class_Str var67;
+var67.buf = NULL;
+struct class_SymbolValue_b2eed984e4 var68;
+var68.membernum = -1;
+struct class_Symbol_037dd39afd* var69;
+var69 = NULL;
+struct class_Str var70;
+var70.buf = NULL;
+struct class_Variable_1aaa81c8d2 var71;
+var71.membernum = -1;
+var4 = var2->memb_returntype;
+incref__null___Type__7de1ddce50(var4);
+var5 = oomph_null;
+var6 = (struct class__null___Type__7de1ddce50){ .val = { .item0 = var5 }, .membernum = 0 };
+var7 = meth__null___Type__7de1ddce50_equals(var4,var6);
+if (var7) goto label8;
+var9 = var2->memb_returntype;
+incref__null___Type__7de1ddce50(var9);
+var10 = meth__null___Type__7de1ddce50_get(var9);
+var11 = oomph_null;
+var12 = (struct class__null___FunctionOrMethodConverter__7dc768c0a0){ .val = { .item0 = var11 }, .membernum = 0 };
+var13 = meth_FileConverter_c79636dcc7_get_type(var1,var10,var12);
+var14 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var13 }, .membernum = 1 };
+var13.membernum = -1;
+var15 = var14;
+var14.membernum = -1;
+if (oomph_true) goto label16;
+label8: (void)0;
+var17 = oomph_null;
+var15 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var17 }, .membernum = 0 };
+label16: (void)0;
+var18 = var2->memb_args;
+incref(var18);
+var19 = ctor_List_Type__057f9c6088();
+var20 = meth_List_TypeAndName__74be4dae93_length(var18);
+meth_List_Type__057f9c6088___reserve(var19,var20);
+var21 = 0LL;
+label22: (void)0;
+if (var21 >= var18->len) goto label24;
+decref((var23), dtor_TypeAndName_fec99b5f94); var23 = var18->data[var21++]; incref(var23);
+decref_Type_e6cf7dd4e5(var25);
+var25.membernum = -1;
+var25 = var23->memb_type;
+incref_Type_e6cf7dd4e5(var25);
+var26 = oomph_null;
+decref_Type_87e1ce5c5e(var27);
+var27.membernum = -1;
+decref__null___FunctionOrMethodConverter__7dc768c0a0(var28);
+var28.membernum = -1;
+var28 = (struct class__null___FunctionOrMethodConverter__7dc768c0a0){ .val = { .item0 = var26 }, .membernum = 0 };
+var27 = meth_FileConverter_c79636dcc7_get_type(var1,var25,var28);
+meth_List_Type__057f9c6088_push(var19,var27);
+if (oomph_true) goto label22;
+label24: (void)0;
+var29 = ctor_FunctionType_4e16d0ea53(var19,var15);
+var30 = oomph_null;
+var31 = (struct class__null___BasicType__3303ac43c9){ .val = { .item0 = var30 }, .membernum = 0 };
+var32 = meth__null___BasicType__3303ac43c9_equals(var3,var31);
+if (var32) goto label33;
+var34 = meth__null___BasicType__3303ac43c9_get(var3);
+var35 = var34->memb_methods;
+incref(var35);
+var36 = 0LL;
+label37: (void)0;
+if (var36 >= var35->len) goto label39;
+var38 = var35->data[var36++];
+string_decref(var40);
+var40.buf = NULL;
+var40 = var38->memb_name;
+string_incref(var40);
+string_decref(var41);
+var41.buf = NULL;
+var41 = var2->memb_name;
+string_incref(var41);
+var42 = meth_Str_equals(var40,var41);
+var43 = oomph_bool_not(var42);
+string_decref(var44);
+var44.buf = NULL;
+var44 = string1_self_hosted_ast2ir_oomph_9b4ddfeec7; string_incref(var44);
+var45 = 1107LL;
+oomph_assert(var43,var44,var45);
+if (oomph_true) goto label37;
+label39: (void)0;
+var46 = meth__null___BasicType__3303ac43c9_get(var3);
+var47 = var46->memb_methods;
+incref(var47);
+var48 = var2->memb_name;
+string_incref(var48);
+var49 = ctor_Method_bfbd73ad15(var48,var29);
+meth_List_Method__1e0ab9c757_push(var47,var49);
+if (oomph_true) goto label50;
+label33: (void)0;
+var51 = var1->memb_variables;
+incref(var51);
+var52 = 0LL;
+label53: (void)0;
+if (var52 >= var51->len) goto label55;
+var54 = var51->data[var52++];
+string_decref(var56);
+var56.buf = NULL;
+var56 = var2->memb_name;
+string_incref(var56);
+string_decref(var57);
+var57.buf = NULL;
+var57 = var54->memb_name;
+string_incref(var57);
+var58 = meth_Str_equals(var56,var57);
+var59 = oomph_bool_not(var58);
+string_decref(var60);
+var60.buf = NULL;
+var60 = string1_self_hosted_ast2ir_oomph_9b4ddfeec7; string_incref(var60);
+var61 = 1099LL;
+oomph_assert(var59,var60,var61);
+if (oomph_true) goto label53;
+label55: (void)0;
+var62 = var2->memb_name;
+string_incref(var62);
+var63 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var29 }, .membernum = 2 };
+var29 = NULL;
+var64 = ctor_FileVariable_a7b8ca651f(var62,var63);
+var65 = var1->memb_symbols;
+incref(var65);
+var66 = var1->memb_path;
+string_incref(var66);
+var67 = var2->memb_name;
+string_incref(var67);
+var68 = (struct class_SymbolValue_b2eed984e4){ .val = { .item1 = var64 }, .membernum = 1 };
+incref(var64);
+var69 = ctor_Symbol_037dd39afd(var66,var67,var68);
+meth_List_Symbol__9a01330177_push(var65,var69);
+var70 = var2->memb_name;
+string_incref(var70);
+var71 = (struct class_Variable_1aaa81c8d2){ .val = { .item1 = var64 }, .membernum = 1 };
+var64 = NULL;
+meth_FileConverter_c79636dcc7_add_var(var1,var71,var70);
+label50: (void)0;
+out: (void)0;
+decref_Variable_1aaa81c8d2(var71);
+string_decref(var70);
+decref((var69), dtor_Symbol_037dd39afd);
+decref_SymbolValue_b2eed984e4(var68);
+string_decref(var67);
+string_decref(var66);
+decref((var65), dtor_List_Symbol__9a01330177);
+decref((var64), dtor_FileVariable_a7b8ca651f);
+decref_Type_87e1ce5c5e(var63);
+string_decref(var62);
+(void)0;
+string_decref(var60);
+(void)0;
+(void)0;
+string_decref(var57);
+string_decref(var56);
+(void)0;
+decref((var51), dtor_List_NamedVariable__2ad9e9e312);
+decref((var49), dtor_Method_bfbd73ad15);
+string_decref(var48);
+decref((var47), dtor_List_Method__1e0ab9c757);
+decref((var46), dtor_BasicType_899b9c9f8e);
+(void)0;
+string_decref(var44);
+(void)0;
+(void)0;
+string_decref(var41);
+string_decref(var40);
+(void)0;
+decref((var35), dtor_List_Method__1e0ab9c757);
+decref((var34), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref__null___BasicType__3303ac43c9(var31);
+(void)0;
+decref((var29), dtor_FunctionType_4e16d0ea53);
+decref__null___FunctionOrMethodConverter__7dc768c0a0(var28);
+decref_Type_87e1ce5c5e(var27);
+(void)0;
+decref_Type_e6cf7dd4e5(var25);
+decref((var23), dtor_TypeAndName_fec99b5f94);
+(void)0;
+(void)0;
+decref((var19), dtor_List_Type__057f9c6088);
+decref((var18), dtor_List_TypeAndName__74be4dae93);
+(void)0;
+decref__null___Type__8438ac3dcf(var15);
+decref__null___Type__8438ac3dcf(var14);
+decref_Type_87e1ce5c5e(var13);
+decref__null___FunctionOrMethodConverter__7dc768c0a0(var12);
+(void)0;
+decref_Type_e6cf7dd4e5(var10);
+decref__null___Type__7de1ddce50(var9);
+(void)0;
+decref__null___Type__7de1ddce50(var6);
+(void)0;
+decref__null___Type__7de1ddce50(var4);
+}void meth_FileConverter_c79636dcc7_do_step3(struct class_FileConverter_c79636dcc7* var1, struct class_ToplevelDeclaration_054352d1cf var2){bool var3;
+struct class_FuncOrMethodDef_533c7b75ab* var7;
+var7 = NULL;
+char var8;
+struct class__null___BasicType__3303ac43c9 var9;
+var9.membernum = -1;
+struct class_ClassDef_ac59c4b64c* var11;
+var11 = NULL;
+bool var12;
+struct class_List_NamedType__d1143722a6* var13;
+var13 = NULL;
+int64_t var14;
+struct class_NamedType_fe3e45e722* var16;
+var16 = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+bool var20;
+struct class_Type_87e1ce5c5e var23;
+var23.membernum = -1;
+struct class_BasicType_899b9c9f8e* var24;
+var24 = NULL;
+bool var25;
+struct class_Str var26;
+var26.buf = NULL;
+int64_t var27;
+struct class_List_Member__7525bf27e3* var28;
+var28 = NULL;
+struct class_List_TypeAndName__74be4dae93* var29;
+var29 = NULL;
+struct class_List_Member__7525bf27e3* var30;
+var30 = NULL;
+int64_t var31;
+int64_t var32;
+struct class_TypeAndName_fec99b5f94* var34;
+var34 = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+struct class_Type_e6cf7dd4e5 var37;
+var37.membernum = -1;
+char var38;
+struct class_Type_87e1ce5c5e var39;
+var39.membernum = -1;
+struct class__null___FunctionOrMethodConverter__7dc768c0a0 var40;
+var40.membernum = -1;
+struct class_Member_a3dd2b1b39* var41;
+var41 = NULL;
+struct class_List_Type__057f9c6088* var42;
+var42 = NULL;
+struct class__null___List_Type___114a421a91 var43;
+var43.membernum = -1;
+struct class__null___List_Type___114a421a91 var44;
+var44.membernum = -1;
+struct class__null___List_Type___114a421a91 var45;
+var45.membernum = -1;
+struct class_List_Type__057f9c6088* var46;
+var46 = NULL;
+struct class_List_Member__7525bf27e3* var47;
+var47 = NULL;
+struct class_List_Type__057f9c6088* var48;
+var48 = NULL;
+int64_t var49;
+int64_t var50;
+struct class_Member_a3dd2b1b39* var52;
+var52 = NULL;
+struct class_Type_87e1ce5c5e var54;
+var54.membernum = -1;
+bool var55;
+struct class_List_Method__1e0ab9c757* var58;
+var58 = NULL;
+struct class_Str var59;
+var59.buf = NULL;
+struct class_Type_87e1ce5c5e var60;
+var60.membernum = -1;
+struct class_List_Type__057f9c6088* var61;
+var61 = NULL;
+struct class_Builtins_bd980a9f08* var62;
+var62 = NULL;
+struct class_Type_87e1ce5c5e var63;
+var63.membernum = -1;
+struct class__null___Type__8438ac3dcf var64;
+var64.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var65;
+var65 = NULL;
+struct class_Method_bfbd73ad15* var66;
+var66 = NULL;
+struct class_Str var67;
+var67.buf = NULL;
+struct class_List_FuncOrMethodDef__af5379b09e* var68;
+var68 = NULL;
+struct class_List_Str__43b70c06cb* var69;
+var69 = NULL;
+int64_t var70;
+int64_t var71;
+struct class_FuncOrMethodDef_533c7b75ab* var73;
+var73 = NULL;
+struct class_Str var75;
+var75.buf = NULL;
+bool var76;
+bool var77;
+struct class_List_Method__1e0ab9c757* var80;
+var80 = NULL;
+struct class_Str var81;
+var81.buf = NULL;
+struct class_Type_87e1ce5c5e var82;
+var82.membernum = -1;
+struct class_Type_87e1ce5c5e var83;
+var83.membernum = -1;
+struct class_List_Type__057f9c6088* var84;
+var84 = NULL;
+struct class_Builtins_bd980a9f08* var85;
+var85 = NULL;
+struct class_Type_87e1ce5c5e var86;
+var86.membernum = -1;
+struct class__null___Type__8438ac3dcf var87;
+var87.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var88;
+var88 = NULL;
+struct class_Method_bfbd73ad15* var89;
+var89 = NULL;
+struct class_List_FuncOrMethodDef__af5379b09e* var90;
+var90 = NULL;
+int64_t var91;
+struct class_FuncOrMethodDef_533c7b75ab* var93;
+var93 = NULL;
+struct class_Location_500c4434c9* var95;
+var95 = NULL;
+struct class_List_TypeAndName__74be4dae93* var96;
+var96 = NULL;
+int64_t var97;
+struct class_Str var98;
+var98.buf = NULL;
+struct class_NamedType_0d620e38a7* var99;
+var99 = NULL;
+struct class_Str var100;
+var100.buf = NULL;
+struct class_Type_e6cf7dd4e5 var101;
+var101.membernum = -1;
+struct class_TypeAndName_fec99b5f94* var102;
+var102 = NULL;
+struct class__null___BasicType__3303ac43c9 var103;
+var103.membernum = -1;
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) goto label4;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) goto label5;
+
+            var3 = (
+                var2.membernum == 2
+            );
+            if (var3) goto label6;
+
+            var3 = (
+                var2.membernum == 3
+            );
+            if (var3) goto label6;
+label4: (void)0;
+
+            if (var2.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var7 = var2.val.item1;
+            incref(var7);
+var8 = oomph_null;
+var9 = (struct class__null___BasicType__3303ac43c9){ .val = { .item0 = var8 }, .membernum = 0 };
+meth_FileConverter_c79636dcc7_func_or_meth_step3(var1,var7,var9);
+if (oomph_true) goto label10;
+label5: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var11 = var2.val.item0;
+            incref(var11);
+var12 = oomph_false;
+var13 = var1->memb_types;
+incref(var13);
+var14 = 0LL;
+label15: (void)0;
+if (var14 >= var13->len) goto label17;
+var16 = var13->data[var14++];
+string_decref(var18);
+var18.buf = NULL;
+var18 = var16->memb_name;
+string_incref(var18);
+string_decref(var19);
+var19.buf = NULL;
+var19 = var11->memb_name;
+string_incref(var19);
+var20 = meth_Str_equals(var18,var19);
+if (var20) goto label21;
+if (oomph_true) goto label22;
+label21: (void)0;
+var23 = var16->memb_type;
+incref_Type_87e1ce5c5e(var23);
+
+            if (var23.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var24 = var23.val.item1;
+            incref(var24);
+var25 = oomph_true;
+var12 = var25;
+if (oomph_true) goto label17;
+label22: (void)0;
+if (oomph_true) goto label15;
+label17: (void)0;
+var26 = string1_self_hosted_ast2ir_oomph_9b4ddfeec7; string_incref(var26);
+var27 = 1123LL;
+oomph_assert(var12,var26,var27);
+var28 = var24->memb_members;
+incref(var28);
+var29 = var11->memb_members;
+incref(var29);
+var30 = ctor_List_Member__7525bf27e3();
+var31 = meth_List_TypeAndName__74be4dae93_length(var29);
+meth_List_Member__7525bf27e3___reserve(var30,var31);
+var32 = 0LL;
+label33: (void)0;
+if (var32 >= var29->len) goto label35;
+decref((var34), dtor_TypeAndName_fec99b5f94); var34 = var29->data[var32++]; incref(var34);
+string_decref(var36);
+var36.buf = NULL;
+var36 = var34->memb_name;
+string_incref(var36);
+decref_Type_e6cf7dd4e5(var37);
+var37.membernum = -1;
+var37 = var34->memb_type;
+incref_Type_e6cf7dd4e5(var37);
+var38 = oomph_null;
+decref_Type_87e1ce5c5e(var39);
+var39.membernum = -1;
+decref__null___FunctionOrMethodConverter__7dc768c0a0(var40);
+var40.membernum = -1;
+var40 = (struct class__null___FunctionOrMethodConverter__7dc768c0a0){ .val = { .item0 = var38 }, .membernum = 0 };
+var39 = meth_FileConverter_c79636dcc7_get_type(var1,var37,var40);
+decref((var41), dtor_Member_a3dd2b1b39);
+var41 = NULL;
+var41 = ctor_Member_a3dd2b1b39(var36,var39);
+meth_List_Member__7525bf27e3_push(var30,var41);
+if (oomph_true) goto label33;
+label35: (void)0;
+meth_List_Member__7525bf27e3_push_all(var28,var30);
+var42 = ctor_List_Type__057f9c6088();
+var43 = (struct class__null___List_Type___114a421a91){ .val = { .item1 = var42 }, .membernum = 1 };
+var42 = NULL;
+var44 = var24->memb_constructor_argtypes;
+var24->memb_constructor_argtypes = var43;
+var43.membernum = -1;
+var45 = var24->memb_constructor_argtypes;
+incref__null___List_Type___114a421a91(var45);
+var46 = meth__null___List_Type___114a421a91_get(var45);
+var47 = var24->memb_members;
+incref(var47);
+var48 = ctor_List_Type__057f9c6088();
+var49 = meth_List_Member__7525bf27e3_length(var47);
+meth_List_Type__057f9c6088___reserve(var48,var49);
+var50 = 0LL;
+label51: (void)0;
+if (var50 >= var47->len) goto label53;
+var52 = var47->data[var50++];
+decref_Type_87e1ce5c5e(var54);
+var54.membernum = -1;
+var54 = var52->memb_type;
+incref_Type_87e1ce5c5e(var54);
+meth_List_Type__057f9c6088_push(var48,var54);
+if (oomph_true) goto label51;
+label53: (void)0;
+meth_List_Type__057f9c6088_push_all(var46,var48);
+var55 = var24->memb_create_to_string_method;
+if (var55) goto label56;
+if (oomph_true) goto label57;
+label56: (void)0;
+var58 = var24->memb_methods;
+incref(var58);
+var59 = string9_to_string_0c1dadc6d5; string_incref(var59);
+var60 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var24 }, .membernum = 1 };
+incref(var24);
+var61 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var61,var60);
+var62 = var1->memb_builtins;
+var63 = var62->memb_STR;
+var62 = NULL;
+incref_Type_87e1ce5c5e(var63);
+var64 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var63 }, .membernum = 1 };
+var63.membernum = -1;
+var65 = ctor_FunctionType_4e16d0ea53(var61,var64);
+var66 = ctor_Method_bfbd73ad15(var59,var65);
+meth_List_Method__1e0ab9c757_push(var58,var66);
+label57: (void)0;
+var67 = string10_equals_d07c59c1ca; string_incref(var67);
+var68 = var11->memb_body;
+incref(var68);
+var69 = ctor_List_Str__43b70c06cb();
+var70 = meth_List_FuncOrMethodDef__af5379b09e_length(var68);
+meth_List_Str__43b70c06cb___reserve(var69,var70);
+var71 = 0LL;
+label72: (void)0;
+if (var71 >= var68->len) goto label74;
+var73 = var68->data[var71++];
+string_decref(var75);
+var75.buf = NULL;
+var75 = var73->memb_name;
+string_incref(var75);
+meth_List_Str__43b70c06cb_push(var69,var75);
+if (oomph_true) goto label72;
+label74: (void)0;
+var76 = meth_List_Str__43b70c06cb___contains(var69,var67);
+var77 = oomph_bool_not(var76);
+if (var77) goto label78;
+if (oomph_true) goto label79;
+label78: (void)0;
+var80 = var24->memb_methods;
+incref(var80);
+var81 = string10_equals_d07c59c1ca; string_incref(var81);
+var82 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var24 }, .membernum = 1 };
+incref(var24);
+var83 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var24 }, .membernum = 1 };
+incref(var24);
+var84 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var84,var82);
+meth_List_Type__057f9c6088_push(var84,var83);
+var85 = var1->memb_builtins;
+var86 = var85->memb_BOOL;
+var85 = NULL;
+incref_Type_87e1ce5c5e(var86);
+var87 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var86 }, .membernum = 1 };
+var86.membernum = -1;
+var88 = ctor_FunctionType_4e16d0ea53(var84,var87);
+var89 = ctor_Method_bfbd73ad15(var81,var88);
+meth_List_Method__1e0ab9c757_push(var80,var89);
+label79: (void)0;
+var90 = var11->memb_body;
+incref(var90);
+var91 = 0LL;
+label92: (void)0;
+if (var91 >= var90->len) goto label94;
+decref((var93), dtor_FuncOrMethodDef_533c7b75ab); var93 = var90->data[var91++]; incref(var93);
+decref((var95), dtor_Location_500c4434c9);
+var95 = NULL;
+var95 = var11->memb_location;
+incref(var95);
+decref((var96), dtor_List_TypeAndName__74be4dae93);
+var96 = NULL;
+var96 = var93->memb_args;
+incref(var96);
+var97 = 0LL;
+string_decref(var98);
+var98.buf = NULL;
+var98 = var24->memb_name;
+string_incref(var98);
+var99 = ctor_NamedType_0d620e38a7(var95,var98);
+string_decref(var100);
+var100.buf = NULL;
+var100 = string11_self_87e957c1c5; string_incref(var100);
+decref_Type_e6cf7dd4e5(var101);
+var101.membernum = -1;
+var101 = (struct class_Type_e6cf7dd4e5){ .val = { .item2 = var99 }, .membernum = 2 };
+var99 = NULL;
+decref((var102), dtor_TypeAndName_fec99b5f94);
+var102 = NULL;
+var102 = ctor_TypeAndName_fec99b5f94(var101,var100,var95);
+meth_List_TypeAndName__74be4dae93_insert(var96,var97,var102);
+decref__null___BasicType__3303ac43c9(var103);
+var103.membernum = -1;
+var103 = (struct class__null___BasicType__3303ac43c9){ .val = { .item1 = var24 }, .membernum = 1 };
+incref(var24);
+meth_FileConverter_c79636dcc7_func_or_meth_step3(var1,var93,var103);
+if (oomph_true) goto label92;
+label94: (void)0;
+if (oomph_true) goto label10;
+label6: (void)0;
+label10: (void)0;
+out: (void)0;
+decref__null___BasicType__3303ac43c9(var103);
+decref((var102), dtor_TypeAndName_fec99b5f94);
+decref_Type_e6cf7dd4e5(var101);
+string_decref(var100);
+decref((var99), dtor_NamedType_0d620e38a7);
+string_decref(var98);
+(void)0;
+decref((var96), dtor_List_TypeAndName__74be4dae93);
+decref((var95), dtor_Location_500c4434c9);
+decref((var93), dtor_FuncOrMethodDef_533c7b75ab);
+(void)0;
+decref((var90), dtor_List_FuncOrMethodDef__af5379b09e);
+decref((var89), dtor_Method_bfbd73ad15);
+decref((var88), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var87);
+decref_Type_87e1ce5c5e(var86);
+decref((var85), dtor_Builtins_bd980a9f08);
+decref((var84), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var83);
+decref_Type_87e1ce5c5e(var82);
+string_decref(var81);
+decref((var80), dtor_List_Method__1e0ab9c757);
+(void)0;
+(void)0;
+string_decref(var75);
+(void)0;
+(void)0;
+decref((var69), dtor_List_Str__43b70c06cb);
+decref((var68), dtor_List_FuncOrMethodDef__af5379b09e);
+string_decref(var67);
+decref((var66), dtor_Method_bfbd73ad15);
+decref((var65), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var64);
+decref_Type_87e1ce5c5e(var63);
+decref((var62), dtor_Builtins_bd980a9f08);
+decref((var61), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var60);
+string_decref(var59);
+decref((var58), dtor_List_Method__1e0ab9c757);
+(void)0;
+decref_Type_87e1ce5c5e(var54);
+(void)0;
+(void)0;
+decref((var48), dtor_List_Type__057f9c6088);
+decref((var47), dtor_List_Member__7525bf27e3);
+decref((var46), dtor_List_Type__057f9c6088);
+decref__null___List_Type___114a421a91(var45);
+decref__null___List_Type___114a421a91(var44);
+decref__null___List_Type___114a421a91(var43);
+decref((var42), dtor_List_Type__057f9c6088);
+decref((var41), dtor_Member_a3dd2b1b39);
+decref__null___FunctionOrMethodConverter__7dc768c0a0(var40);
+decref_Type_87e1ce5c5e(var39);
+(void)0;
+decref_Type_e6cf7dd4e5(var37);
+string_decref(var36);
+decref((var34), dtor_TypeAndName_fec99b5f94);
+(void)0;
+(void)0;
+decref((var30), dtor_List_Member__7525bf27e3);
+decref((var29), dtor_List_TypeAndName__74be4dae93);
+decref((var28), dtor_List_Member__7525bf27e3);
+(void)0;
+string_decref(var26);
+(void)0;
+decref((var24), dtor_BasicType_899b9c9f8e);
+decref_Type_87e1ce5c5e(var23);
+(void)0;
+string_decref(var19);
+string_decref(var18);
+(void)0;
+decref((var13), dtor_List_NamedType__d1143722a6);
+(void)0;
+decref((var11), dtor_ClassDef_ac59c4b64c);
+decref__null___BasicType__3303ac43c9(var9);
+(void)0;
+decref((var7), dtor_FuncOrMethodDef_533c7b75ab);
+(void)0;
+}struct class_ToplevelDeclaration_5505a52ad0 meth_FileConverter_c79636dcc7_func_or_meth_step4(struct class_FileConverter_c79636dcc7* var1, struct class_FuncOrMethodDef_533c7b75ab* var2, struct class__null___Type__8438ac3dcf var3){char var4;
+struct class__null___Type__8438ac3dcf var5;
+var5.membernum = -1;
+bool var6;
+struct class_Type_87e1ce5c5e var8;
+var8.membernum = -1;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Builtins_bd980a9f08* var10;
+var10 = NULL;
+struct class_FunctionType_4e16d0ea53* var11;
+var11 = NULL;
+struct class_FunctionType_4e16d0ea53* var12;
+var12 = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+char var15;
+struct class__null___Location__87aaae6467 var16;
+var16.membernum = -1;
+struct class_Variable_1aaa81c8d2 var17;
+var17.membernum = -1;
+struct class_Type_87e1ce5c5e var18;
+var18.membernum = -1;
+struct class_List_NamedVariable__2ad9e9e312* var19;
+var19 = NULL;
+struct class_List_NamedVariable__2ad9e9e312* var20;
+var20 = NULL;
+struct class_List_NamedVariable__2ad9e9e312* var21;
+var21 = NULL;
+struct class_List_LocalVariable__81e23234f3* var22;
+var22 = NULL;
+struct class_List_Instruction__6e475c861a* var23;
+var23 = NULL;
+int64_t var24;
+struct class_List_TypeAndName__74be4dae93* var25;
+var25 = NULL;
+int64_t var26;
+struct class_List_Type__057f9c6088* var27;
+var27 = NULL;
+int64_t var28;
+bool var29;
+struct class_Str var30;
+var30.buf = NULL;
+int64_t var31;
+int64_t var32;
+struct class_List_TypeAndName__74be4dae93* var34;
+var34 = NULL;
+int64_t var35;
+bool var36;
+bool var37;
+struct class_List_TypeAndName__74be4dae93* var39;
+var39 = NULL;
+struct class_TypeAndName_fec99b5f94* var40;
+var40 = NULL;
+struct class_Str var41;
+var41.buf = NULL;
+struct class_List_TypeAndName__74be4dae93* var42;
+var42 = NULL;
+struct class_TypeAndName_fec99b5f94* var43;
+var43 = NULL;
+struct class_Location_500c4434c9* var44;
+var44 = NULL;
+struct class_List_Type__057f9c6088* var45;
+var45 = NULL;
+struct class_Type_87e1ce5c5e var46;
+var46.membernum = -1;
+int64_t var47;
+int64_t var48;
+struct class_LocalVariable_846080e5ae* var49;
+var49 = NULL;
+struct class_LocalVariable_846080e5ae* var50;
+var50 = NULL;
+int64_t var51;
+int64_t var52;
+struct class_Variable_1aaa81c8d2 var53;
+var53.membernum = -1;
+struct class_VarCpy_e77a538911* var54;
+var54 = NULL;
+struct class_Instruction_b0fafb4d55 var55;
+var55.membernum = -1;
+struct class_IncRef_54322428a7* var56;
+var56 = NULL;
+struct class_Instruction_b0fafb4d55 var57;
+var57.membernum = -1;
+int64_t var58;
+struct class_NamedVariable_ac0761c28d* var60;
+var60 = NULL;
+struct class_Str var62;
+var62.buf = NULL;
+bool var63;
+bool var64;
+struct class_Str var65;
+var65.buf = NULL;
+int64_t var66;
+struct class_Variable_1aaa81c8d2 var67;
+var67.membernum = -1;
+struct class_NamedVariable_ac0761c28d* var68;
+var68 = NULL;
+int64_t var69;
+int64_t var70;
+struct class_Builtins_bd980a9f08* var71;
+var71 = NULL;
+struct class__null___Type__8438ac3dcf var72;
+var72.membernum = -1;
+struct class_List_LoopLabels__74a48e6cc9* var73;
+var73 = NULL;
+struct class_List_Instruction__6e475c861a* var74;
+var74 = NULL;
+struct class_List_List_Instruction___d2e1d3bdd4* var75;
+var75 = NULL;
+struct class_List_AutoTypeNode__28b2c8eb14* var76;
+var76 = NULL;
+int64_t var77;
+int64_t var78;
+struct class_FunctionOrMethodConverter_14d05c56fc* var79;
+var79 = NULL;
+struct class_List_Statement__5d7503c104* var80;
+var80 = NULL;
+int64_t var81;
+struct class_Statement_1dc2e7090f var83;
+var83.membernum = -1;
+struct class_List_Instruction__6e475c861a* var85;
+var85 = NULL;
+char var86;
+struct class__null___Type__8438ac3dcf var87;
+var87.membernum = -1;
+bool var88;
+struct class_Str var90;
+var90.buf = NULL;
+struct class_MethodDef_28b65923b5* var91;
+var91 = NULL;
+struct class_ToplevelDeclaration_5505a52ad0 var92;
+var92.membernum = -1;
+struct class_FileVariable_a7b8ca651f* var93;
+var93 = NULL;
+struct class_FuncDef_2bd6886a53* var94;
+var94 = NULL;
+struct class_ToplevelDeclaration_5505a52ad0 var95;
+var95.membernum = -1;
+struct class_ToplevelDeclaration_5505a52ad0 retval;
+var4 = oomph_null;
+var5 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var4 }, .membernum = 0 };
+var6 = meth__null___Type__8438ac3dcf_equals(var3,var5);
+if (var6) goto label7;
+var8 = meth__null___Type__8438ac3dcf_get(var3);
+var9 = var2->memb_name;
+string_incref(var9);
+var10 = var1->memb_builtins;
+incref(var10);
+var11 = ir_4b1a3e0393_get_method(var8,var9,var10);
+var12 = var11;
+var11 = NULL;
+if (oomph_true) goto label13;
+label7: (void)0;
+var14 = var2->memb_name;
+string_incref(var14);
+var15 = oomph_null;
+var16 = (struct class__null___Location__87aaae6467){ .val = { .item0 = var15 }, .membernum = 0 };
+var17 = meth_FileConverter_c79636dcc7_get_var(var1,var14,var16);
+var18 = ir_4b1a3e0393_var_type(var17);
+
+            if (var18.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var12 = var18.val.item2;
+            incref(var12);
+label13: (void)0;
+var19 = var1->memb_variables;
+incref(var19);
+var20 = meth_List_NamedVariable__2ad9e9e312_reversed(var19);
+var21 = meth_List_NamedVariable__2ad9e9e312_reversed(var20);
+var22 = ctor_List_LocalVariable__81e23234f3();
+var23 = ctor_List_Instruction__6e475c861a();
+var24 = 0LL;
+var25 = var2->memb_args;
+incref(var25);
+var26 = meth_List_TypeAndName__74be4dae93_length(var25);
+var27 = var12->memb_argtypes;
+incref(var27);
+var28 = meth_List_Type__057f9c6088_length(var27);
+var29 = meth_Int_equals(var26,var28);
+var30 = string1_self_hosted_ast2ir_oomph_9b4ddfeec7; string_incref(var30);
+var31 = 1176LL;
+oomph_assert(var29,var30,var31);
+var32 = 0LL;
+label33: (void)0;
+decref((var34), dtor_List_TypeAndName__74be4dae93);
+var34 = NULL;
+var34 = var2->memb_args;
+incref(var34);
+var35 = meth_List_TypeAndName__74be4dae93_length(var34);
+var36 = oomph_int_gt(var35,var32);
+var37 = oomph_bool_not(var36);
+if (var37) goto label38;
+decref((var39), dtor_List_TypeAndName__74be4dae93);
+var39 = NULL;
+var39 = var2->memb_args;
+incref(var39);
+decref((var40), dtor_TypeAndName_fec99b5f94);
+var40 = NULL;
+var40 = meth_List_TypeAndName__74be4dae93_get(var39,var32);
+string_decref(var41);
+var41.buf = NULL;
+var41 = var40->memb_name;
+string_incref(var41);
+decref((var42), dtor_List_TypeAndName__74be4dae93);
+var42 = NULL;
+var42 = var2->memb_args;
+incref(var42);
+decref((var43), dtor_TypeAndName_fec99b5f94);
+var43 = NULL;
+var43 = meth_List_TypeAndName__74be4dae93_get(var42,var32);
+decref((var44), dtor_Location_500c4434c9);
+var44 = NULL;
+var44 = var43->memb_name_location;
+incref(var44);
+decref((var45), dtor_List_Type__057f9c6088);
+var45 = NULL;
+var45 = var12->memb_argtypes;
+incref(var45);
+decref_Type_87e1ce5c5e(var46);
+var46.membernum = -1;
+var46 = meth_List_Type__057f9c6088_get(var45,var32);
+var47 = 1LL;
+var48 = oomph_int_add(var24,var47);
+var24 = var48;
+var49 = ctor_LocalVariable_846080e5ae(var46,var24,var44);
+meth_List_LocalVariable__81e23234f3_push(var22,var49);
+var50 = ctor_LocalVariable_846080e5ae(var46,var24,var44);
+var51 = 1LL;
+var52 = oomph_int_add(var24,var51);
+var24 = var52;
+decref_Variable_1aaa81c8d2(var53);
+var53.membernum = -1;
+var53 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var49 }, .membernum = 2 };
+var49 = NULL;
+var54 = ctor_VarCpy_e77a538911(var50,var53);
+decref_Instruction_b0fafb4d55(var55);
+var55.membernum = -1;
+var55 = (struct class_Instruction_b0fafb4d55){ .val = { .item18 = var54 }, .membernum = 18 };
+var54 = NULL;
+meth_List_Instruction__6e475c861a_push(var23,var55);
+var56 = ctor_IncRef_54322428a7(var50);
+decref_Instruction_b0fafb4d55(var57);
+var57.membernum = -1;
+var57 = (struct class_Instruction_b0fafb4d55){ .val = { .item8 = var56 }, .membernum = 8 };
+var56 = NULL;
+meth_List_Instruction__6e475c861a_push(var23,var57);
+var58 = 0LL;
+label59: (void)0;
+if (var58 >= var21->len) goto label61;
+var60 = var21->data[var58++];
+string_decref(var62);
+var62.buf = NULL;
+var62 = var60->memb_name;
+string_incref(var62);
+var63 = meth_Str_equals(var62,var41);
+var64 = oomph_bool_not(var63);
+string_decref(var65);
+var65.buf = NULL;
+var65 = string1_self_hosted_ast2ir_oomph_9b4ddfeec7; string_incref(var65);
+var66 = 1194LL;
+oomph_assert(var64,var65,var66);
+if (oomph_true) goto label59;
+label61: (void)0;
+decref_Variable_1aaa81c8d2(var67);
+var67.membernum = -1;
+var67 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var50 }, .membernum = 2 };
+var50 = NULL;
+decref((var68), dtor_NamedVariable_ac0761c28d);
+var68 = NULL;
+var68 = ctor_NamedVariable_ac0761c28d(var41,var67);
+meth_List_NamedVariable__2ad9e9e312_push(var21,var68);
+var69 = 1LL;
+var70 = oomph_int_add(var32,var69);
+var32 = var70;
+if (oomph_true) goto label33;
+label38: (void)0;
+var71 = var1->memb_builtins;
+incref(var71);
+var72 = var12->memb_returntype;
+incref__null___Type__8438ac3dcf(var72);
+var73 = ctor_List_LoopLabels__74a48e6cc9();
+var74 = ctor_List_Instruction__6e475c861a();
+var75 = ctor_List_List_Instruction___d2e1d3bdd4();
+var76 = ctor_List_AutoTypeNode__28b2c8eb14();
+var77 = 0LL;
+var78 = 0LL;
+var79 = ctor_FunctionOrMethodConverter_14d05c56fc(var71,var1,var21,var72,var73,var74,var75,var76,var77,var78,var24);
+var80 = var2->memb_body;
+incref(var80);
+var81 = 0LL;
+label82: (void)0;
+if (var81 >= var80->len) goto label84;
+decref_Statement_1dc2e7090f(var83); var83 = var80->data[var81++]; incref_Statement_1dc2e7090f(var83);
+meth_FunctionOrMethodConverter_14d05c56fc_do_statement(var79,var83);
+if (oomph_true) goto label82;
+label84: (void)0;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_everywhere(var79);
+var85 = var79->memb_code;
+incref(var85);
+meth_List_Instruction__6e475c861a_push_all(var23,var85);
+var86 = oomph_null;
+var87 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var86 }, .membernum = 0 };
+var88 = meth__null___Type__8438ac3dcf_equals(var3,var87);
+if (var88) goto label89;
+var90 = var2->memb_name;
+string_incref(var90);
+var91 = ctor_MethodDef_28b65923b5(var90,var12,var22,var23);
+var92 = (struct class_ToplevelDeclaration_5505a52ad0){ .val = { .item1 = var91 }, .membernum = 1 };
+var91 = NULL;
+retval = var92; var92.membernum = -1;
+goto out;
+label89: (void)0;
+
+            if (var17.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var93 = var17.val.item1;
+            incref(var93);
+var94 = ctor_FuncDef_2bd6886a53(var93,var22,var23);
+var95 = (struct class_ToplevelDeclaration_5505a52ad0){ .val = { .item0 = var94 }, .membernum = 0 };
+var94 = NULL;
+retval = var95; var95.membernum = -1;
+goto out;
+label96: (void)0;
+out: (void)0;
+decref_ToplevelDeclaration_5505a52ad0(var95);
+decref((var94), dtor_FuncDef_2bd6886a53);
+decref((var93), dtor_FileVariable_a7b8ca651f);
+decref_ToplevelDeclaration_5505a52ad0(var92);
+decref((var91), dtor_MethodDef_28b65923b5);
+string_decref(var90);
+(void)0;
+decref__null___Type__8438ac3dcf(var87);
+(void)0;
+decref((var85), dtor_List_Instruction__6e475c861a);
+decref_Statement_1dc2e7090f(var83);
+(void)0;
+decref((var80), dtor_List_Statement__5d7503c104);
+decref((var79), dtor_FunctionOrMethodConverter_14d05c56fc);
+(void)0;
+(void)0;
+decref((var76), dtor_List_AutoTypeNode__28b2c8eb14);
+decref((var75), dtor_List_List_Instruction___d2e1d3bdd4);
+decref((var74), dtor_List_Instruction__6e475c861a);
+decref((var73), dtor_List_LoopLabels__74a48e6cc9);
+decref__null___Type__8438ac3dcf(var72);
+decref((var71), dtor_Builtins_bd980a9f08);
+(void)0;
+(void)0;
+decref((var68), dtor_NamedVariable_ac0761c28d);
+decref_Variable_1aaa81c8d2(var67);
+(void)0;
+string_decref(var65);
+(void)0;
+(void)0;
+string_decref(var62);
+(void)0;
+decref_Instruction_b0fafb4d55(var57);
+decref((var56), dtor_IncRef_54322428a7);
+decref_Instruction_b0fafb4d55(var55);
+decref((var54), dtor_VarCpy_e77a538911);
+decref_Variable_1aaa81c8d2(var53);
+(void)0;
+(void)0;
+decref((var50), dtor_LocalVariable_846080e5ae);
+decref((var49), dtor_LocalVariable_846080e5ae);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var46);
+decref((var45), dtor_List_Type__057f9c6088);
+decref((var44), dtor_Location_500c4434c9);
+decref((var43), dtor_TypeAndName_fec99b5f94);
+decref((var42), dtor_List_TypeAndName__74be4dae93);
+string_decref(var41);
+decref((var40), dtor_TypeAndName_fec99b5f94);
+decref((var39), dtor_List_TypeAndName__74be4dae93);
+(void)0;
+(void)0;
+(void)0;
+decref((var34), dtor_List_TypeAndName__74be4dae93);
+(void)0;
+(void)0;
+string_decref(var30);
+(void)0;
+(void)0;
+decref((var27), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var25), dtor_List_TypeAndName__74be4dae93);
+(void)0;
+decref((var23), dtor_List_Instruction__6e475c861a);
+decref((var22), dtor_List_LocalVariable__81e23234f3);
+decref((var21), dtor_List_NamedVariable__2ad9e9e312);
+decref((var20), dtor_List_NamedVariable__2ad9e9e312);
+decref((var19), dtor_List_NamedVariable__2ad9e9e312);
+decref_Type_87e1ce5c5e(var18);
+decref_Variable_1aaa81c8d2(var17);
+decref__null___Location__87aaae6467(var16);
+(void)0;
+string_decref(var14);
+decref((var12), dtor_FunctionType_4e16d0ea53);
+decref((var11), dtor_FunctionType_4e16d0ea53);
+decref((var10), dtor_Builtins_bd980a9f08);
+string_decref(var9);
+decref_Type_87e1ce5c5e(var8);
+(void)0;
+decref__null___Type__8438ac3dcf(var5);
+(void)0;
+return retval;
+}struct class_List_ToplevelDeclaration__35f88ef566* meth_FileConverter_c79636dcc7_do_step4(struct class_FileConverter_c79636dcc7* var1, struct class_ToplevelDeclaration_054352d1cf var2){bool var3;
+struct class_ClassDef_ac59c4b64c* var7;
+var7 = NULL;
+bool var8;
+struct class_List_NamedType__d1143722a6* var9;
+var9 = NULL;
+int64_t var10;
+struct class_NamedType_fe3e45e722* var12;
+var12 = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+bool var16;
+struct class_Type_87e1ce5c5e var19;
+var19.membernum = -1;
+bool var20;
+struct class_Str var21;
+var21.buf = NULL;
+int64_t var22;
+struct class_List_ToplevelDeclaration__35f88ef566* var23;
+var23 = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_List_FuncOrMethodDef__af5379b09e* var25;
+var25 = NULL;
+struct class_List_Str__43b70c06cb* var26;
+var26 = NULL;
+int64_t var27;
+int64_t var28;
+struct class_FuncOrMethodDef_533c7b75ab* var30;
+var30 = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+bool var33;
+bool var34;
+struct class_Builtins_bd980a9f08* var37;
+var37 = NULL;
+struct class_Location_500c4434c9* var38;
+var38 = NULL;
+struct class_MethodDef_28b65923b5* var39;
+var39 = NULL;
+struct class_ToplevelDeclaration_5505a52ad0 var40;
+var40.membernum = -1;
+struct class_List_FuncOrMethodDef__af5379b09e* var41;
+var41 = NULL;
+int64_t var42;
+struct class_FuncOrMethodDef_533c7b75ab* var44;
+var44 = NULL;
+struct class_ToplevelDeclaration_5505a52ad0 var46;
+var46.membernum = -1;
+struct class__null___Type__8438ac3dcf var47;
+var47.membernum = -1;
+struct class_MethodDef_28b65923b5* var48;
+var48 = NULL;
+struct class_ToplevelDeclaration_5505a52ad0 var49;
+var49.membernum = -1;
+struct class_List_Symbol__9a01330177* var50;
+var50 = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+struct class_Str var52;
+var52.buf = NULL;
+struct class_SymbolValue_b2eed984e4 var53;
+var53.membernum = -1;
+struct class_Symbol_037dd39afd* var54;
+var54 = NULL;
+struct class_FuncOrMethodDef_533c7b75ab* var55;
+var55 = NULL;
+char var56;
+struct class__null___Type__8438ac3dcf var57;
+var57.membernum = -1;
+struct class_ToplevelDeclaration_5505a52ad0 var58;
+var58.membernum = -1;
+struct class_List_ToplevelDeclaration__35f88ef566* var59;
+var59 = NULL;
+struct class_List_ToplevelDeclaration__35f88ef566* var60;
+var60 = NULL;
+struct class_List_ToplevelDeclaration__35f88ef566* retval;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) goto label4;
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) goto label5;
+
+            var3 = (
+                var2.membernum == 2
+            );
+            if (var3) goto label6;
+
+            var3 = (
+                var2.membernum == 3
+            );
+            if (var3) goto label6;
+label4: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var7 = var2.val.item0;
+            incref(var7);
+var8 = oomph_false;
+var9 = var1->memb_types;
+incref(var9);
+var10 = 0LL;
+label11: (void)0;
+if (var10 >= var9->len) goto label13;
+var12 = var9->data[var10++];
+string_decref(var14);
+var14.buf = NULL;
+var14 = var12->memb_name;
+string_incref(var14);
+string_decref(var15);
+var15.buf = NULL;
+var15 = var7->memb_name;
+string_incref(var15);
+var16 = meth_Str_equals(var14,var15);
+if (var16) goto label17;
+if (oomph_true) goto label18;
+label17: (void)0;
+var19 = var12->memb_type;
+incref_Type_87e1ce5c5e(var19);
+var20 = oomph_true;
+var8 = var20;
+if (oomph_true) goto label13;
+label18: (void)0;
+if (oomph_true) goto label11;
+label13: (void)0;
+var21 = string1_self_hosted_ast2ir_oomph_9b4ddfeec7; string_incref(var21);
+var22 = 1226LL;
+oomph_assert(var8,var21,var22);
+var23 = ctor_List_ToplevelDeclaration__35f88ef566();
+var24 = string10_equals_d07c59c1ca; string_incref(var24);
+var25 = var7->memb_body;
+incref(var25);
+var26 = ctor_List_Str__43b70c06cb();
+var27 = meth_List_FuncOrMethodDef__af5379b09e_length(var25);
+meth_List_Str__43b70c06cb___reserve(var26,var27);
+var28 = 0LL;
+label29: (void)0;
+if (var28 >= var25->len) goto label31;
+var30 = var25->data[var28++];
+string_decref(var32);
+var32.buf = NULL;
+var32 = var30->memb_name;
+string_incref(var32);
+meth_List_Str__43b70c06cb_push(var26,var32);
+if (oomph_true) goto label29;
+label31: (void)0;
+var33 = meth_List_Str__43b70c06cb___contains(var26,var24);
+var34 = oomph_bool_not(var33);
+if (var34) goto label35;
+if (oomph_true) goto label36;
+label35: (void)0;
+var37 = var1->memb_builtins;
+incref(var37);
+var38 = var7->memb_location;
+incref(var38);
+var39 = ast2ir_d819fcc31b_create_pointers_equal_method(var37,var19,var38);
+var40 = (struct class_ToplevelDeclaration_5505a52ad0){ .val = { .item1 = var39 }, .membernum = 1 };
+var39 = NULL;
+meth_List_ToplevelDeclaration__35f88ef566_push(var23,var40);
+label36: (void)0;
+var41 = var7->memb_body;
+incref(var41);
+var42 = 0LL;
+label43: (void)0;
+if (var42 >= var41->len) goto label45;
+decref((var44), dtor_FuncOrMethodDef_533c7b75ab); var44 = var41->data[var42++]; incref(var44);
+decref_ToplevelDeclaration_5505a52ad0(var46);
+var46.membernum = -1;
+decref__null___Type__8438ac3dcf(var47);
+var47.membernum = -1;
+var47 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var19 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var19);
+var46 = meth_FileConverter_c79636dcc7_func_or_meth_step4(var1,var44,var47);
+
+            if (var46.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var48 = var46.val.item1;
+            incref(var48);
+decref_ToplevelDeclaration_5505a52ad0(var49);
+var49.membernum = -1;
+var49 = (struct class_ToplevelDeclaration_5505a52ad0){ .val = { .item1 = var48 }, .membernum = 1 };
+var48 = NULL;
+meth_List_ToplevelDeclaration__35f88ef566_push(var23,var49);
+if (oomph_true) goto label43;
+label45: (void)0;
+var50 = var1->memb_symbols;
+incref(var50);
+var51 = var1->memb_path;
+string_incref(var51);
+var52 = var7->memb_name;
+string_incref(var52);
+var53 = (struct class_SymbolValue_b2eed984e4){ .val = { .item0 = var19 }, .membernum = 0 };
+var19.membernum = -1;
+var54 = ctor_Symbol_037dd39afd(var51,var52,var53);
+meth_List_Symbol__9a01330177_push(var50,var54);
+retval = var23; var23 = NULL;
+goto out;
+label5: (void)0;
+
+            if (var2.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var55 = var2.val.item1;
+            incref(var55);
+var56 = oomph_null;
+var57 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var56 }, .membernum = 0 };
+var58 = meth_FileConverter_c79636dcc7_func_or_meth_step4(var1,var55,var57);
+var59 = ctor_List_ToplevelDeclaration__35f88ef566();
+meth_List_ToplevelDeclaration__35f88ef566_push(var59,var58);
+retval = var59; var59 = NULL;
+goto out;
+label6: (void)0;
+var60 = ctor_List_ToplevelDeclaration__35f88ef566();
+retval = var60; var60 = NULL;
+goto out;
+label61: (void)0;
+out: (void)0;
+decref((var60), dtor_List_ToplevelDeclaration__35f88ef566);
+decref((var59), dtor_List_ToplevelDeclaration__35f88ef566);
+decref_ToplevelDeclaration_5505a52ad0(var58);
+decref__null___Type__8438ac3dcf(var57);
+(void)0;
+decref((var55), dtor_FuncOrMethodDef_533c7b75ab);
+decref((var54), dtor_Symbol_037dd39afd);
+decref_SymbolValue_b2eed984e4(var53);
+string_decref(var52);
+string_decref(var51);
+decref((var50), dtor_List_Symbol__9a01330177);
+decref_ToplevelDeclaration_5505a52ad0(var49);
+decref((var48), dtor_MethodDef_28b65923b5);
+decref__null___Type__8438ac3dcf(var47);
+decref_ToplevelDeclaration_5505a52ad0(var46);
+decref((var44), dtor_FuncOrMethodDef_533c7b75ab);
+(void)0;
+decref((var41), dtor_List_FuncOrMethodDef__af5379b09e);
+decref_ToplevelDeclaration_5505a52ad0(var40);
+decref((var39), dtor_MethodDef_28b65923b5);
+decref((var38), dtor_Location_500c4434c9);
+decref((var37), dtor_Builtins_bd980a9f08);
+(void)0;
+(void)0;
+string_decref(var32);
+(void)0;
+(void)0;
+decref((var26), dtor_List_Str__43b70c06cb);
+decref((var25), dtor_List_FuncOrMethodDef__af5379b09e);
+string_decref(var24);
+decref((var23), dtor_List_ToplevelDeclaration__35f88ef566);
+(void)0;
+string_decref(var21);
+(void)0;
+decref_Type_87e1ce5c5e(var19);
+(void)0;
+string_decref(var15);
+string_decref(var14);
+(void)0;
+decref((var9), dtor_List_NamedType__d1143722a6);
+(void)0;
+decref((var7), dtor_ClassDef_ac59c4b64c);
+(void)0;
+return retval;
+}
@@ -0,0 +1,252 @@
+
+                #ifndef HEADER_GUARD_FileConverter_c79636dcc7
+                #define HEADER_GUARD_FileConverter_c79636dcc7
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Instruction_b0fafb4d55.h"
+#include "Statement_1dc2e7090f.h"
+#include "SymbolValue_b2eed984e4.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "ToplevelDeclaration_5505a52ad0.h"
+#include "Type_87e1ce5c5e.h"
+#include "Type_e6cf7dd4e5.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_null___BasicType__3303ac43c9.h"
+#include "_null___FunctionOrMethodConverter__7dc768c0a0.h"
+#include "_null___GenericSource__4440b6073d.h"
+#include "_null___List_Type___114a421a91.h"
+#include "_null___Location__87aaae6467.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "_null___Type__7de1ddce50.h"
+#include "_null___Type__8438ac3dcf.h"
+#include "ast2ir_d819fcc31b.h"
+#include "ast_91af7cbb25.h"
+#include "ir_4b1a3e0393.h"
+struct class_Builtins_bd980a9f08;
+struct class_List_Symbol__9a01330177;
+struct class_List_NamedType__d1143722a6;
+struct class_List_NamedGeneric__fd1333dbd0;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_List_NamedAstType__23f1f6ad88;
+struct class_Builtins_bd980a9f08;
+struct class_List_Symbol__9a01330177;
+struct class_List_NamedType__d1143722a6;
+struct class_List_NamedGeneric__fd1333dbd0;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_List_NamedAstType__23f1f6ad88;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_NamedVariable_ac0761c28d;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_NamedVariable_ac0761c28d;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_List_NamedAstType__23f1f6ad88;
+struct class_List_Str__43b70c06cb;
+struct class_NamedAstType_601829e0d0;
+struct class_List_NamedAstType__23f1f6ad88;
+struct class_NamedAstType_601829e0d0;
+struct class_List_NamedType__d1143722a6;
+struct class_List_Str__43b70c06cb;
+struct class_NamedType_fe3e45e722;
+struct class_List_NamedType__d1143722a6;
+struct class_NamedType_fe3e45e722;
+struct class_List_NamedType__d1143722a6;
+struct class_NamedType_fe3e45e722;
+struct class_AutoType_39f5d793d6;
+struct class_Location_500c4434c9;
+struct class_NamedType_0d620e38a7;
+struct class_UnionType_0c977b4168;
+struct class_List_Type__b06c7a2bb6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionOrMethodConverter_14d05c56fc;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__b06c7a2bb6;
+struct class_List_Type__057f9c6088;
+struct class_Builtins_bd980a9f08;
+struct class_Location_500c4434c9;
+struct class_UnionType_7f899bced1;
+struct class_GenericType_f44d8197cb;
+struct class_List_NamedGeneric__fd1333dbd0;
+struct class_NamedGeneric_b3d994eaa0;
+struct class_FunctionOrMethodConverter_14d05c56fc;
+struct class_Builtins_bd980a9f08;
+struct class_Generic_c39b95ec73;
+struct class_List_NamedType__d1143722a6;
+struct class_List_Str__43b70c06cb;
+struct class_NamedType_fe3e45e722;
+struct class_List_NamedAstType__23f1f6ad88;
+struct class_List_Str__43b70c06cb;
+struct class_NamedAstType_601829e0d0;
+struct class_Location_500c4434c9;
+struct class_Import_6056d7e9c9;
+struct class_List_Symbol__9a01330177;
+struct class_Symbol_037dd39afd;
+struct class_FileVariable_a7b8ca651f;
+struct class_List_NamedType__d1143722a6;
+struct class_List_Str__43b70c06cb;
+struct class_NamedType_fe3e45e722;
+struct class_List_NamedType__d1143722a6;
+struct class_NamedType_fe3e45e722;
+struct class_ClassDef_ac59c4b64c;
+struct class_Location_500c4434c9;
+struct class_List_FuncOrMethodDef__af5379b09e;
+struct class_List_Str__43b70c06cb;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Member__7525bf27e3;
+struct class_BasicType_899b9c9f8e;
+struct class_Builtins_bd980a9f08;
+struct class_List_BasicType__d02960f5a1;
+struct class_List_NamedType__d1143722a6;
+struct class_List_Str__43b70c06cb;
+struct class_NamedType_fe3e45e722;
+struct class_List_NamedType__d1143722a6;
+struct class_NamedType_fe3e45e722;
+struct class_TypeDef_44471836ba;
+struct class_Location_500c4434c9;
+struct class_List_NamedAstType__23f1f6ad88;
+struct class_NamedAstType_601829e0d0;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_TypeDef_44471836ba;
+struct class_List_Symbol__9a01330177;
+struct class_Symbol_037dd39afd;
+struct class_UnionType_7f899bced1;
+struct class_ClassDef_ac59c4b64c;
+struct class_List_Symbol__9a01330177;
+struct class_Symbol_037dd39afd;
+struct class_List_TypeAndName__74be4dae93;
+struct class_List_Type__057f9c6088;
+struct class_TypeAndName_fec99b5f94;
+struct class_FunctionType_4e16d0ea53;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Method__1e0ab9c757;
+struct class_Method_bfbd73ad15;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Method__1e0ab9c757;
+struct class_Method_bfbd73ad15;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_NamedVariable_ac0761c28d;
+struct class_FileVariable_a7b8ca651f;
+struct class_List_Symbol__9a01330177;
+struct class_Symbol_037dd39afd;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_ClassDef_ac59c4b64c;
+struct class_List_NamedType__d1143722a6;
+struct class_NamedType_fe3e45e722;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Member__7525bf27e3;
+struct class_List_TypeAndName__74be4dae93;
+struct class_List_Member__7525bf27e3;
+struct class_TypeAndName_fec99b5f94;
+struct class_Member_a3dd2b1b39;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_List_Member__7525bf27e3;
+struct class_List_Type__057f9c6088;
+struct class_Member_a3dd2b1b39;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Type__057f9c6088;
+struct class_Builtins_bd980a9f08;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_FuncOrMethodDef__af5379b09e;
+struct class_List_Str__43b70c06cb;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Type__057f9c6088;
+struct class_Builtins_bd980a9f08;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_FuncOrMethodDef__af5379b09e;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_Location_500c4434c9;
+struct class_List_TypeAndName__74be4dae93;
+struct class_NamedType_0d620e38a7;
+struct class_TypeAndName_fec99b5f94;
+struct class_Builtins_bd980a9f08;
+struct class_FunctionType_4e16d0ea53;
+struct class_FunctionType_4e16d0ea53;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_Instruction__6e475c861a;
+struct class_List_TypeAndName__74be4dae93;
+struct class_List_Type__057f9c6088;
+struct class_List_TypeAndName__74be4dae93;
+struct class_List_TypeAndName__74be4dae93;
+struct class_TypeAndName_fec99b5f94;
+struct class_List_TypeAndName__74be4dae93;
+struct class_TypeAndName_fec99b5f94;
+struct class_Location_500c4434c9;
+struct class_List_Type__057f9c6088;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_VarCpy_e77a538911;
+struct class_IncRef_54322428a7;
+struct class_NamedVariable_ac0761c28d;
+struct class_NamedVariable_ac0761c28d;
+struct class_Builtins_bd980a9f08;
+struct class_List_LoopLabels__74a48e6cc9;
+struct class_List_Instruction__6e475c861a;
+struct class_List_List_Instruction___d2e1d3bdd4;
+struct class_List_AutoTypeNode__28b2c8eb14;
+struct class_FunctionOrMethodConverter_14d05c56fc;
+struct class_List_Statement__5d7503c104;
+struct class_List_Instruction__6e475c861a;
+struct class_MethodDef_28b65923b5;
+struct class_FileVariable_a7b8ca651f;
+struct class_FuncDef_2bd6886a53;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_ClassDef_ac59c4b64c;
+struct class_List_NamedType__d1143722a6;
+struct class_NamedType_fe3e45e722;
+struct class_List_ToplevelDeclaration__35f88ef566;
+struct class_List_FuncOrMethodDef__af5379b09e;
+struct class_List_Str__43b70c06cb;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_Builtins_bd980a9f08;
+struct class_Location_500c4434c9;
+struct class_MethodDef_28b65923b5;
+struct class_List_FuncOrMethodDef__af5379b09e;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_MethodDef_28b65923b5;
+struct class_List_Symbol__9a01330177;
+struct class_Symbol_037dd39afd;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_List_ToplevelDeclaration__35f88ef566;
+struct class_List_ToplevelDeclaration__35f88ef566;
+struct class_List_ToplevelDeclaration__35f88ef566;
+struct class_List_ToplevelDeclaration__35f88ef566;
+
+            struct class_FileConverter_c79636dcc7 {
+                REFCOUNT_HEADER
+                struct class_Builtins_bd980a9f08* memb_builtins;
+struct class_Str memb_path;
+struct class_List_Symbol__9a01330177* memb_symbols;
+struct class_List_NamedType__d1143722a6* memb_types;
+struct class_List_NamedGeneric__fd1333dbd0* memb_generics;
+struct class_List_NamedVariable__2ad9e9e312* memb_variables;
+struct class_List_NamedAstType__23f1f6ad88* memb_typedef_laziness;
+
+            };
+            
+            struct class_FileConverter_c79636dcc7* ctor_FileConverter_c79636dcc7(struct class_Builtins_bd980a9f08* arg_builtins,struct class_Str arg_path,struct class_List_Symbol__9a01330177* arg_symbols,struct class_List_NamedType__d1143722a6* arg_types,struct class_List_NamedGeneric__fd1333dbd0* arg_generics,struct class_List_NamedVariable__2ad9e9e312* arg_variables,struct class_List_NamedAstType__23f1f6ad88* arg_typedef_laziness);
+            void dtor_FileConverter_c79636dcc7(void *ptr);
+            
+                struct class_Str meth_FileConverter_c79636dcc7_to_string(struct class_FileConverter_c79636dcc7* obj);
+                bool meth_FileConverter_c79636dcc7_equals(struct class_FileConverter_c79636dcc7* var1, struct class_FileConverter_c79636dcc7* var2);
+void meth_FileConverter_c79636dcc7_add_var(struct class_FileConverter_c79636dcc7* var1, struct class_Variable_1aaa81c8d2 var2, struct class_Str var3);
+struct class_Variable_1aaa81c8d2 meth_FileConverter_c79636dcc7_get_var(struct class_FileConverter_c79636dcc7* var1, struct class_Str var2, struct class__null___Location__87aaae6467 var3);
+struct class_Type_87e1ce5c5e meth_FileConverter_c79636dcc7_get_named_type(struct class_FileConverter_c79636dcc7* var1, struct class_Str var2);
+struct class_Type_87e1ce5c5e meth_FileConverter_c79636dcc7_get_type(struct class_FileConverter_c79636dcc7* var1, struct class_Type_e6cf7dd4e5 var2, struct class__null___FunctionOrMethodConverter__7dc768c0a0 var3);
+void meth_FileConverter_c79636dcc7_check_type_not_exists(struct class_FileConverter_c79636dcc7* var1, struct class_Str var2, struct class_Location_500c4434c9* var3);
+void meth_FileConverter_c79636dcc7_do_step1(struct class_FileConverter_c79636dcc7* var1, struct class_ToplevelDeclaration_054352d1cf var2);
+void meth_FileConverter_c79636dcc7_do_step2(struct class_FileConverter_c79636dcc7* var1, struct class_ToplevelDeclaration_054352d1cf var2);
+void meth_FileConverter_c79636dcc7_func_or_meth_step3(struct class_FileConverter_c79636dcc7* var1, struct class_FuncOrMethodDef_533c7b75ab* var2, struct class__null___BasicType__3303ac43c9 var3);
+void meth_FileConverter_c79636dcc7_do_step3(struct class_FileConverter_c79636dcc7* var1, struct class_ToplevelDeclaration_054352d1cf var2);
+struct class_ToplevelDeclaration_5505a52ad0 meth_FileConverter_c79636dcc7_func_or_meth_step4(struct class_FileConverter_c79636dcc7* var1, struct class_FuncOrMethodDef_533c7b75ab* var2, struct class__null___Type__8438ac3dcf var3);
+struct class_List_ToplevelDeclaration__35f88ef566* meth_FileConverter_c79636dcc7_do_step4(struct class_FileConverter_c79636dcc7* var1, struct class_ToplevelDeclaration_054352d1cf var2);
+
+                #endif
+                
@@ -0,0 +1,6549 @@
+#include <lib/oomph.h>
+#include "FilePair_99df852164.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "AutoType_33a5d572cb.h"
+#include "BasicType_899b9c9f8e.h"
+#include "BuiltinVariable_f6e0cdd1b6.h"
+#include "Builtins_bd980a9f08.h"
+#include "FileVariable_a7b8ca651f.h"
+#include "FuncDef_2bd6886a53.h"
+#include "FunctionEmitter_34815fc0d7.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "GenericSource_35cfcd932e.h"
+#include "Generic_c39b95ec73.h"
+#include "List_FilePair__2b6998ab5b.h"
+#include "List_GotoLabel__152f526689.h"
+#include "List_Int__df8a64abf3.h"
+#include "List_List_Str___637f5f7ec1.h"
+#include "List_LocalVariable__81e23234f3.h"
+#include "List_Member__7525bf27e3.h"
+#include "List_Method__1e0ab9c757.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Symbol__9a01330177.h"
+#include "List_Type__057f9c6088.h"
+#include "LocalVariable_846080e5ae.h"
+#include "Member_a3dd2b1b39.h"
+#include "MethodDef_28b65923b5.h"
+#include "Method_bfbd73ad15.h"
+#include "Session_88204c75ff.h"
+#include "SymbolValue_b2eed984e4.h"
+#include "Symbol_037dd39afd.h"
+#include "ToplevelDeclaration_5505a52ad0.h"
+#include "Type_87e1ce5c5e.h"
+#include "UnionType_7f899bced1.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_FuncDef___MethodDef__5505a52ad0.h"
+#include "_Type___Str__e7feb8bffc.h"
+#include "_null___GenericSource__4440b6073d.h"
+#include "_null___List_Str___1b0213dad9.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "_null___Type__8438ac3dcf.h"
+#include "bundle_io_45f5b8a585.h"
+#include "c_output_6a23cf54cc.h"
+#include "ir_4b1a3e0393.h"
+
+            static struct StringBuf string0_FilePair_b09118b315_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x69', '\x6c', '\x65', '\x50', '\x61', '\x69', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_FilePair_b09118b315 = {
+                .buf = &string0_FilePair_b09118b315_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_void_23c41bd03f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x76', '\x6f', '\x69', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string1_void_23c41bd03f = {
+                .buf = &string1_void_23c41bd03f_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_self_hosted_c_output_oomph_64e0ea3117_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x63', '\x5f', '\x6f', '\x75', '\x74', '\x70', '\x75', '\x74', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string2_self_hosted_c_output_oomph_64e0ea3117 = {
+                .buf = &string2_self_hosted_c_output_oomph_64e0ea3117_buf,
+                .nbytes = 26,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_int64_t_83becdea11_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x36', '\x34', '\x5f', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string3_int64_t_83becdea11 = {
+                .buf = &string3_int64_t_83becdea11_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_double_3f45021648_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x6f', '\x75', '\x62', '\x6c', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string4_double_3f45021648 = {
+                .buf = &string4_double_3f45021648_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_bool_87ceb82cfb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x6f', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string5_bool_87ceb82cfb = {
+                .buf = &string5_bool_87ceb82cfb_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6_struct_class_Str_37048601bb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f', '\x53', '\x74', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string6_struct_class_Str_37048601bb = {
+                .buf = &string6_struct_class_Str_37048601bb_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7_char_f51c5bcd0a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x68', '\x61', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string7_char_f51c5bcd0a = {
+                .buf = &string7_char_f51c5bcd0a_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string8_struct_class__cbaa47d00e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string8_struct_class__cbaa47d00e = {
+                .buf = &string8_struct_class__cbaa47d00e_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string9___fd8d53e8a5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2a' },
+                .malloced = false,
+            };
+            static struct class_Str string9___fd8d53e8a5 = {
+                .buf = &string9___fd8d53e8a5_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string10____afb2f97902_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string10____afb2f97902 = {
+                .buf = &string10____afb2f97902_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string11_oomph__b49a881ee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string11_oomph__b49a881ee6 = {
+                .buf = &string11_oomph__b49a881ee6_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string12_main_b15b214437_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x61', '\x69', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string12_main_b15b214437 = {
+                .buf = &string12_main_b15b214437_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string13_oomph_main_f42ac2d0d5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f', '\x6d', '\x61', '\x69', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string13_oomph_main_f42ac2d0d5 = {
+                .buf = &string13_oomph_main_f42ac2d0d5_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string14___Bool_to_string_dad773c5b7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x42', '\x6f', '\x6f', '\x6c', '\x5f', '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string14___Bool_to_string_dad773c5b7 = {
+                .buf = &string14___Bool_to_string_dad773c5b7_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string15___List_Str_join_ffc59580ff_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x4c', '\x69', '\x73', '\x74', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x6a', '\x6f', '\x69', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string15___List_Str_join_ffc59580ff = {
+                .buf = &string15___List_Str_join_ffc59580ff_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string16___Str___contains_8997d6dfce_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x5f', '\x5f', '\x63', '\x6f', '\x6e', '\x74', '\x61', '\x69', '\x6e', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string16___Str___contains_8997d6dfce = {
+                .buf = &string16___Str___contains_8997d6dfce_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string17___Str_center_pad_073e8c0216_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x63', '\x65', '\x6e', '\x74', '\x65', '\x72', '\x5f', '\x70', '\x61', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string17___Str_center_pad_073e8c0216 = {
+                .buf = &string17___Str_center_pad_073e8c0216_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string18___Str_count_b51b07da76_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x63', '\x6f', '\x75', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string18___Str_count_b51b07da76 = {
+                .buf = &string18___Str_count_b51b07da76_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string19___Str_ends_with_dcad540805_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x65', '\x6e', '\x64', '\x73', '\x5f', '\x77', '\x69', '\x74', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string19___Str_ends_with_dcad540805 = {
+                .buf = &string19___Str_ends_with_dcad540805_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string20___Str_from_start_to_substring_462924c760_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x66', '\x72', '\x6f', '\x6d', '\x5f', '\x73', '\x74', '\x61', '\x72', '\x74', '\x5f', '\x74', '\x6f', '\x5f', '\x73', '\x75', '\x62', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string20___Str_from_start_to_substring_462924c760 = {
+                .buf = &string20___Str_from_start_to_substring_462924c760_buf,
+                .nbytes = 29,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string21___Str_get_utf8_c826dd9fd5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x67', '\x65', '\x74', '\x5f', '\x75', '\x74', '\x66', '\x38' },
+                .malloced = false,
+            };
+            static struct class_Str string21___Str_get_utf8_c826dd9fd5 = {
+                .buf = &string21___Str_get_utf8_c826dd9fd5_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string22___Str_left_pad_3d523e4aca_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x6c', '\x65', '\x66', '\x74', '\x5f', '\x70', '\x61', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string22___Str_left_pad_3d523e4aca = {
+                .buf = &string22___Str_left_pad_3d523e4aca_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string23___Str_left_trim_5e00f6c909_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x6c', '\x65', '\x66', '\x74', '\x5f', '\x74', '\x72', '\x69', '\x6d' },
+                .malloced = false,
+            };
+            static struct class_Str string23___Str_left_trim_5e00f6c909 = {
+                .buf = &string23___Str_left_trim_5e00f6c909_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string24___Str_remove_prefix_03762ab753_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x72', '\x65', '\x6d', '\x6f', '\x76', '\x65', '\x5f', '\x70', '\x72', '\x65', '\x66', '\x69', '\x78' },
+                .malloced = false,
+            };
+            static struct class_Str string24___Str_remove_prefix_03762ab753 = {
+                .buf = &string24___Str_remove_prefix_03762ab753_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string25___Str_remove_suffix_4cb74a7e98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x72', '\x65', '\x6d', '\x6f', '\x76', '\x65', '\x5f', '\x73', '\x75', '\x66', '\x66', '\x69', '\x78' },
+                .malloced = false,
+            };
+            static struct class_Str string25___Str_remove_suffix_4cb74a7e98 = {
+                .buf = &string25___Str_remove_suffix_4cb74a7e98_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string26___Str_repeat_6103748743_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x72', '\x65', '\x70', '\x65', '\x61', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string26___Str_repeat_6103748743 = {
+                .buf = &string26___Str_repeat_6103748743_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string27___Str_replace_554e473c7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x72', '\x65', '\x70', '\x6c', '\x61', '\x63', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string27___Str_replace_554e473c7a = {
+                .buf = &string27___Str_replace_554e473c7a_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string28___Str_right_pad_6fc7cea2f7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x72', '\x69', '\x67', '\x68', '\x74', '\x5f', '\x70', '\x61', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string28___Str_right_pad_6fc7cea2f7 = {
+                .buf = &string28___Str_right_pad_6fc7cea2f7_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string29___Str_right_trim_8ff2898d46_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x72', '\x69', '\x67', '\x68', '\x74', '\x5f', '\x74', '\x72', '\x69', '\x6d' },
+                .malloced = false,
+            };
+            static struct class_Str string29___Str_right_trim_8ff2898d46 = {
+                .buf = &string29___Str_right_trim_8ff2898d46_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string30___Str_split_1419b998f9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x73', '\x70', '\x6c', '\x69', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string30___Str_split_1419b998f9 = {
+                .buf = &string30___Str_split_1419b998f9_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string31___Str_starts_with_e1f47b3366_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x73', '\x74', '\x61', '\x72', '\x74', '\x73', '\x5f', '\x77', '\x69', '\x74', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string31___Str_starts_with_e1f47b3366 = {
+                .buf = &string31___Str_starts_with_e1f47b3366_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string32___Str_trim_9d52f8cf66_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x74', '\x72', '\x69', '\x6d' },
+                .malloced = false,
+            };
+            static struct class_Str string32___Str_trim_9d52f8cf66 = {
+                .buf = &string32___Str_trim_9d52f8cf66_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string33_meth__037d88e79e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string33_meth__037d88e79e = {
+                .buf = &string33_meth__037d88e79e_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string34___3dd6dc5c14_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string34___3dd6dc5c14 = {
+                .buf = &string34___3dd6dc5c14_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string35___63dbb4f422_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string35___63dbb4f422 = {
+                .buf = &string35___63dbb4f422_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string36___54a7aca889_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c' },
+                .malloced = false,
+            };
+            static struct class_Str string36___54a7aca889 = {
+                .buf = &string36___54a7aca889_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string37__37a398d8ea_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string37__37a398d8ea = {
+                .buf = &string37__37a398d8ea_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string38___074be16786_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28' },
+                .malloced = false,
+            };
+            static struct class_Str string38___074be16786 = {
+                .buf = &string38___074be16786_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string39___b44de59f49_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string39___b44de59f49 = {
+                .buf = &string39___b44de59f49_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string40___aa96dea2e8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7b' },
+                .malloced = false,
+            };
+            static struct class_Str string40___aa96dea2e8 = {
+                .buf = &string40___aa96dea2e8_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string41____06db358fc6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7d', '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string41____06db358fc6 = {
+                .buf = &string41____06db358fc6_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string42_string_d85d5cef01_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string42_string_d85d5cef01 = {
+                .buf = &string42_string_d85d5cef01_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string43_0_c401021f71_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x30' },
+                .malloced = false,
+            };
+            static struct class_Str string43_0_c401021f71 = {
+                .buf = &string43_0_c401021f71_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string44______________static_struct_StringBuf__94bed08649_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x61', '\x74', '\x69', '\x63', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x42', '\x75', '\x66', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string44______________static_struct_StringBuf__94bed08649 = {
+                .buf = &string44______________static_struct_StringBuf__94bed08649_buf,
+                .nbytes = 37,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string45__buf______________________refcount____1___________________data____char______73263679a8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x62', '\x75', '\x66', '\x20', '\x3d', '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x72', '\x65', '\x66', '\x63', '\x6f', '\x75', '\x6e', '\x74', '\x20', '\x3d', '\x20', '\x2d', '\x31', '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x64', '\x61', '\x74', '\x61', '\x20', '\x3d', '\x20', '\x28', '\x63', '\x68', '\x61', '\x72', '\x5b', '\x5d', '\x29', '\x7b', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string45__buf______________________refcount____1___________________data____char______73263679a8 = {
+                .buf = &string45__buf______________________refcount____1___________________data____char______73263679a8_buf,
+                .nbytes = 75,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string46______________________malloced___false_____________________________static_struct_class_Str__c86c371ec5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x7d', '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x6d', '\x61', '\x6c', '\x6c', '\x6f', '\x63', '\x65', '\x64', '\x20', '\x3d', '\x20', '\x66', '\x61', '\x6c', '\x73', '\x65', '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x61', '\x74', '\x69', '\x63', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f', '\x53', '\x74', '\x72', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string46______________________malloced___false_____________________________static_struct_class_Str__c86c371ec5 = {
+                .buf = &string46______________________malloced___false_____________________________static_struct_class_Str__c86c371ec5_buf,
+                .nbytes = 90,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string47_______________________buf_____12cd07e483_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x3d', '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x62', '\x75', '\x66', '\x20', '\x3d', '\x20', '\x26' },
+                .malloced = false,
+            };
+            static struct class_Str string47_______________________buf_____12cd07e483 = {
+                .buf = &string47_______________________buf_____12cd07e483_buf,
+                .nbytes = 29,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string48__buf___________________nbytes____a3420a852c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x62', '\x75', '\x66', '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x6e', '\x62', '\x79', '\x74', '\x65', '\x73', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string48__buf___________________nbytes____a3420a852c = {
+                .buf = &string48__buf___________________nbytes____a3420a852c_buf,
+                .nbytes = 32,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string49____________________offset___0______________________________e7d7c6b537_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x6f', '\x66', '\x66', '\x73', '\x65', '\x74', '\x20', '\x3d', '\x20', '\x30', '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string49____________________offset___0______________________________e7d7c6b537 = {
+                .buf = &string49____________________offset___0______________________________e7d7c6b537_buf,
+                .nbytes = 58,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string50__________________________case__58a43c2bf0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x63', '\x61', '\x73', '\x65', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string50__________________________case__58a43c2bf0 = {
+                .buf = &string50__________________________case__58a43c2bf0_buf,
+                .nbytes = 30,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string51_______________________________valstr___meth__4179699267_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x76', '\x61', '\x6c', '\x73', '\x74', '\x72', '\x20', '\x3d', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string51_______________________________valstr___meth__4179699267 = {
+                .buf = &string51_______________________________valstr___meth__4179699267_buf,
+                .nbytes = 44,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string52__to_string_obj_val_item_796ebcaf2e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x28', '\x6f', '\x62', '\x6a', '\x2e', '\x76', '\x61', '\x6c', '\x2e', '\x69', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+            };
+            static struct class_Str string52__to_string_obj_val_item_796ebcaf2e = {
+                .buf = &string52__to_string_obj_val_item_796ebcaf2e_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string53________________________________break___________________________4fde757628_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x62', '\x72', '\x65', '\x61', '\x6b', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string53________________________________break___________________________4fde757628 = {
+                .buf = &string53________________________________break___________________________4fde757628_buf,
+                .nbytes = 62,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string54_______________________________return_meth__acdde1bc0c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string54_______________________________return_meth__acdde1bc0c = {
+                .buf = &string54_______________________________return_meth__acdde1bc0c_buf,
+                .nbytes = 42,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string55__equals_a_val_item_2867b4cb78_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x65', '\x71', '\x75', '\x61', '\x6c', '\x73', '\x28', '\x61', '\x2e', '\x76', '\x61', '\x6c', '\x2e', '\x69', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+            };
+            static struct class_Str string55__equals_a_val_item_2867b4cb78 = {
+                .buf = &string55__equals_a_val_item_2867b4cb78_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string56___b_val_item_c388b39a11_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x20', '\x62', '\x2e', '\x76', '\x61', '\x6c', '\x2e', '\x69', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+            };
+            static struct class_Str string56___b_val_item_c388b39a11 = {
+                .buf = &string56___b_val_item_c388b39a11_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string57_____________________________db53c59dd0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string57_____________________________db53c59dd0 = {
+                .buf = &string57_____________________________db53c59dd0_buf,
+                .nbytes = 27,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string58__________________struct_class_Str_meth__6558deb1e3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f', '\x53', '\x74', '\x72', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string58__________________struct_class_Str_meth__6558deb1e3 = {
+                .buf = &string58__________________struct_class_Str_meth__6558deb1e3_buf,
+                .nbytes = 39,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string59__to_string_struct_class__fd8546d3f2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x28', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string59__to_string_struct_class__fd8546d3f2 = {
+                .buf = &string59__to_string_struct_class__fd8546d3f2_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string60__obj___________________bool_meth__06bd8c6c68_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x62', '\x6f', '\x6f', '\x6c', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string60__obj___________________bool_meth__06bd8c6c68 = {
+                .buf = &string60__obj___________________bool_meth__06bd8c6c68_buf,
+                .nbytes = 33,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string61__equals_struct_class__a044eebb07_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x65', '\x71', '\x75', '\x61', '\x6c', '\x73', '\x28', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string61__equals_struct_class__a044eebb07 = {
+                .buf = &string61__equals_struct_class__a044eebb07_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string62__a__struct_class__c06b334a35_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x61', '\x2c', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string62__a__struct_class__c06b334a35 = {
+                .buf = &string62__a__struct_class__c06b334a35_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string63__b____________________eb3e8b25b9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x62', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string63__b____________________eb3e8b25b9 = {
+                .buf = &string63__b____________________eb3e8b25b9_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string64__obj________________________________________struct_class_Str_valstr______________________switch_obj_membernum_____________________________39335ca6a1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f', '\x53', '\x74', '\x72', '\x20', '\x76', '\x61', '\x6c', '\x73', '\x74', '\x72', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x77', '\x69', '\x74', '\x63', '\x68', '\x28', '\x6f', '\x62', '\x6a', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x29', '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string64__obj________________________________________struct_class_Str_valstr______________________switch_obj_membernum_____________________________39335ca6a1 = {
+                .buf = &string64__obj________________________________________struct_class_Str_valstr______________________switch_obj_membernum_____________________________39335ca6a1_buf,
+                .nbytes = 137,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string65__________________________default______________________________panic_printf___________________________________INTERNAL_OOMPH_ERROR__invalid__s_membernum__d___________________________________string_to_cstr__98db993b10_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x64', '\x65', '\x66', '\x61', '\x75', '\x6c', '\x74', '\x3a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x70', '\x61', '\x6e', '\x69', '\x63', '\x5f', '\x70', '\x72', '\x69', '\x6e', '\x74', '\x66', '\x28', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x22', '\x49', '\x4e', '\x54', '\x45', '\x52', '\x4e', '\x41', '\x4c', '\x20', '\x4f', '\x4f', '\x4d', '\x50', '\x48', '\x20', '\x45', '\x52', '\x52', '\x4f', '\x52', '\x3a', '\x20', '\x69', '\x6e', '\x76', '\x61', '\x6c', '\x69', '\x64', '\x20', '\x25', '\x73', '\x20', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x20', '\x25', '\x64', '\x22', '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x74', '\x6f', '\x5f', '\x63', '\x73', '\x74', '\x72', '\x28' },
+                .malloced = false,
+            };
+            static struct class_Str string65__________________________default______________________________panic_printf___________________________________INTERNAL_OOMPH_ERROR__invalid__s_membernum__d___________________________________string_to_cstr__98db993b10 = {
+                .buf = &string65__________________________default______________________________panic_printf___________________________________INTERNAL_OOMPH_ERROR__invalid__s_membernum__d___________________________________string_to_cstr__98db993b10_buf,
+                .nbytes = 204,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string66_____int_obj_membernum______________________________________________struct_class_Str_res____c13c02f8d2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x2c', '\x20', '\x28', '\x69', '\x6e', '\x74', '\x29', '\x6f', '\x62', '\x6a', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x0a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f', '\x53', '\x74', '\x72', '\x20', '\x72', '\x65', '\x73', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string66_____int_obj_membernum______________________________________________struct_class_Str_res____c13c02f8d2 = {
+                .buf = &string66_____int_obj_membernum______________________________________________struct_class_Str_res____c13c02f8d2_buf,
+                .nbytes = 90,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string67_______________________string_incref_res_______________________oomph_string_concat_inplace_cstr__res____________________________oomph_string_concat_inplace__res__valstr_______________________oomph_string_concat_inplace_cstr__res____________________________string_decref_valstr_______________________return_res_____________________________________bool_meth__22b91bc13d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x69', '\x6e', '\x63', '\x72', '\x65', '\x66', '\x28', '\x72', '\x65', '\x73', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x63', '\x6f', '\x6e', '\x63', '\x61', '\x74', '\x5f', '\x69', '\x6e', '\x70', '\x6c', '\x61', '\x63', '\x65', '\x5f', '\x63', '\x73', '\x74', '\x72', '\x28', '\x26', '\x72', '\x65', '\x73', '\x2c', '\x20', '\x22', '\x28', '\x22', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x63', '\x6f', '\x6e', '\x63', '\x61', '\x74', '\x5f', '\x69', '\x6e', '\x70', '\x6c', '\x61', '\x63', '\x65', '\x28', '\x26', '\x72', '\x65', '\x73', '\x2c', '\x20', '\x76', '\x61', '\x6c', '\x73', '\x74', '\x72', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x63', '\x6f', '\x6e', '\x63', '\x61', '\x74', '\x5f', '\x69', '\x6e', '\x70', '\x6c', '\x61', '\x63', '\x65', '\x5f', '\x63', '\x73', '\x74', '\x72', '\x28', '\x26', '\x72', '\x65', '\x73', '\x2c', '\x20', '\x22', '\x29', '\x22', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x64', '\x65', '\x63', '\x72', '\x65', '\x66', '\x28', '\x76', '\x61', '\x6c', '\x73', '\x74', '\x72', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x72', '\x65', '\x73', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x0a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x62', '\x6f', '\x6f', '\x6c', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string67_______________________string_incref_res_______________________oomph_string_concat_inplace_cstr__res____________________________oomph_string_concat_inplace__res__valstr_______________________oomph_string_concat_inplace_cstr__res____________________________string_decref_valstr_______________________return_res_____________________________________bool_meth__22b91bc13d = {
+                .buf = &string67_______________________string_incref_res_______________________oomph_string_concat_inplace_cstr__res____________________________oomph_string_concat_inplace__res__valstr_______________________oomph_string_concat_inplace_cstr__res____________________________string_decref_valstr_______________________return_res_____________________________________bool_meth__22b91bc13d_buf,
+                .nbytes = 355,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string68__b________________________________________if__a_membernum____b_membernum__________________________return_false______________________switch_a_membernum_____________________________984b047854_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x62', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x69', '\x66', '\x20', '\x28', '\x61', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x20', '\x21', '\x3d', '\x20', '\x62', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x66', '\x61', '\x6c', '\x73', '\x65', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x77', '\x69', '\x74', '\x63', '\x68', '\x28', '\x61', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x29', '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string68__b________________________________________if__a_membernum____b_membernum__________________________return_false______________________switch_a_membernum_____________________________984b047854 = {
+                .buf = &string68__b________________________________________if__a_membernum____b_membernum__________________________return_false______________________switch_a_membernum_____________________________984b047854_buf,
+                .nbytes = 178,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string69_____int_a_membernum____________________________________________________________b2f4b03033_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x2c', '\x20', '\x28', '\x69', '\x6e', '\x74', '\x29', '\x61', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string69_____int_a_membernum____________________________________________________________b2f4b03033 = {
+                .buf = &string69_____int_a_membernum____________________________________________________________b2f4b03033_buf,
+                .nbytes = 78,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string70_obj_val_item_99b40acef6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2e', '\x76', '\x61', '\x6c', '\x2e', '\x69', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+            };
+            static struct class_Str string70_obj_val_item_99b40acef6 = {
+                .buf = &string70_obj_val_item_99b40acef6_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string71_case__ba0932b8b3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x61', '\x73', '\x65', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string71_case__ba0932b8b3 = {
+                .buf = &string71_case__ba0932b8b3_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string72____e27757c517_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string72____e27757c517 = {
+                .buf = &string72____e27757c517_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string73___break___7ea39a708b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x20', '\x62', '\x72', '\x65', '\x61', '\x6b', '\x3b', '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string73___break___7ea39a708b = {
+                .buf = &string73___break___7ea39a708b_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string74__________________void_incref__602b7186e3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x69', '\x6e', '\x63', '\x72', '\x65', '\x66', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string74__________________void_incref__602b7186e3 = {
+                .buf = &string74__________________void_incref__602b7186e3_buf,
+                .nbytes = 29,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string75__struct_class__66cd20f90a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string75__struct_class__66cd20f90a = {
+                .buf = &string75__struct_class__66cd20f90a_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string76__obj___________________void_decref__09249fe405_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x64', '\x65', '\x63', '\x72', '\x65', '\x66', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string76__obj___________________void_decref__09249fe405 = {
+                .buf = &string76__obj___________________void_decref__09249fe405_buf,
+                .nbytes = 35,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string77__obj____________________c47bb4d2e5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string77__obj____________________c47bb4d2e5 = {
+                .buf = &string77__obj____________________c47bb4d2e5_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string78__obj________________________switch_obj_membernum_____________________________979fb46448_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x29', '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x77', '\x69', '\x74', '\x63', '\x68', '\x28', '\x6f', '\x62', '\x6a', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x29', '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string78__obj________________________switch_obj_membernum_____________________________979fb46448 = {
+                .buf = &string78__obj________________________switch_obj_membernum_____________________________979fb46448_buf,
+                .nbytes = 76,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string79__________________________default______________________________assert_0___________________________________________________________void_decref__5d7fb36d61_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x64', '\x65', '\x66', '\x61', '\x75', '\x6c', '\x74', '\x3a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x61', '\x73', '\x73', '\x65', '\x72', '\x74', '\x28', '\x30', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x64', '\x65', '\x63', '\x72', '\x65', '\x66', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string79__________________________default______________________________assert_0___________________________________________________________void_decref__5d7fb36d61 = {
+                .buf = &string79__________________________default______________________________assert_0___________________________________________________________void_decref__5d7fb36d61_buf,
+                .nbytes = 141,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string80__obj________________________switch_obj_membernum____________________________case__1_______variable_not_in_use__see_UnSet______________________________break___________________________540c0a5112_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x29', '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x77', '\x69', '\x74', '\x63', '\x68', '\x28', '\x6f', '\x62', '\x6a', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x29', '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x63', '\x61', '\x73', '\x65', '\x20', '\x2d', '\x31', '\x3a', '\x20', '\x20', '\x20', '\x2f', '\x2f', '\x20', '\x76', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65', '\x20', '\x6e', '\x6f', '\x74', '\x20', '\x69', '\x6e', '\x20', '\x75', '\x73', '\x65', '\x20', '\x28', '\x73', '\x65', '\x65', '\x20', '\x55', '\x6e', '\x53', '\x65', '\x74', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x62', '\x72', '\x65', '\x61', '\x6b', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string80__obj________________________switch_obj_membernum____________________________case__1_______variable_not_in_use__see_UnSet______________________________break___________________________540c0a5112 = {
+                .buf = &string80__obj________________________switch_obj_membernum____________________________case__1_______variable_not_in_use__see_UnSet______________________________break___________________________540c0a5112_buf,
+                .nbytes = 181,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string81__________________________default______________________________assert_0____________________________________________________________4f523a6aef_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x64', '\x65', '\x66', '\x61', '\x75', '\x6c', '\x74', '\x3a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x61', '\x73', '\x73', '\x65', '\x72', '\x74', '\x28', '\x30', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string81__________________________default______________________________assert_0____________________________________________________________4f523a6aef = {
+                .buf = &string81__________________________default______________________________assert_0____________________________________________________________4f523a6aef_buf,
+                .nbytes = 129,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string82__item_4e28d07419_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x69', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+            };
+            static struct class_Str string82__item_4e28d07419 = {
+                .buf = &string82__item_4e28d07419_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string83__________________struct_class__55fc486395_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string83__________________struct_class__55fc486395 = {
+                .buf = &string83__________________struct_class__55fc486395_buf,
+                .nbytes = 30,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string84________________________union____________________________62a2fa0c00_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x75', '\x6e', '\x69', '\x6f', '\x6e', '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string84________________________union____________________________62a2fa0c00 = {
+                .buf = &string84________________________union____________________________62a2fa0c00_buf,
+                .nbytes = 55,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string85________________________val______________________short_membernum______________________________________90e1c3ecf2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x20', '\x76', '\x61', '\x6c', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x68', '\x6f', '\x72', '\x74', '\x20', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string85________________________val______________________short_membernum______________________________________90e1c3ecf2 = {
+                .buf = &string85________________________val______________________short_membernum______________________________________90e1c3ecf2_buf,
+                .nbytes = 100,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string86__meth__83bc08e002_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string86__meth__83bc08e002 = {
+                .buf = &string86__meth__83bc08e002_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string87__get_struct_class__624bd0c497_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x67', '\x65', '\x74', '\x28', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string87__get_struct_class__624bd0c497 = {
+                .buf = &string87__get_struct_class__624bd0c497_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string88__obj___684a38e291_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x29', '\x3b' },
+                .malloced = false,
+            };
+            static struct class_Str string88__obj___684a38e291 = {
+                .buf = &string88__obj___684a38e291_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string89_______________________8d540d53c1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string89_______________________8d540d53c1 = {
+                .buf = &string89_______________________8d540d53c1_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string90__obj________________________________________________if__obj_membernum____0______________________________panic_printf__Error__null_get___was_called____________________________assert_obj_membernum____1____________________________44f2cce466_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x69', '\x66', '\x20', '\x28', '\x6f', '\x62', '\x6a', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x20', '\x3d', '\x3d', '\x20', '\x30', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x70', '\x61', '\x6e', '\x69', '\x63', '\x5f', '\x70', '\x72', '\x69', '\x6e', '\x74', '\x66', '\x28', '\x22', '\x45', '\x72', '\x72', '\x6f', '\x72', '\x3a', '\x20', '\x6e', '\x75', '\x6c', '\x6c', '\x2e', '\x67', '\x65', '\x74', '\x28', '\x29', '\x20', '\x77', '\x61', '\x73', '\x20', '\x63', '\x61', '\x6c', '\x6c', '\x65', '\x64', '\x22', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x61', '\x73', '\x73', '\x65', '\x72', '\x74', '\x28', '\x6f', '\x62', '\x6a', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x20', '\x3d', '\x3d', '\x20', '\x31', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string90__obj________________________________________________if__obj_membernum____0______________________________panic_printf__Error__null_get___was_called____________________________assert_obj_membernum____1____________________________44f2cce466 = {
+                .buf = &string90__obj________________________________________________if__obj_membernum____0______________________________panic_printf__Error__null_get___was_called____________________________assert_obj_membernum____1____________________________44f2cce466_buf,
+                .nbytes = 226,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string91_obj_val_item1_9d375ab773_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2e', '\x76', '\x61', '\x6c', '\x2e', '\x69', '\x74', '\x65', '\x6d', '\x31' },
+                .malloced = false,
+            };
+            static struct class_Str string91_obj_val_item1_9d375ab773 = {
+                .buf = &string91_obj_val_item1_9d375ab773_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string92___________________________return_obj_val_item1_____________________________________________6243e272df_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x6f', '\x62', '\x6a', '\x2e', '\x76', '\x61', '\x6c', '\x2e', '\x69', '\x74', '\x65', '\x6d', '\x31', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string92___________________________return_obj_val_item1_____________________________________________6243e272df = {
+                .buf = &string92___________________________return_obj_val_item1_____________________________________________6243e272df_buf,
+                .nbytes = 90,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string93_CONSTRUCTOR_7f260334d8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x4f', '\x4e', '\x53', '\x54', '\x52', '\x55', '\x43', '\x54', '\x4f', '\x52' },
+                .malloced = false,
+            };
+            static struct class_Str string93_CONSTRUCTOR_7f260334d8 = {
+                .buf = &string93_CONSTRUCTOR_7f260334d8_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string94_ctor__5008fd0aed_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x74', '\x6f', '\x72', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string94_ctor__5008fd0aed = {
+                .buf = &string94_ctor__5008fd0aed_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string95_DESTRUCTOR_9d2a8e4687_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x44', '\x45', '\x53', '\x54', '\x52', '\x55', '\x43', '\x54', '\x4f', '\x52' },
+                .malloced = false,
+            };
+            static struct class_Str string95_DESTRUCTOR_9d2a8e4687 = {
+                .buf = &string95_DESTRUCTOR_9d2a8e4687_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string96_dtor__c0c64c77d8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x74', '\x6f', '\x72', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string96_dtor__c0c64c77d8 = {
+                .buf = &string96_dtor__c0c64c77d8_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string97_TYPE_317f84a587_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x59', '\x50', '\x45' },
+                .malloced = false,
+            };
+            static struct class_Str string97_TYPE_317f84a587 = {
+                .buf = &string97_TYPE_317f84a587_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string98____bd3f03ca7c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x2a' },
+                .malloced = false,
+            };
+            static struct class_Str string98____bd3f03ca7c = {
+                .buf = &string98____bd3f03ca7c_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string99_TYPE_STRUCT_c4ac1cfc3e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x59', '\x50', '\x45', '\x5f', '\x53', '\x54', '\x52', '\x55', '\x43', '\x54' },
+                .malloced = false,
+            };
+            static struct class_Str string99_TYPE_STRUCT_c4ac1cfc3e = {
+                .buf = &string99_TYPE_STRUCT_c4ac1cfc3e_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string100_class__296f18d03a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string100_class__296f18d03a = {
+                .buf = &string100_class__296f18d03a_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string101_METHOD_name__15be1988f4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4d', '\x45', '\x54', '\x48', '\x4f', '\x44', '\x28', '\x6e', '\x61', '\x6d', '\x65', '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string101_METHOD_name__15be1988f4 = {
+                .buf = &string101_METHOD_name__15be1988f4_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string102____name_1c0bc7a44d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x23', '\x23', '\x6e', '\x61', '\x6d', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string102____name_1c0bc7a44d = {
+                .buf = &string102____name_1c0bc7a44d_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string103_ITEMTYPE_a946a7fce3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x54', '\x45', '\x4d', '\x54', '\x59', '\x50', '\x45' },
+                .malloced = false,
+            };
+            static struct class_Str string103_ITEMTYPE_a946a7fce3 = {
+                .buf = &string103_ITEMTYPE_a946a7fce3_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string104_ITEMTYPE_METHOD_name__fcd6515168_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x54', '\x45', '\x4d', '\x54', '\x59', '\x50', '\x45', '\x5f', '\x4d', '\x45', '\x54', '\x48', '\x4f', '\x44', '\x28', '\x6e', '\x61', '\x6d', '\x65', '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string104_ITEMTYPE_METHOD_name__fcd6515168 = {
+                .buf = &string104_ITEMTYPE_METHOD_name__fcd6515168_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string105_INCREF_ITEM_val__def389f73e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x4e', '\x43', '\x52', '\x45', '\x46', '\x5f', '\x49', '\x54', '\x45', '\x4d', '\x28', '\x76', '\x61', '\x6c', '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string105_INCREF_ITEM_val__def389f73e = {
+                .buf = &string105_INCREF_ITEM_val__def389f73e_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string106__val__f3357ba361_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x76', '\x61', '\x6c', '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string106__val__f3357ba361 = {
+                .buf = &string106__val__f3357ba361_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string107_DECREF_ITEM_val__d348a13608_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x44', '\x45', '\x43', '\x52', '\x45', '\x46', '\x5f', '\x49', '\x54', '\x45', '\x4d', '\x28', '\x76', '\x61', '\x6c', '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string107_DECREF_ITEM_val__d348a13608 = {
+                .buf = &string107_DECREF_ITEM_val__d348a13608_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string108_ITEMTYPE_IS_STRING_6d1cc985c2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x54', '\x45', '\x4d', '\x54', '\x59', '\x50', '\x45', '\x5f', '\x49', '\x53', '\x5f', '\x53', '\x54', '\x52', '\x49', '\x4e', '\x47' },
+                .malloced = false,
+            };
+            static struct class_Str string108_ITEMTYPE_IS_STRING_6d1cc985c2 = {
+                .buf = &string108_ITEMTYPE_IS_STRING_6d1cc985c2_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string109_1_57b1a3ef8f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x31' },
+                .malloced = false,
+            };
+            static struct class_Str string109_1_57b1a3ef8f = {
+                .buf = &string109_1_57b1a3ef8f_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string110___1401049c7f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string110___1401049c7f = {
+                .buf = &string110___1401049c7f_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string111__define__ecc087e058_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x23', '\x64', '\x65', '\x66', '\x69', '\x6e', '\x65', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string111__define__ecc087e058 = {
+                .buf = &string111__define__ecc087e058_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string112__undef__4a7b61af8c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x23', '\x75', '\x6e', '\x64', '\x65', '\x66', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string112__undef__4a7b61af8c = {
+                .buf = &string112__undef__4a7b61af8c_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string113_lib_generic_list_h_3e66a12824_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x69', '\x62', '\x2f', '\x67', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x2f', '\x6c', '\x69', '\x73', '\x74', '\x2e', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string113_lib_generic_list_h_3e66a12824 = {
+                .buf = &string113_lib_generic_list_h_3e66a12824_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string114_TYPE_CONSTRUCTOR_void___void_DESTRUCTOR_void__ptr___be61785c83_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x59', '\x50', '\x45', '\x20', '\x43', '\x4f', '\x4e', '\x53', '\x54', '\x52', '\x55', '\x43', '\x54', '\x4f', '\x52', '\x28', '\x76', '\x6f', '\x69', '\x64', '\x29', '\x3b', '\x20', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x44', '\x45', '\x53', '\x54', '\x52', '\x55', '\x43', '\x54', '\x4f', '\x52', '\x28', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x2a', '\x70', '\x74', '\x72', '\x29', '\x3b' },
+                .malloced = false,
+            };
+            static struct class_Str string114_TYPE_CONSTRUCTOR_void___void_DESTRUCTOR_void__ptr___be61785c83 = {
+                .buf = &string114_TYPE_CONSTRUCTOR_void___void_DESTRUCTOR_void__ptr___be61785c83_buf,
+                .nbytes = 51,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string115_lib_generic_list_c_045b5afa1d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x69', '\x62', '\x2f', '\x67', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x2f', '\x6c', '\x69', '\x73', '\x74', '\x2e', '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string115_lib_generic_list_c_045b5afa1d = {
+                .buf = &string115_lib_generic_list_c_045b5afa1d_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string116__memb__da84384c07_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6d', '\x65', '\x6d', '\x62', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string116__memb__da84384c07 = {
+                .buf = &string116__memb__da84384c07_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string117__arg__b0c9cbb279_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x61', '\x72', '\x67', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string117__arg__b0c9cbb279 = {
+                .buf = &string117__arg__b0c9cbb279_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string118_obj__memb__d08a0c2cf2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2d', '\x3e', '\x6d', '\x65', '\x6d', '\x62', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string118_obj__memb__d08a0c2cf2 = {
+                .buf = &string118_obj__memb__d08a0c2cf2_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string119____arg__b04d6fe191_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x3d', '\x20', '\x61', '\x72', '\x67', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string119____arg__b04d6fe191 = {
+                .buf = &string119____arg__b04d6fe191_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string120______________________struct_class__d1f94524ac_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string120______________________struct_class__d1f94524ac = {
+                .buf = &string120______________________struct_class__d1f94524ac_buf,
+                .nbytes = 34,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string121____________________________REFCOUNT_HEADER__________________________7b92e580ec_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x52', '\x45', '\x46', '\x43', '\x4f', '\x55', '\x4e', '\x54', '\x5f', '\x48', '\x45', '\x41', '\x44', '\x45', '\x52', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string121____________________________REFCOUNT_HEADER__________________________7b92e580ec = {
+                .buf = &string121____________________________REFCOUNT_HEADER__________________________7b92e580ec_buf,
+                .nbytes = 67,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string122______________________________________________1e13706db2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string122______________________________________________1e13706db2 = {
+                .buf = &string122______________________________________________1e13706db2_buf,
+                .nbytes = 44,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string123__ctor__56dbf44a4f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x63', '\x74', '\x6f', '\x72', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string123__ctor__56dbf44a4f = {
+                .buf = &string123__ctor__56dbf44a4f_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string124________________________void_dtor__9b0c4575da_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x64', '\x74', '\x6f', '\x72', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string124________________________void_dtor__9b0c4575da = {
+                .buf = &string124________________________void_dtor__9b0c4575da_buf,
+                .nbytes = 33,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string125__void__ptr________________________f305190e86_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x2a', '\x70', '\x74', '\x72', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string125__void__ptr________________________f305190e86 = {
+                .buf = &string125__void__ptr________________________f305190e86_buf,
+                .nbytes = 33,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string126__________________________________________________6760f78668_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string126__________________________________________________6760f78668 = {
+                .buf = &string126__________________________________________________6760f78668_buf,
+                .nbytes = 48,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string127__obj___malloc_sizeof__obj____________________________assert_obj___________________________obj__refcount___1___________________________e648cd65d9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x20', '\x3d', '\x20', '\x6d', '\x61', '\x6c', '\x6c', '\x6f', '\x63', '\x28', '\x73', '\x69', '\x7a', '\x65', '\x6f', '\x66', '\x28', '\x2a', '\x6f', '\x62', '\x6a', '\x29', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x61', '\x73', '\x73', '\x65', '\x72', '\x74', '\x28', '\x6f', '\x62', '\x6a', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x6f', '\x62', '\x6a', '\x2d', '\x3e', '\x72', '\x65', '\x66', '\x63', '\x6f', '\x75', '\x6e', '\x74', '\x20', '\x3d', '\x20', '\x31', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string127__obj___malloc_sizeof__obj____________________________assert_obj___________________________obj__refcount___1___________________________e648cd65d9 = {
+                .buf = &string127__obj___malloc_sizeof__obj____________________________assert_obj___________________________obj__refcount___1___________________________e648cd65d9_buf,
+                .nbytes = 133,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string128___________________________9ff0ba6c73_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string128___________________________9ff0ba6c73 = {
+                .buf = &string128___________________________9ff0ba6c73_buf,
+                .nbytes = 25,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string129__________________________return_obj_____________________________________________void_dtor__0eb49930d4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x6f', '\x62', '\x6a', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x0a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x64', '\x74', '\x6f', '\x72', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string129__________________________return_obj_____________________________________________void_dtor__0eb49930d4 = {
+                .buf = &string129__________________________return_obj_____________________________________________void_dtor__0eb49930d4_buf,
+                .nbytes = 90,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string130__void__ptr________________________________________________struct_class__df8fb23161_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x2a', '\x70', '\x74', '\x72', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string130__void__ptr________________________________________________struct_class__df8fb23161 = {
+                .buf = &string130__void__ptr________________________________________________struct_class__df8fb23161_buf,
+                .nbytes = 71,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string131___obj___ptr___________________________8c0875cfc2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x2a', '\x6f', '\x62', '\x6a', '\x20', '\x3d', '\x20', '\x70', '\x74', '\x72', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string131___obj___ptr___________________________8c0875cfc2 = {
+                .buf = &string131___obj___ptr___________________________8c0875cfc2_buf,
+                .nbytes = 37,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string132__________________________free_obj______________________________________________c762b5a07b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x66', '\x72', '\x65', '\x65', '\x28', '\x6f', '\x62', '\x6a', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string132__________________________free_obj______________________________________________c762b5a07b = {
+                .buf = &string132__________________________free_obj______________________________________________c762b5a07b_buf,
+                .nbytes = 78,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string133__________________________struct_class_Str_meth__ef78a1bee5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f', '\x53', '\x74', '\x72', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string133__________________________struct_class_Str_meth__ef78a1bee5 = {
+                .buf = &string133__________________________struct_class_Str_meth__ef78a1bee5_buf,
+                .nbytes = 47,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string134__to_string__e55b86daa9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x28' },
+                .malloced = false,
+            };
+            static struct class_Str string134__to_string__e55b86daa9 = {
+                .buf = &string134__to_string__e55b86daa9_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string135__obj____________________________7f9b736a41_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string135__obj____________________________7f9b736a41 = {
+                .buf = &string135__obj____________________________7f9b736a41_buf,
+                .nbytes = 31,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string136__________________________________tmp___meth__de2e6b2828_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x74', '\x6d', '\x70', '\x20', '\x3d', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string136__________________________________tmp___meth__de2e6b2828 = {
+                .buf = &string136__________________________________tmp___meth__de2e6b2828_buf,
+                .nbytes = 44,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string137__to_string_self__memb__efd769ce39_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x28', '\x73', '\x65', '\x6c', '\x66', '\x2d', '\x3e', '\x6d', '\x65', '\x6d', '\x62', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string137__to_string_self__memb__efd769ce39 = {
+                .buf = &string137__to_string_self__memb__efd769ce39_buf,
+                .nbytes = 22,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string138____________________________________oomph_string_concat_inplace__res__tmp___________________________________string_decref_tmp____________________________________7f935a5a13_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x63', '\x6f', '\x6e', '\x63', '\x61', '\x74', '\x5f', '\x69', '\x6e', '\x70', '\x6c', '\x61', '\x63', '\x65', '\x28', '\x26', '\x72', '\x65', '\x73', '\x2c', '\x20', '\x74', '\x6d', '\x70', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x64', '\x65', '\x63', '\x72', '\x65', '\x66', '\x28', '\x74', '\x6d', '\x70', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string138____________________________________oomph_string_concat_inplace__res__tmp___________________________________string_decref_tmp____________________________________7f935a5a13 = {
+                .buf = &string138____________________________________oomph_string_concat_inplace__res__tmp___________________________________string_decref_tmp____________________________________7f935a5a13_buf,
+                .nbytes = 159,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string139_oomph_string_concat_inplace_cstr__res_________0d14eaacd2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x63', '\x6f', '\x6e', '\x63', '\x61', '\x74', '\x5f', '\x69', '\x6e', '\x70', '\x6c', '\x61', '\x63', '\x65', '\x5f', '\x63', '\x73', '\x74', '\x72', '\x28', '\x26', '\x72', '\x65', '\x73', '\x2c', '\x20', '\x22', '\x2c', '\x20', '\x22', '\x29', '\x3b' },
+                .malloced = false,
+            };
+            static struct class_Str string139_oomph_string_concat_inplace_cstr__res_________0d14eaacd2 = {
+                .buf = &string139_oomph_string_concat_inplace_cstr__res_________0d14eaacd2_buf,
+                .nbytes = 45,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string140__self________________________________________________________struct_class_Str_res____1a2d4edce0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x73', '\x65', '\x6c', '\x66', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f', '\x53', '\x74', '\x72', '\x20', '\x72', '\x65', '\x73', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string140__self________________________________________________________struct_class_Str_res____1a2d4edce0 = {
+                .buf = &string140__self________________________________________________________struct_class_Str_res____1a2d4edce0_buf,
+                .nbytes = 84,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string141_______________________________struct_class_Str_tmp______________________________oomph_string_concat_inplace_cstr__res_____________________________________b8968be402_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x5f', '\x53', '\x74', '\x72', '\x20', '\x74', '\x6d', '\x70', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x63', '\x6f', '\x6e', '\x63', '\x61', '\x74', '\x5f', '\x69', '\x6e', '\x70', '\x6c', '\x61', '\x63', '\x65', '\x5f', '\x63', '\x73', '\x74', '\x72', '\x28', '\x26', '\x72', '\x65', '\x73', '\x2c', '\x20', '\x22', '\x28', '\x22', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string141_______________________________struct_class_Str_tmp______________________________oomph_string_concat_inplace_cstr__res_____________________________________b8968be402 = {
+                .buf = &string141_______________________________struct_class_Str_tmp______________________________oomph_string_concat_inplace_cstr__res_____________________________________b8968be402_buf,
+                .nbytes = 153,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string142______________________________oomph_string_concat_inplace_cstr__res____________________________________return_res_____________________________________________________61f01882da_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x63', '\x6f', '\x6e', '\x63', '\x61', '\x74', '\x5f', '\x69', '\x6e', '\x70', '\x6c', '\x61', '\x63', '\x65', '\x5f', '\x63', '\x73', '\x74', '\x72', '\x28', '\x26', '\x72', '\x65', '\x73', '\x2c', '\x20', '\x22', '\x29', '\x22', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x72', '\x65', '\x73', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string142______________________________oomph_string_concat_inplace_cstr__res____________________________________return_res_____________________________________________________61f01882da = {
+                .buf = &string142______________________________oomph_string_concat_inplace_cstr__res____________________________________return_res_____________________________________________________61f01882da_buf,
+                .nbytes = 164,
+                .offset = 0,
+            };
+            
+            struct class_FilePair_99df852164* ctor_FilePair_99df852164(struct class_Session_88204c75ff* arg_session,struct class_Str arg_id,struct class__Type___Str__e7feb8bffc arg_type_or_source_path,struct class_List_Str__43b70c06cb* arg_strings,struct class__null___Str__5eca9cec4f arg_struct,struct class_Str arg_string_defs,struct class_Str arg_function_decls,struct class_Str arg_function_defs,struct class_List_FilePair__2b6998ab5b* arg_c_includes,struct class_List_FilePair__2b6998ab5b* arg_h_includes,struct class_Str arg_h_fwd_decls)
+            {
+                struct class_FilePair_99df852164* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_session = arg_session;
+obj->memb_id = arg_id;
+obj->memb_type_or_source_path = arg_type_or_source_path;
+obj->memb_strings = arg_strings;
+obj->memb_struct = arg_struct;
+obj->memb_string_defs = arg_string_defs;
+obj->memb_function_decls = arg_function_decls;
+obj->memb_function_defs = arg_function_defs;
+obj->memb_c_includes = arg_c_includes;
+obj->memb_h_includes = arg_h_includes;
+obj->memb_h_fwd_decls = arg_h_fwd_decls;
+
+                incref(arg_session);
+string_incref(arg_id);
+incref__Type___Str__e7feb8bffc(arg_type_or_source_path);
+incref(arg_strings);
+incref__null___Str__5eca9cec4f(arg_struct);
+string_incref(arg_string_defs);
+string_incref(arg_function_decls);
+string_incref(arg_function_defs);
+incref(arg_c_includes);
+incref(arg_h_includes);
+string_incref(arg_h_fwd_decls);
+
+                return obj;
+            }
+
+            void dtor_FilePair_99df852164(void *ptr)
+            {
+                struct class_FilePair_99df852164 *obj = ptr;
+                decref((obj->memb_session), dtor_Session_88204c75ff);
+string_decref(obj->memb_id);
+decref__Type___Str__e7feb8bffc(obj->memb_type_or_source_path);
+decref((obj->memb_strings), dtor_List_Str__43b70c06cb);
+decref__null___Str__5eca9cec4f(obj->memb_struct);
+string_decref(obj->memb_string_defs);
+string_decref(obj->memb_function_decls);
+string_decref(obj->memb_function_defs);
+decref((obj->memb_c_includes), dtor_List_FilePair__2b6998ab5b);
+decref((obj->memb_h_includes), dtor_List_FilePair__2b6998ab5b);
+string_decref(obj->memb_h_fwd_decls);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_FilePair_99df852164_to_string(struct class_FilePair_99df852164* self)
+                {
+                    struct class_Str res = string0_FilePair_b09118b315;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Session_88204c75ff_to_string(self->memb_session);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_id);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__Type___Str__e7feb8bffc_to_string(self->memb_type_or_source_path);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Str__43b70c06cb_to_string(self->memb_strings);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__null___Str__5eca9cec4f_to_string(self->memb_struct);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_string_defs);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_function_decls);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_function_defs);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_FilePair__2b6998ab5b_to_string(self->memb_c_includes);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_FilePair__2b6998ab5b_to_string(self->memb_h_includes);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_h_fwd_decls);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_FilePair_99df852164_equals(struct class_FilePair_99df852164* var1, struct class_FilePair_99df852164* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}struct class_Str meth_FilePair_99df852164_emit_type(struct class_FilePair_99df852164* var1, struct class__null___Type__8438ac3dcf var2){bool var3;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str retval;
+var3 = oomph_true;
+var4 = meth_FilePair_99df852164_emit_type_custom(var1,var2,var3);
+retval = var4; var4.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var4);
+(void)0;
+return retval;
+}struct class_Str meth_FilePair_99df852164_emit_type_custom(struct class_FilePair_99df852164* var1, struct class__null___Type__8438ac3dcf var2, bool var3){bool var4;
+char var5;
+struct class__null___Type__8438ac3dcf var6;
+var6.membernum = -1;
+bool var7;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Type_87e1ce5c5e var11;
+var11.membernum = -1;
+bool var12;
+struct class_AutoType_33a5d572cb* var15;
+var15 = NULL;
+bool var16;
+struct class_Str var17;
+var17.buf = NULL;
+int64_t var18;
+struct class_Session_88204c75ff* var20;
+var20 = NULL;
+struct class_Builtins_bd980a9f08* var21;
+var21 = NULL;
+struct class_Type_87e1ce5c5e var22;
+var22.membernum = -1;
+bool var23;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_Session_88204c75ff* var27;
+var27 = NULL;
+struct class_Builtins_bd980a9f08* var28;
+var28 = NULL;
+struct class_Type_87e1ce5c5e var29;
+var29.membernum = -1;
+bool var30;
+struct class_Str var33;
+var33.buf = NULL;
+struct class_Session_88204c75ff* var34;
+var34 = NULL;
+struct class_Builtins_bd980a9f08* var35;
+var35 = NULL;
+struct class_Type_87e1ce5c5e var36;
+var36.membernum = -1;
+bool var37;
+struct class_Str var40;
+var40.buf = NULL;
+struct class_Session_88204c75ff* var41;
+var41 = NULL;
+struct class_Builtins_bd980a9f08* var42;
+var42 = NULL;
+struct class_Type_87e1ce5c5e var43;
+var43.membernum = -1;
+bool var44;
+struct class_Str var47;
+var47.buf = NULL;
+struct class_Session_88204c75ff* var48;
+var48 = NULL;
+struct class_Builtins_bd980a9f08* var49;
+var49 = NULL;
+struct class_Type_87e1ce5c5e var50;
+var50.membernum = -1;
+bool var51;
+struct class_Str var54;
+var54.buf = NULL;
+struct class_Session_88204c75ff* var55;
+var55 = NULL;
+struct class_FilePair_99df852164* var56;
+var56 = NULL;
+struct class_Str var57;
+var57.buf = NULL;
+struct class_Str var58;
+var58.buf = NULL;
+struct class_Str var59;
+var59.buf = NULL;
+bool var60;
+struct class_UnionType_7f899bced1* var63;
+var63 = NULL;
+bool var64;
+bool var66;
+bool var68;
+struct class_Str var70;
+var70.buf = NULL;
+struct class_Str var71;
+var71.buf = NULL;
+bool var72;
+bool var73;
+struct class_List_FilePair__2b6998ab5b* var76;
+var76 = NULL;
+bool var77;
+bool var78;
+struct class_List_FilePair__2b6998ab5b* var81;
+var81 = NULL;
+struct class_List_FilePair__2b6998ab5b* var83;
+var83 = NULL;
+bool var84;
+bool var85;
+struct class_List_FilePair__2b6998ab5b* var88;
+var88 = NULL;
+struct class_Str var90;
+var90.buf = NULL;
+struct class_Str var91;
+var91.buf = NULL;
+struct class_Str var92;
+var92.buf = NULL;
+struct class_Str var93;
+var93.buf = NULL;
+struct class_Str var94;
+var94.buf = NULL;
+struct class_Str var95;
+var95.buf = NULL;
+struct class_Str var96;
+var96.buf = NULL;
+struct class_Str var97;
+var97.buf = NULL;
+struct class_Str retval;
+var4 = var3;
+var5 = oomph_null;
+var6 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var5 }, .membernum = 0 };
+var7 = meth__null___Type__8438ac3dcf_equals(var2,var6);
+if (var7) goto label8;
+if (oomph_true) goto label9;
+label8: (void)0;
+var10 = string1_void_23c41bd03f; string_incref(var10);
+retval = var10; var10.buf = NULL;
+goto out;
+label9: (void)0;
+var11 = meth__null___Type__8438ac3dcf_get(var2);
+
+            var12 = (
+                var11.membernum == 0
+            );
+            if (var12) goto label13;
+
+            var12 = (
+                var11.membernum == 1
+            );
+            if (var12) goto label14;
+
+            var12 = (
+                var11.membernum == 2
+            );
+            if (var12) goto label14;
+
+            var12 = (
+                var11.membernum == 3
+            );
+            if (var12) goto label14;
+label13: (void)0;
+
+            if (var11.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var15 = var11.val.item0;
+            incref(var15);
+var16 = oomph_false;
+var17 = string2_self_hosted_c_output_oomph_64e0ea3117; string_incref(var17);
+var18 = 269LL;
+oomph_assert(var16,var17,var18);
+if (oomph_true) goto label19;
+label14: (void)0;
+label19: (void)0;
+var20 = var1->memb_session;
+var21 = var20->memb_builtins;
+var20 = NULL;
+incref(var21);
+var22 = var21->memb_INT;
+incref_Type_87e1ce5c5e(var22);
+var23 = meth_Type_87e1ce5c5e_equals(var11,var22);
+if (var23) goto label24;
+if (oomph_true) goto label25;
+label24: (void)0;
+var26 = string3_int64_t_83becdea11; string_incref(var26);
+retval = var26; var26.buf = NULL;
+goto out;
+label25: (void)0;
+var27 = var1->memb_session;
+var28 = var27->memb_builtins;
+var27 = NULL;
+incref(var28);
+var29 = var28->memb_FLOAT;
+incref_Type_87e1ce5c5e(var29);
+var30 = meth_Type_87e1ce5c5e_equals(var11,var29);
+if (var30) goto label31;
+if (oomph_true) goto label32;
+label31: (void)0;
+var33 = string4_double_3f45021648; string_incref(var33);
+retval = var33; var33.buf = NULL;
+goto out;
+label32: (void)0;
+var34 = var1->memb_session;
+var35 = var34->memb_builtins;
+var34 = NULL;
+incref(var35);
+var36 = var35->memb_BOOL;
+incref_Type_87e1ce5c5e(var36);
+var37 = meth_Type_87e1ce5c5e_equals(var11,var36);
+if (var37) goto label38;
+if (oomph_true) goto label39;
+label38: (void)0;
+var40 = string5_bool_87ceb82cfb; string_incref(var40);
+retval = var40; var40.buf = NULL;
+goto out;
+label39: (void)0;
+var41 = var1->memb_session;
+var42 = var41->memb_builtins;
+var41 = NULL;
+incref(var42);
+var43 = var42->memb_STR;
+incref_Type_87e1ce5c5e(var43);
+var44 = meth_Type_87e1ce5c5e_equals(var11,var43);
+if (var44) goto label45;
+if (oomph_true) goto label46;
+label45: (void)0;
+var47 = string6_struct_class_Str_37048601bb; string_incref(var47);
+retval = var47; var47.buf = NULL;
+goto out;
+label46: (void)0;
+var48 = var1->memb_session;
+var49 = var48->memb_builtins;
+var48 = NULL;
+incref(var49);
+var50 = var49->memb_NULL_TYPE;
+incref_Type_87e1ce5c5e(var50);
+var51 = meth_Type_87e1ce5c5e_equals(var11,var50);
+if (var51) goto label52;
+if (oomph_true) goto label53;
+label52: (void)0;
+var54 = string7_char_f51c5bcd0a; string_incref(var54);
+retval = var54; var54.buf = NULL;
+goto out;
+label53: (void)0;
+var55 = var1->memb_session;
+incref(var55);
+var56 = meth_Session_88204c75ff_type_to_file_pair(var55,var11);
+var57 = string8_struct_class__cbaa47d00e; string_incref(var57);
+var58 = var56->memb_id;
+string_incref(var58);
+var59 = oomph_string_concat(var57,var58);
+
+            var60 = (
+                var11.membernum == 3
+            );
+            if (var60) goto label61;
+
+            var60 = (
+                var11.membernum == 0
+            );
+            if (var60) goto label62;
+
+            var60 = (
+                var11.membernum == 1
+            );
+            if (var60) goto label62;
+
+            var60 = (
+                var11.membernum == 2
+            );
+            if (var60) goto label62;
+label61: (void)0;
+
+            if (var11.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var63 = var11.val.item3;
+            incref(var63);
+var64 = oomph_false;
+var4 = var64;
+if (oomph_true) goto label65;
+label62: (void)0;
+var66 = ir_4b1a3e0393_is_refcounted(var11);
+if (var66) goto label67;
+var68 = oomph_false;
+var4 = var68;
+if (oomph_true) goto label69;
+label67: (void)0;
+var70 = string9___fd8d53e8a5; string_incref(var70);
+var71 = oomph_string_concat(var59,var70);
+string_decref(var59);
+var59 = var71;
+var71.buf = NULL;
+label69: (void)0;
+label65: (void)0;
+var72 = meth_FilePair_99df852164_equals(var56,var1);
+var73 = oomph_bool_not(var72);
+if (var73) goto label74;
+if (oomph_true) goto label75;
+label74: (void)0;
+var76 = var1->memb_c_includes;
+incref(var76);
+var77 = meth_List_FilePair__2b6998ab5b___contains(var76,var56);
+var78 = oomph_bool_not(var77);
+if (var78) goto label79;
+if (oomph_true) goto label80;
+label79: (void)0;
+var81 = var1->memb_c_includes;
+incref(var81);
+meth_List_FilePair__2b6998ab5b_push(var81,var56);
+label80: (void)0;
+if (var4) goto label82;
+var83 = var1->memb_h_includes;
+incref(var83);
+var84 = meth_List_FilePair__2b6998ab5b___contains(var83,var56);
+var85 = oomph_bool_not(var84);
+if (var85) goto label86;
+if (oomph_true) goto label87;
+label86: (void)0;
+var88 = var1->memb_h_includes;
+incref(var88);
+meth_List_FilePair__2b6998ab5b_push(var88,var56);
+label87: (void)0;
+if (oomph_true) goto label89;
+label82: (void)0;
+var90 = var1->memb_h_fwd_decls;
+string_incref(var90);
+var91 = string8_struct_class__cbaa47d00e; string_incref(var91);
+var92 = var56->memb_id;
+string_incref(var92);
+var93 = oomph_string_concat(var91,var92);
+var94 = string10____afb2f97902; string_incref(var94);
+var95 = oomph_string_concat(var93,var94);
+var96 = oomph_string_concat(var90,var95);
+var97 = var1->memb_h_fwd_decls;
+var1->memb_h_fwd_decls = var96;
+var96.buf = NULL;
+label89: (void)0;
+label75: (void)0;
+retval = var59; var59.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var97);
+string_decref(var96);
+string_decref(var95);
+string_decref(var94);
+string_decref(var93);
+string_decref(var92);
+string_decref(var91);
+string_decref(var90);
+decref((var88), dtor_List_FilePair__2b6998ab5b);
+(void)0;
+(void)0;
+decref((var83), dtor_List_FilePair__2b6998ab5b);
+decref((var81), dtor_List_FilePair__2b6998ab5b);
+(void)0;
+(void)0;
+decref((var76), dtor_List_FilePair__2b6998ab5b);
+(void)0;
+(void)0;
+string_decref(var71);
+string_decref(var70);
+(void)0;
+(void)0;
+(void)0;
+decref((var63), dtor_UnionType_7f899bced1);
+(void)0;
+string_decref(var59);
+string_decref(var58);
+string_decref(var57);
+decref((var56), dtor_FilePair_99df852164);
+decref((var55), dtor_Session_88204c75ff);
+string_decref(var54);
+(void)0;
+decref_Type_87e1ce5c5e(var50);
+decref((var49), dtor_Builtins_bd980a9f08);
+decref((var48), dtor_Session_88204c75ff);
+string_decref(var47);
+(void)0;
+decref_Type_87e1ce5c5e(var43);
+decref((var42), dtor_Builtins_bd980a9f08);
+decref((var41), dtor_Session_88204c75ff);
+string_decref(var40);
+(void)0;
+decref_Type_87e1ce5c5e(var36);
+decref((var35), dtor_Builtins_bd980a9f08);
+decref((var34), dtor_Session_88204c75ff);
+string_decref(var33);
+(void)0;
+decref_Type_87e1ce5c5e(var29);
+decref((var28), dtor_Builtins_bd980a9f08);
+decref((var27), dtor_Session_88204c75ff);
+string_decref(var26);
+(void)0;
+decref_Type_87e1ce5c5e(var22);
+decref((var21), dtor_Builtins_bd980a9f08);
+decref((var20), dtor_Session_88204c75ff);
+(void)0;
+string_decref(var17);
+(void)0;
+decref((var15), dtor_AutoType_33a5d572cb);
+(void)0;
+decref_Type_87e1ce5c5e(var11);
+string_decref(var10);
+(void)0;
+decref__null___Type__8438ac3dcf(var6);
+(void)0;
+(void)0;
+return retval;
+}struct class_Str meth_FilePair_99df852164_emit_var(struct class_FilePair_99df852164* var1, struct class_Variable_1aaa81c8d2 var2){bool var3;
+struct class_LocalVariable_846080e5ae* var7;
+var7 = NULL;
+bool var8;
+struct class_Str var9;
+var9.buf = NULL;
+int64_t var10;
+struct class_BuiltinVariable_f6e0cdd1b6* var12;
+var12 = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_FileVariable_a7b8ca651f* var17;
+var17 = NULL;
+struct class_Session_88204c75ff* var18;
+var18 = NULL;
+struct class_List_Symbol__9a01330177* var19;
+var19 = NULL;
+int64_t var20;
+struct class_Symbol_037dd39afd* var22;
+var22 = NULL;
+struct class_SymbolValue_b2eed984e4 var24;
+var24.membernum = -1;
+struct class_SymbolValue_b2eed984e4 var25;
+var25.membernum = -1;
+bool var26;
+struct class_Session_88204c75ff* var29;
+var29 = NULL;
+struct class_Str var30;
+var30.buf = NULL;
+struct class_FilePair_99df852164* var31;
+var31 = NULL;
+bool var32;
+bool var33;
+struct class_List_FilePair__2b6998ab5b* var36;
+var36 = NULL;
+bool var37;
+bool var38;
+struct class_List_FilePair__2b6998ab5b* var41;
+var41 = NULL;
+struct class_List_FilePair__2b6998ab5b* var42;
+var42 = NULL;
+bool var43;
+bool var44;
+struct class_List_FilePair__2b6998ab5b* var47;
+var47 = NULL;
+struct class_Variable_1aaa81c8d2 var48;
+var48.membernum = -1;
+struct class_Str var49;
+var49.buf = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+bool var52;
+struct class_Str var55;
+var55.buf = NULL;
+struct class_Str var56;
+var56.buf = NULL;
+struct class_Str var57;
+var57.buf = NULL;
+struct class_Str var58;
+var58.buf = NULL;
+struct class_Str var59;
+var59.buf = NULL;
+struct class_Str var60;
+var60.buf = NULL;
+struct class_Str var61;
+var61.buf = NULL;
+struct class_Str var62;
+var62.buf = NULL;
+struct class_Str var63;
+var63.buf = NULL;
+struct class_Str var64;
+var64.buf = NULL;
+struct class_Str var65;
+var65.buf = NULL;
+struct class_Str var66;
+var66.buf = NULL;
+struct class_Str var67;
+var67.buf = NULL;
+struct class_Str var68;
+var68.buf = NULL;
+struct class_Str var69;
+var69.buf = NULL;
+struct class_Str var70;
+var70.buf = NULL;
+struct class_Str var71;
+var71.buf = NULL;
+struct class_Str var72;
+var72.buf = NULL;
+struct class_Str var73;
+var73.buf = NULL;
+struct class_Str var74;
+var74.buf = NULL;
+struct class_Str var75;
+var75.buf = NULL;
+struct class_List_Str__43b70c06cb* var76;
+var76 = NULL;
+bool var77;
+struct class_Str var80;
+var80.buf = NULL;
+struct class_Str var81;
+var81.buf = NULL;
+struct class_Str var82;
+var82.buf = NULL;
+struct class_Str var83;
+var83.buf = NULL;
+struct class_Str var84;
+var84.buf = NULL;
+struct class_Str var85;
+var85.buf = NULL;
+struct class_Str var86;
+var86.buf = NULL;
+struct class_Str var87;
+var87.buf = NULL;
+struct class_Str var88;
+var88.buf = NULL;
+struct class_Str retval;
+
+            var3 = (
+                var2.membernum == 2
+            );
+            if (var3) goto label4;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) goto label5;
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) goto label6;
+label4: (void)0;
+
+            if (var2.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var7 = var2.val.item2;
+            incref(var7);
+var8 = oomph_false;
+var9 = string2_self_hosted_c_output_oomph_64e0ea3117; string_incref(var9);
+var10 = 311LL;
+oomph_assert(var8,var9,var10);
+if (oomph_true) goto label11;
+label5: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var12 = var2.val.item0;
+            incref(var12);
+var13 = string11_oomph__b49a881ee6; string_incref(var13);
+var14 = var12->memb_name;
+string_incref(var14);
+var15 = c_output_6a23cf54cc_trim_leading_underscores(var14);
+var16 = oomph_string_concat(var13,var15);
+retval = var16; var16.buf = NULL;
+goto out;
+label6: (void)0;
+
+            if (var2.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var17 = var2.val.item1;
+            incref(var17);
+var18 = var1->memb_session;
+var19 = var18->memb_symbols;
+var18 = NULL;
+incref(var19);
+var20 = 0LL;
+label21: (void)0;
+if (var20 >= var19->len) goto label23;
+decref((var22), dtor_Symbol_037dd39afd); var22 = var19->data[var20++]; incref(var22);
+decref_SymbolValue_b2eed984e4(var24);
+var24.membernum = -1;
+var24 = var22->memb_value;
+incref_SymbolValue_b2eed984e4(var24);
+decref_SymbolValue_b2eed984e4(var25);
+var25.membernum = -1;
+var25 = (struct class_SymbolValue_b2eed984e4){ .val = { .item1 = var17 }, .membernum = 1 };
+incref(var17);
+var26 = meth_SymbolValue_b2eed984e4_equals(var24,var25);
+if (var26) goto label27;
+if (oomph_true) goto label28;
+label27: (void)0;
+decref((var29), dtor_Session_88204c75ff);
+var29 = NULL;
+var29 = var1->memb_session;
+incref(var29);
+string_decref(var30);
+var30.buf = NULL;
+var30 = var22->memb_path;
+string_incref(var30);
+decref((var31), dtor_FilePair_99df852164);
+var31 = NULL;
+var31 = meth_Session_88204c75ff_source_path_to_file_pair(var29,var30);
+var32 = meth_FilePair_99df852164_equals(var31,var1);
+var33 = oomph_bool_not(var32);
+if (var33) goto label34;
+if (oomph_true) goto label35;
+label34: (void)0;
+var36 = var1->memb_c_includes;
+incref(var36);
+var37 = meth_List_FilePair__2b6998ab5b___contains(var36,var31);
+var38 = oomph_bool_not(var37);
+if (var38) goto label39;
+if (oomph_true) goto label40;
+label39: (void)0;
+var41 = var1->memb_c_includes;
+incref(var41);
+meth_List_FilePair__2b6998ab5b_push(var41,var31);
+label40: (void)0;
+var42 = var1->memb_h_includes;
+incref(var42);
+var43 = meth_List_FilePair__2b6998ab5b___contains(var42,var31);
+var44 = oomph_bool_not(var43);
+if (var44) goto label45;
+if (oomph_true) goto label46;
+label45: (void)0;
+var47 = var1->memb_h_includes;
+incref(var47);
+meth_List_FilePair__2b6998ab5b_push(var47,var31);
+label46: (void)0;
+var48 = (struct class_Variable_1aaa81c8d2){ .val = { .item1 = var17 }, .membernum = 1 };
+var17 = NULL;
+var49 = meth_FilePair_99df852164_emit_var(var31,var48);
+retval = var49; var49.buf = NULL;
+goto out;
+label35: (void)0;
+label28: (void)0;
+if (oomph_true) goto label21;
+label23: (void)0;
+var50 = var17->memb_name;
+string_incref(var50);
+var51 = string12_main_b15b214437; string_incref(var51);
+var52 = meth_Str_equals(var50,var51);
+if (var52) goto label53;
+if (oomph_true) goto label54;
+label53: (void)0;
+var55 = string13_oomph_main_f42ac2d0d5; string_incref(var55);
+retval = var55; var55.buf = NULL;
+goto out;
+label54: (void)0;
+var56 = var17->memb_name;
+string_incref(var56);
+var57 = string14___Bool_to_string_dad773c5b7; string_incref(var57);
+var58 = string15___List_Str_join_ffc59580ff; string_incref(var58);
+var59 = string16___Str___contains_8997d6dfce; string_incref(var59);
+var60 = string17___Str_center_pad_073e8c0216; string_incref(var60);
+var61 = string18___Str_count_b51b07da76; string_incref(var61);
+var62 = string19___Str_ends_with_dcad540805; string_incref(var62);
+var63 = string20___Str_from_start_to_substring_462924c760; string_incref(var63);
+var64 = string21___Str_get_utf8_c826dd9fd5; string_incref(var64);
+var65 = string22___Str_left_pad_3d523e4aca; string_incref(var65);
+var66 = string23___Str_left_trim_5e00f6c909; string_incref(var66);
+var67 = string24___Str_remove_prefix_03762ab753; string_incref(var67);
+var68 = string25___Str_remove_suffix_4cb74a7e98; string_incref(var68);
+var69 = string26___Str_repeat_6103748743; string_incref(var69);
+var70 = string27___Str_replace_554e473c7a; string_incref(var70);
+var71 = string28___Str_right_pad_6fc7cea2f7; string_incref(var71);
+var72 = string29___Str_right_trim_8ff2898d46; string_incref(var72);
+var73 = string30___Str_split_1419b998f9; string_incref(var73);
+var74 = string31___Str_starts_with_e1f47b3366; string_incref(var74);
+var75 = string32___Str_trim_9d52f8cf66; string_incref(var75);
+var76 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var76,var57);
+meth_List_Str__43b70c06cb_push(var76,var58);
+meth_List_Str__43b70c06cb_push(var76,var59);
+meth_List_Str__43b70c06cb_push(var76,var60);
+meth_List_Str__43b70c06cb_push(var76,var61);
+meth_List_Str__43b70c06cb_push(var76,var62);
+meth_List_Str__43b70c06cb_push(var76,var63);
+meth_List_Str__43b70c06cb_push(var76,var64);
+meth_List_Str__43b70c06cb_push(var76,var65);
+meth_List_Str__43b70c06cb_push(var76,var66);
+meth_List_Str__43b70c06cb_push(var76,var67);
+meth_List_Str__43b70c06cb_push(var76,var68);
+meth_List_Str__43b70c06cb_push(var76,var69);
+meth_List_Str__43b70c06cb_push(var76,var70);
+meth_List_Str__43b70c06cb_push(var76,var71);
+meth_List_Str__43b70c06cb_push(var76,var72);
+meth_List_Str__43b70c06cb_push(var76,var73);
+meth_List_Str__43b70c06cb_push(var76,var74);
+meth_List_Str__43b70c06cb_push(var76,var75);
+var77 = meth_List_Str__43b70c06cb___contains(var76,var56);
+if (var77) goto label78;
+if (oomph_true) goto label79;
+label78: (void)0;
+var80 = string33_meth__037d88e79e; string_incref(var80);
+var81 = var17->memb_name;
+string_incref(var81);
+var82 = c_output_6a23cf54cc_trim_leading_underscores(var81);
+var83 = oomph_string_concat(var80,var82);
+retval = var83; var83.buf = NULL;
+goto out;
+label79: (void)0;
+var84 = var1->memb_id;
+string_incref(var84);
+var85 = string34___3dd6dc5c14; string_incref(var85);
+var86 = oomph_string_concat(var84,var85);
+var87 = var17->memb_name;
+string_incref(var87);
+var88 = oomph_string_concat(var86,var87);
+retval = var88; var88.buf = NULL;
+goto out;
+label11: (void)0;
+out: (void)0;
+string_decref(var88);
+string_decref(var87);
+string_decref(var86);
+string_decref(var85);
+string_decref(var84);
+string_decref(var83);
+string_decref(var82);
+string_decref(var81);
+string_decref(var80);
+(void)0;
+decref((var76), dtor_List_Str__43b70c06cb);
+string_decref(var75);
+string_decref(var74);
+string_decref(var73);
+string_decref(var72);
+string_decref(var71);
+string_decref(var70);
+string_decref(var69);
+string_decref(var68);
+string_decref(var67);
+string_decref(var66);
+string_decref(var65);
+string_decref(var64);
+string_decref(var63);
+string_decref(var62);
+string_decref(var61);
+string_decref(var60);
+string_decref(var59);
+string_decref(var58);
+string_decref(var57);
+string_decref(var56);
+string_decref(var55);
+(void)0;
+string_decref(var51);
+string_decref(var50);
+string_decref(var49);
+decref_Variable_1aaa81c8d2(var48);
+decref((var47), dtor_List_FilePair__2b6998ab5b);
+(void)0;
+(void)0;
+decref((var42), dtor_List_FilePair__2b6998ab5b);
+decref((var41), dtor_List_FilePair__2b6998ab5b);
+(void)0;
+(void)0;
+decref((var36), dtor_List_FilePair__2b6998ab5b);
+(void)0;
+(void)0;
+decref((var31), dtor_FilePair_99df852164);
+string_decref(var30);
+decref((var29), dtor_Session_88204c75ff);
+(void)0;
+decref_SymbolValue_b2eed984e4(var25);
+decref_SymbolValue_b2eed984e4(var24);
+decref((var22), dtor_Symbol_037dd39afd);
+(void)0;
+decref((var19), dtor_List_Symbol__9a01330177);
+decref((var18), dtor_Session_88204c75ff);
+decref((var17), dtor_FileVariable_a7b8ca651f);
+string_decref(var16);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+decref((var12), dtor_BuiltinVariable_f6e0cdd1b6);
+(void)0;
+string_decref(var9);
+(void)0;
+decref((var7), dtor_LocalVariable_846080e5ae);
+(void)0;
+return retval;
+}void meth_FilePair_99df852164_define_function(struct class_FilePair_99df852164* var1, struct class_Str var2, struct class_FunctionType_4e16d0ea53* var3, struct class__null___List_Str___1b0213dad9 var4, struct class__null___Str__5eca9cec4f var5){bool var6;
+char var9;
+struct class_List_Type__057f9c6088* var10;
+var10 = NULL;
+struct class_List_Str__43b70c06cb* var11;
+var11 = NULL;
+int64_t var12;
+int64_t var13;
+struct class_Type_87e1ce5c5e var15;
+var15.membernum = -1;
+struct class_Str var17;
+var17.buf = NULL;
+struct class__null___Type__8438ac3dcf var18;
+var18.membernum = -1;
+struct class_List_Str__43b70c06cb* var19;
+var19 = NULL;
+struct class_List_Str__43b70c06cb* var21;
+var21 = NULL;
+int64_t var22;
+struct class_List_Type__057f9c6088* var23;
+var23 = NULL;
+int64_t var24;
+bool var25;
+struct class_Str var26;
+var26.buf = NULL;
+int64_t var27;
+struct class_List_Str__43b70c06cb* var28;
+var28 = NULL;
+int64_t var29;
+struct class_List_Str__43b70c06cb* var31;
+var31 = NULL;
+int64_t var32;
+bool var33;
+bool var34;
+struct class_List_Type__057f9c6088* var36;
+var36 = NULL;
+struct class_Type_87e1ce5c5e var37;
+var37.membernum = -1;
+struct class_Str var38;
+var38.buf = NULL;
+struct class__null___Type__8438ac3dcf var39;
+var39.membernum = -1;
+struct class_Str var40;
+var40.buf = NULL;
+struct class_Str var41;
+var41.buf = NULL;
+struct class_Str var42;
+var42.buf = NULL;
+struct class_Str var43;
+var43.buf = NULL;
+int64_t var44;
+int64_t var45;
+struct class_Str var46;
+var46.buf = NULL;
+struct class_Str var47;
+var47.buf = NULL;
+struct class_Str var48;
+var48.buf = NULL;
+bool var49;
+struct class_Str var52;
+var52.buf = NULL;
+struct class__null___Type__8438ac3dcf var53;
+var53.membernum = -1;
+struct class_Str var54;
+var54.buf = NULL;
+struct class_Str var55;
+var55.buf = NULL;
+struct class_Str var56;
+var56.buf = NULL;
+struct class_Str var57;
+var57.buf = NULL;
+struct class_Str var58;
+var58.buf = NULL;
+struct class_Str var59;
+var59.buf = NULL;
+struct class_Str var60;
+var60.buf = NULL;
+struct class_Str var61;
+var61.buf = NULL;
+struct class_Str var62;
+var62.buf = NULL;
+struct class_Str var63;
+var63.buf = NULL;
+struct class_Str var64;
+var64.buf = NULL;
+struct class_Str var65;
+var65.buf = NULL;
+struct class_Str var66;
+var66.buf = NULL;
+struct class_Str var67;
+var67.buf = NULL;
+char var68;
+struct class__null___Str__5eca9cec4f var69;
+var69.membernum = -1;
+bool var70;
+bool var71;
+struct class_Str var74;
+var74.buf = NULL;
+struct class_Str var75;
+var75.buf = NULL;
+struct class_Str var76;
+var76.buf = NULL;
+struct class_Str var77;
+var77.buf = NULL;
+struct class_Str var78;
+var78.buf = NULL;
+struct class_Str var79;
+var79.buf = NULL;
+struct class_Str var80;
+var80.buf = NULL;
+struct class_Str var81;
+var81.buf = NULL;
+struct class_Str var82;
+var82.buf = NULL;
+
+            var6 = (
+                var4.membernum == 0
+            );
+            if (var6) goto label7;
+
+            var6 = (
+                var4.membernum == 1
+            );
+            if (var6) goto label8;
+label7: (void)0;
+
+            if (var4.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var9 = var4.val.item0;
+            var10 = var3->memb_argtypes;
+incref(var10);
+var11 = ctor_List_Str__43b70c06cb();
+var12 = meth_List_Type__057f9c6088_length(var10);
+meth_List_Str__43b70c06cb___reserve(var11,var12);
+var13 = 0LL;
+label14: (void)0;
+if (var13 >= var10->len) goto label16;
+decref_Type_87e1ce5c5e(var15); var15 = var10->data[var13++]; incref_Type_87e1ce5c5e(var15);
+string_decref(var17);
+var17.buf = NULL;
+decref__null___Type__8438ac3dcf(var18);
+var18.membernum = -1;
+var18 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var15 }, .membernum = 1 };
+var15.membernum = -1;
+var17 = meth_FilePair_99df852164_emit_type(var1,var18);
+meth_List_Str__43b70c06cb_push(var11,var17);
+if (oomph_true) goto label14;
+label16: (void)0;
+var19 = var11;
+var11 = NULL;
+if (oomph_true) goto label20;
+label8: (void)0;
+
+            if (var4.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var21 = var4.val.item1;
+            incref(var21);
+var22 = meth_List_Str__43b70c06cb_length(var21);
+var23 = var3->memb_argtypes;
+incref(var23);
+var24 = meth_List_Type__057f9c6088_length(var23);
+var25 = meth_Int_equals(var22,var24);
+var26 = string2_self_hosted_c_output_oomph_64e0ea3117; string_incref(var26);
+var27 = 365LL;
+oomph_assert(var25,var26,var27);
+var28 = ctor_List_Str__43b70c06cb();
+var29 = 0LL;
+label30: (void)0;
+decref((var31), dtor_List_Str__43b70c06cb);
+var31 = NULL;
+var31 = meth__null___List_Str___1b0213dad9_get(var4);
+var32 = meth_List_Str__43b70c06cb_length(var31);
+var33 = oomph_int_gt(var32,var29);
+var34 = oomph_bool_not(var33);
+if (var34) goto label35;
+decref((var36), dtor_List_Type__057f9c6088);
+var36 = NULL;
+var36 = var3->memb_argtypes;
+incref(var36);
+var37 = meth_List_Type__057f9c6088_get(var36,var29);
+string_decref(var38);
+var38.buf = NULL;
+decref__null___Type__8438ac3dcf(var39);
+var39.membernum = -1;
+var39 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var37 }, .membernum = 1 };
+var37.membernum = -1;
+var38 = meth_FilePair_99df852164_emit_type(var1,var39);
+string_decref(var40);
+var40.buf = NULL;
+var40 = string35___63dbb4f422; string_incref(var40);
+string_decref(var41);
+var41.buf = NULL;
+var41 = oomph_string_concat(var38,var40);
+string_decref(var42);
+var42.buf = NULL;
+var42 = meth_List_Str__43b70c06cb_get(var21,var29);
+string_decref(var43);
+var43.buf = NULL;
+var43 = oomph_string_concat(var41,var42);
+meth_List_Str__43b70c06cb_push(var28,var43);
+var44 = 1LL;
+var45 = oomph_int_add(var29,var44);
+var29 = var45;
+if (oomph_true) goto label30;
+label35: (void)0;
+var19 = var28;
+var28 = NULL;
+label20: (void)0;
+var46 = string36___54a7aca889; string_incref(var46);
+var47 = meth_List_Str__43b70c06cb_join(var19,var46);
+var48 = string37__37a398d8ea; string_incref(var48);
+var49 = meth_Str_equals(var47,var48);
+if (var49) goto label50;
+if (oomph_true) goto label51;
+label50: (void)0;
+var52 = string1_void_23c41bd03f; string_incref(var52);
+string_decref(var47);
+var47 = var52;
+var52.buf = NULL;
+label51: (void)0;
+var53 = var3->memb_returntype;
+incref__null___Type__8438ac3dcf(var53);
+var54 = meth_FilePair_99df852164_emit_type(var1,var53);
+var55 = string35___63dbb4f422; string_incref(var55);
+var56 = oomph_string_concat(var54,var55);
+var57 = oomph_string_concat(var56,var2);
+var58 = string38___074be16786; string_incref(var58);
+var59 = oomph_string_concat(var57,var58);
+var60 = oomph_string_concat(var59,var47);
+var61 = string39___b44de59f49; string_incref(var61);
+var62 = oomph_string_concat(var60,var61);
+var63 = var1->memb_function_decls;
+string_incref(var63);
+var64 = oomph_string_concat(var63,var62);
+var65 = string10____afb2f97902; string_incref(var65);
+var66 = oomph_string_concat(var64,var65);
+var67 = var1->memb_function_decls;
+var1->memb_function_decls = var66;
+var66.buf = NULL;
+var68 = oomph_null;
+var69 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var68 }, .membernum = 0 };
+var70 = meth__null___Str__5eca9cec4f_equals(var5,var69);
+var71 = oomph_bool_not(var70);
+if (var71) goto label72;
+if (oomph_true) goto label73;
+label72: (void)0;
+var74 = var1->memb_function_defs;
+string_incref(var74);
+var75 = oomph_string_concat(var74,var62);
+var76 = string40___aa96dea2e8; string_incref(var76);
+var77 = oomph_string_concat(var75,var76);
+var78 = meth__null___Str__5eca9cec4f_get(var5);
+var79 = oomph_string_concat(var77,var78);
+var80 = string41____06db358fc6; string_incref(var80);
+var81 = oomph_string_concat(var79,var80);
+var82 = var1->memb_function_defs;
+var1->memb_function_defs = var81;
+var81.buf = NULL;
+label73: (void)0;
+out: (void)0;
+string_decref(var82);
+string_decref(var81);
+string_decref(var80);
+string_decref(var79);
+string_decref(var78);
+string_decref(var77);
+string_decref(var76);
+string_decref(var75);
+string_decref(var74);
+(void)0;
+(void)0;
+decref__null___Str__5eca9cec4f(var69);
+(void)0;
+string_decref(var67);
+string_decref(var66);
+string_decref(var65);
+string_decref(var64);
+string_decref(var63);
+string_decref(var62);
+string_decref(var61);
+string_decref(var60);
+string_decref(var59);
+string_decref(var58);
+string_decref(var57);
+string_decref(var56);
+string_decref(var55);
+string_decref(var54);
+decref__null___Type__8438ac3dcf(var53);
+string_decref(var52);
+(void)0;
+string_decref(var48);
+string_decref(var47);
+string_decref(var46);
+(void)0;
+(void)0;
+string_decref(var43);
+string_decref(var42);
+string_decref(var41);
+string_decref(var40);
+decref__null___Type__8438ac3dcf(var39);
+string_decref(var38);
+decref_Type_87e1ce5c5e(var37);
+decref((var36), dtor_List_Type__057f9c6088);
+(void)0;
+(void)0;
+(void)0;
+decref((var31), dtor_List_Str__43b70c06cb);
+(void)0;
+decref((var28), dtor_List_Str__43b70c06cb);
+(void)0;
+string_decref(var26);
+(void)0;
+(void)0;
+decref((var23), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var21), dtor_List_Str__43b70c06cb);
+decref((var19), dtor_List_Str__43b70c06cb);
+decref__null___Type__8438ac3dcf(var18);
+string_decref(var17);
+decref_Type_87e1ce5c5e(var15);
+(void)0;
+(void)0;
+decref((var11), dtor_List_Str__43b70c06cb);
+decref((var10), dtor_List_Type__057f9c6088);
+(void)0;
+(void)0;
+}struct class_Str meth_FilePair_99df852164_emit_string(struct class_FilePair_99df852164* var1, struct class_Str var2){struct class_List_Str__43b70c06cb* var3;
+var3 = NULL;
+bool var4;
+bool var5;
+struct class_List_Str__43b70c06cb* var8;
+var8 = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_List_Str__43b70c06cb* var10;
+var10 = NULL;
+int64_t var11;
+int64_t var12;
+struct class_List_Str__43b70c06cb* var13;
+var13 = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_List_Str__43b70c06cb* var17;
+var17 = NULL;
+int64_t var18;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_List_Int__df8a64abf3* var25;
+var25 = NULL;
+struct class_List_Str__43b70c06cb* var26;
+var26 = NULL;
+int64_t var27;
+int64_t var28;
+int64_t var30;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_List_Str__43b70c06cb* var33;
+var33 = NULL;
+bool var34;
+struct class_Str var37;
+var37.buf = NULL;
+struct class_Str var38;
+var38.buf = NULL;
+struct class_Str var39;
+var39.buf = NULL;
+struct class_Str var40;
+var40.buf = NULL;
+struct class_Str var41;
+var41.buf = NULL;
+struct class_Str var42;
+var42.buf = NULL;
+struct class_Str var43;
+var43.buf = NULL;
+struct class_Str var44;
+var44.buf = NULL;
+struct class_Str var45;
+var45.buf = NULL;
+struct class_Str var46;
+var46.buf = NULL;
+struct class_Str var47;
+var47.buf = NULL;
+struct class_Str var48;
+var48.buf = NULL;
+struct class_Str var49;
+var49.buf = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+struct class_Str var52;
+var52.buf = NULL;
+struct class_Str var53;
+var53.buf = NULL;
+struct class_List_Int__df8a64abf3* var54;
+var54 = NULL;
+int64_t var55;
+struct class_Str var56;
+var56.buf = NULL;
+struct class_Str var57;
+var57.buf = NULL;
+struct class_Str var58;
+var58.buf = NULL;
+struct class_Str var59;
+var59.buf = NULL;
+struct class_Str var60;
+var60.buf = NULL;
+struct class_Str var61;
+var61.buf = NULL;
+struct class_Str retval;
+var3 = var1->memb_strings;
+incref(var3);
+var4 = meth_List_Str__43b70c06cb___contains(var3,var2);
+var5 = oomph_bool_not(var4);
+if (var5) goto label6;
+if (oomph_true) goto label7;
+label6: (void)0;
+var8 = var1->memb_strings;
+incref(var8);
+meth_List_Str__43b70c06cb_push(var8,var2);
+label7: (void)0;
+var9 = string37__37a398d8ea; string_incref(var9);
+var10 = meth_Str_split(var2,var9);
+var11 = 0LL;
+var12 = 20LL;
+var13 = meth_List_Str__43b70c06cb_slice(var10,var11,var12);
+var14 = string37__37a398d8ea; string_incref(var14);
+var15 = meth_List_Str__43b70c06cb_join(var13,var14);
+var16 = string42_string_d85d5cef01; string_incref(var16);
+var17 = var1->memb_strings;
+incref(var17);
+var18 = meth_List_Str__43b70c06cb_find_only(var17,var2);
+var19 = meth_Int_to_string(var18);
+var20 = oomph_string_concat(var16,var19);
+var21 = oomph_string_concat(var20,var15);
+var22 = c_output_6a23cf54cc_create_id(var21,var2);
+if (var5) goto label23;
+if (oomph_true) goto label24;
+label23: (void)0;
+var25 = meth_Str_get_utf8(var2);
+var26 = ctor_List_Str__43b70c06cb();
+var27 = meth_List_Int__df8a64abf3_length(var25);
+meth_List_Str__43b70c06cb___reserve(var26,var27);
+var28 = 0LL;
+label29: (void)0;
+if (var28 >= var25->len) goto label31;
+var30 = var25->data[var28++];
+string_decref(var32);
+var32.buf = NULL;
+var32 = meth_Int_to_string(var30);
+meth_List_Str__43b70c06cb_push(var26,var32);
+if (oomph_true) goto label29;
+label31: (void)0;
+var33 = ctor_List_Str__43b70c06cb();
+var34 = meth_List_Str__43b70c06cb_equals(var26,var33);
+if (var34) goto label35;
+if (oomph_true) goto label36;
+label35: (void)0;
+var37 = string43_0_c401021f71; string_incref(var37);
+meth_List_Str__43b70c06cb_push(var26,var37);
+label36: (void)0;
+var38 = var1->memb_string_defs;
+string_incref(var38);
+var39 = string44______________static_struct_StringBuf__94bed08649; string_incref(var39);
+var40 = oomph_string_concat(var39,var22);
+var41 = string45__buf______________________refcount____1___________________data____char______73263679a8; string_incref(var41);
+var42 = oomph_string_concat(var40,var41);
+var43 = string36___54a7aca889; string_incref(var43);
+var44 = meth_List_Str__43b70c06cb_join(var26,var43);
+var45 = oomph_string_concat(var42,var44);
+var46 = string46______________________malloced___false_____________________________static_struct_class_Str__c86c371ec5; string_incref(var46);
+var47 = oomph_string_concat(var45,var46);
+var48 = oomph_string_concat(var47,var22);
+var49 = string47_______________________buf_____12cd07e483; string_incref(var49);
+var50 = oomph_string_concat(var48,var49);
+var51 = oomph_string_concat(var50,var22);
+var52 = string48__buf___________________nbytes____a3420a852c; string_incref(var52);
+var53 = oomph_string_concat(var51,var52);
+var54 = meth_Str_get_utf8(var2);
+var55 = meth_List_Int__df8a64abf3_length(var54);
+var56 = meth_Int_to_string(var55);
+var57 = oomph_string_concat(var53,var56);
+var58 = string49____________________offset___0______________________________e7d7c6b537; string_incref(var58);
+var59 = oomph_string_concat(var57,var58);
+var60 = oomph_string_concat(var38,var59);
+var61 = var1->memb_string_defs;
+var1->memb_string_defs = var60;
+var60.buf = NULL;
+label24: (void)0;
+retval = var22; var22.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var61);
+string_decref(var60);
+string_decref(var59);
+string_decref(var58);
+string_decref(var57);
+string_decref(var56);
+(void)0;
+decref((var54), dtor_List_Int__df8a64abf3);
+string_decref(var53);
+string_decref(var52);
+string_decref(var51);
+string_decref(var50);
+string_decref(var49);
+string_decref(var48);
+string_decref(var47);
+string_decref(var46);
+string_decref(var45);
+string_decref(var44);
+string_decref(var43);
+string_decref(var42);
+string_decref(var41);
+string_decref(var40);
+string_decref(var39);
+string_decref(var38);
+string_decref(var37);
+(void)0;
+decref((var33), dtor_List_Str__43b70c06cb);
+string_decref(var32);
+(void)0;
+(void)0;
+decref((var26), dtor_List_Str__43b70c06cb);
+decref((var25), dtor_List_Int__df8a64abf3);
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+string_decref(var19);
+(void)0;
+decref((var17), dtor_List_Str__43b70c06cb);
+string_decref(var16);
+string_decref(var15);
+string_decref(var14);
+decref((var13), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref((var10), dtor_List_Str__43b70c06cb);
+string_decref(var9);
+decref((var8), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref((var3), dtor_List_Str__43b70c06cb);
+return retval;
+}void meth_FilePair_99df852164_define_type(struct class_FilePair_99df852164* var1, struct class_Type_87e1ce5c5e var2){struct class__null___Str__5eca9cec4f var3;
+var3.membernum = -1;
+char var4;
+struct class__null___Str__5eca9cec4f var5;
+var5.membernum = -1;
+bool var6;
+struct class_Str var7;
+var7.buf = NULL;
+int64_t var8;
+bool var9;
+struct class_AutoType_33a5d572cb* var14;
+var14 = NULL;
+bool var15;
+struct class_Str var16;
+var16.buf = NULL;
+int64_t var17;
+struct class_FunctionType_4e16d0ea53* var19;
+var19 = NULL;
+bool var20;
+struct class_Str var21;
+var21.buf = NULL;
+int64_t var22;
+struct class_UnionType_7f899bced1* var23;
+var23 = NULL;
+struct class_List_Type__057f9c6088* var24;
+var24 = NULL;
+int64_t var25;
+struct class_List_Type__057f9c6088* var26;
+var26 = NULL;
+struct class_List_Str__43b70c06cb* var27;
+var27 = NULL;
+int64_t var28;
+int64_t var29;
+struct class_Type_87e1ce5c5e var31;
+var31.membernum = -1;
+struct class_Session_88204c75ff* var33;
+var33 = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_List_Str__43b70c06cb* var35;
+var35 = NULL;
+int64_t var36;
+bool var38;
+bool var39;
+struct class_Str var41;
+var41.buf = NULL;
+struct class_Str var42;
+var42.buf = NULL;
+struct class_Str var43;
+var43.buf = NULL;
+struct class_Str var44;
+var44.buf = NULL;
+struct class_Str var45;
+var45.buf = NULL;
+struct class_Str var46;
+var46.buf = NULL;
+struct class_Str var47;
+var47.buf = NULL;
+struct class_Str var48;
+var48.buf = NULL;
+struct class_Str var49;
+var49.buf = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+struct class_Str var52;
+var52.buf = NULL;
+struct class_Str var53;
+var53.buf = NULL;
+int64_t var54;
+int64_t var55;
+struct class_Str var56;
+var56.buf = NULL;
+struct class_Str var57;
+var57.buf = NULL;
+struct class_List_Str__43b70c06cb* var58;
+var58 = NULL;
+int64_t var59;
+bool var61;
+bool var62;
+struct class_Str var64;
+var64.buf = NULL;
+struct class_Str var65;
+var65.buf = NULL;
+struct class_Str var66;
+var66.buf = NULL;
+struct class_Str var67;
+var67.buf = NULL;
+struct class_Str var68;
+var68.buf = NULL;
+struct class_Str var69;
+var69.buf = NULL;
+struct class_Str var70;
+var70.buf = NULL;
+struct class_Str var71;
+var71.buf = NULL;
+struct class_Str var72;
+var72.buf = NULL;
+struct class_Str var73;
+var73.buf = NULL;
+struct class_Str var74;
+var74.buf = NULL;
+struct class_Str var75;
+var75.buf = NULL;
+struct class_Str var76;
+var76.buf = NULL;
+struct class_Str var77;
+var77.buf = NULL;
+struct class_Str var78;
+var78.buf = NULL;
+struct class_Str var79;
+var79.buf = NULL;
+struct class_Str var80;
+var80.buf = NULL;
+int64_t var81;
+int64_t var82;
+struct class_Str var83;
+var83.buf = NULL;
+struct class_Str var84;
+var84.buf = NULL;
+struct class_Str var85;
+var85.buf = NULL;
+struct class_Str var86;
+var86.buf = NULL;
+struct class_Str var87;
+var87.buf = NULL;
+struct class_Str var88;
+var88.buf = NULL;
+struct class_Str var89;
+var89.buf = NULL;
+struct class_Str var90;
+var90.buf = NULL;
+struct class_Str var91;
+var91.buf = NULL;
+struct class_Str var92;
+var92.buf = NULL;
+struct class_Str var93;
+var93.buf = NULL;
+struct class_Str var94;
+var94.buf = NULL;
+struct class_Str var95;
+var95.buf = NULL;
+struct class_Str var96;
+var96.buf = NULL;
+struct class_Str var97;
+var97.buf = NULL;
+struct class_Str var98;
+var98.buf = NULL;
+struct class_Str var99;
+var99.buf = NULL;
+struct class_Str var100;
+var100.buf = NULL;
+struct class_Str var101;
+var101.buf = NULL;
+struct class_Str var102;
+var102.buf = NULL;
+struct class_Str var103;
+var103.buf = NULL;
+struct class_Str var104;
+var104.buf = NULL;
+struct class_Str var105;
+var105.buf = NULL;
+struct class_Str var106;
+var106.buf = NULL;
+struct class_Str var107;
+var107.buf = NULL;
+struct class_Str var108;
+var108.buf = NULL;
+struct class_Type_87e1ce5c5e var109;
+var109.membernum = -1;
+struct class_Str var110;
+var110.buf = NULL;
+struct class_Str var111;
+var111.buf = NULL;
+struct class_Str var112;
+var112.buf = NULL;
+struct class_Str var113;
+var113.buf = NULL;
+struct class_Str var114;
+var114.buf = NULL;
+struct class_Str var115;
+var115.buf = NULL;
+struct class_Str var116;
+var116.buf = NULL;
+struct class_Str var117;
+var117.buf = NULL;
+struct class_Str var118;
+var118.buf = NULL;
+struct class_Str var119;
+var119.buf = NULL;
+struct class_Str var120;
+var120.buf = NULL;
+struct class_Str var121;
+var121.buf = NULL;
+struct class_Str var122;
+var122.buf = NULL;
+struct class_Str var123;
+var123.buf = NULL;
+struct class_Str var124;
+var124.buf = NULL;
+struct class_Str var125;
+var125.buf = NULL;
+struct class_Str var126;
+var126.buf = NULL;
+struct class_Str var127;
+var127.buf = NULL;
+struct class_Type_87e1ce5c5e var128;
+var128.membernum = -1;
+struct class_Str var129;
+var129.buf = NULL;
+struct class_Str var130;
+var130.buf = NULL;
+struct class_Str var131;
+var131.buf = NULL;
+struct class_Str var132;
+var132.buf = NULL;
+struct class_Str var133;
+var133.buf = NULL;
+struct class_Str var134;
+var134.buf = NULL;
+struct class_Str var135;
+var135.buf = NULL;
+struct class_Str var136;
+var136.buf = NULL;
+struct class_Str var137;
+var137.buf = NULL;
+struct class_Str var138;
+var138.buf = NULL;
+struct class_Str var139;
+var139.buf = NULL;
+struct class_Str var140;
+var140.buf = NULL;
+struct class_Str var141;
+var141.buf = NULL;
+struct class_Str var142;
+var142.buf = NULL;
+struct class_Str var143;
+var143.buf = NULL;
+struct class_Str var144;
+var144.buf = NULL;
+struct class_Str var145;
+var145.buf = NULL;
+struct class_Str var146;
+var146.buf = NULL;
+struct class_Str var147;
+var147.buf = NULL;
+struct class_Str var148;
+var148.buf = NULL;
+struct class_Str var149;
+var149.buf = NULL;
+struct class_Str var150;
+var150.buf = NULL;
+struct class_Str var151;
+var151.buf = NULL;
+struct class_Str var152;
+var152.buf = NULL;
+struct class_Str var153;
+var153.buf = NULL;
+struct class_List_Str__43b70c06cb* var154;
+var154 = NULL;
+int64_t var155;
+bool var157;
+bool var158;
+struct class_Session_88204c75ff* var160;
+var160 = NULL;
+struct class_Str var161;
+var161.buf = NULL;
+struct class_Str var162;
+var162.buf = NULL;
+struct class_Str var163;
+var163.buf = NULL;
+struct class_List_Type__057f9c6088* var164;
+var164 = NULL;
+struct class_Type_87e1ce5c5e var165;
+var165.membernum = -1;
+struct class_Str var166;
+var166.buf = NULL;
+int64_t var167;
+int64_t var168;
+struct class_List_Str__43b70c06cb* var169;
+var169 = NULL;
+int64_t var170;
+bool var172;
+bool var173;
+struct class_Session_88204c75ff* var175;
+var175 = NULL;
+struct class_Str var176;
+var176.buf = NULL;
+struct class_Str var177;
+var177.buf = NULL;
+struct class_Str var178;
+var178.buf = NULL;
+struct class_List_Type__057f9c6088* var179;
+var179 = NULL;
+struct class_Type_87e1ce5c5e var180;
+var180.membernum = -1;
+struct class_Str var181;
+var181.buf = NULL;
+int64_t var182;
+int64_t var183;
+struct class_List_Str__43b70c06cb* var184;
+var184 = NULL;
+int64_t var185;
+bool var187;
+bool var188;
+struct class_Str var190;
+var190.buf = NULL;
+struct class_Str var191;
+var191.buf = NULL;
+struct class_Str var192;
+var192.buf = NULL;
+struct class_Str var193;
+var193.buf = NULL;
+struct class_Str var194;
+var194.buf = NULL;
+struct class_Str var195;
+var195.buf = NULL;
+struct class_Str var196;
+var196.buf = NULL;
+struct class_Str var197;
+var197.buf = NULL;
+struct class_Str var198;
+var198.buf = NULL;
+int64_t var199;
+int64_t var200;
+struct class_Str var201;
+var201.buf = NULL;
+struct class_Str var202;
+var202.buf = NULL;
+struct class_List_Str__43b70c06cb* var203;
+var203 = NULL;
+int64_t var204;
+bool var206;
+bool var207;
+struct class_Str var209;
+var209.buf = NULL;
+struct class_Str var210;
+var210.buf = NULL;
+struct class_Str var211;
+var211.buf = NULL;
+struct class_Str var212;
+var212.buf = NULL;
+struct class_Str var213;
+var213.buf = NULL;
+struct class_Str var214;
+var214.buf = NULL;
+struct class_Str var215;
+var215.buf = NULL;
+struct class_Str var216;
+var216.buf = NULL;
+struct class_Str var217;
+var217.buf = NULL;
+int64_t var218;
+int64_t var219;
+struct class_Str var220;
+var220.buf = NULL;
+struct class_Str var221;
+var221.buf = NULL;
+struct class_Str var222;
+var222.buf = NULL;
+struct class_Str var223;
+var223.buf = NULL;
+struct class_Str var224;
+var224.buf = NULL;
+struct class_Str var225;
+var225.buf = NULL;
+struct class_Str var226;
+var226.buf = NULL;
+struct class_Str var227;
+var227.buf = NULL;
+struct class_Str var228;
+var228.buf = NULL;
+struct class_Str var229;
+var229.buf = NULL;
+struct class_Str var230;
+var230.buf = NULL;
+struct class_Str var231;
+var231.buf = NULL;
+struct class_Str var232;
+var232.buf = NULL;
+struct class_Str var233;
+var233.buf = NULL;
+struct class_Str var234;
+var234.buf = NULL;
+struct class_Str var235;
+var235.buf = NULL;
+struct class_Str var236;
+var236.buf = NULL;
+struct class_Str var237;
+var237.buf = NULL;
+struct class_Str var238;
+var238.buf = NULL;
+struct class_Str var239;
+var239.buf = NULL;
+struct class_Str var240;
+var240.buf = NULL;
+struct class_Str var241;
+var241.buf = NULL;
+struct class_Str var242;
+var242.buf = NULL;
+struct class_Str var243;
+var243.buf = NULL;
+struct class_Str var244;
+var244.buf = NULL;
+struct class_Str var245;
+var245.buf = NULL;
+struct class_Str var246;
+var246.buf = NULL;
+struct class_Str var247;
+var247.buf = NULL;
+struct class_Str var248;
+var248.buf = NULL;
+struct class_Str var249;
+var249.buf = NULL;
+struct class_Str var250;
+var250.buf = NULL;
+struct class_Str var251;
+var251.buf = NULL;
+struct class_Str var252;
+var252.buf = NULL;
+struct class_Str var253;
+var253.buf = NULL;
+struct class_Str var254;
+var254.buf = NULL;
+struct class_Str var255;
+var255.buf = NULL;
+struct class_Str var256;
+var256.buf = NULL;
+struct class_Str var257;
+var257.buf = NULL;
+struct class_Str var258;
+var258.buf = NULL;
+struct class_Str var259;
+var259.buf = NULL;
+struct class_Str var260;
+var260.buf = NULL;
+struct class_Str var261;
+var261.buf = NULL;
+struct class_Str var262;
+var262.buf = NULL;
+struct class_Str var263;
+var263.buf = NULL;
+struct class_Str var264;
+var264.buf = NULL;
+struct class_Str var265;
+var265.buf = NULL;
+struct class_Str var266;
+var266.buf = NULL;
+struct class_Str var267;
+var267.buf = NULL;
+struct class_List_Str__43b70c06cb* var268;
+var268 = NULL;
+int64_t var269;
+bool var271;
+bool var272;
+struct class_List_Type__057f9c6088* var274;
+var274 = NULL;
+struct class_Type_87e1ce5c5e var275;
+var275.membernum = -1;
+struct class_Str var276;
+var276.buf = NULL;
+struct class__null___Type__8438ac3dcf var277;
+var277.membernum = -1;
+struct class_Str var278;
+var278.buf = NULL;
+struct class_Str var279;
+var279.buf = NULL;
+struct class_Str var280;
+var280.buf = NULL;
+struct class_Str var281;
+var281.buf = NULL;
+struct class_Str var282;
+var282.buf = NULL;
+struct class_Str var283;
+var283.buf = NULL;
+int64_t var284;
+int64_t var285;
+struct class_Str var286;
+var286.buf = NULL;
+struct class_Str var287;
+var287.buf = NULL;
+struct class_Str var288;
+var288.buf = NULL;
+struct class_Str var289;
+var289.buf = NULL;
+struct class_Str var290;
+var290.buf = NULL;
+struct class_Str var291;
+var291.buf = NULL;
+struct class_Str var292;
+var292.buf = NULL;
+struct class_Str var293;
+var293.buf = NULL;
+struct class_Str var294;
+var294.buf = NULL;
+struct class_Str var295;
+var295.buf = NULL;
+struct class__null___Str__5eca9cec4f var296;
+var296.membernum = -1;
+struct class__null___Str__5eca9cec4f var297;
+var297.membernum = -1;
+int64_t var298;
+bool var299;
+bool var301;
+struct class_List_Type__057f9c6088* var303;
+var303 = NULL;
+struct class_Type_87e1ce5c5e var304;
+var304.membernum = -1;
+struct class_Session_88204c75ff* var305;
+var305 = NULL;
+struct class_Builtins_bd980a9f08* var306;
+var306 = NULL;
+struct class_Type_87e1ce5c5e var307;
+var307.membernum = -1;
+bool var308;
+struct class_List_Type__057f9c6088* var311;
+var311 = NULL;
+struct class_Type_87e1ce5c5e var312;
+var312.membernum = -1;
+struct class__null___Type__8438ac3dcf var313;
+var313.membernum = -1;
+struct class_Str var314;
+var314.buf = NULL;
+struct class_Str var315;
+var315.buf = NULL;
+struct class_Str var316;
+var316.buf = NULL;
+struct class_Str var317;
+var317.buf = NULL;
+struct class_Str var318;
+var318.buf = NULL;
+struct class_Str var319;
+var319.buf = NULL;
+struct class_Str var320;
+var320.buf = NULL;
+struct class_Str var321;
+var321.buf = NULL;
+struct class_Str var322;
+var322.buf = NULL;
+struct class_Str var323;
+var323.buf = NULL;
+struct class_Str var324;
+var324.buf = NULL;
+struct class_Str var325;
+var325.buf = NULL;
+struct class_Str var326;
+var326.buf = NULL;
+struct class_Str var327;
+var327.buf = NULL;
+struct class_Str var328;
+var328.buf = NULL;
+struct class_Str var329;
+var329.buf = NULL;
+struct class_Str var330;
+var330.buf = NULL;
+struct class_Str var331;
+var331.buf = NULL;
+struct class_Str var332;
+var332.buf = NULL;
+struct class_Str var333;
+var333.buf = NULL;
+struct class_Str var334;
+var334.buf = NULL;
+struct class_Str var335;
+var335.buf = NULL;
+struct class_Str var336;
+var336.buf = NULL;
+struct class_Str var337;
+var337.buf = NULL;
+struct class_Str var338;
+var338.buf = NULL;
+struct class_Str var339;
+var339.buf = NULL;
+struct class_Str var340;
+var340.buf = NULL;
+struct class_Session_88204c75ff* var341;
+var341 = NULL;
+struct class_Str var342;
+var342.buf = NULL;
+struct class_Str var343;
+var343.buf = NULL;
+struct class_Str var344;
+var344.buf = NULL;
+struct class_Str var345;
+var345.buf = NULL;
+struct class_Str var346;
+var346.buf = NULL;
+struct class_Str var347;
+var347.buf = NULL;
+struct class_Str var348;
+var348.buf = NULL;
+struct class_BasicType_899b9c9f8e* var349;
+var349 = NULL;
+struct class__null___GenericSource__4440b6073d var350;
+var350.membernum = -1;
+char var351;
+struct class__null___GenericSource__4440b6073d var352;
+var352.membernum = -1;
+bool var353;
+struct class__null___GenericSource__4440b6073d var355;
+var355.membernum = -1;
+struct class_GenericSource_35cfcd932e* var356;
+var356 = NULL;
+struct class_Generic_c39b95ec73* var357;
+var357 = NULL;
+struct class_Session_88204c75ff* var358;
+var358 = NULL;
+struct class_Builtins_bd980a9f08* var359;
+var359 = NULL;
+struct class_Generic_c39b95ec73* var360;
+var360 = NULL;
+bool var361;
+struct class_Str var362;
+var362.buf = NULL;
+int64_t var363;
+struct class__null___GenericSource__4440b6073d var364;
+var364.membernum = -1;
+struct class_GenericSource_35cfcd932e* var365;
+var365 = NULL;
+struct class_Type_87e1ce5c5e var366;
+var366.membernum = -1;
+struct class_Str var367;
+var367.buf = NULL;
+struct class_Str var368;
+var368.buf = NULL;
+struct class_Session_88204c75ff* var369;
+var369 = NULL;
+struct class_Type_87e1ce5c5e var370;
+var370.membernum = -1;
+struct class_Str var371;
+var371.buf = NULL;
+struct class_Str var372;
+var372.buf = NULL;
+struct class_List_Str__43b70c06cb* var373;
+var373 = NULL;
+struct class_Str var374;
+var374.buf = NULL;
+struct class_Str var375;
+var375.buf = NULL;
+struct class_Session_88204c75ff* var376;
+var376 = NULL;
+struct class_Type_87e1ce5c5e var377;
+var377.membernum = -1;
+struct class_Str var378;
+var378.buf = NULL;
+struct class_Str var379;
+var379.buf = NULL;
+struct class_List_Str__43b70c06cb* var380;
+var380 = NULL;
+struct class_Str var381;
+var381.buf = NULL;
+struct class_Str var382;
+var382.buf = NULL;
+struct class_Session_88204c75ff* var383;
+var383 = NULL;
+struct class_Type_87e1ce5c5e var384;
+var384.membernum = -1;
+struct class_Str var385;
+var385.buf = NULL;
+struct class_Str var386;
+var386.buf = NULL;
+struct class_Str var387;
+var387.buf = NULL;
+struct class_Str var388;
+var388.buf = NULL;
+struct class_List_Str__43b70c06cb* var389;
+var389 = NULL;
+struct class_Str var390;
+var390.buf = NULL;
+struct class_Str var391;
+var391.buf = NULL;
+struct class_Session_88204c75ff* var392;
+var392 = NULL;
+struct class_Type_87e1ce5c5e var393;
+var393.membernum = -1;
+struct class_Str var394;
+var394.buf = NULL;
+struct class_Str var395;
+var395.buf = NULL;
+struct class_List_Str__43b70c06cb* var396;
+var396 = NULL;
+struct class_Str var397;
+var397.buf = NULL;
+struct class_Str var398;
+var398.buf = NULL;
+struct class_Session_88204c75ff* var399;
+var399 = NULL;
+struct class_Type_87e1ce5c5e var400;
+var400.membernum = -1;
+struct class_Str var401;
+var401.buf = NULL;
+struct class_Str var402;
+var402.buf = NULL;
+struct class_Str var403;
+var403.buf = NULL;
+struct class_Str var404;
+var404.buf = NULL;
+struct class_List_Str__43b70c06cb* var405;
+var405 = NULL;
+struct class_Str var406;
+var406.buf = NULL;
+bool var407;
+struct class__null___Type__8438ac3dcf var408;
+var408.membernum = -1;
+struct class_Str var409;
+var409.buf = NULL;
+struct class_List_Str__43b70c06cb* var410;
+var410 = NULL;
+struct class_Str var411;
+var411.buf = NULL;
+struct class_Str var412;
+var412.buf = NULL;
+struct class_Session_88204c75ff* var413;
+var413 = NULL;
+struct class_Str var414;
+var414.buf = NULL;
+struct class_Str var415;
+var415.buf = NULL;
+struct class_Str var416;
+var416.buf = NULL;
+struct class_Str var417;
+var417.buf = NULL;
+struct class_List_Str__43b70c06cb* var418;
+var418 = NULL;
+struct class_Str var419;
+var419.buf = NULL;
+struct class_Session_88204c75ff* var420;
+var420 = NULL;
+struct class_Str var421;
+var421.buf = NULL;
+struct class_Str var422;
+var422.buf = NULL;
+struct class_List_Str__43b70c06cb* var423;
+var423 = NULL;
+struct class_Str var424;
+var424.buf = NULL;
+struct class_Session_88204c75ff* var425;
+var425 = NULL;
+struct class_Str var426;
+var426.buf = NULL;
+struct class_Str var427;
+var427.buf = NULL;
+struct class_List_Str__43b70c06cb* var428;
+var428 = NULL;
+struct class_List_List_Str___637f5f7ec1* var429;
+var429 = NULL;
+struct class_Session_88204c75ff* var430;
+var430 = NULL;
+struct class_Builtins_bd980a9f08* var431;
+var431 = NULL;
+struct class_Type_87e1ce5c5e var432;
+var432.membernum = -1;
+bool var433;
+struct class_Str var435;
+var435.buf = NULL;
+struct class_Str var436;
+var436.buf = NULL;
+struct class_List_Str__43b70c06cb* var437;
+var437 = NULL;
+struct class_Str var439;
+var439.buf = NULL;
+struct class_Str var440;
+var440.buf = NULL;
+struct class_List_Str__43b70c06cb* var441;
+var441 = NULL;
+struct class_Str var442;
+var442.buf = NULL;
+struct class_Str var443;
+var443.buf = NULL;
+int64_t var444;
+struct class_List_Str__43b70c06cb* var446;
+var446 = NULL;
+struct class_Str var448;
+var448.buf = NULL;
+struct class_Str var449;
+var449.buf = NULL;
+struct class_List_Str__43b70c06cb* var450;
+var450 = NULL;
+struct class_Str var451;
+var451.buf = NULL;
+struct class_Str var452;
+var452.buf = NULL;
+struct class_Str var453;
+var453.buf = NULL;
+struct class_Str var454;
+var454.buf = NULL;
+struct class_Str var455;
+var455.buf = NULL;
+struct class_Str var456;
+var456.buf = NULL;
+struct class_Str var457;
+var457.buf = NULL;
+struct class_Str var458;
+var458.buf = NULL;
+struct class_Str var459;
+var459.buf = NULL;
+struct class_Str var460;
+var460.buf = NULL;
+struct class_Str var461;
+var461.buf = NULL;
+struct class_Str var462;
+var462.buf = NULL;
+struct class_Str var463;
+var463.buf = NULL;
+struct class_Str var464;
+var464.buf = NULL;
+struct class_Str var465;
+var465.buf = NULL;
+struct class_Str var466;
+var466.buf = NULL;
+struct class_Str var467;
+var467.buf = NULL;
+struct class_Str var468;
+var468.buf = NULL;
+struct class_Str var469;
+var469.buf = NULL;
+struct class_Str var470;
+var470.buf = NULL;
+struct class__null___Str__5eca9cec4f var471;
+var471.membernum = -1;
+struct class__null___Str__5eca9cec4f var472;
+var472.membernum = -1;
+struct class_Session_88204c75ff* var473;
+var473 = NULL;
+struct class_Builtins_bd980a9f08* var474;
+var474 = NULL;
+struct class_Type_87e1ce5c5e var475;
+var475.membernum = -1;
+struct class_List_Method__1e0ab9c757* var476;
+var476 = NULL;
+int64_t var477;
+struct class_Method_bfbd73ad15* var479;
+var479 = NULL;
+struct class_Str var481;
+var481.buf = NULL;
+struct class_Session_88204c75ff* var482;
+var482 = NULL;
+struct class_Str var483;
+var483.buf = NULL;
+struct class_Type_87e1ce5c5e var484;
+var484.membernum = -1;
+struct class_Str var485;
+var485.buf = NULL;
+struct class_Str var486;
+var486.buf = NULL;
+struct class_Str var487;
+var487.buf = NULL;
+struct class_Str var488;
+var488.buf = NULL;
+struct class_Str var489;
+var489.buf = NULL;
+struct class_FunctionType_4e16d0ea53* var490;
+var490 = NULL;
+char var491;
+char var492;
+struct class__null___List_Str___1b0213dad9 var493;
+var493.membernum = -1;
+struct class__null___Str__5eca9cec4f var494;
+var494.membernum = -1;
+struct class_Str var495;
+var495.buf = NULL;
+struct class_Str var496;
+var496.buf = NULL;
+struct class_Str var497;
+var497.buf = NULL;
+struct class_Str var498;
+var498.buf = NULL;
+struct class_Str var499;
+var499.buf = NULL;
+struct class_Str var500;
+var500.buf = NULL;
+struct class_Str var501;
+var501.buf = NULL;
+struct class_Str var502;
+var502.buf = NULL;
+struct class_Str var503;
+var503.buf = NULL;
+struct class_Str var504;
+var504.buf = NULL;
+struct class_Str var505;
+var505.buf = NULL;
+struct class_Str var506;
+var506.buf = NULL;
+struct class_Str var507;
+var507.buf = NULL;
+struct class_List_Member__7525bf27e3* var509;
+var509 = NULL;
+struct class_List_Str__43b70c06cb* var510;
+var510 = NULL;
+int64_t var511;
+int64_t var512;
+struct class_Member_a3dd2b1b39* var514;
+var514 = NULL;
+struct class_Type_87e1ce5c5e var516;
+var516.membernum = -1;
+struct class_Str var517;
+var517.buf = NULL;
+struct class__null___Type__8438ac3dcf var518;
+var518.membernum = -1;
+struct class_Str var519;
+var519.buf = NULL;
+struct class_Str var520;
+var520.buf = NULL;
+struct class_Str var521;
+var521.buf = NULL;
+struct class_Str var522;
+var522.buf = NULL;
+struct class_Str var523;
+var523.buf = NULL;
+struct class_Str var524;
+var524.buf = NULL;
+struct class_Str var525;
+var525.buf = NULL;
+struct class_Str var526;
+var526.buf = NULL;
+struct class_List_Member__7525bf27e3* var527;
+var527 = NULL;
+struct class_List_Str__43b70c06cb* var528;
+var528 = NULL;
+int64_t var529;
+int64_t var530;
+struct class_Member_a3dd2b1b39* var532;
+var532 = NULL;
+struct class_Type_87e1ce5c5e var534;
+var534.membernum = -1;
+struct class_Str var535;
+var535.buf = NULL;
+struct class__null___Type__8438ac3dcf var536;
+var536.membernum = -1;
+struct class_Str var537;
+var537.buf = NULL;
+struct class_Str var538;
+var538.buf = NULL;
+struct class_Str var539;
+var539.buf = NULL;
+struct class_Str var540;
+var540.buf = NULL;
+struct class_Str var541;
+var541.buf = NULL;
+struct class_Str var542;
+var542.buf = NULL;
+struct class_Str var543;
+var543.buf = NULL;
+bool var544;
+struct class_Str var547;
+var547.buf = NULL;
+struct class_List_Member__7525bf27e3* var548;
+var548 = NULL;
+struct class_List_Str__43b70c06cb* var549;
+var549 = NULL;
+int64_t var550;
+int64_t var551;
+struct class_Member_a3dd2b1b39* var553;
+var553 = NULL;
+struct class_Str var555;
+var555.buf = NULL;
+struct class_Str var556;
+var556.buf = NULL;
+struct class_Str var557;
+var557.buf = NULL;
+struct class_Str var558;
+var558.buf = NULL;
+struct class_Str var559;
+var559.buf = NULL;
+struct class_Str var560;
+var560.buf = NULL;
+struct class_Str var561;
+var561.buf = NULL;
+struct class_Str var562;
+var562.buf = NULL;
+struct class_Str var563;
+var563.buf = NULL;
+struct class_Str var564;
+var564.buf = NULL;
+struct class_Str var565;
+var565.buf = NULL;
+struct class_List_Member__7525bf27e3* var566;
+var566 = NULL;
+struct class_List_Str__43b70c06cb* var567;
+var567 = NULL;
+int64_t var568;
+int64_t var569;
+struct class_Member_a3dd2b1b39* var571;
+var571 = NULL;
+struct class_Session_88204c75ff* var573;
+var573 = NULL;
+struct class_Str var574;
+var574.buf = NULL;
+struct class_Str var575;
+var575.buf = NULL;
+struct class_Str var576;
+var576.buf = NULL;
+struct class_Type_87e1ce5c5e var577;
+var577.membernum = -1;
+struct class_Str var578;
+var578.buf = NULL;
+struct class_Str var579;
+var579.buf = NULL;
+struct class_Str var580;
+var580.buf = NULL;
+struct class_Str var581;
+var581.buf = NULL;
+struct class_Str var582;
+var582.buf = NULL;
+struct class_List_Member__7525bf27e3* var583;
+var583 = NULL;
+struct class_List_Str__43b70c06cb* var584;
+var584 = NULL;
+int64_t var585;
+int64_t var586;
+struct class_Member_a3dd2b1b39* var588;
+var588 = NULL;
+struct class_Session_88204c75ff* var590;
+var590 = NULL;
+struct class_Str var591;
+var591.buf = NULL;
+struct class_Str var592;
+var592.buf = NULL;
+struct class_Str var593;
+var593.buf = NULL;
+struct class_Type_87e1ce5c5e var594;
+var594.membernum = -1;
+struct class_Str var595;
+var595.buf = NULL;
+struct class_Str var596;
+var596.buf = NULL;
+struct class_Str var597;
+var597.buf = NULL;
+struct class_Str var598;
+var598.buf = NULL;
+struct class_Str var599;
+var599.buf = NULL;
+struct class_Str var600;
+var600.buf = NULL;
+struct class_Str var601;
+var601.buf = NULL;
+struct class_Str var602;
+var602.buf = NULL;
+struct class_Str var603;
+var603.buf = NULL;
+struct class_Str var604;
+var604.buf = NULL;
+struct class_Str var605;
+var605.buf = NULL;
+struct class_Str var606;
+var606.buf = NULL;
+struct class_Str var607;
+var607.buf = NULL;
+struct class__null___Str__5eca9cec4f var608;
+var608.membernum = -1;
+struct class__null___Str__5eca9cec4f var609;
+var609.membernum = -1;
+struct class_Str var610;
+var610.buf = NULL;
+struct class_Str var611;
+var611.buf = NULL;
+struct class_Type_87e1ce5c5e var612;
+var612.membernum = -1;
+struct class__null___Type__8438ac3dcf var613;
+var613.membernum = -1;
+struct class_Str var614;
+var614.buf = NULL;
+struct class_Str var615;
+var615.buf = NULL;
+struct class_Str var616;
+var616.buf = NULL;
+struct class_Str var617;
+var617.buf = NULL;
+struct class_Str var618;
+var618.buf = NULL;
+struct class_Str var619;
+var619.buf = NULL;
+struct class_Str var620;
+var620.buf = NULL;
+struct class_Str var621;
+var621.buf = NULL;
+struct class_Str var622;
+var622.buf = NULL;
+struct class_Str var623;
+var623.buf = NULL;
+struct class_Str var624;
+var624.buf = NULL;
+struct class_Str var625;
+var625.buf = NULL;
+struct class_Str var626;
+var626.buf = NULL;
+struct class_Str var627;
+var627.buf = NULL;
+struct class_Str var628;
+var628.buf = NULL;
+struct class_Str var629;
+var629.buf = NULL;
+struct class_Str var630;
+var630.buf = NULL;
+struct class_Str var631;
+var631.buf = NULL;
+struct class_Str var632;
+var632.buf = NULL;
+struct class_Type_87e1ce5c5e var633;
+var633.membernum = -1;
+struct class__null___Type__8438ac3dcf var634;
+var634.membernum = -1;
+struct class_Str var635;
+var635.buf = NULL;
+struct class_Str var636;
+var636.buf = NULL;
+struct class_Str var637;
+var637.buf = NULL;
+struct class_Str var638;
+var638.buf = NULL;
+struct class_Str var639;
+var639.buf = NULL;
+struct class_Str var640;
+var640.buf = NULL;
+struct class_Str var641;
+var641.buf = NULL;
+struct class_Str var642;
+var642.buf = NULL;
+struct class_Str var643;
+var643.buf = NULL;
+struct class_Str var644;
+var644.buf = NULL;
+struct class_Str var645;
+var645.buf = NULL;
+struct class_Type_87e1ce5c5e var646;
+var646.membernum = -1;
+struct class__null___Type__8438ac3dcf var647;
+var647.membernum = -1;
+struct class_Str var648;
+var648.buf = NULL;
+struct class_Str var649;
+var649.buf = NULL;
+struct class_Str var650;
+var650.buf = NULL;
+struct class_Str var651;
+var651.buf = NULL;
+struct class_Str var652;
+var652.buf = NULL;
+struct class_Str var653;
+var653.buf = NULL;
+struct class_Str var654;
+var654.buf = NULL;
+struct class_Str var655;
+var655.buf = NULL;
+struct class_Str var656;
+var656.buf = NULL;
+struct class_Str var657;
+var657.buf = NULL;
+struct class_Str var658;
+var658.buf = NULL;
+struct class_Str var659;
+var659.buf = NULL;
+struct class_Str var660;
+var660.buf = NULL;
+struct class_Str var661;
+var661.buf = NULL;
+struct class_Str var662;
+var662.buf = NULL;
+struct class_Str var663;
+var663.buf = NULL;
+struct class_Str var664;
+var664.buf = NULL;
+struct class_Str var665;
+var665.buf = NULL;
+struct class_Str var666;
+var666.buf = NULL;
+struct class_Str var667;
+var667.buf = NULL;
+struct class_Str var668;
+var668.buf = NULL;
+struct class_Str var669;
+var669.buf = NULL;
+struct class_Str var670;
+var670.buf = NULL;
+bool var671;
+struct class_Str var674;
+var674.buf = NULL;
+struct class_Str var675;
+var675.buf = NULL;
+struct class_Str var676;
+var676.buf = NULL;
+struct class_Str var677;
+var677.buf = NULL;
+struct class_Str var678;
+var678.buf = NULL;
+struct class_Str var679;
+var679.buf = NULL;
+struct class_Type_87e1ce5c5e var680;
+var680.membernum = -1;
+struct class__null___Type__8438ac3dcf var681;
+var681.membernum = -1;
+struct class_Str var682;
+var682.buf = NULL;
+struct class_Str var683;
+var683.buf = NULL;
+struct class_Str var684;
+var684.buf = NULL;
+struct class_Str var685;
+var685.buf = NULL;
+struct class_Str var686;
+var686.buf = NULL;
+struct class_Str var687;
+var687.buf = NULL;
+struct class_List_Member__7525bf27e3* var688;
+var688 = NULL;
+struct class_List_Str__43b70c06cb* var689;
+var689 = NULL;
+int64_t var690;
+int64_t var691;
+struct class_Member_a3dd2b1b39* var693;
+var693 = NULL;
+struct class_Str var695;
+var695.buf = NULL;
+struct class_Session_88204c75ff* var696;
+var696 = NULL;
+struct class_Type_87e1ce5c5e var697;
+var697.membernum = -1;
+struct class_Str var698;
+var698.buf = NULL;
+struct class_Str var699;
+var699.buf = NULL;
+struct class_Str var700;
+var700.buf = NULL;
+struct class_Str var701;
+var701.buf = NULL;
+struct class_Str var702;
+var702.buf = NULL;
+struct class_Str var703;
+var703.buf = NULL;
+struct class_Str var704;
+var704.buf = NULL;
+struct class_Str var705;
+var705.buf = NULL;
+struct class_Str var706;
+var706.buf = NULL;
+struct class_Str var707;
+var707.buf = NULL;
+struct class_Str var708;
+var708.buf = NULL;
+struct class_Str var709;
+var709.buf = NULL;
+struct class_Str var710;
+var710.buf = NULL;
+struct class_Str var711;
+var711.buf = NULL;
+struct class_Str var712;
+var712.buf = NULL;
+struct class_Str var713;
+var713.buf = NULL;
+struct class_Type_87e1ce5c5e var714;
+var714.membernum = -1;
+struct class__null___Type__8438ac3dcf var715;
+var715.membernum = -1;
+struct class_Str var716;
+var716.buf = NULL;
+struct class_Str var717;
+var717.buf = NULL;
+struct class_Str var718;
+var718.buf = NULL;
+struct class_Str var719;
+var719.buf = NULL;
+struct class_Str var720;
+var720.buf = NULL;
+struct class_Str var721;
+var721.buf = NULL;
+struct class_Str var722;
+var722.buf = NULL;
+struct class_Str var723;
+var723.buf = NULL;
+struct class_Str var724;
+var724.buf = NULL;
+struct class_Str var725;
+var725.buf = NULL;
+struct class_Str var726;
+var726.buf = NULL;
+struct class_Str var727;
+var727.buf = NULL;
+struct class_Str var728;
+var728.buf = NULL;
+struct class_Str var729;
+var729.buf = NULL;
+var3 = var1->memb_struct;
+incref__null___Str__5eca9cec4f(var3);
+var4 = oomph_null;
+var5 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var4 }, .membernum = 0 };
+var6 = meth__null___Str__5eca9cec4f_equals(var3,var5);
+var7 = string2_self_hosted_c_output_oomph_64e0ea3117; string_incref(var7);
+var8 = 413LL;
+oomph_assert(var6,var7,var8);
+
+            var9 = (
+                var2.membernum == 0
+            );
+            if (var9) goto label10;
+
+            var9 = (
+                var2.membernum == 2
+            );
+            if (var9) goto label11;
+
+            var9 = (
+                var2.membernum == 3
+            );
+            if (var9) goto label12;
+
+            var9 = (
+                var2.membernum == 1
+            );
+            if (var9) goto label13;
+label10: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var14 = var2.val.item0;
+            incref(var14);
+var15 = oomph_false;
+var16 = string2_self_hosted_c_output_oomph_64e0ea3117; string_incref(var16);
+var17 = 417LL;
+oomph_assert(var15,var16,var17);
+if (oomph_true) goto label18;
+label11: (void)0;
+
+            if (var2.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var19 = var2.val.item2;
+            incref(var19);
+var20 = oomph_false;
+var21 = string2_self_hosted_c_output_oomph_64e0ea3117; string_incref(var21);
+var22 = 419LL;
+oomph_assert(var20,var21,var22);
+if (oomph_true) goto label18;
+label12: (void)0;
+
+            if (var2.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var23 = var2.val.item3;
+            incref(var23);
+var24 = var23->memb_type_members;
+incref(var24);
+var25 = meth_List_Type__057f9c6088_length(var24);
+var26 = var23->memb_type_members;
+incref(var26);
+var27 = ctor_List_Str__43b70c06cb();
+var28 = meth_List_Type__057f9c6088_length(var26);
+meth_List_Str__43b70c06cb___reserve(var27,var28);
+var29 = 0LL;
+label30: (void)0;
+if (var29 >= var26->len) goto label32;
+decref_Type_87e1ce5c5e(var31); var31 = var26->data[var29++]; incref_Type_87e1ce5c5e(var31);
+decref((var33), dtor_Session_88204c75ff);
+var33 = NULL;
+var33 = var1->memb_session;
+incref(var33);
+string_decref(var34);
+var34.buf = NULL;
+var34 = meth_Session_88204c75ff_get_type_c_name(var33,var31);
+meth_List_Str__43b70c06cb_push(var27,var34);
+if (oomph_true) goto label30;
+label32: (void)0;
+var35 = ctor_List_Str__43b70c06cb();
+var36 = 0LL;
+label37: (void)0;
+var38 = oomph_int_gt(var25,var36);
+var39 = oomph_bool_not(var38);
+if (var39) goto label40;
+string_decref(var41);
+var41.buf = NULL;
+var41 = string50__________________________case__58a43c2bf0; string_incref(var41);
+string_decref(var42);
+var42.buf = NULL;
+var42 = meth_Int_to_string(var36);
+string_decref(var43);
+var43.buf = NULL;
+var43 = oomph_string_concat(var41,var42);
+string_decref(var44);
+var44.buf = NULL;
+var44 = string51_______________________________valstr___meth__4179699267; string_incref(var44);
+string_decref(var45);
+var45.buf = NULL;
+var45 = oomph_string_concat(var43,var44);
+string_decref(var46);
+var46.buf = NULL;
+var46 = meth_List_Str__43b70c06cb_get(var27,var36);
+string_decref(var47);
+var47.buf = NULL;
+var47 = oomph_string_concat(var45,var46);
+string_decref(var48);
+var48.buf = NULL;
+var48 = string52__to_string_obj_val_item_796ebcaf2e; string_incref(var48);
+string_decref(var49);
+var49.buf = NULL;
+var49 = oomph_string_concat(var47,var48);
+string_decref(var50);
+var50.buf = NULL;
+var50 = meth_Int_to_string(var36);
+string_decref(var51);
+var51.buf = NULL;
+var51 = oomph_string_concat(var49,var50);
+string_decref(var52);
+var52.buf = NULL;
+var52 = string53________________________________break___________________________4fde757628; string_incref(var52);
+string_decref(var53);
+var53.buf = NULL;
+var53 = oomph_string_concat(var51,var52);
+meth_List_Str__43b70c06cb_push(var35,var53);
+var54 = 1LL;
+var55 = oomph_int_add(var36,var54);
+var36 = var55;
+if (oomph_true) goto label37;
+label40: (void)0;
+var56 = string37__37a398d8ea; string_incref(var56);
+var57 = meth_List_Str__43b70c06cb_join(var35,var56);
+var58 = ctor_List_Str__43b70c06cb();
+var59 = 0LL;
+label60: (void)0;
+var61 = oomph_int_gt(var25,var59);
+var62 = oomph_bool_not(var61);
+if (var62) goto label63;
+string_decref(var64);
+var64.buf = NULL;
+var64 = string50__________________________case__58a43c2bf0; string_incref(var64);
+string_decref(var65);
+var65.buf = NULL;
+var65 = meth_Int_to_string(var59);
+string_decref(var66);
+var66.buf = NULL;
+var66 = oomph_string_concat(var64,var65);
+string_decref(var67);
+var67.buf = NULL;
+var67 = string54_______________________________return_meth__acdde1bc0c; string_incref(var67);
+string_decref(var68);
+var68.buf = NULL;
+var68 = oomph_string_concat(var66,var67);
+string_decref(var69);
+var69.buf = NULL;
+var69 = meth_List_Str__43b70c06cb_get(var27,var59);
+string_decref(var70);
+var70.buf = NULL;
+var70 = oomph_string_concat(var68,var69);
+string_decref(var71);
+var71.buf = NULL;
+var71 = string55__equals_a_val_item_2867b4cb78; string_incref(var71);
+string_decref(var72);
+var72.buf = NULL;
+var72 = oomph_string_concat(var70,var71);
+string_decref(var73);
+var73.buf = NULL;
+var73 = meth_Int_to_string(var59);
+string_decref(var74);
+var74.buf = NULL;
+var74 = oomph_string_concat(var72,var73);
+string_decref(var75);
+var75.buf = NULL;
+var75 = string56___b_val_item_c388b39a11; string_incref(var75);
+string_decref(var76);
+var76.buf = NULL;
+var76 = oomph_string_concat(var74,var75);
+string_decref(var77);
+var77.buf = NULL;
+var77 = meth_Int_to_string(var59);
+string_decref(var78);
+var78.buf = NULL;
+var78 = oomph_string_concat(var76,var77);
+string_decref(var79);
+var79.buf = NULL;
+var79 = string57_____________________________db53c59dd0; string_incref(var79);
+string_decref(var80);
+var80.buf = NULL;
+var80 = oomph_string_concat(var78,var79);
+meth_List_Str__43b70c06cb_push(var58,var80);
+var81 = 1LL;
+var82 = oomph_int_add(var59,var81);
+var59 = var82;
+if (oomph_true) goto label60;
+label63: (void)0;
+var83 = string37__37a398d8ea; string_incref(var83);
+var84 = meth_List_Str__43b70c06cb_join(var58,var83);
+var85 = var1->memb_function_decls;
+string_incref(var85);
+var86 = string58__________________struct_class_Str_meth__6558deb1e3; string_incref(var86);
+var87 = var1->memb_id;
+string_incref(var87);
+var88 = oomph_string_concat(var86,var87);
+var89 = string59__to_string_struct_class__fd8546d3f2; string_incref(var89);
+var90 = oomph_string_concat(var88,var89);
+var91 = var1->memb_id;
+string_incref(var91);
+var92 = oomph_string_concat(var90,var91);
+var93 = string60__obj___________________bool_meth__06bd8c6c68; string_incref(var93);
+var94 = oomph_string_concat(var92,var93);
+var95 = var1->memb_id;
+string_incref(var95);
+var96 = oomph_string_concat(var94,var95);
+var97 = string61__equals_struct_class__a044eebb07; string_incref(var97);
+var98 = oomph_string_concat(var96,var97);
+var99 = var1->memb_id;
+string_incref(var99);
+var100 = oomph_string_concat(var98,var99);
+var101 = string62__a__struct_class__c06b334a35; string_incref(var101);
+var102 = oomph_string_concat(var100,var101);
+var103 = var1->memb_id;
+string_incref(var103);
+var104 = oomph_string_concat(var102,var103);
+var105 = string63__b____________________eb3e8b25b9; string_incref(var105);
+var106 = oomph_string_concat(var104,var105);
+var107 = oomph_string_concat(var85,var106);
+var108 = var1->memb_function_decls;
+var1->memb_function_decls = var107;
+var107.buf = NULL;
+var109 = (struct class_Type_87e1ce5c5e){ .val = { .item3 = var23 }, .membernum = 3 };
+incref(var23);
+var110 = ir_4b1a3e0393_type_name(var109);
+var111 = meth_FilePair_99df852164_emit_string(var1,var110);
+var112 = var1->memb_function_defs;
+string_incref(var112);
+var113 = string58__________________struct_class_Str_meth__6558deb1e3; string_incref(var113);
+var114 = var1->memb_id;
+string_incref(var114);
+var115 = oomph_string_concat(var113,var114);
+var116 = string59__to_string_struct_class__fd8546d3f2; string_incref(var116);
+var117 = oomph_string_concat(var115,var116);
+var118 = var1->memb_id;
+string_incref(var118);
+var119 = oomph_string_concat(var117,var118);
+var120 = string64__obj________________________________________struct_class_Str_valstr______________________switch_obj_membernum_____________________________39335ca6a1; string_incref(var120);
+var121 = oomph_string_concat(var119,var120);
+var122 = oomph_string_concat(var121,var57);
+var123 = string65__________________________default______________________________panic_printf___________________________________INTERNAL_OOMPH_ERROR__invalid__s_membernum__d___________________________________string_to_cstr__98db993b10; string_incref(var123);
+var124 = oomph_string_concat(var122,var123);
+var125 = oomph_string_concat(var124,var111);
+var126 = string66_____int_obj_membernum______________________________________________struct_class_Str_res____c13c02f8d2; string_incref(var126);
+var127 = oomph_string_concat(var125,var126);
+var128 = (struct class_Type_87e1ce5c5e){ .val = { .item3 = var23 }, .membernum = 3 };
+incref(var23);
+var129 = ir_4b1a3e0393_type_name(var128);
+var130 = meth_FilePair_99df852164_emit_string(var1,var129);
+var131 = oomph_string_concat(var127,var130);
+var132 = string67_______________________string_incref_res_______________________oomph_string_concat_inplace_cstr__res____________________________oomph_string_concat_inplace__res__valstr_______________________oomph_string_concat_inplace_cstr__res____________________________string_decref_valstr_______________________return_res_____________________________________bool_meth__22b91bc13d; string_incref(var132);
+var133 = oomph_string_concat(var131,var132);
+var134 = var1->memb_id;
+string_incref(var134);
+var135 = oomph_string_concat(var133,var134);
+var136 = string61__equals_struct_class__a044eebb07; string_incref(var136);
+var137 = oomph_string_concat(var135,var136);
+var138 = var1->memb_id;
+string_incref(var138);
+var139 = oomph_string_concat(var137,var138);
+var140 = string62__a__struct_class__c06b334a35; string_incref(var140);
+var141 = oomph_string_concat(var139,var140);
+var142 = var1->memb_id;
+string_incref(var142);
+var143 = oomph_string_concat(var141,var142);
+var144 = string68__b________________________________________if__a_membernum____b_membernum__________________________return_false______________________switch_a_membernum_____________________________984b047854; string_incref(var144);
+var145 = oomph_string_concat(var143,var144);
+var146 = oomph_string_concat(var145,var84);
+var147 = string65__________________________default______________________________panic_printf___________________________________INTERNAL_OOMPH_ERROR__invalid__s_membernum__d___________________________________string_to_cstr__98db993b10; string_incref(var147);
+var148 = oomph_string_concat(var146,var147);
+var149 = oomph_string_concat(var148,var111);
+var150 = string69_____int_a_membernum____________________________________________________________b2f4b03033; string_incref(var150);
+var151 = oomph_string_concat(var149,var150);
+var152 = oomph_string_concat(var112,var151);
+var153 = var1->memb_function_defs;
+var1->memb_function_defs = var152;
+var152.buf = NULL;
+var154 = ctor_List_Str__43b70c06cb();
+var155 = 0LL;
+label156: (void)0;
+var157 = oomph_int_gt(var25,var155);
+var158 = oomph_bool_not(var157);
+if (var158) goto label159;
+decref((var160), dtor_Session_88204c75ff);
+var160 = NULL;
+var160 = var1->memb_session;
+incref(var160);
+string_decref(var161);
+var161.buf = NULL;
+var161 = string70_obj_val_item_99b40acef6; string_incref(var161);
+string_decref(var162);
+var162.buf = NULL;
+var162 = meth_Int_to_string(var155);
+string_decref(var163);
+var163.buf = NULL;
+var163 = oomph_string_concat(var161,var162);
+decref((var164), dtor_List_Type__057f9c6088);
+var164 = NULL;
+var164 = var23->memb_type_members;
+incref(var164);
+decref_Type_87e1ce5c5e(var165);
+var165.membernum = -1;
+var165 = meth_List_Type__057f9c6088_get(var164,var155);
+string_decref(var166);
+var166.buf = NULL;
+var166 = meth_Session_88204c75ff_emit_incref(var160,var163,var165);
+meth_List_Str__43b70c06cb_push(var154,var166);
+var167 = 1LL;
+var168 = oomph_int_add(var155,var167);
+var155 = var168;
+if (oomph_true) goto label156;
+label159: (void)0;
+var169 = ctor_List_Str__43b70c06cb();
+var170 = 0LL;
+label171: (void)0;
+var172 = oomph_int_gt(var25,var170);
+var173 = oomph_bool_not(var172);
+if (var173) goto label174;
+decref((var175), dtor_Session_88204c75ff);
+var175 = NULL;
+var175 = var1->memb_session;
+incref(var175);
+string_decref(var176);
+var176.buf = NULL;
+var176 = string70_obj_val_item_99b40acef6; string_incref(var176);
+string_decref(var177);
+var177.buf = NULL;
+var177 = meth_Int_to_string(var170);
+string_decref(var178);
+var178.buf = NULL;
+var178 = oomph_string_concat(var176,var177);
+decref((var179), dtor_List_Type__057f9c6088);
+var179 = NULL;
+var179 = var23->memb_type_members;
+incref(var179);
+decref_Type_87e1ce5c5e(var180);
+var180.membernum = -1;
+var180 = meth_List_Type__057f9c6088_get(var179,var170);
+string_decref(var181);
+var181.buf = NULL;
+var181 = meth_Session_88204c75ff_emit_decref(var175,var178,var180);
+meth_List_Str__43b70c06cb_push(var169,var181);
+var182 = 1LL;
+var183 = oomph_int_add(var170,var182);
+var170 = var183;
+if (oomph_true) goto label171;
+label174: (void)0;
+var184 = ctor_List_Str__43b70c06cb();
+var185 = 0LL;
+label186: (void)0;
+var187 = oomph_int_gt(var25,var185);
+var188 = oomph_bool_not(var187);
+if (var188) goto label189;
+string_decref(var190);
+var190.buf = NULL;
+var190 = string71_case__ba0932b8b3; string_incref(var190);
+string_decref(var191);
+var191.buf = NULL;
+var191 = meth_Int_to_string(var185);
+string_decref(var192);
+var192.buf = NULL;
+var192 = oomph_string_concat(var190,var191);
+string_decref(var193);
+var193.buf = NULL;
+var193 = string72____e27757c517; string_incref(var193);
+string_decref(var194);
+var194.buf = NULL;
+var194 = oomph_string_concat(var192,var193);
+string_decref(var195);
+var195.buf = NULL;
+var195 = meth_List_Str__43b70c06cb_get(var154,var185);
+string_decref(var196);
+var196.buf = NULL;
+var196 = oomph_string_concat(var194,var195);
+string_decref(var197);
+var197.buf = NULL;
+var197 = string73___break___7ea39a708b; string_incref(var197);
+string_decref(var198);
+var198.buf = NULL;
+var198 = oomph_string_concat(var196,var197);
+meth_List_Str__43b70c06cb_push(var184,var198);
+var199 = 1LL;
+var200 = oomph_int_add(var185,var199);
+var185 = var200;
+if (oomph_true) goto label186;
+label189: (void)0;
+var201 = string37__37a398d8ea; string_incref(var201);
+var202 = meth_List_Str__43b70c06cb_join(var184,var201);
+var203 = ctor_List_Str__43b70c06cb();
+var204 = 0LL;
+label205: (void)0;
+var206 = oomph_int_gt(var25,var204);
+var207 = oomph_bool_not(var206);
+if (var207) goto label208;
+string_decref(var209);
+var209.buf = NULL;
+var209 = string71_case__ba0932b8b3; string_incref(var209);
+string_decref(var210);
+var210.buf = NULL;
+var210 = meth_Int_to_string(var204);
+string_decref(var211);
+var211.buf = NULL;
+var211 = oomph_string_concat(var209,var210);
+string_decref(var212);
+var212.buf = NULL;
+var212 = string72____e27757c517; string_incref(var212);
+string_decref(var213);
+var213.buf = NULL;
+var213 = oomph_string_concat(var211,var212);
+string_decref(var214);
+var214.buf = NULL;
+var214 = meth_List_Str__43b70c06cb_get(var169,var204);
+string_decref(var215);
+var215.buf = NULL;
+var215 = oomph_string_concat(var213,var214);
+string_decref(var216);
+var216.buf = NULL;
+var216 = string73___break___7ea39a708b; string_incref(var216);
+string_decref(var217);
+var217.buf = NULL;
+var217 = oomph_string_concat(var215,var216);
+meth_List_Str__43b70c06cb_push(var203,var217);
+var218 = 1LL;
+var219 = oomph_int_add(var204,var218);
+var204 = var219;
+if (oomph_true) goto label205;
+label208: (void)0;
+var220 = string37__37a398d8ea; string_incref(var220);
+var221 = meth_List_Str__43b70c06cb_join(var203,var220);
+var222 = var1->memb_function_decls;
+string_incref(var222);
+var223 = string74__________________void_incref__602b7186e3; string_incref(var223);
+var224 = var1->memb_id;
+string_incref(var224);
+var225 = oomph_string_concat(var223,var224);
+var226 = string75__struct_class__66cd20f90a; string_incref(var226);
+var227 = oomph_string_concat(var225,var226);
+var228 = var1->memb_id;
+string_incref(var228);
+var229 = oomph_string_concat(var227,var228);
+var230 = string76__obj___________________void_decref__09249fe405; string_incref(var230);
+var231 = oomph_string_concat(var229,var230);
+var232 = var1->memb_id;
+string_incref(var232);
+var233 = oomph_string_concat(var231,var232);
+var234 = string75__struct_class__66cd20f90a; string_incref(var234);
+var235 = oomph_string_concat(var233,var234);
+var236 = var1->memb_id;
+string_incref(var236);
+var237 = oomph_string_concat(var235,var236);
+var238 = string77__obj____________________c47bb4d2e5; string_incref(var238);
+var239 = oomph_string_concat(var237,var238);
+var240 = oomph_string_concat(var222,var239);
+var241 = var1->memb_function_decls;
+var1->memb_function_decls = var240;
+var240.buf = NULL;
+var242 = var1->memb_function_defs;
+string_incref(var242);
+var243 = string74__________________void_incref__602b7186e3; string_incref(var243);
+var244 = var1->memb_id;
+string_incref(var244);
+var245 = oomph_string_concat(var243,var244);
+var246 = string75__struct_class__66cd20f90a; string_incref(var246);
+var247 = oomph_string_concat(var245,var246);
+var248 = var1->memb_id;
+string_incref(var248);
+var249 = oomph_string_concat(var247,var248);
+var250 = string78__obj________________________switch_obj_membernum_____________________________979fb46448; string_incref(var250);
+var251 = oomph_string_concat(var249,var250);
+var252 = oomph_string_concat(var251,var202);
+var253 = string79__________________________default______________________________assert_0___________________________________________________________void_decref__5d7fb36d61; string_incref(var253);
+var254 = oomph_string_concat(var252,var253);
+var255 = var1->memb_id;
+string_incref(var255);
+var256 = oomph_string_concat(var254,var255);
+var257 = string75__struct_class__66cd20f90a; string_incref(var257);
+var258 = oomph_string_concat(var256,var257);
+var259 = var1->memb_id;
+string_incref(var259);
+var260 = oomph_string_concat(var258,var259);
+var261 = string80__obj________________________switch_obj_membernum____________________________case__1_______variable_not_in_use__see_UnSet______________________________break___________________________540c0a5112; string_incref(var261);
+var262 = oomph_string_concat(var260,var261);
+var263 = oomph_string_concat(var262,var221);
+var264 = string81__________________________default______________________________assert_0____________________________________________________________4f523a6aef; string_incref(var264);
+var265 = oomph_string_concat(var263,var264);
+var266 = oomph_string_concat(var242,var265);
+var267 = var1->memb_function_defs;
+var1->memb_function_defs = var266;
+var266.buf = NULL;
+var268 = ctor_List_Str__43b70c06cb();
+var269 = 0LL;
+label270: (void)0;
+var271 = oomph_int_gt(var25,var269);
+var272 = oomph_bool_not(var271);
+if (var272) goto label273;
+decref((var274), dtor_List_Type__057f9c6088);
+var274 = NULL;
+var274 = var23->memb_type_members;
+incref(var274);
+var275 = meth_List_Type__057f9c6088_get(var274,var269);
+string_decref(var276);
+var276.buf = NULL;
+decref__null___Type__8438ac3dcf(var277);
+var277.membernum = -1;
+var277 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var275 }, .membernum = 1 };
+var275.membernum = -1;
+var276 = meth_FilePair_99df852164_emit_type(var1,var277);
+string_decref(var278);
+var278.buf = NULL;
+var278 = string82__item_4e28d07419; string_incref(var278);
+string_decref(var279);
+var279.buf = NULL;
+var279 = oomph_string_concat(var276,var278);
+string_decref(var280);
+var280.buf = NULL;
+var280 = meth_Int_to_string(var269);
+string_decref(var281);
+var281.buf = NULL;
+var281 = oomph_string_concat(var279,var280);
+string_decref(var282);
+var282.buf = NULL;
+var282 = string10____afb2f97902; string_incref(var282);
+string_decref(var283);
+var283.buf = NULL;
+var283 = oomph_string_concat(var281,var282);
+meth_List_Str__43b70c06cb_push(var268,var283);
+var284 = 1LL;
+var285 = oomph_int_add(var269,var284);
+var269 = var285;
+if (oomph_true) goto label270;
+label273: (void)0;
+var286 = string37__37a398d8ea; string_incref(var286);
+var287 = meth_List_Str__43b70c06cb_join(var268,var286);
+var288 = string83__________________struct_class__55fc486395; string_incref(var288);
+var289 = var1->memb_id;
+string_incref(var289);
+var290 = oomph_string_concat(var288,var289);
+var291 = string84________________________union____________________________62a2fa0c00; string_incref(var291);
+var292 = oomph_string_concat(var290,var291);
+var293 = oomph_string_concat(var292,var287);
+var294 = string85________________________val______________________short_membernum______________________________________90e1c3ecf2; string_incref(var294);
+var295 = oomph_string_concat(var293,var294);
+var296 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var295 }, .membernum = 1 };
+var295.buf = NULL;
+var297 = var1->memb_struct;
+var1->memb_struct = var296;
+var296.membernum = -1;
+var298 = 2LL;
+var299 = meth_Int_equals(var25,var298);
+if (var299) goto label300;
+var301 = oomph_false;
+if (oomph_true) goto label302;
+label300: (void)0;
+var303 = var23->memb_type_members;
+incref(var303);
+var304 = meth_List_Type__057f9c6088_first(var303);
+var305 = var1->memb_session;
+var306 = var305->memb_builtins;
+var305 = NULL;
+incref(var306);
+var307 = var306->memb_NULL_TYPE;
+incref_Type_87e1ce5c5e(var307);
+var308 = meth_Type_87e1ce5c5e_equals(var304,var307);
+var301 = var308;
+label302: (void)0;
+if (var301) goto label309;
+if (oomph_true) goto label310;
+label309: (void)0;
+var311 = var23->memb_type_members;
+incref(var311);
+var312 = meth_List_Type__057f9c6088_last(var311);
+var313 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var312 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var312);
+var314 = meth_FilePair_99df852164_emit_type(var1,var313);
+var315 = var1->memb_function_decls;
+string_incref(var315);
+var316 = string86__meth__83bc08e002; string_incref(var316);
+var317 = oomph_string_concat(var314,var316);
+var318 = var1->memb_id;
+string_incref(var318);
+var319 = oomph_string_concat(var317,var318);
+var320 = string87__get_struct_class__624bd0c497; string_incref(var320);
+var321 = oomph_string_concat(var319,var320);
+var322 = var1->memb_id;
+string_incref(var322);
+var323 = oomph_string_concat(var321,var322);
+var324 = string88__obj___684a38e291; string_incref(var324);
+var325 = oomph_string_concat(var323,var324);
+var326 = oomph_string_concat(var315,var325);
+var327 = var1->memb_function_decls;
+var1->memb_function_decls = var326;
+var326.buf = NULL;
+var328 = var1->memb_function_defs;
+string_incref(var328);
+var329 = string89_______________________8d540d53c1; string_incref(var329);
+var330 = oomph_string_concat(var329,var314);
+var331 = string86__meth__83bc08e002; string_incref(var331);
+var332 = oomph_string_concat(var330,var331);
+var333 = var1->memb_id;
+string_incref(var333);
+var334 = oomph_string_concat(var332,var333);
+var335 = string87__get_struct_class__624bd0c497; string_incref(var335);
+var336 = oomph_string_concat(var334,var335);
+var337 = var1->memb_id;
+string_incref(var337);
+var338 = oomph_string_concat(var336,var337);
+var339 = string90__obj________________________________________________if__obj_membernum____0______________________________panic_printf__Error__null_get___was_called____________________________assert_obj_membernum____1____________________________44f2cce466; string_incref(var339);
+var340 = oomph_string_concat(var338,var339);
+var341 = var1->memb_session;
+incref(var341);
+var342 = string91_obj_val_item1_9d375ab773; string_incref(var342);
+var343 = meth_Session_88204c75ff_emit_incref(var341,var342,var312);
+var344 = oomph_string_concat(var340,var343);
+var345 = string92___________________________return_obj_val_item1_____________________________________________6243e272df; string_incref(var345);
+var346 = oomph_string_concat(var344,var345);
+var347 = oomph_string_concat(var328,var346);
+var348 = var1->memb_function_defs;
+var1->memb_function_defs = var347;
+var347.buf = NULL;
+label310: (void)0;
+if (oomph_true) goto label18;
+label13: (void)0;
+
+            if (var2.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var349 = var2.val.item1;
+            incref(var349);
+var350 = var349->memb_generic_source;
+incref__null___GenericSource__4440b6073d(var350);
+var351 = oomph_null;
+var352 = (struct class__null___GenericSource__4440b6073d){ .val = { .item0 = var351 }, .membernum = 0 };
+var353 = meth__null___GenericSource__4440b6073d_equals(var350,var352);
+if (var353) goto label354;
+var355 = var349->memb_generic_source;
+incref__null___GenericSource__4440b6073d(var355);
+var356 = meth__null___GenericSource__4440b6073d_get(var355);
+var357 = var356->memb_generik;
+incref(var357);
+var358 = var1->memb_session;
+var359 = var358->memb_builtins;
+var358 = NULL;
+incref(var359);
+var360 = var359->memb_LIST;
+incref(var360);
+var361 = meth_Generic_c39b95ec73_equals(var357,var360);
+var362 = string2_self_hosted_c_output_oomph_64e0ea3117; string_incref(var362);
+var363 = 606LL;
+oomph_assert(var361,var362,var363);
+var364 = var349->memb_generic_source;
+incref__null___GenericSource__4440b6073d(var364);
+var365 = meth__null___GenericSource__4440b6073d_get(var364);
+var366 = var365->memb_arg;
+incref_Type_87e1ce5c5e(var366);
+var367 = string93_CONSTRUCTOR_7f260334d8; string_incref(var367);
+var368 = string94_ctor__5008fd0aed; string_incref(var368);
+var369 = var1->memb_session;
+incref(var369);
+var370 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var349 }, .membernum = 1 };
+incref(var349);
+var371 = meth_Session_88204c75ff_get_type_c_name(var369,var370);
+var372 = oomph_string_concat(var368,var371);
+var373 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var373,var367);
+meth_List_Str__43b70c06cb_push(var373,var372);
+var374 = string95_DESTRUCTOR_9d2a8e4687; string_incref(var374);
+var375 = string96_dtor__c0c64c77d8; string_incref(var375);
+var376 = var1->memb_session;
+incref(var376);
+var377 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var349 }, .membernum = 1 };
+incref(var349);
+var378 = meth_Session_88204c75ff_get_type_c_name(var376,var377);
+var379 = oomph_string_concat(var375,var378);
+var380 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var380,var374);
+meth_List_Str__43b70c06cb_push(var380,var379);
+var381 = string97_TYPE_317f84a587; string_incref(var381);
+var382 = string8_struct_class__cbaa47d00e; string_incref(var382);
+var383 = var1->memb_session;
+incref(var383);
+var384 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var349 }, .membernum = 1 };
+incref(var349);
+var385 = meth_Session_88204c75ff_get_type_c_name(var383,var384);
+var386 = oomph_string_concat(var382,var385);
+var387 = string98____bd3f03ca7c; string_incref(var387);
+var388 = oomph_string_concat(var386,var387);
+var389 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var389,var381);
+meth_List_Str__43b70c06cb_push(var389,var388);
+var390 = string99_TYPE_STRUCT_c4ac1cfc3e; string_incref(var390);
+var391 = string100_class__296f18d03a; string_incref(var391);
+var392 = var1->memb_session;
+incref(var392);
+var393 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var349 }, .membernum = 1 };
+incref(var349);
+var394 = meth_Session_88204c75ff_get_type_c_name(var392,var393);
+var395 = oomph_string_concat(var391,var394);
+var396 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var396,var390);
+meth_List_Str__43b70c06cb_push(var396,var395);
+var397 = string101_METHOD_name__15be1988f4; string_incref(var397);
+var398 = string33_meth__037d88e79e; string_incref(var398);
+var399 = var1->memb_session;
+incref(var399);
+var400 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var349 }, .membernum = 1 };
+incref(var349);
+var401 = meth_Session_88204c75ff_get_type_c_name(var399,var400);
+var402 = oomph_string_concat(var398,var401);
+var403 = string102____name_1c0bc7a44d; string_incref(var403);
+var404 = oomph_string_concat(var402,var403);
+var405 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var405,var397);
+meth_List_Str__43b70c06cb_push(var405,var404);
+var406 = string103_ITEMTYPE_a946a7fce3; string_incref(var406);
+var407 = oomph_false;
+var408 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var366 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var366);
+var409 = meth_FilePair_99df852164_emit_type_custom(var1,var408,var407);
+var410 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var410,var406);
+meth_List_Str__43b70c06cb_push(var410,var409);
+var411 = string104_ITEMTYPE_METHOD_name__fcd6515168; string_incref(var411);
+var412 = string33_meth__037d88e79e; string_incref(var412);
+var413 = var1->memb_session;
+incref(var413);
+var414 = meth_Session_88204c75ff_get_type_c_name(var413,var366);
+var415 = oomph_string_concat(var412,var414);
+var416 = string102____name_1c0bc7a44d; string_incref(var416);
+var417 = oomph_string_concat(var415,var416);
+var418 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var418,var411);
+meth_List_Str__43b70c06cb_push(var418,var417);
+var419 = string105_INCREF_ITEM_val__def389f73e; string_incref(var419);
+var420 = var1->memb_session;
+incref(var420);
+var421 = string106__val__f3357ba361; string_incref(var421);
+var422 = meth_Session_88204c75ff_emit_incref(var420,var421,var366);
+var423 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var423,var419);
+meth_List_Str__43b70c06cb_push(var423,var422);
+var424 = string107_DECREF_ITEM_val__d348a13608; string_incref(var424);
+var425 = var1->memb_session;
+incref(var425);
+var426 = string106__val__f3357ba361; string_incref(var426);
+var427 = meth_Session_88204c75ff_emit_decref(var425,var426,var366);
+var428 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var428,var424);
+meth_List_Str__43b70c06cb_push(var428,var427);
+var429 = ctor_List_List_Str___637f5f7ec1();
+meth_List_List_Str___637f5f7ec1_push(var429,var373);
+meth_List_List_Str___637f5f7ec1_push(var429,var380);
+meth_List_List_Str___637f5f7ec1_push(var429,var389);
+meth_List_List_Str___637f5f7ec1_push(var429,var396);
+meth_List_List_Str___637f5f7ec1_push(var429,var405);
+meth_List_List_Str___637f5f7ec1_push(var429,var410);
+meth_List_List_Str___637f5f7ec1_push(var429,var418);
+meth_List_List_Str___637f5f7ec1_push(var429,var423);
+meth_List_List_Str___637f5f7ec1_push(var429,var428);
+var430 = var1->memb_session;
+var431 = var430->memb_builtins;
+var430 = NULL;
+incref(var431);
+var432 = var431->memb_STR;
+incref_Type_87e1ce5c5e(var432);
+var433 = meth_Type_87e1ce5c5e_equals(var366,var432);
+if (var433) goto label434;
+var435 = string108_ITEMTYPE_IS_STRING_6d1cc985c2; string_incref(var435);
+var436 = string43_0_c401021f71; string_incref(var436);
+var437 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var437,var435);
+meth_List_Str__43b70c06cb_push(var437,var436);
+meth_List_List_Str___637f5f7ec1_push(var429,var437);
+if (oomph_true) goto label438;
+label434: (void)0;
+var439 = string108_ITEMTYPE_IS_STRING_6d1cc985c2; string_incref(var439);
+var440 = string109_1_57b1a3ef8f; string_incref(var440);
+var441 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var441,var439);
+meth_List_Str__43b70c06cb_push(var441,var440);
+meth_List_List_Str___637f5f7ec1_push(var429,var441);
+label438: (void)0;
+var442 = string110___1401049c7f; string_incref(var442);
+var443 = string110___1401049c7f; string_incref(var443);
+var444 = 0LL;
+label445: (void)0;
+if (var444 >= var429->len) goto label447;
+var446 = var429->data[var444++];
+string_decref(var448);
+var448.buf = NULL;
+var448 = meth_List_Str__43b70c06cb_first(var446);
+string_decref(var449);
+var449.buf = NULL;
+var449 = string38___074be16786; string_incref(var449);
+decref((var450), dtor_List_Str__43b70c06cb);
+var450 = NULL;
+var450 = meth_Str_split(var448,var449);
+string_decref(var451);
+var451.buf = NULL;
+var451 = meth_List_Str__43b70c06cb_first(var450);
+string_decref(var452);
+var452.buf = NULL;
+var452 = string111__define__ecc087e058; string_incref(var452);
+string_decref(var453);
+var453.buf = NULL;
+var453 = meth_List_Str__43b70c06cb_first(var446);
+string_decref(var454);
+var454.buf = NULL;
+var454 = oomph_string_concat(var452,var453);
+string_decref(var455);
+var455.buf = NULL;
+var455 = string35___63dbb4f422; string_incref(var455);
+string_decref(var456);
+var456.buf = NULL;
+var456 = oomph_string_concat(var454,var455);
+string_decref(var457);
+var457.buf = NULL;
+var457 = meth_List_Str__43b70c06cb_last(var446);
+string_decref(var458);
+var458.buf = NULL;
+var458 = oomph_string_concat(var456,var457);
+string_decref(var459);
+var459.buf = NULL;
+var459 = string110___1401049c7f; string_incref(var459);
+string_decref(var460);
+var460.buf = NULL;
+var460 = oomph_string_concat(var458,var459);
+var461 = oomph_string_concat(var442,var460);
+string_decref(var442);
+var442 = var461;
+var461.buf = NULL;
+string_decref(var462);
+var462.buf = NULL;
+var462 = string112__undef__4a7b61af8c; string_incref(var462);
+string_decref(var463);
+var463.buf = NULL;
+var463 = oomph_string_concat(var462,var451);
+string_decref(var464);
+var464.buf = NULL;
+var464 = string110___1401049c7f; string_incref(var464);
+string_decref(var465);
+var465.buf = NULL;
+var465 = oomph_string_concat(var463,var464);
+var466 = oomph_string_concat(var443,var465);
+string_decref(var443);
+var443 = var466;
+var466.buf = NULL;
+if (oomph_true) goto label445;
+label447: (void)0;
+var467 = string113_lib_generic_list_h_3e66a12824; string_incref(var467);
+var468 = bundle_io_45f5b8a585_read_file(var467);
+var469 = oomph_string_concat(var442,var468);
+var470 = oomph_string_concat(var469,var443);
+var471 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var470 }, .membernum = 1 };
+var470.buf = NULL;
+var472 = var1->memb_struct;
+var1->memb_struct = var471;
+var471.membernum = -1;
+var473 = var1->memb_session;
+var474 = var473->memb_builtins;
+var473 = NULL;
+incref(var474);
+var475 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var349 }, .membernum = 1 };
+incref(var349);
+var476 = ir_4b1a3e0393_get_methods(var475,var474);
+var477 = 0LL;
+label478: (void)0;
+if (var477 >= var476->len) goto label480;
+decref((var479), dtor_Method_bfbd73ad15); var479 = var476->data[var477++]; incref(var479);
+string_decref(var481);
+var481.buf = NULL;
+var481 = string33_meth__037d88e79e; string_incref(var481);
+decref((var482), dtor_Session_88204c75ff);
+var482 = NULL;
+var482 = var1->memb_session;
+incref(var482);
+string_decref(var483);
+var483.buf = NULL;
+decref_Type_87e1ce5c5e(var484);
+var484.membernum = -1;
+var484 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var349 }, .membernum = 1 };
+incref(var349);
+var483 = meth_Session_88204c75ff_get_type_c_name(var482,var484);
+string_decref(var485);
+var485.buf = NULL;
+var485 = oomph_string_concat(var481,var483);
+string_decref(var486);
+var486.buf = NULL;
+var486 = string34___3dd6dc5c14; string_incref(var486);
+string_decref(var487);
+var487.buf = NULL;
+var487 = oomph_string_concat(var485,var486);
+string_decref(var488);
+var488.buf = NULL;
+var488 = var479->memb_name;
+string_incref(var488);
+string_decref(var489);
+var489.buf = NULL;
+var489 = oomph_string_concat(var487,var488);
+decref((var490), dtor_FunctionType_4e16d0ea53);
+var490 = NULL;
+var490 = var479->memb_functype;
+incref(var490);
+var491 = oomph_null;
+var492 = oomph_null;
+decref__null___List_Str___1b0213dad9(var493);
+var493.membernum = -1;
+var493 = (struct class__null___List_Str___1b0213dad9){ .val = { .item0 = var491 }, .membernum = 0 };
+decref__null___Str__5eca9cec4f(var494);
+var494.membernum = -1;
+var494 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var492 }, .membernum = 0 };
+meth_FilePair_99df852164_define_function(var1,var489,var490,var493,var494);
+if (oomph_true) goto label478;
+label480: (void)0;
+var495 = var1->memb_function_decls;
+string_incref(var495);
+var496 = oomph_string_concat(var495,var442);
+var497 = string114_TYPE_CONSTRUCTOR_void___void_DESTRUCTOR_void__ptr___be61785c83; string_incref(var497);
+var498 = oomph_string_concat(var496,var497);
+var499 = oomph_string_concat(var498,var443);
+var500 = var1->memb_function_decls;
+var1->memb_function_decls = var499;
+var499.buf = NULL;
+var501 = var1->memb_function_defs;
+string_incref(var501);
+var502 = oomph_string_concat(var501,var442);
+var503 = string115_lib_generic_list_c_045b5afa1d; string_incref(var503);
+var504 = bundle_io_45f5b8a585_read_file(var503);
+var505 = oomph_string_concat(var502,var504);
+var506 = oomph_string_concat(var505,var443);
+var507 = var1->memb_function_defs;
+var1->memb_function_defs = var506;
+var506.buf = NULL;
+if (oomph_true) goto label508;
+label354: (void)0;
+var509 = var349->memb_members;
+incref(var509);
+var510 = ctor_List_Str__43b70c06cb();
+var511 = meth_List_Member__7525bf27e3_length(var509);
+meth_List_Str__43b70c06cb___reserve(var510,var511);
+var512 = 0LL;
+label513: (void)0;
+if (var512 >= var509->len) goto label515;
+decref((var514), dtor_Member_a3dd2b1b39); var514 = var509->data[var512++]; incref(var514);
+var516 = var514->memb_type;
+incref_Type_87e1ce5c5e(var516);
+string_decref(var517);
+var517.buf = NULL;
+decref__null___Type__8438ac3dcf(var518);
+var518.membernum = -1;
+var518 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var516 }, .membernum = 1 };
+var516.membernum = -1;
+var517 = meth_FilePair_99df852164_emit_type(var1,var518);
+string_decref(var519);
+var519.buf = NULL;
+var519 = string116__memb__da84384c07; string_incref(var519);
+string_decref(var520);
+var520.buf = NULL;
+var520 = oomph_string_concat(var517,var519);
+string_decref(var521);
+var521.buf = NULL;
+var521 = var514->memb_name;
+string_incref(var521);
+string_decref(var522);
+var522.buf = NULL;
+var522 = oomph_string_concat(var520,var521);
+string_decref(var523);
+var523.buf = NULL;
+var523 = string10____afb2f97902; string_incref(var523);
+string_decref(var524);
+var524.buf = NULL;
+var524 = oomph_string_concat(var522,var523);
+meth_List_Str__43b70c06cb_push(var510,var524);
+if (oomph_true) goto label513;
+label515: (void)0;
+var525 = string37__37a398d8ea; string_incref(var525);
+var526 = meth_List_Str__43b70c06cb_join(var510,var525);
+var527 = var349->memb_members;
+incref(var527);
+var528 = ctor_List_Str__43b70c06cb();
+var529 = meth_List_Member__7525bf27e3_length(var527);
+meth_List_Str__43b70c06cb___reserve(var528,var529);
+var530 = 0LL;
+label531: (void)0;
+if (var530 >= var527->len) goto label533;
+decref((var532), dtor_Member_a3dd2b1b39); var532 = var527->data[var530++]; incref(var532);
+var534 = var532->memb_type;
+incref_Type_87e1ce5c5e(var534);
+string_decref(var535);
+var535.buf = NULL;
+decref__null___Type__8438ac3dcf(var536);
+var536.membernum = -1;
+var536 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var534 }, .membernum = 1 };
+var534.membernum = -1;
+var535 = meth_FilePair_99df852164_emit_type(var1,var536);
+string_decref(var537);
+var537.buf = NULL;
+var537 = string117__arg__b0c9cbb279; string_incref(var537);
+string_decref(var538);
+var538.buf = NULL;
+var538 = oomph_string_concat(var535,var537);
+string_decref(var539);
+var539.buf = NULL;
+var539 = var532->memb_name;
+string_incref(var539);
+string_decref(var540);
+var540.buf = NULL;
+var540 = oomph_string_concat(var538,var539);
+meth_List_Str__43b70c06cb_push(var528,var540);
+if (oomph_true) goto label531;
+label533: (void)0;
+var541 = string36___54a7aca889; string_incref(var541);
+var542 = meth_List_Str__43b70c06cb_join(var528,var541);
+var543 = string37__37a398d8ea; string_incref(var543);
+var544 = meth_Str_equals(var542,var543);
+if (var544) goto label545;
+if (oomph_true) goto label546;
+label545: (void)0;
+var547 = string1_void_23c41bd03f; string_incref(var547);
+string_decref(var542);
+var542 = var547;
+var547.buf = NULL;
+label546: (void)0;
+var548 = var349->memb_members;
+incref(var548);
+var549 = ctor_List_Str__43b70c06cb();
+var550 = meth_List_Member__7525bf27e3_length(var548);
+meth_List_Str__43b70c06cb___reserve(var549,var550);
+var551 = 0LL;
+label552: (void)0;
+if (var551 >= var548->len) goto label554;
+var553 = var548->data[var551++];
+string_decref(var555);
+var555.buf = NULL;
+var555 = string118_obj__memb__d08a0c2cf2; string_incref(var555);
+string_decref(var556);
+var556.buf = NULL;
+var556 = var553->memb_name;
+string_incref(var556);
+string_decref(var557);
+var557.buf = NULL;
+var557 = oomph_string_concat(var555,var556);
+string_decref(var558);
+var558.buf = NULL;
+var558 = string119____arg__b04d6fe191; string_incref(var558);
+string_decref(var559);
+var559.buf = NULL;
+var559 = oomph_string_concat(var557,var558);
+string_decref(var560);
+var560.buf = NULL;
+var560 = var553->memb_name;
+string_incref(var560);
+string_decref(var561);
+var561.buf = NULL;
+var561 = oomph_string_concat(var559,var560);
+string_decref(var562);
+var562.buf = NULL;
+var562 = string10____afb2f97902; string_incref(var562);
+string_decref(var563);
+var563.buf = NULL;
+var563 = oomph_string_concat(var561,var562);
+meth_List_Str__43b70c06cb_push(var549,var563);
+if (oomph_true) goto label552;
+label554: (void)0;
+var564 = string37__37a398d8ea; string_incref(var564);
+var565 = meth_List_Str__43b70c06cb_join(var549,var564);
+var566 = var349->memb_members;
+incref(var566);
+var567 = ctor_List_Str__43b70c06cb();
+var568 = meth_List_Member__7525bf27e3_length(var566);
+meth_List_Str__43b70c06cb___reserve(var567,var568);
+var569 = 0LL;
+label570: (void)0;
+if (var569 >= var566->len) goto label572;
+decref((var571), dtor_Member_a3dd2b1b39); var571 = var566->data[var569++]; incref(var571);
+decref((var573), dtor_Session_88204c75ff);
+var573 = NULL;
+var573 = var1->memb_session;
+incref(var573);
+string_decref(var574);
+var574.buf = NULL;
+var574 = string118_obj__memb__d08a0c2cf2; string_incref(var574);
+string_decref(var575);
+var575.buf = NULL;
+var575 = var571->memb_name;
+string_incref(var575);
+string_decref(var576);
+var576.buf = NULL;
+var576 = oomph_string_concat(var574,var575);
+decref_Type_87e1ce5c5e(var577);
+var577.membernum = -1;
+var577 = var571->memb_type;
+incref_Type_87e1ce5c5e(var577);
+string_decref(var578);
+var578.buf = NULL;
+var578 = meth_Session_88204c75ff_emit_incref(var573,var576,var577);
+string_decref(var579);
+var579.buf = NULL;
+var579 = string10____afb2f97902; string_incref(var579);
+string_decref(var580);
+var580.buf = NULL;
+var580 = oomph_string_concat(var578,var579);
+meth_List_Str__43b70c06cb_push(var567,var580);
+if (oomph_true) goto label570;
+label572: (void)0;
+var581 = string37__37a398d8ea; string_incref(var581);
+var582 = meth_List_Str__43b70c06cb_join(var567,var581);
+var583 = var349->memb_members;
+incref(var583);
+var584 = ctor_List_Str__43b70c06cb();
+var585 = meth_List_Member__7525bf27e3_length(var583);
+meth_List_Str__43b70c06cb___reserve(var584,var585);
+var586 = 0LL;
+label587: (void)0;
+if (var586 >= var583->len) goto label589;
+decref((var588), dtor_Member_a3dd2b1b39); var588 = var583->data[var586++]; incref(var588);
+decref((var590), dtor_Session_88204c75ff);
+var590 = NULL;
+var590 = var1->memb_session;
+incref(var590);
+string_decref(var591);
+var591.buf = NULL;
+var591 = string118_obj__memb__d08a0c2cf2; string_incref(var591);
+string_decref(var592);
+var592.buf = NULL;
+var592 = var588->memb_name;
+string_incref(var592);
+string_decref(var593);
+var593.buf = NULL;
+var593 = oomph_string_concat(var591,var592);
+decref_Type_87e1ce5c5e(var594);
+var594.membernum = -1;
+var594 = var588->memb_type;
+incref_Type_87e1ce5c5e(var594);
+string_decref(var595);
+var595.buf = NULL;
+var595 = meth_Session_88204c75ff_emit_decref(var590,var593,var594);
+string_decref(var596);
+var596.buf = NULL;
+var596 = string10____afb2f97902; string_incref(var596);
+string_decref(var597);
+var597.buf = NULL;
+var597 = oomph_string_concat(var595,var596);
+meth_List_Str__43b70c06cb_push(var584,var597);
+if (oomph_true) goto label587;
+label589: (void)0;
+var598 = string37__37a398d8ea; string_incref(var598);
+var599 = meth_List_Str__43b70c06cb_join(var584,var598);
+var600 = string120______________________struct_class__d1f94524ac; string_incref(var600);
+var601 = var1->memb_id;
+string_incref(var601);
+var602 = oomph_string_concat(var600,var601);
+var603 = string121____________________________REFCOUNT_HEADER__________________________7b92e580ec; string_incref(var603);
+var604 = oomph_string_concat(var602,var603);
+var605 = oomph_string_concat(var604,var526);
+var606 = string122______________________________________________1e13706db2; string_incref(var606);
+var607 = oomph_string_concat(var605,var606);
+var608 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var607 }, .membernum = 1 };
+var607.buf = NULL;
+var609 = var1->memb_struct;
+var1->memb_struct = var608;
+var608.membernum = -1;
+var610 = var1->memb_function_decls;
+string_incref(var610);
+var611 = string89_______________________8d540d53c1; string_incref(var611);
+var612 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var349 }, .membernum = 1 };
+incref(var349);
+var613 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var612 }, .membernum = 1 };
+var612.membernum = -1;
+var614 = meth_FilePair_99df852164_emit_type(var1,var613);
+var615 = oomph_string_concat(var611,var614);
+var616 = string123__ctor__56dbf44a4f; string_incref(var616);
+var617 = oomph_string_concat(var615,var616);
+var618 = var1->memb_id;
+string_incref(var618);
+var619 = oomph_string_concat(var617,var618);
+var620 = string38___074be16786; string_incref(var620);
+var621 = oomph_string_concat(var619,var620);
+var622 = oomph_string_concat(var621,var542);
+var623 = string124________________________void_dtor__9b0c4575da; string_incref(var623);
+var624 = oomph_string_concat(var622,var623);
+var625 = var1->memb_id;
+string_incref(var625);
+var626 = oomph_string_concat(var624,var625);
+var627 = string125__void__ptr________________________f305190e86; string_incref(var627);
+var628 = oomph_string_concat(var626,var627);
+var629 = oomph_string_concat(var610,var628);
+var630 = var1->memb_function_decls;
+var1->memb_function_decls = var629;
+var629.buf = NULL;
+var631 = var1->memb_function_defs;
+string_incref(var631);
+var632 = string89_______________________8d540d53c1; string_incref(var632);
+var633 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var349 }, .membernum = 1 };
+incref(var349);
+var634 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var633 }, .membernum = 1 };
+var633.membernum = -1;
+var635 = meth_FilePair_99df852164_emit_type(var1,var634);
+var636 = oomph_string_concat(var632,var635);
+var637 = string123__ctor__56dbf44a4f; string_incref(var637);
+var638 = oomph_string_concat(var636,var637);
+var639 = var1->memb_id;
+string_incref(var639);
+var640 = oomph_string_concat(var638,var639);
+var641 = string38___074be16786; string_incref(var641);
+var642 = oomph_string_concat(var640,var641);
+var643 = oomph_string_concat(var642,var542);
+var644 = string126__________________________________________________6760f78668; string_incref(var644);
+var645 = oomph_string_concat(var643,var644);
+var646 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var349 }, .membernum = 1 };
+incref(var349);
+var647 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var646 }, .membernum = 1 };
+var646.membernum = -1;
+var648 = meth_FilePair_99df852164_emit_type(var1,var647);
+var649 = oomph_string_concat(var645,var648);
+var650 = string127__obj___malloc_sizeof__obj____________________________assert_obj___________________________obj__refcount___1___________________________e648cd65d9; string_incref(var650);
+var651 = oomph_string_concat(var649,var650);
+var652 = oomph_string_concat(var651,var565);
+var653 = string128___________________________9ff0ba6c73; string_incref(var653);
+var654 = oomph_string_concat(var652,var653);
+var655 = oomph_string_concat(var654,var582);
+var656 = string129__________________________return_obj_____________________________________________void_dtor__0eb49930d4; string_incref(var656);
+var657 = oomph_string_concat(var655,var656);
+var658 = var1->memb_id;
+string_incref(var658);
+var659 = oomph_string_concat(var657,var658);
+var660 = string130__void__ptr________________________________________________struct_class__df8fb23161; string_incref(var660);
+var661 = oomph_string_concat(var659,var660);
+var662 = var1->memb_id;
+string_incref(var662);
+var663 = oomph_string_concat(var661,var662);
+var664 = string131___obj___ptr___________________________8c0875cfc2; string_incref(var664);
+var665 = oomph_string_concat(var663,var664);
+var666 = oomph_string_concat(var665,var599);
+var667 = string132__________________________free_obj______________________________________________c762b5a07b; string_incref(var667);
+var668 = oomph_string_concat(var666,var667);
+var669 = oomph_string_concat(var631,var668);
+var670 = var1->memb_function_defs;
+var1->memb_function_defs = var669;
+var669.buf = NULL;
+var671 = var349->memb_create_to_string_method;
+if (var671) goto label672;
+if (oomph_true) goto label673;
+label672: (void)0;
+var674 = var1->memb_function_decls;
+string_incref(var674);
+var675 = string133__________________________struct_class_Str_meth__ef78a1bee5; string_incref(var675);
+var676 = var1->memb_id;
+string_incref(var676);
+var677 = oomph_string_concat(var675,var676);
+var678 = string134__to_string__e55b86daa9; string_incref(var678);
+var679 = oomph_string_concat(var677,var678);
+var680 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var349 }, .membernum = 1 };
+incref(var349);
+var681 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var680 }, .membernum = 1 };
+var680.membernum = -1;
+var682 = meth_FilePair_99df852164_emit_type(var1,var681);
+var683 = oomph_string_concat(var679,var682);
+var684 = string135__obj____________________________7f9b736a41; string_incref(var684);
+var685 = oomph_string_concat(var683,var684);
+var686 = oomph_string_concat(var674,var685);
+var687 = var1->memb_function_decls;
+var1->memb_function_decls = var686;
+var686.buf = NULL;
+var688 = var349->memb_members;
+incref(var688);
+var689 = ctor_List_Str__43b70c06cb();
+var690 = meth_List_Member__7525bf27e3_length(var688);
+meth_List_Str__43b70c06cb___reserve(var689,var690);
+var691 = 0LL;
+label692: (void)0;
+if (var691 >= var688->len) goto label694;
+decref((var693), dtor_Member_a3dd2b1b39); var693 = var688->data[var691++]; incref(var693);
+string_decref(var695);
+var695.buf = NULL;
+var695 = string136__________________________________tmp___meth__de2e6b2828; string_incref(var695);
+decref((var696), dtor_Session_88204c75ff);
+var696 = NULL;
+var696 = var1->memb_session;
+incref(var696);
+decref_Type_87e1ce5c5e(var697);
+var697.membernum = -1;
+var697 = var693->memb_type;
+incref_Type_87e1ce5c5e(var697);
+string_decref(var698);
+var698.buf = NULL;
+var698 = meth_Session_88204c75ff_get_type_c_name(var696,var697);
+string_decref(var699);
+var699.buf = NULL;
+var699 = oomph_string_concat(var695,var698);
+string_decref(var700);
+var700.buf = NULL;
+var700 = string137__to_string_self__memb__efd769ce39; string_incref(var700);
+string_decref(var701);
+var701.buf = NULL;
+var701 = oomph_string_concat(var699,var700);
+string_decref(var702);
+var702.buf = NULL;
+var702 = var693->memb_name;
+string_incref(var702);
+string_decref(var703);
+var703.buf = NULL;
+var703 = oomph_string_concat(var701,var702);
+string_decref(var704);
+var704.buf = NULL;
+var704 = string138____________________________________oomph_string_concat_inplace__res__tmp___________________________________string_decref_tmp____________________________________7f935a5a13; string_incref(var704);
+string_decref(var705);
+var705.buf = NULL;
+var705 = oomph_string_concat(var703,var704);
+meth_List_Str__43b70c06cb_push(var689,var705);
+if (oomph_true) goto label692;
+label694: (void)0;
+var706 = string139_oomph_string_concat_inplace_cstr__res_________0d14eaacd2; string_incref(var706);
+var707 = meth_List_Str__43b70c06cb_join(var689,var706);
+var708 = var1->memb_function_defs;
+string_incref(var708);
+var709 = string133__________________________struct_class_Str_meth__ef78a1bee5; string_incref(var709);
+var710 = var1->memb_id;
+string_incref(var710);
+var711 = oomph_string_concat(var709,var710);
+var712 = string134__to_string__e55b86daa9; string_incref(var712);
+var713 = oomph_string_concat(var711,var712);
+var714 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var349 }, .membernum = 1 };
+incref(var349);
+var715 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var714 }, .membernum = 1 };
+var714.membernum = -1;
+var716 = meth_FilePair_99df852164_emit_type(var1,var715);
+var717 = oomph_string_concat(var713,var716);
+var718 = string140__self________________________________________________________struct_class_Str_res____1a2d4edce0; string_incref(var718);
+var719 = oomph_string_concat(var717,var718);
+var720 = var349->memb_name;
+string_incref(var720);
+var721 = meth_FilePair_99df852164_emit_string(var1,var720);
+var722 = oomph_string_concat(var719,var721);
+var723 = string141_______________________________struct_class_Str_tmp______________________________oomph_string_concat_inplace_cstr__res_____________________________________b8968be402; string_incref(var723);
+var724 = oomph_string_concat(var722,var723);
+var725 = oomph_string_concat(var724,var707);
+var726 = string142______________________________oomph_string_concat_inplace_cstr__res____________________________________return_res_____________________________________________________61f01882da; string_incref(var726);
+var727 = oomph_string_concat(var725,var726);
+var728 = oomph_string_concat(var708,var727);
+var729 = var1->memb_function_defs;
+var1->memb_function_defs = var728;
+var728.buf = NULL;
+label673: (void)0;
+label508: (void)0;
+label18: (void)0;
+out: (void)0;
+string_decref(var729);
+string_decref(var728);
+string_decref(var727);
+string_decref(var726);
+string_decref(var725);
+string_decref(var724);
+string_decref(var723);
+string_decref(var722);
+string_decref(var721);
+string_decref(var720);
+string_decref(var719);
+string_decref(var718);
+string_decref(var717);
+string_decref(var716);
+decref__null___Type__8438ac3dcf(var715);
+decref_Type_87e1ce5c5e(var714);
+string_decref(var713);
+string_decref(var712);
+string_decref(var711);
+string_decref(var710);
+string_decref(var709);
+string_decref(var708);
+string_decref(var707);
+string_decref(var706);
+string_decref(var705);
+string_decref(var704);
+string_decref(var703);
+string_decref(var702);
+string_decref(var701);
+string_decref(var700);
+string_decref(var699);
+string_decref(var698);
+decref_Type_87e1ce5c5e(var697);
+decref((var696), dtor_Session_88204c75ff);
+string_decref(var695);
+decref((var693), dtor_Member_a3dd2b1b39);
+(void)0;
+(void)0;
+decref((var689), dtor_List_Str__43b70c06cb);
+decref((var688), dtor_List_Member__7525bf27e3);
+string_decref(var687);
+string_decref(var686);
+string_decref(var685);
+string_decref(var684);
+string_decref(var683);
+string_decref(var682);
+decref__null___Type__8438ac3dcf(var681);
+decref_Type_87e1ce5c5e(var680);
+string_decref(var679);
+string_decref(var678);
+string_decref(var677);
+string_decref(var676);
+string_decref(var675);
+string_decref(var674);
+(void)0;
+string_decref(var670);
+string_decref(var669);
+string_decref(var668);
+string_decref(var667);
+string_decref(var666);
+string_decref(var665);
+string_decref(var664);
+string_decref(var663);
+string_decref(var662);
+string_decref(var661);
+string_decref(var660);
+string_decref(var659);
+string_decref(var658);
+string_decref(var657);
+string_decref(var656);
+string_decref(var655);
+string_decref(var654);
+string_decref(var653);
+string_decref(var652);
+string_decref(var651);
+string_decref(var650);
+string_decref(var649);
+string_decref(var648);
+decref__null___Type__8438ac3dcf(var647);
+decref_Type_87e1ce5c5e(var646);
+string_decref(var645);
+string_decref(var644);
+string_decref(var643);
+string_decref(var642);
+string_decref(var641);
+string_decref(var640);
+string_decref(var639);
+string_decref(var638);
+string_decref(var637);
+string_decref(var636);
+string_decref(var635);
+decref__null___Type__8438ac3dcf(var634);
+decref_Type_87e1ce5c5e(var633);
+string_decref(var632);
+string_decref(var631);
+string_decref(var630);
+string_decref(var629);
+string_decref(var628);
+string_decref(var627);
+string_decref(var626);
+string_decref(var625);
+string_decref(var624);
+string_decref(var623);
+string_decref(var622);
+string_decref(var621);
+string_decref(var620);
+string_decref(var619);
+string_decref(var618);
+string_decref(var617);
+string_decref(var616);
+string_decref(var615);
+string_decref(var614);
+decref__null___Type__8438ac3dcf(var613);
+decref_Type_87e1ce5c5e(var612);
+string_decref(var611);
+string_decref(var610);
+decref__null___Str__5eca9cec4f(var609);
+decref__null___Str__5eca9cec4f(var608);
+string_decref(var607);
+string_decref(var606);
+string_decref(var605);
+string_decref(var604);
+string_decref(var603);
+string_decref(var602);
+string_decref(var601);
+string_decref(var600);
+string_decref(var599);
+string_decref(var598);
+string_decref(var597);
+string_decref(var596);
+string_decref(var595);
+decref_Type_87e1ce5c5e(var594);
+string_decref(var593);
+string_decref(var592);
+string_decref(var591);
+decref((var590), dtor_Session_88204c75ff);
+decref((var588), dtor_Member_a3dd2b1b39);
+(void)0;
+(void)0;
+decref((var584), dtor_List_Str__43b70c06cb);
+decref((var583), dtor_List_Member__7525bf27e3);
+string_decref(var582);
+string_decref(var581);
+string_decref(var580);
+string_decref(var579);
+string_decref(var578);
+decref_Type_87e1ce5c5e(var577);
+string_decref(var576);
+string_decref(var575);
+string_decref(var574);
+decref((var573), dtor_Session_88204c75ff);
+decref((var571), dtor_Member_a3dd2b1b39);
+(void)0;
+(void)0;
+decref((var567), dtor_List_Str__43b70c06cb);
+decref((var566), dtor_List_Member__7525bf27e3);
+string_decref(var565);
+string_decref(var564);
+string_decref(var563);
+string_decref(var562);
+string_decref(var561);
+string_decref(var560);
+string_decref(var559);
+string_decref(var558);
+string_decref(var557);
+string_decref(var556);
+string_decref(var555);
+(void)0;
+(void)0;
+decref((var549), dtor_List_Str__43b70c06cb);
+decref((var548), dtor_List_Member__7525bf27e3);
+string_decref(var547);
+(void)0;
+string_decref(var543);
+string_decref(var542);
+string_decref(var541);
+string_decref(var540);
+string_decref(var539);
+string_decref(var538);
+string_decref(var537);
+decref__null___Type__8438ac3dcf(var536);
+string_decref(var535);
+decref_Type_87e1ce5c5e(var534);
+decref((var532), dtor_Member_a3dd2b1b39);
+(void)0;
+(void)0;
+decref((var528), dtor_List_Str__43b70c06cb);
+decref((var527), dtor_List_Member__7525bf27e3);
+string_decref(var526);
+string_decref(var525);
+string_decref(var524);
+string_decref(var523);
+string_decref(var522);
+string_decref(var521);
+string_decref(var520);
+string_decref(var519);
+decref__null___Type__8438ac3dcf(var518);
+string_decref(var517);
+decref_Type_87e1ce5c5e(var516);
+decref((var514), dtor_Member_a3dd2b1b39);
+(void)0;
+(void)0;
+decref((var510), dtor_List_Str__43b70c06cb);
+decref((var509), dtor_List_Member__7525bf27e3);
+string_decref(var507);
+string_decref(var506);
+string_decref(var505);
+string_decref(var504);
+string_decref(var503);
+string_decref(var502);
+string_decref(var501);
+string_decref(var500);
+string_decref(var499);
+string_decref(var498);
+string_decref(var497);
+string_decref(var496);
+string_decref(var495);
+decref__null___Str__5eca9cec4f(var494);
+decref__null___List_Str___1b0213dad9(var493);
+(void)0;
+(void)0;
+decref((var490), dtor_FunctionType_4e16d0ea53);
+string_decref(var489);
+string_decref(var488);
+string_decref(var487);
+string_decref(var486);
+string_decref(var485);
+decref_Type_87e1ce5c5e(var484);
+string_decref(var483);
+decref((var482), dtor_Session_88204c75ff);
+string_decref(var481);
+decref((var479), dtor_Method_bfbd73ad15);
+(void)0;
+decref((var476), dtor_List_Method__1e0ab9c757);
+decref_Type_87e1ce5c5e(var475);
+decref((var474), dtor_Builtins_bd980a9f08);
+decref((var473), dtor_Session_88204c75ff);
+decref__null___Str__5eca9cec4f(var472);
+decref__null___Str__5eca9cec4f(var471);
+string_decref(var470);
+string_decref(var469);
+string_decref(var468);
+string_decref(var467);
+string_decref(var466);
+string_decref(var465);
+string_decref(var464);
+string_decref(var463);
+string_decref(var462);
+string_decref(var461);
+string_decref(var460);
+string_decref(var459);
+string_decref(var458);
+string_decref(var457);
+string_decref(var456);
+string_decref(var455);
+string_decref(var454);
+string_decref(var453);
+string_decref(var452);
+string_decref(var451);
+decref((var450), dtor_List_Str__43b70c06cb);
+string_decref(var449);
+string_decref(var448);
+(void)0;
+string_decref(var443);
+string_decref(var442);
+decref((var441), dtor_List_Str__43b70c06cb);
+string_decref(var440);
+string_decref(var439);
+decref((var437), dtor_List_Str__43b70c06cb);
+string_decref(var436);
+string_decref(var435);
+(void)0;
+decref_Type_87e1ce5c5e(var432);
+decref((var431), dtor_Builtins_bd980a9f08);
+decref((var430), dtor_Session_88204c75ff);
+decref((var429), dtor_List_List_Str___637f5f7ec1);
+decref((var428), dtor_List_Str__43b70c06cb);
+string_decref(var427);
+string_decref(var426);
+decref((var425), dtor_Session_88204c75ff);
+string_decref(var424);
+decref((var423), dtor_List_Str__43b70c06cb);
+string_decref(var422);
+string_decref(var421);
+decref((var420), dtor_Session_88204c75ff);
+string_decref(var419);
+decref((var418), dtor_List_Str__43b70c06cb);
+string_decref(var417);
+string_decref(var416);
+string_decref(var415);
+string_decref(var414);
+decref((var413), dtor_Session_88204c75ff);
+string_decref(var412);
+string_decref(var411);
+decref((var410), dtor_List_Str__43b70c06cb);
+string_decref(var409);
+decref__null___Type__8438ac3dcf(var408);
+(void)0;
+string_decref(var406);
+decref((var405), dtor_List_Str__43b70c06cb);
+string_decref(var404);
+string_decref(var403);
+string_decref(var402);
+string_decref(var401);
+decref_Type_87e1ce5c5e(var400);
+decref((var399), dtor_Session_88204c75ff);
+string_decref(var398);
+string_decref(var397);
+decref((var396), dtor_List_Str__43b70c06cb);
+string_decref(var395);
+string_decref(var394);
+decref_Type_87e1ce5c5e(var393);
+decref((var392), dtor_Session_88204c75ff);
+string_decref(var391);
+string_decref(var390);
+decref((var389), dtor_List_Str__43b70c06cb);
+string_decref(var388);
+string_decref(var387);
+string_decref(var386);
+string_decref(var385);
+decref_Type_87e1ce5c5e(var384);
+decref((var383), dtor_Session_88204c75ff);
+string_decref(var382);
+string_decref(var381);
+decref((var380), dtor_List_Str__43b70c06cb);
+string_decref(var379);
+string_decref(var378);
+decref_Type_87e1ce5c5e(var377);
+decref((var376), dtor_Session_88204c75ff);
+string_decref(var375);
+string_decref(var374);
+decref((var373), dtor_List_Str__43b70c06cb);
+string_decref(var372);
+string_decref(var371);
+decref_Type_87e1ce5c5e(var370);
+decref((var369), dtor_Session_88204c75ff);
+string_decref(var368);
+string_decref(var367);
+decref_Type_87e1ce5c5e(var366);
+decref((var365), dtor_GenericSource_35cfcd932e);
+decref__null___GenericSource__4440b6073d(var364);
+(void)0;
+string_decref(var362);
+(void)0;
+decref((var360), dtor_Generic_c39b95ec73);
+decref((var359), dtor_Builtins_bd980a9f08);
+decref((var358), dtor_Session_88204c75ff);
+decref((var357), dtor_Generic_c39b95ec73);
+decref((var356), dtor_GenericSource_35cfcd932e);
+decref__null___GenericSource__4440b6073d(var355);
+(void)0;
+decref__null___GenericSource__4440b6073d(var352);
+(void)0;
+decref__null___GenericSource__4440b6073d(var350);
+decref((var349), dtor_BasicType_899b9c9f8e);
+string_decref(var348);
+string_decref(var347);
+string_decref(var346);
+string_decref(var345);
+string_decref(var344);
+string_decref(var343);
+string_decref(var342);
+decref((var341), dtor_Session_88204c75ff);
+string_decref(var340);
+string_decref(var339);
+string_decref(var338);
+string_decref(var337);
+string_decref(var336);
+string_decref(var335);
+string_decref(var334);
+string_decref(var333);
+string_decref(var332);
+string_decref(var331);
+string_decref(var330);
+string_decref(var329);
+string_decref(var328);
+string_decref(var327);
+string_decref(var326);
+string_decref(var325);
+string_decref(var324);
+string_decref(var323);
+string_decref(var322);
+string_decref(var321);
+string_decref(var320);
+string_decref(var319);
+string_decref(var318);
+string_decref(var317);
+string_decref(var316);
+string_decref(var315);
+string_decref(var314);
+decref__null___Type__8438ac3dcf(var313);
+decref_Type_87e1ce5c5e(var312);
+decref((var311), dtor_List_Type__057f9c6088);
+(void)0;
+decref_Type_87e1ce5c5e(var307);
+decref((var306), dtor_Builtins_bd980a9f08);
+decref((var305), dtor_Session_88204c75ff);
+decref_Type_87e1ce5c5e(var304);
+decref((var303), dtor_List_Type__057f9c6088);
+(void)0;
+(void)0;
+(void)0;
+decref__null___Str__5eca9cec4f(var297);
+decref__null___Str__5eca9cec4f(var296);
+string_decref(var295);
+string_decref(var294);
+string_decref(var293);
+string_decref(var292);
+string_decref(var291);
+string_decref(var290);
+string_decref(var289);
+string_decref(var288);
+string_decref(var287);
+string_decref(var286);
+(void)0;
+(void)0;
+string_decref(var283);
+string_decref(var282);
+string_decref(var281);
+string_decref(var280);
+string_decref(var279);
+string_decref(var278);
+decref__null___Type__8438ac3dcf(var277);
+string_decref(var276);
+decref_Type_87e1ce5c5e(var275);
+decref((var274), dtor_List_Type__057f9c6088);
+(void)0;
+(void)0;
+(void)0;
+decref((var268), dtor_List_Str__43b70c06cb);
+string_decref(var267);
+string_decref(var266);
+string_decref(var265);
+string_decref(var264);
+string_decref(var263);
+string_decref(var262);
+string_decref(var261);
+string_decref(var260);
+string_decref(var259);
+string_decref(var258);
+string_decref(var257);
+string_decref(var256);
+string_decref(var255);
+string_decref(var254);
+string_decref(var253);
+string_decref(var252);
+string_decref(var251);
+string_decref(var250);
+string_decref(var249);
+string_decref(var248);
+string_decref(var247);
+string_decref(var246);
+string_decref(var245);
+string_decref(var244);
+string_decref(var243);
+string_decref(var242);
+string_decref(var241);
+string_decref(var240);
+string_decref(var239);
+string_decref(var238);
+string_decref(var237);
+string_decref(var236);
+string_decref(var235);
+string_decref(var234);
+string_decref(var233);
+string_decref(var232);
+string_decref(var231);
+string_decref(var230);
+string_decref(var229);
+string_decref(var228);
+string_decref(var227);
+string_decref(var226);
+string_decref(var225);
+string_decref(var224);
+string_decref(var223);
+string_decref(var222);
+string_decref(var221);
+string_decref(var220);
+(void)0;
+(void)0;
+string_decref(var217);
+string_decref(var216);
+string_decref(var215);
+string_decref(var214);
+string_decref(var213);
+string_decref(var212);
+string_decref(var211);
+string_decref(var210);
+string_decref(var209);
+(void)0;
+(void)0;
+(void)0;
+decref((var203), dtor_List_Str__43b70c06cb);
+string_decref(var202);
+string_decref(var201);
+(void)0;
+(void)0;
+string_decref(var198);
+string_decref(var197);
+string_decref(var196);
+string_decref(var195);
+string_decref(var194);
+string_decref(var193);
+string_decref(var192);
+string_decref(var191);
+string_decref(var190);
+(void)0;
+(void)0;
+(void)0;
+decref((var184), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+string_decref(var181);
+decref_Type_87e1ce5c5e(var180);
+decref((var179), dtor_List_Type__057f9c6088);
+string_decref(var178);
+string_decref(var177);
+string_decref(var176);
+decref((var175), dtor_Session_88204c75ff);
+(void)0;
+(void)0;
+(void)0;
+decref((var169), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+string_decref(var166);
+decref_Type_87e1ce5c5e(var165);
+decref((var164), dtor_List_Type__057f9c6088);
+string_decref(var163);
+string_decref(var162);
+string_decref(var161);
+decref((var160), dtor_Session_88204c75ff);
+(void)0;
+(void)0;
+(void)0;
+decref((var154), dtor_List_Str__43b70c06cb);
+string_decref(var153);
+string_decref(var152);
+string_decref(var151);
+string_decref(var150);
+string_decref(var149);
+string_decref(var148);
+string_decref(var147);
+string_decref(var146);
+string_decref(var145);
+string_decref(var144);
+string_decref(var143);
+string_decref(var142);
+string_decref(var141);
+string_decref(var140);
+string_decref(var139);
+string_decref(var138);
+string_decref(var137);
+string_decref(var136);
+string_decref(var135);
+string_decref(var134);
+string_decref(var133);
+string_decref(var132);
+string_decref(var131);
+string_decref(var130);
+string_decref(var129);
+decref_Type_87e1ce5c5e(var128);
+string_decref(var127);
+string_decref(var126);
+string_decref(var125);
+string_decref(var124);
+string_decref(var123);
+string_decref(var122);
+string_decref(var121);
+string_decref(var120);
+string_decref(var119);
+string_decref(var118);
+string_decref(var117);
+string_decref(var116);
+string_decref(var115);
+string_decref(var114);
+string_decref(var113);
+string_decref(var112);
+string_decref(var111);
+string_decref(var110);
+decref_Type_87e1ce5c5e(var109);
+string_decref(var108);
+string_decref(var107);
+string_decref(var106);
+string_decref(var105);
+string_decref(var104);
+string_decref(var103);
+string_decref(var102);
+string_decref(var101);
+string_decref(var100);
+string_decref(var99);
+string_decref(var98);
+string_decref(var97);
+string_decref(var96);
+string_decref(var95);
+string_decref(var94);
+string_decref(var93);
+string_decref(var92);
+string_decref(var91);
+string_decref(var90);
+string_decref(var89);
+string_decref(var88);
+string_decref(var87);
+string_decref(var86);
+string_decref(var85);
+string_decref(var84);
+string_decref(var83);
+(void)0;
+(void)0;
+string_decref(var80);
+string_decref(var79);
+string_decref(var78);
+string_decref(var77);
+string_decref(var76);
+string_decref(var75);
+string_decref(var74);
+string_decref(var73);
+string_decref(var72);
+string_decref(var71);
+string_decref(var70);
+string_decref(var69);
+string_decref(var68);
+string_decref(var67);
+string_decref(var66);
+string_decref(var65);
+string_decref(var64);
+(void)0;
+(void)0;
+(void)0;
+decref((var58), dtor_List_Str__43b70c06cb);
+string_decref(var57);
+string_decref(var56);
+(void)0;
+(void)0;
+string_decref(var53);
+string_decref(var52);
+string_decref(var51);
+string_decref(var50);
+string_decref(var49);
+string_decref(var48);
+string_decref(var47);
+string_decref(var46);
+string_decref(var45);
+string_decref(var44);
+string_decref(var43);
+string_decref(var42);
+string_decref(var41);
+(void)0;
+(void)0;
+(void)0;
+decref((var35), dtor_List_Str__43b70c06cb);
+string_decref(var34);
+decref((var33), dtor_Session_88204c75ff);
+decref_Type_87e1ce5c5e(var31);
+(void)0;
+(void)0;
+decref((var27), dtor_List_Str__43b70c06cb);
+decref((var26), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var24), dtor_List_Type__057f9c6088);
+decref((var23), dtor_UnionType_7f899bced1);
+(void)0;
+string_decref(var21);
+(void)0;
+decref((var19), dtor_FunctionType_4e16d0ea53);
+(void)0;
+string_decref(var16);
+(void)0;
+decref((var14), dtor_AutoType_33a5d572cb);
+(void)0;
+(void)0;
+string_decref(var7);
+(void)0;
+decref__null___Str__5eca9cec4f(var5);
+(void)0;
+decref__null___Str__5eca9cec4f(var3);
+}void meth_FilePair_99df852164_emit_toplevel_declaration(struct class_FilePair_99df852164* var1, struct class_ToplevelDeclaration_5505a52ad0 var2){bool var3;
+struct class_FuncDef_2bd6886a53* var6;
+var6 = NULL;
+struct class_List_LocalVariable__81e23234f3* var7;
+var7 = NULL;
+struct class_List_GotoLabel__152f526689* var8;
+var8 = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var11;
+var11 = NULL;
+struct class_FunctionEmitter_34815fc0d7* var12;
+var12 = NULL;
+struct class_FileVariable_a7b8ca651f* var13;
+var13 = NULL;
+struct class_Variable_1aaa81c8d2 var14;
+var14.membernum = -1;
+struct class_Str var15;
+var15.buf = NULL;
+struct class__FuncDef___MethodDef__5505a52ad0 var16;
+var16.membernum = -1;
+struct class_MethodDef_28b65923b5* var18;
+var18 = NULL;
+struct class_FunctionType_4e16d0ea53* var19;
+var19 = NULL;
+struct class_List_Type__057f9c6088* var20;
+var20 = NULL;
+struct class_Type_87e1ce5c5e var21;
+var21.membernum = -1;
+struct class_Session_88204c75ff* var22;
+var22 = NULL;
+struct class_FilePair_99df852164* var23;
+var23 = NULL;
+struct class_List_LocalVariable__81e23234f3* var24;
+var24 = NULL;
+struct class_List_GotoLabel__152f526689* var25;
+var25 = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var28;
+var28 = NULL;
+struct class_FunctionEmitter_34815fc0d7* var29;
+var29 = NULL;
+struct class_Str var30;
+var30.buf = NULL;
+struct class_Session_88204c75ff* var31;
+var31 = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+struct class_Str var37;
+var37.buf = NULL;
+struct class__FuncDef___MethodDef__5505a52ad0 var38;
+var38.membernum = -1;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) goto label4;
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) goto label5;
+label4: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var6 = var2.val.item0;
+            incref(var6);
+var7 = ctor_List_LocalVariable__81e23234f3();
+var8 = ctor_List_GotoLabel__152f526689();
+var9 = string37__37a398d8ea; string_incref(var9);
+var10 = string37__37a398d8ea; string_incref(var10);
+var11 = ctor_List_LocalVariable__81e23234f3();
+var12 = ctor_FunctionEmitter_34815fc0d7(var1,var7,var8,var9,var10,var11);
+var13 = var6->memb_var;
+incref(var13);
+var14 = (struct class_Variable_1aaa81c8d2){ .val = { .item1 = var13 }, .membernum = 1 };
+var13 = NULL;
+var15 = meth_FilePair_99df852164_emit_var(var1,var14);
+var16 = (struct class__FuncDef___MethodDef__5505a52ad0){ .val = { .item0 = var6 }, .membernum = 0 };
+var6 = NULL;
+meth_FunctionEmitter_34815fc0d7_emit_funcdef(var12,var16,var15);
+if (oomph_true) goto label17;
+label5: (void)0;
+
+            if (var2.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var18 = var2.val.item1;
+            incref(var18);
+var19 = var18->memb_type;
+var20 = var19->memb_argtypes;
+var19 = NULL;
+incref(var20);
+var21 = meth_List_Type__057f9c6088_first(var20);
+var22 = var1->memb_session;
+incref(var22);
+var23 = meth_Session_88204c75ff_type_to_file_pair(var22,var21);
+var24 = ctor_List_LocalVariable__81e23234f3();
+var25 = ctor_List_GotoLabel__152f526689();
+var26 = string37__37a398d8ea; string_incref(var26);
+var27 = string37__37a398d8ea; string_incref(var27);
+var28 = ctor_List_LocalVariable__81e23234f3();
+var29 = ctor_FunctionEmitter_34815fc0d7(var23,var24,var25,var26,var27,var28);
+var30 = string33_meth__037d88e79e; string_incref(var30);
+var31 = var1->memb_session;
+incref(var31);
+var32 = meth_Session_88204c75ff_get_type_c_name(var31,var21);
+var33 = oomph_string_concat(var30,var32);
+var34 = string34___3dd6dc5c14; string_incref(var34);
+var35 = oomph_string_concat(var33,var34);
+var36 = var18->memb_name;
+string_incref(var36);
+var37 = oomph_string_concat(var35,var36);
+var38 = (struct class__FuncDef___MethodDef__5505a52ad0){ .val = { .item1 = var18 }, .membernum = 1 };
+var18 = NULL;
+meth_FunctionEmitter_34815fc0d7_emit_funcdef(var29,var38,var37);
+label17: (void)0;
+out: (void)0;
+decref__FuncDef___MethodDef__5505a52ad0(var38);
+string_decref(var37);
+string_decref(var36);
+string_decref(var35);
+string_decref(var34);
+string_decref(var33);
+string_decref(var32);
+decref((var31), dtor_Session_88204c75ff);
+string_decref(var30);
+decref((var29), dtor_FunctionEmitter_34815fc0d7);
+decref((var28), dtor_List_LocalVariable__81e23234f3);
+string_decref(var27);
+string_decref(var26);
+decref((var25), dtor_List_GotoLabel__152f526689);
+decref((var24), dtor_List_LocalVariable__81e23234f3);
+decref((var23), dtor_FilePair_99df852164);
+decref((var22), dtor_Session_88204c75ff);
+decref_Type_87e1ce5c5e(var21);
+decref((var20), dtor_List_Type__057f9c6088);
+decref((var19), dtor_FunctionType_4e16d0ea53);
+decref((var18), dtor_MethodDef_28b65923b5);
+decref__FuncDef___MethodDef__5505a52ad0(var16);
+string_decref(var15);
+decref_Variable_1aaa81c8d2(var14);
+decref((var13), dtor_FileVariable_a7b8ca651f);
+decref((var12), dtor_FunctionEmitter_34815fc0d7);
+decref((var11), dtor_List_LocalVariable__81e23234f3);
+string_decref(var10);
+string_decref(var9);
+decref((var8), dtor_List_GotoLabel__152f526689);
+decref((var7), dtor_List_LocalVariable__81e23234f3);
+decref((var6), dtor_FuncDef_2bd6886a53);
+(void)0;
+}
@@ -0,0 +1,202 @@
+
+                #ifndef HEADER_GUARD_FilePair_99df852164
+                #define HEADER_GUARD_FilePair_99df852164
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "SymbolValue_b2eed984e4.h"
+#include "ToplevelDeclaration_5505a52ad0.h"
+#include "Type_87e1ce5c5e.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_FuncDef___MethodDef__5505a52ad0.h"
+#include "_Type___Str__e7feb8bffc.h"
+#include "_null___GenericSource__4440b6073d.h"
+#include "_null___List_Str___1b0213dad9.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "_null___Type__8438ac3dcf.h"
+#include "bundle_io_45f5b8a585.h"
+#include "c_output_6a23cf54cc.h"
+#include "ir_4b1a3e0393.h"
+struct class_Session_88204c75ff;
+struct class_List_Str__43b70c06cb;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_FilePair__2b6998ab5b;
+struct class_Session_88204c75ff;
+struct class_List_Str__43b70c06cb;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_FilePair__2b6998ab5b;
+struct class_AutoType_33a5d572cb;
+struct class_Session_88204c75ff;
+struct class_Builtins_bd980a9f08;
+struct class_Session_88204c75ff;
+struct class_Builtins_bd980a9f08;
+struct class_Session_88204c75ff;
+struct class_Builtins_bd980a9f08;
+struct class_Session_88204c75ff;
+struct class_Builtins_bd980a9f08;
+struct class_Session_88204c75ff;
+struct class_Builtins_bd980a9f08;
+struct class_Session_88204c75ff;
+struct class_UnionType_7f899bced1;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_FilePair__2b6998ab5b;
+struct class_LocalVariable_846080e5ae;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_FileVariable_a7b8ca651f;
+struct class_Session_88204c75ff;
+struct class_List_Symbol__9a01330177;
+struct class_Symbol_037dd39afd;
+struct class_Session_88204c75ff;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_Str__43b70c06cb;
+struct class_List_Type__057f9c6088;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Type__057f9c6088;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Int__df8a64abf3;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Int__df8a64abf3;
+struct class_AutoType_33a5d572cb;
+struct class_FunctionType_4e16d0ea53;
+struct class_UnionType_7f899bced1;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_List_Str__43b70c06cb;
+struct class_Session_88204c75ff;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_Session_88204c75ff;
+struct class_List_Type__057f9c6088;
+struct class_List_Str__43b70c06cb;
+struct class_Session_88204c75ff;
+struct class_List_Type__057f9c6088;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_Session_88204c75ff;
+struct class_Builtins_bd980a9f08;
+struct class_List_Type__057f9c6088;
+struct class_Session_88204c75ff;
+struct class_BasicType_899b9c9f8e;
+struct class_GenericSource_35cfcd932e;
+struct class_Generic_c39b95ec73;
+struct class_Session_88204c75ff;
+struct class_Builtins_bd980a9f08;
+struct class_Generic_c39b95ec73;
+struct class_GenericSource_35cfcd932e;
+struct class_Session_88204c75ff;
+struct class_List_Str__43b70c06cb;
+struct class_Session_88204c75ff;
+struct class_List_Str__43b70c06cb;
+struct class_Session_88204c75ff;
+struct class_List_Str__43b70c06cb;
+struct class_Session_88204c75ff;
+struct class_List_Str__43b70c06cb;
+struct class_Session_88204c75ff;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_Session_88204c75ff;
+struct class_List_Str__43b70c06cb;
+struct class_Session_88204c75ff;
+struct class_List_Str__43b70c06cb;
+struct class_Session_88204c75ff;
+struct class_List_Str__43b70c06cb;
+struct class_List_List_Str___637f5f7ec1;
+struct class_Session_88204c75ff;
+struct class_Builtins_bd980a9f08;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_Session_88204c75ff;
+struct class_Builtins_bd980a9f08;
+struct class_List_Method__1e0ab9c757;
+struct class_Method_bfbd73ad15;
+struct class_Session_88204c75ff;
+struct class_FunctionType_4e16d0ea53;
+struct class_List_Member__7525bf27e3;
+struct class_List_Str__43b70c06cb;
+struct class_Member_a3dd2b1b39;
+struct class_List_Member__7525bf27e3;
+struct class_List_Str__43b70c06cb;
+struct class_Member_a3dd2b1b39;
+struct class_List_Member__7525bf27e3;
+struct class_List_Str__43b70c06cb;
+struct class_Member_a3dd2b1b39;
+struct class_List_Member__7525bf27e3;
+struct class_List_Str__43b70c06cb;
+struct class_Member_a3dd2b1b39;
+struct class_Session_88204c75ff;
+struct class_List_Member__7525bf27e3;
+struct class_List_Str__43b70c06cb;
+struct class_Member_a3dd2b1b39;
+struct class_Session_88204c75ff;
+struct class_List_Member__7525bf27e3;
+struct class_List_Str__43b70c06cb;
+struct class_Member_a3dd2b1b39;
+struct class_Session_88204c75ff;
+struct class_FuncDef_2bd6886a53;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_GotoLabel__152f526689;
+struct class_List_LocalVariable__81e23234f3;
+struct class_FunctionEmitter_34815fc0d7;
+struct class_FileVariable_a7b8ca651f;
+struct class_MethodDef_28b65923b5;
+struct class_FunctionType_4e16d0ea53;
+struct class_List_Type__057f9c6088;
+struct class_Session_88204c75ff;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_GotoLabel__152f526689;
+struct class_List_LocalVariable__81e23234f3;
+struct class_FunctionEmitter_34815fc0d7;
+struct class_Session_88204c75ff;
+
+            struct class_FilePair_99df852164 {
+                REFCOUNT_HEADER
+                struct class_Session_88204c75ff* memb_session;
+struct class_Str memb_id;
+struct class__Type___Str__e7feb8bffc memb_type_or_source_path;
+struct class_List_Str__43b70c06cb* memb_strings;
+struct class__null___Str__5eca9cec4f memb_struct;
+struct class_Str memb_string_defs;
+struct class_Str memb_function_decls;
+struct class_Str memb_function_defs;
+struct class_List_FilePair__2b6998ab5b* memb_c_includes;
+struct class_List_FilePair__2b6998ab5b* memb_h_includes;
+struct class_Str memb_h_fwd_decls;
+
+            };
+            
+            struct class_FilePair_99df852164* ctor_FilePair_99df852164(struct class_Session_88204c75ff* arg_session,struct class_Str arg_id,struct class__Type___Str__e7feb8bffc arg_type_or_source_path,struct class_List_Str__43b70c06cb* arg_strings,struct class__null___Str__5eca9cec4f arg_struct,struct class_Str arg_string_defs,struct class_Str arg_function_decls,struct class_Str arg_function_defs,struct class_List_FilePair__2b6998ab5b* arg_c_includes,struct class_List_FilePair__2b6998ab5b* arg_h_includes,struct class_Str arg_h_fwd_decls);
+            void dtor_FilePair_99df852164(void *ptr);
+            
+                struct class_Str meth_FilePair_99df852164_to_string(struct class_FilePair_99df852164* obj);
+                bool meth_FilePair_99df852164_equals(struct class_FilePair_99df852164* var1, struct class_FilePair_99df852164* var2);
+struct class_Str meth_FilePair_99df852164_emit_type(struct class_FilePair_99df852164* var1, struct class__null___Type__8438ac3dcf var2);
+struct class_Str meth_FilePair_99df852164_emit_type_custom(struct class_FilePair_99df852164* var1, struct class__null___Type__8438ac3dcf var2, bool var3);
+struct class_Str meth_FilePair_99df852164_emit_var(struct class_FilePair_99df852164* var1, struct class_Variable_1aaa81c8d2 var2);
+void meth_FilePair_99df852164_define_function(struct class_FilePair_99df852164* var1, struct class_Str var2, struct class_FunctionType_4e16d0ea53* var3, struct class__null___List_Str___1b0213dad9 var4, struct class__null___Str__5eca9cec4f var5);
+struct class_Str meth_FilePair_99df852164_emit_string(struct class_FilePair_99df852164* var1, struct class_Str var2);
+void meth_FilePair_99df852164_define_type(struct class_FilePair_99df852164* var1, struct class_Type_87e1ce5c5e var2);
+void meth_FilePair_99df852164_emit_toplevel_declaration(struct class_FilePair_99df852164* var1, struct class_ToplevelDeclaration_5505a52ad0 var2);
+
+                #endif
+                
@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_FileVariable_a7b8ca651f
+                #define HEADER_GUARD_FileVariable_a7b8ca651f
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+
+            struct class_FileVariable_a7b8ca651f {
+                REFCOUNT_HEADER
+                struct class_Str memb_name;
+struct class_Type_87e1ce5c5e memb_type;
+
+            };
+            
+            struct class_FileVariable_a7b8ca651f* ctor_FileVariable_a7b8ca651f(struct class_Str arg_name,struct class_Type_87e1ce5c5e arg_type);
+            void dtor_FileVariable_a7b8ca651f(void *ptr);
+            
+                struct class_Str meth_FileVariable_a7b8ca651f_to_string(struct class_FileVariable_a7b8ca651f* obj);
+                bool meth_FileVariable_a7b8ca651f_equals(struct class_FileVariable_a7b8ca651f* var1, struct class_FileVariable_a7b8ca651f* var2);
+
+                #endif
+                
@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "FloatConstant_4759845694.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_FloatConstant_44f3fcb030_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6c', '\x6f', '\x61', '\x74', '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x61', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string0_FloatConstant_44f3fcb030 = {
+                .buf = &string0_FloatConstant_44f3fcb030_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            struct class_FloatConstant_4759845694* ctor_FloatConstant_4759845694(struct class_Location_500c4434c9* arg_location,struct class_Str arg_value)
+            {
+                struct class_FloatConstant_4759845694* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_value = arg_value;
+
+                incref(arg_location);
+string_incref(arg_value);
+
+                return obj;
+            }
+
+            void dtor_FloatConstant_4759845694(void *ptr)
+            {
+                struct class_FloatConstant_4759845694 *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+string_decref(obj->memb_value);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_FloatConstant_4759845694_to_string(struct class_FloatConstant_4759845694* self)
+                {
+                    struct class_Str res = string0_FloatConstant_44f3fcb030;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_FloatConstant_4759845694_equals(struct class_FloatConstant_4759845694* var1, struct class_FloatConstant_4759845694* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
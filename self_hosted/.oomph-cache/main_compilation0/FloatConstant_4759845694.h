@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_FloatConstant_4759845694
+                #define HEADER_GUARD_FloatConstant_4759845694
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_FloatConstant_4759845694 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Str memb_value;
+
+            };
+            
+            struct class_FloatConstant_4759845694* ctor_FloatConstant_4759845694(struct class_Location_500c4434c9* arg_location,struct class_Str arg_value);
+            void dtor_FloatConstant_4759845694(void *ptr);
+            
+                struct class_Str meth_FloatConstant_4759845694_to_string(struct class_FloatConstant_4759845694* obj);
+                bool meth_FloatConstant_4759845694_equals(struct class_FloatConstant_4759845694* var1, struct class_FloatConstant_4759845694* var2);
+
+                #endif
+                
@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_FloatConstant_652a176e04
+                #define HEADER_GUARD_FloatConstant_652a176e04
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+
+            struct class_FloatConstant_652a176e04 {
+                REFCOUNT_HEADER
+                struct class_Str memb_value;
+struct class_LocalVariable_846080e5ae* memb_var;
+
+            };
+            
+            struct class_FloatConstant_652a176e04* ctor_FloatConstant_652a176e04(struct class_Str arg_value,struct class_LocalVariable_846080e5ae* arg_var);
+            void dtor_FloatConstant_652a176e04(void *ptr);
+            
+                struct class_Str meth_FloatConstant_652a176e04_to_string(struct class_FloatConstant_652a176e04* obj);
+                bool meth_FloatConstant_652a176e04_equals(struct class_FloatConstant_652a176e04* var1, struct class_FloatConstant_652a176e04* var2);
+
+                #endif
+                
@@ -0,0 +1,80 @@
+#include <lib/oomph.h>
+#include "ForLoopHeader_79606b2adb.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Statement__5d7503c104.h"
+#include "Location_500c4434c9.h"
+#include "_null___Expression__957e7d6409.h"
+
+            static struct StringBuf string0_ForLoopHeader_028e9ad9d5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x72', '\x4c', '\x6f', '\x6f', '\x70', '\x48', '\x65', '\x61', '\x64', '\x65', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_ForLoopHeader_028e9ad9d5 = {
+                .buf = &string0_ForLoopHeader_028e9ad9d5_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            struct class_ForLoopHeader_79606b2adb* ctor_ForLoopHeader_79606b2adb(struct class_Location_500c4434c9* arg_keyword_location,struct class_List_Statement__5d7503c104* arg_init,struct class__null___Expression__957e7d6409 arg_cond,struct class_List_Statement__5d7503c104* arg_incr)
+            {
+                struct class_ForLoopHeader_79606b2adb* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_keyword_location = arg_keyword_location;
+obj->memb_init = arg_init;
+obj->memb_cond = arg_cond;
+obj->memb_incr = arg_incr;
+
+                incref(arg_keyword_location);
+incref(arg_init);
+incref__null___Expression__957e7d6409(arg_cond);
+incref(arg_incr);
+
+                return obj;
+            }
+
+            void dtor_ForLoopHeader_79606b2adb(void *ptr)
+            {
+                struct class_ForLoopHeader_79606b2adb *obj = ptr;
+                decref((obj->memb_keyword_location), dtor_Location_500c4434c9);
+decref((obj->memb_init), dtor_List_Statement__5d7503c104);
+decref__null___Expression__957e7d6409(obj->memb_cond);
+decref((obj->memb_incr), dtor_List_Statement__5d7503c104);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_ForLoopHeader_79606b2adb_to_string(struct class_ForLoopHeader_79606b2adb* self)
+                {
+                    struct class_Str res = string0_ForLoopHeader_028e9ad9d5;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_keyword_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Statement__5d7503c104_to_string(self->memb_init);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__null___Expression__957e7d6409_to_string(self->memb_cond);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Statement__5d7503c104_to_string(self->memb_incr);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_ForLoopHeader_79606b2adb_equals(struct class_ForLoopHeader_79606b2adb* var1, struct class_ForLoopHeader_79606b2adb* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
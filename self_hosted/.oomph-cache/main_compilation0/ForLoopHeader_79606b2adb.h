@@ -0,0 +1,30 @@
+
+                #ifndef HEADER_GUARD_ForLoopHeader_79606b2adb
+                #define HEADER_GUARD_ForLoopHeader_79606b2adb
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Expression__957e7d6409.h"
+struct class_Location_500c4434c9;
+struct class_List_Statement__5d7503c104;
+struct class_List_Statement__5d7503c104;
+struct class_Location_500c4434c9;
+struct class_List_Statement__5d7503c104;
+struct class_List_Statement__5d7503c104;
+
+            struct class_ForLoopHeader_79606b2adb {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_keyword_location;
+struct class_List_Statement__5d7503c104* memb_init;
+struct class__null___Expression__957e7d6409 memb_cond;
+struct class_List_Statement__5d7503c104* memb_incr;
+
+            };
+            
+            struct class_ForLoopHeader_79606b2adb* ctor_ForLoopHeader_79606b2adb(struct class_Location_500c4434c9* arg_keyword_location,struct class_List_Statement__5d7503c104* arg_init,struct class__null___Expression__957e7d6409 arg_cond,struct class_List_Statement__5d7503c104* arg_incr);
+            void dtor_ForLoopHeader_79606b2adb(void *ptr);
+            
+                struct class_Str meth_ForLoopHeader_79606b2adb_to_string(struct class_ForLoopHeader_79606b2adb* obj);
+                bool meth_ForLoopHeader_79606b2adb_equals(struct class_ForLoopHeader_79606b2adb* var1, struct class_ForLoopHeader_79606b2adb* var2);
+
+                #endif
+                
@@ -0,0 +1,72 @@
+#include <lib/oomph.h>
+#include "ForeachLoopHeader_ebcb7f3325.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_ForeachLoopHeader_d2b47fcca8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x72', '\x65', '\x61', '\x63', '\x68', '\x4c', '\x6f', '\x6f', '\x70', '\x48', '\x65', '\x61', '\x64', '\x65', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_ForeachLoopHeader_d2b47fcca8 = {
+                .buf = &string0_ForeachLoopHeader_d2b47fcca8_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            
+            struct class_ForeachLoopHeader_ebcb7f3325* ctor_ForeachLoopHeader_ebcb7f3325(struct class_Location_500c4434c9* arg_keyword_location,struct class_Str arg_varname,struct class_Expression_35f2052bf4 arg_list)
+            {
+                struct class_ForeachLoopHeader_ebcb7f3325* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_keyword_location = arg_keyword_location;
+obj->memb_varname = arg_varname;
+obj->memb_list = arg_list;
+
+                incref(arg_keyword_location);
+string_incref(arg_varname);
+incref_Expression_35f2052bf4(arg_list);
+
+                return obj;
+            }
+
+            void dtor_ForeachLoopHeader_ebcb7f3325(void *ptr)
+            {
+                struct class_ForeachLoopHeader_ebcb7f3325 *obj = ptr;
+                decref((obj->memb_keyword_location), dtor_Location_500c4434c9);
+string_decref(obj->memb_varname);
+decref_Expression_35f2052bf4(obj->memb_list);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_ForeachLoopHeader_ebcb7f3325_to_string(struct class_ForeachLoopHeader_ebcb7f3325* self)
+                {
+                    struct class_Str res = string0_ForeachLoopHeader_d2b47fcca8;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_keyword_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_varname);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_35f2052bf4_to_string(self->memb_list);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_ForeachLoopHeader_ebcb7f3325_equals(struct class_ForeachLoopHeader_ebcb7f3325* var1, struct class_ForeachLoopHeader_ebcb7f3325* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
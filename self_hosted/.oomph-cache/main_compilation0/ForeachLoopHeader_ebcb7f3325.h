@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_ForeachLoopHeader_ebcb7f3325
+                #define HEADER_GUARD_ForeachLoopHeader_ebcb7f3325
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_ForeachLoopHeader_ebcb7f3325 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_keyword_location;
+struct class_Str memb_varname;
+struct class_Expression_35f2052bf4 memb_list;
+
+            };
+            
+            struct class_ForeachLoopHeader_ebcb7f3325* ctor_ForeachLoopHeader_ebcb7f3325(struct class_Location_500c4434c9* arg_keyword_location,struct class_Str arg_varname,struct class_Expression_35f2052bf4 arg_list);
+            void dtor_ForeachLoopHeader_ebcb7f3325(void *ptr);
+            
+                struct class_Str meth_ForeachLoopHeader_ebcb7f3325_to_string(struct class_ForeachLoopHeader_ebcb7f3325* obj);
+                bool meth_ForeachLoopHeader_ebcb7f3325_equals(struct class_ForeachLoopHeader_ebcb7f3325* var1, struct class_ForeachLoopHeader_ebcb7f3325* var2);
+
+                #endif
+                
@@ -0,0 +1,73 @@
+#include <lib/oomph.h>
+#include "FuncDef_2bd6886a53.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "FileVariable_a7b8ca651f.h"
+#include "List_Instruction__6e475c861a.h"
+#include "List_LocalVariable__81e23234f3.h"
+
+            static struct StringBuf string0_FuncDef_7e4c76e69a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x75', '\x6e', '\x63', '\x44', '\x65', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string0_FuncDef_7e4c76e69a = {
+                .buf = &string0_FuncDef_7e4c76e69a_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            struct class_FuncDef_2bd6886a53* ctor_FuncDef_2bd6886a53(struct class_FileVariable_a7b8ca651f* arg_var,struct class_List_LocalVariable__81e23234f3* arg_argvars,struct class_List_Instruction__6e475c861a* arg_body)
+            {
+                struct class_FuncDef_2bd6886a53* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_var = arg_var;
+obj->memb_argvars = arg_argvars;
+obj->memb_body = arg_body;
+
+                incref(arg_var);
+incref(arg_argvars);
+incref(arg_body);
+
+                return obj;
+            }
+
+            void dtor_FuncDef_2bd6886a53(void *ptr)
+            {
+                struct class_FuncDef_2bd6886a53 *obj = ptr;
+                decref((obj->memb_var), dtor_FileVariable_a7b8ca651f);
+decref((obj->memb_argvars), dtor_List_LocalVariable__81e23234f3);
+decref((obj->memb_body), dtor_List_Instruction__6e475c861a);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_FuncDef_2bd6886a53_to_string(struct class_FuncDef_2bd6886a53* self)
+                {
+                    struct class_Str res = string0_FuncDef_7e4c76e69a;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_FileVariable_a7b8ca651f_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_LocalVariable__81e23234f3_to_string(self->memb_argvars);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Instruction__6e475c861a_to_string(self->memb_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_FuncDef_2bd6886a53_equals(struct class_FuncDef_2bd6886a53* var1, struct class_FuncDef_2bd6886a53* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
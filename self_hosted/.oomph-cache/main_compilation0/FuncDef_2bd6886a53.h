@@ -0,0 +1,28 @@
+
+                #ifndef HEADER_GUARD_FuncDef_2bd6886a53
+                #define HEADER_GUARD_FuncDef_2bd6886a53
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_FileVariable_a7b8ca651f;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_Instruction__6e475c861a;
+struct class_FileVariable_a7b8ca651f;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_Instruction__6e475c861a;
+
+            struct class_FuncDef_2bd6886a53 {
+                REFCOUNT_HEADER
+                struct class_FileVariable_a7b8ca651f* memb_var;
+struct class_List_LocalVariable__81e23234f3* memb_argvars;
+struct class_List_Instruction__6e475c861a* memb_body;
+
+            };
+            
+            struct class_FuncDef_2bd6886a53* ctor_FuncDef_2bd6886a53(struct class_FileVariable_a7b8ca651f* arg_var,struct class_List_LocalVariable__81e23234f3* arg_argvars,struct class_List_Instruction__6e475c861a* arg_body);
+            void dtor_FuncDef_2bd6886a53(void *ptr);
+            
+                struct class_Str meth_FuncDef_2bd6886a53_to_string(struct class_FuncDef_2bd6886a53* obj);
+                bool meth_FuncDef_2bd6886a53_equals(struct class_FuncDef_2bd6886a53* var1, struct class_FuncDef_2bd6886a53* var2);
+
+                #endif
+                
@@ -0,0 +1,88 @@
+#include <lib/oomph.h>
+#include "FuncOrMethodDef_533c7b75ab.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Statement__5d7503c104.h"
+#include "List_TypeAndName__74be4dae93.h"
+#include "Location_500c4434c9.h"
+#include "_null___Type__7de1ddce50.h"
+
+            static struct StringBuf string0_FuncOrMethodDef_ea84cf6612_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x75', '\x6e', '\x63', '\x4f', '\x72', '\x4d', '\x65', '\x74', '\x68', '\x6f', '\x64', '\x44', '\x65', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string0_FuncOrMethodDef_ea84cf6612 = {
+                .buf = &string0_FuncOrMethodDef_ea84cf6612_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            struct class_FuncOrMethodDef_533c7b75ab* ctor_FuncOrMethodDef_533c7b75ab(struct class_Location_500c4434c9* arg_location,struct class_Str arg_name,struct class_List_TypeAndName__74be4dae93* arg_args,struct class__null___Type__7de1ddce50 arg_returntype,struct class_List_Statement__5d7503c104* arg_body)
+            {
+                struct class_FuncOrMethodDef_533c7b75ab* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+obj->memb_args = arg_args;
+obj->memb_returntype = arg_returntype;
+obj->memb_body = arg_body;
+
+                incref(arg_location);
+string_incref(arg_name);
+incref(arg_args);
+incref__null___Type__7de1ddce50(arg_returntype);
+incref(arg_body);
+
+                return obj;
+            }
+
+            void dtor_FuncOrMethodDef_533c7b75ab(void *ptr)
+            {
+                struct class_FuncOrMethodDef_533c7b75ab *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+string_decref(obj->memb_name);
+decref((obj->memb_args), dtor_List_TypeAndName__74be4dae93);
+decref__null___Type__7de1ddce50(obj->memb_returntype);
+decref((obj->memb_body), dtor_List_Statement__5d7503c104);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_FuncOrMethodDef_533c7b75ab_to_string(struct class_FuncOrMethodDef_533c7b75ab* self)
+                {
+                    struct class_Str res = string0_FuncOrMethodDef_ea84cf6612;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_TypeAndName__74be4dae93_to_string(self->memb_args);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__null___Type__7de1ddce50_to_string(self->memb_returntype);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Statement__5d7503c104_to_string(self->memb_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_FuncOrMethodDef_533c7b75ab_equals(struct class_FuncOrMethodDef_533c7b75ab* var1, struct class_FuncOrMethodDef_533c7b75ab* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
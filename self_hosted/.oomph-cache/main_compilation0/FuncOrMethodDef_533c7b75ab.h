@@ -0,0 +1,31 @@
+
+                #ifndef HEADER_GUARD_FuncOrMethodDef_533c7b75ab
+                #define HEADER_GUARD_FuncOrMethodDef_533c7b75ab
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Type__7de1ddce50.h"
+struct class_Location_500c4434c9;
+struct class_List_TypeAndName__74be4dae93;
+struct class_List_Statement__5d7503c104;
+struct class_Location_500c4434c9;
+struct class_List_TypeAndName__74be4dae93;
+struct class_List_Statement__5d7503c104;
+
+            struct class_FuncOrMethodDef_533c7b75ab {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Str memb_name;
+struct class_List_TypeAndName__74be4dae93* memb_args;
+struct class__null___Type__7de1ddce50 memb_returntype;
+struct class_List_Statement__5d7503c104* memb_body;
+
+            };
+            
+            struct class_FuncOrMethodDef_533c7b75ab* ctor_FuncOrMethodDef_533c7b75ab(struct class_Location_500c4434c9* arg_location,struct class_Str arg_name,struct class_List_TypeAndName__74be4dae93* arg_args,struct class__null___Type__7de1ddce50 arg_returntype,struct class_List_Statement__5d7503c104* arg_body);
+            void dtor_FuncOrMethodDef_533c7b75ab(void *ptr);
+            
+                struct class_Str meth_FuncOrMethodDef_533c7b75ab_to_string(struct class_FuncOrMethodDef_533c7b75ab* obj);
+                bool meth_FuncOrMethodDef_533c7b75ab_equals(struct class_FuncOrMethodDef_533c7b75ab* var1, struct class_FuncOrMethodDef_533c7b75ab* var2);
+
+                #endif
+                
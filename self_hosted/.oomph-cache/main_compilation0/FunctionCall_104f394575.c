@@ -0,0 +1,73 @@
+#include <lib/oomph.h>
+#include "FunctionCall_104f394575.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_LocalVariable__81e23234f3.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_null___LocalVariable__494c1a2e12.h"
+
+            static struct StringBuf string0_FunctionCall_4dd66bd4a7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x43', '\x61', '\x6c', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_FunctionCall_4dd66bd4a7 = {
+                .buf = &string0_FunctionCall_4dd66bd4a7_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            struct class_FunctionCall_104f394575* ctor_FunctionCall_104f394575(struct class_Variable_1aaa81c8d2 arg_function,struct class_List_LocalVariable__81e23234f3* arg_args,struct class__null___LocalVariable__494c1a2e12 arg_result)
+            {
+                struct class_FunctionCall_104f394575* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_function = arg_function;
+obj->memb_args = arg_args;
+obj->memb_result = arg_result;
+
+                incref_Variable_1aaa81c8d2(arg_function);
+incref(arg_args);
+incref__null___LocalVariable__494c1a2e12(arg_result);
+
+                return obj;
+            }
+
+            void dtor_FunctionCall_104f394575(void *ptr)
+            {
+                struct class_FunctionCall_104f394575 *obj = ptr;
+                decref_Variable_1aaa81c8d2(obj->memb_function);
+decref((obj->memb_args), dtor_List_LocalVariable__81e23234f3);
+decref__null___LocalVariable__494c1a2e12(obj->memb_result);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_FunctionCall_104f394575_to_string(struct class_FunctionCall_104f394575* self)
+                {
+                    struct class_Str res = string0_FunctionCall_4dd66bd4a7;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Variable_1aaa81c8d2_to_string(self->memb_function);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_LocalVariable__81e23234f3_to_string(self->memb_args);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__null___LocalVariable__494c1a2e12_to_string(self->memb_result);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_FunctionCall_104f394575_equals(struct class_FunctionCall_104f394575* var1, struct class_FunctionCall_104f394575* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,26 @@
+
+                #ifndef HEADER_GUARD_FunctionCall_104f394575
+                #define HEADER_GUARD_FunctionCall_104f394575
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_null___LocalVariable__494c1a2e12.h"
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_LocalVariable__81e23234f3;
+
+            struct class_FunctionCall_104f394575 {
+                REFCOUNT_HEADER
+                struct class_Variable_1aaa81c8d2 memb_function;
+struct class_List_LocalVariable__81e23234f3* memb_args;
+struct class__null___LocalVariable__494c1a2e12 memb_result;
+
+            };
+            
+            struct class_FunctionCall_104f394575* ctor_FunctionCall_104f394575(struct class_Variable_1aaa81c8d2 arg_function,struct class_List_LocalVariable__81e23234f3* arg_args,struct class__null___LocalVariable__494c1a2e12 arg_result);
+            void dtor_FunctionCall_104f394575(void *ptr);
+            
+                struct class_Str meth_FunctionCall_104f394575_to_string(struct class_FunctionCall_104f394575* obj);
+                bool meth_FunctionCall_104f394575_equals(struct class_FunctionCall_104f394575* var1, struct class_FunctionCall_104f394575* var2);
+
+                #endif
+                
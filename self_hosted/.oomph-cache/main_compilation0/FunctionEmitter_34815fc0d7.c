@@ -0,0 +1,3109 @@
+#include <lib/oomph.h>
+#include "FunctionEmitter_34815fc0d7.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Builtins_bd980a9f08.h"
+#include "ConstructorCall_f8e441a21d.h"
+#include "DecRef_f37e9a69d2.h"
+#include "FilePair_99df852164.h"
+#include "FileVariable_a7b8ca651f.h"
+#include "FloatConstant_652a176e04.h"
+#include "FuncDef_2bd6886a53.h"
+#include "FunctionCall_104f394575.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "GetAttribute_3d0cc1bf97.h"
+#include "GetFromUnion_b0861b839c.h"
+#include "GotoIf_feb019130f.h"
+#include "GotoLabel_9654b8ee6d.h"
+#include "IncRef_54322428a7.h"
+#include "InstantiateUnion_29af05529f.h"
+#include "Instruction_b0fafb4d55.h"
+#include "IntConstant_817d6312f0.h"
+#include "List_GotoLabel__152f526689.h"
+#include "List_Instruction__6e475c861a.h"
+#include "List_LocalVariable__81e23234f3.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Type__057f9c6088.h"
+#include "LocalVariable_846080e5ae.h"
+#include "MethodCall_b0095be49c.h"
+#include "MethodDef_28b65923b5.h"
+#include "PointersEqual_deb0abf3fc.h"
+#include "Return_aa2d9b1c64.h"
+#include "Session_88204c75ff.h"
+#include "SetAttribute_25344a82b6.h"
+#include "StringConstant_e1466967c8.h"
+#include "Type_87e1ce5c5e.h"
+#include "UnSet_a1ce71f609.h"
+#include "UnionMemberCheck_7021628c40.h"
+#include "UnionType_7f899bced1.h"
+#include "VarCpy_e77a538911.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_FuncDef___MethodDef__5505a52ad0.h"
+#include "_null___List_Str___1b0213dad9.h"
+#include "_null___LocalVariable__494c1a2e12.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "_null___Type__8438ac3dcf.h"
+#include "c_output_6a23cf54cc.h"
+#include "ir_4b1a3e0393.h"
+
+            static struct StringBuf string0_FunctionEmitter_16e604c407_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x45', '\x6d', '\x69', '\x74', '\x74', '\x65', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_FunctionEmitter_16e604c407 = {
+                .buf = &string0_FunctionEmitter_16e604c407_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1___e2361dca1b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c' },
+                .malloced = false,
+            };
+            static struct class_Str string1___e2361dca1b = {
+                .buf = &string1___e2361dca1b_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_____946eafb09a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x3d', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string2_____946eafb09a = {
+                .buf = &string2_____946eafb09a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3___84f78e5a17_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28' },
+                .malloced = false,
+            };
+            static struct class_Str string3___84f78e5a17 = {
+                .buf = &string3___84f78e5a17_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_____2ce2c8b2a2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b', '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string4_____2ce2c8b2a2 = {
+                .buf = &string4_____2ce2c8b2a2_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5__bcbd231d6e_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string5__bcbd231d6e = {
+                .buf = &string5__bcbd231d6e_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6___________________092d1ac1a4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string6___________________092d1ac1a4 = {
+                .buf = &string6___________________092d1ac1a4_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7____________________f53500acd0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string7____________________f53500acd0 = {
+                .buf = &string7____________________f53500acd0_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string8_LL___b00f5f16e5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x4c', '\x3b', '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string8_LL___b00f5f16e5 = {
+                .buf = &string8_LL___b00f5f16e5_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string9____490609e25d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string9____490609e25d = {
+                .buf = &string9____490609e25d_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string10_meth__45fcc25556_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string10_meth__45fcc25556 = {
+                .buf = &string10_meth__45fcc25556_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string11___fd4bf6ffa4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string11___fd4bf6ffa4 = {
+                .buf = &string11___fd4bf6ffa4_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string12_ctor__41d1378779_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x74', '\x6f', '\x72', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string12_ctor__41d1378779 = {
+                .buf = &string12_ctor__41d1378779_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string13___________________________d08d32af12_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string13___________________________d08d32af12 = {
+                .buf = &string13___________________________d08d32af12_buf,
+                .nbytes = 25,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string14___________________________retval____f5d6fb56c5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x72', '\x65', '\x74', '\x76', '\x61', '\x6c', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string14___________________________retval____f5d6fb56c5 = {
+                .buf = &string14___________________________retval____f5d6fb56c5_buf,
+                .nbytes = 35,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string15___________________________goto_out___________________________650a8c98d4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x67', '\x6f', '\x74', '\x6f', '\x20', '\x6f', '\x75', '\x74', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string15___________________________goto_out___________________________650a8c98d4 = {
+                .buf = &string15___________________________goto_out___________________________650a8c98d4_buf,
+                .nbytes = 60,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string16_goto_out___676729e0b5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x67', '\x6f', '\x74', '\x6f', '\x20', '\x6f', '\x75', '\x74', '\x3b', '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string16_goto_out___676729e0b5 = {
+                .buf = &string16_goto_out___676729e0b5_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string17___memb__0a553a4ce9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x3e', '\x6d', '\x65', '\x6d', '\x62', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string17___memb__0a553a4ce9 = {
+                .buf = &string17___memb__0a553a4ce9_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string18______b2511f85b9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x3d', '\x20', '\x28' },
+                .malloced = false,
+            };
+            static struct class_Str string18______b2511f85b9 = {
+                .buf = &string18______b2511f85b9_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string19______483564d860_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x3d', '\x3d', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string19______483564d860 = {
+                .buf = &string19______483564d860_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string20__________________________val______item_6197bcd4fd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x20', '\x7b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x76', '\x61', '\x6c', '\x20', '\x3d', '\x20', '\x7b', '\x20', '\x2e', '\x69', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+            };
+            static struct class_Str string20__________________________val______item_6197bcd4fd = {
+                .buf = &string20__________________________val______item_6197bcd4fd_buf,
+                .nbytes = 38,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string21__________________________membernum____8b962003b6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x7d', '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string21__________________________membernum____8b962003b6 = {
+                .buf = &string21__________________________membernum____8b962003b6_buf,
+                .nbytes = 37,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string22_______________________________________ce5430e47f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x7d', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string22_______________________________________ce5430e47f = {
+                .buf = &string22_______________________________________ce5430e47f_buf,
+                .nbytes = 37,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string23__________________if___3fb45db31a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x69', '\x66', '\x20', '\x28' },
+                .malloced = false,
+            };
+            static struct class_Str string23__________________if___3fb45db31a = {
+                .buf = &string23__________________if___3fb45db31a_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string24__membernum_____f04718803d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x20', '\x21', '\x3d', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string24__membernum_____f04718803d = {
+                .buf = &string24__membernum_____f04718803d_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string25_______________________panic_printf___as__failed_________TODO__better_message____________________60ee8d2345_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x70', '\x61', '\x6e', '\x69', '\x63', '\x5f', '\x70', '\x72', '\x69', '\x6e', '\x74', '\x66', '\x28', '\x22', '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64', '\x22', '\x29', '\x3b', '\x20', '\x20', '\x20', '\x2f', '\x2f', '\x20', '\x54', '\x4f', '\x44', '\x4f', '\x3a', '\x20', '\x62', '\x65', '\x74', '\x74', '\x65', '\x72', '\x20', '\x6d', '\x65', '\x73', '\x73', '\x61', '\x67', '\x65', '\x3f', '\x0a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string25_______________________panic_printf___as__failed_________TODO__better_message____________________60ee8d2345 = {
+                .buf = &string25_______________________panic_printf___as__failed_________TODO__better_message____________________60ee8d2345_buf,
+                .nbytes = 95,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string26__val_item_4797b8fb11_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x76', '\x61', '\x6c', '\x2e', '\x69', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+            };
+            static struct class_Str string26__val_item_4797b8fb11 = {
+                .buf = &string26__val_item_4797b8fb11_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string27__membernum____1___dafb6f8bb2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x20', '\x3d', '\x20', '\x2d', '\x31', '\x3b', '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string27__membernum____1___dafb6f8bb2 = {
+                .buf = &string27__membernum____1___dafb6f8bb2_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string28__buf___NULL___349875091e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x62', '\x75', '\x66', '\x20', '\x3d', '\x20', '\x4e', '\x55', '\x4c', '\x4c', '\x3b', '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string28__buf___NULL___349875091e = {
+                .buf = &string28__buf___NULL___349875091e_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string29____NULL___df2d91d78a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x3d', '\x20', '\x4e', '\x55', '\x4c', '\x4c', '\x3b', '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string29____NULL___df2d91d78a = {
+                .buf = &string29____NULL___df2d91d78a_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string30_______________________goto__b43ec08d47_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x67', '\x6f', '\x74', '\x6f', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string30_______________________goto__b43ec08d47 = {
+                .buf = &string30_______________________goto__b43ec08d47_buf,
+                .nbytes = 27,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string31__membernum_____e3adb3fc5a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x20', '\x3d', '\x3d', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string31__membernum_____e3adb3fc5a = {
+                .buf = &string31__membernum_____e3adb3fc5a_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string32_label_f89ed6d3a8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x61', '\x62', '\x65', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string32_label_f89ed6d3a8 = {
+                .buf = &string32_label_f89ed6d3a8_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string33_self_hosted_c_output_oomph_fd84fc210b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x63', '\x5f', '\x6f', '\x75', '\x74', '\x70', '\x75', '\x74', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string33_self_hosted_c_output_oomph_fd84fc210b = {
+                .buf = &string33_self_hosted_c_output_oomph_fd84fc210b_buf,
+                .nbytes = 26,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string34_______________78d1fd569c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string34_______________78d1fd569c = {
+                .buf = &string34_______________78d1fd569c_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string35___d57d80595e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string35___d57d80595e = {
+                .buf = &string35___d57d80595e_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string36________________3e01ab3ed7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string36________________3e01ab3ed7 = {
+                .buf = &string36________________3e01ab3ed7_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string37_var_89b1de7c1f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x76', '\x61', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string37_var_89b1de7c1f = {
+                .buf = &string37_var_89b1de7c1f_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string38__retval_______________27f6a326c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x72', '\x65', '\x74', '\x76', '\x61', '\x6c', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string38__retval_______________27f6a326c7 = {
+                .buf = &string38__retval_______________27f6a326c7_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string39_return_retval___7bc2225875_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x72', '\x65', '\x74', '\x76', '\x61', '\x6c', '\x3b', '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string39_return_retval___7bc2225875 = {
+                .buf = &string39_return_retval___7bc2225875_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string40_out_939c3aeb8b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x75', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string40_out_939c3aeb8b = {
+                .buf = &string40_out_939c3aeb8b_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_FunctionEmitter_34815fc0d7* ctor_FunctionEmitter_34815fc0d7(struct class_FilePair_99df852164* arg_file_pair,struct class_List_LocalVariable__81e23234f3* arg_local_vars,struct class_List_GotoLabel__152f526689* arg_labels,struct class_Str arg_before_body,struct class_Str arg_after_body,struct class_List_LocalVariable__81e23234f3* arg_need_decref)
+            {
+                struct class_FunctionEmitter_34815fc0d7* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_file_pair = arg_file_pair;
+obj->memb_local_vars = arg_local_vars;
+obj->memb_labels = arg_labels;
+obj->memb_before_body = arg_before_body;
+obj->memb_after_body = arg_after_body;
+obj->memb_need_decref = arg_need_decref;
+
+                incref(arg_file_pair);
+incref(arg_local_vars);
+incref(arg_labels);
+string_incref(arg_before_body);
+string_incref(arg_after_body);
+incref(arg_need_decref);
+
+                return obj;
+            }
+
+            void dtor_FunctionEmitter_34815fc0d7(void *ptr)
+            {
+                struct class_FunctionEmitter_34815fc0d7 *obj = ptr;
+                decref((obj->memb_file_pair), dtor_FilePair_99df852164);
+decref((obj->memb_local_vars), dtor_List_LocalVariable__81e23234f3);
+decref((obj->memb_labels), dtor_List_GotoLabel__152f526689);
+string_decref(obj->memb_before_body);
+string_decref(obj->memb_after_body);
+decref((obj->memb_need_decref), dtor_List_LocalVariable__81e23234f3);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_FunctionEmitter_34815fc0d7_to_string(struct class_FunctionEmitter_34815fc0d7* self)
+                {
+                    struct class_Str res = string0_FunctionEmitter_16e604c407;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_FilePair_99df852164_to_string(self->memb_file_pair);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_LocalVariable__81e23234f3_to_string(self->memb_local_vars);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_GotoLabel__152f526689_to_string(self->memb_labels);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_before_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_after_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_LocalVariable__81e23234f3_to_string(self->memb_need_decref);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_FunctionEmitter_34815fc0d7_equals(struct class_FunctionEmitter_34815fc0d7* var1, struct class_FunctionEmitter_34815fc0d7* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}struct class_Str meth_FunctionEmitter_34815fc0d7_incref_var(struct class_FunctionEmitter_34815fc0d7* var1, struct class_LocalVariable_846080e5ae* var2){struct class_FilePair_99df852164* var3;
+var3 = NULL;
+struct class_Session_88204c75ff* var4;
+var4 = NULL;
+struct class_Variable_1aaa81c8d2 var5;
+var5.membernum = -1;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Type_87e1ce5c5e var7;
+var7.membernum = -1;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str retval;
+var3 = var1->memb_file_pair;
+var4 = var3->memb_session;
+var3 = NULL;
+incref(var4);
+var5 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var2 }, .membernum = 2 };
+incref(var2);
+var6 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var5);
+var7 = var2->memb_type;
+incref_Type_87e1ce5c5e(var7);
+var8 = meth_Session_88204c75ff_emit_incref(var4,var6,var7);
+retval = var8; var8.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var8);
+decref_Type_87e1ce5c5e(var7);
+string_decref(var6);
+decref_Variable_1aaa81c8d2(var5);
+decref((var4), dtor_Session_88204c75ff);
+decref((var3), dtor_FilePair_99df852164);
+return retval;
+}struct class_Str meth_FunctionEmitter_34815fc0d7_emit_call(struct class_FunctionEmitter_34815fc0d7* var1, struct class_Str var2, struct class_List_LocalVariable__81e23234f3* var3, struct class__null___LocalVariable__494c1a2e12 var4){struct class_List_Str__43b70c06cb* var5;
+var5 = NULL;
+int64_t var6;
+int64_t var7;
+struct class_LocalVariable_846080e5ae* var9;
+var9 = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Variable_1aaa81c8d2 var12;
+var12.membernum = -1;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+bool var15;
+struct class_LocalVariable_846080e5ae* var18;
+var18 = NULL;
+struct class_Variable_1aaa81c8d2 var19;
+var19.membernum = -1;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+struct class_Str var28;
+var28.buf = NULL;
+char var29;
+struct class_Str var30;
+var30.buf = NULL;
+struct class_Str var31;
+var31.buf = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_Str retval;
+var5 = ctor_List_Str__43b70c06cb();
+var6 = meth_List_LocalVariable__81e23234f3_length(var3);
+meth_List_Str__43b70c06cb___reserve(var5,var6);
+var7 = 0LL;
+label8: (void)0;
+if (var7 >= var3->len) goto label10;
+decref((var9), dtor_LocalVariable_846080e5ae); var9 = var3->data[var7++]; incref(var9);
+string_decref(var11);
+var11.buf = NULL;
+decref_Variable_1aaa81c8d2(var12);
+var12.membernum = -1;
+var12 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var9 }, .membernum = 2 };
+var9 = NULL;
+var11 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var12);
+meth_List_Str__43b70c06cb_push(var5,var11);
+if (oomph_true) goto label8;
+label10: (void)0;
+var13 = string1___e2361dca1b; string_incref(var13);
+var14 = meth_List_Str__43b70c06cb_join(var5,var13);
+
+            var15 = (
+                var4.membernum == 1
+            );
+            if (var15) goto label16;
+
+            var15 = (
+                var4.membernum == 0
+            );
+            if (var15) goto label17;
+label16: (void)0;
+
+            if (var4.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var18 = var4.val.item1;
+            incref(var18);
+var19 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var18 }, .membernum = 2 };
+var18 = NULL;
+var20 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var19);
+var21 = string2_____946eafb09a; string_incref(var21);
+var22 = oomph_string_concat(var20,var21);
+var23 = oomph_string_concat(var22,var2);
+var24 = string3___84f78e5a17; string_incref(var24);
+var25 = oomph_string_concat(var23,var24);
+var26 = oomph_string_concat(var25,var14);
+var27 = string4_____2ce2c8b2a2; string_incref(var27);
+var28 = oomph_string_concat(var26,var27);
+retval = var28; var28.buf = NULL;
+goto out;
+label17: (void)0;
+
+            if (var4.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var29 = var4.val.item0;
+            var30 = string3___84f78e5a17; string_incref(var30);
+var31 = oomph_string_concat(var2,var30);
+var32 = oomph_string_concat(var31,var14);
+var33 = string4_____2ce2c8b2a2; string_incref(var33);
+var34 = oomph_string_concat(var32,var33);
+retval = var34; var34.buf = NULL;
+goto out;
+label35: (void)0;
+out: (void)0;
+string_decref(var34);
+string_decref(var33);
+string_decref(var32);
+string_decref(var31);
+string_decref(var30);
+(void)0;
+string_decref(var28);
+string_decref(var27);
+string_decref(var26);
+string_decref(var25);
+string_decref(var24);
+string_decref(var23);
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+decref_Variable_1aaa81c8d2(var19);
+decref((var18), dtor_LocalVariable_846080e5ae);
+(void)0;
+string_decref(var14);
+string_decref(var13);
+decref_Variable_1aaa81c8d2(var12);
+string_decref(var11);
+decref((var9), dtor_LocalVariable_846080e5ae);
+(void)0;
+(void)0;
+decref((var5), dtor_List_Str__43b70c06cb);
+return retval;
+}struct class_Str meth_FunctionEmitter_34815fc0d7_emit_body(struct class_FunctionEmitter_34815fc0d7* var1, struct class_List_Instruction__6e475c861a* var2){struct class_List_Str__43b70c06cb* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var5;
+struct class_Instruction_b0fafb4d55 var7;
+var7.membernum = -1;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str retval;
+var3 = ctor_List_Str__43b70c06cb();
+var4 = meth_List_Instruction__6e475c861a_length(var2);
+meth_List_Str__43b70c06cb___reserve(var3,var4);
+var5 = 0LL;
+label6: (void)0;
+if (var5 >= var2->len) goto label8;
+decref_Instruction_b0fafb4d55(var7); var7 = var2->data[var5++]; incref_Instruction_b0fafb4d55(var7);
+string_decref(var9);
+var9.buf = NULL;
+var9 = meth_FunctionEmitter_34815fc0d7_emit_instruction(var1,var7);
+meth_List_Str__43b70c06cb_push(var3,var9);
+if (oomph_true) goto label6;
+label8: (void)0;
+var10 = string5__bcbd231d6e; string_incref(var10);
+var11 = meth_List_Str__43b70c06cb_join(var3,var10);
+retval = var11; var11.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var11);
+string_decref(var10);
+string_decref(var9);
+decref_Instruction_b0fafb4d55(var7);
+(void)0;
+(void)0;
+decref((var3), dtor_List_Str__43b70c06cb);
+return retval;
+}struct class_Str meth_FunctionEmitter_34815fc0d7_emit_instruction(struct class_FunctionEmitter_34815fc0d7* var1, struct class_Instruction_b0fafb4d55 var2){bool var3;
+struct class_StringConstant_e1466967c8* var23;
+var23 = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_LocalVariable_846080e5ae* var25;
+var25 = NULL;
+struct class_Variable_1aaa81c8d2 var26;
+var26.membernum = -1;
+struct class_Str var27;
+var27.buf = NULL;
+struct class_Str var28;
+var28.buf = NULL;
+struct class_Str var29;
+var29.buf = NULL;
+struct class_Str var30;
+var30.buf = NULL;
+struct class_FilePair_99df852164* var31;
+var31 = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+struct class_LocalVariable_846080e5ae* var37;
+var37 = NULL;
+struct class_Str var38;
+var38.buf = NULL;
+struct class_Str var39;
+var39.buf = NULL;
+struct class_Str var40;
+var40.buf = NULL;
+struct class_Str var41;
+var41.buf = NULL;
+struct class_IntConstant_817d6312f0* var42;
+var42 = NULL;
+struct class_LocalVariable_846080e5ae* var43;
+var43 = NULL;
+struct class_Variable_1aaa81c8d2 var44;
+var44.membernum = -1;
+struct class_Str var45;
+var45.buf = NULL;
+struct class_Str var46;
+var46.buf = NULL;
+struct class_Str var47;
+var47.buf = NULL;
+int64_t var48;
+struct class_Str var49;
+var49.buf = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+struct class_Str var52;
+var52.buf = NULL;
+struct class_FloatConstant_652a176e04* var53;
+var53 = NULL;
+struct class_LocalVariable_846080e5ae* var54;
+var54 = NULL;
+struct class_Variable_1aaa81c8d2 var55;
+var55.membernum = -1;
+struct class_Str var56;
+var56.buf = NULL;
+struct class_Str var57;
+var57.buf = NULL;
+struct class_Str var58;
+var58.buf = NULL;
+struct class_Str var59;
+var59.buf = NULL;
+struct class_Str var60;
+var60.buf = NULL;
+struct class_Str var61;
+var61.buf = NULL;
+struct class_Str var62;
+var62.buf = NULL;
+struct class_VarCpy_e77a538911* var63;
+var63 = NULL;
+struct class_LocalVariable_846080e5ae* var64;
+var64 = NULL;
+struct class_Variable_1aaa81c8d2 var65;
+var65.membernum = -1;
+struct class_Str var66;
+var66.buf = NULL;
+struct class_Str var67;
+var67.buf = NULL;
+struct class_Str var68;
+var68.buf = NULL;
+struct class_Variable_1aaa81c8d2 var69;
+var69.membernum = -1;
+struct class_Str var70;
+var70.buf = NULL;
+struct class_Str var71;
+var71.buf = NULL;
+struct class_Str var72;
+var72.buf = NULL;
+struct class_Str var73;
+var73.buf = NULL;
+struct class_IncRef_54322428a7* var74;
+var74 = NULL;
+struct class_LocalVariable_846080e5ae* var75;
+var75 = NULL;
+struct class_Str var76;
+var76.buf = NULL;
+struct class_Str var77;
+var77.buf = NULL;
+struct class_Str var78;
+var78.buf = NULL;
+struct class_DecRef_f37e9a69d2* var79;
+var79 = NULL;
+struct class_FilePair_99df852164* var80;
+var80 = NULL;
+struct class_Session_88204c75ff* var81;
+var81 = NULL;
+struct class_LocalVariable_846080e5ae* var82;
+var82 = NULL;
+struct class_Variable_1aaa81c8d2 var83;
+var83.membernum = -1;
+struct class_Str var84;
+var84.buf = NULL;
+struct class_LocalVariable_846080e5ae* var85;
+var85 = NULL;
+struct class_Type_87e1ce5c5e var86;
+var86.membernum = -1;
+struct class_Str var87;
+var87.buf = NULL;
+struct class_Str var88;
+var88.buf = NULL;
+struct class_Str var89;
+var89.buf = NULL;
+struct class_FunctionCall_104f394575* var90;
+var90 = NULL;
+struct class_Variable_1aaa81c8d2 var91;
+var91.membernum = -1;
+struct class_Str var92;
+var92.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var93;
+var93 = NULL;
+struct class__null___LocalVariable__494c1a2e12 var94;
+var94.membernum = -1;
+struct class_Str var95;
+var95.buf = NULL;
+struct class_MethodCall_b0095be49c* var96;
+var96 = NULL;
+struct class_LocalVariable_846080e5ae* var97;
+var97 = NULL;
+struct class_List_LocalVariable__81e23234f3* var98;
+var98 = NULL;
+struct class_List_LocalVariable__81e23234f3* var99;
+var99 = NULL;
+struct class_Str var100;
+var100.buf = NULL;
+struct class_FilePair_99df852164* var101;
+var101 = NULL;
+struct class_Session_88204c75ff* var102;
+var102 = NULL;
+struct class_LocalVariable_846080e5ae* var103;
+var103 = NULL;
+struct class_Type_87e1ce5c5e var104;
+var104.membernum = -1;
+struct class_Str var105;
+var105.buf = NULL;
+struct class_Str var106;
+var106.buf = NULL;
+struct class_Str var107;
+var107.buf = NULL;
+struct class_Str var108;
+var108.buf = NULL;
+struct class_Str var109;
+var109.buf = NULL;
+struct class_Str var110;
+var110.buf = NULL;
+struct class__null___LocalVariable__494c1a2e12 var111;
+var111.membernum = -1;
+struct class_Str var112;
+var112.buf = NULL;
+struct class_ConstructorCall_f8e441a21d* var113;
+var113 = NULL;
+struct class_Str var114;
+var114.buf = NULL;
+struct class_FilePair_99df852164* var115;
+var115 = NULL;
+struct class_Session_88204c75ff* var116;
+var116 = NULL;
+struct class_LocalVariable_846080e5ae* var117;
+var117 = NULL;
+struct class_Type_87e1ce5c5e var118;
+var118.membernum = -1;
+struct class_Str var119;
+var119.buf = NULL;
+struct class_Str var120;
+var120.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var121;
+var121 = NULL;
+struct class_LocalVariable_846080e5ae* var122;
+var122 = NULL;
+struct class__null___LocalVariable__494c1a2e12 var123;
+var123.membernum = -1;
+struct class_Str var124;
+var124.buf = NULL;
+struct class_Return_aa2d9b1c64* var125;
+var125 = NULL;
+struct class__null___LocalVariable__494c1a2e12 var126;
+var126.membernum = -1;
+bool var127;
+struct class_LocalVariable_846080e5ae* var130;
+var130 = NULL;
+struct class_Str var131;
+var131.buf = NULL;
+struct class_Str var132;
+var132.buf = NULL;
+struct class_Str var133;
+var133.buf = NULL;
+struct class_Str var134;
+var134.buf = NULL;
+struct class_Str var135;
+var135.buf = NULL;
+struct class_Variable_1aaa81c8d2 var136;
+var136.membernum = -1;
+struct class_Str var137;
+var137.buf = NULL;
+struct class_Str var138;
+var138.buf = NULL;
+struct class_Str var139;
+var139.buf = NULL;
+struct class_Str var140;
+var140.buf = NULL;
+char var141;
+struct class_Str var142;
+var142.buf = NULL;
+struct class_GetAttribute_3d0cc1bf97* var145;
+var145 = NULL;
+struct class_LocalVariable_846080e5ae* var146;
+var146 = NULL;
+struct class_Variable_1aaa81c8d2 var147;
+var147.membernum = -1;
+struct class_Str var148;
+var148.buf = NULL;
+struct class_Str var149;
+var149.buf = NULL;
+struct class_Str var150;
+var150.buf = NULL;
+struct class_LocalVariable_846080e5ae* var151;
+var151 = NULL;
+struct class_Variable_1aaa81c8d2 var152;
+var152.membernum = -1;
+struct class_Str var153;
+var153.buf = NULL;
+struct class_Str var154;
+var154.buf = NULL;
+struct class_Str var155;
+var155.buf = NULL;
+struct class_Str var156;
+var156.buf = NULL;
+struct class_Str var157;
+var157.buf = NULL;
+struct class_Str var158;
+var158.buf = NULL;
+struct class_Str var159;
+var159.buf = NULL;
+struct class_Str var160;
+var160.buf = NULL;
+struct class_SetAttribute_25344a82b6* var161;
+var161 = NULL;
+struct class_LocalVariable_846080e5ae* var162;
+var162 = NULL;
+struct class_Variable_1aaa81c8d2 var163;
+var163.membernum = -1;
+struct class_Str var164;
+var164.buf = NULL;
+struct class_Str var165;
+var165.buf = NULL;
+struct class_Str var166;
+var166.buf = NULL;
+struct class_Str var167;
+var167.buf = NULL;
+struct class_Str var168;
+var168.buf = NULL;
+struct class_Str var169;
+var169.buf = NULL;
+struct class_Str var170;
+var170.buf = NULL;
+struct class_LocalVariable_846080e5ae* var171;
+var171 = NULL;
+struct class_Variable_1aaa81c8d2 var172;
+var172.membernum = -1;
+struct class_Str var173;
+var173.buf = NULL;
+struct class_Str var174;
+var174.buf = NULL;
+struct class_Str var175;
+var175.buf = NULL;
+struct class_Str var176;
+var176.buf = NULL;
+struct class_PointersEqual_deb0abf3fc* var177;
+var177 = NULL;
+struct class_LocalVariable_846080e5ae* var178;
+var178 = NULL;
+struct class_Variable_1aaa81c8d2 var179;
+var179.membernum = -1;
+struct class_Str var180;
+var180.buf = NULL;
+struct class_Str var181;
+var181.buf = NULL;
+struct class_Str var182;
+var182.buf = NULL;
+struct class_LocalVariable_846080e5ae* var183;
+var183 = NULL;
+struct class_Variable_1aaa81c8d2 var184;
+var184.membernum = -1;
+struct class_Str var185;
+var185.buf = NULL;
+struct class_Str var186;
+var186.buf = NULL;
+struct class_Str var187;
+var187.buf = NULL;
+struct class_Str var188;
+var188.buf = NULL;
+struct class_LocalVariable_846080e5ae* var189;
+var189 = NULL;
+struct class_Variable_1aaa81c8d2 var190;
+var190.membernum = -1;
+struct class_Str var191;
+var191.buf = NULL;
+struct class_Str var192;
+var192.buf = NULL;
+struct class_Str var193;
+var193.buf = NULL;
+struct class_Str var194;
+var194.buf = NULL;
+struct class_InstantiateUnion_29af05529f* var195;
+var195 = NULL;
+struct class_LocalVariable_846080e5ae* var196;
+var196 = NULL;
+struct class_Type_87e1ce5c5e var197;
+var197.membernum = -1;
+struct class_UnionType_7f899bced1* var198;
+var198 = NULL;
+struct class_List_Type__057f9c6088* var199;
+var199 = NULL;
+struct class_LocalVariable_846080e5ae* var200;
+var200 = NULL;
+struct class_Type_87e1ce5c5e var201;
+var201.membernum = -1;
+int64_t var202;
+struct class_Str var203;
+var203.buf = NULL;
+struct class_LocalVariable_846080e5ae* var204;
+var204 = NULL;
+struct class_Variable_1aaa81c8d2 var205;
+var205.membernum = -1;
+struct class_Str var206;
+var206.buf = NULL;
+struct class_Str var207;
+var207.buf = NULL;
+struct class_Str var208;
+var208.buf = NULL;
+struct class_Str var209;
+var209.buf = NULL;
+struct class_FilePair_99df852164* var210;
+var210 = NULL;
+struct class_Type_87e1ce5c5e var211;
+var211.membernum = -1;
+struct class__null___Type__8438ac3dcf var212;
+var212.membernum = -1;
+struct class_Str var213;
+var213.buf = NULL;
+struct class_Str var214;
+var214.buf = NULL;
+struct class_Str var215;
+var215.buf = NULL;
+struct class_Str var216;
+var216.buf = NULL;
+struct class_Str var217;
+var217.buf = NULL;
+struct class_Str var218;
+var218.buf = NULL;
+struct class_Str var219;
+var219.buf = NULL;
+struct class_Str var220;
+var220.buf = NULL;
+struct class_LocalVariable_846080e5ae* var221;
+var221 = NULL;
+struct class_Variable_1aaa81c8d2 var222;
+var222.membernum = -1;
+struct class_Str var223;
+var223.buf = NULL;
+struct class_Str var224;
+var224.buf = NULL;
+struct class_Str var225;
+var225.buf = NULL;
+struct class_Str var226;
+var226.buf = NULL;
+struct class_Str var227;
+var227.buf = NULL;
+struct class_Str var228;
+var228.buf = NULL;
+struct class_Str var229;
+var229.buf = NULL;
+struct class_Str var230;
+var230.buf = NULL;
+struct class_GetFromUnion_b0861b839c* var231;
+var231 = NULL;
+struct class_LocalVariable_846080e5ae* var232;
+var232 = NULL;
+struct class_Type_87e1ce5c5e var233;
+var233.membernum = -1;
+struct class_UnionType_7f899bced1* var234;
+var234 = NULL;
+struct class_List_Type__057f9c6088* var235;
+var235 = NULL;
+struct class_LocalVariable_846080e5ae* var236;
+var236 = NULL;
+struct class_Type_87e1ce5c5e var237;
+var237.membernum = -1;
+int64_t var238;
+struct class_Str var239;
+var239.buf = NULL;
+struct class_LocalVariable_846080e5ae* var240;
+var240 = NULL;
+struct class_Variable_1aaa81c8d2 var241;
+var241.membernum = -1;
+struct class_Str var242;
+var242.buf = NULL;
+struct class_Str var243;
+var243.buf = NULL;
+struct class_Str var244;
+var244.buf = NULL;
+struct class_Str var245;
+var245.buf = NULL;
+struct class_Str var246;
+var246.buf = NULL;
+struct class_Str var247;
+var247.buf = NULL;
+struct class_Str var248;
+var248.buf = NULL;
+struct class_Str var249;
+var249.buf = NULL;
+struct class_LocalVariable_846080e5ae* var250;
+var250 = NULL;
+struct class_Variable_1aaa81c8d2 var251;
+var251.membernum = -1;
+struct class_Str var252;
+var252.buf = NULL;
+struct class_Str var253;
+var253.buf = NULL;
+struct class_Str var254;
+var254.buf = NULL;
+struct class_Str var255;
+var255.buf = NULL;
+struct class_LocalVariable_846080e5ae* var256;
+var256 = NULL;
+struct class_Variable_1aaa81c8d2 var257;
+var257.membernum = -1;
+struct class_Str var258;
+var258.buf = NULL;
+struct class_Str var259;
+var259.buf = NULL;
+struct class_Str var260;
+var260.buf = NULL;
+struct class_Str var261;
+var261.buf = NULL;
+struct class_Str var262;
+var262.buf = NULL;
+struct class_Str var263;
+var263.buf = NULL;
+struct class_Str var264;
+var264.buf = NULL;
+struct class_Str var265;
+var265.buf = NULL;
+struct class_UnSet_a1ce71f609* var266;
+var266 = NULL;
+struct class_LocalVariable_846080e5ae* var267;
+var267 = NULL;
+struct class_Type_87e1ce5c5e var268;
+var268.membernum = -1;
+bool var269;
+struct class_UnionType_7f899bced1* var272;
+var272 = NULL;
+struct class_LocalVariable_846080e5ae* var273;
+var273 = NULL;
+struct class_Variable_1aaa81c8d2 var274;
+var274.membernum = -1;
+struct class_Str var275;
+var275.buf = NULL;
+struct class_Str var276;
+var276.buf = NULL;
+struct class_Str var277;
+var277.buf = NULL;
+struct class_LocalVariable_846080e5ae* var278;
+var278 = NULL;
+struct class_Type_87e1ce5c5e var279;
+var279.membernum = -1;
+struct class_FilePair_99df852164* var280;
+var280 = NULL;
+struct class_Session_88204c75ff* var281;
+var281 = NULL;
+struct class_Builtins_bd980a9f08* var282;
+var282 = NULL;
+struct class_Type_87e1ce5c5e var283;
+var283.membernum = -1;
+bool var284;
+struct class_LocalVariable_846080e5ae* var287;
+var287 = NULL;
+struct class_Variable_1aaa81c8d2 var288;
+var288.membernum = -1;
+struct class_Str var289;
+var289.buf = NULL;
+struct class_Str var290;
+var290.buf = NULL;
+struct class_Str var291;
+var291.buf = NULL;
+struct class_LocalVariable_846080e5ae* var292;
+var292 = NULL;
+struct class_Type_87e1ce5c5e var293;
+var293.membernum = -1;
+bool var294;
+struct class_LocalVariable_846080e5ae* var297;
+var297 = NULL;
+struct class_Variable_1aaa81c8d2 var298;
+var298.membernum = -1;
+struct class_Str var299;
+var299.buf = NULL;
+struct class_Str var300;
+var300.buf = NULL;
+struct class_Str var301;
+var301.buf = NULL;
+struct class_Str var302;
+var302.buf = NULL;
+struct class_GotoLabel_9654b8ee6d* var304;
+var304 = NULL;
+struct class_Str var305;
+var305.buf = NULL;
+struct class_Str var306;
+var306.buf = NULL;
+struct class_GotoIf_feb019130f* var307;
+var307 = NULL;
+struct class_Str var308;
+var308.buf = NULL;
+struct class_LocalVariable_846080e5ae* var309;
+var309 = NULL;
+struct class_Variable_1aaa81c8d2 var310;
+var310.membernum = -1;
+struct class_Str var311;
+var311.buf = NULL;
+struct class_Str var312;
+var312.buf = NULL;
+struct class_Str var313;
+var313.buf = NULL;
+struct class_Str var314;
+var314.buf = NULL;
+struct class_GotoLabel_9654b8ee6d* var315;
+var315 = NULL;
+struct class_Str var316;
+var316.buf = NULL;
+struct class_Str var317;
+var317.buf = NULL;
+struct class_Str var318;
+var318.buf = NULL;
+struct class_Str var319;
+var319.buf = NULL;
+struct class_UnionMemberCheck_7021628c40* var320;
+var320 = NULL;
+struct class_LocalVariable_846080e5ae* var321;
+var321 = NULL;
+struct class_Type_87e1ce5c5e var322;
+var322.membernum = -1;
+struct class_UnionType_7f899bced1* var323;
+var323 = NULL;
+struct class_List_Type__057f9c6088* var324;
+var324 = NULL;
+struct class_Type_87e1ce5c5e var325;
+var325.membernum = -1;
+int64_t var326;
+struct class_LocalVariable_846080e5ae* var327;
+var327 = NULL;
+struct class_Variable_1aaa81c8d2 var328;
+var328.membernum = -1;
+struct class_Str var329;
+var329.buf = NULL;
+struct class_Str var330;
+var330.buf = NULL;
+struct class_Str var331;
+var331.buf = NULL;
+struct class_LocalVariable_846080e5ae* var332;
+var332 = NULL;
+struct class_Variable_1aaa81c8d2 var333;
+var333.membernum = -1;
+struct class_Str var334;
+var334.buf = NULL;
+struct class_Str var335;
+var335.buf = NULL;
+struct class_Str var336;
+var336.buf = NULL;
+struct class_Str var337;
+var337.buf = NULL;
+struct class_Str var338;
+var338.buf = NULL;
+struct class_Str var339;
+var339.buf = NULL;
+struct class_Str var340;
+var340.buf = NULL;
+struct class_Str var341;
+var341.buf = NULL;
+struct class_Str retval;
+
+            var3 = (
+                var2.membernum == 15
+            );
+            if (var3) goto label4;
+
+            var3 = (
+                var2.membernum == 10
+            );
+            if (var3) goto label5;
+
+            var3 = (
+                var2.membernum == 2
+            );
+            if (var3) goto label6;
+
+            var3 = (
+                var2.membernum == 18
+            );
+            if (var3) goto label7;
+
+            var3 = (
+                var2.membernum == 8
+            );
+            if (var3) goto label8;
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) goto label9;
+
+            var3 = (
+                var2.membernum == 3
+            );
+            if (var3) goto label10;
+
+            var3 = (
+                var2.membernum == 11
+            );
+            if (var3) goto label11;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) goto label12;
+
+            var3 = (
+                var2.membernum == 13
+            );
+            if (var3) goto label13;
+
+            var3 = (
+                var2.membernum == 4
+            );
+            if (var3) goto label14;
+
+            var3 = (
+                var2.membernum == 14
+            );
+            if (var3) goto label15;
+
+            var3 = (
+                var2.membernum == 12
+            );
+            if (var3) goto label16;
+
+            var3 = (
+                var2.membernum == 9
+            );
+            if (var3) goto label17;
+
+            var3 = (
+                var2.membernum == 5
+            );
+            if (var3) goto label18;
+
+            var3 = (
+                var2.membernum == 16
+            );
+            if (var3) goto label19;
+
+            var3 = (
+                var2.membernum == 7
+            );
+            if (var3) goto label20;
+
+            var3 = (
+                var2.membernum == 6
+            );
+            if (var3) goto label21;
+
+            var3 = (
+                var2.membernum == 17
+            );
+            if (var3) goto label22;
+label4: (void)0;
+
+            if (var2.membernum != 15)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var23 = var2.val.item15;
+            incref(var23);
+var24 = string6___________________092d1ac1a4; string_incref(var24);
+var25 = var23->memb_var;
+incref(var25);
+var26 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var25 }, .membernum = 2 };
+var25 = NULL;
+var27 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var26);
+var28 = oomph_string_concat(var24,var27);
+var29 = string2_____946eafb09a; string_incref(var29);
+var30 = oomph_string_concat(var28,var29);
+var31 = var1->memb_file_pair;
+incref(var31);
+var32 = var23->memb_value;
+string_incref(var32);
+var33 = meth_FilePair_99df852164_emit_string(var31,var32);
+var34 = oomph_string_concat(var30,var33);
+var35 = string7____________________f53500acd0; string_incref(var35);
+var36 = oomph_string_concat(var34,var35);
+var37 = var23->memb_var;
+incref(var37);
+var38 = meth_FunctionEmitter_34815fc0d7_incref_var(var1,var37);
+var39 = oomph_string_concat(var36,var38);
+var40 = string7____________________f53500acd0; string_incref(var40);
+var41 = oomph_string_concat(var39,var40);
+retval = var41; var41.buf = NULL;
+goto out;
+label5: (void)0;
+
+            if (var2.membernum != 10)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var42 = var2.val.item10;
+            incref(var42);
+var43 = var42->memb_var;
+incref(var43);
+var44 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var43 }, .membernum = 2 };
+var43 = NULL;
+var45 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var44);
+var46 = string2_____946eafb09a; string_incref(var46);
+var47 = oomph_string_concat(var45,var46);
+var48 = var42->memb_value;
+var49 = meth_Int_to_string(var48);
+var50 = oomph_string_concat(var47,var49);
+var51 = string8_LL___b00f5f16e5; string_incref(var51);
+var52 = oomph_string_concat(var50,var51);
+retval = var52; var52.buf = NULL;
+goto out;
+label6: (void)0;
+
+            if (var2.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var53 = var2.val.item2;
+            incref(var53);
+var54 = var53->memb_var;
+incref(var54);
+var55 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var54 }, .membernum = 2 };
+var54 = NULL;
+var56 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var55);
+var57 = string2_____946eafb09a; string_incref(var57);
+var58 = oomph_string_concat(var56,var57);
+var59 = var53->memb_value;
+string_incref(var59);
+var60 = oomph_string_concat(var58,var59);
+var61 = string9____490609e25d; string_incref(var61);
+var62 = oomph_string_concat(var60,var61);
+retval = var62; var62.buf = NULL;
+goto out;
+label7: (void)0;
+
+            if (var2.membernum != 18)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var63 = var2.val.item18;
+            incref(var63);
+var64 = var63->memb_dest;
+incref(var64);
+var65 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var64 }, .membernum = 2 };
+var64 = NULL;
+var66 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var65);
+var67 = string2_____946eafb09a; string_incref(var67);
+var68 = oomph_string_concat(var66,var67);
+var69 = var63->memb_source;
+incref_Variable_1aaa81c8d2(var69);
+var70 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var69);
+var71 = oomph_string_concat(var68,var70);
+var72 = string9____490609e25d; string_incref(var72);
+var73 = oomph_string_concat(var71,var72);
+retval = var73; var73.buf = NULL;
+goto out;
+label8: (void)0;
+
+            if (var2.membernum != 8)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var74 = var2.val.item8;
+            incref(var74);
+var75 = var74->memb_var;
+incref(var75);
+var76 = meth_FunctionEmitter_34815fc0d7_incref_var(var1,var75);
+var77 = string9____490609e25d; string_incref(var77);
+var78 = oomph_string_concat(var76,var77);
+retval = var78; var78.buf = NULL;
+goto out;
+label9: (void)0;
+
+            if (var2.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var79 = var2.val.item1;
+            incref(var79);
+var80 = var1->memb_file_pair;
+var81 = var80->memb_session;
+var80 = NULL;
+incref(var81);
+var82 = var79->memb_var;
+incref(var82);
+var83 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var82 }, .membernum = 2 };
+var82 = NULL;
+var84 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var83);
+var85 = var79->memb_var;
+var86 = var85->memb_type;
+var85 = NULL;
+incref_Type_87e1ce5c5e(var86);
+var87 = meth_Session_88204c75ff_emit_decref(var81,var84,var86);
+var88 = string9____490609e25d; string_incref(var88);
+var89 = oomph_string_concat(var87,var88);
+retval = var89; var89.buf = NULL;
+goto out;
+label10: (void)0;
+
+            if (var2.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var90 = var2.val.item3;
+            incref(var90);
+var91 = var90->memb_function;
+incref_Variable_1aaa81c8d2(var91);
+var92 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var91);
+var93 = var90->memb_args;
+incref(var93);
+var94 = var90->memb_result;
+incref__null___LocalVariable__494c1a2e12(var94);
+var95 = meth_FunctionEmitter_34815fc0d7_emit_call(var1,var92,var93,var94);
+retval = var95; var95.buf = NULL;
+goto out;
+label11: (void)0;
+
+            if (var2.membernum != 11)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var96 = var2.val.item11;
+            incref(var96);
+var97 = var96->memb_obj;
+incref(var97);
+var98 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var98,var97);
+var99 = var96->memb_args;
+incref(var99);
+meth_List_LocalVariable__81e23234f3_push_all(var98,var99);
+var100 = string10_meth__45fcc25556; string_incref(var100);
+var101 = var1->memb_file_pair;
+var102 = var101->memb_session;
+var101 = NULL;
+incref(var102);
+var103 = var96->memb_obj;
+var104 = var103->memb_type;
+var103 = NULL;
+incref_Type_87e1ce5c5e(var104);
+var105 = meth_Session_88204c75ff_get_type_c_name(var102,var104);
+var106 = oomph_string_concat(var100,var105);
+var107 = string11___fd4bf6ffa4; string_incref(var107);
+var108 = oomph_string_concat(var106,var107);
+var109 = var96->memb_method_name;
+string_incref(var109);
+var110 = oomph_string_concat(var108,var109);
+var111 = var96->memb_result;
+incref__null___LocalVariable__494c1a2e12(var111);
+var112 = meth_FunctionEmitter_34815fc0d7_emit_call(var1,var110,var98,var111);
+retval = var112; var112.buf = NULL;
+goto out;
+label12: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var113 = var2.val.item0;
+            incref(var113);
+var114 = string12_ctor__41d1378779; string_incref(var114);
+var115 = var1->memb_file_pair;
+var116 = var115->memb_session;
+var115 = NULL;
+incref(var116);
+var117 = var113->memb_result;
+var118 = var117->memb_type;
+var117 = NULL;
+incref_Type_87e1ce5c5e(var118);
+var119 = meth_Session_88204c75ff_get_type_c_name(var116,var118);
+var120 = oomph_string_concat(var114,var119);
+var121 = var113->memb_args;
+incref(var121);
+var122 = var113->memb_result;
+incref(var122);
+var123 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item1 = var122 }, .membernum = 1 };
+var122 = NULL;
+var124 = meth_FunctionEmitter_34815fc0d7_emit_call(var1,var120,var121,var123);
+retval = var124; var124.buf = NULL;
+goto out;
+label13: (void)0;
+
+            if (var2.membernum != 13)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var125 = var2.val.item13;
+            incref(var125);
+var126 = var125->memb_value;
+incref__null___LocalVariable__494c1a2e12(var126);
+
+            var127 = (
+                var126.membernum == 1
+            );
+            if (var127) goto label128;
+
+            var127 = (
+                var126.membernum == 0
+            );
+            if (var127) goto label129;
+label128: (void)0;
+
+            if (var126.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var130 = var126.val.item1;
+            incref(var130);
+var131 = string13___________________________d08d32af12; string_incref(var131);
+var132 = meth_FunctionEmitter_34815fc0d7_incref_var(var1,var130);
+var133 = oomph_string_concat(var131,var132);
+var134 = string14___________________________retval____f5d6fb56c5; string_incref(var134);
+var135 = oomph_string_concat(var133,var134);
+var136 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var130 }, .membernum = 2 };
+var130 = NULL;
+var137 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var136);
+var138 = oomph_string_concat(var135,var137);
+var139 = string15___________________________goto_out___________________________650a8c98d4; string_incref(var139);
+var140 = oomph_string_concat(var138,var139);
+retval = var140; var140.buf = NULL;
+goto out;
+label129: (void)0;
+
+            if (var126.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var141 = var126.val.item0;
+            var142 = string16_goto_out___676729e0b5; string_incref(var142);
+retval = var142; var142.buf = NULL;
+goto out;
+label143: (void)0;
+if (oomph_true) goto label144;
+label14: (void)0;
+
+            if (var2.membernum != 4)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var145 = var2.val.item4;
+            incref(var145);
+var146 = var145->memb_result;
+incref(var146);
+var147 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var146 }, .membernum = 2 };
+var146 = NULL;
+var148 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var147);
+var149 = string2_____946eafb09a; string_incref(var149);
+var150 = oomph_string_concat(var148,var149);
+var151 = var145->memb_obj;
+incref(var151);
+var152 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var151 }, .membernum = 2 };
+var151 = NULL;
+var153 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var152);
+var154 = oomph_string_concat(var150,var153);
+var155 = string17___memb__0a553a4ce9; string_incref(var155);
+var156 = oomph_string_concat(var154,var155);
+var157 = var145->memb_attribute;
+string_incref(var157);
+var158 = oomph_string_concat(var156,var157);
+var159 = string9____490609e25d; string_incref(var159);
+var160 = oomph_string_concat(var158,var159);
+retval = var160; var160.buf = NULL;
+goto out;
+label15: (void)0;
+
+            if (var2.membernum != 14)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var161 = var2.val.item14;
+            incref(var161);
+var162 = var161->memb_obj;
+incref(var162);
+var163 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var162 }, .membernum = 2 };
+var162 = NULL;
+var164 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var163);
+var165 = string17___memb__0a553a4ce9; string_incref(var165);
+var166 = oomph_string_concat(var164,var165);
+var167 = var161->memb_attribute;
+string_incref(var167);
+var168 = oomph_string_concat(var166,var167);
+var169 = string2_____946eafb09a; string_incref(var169);
+var170 = oomph_string_concat(var168,var169);
+var171 = var161->memb_value;
+incref(var171);
+var172 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var171 }, .membernum = 2 };
+var171 = NULL;
+var173 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var172);
+var174 = oomph_string_concat(var170,var173);
+var175 = string9____490609e25d; string_incref(var175);
+var176 = oomph_string_concat(var174,var175);
+retval = var176; var176.buf = NULL;
+goto out;
+label16: (void)0;
+
+            if (var2.membernum != 12)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var177 = var2.val.item12;
+            incref(var177);
+var178 = var177->memb_result;
+incref(var178);
+var179 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var178 }, .membernum = 2 };
+var178 = NULL;
+var180 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var179);
+var181 = string18______b2511f85b9; string_incref(var181);
+var182 = oomph_string_concat(var180,var181);
+var183 = var177->memb_lhs;
+incref(var183);
+var184 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var183 }, .membernum = 2 };
+var183 = NULL;
+var185 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var184);
+var186 = oomph_string_concat(var182,var185);
+var187 = string19______483564d860; string_incref(var187);
+var188 = oomph_string_concat(var186,var187);
+var189 = var177->memb_rhs;
+incref(var189);
+var190 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var189 }, .membernum = 2 };
+var189 = NULL;
+var191 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var190);
+var192 = oomph_string_concat(var188,var191);
+var193 = string4_____2ce2c8b2a2; string_incref(var193);
+var194 = oomph_string_concat(var192,var193);
+retval = var194; var194.buf = NULL;
+goto out;
+label17: (void)0;
+
+            if (var2.membernum != 9)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var195 = var2.val.item9;
+            incref(var195);
+var196 = var195->memb_result;
+var197 = var196->memb_type;
+var196 = NULL;
+incref_Type_87e1ce5c5e(var197);
+
+            if (var197.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var198 = var197.val.item3;
+            incref(var198);
+var199 = var198->memb_type_members;
+incref(var199);
+var200 = var195->memb_value;
+var201 = var200->memb_type;
+var200 = NULL;
+incref_Type_87e1ce5c5e(var201);
+var202 = meth_List_Type__057f9c6088_find_only(var199,var201);
+var203 = string6___________________092d1ac1a4; string_incref(var203);
+var204 = var195->memb_result;
+incref(var204);
+var205 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var204 }, .membernum = 2 };
+var204 = NULL;
+var206 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var205);
+var207 = oomph_string_concat(var203,var206);
+var208 = string18______b2511f85b9; string_incref(var208);
+var209 = oomph_string_concat(var207,var208);
+var210 = var1->memb_file_pair;
+incref(var210);
+var211 = (struct class_Type_87e1ce5c5e){ .val = { .item3 = var198 }, .membernum = 3 };
+var198 = NULL;
+var212 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var211 }, .membernum = 1 };
+var211.membernum = -1;
+var213 = meth_FilePair_99df852164_emit_type(var210,var212);
+var214 = oomph_string_concat(var209,var213);
+var215 = string20__________________________val______item_6197bcd4fd; string_incref(var215);
+var216 = oomph_string_concat(var214,var215);
+var217 = meth_Int_to_string(var202);
+var218 = oomph_string_concat(var216,var217);
+var219 = string2_____946eafb09a; string_incref(var219);
+var220 = oomph_string_concat(var218,var219);
+var221 = var195->memb_value;
+incref(var221);
+var222 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var221 }, .membernum = 2 };
+var221 = NULL;
+var223 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var222);
+var224 = oomph_string_concat(var220,var223);
+var225 = string21__________________________membernum____8b962003b6; string_incref(var225);
+var226 = oomph_string_concat(var224,var225);
+var227 = meth_Int_to_string(var202);
+var228 = oomph_string_concat(var226,var227);
+var229 = string22_______________________________________ce5430e47f; string_incref(var229);
+var230 = oomph_string_concat(var228,var229);
+retval = var230; var230.buf = NULL;
+goto out;
+label18: (void)0;
+
+            if (var2.membernum != 5)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var231 = var2.val.item5;
+            incref(var231);
+var232 = var231->memb_union_var;
+var233 = var232->memb_type;
+var232 = NULL;
+incref_Type_87e1ce5c5e(var233);
+
+            if (var233.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var234 = var233.val.item3;
+            incref(var234);
+var235 = var234->memb_type_members;
+incref(var235);
+var236 = var231->memb_result;
+var237 = var236->memb_type;
+var236 = NULL;
+incref_Type_87e1ce5c5e(var237);
+var238 = meth_List_Type__057f9c6088_find_only(var235,var237);
+var239 = string23__________________if___3fb45db31a; string_incref(var239);
+var240 = var231->memb_union_var;
+incref(var240);
+var241 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var240 }, .membernum = 2 };
+var240 = NULL;
+var242 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var241);
+var243 = oomph_string_concat(var239,var242);
+var244 = string24__membernum_____f04718803d; string_incref(var244);
+var245 = oomph_string_concat(var243,var244);
+var246 = meth_Int_to_string(var238);
+var247 = oomph_string_concat(var245,var246);
+var248 = string25_______________________panic_printf___as__failed_________TODO__better_message____________________60ee8d2345; string_incref(var248);
+var249 = oomph_string_concat(var247,var248);
+var250 = var231->memb_result;
+incref(var250);
+var251 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var250 }, .membernum = 2 };
+var250 = NULL;
+var252 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var251);
+var253 = oomph_string_concat(var249,var252);
+var254 = string2_____946eafb09a; string_incref(var254);
+var255 = oomph_string_concat(var253,var254);
+var256 = var231->memb_union_var;
+incref(var256);
+var257 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var256 }, .membernum = 2 };
+var256 = NULL;
+var258 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var257);
+var259 = oomph_string_concat(var255,var258);
+var260 = string26__val_item_4797b8fb11; string_incref(var260);
+var261 = oomph_string_concat(var259,var260);
+var262 = meth_Int_to_string(var238);
+var263 = oomph_string_concat(var261,var262);
+var264 = string7____________________f53500acd0; string_incref(var264);
+var265 = oomph_string_concat(var263,var264);
+retval = var265; var265.buf = NULL;
+goto out;
+label19: (void)0;
+
+            if (var2.membernum != 16)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var266 = var2.val.item16;
+            incref(var266);
+var267 = var266->memb_var;
+var268 = var267->memb_type;
+var267 = NULL;
+incref_Type_87e1ce5c5e(var268);
+
+            var269 = (
+                var268.membernum == 3
+            );
+            if (var269) goto label270;
+
+            var269 = (
+                var268.membernum == 0
+            );
+            if (var269) goto label271;
+
+            var269 = (
+                var268.membernum == 1
+            );
+            if (var269) goto label271;
+
+            var269 = (
+                var268.membernum == 2
+            );
+            if (var269) goto label271;
+label270: (void)0;
+
+            if (var268.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var272 = var268.val.item3;
+            incref(var272);
+var273 = var266->memb_var;
+incref(var273);
+var274 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var273 }, .membernum = 2 };
+var273 = NULL;
+var275 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var274);
+var276 = string27__membernum____1___dafb6f8bb2; string_incref(var276);
+var277 = oomph_string_concat(var275,var276);
+retval = var277; var277.buf = NULL;
+goto out;
+label271: (void)0;
+var278 = var266->memb_var;
+var279 = var278->memb_type;
+var278 = NULL;
+incref_Type_87e1ce5c5e(var279);
+var280 = var1->memb_file_pair;
+var281 = var280->memb_session;
+var280 = NULL;
+incref(var281);
+var282 = var281->memb_builtins;
+incref(var282);
+var283 = var282->memb_STR;
+incref_Type_87e1ce5c5e(var283);
+var284 = meth_Type_87e1ce5c5e_equals(var279,var283);
+if (var284) goto label285;
+if (oomph_true) goto label286;
+label285: (void)0;
+var287 = var266->memb_var;
+incref(var287);
+var288 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var287 }, .membernum = 2 };
+var287 = NULL;
+var289 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var288);
+var290 = string28__buf___NULL___349875091e; string_incref(var290);
+var291 = oomph_string_concat(var289,var290);
+retval = var291; var291.buf = NULL;
+goto out;
+label286: (void)0;
+var292 = var266->memb_var;
+var293 = var292->memb_type;
+var292 = NULL;
+incref_Type_87e1ce5c5e(var293);
+var294 = ir_4b1a3e0393_is_refcounted(var293);
+if (var294) goto label295;
+if (oomph_true) goto label296;
+label295: (void)0;
+var297 = var266->memb_var;
+incref(var297);
+var298 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var297 }, .membernum = 2 };
+var297 = NULL;
+var299 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var298);
+var300 = string29____NULL___df2d91d78a; string_incref(var300);
+var301 = oomph_string_concat(var299,var300);
+retval = var301; var301.buf = NULL;
+goto out;
+label296: (void)0;
+var302 = string5__bcbd231d6e; string_incref(var302);
+retval = var302; var302.buf = NULL;
+goto out;
+label303: (void)0;
+if (oomph_true) goto label144;
+label20: (void)0;
+
+            if (var2.membernum != 7)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var304 = var2.val.item7;
+            incref(var304);
+var305 = meth_FunctionEmitter_34815fc0d7_get_label_name(var1,var304);
+var306 = c_output_6a23cf54cc_emit_label(var305);
+retval = var306; var306.buf = NULL;
+goto out;
+label21: (void)0;
+
+            if (var2.membernum != 6)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var307 = var2.val.item6;
+            incref(var307);
+var308 = string23__________________if___3fb45db31a; string_incref(var308);
+var309 = var307->memb_cond;
+incref(var309);
+var310 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var309 }, .membernum = 2 };
+var309 = NULL;
+var311 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var310);
+var312 = oomph_string_concat(var308,var311);
+var313 = string30_______________________goto__b43ec08d47; string_incref(var313);
+var314 = oomph_string_concat(var312,var313);
+var315 = var307->memb_label;
+incref(var315);
+var316 = meth_FunctionEmitter_34815fc0d7_get_label_name(var1,var315);
+var317 = oomph_string_concat(var314,var316);
+var318 = string7____________________f53500acd0; string_incref(var318);
+var319 = oomph_string_concat(var317,var318);
+retval = var319; var319.buf = NULL;
+goto out;
+label22: (void)0;
+
+            if (var2.membernum != 17)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var320 = var2.val.item17;
+            incref(var320);
+var321 = var320->memb_union_var;
+var322 = var321->memb_type;
+var321 = NULL;
+incref_Type_87e1ce5c5e(var322);
+
+            if (var322.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var323 = var322.val.item3;
+            incref(var323);
+var324 = var323->memb_type_members;
+incref(var324);
+var325 = var320->memb_member_type;
+incref_Type_87e1ce5c5e(var325);
+var326 = meth_List_Type__057f9c6088_find_only(var324,var325);
+var327 = var320->memb_result;
+incref(var327);
+var328 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var327 }, .membernum = 2 };
+var327 = NULL;
+var329 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var328);
+var330 = string18______b2511f85b9; string_incref(var330);
+var331 = oomph_string_concat(var329,var330);
+var332 = var320->memb_union_var;
+incref(var332);
+var333 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var332 }, .membernum = 2 };
+var332 = NULL;
+var334 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var333);
+var335 = oomph_string_concat(var331,var334);
+var336 = string31__membernum_____e3adb3fc5a; string_incref(var336);
+var337 = oomph_string_concat(var335,var336);
+var338 = meth_Int_to_string(var326);
+var339 = oomph_string_concat(var337,var338);
+var340 = string4_____2ce2c8b2a2; string_incref(var340);
+var341 = oomph_string_concat(var339,var340);
+retval = var341; var341.buf = NULL;
+goto out;
+label144: (void)0;
+out: (void)0;
+string_decref(var341);
+string_decref(var340);
+string_decref(var339);
+string_decref(var338);
+string_decref(var337);
+string_decref(var336);
+string_decref(var335);
+string_decref(var334);
+decref_Variable_1aaa81c8d2(var333);
+decref((var332), dtor_LocalVariable_846080e5ae);
+string_decref(var331);
+string_decref(var330);
+string_decref(var329);
+decref_Variable_1aaa81c8d2(var328);
+decref((var327), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref_Type_87e1ce5c5e(var325);
+decref((var324), dtor_List_Type__057f9c6088);
+decref((var323), dtor_UnionType_7f899bced1);
+decref_Type_87e1ce5c5e(var322);
+decref((var321), dtor_LocalVariable_846080e5ae);
+decref((var320), dtor_UnionMemberCheck_7021628c40);
+string_decref(var319);
+string_decref(var318);
+string_decref(var317);
+string_decref(var316);
+decref((var315), dtor_GotoLabel_9654b8ee6d);
+string_decref(var314);
+string_decref(var313);
+string_decref(var312);
+string_decref(var311);
+decref_Variable_1aaa81c8d2(var310);
+decref((var309), dtor_LocalVariable_846080e5ae);
+string_decref(var308);
+decref((var307), dtor_GotoIf_feb019130f);
+string_decref(var306);
+string_decref(var305);
+decref((var304), dtor_GotoLabel_9654b8ee6d);
+string_decref(var302);
+string_decref(var301);
+string_decref(var300);
+string_decref(var299);
+decref_Variable_1aaa81c8d2(var298);
+decref((var297), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref_Type_87e1ce5c5e(var293);
+decref((var292), dtor_LocalVariable_846080e5ae);
+string_decref(var291);
+string_decref(var290);
+string_decref(var289);
+decref_Variable_1aaa81c8d2(var288);
+decref((var287), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref_Type_87e1ce5c5e(var283);
+decref((var282), dtor_Builtins_bd980a9f08);
+decref((var281), dtor_Session_88204c75ff);
+decref((var280), dtor_FilePair_99df852164);
+decref_Type_87e1ce5c5e(var279);
+decref((var278), dtor_LocalVariable_846080e5ae);
+string_decref(var277);
+string_decref(var276);
+string_decref(var275);
+decref_Variable_1aaa81c8d2(var274);
+decref((var273), dtor_LocalVariable_846080e5ae);
+decref((var272), dtor_UnionType_7f899bced1);
+(void)0;
+decref_Type_87e1ce5c5e(var268);
+decref((var267), dtor_LocalVariable_846080e5ae);
+decref((var266), dtor_UnSet_a1ce71f609);
+string_decref(var265);
+string_decref(var264);
+string_decref(var263);
+string_decref(var262);
+string_decref(var261);
+string_decref(var260);
+string_decref(var259);
+string_decref(var258);
+decref_Variable_1aaa81c8d2(var257);
+decref((var256), dtor_LocalVariable_846080e5ae);
+string_decref(var255);
+string_decref(var254);
+string_decref(var253);
+string_decref(var252);
+decref_Variable_1aaa81c8d2(var251);
+decref((var250), dtor_LocalVariable_846080e5ae);
+string_decref(var249);
+string_decref(var248);
+string_decref(var247);
+string_decref(var246);
+string_decref(var245);
+string_decref(var244);
+string_decref(var243);
+string_decref(var242);
+decref_Variable_1aaa81c8d2(var241);
+decref((var240), dtor_LocalVariable_846080e5ae);
+string_decref(var239);
+(void)0;
+decref_Type_87e1ce5c5e(var237);
+decref((var236), dtor_LocalVariable_846080e5ae);
+decref((var235), dtor_List_Type__057f9c6088);
+decref((var234), dtor_UnionType_7f899bced1);
+decref_Type_87e1ce5c5e(var233);
+decref((var232), dtor_LocalVariable_846080e5ae);
+decref((var231), dtor_GetFromUnion_b0861b839c);
+string_decref(var230);
+string_decref(var229);
+string_decref(var228);
+string_decref(var227);
+string_decref(var226);
+string_decref(var225);
+string_decref(var224);
+string_decref(var223);
+decref_Variable_1aaa81c8d2(var222);
+decref((var221), dtor_LocalVariable_846080e5ae);
+string_decref(var220);
+string_decref(var219);
+string_decref(var218);
+string_decref(var217);
+string_decref(var216);
+string_decref(var215);
+string_decref(var214);
+string_decref(var213);
+decref__null___Type__8438ac3dcf(var212);
+decref_Type_87e1ce5c5e(var211);
+decref((var210), dtor_FilePair_99df852164);
+string_decref(var209);
+string_decref(var208);
+string_decref(var207);
+string_decref(var206);
+decref_Variable_1aaa81c8d2(var205);
+decref((var204), dtor_LocalVariable_846080e5ae);
+string_decref(var203);
+(void)0;
+decref_Type_87e1ce5c5e(var201);
+decref((var200), dtor_LocalVariable_846080e5ae);
+decref((var199), dtor_List_Type__057f9c6088);
+decref((var198), dtor_UnionType_7f899bced1);
+decref_Type_87e1ce5c5e(var197);
+decref((var196), dtor_LocalVariable_846080e5ae);
+decref((var195), dtor_InstantiateUnion_29af05529f);
+string_decref(var194);
+string_decref(var193);
+string_decref(var192);
+string_decref(var191);
+decref_Variable_1aaa81c8d2(var190);
+decref((var189), dtor_LocalVariable_846080e5ae);
+string_decref(var188);
+string_decref(var187);
+string_decref(var186);
+string_decref(var185);
+decref_Variable_1aaa81c8d2(var184);
+decref((var183), dtor_LocalVariable_846080e5ae);
+string_decref(var182);
+string_decref(var181);
+string_decref(var180);
+decref_Variable_1aaa81c8d2(var179);
+decref((var178), dtor_LocalVariable_846080e5ae);
+decref((var177), dtor_PointersEqual_deb0abf3fc);
+string_decref(var176);
+string_decref(var175);
+string_decref(var174);
+string_decref(var173);
+decref_Variable_1aaa81c8d2(var172);
+decref((var171), dtor_LocalVariable_846080e5ae);
+string_decref(var170);
+string_decref(var169);
+string_decref(var168);
+string_decref(var167);
+string_decref(var166);
+string_decref(var165);
+string_decref(var164);
+decref_Variable_1aaa81c8d2(var163);
+decref((var162), dtor_LocalVariable_846080e5ae);
+decref((var161), dtor_SetAttribute_25344a82b6);
+string_decref(var160);
+string_decref(var159);
+string_decref(var158);
+string_decref(var157);
+string_decref(var156);
+string_decref(var155);
+string_decref(var154);
+string_decref(var153);
+decref_Variable_1aaa81c8d2(var152);
+decref((var151), dtor_LocalVariable_846080e5ae);
+string_decref(var150);
+string_decref(var149);
+string_decref(var148);
+decref_Variable_1aaa81c8d2(var147);
+decref((var146), dtor_LocalVariable_846080e5ae);
+decref((var145), dtor_GetAttribute_3d0cc1bf97);
+string_decref(var142);
+(void)0;
+string_decref(var140);
+string_decref(var139);
+string_decref(var138);
+string_decref(var137);
+decref_Variable_1aaa81c8d2(var136);
+string_decref(var135);
+string_decref(var134);
+string_decref(var133);
+string_decref(var132);
+string_decref(var131);
+decref((var130), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var126);
+decref((var125), dtor_Return_aa2d9b1c64);
+string_decref(var124);
+decref__null___LocalVariable__494c1a2e12(var123);
+decref((var122), dtor_LocalVariable_846080e5ae);
+decref((var121), dtor_List_LocalVariable__81e23234f3);
+string_decref(var120);
+string_decref(var119);
+decref_Type_87e1ce5c5e(var118);
+decref((var117), dtor_LocalVariable_846080e5ae);
+decref((var116), dtor_Session_88204c75ff);
+decref((var115), dtor_FilePair_99df852164);
+string_decref(var114);
+decref((var113), dtor_ConstructorCall_f8e441a21d);
+string_decref(var112);
+decref__null___LocalVariable__494c1a2e12(var111);
+string_decref(var110);
+string_decref(var109);
+string_decref(var108);
+string_decref(var107);
+string_decref(var106);
+string_decref(var105);
+decref_Type_87e1ce5c5e(var104);
+decref((var103), dtor_LocalVariable_846080e5ae);
+decref((var102), dtor_Session_88204c75ff);
+decref((var101), dtor_FilePair_99df852164);
+string_decref(var100);
+decref((var99), dtor_List_LocalVariable__81e23234f3);
+decref((var98), dtor_List_LocalVariable__81e23234f3);
+decref((var97), dtor_LocalVariable_846080e5ae);
+decref((var96), dtor_MethodCall_b0095be49c);
+string_decref(var95);
+decref__null___LocalVariable__494c1a2e12(var94);
+decref((var93), dtor_List_LocalVariable__81e23234f3);
+string_decref(var92);
+decref_Variable_1aaa81c8d2(var91);
+decref((var90), dtor_FunctionCall_104f394575);
+string_decref(var89);
+string_decref(var88);
+string_decref(var87);
+decref_Type_87e1ce5c5e(var86);
+decref((var85), dtor_LocalVariable_846080e5ae);
+string_decref(var84);
+decref_Variable_1aaa81c8d2(var83);
+decref((var82), dtor_LocalVariable_846080e5ae);
+decref((var81), dtor_Session_88204c75ff);
+decref((var80), dtor_FilePair_99df852164);
+decref((var79), dtor_DecRef_f37e9a69d2);
+string_decref(var78);
+string_decref(var77);
+string_decref(var76);
+decref((var75), dtor_LocalVariable_846080e5ae);
+decref((var74), dtor_IncRef_54322428a7);
+string_decref(var73);
+string_decref(var72);
+string_decref(var71);
+string_decref(var70);
+decref_Variable_1aaa81c8d2(var69);
+string_decref(var68);
+string_decref(var67);
+string_decref(var66);
+decref_Variable_1aaa81c8d2(var65);
+decref((var64), dtor_LocalVariable_846080e5ae);
+decref((var63), dtor_VarCpy_e77a538911);
+string_decref(var62);
+string_decref(var61);
+string_decref(var60);
+string_decref(var59);
+string_decref(var58);
+string_decref(var57);
+string_decref(var56);
+decref_Variable_1aaa81c8d2(var55);
+decref((var54), dtor_LocalVariable_846080e5ae);
+decref((var53), dtor_FloatConstant_652a176e04);
+string_decref(var52);
+string_decref(var51);
+string_decref(var50);
+string_decref(var49);
+(void)0;
+string_decref(var47);
+string_decref(var46);
+string_decref(var45);
+decref_Variable_1aaa81c8d2(var44);
+decref((var43), dtor_LocalVariable_846080e5ae);
+decref((var42), dtor_IntConstant_817d6312f0);
+string_decref(var41);
+string_decref(var40);
+string_decref(var39);
+string_decref(var38);
+decref((var37), dtor_LocalVariable_846080e5ae);
+string_decref(var36);
+string_decref(var35);
+string_decref(var34);
+string_decref(var33);
+string_decref(var32);
+decref((var31), dtor_FilePair_99df852164);
+string_decref(var30);
+string_decref(var29);
+string_decref(var28);
+string_decref(var27);
+decref_Variable_1aaa81c8d2(var26);
+decref((var25), dtor_LocalVariable_846080e5ae);
+string_decref(var24);
+decref((var23), dtor_StringConstant_e1466967c8);
+(void)0;
+return retval;
+}struct class_Str meth_FunctionEmitter_34815fc0d7_get_label_name(struct class_FunctionEmitter_34815fc0d7* var1, struct class_GotoLabel_9654b8ee6d* var2){struct class_List_GotoLabel__152f526689* var3;
+var3 = NULL;
+bool var4;
+bool var5;
+struct class_List_GotoLabel__152f526689* var8;
+var8 = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_List_GotoLabel__152f526689* var10;
+var10 = NULL;
+int64_t var11;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str retval;
+var3 = var1->memb_labels;
+incref(var3);
+var4 = meth_List_GotoLabel__152f526689___contains(var3,var2);
+var5 = oomph_bool_not(var4);
+if (var5) goto label6;
+if (oomph_true) goto label7;
+label6: (void)0;
+var8 = var1->memb_labels;
+incref(var8);
+meth_List_GotoLabel__152f526689_push(var8,var2);
+label7: (void)0;
+var9 = string32_label_f89ed6d3a8; string_incref(var9);
+var10 = var1->memb_labels;
+incref(var10);
+var11 = meth_List_GotoLabel__152f526689_find_only(var10,var2);
+var12 = meth_Int_to_string(var11);
+var13 = oomph_string_concat(var9,var12);
+retval = var13; var13.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var13);
+string_decref(var12);
+(void)0;
+decref((var10), dtor_List_GotoLabel__152f526689);
+string_decref(var9);
+decref((var8), dtor_List_GotoLabel__152f526689);
+(void)0;
+(void)0;
+decref((var3), dtor_List_GotoLabel__152f526689);
+return retval;
+}void meth_FunctionEmitter_34815fc0d7_add_local_var(struct class_FunctionEmitter_34815fc0d7* var1, struct class_LocalVariable_846080e5ae* var2, bool var3, bool var4){struct class_List_LocalVariable__81e23234f3* var5;
+var5 = NULL;
+bool var6;
+bool var7;
+struct class_Str var8;
+var8.buf = NULL;
+int64_t var9;
+struct class_List_LocalVariable__81e23234f3* var10;
+var10 = NULL;
+struct class_Variable_1aaa81c8d2 var11;
+var11.membernum = -1;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_FilePair_99df852164* var17;
+var17 = NULL;
+struct class_Type_87e1ce5c5e var18;
+var18.membernum = -1;
+struct class__null___Type__8438ac3dcf var19;
+var19.membernum = -1;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+struct class_UnSet_a1ce71f609* var28;
+var28 = NULL;
+struct class_Instruction_b0fafb4d55 var29;
+var29.membernum = -1;
+struct class_Str var30;
+var30.buf = NULL;
+struct class_Str var31;
+var31.buf = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var35;
+var35 = NULL;
+bool var36;
+bool var37;
+struct class_Str var38;
+var38.buf = NULL;
+int64_t var39;
+struct class_List_LocalVariable__81e23234f3* var40;
+var40 = NULL;
+var5 = var1->memb_local_vars;
+incref(var5);
+var6 = meth_List_LocalVariable__81e23234f3___contains(var5,var2);
+var7 = oomph_bool_not(var6);
+var8 = string33_self_hosted_c_output_oomph_fd84fc210b; string_incref(var8);
+var9 = 164LL;
+oomph_assert(var7,var8,var9);
+var10 = var1->memb_local_vars;
+incref(var10);
+meth_List_LocalVariable__81e23234f3_push(var10,var2);
+var11 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var2 }, .membernum = 2 };
+incref(var2);
+var12 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var11);
+if (var3) goto label13;
+if (oomph_true) goto label14;
+label13: (void)0;
+var15 = var1->memb_before_body;
+string_incref(var15);
+var16 = string34_______________78d1fd569c; string_incref(var16);
+var17 = var1->memb_file_pair;
+incref(var17);
+var18 = var2->memb_type;
+incref_Type_87e1ce5c5e(var18);
+var19 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var18 }, .membernum = 1 };
+var18.membernum = -1;
+var20 = meth_FilePair_99df852164_emit_type(var17,var19);
+var21 = oomph_string_concat(var16,var20);
+var22 = string35___d57d80595e; string_incref(var22);
+var23 = oomph_string_concat(var21,var22);
+var24 = oomph_string_concat(var23,var12);
+var25 = string36________________3e01ab3ed7; string_incref(var25);
+var26 = oomph_string_concat(var24,var25);
+var27 = oomph_string_concat(var15,var26);
+var28 = ctor_UnSet_a1ce71f609(var2);
+var29 = (struct class_Instruction_b0fafb4d55){ .val = { .item16 = var28 }, .membernum = 16 };
+var28 = NULL;
+var30 = meth_FunctionEmitter_34815fc0d7_emit_instruction(var1,var29);
+var31 = oomph_string_concat(var27,var30);
+var32 = var1->memb_before_body;
+var1->memb_before_body = var31;
+var31.buf = NULL;
+label14: (void)0;
+if (var4) goto label33;
+if (oomph_true) goto label34;
+label33: (void)0;
+var35 = var1->memb_need_decref;
+incref(var35);
+var36 = meth_List_LocalVariable__81e23234f3___contains(var35,var2);
+var37 = oomph_bool_not(var36);
+var38 = string33_self_hosted_c_output_oomph_fd84fc210b; string_incref(var38);
+var39 = 175LL;
+oomph_assert(var37,var38,var39);
+var40 = var1->memb_need_decref;
+incref(var40);
+meth_List_LocalVariable__81e23234f3_push(var40,var2);
+label34: (void)0;
+out: (void)0;
+decref((var40), dtor_List_LocalVariable__81e23234f3);
+(void)0;
+string_decref(var38);
+(void)0;
+(void)0;
+decref((var35), dtor_List_LocalVariable__81e23234f3);
+string_decref(var32);
+string_decref(var31);
+string_decref(var30);
+decref_Instruction_b0fafb4d55(var29);
+decref((var28), dtor_UnSet_a1ce71f609);
+string_decref(var27);
+string_decref(var26);
+string_decref(var25);
+string_decref(var24);
+string_decref(var23);
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+decref__null___Type__8438ac3dcf(var19);
+decref_Type_87e1ce5c5e(var18);
+decref((var17), dtor_FilePair_99df852164);
+string_decref(var16);
+string_decref(var15);
+string_decref(var12);
+decref_Variable_1aaa81c8d2(var11);
+decref((var10), dtor_List_LocalVariable__81e23234f3);
+(void)0;
+string_decref(var8);
+(void)0;
+(void)0;
+decref((var5), dtor_List_LocalVariable__81e23234f3);
+}struct class_Str meth_FunctionEmitter_34815fc0d7_emit_var(struct class_FunctionEmitter_34815fc0d7* var1, struct class_Variable_1aaa81c8d2 var2){bool var3;
+struct class_LocalVariable_846080e5ae* var6;
+var6 = NULL;
+struct class_List_LocalVariable__81e23234f3* var7;
+var7 = NULL;
+bool var8;
+bool var9;
+bool var12;
+bool var13;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var15;
+var15 = NULL;
+int64_t var16;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_FilePair_99df852164* var19;
+var19 = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str retval;
+
+            var3 = (
+                var2.membernum == 2
+            );
+            if (var3) goto label4;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) goto label5;
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) goto label5;
+label4: (void)0;
+
+            if (var2.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var6 = var2.val.item2;
+            incref(var6);
+var7 = var1->memb_local_vars;
+incref(var7);
+var8 = meth_List_LocalVariable__81e23234f3___contains(var7,var6);
+var9 = oomph_bool_not(var8);
+if (var9) goto label10;
+if (oomph_true) goto label11;
+label10: (void)0;
+var12 = oomph_true;
+var13 = oomph_true;
+meth_FunctionEmitter_34815fc0d7_add_local_var(var1,var6,var12,var13);
+label11: (void)0;
+var14 = string37_var_89b1de7c1f; string_incref(var14);
+var15 = var1->memb_local_vars;
+incref(var15);
+var16 = meth_List_LocalVariable__81e23234f3_find_only(var15,var6);
+var17 = meth_Int_to_string(var16);
+var18 = oomph_string_concat(var14,var17);
+retval = var18; var18.buf = NULL;
+goto out;
+label5: (void)0;
+var19 = var1->memb_file_pair;
+incref(var19);
+var20 = meth_FilePair_99df852164_emit_var(var19,var2);
+retval = var20; var20.buf = NULL;
+goto out;
+label21: (void)0;
+out: (void)0;
+string_decref(var20);
+decref((var19), dtor_FilePair_99df852164);
+string_decref(var18);
+string_decref(var17);
+(void)0;
+decref((var15), dtor_List_LocalVariable__81e23234f3);
+string_decref(var14);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_LocalVariable__81e23234f3);
+decref((var6), dtor_LocalVariable_846080e5ae);
+(void)0;
+return retval;
+}void meth_FunctionEmitter_34815fc0d7_emit_funcdef(struct class_FunctionEmitter_34815fc0d7* var1, struct class__FuncDef___MethodDef__5505a52ad0 var2, struct class_Str var3){bool var4;
+struct class_FuncDef_2bd6886a53* var7;
+var7 = NULL;
+struct class_List_LocalVariable__81e23234f3* var8;
+var8 = NULL;
+struct class_FileVariable_a7b8ca651f* var9;
+var9 = NULL;
+struct class_Type_87e1ce5c5e var10;
+var10.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var11;
+var11 = NULL;
+struct class_List_Instruction__6e475c861a* var12;
+var12 = NULL;
+struct class_MethodDef_28b65923b5* var14;
+var14 = NULL;
+struct class_List_LocalVariable__81e23234f3* var15;
+var15 = NULL;
+struct class_FunctionType_4e16d0ea53* var16;
+var16 = NULL;
+struct class_List_Instruction__6e475c861a* var17;
+var17 = NULL;
+struct class_List_LocalVariable__81e23234f3* var18;
+var18 = NULL;
+int64_t var19;
+struct class_LocalVariable_846080e5ae* var21;
+var21 = NULL;
+bool var23;
+bool var24;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var26;
+var26 = NULL;
+struct class_List_LocalVariable__81e23234f3* var27;
+var27 = NULL;
+struct class_List_Str__43b70c06cb* var28;
+var28 = NULL;
+int64_t var29;
+int64_t var30;
+struct class_LocalVariable_846080e5ae* var32;
+var32 = NULL;
+struct class_FilePair_99df852164* var34;
+var34 = NULL;
+struct class_Session_88204c75ff* var35;
+var35 = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+struct class_Variable_1aaa81c8d2 var37;
+var37.membernum = -1;
+struct class_Type_87e1ce5c5e var38;
+var38.membernum = -1;
+struct class_Str var39;
+var39.buf = NULL;
+struct class_Str var40;
+var40.buf = NULL;
+struct class_Str var41;
+var41.buf = NULL;
+struct class_Str var42;
+var42.buf = NULL;
+struct class_Str var43;
+var43.buf = NULL;
+struct class__null___Type__8438ac3dcf var44;
+var44.membernum = -1;
+char var45;
+struct class__null___Type__8438ac3dcf var46;
+var46.membernum = -1;
+bool var47;
+bool var48;
+struct class_Str var51;
+var51.buf = NULL;
+struct class_Str var52;
+var52.buf = NULL;
+struct class_FilePair_99df852164* var53;
+var53 = NULL;
+struct class__null___Type__8438ac3dcf var54;
+var54.membernum = -1;
+struct class_Type_87e1ce5c5e var55;
+var55.membernum = -1;
+struct class__null___Type__8438ac3dcf var56;
+var56.membernum = -1;
+struct class_Str var57;
+var57.buf = NULL;
+struct class_Str var58;
+var58.buf = NULL;
+struct class_Str var59;
+var59.buf = NULL;
+struct class_Str var60;
+var60.buf = NULL;
+struct class_Str var61;
+var61.buf = NULL;
+struct class_Str var62;
+var62.buf = NULL;
+struct class_Str var63;
+var63.buf = NULL;
+struct class_Str var64;
+var64.buf = NULL;
+struct class_Str var65;
+var65.buf = NULL;
+struct class_Str var66;
+var66.buf = NULL;
+struct class_List_Str__43b70c06cb* var67;
+var67 = NULL;
+struct class_List_LocalVariable__81e23234f3* var68;
+var68 = NULL;
+int64_t var69;
+struct class_LocalVariable_846080e5ae* var71;
+var71 = NULL;
+struct class_Str var73;
+var73.buf = NULL;
+struct class_Variable_1aaa81c8d2 var74;
+var74.membernum = -1;
+struct class_FilePair_99df852164* var75;
+var75 = NULL;
+struct class_Str var76;
+var76.buf = NULL;
+struct class_Str var77;
+var77.buf = NULL;
+struct class_Str var78;
+var78.buf = NULL;
+struct class_Str var79;
+var79.buf = NULL;
+struct class_Str var80;
+var80.buf = NULL;
+struct class_Str var81;
+var81.buf = NULL;
+struct class_Str var82;
+var82.buf = NULL;
+struct class_Str var83;
+var83.buf = NULL;
+struct class__null___List_Str___1b0213dad9 var84;
+var84.membernum = -1;
+struct class__null___Str__5eca9cec4f var85;
+var85.membernum = -1;
+
+            var4 = (
+                var2.membernum == 0
+            );
+            if (var4) goto label5;
+
+            var4 = (
+                var2.membernum == 1
+            );
+            if (var4) goto label6;
+label5: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var7 = var2.val.item0;
+            incref(var7);
+var8 = var7->memb_argvars;
+incref(var8);
+var9 = var7->memb_var;
+var10 = var9->memb_type;
+var9 = NULL;
+incref_Type_87e1ce5c5e(var10);
+
+            if (var10.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var11 = var10.val.item2;
+            incref(var11);
+var12 = var7->memb_body;
+incref(var12);
+if (oomph_true) goto label13;
+label6: (void)0;
+
+            if (var2.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var14 = var2.val.item1;
+            incref(var14);
+var15 = var14->memb_argvars;
+incref(var15);
+var8 = var15;
+var15 = NULL;
+var16 = var14->memb_type;
+incref(var16);
+var11 = var16;
+var16 = NULL;
+var17 = var14->memb_body;
+incref(var17);
+var12 = var17;
+var17 = NULL;
+label13: (void)0;
+var18 = var8;
+incref(var18);
+var19 = 0LL;
+label20: (void)0;
+if (var19 >= var18->len) goto label22;
+decref((var21), dtor_LocalVariable_846080e5ae); var21 = var18->data[var19++]; incref(var21);
+var23 = oomph_false;
+var24 = oomph_false;
+meth_FunctionEmitter_34815fc0d7_add_local_var(var1,var21,var23,var24);
+if (oomph_true) goto label20;
+label22: (void)0;
+var25 = meth_FunctionEmitter_34815fc0d7_emit_body(var1,var12);
+var26 = var1->memb_need_decref;
+incref(var26);
+var27 = meth_List_LocalVariable__81e23234f3_reversed(var26);
+var28 = ctor_List_Str__43b70c06cb();
+var29 = meth_List_LocalVariable__81e23234f3_length(var27);
+meth_List_Str__43b70c06cb___reserve(var28,var29);
+var30 = 0LL;
+label31: (void)0;
+if (var30 >= var27->len) goto label33;
+decref((var32), dtor_LocalVariable_846080e5ae); var32 = var27->data[var30++]; incref(var32);
+var34 = var1->memb_file_pair;
+decref((var35), dtor_Session_88204c75ff);
+var35 = NULL;
+var35 = var34->memb_session;
+var34 = NULL;
+incref(var35);
+string_decref(var36);
+var36.buf = NULL;
+decref_Variable_1aaa81c8d2(var37);
+var37.membernum = -1;
+var37 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var32 }, .membernum = 2 };
+incref(var32);
+var36 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var37);
+decref_Type_87e1ce5c5e(var38);
+var38.membernum = -1;
+var38 = var32->memb_type;
+incref_Type_87e1ce5c5e(var38);
+string_decref(var39);
+var39.buf = NULL;
+var39 = meth_Session_88204c75ff_emit_decref(var35,var36,var38);
+string_decref(var40);
+var40.buf = NULL;
+var40 = string9____490609e25d; string_incref(var40);
+string_decref(var41);
+var41.buf = NULL;
+var41 = oomph_string_concat(var39,var40);
+meth_List_Str__43b70c06cb_push(var28,var41);
+if (oomph_true) goto label31;
+label33: (void)0;
+var42 = string5__bcbd231d6e; string_incref(var42);
+var43 = meth_List_Str__43b70c06cb_join(var28,var42);
+var44 = var11->memb_returntype;
+incref__null___Type__8438ac3dcf(var44);
+var45 = oomph_null;
+var46 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var45 }, .membernum = 0 };
+var47 = meth__null___Type__8438ac3dcf_equals(var44,var46);
+var48 = oomph_bool_not(var47);
+if (var48) goto label49;
+if (oomph_true) goto label50;
+label49: (void)0;
+var51 = var1->memb_before_body;
+string_incref(var51);
+var52 = string34_______________78d1fd569c; string_incref(var52);
+var53 = var1->memb_file_pair;
+incref(var53);
+var54 = var11->memb_returntype;
+incref__null___Type__8438ac3dcf(var54);
+var55 = meth__null___Type__8438ac3dcf_get(var54);
+var56 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+var55.membernum = -1;
+var57 = meth_FilePair_99df852164_emit_type(var53,var56);
+var58 = oomph_string_concat(var52,var57);
+var59 = string38__retval_______________27f6a326c7; string_incref(var59);
+var60 = oomph_string_concat(var58,var59);
+var61 = oomph_string_concat(var51,var60);
+var62 = var1->memb_before_body;
+var1->memb_before_body = var61;
+var61.buf = NULL;
+var63 = var1->memb_after_body;
+string_incref(var63);
+var64 = string39_return_retval___7bc2225875; string_incref(var64);
+var65 = oomph_string_concat(var63,var64);
+var66 = var1->memb_after_body;
+var1->memb_after_body = var65;
+var65.buf = NULL;
+label50: (void)0;
+var67 = ctor_List_Str__43b70c06cb();
+var68 = var8;
+var8 = NULL;
+var69 = 0LL;
+label70: (void)0;
+if (var69 >= var68->len) goto label72;
+decref((var71), dtor_LocalVariable_846080e5ae); var71 = var68->data[var69++]; incref(var71);
+string_decref(var73);
+var73.buf = NULL;
+decref_Variable_1aaa81c8d2(var74);
+var74.membernum = -1;
+var74 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var71 }, .membernum = 2 };
+var71 = NULL;
+var73 = meth_FunctionEmitter_34815fc0d7_emit_var(var1,var74);
+meth_List_Str__43b70c06cb_push(var67,var73);
+if (oomph_true) goto label70;
+label72: (void)0;
+var75 = var1->memb_file_pair;
+incref(var75);
+var76 = var1->memb_before_body;
+string_incref(var76);
+var77 = oomph_string_concat(var76,var25);
+var78 = string40_out_939c3aeb8b; string_incref(var78);
+var79 = c_output_6a23cf54cc_emit_label(var78);
+var80 = oomph_string_concat(var77,var79);
+var81 = oomph_string_concat(var80,var43);
+var82 = var1->memb_after_body;
+string_incref(var82);
+var83 = oomph_string_concat(var81,var82);
+var84 = (struct class__null___List_Str___1b0213dad9){ .val = { .item1 = var67 }, .membernum = 1 };
+var67 = NULL;
+var85 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var83 }, .membernum = 1 };
+var83.buf = NULL;
+meth_FilePair_99df852164_define_function(var75,var3,var11,var84,var85);
+out: (void)0;
+decref__null___Str__5eca9cec4f(var85);
+decref__null___List_Str___1b0213dad9(var84);
+string_decref(var83);
+string_decref(var82);
+string_decref(var81);
+string_decref(var80);
+string_decref(var79);
+string_decref(var78);
+string_decref(var77);
+string_decref(var76);
+decref((var75), dtor_FilePair_99df852164);
+decref_Variable_1aaa81c8d2(var74);
+string_decref(var73);
+decref((var71), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref((var68), dtor_List_LocalVariable__81e23234f3);
+decref((var67), dtor_List_Str__43b70c06cb);
+string_decref(var66);
+string_decref(var65);
+string_decref(var64);
+string_decref(var63);
+string_decref(var62);
+string_decref(var61);
+string_decref(var60);
+string_decref(var59);
+string_decref(var58);
+string_decref(var57);
+decref__null___Type__8438ac3dcf(var56);
+decref_Type_87e1ce5c5e(var55);
+decref__null___Type__8438ac3dcf(var54);
+decref((var53), dtor_FilePair_99df852164);
+string_decref(var52);
+string_decref(var51);
+(void)0;
+(void)0;
+decref__null___Type__8438ac3dcf(var46);
+(void)0;
+decref__null___Type__8438ac3dcf(var44);
+string_decref(var43);
+string_decref(var42);
+string_decref(var41);
+string_decref(var40);
+string_decref(var39);
+decref_Type_87e1ce5c5e(var38);
+decref_Variable_1aaa81c8d2(var37);
+string_decref(var36);
+decref((var35), dtor_Session_88204c75ff);
+decref((var34), dtor_FilePair_99df852164);
+decref((var32), dtor_LocalVariable_846080e5ae);
+(void)0;
+(void)0;
+decref((var28), dtor_List_Str__43b70c06cb);
+decref((var27), dtor_List_LocalVariable__81e23234f3);
+decref((var26), dtor_List_LocalVariable__81e23234f3);
+string_decref(var25);
+(void)0;
+(void)0;
+decref((var21), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref((var18), dtor_List_LocalVariable__81e23234f3);
+decref((var17), dtor_List_Instruction__6e475c861a);
+decref((var16), dtor_FunctionType_4e16d0ea53);
+decref((var15), dtor_List_LocalVariable__81e23234f3);
+decref((var14), dtor_MethodDef_28b65923b5);
+decref((var12), dtor_List_Instruction__6e475c861a);
+decref((var11), dtor_FunctionType_4e16d0ea53);
+decref_Type_87e1ce5c5e(var10);
+decref((var9), dtor_FileVariable_a7b8ca651f);
+decref((var8), dtor_List_LocalVariable__81e23234f3);
+decref((var7), dtor_FuncDef_2bd6886a53);
+(void)0;
+}
@@ -0,0 +1,178 @@
+
+                #ifndef HEADER_GUARD_FunctionEmitter_34815fc0d7
+                #define HEADER_GUARD_FunctionEmitter_34815fc0d7
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Instruction_b0fafb4d55.h"
+#include "Type_87e1ce5c5e.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_FuncDef___MethodDef__5505a52ad0.h"
+#include "_null___List_Str___1b0213dad9.h"
+#include "_null___LocalVariable__494c1a2e12.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "_null___Type__8438ac3dcf.h"
+#include "c_output_6a23cf54cc.h"
+#include "ir_4b1a3e0393.h"
+struct class_FilePair_99df852164;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_GotoLabel__152f526689;
+struct class_List_LocalVariable__81e23234f3;
+struct class_FilePair_99df852164;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_GotoLabel__152f526689;
+struct class_List_LocalVariable__81e23234f3;
+struct class_FilePair_99df852164;
+struct class_Session_88204c75ff;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Str__43b70c06cb;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_Str__43b70c06cb;
+struct class_List_Instruction__6e475c861a;
+struct class_StringConstant_e1466967c8;
+struct class_LocalVariable_846080e5ae;
+struct class_FilePair_99df852164;
+struct class_LocalVariable_846080e5ae;
+struct class_IntConstant_817d6312f0;
+struct class_LocalVariable_846080e5ae;
+struct class_FloatConstant_652a176e04;
+struct class_LocalVariable_846080e5ae;
+struct class_VarCpy_e77a538911;
+struct class_LocalVariable_846080e5ae;
+struct class_IncRef_54322428a7;
+struct class_LocalVariable_846080e5ae;
+struct class_DecRef_f37e9a69d2;
+struct class_FilePair_99df852164;
+struct class_Session_88204c75ff;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_FunctionCall_104f394575;
+struct class_List_LocalVariable__81e23234f3;
+struct class_MethodCall_b0095be49c;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_LocalVariable__81e23234f3;
+struct class_FilePair_99df852164;
+struct class_Session_88204c75ff;
+struct class_LocalVariable_846080e5ae;
+struct class_ConstructorCall_f8e441a21d;
+struct class_FilePair_99df852164;
+struct class_Session_88204c75ff;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Return_aa2d9b1c64;
+struct class_LocalVariable_846080e5ae;
+struct class_GetAttribute_3d0cc1bf97;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_SetAttribute_25344a82b6;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_PointersEqual_deb0abf3fc;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_InstantiateUnion_29af05529f;
+struct class_LocalVariable_846080e5ae;
+struct class_UnionType_7f899bced1;
+struct class_List_Type__057f9c6088;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_FilePair_99df852164;
+struct class_LocalVariable_846080e5ae;
+struct class_GetFromUnion_b0861b839c;
+struct class_LocalVariable_846080e5ae;
+struct class_UnionType_7f899bced1;
+struct class_List_Type__057f9c6088;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_UnSet_a1ce71f609;
+struct class_LocalVariable_846080e5ae;
+struct class_UnionType_7f899bced1;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_FilePair_99df852164;
+struct class_Session_88204c75ff;
+struct class_Builtins_bd980a9f08;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoIf_feb019130f;
+struct class_LocalVariable_846080e5ae;
+struct class_GotoLabel_9654b8ee6d;
+struct class_UnionMemberCheck_7021628c40;
+struct class_LocalVariable_846080e5ae;
+struct class_UnionType_7f899bced1;
+struct class_List_Type__057f9c6088;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_List_GotoLabel__152f526689;
+struct class_List_GotoLabel__152f526689;
+struct class_List_GotoLabel__152f526689;
+struct class_GotoLabel_9654b8ee6d;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_LocalVariable__81e23234f3;
+struct class_FilePair_99df852164;
+struct class_UnSet_a1ce71f609;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_LocalVariable__81e23234f3;
+struct class_FilePair_99df852164;
+struct class_FuncDef_2bd6886a53;
+struct class_List_LocalVariable__81e23234f3;
+struct class_FileVariable_a7b8ca651f;
+struct class_FunctionType_4e16d0ea53;
+struct class_List_Instruction__6e475c861a;
+struct class_MethodDef_28b65923b5;
+struct class_List_LocalVariable__81e23234f3;
+struct class_FunctionType_4e16d0ea53;
+struct class_List_Instruction__6e475c861a;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_Str__43b70c06cb;
+struct class_LocalVariable_846080e5ae;
+struct class_FilePair_99df852164;
+struct class_Session_88204c75ff;
+struct class_FilePair_99df852164;
+struct class_List_Str__43b70c06cb;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_FilePair_99df852164;
+
+            struct class_FunctionEmitter_34815fc0d7 {
+                REFCOUNT_HEADER
+                struct class_FilePair_99df852164* memb_file_pair;
+struct class_List_LocalVariable__81e23234f3* memb_local_vars;
+struct class_List_GotoLabel__152f526689* memb_labels;
+struct class_Str memb_before_body;
+struct class_Str memb_after_body;
+struct class_List_LocalVariable__81e23234f3* memb_need_decref;
+
+            };
+            
+            struct class_FunctionEmitter_34815fc0d7* ctor_FunctionEmitter_34815fc0d7(struct class_FilePair_99df852164* arg_file_pair,struct class_List_LocalVariable__81e23234f3* arg_local_vars,struct class_List_GotoLabel__152f526689* arg_labels,struct class_Str arg_before_body,struct class_Str arg_after_body,struct class_List_LocalVariable__81e23234f3* arg_need_decref);
+            void dtor_FunctionEmitter_34815fc0d7(void *ptr);
+            
+                struct class_Str meth_FunctionEmitter_34815fc0d7_to_string(struct class_FunctionEmitter_34815fc0d7* obj);
+                bool meth_FunctionEmitter_34815fc0d7_equals(struct class_FunctionEmitter_34815fc0d7* var1, struct class_FunctionEmitter_34815fc0d7* var2);
+struct class_Str meth_FunctionEmitter_34815fc0d7_incref_var(struct class_FunctionEmitter_34815fc0d7* var1, struct class_LocalVariable_846080e5ae* var2);
+struct class_Str meth_FunctionEmitter_34815fc0d7_emit_call(struct class_FunctionEmitter_34815fc0d7* var1, struct class_Str var2, struct class_List_LocalVariable__81e23234f3* var3, struct class__null___LocalVariable__494c1a2e12 var4);
+struct class_Str meth_FunctionEmitter_34815fc0d7_emit_body(struct class_FunctionEmitter_34815fc0d7* var1, struct class_List_Instruction__6e475c861a* var2);
+struct class_Str meth_FunctionEmitter_34815fc0d7_emit_instruction(struct class_FunctionEmitter_34815fc0d7* var1, struct class_Instruction_b0fafb4d55 var2);
+struct class_Str meth_FunctionEmitter_34815fc0d7_get_label_name(struct class_FunctionEmitter_34815fc0d7* var1, struct class_GotoLabel_9654b8ee6d* var2);
+void meth_FunctionEmitter_34815fc0d7_add_local_var(struct class_FunctionEmitter_34815fc0d7* var1, struct class_LocalVariable_846080e5ae* var2, bool var3, bool var4);
+struct class_Str meth_FunctionEmitter_34815fc0d7_emit_var(struct class_FunctionEmitter_34815fc0d7* var1, struct class_Variable_1aaa81c8d2 var2);
+void meth_FunctionEmitter_34815fc0d7_emit_funcdef(struct class_FunctionEmitter_34815fc0d7* var1, struct class__FuncDef___MethodDef__5505a52ad0 var2, struct class_Str var3);
+
+                #endif
+                
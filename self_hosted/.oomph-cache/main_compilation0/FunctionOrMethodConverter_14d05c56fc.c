@@ -0,0 +1,9597 @@
+#include <lib/oomph.h>
+#include "FunctionOrMethodConverter_14d05c56fc.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "As_a05f1f16b6.h"
+#include "AutoTypeNode_203f67ecfa.h"
+#include "AutoType_33a5d572cb.h"
+#include "AutoType_39f5d793d6.h"
+#include "BinaryOperator_e25f87d1b5.h"
+#include "Break_2f9897f5fd.h"
+#include "BuiltinVariable_f6e0cdd1b6.h"
+#include "Builtins_bd980a9f08.h"
+#include "Call_d0fb9d6234.h"
+#include "Case_458b8eeee1.h"
+#include "ConditionAndBody_0e2f888e06.h"
+#include "ConstructorCall_f8e441a21d.h"
+#include "Constructor_0c896e4031.h"
+#include "Continue_b54f3b332e.h"
+#include "DecRef_f37e9a69d2.h"
+#include "Expression_35f2052bf4.h"
+#include "FileConverter_c79636dcc7.h"
+#include "FloatConstant_4759845694.h"
+#include "FloatConstant_652a176e04.h"
+#include "ForLoopHeader_79606b2adb.h"
+#include "FunctionCall_104f394575.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "GenericSource_35cfcd932e.h"
+#include "Generic_c39b95ec73.h"
+#include "GetAttribute_0758070446.h"
+#include "GetAttribute_3d0cc1bf97.h"
+#include "GetFromUnion_b0861b839c.h"
+#include "GetVar_642f116a6c.h"
+#include "GotoIf_feb019130f.h"
+#include "GotoLabel_9654b8ee6d.h"
+#include "If_8811dba942.h"
+#include "IncRef_54322428a7.h"
+#include "InstantiateUnion_29af05529f.h"
+#include "Instruction_b0fafb4d55.h"
+#include "IntConstant_4cbc4c5420.h"
+#include "IntConstant_817d6312f0.h"
+#include "Let_c9da3e3372.h"
+#include "ListComprehension_10c913d2dd.h"
+#include "ListLiteral_66e426dc17.h"
+#include "List_AutoTypeNode__28b2c8eb14.h"
+#include "List_Case__f5a6b4b2ec.h"
+#include "List_ConditionAndBody__ad79dde1db.h"
+#include "List_Expression__d162784c9e.h"
+#include "List_Instruction__6e475c861a.h"
+#include "List_List_Instruction___d2e1d3bdd4.h"
+#include "List_List_UnionType___fea86ef88e.h"
+#include "List_LocalVariable__81e23234f3.h"
+#include "List_LoopLabels__74a48e6cc9.h"
+#include "List_NamedVariable__2ad9e9e312.h"
+#include "List_Statement__5d7503c104.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Type__057f9c6088.h"
+#include "List_UnionType__f35bb76792.h"
+#include "LocalVariable_846080e5ae.h"
+#include "Location_500c4434c9.h"
+#include "LoopHeader_23fd592271.h"
+#include "LoopLabels_8e8d3917a5.h"
+#include "Loop_80080d5f12.h"
+#include "MethodCall_b0095be49c.h"
+#include "NamedVariable_ac0761c28d.h"
+#include "Pass_e49950b77e.h"
+#include "PointersEqual_deb0abf3fc.h"
+#include "Return_33802009cd.h"
+#include "Return_aa2d9b1c64.h"
+#include "SetAttribute_25344a82b6.h"
+#include "SetAttribute_6bd58fd9d3.h"
+#include "SetVar_6a19c6f350.h"
+#include "Statement_1dc2e7090f.h"
+#include "StatementsAndExpression_964cbccc5e.h"
+#include "StringConstant_c2b1c10b4f.h"
+#include "StringConstant_e1466967c8.h"
+#include "StringFormatJoin_bc28806767.h"
+#include "Switch_9b8c881aeb.h"
+#include "TypeAndName_fec99b5f94.h"
+#include "TypePair_63e9b86975.h"
+#include "Type_87e1ce5c5e.h"
+#include "Type_e6cf7dd4e5.h"
+#include "UnSet_a1ce71f609.h"
+#include "UnaryOperator_348525ebbe.h"
+#include "UnionMemberCheck_7021628c40.h"
+#include "UnionType_7f899bced1.h"
+#include "VarCpy_e77a538911.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_null___Expression__957e7d6409.h"
+#include "_null___FunctionOrMethodConverter__7dc768c0a0.h"
+#include "_null___GenericSource__4440b6073d.h"
+#include "_null___List_Type___114a421a91.h"
+#include "_null___List_UnionType___b20440b9a7.h"
+#include "_null___LocalVariable__494c1a2e12.h"
+#include "_null___Location__87aaae6467.h"
+#include "_null___TypeAndName__d7958d7e85.h"
+#include "_null___Type__8438ac3dcf.h"
+#include "ast2ir_d819fcc31b.h"
+#include "ast_91af7cbb25.h"
+#include "ir_4b1a3e0393.h"
+
+            static struct StringBuf string0_FunctionOrMethodConverter_9eb15e0885_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x4f', '\x72', '\x4d', '\x65', '\x74', '\x68', '\x6f', '\x64', '\x43', '\x6f', '\x6e', '\x76', '\x65', '\x72', '\x74', '\x65', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_FunctionOrMethodConverter_9eb15e0885 = {
+                .buf = &string0_FunctionOrMethodConverter_9eb15e0885_buf,
+                .nbytes = 25,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_self_hosted_ast2ir_oomph_6b6455e130_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x61', '\x73', '\x74', '\x32', '\x69', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string1_self_hosted_ast2ir_oomph_6b6455e130 = {
+                .buf = &string1_self_hosted_ast2ir_oomph_6b6455e130_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_to_string_8e837cbda7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string2_to_string_8e837cbda7 = {
+                .buf = &string2_to_string_8e837cbda7_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_int2float_a5559f23a2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x32', '\x66', '\x6c', '\x6f', '\x61', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string3_int2float_a5559f23a2 = {
+                .buf = &string3_int2float_a5559f23a2_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_wrong_type__should_be__f4388f6163_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77', '\x72', '\x6f', '\x6e', '\x67', '\x20', '\x74', '\x79', '\x70', '\x65', '\x3a', '\x20', '\x73', '\x68', '\x6f', '\x75', '\x6c', '\x64', '\x20', '\x62', '\x65', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string4_wrong_type__should_be__f4388f6163 = {
+                .buf = &string4_wrong_type__should_be__f4388f6163_buf,
+                .nbytes = 22,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5___but_it_s__27ee696d62_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x20', '\x62', '\x75', '\x74', '\x20', '\x69', '\x74', '\x27', '\x73', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string5___but_it_s__27ee696d62 = {
+                .buf = &string5___but_it_s__27ee696d62_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6_s_afc861ea4a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string6_s_afc861ea4a = {
+                .buf = &string6_s_afc861ea4a_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7__c99c626e9b_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string7__c99c626e9b = {
+                .buf = &string7__c99c626e9b_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string8_expected__53c97793da_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x78', '\x70', '\x65', '\x63', '\x74', '\x65', '\x64', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string8_expected__53c97793da = {
+                .buf = &string8_expected__53c97793da_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string9__argument_2122fd1ae9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x61', '\x72', '\x67', '\x75', '\x6d', '\x65', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string9__argument_2122fd1ae9 = {
+                .buf = &string9__argument_2122fd1ae9_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string10___got__c117f564cf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x20', '\x67', '\x6f', '\x74', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string10___got__c117f564cf = {
+                .buf = &string10___got__c117f564cf_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string11_print_52e44757fa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x72', '\x69', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string11_print_52e44757fa = {
+                .buf = &string11_print_52e44757fa_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string12_print_must_be_called_with_1_argument_a627b54dcd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x72', '\x69', '\x6e', '\x74', '\x20', '\x6d', '\x75', '\x73', '\x74', '\x20', '\x62', '\x65', '\x20', '\x63', '\x61', '\x6c', '\x6c', '\x65', '\x64', '\x20', '\x77', '\x69', '\x74', '\x68', '\x20', '\x31', '\x20', '\x61', '\x72', '\x67', '\x75', '\x6d', '\x65', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string12_print_must_be_called_with_1_argument_a627b54dcd = {
+                .buf = &string12_print_must_be_called_with_1_argument_a627b54dcd_buf,
+                .nbytes = 36,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string13_bool_not_044770c441_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x6f', '\x6f', '\x6c', '\x5f', '\x6e', '\x6f', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string13_bool_not_044770c441 = {
+                .buf = &string13_bool_not_044770c441_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string14_true_7fafb4b9ec_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string14_true_7fafb4b9ec = {
+                .buf = &string14_true_7fafb4b9ec_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string15_in_6609819b55_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string15_in_6609819b55 = {
+                .buf = &string15_in_6609819b55_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string16_not_in_b0f1dd0794_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x6f', '\x74', '\x20', '\x69', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string16_not_in_b0f1dd0794 = {
+                .buf = &string16_not_in_b0f1dd0794_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string17___contains_43aa841d5f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x63', '\x6f', '\x6e', '\x74', '\x61', '\x69', '\x6e', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string17___contains_43aa841d5f = {
+                .buf = &string17___contains_43aa841d5f_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string18____58d7772a7b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x21', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string18____58d7772a7b = {
+                .buf = &string18____58d7772a7b_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string19____5636f2c917_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3d', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string19____5636f2c917 = {
+                .buf = &string19____5636f2c917_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string20___eb69a54709_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3c' },
+                .malloced = false,
+            };
+            static struct class_Str string20___eb69a54709 = {
+                .buf = &string20___eb69a54709_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string21___60f7097246_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3e' },
+                .malloced = false,
+            };
+            static struct class_Str string21___60f7097246 = {
+                .buf = &string21___60f7097246_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string22____73709df24c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3c', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string22____73709df24c = {
+                .buf = &string22____73709df24c_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string23____7ff3e97294_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3e', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string23____7ff3e97294 = {
+                .buf = &string23____7ff3e97294_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string24___274da8c49e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2b' },
+                .malloced = false,
+            };
+            static struct class_Str string24___274da8c49e = {
+                .buf = &string24___274da8c49e_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string25_string_concat_8eba42145a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x63', '\x6f', '\x6e', '\x63', '\x61', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string25_string_concat_8eba42145a = {
+                .buf = &string25_string_concat_8eba42145a_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string26_int_add_c4bbff9d11_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x61', '\x64', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string26_int_add_c4bbff9d11 = {
+                .buf = &string26_int_add_c4bbff9d11_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string27___039618761f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d' },
+                .malloced = false,
+            };
+            static struct class_Str string27___039618761f = {
+                .buf = &string27___039618761f_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string28_int_sub_6fe33733ef_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x73', '\x75', '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string28_int_sub_6fe33733ef = {
+                .buf = &string28_int_sub_6fe33733ef_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string29___a4b78792af_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2a' },
+                .malloced = false,
+            };
+            static struct class_Str string29___a4b78792af = {
+                .buf = &string29___a4b78792af_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string30_int_mul_c20cc3837d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x6d', '\x75', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string30_int_mul_c20cc3837d = {
+                .buf = &string30_int_mul_c20cc3837d_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string31_mod_24ee0daef1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x6f', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string31_mod_24ee0daef1 = {
+                .buf = &string31_mod_24ee0daef1_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string32_int_mod_b40436a1e7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x6d', '\x6f', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string32_int_mod_b40436a1e7 = {
+                .buf = &string32_int_mod_b40436a1e7_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string33_int_gt_ba483fe15c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x67', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string33_int_gt_ba483fe15c = {
+                .buf = &string33_int_gt_ba483fe15c_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string34___cb84f637ff_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f' },
+                .malloced = false,
+            };
+            static struct class_Str string34___cb84f637ff = {
+                .buf = &string34___cb84f637ff_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string35_float_add_71045e46d5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x61', '\x64', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string35_float_add_71045e46d5 = {
+                .buf = &string35_float_add_71045e46d5_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string36_float_sub_3c2a12e9ae_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x73', '\x75', '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string36_float_sub_3c2a12e9ae = {
+                .buf = &string36_float_sub_3c2a12e9ae_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string37_float_mul_86d0e314e5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x6d', '\x75', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string37_float_mul_86d0e314e5 = {
+                .buf = &string37_float_mul_86d0e314e5_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string38_float_div_2c99cebeb4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x64', '\x69', '\x76' },
+                .malloced = false,
+            };
+            static struct class_Str string38_float_div_2c99cebeb4 = {
+                .buf = &string38_float_div_2c99cebeb4_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string39_float_mod_4a5d2ea70b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x6d', '\x6f', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string39_float_mod_4a5d2ea70b = {
+                .buf = &string39_float_mod_4a5d2ea70b_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string40_float_gt_6565c8c20e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x67', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string40_float_gt_6565c8c20e = {
+                .buf = &string40_float_gt_6565c8c20e_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string41_equals_273d01f72c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x71', '\x75', '\x61', '\x6c', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string41_equals_273d01f72c = {
+                .buf = &string41_equals_273d01f72c_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string42_wrong_types___ab978b9888_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77', '\x72', '\x6f', '\x6e', '\x67', '\x20', '\x74', '\x79', '\x70', '\x65', '\x73', '\x3a', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string42_wrong_types___ab978b9888 = {
+                .buf = &string42_wrong_types___ab978b9888_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string43___6086a9b56a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string43___6086a9b56a = {
+                .buf = &string43___6086a9b56a_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string44_and_aef63e438d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x6e', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string44_and_aef63e438d = {
+                .buf = &string44_and_aef63e438d_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string45_or_bbe8969286_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string45_or_bbe8969286 = {
+                .buf = &string45_or_bbe8969286_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string46_false_c928a229ad_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string46_false_c928a229ad = {
+                .buf = &string46_false_c928a229ad_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string47_push_aa992f59e2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x75', '\x73', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string47_push_aa992f59e2 = {
+                .buf = &string47_push_aa992f59e2_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string48_not_1651420f68_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x6f', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string48_not_1651420f68 = {
+                .buf = &string48_not_1651420f68_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string49_int_neg_f0b575260a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x6e', '\x65', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string49_int_neg_f0b575260a = {
+                .buf = &string49_int_neg_f0b575260a_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string50_float_neg_c93563ff90_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x6e', '\x65', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string50_float_neg_c93563ff90 = {
+                .buf = &string50_float_neg_c93563ff90_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string51_switch_does_not_handle___67316f82fc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x77', '\x69', '\x74', '\x63', '\x68', '\x20', '\x64', '\x6f', '\x65', '\x73', '\x20', '\x6e', '\x6f', '\x74', '\x20', '\x68', '\x61', '\x6e', '\x64', '\x6c', '\x65', '\x3a', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string51_switch_does_not_handle___67316f82fc = {
+                .buf = &string51_switch_does_not_handle___67316f82fc_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            
+            struct class_FunctionOrMethodConverter_14d05c56fc* ctor_FunctionOrMethodConverter_14d05c56fc(struct class_Builtins_bd980a9f08* arg_builtins,struct class_FileConverter_c79636dcc7* arg_file_converter,struct class_List_NamedVariable__2ad9e9e312* arg_variables,struct class__null___Type__8438ac3dcf arg_returntype,struct class_List_LoopLabels__74a48e6cc9* arg_loop_stack,struct class_List_Instruction__6e475c861a* arg_code,struct class_List_List_Instruction___d2e1d3bdd4* arg_code_stack,struct class_List_AutoTypeNode__28b2c8eb14* arg_autotype_nodes,int64_t arg_autotype_counter,int64_t arg_goto_label_counter,int64_t arg_local_var_counter)
+            {
+                struct class_FunctionOrMethodConverter_14d05c56fc* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_builtins = arg_builtins;
+obj->memb_file_converter = arg_file_converter;
+obj->memb_variables = arg_variables;
+obj->memb_returntype = arg_returntype;
+obj->memb_loop_stack = arg_loop_stack;
+obj->memb_code = arg_code;
+obj->memb_code_stack = arg_code_stack;
+obj->memb_autotype_nodes = arg_autotype_nodes;
+obj->memb_autotype_counter = arg_autotype_counter;
+obj->memb_goto_label_counter = arg_goto_label_counter;
+obj->memb_local_var_counter = arg_local_var_counter;
+
+                incref(arg_builtins);
+incref(arg_file_converter);
+incref(arg_variables);
+incref__null___Type__8438ac3dcf(arg_returntype);
+incref(arg_loop_stack);
+incref(arg_code);
+incref(arg_code_stack);
+incref(arg_autotype_nodes);
+(void)0;
+(void)0;
+(void)0;
+
+                return obj;
+            }
+
+            void dtor_FunctionOrMethodConverter_14d05c56fc(void *ptr)
+            {
+                struct class_FunctionOrMethodConverter_14d05c56fc *obj = ptr;
+                decref((obj->memb_builtins), dtor_Builtins_bd980a9f08);
+decref((obj->memb_file_converter), dtor_FileConverter_c79636dcc7);
+decref((obj->memb_variables), dtor_List_NamedVariable__2ad9e9e312);
+decref__null___Type__8438ac3dcf(obj->memb_returntype);
+decref((obj->memb_loop_stack), dtor_List_LoopLabels__74a48e6cc9);
+decref((obj->memb_code), dtor_List_Instruction__6e475c861a);
+decref((obj->memb_code_stack), dtor_List_List_Instruction___d2e1d3bdd4);
+decref((obj->memb_autotype_nodes), dtor_List_AutoTypeNode__28b2c8eb14);
+(void)0;
+(void)0;
+(void)0;
+
+                free(obj);
+            }
+            
+                struct class_Str meth_FunctionOrMethodConverter_14d05c56fc_to_string(struct class_FunctionOrMethodConverter_14d05c56fc* self)
+                {
+                    struct class_Str res = string0_FunctionOrMethodConverter_9eb15e0885;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Builtins_bd980a9f08_to_string(self->memb_builtins);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_FileConverter_c79636dcc7_to_string(self->memb_file_converter);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_NamedVariable__2ad9e9e312_to_string(self->memb_variables);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__null___Type__8438ac3dcf_to_string(self->memb_returntype);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_LoopLabels__74a48e6cc9_to_string(self->memb_loop_stack);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Instruction__6e475c861a_to_string(self->memb_code);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_List_Instruction___d2e1d3bdd4_to_string(self->memb_code_stack);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_AutoTypeNode__28b2c8eb14_to_string(self->memb_autotype_nodes);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Int_to_string(self->memb_autotype_counter);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Int_to_string(self->memb_goto_label_counter);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Int_to_string(self->memb_local_var_counter);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_FunctionOrMethodConverter_14d05c56fc_equals(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_FunctionOrMethodConverter_14d05c56fc* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_create_var(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Type_87e1ce5c5e var2, struct class_Location_500c4434c9* var3){int64_t var4;
+int64_t var5;
+int64_t var6;
+int64_t var7;
+struct class_LocalVariable_846080e5ae* var8;
+var8 = NULL;
+struct class_List_Instruction__6e475c861a* var9;
+var9 = NULL;
+struct class_DecRef_f37e9a69d2* var10;
+var10 = NULL;
+struct class_Instruction_b0fafb4d55 var11;
+var11.membernum = -1;
+struct class_List_Instruction__6e475c861a* var12;
+var12 = NULL;
+struct class_UnSet_a1ce71f609* var13;
+var13 = NULL;
+struct class_Instruction_b0fafb4d55 var14;
+var14.membernum = -1;
+struct class_LocalVariable_846080e5ae* retval;
+var4 = var1->memb_local_var_counter;
+var5 = 1LL;
+var6 = oomph_int_add(var4,var5);
+var1->memb_local_var_counter = var6;
+var7 = var1->memb_local_var_counter;
+var8 = ctor_LocalVariable_846080e5ae(var2,var7,var3);
+var9 = var1->memb_code;
+incref(var9);
+var10 = ctor_DecRef_f37e9a69d2(var8);
+var11 = (struct class_Instruction_b0fafb4d55){ .val = { .item1 = var10 }, .membernum = 1 };
+var10 = NULL;
+meth_List_Instruction__6e475c861a_push(var9,var11);
+var12 = var1->memb_code;
+incref(var12);
+var13 = ctor_UnSet_a1ce71f609(var8);
+var14 = (struct class_Instruction_b0fafb4d55){ .val = { .item16 = var13 }, .membernum = 16 };
+var13 = NULL;
+meth_List_Instruction__6e475c861a_push(var12,var14);
+retval = var8; var8 = NULL;
+goto out;
+out: (void)0;
+decref_Instruction_b0fafb4d55(var14);
+decref((var13), dtor_UnSet_a1ce71f609);
+decref((var12), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var11);
+decref((var10), dtor_DecRef_f37e9a69d2);
+decref((var9), dtor_List_Instruction__6e475c861a);
+decref((var8), dtor_LocalVariable_846080e5ae);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}struct class_Variable_1aaa81c8d2 meth_FunctionOrMethodConverter_14d05c56fc_get_var(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Str var2, struct class__null___Location__87aaae6467 var3){struct class_List_NamedVariable__2ad9e9e312* var4;
+var4 = NULL;
+struct class_Variable_1aaa81c8d2 var5;
+var5.membernum = -1;
+struct class_Variable_1aaa81c8d2 retval;
+var4 = var1->memb_variables;
+incref(var4);
+var5 = ast2ir_d819fcc31b_find_variable(var4,var2,var3);
+retval = var5; var5.membernum = -1;
+goto out;
+out: (void)0;
+decref_Variable_1aaa81c8d2(var5);
+decref((var4), dtor_List_NamedVariable__2ad9e9e312);
+return retval;
+}struct class_AutoTypeNode_203f67ecfa* meth_FunctionOrMethodConverter_14d05c56fc_find_autotype_root(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_AutoType_33a5d572cb* var2){struct class_List_AutoTypeNode__28b2c8eb14* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var5;
+int64_t var6;
+struct class_AutoTypeNode_203f67ecfa* var7;
+var7 = NULL;
+int64_t var9;
+struct class_AutoType_33a5d572cb* var10;
+var10 = NULL;
+int64_t var11;
+bool var12;
+bool var13;
+bool var14;
+struct class_List_AutoTypeNode__28b2c8eb14* var16;
+var16 = NULL;
+int64_t var17;
+int64_t var18;
+int64_t var19;
+struct class_AutoTypeNode_203f67ecfa* var20;
+var20 = NULL;
+struct class_List_AutoTypeNode__28b2c8eb14* var21;
+var21 = NULL;
+int64_t var22;
+int64_t var23;
+int64_t var24;
+struct class_AutoTypeNode_203f67ecfa* var25;
+var25 = NULL;
+bool var27;
+bool var28;
+bool var29;
+int64_t var31;
+struct class_AutoType_33a5d572cb* var32;
+var32 = NULL;
+int64_t var33;
+struct class_List_AutoTypeNode__28b2c8eb14* var34;
+var34 = NULL;
+int64_t var35;
+int64_t var36;
+struct class_AutoTypeNode_203f67ecfa* var37;
+var37 = NULL;
+struct class_AutoTypeNode_203f67ecfa* retval;
+var3 = var1->memb_autotype_nodes;
+incref(var3);
+var4 = var2->memb_id;
+var5 = 1LL;
+var6 = oomph_int_sub(var4,var5);
+var7 = meth_List_AutoTypeNode__28b2c8eb14_get(var3,var6);
+label8: (void)0;
+var9 = var7->memb_parent_id;
+var10 = var7->memb_autotype;
+var11 = var10->memb_id;
+var10 = NULL;
+var12 = meth_Int_equals(var9,var11);
+var13 = oomph_bool_not(var12);
+var14 = oomph_bool_not(var13);
+if (var14) goto label15;
+decref((var16), dtor_List_AutoTypeNode__28b2c8eb14);
+var16 = NULL;
+var16 = var1->memb_autotype_nodes;
+incref(var16);
+var17 = var7->memb_parent_id;
+var18 = 1LL;
+var19 = oomph_int_sub(var17,var18);
+var20 = meth_List_AutoTypeNode__28b2c8eb14_get(var16,var19);
+decref((var7), dtor_AutoTypeNode_203f67ecfa);
+var7 = var20;
+var20 = NULL;
+if (oomph_true) goto label8;
+label15: (void)0;
+var21 = var1->memb_autotype_nodes;
+incref(var21);
+var22 = var2->memb_id;
+var23 = 1LL;
+var24 = oomph_int_sub(var22,var23);
+var25 = meth_List_AutoTypeNode__28b2c8eb14_get(var21,var24);
+label26: (void)0;
+var27 = meth_AutoTypeNode_203f67ecfa_equals(var25,var7);
+var28 = oomph_bool_not(var27);
+var29 = oomph_bool_not(var28);
+if (var29) goto label30;
+var31 = var25->memb_parent_id;
+var32 = var7->memb_autotype;
+var33 = var32->memb_id;
+var32 = NULL;
+var25->memb_parent_id = var33;
+decref((var34), dtor_List_AutoTypeNode__28b2c8eb14);
+var34 = NULL;
+var34 = var1->memb_autotype_nodes;
+incref(var34);
+var35 = 1LL;
+var36 = oomph_int_sub(var31,var35);
+var37 = meth_List_AutoTypeNode__28b2c8eb14_get(var34,var36);
+decref((var25), dtor_AutoTypeNode_203f67ecfa);
+var25 = var37;
+var37 = NULL;
+if (oomph_true) goto label26;
+label30: (void)0;
+retval = var7; var7 = NULL;
+goto out;
+out: (void)0;
+decref((var37), dtor_AutoTypeNode_203f67ecfa);
+(void)0;
+(void)0;
+decref((var34), dtor_List_AutoTypeNode__28b2c8eb14);
+(void)0;
+decref((var32), dtor_AutoType_33a5d572cb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var25), dtor_AutoTypeNode_203f67ecfa);
+(void)0;
+(void)0;
+(void)0;
+decref((var21), dtor_List_AutoTypeNode__28b2c8eb14);
+decref((var20), dtor_AutoTypeNode_203f67ecfa);
+(void)0;
+(void)0;
+(void)0;
+decref((var16), dtor_List_AutoTypeNode__28b2c8eb14);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var10), dtor_AutoType_33a5d572cb);
+(void)0;
+decref((var7), dtor_AutoTypeNode_203f67ecfa);
+(void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_List_AutoTypeNode__28b2c8eb14);
+return retval;
+}void meth_FunctionOrMethodConverter_14d05c56fc_match_autotypes(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_AutoType_33a5d572cb* var2, struct class_AutoType_33a5d572cb* var3){struct class_AutoTypeNode_203f67ecfa* var4;
+var4 = NULL;
+struct class_AutoTypeNode_203f67ecfa* var5;
+var5 = NULL;
+bool var6;
+bool var7;
+struct class__null___Type__8438ac3dcf var10;
+var10.membernum = -1;
+char var11;
+struct class__null___Type__8438ac3dcf var12;
+var12.membernum = -1;
+bool var13;
+bool var15;
+struct class__null___Type__8438ac3dcf var17;
+var17.membernum = -1;
+char var18;
+struct class__null___Type__8438ac3dcf var19;
+var19.membernum = -1;
+bool var20;
+struct class_Str var21;
+var21.buf = NULL;
+int64_t var22;
+struct class_AutoType_33a5d572cb* var23;
+var23 = NULL;
+int64_t var24;
+var4 = meth_FunctionOrMethodConverter_14d05c56fc_find_autotype_root(var1,var2);
+var5 = meth_FunctionOrMethodConverter_14d05c56fc_find_autotype_root(var1,var3);
+var6 = meth_AutoTypeNode_203f67ecfa_equals(var4,var5);
+var7 = oomph_bool_not(var6);
+if (var7) goto label8;
+if (oomph_true) goto label9;
+label8: (void)0;
+var10 = var4->memb_resolved;
+incref__null___Type__8438ac3dcf(var10);
+var11 = oomph_null;
+var12 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var11 }, .membernum = 0 };
+var13 = meth__null___Type__8438ac3dcf_equals(var10,var12);
+if (var13) goto label14;
+var15 = oomph_false;
+if (oomph_true) goto label16;
+label14: (void)0;
+var17 = var5->memb_resolved;
+incref__null___Type__8438ac3dcf(var17);
+var18 = oomph_null;
+var19 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var18 }, .membernum = 0 };
+var20 = meth__null___Type__8438ac3dcf_equals(var17,var19);
+var15 = var20;
+label16: (void)0;
+var21 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var21);
+var22 = 83LL;
+oomph_assert(var15,var21,var22);
+var23 = var4->memb_autotype;
+var24 = var23->memb_id;
+var23 = NULL;
+var5->memb_parent_id = var24;
+label9: (void)0;
+out: (void)0;
+(void)0;
+decref((var23), dtor_AutoType_33a5d572cb);
+(void)0;
+string_decref(var21);
+(void)0;
+decref__null___Type__8438ac3dcf(var19);
+(void)0;
+decref__null___Type__8438ac3dcf(var17);
+(void)0;
+(void)0;
+decref__null___Type__8438ac3dcf(var12);
+(void)0;
+decref__null___Type__8438ac3dcf(var10);
+(void)0;
+(void)0;
+decref((var5), dtor_AutoTypeNode_203f67ecfa);
+decref((var4), dtor_AutoTypeNode_203f67ecfa);
+}void meth_FunctionOrMethodConverter_14d05c56fc_resolve_autotype(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_AutoType_33a5d572cb* var2, struct class_Type_87e1ce5c5e var3){bool var4;
+struct class_AutoType_33a5d572cb* var7;
+var7 = NULL;
+bool var8;
+struct class_Str var9;
+var9.buf = NULL;
+int64_t var10;
+struct class_AutoTypeNode_203f67ecfa* var12;
+var12 = NULL;
+struct class__null___Type__8438ac3dcf var13;
+var13.membernum = -1;
+char var14;
+struct class__null___Type__8438ac3dcf var15;
+var15.membernum = -1;
+bool var16;
+struct class__null___Type__8438ac3dcf var18;
+var18.membernum = -1;
+struct class_Type_87e1ce5c5e var19;
+var19.membernum = -1;
+bool var20;
+struct class_Str var21;
+var21.buf = NULL;
+int64_t var22;
+struct class__null___Type__8438ac3dcf var24;
+var24.membernum = -1;
+struct class__null___Type__8438ac3dcf var25;
+var25.membernum = -1;
+
+            var4 = (
+                var3.membernum == 0
+            );
+            if (var4) goto label5;
+
+            var4 = (
+                var3.membernum == 1
+            );
+            if (var4) goto label6;
+
+            var4 = (
+                var3.membernum == 2
+            );
+            if (var4) goto label6;
+
+            var4 = (
+                var3.membernum == 3
+            );
+            if (var4) goto label6;
+label5: (void)0;
+
+            if (var3.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var7 = var3.val.item0;
+            incref(var7);
+var8 = oomph_false;
+var9 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var9);
+var10 = 89LL;
+oomph_assert(var8,var9,var10);
+if (oomph_true) goto label11;
+label6: (void)0;
+label11: (void)0;
+var12 = meth_FunctionOrMethodConverter_14d05c56fc_find_autotype_root(var1,var2);
+var13 = var12->memb_resolved;
+incref__null___Type__8438ac3dcf(var13);
+var14 = oomph_null;
+var15 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var14 }, .membernum = 0 };
+var16 = meth__null___Type__8438ac3dcf_equals(var13,var15);
+if (var16) goto label17;
+var18 = var12->memb_resolved;
+incref__null___Type__8438ac3dcf(var18);
+var19 = meth__null___Type__8438ac3dcf_get(var18);
+var20 = meth_Type_87e1ce5c5e_equals(var19,var3);
+var21 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var21);
+var22 = 97LL;
+oomph_assert(var20,var21,var22);
+if (oomph_true) goto label23;
+label17: (void)0;
+var24 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var3 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var3);
+var25 = var12->memb_resolved;
+var12->memb_resolved = var24;
+var24.membernum = -1;
+label23: (void)0;
+out: (void)0;
+decref__null___Type__8438ac3dcf(var25);
+decref__null___Type__8438ac3dcf(var24);
+(void)0;
+string_decref(var21);
+(void)0;
+decref_Type_87e1ce5c5e(var19);
+decref__null___Type__8438ac3dcf(var18);
+(void)0;
+decref__null___Type__8438ac3dcf(var15);
+(void)0;
+decref__null___Type__8438ac3dcf(var13);
+decref((var12), dtor_AutoTypeNode_203f67ecfa);
+(void)0;
+string_decref(var9);
+(void)0;
+decref((var7), dtor_AutoType_33a5d572cb);
+(void)0;
+}struct class_Type_87e1ce5c5e meth_FunctionOrMethodConverter_14d05c56fc_substitute_autotypes(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Type_87e1ce5c5e var2, bool var3){bool var4;
+struct class_AutoType_33a5d572cb* var7;
+var7 = NULL;
+struct class_AutoTypeNode_203f67ecfa* var8;
+var8 = NULL;
+struct class__null___Type__8438ac3dcf var9;
+var9.membernum = -1;
+char var10;
+struct class__null___Type__8438ac3dcf var11;
+var11.membernum = -1;
+bool var12;
+bool var13;
+struct class__null___Type__8438ac3dcf var16;
+var16.membernum = -1;
+struct class_Type_87e1ce5c5e var17;
+var17.membernum = -1;
+bool var18;
+struct class_Str var19;
+var19.buf = NULL;
+int64_t var20;
+struct class_AutoType_33a5d572cb* var21;
+var21 = NULL;
+struct class_Type_87e1ce5c5e var22;
+var22.membernum = -1;
+struct class__null___GenericSource__4440b6073d var24;
+var24.membernum = -1;
+char var25;
+struct class__null___GenericSource__4440b6073d var26;
+var26.membernum = -1;
+bool var27;
+struct class_GenericSource_35cfcd932e* var30;
+var30 = NULL;
+struct class_Type_87e1ce5c5e var31;
+var31.membernum = -1;
+struct class_Type_87e1ce5c5e var32;
+var32.membernum = -1;
+struct class_Builtins_bd980a9f08* var33;
+var33 = NULL;
+struct class_GenericSource_35cfcd932e* var34;
+var34 = NULL;
+struct class_Generic_c39b95ec73* var35;
+var35 = NULL;
+struct class_Type_87e1ce5c5e var36;
+var36.membernum = -1;
+struct class_Type_87e1ce5c5e retval;
+
+            var4 = (
+                var2.membernum == 0
+            );
+            if (var4) goto label5;
+
+            var4 = (
+                var2.membernum == 1
+            );
+            if (var4) goto label6;
+
+            var4 = (
+                var2.membernum == 2
+            );
+            if (var4) goto label6;
+
+            var4 = (
+                var2.membernum == 3
+            );
+            if (var4) goto label6;
+label5: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var7 = var2.val.item0;
+            incref(var7);
+var8 = meth_FunctionOrMethodConverter_14d05c56fc_find_autotype_root(var1,var7);
+var9 = var8->memb_resolved;
+incref__null___Type__8438ac3dcf(var9);
+var10 = oomph_null;
+var11 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var10 }, .membernum = 0 };
+var12 = meth__null___Type__8438ac3dcf_equals(var9,var11);
+var13 = oomph_bool_not(var12);
+if (var13) goto label14;
+if (oomph_true) goto label15;
+label14: (void)0;
+var16 = var8->memb_resolved;
+incref__null___Type__8438ac3dcf(var16);
+var17 = meth__null___Type__8438ac3dcf_get(var16);
+retval = var17; var17.membernum = -1;
+goto out;
+label15: (void)0;
+var18 = oomph_bool_not(var3);
+var19 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var19);
+var20 = 105LL;
+oomph_assert(var18,var19,var20);
+var21 = var8->memb_autotype;
+incref(var21);
+var22 = (struct class_Type_87e1ce5c5e){ .val = { .item0 = var21 }, .membernum = 0 };
+var21 = NULL;
+retval = var22; var22.membernum = -1;
+goto out;
+label6: (void)0;
+label23: (void)0;
+var24 = ir_4b1a3e0393_get_generic_source(var2);
+var25 = oomph_null;
+var26 = (struct class__null___GenericSource__4440b6073d){ .val = { .item0 = var25 }, .membernum = 0 };
+var27 = meth__null___GenericSource__4440b6073d_equals(var24,var26);
+if (var27) goto label28;
+if (oomph_true) goto label29;
+label28: (void)0;
+incref_Type_87e1ce5c5e(var2); retval = var2; goto out;
+label29: (void)0;
+var30 = meth__null___GenericSource__4440b6073d_get(var24);
+var31 = var30->memb_arg;
+incref_Type_87e1ce5c5e(var31);
+var32 = meth_FunctionOrMethodConverter_14d05c56fc_substitute_autotypes(var1,var31,var3);
+var33 = var1->memb_builtins;
+incref(var33);
+var34 = meth__null___GenericSource__4440b6073d_get(var24);
+var35 = var34->memb_generik;
+incref(var35);
+var36 = meth_Builtins_bd980a9f08_generic2type(var33,var35,var32);
+retval = var36; var36.membernum = -1;
+goto out;
+out: (void)0;
+decref_Type_87e1ce5c5e(var36);
+decref((var35), dtor_Generic_c39b95ec73);
+decref((var34), dtor_GenericSource_35cfcd932e);
+decref((var33), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var32);
+decref_Type_87e1ce5c5e(var31);
+decref((var30), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref__null___GenericSource__4440b6073d(var26);
+(void)0;
+decref__null___GenericSource__4440b6073d(var24);
+decref_Type_87e1ce5c5e(var22);
+decref((var21), dtor_AutoType_33a5d572cb);
+(void)0;
+string_decref(var19);
+(void)0;
+decref_Type_87e1ce5c5e(var17);
+decref__null___Type__8438ac3dcf(var16);
+(void)0;
+(void)0;
+decref__null___Type__8438ac3dcf(var11);
+(void)0;
+decref__null___Type__8438ac3dcf(var9);
+decref((var8), dtor_AutoTypeNode_203f67ecfa);
+decref((var7), dtor_AutoType_33a5d572cb);
+(void)0;
+return retval;
+}struct class_AutoType_33a5d572cb* meth_FunctionOrMethodConverter_14d05c56fc_create_autotype(struct class_FunctionOrMethodConverter_14d05c56fc* var1){int64_t var2;
+int64_t var3;
+int64_t var4;
+int64_t var5;
+struct class_AutoType_33a5d572cb* var6;
+var6 = NULL;
+struct class_List_AutoTypeNode__28b2c8eb14* var7;
+var7 = NULL;
+int64_t var8;
+char var9;
+struct class__null___Type__8438ac3dcf var10;
+var10.membernum = -1;
+struct class_AutoTypeNode_203f67ecfa* var11;
+var11 = NULL;
+struct class_AutoType_33a5d572cb* retval;
+var2 = var1->memb_autotype_counter;
+var3 = 1LL;
+var4 = oomph_int_add(var2,var3);
+var1->memb_autotype_counter = var4;
+var5 = var1->memb_autotype_counter;
+var6 = ctor_AutoType_33a5d572cb(var5);
+var7 = var1->memb_autotype_nodes;
+incref(var7);
+var8 = var6->memb_id;
+var9 = oomph_null;
+var10 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var9 }, .membernum = 0 };
+var11 = ctor_AutoTypeNode_203f67ecfa(var6,var8,var10);
+meth_List_AutoTypeNode__28b2c8eb14_push(var7,var11);
+retval = var6; var6 = NULL;
+goto out;
+out: (void)0;
+decref((var11), dtor_AutoTypeNode_203f67ecfa);
+decref__null___Type__8438ac3dcf(var10);
+(void)0;
+(void)0;
+decref((var7), dtor_List_AutoTypeNode__28b2c8eb14);
+decref((var6), dtor_AutoType_33a5d572cb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}struct class_GotoLabel_9654b8ee6d* meth_FunctionOrMethodConverter_14d05c56fc_create_goto_label(struct class_FunctionOrMethodConverter_14d05c56fc* var1){int64_t var2;
+int64_t var3;
+int64_t var4;
+int64_t var5;
+struct class_GotoLabel_9654b8ee6d* var6;
+var6 = NULL;
+struct class_GotoLabel_9654b8ee6d* retval;
+var2 = var1->memb_goto_label_counter;
+var3 = 1LL;
+var4 = oomph_int_add(var2,var3);
+var1->memb_goto_label_counter = var4;
+var5 = var1->memb_goto_label_counter;
+var6 = ctor_GotoLabel_9654b8ee6d(var5);
+retval = var6; var6 = NULL;
+goto out;
+out: (void)0;
+decref((var6), dtor_GotoLabel_9654b8ee6d);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}struct class_Type_87e1ce5c5e meth_FunctionOrMethodConverter_14d05c56fc_get_type(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Type_e6cf7dd4e5 var2){bool var3;
+struct class_AutoType_39f5d793d6* var6;
+var6 = NULL;
+struct class_AutoType_33a5d572cb* var7;
+var7 = NULL;
+struct class_Type_87e1ce5c5e var8;
+var8.membernum = -1;
+struct class_FileConverter_c79636dcc7* var9;
+var9 = NULL;
+struct class__null___FunctionOrMethodConverter__7dc768c0a0 var10;
+var10.membernum = -1;
+struct class_Type_87e1ce5c5e var11;
+var11.membernum = -1;
+struct class_Type_87e1ce5c5e retval;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) goto label4;
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) goto label5;
+
+            var3 = (
+                var2.membernum == 2
+            );
+            if (var3) goto label5;
+
+            var3 = (
+                var2.membernum == 3
+            );
+            if (var3) goto label5;
+label4: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var6 = var2.val.item0;
+            incref(var6);
+var7 = meth_FunctionOrMethodConverter_14d05c56fc_create_autotype(var1);
+var8 = (struct class_Type_87e1ce5c5e){ .val = { .item0 = var7 }, .membernum = 0 };
+var7 = NULL;
+retval = var8; var8.membernum = -1;
+goto out;
+label5: (void)0;
+var9 = var1->memb_file_converter;
+incref(var9);
+var10 = (struct class__null___FunctionOrMethodConverter__7dc768c0a0){ .val = { .item1 = var1 }, .membernum = 1 };
+incref(var1);
+var11 = meth_FileConverter_c79636dcc7_get_type(var9,var2,var10);
+retval = var11; var11.membernum = -1;
+goto out;
+label12: (void)0;
+out: (void)0;
+decref_Type_87e1ce5c5e(var11);
+decref__null___FunctionOrMethodConverter__7dc768c0a0(var10);
+decref((var9), dtor_FileConverter_c79636dcc7);
+decref_Type_87e1ce5c5e(var8);
+decref((var7), dtor_AutoType_33a5d572cb);
+decref((var6), dtor_AutoType_39f5d793d6);
+(void)0;
+return retval;
+}void meth_FunctionOrMethodConverter_14d05c56fc_push_code(struct class_FunctionOrMethodConverter_14d05c56fc* var1){struct class_List_List_Instruction___d2e1d3bdd4* var2;
+var2 = NULL;
+struct class_List_Instruction__6e475c861a* var3;
+var3 = NULL;
+struct class_List_Instruction__6e475c861a* var4;
+var4 = NULL;
+struct class_List_Instruction__6e475c861a* var5;
+var5 = NULL;
+var2 = var1->memb_code_stack;
+incref(var2);
+var3 = var1->memb_code;
+incref(var3);
+meth_List_List_Instruction___d2e1d3bdd4_push(var2,var3);
+var4 = ctor_List_Instruction__6e475c861a();
+var5 = var1->memb_code;
+var1->memb_code = var4;
+var4 = NULL;
+out: (void)0;
+decref((var5), dtor_List_Instruction__6e475c861a);
+decref((var4), dtor_List_Instruction__6e475c861a);
+decref((var3), dtor_List_Instruction__6e475c861a);
+decref((var2), dtor_List_List_Instruction___d2e1d3bdd4);
+}struct class_List_Instruction__6e475c861a* meth_FunctionOrMethodConverter_14d05c56fc_pop_code(struct class_FunctionOrMethodConverter_14d05c56fc* var1){struct class_List_Instruction__6e475c861a* var2;
+var2 = NULL;
+struct class_List_List_Instruction___d2e1d3bdd4* var3;
+var3 = NULL;
+struct class_List_Instruction__6e475c861a* var4;
+var4 = NULL;
+struct class_List_Instruction__6e475c861a* var5;
+var5 = NULL;
+struct class_List_Instruction__6e475c861a* retval;
+var2 = var1->memb_code;
+incref(var2);
+var3 = var1->memb_code_stack;
+incref(var3);
+var4 = meth_List_List_Instruction___d2e1d3bdd4_pop(var3);
+var5 = var1->memb_code;
+var1->memb_code = var4;
+var4 = NULL;
+retval = var2; var2 = NULL;
+goto out;
+out: (void)0;
+decref((var5), dtor_List_Instruction__6e475c861a);
+decref((var4), dtor_List_Instruction__6e475c861a);
+decref((var3), dtor_List_List_Instruction___d2e1d3bdd4);
+decref((var2), dtor_List_Instruction__6e475c861a);
+return retval;
+}struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_stringify(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_LocalVariable_846080e5ae* var2){struct class_Type_87e1ce5c5e var3;
+var3.membernum = -1;
+struct class_Builtins_bd980a9f08* var4;
+var4 = NULL;
+struct class_Type_87e1ce5c5e var5;
+var5.membernum = -1;
+bool var6;
+struct class_Builtins_bd980a9f08* var9;
+var9 = NULL;
+struct class_Type_87e1ce5c5e var10;
+var10.membernum = -1;
+struct class_Location_500c4434c9* var11;
+var11 = NULL;
+struct class_LocalVariable_846080e5ae* var12;
+var12 = NULL;
+struct class_List_Instruction__6e475c861a* var13;
+var13 = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var15;
+var15 = NULL;
+struct class_Location_500c4434c9* var16;
+var16 = NULL;
+struct class__null___LocalVariable__494c1a2e12 var17;
+var17.membernum = -1;
+struct class_MethodCall_b0095be49c* var18;
+var18 = NULL;
+struct class_Instruction_b0fafb4d55 var19;
+var19.membernum = -1;
+struct class_LocalVariable_846080e5ae* retval;
+var3 = var2->memb_type;
+incref_Type_87e1ce5c5e(var3);
+var4 = var1->memb_builtins;
+var5 = var4->memb_STR;
+var4 = NULL;
+incref_Type_87e1ce5c5e(var5);
+var6 = meth_Type_87e1ce5c5e_equals(var3,var5);
+if (var6) goto label7;
+if (oomph_true) goto label8;
+label7: (void)0;
+incref(var2); retval = var2; goto out;
+label8: (void)0;
+var9 = var1->memb_builtins;
+var10 = var9->memb_STR;
+var9 = NULL;
+incref_Type_87e1ce5c5e(var10);
+var11 = var2->memb_location;
+incref(var11);
+var12 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var10,var11);
+var13 = var1->memb_code;
+incref(var13);
+var14 = string2_to_string_8e837cbda7; string_incref(var14);
+var15 = ctor_List_LocalVariable__81e23234f3();
+var16 = var2->memb_location;
+incref(var16);
+var17 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item1 = var12 }, .membernum = 1 };
+incref(var12);
+var18 = ctor_MethodCall_b0095be49c(var2,var14,var15,var17,var16);
+var19 = (struct class_Instruction_b0fafb4d55){ .val = { .item11 = var18 }, .membernum = 11 };
+var18 = NULL;
+meth_List_Instruction__6e475c861a_push(var13,var19);
+retval = var12; var12 = NULL;
+goto out;
+out: (void)0;
+decref_Instruction_b0fafb4d55(var19);
+decref((var18), dtor_MethodCall_b0095be49c);
+decref__null___LocalVariable__494c1a2e12(var17);
+decref((var16), dtor_Location_500c4434c9);
+decref((var15), dtor_List_LocalVariable__81e23234f3);
+string_decref(var14);
+decref((var13), dtor_List_Instruction__6e475c861a);
+decref((var12), dtor_LocalVariable_846080e5ae);
+decref((var11), dtor_Location_500c4434c9);
+decref_Type_87e1ce5c5e(var10);
+decref((var9), dtor_Builtins_bd980a9f08);
+(void)0;
+decref_Type_87e1ce5c5e(var5);
+decref((var4), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var3);
+return retval;
+}struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Str var2, struct class_List_LocalVariable__81e23234f3* var3){struct class_LocalVariable_846080e5ae* var4;
+var4 = NULL;
+struct class_Location_500c4434c9* var5;
+var5 = NULL;
+int64_t var6;
+int64_t var7;
+struct class_List_LocalVariable__81e23234f3* var8;
+var8 = NULL;
+int64_t var9;
+struct class_LocalVariable_846080e5ae* var11;
+var11 = NULL;
+struct class_Location_500c4434c9* var13;
+var13 = NULL;
+struct class_Location_500c4434c9* var14;
+var14 = NULL;
+struct class_Builtins_bd980a9f08* var15;
+var15 = NULL;
+struct class_BuiltinVariable_f6e0cdd1b6* var16;
+var16 = NULL;
+struct class_Type_87e1ce5c5e var17;
+var17.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var18;
+var18 = NULL;
+struct class__null___Type__8438ac3dcf var19;
+var19.membernum = -1;
+struct class_Type_87e1ce5c5e var20;
+var20.membernum = -1;
+struct class_LocalVariable_846080e5ae* var21;
+var21 = NULL;
+struct class_List_Instruction__6e475c861a* var22;
+var22 = NULL;
+struct class_Variable_1aaa81c8d2 var23;
+var23.membernum = -1;
+struct class__null___LocalVariable__494c1a2e12 var24;
+var24.membernum = -1;
+struct class_FunctionCall_104f394575* var25;
+var25 = NULL;
+struct class_Instruction_b0fafb4d55 var26;
+var26.membernum = -1;
+struct class_LocalVariable_846080e5ae* retval;
+var4 = meth_List_LocalVariable__81e23234f3_first(var3);
+var5 = var4->memb_location;
+incref(var5);
+var6 = 1LL;
+var7 = meth_List_LocalVariable__81e23234f3_length(var3);
+var8 = meth_List_LocalVariable__81e23234f3_slice(var3,var6,var7);
+var9 = 0LL;
+label10: (void)0;
+if (var9 >= var8->len) goto label12;
+decref((var11), dtor_LocalVariable_846080e5ae); var11 = var8->data[var9++]; incref(var11);
+decref((var13), dtor_Location_500c4434c9);
+var13 = NULL;
+var13 = var11->memb_location;
+incref(var13);
+var14 = meth_Location_500c4434c9_combine(var5,var13);
+decref((var5), dtor_Location_500c4434c9);
+var5 = var14;
+var14 = NULL;
+if (oomph_true) goto label10;
+label12: (void)0;
+var15 = var1->memb_builtins;
+incref(var15);
+var16 = meth_Builtins_bd980a9f08_get_hidden_var(var15,var2);
+var17 = var16->memb_type;
+incref_Type_87e1ce5c5e(var17);
+
+            if (var17.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var18 = var17.val.item2;
+            incref(var18);
+var19 = var18->memb_returntype;
+incref__null___Type__8438ac3dcf(var19);
+var20 = meth__null___Type__8438ac3dcf_get(var19);
+var21 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var20,var5);
+var22 = var1->memb_code;
+incref(var22);
+var23 = (struct class_Variable_1aaa81c8d2){ .val = { .item0 = var16 }, .membernum = 0 };
+var16 = NULL;
+var24 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item1 = var21 }, .membernum = 1 };
+incref(var21);
+var25 = ctor_FunctionCall_104f394575(var23,var3,var24);
+var26 = (struct class_Instruction_b0fafb4d55){ .val = { .item3 = var25 }, .membernum = 3 };
+var25 = NULL;
+meth_List_Instruction__6e475c861a_push(var22,var26);
+retval = var21; var21 = NULL;
+goto out;
+out: (void)0;
+decref_Instruction_b0fafb4d55(var26);
+decref((var25), dtor_FunctionCall_104f394575);
+decref__null___LocalVariable__494c1a2e12(var24);
+decref_Variable_1aaa81c8d2(var23);
+decref((var22), dtor_List_Instruction__6e475c861a);
+decref((var21), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var20);
+decref__null___Type__8438ac3dcf(var19);
+decref((var18), dtor_FunctionType_4e16d0ea53);
+decref_Type_87e1ce5c5e(var17);
+decref((var16), dtor_BuiltinVariable_f6e0cdd1b6);
+decref((var15), dtor_Builtins_bd980a9f08);
+decref((var14), dtor_Location_500c4434c9);
+decref((var13), dtor_Location_500c4434c9);
+decref((var11), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref((var8), dtor_List_LocalVariable__81e23234f3);
+(void)0;
+(void)0;
+decref((var5), dtor_Location_500c4434c9);
+decref((var4), dtor_LocalVariable_846080e5ae);
+return retval;
+}struct class__null___Type__8438ac3dcf meth_FunctionOrMethodConverter_14d05c56fc_lookup_autotype(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_AutoType_33a5d572cb* var2){struct class_AutoTypeNode_203f67ecfa* var3;
+var3 = NULL;
+struct class__null___Type__8438ac3dcf var4;
+var4.membernum = -1;
+struct class__null___Type__8438ac3dcf retval;
+var3 = meth_FunctionOrMethodConverter_14d05c56fc_find_autotype_root(var1,var2);
+var4 = var3->memb_resolved;
+incref__null___Type__8438ac3dcf(var4);
+retval = var4; var4.membernum = -1;
+goto out;
+out: (void)0;
+decref__null___Type__8438ac3dcf(var4);
+decref((var3), dtor_AutoTypeNode_203f67ecfa);
+return retval;
+}struct class_TypePair_63e9b86975* meth_FunctionOrMethodConverter_14d05c56fc_do_the_autotype_thing(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Type_87e1ce5c5e var2, struct class_Type_87e1ce5c5e var3){bool var4;
+bool var6;
+bool var8;
+bool var10;
+bool var12;
+struct class__null___GenericSource__4440b6073d var14;
+var14.membernum = -1;
+struct class__null___GenericSource__4440b6073d var15;
+var15.membernum = -1;
+char var16;
+struct class__null___GenericSource__4440b6073d var17;
+var17.membernum = -1;
+bool var18;
+bool var19;
+bool var21;
+char var23;
+struct class__null___GenericSource__4440b6073d var24;
+var24.membernum = -1;
+bool var25;
+bool var26;
+bool var28;
+struct class_GenericSource_35cfcd932e* var30;
+var30 = NULL;
+struct class_Generic_c39b95ec73* var31;
+var31 = NULL;
+struct class_GenericSource_35cfcd932e* var32;
+var32 = NULL;
+struct class_Generic_c39b95ec73* var33;
+var33 = NULL;
+bool var34;
+struct class_GenericSource_35cfcd932e* var37;
+var37 = NULL;
+struct class_Generic_c39b95ec73* var38;
+var38 = NULL;
+struct class_GenericSource_35cfcd932e* var39;
+var39 = NULL;
+struct class_Type_87e1ce5c5e var40;
+var40.membernum = -1;
+struct class_GenericSource_35cfcd932e* var41;
+var41 = NULL;
+struct class_Type_87e1ce5c5e var42;
+var42.membernum = -1;
+struct class_TypePair_63e9b86975* var43;
+var43 = NULL;
+struct class_Builtins_bd980a9f08* var44;
+var44 = NULL;
+struct class_Type_87e1ce5c5e var45;
+var45.membernum = -1;
+struct class_Type_87e1ce5c5e var46;
+var46.membernum = -1;
+struct class_Builtins_bd980a9f08* var47;
+var47 = NULL;
+struct class_Type_87e1ce5c5e var48;
+var48.membernum = -1;
+struct class_Type_87e1ce5c5e var49;
+var49.membernum = -1;
+struct class_TypePair_63e9b86975* var50;
+var50 = NULL;
+struct class_AutoType_33a5d572cb* var52;
+var52 = NULL;
+struct class__null___Type__8438ac3dcf var53;
+var53.membernum = -1;
+char var54;
+struct class__null___Type__8438ac3dcf var55;
+var55.membernum = -1;
+bool var56;
+bool var57;
+struct class_Type_87e1ce5c5e var60;
+var60.membernum = -1;
+struct class_TypePair_63e9b86975* var61;
+var61 = NULL;
+struct class_AutoType_33a5d572cb* var62;
+var62 = NULL;
+struct class_TypePair_63e9b86975* var63;
+var63 = NULL;
+struct class_AutoType_33a5d572cb* var65;
+var65 = NULL;
+struct class__null___Type__8438ac3dcf var66;
+var66.membernum = -1;
+char var67;
+struct class__null___Type__8438ac3dcf var68;
+var68.membernum = -1;
+bool var69;
+bool var70;
+struct class_Type_87e1ce5c5e var73;
+var73.membernum = -1;
+struct class_TypePair_63e9b86975* var74;
+var74 = NULL;
+struct class_AutoType_33a5d572cb* var75;
+var75 = NULL;
+struct class_TypePair_63e9b86975* var76;
+var76 = NULL;
+bool var78;
+bool var79;
+struct class_AutoType_33a5d572cb* var82;
+var82 = NULL;
+struct class__null___Type__8438ac3dcf var83;
+var83.membernum = -1;
+struct class_AutoType_33a5d572cb* var84;
+var84 = NULL;
+struct class__null___Type__8438ac3dcf var85;
+var85.membernum = -1;
+char var86;
+struct class__null___Type__8438ac3dcf var87;
+var87.membernum = -1;
+bool var88;
+bool var89;
+bool var91;
+char var93;
+struct class__null___Type__8438ac3dcf var94;
+var94.membernum = -1;
+bool var95;
+bool var96;
+struct class_Type_87e1ce5c5e var99;
+var99.membernum = -1;
+struct class_Type_87e1ce5c5e var100;
+var100.membernum = -1;
+struct class_TypePair_63e9b86975* var101;
+var101 = NULL;
+char var102;
+struct class__null___Type__8438ac3dcf var103;
+var103.membernum = -1;
+bool var104;
+bool var105;
+struct class_Type_87e1ce5c5e var108;
+var108.membernum = -1;
+struct class_TypePair_63e9b86975* var109;
+var109 = NULL;
+char var110;
+struct class__null___Type__8438ac3dcf var111;
+var111.membernum = -1;
+bool var112;
+bool var113;
+struct class_Type_87e1ce5c5e var116;
+var116.membernum = -1;
+struct class_TypePair_63e9b86975* var117;
+var117 = NULL;
+struct class_AutoType_33a5d572cb* var118;
+var118 = NULL;
+struct class_AutoType_33a5d572cb* var119;
+var119 = NULL;
+struct class_TypePair_63e9b86975* var120;
+var120 = NULL;
+struct class_TypePair_63e9b86975* var121;
+var121 = NULL;
+struct class_TypePair_63e9b86975* retval;
+var4 = ast2ir_d819fcc31b_is_autotype(var2);
+if (var4) goto label5;
+var6 = oomph_false;
+if (oomph_true) goto label7;
+label5: (void)0;
+var8 = ast2ir_d819fcc31b_is_autotype(var3);
+var6 = var8;
+label7: (void)0;
+if (var6) goto label9;
+var10 = ast2ir_d819fcc31b_is_autotype(var2);
+if (var10) goto label11;
+var12 = ast2ir_d819fcc31b_is_autotype(var3);
+if (var12) goto label13;
+var14 = ir_4b1a3e0393_get_generic_source(var2);
+var15 = ir_4b1a3e0393_get_generic_source(var3);
+var16 = oomph_null;
+var17 = (struct class__null___GenericSource__4440b6073d){ .val = { .item0 = var16 }, .membernum = 0 };
+var18 = meth__null___GenericSource__4440b6073d_equals(var14,var17);
+var19 = oomph_bool_not(var18);
+if (var19) goto label20;
+var21 = oomph_false;
+if (oomph_true) goto label22;
+label20: (void)0;
+var23 = oomph_null;
+var24 = (struct class__null___GenericSource__4440b6073d){ .val = { .item0 = var23 }, .membernum = 0 };
+var25 = meth__null___GenericSource__4440b6073d_equals(var15,var24);
+var26 = oomph_bool_not(var25);
+var21 = var26;
+label22: (void)0;
+if (var21) goto label27;
+var28 = oomph_false;
+if (oomph_true) goto label29;
+label27: (void)0;
+var30 = meth__null___GenericSource__4440b6073d_get(var14);
+var31 = var30->memb_generik;
+incref(var31);
+var32 = meth__null___GenericSource__4440b6073d_get(var15);
+var33 = var32->memb_generik;
+incref(var33);
+var34 = meth_Generic_c39b95ec73_equals(var31,var33);
+var28 = var34;
+label29: (void)0;
+if (var28) goto label35;
+if (oomph_true) goto label36;
+label35: (void)0;
+var37 = meth__null___GenericSource__4440b6073d_get(var14);
+var38 = var37->memb_generik;
+incref(var38);
+var39 = meth__null___GenericSource__4440b6073d_get(var14);
+var40 = var39->memb_arg;
+incref_Type_87e1ce5c5e(var40);
+var41 = meth__null___GenericSource__4440b6073d_get(var15);
+var42 = var41->memb_arg;
+incref_Type_87e1ce5c5e(var42);
+var43 = meth_FunctionOrMethodConverter_14d05c56fc_do_the_autotype_thing(var1,var40,var42);
+var44 = var1->memb_builtins;
+incref(var44);
+var45 = var43->memb_first;
+incref_Type_87e1ce5c5e(var45);
+var46 = meth_Builtins_bd980a9f08_generic2type(var44,var38,var45);
+var47 = var1->memb_builtins;
+incref(var47);
+var48 = var43->memb_second;
+incref_Type_87e1ce5c5e(var48);
+var49 = meth_Builtins_bd980a9f08_generic2type(var47,var38,var48);
+var50 = ctor_TypePair_63e9b86975(var46,var49);
+retval = var50; var50 = NULL;
+goto out;
+label36: (void)0;
+if (oomph_true) goto label51;
+label13: (void)0;
+
+            if (var3.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var52 = var3.val.item0;
+            incref(var52);
+var53 = meth_FunctionOrMethodConverter_14d05c56fc_lookup_autotype(var1,var52);
+var54 = oomph_null;
+var55 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var54 }, .membernum = 0 };
+var56 = meth__null___Type__8438ac3dcf_equals(var53,var55);
+var57 = oomph_bool_not(var56);
+if (var57) goto label58;
+if (oomph_true) goto label59;
+label58: (void)0;
+var60 = meth__null___Type__8438ac3dcf_get(var53);
+var61 = ctor_TypePair_63e9b86975(var2,var60);
+retval = var61; var61 = NULL;
+goto out;
+label59: (void)0;
+
+            if (var3.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var62 = var3.val.item0;
+            incref(var62);
+meth_FunctionOrMethodConverter_14d05c56fc_resolve_autotype(var1,var62,var2);
+var63 = ctor_TypePair_63e9b86975(var2,var2);
+retval = var63; var63 = NULL;
+goto out;
+label51: (void)0;
+if (oomph_true) goto label64;
+label11: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var65 = var2.val.item0;
+            incref(var65);
+var66 = meth_FunctionOrMethodConverter_14d05c56fc_lookup_autotype(var1,var65);
+var67 = oomph_null;
+var68 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var67 }, .membernum = 0 };
+var69 = meth__null___Type__8438ac3dcf_equals(var66,var68);
+var70 = oomph_bool_not(var69);
+if (var70) goto label71;
+if (oomph_true) goto label72;
+label71: (void)0;
+var73 = meth__null___Type__8438ac3dcf_get(var66);
+var74 = ctor_TypePair_63e9b86975(var73,var3);
+retval = var74; var74 = NULL;
+goto out;
+label72: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var75 = var2.val.item0;
+            incref(var75);
+meth_FunctionOrMethodConverter_14d05c56fc_resolve_autotype(var1,var75,var3);
+var76 = ctor_TypePair_63e9b86975(var3,var3);
+retval = var76; var76 = NULL;
+goto out;
+label64: (void)0;
+if (oomph_true) goto label77;
+label9: (void)0;
+var78 = meth_Type_87e1ce5c5e_equals(var2,var3);
+var79 = oomph_bool_not(var78);
+if (var79) goto label80;
+if (oomph_true) goto label81;
+label80: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var82 = var2.val.item0;
+            incref(var82);
+var83 = meth_FunctionOrMethodConverter_14d05c56fc_lookup_autotype(var1,var82);
+
+            if (var3.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var84 = var3.val.item0;
+            incref(var84);
+var85 = meth_FunctionOrMethodConverter_14d05c56fc_lookup_autotype(var1,var84);
+var86 = oomph_null;
+var87 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var86 }, .membernum = 0 };
+var88 = meth__null___Type__8438ac3dcf_equals(var83,var87);
+var89 = oomph_bool_not(var88);
+if (var89) goto label90;
+var91 = oomph_false;
+if (oomph_true) goto label92;
+label90: (void)0;
+var93 = oomph_null;
+var94 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var93 }, .membernum = 0 };
+var95 = meth__null___Type__8438ac3dcf_equals(var85,var94);
+var96 = oomph_bool_not(var95);
+var91 = var96;
+label92: (void)0;
+if (var91) goto label97;
+if (oomph_true) goto label98;
+label97: (void)0;
+var99 = meth__null___Type__8438ac3dcf_get(var83);
+var100 = meth__null___Type__8438ac3dcf_get(var85);
+var101 = ctor_TypePair_63e9b86975(var99,var100);
+retval = var101; var101 = NULL;
+goto out;
+label98: (void)0;
+var102 = oomph_null;
+var103 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var102 }, .membernum = 0 };
+var104 = meth__null___Type__8438ac3dcf_equals(var83,var103);
+var105 = oomph_bool_not(var104);
+if (var105) goto label106;
+if (oomph_true) goto label107;
+label106: (void)0;
+var108 = meth__null___Type__8438ac3dcf_get(var83);
+var109 = ctor_TypePair_63e9b86975(var108,var3);
+retval = var109; var109 = NULL;
+goto out;
+label107: (void)0;
+var110 = oomph_null;
+var111 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var110 }, .membernum = 0 };
+var112 = meth__null___Type__8438ac3dcf_equals(var85,var111);
+var113 = oomph_bool_not(var112);
+if (var113) goto label114;
+if (oomph_true) goto label115;
+label114: (void)0;
+var116 = meth__null___Type__8438ac3dcf_get(var85);
+var117 = ctor_TypePair_63e9b86975(var2,var116);
+retval = var117; var117 = NULL;
+goto out;
+label115: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var118 = var2.val.item0;
+            incref(var118);
+
+            if (var3.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var119 = var3.val.item0;
+            incref(var119);
+meth_FunctionOrMethodConverter_14d05c56fc_match_autotypes(var1,var118,var119);
+var120 = ctor_TypePair_63e9b86975(var2,var2);
+retval = var120; var120 = NULL;
+goto out;
+label81: (void)0;
+label77: (void)0;
+var121 = ctor_TypePair_63e9b86975(var2,var3);
+retval = var121; var121 = NULL;
+goto out;
+out: (void)0;
+decref((var121), dtor_TypePair_63e9b86975);
+decref((var120), dtor_TypePair_63e9b86975);
+decref((var119), dtor_AutoType_33a5d572cb);
+decref((var118), dtor_AutoType_33a5d572cb);
+decref((var117), dtor_TypePair_63e9b86975);
+decref_Type_87e1ce5c5e(var116);
+(void)0;
+(void)0;
+decref__null___Type__8438ac3dcf(var111);
+(void)0;
+decref((var109), dtor_TypePair_63e9b86975);
+decref_Type_87e1ce5c5e(var108);
+(void)0;
+(void)0;
+decref__null___Type__8438ac3dcf(var103);
+(void)0;
+decref((var101), dtor_TypePair_63e9b86975);
+decref_Type_87e1ce5c5e(var100);
+decref_Type_87e1ce5c5e(var99);
+(void)0;
+(void)0;
+decref__null___Type__8438ac3dcf(var94);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__null___Type__8438ac3dcf(var87);
+(void)0;
+decref__null___Type__8438ac3dcf(var85);
+decref((var84), dtor_AutoType_33a5d572cb);
+decref__null___Type__8438ac3dcf(var83);
+decref((var82), dtor_AutoType_33a5d572cb);
+(void)0;
+(void)0;
+decref((var76), dtor_TypePair_63e9b86975);
+decref((var75), dtor_AutoType_33a5d572cb);
+decref((var74), dtor_TypePair_63e9b86975);
+decref_Type_87e1ce5c5e(var73);
+(void)0;
+(void)0;
+decref__null___Type__8438ac3dcf(var68);
+(void)0;
+decref__null___Type__8438ac3dcf(var66);
+decref((var65), dtor_AutoType_33a5d572cb);
+decref((var63), dtor_TypePair_63e9b86975);
+decref((var62), dtor_AutoType_33a5d572cb);
+decref((var61), dtor_TypePair_63e9b86975);
+decref_Type_87e1ce5c5e(var60);
+(void)0;
+(void)0;
+decref__null___Type__8438ac3dcf(var55);
+(void)0;
+decref__null___Type__8438ac3dcf(var53);
+decref((var52), dtor_AutoType_33a5d572cb);
+decref((var50), dtor_TypePair_63e9b86975);
+decref_Type_87e1ce5c5e(var49);
+decref_Type_87e1ce5c5e(var48);
+decref((var47), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var46);
+decref_Type_87e1ce5c5e(var45);
+decref((var44), dtor_Builtins_bd980a9f08);
+decref((var43), dtor_TypePair_63e9b86975);
+decref_Type_87e1ce5c5e(var42);
+decref((var41), dtor_GenericSource_35cfcd932e);
+decref_Type_87e1ce5c5e(var40);
+decref((var39), dtor_GenericSource_35cfcd932e);
+decref((var38), dtor_Generic_c39b95ec73);
+decref((var37), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref((var33), dtor_Generic_c39b95ec73);
+decref((var32), dtor_GenericSource_35cfcd932e);
+decref((var31), dtor_Generic_c39b95ec73);
+decref((var30), dtor_GenericSource_35cfcd932e);
+(void)0;
+(void)0;
+(void)0;
+decref__null___GenericSource__4440b6073d(var24);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__null___GenericSource__4440b6073d(var17);
+(void)0;
+decref__null___GenericSource__4440b6073d(var15);
+decref__null___GenericSource__4440b6073d(var14);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}struct class__null___LocalVariable__494c1a2e12 meth_FunctionOrMethodConverter_14d05c56fc_implicit_conversion_if_possible(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_LocalVariable_846080e5ae* var2, struct class_Type_87e1ce5c5e var3){struct class_LocalVariable_846080e5ae* var4;
+var4 = NULL;
+struct class_Type_87e1ce5c5e var5;
+var5.membernum = -1;
+struct class_Type_87e1ce5c5e var6;
+var6.membernum = -1;
+struct class_TypePair_63e9b86975* var7;
+var7 = NULL;
+struct class_Type_87e1ce5c5e var8;
+var8.membernum = -1;
+struct class_Type_87e1ce5c5e var9;
+var9.membernum = -1;
+struct class_Type_87e1ce5c5e var10;
+var10.membernum = -1;
+struct class_Type_87e1ce5c5e var11;
+var11.membernum = -1;
+bool var12;
+struct class__null___LocalVariable__494c1a2e12 var15;
+var15.membernum = -1;
+struct class_Builtins_bd980a9f08* var16;
+var16 = NULL;
+struct class_Type_87e1ce5c5e var17;
+var17.membernum = -1;
+bool var18;
+bool var20;
+struct class_Type_87e1ce5c5e var22;
+var22.membernum = -1;
+struct class_Builtins_bd980a9f08* var23;
+var23 = NULL;
+struct class_Type_87e1ce5c5e var24;
+var24.membernum = -1;
+bool var25;
+struct class_Str var28;
+var28.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var29;
+var29 = NULL;
+struct class_LocalVariable_846080e5ae* var30;
+var30 = NULL;
+struct class__null___LocalVariable__494c1a2e12 var31;
+var31.membernum = -1;
+struct class_Type_87e1ce5c5e var32;
+var32.membernum = -1;
+bool var33;
+struct class_UnionType_7f899bced1* var36;
+var36 = NULL;
+char var37;
+struct class__null___List_UnionType___b20440b9a7 var38;
+var38.membernum = -1;
+struct class_List_UnionType__f35bb76792* var39;
+var39 = NULL;
+struct class_List_List_UnionType___fea86ef88e* var40;
+var40 = NULL;
+struct class_List_List_UnionType___fea86ef88e* var42;
+var42 = NULL;
+bool var43;
+bool var44;
+bool var45;
+struct class_List_UnionType__f35bb76792* var47;
+var47 = NULL;
+struct class_UnionType_7f899bced1* var48;
+var48 = NULL;
+struct class_List_Type__057f9c6088* var49;
+var49 = NULL;
+int64_t var50;
+struct class_Type_87e1ce5c5e var52;
+var52.membernum = -1;
+struct class_Type_87e1ce5c5e var54;
+var54.membernum = -1;
+bool var55;
+struct class_UnionType_7f899bced1* var57;
+var57 = NULL;
+bool var58;
+struct class_List_UnionType__f35bb76792* var61;
+var61 = NULL;
+struct class_List_UnionType__f35bb76792* var62;
+var62 = NULL;
+char var65;
+struct class__null___List_UnionType___b20440b9a7 var66;
+var66.membernum = -1;
+bool var67;
+bool var68;
+char var71;
+struct class__null___LocalVariable__494c1a2e12 var72;
+var72.membernum = -1;
+struct class__null___List_UnionType___b20440b9a7 var73;
+var73.membernum = -1;
+char var74;
+struct class__null___List_UnionType___b20440b9a7 var75;
+var75.membernum = -1;
+bool var76;
+char var79;
+struct class__null___LocalVariable__494c1a2e12 var80;
+var80.membernum = -1;
+struct class_List_UnionType__f35bb76792* var81;
+var81 = NULL;
+struct class_List_UnionType__f35bb76792* var82;
+var82 = NULL;
+int64_t var83;
+struct class_UnionType_7f899bced1* var85;
+var85 = NULL;
+struct class_Location_500c4434c9* var87;
+var87 = NULL;
+struct class_Type_87e1ce5c5e var88;
+var88.membernum = -1;
+struct class_LocalVariable_846080e5ae* var89;
+var89 = NULL;
+struct class_List_Instruction__6e475c861a* var90;
+var90 = NULL;
+struct class_InstantiateUnion_29af05529f* var91;
+var91 = NULL;
+struct class_Instruction_b0fafb4d55 var92;
+var92.membernum = -1;
+struct class_List_Instruction__6e475c861a* var93;
+var93 = NULL;
+struct class_IncRef_54322428a7* var94;
+var94 = NULL;
+struct class_Instruction_b0fafb4d55 var95;
+var95.membernum = -1;
+struct class__null___LocalVariable__494c1a2e12 var96;
+var96.membernum = -1;
+char var97;
+struct class__null___LocalVariable__494c1a2e12 var98;
+var98.membernum = -1;
+struct class__null___LocalVariable__494c1a2e12 retval;
+var4 = var2;
+incref(var4);
+var5 = var3;
+incref_Type_87e1ce5c5e(var5);
+var6 = var4->memb_type;
+incref_Type_87e1ce5c5e(var6);
+var7 = meth_FunctionOrMethodConverter_14d05c56fc_do_the_autotype_thing(var1,var6,var5);
+var8 = var7->memb_first;
+incref_Type_87e1ce5c5e(var8);
+var9 = var4->memb_type;
+var4->memb_type = var8;
+var8.membernum = -1;
+var10 = var7->memb_second;
+incref_Type_87e1ce5c5e(var10);
+decref_Type_87e1ce5c5e(var5);
+var5 = var10;
+var10.membernum = -1;
+var11 = var4->memb_type;
+incref_Type_87e1ce5c5e(var11);
+var12 = meth_Type_87e1ce5c5e_equals(var11,var5);
+if (var12) goto label13;
+if (oomph_true) goto label14;
+label13: (void)0;
+var15 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item1 = var4 }, .membernum = 1 };
+var4 = NULL;
+retval = var15; var15.membernum = -1;
+goto out;
+label14: (void)0;
+var16 = var1->memb_builtins;
+var17 = var16->memb_FLOAT;
+var16 = NULL;
+incref_Type_87e1ce5c5e(var17);
+var18 = meth_Type_87e1ce5c5e_equals(var5,var17);
+if (var18) goto label19;
+var20 = oomph_false;
+if (oomph_true) goto label21;
+label19: (void)0;
+var22 = var4->memb_type;
+incref_Type_87e1ce5c5e(var22);
+var23 = var1->memb_builtins;
+var24 = var23->memb_INT;
+var23 = NULL;
+incref_Type_87e1ce5c5e(var24);
+var25 = meth_Type_87e1ce5c5e_equals(var22,var24);
+var20 = var25;
+label21: (void)0;
+if (var20) goto label26;
+if (oomph_true) goto label27;
+label26: (void)0;
+var28 = string3_int2float_a5559f23a2; string_incref(var28);
+var29 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var29,var4);
+var30 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var28,var29);
+var31 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item1 = var30 }, .membernum = 1 };
+var30 = NULL;
+retval = var31; var31.membernum = -1;
+goto out;
+label27: (void)0;
+var32 = var5;
+var5.membernum = -1;
+
+            var33 = (
+                var32.membernum == 3
+            );
+            if (var33) goto label34;
+
+            var33 = (
+                var32.membernum == 0
+            );
+            if (var33) goto label35;
+
+            var33 = (
+                var32.membernum == 1
+            );
+            if (var33) goto label35;
+
+            var33 = (
+                var32.membernum == 2
+            );
+            if (var33) goto label35;
+label34: (void)0;
+
+            if (var32.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var36 = var32.val.item3;
+            incref(var36);
+var37 = oomph_null;
+var38 = (struct class__null___List_UnionType___b20440b9a7){ .val = { .item0 = var37 }, .membernum = 0 };
+var39 = ctor_List_UnionType__f35bb76792();
+meth_List_UnionType__f35bb76792_push(var39,var36);
+var40 = ctor_List_List_UnionType___fea86ef88e();
+meth_List_List_UnionType___fea86ef88e_push(var40,var39);
+label41: (void)0;
+decref((var42), dtor_List_List_UnionType___fea86ef88e);
+var42 = NULL;
+var42 = ctor_List_List_UnionType___fea86ef88e();
+var43 = meth_List_List_UnionType___fea86ef88e_equals(var40,var42);
+var44 = oomph_bool_not(var43);
+var45 = oomph_bool_not(var44);
+if (var45) goto label46;
+decref((var47), dtor_List_UnionType__f35bb76792);
+var47 = NULL;
+var47 = meth_List_List_UnionType___fea86ef88e_pop(var40);
+decref((var48), dtor_UnionType_7f899bced1);
+var48 = NULL;
+var48 = meth_List_UnionType__f35bb76792_last(var47);
+decref((var49), dtor_List_Type__057f9c6088);
+var49 = NULL;
+var49 = var48->memb_type_members;
+incref(var49);
+var50 = 0LL;
+label51: (void)0;
+if (var50 >= var49->len) goto label53;
+decref_Type_87e1ce5c5e(var52); var52 = var49->data[var50++]; incref_Type_87e1ce5c5e(var52);
+decref_Type_87e1ce5c5e(var54);
+var54.membernum = -1;
+var54 = var4->memb_type;
+incref_Type_87e1ce5c5e(var54);
+var55 = meth_Type_87e1ce5c5e_equals(var52,var54);
+if (var55) goto label56;
+decref((var57), dtor_UnionType_7f899bced1);
+var57 = NULL;
+
+            var58 = (
+                var52.membernum == 3
+            );
+            if (var58) goto label59;
+
+            var58 = (
+                var52.membernum == 0
+            );
+            if (var58) goto label60;
+
+            var58 = (
+                var52.membernum == 1
+            );
+            if (var58) goto label60;
+
+            var58 = (
+                var52.membernum == 2
+            );
+            if (var58) goto label60;
+label59: (void)0;
+
+            if (var52.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var57 = var52.val.item3;
+            incref(var57);
+decref((var61), dtor_List_UnionType__f35bb76792);
+var61 = NULL;
+var61 = meth_List_UnionType__f35bb76792_reversed(var47);
+decref((var62), dtor_List_UnionType__f35bb76792);
+var62 = NULL;
+var62 = meth_List_UnionType__f35bb76792_reversed(var61);
+meth_List_UnionType__f35bb76792_push(var62,var57);
+meth_List_List_UnionType___fea86ef88e_push(var40,var62);
+if (oomph_true) goto label63;
+label60: (void)0;
+label63: (void)0;
+if (oomph_true) goto label64;
+label56: (void)0;
+var65 = oomph_null;
+decref__null___List_UnionType___b20440b9a7(var66);
+var66.membernum = -1;
+var66 = (struct class__null___List_UnionType___b20440b9a7){ .val = { .item0 = var65 }, .membernum = 0 };
+var67 = meth__null___List_UnionType___b20440b9a7_equals(var38,var66);
+var68 = oomph_bool_not(var67);
+if (var68) goto label69;
+if (oomph_true) goto label70;
+label69: (void)0;
+var71 = oomph_null;
+var72 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item0 = var71 }, .membernum = 0 };
+retval = var72; var72.membernum = -1;
+goto out;
+label70: (void)0;
+decref__null___List_UnionType___b20440b9a7(var38);
+var73 = (struct class__null___List_UnionType___b20440b9a7){ .val = { .item1 = var47 }, .membernum = 1 };
+incref(var47);
+var38 = var73;
+var73.membernum = -1;
+label64: (void)0;
+if (oomph_true) goto label51;
+label53: (void)0;
+if (oomph_true) goto label41;
+label46: (void)0;
+var74 = oomph_null;
+var75 = (struct class__null___List_UnionType___b20440b9a7){ .val = { .item0 = var74 }, .membernum = 0 };
+var76 = meth__null___List_UnionType___b20440b9a7_equals(var38,var75);
+if (var76) goto label77;
+if (oomph_true) goto label78;
+label77: (void)0;
+var79 = oomph_null;
+var80 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item0 = var79 }, .membernum = 0 };
+retval = var80; var80.membernum = -1;
+goto out;
+label78: (void)0;
+var81 = meth__null___List_UnionType___b20440b9a7_get(var38);
+var82 = meth_List_UnionType__f35bb76792_reversed(var81);
+var83 = 0LL;
+label84: (void)0;
+if (var83 >= var82->len) goto label86;
+decref((var85), dtor_UnionType_7f899bced1); var85 = var82->data[var83++]; incref(var85);
+decref((var87), dtor_Location_500c4434c9);
+var87 = NULL;
+var87 = var4->memb_location;
+incref(var87);
+decref_Type_87e1ce5c5e(var88);
+var88.membernum = -1;
+var88 = (struct class_Type_87e1ce5c5e){ .val = { .item3 = var85 }, .membernum = 3 };
+var85 = NULL;
+var89 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var88,var87);
+decref((var90), dtor_List_Instruction__6e475c861a);
+var90 = NULL;
+var90 = var1->memb_code;
+incref(var90);
+var91 = ctor_InstantiateUnion_29af05529f(var89,var4);
+decref_Instruction_b0fafb4d55(var92);
+var92.membernum = -1;
+var92 = (struct class_Instruction_b0fafb4d55){ .val = { .item9 = var91 }, .membernum = 9 };
+var91 = NULL;
+meth_List_Instruction__6e475c861a_push(var90,var92);
+decref((var93), dtor_List_Instruction__6e475c861a);
+var93 = NULL;
+var93 = var1->memb_code;
+incref(var93);
+var94 = ctor_IncRef_54322428a7(var4);
+decref_Instruction_b0fafb4d55(var95);
+var95.membernum = -1;
+var95 = (struct class_Instruction_b0fafb4d55){ .val = { .item8 = var94 }, .membernum = 8 };
+var94 = NULL;
+meth_List_Instruction__6e475c861a_push(var93,var95);
+decref((var4), dtor_LocalVariable_846080e5ae);
+var4 = var89;
+var89 = NULL;
+if (oomph_true) goto label84;
+label86: (void)0;
+var96 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item1 = var4 }, .membernum = 1 };
+var4 = NULL;
+retval = var96; var96.membernum = -1;
+goto out;
+label35: (void)0;
+var97 = oomph_null;
+var98 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item0 = var97 }, .membernum = 0 };
+retval = var98; var98.membernum = -1;
+goto out;
+label99: (void)0;
+out: (void)0;
+decref__null___LocalVariable__494c1a2e12(var98);
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var96);
+decref_Instruction_b0fafb4d55(var95);
+decref((var94), dtor_IncRef_54322428a7);
+decref((var93), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var92);
+decref((var91), dtor_InstantiateUnion_29af05529f);
+decref((var90), dtor_List_Instruction__6e475c861a);
+decref((var89), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var88);
+decref((var87), dtor_Location_500c4434c9);
+decref((var85), dtor_UnionType_7f899bced1);
+(void)0;
+decref((var82), dtor_List_UnionType__f35bb76792);
+decref((var81), dtor_List_UnionType__f35bb76792);
+decref__null___LocalVariable__494c1a2e12(var80);
+(void)0;
+(void)0;
+decref__null___List_UnionType___b20440b9a7(var75);
+(void)0;
+decref__null___List_UnionType___b20440b9a7(var73);
+decref__null___LocalVariable__494c1a2e12(var72);
+(void)0;
+(void)0;
+(void)0;
+decref__null___List_UnionType___b20440b9a7(var66);
+(void)0;
+decref((var62), dtor_List_UnionType__f35bb76792);
+decref((var61), dtor_List_UnionType__f35bb76792);
+(void)0;
+decref((var57), dtor_UnionType_7f899bced1);
+(void)0;
+decref_Type_87e1ce5c5e(var54);
+decref_Type_87e1ce5c5e(var52);
+(void)0;
+decref((var49), dtor_List_Type__057f9c6088);
+decref((var48), dtor_UnionType_7f899bced1);
+decref((var47), dtor_List_UnionType__f35bb76792);
+(void)0;
+(void)0;
+(void)0;
+decref((var42), dtor_List_List_UnionType___fea86ef88e);
+decref((var40), dtor_List_List_UnionType___fea86ef88e);
+decref((var39), dtor_List_UnionType__f35bb76792);
+decref__null___List_UnionType___b20440b9a7(var38);
+(void)0;
+decref((var36), dtor_UnionType_7f899bced1);
+(void)0;
+decref_Type_87e1ce5c5e(var32);
+decref__null___LocalVariable__494c1a2e12(var31);
+decref((var30), dtor_LocalVariable_846080e5ae);
+decref((var29), dtor_List_LocalVariable__81e23234f3);
+string_decref(var28);
+(void)0;
+decref_Type_87e1ce5c5e(var24);
+decref((var23), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var22);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var17);
+decref((var16), dtor_Builtins_bd980a9f08);
+decref__null___LocalVariable__494c1a2e12(var15);
+(void)0;
+decref_Type_87e1ce5c5e(var11);
+decref_Type_87e1ce5c5e(var10);
+decref_Type_87e1ce5c5e(var9);
+decref_Type_87e1ce5c5e(var8);
+decref((var7), dtor_TypePair_63e9b86975);
+decref_Type_87e1ce5c5e(var6);
+decref_Type_87e1ce5c5e(var5);
+decref((var4), dtor_LocalVariable_846080e5ae);
+return retval;
+}struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_implicit_conversion(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_LocalVariable_846080e5ae* var2, struct class_Type_87e1ce5c5e var3){struct class__null___LocalVariable__494c1a2e12 var4;
+var4.membernum = -1;
+char var5;
+struct class__null___LocalVariable__494c1a2e12 var6;
+var6.membernum = -1;
+bool var7;
+struct class_Location_500c4434c9* var10;
+var10 = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Type_87e1ce5c5e var16;
+var16.membernum = -1;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_LocalVariable_846080e5ae* var19;
+var19 = NULL;
+struct class_LocalVariable_846080e5ae* retval;
+var4 = meth_FunctionOrMethodConverter_14d05c56fc_implicit_conversion_if_possible(var1,var2,var3);
+var5 = oomph_null;
+var6 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item0 = var5 }, .membernum = 0 };
+var7 = meth__null___LocalVariable__494c1a2e12_equals(var4,var6);
+if (var7) goto label8;
+if (oomph_true) goto label9;
+label8: (void)0;
+var10 = var2->memb_location;
+incref(var10);
+var11 = string4_wrong_type__should_be__f4388f6163; string_incref(var11);
+var12 = ir_4b1a3e0393_type_name(var3);
+var13 = oomph_string_concat(var11,var12);
+var14 = string5___but_it_s__27ee696d62; string_incref(var14);
+var15 = oomph_string_concat(var13,var14);
+var16 = var2->memb_type;
+incref_Type_87e1ce5c5e(var16);
+var17 = ir_4b1a3e0393_type_name(var16);
+var18 = oomph_string_concat(var15,var17);
+meth_Location_500c4434c9_error(var10,var18);
+label9: (void)0;
+var19 = meth__null___LocalVariable__494c1a2e12_get(var4);
+retval = var19; var19 = NULL;
+goto out;
+out: (void)0;
+decref((var19), dtor_LocalVariable_846080e5ae);
+string_decref(var18);
+string_decref(var17);
+decref_Type_87e1ce5c5e(var16);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+decref((var10), dtor_Location_500c4434c9);
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var6);
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var4);
+return retval;
+}struct class_List_LocalVariable__81e23234f3* meth_FunctionOrMethodConverter_14d05c56fc_do_args(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_List_LocalVariable__81e23234f3* var2, struct class_List_Type__057f9c6088* var3, struct class_Location_500c4434c9* var4){int64_t var5;
+int64_t var6;
+bool var7;
+bool var8;
+int64_t var11;
+int64_t var12;
+bool var13;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+int64_t var19;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+int64_t var27;
+struct class_Str var28;
+var28.buf = NULL;
+struct class_Str var29;
+var29.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var30;
+var30 = NULL;
+int64_t var31;
+int64_t var33;
+bool var34;
+bool var35;
+struct class_LocalVariable_846080e5ae* var37;
+var37 = NULL;
+struct class_Type_87e1ce5c5e var38;
+var38.membernum = -1;
+struct class_LocalVariable_846080e5ae* var39;
+var39 = NULL;
+int64_t var40;
+int64_t var41;
+struct class_List_LocalVariable__81e23234f3* retval;
+var5 = meth_List_LocalVariable__81e23234f3_length(var2);
+var6 = meth_List_Type__057f9c6088_length(var3);
+var7 = meth_Int_equals(var5,var6);
+var8 = oomph_bool_not(var7);
+if (var8) goto label9;
+if (oomph_true) goto label10;
+label9: (void)0;
+var11 = meth_List_Type__057f9c6088_length(var3);
+var12 = 1LL;
+var13 = meth_Int_equals(var11,var12);
+if (var13) goto label14;
+var15 = string6_s_afc861ea4a; string_incref(var15);
+var16 = var15;
+var15.buf = NULL;
+if (oomph_true) goto label17;
+label14: (void)0;
+var16 = string7__c99c626e9b; string_incref(var16);
+label17: (void)0;
+var18 = string8_expected__53c97793da; string_incref(var18);
+var19 = meth_List_Type__057f9c6088_length(var3);
+var20 = meth_Int_to_string(var19);
+var21 = oomph_string_concat(var18,var20);
+var22 = string9__argument_2122fd1ae9; string_incref(var22);
+var23 = oomph_string_concat(var21,var22);
+var24 = oomph_string_concat(var23,var16);
+var25 = string10___got__c117f564cf; string_incref(var25);
+var26 = oomph_string_concat(var24,var25);
+var27 = meth_List_LocalVariable__81e23234f3_length(var2);
+var28 = meth_Int_to_string(var27);
+var29 = oomph_string_concat(var26,var28);
+meth_Location_500c4434c9_error(var4,var29);
+label10: (void)0;
+var30 = ctor_List_LocalVariable__81e23234f3();
+var31 = 0LL;
+label32: (void)0;
+var33 = meth_List_LocalVariable__81e23234f3_length(var2);
+var34 = oomph_int_gt(var33,var31);
+var35 = oomph_bool_not(var34);
+if (var35) goto label36;
+decref((var37), dtor_LocalVariable_846080e5ae);
+var37 = NULL;
+var37 = meth_List_LocalVariable__81e23234f3_get(var2,var31);
+decref_Type_87e1ce5c5e(var38);
+var38.membernum = -1;
+var38 = meth_List_Type__057f9c6088_get(var3,var31);
+decref((var39), dtor_LocalVariable_846080e5ae);
+var39 = NULL;
+var39 = meth_FunctionOrMethodConverter_14d05c56fc_implicit_conversion(var1,var37,var38);
+meth_List_LocalVariable__81e23234f3_push(var30,var39);
+var40 = 1LL;
+var41 = oomph_int_add(var31,var40);
+var31 = var41;
+if (oomph_true) goto label32;
+label36: (void)0;
+retval = var30; var30 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var39), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var38);
+decref((var37), dtor_LocalVariable_846080e5ae);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var30), dtor_List_LocalVariable__81e23234f3);
+string_decref(var29);
+string_decref(var28);
+(void)0;
+string_decref(var26);
+string_decref(var25);
+string_decref(var24);
+string_decref(var23);
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+(void)0;
+string_decref(var18);
+string_decref(var16);
+string_decref(var15);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}struct class_FunctionType_4e16d0ea53* meth_FunctionOrMethodConverter_14d05c56fc_get_method_functype(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Type_87e1ce5c5e var2, struct class_Str var3){struct class_Builtins_bd980a9f08* var4;
+var4 = NULL;
+struct class_FunctionType_4e16d0ea53* var5;
+var5 = NULL;
+struct class_FunctionType_4e16d0ea53* retval;
+var4 = var1->memb_builtins;
+incref(var4);
+var5 = ir_4b1a3e0393_get_method(var2,var3,var4);
+retval = var5; var5 = NULL;
+goto out;
+out: (void)0;
+decref((var5), dtor_FunctionType_4e16d0ea53);
+decref((var4), dtor_Builtins_bd980a9f08);
+return retval;
+}struct class_Type_87e1ce5c5e meth_FunctionOrMethodConverter_14d05c56fc_get_attribute_type(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Type_87e1ce5c5e var2, struct class_Str var3){struct class_Type_87e1ce5c5e var4;
+var4.membernum = -1;
+struct class_Type_87e1ce5c5e retval;
+var4 = ir_4b1a3e0393_get_member(var2,var3);
+retval = var4; var4.membernum = -1;
+goto out;
+out: (void)0;
+decref_Type_87e1ce5c5e(var4);
+return retval;
+}struct class__null___LocalVariable__494c1a2e12 meth_FunctionOrMethodConverter_14d05c56fc_do_call(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Call_d0fb9d6234* var2, bool var3){struct class_List_Expression__d162784c9e* var4;
+var4 = NULL;
+struct class_List_LocalVariable__81e23234f3* var5;
+var5 = NULL;
+int64_t var6;
+int64_t var7;
+struct class_Expression_35f2052bf4 var9;
+var9.membernum = -1;
+struct class_LocalVariable_846080e5ae* var11;
+var11 = NULL;
+struct class_List_LocalVariable__81e23234f3* var12;
+var12 = NULL;
+char var13;
+struct class__null___LocalVariable__494c1a2e12 var14;
+var14.membernum = -1;
+struct class_Expression_35f2052bf4 var15;
+var15.membernum = -1;
+bool var16;
+struct class_GetAttribute_0758070446* var21;
+var21 = NULL;
+struct class_Expression_35f2052bf4 var22;
+var22.membernum = -1;
+struct class_LocalVariable_846080e5ae* var23;
+var23 = NULL;
+struct class_Type_87e1ce5c5e var24;
+var24.membernum = -1;
+bool var25;
+struct class_Type_87e1ce5c5e var26;
+var26.membernum = -1;
+struct class_Type_87e1ce5c5e var27;
+var27.membernum = -1;
+struct class_Type_87e1ce5c5e var28;
+var28.membernum = -1;
+bool var29;
+struct class_AutoType_33a5d572cb* var32;
+var32 = NULL;
+struct class_AutoType_33a5d572cb* var35;
+var35 = NULL;
+struct class_Location_500c4434c9* var36;
+var36 = NULL;
+struct class_Type_87e1ce5c5e var37;
+var37.membernum = -1;
+struct class_LocalVariable_846080e5ae* var38;
+var38 = NULL;
+struct class__null___LocalVariable__494c1a2e12 var39;
+var39.membernum = -1;
+struct class_Type_87e1ce5c5e var41;
+var41.membernum = -1;
+struct class_Str var42;
+var42.buf = NULL;
+struct class_FunctionType_4e16d0ea53* var43;
+var43 = NULL;
+struct class_Type_87e1ce5c5e var44;
+var44.membernum = -1;
+struct class_List_Type__057f9c6088* var45;
+var45 = NULL;
+struct class_Type_87e1ce5c5e var46;
+var46.membernum = -1;
+bool var47;
+struct class_Str var48;
+var48.buf = NULL;
+int64_t var49;
+struct class__null___Type__8438ac3dcf var50;
+var50.membernum = -1;
+char var51;
+struct class__null___Type__8438ac3dcf var52;
+var52.membernum = -1;
+bool var53;
+bool var54;
+struct class__null___Type__8438ac3dcf var57;
+var57.membernum = -1;
+struct class_Type_87e1ce5c5e var58;
+var58.membernum = -1;
+struct class_Location_500c4434c9* var59;
+var59 = NULL;
+struct class_LocalVariable_846080e5ae* var60;
+var60 = NULL;
+struct class__null___LocalVariable__494c1a2e12 var61;
+var61.membernum = -1;
+struct class_List_Type__057f9c6088* var62;
+var62 = NULL;
+int64_t var63;
+struct class_List_Type__057f9c6088* var64;
+var64 = NULL;
+int64_t var65;
+struct class_List_Type__057f9c6088* var66;
+var66 = NULL;
+struct class_Location_500c4434c9* var67;
+var67 = NULL;
+struct class_List_LocalVariable__81e23234f3* var68;
+var68 = NULL;
+struct class_List_Instruction__6e475c861a* var69;
+var69 = NULL;
+struct class_Str var70;
+var70.buf = NULL;
+struct class_Location_500c4434c9* var71;
+var71 = NULL;
+struct class_MethodCall_b0095be49c* var72;
+var72 = NULL;
+struct class_Instruction_b0fafb4d55 var73;
+var73.membernum = -1;
+struct class_GetVar_642f116a6c* var75;
+var75 = NULL;
+struct class_Str var76;
+var76.buf = NULL;
+struct class_Location_500c4434c9* var77;
+var77 = NULL;
+struct class__null___Location__87aaae6467 var78;
+var78.membernum = -1;
+struct class_Variable_1aaa81c8d2 var79;
+var79.membernum = -1;
+struct class_Type_87e1ce5c5e var80;
+var80.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var81;
+var81 = NULL;
+struct class__null___Type__8438ac3dcf var82;
+var82.membernum = -1;
+char var83;
+struct class__null___Type__8438ac3dcf var84;
+var84.membernum = -1;
+bool var85;
+bool var86;
+struct class__null___Type__8438ac3dcf var89;
+var89.membernum = -1;
+struct class_Type_87e1ce5c5e var90;
+var90.membernum = -1;
+struct class_Location_500c4434c9* var91;
+var91 = NULL;
+struct class_LocalVariable_846080e5ae* var92;
+var92 = NULL;
+struct class__null___LocalVariable__494c1a2e12 var93;
+var93.membernum = -1;
+struct class_Builtins_bd980a9f08* var94;
+var94 = NULL;
+struct class_Str var95;
+var95.buf = NULL;
+struct class_BuiltinVariable_f6e0cdd1b6* var96;
+var96 = NULL;
+struct class_Variable_1aaa81c8d2 var97;
+var97.membernum = -1;
+bool var98;
+struct class_List_Type__057f9c6088* var100;
+var100 = NULL;
+struct class_Location_500c4434c9* var101;
+var101 = NULL;
+struct class_List_LocalVariable__81e23234f3* var102;
+var102 = NULL;
+int64_t var104;
+int64_t var105;
+bool var106;
+bool var107;
+struct class_Location_500c4434c9* var110;
+var110 = NULL;
+struct class_Str var111;
+var111.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var112;
+var112 = NULL;
+int64_t var113;
+struct class_List_LocalVariable__81e23234f3* var114;
+var114 = NULL;
+int64_t var115;
+struct class_LocalVariable_846080e5ae* var117;
+var117 = NULL;
+struct class_LocalVariable_846080e5ae* var119;
+var119 = NULL;
+struct class_List_Instruction__6e475c861a* var120;
+var120 = NULL;
+struct class_FunctionCall_104f394575* var121;
+var121 = NULL;
+struct class_Instruction_b0fafb4d55 var122;
+var122.membernum = -1;
+struct class_Constructor_0c896e4031* var123;
+var123 = NULL;
+struct class_Type_e6cf7dd4e5 var124;
+var124.membernum = -1;
+struct class_Type_87e1ce5c5e var125;
+var125.membernum = -1;
+struct class__null___List_Type___114a421a91 var126;
+var126.membernum = -1;
+struct class_List_Type__057f9c6088* var127;
+var127 = NULL;
+struct class_Location_500c4434c9* var128;
+var128 = NULL;
+struct class_List_LocalVariable__81e23234f3* var129;
+var129 = NULL;
+struct class_Location_500c4434c9* var130;
+var130 = NULL;
+struct class_LocalVariable_846080e5ae* var131;
+var131 = NULL;
+struct class__null___LocalVariable__494c1a2e12 var132;
+var132.membernum = -1;
+struct class_List_Instruction__6e475c861a* var133;
+var133 = NULL;
+struct class_LocalVariable_846080e5ae* var134;
+var134 = NULL;
+struct class_ConstructorCall_f8e441a21d* var135;
+var135 = NULL;
+struct class_Instruction_b0fafb4d55 var136;
+var136.membernum = -1;
+bool var137;
+struct class_Str var138;
+var138.buf = NULL;
+int64_t var139;
+struct class__null___LocalVariable__494c1a2e12 retval;
+var4 = var2->memb_args;
+incref(var4);
+var5 = ctor_List_LocalVariable__81e23234f3();
+var6 = meth_List_Expression__d162784c9e_length(var4);
+meth_List_LocalVariable__81e23234f3___reserve(var5,var6);
+var7 = 0LL;
+label8: (void)0;
+if (var7 >= var4->len) goto label10;
+decref_Expression_35f2052bf4(var9); var9 = var4->data[var7++]; incref_Expression_35f2052bf4(var9);
+decref((var11), dtor_LocalVariable_846080e5ae);
+var11 = NULL;
+var11 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var9);
+meth_List_LocalVariable__81e23234f3_push(var5,var11);
+if (oomph_true) goto label8;
+label10: (void)0;
+var12 = var5;
+var5 = NULL;
+var13 = oomph_null;
+var14 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item0 = var13 }, .membernum = 0 };
+var15 = var2->memb_function;
+incref_Expression_35f2052bf4(var15);
+
+            var16 = (
+                var15.membernum == 5
+            );
+            if (var16) goto label17;
+
+            var16 = (
+                var15.membernum == 6
+            );
+            if (var16) goto label18;
+
+            var16 = (
+                var15.membernum == 3
+            );
+            if (var16) goto label19;
+
+            var16 = (
+                var15.membernum == 0
+            );
+            if (var16) goto label20;
+
+            var16 = (
+                var15.membernum == 1
+            );
+            if (var16) goto label20;
+
+            var16 = (
+                var15.membernum == 2
+            );
+            if (var16) goto label20;
+
+            var16 = (
+                var15.membernum == 4
+            );
+            if (var16) goto label20;
+
+            var16 = (
+                var15.membernum == 7
+            );
+            if (var16) goto label20;
+
+            var16 = (
+                var15.membernum == 8
+            );
+            if (var16) goto label20;
+
+            var16 = (
+                var15.membernum == 9
+            );
+            if (var16) goto label20;
+
+            var16 = (
+                var15.membernum == 10
+            );
+            if (var16) goto label20;
+
+            var16 = (
+                var15.membernum == 11
+            );
+            if (var16) goto label20;
+
+            var16 = (
+                var15.membernum == 12
+            );
+            if (var16) goto label20;
+
+            var16 = (
+                var15.membernum == 13
+            );
+            if (var16) goto label20;
+label17: (void)0;
+
+            if (var15.membernum != 5)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var21 = var15.val.item5;
+            incref(var21);
+var22 = var21->memb_obj;
+incref_Expression_35f2052bf4(var22);
+var23 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var22);
+var24 = var23->memb_type;
+incref_Type_87e1ce5c5e(var24);
+var25 = oomph_false;
+var26 = meth_FunctionOrMethodConverter_14d05c56fc_substitute_autotypes(var1,var24,var25);
+var27 = var23->memb_type;
+var23->memb_type = var26;
+var26.membernum = -1;
+var28 = var23->memb_type;
+incref_Type_87e1ce5c5e(var28);
+
+            var29 = (
+                var28.membernum == 0
+            );
+            if (var29) goto label30;
+
+            var29 = (
+                var28.membernum == 1
+            );
+            if (var29) goto label31;
+
+            var29 = (
+                var28.membernum == 2
+            );
+            if (var29) goto label31;
+
+            var29 = (
+                var28.membernum == 3
+            );
+            if (var29) goto label31;
+label30: (void)0;
+
+            if (var28.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var32 = var28.val.item0;
+            incref(var32);
+if (var3) goto label33;
+if (oomph_true) goto label34;
+label33: (void)0;
+var35 = meth_FunctionOrMethodConverter_14d05c56fc_create_autotype(var1);
+var36 = var2->memb_location;
+incref(var36);
+var37 = (struct class_Type_87e1ce5c5e){ .val = { .item0 = var35 }, .membernum = 0 };
+var35 = NULL;
+var38 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var37,var36);
+decref__null___LocalVariable__494c1a2e12(var14);
+var39 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item1 = var38 }, .membernum = 1 };
+var38 = NULL;
+var14 = var39;
+var39.membernum = -1;
+label34: (void)0;
+if (oomph_true) goto label40;
+label31: (void)0;
+var41 = var23->memb_type;
+incref_Type_87e1ce5c5e(var41);
+var42 = var21->memb_attribute;
+string_incref(var42);
+var43 = meth_FunctionOrMethodConverter_14d05c56fc_get_method_functype(var1,var41,var42);
+var44 = var23->memb_type;
+incref_Type_87e1ce5c5e(var44);
+var45 = var43->memb_argtypes;
+incref(var45);
+var46 = meth_List_Type__057f9c6088_first(var45);
+var47 = meth_Type_87e1ce5c5e_equals(var44,var46);
+var48 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var48);
+var49 = 320LL;
+oomph_assert(var47,var48,var49);
+var50 = var43->memb_returntype;
+incref__null___Type__8438ac3dcf(var50);
+var51 = oomph_null;
+var52 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var51 }, .membernum = 0 };
+var53 = meth__null___Type__8438ac3dcf_equals(var50,var52);
+var54 = oomph_bool_not(var53);
+if (var54) goto label55;
+if (oomph_true) goto label56;
+label55: (void)0;
+var57 = var43->memb_returntype;
+incref__null___Type__8438ac3dcf(var57);
+var58 = meth__null___Type__8438ac3dcf_get(var57);
+var59 = var2->memb_location;
+incref(var59);
+var60 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var58,var59);
+decref__null___LocalVariable__494c1a2e12(var14);
+var61 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item1 = var60 }, .membernum = 1 };
+var60 = NULL;
+var14 = var61;
+var61.membernum = -1;
+label56: (void)0;
+var62 = var43->memb_argtypes;
+incref(var62);
+var63 = 1LL;
+var64 = var43->memb_argtypes;
+incref(var64);
+var65 = meth_List_Type__057f9c6088_length(var64);
+var66 = meth_List_Type__057f9c6088_slice(var62,var63,var65);
+var67 = var2->memb_location;
+incref(var67);
+var68 = meth_FunctionOrMethodConverter_14d05c56fc_do_args(var1,var12,var66,var67);
+decref((var12), dtor_List_LocalVariable__81e23234f3);
+var12 = var68;
+var68 = NULL;
+label40: (void)0;
+var69 = var1->memb_code;
+incref(var69);
+var70 = var21->memb_attribute;
+string_incref(var70);
+var71 = var2->memb_location;
+incref(var71);
+var72 = ctor_MethodCall_b0095be49c(var23,var70,var12,var14,var71);
+var73 = (struct class_Instruction_b0fafb4d55){ .val = { .item11 = var72 }, .membernum = 11 };
+var72 = NULL;
+meth_List_Instruction__6e475c861a_push(var69,var73);
+if (oomph_true) goto label74;
+label18: (void)0;
+
+            if (var15.membernum != 6)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var75 = var15.val.item6;
+            incref(var75);
+var76 = var75->memb_varname;
+string_incref(var76);
+var77 = var75->memb_location;
+incref(var77);
+var78 = (struct class__null___Location__87aaae6467){ .val = { .item1 = var77 }, .membernum = 1 };
+var77 = NULL;
+var79 = meth_FunctionOrMethodConverter_14d05c56fc_get_var(var1,var76,var78);
+var80 = ir_4b1a3e0393_var_type(var79);
+
+            if (var80.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var81 = var80.val.item2;
+            incref(var81);
+var82 = var81->memb_returntype;
+incref__null___Type__8438ac3dcf(var82);
+var83 = oomph_null;
+var84 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var83 }, .membernum = 0 };
+var85 = meth__null___Type__8438ac3dcf_equals(var82,var84);
+var86 = oomph_bool_not(var85);
+if (var86) goto label87;
+if (oomph_true) goto label88;
+label87: (void)0;
+var89 = var81->memb_returntype;
+incref__null___Type__8438ac3dcf(var89);
+var90 = meth__null___Type__8438ac3dcf_get(var89);
+var91 = var2->memb_location;
+incref(var91);
+var92 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var90,var91);
+decref__null___LocalVariable__494c1a2e12(var14);
+var93 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item1 = var92 }, .membernum = 1 };
+var92 = NULL;
+var14 = var93;
+var93.membernum = -1;
+label88: (void)0;
+var94 = var1->memb_builtins;
+incref(var94);
+var95 = string11_print_52e44757fa; string_incref(var95);
+var96 = meth_Builtins_bd980a9f08_get_visible_var(var94,var95);
+var97 = (struct class_Variable_1aaa81c8d2){ .val = { .item0 = var96 }, .membernum = 0 };
+var96 = NULL;
+var98 = meth_Variable_1aaa81c8d2_equals(var79,var97);
+if (var98) goto label99;
+var100 = var81->memb_argtypes;
+incref(var100);
+var101 = var75->memb_location;
+incref(var101);
+var102 = meth_FunctionOrMethodConverter_14d05c56fc_do_args(var1,var12,var100,var101);
+decref((var12), dtor_List_LocalVariable__81e23234f3);
+var12 = var102;
+var102 = NULL;
+if (oomph_true) goto label103;
+label99: (void)0;
+var104 = meth_List_LocalVariable__81e23234f3_length(var12);
+var105 = 1LL;
+var106 = meth_Int_equals(var104,var105);
+var107 = oomph_bool_not(var106);
+if (var107) goto label108;
+if (oomph_true) goto label109;
+label108: (void)0;
+var110 = var75->memb_location;
+incref(var110);
+var111 = string12_print_must_be_called_with_1_argument_a627b54dcd; string_incref(var111);
+meth_Location_500c4434c9_error(var110,var111);
+label109: (void)0;
+var112 = ctor_List_LocalVariable__81e23234f3();
+var113 = meth_List_LocalVariable__81e23234f3_length(var12);
+meth_List_LocalVariable__81e23234f3___reserve(var112,var113);
+var114 = var12;
+var12 = NULL;
+var115 = 0LL;
+label116: (void)0;
+if (var115 >= var114->len) goto label118;
+decref((var117), dtor_LocalVariable_846080e5ae); var117 = var114->data[var115++]; incref(var117);
+decref((var119), dtor_LocalVariable_846080e5ae);
+var119 = NULL;
+var119 = meth_FunctionOrMethodConverter_14d05c56fc_stringify(var1,var117);
+meth_List_LocalVariable__81e23234f3_push(var112,var119);
+if (oomph_true) goto label116;
+label118: (void)0;
+var12 = var112;
+var112 = NULL;
+label103: (void)0;
+var120 = var1->memb_code;
+incref(var120);
+var121 = ctor_FunctionCall_104f394575(var79,var12,var14);
+var122 = (struct class_Instruction_b0fafb4d55){ .val = { .item3 = var121 }, .membernum = 3 };
+var121 = NULL;
+meth_List_Instruction__6e475c861a_push(var120,var122);
+if (oomph_true) goto label74;
+label19: (void)0;
+
+            if (var15.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var123 = var15.val.item3;
+            incref(var123);
+var124 = var123->memb_type;
+incref_Type_e6cf7dd4e5(var124);
+var125 = meth_FunctionOrMethodConverter_14d05c56fc_get_type(var1,var124);
+var126 = ir_4b1a3e0393_get_constructor_argtypes(var125);
+var127 = meth__null___List_Type___114a421a91_get(var126);
+var128 = var123->memb_location;
+incref(var128);
+var129 = meth_FunctionOrMethodConverter_14d05c56fc_do_args(var1,var12,var127,var128);
+decref((var12), dtor_List_LocalVariable__81e23234f3);
+var12 = var129;
+var129 = NULL;
+var130 = var2->memb_location;
+incref(var130);
+var131 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var125,var130);
+decref__null___LocalVariable__494c1a2e12(var14);
+var132 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item1 = var131 }, .membernum = 1 };
+var131 = NULL;
+var14 = var132;
+var132.membernum = -1;
+var133 = var1->memb_code;
+incref(var133);
+var134 = meth__null___LocalVariable__494c1a2e12_get(var14);
+var135 = ctor_ConstructorCall_f8e441a21d(var134,var12);
+var136 = (struct class_Instruction_b0fafb4d55){ .val = { .item0 = var135 }, .membernum = 0 };
+var135 = NULL;
+meth_List_Instruction__6e475c861a_push(var133,var136);
+if (oomph_true) goto label74;
+label20: (void)0;
+var137 = oomph_false;
+var138 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var138);
+var139 = 365LL;
+oomph_assert(var137,var138,var139);
+label74: (void)0;
+retval = var14; var14.membernum = -1;
+goto out;
+out: (void)0;
+(void)0;
+string_decref(var138);
+(void)0;
+decref_Instruction_b0fafb4d55(var136);
+decref((var135), dtor_ConstructorCall_f8e441a21d);
+decref((var134), dtor_LocalVariable_846080e5ae);
+decref((var133), dtor_List_Instruction__6e475c861a);
+decref__null___LocalVariable__494c1a2e12(var132);
+decref((var131), dtor_LocalVariable_846080e5ae);
+decref((var130), dtor_Location_500c4434c9);
+decref((var129), dtor_List_LocalVariable__81e23234f3);
+decref((var128), dtor_Location_500c4434c9);
+decref((var127), dtor_List_Type__057f9c6088);
+decref__null___List_Type___114a421a91(var126);
+decref_Type_87e1ce5c5e(var125);
+decref_Type_e6cf7dd4e5(var124);
+decref((var123), dtor_Constructor_0c896e4031);
+decref_Instruction_b0fafb4d55(var122);
+decref((var121), dtor_FunctionCall_104f394575);
+decref((var120), dtor_List_Instruction__6e475c861a);
+decref((var119), dtor_LocalVariable_846080e5ae);
+decref((var117), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref((var114), dtor_List_LocalVariable__81e23234f3);
+(void)0;
+decref((var112), dtor_List_LocalVariable__81e23234f3);
+string_decref(var111);
+decref((var110), dtor_Location_500c4434c9);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var102), dtor_List_LocalVariable__81e23234f3);
+decref((var101), dtor_Location_500c4434c9);
+decref((var100), dtor_List_Type__057f9c6088);
+(void)0;
+decref_Variable_1aaa81c8d2(var97);
+decref((var96), dtor_BuiltinVariable_f6e0cdd1b6);
+string_decref(var95);
+decref((var94), dtor_Builtins_bd980a9f08);
+decref__null___LocalVariable__494c1a2e12(var93);
+decref((var92), dtor_LocalVariable_846080e5ae);
+decref((var91), dtor_Location_500c4434c9);
+decref_Type_87e1ce5c5e(var90);
+decref__null___Type__8438ac3dcf(var89);
+(void)0;
+(void)0;
+decref__null___Type__8438ac3dcf(var84);
+(void)0;
+decref__null___Type__8438ac3dcf(var82);
+decref((var81), dtor_FunctionType_4e16d0ea53);
+decref_Type_87e1ce5c5e(var80);
+decref_Variable_1aaa81c8d2(var79);
+decref__null___Location__87aaae6467(var78);
+decref((var77), dtor_Location_500c4434c9);
+string_decref(var76);
+decref((var75), dtor_GetVar_642f116a6c);
+decref_Instruction_b0fafb4d55(var73);
+decref((var72), dtor_MethodCall_b0095be49c);
+decref((var71), dtor_Location_500c4434c9);
+string_decref(var70);
+decref((var69), dtor_List_Instruction__6e475c861a);
+decref((var68), dtor_List_LocalVariable__81e23234f3);
+decref((var67), dtor_Location_500c4434c9);
+decref((var66), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var64), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var62), dtor_List_Type__057f9c6088);
+decref__null___LocalVariable__494c1a2e12(var61);
+decref((var60), dtor_LocalVariable_846080e5ae);
+decref((var59), dtor_Location_500c4434c9);
+decref_Type_87e1ce5c5e(var58);
+decref__null___Type__8438ac3dcf(var57);
+(void)0;
+(void)0;
+decref__null___Type__8438ac3dcf(var52);
+(void)0;
+decref__null___Type__8438ac3dcf(var50);
+(void)0;
+string_decref(var48);
+(void)0;
+decref_Type_87e1ce5c5e(var46);
+decref((var45), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var44);
+decref((var43), dtor_FunctionType_4e16d0ea53);
+string_decref(var42);
+decref_Type_87e1ce5c5e(var41);
+decref__null___LocalVariable__494c1a2e12(var39);
+decref((var38), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var37);
+decref((var36), dtor_Location_500c4434c9);
+decref((var35), dtor_AutoType_33a5d572cb);
+decref((var32), dtor_AutoType_33a5d572cb);
+(void)0;
+decref_Type_87e1ce5c5e(var28);
+decref_Type_87e1ce5c5e(var27);
+decref_Type_87e1ce5c5e(var26);
+(void)0;
+decref_Type_87e1ce5c5e(var24);
+decref((var23), dtor_LocalVariable_846080e5ae);
+decref_Expression_35f2052bf4(var22);
+decref((var21), dtor_GetAttribute_0758070446);
+(void)0;
+decref_Expression_35f2052bf4(var15);
+decref__null___LocalVariable__494c1a2e12(var14);
+(void)0;
+decref((var12), dtor_List_LocalVariable__81e23234f3);
+decref((var11), dtor_LocalVariable_846080e5ae);
+decref_Expression_35f2052bf4(var9);
+(void)0;
+(void)0;
+decref((var5), dtor_List_LocalVariable__81e23234f3);
+decref((var4), dtor_List_Expression__d162784c9e);
+return retval;
+}struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_not_(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_LocalVariable_846080e5ae* var2){struct class_Str var3;
+var3.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var4;
+var4 = NULL;
+struct class_LocalVariable_846080e5ae* var5;
+var5 = NULL;
+struct class_LocalVariable_846080e5ae* retval;
+var3 = string13_bool_not_044770c441; string_incref(var3);
+var4 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var4,var2);
+var5 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var3,var4);
+retval = var5; var5 = NULL;
+goto out;
+out: (void)0;
+decref((var5), dtor_LocalVariable_846080e5ae);
+decref((var4), dtor_List_LocalVariable__81e23234f3);
+string_decref(var3);
+return retval;
+}struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_bool_constant(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Str var2, struct class_Location_500c4434c9* var3){struct class_Builtins_bd980a9f08* var4;
+var4 = NULL;
+struct class_Type_87e1ce5c5e var5;
+var5.membernum = -1;
+struct class_LocalVariable_846080e5ae* var6;
+var6 = NULL;
+struct class_List_Instruction__6e475c861a* var7;
+var7 = NULL;
+struct class_Builtins_bd980a9f08* var8;
+var8 = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_BuiltinVariable_f6e0cdd1b6* var10;
+var10 = NULL;
+struct class_Variable_1aaa81c8d2 var11;
+var11.membernum = -1;
+struct class_VarCpy_e77a538911* var12;
+var12 = NULL;
+struct class_Instruction_b0fafb4d55 var13;
+var13.membernum = -1;
+struct class_LocalVariable_846080e5ae* retval;
+var4 = var1->memb_builtins;
+var5 = var4->memb_BOOL;
+var4 = NULL;
+incref_Type_87e1ce5c5e(var5);
+var6 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var5,var3);
+var7 = var1->memb_code;
+incref(var7);
+var8 = var1->memb_builtins;
+incref(var8);
+var9 = string14_true_7fafb4b9ec; string_incref(var9);
+var10 = meth_Builtins_bd980a9f08_get_visible_var(var8,var9);
+var11 = (struct class_Variable_1aaa81c8d2){ .val = { .item0 = var10 }, .membernum = 0 };
+var10 = NULL;
+var12 = ctor_VarCpy_e77a538911(var6,var11);
+var13 = (struct class_Instruction_b0fafb4d55){ .val = { .item18 = var12 }, .membernum = 18 };
+var12 = NULL;
+meth_List_Instruction__6e475c861a_push(var7,var13);
+retval = var6; var6 = NULL;
+goto out;
+out: (void)0;
+decref_Instruction_b0fafb4d55(var13);
+decref((var12), dtor_VarCpy_e77a538911);
+decref_Variable_1aaa81c8d2(var11);
+decref((var10), dtor_BuiltinVariable_f6e0cdd1b6);
+string_decref(var9);
+decref((var8), dtor_Builtins_bd980a9f08);
+decref((var7), dtor_List_Instruction__6e475c861a);
+decref((var6), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var5);
+decref((var4), dtor_Builtins_bd980a9f08);
+return retval;
+}struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_do_binary_op_typed(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_LocalVariable_846080e5ae* var2, struct class_Str var3, struct class_Location_500c4434c9* var4, struct class_LocalVariable_846080e5ae* var5){struct class_LocalVariable_846080e5ae* var6;
+var6 = NULL;
+struct class_LocalVariable_846080e5ae* var7;
+var7 = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_List_Str__43b70c06cb* var10;
+var10 = NULL;
+bool var11;
+struct class_Builtins_bd980a9f08* var14;
+var14 = NULL;
+struct class_Type_87e1ce5c5e var15;
+var15.membernum = -1;
+struct class_LocalVariable_846080e5ae* var16;
+var16 = NULL;
+struct class_List_Instruction__6e475c861a* var17;
+var17 = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var19;
+var19 = NULL;
+struct class__null___LocalVariable__494c1a2e12 var20;
+var20.membernum = -1;
+struct class_MethodCall_b0095be49c* var21;
+var21 = NULL;
+struct class_Instruction_b0fafb4d55 var22;
+var22.membernum = -1;
+struct class_Str var23;
+var23.buf = NULL;
+bool var24;
+struct class_LocalVariable_846080e5ae* var27;
+var27 = NULL;
+struct class_Type_87e1ce5c5e var28;
+var28.membernum = -1;
+struct class_Type_87e1ce5c5e var29;
+var29.membernum = -1;
+bool var30;
+bool var31;
+struct class_Type_87e1ce5c5e var34;
+var34.membernum = -1;
+struct class__null___LocalVariable__494c1a2e12 var35;
+var35.membernum = -1;
+struct class_Type_87e1ce5c5e var36;
+var36.membernum = -1;
+struct class__null___LocalVariable__494c1a2e12 var37;
+var37.membernum = -1;
+char var38;
+struct class__null___LocalVariable__494c1a2e12 var39;
+var39.membernum = -1;
+bool var40;
+bool var42;
+char var44;
+struct class__null___LocalVariable__494c1a2e12 var45;
+var45.membernum = -1;
+bool var46;
+bool var47;
+char var49;
+struct class__null___LocalVariable__494c1a2e12 var50;
+var50.membernum = -1;
+bool var51;
+bool var52;
+bool var54;
+char var56;
+struct class__null___LocalVariable__494c1a2e12 var57;
+var57.membernum = -1;
+bool var58;
+struct class_LocalVariable_846080e5ae* var61;
+var61 = NULL;
+struct class_LocalVariable_846080e5ae* var63;
+var63 = NULL;
+struct class_Type_87e1ce5c5e var64;
+var64.membernum = -1;
+bool var65;
+struct class_Type_87e1ce5c5e var66;
+var66.membernum = -1;
+struct class_Type_87e1ce5c5e var67;
+var67.membernum = -1;
+bool var68;
+struct class_Type_87e1ce5c5e var69;
+var69.membernum = -1;
+bool var70;
+struct class_Str var71;
+var71.buf = NULL;
+int64_t var72;
+struct class_Type_87e1ce5c5e var73;
+var73.membernum = -1;
+bool var74;
+struct class_Type_87e1ce5c5e var75;
+var75.membernum = -1;
+struct class_Str var76;
+var76.buf = NULL;
+bool var77;
+struct class_Str var80;
+var80.buf = NULL;
+struct class_LocalVariable_846080e5ae* var81;
+var81 = NULL;
+struct class_LocalVariable_846080e5ae* var82;
+var82 = NULL;
+struct class_Str var83;
+var83.buf = NULL;
+bool var84;
+struct class_Str var87;
+var87.buf = NULL;
+struct class_LocalVariable_846080e5ae* var88;
+var88 = NULL;
+struct class_Str var89;
+var89.buf = NULL;
+bool var90;
+struct class_Str var93;
+var93.buf = NULL;
+struct class_LocalVariable_846080e5ae* var94;
+var94 = NULL;
+struct class_LocalVariable_846080e5ae* var95;
+var95 = NULL;
+struct class_Str var96;
+var96.buf = NULL;
+bool var97;
+struct class_Str var100;
+var100.buf = NULL;
+struct class_LocalVariable_846080e5ae* var101;
+var101 = NULL;
+struct class_LocalVariable_846080e5ae* var102;
+var102 = NULL;
+struct class_Builtins_bd980a9f08* var103;
+var103 = NULL;
+struct class_Type_87e1ce5c5e var104;
+var104.membernum = -1;
+bool var105;
+bool var107;
+struct class_Str var109;
+var109.buf = NULL;
+bool var110;
+struct class_Str var113;
+var113.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var114;
+var114 = NULL;
+struct class_LocalVariable_846080e5ae* var115;
+var115 = NULL;
+struct class_Builtins_bd980a9f08* var116;
+var116 = NULL;
+struct class_Type_87e1ce5c5e var117;
+var117.membernum = -1;
+bool var118;
+bool var120;
+struct class_Str var122;
+var122.buf = NULL;
+bool var123;
+struct class_Str var126;
+var126.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var127;
+var127 = NULL;
+struct class_LocalVariable_846080e5ae* var128;
+var128 = NULL;
+struct class_Builtins_bd980a9f08* var129;
+var129 = NULL;
+struct class_Type_87e1ce5c5e var130;
+var130.membernum = -1;
+bool var131;
+bool var133;
+struct class_Str var135;
+var135.buf = NULL;
+bool var136;
+struct class_Str var139;
+var139.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var140;
+var140 = NULL;
+struct class_LocalVariable_846080e5ae* var141;
+var141 = NULL;
+struct class_Builtins_bd980a9f08* var142;
+var142 = NULL;
+struct class_Type_87e1ce5c5e var143;
+var143.membernum = -1;
+bool var144;
+bool var146;
+struct class_Str var148;
+var148.buf = NULL;
+bool var149;
+struct class_Str var152;
+var152.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var153;
+var153 = NULL;
+struct class_LocalVariable_846080e5ae* var154;
+var154 = NULL;
+struct class_Builtins_bd980a9f08* var155;
+var155 = NULL;
+struct class_Type_87e1ce5c5e var156;
+var156.membernum = -1;
+bool var157;
+bool var159;
+struct class_Str var161;
+var161.buf = NULL;
+bool var162;
+struct class_Str var165;
+var165.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var166;
+var166 = NULL;
+struct class_LocalVariable_846080e5ae* var167;
+var167 = NULL;
+struct class_Builtins_bd980a9f08* var168;
+var168 = NULL;
+struct class_Type_87e1ce5c5e var169;
+var169.membernum = -1;
+bool var170;
+bool var172;
+struct class_Str var174;
+var174.buf = NULL;
+bool var175;
+struct class_Str var178;
+var178.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var179;
+var179 = NULL;
+struct class_LocalVariable_846080e5ae* var180;
+var180 = NULL;
+struct class_Builtins_bd980a9f08* var181;
+var181 = NULL;
+struct class_Type_87e1ce5c5e var182;
+var182.membernum = -1;
+bool var183;
+bool var185;
+struct class_Str var187;
+var187.buf = NULL;
+bool var188;
+struct class_Str var191;
+var191.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var192;
+var192 = NULL;
+struct class_LocalVariable_846080e5ae* var193;
+var193 = NULL;
+struct class_Str var194;
+var194.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var195;
+var195 = NULL;
+struct class_LocalVariable_846080e5ae* var196;
+var196 = NULL;
+struct class_Builtins_bd980a9f08* var197;
+var197 = NULL;
+struct class_Type_87e1ce5c5e var198;
+var198.membernum = -1;
+struct class_Builtins_bd980a9f08* var199;
+var199 = NULL;
+struct class_Type_87e1ce5c5e var200;
+var200.membernum = -1;
+bool var201;
+bool var203;
+struct class_Str var205;
+var205.buf = NULL;
+bool var206;
+struct class_Str var209;
+var209.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var210;
+var210 = NULL;
+struct class_LocalVariable_846080e5ae* var211;
+var211 = NULL;
+struct class_Builtins_bd980a9f08* var212;
+var212 = NULL;
+struct class_Type_87e1ce5c5e var213;
+var213.membernum = -1;
+bool var214;
+bool var216;
+struct class_Str var218;
+var218.buf = NULL;
+bool var219;
+struct class_Str var222;
+var222.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var223;
+var223 = NULL;
+struct class_LocalVariable_846080e5ae* var224;
+var224 = NULL;
+struct class_Builtins_bd980a9f08* var225;
+var225 = NULL;
+struct class_Type_87e1ce5c5e var226;
+var226.membernum = -1;
+bool var227;
+bool var229;
+struct class_Str var231;
+var231.buf = NULL;
+bool var232;
+struct class_Str var235;
+var235.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var236;
+var236 = NULL;
+struct class_LocalVariable_846080e5ae* var237;
+var237 = NULL;
+struct class_Builtins_bd980a9f08* var238;
+var238 = NULL;
+struct class_Type_87e1ce5c5e var239;
+var239.membernum = -1;
+bool var240;
+bool var242;
+struct class_Str var244;
+var244.buf = NULL;
+bool var245;
+struct class_Str var248;
+var248.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var249;
+var249 = NULL;
+struct class_LocalVariable_846080e5ae* var250;
+var250 = NULL;
+struct class_Builtins_bd980a9f08* var251;
+var251 = NULL;
+struct class_Type_87e1ce5c5e var252;
+var252.membernum = -1;
+bool var253;
+bool var255;
+struct class_Str var257;
+var257.buf = NULL;
+bool var258;
+struct class_Str var261;
+var261.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var262;
+var262 = NULL;
+struct class_LocalVariable_846080e5ae* var263;
+var263 = NULL;
+struct class_Builtins_bd980a9f08* var264;
+var264 = NULL;
+struct class_Type_87e1ce5c5e var265;
+var265.membernum = -1;
+bool var266;
+bool var268;
+struct class_Str var270;
+var270.buf = NULL;
+bool var271;
+struct class_Str var274;
+var274.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var275;
+var275 = NULL;
+struct class_LocalVariable_846080e5ae* var276;
+var276 = NULL;
+struct class_Str var277;
+var277.buf = NULL;
+bool var278;
+struct class_Builtins_bd980a9f08* var281;
+var281 = NULL;
+struct class_Type_87e1ce5c5e var282;
+var282.membernum = -1;
+struct class_LocalVariable_846080e5ae* var283;
+var283 = NULL;
+struct class_List_Instruction__6e475c861a* var284;
+var284 = NULL;
+struct class_Str var285;
+var285.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var286;
+var286 = NULL;
+struct class__null___LocalVariable__494c1a2e12 var287;
+var287.membernum = -1;
+struct class_MethodCall_b0095be49c* var288;
+var288 = NULL;
+struct class_Instruction_b0fafb4d55 var289;
+var289.membernum = -1;
+struct class_Str var290;
+var290.buf = NULL;
+struct class_Str var291;
+var291.buf = NULL;
+struct class_Str var292;
+var292.buf = NULL;
+struct class_Str var293;
+var293.buf = NULL;
+struct class_Str var294;
+var294.buf = NULL;
+struct class_Str var295;
+var295.buf = NULL;
+struct class_Str var296;
+var296.buf = NULL;
+struct class_Str var297;
+var297.buf = NULL;
+struct class_Str var298;
+var298.buf = NULL;
+struct class_Str var299;
+var299.buf = NULL;
+bool var300;
+struct class_Str var301;
+var301.buf = NULL;
+int64_t var302;
+struct class_LocalVariable_846080e5ae* retval;
+var6 = var2;
+incref(var6);
+var7 = var5;
+incref(var7);
+var8 = string15_in_6609819b55; string_incref(var8);
+var9 = string16_not_in_b0f1dd0794; string_incref(var9);
+var10 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var10,var8);
+meth_List_Str__43b70c06cb_push(var10,var9);
+var11 = meth_List_Str__43b70c06cb___contains(var10,var3);
+if (var11) goto label12;
+if (oomph_true) goto label13;
+label12: (void)0;
+var14 = var1->memb_builtins;
+var15 = var14->memb_BOOL;
+var14 = NULL;
+incref_Type_87e1ce5c5e(var15);
+var16 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var15,var4);
+var17 = var1->memb_code;
+incref(var17);
+var18 = string17___contains_43aa841d5f; string_incref(var18);
+var19 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var19,var6);
+var20 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item1 = var16 }, .membernum = 1 };
+incref(var16);
+var21 = ctor_MethodCall_b0095be49c(var7,var18,var19,var20,var4);
+var22 = (struct class_Instruction_b0fafb4d55){ .val = { .item11 = var21 }, .membernum = 11 };
+var21 = NULL;
+meth_List_Instruction__6e475c861a_push(var17,var22);
+var23 = string16_not_in_b0f1dd0794; string_incref(var23);
+var24 = meth_Str_equals(var3,var23);
+if (var24) goto label25;
+if (oomph_true) goto label26;
+label25: (void)0;
+var27 = meth_FunctionOrMethodConverter_14d05c56fc_not_(var1,var16);
+retval = var27; var27 = NULL;
+goto out;
+label26: (void)0;
+retval = var16; var16 = NULL;
+goto out;
+label13: (void)0;
+var28 = var6->memb_type;
+incref_Type_87e1ce5c5e(var28);
+var29 = var7->memb_type;
+incref_Type_87e1ce5c5e(var29);
+var30 = meth_Type_87e1ce5c5e_equals(var28,var29);
+var31 = oomph_bool_not(var30);
+if (var31) goto label32;
+if (oomph_true) goto label33;
+label32: (void)0;
+var34 = var7->memb_type;
+incref_Type_87e1ce5c5e(var34);
+var35 = meth_FunctionOrMethodConverter_14d05c56fc_implicit_conversion_if_possible(var1,var6,var34);
+var36 = var6->memb_type;
+incref_Type_87e1ce5c5e(var36);
+var37 = meth_FunctionOrMethodConverter_14d05c56fc_implicit_conversion_if_possible(var1,var7,var36);
+var38 = oomph_null;
+var39 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item0 = var38 }, .membernum = 0 };
+var40 = meth__null___LocalVariable__494c1a2e12_equals(var35,var39);
+if (var40) goto label41;
+var42 = oomph_false;
+if (oomph_true) goto label43;
+label41: (void)0;
+var44 = oomph_null;
+var45 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item0 = var44 }, .membernum = 0 };
+var46 = meth__null___LocalVariable__494c1a2e12_equals(var37,var45);
+var47 = oomph_bool_not(var46);
+var42 = var47;
+label43: (void)0;
+if (var42) goto label48;
+var49 = oomph_null;
+var50 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item0 = var49 }, .membernum = 0 };
+var51 = meth__null___LocalVariable__494c1a2e12_equals(var35,var50);
+var52 = oomph_bool_not(var51);
+if (var52) goto label53;
+var54 = oomph_false;
+if (oomph_true) goto label55;
+label53: (void)0;
+var56 = oomph_null;
+var57 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item0 = var56 }, .membernum = 0 };
+var58 = meth__null___LocalVariable__494c1a2e12_equals(var37,var57);
+var54 = var58;
+label55: (void)0;
+if (var54) goto label59;
+if (oomph_true) goto label60;
+label59: (void)0;
+var61 = meth__null___LocalVariable__494c1a2e12_get(var35);
+decref((var6), dtor_LocalVariable_846080e5ae);
+var6 = var61;
+var61 = NULL;
+label60: (void)0;
+if (oomph_true) goto label62;
+label48: (void)0;
+var63 = meth__null___LocalVariable__494c1a2e12_get(var37);
+decref((var7), dtor_LocalVariable_846080e5ae);
+var7 = var63;
+var63 = NULL;
+label62: (void)0;
+label33: (void)0;
+var64 = var6->memb_type;
+incref_Type_87e1ce5c5e(var64);
+var65 = oomph_false;
+var66 = meth_FunctionOrMethodConverter_14d05c56fc_substitute_autotypes(var1,var64,var65);
+var67 = var7->memb_type;
+incref_Type_87e1ce5c5e(var67);
+var68 = oomph_false;
+var69 = meth_FunctionOrMethodConverter_14d05c56fc_substitute_autotypes(var1,var67,var68);
+var70 = meth_Type_87e1ce5c5e_equals(var66,var69);
+var71 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var71);
+var72 = 397LL;
+oomph_assert(var70,var71,var72);
+var73 = var6->memb_type;
+incref_Type_87e1ce5c5e(var73);
+var74 = oomph_false;
+var75 = meth_FunctionOrMethodConverter_14d05c56fc_substitute_autotypes(var1,var73,var74);
+var76 = string18____58d7772a7b; string_incref(var76);
+var77 = meth_Str_equals(var3,var76);
+if (var77) goto label78;
+if (oomph_true) goto label79;
+label78: (void)0;
+var80 = string19____5636f2c917; string_incref(var80);
+var81 = meth_FunctionOrMethodConverter_14d05c56fc_do_binary_op_typed(var1,var6,var80,var4,var7);
+var82 = meth_FunctionOrMethodConverter_14d05c56fc_not_(var1,var81);
+retval = var82; var82 = NULL;
+goto out;
+label79: (void)0;
+var83 = string20___eb69a54709; string_incref(var83);
+var84 = meth_Str_equals(var3,var83);
+if (var84) goto label85;
+if (oomph_true) goto label86;
+label85: (void)0;
+var87 = string21___60f7097246; string_incref(var87);
+var88 = meth_FunctionOrMethodConverter_14d05c56fc_do_binary_op_typed(var1,var7,var87,var4,var6);
+retval = var88; var88 = NULL;
+goto out;
+label86: (void)0;
+var89 = string22____73709df24c; string_incref(var89);
+var90 = meth_Str_equals(var3,var89);
+if (var90) goto label91;
+if (oomph_true) goto label92;
+label91: (void)0;
+var93 = string21___60f7097246; string_incref(var93);
+var94 = meth_FunctionOrMethodConverter_14d05c56fc_do_binary_op_typed(var1,var6,var93,var4,var7);
+var95 = meth_FunctionOrMethodConverter_14d05c56fc_not_(var1,var94);
+retval = var95; var95 = NULL;
+goto out;
+label92: (void)0;
+var96 = string23____7ff3e97294; string_incref(var96);
+var97 = meth_Str_equals(var3,var96);
+if (var97) goto label98;
+if (oomph_true) goto label99;
+label98: (void)0;
+var100 = string20___eb69a54709; string_incref(var100);
+var101 = meth_FunctionOrMethodConverter_14d05c56fc_do_binary_op_typed(var1,var6,var100,var4,var7);
+var102 = meth_FunctionOrMethodConverter_14d05c56fc_not_(var1,var101);
+retval = var102; var102 = NULL;
+goto out;
+label99: (void)0;
+var103 = var1->memb_builtins;
+var104 = var103->memb_STR;
+var103 = NULL;
+incref_Type_87e1ce5c5e(var104);
+var105 = meth_Type_87e1ce5c5e_equals(var75,var104);
+if (var105) goto label106;
+var107 = oomph_false;
+if (oomph_true) goto label108;
+label106: (void)0;
+var109 = string24___274da8c49e; string_incref(var109);
+var110 = meth_Str_equals(var3,var109);
+var107 = var110;
+label108: (void)0;
+if (var107) goto label111;
+if (oomph_true) goto label112;
+label111: (void)0;
+var113 = string25_string_concat_8eba42145a; string_incref(var113);
+var114 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var114,var6);
+meth_List_LocalVariable__81e23234f3_push(var114,var7);
+var115 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var113,var114);
+retval = var115; var115 = NULL;
+goto out;
+label112: (void)0;
+var116 = var1->memb_builtins;
+var117 = var116->memb_INT;
+var116 = NULL;
+incref_Type_87e1ce5c5e(var117);
+var118 = meth_Type_87e1ce5c5e_equals(var75,var117);
+if (var118) goto label119;
+var120 = oomph_false;
+if (oomph_true) goto label121;
+label119: (void)0;
+var122 = string24___274da8c49e; string_incref(var122);
+var123 = meth_Str_equals(var3,var122);
+var120 = var123;
+label121: (void)0;
+if (var120) goto label124;
+if (oomph_true) goto label125;
+label124: (void)0;
+var126 = string26_int_add_c4bbff9d11; string_incref(var126);
+var127 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var127,var6);
+meth_List_LocalVariable__81e23234f3_push(var127,var7);
+var128 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var126,var127);
+retval = var128; var128 = NULL;
+goto out;
+label125: (void)0;
+var129 = var1->memb_builtins;
+var130 = var129->memb_INT;
+var129 = NULL;
+incref_Type_87e1ce5c5e(var130);
+var131 = meth_Type_87e1ce5c5e_equals(var75,var130);
+if (var131) goto label132;
+var133 = oomph_false;
+if (oomph_true) goto label134;
+label132: (void)0;
+var135 = string27___039618761f; string_incref(var135);
+var136 = meth_Str_equals(var3,var135);
+var133 = var136;
+label134: (void)0;
+if (var133) goto label137;
+if (oomph_true) goto label138;
+label137: (void)0;
+var139 = string28_int_sub_6fe33733ef; string_incref(var139);
+var140 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var140,var6);
+meth_List_LocalVariable__81e23234f3_push(var140,var7);
+var141 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var139,var140);
+retval = var141; var141 = NULL;
+goto out;
+label138: (void)0;
+var142 = var1->memb_builtins;
+var143 = var142->memb_INT;
+var142 = NULL;
+incref_Type_87e1ce5c5e(var143);
+var144 = meth_Type_87e1ce5c5e_equals(var75,var143);
+if (var144) goto label145;
+var146 = oomph_false;
+if (oomph_true) goto label147;
+label145: (void)0;
+var148 = string29___a4b78792af; string_incref(var148);
+var149 = meth_Str_equals(var3,var148);
+var146 = var149;
+label147: (void)0;
+if (var146) goto label150;
+if (oomph_true) goto label151;
+label150: (void)0;
+var152 = string30_int_mul_c20cc3837d; string_incref(var152);
+var153 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var153,var6);
+meth_List_LocalVariable__81e23234f3_push(var153,var7);
+var154 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var152,var153);
+retval = var154; var154 = NULL;
+goto out;
+label151: (void)0;
+var155 = var1->memb_builtins;
+var156 = var155->memb_INT;
+var155 = NULL;
+incref_Type_87e1ce5c5e(var156);
+var157 = meth_Type_87e1ce5c5e_equals(var75,var156);
+if (var157) goto label158;
+var159 = oomph_false;
+if (oomph_true) goto label160;
+label158: (void)0;
+var161 = string31_mod_24ee0daef1; string_incref(var161);
+var162 = meth_Str_equals(var3,var161);
+var159 = var162;
+label160: (void)0;
+if (var159) goto label163;
+if (oomph_true) goto label164;
+label163: (void)0;
+var165 = string32_int_mod_b40436a1e7; string_incref(var165);
+var166 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var166,var6);
+meth_List_LocalVariable__81e23234f3_push(var166,var7);
+var167 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var165,var166);
+retval = var167; var167 = NULL;
+goto out;
+label164: (void)0;
+var168 = var1->memb_builtins;
+var169 = var168->memb_INT;
+var168 = NULL;
+incref_Type_87e1ce5c5e(var169);
+var170 = meth_Type_87e1ce5c5e_equals(var75,var169);
+if (var170) goto label171;
+var172 = oomph_false;
+if (oomph_true) goto label173;
+label171: (void)0;
+var174 = string21___60f7097246; string_incref(var174);
+var175 = meth_Str_equals(var3,var174);
+var172 = var175;
+label173: (void)0;
+if (var172) goto label176;
+if (oomph_true) goto label177;
+label176: (void)0;
+var178 = string33_int_gt_ba483fe15c; string_incref(var178);
+var179 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var179,var6);
+meth_List_LocalVariable__81e23234f3_push(var179,var7);
+var180 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var178,var179);
+retval = var180; var180 = NULL;
+goto out;
+label177: (void)0;
+var181 = var1->memb_builtins;
+var182 = var181->memb_INT;
+var181 = NULL;
+incref_Type_87e1ce5c5e(var182);
+var183 = meth_Type_87e1ce5c5e_equals(var75,var182);
+if (var183) goto label184;
+var185 = oomph_false;
+if (oomph_true) goto label186;
+label184: (void)0;
+var187 = string34___cb84f637ff; string_incref(var187);
+var188 = meth_Str_equals(var3,var187);
+var185 = var188;
+label186: (void)0;
+if (var185) goto label189;
+if (oomph_true) goto label190;
+label189: (void)0;
+var191 = string3_int2float_a5559f23a2; string_incref(var191);
+var192 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var192,var6);
+var193 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var191,var192);
+decref((var6), dtor_LocalVariable_846080e5ae);
+var6 = var193;
+var193 = NULL;
+var194 = string3_int2float_a5559f23a2; string_incref(var194);
+var195 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var195,var7);
+var196 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var194,var195);
+decref((var7), dtor_LocalVariable_846080e5ae);
+var7 = var196;
+var196 = NULL;
+var197 = var1->memb_builtins;
+var198 = var197->memb_FLOAT;
+var197 = NULL;
+incref_Type_87e1ce5c5e(var198);
+decref_Type_87e1ce5c5e(var75);
+var75 = var198;
+var198.membernum = -1;
+label190: (void)0;
+var199 = var1->memb_builtins;
+var200 = var199->memb_FLOAT;
+var199 = NULL;
+incref_Type_87e1ce5c5e(var200);
+var201 = meth_Type_87e1ce5c5e_equals(var75,var200);
+if (var201) goto label202;
+var203 = oomph_false;
+if (oomph_true) goto label204;
+label202: (void)0;
+var205 = string24___274da8c49e; string_incref(var205);
+var206 = meth_Str_equals(var3,var205);
+var203 = var206;
+label204: (void)0;
+if (var203) goto label207;
+if (oomph_true) goto label208;
+label207: (void)0;
+var209 = string35_float_add_71045e46d5; string_incref(var209);
+var210 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var210,var6);
+meth_List_LocalVariable__81e23234f3_push(var210,var7);
+var211 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var209,var210);
+retval = var211; var211 = NULL;
+goto out;
+label208: (void)0;
+var212 = var1->memb_builtins;
+var213 = var212->memb_FLOAT;
+var212 = NULL;
+incref_Type_87e1ce5c5e(var213);
+var214 = meth_Type_87e1ce5c5e_equals(var75,var213);
+if (var214) goto label215;
+var216 = oomph_false;
+if (oomph_true) goto label217;
+label215: (void)0;
+var218 = string27___039618761f; string_incref(var218);
+var219 = meth_Str_equals(var3,var218);
+var216 = var219;
+label217: (void)0;
+if (var216) goto label220;
+if (oomph_true) goto label221;
+label220: (void)0;
+var222 = string36_float_sub_3c2a12e9ae; string_incref(var222);
+var223 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var223,var6);
+meth_List_LocalVariable__81e23234f3_push(var223,var7);
+var224 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var222,var223);
+retval = var224; var224 = NULL;
+goto out;
+label221: (void)0;
+var225 = var1->memb_builtins;
+var226 = var225->memb_FLOAT;
+var225 = NULL;
+incref_Type_87e1ce5c5e(var226);
+var227 = meth_Type_87e1ce5c5e_equals(var75,var226);
+if (var227) goto label228;
+var229 = oomph_false;
+if (oomph_true) goto label230;
+label228: (void)0;
+var231 = string29___a4b78792af; string_incref(var231);
+var232 = meth_Str_equals(var3,var231);
+var229 = var232;
+label230: (void)0;
+if (var229) goto label233;
+if (oomph_true) goto label234;
+label233: (void)0;
+var235 = string37_float_mul_86d0e314e5; string_incref(var235);
+var236 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var236,var6);
+meth_List_LocalVariable__81e23234f3_push(var236,var7);
+var237 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var235,var236);
+retval = var237; var237 = NULL;
+goto out;
+label234: (void)0;
+var238 = var1->memb_builtins;
+var239 = var238->memb_FLOAT;
+var238 = NULL;
+incref_Type_87e1ce5c5e(var239);
+var240 = meth_Type_87e1ce5c5e_equals(var75,var239);
+if (var240) goto label241;
+var242 = oomph_false;
+if (oomph_true) goto label243;
+label241: (void)0;
+var244 = string34___cb84f637ff; string_incref(var244);
+var245 = meth_Str_equals(var3,var244);
+var242 = var245;
+label243: (void)0;
+if (var242) goto label246;
+if (oomph_true) goto label247;
+label246: (void)0;
+var248 = string38_float_div_2c99cebeb4; string_incref(var248);
+var249 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var249,var6);
+meth_List_LocalVariable__81e23234f3_push(var249,var7);
+var250 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var248,var249);
+retval = var250; var250 = NULL;
+goto out;
+label247: (void)0;
+var251 = var1->memb_builtins;
+var252 = var251->memb_FLOAT;
+var251 = NULL;
+incref_Type_87e1ce5c5e(var252);
+var253 = meth_Type_87e1ce5c5e_equals(var75,var252);
+if (var253) goto label254;
+var255 = oomph_false;
+if (oomph_true) goto label256;
+label254: (void)0;
+var257 = string31_mod_24ee0daef1; string_incref(var257);
+var258 = meth_Str_equals(var3,var257);
+var255 = var258;
+label256: (void)0;
+if (var255) goto label259;
+if (oomph_true) goto label260;
+label259: (void)0;
+var261 = string39_float_mod_4a5d2ea70b; string_incref(var261);
+var262 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var262,var6);
+meth_List_LocalVariable__81e23234f3_push(var262,var7);
+var263 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var261,var262);
+retval = var263; var263 = NULL;
+goto out;
+label260: (void)0;
+var264 = var1->memb_builtins;
+var265 = var264->memb_FLOAT;
+var264 = NULL;
+incref_Type_87e1ce5c5e(var265);
+var266 = meth_Type_87e1ce5c5e_equals(var75,var265);
+if (var266) goto label267;
+var268 = oomph_false;
+if (oomph_true) goto label269;
+label267: (void)0;
+var270 = string21___60f7097246; string_incref(var270);
+var271 = meth_Str_equals(var3,var270);
+var268 = var271;
+label269: (void)0;
+if (var268) goto label272;
+if (oomph_true) goto label273;
+label272: (void)0;
+var274 = string40_float_gt_6565c8c20e; string_incref(var274);
+var275 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var275,var6);
+meth_List_LocalVariable__81e23234f3_push(var275,var7);
+var276 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var274,var275);
+retval = var276; var276 = NULL;
+goto out;
+label273: (void)0;
+var277 = string19____5636f2c917; string_incref(var277);
+var278 = meth_Str_equals(var3,var277);
+if (var278) goto label279;
+if (oomph_true) goto label280;
+label279: (void)0;
+var281 = var1->memb_builtins;
+var282 = var281->memb_BOOL;
+var281 = NULL;
+incref_Type_87e1ce5c5e(var282);
+var283 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var282,var4);
+var16 = var283;
+var283 = NULL;
+var284 = var1->memb_code;
+incref(var284);
+var285 = string41_equals_273d01f72c; string_incref(var285);
+var286 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var286,var7);
+var287 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item1 = var16 }, .membernum = 1 };
+incref(var16);
+var288 = ctor_MethodCall_b0095be49c(var6,var285,var286,var287,var4);
+var289 = (struct class_Instruction_b0fafb4d55){ .val = { .item11 = var288 }, .membernum = 11 };
+var288 = NULL;
+meth_List_Instruction__6e475c861a_push(var284,var289);
+retval = var16; var16 = NULL;
+goto out;
+label280: (void)0;
+var290 = string42_wrong_types___ab978b9888; string_incref(var290);
+var291 = ir_4b1a3e0393_type_name(var75);
+var292 = oomph_string_concat(var290,var291);
+var293 = string43___6086a9b56a; string_incref(var293);
+var294 = oomph_string_concat(var292,var293);
+var295 = oomph_string_concat(var294,var3);
+var296 = string43___6086a9b56a; string_incref(var296);
+var297 = oomph_string_concat(var295,var296);
+var298 = ir_4b1a3e0393_type_name(var75);
+var299 = oomph_string_concat(var297,var298);
+oomph_print(var299);
+var300 = oomph_false;
+var301 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var301);
+var302 = 450LL;
+oomph_assert(var300,var301,var302);
+out: (void)0;
+(void)0;
+string_decref(var301);
+(void)0;
+string_decref(var299);
+string_decref(var298);
+string_decref(var297);
+string_decref(var296);
+string_decref(var295);
+string_decref(var294);
+string_decref(var293);
+string_decref(var292);
+string_decref(var291);
+string_decref(var290);
+decref_Instruction_b0fafb4d55(var289);
+decref((var288), dtor_MethodCall_b0095be49c);
+decref__null___LocalVariable__494c1a2e12(var287);
+decref((var286), dtor_List_LocalVariable__81e23234f3);
+string_decref(var285);
+decref((var284), dtor_List_Instruction__6e475c861a);
+decref((var283), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var282);
+decref((var281), dtor_Builtins_bd980a9f08);
+(void)0;
+string_decref(var277);
+decref((var276), dtor_LocalVariable_846080e5ae);
+decref((var275), dtor_List_LocalVariable__81e23234f3);
+string_decref(var274);
+(void)0;
+string_decref(var270);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var265);
+decref((var264), dtor_Builtins_bd980a9f08);
+decref((var263), dtor_LocalVariable_846080e5ae);
+decref((var262), dtor_List_LocalVariable__81e23234f3);
+string_decref(var261);
+(void)0;
+string_decref(var257);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var252);
+decref((var251), dtor_Builtins_bd980a9f08);
+decref((var250), dtor_LocalVariable_846080e5ae);
+decref((var249), dtor_List_LocalVariable__81e23234f3);
+string_decref(var248);
+(void)0;
+string_decref(var244);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var239);
+decref((var238), dtor_Builtins_bd980a9f08);
+decref((var237), dtor_LocalVariable_846080e5ae);
+decref((var236), dtor_List_LocalVariable__81e23234f3);
+string_decref(var235);
+(void)0;
+string_decref(var231);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var226);
+decref((var225), dtor_Builtins_bd980a9f08);
+decref((var224), dtor_LocalVariable_846080e5ae);
+decref((var223), dtor_List_LocalVariable__81e23234f3);
+string_decref(var222);
+(void)0;
+string_decref(var218);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var213);
+decref((var212), dtor_Builtins_bd980a9f08);
+decref((var211), dtor_LocalVariable_846080e5ae);
+decref((var210), dtor_List_LocalVariable__81e23234f3);
+string_decref(var209);
+(void)0;
+string_decref(var205);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var200);
+decref((var199), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var198);
+decref((var197), dtor_Builtins_bd980a9f08);
+decref((var196), dtor_LocalVariable_846080e5ae);
+decref((var195), dtor_List_LocalVariable__81e23234f3);
+string_decref(var194);
+decref((var193), dtor_LocalVariable_846080e5ae);
+decref((var192), dtor_List_LocalVariable__81e23234f3);
+string_decref(var191);
+(void)0;
+string_decref(var187);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var182);
+decref((var181), dtor_Builtins_bd980a9f08);
+decref((var180), dtor_LocalVariable_846080e5ae);
+decref((var179), dtor_List_LocalVariable__81e23234f3);
+string_decref(var178);
+(void)0;
+string_decref(var174);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var169);
+decref((var168), dtor_Builtins_bd980a9f08);
+decref((var167), dtor_LocalVariable_846080e5ae);
+decref((var166), dtor_List_LocalVariable__81e23234f3);
+string_decref(var165);
+(void)0;
+string_decref(var161);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var156);
+decref((var155), dtor_Builtins_bd980a9f08);
+decref((var154), dtor_LocalVariable_846080e5ae);
+decref((var153), dtor_List_LocalVariable__81e23234f3);
+string_decref(var152);
+(void)0;
+string_decref(var148);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var143);
+decref((var142), dtor_Builtins_bd980a9f08);
+decref((var141), dtor_LocalVariable_846080e5ae);
+decref((var140), dtor_List_LocalVariable__81e23234f3);
+string_decref(var139);
+(void)0;
+string_decref(var135);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var130);
+decref((var129), dtor_Builtins_bd980a9f08);
+decref((var128), dtor_LocalVariable_846080e5ae);
+decref((var127), dtor_List_LocalVariable__81e23234f3);
+string_decref(var126);
+(void)0;
+string_decref(var122);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var117);
+decref((var116), dtor_Builtins_bd980a9f08);
+decref((var115), dtor_LocalVariable_846080e5ae);
+decref((var114), dtor_List_LocalVariable__81e23234f3);
+string_decref(var113);
+(void)0;
+string_decref(var109);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var104);
+decref((var103), dtor_Builtins_bd980a9f08);
+decref((var102), dtor_LocalVariable_846080e5ae);
+decref((var101), dtor_LocalVariable_846080e5ae);
+string_decref(var100);
+(void)0;
+string_decref(var96);
+decref((var95), dtor_LocalVariable_846080e5ae);
+decref((var94), dtor_LocalVariable_846080e5ae);
+string_decref(var93);
+(void)0;
+string_decref(var89);
+decref((var88), dtor_LocalVariable_846080e5ae);
+string_decref(var87);
+(void)0;
+string_decref(var83);
+decref((var82), dtor_LocalVariable_846080e5ae);
+decref((var81), dtor_LocalVariable_846080e5ae);
+string_decref(var80);
+(void)0;
+string_decref(var76);
+decref_Type_87e1ce5c5e(var75);
+(void)0;
+decref_Type_87e1ce5c5e(var73);
+(void)0;
+string_decref(var71);
+(void)0;
+decref_Type_87e1ce5c5e(var69);
+(void)0;
+decref_Type_87e1ce5c5e(var67);
+decref_Type_87e1ce5c5e(var66);
+(void)0;
+decref_Type_87e1ce5c5e(var64);
+decref((var63), dtor_LocalVariable_846080e5ae);
+decref((var61), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var57);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var50);
+(void)0;
+(void)0;
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var45);
+(void)0;
+(void)0;
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var39);
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var37);
+decref_Type_87e1ce5c5e(var36);
+decref__null___LocalVariable__494c1a2e12(var35);
+decref_Type_87e1ce5c5e(var34);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var29);
+decref_Type_87e1ce5c5e(var28);
+decref((var27), dtor_LocalVariable_846080e5ae);
+(void)0;
+string_decref(var23);
+decref_Instruction_b0fafb4d55(var22);
+decref((var21), dtor_MethodCall_b0095be49c);
+decref__null___LocalVariable__494c1a2e12(var20);
+decref((var19), dtor_List_LocalVariable__81e23234f3);
+string_decref(var18);
+decref((var17), dtor_List_Instruction__6e475c861a);
+decref((var16), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var15);
+decref((var14), dtor_Builtins_bd980a9f08);
+(void)0;
+decref((var10), dtor_List_Str__43b70c06cb);
+string_decref(var9);
+string_decref(var8);
+decref((var7), dtor_LocalVariable_846080e5ae);
+decref((var6), dtor_LocalVariable_846080e5ae);
+return retval;
+}void meth_FunctionOrMethodConverter_14d05c56fc_do_if(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_LocalVariable_846080e5ae* var2, struct class_List_Instruction__6e475c861a* var3, struct class_List_Instruction__6e475c861a* var4){struct class_GotoLabel_9654b8ee6d* var5;
+var5 = NULL;
+struct class_GotoLabel_9654b8ee6d* var6;
+var6 = NULL;
+struct class_List_Instruction__6e475c861a* var7;
+var7 = NULL;
+struct class_GotoIf_feb019130f* var8;
+var8 = NULL;
+struct class_Instruction_b0fafb4d55 var9;
+var9.membernum = -1;
+struct class_List_Instruction__6e475c861a* var10;
+var10 = NULL;
+struct class_List_Instruction__6e475c861a* var11;
+var11 = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Location_500c4434c9* var13;
+var13 = NULL;
+struct class_LocalVariable_846080e5ae* var14;
+var14 = NULL;
+struct class_GotoIf_feb019130f* var15;
+var15 = NULL;
+struct class_Instruction_b0fafb4d55 var16;
+var16.membernum = -1;
+struct class_List_Instruction__6e475c861a* var17;
+var17 = NULL;
+struct class_Instruction_b0fafb4d55 var18;
+var18.membernum = -1;
+struct class_List_Instruction__6e475c861a* var19;
+var19 = NULL;
+struct class_List_Instruction__6e475c861a* var20;
+var20 = NULL;
+struct class_Instruction_b0fafb4d55 var21;
+var21.membernum = -1;
+var5 = meth_FunctionOrMethodConverter_14d05c56fc_create_goto_label(var1);
+var6 = meth_FunctionOrMethodConverter_14d05c56fc_create_goto_label(var1);
+var7 = var1->memb_code;
+incref(var7);
+var8 = ctor_GotoIf_feb019130f(var5,var2);
+var9 = (struct class_Instruction_b0fafb4d55){ .val = { .item6 = var8 }, .membernum = 6 };
+var8 = NULL;
+meth_List_Instruction__6e475c861a_push(var7,var9);
+var10 = var1->memb_code;
+incref(var10);
+meth_List_Instruction__6e475c861a_push_all(var10,var4);
+var11 = var1->memb_code;
+incref(var11);
+var12 = string14_true_7fafb4b9ec; string_incref(var12);
+var13 = var2->memb_location;
+incref(var13);
+var14 = meth_FunctionOrMethodConverter_14d05c56fc_bool_constant(var1,var12,var13);
+var15 = ctor_GotoIf_feb019130f(var6,var14);
+var16 = (struct class_Instruction_b0fafb4d55){ .val = { .item6 = var15 }, .membernum = 6 };
+var15 = NULL;
+meth_List_Instruction__6e475c861a_push(var11,var16);
+var17 = var1->memb_code;
+incref(var17);
+var18 = (struct class_Instruction_b0fafb4d55){ .val = { .item7 = var5 }, .membernum = 7 };
+var5 = NULL;
+meth_List_Instruction__6e475c861a_push(var17,var18);
+var19 = var1->memb_code;
+incref(var19);
+meth_List_Instruction__6e475c861a_push_all(var19,var3);
+var20 = var1->memb_code;
+incref(var20);
+var21 = (struct class_Instruction_b0fafb4d55){ .val = { .item7 = var6 }, .membernum = 7 };
+var6 = NULL;
+meth_List_Instruction__6e475c861a_push(var20,var21);
+out: (void)0;
+decref_Instruction_b0fafb4d55(var21);
+decref((var20), dtor_List_Instruction__6e475c861a);
+decref((var19), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var18);
+decref((var17), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var16);
+decref((var15), dtor_GotoIf_feb019130f);
+decref((var14), dtor_LocalVariable_846080e5ae);
+decref((var13), dtor_Location_500c4434c9);
+string_decref(var12);
+decref((var11), dtor_List_Instruction__6e475c861a);
+decref((var10), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var9);
+decref((var8), dtor_GotoIf_feb019130f);
+decref((var7), dtor_List_Instruction__6e475c861a);
+decref((var6), dtor_GotoLabel_9654b8ee6d);
+decref((var5), dtor_GotoLabel_9654b8ee6d);
+}struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_do_binary_op(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_BinaryOperator_e25f87d1b5* var2){struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_List_Str__43b70c06cb* var6;
+var6 = NULL;
+bool var7;
+struct class_Expression_35f2052bf4 var10;
+var10.membernum = -1;
+struct class_Builtins_bd980a9f08* var11;
+var11 = NULL;
+struct class_Type_87e1ce5c5e var12;
+var12.membernum = -1;
+struct class_LocalVariable_846080e5ae* var13;
+var13 = NULL;
+struct class_Builtins_bd980a9f08* var14;
+var14 = NULL;
+struct class_Type_87e1ce5c5e var15;
+var15.membernum = -1;
+struct class_Location_500c4434c9* var16;
+var16 = NULL;
+struct class_LocalVariable_846080e5ae* var17;
+var17 = NULL;
+struct class_Expression_35f2052bf4 var18;
+var18.membernum = -1;
+struct class_Builtins_bd980a9f08* var19;
+var19 = NULL;
+struct class_Type_87e1ce5c5e var20;
+var20.membernum = -1;
+struct class_LocalVariable_846080e5ae* var21;
+var21 = NULL;
+struct class_List_Instruction__6e475c861a* var22;
+var22 = NULL;
+struct class_Variable_1aaa81c8d2 var23;
+var23.membernum = -1;
+struct class_VarCpy_e77a538911* var24;
+var24 = NULL;
+struct class_Instruction_b0fafb4d55 var25;
+var25.membernum = -1;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+bool var28;
+struct class_Builtins_bd980a9f08* var30;
+var30 = NULL;
+struct class_Str var31;
+var31.buf = NULL;
+struct class_BuiltinVariable_f6e0cdd1b6* var32;
+var32 = NULL;
+struct class_Variable_1aaa81c8d2 var33;
+var33.membernum = -1;
+struct class_VarCpy_e77a538911* var34;
+var34 = NULL;
+struct class_Instruction_b0fafb4d55 var35;
+var35.membernum = -1;
+struct class_List_Instruction__6e475c861a* var36;
+var36 = NULL;
+struct class_Builtins_bd980a9f08* var38;
+var38 = NULL;
+struct class_Str var39;
+var39.buf = NULL;
+struct class_BuiltinVariable_f6e0cdd1b6* var40;
+var40 = NULL;
+struct class_Variable_1aaa81c8d2 var41;
+var41.membernum = -1;
+struct class_VarCpy_e77a538911* var42;
+var42 = NULL;
+struct class_Instruction_b0fafb4d55 var43;
+var43.membernum = -1;
+struct class_List_Instruction__6e475c861a* var44;
+var44 = NULL;
+struct class_Expression_35f2052bf4 var45;
+var45.membernum = -1;
+struct class_LocalVariable_846080e5ae* var46;
+var46 = NULL;
+struct class_Expression_35f2052bf4 var47;
+var47.membernum = -1;
+struct class_LocalVariable_846080e5ae* var48;
+var48 = NULL;
+struct class_Str var49;
+var49.buf = NULL;
+struct class_Location_500c4434c9* var50;
+var50 = NULL;
+struct class_LocalVariable_846080e5ae* var51;
+var51 = NULL;
+struct class_LocalVariable_846080e5ae* retval;
+var3 = var2->memb_op;
+string_incref(var3);
+var4 = string44_and_aef63e438d; string_incref(var4);
+var5 = string45_or_bbe8969286; string_incref(var5);
+var6 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var6,var4);
+meth_List_Str__43b70c06cb_push(var6,var5);
+var7 = meth_List_Str__43b70c06cb___contains(var6,var3);
+if (var7) goto label8;
+if (oomph_true) goto label9;
+label8: (void)0;
+var10 = var2->memb_lhs;
+incref_Expression_35f2052bf4(var10);
+var11 = var1->memb_builtins;
+var12 = var11->memb_BOOL;
+var11 = NULL;
+incref_Type_87e1ce5c5e(var12);
+var13 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression_and_convert(var1,var10,var12);
+var14 = var1->memb_builtins;
+var15 = var14->memb_BOOL;
+var14 = NULL;
+incref_Type_87e1ce5c5e(var15);
+var16 = var2->memb_location;
+incref(var16);
+var17 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var15,var16);
+meth_FunctionOrMethodConverter_14d05c56fc_push_code(var1);
+var18 = var2->memb_rhs;
+incref_Expression_35f2052bf4(var18);
+var19 = var1->memb_builtins;
+var20 = var19->memb_BOOL;
+var19 = NULL;
+incref_Type_87e1ce5c5e(var20);
+var21 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression_and_convert(var1,var18,var20);
+var22 = meth_FunctionOrMethodConverter_14d05c56fc_pop_code(var1);
+var23 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var21 }, .membernum = 2 };
+var21 = NULL;
+var24 = ctor_VarCpy_e77a538911(var17,var23);
+var25 = (struct class_Instruction_b0fafb4d55){ .val = { .item18 = var24 }, .membernum = 18 };
+var24 = NULL;
+meth_List_Instruction__6e475c861a_push(var22,var25);
+var26 = var2->memb_op;
+string_incref(var26);
+var27 = string44_and_aef63e438d; string_incref(var27);
+var28 = meth_Str_equals(var26,var27);
+if (var28) goto label29;
+var30 = var1->memb_builtins;
+incref(var30);
+var31 = string14_true_7fafb4b9ec; string_incref(var31);
+var32 = meth_Builtins_bd980a9f08_get_visible_var(var30,var31);
+var33 = (struct class_Variable_1aaa81c8d2){ .val = { .item0 = var32 }, .membernum = 0 };
+var32 = NULL;
+var34 = ctor_VarCpy_e77a538911(var17,var33);
+var35 = (struct class_Instruction_b0fafb4d55){ .val = { .item18 = var34 }, .membernum = 18 };
+var34 = NULL;
+var36 = ctor_List_Instruction__6e475c861a();
+meth_List_Instruction__6e475c861a_push(var36,var35);
+meth_FunctionOrMethodConverter_14d05c56fc_do_if(var1,var13,var36,var22);
+if (oomph_true) goto label37;
+label29: (void)0;
+var38 = var1->memb_builtins;
+incref(var38);
+var39 = string46_false_c928a229ad; string_incref(var39);
+var40 = meth_Builtins_bd980a9f08_get_visible_var(var38,var39);
+var41 = (struct class_Variable_1aaa81c8d2){ .val = { .item0 = var40 }, .membernum = 0 };
+var40 = NULL;
+var42 = ctor_VarCpy_e77a538911(var17,var41);
+var43 = (struct class_Instruction_b0fafb4d55){ .val = { .item18 = var42 }, .membernum = 18 };
+var42 = NULL;
+var44 = ctor_List_Instruction__6e475c861a();
+meth_List_Instruction__6e475c861a_push(var44,var43);
+meth_FunctionOrMethodConverter_14d05c56fc_do_if(var1,var13,var22,var44);
+label37: (void)0;
+retval = var17; var17 = NULL;
+goto out;
+label9: (void)0;
+var45 = var2->memb_lhs;
+incref_Expression_35f2052bf4(var45);
+var46 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var45);
+var47 = var2->memb_rhs;
+incref_Expression_35f2052bf4(var47);
+var48 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var47);
+var49 = var2->memb_op;
+string_incref(var49);
+var50 = var2->memb_location;
+incref(var50);
+var51 = meth_FunctionOrMethodConverter_14d05c56fc_do_binary_op_typed(var1,var46,var49,var50,var48);
+retval = var51; var51 = NULL;
+goto out;
+out: (void)0;
+decref((var51), dtor_LocalVariable_846080e5ae);
+decref((var50), dtor_Location_500c4434c9);
+string_decref(var49);
+decref((var48), dtor_LocalVariable_846080e5ae);
+decref_Expression_35f2052bf4(var47);
+decref((var46), dtor_LocalVariable_846080e5ae);
+decref_Expression_35f2052bf4(var45);
+decref((var44), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var43);
+decref((var42), dtor_VarCpy_e77a538911);
+decref_Variable_1aaa81c8d2(var41);
+decref((var40), dtor_BuiltinVariable_f6e0cdd1b6);
+string_decref(var39);
+decref((var38), dtor_Builtins_bd980a9f08);
+decref((var36), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var35);
+decref((var34), dtor_VarCpy_e77a538911);
+decref_Variable_1aaa81c8d2(var33);
+decref((var32), dtor_BuiltinVariable_f6e0cdd1b6);
+string_decref(var31);
+decref((var30), dtor_Builtins_bd980a9f08);
+(void)0;
+string_decref(var27);
+string_decref(var26);
+decref_Instruction_b0fafb4d55(var25);
+decref((var24), dtor_VarCpy_e77a538911);
+decref_Variable_1aaa81c8d2(var23);
+decref((var22), dtor_List_Instruction__6e475c861a);
+decref((var21), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var20);
+decref((var19), dtor_Builtins_bd980a9f08);
+decref_Expression_35f2052bf4(var18);
+decref((var17), dtor_LocalVariable_846080e5ae);
+decref((var16), dtor_Location_500c4434c9);
+decref_Type_87e1ce5c5e(var15);
+decref((var14), dtor_Builtins_bd980a9f08);
+decref((var13), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var12);
+decref((var11), dtor_Builtins_bd980a9f08);
+decref_Expression_35f2052bf4(var10);
+(void)0;
+decref((var6), dtor_List_Str__43b70c06cb);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+return retval;
+}struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_do_expression(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Expression_35f2052bf4 var2){struct class_Location_500c4434c9* var3;
+var3 = NULL;
+bool var4;
+struct class_IntConstant_4cbc4c5420* var19;
+var19 = NULL;
+struct class_Builtins_bd980a9f08* var20;
+var20 = NULL;
+struct class_Type_87e1ce5c5e var21;
+var21.membernum = -1;
+struct class_LocalVariable_846080e5ae* var22;
+var22 = NULL;
+struct class_List_Instruction__6e475c861a* var23;
+var23 = NULL;
+int64_t var24;
+struct class_IntConstant_817d6312f0* var25;
+var25 = NULL;
+struct class_Instruction_b0fafb4d55 var26;
+var26.membernum = -1;
+struct class_FloatConstant_4759845694* var27;
+var27 = NULL;
+struct class_Builtins_bd980a9f08* var28;
+var28 = NULL;
+struct class_Type_87e1ce5c5e var29;
+var29.membernum = -1;
+struct class_LocalVariable_846080e5ae* var30;
+var30 = NULL;
+struct class_List_Instruction__6e475c861a* var31;
+var31 = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_FloatConstant_652a176e04* var33;
+var33 = NULL;
+struct class_Instruction_b0fafb4d55 var34;
+var34.membernum = -1;
+struct class_StringConstant_c2b1c10b4f* var35;
+var35 = NULL;
+struct class_Builtins_bd980a9f08* var36;
+var36 = NULL;
+struct class_Type_87e1ce5c5e var37;
+var37.membernum = -1;
+struct class_LocalVariable_846080e5ae* var38;
+var38 = NULL;
+struct class_List_Instruction__6e475c861a* var39;
+var39 = NULL;
+struct class_Str var40;
+var40.buf = NULL;
+struct class_StringConstant_e1466967c8* var41;
+var41 = NULL;
+struct class_Instruction_b0fafb4d55 var42;
+var42.membernum = -1;
+struct class_ListLiteral_66e426dc17* var43;
+var43 = NULL;
+struct class_List_Expression__d162784c9e* var44;
+var44 = NULL;
+struct class_List_LocalVariable__81e23234f3* var45;
+var45 = NULL;
+int64_t var46;
+int64_t var47;
+struct class_Expression_35f2052bf4 var49;
+var49.membernum = -1;
+struct class_LocalVariable_846080e5ae* var51;
+var51 = NULL;
+struct class_List_LocalVariable__81e23234f3* var52;
+var52 = NULL;
+bool var53;
+struct class_LocalVariable_846080e5ae* var55;
+var55 = NULL;
+struct class_Type_87e1ce5c5e var56;
+var56.membernum = -1;
+struct class_Type_87e1ce5c5e var57;
+var57.membernum = -1;
+int64_t var58;
+struct class_LocalVariable_846080e5ae* var60;
+var60 = NULL;
+struct class_Type_87e1ce5c5e var62;
+var62.membernum = -1;
+bool var63;
+struct class_Str var64;
+var64.buf = NULL;
+int64_t var65;
+struct class_AutoType_33a5d572cb* var67;
+var67 = NULL;
+struct class_Builtins_bd980a9f08* var68;
+var68 = NULL;
+struct class_Builtins_bd980a9f08* var69;
+var69 = NULL;
+struct class_Generic_c39b95ec73* var70;
+var70 = NULL;
+struct class_Type_87e1ce5c5e var71;
+var71.membernum = -1;
+struct class_LocalVariable_846080e5ae* var72;
+var72 = NULL;
+struct class_List_Instruction__6e475c861a* var73;
+var73 = NULL;
+struct class_List_LocalVariable__81e23234f3* var74;
+var74 = NULL;
+struct class_ConstructorCall_f8e441a21d* var75;
+var75 = NULL;
+struct class_Instruction_b0fafb4d55 var76;
+var76.membernum = -1;
+int64_t var77;
+struct class_LocalVariable_846080e5ae* var79;
+var79 = NULL;
+struct class_List_Instruction__6e475c861a* var81;
+var81 = NULL;
+struct class_Str var82;
+var82.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var83;
+var83 = NULL;
+char var84;
+struct class__null___LocalVariable__494c1a2e12 var85;
+var85.membernum = -1;
+struct class_MethodCall_b0095be49c* var86;
+var86 = NULL;
+struct class_Instruction_b0fafb4d55 var87;
+var87.membernum = -1;
+struct class_StringFormatJoin_bc28806767* var88;
+var88 = NULL;
+struct class_List_Expression__d162784c9e* var89;
+var89 = NULL;
+int64_t var90;
+int64_t var91;
+bool var92;
+bool var93;
+struct class_Str var94;
+var94.buf = NULL;
+int64_t var95;
+struct class_List_Expression__d162784c9e* var96;
+var96 = NULL;
+struct class_Expression_35f2052bf4 var97;
+var97.membernum = -1;
+struct class_LocalVariable_846080e5ae* var98;
+var98 = NULL;
+struct class_LocalVariable_846080e5ae* var99;
+var99 = NULL;
+struct class_List_Expression__d162784c9e* var100;
+var100 = NULL;
+int64_t var101;
+struct class_List_Expression__d162784c9e* var102;
+var102 = NULL;
+int64_t var103;
+struct class_List_Expression__d162784c9e* var104;
+var104 = NULL;
+int64_t var105;
+struct class_Expression_35f2052bf4 var107;
+var107.membernum = -1;
+struct class_Str var109;
+var109.buf = NULL;
+struct class_LocalVariable_846080e5ae* var110;
+var110 = NULL;
+struct class_LocalVariable_846080e5ae* var111;
+var111 = NULL;
+struct class_List_LocalVariable__81e23234f3* var112;
+var112 = NULL;
+struct class_LocalVariable_846080e5ae* var113;
+var113 = NULL;
+struct class_Call_d0fb9d6234* var114;
+var114 = NULL;
+struct class_Expression_35f2052bf4 var115;
+var115.membernum = -1;
+bool var116;
+struct class_Constructor_0c896e4031* var119;
+var119 = NULL;
+struct class_Type_e6cf7dd4e5 var120;
+var120.membernum = -1;
+struct class_Type_87e1ce5c5e var121;
+var121.membernum = -1;
+bool var122;
+struct class_UnionType_7f899bced1* var125;
+var125 = NULL;
+struct class_List_Expression__d162784c9e* var126;
+var126 = NULL;
+int64_t var127;
+int64_t var128;
+bool var129;
+struct class_Str var130;
+var130.buf = NULL;
+int64_t var131;
+struct class_List_Expression__d162784c9e* var132;
+var132 = NULL;
+struct class_Expression_35f2052bf4 var133;
+var133.membernum = -1;
+struct class_LocalVariable_846080e5ae* var134;
+var134 = NULL;
+struct class_Type_87e1ce5c5e var135;
+var135.membernum = -1;
+struct class_LocalVariable_846080e5ae* var136;
+var136 = NULL;
+bool var139;
+struct class__null___LocalVariable__494c1a2e12 var140;
+var140.membernum = -1;
+struct class_LocalVariable_846080e5ae* var141;
+var141 = NULL;
+struct class_GetVar_642f116a6c* var142;
+var142 = NULL;
+struct class_Str var143;
+var143.buf = NULL;
+struct class__null___Location__87aaae6467 var144;
+var144.membernum = -1;
+struct class_Variable_1aaa81c8d2 var145;
+var145.membernum = -1;
+struct class_Type_87e1ce5c5e var146;
+var146.membernum = -1;
+struct class_LocalVariable_846080e5ae* var147;
+var147 = NULL;
+struct class_List_Instruction__6e475c861a* var148;
+var148 = NULL;
+struct class_VarCpy_e77a538911* var149;
+var149 = NULL;
+struct class_Instruction_b0fafb4d55 var150;
+var150.membernum = -1;
+struct class_List_Instruction__6e475c861a* var151;
+var151 = NULL;
+struct class_IncRef_54322428a7* var152;
+var152 = NULL;
+struct class_Instruction_b0fafb4d55 var153;
+var153.membernum = -1;
+struct class_UnaryOperator_348525ebbe* var154;
+var154 = NULL;
+struct class_Expression_35f2052bf4 var155;
+var155.membernum = -1;
+struct class_LocalVariable_846080e5ae* var156;
+var156 = NULL;
+struct class_Str var157;
+var157.buf = NULL;
+struct class_Str var158;
+var158.buf = NULL;
+bool var159;
+struct class_Str var162;
+var162.buf = NULL;
+struct class_Builtins_bd980a9f08* var163;
+var163 = NULL;
+struct class_Type_87e1ce5c5e var164;
+var164.membernum = -1;
+struct class_LocalVariable_846080e5ae* var165;
+var165 = NULL;
+struct class_List_LocalVariable__81e23234f3* var166;
+var166 = NULL;
+struct class_LocalVariable_846080e5ae* var167;
+var167 = NULL;
+struct class_Type_87e1ce5c5e var168;
+var168.membernum = -1;
+struct class_Builtins_bd980a9f08* var169;
+var169 = NULL;
+struct class_Type_87e1ce5c5e var170;
+var170.membernum = -1;
+bool var171;
+bool var173;
+struct class_Str var175;
+var175.buf = NULL;
+struct class_Str var176;
+var176.buf = NULL;
+bool var177;
+struct class_Str var180;
+var180.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var181;
+var181 = NULL;
+struct class_LocalVariable_846080e5ae* var182;
+var182 = NULL;
+struct class_Type_87e1ce5c5e var183;
+var183.membernum = -1;
+struct class_Builtins_bd980a9f08* var184;
+var184 = NULL;
+struct class_Type_87e1ce5c5e var185;
+var185.membernum = -1;
+bool var186;
+bool var188;
+struct class_Str var190;
+var190.buf = NULL;
+struct class_Str var191;
+var191.buf = NULL;
+bool var192;
+struct class_Str var195;
+var195.buf = NULL;
+struct class_List_LocalVariable__81e23234f3* var196;
+var196 = NULL;
+struct class_LocalVariable_846080e5ae* var197;
+var197 = NULL;
+struct class_Str var198;
+var198.buf = NULL;
+struct class_Str var199;
+var199.buf = NULL;
+struct class_Str var200;
+var200.buf = NULL;
+struct class_Type_87e1ce5c5e var201;
+var201.membernum = -1;
+struct class_Str var202;
+var202.buf = NULL;
+struct class_Str var203;
+var203.buf = NULL;
+bool var204;
+struct class_Str var205;
+var205.buf = NULL;
+int64_t var206;
+struct class_BinaryOperator_e25f87d1b5* var208;
+var208 = NULL;
+struct class_LocalVariable_846080e5ae* var209;
+var209 = NULL;
+struct class_GetAttribute_0758070446* var210;
+var210 = NULL;
+struct class_Expression_35f2052bf4 var211;
+var211.membernum = -1;
+struct class_LocalVariable_846080e5ae* var212;
+var212 = NULL;
+struct class_Type_87e1ce5c5e var213;
+var213.membernum = -1;
+bool var214;
+struct class_Type_87e1ce5c5e var215;
+var215.membernum = -1;
+struct class_Type_87e1ce5c5e var216;
+var216.membernum = -1;
+struct class_Type_87e1ce5c5e var217;
+var217.membernum = -1;
+bool var218;
+struct class_AutoType_33a5d572cb* var221;
+var221 = NULL;
+struct class_AutoType_33a5d572cb* var222;
+var222 = NULL;
+struct class_Type_87e1ce5c5e var223;
+var223.membernum = -1;
+struct class_LocalVariable_846080e5ae* var224;
+var224 = NULL;
+struct class_Type_87e1ce5c5e var226;
+var226.membernum = -1;
+struct class_Str var227;
+var227.buf = NULL;
+struct class_Type_87e1ce5c5e var228;
+var228.membernum = -1;
+struct class_LocalVariable_846080e5ae* var229;
+var229 = NULL;
+struct class_List_Instruction__6e475c861a* var230;
+var230 = NULL;
+struct class_Str var231;
+var231.buf = NULL;
+struct class_GetAttribute_3d0cc1bf97* var232;
+var232 = NULL;
+struct class_Instruction_b0fafb4d55 var233;
+var233.membernum = -1;
+struct class_List_Instruction__6e475c861a* var234;
+var234 = NULL;
+struct class_IncRef_54322428a7* var235;
+var235 = NULL;
+struct class_Instruction_b0fafb4d55 var236;
+var236.membernum = -1;
+struct class_StatementsAndExpression_964cbccc5e* var237;
+var237 = NULL;
+struct class_List_Statement__5d7503c104* var238;
+var238 = NULL;
+int64_t var239;
+struct class_Statement_1dc2e7090f var241;
+var241.membernum = -1;
+struct class_Expression_35f2052bf4 var243;
+var243.membernum = -1;
+struct class_LocalVariable_846080e5ae* var244;
+var244 = NULL;
+struct class_As_a05f1f16b6* var245;
+var245 = NULL;
+struct class_Expression_35f2052bf4 var246;
+var246.membernum = -1;
+struct class_LocalVariable_846080e5ae* var247;
+var247 = NULL;
+struct class_Type_e6cf7dd4e5 var248;
+var248.membernum = -1;
+struct class_Type_87e1ce5c5e var249;
+var249.membernum = -1;
+struct class_LocalVariable_846080e5ae* var250;
+var250 = NULL;
+struct class_List_Instruction__6e475c861a* var251;
+var251 = NULL;
+struct class_GetFromUnion_b0861b839c* var252;
+var252 = NULL;
+struct class_Instruction_b0fafb4d55 var253;
+var253.membernum = -1;
+struct class_List_Instruction__6e475c861a* var254;
+var254 = NULL;
+struct class_IncRef_54322428a7* var255;
+var255 = NULL;
+struct class_Instruction_b0fafb4d55 var256;
+var256.membernum = -1;
+struct class_Constructor_0c896e4031* var257;
+var257 = NULL;
+bool var258;
+struct class_Str var259;
+var259.buf = NULL;
+int64_t var260;
+struct class_ListComprehension_10c913d2dd* var261;
+var261 = NULL;
+bool var262;
+struct class_Str var263;
+var263.buf = NULL;
+int64_t var264;
+struct class_LocalVariable_846080e5ae* retval;
+var3 = ast_91af7cbb25_locate_expression(var2);
+
+            var4 = (
+                var2.membernum == 7
+            );
+            if (var4) goto label5;
+
+            var4 = (
+                var2.membernum == 4
+            );
+            if (var4) goto label6;
+
+            var4 = (
+                var2.membernum == 11
+            );
+            if (var4) goto label7;
+
+            var4 = (
+                var2.membernum == 9
+            );
+            if (var4) goto label8;
+
+            var4 = (
+                var2.membernum == 12
+            );
+            if (var4) goto label9;
+
+            var4 = (
+                var2.membernum == 2
+            );
+            if (var4) goto label10;
+
+            var4 = (
+                var2.membernum == 6
+            );
+            if (var4) goto label11;
+
+            var4 = (
+                var2.membernum == 13
+            );
+            if (var4) goto label12;
+
+            var4 = (
+                var2.membernum == 1
+            );
+            if (var4) goto label13;
+
+            var4 = (
+                var2.membernum == 5
+            );
+            if (var4) goto label14;
+
+            var4 = (
+                var2.membernum == 10
+            );
+            if (var4) goto label15;
+
+            var4 = (
+                var2.membernum == 0
+            );
+            if (var4) goto label16;
+
+            var4 = (
+                var2.membernum == 3
+            );
+            if (var4) goto label17;
+
+            var4 = (
+                var2.membernum == 8
+            );
+            if (var4) goto label18;
+label5: (void)0;
+
+            if (var2.membernum != 7)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var19 = var2.val.item7;
+            incref(var19);
+var20 = var1->memb_builtins;
+var21 = var20->memb_INT;
+var20 = NULL;
+incref_Type_87e1ce5c5e(var21);
+var22 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var21,var3);
+var23 = var1->memb_code;
+incref(var23);
+var24 = var19->memb_value;
+var25 = ctor_IntConstant_817d6312f0(var24,var22);
+var26 = (struct class_Instruction_b0fafb4d55){ .val = { .item10 = var25 }, .membernum = 10 };
+var25 = NULL;
+meth_List_Instruction__6e475c861a_push(var23,var26);
+retval = var22; var22 = NULL;
+goto out;
+label6: (void)0;
+
+            if (var2.membernum != 4)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var27 = var2.val.item4;
+            incref(var27);
+var28 = var1->memb_builtins;
+var29 = var28->memb_FLOAT;
+var28 = NULL;
+incref_Type_87e1ce5c5e(var29);
+var30 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var29,var3);
+var31 = var1->memb_code;
+incref(var31);
+var32 = var27->memb_value;
+string_incref(var32);
+var33 = ctor_FloatConstant_652a176e04(var32,var30);
+var34 = (struct class_Instruction_b0fafb4d55){ .val = { .item2 = var33 }, .membernum = 2 };
+var33 = NULL;
+meth_List_Instruction__6e475c861a_push(var31,var34);
+retval = var30; var30 = NULL;
+goto out;
+label7: (void)0;
+
+            if (var2.membernum != 11)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var35 = var2.val.item11;
+            incref(var35);
+var36 = var1->memb_builtins;
+var37 = var36->memb_STR;
+var36 = NULL;
+incref_Type_87e1ce5c5e(var37);
+var38 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var37,var3);
+var39 = var1->memb_code;
+incref(var39);
+var40 = var35->memb_value;
+string_incref(var40);
+var41 = ctor_StringConstant_e1466967c8(var40,var38);
+var42 = (struct class_Instruction_b0fafb4d55){ .val = { .item15 = var41 }, .membernum = 15 };
+var41 = NULL;
+meth_List_Instruction__6e475c861a_push(var39,var42);
+retval = var38; var38 = NULL;
+goto out;
+label8: (void)0;
+
+            if (var2.membernum != 9)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var43 = var2.val.item9;
+            incref(var43);
+var44 = var43->memb_content;
+incref(var44);
+var45 = ctor_List_LocalVariable__81e23234f3();
+var46 = meth_List_Expression__d162784c9e_length(var44);
+meth_List_LocalVariable__81e23234f3___reserve(var45,var46);
+var47 = 0LL;
+label48: (void)0;
+if (var47 >= var44->len) goto label50;
+decref_Expression_35f2052bf4(var49); var49 = var44->data[var47++]; incref_Expression_35f2052bf4(var49);
+decref((var51), dtor_LocalVariable_846080e5ae);
+var51 = NULL;
+var51 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var49);
+meth_List_LocalVariable__81e23234f3_push(var45,var51);
+if (oomph_true) goto label48;
+label50: (void)0;
+var52 = ctor_List_LocalVariable__81e23234f3();
+var53 = meth_List_LocalVariable__81e23234f3_equals(var45,var52);
+if (var53) goto label54;
+var55 = meth_List_LocalVariable__81e23234f3_first(var45);
+var56 = var55->memb_type;
+incref_Type_87e1ce5c5e(var56);
+var57 = var56;
+var56.membernum = -1;
+var58 = 0LL;
+label59: (void)0;
+if (var58 >= var45->len) goto label61;
+decref((var60), dtor_LocalVariable_846080e5ae); var60 = var45->data[var58++]; incref(var60);
+decref_Type_87e1ce5c5e(var62);
+var62.membernum = -1;
+var62 = var60->memb_type;
+incref_Type_87e1ce5c5e(var62);
+var63 = meth_Type_87e1ce5c5e_equals(var62,var57);
+string_decref(var64);
+var64.buf = NULL;
+var64 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var64);
+var65 = 528LL;
+oomph_assert(var63,var64,var65);
+if (oomph_true) goto label59;
+label61: (void)0;
+if (oomph_true) goto label66;
+label54: (void)0;
+var67 = meth_FunctionOrMethodConverter_14d05c56fc_create_autotype(var1);
+var57 = (struct class_Type_87e1ce5c5e){ .val = { .item0 = var67 }, .membernum = 0 };
+var67 = NULL;
+label66: (void)0;
+var68 = var1->memb_builtins;
+incref(var68);
+var69 = var1->memb_builtins;
+var70 = var69->memb_LIST;
+var69 = NULL;
+incref(var70);
+var71 = meth_Builtins_bd980a9f08_generic2type(var68,var70,var57);
+var72 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var71,var3);
+var73 = var1->memb_code;
+incref(var73);
+var74 = ctor_List_LocalVariable__81e23234f3();
+var75 = ctor_ConstructorCall_f8e441a21d(var72,var74);
+var76 = (struct class_Instruction_b0fafb4d55){ .val = { .item0 = var75 }, .membernum = 0 };
+var75 = NULL;
+meth_List_Instruction__6e475c861a_push(var73,var76);
+var77 = 0LL;
+label78: (void)0;
+if (var77 >= var45->len) goto label80;
+var79 = var45->data[var77++];
+decref((var81), dtor_List_Instruction__6e475c861a);
+var81 = NULL;
+var81 = var1->memb_code;
+incref(var81);
+string_decref(var82);
+var82.buf = NULL;
+var82 = string47_push_aa992f59e2; string_incref(var82);
+decref((var83), dtor_List_LocalVariable__81e23234f3);
+var83 = NULL;
+var83 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var83,var79);
+var84 = oomph_null;
+decref__null___LocalVariable__494c1a2e12(var85);
+var85.membernum = -1;
+var85 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item0 = var84 }, .membernum = 0 };
+var86 = ctor_MethodCall_b0095be49c(var72,var82,var83,var85,var3);
+decref_Instruction_b0fafb4d55(var87);
+var87.membernum = -1;
+var87 = (struct class_Instruction_b0fafb4d55){ .val = { .item11 = var86 }, .membernum = 11 };
+var86 = NULL;
+meth_List_Instruction__6e475c861a_push(var81,var87);
+if (oomph_true) goto label78;
+label80: (void)0;
+retval = var72; var72 = NULL;
+goto out;
+label9: (void)0;
+
+            if (var2.membernum != 12)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var88 = var2.val.item12;
+            incref(var88);
+var89 = var88->memb_parts;
+incref(var89);
+var90 = meth_List_Expression__d162784c9e_length(var89);
+var91 = 2LL;
+var92 = oomph_int_gt(var91,var90);
+var93 = oomph_bool_not(var92);
+var94 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var94);
+var95 = 541LL;
+oomph_assert(var93,var94,var95);
+var96 = var88->memb_parts;
+incref(var96);
+var97 = meth_List_Expression__d162784c9e_first(var96);
+var98 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var97);
+var99 = meth_FunctionOrMethodConverter_14d05c56fc_stringify(var1,var98);
+var100 = var88->memb_parts;
+incref(var100);
+var101 = 1LL;
+var102 = var88->memb_parts;
+incref(var102);
+var103 = meth_List_Expression__d162784c9e_length(var102);
+var104 = meth_List_Expression__d162784c9e_slice(var100,var101,var103);
+var105 = 0LL;
+label106: (void)0;
+if (var105 >= var104->len) goto label108;
+decref_Expression_35f2052bf4(var107); var107 = var104->data[var105++]; incref_Expression_35f2052bf4(var107);
+string_decref(var109);
+var109.buf = NULL;
+var109 = string25_string_concat_8eba42145a; string_incref(var109);
+decref((var110), dtor_LocalVariable_846080e5ae);
+var110 = NULL;
+var110 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var107);
+decref((var111), dtor_LocalVariable_846080e5ae);
+var111 = NULL;
+var111 = meth_FunctionOrMethodConverter_14d05c56fc_stringify(var1,var110);
+decref((var112), dtor_List_LocalVariable__81e23234f3);
+var112 = NULL;
+var112 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var112,var99);
+meth_List_LocalVariable__81e23234f3_push(var112,var111);
+var113 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var109,var112);
+decref((var99), dtor_LocalVariable_846080e5ae);
+var99 = var113;
+var113 = NULL;
+if (oomph_true) goto label106;
+label108: (void)0;
+retval = var99; var99 = NULL;
+goto out;
+label10: (void)0;
+
+            if (var2.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var114 = var2.val.item2;
+            incref(var114);
+var115 = var114->memb_function;
+incref_Expression_35f2052bf4(var115);
+
+            var116 = (
+                var115.membernum == 3
+            );
+            if (var116) goto label117;
+
+            var116 = (
+                var115.membernum == 0
+            );
+            if (var116) goto label118;
+
+            var116 = (
+                var115.membernum == 1
+            );
+            if (var116) goto label118;
+
+            var116 = (
+                var115.membernum == 2
+            );
+            if (var116) goto label118;
+
+            var116 = (
+                var115.membernum == 4
+            );
+            if (var116) goto label118;
+
+            var116 = (
+                var115.membernum == 5
+            );
+            if (var116) goto label118;
+
+            var116 = (
+                var115.membernum == 6
+            );
+            if (var116) goto label118;
+
+            var116 = (
+                var115.membernum == 7
+            );
+            if (var116) goto label118;
+
+            var116 = (
+                var115.membernum == 8
+            );
+            if (var116) goto label118;
+
+            var116 = (
+                var115.membernum == 9
+            );
+            if (var116) goto label118;
+
+            var116 = (
+                var115.membernum == 10
+            );
+            if (var116) goto label118;
+
+            var116 = (
+                var115.membernum == 11
+            );
+            if (var116) goto label118;
+
+            var116 = (
+                var115.membernum == 12
+            );
+            if (var116) goto label118;
+
+            var116 = (
+                var115.membernum == 13
+            );
+            if (var116) goto label118;
+label117: (void)0;
+
+            if (var115.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var119 = var115.val.item3;
+            incref(var119);
+var120 = var119->memb_type;
+incref_Type_e6cf7dd4e5(var120);
+var121 = meth_FunctionOrMethodConverter_14d05c56fc_get_type(var1,var120);
+
+            var122 = (
+                var121.membernum == 3
+            );
+            if (var122) goto label123;
+
+            var122 = (
+                var121.membernum == 0
+            );
+            if (var122) goto label124;
+
+            var122 = (
+                var121.membernum == 1
+            );
+            if (var122) goto label124;
+
+            var122 = (
+                var121.membernum == 2
+            );
+            if (var122) goto label124;
+label123: (void)0;
+
+            if (var121.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var125 = var121.val.item3;
+            incref(var125);
+var126 = var114->memb_args;
+incref(var126);
+var127 = meth_List_Expression__d162784c9e_length(var126);
+var128 = 1LL;
+var129 = meth_Int_equals(var127,var128);
+var130 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var130);
+var131 = 556LL;
+oomph_assert(var129,var130,var131);
+var132 = var114->memb_args;
+incref(var132);
+var133 = meth_List_Expression__d162784c9e_first(var132);
+var134 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var133);
+var135 = (struct class_Type_87e1ce5c5e){ .val = { .item3 = var125 }, .membernum = 3 };
+var125 = NULL;
+var136 = meth_FunctionOrMethodConverter_14d05c56fc_implicit_conversion(var1,var134,var135);
+retval = var136; var136 = NULL;
+goto out;
+label124: (void)0;
+label137: (void)0;
+if (oomph_true) goto label138;
+label118: (void)0;
+label138: (void)0;
+var139 = oomph_true;
+var140 = meth_FunctionOrMethodConverter_14d05c56fc_do_call(var1,var114,var139);
+var141 = meth__null___LocalVariable__494c1a2e12_get(var140);
+retval = var141; var141 = NULL;
+goto out;
+label11: (void)0;
+
+            if (var2.membernum != 6)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var142 = var2.val.item6;
+            incref(var142);
+var143 = var142->memb_varname;
+string_incref(var143);
+var144 = (struct class__null___Location__87aaae6467){ .val = { .item1 = var3 }, .membernum = 1 };
+incref(var3);
+var145 = meth_FunctionOrMethodConverter_14d05c56fc_get_var(var1,var143,var144);
+var146 = ir_4b1a3e0393_var_type(var145);
+var147 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var146,var3);
+var148 = var1->memb_code;
+incref(var148);
+var149 = ctor_VarCpy_e77a538911(var147,var145);
+var150 = (struct class_Instruction_b0fafb4d55){ .val = { .item18 = var149 }, .membernum = 18 };
+var149 = NULL;
+meth_List_Instruction__6e475c861a_push(var148,var150);
+var151 = var1->memb_code;
+incref(var151);
+var152 = ctor_IncRef_54322428a7(var147);
+var153 = (struct class_Instruction_b0fafb4d55){ .val = { .item8 = var152 }, .membernum = 8 };
+var152 = NULL;
+meth_List_Instruction__6e475c861a_push(var151,var153);
+retval = var147; var147 = NULL;
+goto out;
+label12: (void)0;
+
+            if (var2.membernum != 13)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var154 = var2.val.item13;
+            incref(var154);
+var155 = var154->memb_obj;
+incref_Expression_35f2052bf4(var155);
+var156 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var155);
+var157 = var154->memb_op;
+string_incref(var157);
+var158 = string48_not_1651420f68; string_incref(var158);
+var159 = meth_Str_equals(var157,var158);
+if (var159) goto label160;
+if (oomph_true) goto label161;
+label160: (void)0;
+var162 = string13_bool_not_044770c441; string_incref(var162);
+var163 = var1->memb_builtins;
+var164 = var163->memb_BOOL;
+var163 = NULL;
+incref_Type_87e1ce5c5e(var164);
+var165 = meth_FunctionOrMethodConverter_14d05c56fc_implicit_conversion(var1,var156,var164);
+var166 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var166,var165);
+var167 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var162,var166);
+retval = var167; var167 = NULL;
+goto out;
+label161: (void)0;
+var168 = var156->memb_type;
+incref_Type_87e1ce5c5e(var168);
+var169 = var1->memb_builtins;
+var170 = var169->memb_INT;
+var169 = NULL;
+incref_Type_87e1ce5c5e(var170);
+var171 = meth_Type_87e1ce5c5e_equals(var168,var170);
+if (var171) goto label172;
+var173 = oomph_false;
+if (oomph_true) goto label174;
+label172: (void)0;
+var175 = var154->memb_op;
+string_incref(var175);
+var176 = string27___039618761f; string_incref(var176);
+var177 = meth_Str_equals(var175,var176);
+var173 = var177;
+label174: (void)0;
+if (var173) goto label178;
+if (oomph_true) goto label179;
+label178: (void)0;
+var180 = string49_int_neg_f0b575260a; string_incref(var180);
+var181 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var181,var156);
+var182 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var180,var181);
+retval = var182; var182 = NULL;
+goto out;
+label179: (void)0;
+var183 = var156->memb_type;
+incref_Type_87e1ce5c5e(var183);
+var184 = var1->memb_builtins;
+var185 = var184->memb_FLOAT;
+var184 = NULL;
+incref_Type_87e1ce5c5e(var185);
+var186 = meth_Type_87e1ce5c5e_equals(var183,var185);
+if (var186) goto label187;
+var188 = oomph_false;
+if (oomph_true) goto label189;
+label187: (void)0;
+var190 = var154->memb_op;
+string_incref(var190);
+var191 = string27___039618761f; string_incref(var191);
+var192 = meth_Str_equals(var190,var191);
+var188 = var192;
+label189: (void)0;
+if (var188) goto label193;
+if (oomph_true) goto label194;
+label193: (void)0;
+var195 = string50_float_neg_c93563ff90; string_incref(var195);
+var196 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var196,var156);
+var197 = meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(var1,var195,var196);
+retval = var197; var197 = NULL;
+goto out;
+label194: (void)0;
+var198 = string42_wrong_types___ab978b9888; string_incref(var198);
+var199 = var154->memb_op;
+string_incref(var199);
+var200 = oomph_string_concat(var198,var199);
+var201 = var156->memb_type;
+incref_Type_87e1ce5c5e(var201);
+var202 = ir_4b1a3e0393_type_name(var201);
+var203 = oomph_string_concat(var200,var202);
+oomph_print(var203);
+var204 = oomph_false;
+var205 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var205);
+var206 = 588LL;
+oomph_assert(var204,var205,var206);
+if (oomph_true) goto label207;
+label13: (void)0;
+
+            if (var2.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var208 = var2.val.item1;
+            incref(var208);
+var209 = meth_FunctionOrMethodConverter_14d05c56fc_do_binary_op(var1,var208);
+retval = var209; var209 = NULL;
+goto out;
+label14: (void)0;
+
+            if (var2.membernum != 5)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var210 = var2.val.item5;
+            incref(var210);
+var211 = var210->memb_obj;
+incref_Expression_35f2052bf4(var211);
+var212 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var211);
+var213 = var212->memb_type;
+incref_Type_87e1ce5c5e(var213);
+var214 = oomph_false;
+var215 = meth_FunctionOrMethodConverter_14d05c56fc_substitute_autotypes(var1,var213,var214);
+var216 = var212->memb_type;
+var212->memb_type = var215;
+var215.membernum = -1;
+var217 = var212->memb_type;
+incref_Type_87e1ce5c5e(var217);
+
+            var218 = (
+                var217.membernum == 0
+            );
+            if (var218) goto label219;
+
+            var218 = (
+                var217.membernum == 1
+            );
+            if (var218) goto label220;
+
+            var218 = (
+                var217.membernum == 2
+            );
+            if (var218) goto label220;
+
+            var218 = (
+                var217.membernum == 3
+            );
+            if (var218) goto label220;
+label219: (void)0;
+
+            if (var217.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var221 = var217.val.item0;
+            incref(var221);
+var222 = meth_FunctionOrMethodConverter_14d05c56fc_create_autotype(var1);
+var223 = (struct class_Type_87e1ce5c5e){ .val = { .item0 = var222 }, .membernum = 0 };
+var222 = NULL;
+var224 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var223,var3);
+if (oomph_true) goto label225;
+label220: (void)0;
+var226 = var212->memb_type;
+incref_Type_87e1ce5c5e(var226);
+var227 = var210->memb_attribute;
+string_incref(var227);
+var228 = meth_FunctionOrMethodConverter_14d05c56fc_get_attribute_type(var1,var226,var227);
+var229 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var228,var3);
+var224 = var229;
+var229 = NULL;
+label225: (void)0;
+var230 = var1->memb_code;
+incref(var230);
+var231 = var210->memb_attribute;
+string_incref(var231);
+var232 = ctor_GetAttribute_3d0cc1bf97(var212,var224,var231);
+var233 = (struct class_Instruction_b0fafb4d55){ .val = { .item4 = var232 }, .membernum = 4 };
+var232 = NULL;
+meth_List_Instruction__6e475c861a_push(var230,var233);
+var234 = var1->memb_code;
+incref(var234);
+var235 = ctor_IncRef_54322428a7(var224);
+var236 = (struct class_Instruction_b0fafb4d55){ .val = { .item8 = var235 }, .membernum = 8 };
+var235 = NULL;
+meth_List_Instruction__6e475c861a_push(var234,var236);
+retval = var224; var224 = NULL;
+goto out;
+label15: (void)0;
+
+            if (var2.membernum != 10)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var237 = var2.val.item10;
+            incref(var237);
+var238 = var237->memb_statements;
+incref(var238);
+var239 = 0LL;
+label240: (void)0;
+if (var239 >= var238->len) goto label242;
+decref_Statement_1dc2e7090f(var241); var241 = var238->data[var239++]; incref_Statement_1dc2e7090f(var241);
+meth_FunctionOrMethodConverter_14d05c56fc_do_statement(var1,var241);
+if (oomph_true) goto label240;
+label242: (void)0;
+var243 = var237->memb_expression;
+incref_Expression_35f2052bf4(var243);
+var244 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var243);
+retval = var244; var244 = NULL;
+goto out;
+label16: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var245 = var2.val.item0;
+            incref(var245);
+var246 = var245->memb_expr;
+incref_Expression_35f2052bf4(var246);
+var247 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var246);
+var248 = var245->memb_type;
+incref_Type_e6cf7dd4e5(var248);
+var249 = meth_FunctionOrMethodConverter_14d05c56fc_get_type(var1,var248);
+var250 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var249,var3);
+var251 = var1->memb_code;
+incref(var251);
+var252 = ctor_GetFromUnion_b0861b839c(var250,var247);
+var253 = (struct class_Instruction_b0fafb4d55){ .val = { .item5 = var252 }, .membernum = 5 };
+var252 = NULL;
+meth_List_Instruction__6e475c861a_push(var251,var253);
+var254 = var1->memb_code;
+incref(var254);
+var255 = ctor_IncRef_54322428a7(var250);
+var256 = (struct class_Instruction_b0fafb4d55){ .val = { .item8 = var255 }, .membernum = 8 };
+var255 = NULL;
+meth_List_Instruction__6e475c861a_push(var254,var256);
+retval = var250; var250 = NULL;
+goto out;
+label17: (void)0;
+
+            if (var2.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var257 = var2.val.item3;
+            incref(var257);
+var258 = oomph_false;
+var259 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var259);
+var260 = 624LL;
+oomph_assert(var258,var259,var260);
+if (oomph_true) goto label207;
+label18: (void)0;
+
+            if (var2.membernum != 8)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var261 = var2.val.item8;
+            incref(var261);
+var262 = oomph_false;
+var263 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var263);
+var264 = 628LL;
+oomph_assert(var262,var263,var264);
+label207: (void)0;
+out: (void)0;
+(void)0;
+string_decref(var263);
+(void)0;
+decref((var261), dtor_ListComprehension_10c913d2dd);
+(void)0;
+string_decref(var259);
+(void)0;
+decref((var257), dtor_Constructor_0c896e4031);
+decref_Instruction_b0fafb4d55(var256);
+decref((var255), dtor_IncRef_54322428a7);
+decref((var254), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var253);
+decref((var252), dtor_GetFromUnion_b0861b839c);
+decref((var251), dtor_List_Instruction__6e475c861a);
+decref((var250), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var249);
+decref_Type_e6cf7dd4e5(var248);
+decref((var247), dtor_LocalVariable_846080e5ae);
+decref_Expression_35f2052bf4(var246);
+decref((var245), dtor_As_a05f1f16b6);
+decref((var244), dtor_LocalVariable_846080e5ae);
+decref_Expression_35f2052bf4(var243);
+decref_Statement_1dc2e7090f(var241);
+(void)0;
+decref((var238), dtor_List_Statement__5d7503c104);
+decref((var237), dtor_StatementsAndExpression_964cbccc5e);
+decref_Instruction_b0fafb4d55(var236);
+decref((var235), dtor_IncRef_54322428a7);
+decref((var234), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var233);
+decref((var232), dtor_GetAttribute_3d0cc1bf97);
+string_decref(var231);
+decref((var230), dtor_List_Instruction__6e475c861a);
+decref((var229), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var228);
+string_decref(var227);
+decref_Type_87e1ce5c5e(var226);
+decref((var224), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var223);
+decref((var222), dtor_AutoType_33a5d572cb);
+decref((var221), dtor_AutoType_33a5d572cb);
+(void)0;
+decref_Type_87e1ce5c5e(var217);
+decref_Type_87e1ce5c5e(var216);
+decref_Type_87e1ce5c5e(var215);
+(void)0;
+decref_Type_87e1ce5c5e(var213);
+decref((var212), dtor_LocalVariable_846080e5ae);
+decref_Expression_35f2052bf4(var211);
+decref((var210), dtor_GetAttribute_0758070446);
+decref((var209), dtor_LocalVariable_846080e5ae);
+decref((var208), dtor_BinaryOperator_e25f87d1b5);
+(void)0;
+string_decref(var205);
+(void)0;
+string_decref(var203);
+string_decref(var202);
+decref_Type_87e1ce5c5e(var201);
+string_decref(var200);
+string_decref(var199);
+string_decref(var198);
+decref((var197), dtor_LocalVariable_846080e5ae);
+decref((var196), dtor_List_LocalVariable__81e23234f3);
+string_decref(var195);
+(void)0;
+string_decref(var191);
+string_decref(var190);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var185);
+decref((var184), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var183);
+decref((var182), dtor_LocalVariable_846080e5ae);
+decref((var181), dtor_List_LocalVariable__81e23234f3);
+string_decref(var180);
+(void)0;
+string_decref(var176);
+string_decref(var175);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var170);
+decref((var169), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var168);
+decref((var167), dtor_LocalVariable_846080e5ae);
+decref((var166), dtor_List_LocalVariable__81e23234f3);
+decref((var165), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var164);
+decref((var163), dtor_Builtins_bd980a9f08);
+string_decref(var162);
+(void)0;
+string_decref(var158);
+string_decref(var157);
+decref((var156), dtor_LocalVariable_846080e5ae);
+decref_Expression_35f2052bf4(var155);
+decref((var154), dtor_UnaryOperator_348525ebbe);
+decref_Instruction_b0fafb4d55(var153);
+decref((var152), dtor_IncRef_54322428a7);
+decref((var151), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var150);
+decref((var149), dtor_VarCpy_e77a538911);
+decref((var148), dtor_List_Instruction__6e475c861a);
+decref((var147), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var146);
+decref_Variable_1aaa81c8d2(var145);
+decref__null___Location__87aaae6467(var144);
+string_decref(var143);
+decref((var142), dtor_GetVar_642f116a6c);
+decref((var141), dtor_LocalVariable_846080e5ae);
+decref__null___LocalVariable__494c1a2e12(var140);
+(void)0;
+decref((var136), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var135);
+decref((var134), dtor_LocalVariable_846080e5ae);
+decref_Expression_35f2052bf4(var133);
+decref((var132), dtor_List_Expression__d162784c9e);
+(void)0;
+string_decref(var130);
+(void)0;
+(void)0;
+(void)0;
+decref((var126), dtor_List_Expression__d162784c9e);
+decref((var125), dtor_UnionType_7f899bced1);
+(void)0;
+decref_Type_87e1ce5c5e(var121);
+decref_Type_e6cf7dd4e5(var120);
+decref((var119), dtor_Constructor_0c896e4031);
+(void)0;
+decref_Expression_35f2052bf4(var115);
+decref((var114), dtor_Call_d0fb9d6234);
+decref((var113), dtor_LocalVariable_846080e5ae);
+decref((var112), dtor_List_LocalVariable__81e23234f3);
+decref((var111), dtor_LocalVariable_846080e5ae);
+decref((var110), dtor_LocalVariable_846080e5ae);
+string_decref(var109);
+decref_Expression_35f2052bf4(var107);
+(void)0;
+decref((var104), dtor_List_Expression__d162784c9e);
+(void)0;
+decref((var102), dtor_List_Expression__d162784c9e);
+(void)0;
+decref((var100), dtor_List_Expression__d162784c9e);
+decref((var99), dtor_LocalVariable_846080e5ae);
+decref((var98), dtor_LocalVariable_846080e5ae);
+decref_Expression_35f2052bf4(var97);
+decref((var96), dtor_List_Expression__d162784c9e);
+(void)0;
+string_decref(var94);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var89), dtor_List_Expression__d162784c9e);
+decref((var88), dtor_StringFormatJoin_bc28806767);
+decref_Instruction_b0fafb4d55(var87);
+decref((var86), dtor_MethodCall_b0095be49c);
+decref__null___LocalVariable__494c1a2e12(var85);
+(void)0;
+decref((var83), dtor_List_LocalVariable__81e23234f3);
+string_decref(var82);
+decref((var81), dtor_List_Instruction__6e475c861a);
+(void)0;
+decref_Instruction_b0fafb4d55(var76);
+decref((var75), dtor_ConstructorCall_f8e441a21d);
+decref((var74), dtor_List_LocalVariable__81e23234f3);
+decref((var73), dtor_List_Instruction__6e475c861a);
+decref((var72), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var71);
+decref((var70), dtor_Generic_c39b95ec73);
+decref((var69), dtor_Builtins_bd980a9f08);
+decref((var68), dtor_Builtins_bd980a9f08);
+decref((var67), dtor_AutoType_33a5d572cb);
+(void)0;
+string_decref(var64);
+(void)0;
+decref_Type_87e1ce5c5e(var62);
+decref((var60), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref_Type_87e1ce5c5e(var57);
+decref_Type_87e1ce5c5e(var56);
+decref((var55), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref((var52), dtor_List_LocalVariable__81e23234f3);
+decref((var51), dtor_LocalVariable_846080e5ae);
+decref_Expression_35f2052bf4(var49);
+(void)0;
+(void)0;
+decref((var45), dtor_List_LocalVariable__81e23234f3);
+decref((var44), dtor_List_Expression__d162784c9e);
+decref((var43), dtor_ListLiteral_66e426dc17);
+decref_Instruction_b0fafb4d55(var42);
+decref((var41), dtor_StringConstant_e1466967c8);
+string_decref(var40);
+decref((var39), dtor_List_Instruction__6e475c861a);
+decref((var38), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var37);
+decref((var36), dtor_Builtins_bd980a9f08);
+decref((var35), dtor_StringConstant_c2b1c10b4f);
+decref_Instruction_b0fafb4d55(var34);
+decref((var33), dtor_FloatConstant_652a176e04);
+string_decref(var32);
+decref((var31), dtor_List_Instruction__6e475c861a);
+decref((var30), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var29);
+decref((var28), dtor_Builtins_bd980a9f08);
+decref((var27), dtor_FloatConstant_4759845694);
+decref_Instruction_b0fafb4d55(var26);
+decref((var25), dtor_IntConstant_817d6312f0);
+(void)0;
+decref((var23), dtor_List_Instruction__6e475c861a);
+decref((var22), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var21);
+decref((var20), dtor_Builtins_bd980a9f08);
+decref((var19), dtor_IntConstant_4cbc4c5420);
+(void)0;
+decref((var3), dtor_Location_500c4434c9);
+return retval;
+}struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_do_expression_and_convert(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Expression_35f2052bf4 var2, struct class_Type_87e1ce5c5e var3){struct class_LocalVariable_846080e5ae* var4;
+var4 = NULL;
+struct class_LocalVariable_846080e5ae* var5;
+var5 = NULL;
+struct class_LocalVariable_846080e5ae* retval;
+var4 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var2);
+var5 = meth_FunctionOrMethodConverter_14d05c56fc_implicit_conversion(var1,var4,var3);
+retval = var5; var5 = NULL;
+goto out;
+out: (void)0;
+decref((var5), dtor_LocalVariable_846080e5ae);
+decref((var4), dtor_LocalVariable_846080e5ae);
+return retval;
+}void meth_FunctionOrMethodConverter_14d05c56fc_do_statement(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Statement_1dc2e7090f var2){bool var3;
+struct class_Call_d0fb9d6234* var15;
+var15 = NULL;
+bool var16;
+struct class__null___LocalVariable__494c1a2e12 var17;
+var17.membernum = -1;
+struct class_Let_c9da3e3372* var19;
+var19 = NULL;
+struct class_List_NamedVariable__2ad9e9e312* var20;
+var20 = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Expression_35f2052bf4 var22;
+var22.membernum = -1;
+struct class_LocalVariable_846080e5ae* var23;
+var23 = NULL;
+struct class_Variable_1aaa81c8d2 var24;
+var24.membernum = -1;
+struct class_NamedVariable_ac0761c28d* var25;
+var25 = NULL;
+struct class_List_NamedVariable__2ad9e9e312* var26;
+var26 = NULL;
+struct class_List_NamedVariable__2ad9e9e312* var27;
+var27 = NULL;
+int64_t var28;
+struct class_NamedVariable_ac0761c28d* var30;
+var30 = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+bool var34;
+bool var35;
+struct class_List_NamedVariable__2ad9e9e312* var38;
+var38 = NULL;
+struct class_SetVar_6a19c6f350* var39;
+var39 = NULL;
+struct class_Str var40;
+var40.buf = NULL;
+struct class_Location_500c4434c9* var41;
+var41 = NULL;
+struct class__null___Location__87aaae6467 var42;
+var42.membernum = -1;
+struct class_Variable_1aaa81c8d2 var43;
+var43.membernum = -1;
+struct class_LocalVariable_846080e5ae* var44;
+var44 = NULL;
+struct class_Expression_35f2052bf4 var45;
+var45.membernum = -1;
+struct class_LocalVariable_846080e5ae* var46;
+var46 = NULL;
+struct class_List_Instruction__6e475c861a* var47;
+var47 = NULL;
+struct class_DecRef_f37e9a69d2* var48;
+var48 = NULL;
+struct class_Instruction_b0fafb4d55 var49;
+var49.membernum = -1;
+struct class_List_Instruction__6e475c861a* var50;
+var50 = NULL;
+struct class_Type_87e1ce5c5e var51;
+var51.membernum = -1;
+struct class_LocalVariable_846080e5ae* var52;
+var52 = NULL;
+struct class_Variable_1aaa81c8d2 var53;
+var53.membernum = -1;
+struct class_VarCpy_e77a538911* var54;
+var54 = NULL;
+struct class_Instruction_b0fafb4d55 var55;
+var55.membernum = -1;
+struct class_List_Instruction__6e475c861a* var56;
+var56 = NULL;
+struct class_IncRef_54322428a7* var57;
+var57 = NULL;
+struct class_Instruction_b0fafb4d55 var58;
+var58.membernum = -1;
+struct class_SetAttribute_6bd58fd9d3* var59;
+var59 = NULL;
+struct class_Expression_35f2052bf4 var60;
+var60.membernum = -1;
+struct class_LocalVariable_846080e5ae* var61;
+var61 = NULL;
+struct class_Expression_35f2052bf4 var62;
+var62.membernum = -1;
+struct class_LocalVariable_846080e5ae* var63;
+var63 = NULL;
+struct class_Type_87e1ce5c5e var64;
+var64.membernum = -1;
+struct class_Str var65;
+var65.buf = NULL;
+struct class_Type_87e1ce5c5e var66;
+var66.membernum = -1;
+struct class_Type_87e1ce5c5e var67;
+var67.membernum = -1;
+bool var68;
+struct class_Str var69;
+var69.buf = NULL;
+int64_t var70;
+struct class_Type_87e1ce5c5e var71;
+var71.membernum = -1;
+struct class_Location_500c4434c9* var72;
+var72 = NULL;
+struct class_LocalVariable_846080e5ae* var73;
+var73 = NULL;
+struct class_List_Instruction__6e475c861a* var74;
+var74 = NULL;
+struct class_Str var75;
+var75.buf = NULL;
+struct class_GetAttribute_3d0cc1bf97* var76;
+var76 = NULL;
+struct class_Instruction_b0fafb4d55 var77;
+var77.membernum = -1;
+struct class_List_Instruction__6e475c861a* var78;
+var78 = NULL;
+struct class_Str var79;
+var79.buf = NULL;
+struct class_SetAttribute_25344a82b6* var80;
+var80 = NULL;
+struct class_Instruction_b0fafb4d55 var81;
+var81.membernum = -1;
+struct class_List_Instruction__6e475c861a* var82;
+var82 = NULL;
+struct class_IncRef_54322428a7* var83;
+var83 = NULL;
+struct class_Instruction_b0fafb4d55 var84;
+var84.membernum = -1;
+struct class_Pass_e49950b77e* var85;
+var85 = NULL;
+struct class_Continue_b54f3b332e* var86;
+var86 = NULL;
+struct class_List_LoopLabels__74a48e6cc9* var87;
+var87 = NULL;
+struct class_LoopLabels_8e8d3917a5* var88;
+var88 = NULL;
+struct class_GotoLabel_9654b8ee6d* var89;
+var89 = NULL;
+struct class_List_Instruction__6e475c861a* var90;
+var90 = NULL;
+struct class_Str var91;
+var91.buf = NULL;
+struct class_Location_500c4434c9* var92;
+var92 = NULL;
+struct class_LocalVariable_846080e5ae* var93;
+var93 = NULL;
+struct class_GotoIf_feb019130f* var94;
+var94 = NULL;
+struct class_Instruction_b0fafb4d55 var95;
+var95.membernum = -1;
+struct class_Break_2f9897f5fd* var96;
+var96 = NULL;
+struct class_List_LoopLabels__74a48e6cc9* var97;
+var97 = NULL;
+struct class_LoopLabels_8e8d3917a5* var98;
+var98 = NULL;
+struct class_GotoLabel_9654b8ee6d* var99;
+var99 = NULL;
+struct class_List_Instruction__6e475c861a* var100;
+var100 = NULL;
+struct class_Str var101;
+var101.buf = NULL;
+struct class_Location_500c4434c9* var102;
+var102 = NULL;
+struct class_LocalVariable_846080e5ae* var103;
+var103 = NULL;
+struct class_GotoIf_feb019130f* var104;
+var104 = NULL;
+struct class_Instruction_b0fafb4d55 var105;
+var105.membernum = -1;
+struct class_Return_33802009cd* var106;
+var106 = NULL;
+struct class__null___Type__8438ac3dcf var107;
+var107.membernum = -1;
+char var108;
+struct class__null___Type__8438ac3dcf var109;
+var109.membernum = -1;
+bool var110;
+struct class_List_Instruction__6e475c861a* var112;
+var112 = NULL;
+struct class__null___Expression__957e7d6409 var113;
+var113.membernum = -1;
+struct class_Expression_35f2052bf4 var114;
+var114.membernum = -1;
+struct class__null___Type__8438ac3dcf var115;
+var115.membernum = -1;
+struct class_Type_87e1ce5c5e var116;
+var116.membernum = -1;
+struct class_LocalVariable_846080e5ae* var117;
+var117 = NULL;
+struct class__null___LocalVariable__494c1a2e12 var118;
+var118.membernum = -1;
+struct class_Return_aa2d9b1c64* var119;
+var119 = NULL;
+struct class_Instruction_b0fafb4d55 var120;
+var120.membernum = -1;
+struct class__null___Expression__957e7d6409 var122;
+var122.membernum = -1;
+char var123;
+struct class__null___Expression__957e7d6409 var124;
+var124.membernum = -1;
+bool var125;
+struct class_Str var126;
+var126.buf = NULL;
+int64_t var127;
+struct class_List_Instruction__6e475c861a* var128;
+var128 = NULL;
+char var129;
+struct class__null___LocalVariable__494c1a2e12 var130;
+var130.membernum = -1;
+struct class_Return_aa2d9b1c64* var131;
+var131 = NULL;
+struct class_Instruction_b0fafb4d55 var132;
+var132.membernum = -1;
+struct class_If_8811dba942* var133;
+var133 = NULL;
+struct class_List_ConditionAndBody__ad79dde1db* var134;
+var134 = NULL;
+struct class_ConditionAndBody_0e2f888e06* var135;
+var135 = NULL;
+struct class_Expression_35f2052bf4 var136;
+var136.membernum = -1;
+struct class_List_ConditionAndBody__ad79dde1db* var137;
+var137 = NULL;
+struct class_ConditionAndBody_0e2f888e06* var138;
+var138 = NULL;
+struct class_List_Statement__5d7503c104* var139;
+var139 = NULL;
+struct class_Builtins_bd980a9f08* var140;
+var140 = NULL;
+struct class_Type_87e1ce5c5e var141;
+var141.membernum = -1;
+struct class_LocalVariable_846080e5ae* var142;
+var142 = NULL;
+struct class_List_Instruction__6e475c861a* var143;
+var143 = NULL;
+struct class_List_ConditionAndBody__ad79dde1db* var144;
+var144 = NULL;
+int64_t var145;
+int64_t var146;
+bool var147;
+bool var148;
+struct class_List_Statement__5d7503c104* var150;
+var150 = NULL;
+struct class_List_Instruction__6e475c861a* var151;
+var151 = NULL;
+struct class_List_Instruction__6e475c861a* var152;
+var152 = NULL;
+struct class_List_ConditionAndBody__ad79dde1db* var154;
+var154 = NULL;
+int64_t var155;
+struct class_List_ConditionAndBody__ad79dde1db* var156;
+var156 = NULL;
+int64_t var157;
+struct class_List_ConditionAndBody__ad79dde1db* var158;
+var158 = NULL;
+struct class_List_Statement__5d7503c104* var159;
+var159 = NULL;
+struct class_If_8811dba942* var160;
+var160 = NULL;
+struct class_Statement_1dc2e7090f var161;
+var161.membernum = -1;
+struct class_List_Statement__5d7503c104* var162;
+var162 = NULL;
+struct class_Loop_80080d5f12* var163;
+var163 = NULL;
+struct class_GotoLabel_9654b8ee6d* var164;
+var164 = NULL;
+struct class_GotoLabel_9654b8ee6d* var165;
+var165 = NULL;
+struct class_GotoLabel_9654b8ee6d* var166;
+var166 = NULL;
+struct class_LoopHeader_23fd592271 var167;
+var167.membernum = -1;
+struct class_ForLoopHeader_79606b2adb* var168;
+var168 = NULL;
+struct class_List_Statement__5d7503c104* var169;
+var169 = NULL;
+int64_t var170;
+struct class_Statement_1dc2e7090f var172;
+var172.membernum = -1;
+struct class_List_Instruction__6e475c861a* var174;
+var174 = NULL;
+struct class_Instruction_b0fafb4d55 var175;
+var175.membernum = -1;
+struct class__null___Expression__957e7d6409 var176;
+var176.membernum = -1;
+char var177;
+struct class__null___Expression__957e7d6409 var178;
+var178.membernum = -1;
+bool var179;
+struct class__null___Expression__957e7d6409 var181;
+var181.membernum = -1;
+struct class_Expression_35f2052bf4 var182;
+var182.membernum = -1;
+struct class_Builtins_bd980a9f08* var183;
+var183 = NULL;
+struct class_Type_87e1ce5c5e var184;
+var184.membernum = -1;
+struct class_LocalVariable_846080e5ae* var185;
+var185 = NULL;
+struct class_LocalVariable_846080e5ae* var186;
+var186 = NULL;
+struct class_Builtins_bd980a9f08* var188;
+var188 = NULL;
+struct class_Type_87e1ce5c5e var189;
+var189.membernum = -1;
+struct class__null___Expression__957e7d6409 var190;
+var190.membernum = -1;
+struct class_Expression_35f2052bf4 var191;
+var191.membernum = -1;
+struct class_Location_500c4434c9* var192;
+var192 = NULL;
+struct class_List_Instruction__6e475c861a* var193;
+var193 = NULL;
+struct class_Builtins_bd980a9f08* var194;
+var194 = NULL;
+struct class_Str var195;
+var195.buf = NULL;
+struct class_BuiltinVariable_f6e0cdd1b6* var196;
+var196 = NULL;
+struct class_Variable_1aaa81c8d2 var197;
+var197.membernum = -1;
+struct class_VarCpy_e77a538911* var198;
+var198 = NULL;
+struct class_Instruction_b0fafb4d55 var199;
+var199.membernum = -1;
+struct class_List_Instruction__6e475c861a* var200;
+var200 = NULL;
+struct class_LocalVariable_846080e5ae* var201;
+var201 = NULL;
+struct class_GotoIf_feb019130f* var202;
+var202 = NULL;
+struct class_Instruction_b0fafb4d55 var203;
+var203.membernum = -1;
+struct class_List_LoopLabels__74a48e6cc9* var204;
+var204 = NULL;
+struct class_LoopLabels_8e8d3917a5* var205;
+var205 = NULL;
+struct class_List_Instruction__6e475c861a* var206;
+var206 = NULL;
+struct class_List_Statement__5d7503c104* var207;
+var207 = NULL;
+struct class_List_Instruction__6e475c861a* var208;
+var208 = NULL;
+struct class_List_LoopLabels__74a48e6cc9* var209;
+var209 = NULL;
+struct class_LoopLabels_8e8d3917a5* var210;
+var210 = NULL;
+struct class_GotoLabel_9654b8ee6d* var211;
+var211 = NULL;
+bool var212;
+struct class_Str var213;
+var213.buf = NULL;
+int64_t var214;
+struct class_GotoLabel_9654b8ee6d* var215;
+var215 = NULL;
+bool var216;
+struct class_Str var217;
+var217.buf = NULL;
+int64_t var218;
+struct class_List_Instruction__6e475c861a* var219;
+var219 = NULL;
+struct class_Instruction_b0fafb4d55 var220;
+var220.membernum = -1;
+struct class_List_Statement__5d7503c104* var221;
+var221 = NULL;
+int64_t var222;
+struct class_Statement_1dc2e7090f var224;
+var224.membernum = -1;
+struct class_List_Instruction__6e475c861a* var226;
+var226 = NULL;
+struct class_Str var227;
+var227.buf = NULL;
+struct class_LoopHeader_23fd592271 var228;
+var228.membernum = -1;
+struct class_Location_500c4434c9* var229;
+var229 = NULL;
+struct class_LocalVariable_846080e5ae* var230;
+var230 = NULL;
+struct class_GotoIf_feb019130f* var231;
+var231 = NULL;
+struct class_Instruction_b0fafb4d55 var232;
+var232.membernum = -1;
+struct class_List_Instruction__6e475c861a* var233;
+var233 = NULL;
+struct class_Instruction_b0fafb4d55 var234;
+var234.membernum = -1;
+struct class_List_Statement__5d7503c104* var235;
+var235 = NULL;
+int64_t var236;
+int64_t var237;
+bool var238;
+struct class_List_Statement__5d7503c104* var241;
+var241 = NULL;
+struct class_Statement_1dc2e7090f var242;
+var242.membernum = -1;
+bool var243;
+struct class_Let_c9da3e3372* var246;
+var246 = NULL;
+struct class_List_NamedVariable__2ad9e9e312* var247;
+var247 = NULL;
+struct class_List_Str__43b70c06cb* var248;
+var248 = NULL;
+int64_t var249;
+int64_t var250;
+struct class_NamedVariable_ac0761c28d* var252;
+var252 = NULL;
+struct class_Str var254;
+var254.buf = NULL;
+struct class_Str var255;
+var255.buf = NULL;
+bool var256;
+struct class_List_NamedVariable__2ad9e9e312* var259;
+var259 = NULL;
+struct class_Str var260;
+var260.buf = NULL;
+int64_t var261;
+struct class_NamedVariable_ac0761c28d* var262;
+var262 = NULL;
+struct class_Switch_9b8c881aeb* var264;
+var264 = NULL;
+struct class_Expression_35f2052bf4 var265;
+var265.membernum = -1;
+struct class_LocalVariable_846080e5ae* var266;
+var266 = NULL;
+struct class_Type_87e1ce5c5e var267;
+var267.membernum = -1;
+struct class_UnionType_7f899bced1* var268;
+var268 = NULL;
+struct class_List_Type__057f9c6088* var269;
+var269 = NULL;
+struct class_List_Type__057f9c6088* var270;
+var270 = NULL;
+struct class_List_Type__057f9c6088* var271;
+var271 = NULL;
+struct class_GotoLabel_9654b8ee6d* var272;
+var272 = NULL;
+struct class_Builtins_bd980a9f08* var273;
+var273 = NULL;
+struct class_Type_87e1ce5c5e var274;
+var274.membernum = -1;
+struct class_Location_500c4434c9* var275;
+var275 = NULL;
+struct class_LocalVariable_846080e5ae* var276;
+var276 = NULL;
+struct class_List_Instruction__6e475c861a* var277;
+var277 = NULL;
+struct class_List_Case__f5a6b4b2ec* var278;
+var278 = NULL;
+int64_t var279;
+struct class_Case_458b8eeee1* var281;
+var281 = NULL;
+struct class_GotoLabel_9654b8ee6d* var283;
+var283 = NULL;
+struct class_Instruction_b0fafb4d55 var284;
+var284.membernum = -1;
+struct class__null___TypeAndName__d7958d7e85 var285;
+var285.membernum = -1;
+char var286;
+struct class__null___TypeAndName__d7958d7e85 var287;
+var287.membernum = -1;
+bool var288;
+struct class__null___TypeAndName__d7958d7e85 var290;
+var290.membernum = -1;
+struct class_TypeAndName_fec99b5f94* var291;
+var291 = NULL;
+struct class_Str var292;
+var292.buf = NULL;
+struct class__null___TypeAndName__d7958d7e85 var293;
+var293.membernum = -1;
+struct class_TypeAndName_fec99b5f94* var294;
+var294 = NULL;
+struct class_Type_e6cf7dd4e5 var295;
+var295.membernum = -1;
+struct class_Type_87e1ce5c5e var296;
+var296.membernum = -1;
+struct class_List_Type__057f9c6088* var297;
+var297 = NULL;
+bool var298;
+struct class_Str var299;
+var299.buf = NULL;
+int64_t var300;
+struct class__null___TypeAndName__d7958d7e85 var301;
+var301.membernum = -1;
+struct class_TypeAndName_fec99b5f94* var302;
+var302 = NULL;
+struct class_Location_500c4434c9* var303;
+var303 = NULL;
+struct class_LocalVariable_846080e5ae* var304;
+var304 = NULL;
+struct class_List_NamedVariable__2ad9e9e312* var305;
+var305 = NULL;
+struct class_Variable_1aaa81c8d2 var306;
+var306.membernum = -1;
+struct class_NamedVariable_ac0761c28d* var307;
+var307 = NULL;
+struct class_GetFromUnion_b0861b839c* var308;
+var308 = NULL;
+struct class_Instruction_b0fafb4d55 var309;
+var309.membernum = -1;
+struct class_IncRef_54322428a7* var310;
+var310 = NULL;
+struct class_Instruction_b0fafb4d55 var311;
+var311.membernum = -1;
+struct class_List_Type__057f9c6088* var313;
+var313 = NULL;
+bool var314;
+bool var315;
+struct class_Str var316;
+var316.buf = NULL;
+int64_t var317;
+struct class_List_Type__057f9c6088* var318;
+var318 = NULL;
+struct class_List_Statement__5d7503c104* var319;
+var319 = NULL;
+struct class_List_Instruction__6e475c861a* var320;
+var320 = NULL;
+struct class_Str var321;
+var321.buf = NULL;
+struct class_Location_500c4434c9* var322;
+var322 = NULL;
+struct class_LocalVariable_846080e5ae* var323;
+var323 = NULL;
+struct class_GotoIf_feb019130f* var324;
+var324 = NULL;
+struct class_Instruction_b0fafb4d55 var325;
+var325.membernum = -1;
+struct class__null___TypeAndName__d7958d7e85 var326;
+var326.membernum = -1;
+char var327;
+struct class__null___TypeAndName__d7958d7e85 var328;
+var328.membernum = -1;
+bool var329;
+bool var330;
+char var333;
+struct class_Variable_1aaa81c8d2 var334;
+var334.membernum = -1;
+struct class__null___Location__87aaae6467 var335;
+var335.membernum = -1;
+struct class_Variable_1aaa81c8d2 var336;
+var336.membernum = -1;
+bool var337;
+struct class_Str var338;
+var338.buf = NULL;
+int64_t var339;
+int64_t var340;
+struct class_List_NamedVariable__2ad9e9e312* var342;
+var342 = NULL;
+struct class_NamedVariable_ac0761c28d* var343;
+var343 = NULL;
+struct class_Str var344;
+var344.buf = NULL;
+bool var345;
+bool var347;
+struct class_List_NamedVariable__2ad9e9e312* var349;
+var349 = NULL;
+struct class_NamedVariable_ac0761c28d* var350;
+var350 = NULL;
+struct class_Variable_1aaa81c8d2 var351;
+var351.membernum = -1;
+struct class_Variable_1aaa81c8d2 var352;
+var352.membernum = -1;
+bool var353;
+struct class_List_NamedVariable__2ad9e9e312* var356;
+var356 = NULL;
+struct class_NamedVariable_ac0761c28d* var357;
+var357 = NULL;
+int64_t var359;
+int64_t var360;
+int64_t var361;
+struct class_Type_87e1ce5c5e var363;
+var363.membernum = -1;
+struct class_List_Instruction__6e475c861a* var365;
+var365 = NULL;
+struct class_UnionMemberCheck_7021628c40* var366;
+var366 = NULL;
+struct class_Instruction_b0fafb4d55 var367;
+var367.membernum = -1;
+struct class_List_Instruction__6e475c861a* var368;
+var368 = NULL;
+struct class_GotoIf_feb019130f* var369;
+var369 = NULL;
+struct class_Instruction_b0fafb4d55 var370;
+var370.membernum = -1;
+struct class_List_Type__057f9c6088* var371;
+var371 = NULL;
+bool var372;
+bool var373;
+struct class_Str var376;
+var376.buf = NULL;
+struct class_Str var377;
+var377.buf = NULL;
+struct class_Str var378;
+var378.buf = NULL;
+bool var379;
+struct class_Str var380;
+var380.buf = NULL;
+int64_t var381;
+struct class_List_Instruction__6e475c861a* var382;
+var382 = NULL;
+struct class_List_Instruction__6e475c861a* var383;
+var383 = NULL;
+struct class_Instruction_b0fafb4d55 var384;
+var384.membernum = -1;
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) goto label4;
+
+            var3 = (
+                var2.membernum == 4
+            );
+            if (var3) goto label5;
+
+            var3 = (
+                var2.membernum == 9
+            );
+            if (var3) goto label6;
+
+            var3 = (
+                var2.membernum == 8
+            );
+            if (var3) goto label7;
+
+            var3 = (
+                var2.membernum == 6
+            );
+            if (var3) goto label8;
+
+            var3 = (
+                var2.membernum == 2
+            );
+            if (var3) goto label9;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) goto label10;
+
+            var3 = (
+                var2.membernum == 7
+            );
+            if (var3) goto label11;
+
+            var3 = (
+                var2.membernum == 3
+            );
+            if (var3) goto label12;
+
+            var3 = (
+                var2.membernum == 5
+            );
+            if (var3) goto label13;
+
+            var3 = (
+                var2.membernum == 10
+            );
+            if (var3) goto label14;
+label4: (void)0;
+
+            if (var2.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var15 = var2.val.item1;
+            incref(var15);
+var16 = oomph_false;
+var17 = meth_FunctionOrMethodConverter_14d05c56fc_do_call(var1,var15,var16);
+if (oomph_true) goto label18;
+label5: (void)0;
+
+            if (var2.membernum != 4)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var19 = var2.val.item4;
+            incref(var19);
+var20 = var1->memb_variables;
+incref(var20);
+var21 = var19->memb_varname;
+string_incref(var21);
+var22 = var19->memb_value;
+incref_Expression_35f2052bf4(var22);
+var23 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var22);
+var24 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var23 }, .membernum = 2 };
+var23 = NULL;
+var25 = ctor_NamedVariable_ac0761c28d(var21,var24);
+var26 = ctor_List_NamedVariable__2ad9e9e312();
+meth_List_NamedVariable__2ad9e9e312_push(var26,var25);
+var27 = var1->memb_variables;
+var1->memb_variables = var26;
+var26 = NULL;
+var28 = 0LL;
+label29: (void)0;
+if (var28 >= var20->len) goto label31;
+var30 = var20->data[var28++];
+string_decref(var32);
+var32.buf = NULL;
+var32 = var30->memb_name;
+string_incref(var32);
+string_decref(var33);
+var33.buf = NULL;
+var33 = var19->memb_varname;
+string_incref(var33);
+var34 = meth_Str_equals(var32,var33);
+var35 = oomph_bool_not(var34);
+if (var35) goto label36;
+if (oomph_true) goto label37;
+label36: (void)0;
+decref((var38), dtor_List_NamedVariable__2ad9e9e312);
+var38 = NULL;
+var38 = var1->memb_variables;
+incref(var38);
+meth_List_NamedVariable__2ad9e9e312_push(var38,var30);
+label37: (void)0;
+if (oomph_true) goto label29;
+label31: (void)0;
+if (oomph_true) goto label18;
+label6: (void)0;
+
+            if (var2.membernum != 9)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var39 = var2.val.item9;
+            incref(var39);
+var40 = var39->memb_varname;
+string_incref(var40);
+var41 = var39->memb_location;
+incref(var41);
+var42 = (struct class__null___Location__87aaae6467){ .val = { .item1 = var41 }, .membernum = 1 };
+var41 = NULL;
+var43 = meth_FunctionOrMethodConverter_14d05c56fc_get_var(var1,var40,var42);
+
+            if (var43.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var44 = var43.val.item2;
+            incref(var44);
+var45 = var39->memb_value;
+incref_Expression_35f2052bf4(var45);
+var46 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var45);
+var47 = var1->memb_code;
+incref(var47);
+var48 = ctor_DecRef_f37e9a69d2(var44);
+var49 = (struct class_Instruction_b0fafb4d55){ .val = { .item1 = var48 }, .membernum = 1 };
+var48 = NULL;
+meth_List_Instruction__6e475c861a_push(var47,var49);
+var50 = var1->memb_code;
+incref(var50);
+var51 = var44->memb_type;
+incref_Type_87e1ce5c5e(var51);
+var52 = meth_FunctionOrMethodConverter_14d05c56fc_implicit_conversion(var1,var46,var51);
+var53 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var52 }, .membernum = 2 };
+var52 = NULL;
+var54 = ctor_VarCpy_e77a538911(var44,var53);
+var55 = (struct class_Instruction_b0fafb4d55){ .val = { .item18 = var54 }, .membernum = 18 };
+var54 = NULL;
+meth_List_Instruction__6e475c861a_push(var50,var55);
+var56 = var1->memb_code;
+incref(var56);
+var57 = ctor_IncRef_54322428a7(var44);
+var58 = (struct class_Instruction_b0fafb4d55){ .val = { .item8 = var57 }, .membernum = 8 };
+var57 = NULL;
+meth_List_Instruction__6e475c861a_push(var56,var58);
+if (oomph_true) goto label18;
+label7: (void)0;
+
+            if (var2.membernum != 8)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var59 = var2.val.item8;
+            incref(var59);
+var60 = var59->memb_obj;
+incref_Expression_35f2052bf4(var60);
+var61 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var60);
+var62 = var59->memb_value;
+incref_Expression_35f2052bf4(var62);
+var63 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var62);
+var64 = var61->memb_type;
+incref_Type_87e1ce5c5e(var64);
+var65 = var59->memb_attribute;
+string_incref(var65);
+var66 = ir_4b1a3e0393_get_member(var64,var65);
+var67 = var63->memb_type;
+incref_Type_87e1ce5c5e(var67);
+var68 = meth_Type_87e1ce5c5e_equals(var66,var67);
+var69 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var69);
+var70 = 661LL;
+oomph_assert(var68,var69,var70);
+var71 = var63->memb_type;
+incref_Type_87e1ce5c5e(var71);
+var72 = var59->memb_attribute_location;
+incref(var72);
+var73 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var71,var72);
+var74 = var1->memb_code;
+incref(var74);
+var75 = var59->memb_attribute;
+string_incref(var75);
+var76 = ctor_GetAttribute_3d0cc1bf97(var61,var73,var75);
+var77 = (struct class_Instruction_b0fafb4d55){ .val = { .item4 = var76 }, .membernum = 4 };
+var76 = NULL;
+meth_List_Instruction__6e475c861a_push(var74,var77);
+var78 = var1->memb_code;
+incref(var78);
+var79 = var59->memb_attribute;
+string_incref(var79);
+var80 = ctor_SetAttribute_25344a82b6(var61,var79,var63);
+var81 = (struct class_Instruction_b0fafb4d55){ .val = { .item14 = var80 }, .membernum = 14 };
+var80 = NULL;
+meth_List_Instruction__6e475c861a_push(var78,var81);
+var82 = var1->memb_code;
+incref(var82);
+var83 = ctor_IncRef_54322428a7(var63);
+var84 = (struct class_Instruction_b0fafb4d55){ .val = { .item8 = var83 }, .membernum = 8 };
+var83 = NULL;
+meth_List_Instruction__6e475c861a_push(var82,var84);
+if (oomph_true) goto label18;
+label8: (void)0;
+
+            if (var2.membernum != 6)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var85 = var2.val.item6;
+            incref(var85);
+if (oomph_true) goto label18;
+label9: (void)0;
+
+            if (var2.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var86 = var2.val.item2;
+            incref(var86);
+var87 = var1->memb_loop_stack;
+incref(var87);
+var88 = meth_List_LoopLabels__74a48e6cc9_last(var87);
+var89 = var88->memb_continue_label;
+incref(var89);
+var90 = var1->memb_code;
+incref(var90);
+var91 = string14_true_7fafb4b9ec; string_incref(var91);
+var92 = var86->memb_location;
+incref(var92);
+var93 = meth_FunctionOrMethodConverter_14d05c56fc_bool_constant(var1,var91,var92);
+var94 = ctor_GotoIf_feb019130f(var89,var93);
+var95 = (struct class_Instruction_b0fafb4d55){ .val = { .item6 = var94 }, .membernum = 6 };
+var94 = NULL;
+meth_List_Instruction__6e475c861a_push(var90,var95);
+if (oomph_true) goto label18;
+label10: (void)0;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var96 = var2.val.item0;
+            incref(var96);
+var97 = var1->memb_loop_stack;
+incref(var97);
+var98 = meth_List_LoopLabels__74a48e6cc9_last(var97);
+var99 = var98->memb_break_label;
+incref(var99);
+var100 = var1->memb_code;
+incref(var100);
+var101 = string14_true_7fafb4b9ec; string_incref(var101);
+var102 = var96->memb_location;
+incref(var102);
+var103 = meth_FunctionOrMethodConverter_14d05c56fc_bool_constant(var1,var101,var102);
+var104 = ctor_GotoIf_feb019130f(var99,var103);
+var105 = (struct class_Instruction_b0fafb4d55){ .val = { .item6 = var104 }, .membernum = 6 };
+var104 = NULL;
+meth_List_Instruction__6e475c861a_push(var100,var105);
+if (oomph_true) goto label18;
+label11: (void)0;
+
+            if (var2.membernum != 7)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var106 = var2.val.item7;
+            incref(var106);
+var107 = var1->memb_returntype;
+incref__null___Type__8438ac3dcf(var107);
+var108 = oomph_null;
+var109 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var108 }, .membernum = 0 };
+var110 = meth__null___Type__8438ac3dcf_equals(var107,var109);
+if (var110) goto label111;
+var112 = var1->memb_code;
+incref(var112);
+var113 = var106->memb_value;
+incref__null___Expression__957e7d6409(var113);
+var114 = meth__null___Expression__957e7d6409_get(var113);
+var115 = var1->memb_returntype;
+incref__null___Type__8438ac3dcf(var115);
+var116 = meth__null___Type__8438ac3dcf_get(var115);
+var117 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression_and_convert(var1,var114,var116);
+var118 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item1 = var117 }, .membernum = 1 };
+var117 = NULL;
+var119 = ctor_Return_aa2d9b1c64(var118);
+var120 = (struct class_Instruction_b0fafb4d55){ .val = { .item13 = var119 }, .membernum = 13 };
+var119 = NULL;
+meth_List_Instruction__6e475c861a_push(var112,var120);
+if (oomph_true) goto label121;
+label111: (void)0;
+var122 = var106->memb_value;
+incref__null___Expression__957e7d6409(var122);
+var123 = oomph_null;
+var124 = (struct class__null___Expression__957e7d6409){ .val = { .item0 = var123 }, .membernum = 0 };
+var125 = meth__null___Expression__957e7d6409_equals(var122,var124);
+var126 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var126);
+var127 = 682LL;
+oomph_assert(var125,var126,var127);
+var128 = var1->memb_code;
+incref(var128);
+var129 = oomph_null;
+var130 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item0 = var129 }, .membernum = 0 };
+var131 = ctor_Return_aa2d9b1c64(var130);
+var132 = (struct class_Instruction_b0fafb4d55){ .val = { .item13 = var131 }, .membernum = 13 };
+var131 = NULL;
+meth_List_Instruction__6e475c861a_push(var128,var132);
+label121: (void)0;
+if (oomph_true) goto label18;
+label12: (void)0;
+
+            if (var2.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var133 = var2.val.item3;
+            incref(var133);
+var134 = var133->memb_ifs_and_elifs;
+incref(var134);
+var135 = meth_List_ConditionAndBody__ad79dde1db_first(var134);
+var136 = var135->memb_cond;
+incref_Expression_35f2052bf4(var136);
+var137 = var133->memb_ifs_and_elifs;
+incref(var137);
+var138 = meth_List_ConditionAndBody__ad79dde1db_first(var137);
+var139 = var138->memb_body;
+incref(var139);
+var140 = var1->memb_builtins;
+var141 = var140->memb_BOOL;
+var140 = NULL;
+incref_Type_87e1ce5c5e(var141);
+var142 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression_and_convert(var1,var136,var141);
+var143 = meth_FunctionOrMethodConverter_14d05c56fc_do_block(var1,var139);
+var144 = var133->memb_ifs_and_elifs;
+incref(var144);
+var145 = meth_List_ConditionAndBody__ad79dde1db_length(var144);
+var146 = 2LL;
+var147 = oomph_int_gt(var146,var145);
+var148 = oomph_bool_not(var147);
+if (var148) goto label149;
+var150 = var133->memb_else_block;
+incref(var150);
+var151 = meth_FunctionOrMethodConverter_14d05c56fc_do_block(var1,var150);
+var152 = var151;
+var151 = NULL;
+if (oomph_true) goto label153;
+label149: (void)0;
+var154 = var133->memb_ifs_and_elifs;
+incref(var154);
+var155 = 1LL;
+var156 = var133->memb_ifs_and_elifs;
+incref(var156);
+var157 = meth_List_ConditionAndBody__ad79dde1db_length(var156);
+var158 = meth_List_ConditionAndBody__ad79dde1db_slice(var154,var155,var157);
+var159 = var133->memb_else_block;
+incref(var159);
+var160 = ctor_If_8811dba942(var158,var159);
+var161 = (struct class_Statement_1dc2e7090f){ .val = { .item3 = var160 }, .membernum = 3 };
+var160 = NULL;
+var162 = ctor_List_Statement__5d7503c104();
+meth_List_Statement__5d7503c104_push(var162,var161);
+var152 = meth_FunctionOrMethodConverter_14d05c56fc_do_block(var1,var162);
+label153: (void)0;
+meth_FunctionOrMethodConverter_14d05c56fc_do_if(var1,var142,var143,var152);
+if (oomph_true) goto label18;
+label13: (void)0;
+
+            if (var2.membernum != 5)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var163 = var2.val.item5;
+            incref(var163);
+var164 = meth_FunctionOrMethodConverter_14d05c56fc_create_goto_label(var1);
+var165 = meth_FunctionOrMethodConverter_14d05c56fc_create_goto_label(var1);
+var166 = meth_FunctionOrMethodConverter_14d05c56fc_create_goto_label(var1);
+var167 = var163->memb_loop_header;
+incref_LoopHeader_23fd592271(var167);
+
+            if (var167.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var168 = var167.val.item0;
+            incref(var168);
+var169 = var168->memb_init;
+incref(var169);
+var170 = 0LL;
+label171: (void)0;
+if (var170 >= var169->len) goto label173;
+decref_Statement_1dc2e7090f(var172); var172 = var169->data[var170++]; incref_Statement_1dc2e7090f(var172);
+meth_FunctionOrMethodConverter_14d05c56fc_do_statement(var1,var172);
+if (oomph_true) goto label171;
+label173: (void)0;
+var174 = var1->memb_code;
+incref(var174);
+var175 = (struct class_Instruction_b0fafb4d55){ .val = { .item7 = var164 }, .membernum = 7 };
+incref(var164);
+meth_List_Instruction__6e475c861a_push(var174,var175);
+var176 = var168->memb_cond;
+incref__null___Expression__957e7d6409(var176);
+var177 = oomph_null;
+var178 = (struct class__null___Expression__957e7d6409){ .val = { .item0 = var177 }, .membernum = 0 };
+var179 = meth__null___Expression__957e7d6409_equals(var176,var178);
+if (var179) goto label180;
+var181 = var168->memb_cond;
+incref__null___Expression__957e7d6409(var181);
+var182 = meth__null___Expression__957e7d6409_get(var181);
+var183 = var1->memb_builtins;
+var184 = var183->memb_BOOL;
+var183 = NULL;
+incref_Type_87e1ce5c5e(var184);
+var185 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression_and_convert(var1,var182,var184);
+var186 = var185;
+var185 = NULL;
+if (oomph_true) goto label187;
+label180: (void)0;
+var188 = var1->memb_builtins;
+var189 = var188->memb_BOOL;
+var188 = NULL;
+incref_Type_87e1ce5c5e(var189);
+var190 = var168->memb_cond;
+incref__null___Expression__957e7d6409(var190);
+var191 = meth__null___Expression__957e7d6409_get(var190);
+var192 = ast_91af7cbb25_locate_expression(var191);
+var186 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var189,var192);
+var193 = var1->memb_code;
+incref(var193);
+var194 = var1->memb_builtins;
+incref(var194);
+var195 = string14_true_7fafb4b9ec; string_incref(var195);
+var196 = meth_Builtins_bd980a9f08_get_visible_var(var194,var195);
+var197 = (struct class_Variable_1aaa81c8d2){ .val = { .item0 = var196 }, .membernum = 0 };
+var196 = NULL;
+var198 = ctor_VarCpy_e77a538911(var186,var197);
+var199 = (struct class_Instruction_b0fafb4d55){ .val = { .item18 = var198 }, .membernum = 18 };
+var198 = NULL;
+meth_List_Instruction__6e475c861a_push(var193,var199);
+label187: (void)0;
+var200 = var1->memb_code;
+incref(var200);
+var201 = meth_FunctionOrMethodConverter_14d05c56fc_not_(var1,var186);
+var202 = ctor_GotoIf_feb019130f(var166,var201);
+var203 = (struct class_Instruction_b0fafb4d55){ .val = { .item6 = var202 }, .membernum = 6 };
+var202 = NULL;
+meth_List_Instruction__6e475c861a_push(var200,var203);
+var204 = var1->memb_loop_stack;
+incref(var204);
+var205 = ctor_LoopLabels_8e8d3917a5(var165,var166);
+meth_List_LoopLabels__74a48e6cc9_push(var204,var205);
+var206 = var1->memb_code;
+incref(var206);
+var207 = var163->memb_body;
+incref(var207);
+var208 = meth_FunctionOrMethodConverter_14d05c56fc_do_block(var1,var207);
+meth_List_Instruction__6e475c861a_push_all(var206,var208);
+var209 = var1->memb_loop_stack;
+incref(var209);
+var210 = meth_List_LoopLabels__74a48e6cc9_pop(var209);
+var211 = var210->memb_continue_label;
+incref(var211);
+var212 = meth_GotoLabel_9654b8ee6d_equals(var211,var165);
+var213 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var213);
+var214 = 734LL;
+oomph_assert(var212,var213,var214);
+var215 = var210->memb_break_label;
+incref(var215);
+var216 = meth_GotoLabel_9654b8ee6d_equals(var215,var166);
+var217 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var217);
+var218 = 735LL;
+oomph_assert(var216,var217,var218);
+var219 = var1->memb_code;
+incref(var219);
+var220 = (struct class_Instruction_b0fafb4d55){ .val = { .item7 = var165 }, .membernum = 7 };
+var165 = NULL;
+meth_List_Instruction__6e475c861a_push(var219,var220);
+var221 = var168->memb_incr;
+incref(var221);
+var222 = 0LL;
+label223: (void)0;
+if (var222 >= var221->len) goto label225;
+decref_Statement_1dc2e7090f(var224); var224 = var221->data[var222++]; incref_Statement_1dc2e7090f(var224);
+meth_FunctionOrMethodConverter_14d05c56fc_do_statement(var1,var224);
+if (oomph_true) goto label223;
+label225: (void)0;
+var226 = var1->memb_code;
+incref(var226);
+var227 = string14_true_7fafb4b9ec; string_incref(var227);
+var228 = var163->memb_loop_header;
+incref_LoopHeader_23fd592271(var228);
+var229 = ast_91af7cbb25_locate_loop_header(var228);
+var230 = meth_FunctionOrMethodConverter_14d05c56fc_bool_constant(var1,var227,var229);
+var231 = ctor_GotoIf_feb019130f(var164,var230);
+var232 = (struct class_Instruction_b0fafb4d55){ .val = { .item6 = var231 }, .membernum = 6 };
+var231 = NULL;
+meth_List_Instruction__6e475c861a_push(var226,var232);
+var233 = var1->memb_code;
+incref(var233);
+var234 = (struct class_Instruction_b0fafb4d55){ .val = { .item7 = var166 }, .membernum = 7 };
+var166 = NULL;
+meth_List_Instruction__6e475c861a_push(var233,var234);
+var235 = var168->memb_init;
+incref(var235);
+var236 = meth_List_Statement__5d7503c104_length(var235);
+var237 = 1LL;
+var238 = meth_Int_equals(var236,var237);
+if (var238) goto label239;
+if (oomph_true) goto label240;
+label239: (void)0;
+var241 = var168->memb_init;
+incref(var241);
+var242 = meth_List_Statement__5d7503c104_first(var241);
+
+            var243 = (
+                var242.membernum == 4
+            );
+            if (var243) goto label244;
+
+            var243 = (
+                var242.membernum == 0
+            );
+            if (var243) goto label245;
+
+            var243 = (
+                var242.membernum == 1
+            );
+            if (var243) goto label245;
+
+            var243 = (
+                var242.membernum == 2
+            );
+            if (var243) goto label245;
+
+            var243 = (
+                var242.membernum == 3
+            );
+            if (var243) goto label245;
+
+            var243 = (
+                var242.membernum == 5
+            );
+            if (var243) goto label245;
+
+            var243 = (
+                var242.membernum == 6
+            );
+            if (var243) goto label245;
+
+            var243 = (
+                var242.membernum == 7
+            );
+            if (var243) goto label245;
+
+            var243 = (
+                var242.membernum == 8
+            );
+            if (var243) goto label245;
+
+            var243 = (
+                var242.membernum == 9
+            );
+            if (var243) goto label245;
+
+            var243 = (
+                var242.membernum == 10
+            );
+            if (var243) goto label245;
+label244: (void)0;
+
+            if (var242.membernum != 4)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var246 = var242.val.item4;
+            incref(var246);
+var247 = var1->memb_variables;
+incref(var247);
+var248 = ctor_List_Str__43b70c06cb();
+var249 = meth_List_NamedVariable__2ad9e9e312_length(var247);
+meth_List_Str__43b70c06cb___reserve(var248,var249);
+var250 = 0LL;
+label251: (void)0;
+if (var250 >= var247->len) goto label253;
+var252 = var247->data[var250++];
+string_decref(var254);
+var254.buf = NULL;
+var254 = var252->memb_name;
+string_incref(var254);
+meth_List_Str__43b70c06cb_push(var248,var254);
+if (oomph_true) goto label251;
+label253: (void)0;
+var255 = var246->memb_varname;
+string_incref(var255);
+var256 = meth_List_Str__43b70c06cb___contains(var248,var255);
+if (var256) goto label257;
+if (oomph_true) goto label258;
+label257: (void)0;
+var259 = var1->memb_variables;
+incref(var259);
+var260 = var246->memb_varname;
+string_incref(var260);
+var261 = meth_List_Str__43b70c06cb_find_only(var248,var260);
+var262 = meth_List_NamedVariable__2ad9e9e312_delete_at_index(var259,var261);
+label258: (void)0;
+if (oomph_true) goto label263;
+label245: (void)0;
+label263: (void)0;
+label240: (void)0;
+if (oomph_true) goto label18;
+label14: (void)0;
+
+            if (var2.membernum != 10)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var264 = var2.val.item10;
+            incref(var264);
+var265 = var264->memb_union_obj;
+incref_Expression_35f2052bf4(var265);
+var266 = meth_FunctionOrMethodConverter_14d05c56fc_do_expression(var1,var265);
+var267 = var266->memb_type;
+incref_Type_87e1ce5c5e(var267);
+
+            if (var267.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var268 = var267.val.item3;
+            incref(var268);
+var269 = var268->memb_type_members;
+incref(var269);
+var270 = meth_List_Type__057f9c6088_reversed(var269);
+var271 = meth_List_Type__057f9c6088_reversed(var270);
+var272 = meth_FunctionOrMethodConverter_14d05c56fc_create_goto_label(var1);
+var273 = var1->memb_builtins;
+var274 = var273->memb_BOOL;
+var273 = NULL;
+incref_Type_87e1ce5c5e(var274);
+var275 = var264->memb_location;
+incref(var275);
+var276 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var274,var275);
+var277 = ctor_List_Instruction__6e475c861a();
+var278 = var264->memb_cases;
+incref(var278);
+var279 = 0LL;
+label280: (void)0;
+if (var279 >= var278->len) goto label282;
+decref((var281), dtor_Case_458b8eeee1); var281 = var278->data[var279++]; incref(var281);
+decref((var283), dtor_GotoLabel_9654b8ee6d);
+var283 = NULL;
+var283 = meth_FunctionOrMethodConverter_14d05c56fc_create_goto_label(var1);
+decref_Instruction_b0fafb4d55(var284);
+var284.membernum = -1;
+var284 = (struct class_Instruction_b0fafb4d55){ .val = { .item7 = var283 }, .membernum = 7 };
+incref(var283);
+meth_List_Instruction__6e475c861a_push(var277,var284);
+decref__null___TypeAndName__d7958d7e85(var285);
+var285.membernum = -1;
+var285 = var281->memb_type_and_name;
+incref__null___TypeAndName__d7958d7e85(var285);
+var286 = oomph_null;
+decref__null___TypeAndName__d7958d7e85(var287);
+var287.membernum = -1;
+var287 = (struct class__null___TypeAndName__d7958d7e85){ .val = { .item0 = var286 }, .membernum = 0 };
+var288 = meth__null___TypeAndName__d7958d7e85_equals(var285,var287);
+if (var288) goto label289;
+decref__null___TypeAndName__d7958d7e85(var290);
+var290.membernum = -1;
+var290 = var281->memb_type_and_name;
+incref__null___TypeAndName__d7958d7e85(var290);
+decref((var291), dtor_TypeAndName_fec99b5f94);
+var291 = NULL;
+var291 = meth__null___TypeAndName__d7958d7e85_get(var290);
+string_decref(var292);
+var292.buf = NULL;
+var292 = var291->memb_name;
+string_incref(var292);
+decref__null___TypeAndName__d7958d7e85(var293);
+var293.membernum = -1;
+var293 = var281->memb_type_and_name;
+incref__null___TypeAndName__d7958d7e85(var293);
+decref((var294), dtor_TypeAndName_fec99b5f94);
+var294 = NULL;
+var294 = meth__null___TypeAndName__d7958d7e85_get(var293);
+decref_Type_e6cf7dd4e5(var295);
+var295.membernum = -1;
+var295 = var294->memb_type;
+incref_Type_e6cf7dd4e5(var295);
+decref_Type_87e1ce5c5e(var296);
+var296.membernum = -1;
+var296 = meth_FunctionOrMethodConverter_14d05c56fc_get_type(var1,var295);
+decref((var297), dtor_List_Type__057f9c6088);
+var297 = NULL;
+var297 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var297,var296);
+var298 = meth_List_Type__057f9c6088___contains(var271,var296);
+string_decref(var299);
+var299.buf = NULL;
+var299 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var299);
+var300 = 778LL;
+oomph_assert(var298,var299,var300);
+meth_List_Type__057f9c6088_delete_only(var271,var296);
+decref__null___TypeAndName__d7958d7e85(var301);
+var301.membernum = -1;
+var301 = var281->memb_type_and_name;
+incref__null___TypeAndName__d7958d7e85(var301);
+decref((var302), dtor_TypeAndName_fec99b5f94);
+var302 = NULL;
+var302 = meth__null___TypeAndName__d7958d7e85_get(var301);
+decref((var303), dtor_Location_500c4434c9);
+var303 = NULL;
+var303 = var302->memb_name_location;
+incref(var303);
+decref((var304), dtor_LocalVariable_846080e5ae);
+var304 = NULL;
+var304 = meth_FunctionOrMethodConverter_14d05c56fc_create_var(var1,var296,var303);
+decref((var305), dtor_List_NamedVariable__2ad9e9e312);
+var305 = NULL;
+var305 = var1->memb_variables;
+incref(var305);
+decref_Variable_1aaa81c8d2(var306);
+var306.membernum = -1;
+var306 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var304 }, .membernum = 2 };
+incref(var304);
+decref((var307), dtor_NamedVariable_ac0761c28d);
+var307 = NULL;
+var307 = ctor_NamedVariable_ac0761c28d(var292,var306);
+meth_List_NamedVariable__2ad9e9e312_push(var305,var307);
+var308 = ctor_GetFromUnion_b0861b839c(var304,var266);
+decref_Instruction_b0fafb4d55(var309);
+var309.membernum = -1;
+var309 = (struct class_Instruction_b0fafb4d55){ .val = { .item5 = var308 }, .membernum = 5 };
+var308 = NULL;
+meth_List_Instruction__6e475c861a_push(var277,var309);
+var310 = ctor_IncRef_54322428a7(var304);
+decref_Instruction_b0fafb4d55(var311);
+var311.membernum = -1;
+var311 = (struct class_Instruction_b0fafb4d55){ .val = { .item8 = var310 }, .membernum = 8 };
+var310 = NULL;
+meth_List_Instruction__6e475c861a_push(var277,var311);
+if (oomph_true) goto label312;
+label289: (void)0;
+decref((var313), dtor_List_Type__057f9c6088);
+var313 = NULL;
+var313 = ctor_List_Type__057f9c6088();
+var314 = meth_List_Type__057f9c6088_equals(var271,var313);
+var315 = oomph_bool_not(var314);
+string_decref(var316);
+var316.buf = NULL;
+var316 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var316);
+var317 = 771LL;
+oomph_assert(var315,var316,var317);
+var318 = ctor_List_Type__057f9c6088();
+decref((var271), dtor_List_Type__057f9c6088);
+var271 = var318;
+var318 = NULL;
+label312: (void)0;
+decref((var319), dtor_List_Statement__5d7503c104);
+var319 = NULL;
+var319 = var281->memb_body;
+incref(var319);
+decref((var320), dtor_List_Instruction__6e475c861a);
+var320 = NULL;
+var320 = meth_FunctionOrMethodConverter_14d05c56fc_do_block(var1,var319);
+meth_List_Instruction__6e475c861a_push_all(var277,var320);
+string_decref(var321);
+var321.buf = NULL;
+var321 = string14_true_7fafb4b9ec; string_incref(var321);
+decref((var322), dtor_Location_500c4434c9);
+var322 = NULL;
+var322 = var281->memb_location;
+incref(var322);
+decref((var323), dtor_LocalVariable_846080e5ae);
+var323 = NULL;
+var323 = meth_FunctionOrMethodConverter_14d05c56fc_bool_constant(var1,var321,var322);
+var324 = ctor_GotoIf_feb019130f(var272,var323);
+decref_Instruction_b0fafb4d55(var325);
+var325.membernum = -1;
+var325 = (struct class_Instruction_b0fafb4d55){ .val = { .item6 = var324 }, .membernum = 6 };
+var324 = NULL;
+meth_List_Instruction__6e475c861a_push(var277,var325);
+decref__null___TypeAndName__d7958d7e85(var326);
+var326.membernum = -1;
+var326 = var281->memb_type_and_name;
+incref__null___TypeAndName__d7958d7e85(var326);
+var327 = oomph_null;
+decref__null___TypeAndName__d7958d7e85(var328);
+var328.membernum = -1;
+var328 = (struct class__null___TypeAndName__d7958d7e85){ .val = { .item0 = var327 }, .membernum = 0 };
+var329 = meth__null___TypeAndName__d7958d7e85_equals(var326,var328);
+var330 = oomph_bool_not(var329);
+if (var330) goto label331;
+if (oomph_true) goto label332;
+label331: (void)0;
+var333 = oomph_null;
+decref_Variable_1aaa81c8d2(var334);
+var334.membernum = -1;
+decref__null___Location__87aaae6467(var335);
+var335.membernum = -1;
+var335 = (struct class__null___Location__87aaae6467){ .val = { .item0 = var333 }, .membernum = 0 };
+var334 = meth_FunctionOrMethodConverter_14d05c56fc_get_var(var1,var292,var335);
+decref_Variable_1aaa81c8d2(var336);
+var336.membernum = -1;
+var336 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var304 }, .membernum = 2 };
+incref(var304);
+var337 = meth_Variable_1aaa81c8d2_equals(var334,var336);
+string_decref(var338);
+var338.buf = NULL;
+var338 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var338);
+var339 = 793LL;
+oomph_assert(var337,var338,var339);
+var340 = 0LL;
+label341: (void)0;
+decref((var342), dtor_List_NamedVariable__2ad9e9e312);
+var342 = NULL;
+var342 = var1->memb_variables;
+incref(var342);
+decref((var343), dtor_NamedVariable_ac0761c28d);
+var343 = NULL;
+var343 = meth_List_NamedVariable__2ad9e9e312_get(var342,var340);
+string_decref(var344);
+var344.buf = NULL;
+var344 = var343->memb_name;
+string_incref(var344);
+var345 = meth_Str_equals(var344,var292);
+if (var345) goto label346;
+var347 = oomph_false;
+if (oomph_true) goto label348;
+label346: (void)0;
+decref((var349), dtor_List_NamedVariable__2ad9e9e312);
+var349 = NULL;
+var349 = var1->memb_variables;
+incref(var349);
+decref((var350), dtor_NamedVariable_ac0761c28d);
+var350 = NULL;
+var350 = meth_List_NamedVariable__2ad9e9e312_get(var349,var340);
+decref_Variable_1aaa81c8d2(var351);
+var351.membernum = -1;
+var351 = var350->memb_var;
+incref_Variable_1aaa81c8d2(var351);
+decref_Variable_1aaa81c8d2(var352);
+var352.membernum = -1;
+var352 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var304 }, .membernum = 2 };
+incref(var304);
+var353 = meth_Variable_1aaa81c8d2_equals(var351,var352);
+var347 = var353;
+label348: (void)0;
+if (var347) goto label354;
+if (oomph_true) goto label355;
+label354: (void)0;
+decref((var356), dtor_List_NamedVariable__2ad9e9e312);
+var356 = NULL;
+var356 = var1->memb_variables;
+incref(var356);
+decref((var357), dtor_NamedVariable_ac0761c28d);
+var357 = NULL;
+var357 = meth_List_NamedVariable__2ad9e9e312_delete_at_index(var356,var340);
+if (oomph_true) goto label358;
+label355: (void)0;
+var359 = 1LL;
+var360 = oomph_int_add(var340,var359);
+var340 = var360;
+if (oomph_true) goto label341;
+label358: (void)0;
+label332: (void)0;
+var361 = 0LL;
+label362: (void)0;
+if (var361 >= var297->len) goto label364;
+var363 = var297->data[var361++];
+decref((var365), dtor_List_Instruction__6e475c861a);
+var365 = NULL;
+var365 = var1->memb_code;
+incref(var365);
+var366 = ctor_UnionMemberCheck_7021628c40(var276,var266,var363);
+decref_Instruction_b0fafb4d55(var367);
+var367.membernum = -1;
+var367 = (struct class_Instruction_b0fafb4d55){ .val = { .item17 = var366 }, .membernum = 17 };
+var366 = NULL;
+meth_List_Instruction__6e475c861a_push(var365,var367);
+decref((var368), dtor_List_Instruction__6e475c861a);
+var368 = NULL;
+var368 = var1->memb_code;
+incref(var368);
+var369 = ctor_GotoIf_feb019130f(var283,var276);
+decref_Instruction_b0fafb4d55(var370);
+var370.membernum = -1;
+var370 = (struct class_Instruction_b0fafb4d55){ .val = { .item6 = var369 }, .membernum = 6 };
+var369 = NULL;
+meth_List_Instruction__6e475c861a_push(var368,var370);
+if (oomph_true) goto label362;
+label364: (void)0;
+if (oomph_true) goto label280;
+label282: (void)0;
+var371 = ctor_List_Type__057f9c6088();
+var372 = meth_List_Type__057f9c6088_equals(var271,var371);
+var373 = oomph_bool_not(var372);
+if (var373) goto label374;
+if (oomph_true) goto label375;
+label374: (void)0;
+var376 = string51_switch_does_not_handle___67316f82fc; string_incref(var376);
+var377 = meth_List_Type__057f9c6088_to_string(var271);
+var378 = oomph_string_concat(var376,var377);
+oomph_print(var378);
+var379 = oomph_false;
+var380 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var380);
+var381 = 806LL;
+oomph_assert(var379,var380,var381);
+label375: (void)0;
+var382 = var1->memb_code;
+incref(var382);
+meth_List_Instruction__6e475c861a_push_all(var382,var277);
+var383 = var1->memb_code;
+incref(var383);
+var384 = (struct class_Instruction_b0fafb4d55){ .val = { .item7 = var272 }, .membernum = 7 };
+var272 = NULL;
+meth_List_Instruction__6e475c861a_push(var383,var384);
+label18: (void)0;
+out: (void)0;
+decref_Instruction_b0fafb4d55(var384);
+decref((var383), dtor_List_Instruction__6e475c861a);
+decref((var382), dtor_List_Instruction__6e475c861a);
+(void)0;
+string_decref(var380);
+(void)0;
+string_decref(var378);
+string_decref(var377);
+string_decref(var376);
+(void)0;
+(void)0;
+decref((var371), dtor_List_Type__057f9c6088);
+decref_Instruction_b0fafb4d55(var370);
+decref((var369), dtor_GotoIf_feb019130f);
+decref((var368), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var367);
+decref((var366), dtor_UnionMemberCheck_7021628c40);
+decref((var365), dtor_List_Instruction__6e475c861a);
+(void)0;
+(void)0;
+(void)0;
+decref((var357), dtor_NamedVariable_ac0761c28d);
+decref((var356), dtor_List_NamedVariable__2ad9e9e312);
+(void)0;
+decref_Variable_1aaa81c8d2(var352);
+decref_Variable_1aaa81c8d2(var351);
+decref((var350), dtor_NamedVariable_ac0761c28d);
+decref((var349), dtor_List_NamedVariable__2ad9e9e312);
+(void)0;
+(void)0;
+string_decref(var344);
+decref((var343), dtor_NamedVariable_ac0761c28d);
+decref((var342), dtor_List_NamedVariable__2ad9e9e312);
+(void)0;
+(void)0;
+string_decref(var338);
+(void)0;
+decref_Variable_1aaa81c8d2(var336);
+decref__null___Location__87aaae6467(var335);
+decref_Variable_1aaa81c8d2(var334);
+(void)0;
+(void)0;
+(void)0;
+decref__null___TypeAndName__d7958d7e85(var328);
+(void)0;
+decref__null___TypeAndName__d7958d7e85(var326);
+decref_Instruction_b0fafb4d55(var325);
+decref((var324), dtor_GotoIf_feb019130f);
+decref((var323), dtor_LocalVariable_846080e5ae);
+decref((var322), dtor_Location_500c4434c9);
+string_decref(var321);
+decref((var320), dtor_List_Instruction__6e475c861a);
+decref((var319), dtor_List_Statement__5d7503c104);
+decref((var318), dtor_List_Type__057f9c6088);
+(void)0;
+string_decref(var316);
+(void)0;
+(void)0;
+decref((var313), dtor_List_Type__057f9c6088);
+decref_Instruction_b0fafb4d55(var311);
+decref((var310), dtor_IncRef_54322428a7);
+decref_Instruction_b0fafb4d55(var309);
+decref((var308), dtor_GetFromUnion_b0861b839c);
+decref((var307), dtor_NamedVariable_ac0761c28d);
+decref_Variable_1aaa81c8d2(var306);
+decref((var305), dtor_List_NamedVariable__2ad9e9e312);
+decref((var304), dtor_LocalVariable_846080e5ae);
+decref((var303), dtor_Location_500c4434c9);
+decref((var302), dtor_TypeAndName_fec99b5f94);
+decref__null___TypeAndName__d7958d7e85(var301);
+(void)0;
+string_decref(var299);
+(void)0;
+decref((var297), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var296);
+decref_Type_e6cf7dd4e5(var295);
+decref((var294), dtor_TypeAndName_fec99b5f94);
+decref__null___TypeAndName__d7958d7e85(var293);
+string_decref(var292);
+decref((var291), dtor_TypeAndName_fec99b5f94);
+decref__null___TypeAndName__d7958d7e85(var290);
+(void)0;
+decref__null___TypeAndName__d7958d7e85(var287);
+(void)0;
+decref__null___TypeAndName__d7958d7e85(var285);
+decref_Instruction_b0fafb4d55(var284);
+decref((var283), dtor_GotoLabel_9654b8ee6d);
+decref((var281), dtor_Case_458b8eeee1);
+(void)0;
+decref((var278), dtor_List_Case__f5a6b4b2ec);
+decref((var277), dtor_List_Instruction__6e475c861a);
+decref((var276), dtor_LocalVariable_846080e5ae);
+decref((var275), dtor_Location_500c4434c9);
+decref_Type_87e1ce5c5e(var274);
+decref((var273), dtor_Builtins_bd980a9f08);
+decref((var272), dtor_GotoLabel_9654b8ee6d);
+decref((var271), dtor_List_Type__057f9c6088);
+decref((var270), dtor_List_Type__057f9c6088);
+decref((var269), dtor_List_Type__057f9c6088);
+decref((var268), dtor_UnionType_7f899bced1);
+decref_Type_87e1ce5c5e(var267);
+decref((var266), dtor_LocalVariable_846080e5ae);
+decref_Expression_35f2052bf4(var265);
+decref((var264), dtor_Switch_9b8c881aeb);
+decref((var262), dtor_NamedVariable_ac0761c28d);
+(void)0;
+string_decref(var260);
+decref((var259), dtor_List_NamedVariable__2ad9e9e312);
+(void)0;
+string_decref(var255);
+string_decref(var254);
+(void)0;
+(void)0;
+decref((var248), dtor_List_Str__43b70c06cb);
+decref((var247), dtor_List_NamedVariable__2ad9e9e312);
+decref((var246), dtor_Let_c9da3e3372);
+(void)0;
+decref_Statement_1dc2e7090f(var242);
+decref((var241), dtor_List_Statement__5d7503c104);
+(void)0;
+(void)0;
+(void)0;
+decref((var235), dtor_List_Statement__5d7503c104);
+decref_Instruction_b0fafb4d55(var234);
+decref((var233), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var232);
+decref((var231), dtor_GotoIf_feb019130f);
+decref((var230), dtor_LocalVariable_846080e5ae);
+decref((var229), dtor_Location_500c4434c9);
+decref_LoopHeader_23fd592271(var228);
+string_decref(var227);
+decref((var226), dtor_List_Instruction__6e475c861a);
+decref_Statement_1dc2e7090f(var224);
+(void)0;
+decref((var221), dtor_List_Statement__5d7503c104);
+decref_Instruction_b0fafb4d55(var220);
+decref((var219), dtor_List_Instruction__6e475c861a);
+(void)0;
+string_decref(var217);
+(void)0;
+decref((var215), dtor_GotoLabel_9654b8ee6d);
+(void)0;
+string_decref(var213);
+(void)0;
+decref((var211), dtor_GotoLabel_9654b8ee6d);
+decref((var210), dtor_LoopLabels_8e8d3917a5);
+decref((var209), dtor_List_LoopLabels__74a48e6cc9);
+decref((var208), dtor_List_Instruction__6e475c861a);
+decref((var207), dtor_List_Statement__5d7503c104);
+decref((var206), dtor_List_Instruction__6e475c861a);
+decref((var205), dtor_LoopLabels_8e8d3917a5);
+decref((var204), dtor_List_LoopLabels__74a48e6cc9);
+decref_Instruction_b0fafb4d55(var203);
+decref((var202), dtor_GotoIf_feb019130f);
+decref((var201), dtor_LocalVariable_846080e5ae);
+decref((var200), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var199);
+decref((var198), dtor_VarCpy_e77a538911);
+decref_Variable_1aaa81c8d2(var197);
+decref((var196), dtor_BuiltinVariable_f6e0cdd1b6);
+string_decref(var195);
+decref((var194), dtor_Builtins_bd980a9f08);
+decref((var193), dtor_List_Instruction__6e475c861a);
+decref((var192), dtor_Location_500c4434c9);
+decref_Expression_35f2052bf4(var191);
+decref__null___Expression__957e7d6409(var190);
+decref_Type_87e1ce5c5e(var189);
+decref((var188), dtor_Builtins_bd980a9f08);
+decref((var186), dtor_LocalVariable_846080e5ae);
+decref((var185), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var184);
+decref((var183), dtor_Builtins_bd980a9f08);
+decref_Expression_35f2052bf4(var182);
+decref__null___Expression__957e7d6409(var181);
+(void)0;
+decref__null___Expression__957e7d6409(var178);
+(void)0;
+decref__null___Expression__957e7d6409(var176);
+decref_Instruction_b0fafb4d55(var175);
+decref((var174), dtor_List_Instruction__6e475c861a);
+decref_Statement_1dc2e7090f(var172);
+(void)0;
+decref((var169), dtor_List_Statement__5d7503c104);
+decref((var168), dtor_ForLoopHeader_79606b2adb);
+decref_LoopHeader_23fd592271(var167);
+decref((var166), dtor_GotoLabel_9654b8ee6d);
+decref((var165), dtor_GotoLabel_9654b8ee6d);
+decref((var164), dtor_GotoLabel_9654b8ee6d);
+decref((var163), dtor_Loop_80080d5f12);
+decref((var162), dtor_List_Statement__5d7503c104);
+decref_Statement_1dc2e7090f(var161);
+decref((var160), dtor_If_8811dba942);
+decref((var159), dtor_List_Statement__5d7503c104);
+decref((var158), dtor_List_ConditionAndBody__ad79dde1db);
+(void)0;
+decref((var156), dtor_List_ConditionAndBody__ad79dde1db);
+(void)0;
+decref((var154), dtor_List_ConditionAndBody__ad79dde1db);
+decref((var152), dtor_List_Instruction__6e475c861a);
+decref((var151), dtor_List_Instruction__6e475c861a);
+decref((var150), dtor_List_Statement__5d7503c104);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var144), dtor_List_ConditionAndBody__ad79dde1db);
+decref((var143), dtor_List_Instruction__6e475c861a);
+decref((var142), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var141);
+decref((var140), dtor_Builtins_bd980a9f08);
+decref((var139), dtor_List_Statement__5d7503c104);
+decref((var138), dtor_ConditionAndBody_0e2f888e06);
+decref((var137), dtor_List_ConditionAndBody__ad79dde1db);
+decref_Expression_35f2052bf4(var136);
+decref((var135), dtor_ConditionAndBody_0e2f888e06);
+decref((var134), dtor_List_ConditionAndBody__ad79dde1db);
+decref((var133), dtor_If_8811dba942);
+decref_Instruction_b0fafb4d55(var132);
+decref((var131), dtor_Return_aa2d9b1c64);
+decref__null___LocalVariable__494c1a2e12(var130);
+(void)0;
+decref((var128), dtor_List_Instruction__6e475c861a);
+(void)0;
+string_decref(var126);
+(void)0;
+decref__null___Expression__957e7d6409(var124);
+(void)0;
+decref__null___Expression__957e7d6409(var122);
+decref_Instruction_b0fafb4d55(var120);
+decref((var119), dtor_Return_aa2d9b1c64);
+decref__null___LocalVariable__494c1a2e12(var118);
+decref((var117), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var116);
+decref__null___Type__8438ac3dcf(var115);
+decref_Expression_35f2052bf4(var114);
+decref__null___Expression__957e7d6409(var113);
+decref((var112), dtor_List_Instruction__6e475c861a);
+(void)0;
+decref__null___Type__8438ac3dcf(var109);
+(void)0;
+decref__null___Type__8438ac3dcf(var107);
+decref((var106), dtor_Return_33802009cd);
+decref_Instruction_b0fafb4d55(var105);
+decref((var104), dtor_GotoIf_feb019130f);
+decref((var103), dtor_LocalVariable_846080e5ae);
+decref((var102), dtor_Location_500c4434c9);
+string_decref(var101);
+decref((var100), dtor_List_Instruction__6e475c861a);
+decref((var99), dtor_GotoLabel_9654b8ee6d);
+decref((var98), dtor_LoopLabels_8e8d3917a5);
+decref((var97), dtor_List_LoopLabels__74a48e6cc9);
+decref((var96), dtor_Break_2f9897f5fd);
+decref_Instruction_b0fafb4d55(var95);
+decref((var94), dtor_GotoIf_feb019130f);
+decref((var93), dtor_LocalVariable_846080e5ae);
+decref((var92), dtor_Location_500c4434c9);
+string_decref(var91);
+decref((var90), dtor_List_Instruction__6e475c861a);
+decref((var89), dtor_GotoLabel_9654b8ee6d);
+decref((var88), dtor_LoopLabels_8e8d3917a5);
+decref((var87), dtor_List_LoopLabels__74a48e6cc9);
+decref((var86), dtor_Continue_b54f3b332e);
+decref((var85), dtor_Pass_e49950b77e);
+decref_Instruction_b0fafb4d55(var84);
+decref((var83), dtor_IncRef_54322428a7);
+decref((var82), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var81);
+decref((var80), dtor_SetAttribute_25344a82b6);
+string_decref(var79);
+decref((var78), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var77);
+decref((var76), dtor_GetAttribute_3d0cc1bf97);
+string_decref(var75);
+decref((var74), dtor_List_Instruction__6e475c861a);
+decref((var73), dtor_LocalVariable_846080e5ae);
+decref((var72), dtor_Location_500c4434c9);
+decref_Type_87e1ce5c5e(var71);
+(void)0;
+string_decref(var69);
+(void)0;
+decref_Type_87e1ce5c5e(var67);
+decref_Type_87e1ce5c5e(var66);
+string_decref(var65);
+decref_Type_87e1ce5c5e(var64);
+decref((var63), dtor_LocalVariable_846080e5ae);
+decref_Expression_35f2052bf4(var62);
+decref((var61), dtor_LocalVariable_846080e5ae);
+decref_Expression_35f2052bf4(var60);
+decref((var59), dtor_SetAttribute_6bd58fd9d3);
+decref_Instruction_b0fafb4d55(var58);
+decref((var57), dtor_IncRef_54322428a7);
+decref((var56), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var55);
+decref((var54), dtor_VarCpy_e77a538911);
+decref_Variable_1aaa81c8d2(var53);
+decref((var52), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var51);
+decref((var50), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var49);
+decref((var48), dtor_DecRef_f37e9a69d2);
+decref((var47), dtor_List_Instruction__6e475c861a);
+decref((var46), dtor_LocalVariable_846080e5ae);
+decref_Expression_35f2052bf4(var45);
+decref((var44), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var43);
+decref__null___Location__87aaae6467(var42);
+decref((var41), dtor_Location_500c4434c9);
+string_decref(var40);
+decref((var39), dtor_SetVar_6a19c6f350);
+decref((var38), dtor_List_NamedVariable__2ad9e9e312);
+(void)0;
+(void)0;
+string_decref(var33);
+string_decref(var32);
+(void)0;
+decref((var27), dtor_List_NamedVariable__2ad9e9e312);
+decref((var26), dtor_List_NamedVariable__2ad9e9e312);
+decref((var25), dtor_NamedVariable_ac0761c28d);
+decref_Variable_1aaa81c8d2(var24);
+decref((var23), dtor_LocalVariable_846080e5ae);
+decref_Expression_35f2052bf4(var22);
+string_decref(var21);
+decref((var20), dtor_List_NamedVariable__2ad9e9e312);
+decref((var19), dtor_Let_c9da3e3372);
+decref__null___LocalVariable__494c1a2e12(var17);
+(void)0;
+decref((var15), dtor_Call_d0fb9d6234);
+(void)0;
+}struct class_List_Instruction__6e475c861a* meth_FunctionOrMethodConverter_14d05c56fc_do_block(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_List_Statement__5d7503c104* var2){int64_t var3;
+struct class_Statement_1dc2e7090f var5;
+var5.membernum = -1;
+struct class_List_Instruction__6e475c861a* var7;
+var7 = NULL;
+struct class_List_Instruction__6e475c861a* retval;
+meth_FunctionOrMethodConverter_14d05c56fc_push_code(var1);
+var3 = 0LL;
+label4: (void)0;
+if (var3 >= var2->len) goto label6;
+decref_Statement_1dc2e7090f(var5); var5 = var2->data[var3++]; incref_Statement_1dc2e7090f(var5);
+meth_FunctionOrMethodConverter_14d05c56fc_do_statement(var1,var5);
+if (oomph_true) goto label4;
+label6: (void)0;
+var7 = meth_FunctionOrMethodConverter_14d05c56fc_pop_code(var1);
+retval = var7; var7 = NULL;
+goto out;
+out: (void)0;
+decref((var7), dtor_List_Instruction__6e475c861a);
+decref_Statement_1dc2e7090f(var5);
+(void)0;
+return retval;
+}void meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Variable_1aaa81c8d2 var2){bool var3;
+struct class_LocalVariable_846080e5ae* var6;
+var6 = NULL;
+struct class_Type_87e1ce5c5e var7;
+var7.membernum = -1;
+bool var8;
+struct class_Type_87e1ce5c5e var9;
+var9.membernum = -1;
+struct class_Type_87e1ce5c5e var10;
+var10.membernum = -1;
+
+            var3 = (
+                var2.membernum == 2
+            );
+            if (var3) goto label4;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) goto label5;
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) goto label5;
+label4: (void)0;
+
+            if (var2.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var6 = var2.val.item2;
+            incref(var6);
+var7 = var6->memb_type;
+incref_Type_87e1ce5c5e(var7);
+var8 = oomph_true;
+var9 = meth_FunctionOrMethodConverter_14d05c56fc_substitute_autotypes(var1,var7,var8);
+var10 = var6->memb_type;
+var6->memb_type = var9;
+var9.membernum = -1;
+if (oomph_true) goto label11;
+label5: (void)0;
+label11: (void)0;
+out: (void)0;
+decref_Type_87e1ce5c5e(var10);
+decref_Type_87e1ce5c5e(var9);
+(void)0;
+decref_Type_87e1ce5c5e(var7);
+decref((var6), dtor_LocalVariable_846080e5ae);
+(void)0;
+}void meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_everywhere(struct class_FunctionOrMethodConverter_14d05c56fc* var1){struct class_List_Instruction__6e475c861a* var2;
+var2 = NULL;
+struct class_List_Instruction__6e475c861a* var3;
+var3 = NULL;
+int64_t var4;
+struct class_Instruction_b0fafb4d55 var6;
+var6.membernum = -1;
+struct class_MethodCall_b0095be49c* var8;
+var8 = NULL;
+bool var9;
+struct class_GetAttribute_3d0cc1bf97* var11;
+var11 = NULL;
+struct class_LocalVariable_846080e5ae* var14;
+var14 = NULL;
+struct class_Variable_1aaa81c8d2 var15;
+var15.membernum = -1;
+struct class_LocalVariable_846080e5ae* var16;
+var16 = NULL;
+struct class_Type_87e1ce5c5e var17;
+var17.membernum = -1;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_FunctionType_4e16d0ea53* var19;
+var19 = NULL;
+struct class_List_LocalVariable__81e23234f3* var20;
+var20 = NULL;
+struct class_List_Type__057f9c6088* var21;
+var21 = NULL;
+int64_t var22;
+struct class_List_Type__057f9c6088* var23;
+var23 = NULL;
+int64_t var24;
+struct class_List_Type__057f9c6088* var25;
+var25 = NULL;
+struct class_Location_500c4434c9* var26;
+var26 = NULL;
+struct class_List_LocalVariable__81e23234f3* var27;
+var27 = NULL;
+struct class_List_LocalVariable__81e23234f3* var28;
+var28 = NULL;
+struct class_List_Instruction__6e475c861a* var29;
+var29 = NULL;
+struct class__null___Type__8438ac3dcf var30;
+var30.membernum = -1;
+char var31;
+struct class__null___Type__8438ac3dcf var32;
+var32.membernum = -1;
+bool var33;
+struct class__null___LocalVariable__494c1a2e12 var35;
+var35.membernum = -1;
+char var36;
+struct class__null___LocalVariable__494c1a2e12 var37;
+var37.membernum = -1;
+bool var38;
+bool var39;
+struct class__null___LocalVariable__494c1a2e12 var42;
+var42.membernum = -1;
+struct class_LocalVariable_846080e5ae* var43;
+var43 = NULL;
+struct class_Type_87e1ce5c5e var44;
+var44.membernum = -1;
+struct class_AutoType_33a5d572cb* var45;
+var45 = NULL;
+bool var46;
+struct class__null___Type__8438ac3dcf var49;
+var49.membernum = -1;
+struct class_Type_87e1ce5c5e var50;
+var50.membernum = -1;
+struct class__null___LocalVariable__494c1a2e12 var52;
+var52.membernum = -1;
+struct class_LocalVariable_846080e5ae* var53;
+var53 = NULL;
+struct class_Variable_1aaa81c8d2 var54;
+var54.membernum = -1;
+struct class__null___LocalVariable__494c1a2e12 var56;
+var56.membernum = -1;
+char var57;
+struct class__null___LocalVariable__494c1a2e12 var58;
+var58.membernum = -1;
+bool var59;
+struct class_Str var60;
+var60.buf = NULL;
+int64_t var61;
+struct class_List_LocalVariable__81e23234f3* var62;
+var62 = NULL;
+int64_t var63;
+struct class_LocalVariable_846080e5ae* var65;
+var65 = NULL;
+struct class_Variable_1aaa81c8d2 var67;
+var67.membernum = -1;
+struct class_LocalVariable_846080e5ae* var69;
+var69 = NULL;
+struct class_Variable_1aaa81c8d2 var70;
+var70.membernum = -1;
+struct class_LocalVariable_846080e5ae* var71;
+var71 = NULL;
+struct class_Type_87e1ce5c5e var72;
+var72.membernum = -1;
+struct class_AutoType_33a5d572cb* var73;
+var73 = NULL;
+bool var74;
+struct class_LocalVariable_846080e5ae* var77;
+var77 = NULL;
+struct class_Type_87e1ce5c5e var78;
+var78.membernum = -1;
+struct class_Str var79;
+var79.buf = NULL;
+struct class_Type_87e1ce5c5e var80;
+var80.membernum = -1;
+struct class_LocalVariable_846080e5ae* var82;
+var82 = NULL;
+struct class_Variable_1aaa81c8d2 var83;
+var83.membernum = -1;
+struct class_List_Instruction__6e475c861a* var84;
+var84 = NULL;
+struct class_List_Instruction__6e475c861a* var85;
+var85 = NULL;
+int64_t var86;
+struct class_Instruction_b0fafb4d55 var88;
+var88.membernum = -1;
+struct class_IncRef_54322428a7* var90;
+var90 = NULL;
+bool var91;
+struct class_DecRef_f37e9a69d2* var93;
+var93 = NULL;
+struct class_UnSet_a1ce71f609* var95;
+var95 = NULL;
+struct class_IntConstant_817d6312f0* var97;
+var97 = NULL;
+struct class_FloatConstant_652a176e04* var99;
+var99 = NULL;
+struct class_StringConstant_e1466967c8* var101;
+var101 = NULL;
+struct class_MethodCall_b0095be49c* var103;
+var103 = NULL;
+struct class_ConstructorCall_f8e441a21d* var105;
+var105 = NULL;
+struct class_FunctionCall_104f394575* var107;
+var107 = NULL;
+struct class_VarCpy_e77a538911* var109;
+var109 = NULL;
+struct class_GotoIf_feb019130f* var111;
+var111 = NULL;
+struct class_Return_aa2d9b1c64* var113;
+var113 = NULL;
+struct class_InstantiateUnion_29af05529f* var115;
+var115 = NULL;
+struct class_GetAttribute_3d0cc1bf97* var117;
+var117 = NULL;
+struct class_SetAttribute_25344a82b6* var119;
+var119 = NULL;
+struct class_GetFromUnion_b0861b839c* var121;
+var121 = NULL;
+struct class_UnionMemberCheck_7021628c40* var123;
+var123 = NULL;
+struct class_PointersEqual_deb0abf3fc* var125;
+var125 = NULL;
+struct class_GotoLabel_9654b8ee6d* var127;
+var127 = NULL;
+struct class_LocalVariable_846080e5ae* var129;
+var129 = NULL;
+struct class_Variable_1aaa81c8d2 var130;
+var130.membernum = -1;
+struct class_LocalVariable_846080e5ae* var132;
+var132 = NULL;
+struct class_Variable_1aaa81c8d2 var133;
+var133.membernum = -1;
+struct class_LocalVariable_846080e5ae* var134;
+var134 = NULL;
+struct class_Variable_1aaa81c8d2 var135;
+var135.membernum = -1;
+struct class_LocalVariable_846080e5ae* var136;
+var136 = NULL;
+struct class_Variable_1aaa81c8d2 var137;
+var137.membernum = -1;
+struct class_LocalVariable_846080e5ae* var138;
+var138 = NULL;
+struct class_Variable_1aaa81c8d2 var139;
+var139.membernum = -1;
+struct class_LocalVariable_846080e5ae* var140;
+var140 = NULL;
+struct class_Variable_1aaa81c8d2 var141;
+var141.membernum = -1;
+struct class_LocalVariable_846080e5ae* var142;
+var142 = NULL;
+struct class_Variable_1aaa81c8d2 var143;
+var143.membernum = -1;
+struct class_List_LocalVariable__81e23234f3* var144;
+var144 = NULL;
+int64_t var145;
+struct class_LocalVariable_846080e5ae* var147;
+var147 = NULL;
+struct class_Variable_1aaa81c8d2 var149;
+var149.membernum = -1;
+struct class__null___LocalVariable__494c1a2e12 var150;
+var150.membernum = -1;
+char var151;
+struct class__null___LocalVariable__494c1a2e12 var152;
+var152.membernum = -1;
+bool var153;
+bool var154;
+struct class__null___LocalVariable__494c1a2e12 var157;
+var157.membernum = -1;
+struct class_LocalVariable_846080e5ae* var158;
+var158 = NULL;
+struct class_Variable_1aaa81c8d2 var159;
+var159.membernum = -1;
+struct class_Variable_1aaa81c8d2 var160;
+var160.membernum = -1;
+struct class_List_LocalVariable__81e23234f3* var161;
+var161 = NULL;
+int64_t var162;
+struct class_LocalVariable_846080e5ae* var164;
+var164 = NULL;
+struct class_Variable_1aaa81c8d2 var166;
+var166.membernum = -1;
+struct class_LocalVariable_846080e5ae* var167;
+var167 = NULL;
+struct class_Variable_1aaa81c8d2 var168;
+var168.membernum = -1;
+struct class_Variable_1aaa81c8d2 var169;
+var169.membernum = -1;
+struct class_LocalVariable_846080e5ae* var170;
+var170 = NULL;
+struct class_Variable_1aaa81c8d2 var171;
+var171.membernum = -1;
+struct class__null___LocalVariable__494c1a2e12 var172;
+var172.membernum = -1;
+char var173;
+struct class__null___LocalVariable__494c1a2e12 var174;
+var174.membernum = -1;
+bool var175;
+bool var176;
+struct class__null___LocalVariable__494c1a2e12 var179;
+var179.membernum = -1;
+struct class_LocalVariable_846080e5ae* var180;
+var180 = NULL;
+struct class_Variable_1aaa81c8d2 var181;
+var181.membernum = -1;
+struct class_LocalVariable_846080e5ae* var182;
+var182 = NULL;
+struct class_Variable_1aaa81c8d2 var183;
+var183.membernum = -1;
+struct class_LocalVariable_846080e5ae* var184;
+var184 = NULL;
+struct class_Variable_1aaa81c8d2 var185;
+var185.membernum = -1;
+struct class_LocalVariable_846080e5ae* var186;
+var186 = NULL;
+struct class_Variable_1aaa81c8d2 var187;
+var187.membernum = -1;
+struct class_LocalVariable_846080e5ae* var188;
+var188 = NULL;
+struct class_Variable_1aaa81c8d2 var189;
+var189.membernum = -1;
+struct class_LocalVariable_846080e5ae* var190;
+var190 = NULL;
+struct class_Variable_1aaa81c8d2 var191;
+var191.membernum = -1;
+struct class_LocalVariable_846080e5ae* var192;
+var192 = NULL;
+struct class_Variable_1aaa81c8d2 var193;
+var193.membernum = -1;
+struct class_LocalVariable_846080e5ae* var194;
+var194 = NULL;
+struct class_Variable_1aaa81c8d2 var195;
+var195.membernum = -1;
+struct class_LocalVariable_846080e5ae* var196;
+var196 = NULL;
+struct class_Variable_1aaa81c8d2 var197;
+var197.membernum = -1;
+struct class_LocalVariable_846080e5ae* var198;
+var198 = NULL;
+struct class_Variable_1aaa81c8d2 var199;
+var199.membernum = -1;
+struct class_LocalVariable_846080e5ae* var200;
+var200 = NULL;
+struct class_Variable_1aaa81c8d2 var201;
+var201.membernum = -1;
+struct class_LocalVariable_846080e5ae* var202;
+var202 = NULL;
+struct class_Variable_1aaa81c8d2 var203;
+var203.membernum = -1;
+struct class_LocalVariable_846080e5ae* var204;
+var204 = NULL;
+struct class_Variable_1aaa81c8d2 var205;
+var205.membernum = -1;
+struct class_LocalVariable_846080e5ae* var206;
+var206 = NULL;
+struct class_Variable_1aaa81c8d2 var207;
+var207.membernum = -1;
+var2 = ctor_List_Instruction__6e475c861a();
+var3 = var1->memb_code;
+incref(var3);
+var4 = 0LL;
+label5: (void)0;
+if (var4 >= var3->len) goto label7;
+decref_Instruction_b0fafb4d55(var6); var6 = var3->data[var4++]; incref_Instruction_b0fafb4d55(var6);
+decref((var8), dtor_MethodCall_b0095be49c);
+var8 = NULL;
+
+            var9 = (
+                var6.membernum == 11
+            );
+            if (var9) goto label10;
+decref((var11), dtor_GetAttribute_3d0cc1bf97);
+var11 = NULL;
+
+            var9 = (
+                var6.membernum == 4
+            );
+            if (var9) goto label12;
+
+            var9 = (
+                var6.membernum == 0
+            );
+            if (var9) goto label13;
+
+            var9 = (
+                var6.membernum == 1
+            );
+            if (var9) goto label13;
+
+            var9 = (
+                var6.membernum == 2
+            );
+            if (var9) goto label13;
+
+            var9 = (
+                var6.membernum == 3
+            );
+            if (var9) goto label13;
+
+            var9 = (
+                var6.membernum == 5
+            );
+            if (var9) goto label13;
+
+            var9 = (
+                var6.membernum == 6
+            );
+            if (var9) goto label13;
+
+            var9 = (
+                var6.membernum == 7
+            );
+            if (var9) goto label13;
+
+            var9 = (
+                var6.membernum == 8
+            );
+            if (var9) goto label13;
+
+            var9 = (
+                var6.membernum == 9
+            );
+            if (var9) goto label13;
+
+            var9 = (
+                var6.membernum == 10
+            );
+            if (var9) goto label13;
+
+            var9 = (
+                var6.membernum == 12
+            );
+            if (var9) goto label13;
+
+            var9 = (
+                var6.membernum == 13
+            );
+            if (var9) goto label13;
+
+            var9 = (
+                var6.membernum == 14
+            );
+            if (var9) goto label13;
+
+            var9 = (
+                var6.membernum == 15
+            );
+            if (var9) goto label13;
+
+            var9 = (
+                var6.membernum == 16
+            );
+            if (var9) goto label13;
+
+            var9 = (
+                var6.membernum == 17
+            );
+            if (var9) goto label13;
+
+            var9 = (
+                var6.membernum == 18
+            );
+            if (var9) goto label13;
+label10: (void)0;
+
+            if (var6.membernum != 11)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var8 = var6.val.item11;
+            incref(var8);
+var14 = var8->memb_obj;
+incref(var14);
+decref_Variable_1aaa81c8d2(var15);
+var15.membernum = -1;
+var15 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var14 }, .membernum = 2 };
+var14 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var15);
+var16 = var8->memb_obj;
+decref_Type_87e1ce5c5e(var17);
+var17.membernum = -1;
+var17 = var16->memb_type;
+var16 = NULL;
+incref_Type_87e1ce5c5e(var17);
+string_decref(var18);
+var18.buf = NULL;
+var18 = var8->memb_method_name;
+string_incref(var18);
+decref((var19), dtor_FunctionType_4e16d0ea53);
+var19 = NULL;
+var19 = meth_FunctionOrMethodConverter_14d05c56fc_get_method_functype(var1,var17,var18);
+meth_FunctionOrMethodConverter_14d05c56fc_push_code(var1);
+decref((var20), dtor_List_LocalVariable__81e23234f3);
+var20 = NULL;
+var20 = var8->memb_args;
+incref(var20);
+decref((var21), dtor_List_Type__057f9c6088);
+var21 = NULL;
+var21 = var19->memb_argtypes;
+incref(var21);
+var22 = 1LL;
+decref((var23), dtor_List_Type__057f9c6088);
+var23 = NULL;
+var23 = var19->memb_argtypes;
+incref(var23);
+var24 = meth_List_Type__057f9c6088_length(var23);
+decref((var25), dtor_List_Type__057f9c6088);
+var25 = NULL;
+var25 = meth_List_Type__057f9c6088_slice(var21,var22,var24);
+decref((var26), dtor_Location_500c4434c9);
+var26 = NULL;
+var26 = var8->memb_location;
+incref(var26);
+var27 = meth_FunctionOrMethodConverter_14d05c56fc_do_args(var1,var20,var25,var26);
+decref((var28), dtor_List_LocalVariable__81e23234f3);
+var28 = NULL;
+var28 = var8->memb_args;
+var8->memb_args = var27;
+var27 = NULL;
+decref((var29), dtor_List_Instruction__6e475c861a);
+var29 = NULL;
+var29 = meth_FunctionOrMethodConverter_14d05c56fc_pop_code(var1);
+meth_List_Instruction__6e475c861a_push_all(var2,var29);
+decref__null___Type__8438ac3dcf(var30);
+var30.membernum = -1;
+var30 = var19->memb_returntype;
+incref__null___Type__8438ac3dcf(var30);
+var31 = oomph_null;
+decref__null___Type__8438ac3dcf(var32);
+var32.membernum = -1;
+var32 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var31 }, .membernum = 0 };
+var33 = meth__null___Type__8438ac3dcf_equals(var30,var32);
+if (var33) goto label34;
+decref__null___LocalVariable__494c1a2e12(var35);
+var35.membernum = -1;
+var35 = var8->memb_result;
+incref__null___LocalVariable__494c1a2e12(var35);
+var36 = oomph_null;
+decref__null___LocalVariable__494c1a2e12(var37);
+var37.membernum = -1;
+var37 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item0 = var36 }, .membernum = 0 };
+var38 = meth__null___LocalVariable__494c1a2e12_equals(var35,var37);
+var39 = oomph_bool_not(var38);
+if (var39) goto label40;
+if (oomph_true) goto label41;
+label40: (void)0;
+decref__null___LocalVariable__494c1a2e12(var42);
+var42.membernum = -1;
+var42 = var8->memb_result;
+incref__null___LocalVariable__494c1a2e12(var42);
+decref((var43), dtor_LocalVariable_846080e5ae);
+var43 = NULL;
+var43 = meth__null___LocalVariable__494c1a2e12_get(var42);
+decref_Type_87e1ce5c5e(var44);
+var44.membernum = -1;
+var44 = var43->memb_type;
+incref_Type_87e1ce5c5e(var44);
+decref((var45), dtor_AutoType_33a5d572cb);
+var45 = NULL;
+
+            var46 = (
+                var44.membernum == 0
+            );
+            if (var46) goto label47;
+
+            var46 = (
+                var44.membernum == 1
+            );
+            if (var46) goto label48;
+
+            var46 = (
+                var44.membernum == 2
+            );
+            if (var46) goto label48;
+
+            var46 = (
+                var44.membernum == 3
+            );
+            if (var46) goto label48;
+label47: (void)0;
+
+            if (var44.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var45 = var44.val.item0;
+            incref(var45);
+decref__null___Type__8438ac3dcf(var49);
+var49.membernum = -1;
+var49 = var19->memb_returntype;
+incref__null___Type__8438ac3dcf(var49);
+decref_Type_87e1ce5c5e(var50);
+var50.membernum = -1;
+var50 = meth__null___Type__8438ac3dcf_get(var49);
+meth_FunctionOrMethodConverter_14d05c56fc_resolve_autotype(var1,var45,var50);
+if (oomph_true) goto label51;
+label48: (void)0;
+decref__null___LocalVariable__494c1a2e12(var52);
+var52.membernum = -1;
+var52 = var8->memb_result;
+incref__null___LocalVariable__494c1a2e12(var52);
+var53 = meth__null___LocalVariable__494c1a2e12_get(var52);
+decref_Variable_1aaa81c8d2(var54);
+var54.membernum = -1;
+var54 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var53 }, .membernum = 2 };
+var53 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var54);
+label51: (void)0;
+label41: (void)0;
+if (oomph_true) goto label55;
+label34: (void)0;
+decref__null___LocalVariable__494c1a2e12(var56);
+var56.membernum = -1;
+var56 = var8->memb_result;
+incref__null___LocalVariable__494c1a2e12(var56);
+var57 = oomph_null;
+decref__null___LocalVariable__494c1a2e12(var58);
+var58.membernum = -1;
+var58 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item0 = var57 }, .membernum = 0 };
+var59 = meth__null___LocalVariable__494c1a2e12_equals(var56,var58);
+string_decref(var60);
+var60.buf = NULL;
+var60 = string1_self_hosted_ast2ir_oomph_6b6455e130; string_incref(var60);
+var61 = 848LL;
+oomph_assert(var59,var60,var61);
+label55: (void)0;
+decref((var62), dtor_List_LocalVariable__81e23234f3);
+var62 = NULL;
+var62 = var8->memb_args;
+incref(var62);
+var63 = 0LL;
+label64: (void)0;
+if (var63 >= var62->len) goto label66;
+decref((var65), dtor_LocalVariable_846080e5ae); var65 = var62->data[var63++]; incref(var65);
+decref_Variable_1aaa81c8d2(var67);
+var67.membernum = -1;
+var67 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var65 }, .membernum = 2 };
+var65 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var67);
+if (oomph_true) goto label64;
+label66: (void)0;
+if (oomph_true) goto label68;
+label12: (void)0;
+
+            if (var6.membernum != 4)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var11 = var6.val.item4;
+            incref(var11);
+var69 = var11->memb_obj;
+incref(var69);
+decref_Variable_1aaa81c8d2(var70);
+var70.membernum = -1;
+var70 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var69 }, .membernum = 2 };
+var69 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var70);
+var71 = var11->memb_result;
+decref_Type_87e1ce5c5e(var72);
+var72.membernum = -1;
+var72 = var71->memb_type;
+var71 = NULL;
+incref_Type_87e1ce5c5e(var72);
+decref((var73), dtor_AutoType_33a5d572cb);
+var73 = NULL;
+
+            var74 = (
+                var72.membernum == 0
+            );
+            if (var74) goto label75;
+
+            var74 = (
+                var72.membernum == 1
+            );
+            if (var74) goto label76;
+
+            var74 = (
+                var72.membernum == 2
+            );
+            if (var74) goto label76;
+
+            var74 = (
+                var72.membernum == 3
+            );
+            if (var74) goto label76;
+label75: (void)0;
+
+            if (var72.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var73 = var72.val.item0;
+            incref(var73);
+var77 = var11->memb_obj;
+decref_Type_87e1ce5c5e(var78);
+var78.membernum = -1;
+var78 = var77->memb_type;
+var77 = NULL;
+incref_Type_87e1ce5c5e(var78);
+string_decref(var79);
+var79.buf = NULL;
+var79 = var11->memb_attribute;
+string_incref(var79);
+decref_Type_87e1ce5c5e(var80);
+var80.membernum = -1;
+var80 = meth_FunctionOrMethodConverter_14d05c56fc_get_attribute_type(var1,var78,var79);
+meth_FunctionOrMethodConverter_14d05c56fc_resolve_autotype(var1,var73,var80);
+if (oomph_true) goto label81;
+label76: (void)0;
+var82 = var11->memb_result;
+incref(var82);
+decref_Variable_1aaa81c8d2(var83);
+var83.membernum = -1;
+var83 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var82 }, .membernum = 2 };
+var82 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var83);
+label81: (void)0;
+if (oomph_true) goto label68;
+label13: (void)0;
+label68: (void)0;
+meth_List_Instruction__6e475c861a_push(var2,var6);
+if (oomph_true) goto label5;
+label7: (void)0;
+var84 = var1->memb_code;
+var1->memb_code = var2;
+var2 = NULL;
+var85 = var1->memb_code;
+incref(var85);
+var86 = 0LL;
+label87: (void)0;
+if (var86 >= var85->len) goto label89;
+decref_Instruction_b0fafb4d55(var88); var88 = var85->data[var86++]; incref_Instruction_b0fafb4d55(var88);
+decref((var90), dtor_IncRef_54322428a7);
+var90 = NULL;
+
+            var91 = (
+                var88.membernum == 8
+            );
+            if (var91) goto label92;
+decref((var93), dtor_DecRef_f37e9a69d2);
+var93 = NULL;
+
+            var91 = (
+                var88.membernum == 1
+            );
+            if (var91) goto label94;
+decref((var95), dtor_UnSet_a1ce71f609);
+var95 = NULL;
+
+            var91 = (
+                var88.membernum == 16
+            );
+            if (var91) goto label96;
+decref((var97), dtor_IntConstant_817d6312f0);
+var97 = NULL;
+
+            var91 = (
+                var88.membernum == 10
+            );
+            if (var91) goto label98;
+decref((var99), dtor_FloatConstant_652a176e04);
+var99 = NULL;
+
+            var91 = (
+                var88.membernum == 2
+            );
+            if (var91) goto label100;
+decref((var101), dtor_StringConstant_e1466967c8);
+var101 = NULL;
+
+            var91 = (
+                var88.membernum == 15
+            );
+            if (var91) goto label102;
+decref((var103), dtor_MethodCall_b0095be49c);
+var103 = NULL;
+
+            var91 = (
+                var88.membernum == 11
+            );
+            if (var91) goto label104;
+decref((var105), dtor_ConstructorCall_f8e441a21d);
+var105 = NULL;
+
+            var91 = (
+                var88.membernum == 0
+            );
+            if (var91) goto label106;
+decref((var107), dtor_FunctionCall_104f394575);
+var107 = NULL;
+
+            var91 = (
+                var88.membernum == 3
+            );
+            if (var91) goto label108;
+decref((var109), dtor_VarCpy_e77a538911);
+var109 = NULL;
+
+            var91 = (
+                var88.membernum == 18
+            );
+            if (var91) goto label110;
+decref((var111), dtor_GotoIf_feb019130f);
+var111 = NULL;
+
+            var91 = (
+                var88.membernum == 6
+            );
+            if (var91) goto label112;
+decref((var113), dtor_Return_aa2d9b1c64);
+var113 = NULL;
+
+            var91 = (
+                var88.membernum == 13
+            );
+            if (var91) goto label114;
+decref((var115), dtor_InstantiateUnion_29af05529f);
+var115 = NULL;
+
+            var91 = (
+                var88.membernum == 9
+            );
+            if (var91) goto label116;
+decref((var117), dtor_GetAttribute_3d0cc1bf97);
+var117 = NULL;
+
+            var91 = (
+                var88.membernum == 4
+            );
+            if (var91) goto label118;
+decref((var119), dtor_SetAttribute_25344a82b6);
+var119 = NULL;
+
+            var91 = (
+                var88.membernum == 14
+            );
+            if (var91) goto label120;
+decref((var121), dtor_GetFromUnion_b0861b839c);
+var121 = NULL;
+
+            var91 = (
+                var88.membernum == 5
+            );
+            if (var91) goto label122;
+decref((var123), dtor_UnionMemberCheck_7021628c40);
+var123 = NULL;
+
+            var91 = (
+                var88.membernum == 17
+            );
+            if (var91) goto label124;
+decref((var125), dtor_PointersEqual_deb0abf3fc);
+var125 = NULL;
+
+            var91 = (
+                var88.membernum == 12
+            );
+            if (var91) goto label126;
+decref((var127), dtor_GotoLabel_9654b8ee6d);
+var127 = NULL;
+
+            var91 = (
+                var88.membernum == 7
+            );
+            if (var91) goto label128;
+label92: (void)0;
+
+            if (var88.membernum != 8)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var90 = var88.val.item8;
+            incref(var90);
+var129 = var90->memb_var;
+incref(var129);
+decref_Variable_1aaa81c8d2(var130);
+var130.membernum = -1;
+var130 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var129 }, .membernum = 2 };
+var129 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var130);
+if (oomph_true) goto label131;
+label94: (void)0;
+
+            if (var88.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var93 = var88.val.item1;
+            incref(var93);
+var132 = var93->memb_var;
+incref(var132);
+decref_Variable_1aaa81c8d2(var133);
+var133.membernum = -1;
+var133 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var132 }, .membernum = 2 };
+var132 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var133);
+if (oomph_true) goto label131;
+label96: (void)0;
+
+            if (var88.membernum != 16)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var95 = var88.val.item16;
+            incref(var95);
+var134 = var95->memb_var;
+incref(var134);
+decref_Variable_1aaa81c8d2(var135);
+var135.membernum = -1;
+var135 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var134 }, .membernum = 2 };
+var134 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var135);
+if (oomph_true) goto label131;
+label98: (void)0;
+
+            if (var88.membernum != 10)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var97 = var88.val.item10;
+            incref(var97);
+var136 = var97->memb_var;
+incref(var136);
+decref_Variable_1aaa81c8d2(var137);
+var137.membernum = -1;
+var137 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var136 }, .membernum = 2 };
+var136 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var137);
+if (oomph_true) goto label131;
+label100: (void)0;
+
+            if (var88.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var99 = var88.val.item2;
+            incref(var99);
+var138 = var99->memb_var;
+incref(var138);
+decref_Variable_1aaa81c8d2(var139);
+var139.membernum = -1;
+var139 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var138 }, .membernum = 2 };
+var138 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var139);
+if (oomph_true) goto label131;
+label102: (void)0;
+
+            if (var88.membernum != 15)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var101 = var88.val.item15;
+            incref(var101);
+var140 = var101->memb_var;
+incref(var140);
+decref_Variable_1aaa81c8d2(var141);
+var141.membernum = -1;
+var141 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var140 }, .membernum = 2 };
+var140 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var141);
+if (oomph_true) goto label131;
+label104: (void)0;
+
+            if (var88.membernum != 11)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var103 = var88.val.item11;
+            incref(var103);
+if (oomph_true) goto label131;
+label106: (void)0;
+
+            if (var88.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var105 = var88.val.item0;
+            incref(var105);
+var142 = var105->memb_result;
+incref(var142);
+decref_Variable_1aaa81c8d2(var143);
+var143.membernum = -1;
+var143 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var142 }, .membernum = 2 };
+var142 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var143);
+decref((var144), dtor_List_LocalVariable__81e23234f3);
+var144 = NULL;
+var144 = var105->memb_args;
+incref(var144);
+var145 = 0LL;
+label146: (void)0;
+if (var145 >= var144->len) goto label148;
+decref((var147), dtor_LocalVariable_846080e5ae); var147 = var144->data[var145++]; incref(var147);
+decref_Variable_1aaa81c8d2(var149);
+var149.membernum = -1;
+var149 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var147 }, .membernum = 2 };
+var147 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var149);
+if (oomph_true) goto label146;
+label148: (void)0;
+if (oomph_true) goto label131;
+label108: (void)0;
+
+            if (var88.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var107 = var88.val.item3;
+            incref(var107);
+decref__null___LocalVariable__494c1a2e12(var150);
+var150.membernum = -1;
+var150 = var107->memb_result;
+incref__null___LocalVariable__494c1a2e12(var150);
+var151 = oomph_null;
+decref__null___LocalVariable__494c1a2e12(var152);
+var152.membernum = -1;
+var152 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item0 = var151 }, .membernum = 0 };
+var153 = meth__null___LocalVariable__494c1a2e12_equals(var150,var152);
+var154 = oomph_bool_not(var153);
+if (var154) goto label155;
+if (oomph_true) goto label156;
+label155: (void)0;
+decref__null___LocalVariable__494c1a2e12(var157);
+var157.membernum = -1;
+var157 = var107->memb_result;
+incref__null___LocalVariable__494c1a2e12(var157);
+var158 = meth__null___LocalVariable__494c1a2e12_get(var157);
+decref_Variable_1aaa81c8d2(var159);
+var159.membernum = -1;
+var159 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var158 }, .membernum = 2 };
+var158 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var159);
+label156: (void)0;
+decref_Variable_1aaa81c8d2(var160);
+var160.membernum = -1;
+var160 = var107->memb_function;
+incref_Variable_1aaa81c8d2(var160);
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var160);
+decref((var161), dtor_List_LocalVariable__81e23234f3);
+var161 = NULL;
+var161 = var107->memb_args;
+incref(var161);
+var162 = 0LL;
+label163: (void)0;
+if (var162 >= var161->len) goto label165;
+decref((var164), dtor_LocalVariable_846080e5ae); var164 = var161->data[var162++]; incref(var164);
+decref_Variable_1aaa81c8d2(var166);
+var166.membernum = -1;
+var166 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var164 }, .membernum = 2 };
+var164 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var166);
+if (oomph_true) goto label163;
+label165: (void)0;
+if (oomph_true) goto label131;
+label110: (void)0;
+
+            if (var88.membernum != 18)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var109 = var88.val.item18;
+            incref(var109);
+var167 = var109->memb_dest;
+incref(var167);
+decref_Variable_1aaa81c8d2(var168);
+var168.membernum = -1;
+var168 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var167 }, .membernum = 2 };
+var167 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var168);
+decref_Variable_1aaa81c8d2(var169);
+var169.membernum = -1;
+var169 = var109->memb_source;
+incref_Variable_1aaa81c8d2(var169);
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var169);
+if (oomph_true) goto label131;
+label112: (void)0;
+
+            if (var88.membernum != 6)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var111 = var88.val.item6;
+            incref(var111);
+var170 = var111->memb_cond;
+incref(var170);
+decref_Variable_1aaa81c8d2(var171);
+var171.membernum = -1;
+var171 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var170 }, .membernum = 2 };
+var170 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var171);
+if (oomph_true) goto label131;
+label114: (void)0;
+
+            if (var88.membernum != 13)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var113 = var88.val.item13;
+            incref(var113);
+decref__null___LocalVariable__494c1a2e12(var172);
+var172.membernum = -1;
+var172 = var113->memb_value;
+incref__null___LocalVariable__494c1a2e12(var172);
+var173 = oomph_null;
+decref__null___LocalVariable__494c1a2e12(var174);
+var174.membernum = -1;
+var174 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item0 = var173 }, .membernum = 0 };
+var175 = meth__null___LocalVariable__494c1a2e12_equals(var172,var174);
+var176 = oomph_bool_not(var175);
+if (var176) goto label177;
+if (oomph_true) goto label178;
+label177: (void)0;
+decref__null___LocalVariable__494c1a2e12(var179);
+var179.membernum = -1;
+var179 = var113->memb_value;
+incref__null___LocalVariable__494c1a2e12(var179);
+var180 = meth__null___LocalVariable__494c1a2e12_get(var179);
+decref_Variable_1aaa81c8d2(var181);
+var181.membernum = -1;
+var181 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var180 }, .membernum = 2 };
+var180 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var181);
+label178: (void)0;
+if (oomph_true) goto label131;
+label116: (void)0;
+
+            if (var88.membernum != 9)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var115 = var88.val.item9;
+            incref(var115);
+var182 = var115->memb_result;
+incref(var182);
+decref_Variable_1aaa81c8d2(var183);
+var183.membernum = -1;
+var183 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var182 }, .membernum = 2 };
+var182 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var183);
+var184 = var115->memb_value;
+incref(var184);
+decref_Variable_1aaa81c8d2(var185);
+var185.membernum = -1;
+var185 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var184 }, .membernum = 2 };
+var184 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var185);
+if (oomph_true) goto label131;
+label118: (void)0;
+
+            if (var88.membernum != 4)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var117 = var88.val.item4;
+            incref(var117);
+var186 = var117->memb_result;
+incref(var186);
+decref_Variable_1aaa81c8d2(var187);
+var187.membernum = -1;
+var187 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var186 }, .membernum = 2 };
+var186 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var187);
+var188 = var117->memb_obj;
+incref(var188);
+decref_Variable_1aaa81c8d2(var189);
+var189.membernum = -1;
+var189 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var188 }, .membernum = 2 };
+var188 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var189);
+if (oomph_true) goto label131;
+label120: (void)0;
+
+            if (var88.membernum != 14)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var119 = var88.val.item14;
+            incref(var119);
+var190 = var119->memb_value;
+incref(var190);
+decref_Variable_1aaa81c8d2(var191);
+var191.membernum = -1;
+var191 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var190 }, .membernum = 2 };
+var190 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var191);
+var192 = var119->memb_obj;
+incref(var192);
+decref_Variable_1aaa81c8d2(var193);
+var193.membernum = -1;
+var193 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var192 }, .membernum = 2 };
+var192 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var193);
+if (oomph_true) goto label131;
+label122: (void)0;
+
+            if (var88.membernum != 5)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var121 = var88.val.item5;
+            incref(var121);
+var194 = var121->memb_result;
+incref(var194);
+decref_Variable_1aaa81c8d2(var195);
+var195.membernum = -1;
+var195 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var194 }, .membernum = 2 };
+var194 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var195);
+var196 = var121->memb_union_var;
+incref(var196);
+decref_Variable_1aaa81c8d2(var197);
+var197.membernum = -1;
+var197 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var196 }, .membernum = 2 };
+var196 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var197);
+if (oomph_true) goto label131;
+label124: (void)0;
+
+            if (var88.membernum != 17)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var123 = var88.val.item17;
+            incref(var123);
+var198 = var123->memb_result;
+incref(var198);
+decref_Variable_1aaa81c8d2(var199);
+var199.membernum = -1;
+var199 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var198 }, .membernum = 2 };
+var198 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var199);
+var200 = var123->memb_union_var;
+incref(var200);
+decref_Variable_1aaa81c8d2(var201);
+var201.membernum = -1;
+var201 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var200 }, .membernum = 2 };
+var200 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var201);
+if (oomph_true) goto label131;
+label126: (void)0;
+
+            if (var88.membernum != 12)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var125 = var88.val.item12;
+            incref(var125);
+var202 = var125->memb_lhs;
+incref(var202);
+decref_Variable_1aaa81c8d2(var203);
+var203.membernum = -1;
+var203 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var202 }, .membernum = 2 };
+var202 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var203);
+var204 = var125->memb_rhs;
+incref(var204);
+decref_Variable_1aaa81c8d2(var205);
+var205.membernum = -1;
+var205 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var204 }, .membernum = 2 };
+var204 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var205);
+var206 = var125->memb_result;
+incref(var206);
+decref_Variable_1aaa81c8d2(var207);
+var207.membernum = -1;
+var207 = (struct class_Variable_1aaa81c8d2){ .val = { .item2 = var206 }, .membernum = 2 };
+var206 = NULL;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(var1,var207);
+if (oomph_true) goto label131;
+label128: (void)0;
+
+            if (var88.membernum != 7)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var127 = var88.val.item7;
+            incref(var127);
+label131: (void)0;
+if (oomph_true) goto label87;
+label89: (void)0;
+out: (void)0;
+decref_Variable_1aaa81c8d2(var207);
+decref((var206), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var205);
+decref((var204), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var203);
+decref((var202), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var201);
+decref((var200), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var199);
+decref((var198), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var197);
+decref((var196), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var195);
+decref((var194), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var193);
+decref((var192), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var191);
+decref((var190), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var189);
+decref((var188), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var187);
+decref((var186), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var185);
+decref((var184), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var183);
+decref((var182), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var181);
+decref((var180), dtor_LocalVariable_846080e5ae);
+decref__null___LocalVariable__494c1a2e12(var179);
+(void)0;
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var174);
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var172);
+decref_Variable_1aaa81c8d2(var171);
+decref((var170), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var169);
+decref_Variable_1aaa81c8d2(var168);
+decref((var167), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var166);
+decref((var164), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref((var161), dtor_List_LocalVariable__81e23234f3);
+decref_Variable_1aaa81c8d2(var160);
+decref_Variable_1aaa81c8d2(var159);
+decref((var158), dtor_LocalVariable_846080e5ae);
+decref__null___LocalVariable__494c1a2e12(var157);
+(void)0;
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var152);
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var150);
+decref_Variable_1aaa81c8d2(var149);
+decref((var147), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref((var144), dtor_List_LocalVariable__81e23234f3);
+decref_Variable_1aaa81c8d2(var143);
+decref((var142), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var141);
+decref((var140), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var139);
+decref((var138), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var137);
+decref((var136), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var135);
+decref((var134), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var133);
+decref((var132), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var130);
+decref((var129), dtor_LocalVariable_846080e5ae);
+decref((var127), dtor_GotoLabel_9654b8ee6d);
+decref((var125), dtor_PointersEqual_deb0abf3fc);
+decref((var123), dtor_UnionMemberCheck_7021628c40);
+decref((var121), dtor_GetFromUnion_b0861b839c);
+decref((var119), dtor_SetAttribute_25344a82b6);
+decref((var117), dtor_GetAttribute_3d0cc1bf97);
+decref((var115), dtor_InstantiateUnion_29af05529f);
+decref((var113), dtor_Return_aa2d9b1c64);
+decref((var111), dtor_GotoIf_feb019130f);
+decref((var109), dtor_VarCpy_e77a538911);
+decref((var107), dtor_FunctionCall_104f394575);
+decref((var105), dtor_ConstructorCall_f8e441a21d);
+decref((var103), dtor_MethodCall_b0095be49c);
+decref((var101), dtor_StringConstant_e1466967c8);
+decref((var99), dtor_FloatConstant_652a176e04);
+decref((var97), dtor_IntConstant_817d6312f0);
+decref((var95), dtor_UnSet_a1ce71f609);
+decref((var93), dtor_DecRef_f37e9a69d2);
+(void)0;
+decref((var90), dtor_IncRef_54322428a7);
+decref_Instruction_b0fafb4d55(var88);
+(void)0;
+decref((var85), dtor_List_Instruction__6e475c861a);
+decref((var84), dtor_List_Instruction__6e475c861a);
+decref_Variable_1aaa81c8d2(var83);
+decref((var82), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var80);
+string_decref(var79);
+decref_Type_87e1ce5c5e(var78);
+decref((var77), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref((var73), dtor_AutoType_33a5d572cb);
+decref_Type_87e1ce5c5e(var72);
+decref((var71), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var70);
+decref((var69), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var67);
+decref((var65), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref((var62), dtor_List_LocalVariable__81e23234f3);
+(void)0;
+string_decref(var60);
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var58);
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var56);
+decref_Variable_1aaa81c8d2(var54);
+decref((var53), dtor_LocalVariable_846080e5ae);
+decref__null___LocalVariable__494c1a2e12(var52);
+decref_Type_87e1ce5c5e(var50);
+decref__null___Type__8438ac3dcf(var49);
+(void)0;
+decref((var45), dtor_AutoType_33a5d572cb);
+decref_Type_87e1ce5c5e(var44);
+decref((var43), dtor_LocalVariable_846080e5ae);
+decref__null___LocalVariable__494c1a2e12(var42);
+(void)0;
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var37);
+(void)0;
+decref__null___LocalVariable__494c1a2e12(var35);
+(void)0;
+decref__null___Type__8438ac3dcf(var32);
+(void)0;
+decref__null___Type__8438ac3dcf(var30);
+decref((var29), dtor_List_Instruction__6e475c861a);
+decref((var28), dtor_List_LocalVariable__81e23234f3);
+decref((var27), dtor_List_LocalVariable__81e23234f3);
+decref((var26), dtor_Location_500c4434c9);
+decref((var25), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var23), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var21), dtor_List_Type__057f9c6088);
+decref((var20), dtor_List_LocalVariable__81e23234f3);
+decref((var19), dtor_FunctionType_4e16d0ea53);
+string_decref(var18);
+decref_Type_87e1ce5c5e(var17);
+decref((var16), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var15);
+decref((var14), dtor_LocalVariable_846080e5ae);
+decref((var11), dtor_GetAttribute_3d0cc1bf97);
+(void)0;
+decref((var8), dtor_MethodCall_b0095be49c);
+decref_Instruction_b0fafb4d55(var6);
+(void)0;
+decref((var3), dtor_List_Instruction__6e475c861a);
+decref((var2), dtor_List_Instruction__6e475c861a);
+}
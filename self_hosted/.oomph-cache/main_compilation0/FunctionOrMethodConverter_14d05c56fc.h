@@ -0,0 +1,770 @@
+
+                #ifndef HEADER_GUARD_FunctionOrMethodConverter_14d05c56fc
+                #define HEADER_GUARD_FunctionOrMethodConverter_14d05c56fc
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "Instruction_b0fafb4d55.h"
+#include "LoopHeader_23fd592271.h"
+#include "Statement_1dc2e7090f.h"
+#include "Type_87e1ce5c5e.h"
+#include "Type_e6cf7dd4e5.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_null___Expression__957e7d6409.h"
+#include "_null___FunctionOrMethodConverter__7dc768c0a0.h"
+#include "_null___GenericSource__4440b6073d.h"
+#include "_null___List_Type___114a421a91.h"
+#include "_null___List_UnionType___b20440b9a7.h"
+#include "_null___LocalVariable__494c1a2e12.h"
+#include "_null___Location__87aaae6467.h"
+#include "_null___TypeAndName__d7958d7e85.h"
+#include "_null___Type__8438ac3dcf.h"
+#include "ast2ir_d819fcc31b.h"
+#include "ast_91af7cbb25.h"
+#include "ir_4b1a3e0393.h"
+struct class_Builtins_bd980a9f08;
+struct class_FileConverter_c79636dcc7;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_List_LoopLabels__74a48e6cc9;
+struct class_List_Instruction__6e475c861a;
+struct class_List_List_Instruction___d2e1d3bdd4;
+struct class_List_AutoTypeNode__28b2c8eb14;
+struct class_Builtins_bd980a9f08;
+struct class_FileConverter_c79636dcc7;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_List_LoopLabels__74a48e6cc9;
+struct class_List_Instruction__6e475c861a;
+struct class_List_List_Instruction___d2e1d3bdd4;
+struct class_List_AutoTypeNode__28b2c8eb14;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_DecRef_f37e9a69d2;
+struct class_List_Instruction__6e475c861a;
+struct class_UnSet_a1ce71f609;
+struct class_LocalVariable_846080e5ae;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_List_AutoTypeNode__28b2c8eb14;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoType_33a5d572cb;
+struct class_List_AutoTypeNode__28b2c8eb14;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_List_AutoTypeNode__28b2c8eb14;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoType_33a5d572cb;
+struct class_List_AutoTypeNode__28b2c8eb14;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoType_33a5d572cb;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoType_33a5d572cb;
+struct class_AutoType_33a5d572cb;
+struct class_AutoType_33a5d572cb;
+struct class_AutoType_33a5d572cb;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoType_33a5d572cb;
+struct class_AutoType_33a5d572cb;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoType_33a5d572cb;
+struct class_GenericSource_35cfcd932e;
+struct class_Builtins_bd980a9f08;
+struct class_GenericSource_35cfcd932e;
+struct class_Generic_c39b95ec73;
+struct class_AutoType_33a5d572cb;
+struct class_List_AutoTypeNode__28b2c8eb14;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoType_33a5d572cb;
+struct class_AutoType_33a5d572cb;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_AutoType_39f5d793d6;
+struct class_AutoType_33a5d572cb;
+struct class_FileConverter_c79636dcc7;
+struct class_List_List_Instruction___d2e1d3bdd4;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_List_Instruction___d2e1d3bdd4;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_Builtins_bd980a9f08;
+struct class_Builtins_bd980a9f08;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_List_LocalVariable__81e23234f3;
+struct class_Location_500c4434c9;
+struct class_MethodCall_b0095be49c;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_Location_500c4434c9;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Builtins_bd980a9f08;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_FunctionType_4e16d0ea53;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_FunctionCall_104f394575;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoType_33a5d572cb;
+struct class_GenericSource_35cfcd932e;
+struct class_Generic_c39b95ec73;
+struct class_GenericSource_35cfcd932e;
+struct class_Generic_c39b95ec73;
+struct class_GenericSource_35cfcd932e;
+struct class_Generic_c39b95ec73;
+struct class_GenericSource_35cfcd932e;
+struct class_GenericSource_35cfcd932e;
+struct class_TypePair_63e9b86975;
+struct class_Builtins_bd980a9f08;
+struct class_Builtins_bd980a9f08;
+struct class_TypePair_63e9b86975;
+struct class_AutoType_33a5d572cb;
+struct class_TypePair_63e9b86975;
+struct class_AutoType_33a5d572cb;
+struct class_TypePair_63e9b86975;
+struct class_AutoType_33a5d572cb;
+struct class_TypePair_63e9b86975;
+struct class_AutoType_33a5d572cb;
+struct class_TypePair_63e9b86975;
+struct class_AutoType_33a5d572cb;
+struct class_AutoType_33a5d572cb;
+struct class_TypePair_63e9b86975;
+struct class_TypePair_63e9b86975;
+struct class_TypePair_63e9b86975;
+struct class_AutoType_33a5d572cb;
+struct class_AutoType_33a5d572cb;
+struct class_TypePair_63e9b86975;
+struct class_TypePair_63e9b86975;
+struct class_TypePair_63e9b86975;
+struct class_TypePair_63e9b86975;
+struct class_LocalVariable_846080e5ae;
+struct class_TypePair_63e9b86975;
+struct class_Builtins_bd980a9f08;
+struct class_Builtins_bd980a9f08;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_UnionType_7f899bced1;
+struct class_List_UnionType__f35bb76792;
+struct class_List_List_UnionType___fea86ef88e;
+struct class_List_List_UnionType___fea86ef88e;
+struct class_List_UnionType__f35bb76792;
+struct class_UnionType_7f899bced1;
+struct class_List_Type__057f9c6088;
+struct class_UnionType_7f899bced1;
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+struct class_UnionType_7f899bced1;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_InstantiateUnion_29af05529f;
+struct class_List_Instruction__6e475c861a;
+struct class_IncRef_54322428a7;
+struct class_LocalVariable_846080e5ae;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_Type__057f9c6088;
+struct class_Location_500c4434c9;
+struct class_List_LocalVariable__81e23234f3;
+struct class_Builtins_bd980a9f08;
+struct class_FunctionType_4e16d0ea53;
+struct class_FunctionType_4e16d0ea53;
+struct class_FunctionType_4e16d0ea53;
+struct class_List_Expression__d162784c9e;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_GetAttribute_0758070446;
+struct class_LocalVariable_846080e5ae;
+struct class_AutoType_33a5d572cb;
+struct class_AutoType_33a5d572cb;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_FunctionType_4e16d0ea53;
+struct class_List_Type__057f9c6088;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_Location_500c4434c9;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_Instruction__6e475c861a;
+struct class_Location_500c4434c9;
+struct class_MethodCall_b0095be49c;
+struct class_GetVar_642f116a6c;
+struct class_Location_500c4434c9;
+struct class_FunctionType_4e16d0ea53;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_Location_500c4434c9;
+struct class_List_LocalVariable__81e23234f3;
+struct class_Location_500c4434c9;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_FunctionCall_104f394575;
+struct class_Constructor_0c896e4031;
+struct class_List_Type__057f9c6088;
+struct class_Location_500c4434c9;
+struct class_List_LocalVariable__81e23234f3;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_LocalVariable_846080e5ae;
+struct class_ConstructorCall_f8e441a21d;
+struct class_Call_d0fb9d6234;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_Builtins_bd980a9f08;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_VarCpy_e77a538911;
+struct class_LocalVariable_846080e5ae;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Str__43b70c06cb;
+struct class_Builtins_bd980a9f08;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_List_LocalVariable__81e23234f3;
+struct class_MethodCall_b0095be49c;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_Builtins_bd980a9f08;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_List_LocalVariable__81e23234f3;
+struct class_MethodCall_b0095be49c;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_List_Instruction__6e475c861a;
+struct class_GotoIf_feb019130f;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_GotoIf_feb019130f;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Str__43b70c06cb;
+struct class_Builtins_bd980a9f08;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_VarCpy_e77a538911;
+struct class_Builtins_bd980a9f08;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_VarCpy_e77a538911;
+struct class_List_Instruction__6e475c861a;
+struct class_Builtins_bd980a9f08;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_VarCpy_e77a538911;
+struct class_List_Instruction__6e475c861a;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_BinaryOperator_e25f87d1b5;
+struct class_LocalVariable_846080e5ae;
+struct class_Location_500c4434c9;
+struct class_IntConstant_4cbc4c5420;
+struct class_Builtins_bd980a9f08;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_IntConstant_817d6312f0;
+struct class_FloatConstant_4759845694;
+struct class_Builtins_bd980a9f08;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_FloatConstant_652a176e04;
+struct class_StringConstant_c2b1c10b4f;
+struct class_Builtins_bd980a9f08;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_StringConstant_e1466967c8;
+struct class_ListLiteral_66e426dc17;
+struct class_List_Expression__d162784c9e;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_AutoType_33a5d572cb;
+struct class_Builtins_bd980a9f08;
+struct class_Builtins_bd980a9f08;
+struct class_Generic_c39b95ec73;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_List_LocalVariable__81e23234f3;
+struct class_ConstructorCall_f8e441a21d;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_List_LocalVariable__81e23234f3;
+struct class_MethodCall_b0095be49c;
+struct class_StringFormatJoin_bc28806767;
+struct class_List_Expression__d162784c9e;
+struct class_List_Expression__d162784c9e;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Expression__d162784c9e;
+struct class_List_Expression__d162784c9e;
+struct class_List_Expression__d162784c9e;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Call_d0fb9d6234;
+struct class_Constructor_0c896e4031;
+struct class_UnionType_7f899bced1;
+struct class_List_Expression__d162784c9e;
+struct class_List_Expression__d162784c9e;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_GetVar_642f116a6c;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_VarCpy_e77a538911;
+struct class_List_Instruction__6e475c861a;
+struct class_IncRef_54322428a7;
+struct class_UnaryOperator_348525ebbe;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_BinaryOperator_e25f87d1b5;
+struct class_LocalVariable_846080e5ae;
+struct class_GetAttribute_0758070446;
+struct class_LocalVariable_846080e5ae;
+struct class_AutoType_33a5d572cb;
+struct class_AutoType_33a5d572cb;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_GetAttribute_3d0cc1bf97;
+struct class_List_Instruction__6e475c861a;
+struct class_IncRef_54322428a7;
+struct class_StatementsAndExpression_964cbccc5e;
+struct class_List_Statement__5d7503c104;
+struct class_LocalVariable_846080e5ae;
+struct class_As_a05f1f16b6;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_GetFromUnion_b0861b839c;
+struct class_List_Instruction__6e475c861a;
+struct class_IncRef_54322428a7;
+struct class_Constructor_0c896e4031;
+struct class_ListComprehension_10c913d2dd;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_Call_d0fb9d6234;
+struct class_Let_c9da3e3372;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_LocalVariable_846080e5ae;
+struct class_NamedVariable_ac0761c28d;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_NamedVariable_ac0761c28d;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_SetVar_6a19c6f350;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_DecRef_f37e9a69d2;
+struct class_List_Instruction__6e475c861a;
+struct class_LocalVariable_846080e5ae;
+struct class_VarCpy_e77a538911;
+struct class_List_Instruction__6e475c861a;
+struct class_IncRef_54322428a7;
+struct class_SetAttribute_6bd58fd9d3;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_GetAttribute_3d0cc1bf97;
+struct class_List_Instruction__6e475c861a;
+struct class_SetAttribute_25344a82b6;
+struct class_List_Instruction__6e475c861a;
+struct class_IncRef_54322428a7;
+struct class_Pass_e49950b77e;
+struct class_Continue_b54f3b332e;
+struct class_List_LoopLabels__74a48e6cc9;
+struct class_LoopLabels_8e8d3917a5;
+struct class_GotoLabel_9654b8ee6d;
+struct class_List_Instruction__6e475c861a;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_GotoIf_feb019130f;
+struct class_Break_2f9897f5fd;
+struct class_List_LoopLabels__74a48e6cc9;
+struct class_LoopLabels_8e8d3917a5;
+struct class_GotoLabel_9654b8ee6d;
+struct class_List_Instruction__6e475c861a;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_GotoIf_feb019130f;
+struct class_Return_33802009cd;
+struct class_List_Instruction__6e475c861a;
+struct class_LocalVariable_846080e5ae;
+struct class_Return_aa2d9b1c64;
+struct class_List_Instruction__6e475c861a;
+struct class_Return_aa2d9b1c64;
+struct class_If_8811dba942;
+struct class_List_ConditionAndBody__ad79dde1db;
+struct class_ConditionAndBody_0e2f888e06;
+struct class_List_ConditionAndBody__ad79dde1db;
+struct class_ConditionAndBody_0e2f888e06;
+struct class_List_Statement__5d7503c104;
+struct class_Builtins_bd980a9f08;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_List_ConditionAndBody__ad79dde1db;
+struct class_List_Statement__5d7503c104;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_ConditionAndBody__ad79dde1db;
+struct class_List_ConditionAndBody__ad79dde1db;
+struct class_List_ConditionAndBody__ad79dde1db;
+struct class_List_Statement__5d7503c104;
+struct class_If_8811dba942;
+struct class_List_Statement__5d7503c104;
+struct class_Loop_80080d5f12;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_ForLoopHeader_79606b2adb;
+struct class_List_Statement__5d7503c104;
+struct class_List_Instruction__6e475c861a;
+struct class_Builtins_bd980a9f08;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_Builtins_bd980a9f08;
+struct class_Location_500c4434c9;
+struct class_List_Instruction__6e475c861a;
+struct class_Builtins_bd980a9f08;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_VarCpy_e77a538911;
+struct class_List_Instruction__6e475c861a;
+struct class_LocalVariable_846080e5ae;
+struct class_GotoIf_feb019130f;
+struct class_List_LoopLabels__74a48e6cc9;
+struct class_LoopLabels_8e8d3917a5;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Statement__5d7503c104;
+struct class_List_Instruction__6e475c861a;
+struct class_List_LoopLabels__74a48e6cc9;
+struct class_LoopLabels_8e8d3917a5;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Statement__5d7503c104;
+struct class_List_Instruction__6e475c861a;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_GotoIf_feb019130f;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Statement__5d7503c104;
+struct class_List_Statement__5d7503c104;
+struct class_Let_c9da3e3372;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_List_Str__43b70c06cb;
+struct class_NamedVariable_ac0761c28d;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_NamedVariable_ac0761c28d;
+struct class_Switch_9b8c881aeb;
+struct class_LocalVariable_846080e5ae;
+struct class_UnionType_7f899bced1;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_GotoLabel_9654b8ee6d;
+struct class_Builtins_bd980a9f08;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Case__f5a6b4b2ec;
+struct class_Case_458b8eeee1;
+struct class_GotoLabel_9654b8ee6d;
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+struct class_List_Type__057f9c6088;
+struct class_TypeAndName_fec99b5f94;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_NamedVariable_ac0761c28d;
+struct class_GetFromUnion_b0861b839c;
+struct class_IncRef_54322428a7;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_List_Statement__5d7503c104;
+struct class_List_Instruction__6e475c861a;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_GotoIf_feb019130f;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_NamedVariable_ac0761c28d;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_NamedVariable_ac0761c28d;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_NamedVariable_ac0761c28d;
+struct class_List_Instruction__6e475c861a;
+struct class_UnionMemberCheck_7021628c40;
+struct class_List_Instruction__6e475c861a;
+struct class_GotoIf_feb019130f;
+struct class_List_Type__057f9c6088;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Statement__5d7503c104;
+struct class_List_Instruction__6e475c861a;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_MethodCall_b0095be49c;
+struct class_GetAttribute_3d0cc1bf97;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_FunctionType_4e16d0ea53;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_Location_500c4434c9;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_Instruction__6e475c861a;
+struct class_LocalVariable_846080e5ae;
+struct class_AutoType_33a5d572cb;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_AutoType_33a5d572cb;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_IncRef_54322428a7;
+struct class_DecRef_f37e9a69d2;
+struct class_UnSet_a1ce71f609;
+struct class_IntConstant_817d6312f0;
+struct class_FloatConstant_652a176e04;
+struct class_StringConstant_e1466967c8;
+struct class_MethodCall_b0095be49c;
+struct class_ConstructorCall_f8e441a21d;
+struct class_FunctionCall_104f394575;
+struct class_VarCpy_e77a538911;
+struct class_GotoIf_feb019130f;
+struct class_Return_aa2d9b1c64;
+struct class_InstantiateUnion_29af05529f;
+struct class_GetAttribute_3d0cc1bf97;
+struct class_SetAttribute_25344a82b6;
+struct class_GetFromUnion_b0861b839c;
+struct class_UnionMemberCheck_7021628c40;
+struct class_PointersEqual_deb0abf3fc;
+struct class_GotoLabel_9654b8ee6d;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+
+            struct class_FunctionOrMethodConverter_14d05c56fc {
+                REFCOUNT_HEADER
+                struct class_Builtins_bd980a9f08* memb_builtins;
+struct class_FileConverter_c79636dcc7* memb_file_converter;
+struct class_List_NamedVariable__2ad9e9e312* memb_variables;
+struct class__null___Type__8438ac3dcf memb_returntype;
+struct class_List_LoopLabels__74a48e6cc9* memb_loop_stack;
+struct class_List_Instruction__6e475c861a* memb_code;
+struct class_List_List_Instruction___d2e1d3bdd4* memb_code_stack;
+struct class_List_AutoTypeNode__28b2c8eb14* memb_autotype_nodes;
+int64_t memb_autotype_counter;
+int64_t memb_goto_label_counter;
+int64_t memb_local_var_counter;
+
+            };
+            
+            struct class_FunctionOrMethodConverter_14d05c56fc* ctor_FunctionOrMethodConverter_14d05c56fc(struct class_Builtins_bd980a9f08* arg_builtins,struct class_FileConverter_c79636dcc7* arg_file_converter,struct class_List_NamedVariable__2ad9e9e312* arg_variables,struct class__null___Type__8438ac3dcf arg_returntype,struct class_List_LoopLabels__74a48e6cc9* arg_loop_stack,struct class_List_Instruction__6e475c861a* arg_code,struct class_List_List_Instruction___d2e1d3bdd4* arg_code_stack,struct class_List_AutoTypeNode__28b2c8eb14* arg_autotype_nodes,int64_t arg_autotype_counter,int64_t arg_goto_label_counter,int64_t arg_local_var_counter);
+            void dtor_FunctionOrMethodConverter_14d05c56fc(void *ptr);
+            
+                struct class_Str meth_FunctionOrMethodConverter_14d05c56fc_to_string(struct class_FunctionOrMethodConverter_14d05c56fc* obj);
+                bool meth_FunctionOrMethodConverter_14d05c56fc_equals(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_FunctionOrMethodConverter_14d05c56fc* var2);
+struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_create_var(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Type_87e1ce5c5e var2, struct class_Location_500c4434c9* var3);
+struct class_Variable_1aaa81c8d2 meth_FunctionOrMethodConverter_14d05c56fc_get_var(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Str var2, struct class__null___Location__87aaae6467 var3);
+struct class_AutoTypeNode_203f67ecfa* meth_FunctionOrMethodConverter_14d05c56fc_find_autotype_root(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_AutoType_33a5d572cb* var2);
+void meth_FunctionOrMethodConverter_14d05c56fc_match_autotypes(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_AutoType_33a5d572cb* var2, struct class_AutoType_33a5d572cb* var3);
+void meth_FunctionOrMethodConverter_14d05c56fc_resolve_autotype(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_AutoType_33a5d572cb* var2, struct class_Type_87e1ce5c5e var3);
+struct class_Type_87e1ce5c5e meth_FunctionOrMethodConverter_14d05c56fc_substitute_autotypes(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Type_87e1ce5c5e var2, bool var3);
+struct class_AutoType_33a5d572cb* meth_FunctionOrMethodConverter_14d05c56fc_create_autotype(struct class_FunctionOrMethodConverter_14d05c56fc* var1);
+struct class_GotoLabel_9654b8ee6d* meth_FunctionOrMethodConverter_14d05c56fc_create_goto_label(struct class_FunctionOrMethodConverter_14d05c56fc* var1);
+struct class_Type_87e1ce5c5e meth_FunctionOrMethodConverter_14d05c56fc_get_type(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Type_e6cf7dd4e5 var2);
+void meth_FunctionOrMethodConverter_14d05c56fc_push_code(struct class_FunctionOrMethodConverter_14d05c56fc* var1);
+struct class_List_Instruction__6e475c861a* meth_FunctionOrMethodConverter_14d05c56fc_pop_code(struct class_FunctionOrMethodConverter_14d05c56fc* var1);
+struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_stringify(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_LocalVariable_846080e5ae* var2);
+struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Str var2, struct class_List_LocalVariable__81e23234f3* var3);
+struct class__null___Type__8438ac3dcf meth_FunctionOrMethodConverter_14d05c56fc_lookup_autotype(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_AutoType_33a5d572cb* var2);
+struct class_TypePair_63e9b86975* meth_FunctionOrMethodConverter_14d05c56fc_do_the_autotype_thing(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Type_87e1ce5c5e var2, struct class_Type_87e1ce5c5e var3);
+struct class__null___LocalVariable__494c1a2e12 meth_FunctionOrMethodConverter_14d05c56fc_implicit_conversion_if_possible(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_LocalVariable_846080e5ae* var2, struct class_Type_87e1ce5c5e var3);
+struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_implicit_conversion(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_LocalVariable_846080e5ae* var2, struct class_Type_87e1ce5c5e var3);
+struct class_List_LocalVariable__81e23234f3* meth_FunctionOrMethodConverter_14d05c56fc_do_args(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_List_LocalVariable__81e23234f3* var2, struct class_List_Type__057f9c6088* var3, struct class_Location_500c4434c9* var4);
+struct class_FunctionType_4e16d0ea53* meth_FunctionOrMethodConverter_14d05c56fc_get_method_functype(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Type_87e1ce5c5e var2, struct class_Str var3);
+struct class_Type_87e1ce5c5e meth_FunctionOrMethodConverter_14d05c56fc_get_attribute_type(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Type_87e1ce5c5e var2, struct class_Str var3);
+struct class__null___LocalVariable__494c1a2e12 meth_FunctionOrMethodConverter_14d05c56fc_do_call(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Call_d0fb9d6234* var2, bool var3);
+struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_not_(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_LocalVariable_846080e5ae* var2);
+struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_bool_constant(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Str var2, struct class_Location_500c4434c9* var3);
+struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_do_binary_op_typed(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_LocalVariable_846080e5ae* var2, struct class_Str var3, struct class_Location_500c4434c9* var4, struct class_LocalVariable_846080e5ae* var5);
+void meth_FunctionOrMethodConverter_14d05c56fc_do_if(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_LocalVariable_846080e5ae* var2, struct class_List_Instruction__6e475c861a* var3, struct class_List_Instruction__6e475c861a* var4);
+struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_do_binary_op(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_BinaryOperator_e25f87d1b5* var2);
+struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_do_expression(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Expression_35f2052bf4 var2);
+struct class_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_do_expression_and_convert(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Expression_35f2052bf4 var2, struct class_Type_87e1ce5c5e var3);
+void meth_FunctionOrMethodConverter_14d05c56fc_do_statement(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Statement_1dc2e7090f var2);
+struct class_List_Instruction__6e475c861a* meth_FunctionOrMethodConverter_14d05c56fc_do_block(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_List_Statement__5d7503c104* var2);
+void meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(struct class_FunctionOrMethodConverter_14d05c56fc* var1, struct class_Variable_1aaa81c8d2 var2);
+void meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_everywhere(struct class_FunctionOrMethodConverter_14d05c56fc* var1);
+
+                #endif
+                
@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "FunctionType_4e16d0ea53.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Type__057f9c6088.h"
+#include "_null___Type__8438ac3dcf.h"
+
+            static struct StringBuf string0_FunctionType_3e8ceab983_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_FunctionType_3e8ceab983 = {
+                .buf = &string0_FunctionType_3e8ceab983_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            struct class_FunctionType_4e16d0ea53* ctor_FunctionType_4e16d0ea53(struct class_List_Type__057f9c6088* arg_argtypes,struct class__null___Type__8438ac3dcf arg_returntype)
+            {
+                struct class_FunctionType_4e16d0ea53* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_argtypes = arg_argtypes;
+obj->memb_returntype = arg_returntype;
+
+                incref(arg_argtypes);
+incref__null___Type__8438ac3dcf(arg_returntype);
+
+                return obj;
+            }
+
+            void dtor_FunctionType_4e16d0ea53(void *ptr)
+            {
+                struct class_FunctionType_4e16d0ea53 *obj = ptr;
+                decref((obj->memb_argtypes), dtor_List_Type__057f9c6088);
+decref__null___Type__8438ac3dcf(obj->memb_returntype);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_FunctionType_4e16d0ea53_to_string(struct class_FunctionType_4e16d0ea53* self)
+                {
+                    struct class_Str res = string0_FunctionType_3e8ceab983;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_List_Type__057f9c6088_to_string(self->memb_argtypes);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__null___Type__8438ac3dcf_to_string(self->memb_returntype);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_FunctionType_4e16d0ea53_equals(struct class_FunctionType_4e16d0ea53* var1, struct class_FunctionType_4e16d0ea53* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,24 @@
+
+                #ifndef HEADER_GUARD_FunctionType_4e16d0ea53
+                #define HEADER_GUARD_FunctionType_4e16d0ea53
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Type__8438ac3dcf.h"
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+
+            struct class_FunctionType_4e16d0ea53 {
+                REFCOUNT_HEADER
+                struct class_List_Type__057f9c6088* memb_argtypes;
+struct class__null___Type__8438ac3dcf memb_returntype;
+
+            };
+            
+            struct class_FunctionType_4e16d0ea53* ctor_FunctionType_4e16d0ea53(struct class_List_Type__057f9c6088* arg_argtypes,struct class__null___Type__8438ac3dcf arg_returntype);
+            void dtor_FunctionType_4e16d0ea53(void *ptr);
+            
+                struct class_Str meth_FunctionType_4e16d0ea53_to_string(struct class_FunctionType_4e16d0ea53* obj);
+                bool meth_FunctionType_4e16d0ea53_equals(struct class_FunctionType_4e16d0ea53* var1, struct class_FunctionType_4e16d0ea53* var2);
+
+                #endif
+                
@@ -0,0 +1,96 @@
+#include <lib/oomph.h>
+#include "GenericSource_35cfcd932e.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Generic_c39b95ec73.h"
+#include "Type_87e1ce5c5e.h"
+
+            static struct StringBuf string0_GenericSource_4a6d7b8094_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x53', '\x6f', '\x75', '\x72', '\x63', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_GenericSource_4a6d7b8094 = {
+                .buf = &string0_GenericSource_4a6d7b8094_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            struct class_GenericSource_35cfcd932e* ctor_GenericSource_35cfcd932e(struct class_Generic_c39b95ec73* arg_generik,struct class_Type_87e1ce5c5e arg_arg)
+            {
+                struct class_GenericSource_35cfcd932e* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_generik = arg_generik;
+obj->memb_arg = arg_arg;
+
+                incref(arg_generik);
+incref_Type_87e1ce5c5e(arg_arg);
+
+                return obj;
+            }
+
+            void dtor_GenericSource_35cfcd932e(void *ptr)
+            {
+                struct class_GenericSource_35cfcd932e *obj = ptr;
+                decref((obj->memb_generik), dtor_Generic_c39b95ec73);
+decref_Type_87e1ce5c5e(obj->memb_arg);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_GenericSource_35cfcd932e_to_string(struct class_GenericSource_35cfcd932e* self)
+                {
+                    struct class_Str res = string0_GenericSource_4a6d7b8094;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Generic_c39b95ec73_to_string(self->memb_generik);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_arg);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_GenericSource_35cfcd932e_equals(struct class_GenericSource_35cfcd932e* var1, struct class_GenericSource_35cfcd932e* var2){struct class_Generic_c39b95ec73* var3;
+var3 = NULL;
+struct class_Generic_c39b95ec73* var4;
+var4 = NULL;
+bool var5;
+bool var7;
+struct class_Type_87e1ce5c5e var9;
+var9.membernum = -1;
+struct class_Type_87e1ce5c5e var10;
+var10.membernum = -1;
+bool var11;
+bool retval;
+var3 = var1->memb_generik;
+incref(var3);
+var4 = var2->memb_generik;
+incref(var4);
+var5 = meth_Generic_c39b95ec73_equals(var3,var4);
+if (var5) goto label6;
+var7 = oomph_false;
+if (oomph_true) goto label8;
+label6: (void)0;
+var9 = var1->memb_arg;
+incref_Type_87e1ce5c5e(var9);
+var10 = var2->memb_arg;
+incref_Type_87e1ce5c5e(var10);
+var11 = meth_Type_87e1ce5c5e_equals(var9,var10);
+var7 = var11;
+label8: (void)0;
+(void)0; retval = var7; goto out;
+out: (void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var10);
+decref_Type_87e1ce5c5e(var9);
+(void)0;
+(void)0;
+decref((var4), dtor_Generic_c39b95ec73);
+decref((var3), dtor_Generic_c39b95ec73);
+return retval;
+}
@@ -0,0 +1,26 @@
+
+                #ifndef HEADER_GUARD_GenericSource_35cfcd932e
+                #define HEADER_GUARD_GenericSource_35cfcd932e
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+struct class_Generic_c39b95ec73;
+struct class_Generic_c39b95ec73;
+struct class_Generic_c39b95ec73;
+struct class_Generic_c39b95ec73;
+
+            struct class_GenericSource_35cfcd932e {
+                REFCOUNT_HEADER
+                struct class_Generic_c39b95ec73* memb_generik;
+struct class_Type_87e1ce5c5e memb_arg;
+
+            };
+            
+            struct class_GenericSource_35cfcd932e* ctor_GenericSource_35cfcd932e(struct class_Generic_c39b95ec73* arg_generik,struct class_Type_87e1ce5c5e arg_arg);
+            void dtor_GenericSource_35cfcd932e(void *ptr);
+            
+                struct class_Str meth_GenericSource_35cfcd932e_to_string(struct class_GenericSource_35cfcd932e* obj);
+                bool meth_GenericSource_35cfcd932e_equals(struct class_GenericSource_35cfcd932e* var1, struct class_GenericSource_35cfcd932e* var2);
+
+                #endif
+                
@@ -0,0 +1,72 @@
+#include <lib/oomph.h>
+#include "GenericType_f44d8197cb.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_500c4434c9.h"
+#include "Type_e6cf7dd4e5.h"
+
+            static struct StringBuf string0_GenericType_29474bcf38_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_GenericType_29474bcf38 = {
+                .buf = &string0_GenericType_29474bcf38_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            struct class_GenericType_f44d8197cb* ctor_GenericType_f44d8197cb(struct class_Location_500c4434c9* arg_location,struct class_Str arg_name,struct class_Type_e6cf7dd4e5 arg_arg)
+            {
+                struct class_GenericType_f44d8197cb* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+obj->memb_arg = arg_arg;
+
+                incref(arg_location);
+string_incref(arg_name);
+incref_Type_e6cf7dd4e5(arg_arg);
+
+                return obj;
+            }
+
+            void dtor_GenericType_f44d8197cb(void *ptr)
+            {
+                struct class_GenericType_f44d8197cb *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+string_decref(obj->memb_name);
+decref_Type_e6cf7dd4e5(obj->memb_arg);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_GenericType_f44d8197cb_to_string(struct class_GenericType_f44d8197cb* self)
+                {
+                    struct class_Str res = string0_GenericType_29474bcf38;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_e6cf7dd4e5_to_string(self->memb_arg);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_GenericType_f44d8197cb_equals(struct class_GenericType_f44d8197cb* var1, struct class_GenericType_f44d8197cb* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
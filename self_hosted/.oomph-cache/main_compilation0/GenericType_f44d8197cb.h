@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_GenericType_f44d8197cb
+                #define HEADER_GUARD_GenericType_f44d8197cb
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_e6cf7dd4e5.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_GenericType_f44d8197cb {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Str memb_name;
+struct class_Type_e6cf7dd4e5 memb_arg;
+
+            };
+            
+            struct class_GenericType_f44d8197cb* ctor_GenericType_f44d8197cb(struct class_Location_500c4434c9* arg_location,struct class_Str arg_name,struct class_Type_e6cf7dd4e5 arg_arg);
+            void dtor_GenericType_f44d8197cb(void *ptr);
+            
+                struct class_Str meth_GenericType_f44d8197cb_to_string(struct class_GenericType_f44d8197cb* obj);
+                bool meth_GenericType_f44d8197cb_equals(struct class_GenericType_f44d8197cb* var1, struct class_GenericType_f44d8197cb* var2);
+
+                #endif
+                
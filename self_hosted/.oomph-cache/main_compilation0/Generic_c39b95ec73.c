@@ -0,0 +1,56 @@
+#include <lib/oomph.h>
+#include "Generic_c39b95ec73.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Generic_d54c461c45_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Generic_d54c461c45 = {
+                .buf = &string0_Generic_d54c461c45_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            struct class_Generic_c39b95ec73* ctor_Generic_c39b95ec73(struct class_Str arg_name)
+            {
+                struct class_Generic_c39b95ec73* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_name = arg_name;
+
+                string_incref(arg_name);
+
+                return obj;
+            }
+
+            void dtor_Generic_c39b95ec73(void *ptr)
+            {
+                struct class_Generic_c39b95ec73 *obj = ptr;
+                string_decref(obj->memb_name);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Generic_c39b95ec73_to_string(struct class_Generic_c39b95ec73* self)
+                {
+                    struct class_Str res = string0_Generic_d54c461c45;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Generic_c39b95ec73_equals(struct class_Generic_c39b95ec73* var1, struct class_Generic_c39b95ec73* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,20 @@
+
+                #ifndef HEADER_GUARD_Generic_c39b95ec73
+                #define HEADER_GUARD_Generic_c39b95ec73
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Generic_c39b95ec73 {
+                REFCOUNT_HEADER
+                struct class_Str memb_name;
+
+            };
+            
+            struct class_Generic_c39b95ec73* ctor_Generic_c39b95ec73(struct class_Str arg_name);
+            void dtor_Generic_c39b95ec73(void *ptr);
+            
+                struct class_Str meth_Generic_c39b95ec73_to_string(struct class_Generic_c39b95ec73* obj);
+                bool meth_Generic_c39b95ec73_equals(struct class_Generic_c39b95ec73* var1, struct class_Generic_c39b95ec73* var2);
+
+                #endif
+                
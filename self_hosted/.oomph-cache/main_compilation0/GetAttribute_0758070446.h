@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_GetAttribute_0758070446
+                #define HEADER_GUARD_GetAttribute_0758070446
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_GetAttribute_0758070446 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_attribute_location;
+struct class_Expression_35f2052bf4 memb_obj;
+struct class_Str memb_attribute;
+
+            };
+            
+            struct class_GetAttribute_0758070446* ctor_GetAttribute_0758070446(struct class_Location_500c4434c9* arg_attribute_location,struct class_Expression_35f2052bf4 arg_obj,struct class_Str arg_attribute);
+            void dtor_GetAttribute_0758070446(void *ptr);
+            
+                struct class_Str meth_GetAttribute_0758070446_to_string(struct class_GetAttribute_0758070446* obj);
+                bool meth_GetAttribute_0758070446_equals(struct class_GetAttribute_0758070446* var1, struct class_GetAttribute_0758070446* var2);
+
+                #endif
+                
@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "GetAttribute_3d0cc1bf97.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf string0_GetAttribute_2d76f9adcc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x65', '\x74', '\x41', '\x74', '\x74', '\x72', '\x69', '\x62', '\x75', '\x74', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_GetAttribute_2d76f9adcc = {
+                .buf = &string0_GetAttribute_2d76f9adcc_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            struct class_GetAttribute_3d0cc1bf97* ctor_GetAttribute_3d0cc1bf97(struct class_LocalVariable_846080e5ae* arg_obj,struct class_LocalVariable_846080e5ae* arg_result,struct class_Str arg_attribute)
+            {
+                struct class_GetAttribute_3d0cc1bf97* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_obj = arg_obj;
+obj->memb_result = arg_result;
+obj->memb_attribute = arg_attribute;
+
+                incref(arg_obj);
+incref(arg_result);
+string_incref(arg_attribute);
+
+                return obj;
+            }
+
+            void dtor_GetAttribute_3d0cc1bf97(void *ptr)
+            {
+                struct class_GetAttribute_3d0cc1bf97 *obj = ptr;
+                decref((obj->memb_obj), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+string_decref(obj->memb_attribute);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_GetAttribute_3d0cc1bf97_to_string(struct class_GetAttribute_3d0cc1bf97* self)
+                {
+                    struct class_Str res = string0_GetAttribute_2d76f9adcc;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_obj);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_result);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_attribute);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_GetAttribute_3d0cc1bf97_equals(struct class_GetAttribute_3d0cc1bf97* var1, struct class_GetAttribute_3d0cc1bf97* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
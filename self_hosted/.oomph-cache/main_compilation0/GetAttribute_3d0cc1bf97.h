@@ -0,0 +1,26 @@
+
+                #ifndef HEADER_GUARD_GetAttribute_3d0cc1bf97
+                #define HEADER_GUARD_GetAttribute_3d0cc1bf97
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+
+            struct class_GetAttribute_3d0cc1bf97 {
+                REFCOUNT_HEADER
+                struct class_LocalVariable_846080e5ae* memb_obj;
+struct class_LocalVariable_846080e5ae* memb_result;
+struct class_Str memb_attribute;
+
+            };
+            
+            struct class_GetAttribute_3d0cc1bf97* ctor_GetAttribute_3d0cc1bf97(struct class_LocalVariable_846080e5ae* arg_obj,struct class_LocalVariable_846080e5ae* arg_result,struct class_Str arg_attribute);
+            void dtor_GetAttribute_3d0cc1bf97(void *ptr);
+            
+                struct class_Str meth_GetAttribute_3d0cc1bf97_to_string(struct class_GetAttribute_3d0cc1bf97* obj);
+                bool meth_GetAttribute_3d0cc1bf97_equals(struct class_GetAttribute_3d0cc1bf97* var1, struct class_GetAttribute_3d0cc1bf97* var2);
+
+                #endif
+                
@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "GetFromUnion_b0861b839c.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf string0_GetFromUnion_e0dce2ce13_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x65', '\x74', '\x46', '\x72', '\x6f', '\x6d', '\x55', '\x6e', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string0_GetFromUnion_e0dce2ce13 = {
+                .buf = &string0_GetFromUnion_e0dce2ce13_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            struct class_GetFromUnion_b0861b839c* ctor_GetFromUnion_b0861b839c(struct class_LocalVariable_846080e5ae* arg_result,struct class_LocalVariable_846080e5ae* arg_union_var)
+            {
+                struct class_GetFromUnion_b0861b839c* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_result = arg_result;
+obj->memb_union_var = arg_union_var;
+
+                incref(arg_result);
+incref(arg_union_var);
+
+                return obj;
+            }
+
+            void dtor_GetFromUnion_b0861b839c(void *ptr)
+            {
+                struct class_GetFromUnion_b0861b839c *obj = ptr;
+                decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_union_var), dtor_LocalVariable_846080e5ae);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_GetFromUnion_b0861b839c_to_string(struct class_GetFromUnion_b0861b839c* self)
+                {
+                    struct class_Str res = string0_GetFromUnion_e0dce2ce13;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_result);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_union_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_GetFromUnion_b0861b839c_equals(struct class_GetFromUnion_b0861b839c* var1, struct class_GetFromUnion_b0861b839c* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
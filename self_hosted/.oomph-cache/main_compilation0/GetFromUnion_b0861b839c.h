@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_GetFromUnion_b0861b839c
+                #define HEADER_GUARD_GetFromUnion_b0861b839c
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+
+            struct class_GetFromUnion_b0861b839c {
+                REFCOUNT_HEADER
+                struct class_LocalVariable_846080e5ae* memb_result;
+struct class_LocalVariable_846080e5ae* memb_union_var;
+
+            };
+            
+            struct class_GetFromUnion_b0861b839c* ctor_GetFromUnion_b0861b839c(struct class_LocalVariable_846080e5ae* arg_result,struct class_LocalVariable_846080e5ae* arg_union_var);
+            void dtor_GetFromUnion_b0861b839c(void *ptr);
+            
+                struct class_Str meth_GetFromUnion_b0861b839c_to_string(struct class_GetFromUnion_b0861b839c* obj);
+                bool meth_GetFromUnion_b0861b839c_equals(struct class_GetFromUnion_b0861b839c* var1, struct class_GetFromUnion_b0861b839c* var2);
+
+                #endif
+                
@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "GetVar_642f116a6c.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_GetVar_14e6362d91_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x65', '\x74', '\x56', '\x61', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_GetVar_14e6362d91 = {
+                .buf = &string0_GetVar_14e6362d91_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_GetVar_642f116a6c* ctor_GetVar_642f116a6c(struct class_Location_500c4434c9* arg_location,struct class_Str arg_varname)
+            {
+                struct class_GetVar_642f116a6c* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_varname = arg_varname;
+
+                incref(arg_location);
+string_incref(arg_varname);
+
+                return obj;
+            }
+
+            void dtor_GetVar_642f116a6c(void *ptr)
+            {
+                struct class_GetVar_642f116a6c *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+string_decref(obj->memb_varname);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_GetVar_642f116a6c_to_string(struct class_GetVar_642f116a6c* self)
+                {
+                    struct class_Str res = string0_GetVar_14e6362d91;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_varname);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_GetVar_642f116a6c_equals(struct class_GetVar_642f116a6c* var1, struct class_GetVar_642f116a6c* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_GetVar_642f116a6c
+                #define HEADER_GUARD_GetVar_642f116a6c
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_GetVar_642f116a6c {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Str memb_varname;
+
+            };
+            
+            struct class_GetVar_642f116a6c* ctor_GetVar_642f116a6c(struct class_Location_500c4434c9* arg_location,struct class_Str arg_varname);
+            void dtor_GetVar_642f116a6c(void *ptr);
+            
+                struct class_Str meth_GetVar_642f116a6c_to_string(struct class_GetVar_642f116a6c* obj);
+                bool meth_GetVar_642f116a6c_equals(struct class_GetVar_642f116a6c* var1, struct class_GetVar_642f116a6c* var2);
+
+                #endif
+                
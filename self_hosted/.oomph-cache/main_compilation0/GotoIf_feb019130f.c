@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "GotoIf_feb019130f.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "GotoLabel_9654b8ee6d.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf string0_GotoIf_f6baff0a87_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x6f', '\x74', '\x6f', '\x49', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string0_GotoIf_f6baff0a87 = {
+                .buf = &string0_GotoIf_f6baff0a87_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_GotoIf_feb019130f* ctor_GotoIf_feb019130f(struct class_GotoLabel_9654b8ee6d* arg_label,struct class_LocalVariable_846080e5ae* arg_cond)
+            {
+                struct class_GotoIf_feb019130f* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_label = arg_label;
+obj->memb_cond = arg_cond;
+
+                incref(arg_label);
+incref(arg_cond);
+
+                return obj;
+            }
+
+            void dtor_GotoIf_feb019130f(void *ptr)
+            {
+                struct class_GotoIf_feb019130f *obj = ptr;
+                decref((obj->memb_label), dtor_GotoLabel_9654b8ee6d);
+decref((obj->memb_cond), dtor_LocalVariable_846080e5ae);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_GotoIf_feb019130f_to_string(struct class_GotoIf_feb019130f* self)
+                {
+                    struct class_Str res = string0_GotoIf_f6baff0a87;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_GotoLabel_9654b8ee6d_to_string(self->memb_label);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_cond);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_GotoIf_feb019130f_equals(struct class_GotoIf_feb019130f* var1, struct class_GotoIf_feb019130f* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_GotoIf_feb019130f
+                #define HEADER_GUARD_GotoIf_feb019130f
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_GotoLabel_9654b8ee6d;
+struct class_LocalVariable_846080e5ae;
+struct class_GotoLabel_9654b8ee6d;
+struct class_LocalVariable_846080e5ae;
+
+            struct class_GotoIf_feb019130f {
+                REFCOUNT_HEADER
+                struct class_GotoLabel_9654b8ee6d* memb_label;
+struct class_LocalVariable_846080e5ae* memb_cond;
+
+            };
+            
+            struct class_GotoIf_feb019130f* ctor_GotoIf_feb019130f(struct class_GotoLabel_9654b8ee6d* arg_label,struct class_LocalVariable_846080e5ae* arg_cond);
+            void dtor_GotoIf_feb019130f(void *ptr);
+            
+                struct class_Str meth_GotoIf_feb019130f_to_string(struct class_GotoIf_feb019130f* obj);
+                bool meth_GotoIf_feb019130f_equals(struct class_GotoIf_feb019130f* var1, struct class_GotoIf_feb019130f* var2);
+
+                #endif
+                
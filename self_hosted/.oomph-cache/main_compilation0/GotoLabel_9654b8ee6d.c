@@ -0,0 +1,56 @@
+#include <lib/oomph.h>
+#include "GotoLabel_9654b8ee6d.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_GotoLabel_5f2533af7e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x6f', '\x74', '\x6f', '\x4c', '\x61', '\x62', '\x65', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_GotoLabel_5f2533af7e = {
+                .buf = &string0_GotoLabel_5f2533af7e_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            struct class_GotoLabel_9654b8ee6d* ctor_GotoLabel_9654b8ee6d(int64_t arg_id)
+            {
+                struct class_GotoLabel_9654b8ee6d* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_id = arg_id;
+
+                (void)0;
+
+                return obj;
+            }
+
+            void dtor_GotoLabel_9654b8ee6d(void *ptr)
+            {
+                struct class_GotoLabel_9654b8ee6d *obj = ptr;
+                (void)0;
+
+                free(obj);
+            }
+            
+                struct class_Str meth_GotoLabel_9654b8ee6d_to_string(struct class_GotoLabel_9654b8ee6d* self)
+                {
+                    struct class_Str res = string0_GotoLabel_5f2533af7e;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_id);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_GotoLabel_9654b8ee6d_equals(struct class_GotoLabel_9654b8ee6d* var1, struct class_GotoLabel_9654b8ee6d* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
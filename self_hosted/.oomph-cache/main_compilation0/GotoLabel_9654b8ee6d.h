@@ -0,0 +1,20 @@
+
+                #ifndef HEADER_GUARD_GotoLabel_9654b8ee6d
+                #define HEADER_GUARD_GotoLabel_9654b8ee6d
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_GotoLabel_9654b8ee6d {
+                REFCOUNT_HEADER
+                int64_t memb_id;
+
+            };
+            
+            struct class_GotoLabel_9654b8ee6d* ctor_GotoLabel_9654b8ee6d(int64_t arg_id);
+            void dtor_GotoLabel_9654b8ee6d(void *ptr);
+            
+                struct class_Str meth_GotoLabel_9654b8ee6d_to_string(struct class_GotoLabel_9654b8ee6d* obj);
+                bool meth_GotoLabel_9654b8ee6d_equals(struct class_GotoLabel_9654b8ee6d* var1, struct class_GotoLabel_9654b8ee6d* var2);
+
+                #endif
+                
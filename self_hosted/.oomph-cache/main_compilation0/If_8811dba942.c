@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "If_8811dba942.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_ConditionAndBody__ad79dde1db.h"
+#include "List_Statement__5d7503c104.h"
+
+            static struct StringBuf string0_If_1f599c17a2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string0_If_1f599c17a2 = {
+                .buf = &string0_If_1f599c17a2_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            struct class_If_8811dba942* ctor_If_8811dba942(struct class_List_ConditionAndBody__ad79dde1db* arg_ifs_and_elifs,struct class_List_Statement__5d7503c104* arg_else_block)
+            {
+                struct class_If_8811dba942* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_ifs_and_elifs = arg_ifs_and_elifs;
+obj->memb_else_block = arg_else_block;
+
+                incref(arg_ifs_and_elifs);
+incref(arg_else_block);
+
+                return obj;
+            }
+
+            void dtor_If_8811dba942(void *ptr)
+            {
+                struct class_If_8811dba942 *obj = ptr;
+                decref((obj->memb_ifs_and_elifs), dtor_List_ConditionAndBody__ad79dde1db);
+decref((obj->memb_else_block), dtor_List_Statement__5d7503c104);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_If_8811dba942_to_string(struct class_If_8811dba942* self)
+                {
+                    struct class_Str res = string0_If_1f599c17a2;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_List_ConditionAndBody__ad79dde1db_to_string(self->memb_ifs_and_elifs);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Statement__5d7503c104_to_string(self->memb_else_block);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_If_8811dba942_equals(struct class_If_8811dba942* var1, struct class_If_8811dba942* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_If_8811dba942
+                #define HEADER_GUARD_If_8811dba942
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_ConditionAndBody__ad79dde1db;
+struct class_List_Statement__5d7503c104;
+struct class_List_ConditionAndBody__ad79dde1db;
+struct class_List_Statement__5d7503c104;
+
+            struct class_If_8811dba942 {
+                REFCOUNT_HEADER
+                struct class_List_ConditionAndBody__ad79dde1db* memb_ifs_and_elifs;
+struct class_List_Statement__5d7503c104* memb_else_block;
+
+            };
+            
+            struct class_If_8811dba942* ctor_If_8811dba942(struct class_List_ConditionAndBody__ad79dde1db* arg_ifs_and_elifs,struct class_List_Statement__5d7503c104* arg_else_block);
+            void dtor_If_8811dba942(void *ptr);
+            
+                struct class_Str meth_If_8811dba942_to_string(struct class_If_8811dba942* obj);
+                bool meth_If_8811dba942_equals(struct class_If_8811dba942* var1, struct class_If_8811dba942* var2);
+
+                #endif
+                
@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "Import_6056d7e9c9.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_Import_b970433d70_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6d', '\x70', '\x6f', '\x72', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Import_b970433d70 = {
+                .buf = &string0_Import_b970433d70_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_Import_6056d7e9c9* ctor_Import_6056d7e9c9(struct class_Location_500c4434c9* arg_location,struct class_Str arg_path,struct class_Str arg_name)
+            {
+                struct class_Import_6056d7e9c9* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_path = arg_path;
+obj->memb_name = arg_name;
+
+                incref(arg_location);
+string_incref(arg_path);
+string_incref(arg_name);
+
+                return obj;
+            }
+
+            void dtor_Import_6056d7e9c9(void *ptr)
+            {
+                struct class_Import_6056d7e9c9 *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+string_decref(obj->memb_path);
+string_decref(obj->memb_name);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Import_6056d7e9c9_to_string(struct class_Import_6056d7e9c9* self)
+                {
+                    struct class_Str res = string0_Import_b970433d70;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_path);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Import_6056d7e9c9_equals(struct class_Import_6056d7e9c9* var1, struct class_Import_6056d7e9c9* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,24 @@
+
+                #ifndef HEADER_GUARD_Import_6056d7e9c9
+                #define HEADER_GUARD_Import_6056d7e9c9
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_Import_6056d7e9c9 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Str memb_path;
+struct class_Str memb_name;
+
+            };
+            
+            struct class_Import_6056d7e9c9* ctor_Import_6056d7e9c9(struct class_Location_500c4434c9* arg_location,struct class_Str arg_path,struct class_Str arg_name);
+            void dtor_Import_6056d7e9c9(void *ptr);
+            
+                struct class_Str meth_Import_6056d7e9c9_to_string(struct class_Import_6056d7e9c9* obj);
+                bool meth_Import_6056d7e9c9_equals(struct class_Import_6056d7e9c9* var1, struct class_Import_6056d7e9c9* var2);
+
+                #endif
+                
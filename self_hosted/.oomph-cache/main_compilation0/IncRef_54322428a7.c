@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "IncRef_54322428a7.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf string0_IncRef_9b574e8ff6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6e', '\x63', '\x52', '\x65', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string0_IncRef_9b574e8ff6 = {
+                .buf = &string0_IncRef_9b574e8ff6_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_IncRef_54322428a7* ctor_IncRef_54322428a7(struct class_LocalVariable_846080e5ae* arg_var)
+            {
+                struct class_IncRef_54322428a7* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_var = arg_var;
+
+                incref(arg_var);
+
+                return obj;
+            }
+
+            void dtor_IncRef_54322428a7(void *ptr)
+            {
+                struct class_IncRef_54322428a7 *obj = ptr;
+                decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_IncRef_54322428a7_to_string(struct class_IncRef_54322428a7* self)
+                {
+                    struct class_Str res = string0_IncRef_9b574e8ff6;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_IncRef_54322428a7_equals(struct class_IncRef_54322428a7* var1, struct class_IncRef_54322428a7* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
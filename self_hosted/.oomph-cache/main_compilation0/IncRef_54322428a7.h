@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_IncRef_54322428a7
+                #define HEADER_GUARD_IncRef_54322428a7
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+
+            struct class_IncRef_54322428a7 {
+                REFCOUNT_HEADER
+                struct class_LocalVariable_846080e5ae* memb_var;
+
+            };
+            
+            struct class_IncRef_54322428a7* ctor_IncRef_54322428a7(struct class_LocalVariable_846080e5ae* arg_var);
+            void dtor_IncRef_54322428a7(void *ptr);
+            
+                struct class_Str meth_IncRef_54322428a7_to_string(struct class_IncRef_54322428a7* obj);
+                bool meth_IncRef_54322428a7_equals(struct class_IncRef_54322428a7* var1, struct class_IncRef_54322428a7* var2);
+
+                #endif
+                
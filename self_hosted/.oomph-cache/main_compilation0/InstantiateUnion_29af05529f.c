@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "InstantiateUnion_29af05529f.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf string0_InstantiateUnion_ef06853a8b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6e', '\x73', '\x74', '\x61', '\x6e', '\x74', '\x69', '\x61', '\x74', '\x65', '\x55', '\x6e', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string0_InstantiateUnion_ef06853a8b = {
+                .buf = &string0_InstantiateUnion_ef06853a8b_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            struct class_InstantiateUnion_29af05529f* ctor_InstantiateUnion_29af05529f(struct class_LocalVariable_846080e5ae* arg_result,struct class_LocalVariable_846080e5ae* arg_value)
+            {
+                struct class_InstantiateUnion_29af05529f* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_result = arg_result;
+obj->memb_value = arg_value;
+
+                incref(arg_result);
+incref(arg_value);
+
+                return obj;
+            }
+
+            void dtor_InstantiateUnion_29af05529f(void *ptr)
+            {
+                struct class_InstantiateUnion_29af05529f *obj = ptr;
+                decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_value), dtor_LocalVariable_846080e5ae);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_InstantiateUnion_29af05529f_to_string(struct class_InstantiateUnion_29af05529f* self)
+                {
+                    struct class_Str res = string0_InstantiateUnion_ef06853a8b;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_result);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_InstantiateUnion_29af05529f_equals(struct class_InstantiateUnion_29af05529f* var1, struct class_InstantiateUnion_29af05529f* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
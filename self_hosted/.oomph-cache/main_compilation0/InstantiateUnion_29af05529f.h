@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_InstantiateUnion_29af05529f
+                #define HEADER_GUARD_InstantiateUnion_29af05529f
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+
+            struct class_InstantiateUnion_29af05529f {
+                REFCOUNT_HEADER
+                struct class_LocalVariable_846080e5ae* memb_result;
+struct class_LocalVariable_846080e5ae* memb_value;
+
+            };
+            
+            struct class_InstantiateUnion_29af05529f* ctor_InstantiateUnion_29af05529f(struct class_LocalVariable_846080e5ae* arg_result,struct class_LocalVariable_846080e5ae* arg_value);
+            void dtor_InstantiateUnion_29af05529f(void *ptr);
+            
+                struct class_Str meth_InstantiateUnion_29af05529f_to_string(struct class_InstantiateUnion_29af05529f* obj);
+                bool meth_InstantiateUnion_29af05529f_equals(struct class_InstantiateUnion_29af05529f* var1, struct class_InstantiateUnion_29af05529f* var2);
+
+                #endif
+                
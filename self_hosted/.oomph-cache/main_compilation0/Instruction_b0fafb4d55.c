@@ -0,0 +1,389 @@
+#include <lib/oomph.h>
+#include "Instruction_b0fafb4d55.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "ConstructorCall_f8e441a21d.h"
+#include "DecRef_f37e9a69d2.h"
+#include "FloatConstant_652a176e04.h"
+#include "FunctionCall_104f394575.h"
+#include "GetAttribute_3d0cc1bf97.h"
+#include "GetFromUnion_b0861b839c.h"
+#include "GotoIf_feb019130f.h"
+#include "GotoLabel_9654b8ee6d.h"
+#include "IncRef_54322428a7.h"
+#include "InstantiateUnion_29af05529f.h"
+#include "IntConstant_817d6312f0.h"
+#include "MethodCall_b0095be49c.h"
+#include "PointersEqual_deb0abf3fc.h"
+#include "Return_aa2d9b1c64.h"
+#include "SetAttribute_25344a82b6.h"
+#include "StringConstant_e1466967c8.h"
+#include "UnSet_a1ce71f609.h"
+#include "UnionMemberCheck_7021628c40.h"
+#include "VarCpy_e77a538911.h"
+
+            static struct StringBuf string0_Instruction_9eb47e4f2e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6e', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Instruction_9eb47e4f2e = {
+                .buf = &string0_Instruction_9eb47e4f2e_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_Instruction_b0fafb4d55_to_string(struct class_Instruction_b0fafb4d55 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_ConstructorCall_f8e441a21d_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_DecRef_f37e9a69d2_to_string(obj.val.item1);
+                    break;
+                
+                case 2:
+                    valstr = meth_FloatConstant_652a176e04_to_string(obj.val.item2);
+                    break;
+                
+                case 3:
+                    valstr = meth_FunctionCall_104f394575_to_string(obj.val.item3);
+                    break;
+                
+                case 4:
+                    valstr = meth_GetAttribute_3d0cc1bf97_to_string(obj.val.item4);
+                    break;
+                
+                case 5:
+                    valstr = meth_GetFromUnion_b0861b839c_to_string(obj.val.item5);
+                    break;
+                
+                case 6:
+                    valstr = meth_GotoIf_feb019130f_to_string(obj.val.item6);
+                    break;
+                
+                case 7:
+                    valstr = meth_GotoLabel_9654b8ee6d_to_string(obj.val.item7);
+                    break;
+                
+                case 8:
+                    valstr = meth_IncRef_54322428a7_to_string(obj.val.item8);
+                    break;
+                
+                case 9:
+                    valstr = meth_InstantiateUnion_29af05529f_to_string(obj.val.item9);
+                    break;
+                
+                case 10:
+                    valstr = meth_IntConstant_817d6312f0_to_string(obj.val.item10);
+                    break;
+                
+                case 11:
+                    valstr = meth_MethodCall_b0095be49c_to_string(obj.val.item11);
+                    break;
+                
+                case 12:
+                    valstr = meth_PointersEqual_deb0abf3fc_to_string(obj.val.item12);
+                    break;
+                
+                case 13:
+                    valstr = meth_Return_aa2d9b1c64_to_string(obj.val.item13);
+                    break;
+                
+                case 14:
+                    valstr = meth_SetAttribute_25344a82b6_to_string(obj.val.item14);
+                    break;
+                
+                case 15:
+                    valstr = meth_StringConstant_e1466967c8_to_string(obj.val.item15);
+                    break;
+                
+                case 16:
+                    valstr = meth_UnSet_a1ce71f609_to_string(obj.val.item16);
+                    break;
+                
+                case 17:
+                    valstr = meth_UnionMemberCheck_7021628c40_to_string(obj.val.item17);
+                    break;
+                
+                case 18:
+                    valstr = meth_VarCpy_e77a538911_to_string(obj.val.item18);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Instruction_9eb47e4f2e), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_Instruction_9eb47e4f2e;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_Instruction_b0fafb4d55_equals(struct class_Instruction_b0fafb4d55 a, struct class_Instruction_b0fafb4d55 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_ConstructorCall_f8e441a21d_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_DecRef_f37e9a69d2_equals(
+                        a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_FloatConstant_652a176e04_equals(
+                        a.val.item2, b.val.item2);
+                
+                case 3:
+                    return meth_FunctionCall_104f394575_equals(
+                        a.val.item3, b.val.item3);
+                
+                case 4:
+                    return meth_GetAttribute_3d0cc1bf97_equals(
+                        a.val.item4, b.val.item4);
+                
+                case 5:
+                    return meth_GetFromUnion_b0861b839c_equals(
+                        a.val.item5, b.val.item5);
+                
+                case 6:
+                    return meth_GotoIf_feb019130f_equals(
+                        a.val.item6, b.val.item6);
+                
+                case 7:
+                    return meth_GotoLabel_9654b8ee6d_equals(
+                        a.val.item7, b.val.item7);
+                
+                case 8:
+                    return meth_IncRef_54322428a7_equals(
+                        a.val.item8, b.val.item8);
+                
+                case 9:
+                    return meth_InstantiateUnion_29af05529f_equals(
+                        a.val.item9, b.val.item9);
+                
+                case 10:
+                    return meth_IntConstant_817d6312f0_equals(
+                        a.val.item10, b.val.item10);
+                
+                case 11:
+                    return meth_MethodCall_b0095be49c_equals(
+                        a.val.item11, b.val.item11);
+                
+                case 12:
+                    return meth_PointersEqual_deb0abf3fc_equals(
+                        a.val.item12, b.val.item12);
+                
+                case 13:
+                    return meth_Return_aa2d9b1c64_equals(
+                        a.val.item13, b.val.item13);
+                
+                case 14:
+                    return meth_SetAttribute_25344a82b6_equals(
+                        a.val.item14, b.val.item14);
+                
+                case 15:
+                    return meth_StringConstant_e1466967c8_equals(
+                        a.val.item15, b.val.item15);
+                
+                case 16:
+                    return meth_UnSet_a1ce71f609_equals(
+                        a.val.item16, b.val.item16);
+                
+                case 17:
+                    return meth_UnionMemberCheck_7021628c40_equals(
+                        a.val.item17, b.val.item17);
+                
+                case 18:
+                    return meth_VarCpy_e77a538911_equals(
+                        a.val.item18, b.val.item18);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Instruction_9eb47e4f2e), (int)a.membernum);
+                }
+            }
+            
+            void incref_Instruction_b0fafb4d55(struct class_Instruction_b0fafb4d55 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                case 2:
+                    incref(obj.val.item2);
+                    break;
+                
+                case 3:
+                    incref(obj.val.item3);
+                    break;
+                
+                case 4:
+                    incref(obj.val.item4);
+                    break;
+                
+                case 5:
+                    incref(obj.val.item5);
+                    break;
+                
+                case 6:
+                    incref(obj.val.item6);
+                    break;
+                
+                case 7:
+                    incref(obj.val.item7);
+                    break;
+                
+                case 8:
+                    incref(obj.val.item8);
+                    break;
+                
+                case 9:
+                    incref(obj.val.item9);
+                    break;
+                
+                case 10:
+                    incref(obj.val.item10);
+                    break;
+                
+                case 11:
+                    incref(obj.val.item11);
+                    break;
+                
+                case 12:
+                    incref(obj.val.item12);
+                    break;
+                
+                case 13:
+                    incref(obj.val.item13);
+                    break;
+                
+                case 14:
+                    incref(obj.val.item14);
+                    break;
+                
+                case 15:
+                    incref(obj.val.item15);
+                    break;
+                
+                case 16:
+                    incref(obj.val.item16);
+                    break;
+                
+                case 17:
+                    incref(obj.val.item17);
+                    break;
+                
+                case 18:
+                    incref(obj.val.item18);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_Instruction_b0fafb4d55(struct class_Instruction_b0fafb4d55 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_ConstructorCall_f8e441a21d);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_DecRef_f37e9a69d2);
+                    break;
+                
+                case 2:
+                    decref((obj.val.item2), dtor_FloatConstant_652a176e04);
+                    break;
+                
+                case 3:
+                    decref((obj.val.item3), dtor_FunctionCall_104f394575);
+                    break;
+                
+                case 4:
+                    decref((obj.val.item4), dtor_GetAttribute_3d0cc1bf97);
+                    break;
+                
+                case 5:
+                    decref((obj.val.item5), dtor_GetFromUnion_b0861b839c);
+                    break;
+                
+                case 6:
+                    decref((obj.val.item6), dtor_GotoIf_feb019130f);
+                    break;
+                
+                case 7:
+                    decref((obj.val.item7), dtor_GotoLabel_9654b8ee6d);
+                    break;
+                
+                case 8:
+                    decref((obj.val.item8), dtor_IncRef_54322428a7);
+                    break;
+                
+                case 9:
+                    decref((obj.val.item9), dtor_InstantiateUnion_29af05529f);
+                    break;
+                
+                case 10:
+                    decref((obj.val.item10), dtor_IntConstant_817d6312f0);
+                    break;
+                
+                case 11:
+                    decref((obj.val.item11), dtor_MethodCall_b0095be49c);
+                    break;
+                
+                case 12:
+                    decref((obj.val.item12), dtor_PointersEqual_deb0abf3fc);
+                    break;
+                
+                case 13:
+                    decref((obj.val.item13), dtor_Return_aa2d9b1c64);
+                    break;
+                
+                case 14:
+                    decref((obj.val.item14), dtor_SetAttribute_25344a82b6);
+                    break;
+                
+                case 15:
+                    decref((obj.val.item15), dtor_StringConstant_e1466967c8);
+                    break;
+                
+                case 16:
+                    decref((obj.val.item16), dtor_UnSet_a1ce71f609);
+                    break;
+                
+                case 17:
+                    decref((obj.val.item17), dtor_UnionMemberCheck_7021628c40);
+                    break;
+                
+                case 18:
+                    decref((obj.val.item18), dtor_VarCpy_e77a538911);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
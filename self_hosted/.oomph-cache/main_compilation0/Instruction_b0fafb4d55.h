@@ -0,0 +1,59 @@
+
+                #ifndef HEADER_GUARD_Instruction_b0fafb4d55
+                #define HEADER_GUARD_Instruction_b0fafb4d55
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_ConstructorCall_f8e441a21d;
+struct class_DecRef_f37e9a69d2;
+struct class_FloatConstant_652a176e04;
+struct class_FunctionCall_104f394575;
+struct class_GetAttribute_3d0cc1bf97;
+struct class_GetFromUnion_b0861b839c;
+struct class_GotoIf_feb019130f;
+struct class_GotoLabel_9654b8ee6d;
+struct class_IncRef_54322428a7;
+struct class_InstantiateUnion_29af05529f;
+struct class_IntConstant_817d6312f0;
+struct class_MethodCall_b0095be49c;
+struct class_PointersEqual_deb0abf3fc;
+struct class_Return_aa2d9b1c64;
+struct class_SetAttribute_25344a82b6;
+struct class_StringConstant_e1466967c8;
+struct class_UnSet_a1ce71f609;
+struct class_UnionMemberCheck_7021628c40;
+struct class_VarCpy_e77a538911;
+
+            struct class_Instruction_b0fafb4d55 {
+                union {
+                    	struct class_ConstructorCall_f8e441a21d* item0;
+	struct class_DecRef_f37e9a69d2* item1;
+	struct class_FloatConstant_652a176e04* item2;
+	struct class_FunctionCall_104f394575* item3;
+	struct class_GetAttribute_3d0cc1bf97* item4;
+	struct class_GetFromUnion_b0861b839c* item5;
+	struct class_GotoIf_feb019130f* item6;
+	struct class_GotoLabel_9654b8ee6d* item7;
+	struct class_IncRef_54322428a7* item8;
+	struct class_InstantiateUnion_29af05529f* item9;
+	struct class_IntConstant_817d6312f0* item10;
+	struct class_MethodCall_b0095be49c* item11;
+	struct class_PointersEqual_deb0abf3fc* item12;
+	struct class_Return_aa2d9b1c64* item13;
+	struct class_SetAttribute_25344a82b6* item14;
+	struct class_StringConstant_e1466967c8* item15;
+	struct class_UnSet_a1ce71f609* item16;
+	struct class_UnionMemberCheck_7021628c40* item17;
+	struct class_VarCpy_e77a538911* item18;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_Instruction_b0fafb4d55_to_string(struct class_Instruction_b0fafb4d55 obj);
+            bool meth_Instruction_b0fafb4d55_equals(struct class_Instruction_b0fafb4d55 a, struct class_Instruction_b0fafb4d55 b);
+            
+            void incref_Instruction_b0fafb4d55(struct class_Instruction_b0fafb4d55 obj);
+            void decref_Instruction_b0fafb4d55(struct class_Instruction_b0fafb4d55 obj);
+            
+                #endif
+                
@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "IntConstant_4cbc4c5420.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_IntConstant_2caea2a546_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6e', '\x74', '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x61', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string0_IntConstant_2caea2a546 = {
+                .buf = &string0_IntConstant_2caea2a546_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            struct class_IntConstant_4cbc4c5420* ctor_IntConstant_4cbc4c5420(struct class_Location_500c4434c9* arg_location,int64_t arg_value)
+            {
+                struct class_IntConstant_4cbc4c5420* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_value = arg_value;
+
+                incref(arg_location);
+(void)0;
+
+                return obj;
+            }
+
+            void dtor_IntConstant_4cbc4c5420(void *ptr)
+            {
+                struct class_IntConstant_4cbc4c5420 *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+(void)0;
+
+                free(obj);
+            }
+            
+                struct class_Str meth_IntConstant_4cbc4c5420_to_string(struct class_IntConstant_4cbc4c5420* self)
+                {
+                    struct class_Str res = string0_IntConstant_2caea2a546;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Int_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_IntConstant_4cbc4c5420_equals(struct class_IntConstant_4cbc4c5420* var1, struct class_IntConstant_4cbc4c5420* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_IntConstant_4cbc4c5420
+                #define HEADER_GUARD_IntConstant_4cbc4c5420
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_IntConstant_4cbc4c5420 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+int64_t memb_value;
+
+            };
+            
+            struct class_IntConstant_4cbc4c5420* ctor_IntConstant_4cbc4c5420(struct class_Location_500c4434c9* arg_location,int64_t arg_value);
+            void dtor_IntConstant_4cbc4c5420(void *ptr);
+            
+                struct class_Str meth_IntConstant_4cbc4c5420_to_string(struct class_IntConstant_4cbc4c5420* obj);
+                bool meth_IntConstant_4cbc4c5420_equals(struct class_IntConstant_4cbc4c5420* var1, struct class_IntConstant_4cbc4c5420* var2);
+
+                #endif
+                
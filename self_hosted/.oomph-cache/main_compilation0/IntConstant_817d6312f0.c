@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "IntConstant_817d6312f0.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf string0_IntConstant_7174a4ce90_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6e', '\x74', '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x61', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string0_IntConstant_7174a4ce90 = {
+                .buf = &string0_IntConstant_7174a4ce90_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            struct class_IntConstant_817d6312f0* ctor_IntConstant_817d6312f0(int64_t arg_value,struct class_LocalVariable_846080e5ae* arg_var)
+            {
+                struct class_IntConstant_817d6312f0* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_value = arg_value;
+obj->memb_var = arg_var;
+
+                (void)0;
+incref(arg_var);
+
+                return obj;
+            }
+
+            void dtor_IntConstant_817d6312f0(void *ptr)
+            {
+                struct class_IntConstant_817d6312f0 *obj = ptr;
+                (void)0;
+decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_IntConstant_817d6312f0_to_string(struct class_IntConstant_817d6312f0* self)
+                {
+                    struct class_Str res = string0_IntConstant_7174a4ce90;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_IntConstant_817d6312f0_equals(struct class_IntConstant_817d6312f0* var1, struct class_IntConstant_817d6312f0* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_IntConstant_817d6312f0
+                #define HEADER_GUARD_IntConstant_817d6312f0
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+
+            struct class_IntConstant_817d6312f0 {
+                REFCOUNT_HEADER
+                int64_t memb_value;
+struct class_LocalVariable_846080e5ae* memb_var;
+
+            };
+            
+            struct class_IntConstant_817d6312f0* ctor_IntConstant_817d6312f0(int64_t arg_value,struct class_LocalVariable_846080e5ae* arg_var);
+            void dtor_IntConstant_817d6312f0(void *ptr);
+            
+                struct class_Str meth_IntConstant_817d6312f0_to_string(struct class_IntConstant_817d6312f0* obj);
+                bool meth_IntConstant_817d6312f0_equals(struct class_IntConstant_817d6312f0* var1, struct class_IntConstant_817d6312f0* var2);
+
+                #endif
+                
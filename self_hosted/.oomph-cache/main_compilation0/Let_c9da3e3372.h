@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_Let_c9da3e3372
+                #define HEADER_GUARD_Let_c9da3e3372
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_Let_c9da3e3372 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Str memb_varname;
+struct class_Expression_35f2052bf4 memb_value;
+
+            };
+            
+            struct class_Let_c9da3e3372* ctor_Let_c9da3e3372(struct class_Location_500c4434c9* arg_location,struct class_Str arg_varname,struct class_Expression_35f2052bf4 arg_value);
+            void dtor_Let_c9da3e3372(void *ptr);
+            
+                struct class_Str meth_Let_c9da3e3372_to_string(struct class_Let_c9da3e3372* obj);
+                bool meth_Let_c9da3e3372_equals(struct class_Let_c9da3e3372* var1, struct class_Let_c9da3e3372* var2);
+
+                #endif
+                
@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "ListComprehension_10c913d2dd.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "LoopHeader_23fd592271.h"
+
+            static struct StringBuf string0_ListComprehension_35a1046046_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x69', '\x73', '\x74', '\x43', '\x6f', '\x6d', '\x70', '\x72', '\x65', '\x68', '\x65', '\x6e', '\x73', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string0_ListComprehension_35a1046046 = {
+                .buf = &string0_ListComprehension_35a1046046_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            
+            struct class_ListComprehension_10c913d2dd* ctor_ListComprehension_10c913d2dd(struct class_LoopHeader_23fd592271 arg_loop_header,struct class_Expression_35f2052bf4 arg_value)
+            {
+                struct class_ListComprehension_10c913d2dd* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_loop_header = arg_loop_header;
+obj->memb_value = arg_value;
+
+                incref_LoopHeader_23fd592271(arg_loop_header);
+incref_Expression_35f2052bf4(arg_value);
+
+                return obj;
+            }
+
+            void dtor_ListComprehension_10c913d2dd(void *ptr)
+            {
+                struct class_ListComprehension_10c913d2dd *obj = ptr;
+                decref_LoopHeader_23fd592271(obj->memb_loop_header);
+decref_Expression_35f2052bf4(obj->memb_value);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_ListComprehension_10c913d2dd_to_string(struct class_ListComprehension_10c913d2dd* self)
+                {
+                    struct class_Str res = string0_ListComprehension_35a1046046;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LoopHeader_23fd592271_to_string(self->memb_loop_header);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_35f2052bf4_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_ListComprehension_10c913d2dd_equals(struct class_ListComprehension_10c913d2dd* var1, struct class_ListComprehension_10c913d2dd* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_ListComprehension_10c913d2dd
+                #define HEADER_GUARD_ListComprehension_10c913d2dd
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "LoopHeader_23fd592271.h"
+
+            struct class_ListComprehension_10c913d2dd {
+                REFCOUNT_HEADER
+                struct class_LoopHeader_23fd592271 memb_loop_header;
+struct class_Expression_35f2052bf4 memb_value;
+
+            };
+            
+            struct class_ListComprehension_10c913d2dd* ctor_ListComprehension_10c913d2dd(struct class_LoopHeader_23fd592271 arg_loop_header,struct class_Expression_35f2052bf4 arg_value);
+            void dtor_ListComprehension_10c913d2dd(void *ptr);
+            
+                struct class_Str meth_ListComprehension_10c913d2dd_to_string(struct class_ListComprehension_10c913d2dd* obj);
+                bool meth_ListComprehension_10c913d2dd_equals(struct class_ListComprehension_10c913d2dd* var1, struct class_ListComprehension_10c913d2dd* var2);
+
+                #endif
+                
@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "ListLiteral_66e426dc17.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Expression__d162784c9e.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_ListLiteral_585514efbe_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x69', '\x73', '\x74', '\x4c', '\x69', '\x74', '\x65', '\x72', '\x61', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_ListLiteral_585514efbe = {
+                .buf = &string0_ListLiteral_585514efbe_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            struct class_ListLiteral_66e426dc17* ctor_ListLiteral_66e426dc17(struct class_Location_500c4434c9* arg_location,struct class_List_Expression__d162784c9e* arg_content)
+            {
+                struct class_ListLiteral_66e426dc17* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_content = arg_content;
+
+                incref(arg_location);
+incref(arg_content);
+
+                return obj;
+            }
+
+            void dtor_ListLiteral_66e426dc17(void *ptr)
+            {
+                struct class_ListLiteral_66e426dc17 *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+decref((obj->memb_content), dtor_List_Expression__d162784c9e);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_ListLiteral_66e426dc17_to_string(struct class_ListLiteral_66e426dc17* self)
+                {
+                    struct class_Str res = string0_ListLiteral_585514efbe;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Expression__d162784c9e_to_string(self->memb_content);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_ListLiteral_66e426dc17_equals(struct class_ListLiteral_66e426dc17* var1, struct class_ListLiteral_66e426dc17* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
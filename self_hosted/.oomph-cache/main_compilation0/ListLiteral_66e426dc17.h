@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_ListLiteral_66e426dc17
+                #define HEADER_GUARD_ListLiteral_66e426dc17
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_500c4434c9;
+struct class_List_Expression__d162784c9e;
+struct class_Location_500c4434c9;
+struct class_List_Expression__d162784c9e;
+
+            struct class_ListLiteral_66e426dc17 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_List_Expression__d162784c9e* memb_content;
+
+            };
+            
+            struct class_ListLiteral_66e426dc17* ctor_ListLiteral_66e426dc17(struct class_Location_500c4434c9* arg_location,struct class_List_Expression__d162784c9e* arg_content);
+            void dtor_ListLiteral_66e426dc17(void *ptr);
+            
+                struct class_Str meth_ListLiteral_66e426dc17_to_string(struct class_ListLiteral_66e426dc17* obj);
+                bool meth_ListLiteral_66e426dc17_equals(struct class_ListLiteral_66e426dc17* var1, struct class_ListLiteral_66e426dc17* var2);
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_AutoTypeNode__28b2c8eb14
+                #define HEADER_GUARD_List_AutoTypeNode__28b2c8eb14
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "AutoTypeNode_203f67ecfa.h"
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoTypeNode_203f67ecfa;
+struct class_AutoTypeNode_203f67ecfa;
+
+#define CONSTRUCTOR ctor_List_AutoTypeNode__28b2c8eb14
+
+#define DESTRUCTOR dtor_List_AutoTypeNode__28b2c8eb14
+
+#define TYPE struct class_List_AutoTypeNode__28b2c8eb14 *
+
+#define TYPE_STRUCT class_List_AutoTypeNode__28b2c8eb14
+
+#define METHOD(name) meth_List_AutoTypeNode__28b2c8eb14_##name
+
+#define ITEMTYPE struct class_AutoTypeNode_203f67ecfa*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_AutoTypeNode_203f67ecfa_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_AutoTypeNode_203f67ecfa)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_AutoTypeNode__28b2c8eb14___contains(struct class_List_AutoTypeNode__28b2c8eb14*, struct class_AutoTypeNode_203f67ecfa*);
+void meth_List_AutoTypeNode__28b2c8eb14___reserve(struct class_List_AutoTypeNode__28b2c8eb14*, int64_t);
+struct class_AutoTypeNode_203f67ecfa* meth_List_AutoTypeNode__28b2c8eb14_delete_at_index(struct class_List_AutoTypeNode__28b2c8eb14*, int64_t);
+struct class_List_AutoTypeNode__28b2c8eb14* meth_List_AutoTypeNode__28b2c8eb14_delete_slice(struct class_List_AutoTypeNode__28b2c8eb14*, int64_t, int64_t);
+bool meth_List_AutoTypeNode__28b2c8eb14_ends_with(struct class_List_AutoTypeNode__28b2c8eb14*, struct class_List_AutoTypeNode__28b2c8eb14*);
+int64_t meth_List_AutoTypeNode__28b2c8eb14_find_first(struct class_List_AutoTypeNode__28b2c8eb14*, struct class_AutoTypeNode_203f67ecfa*);
+int64_t meth_List_AutoTypeNode__28b2c8eb14_find_last(struct class_List_AutoTypeNode__28b2c8eb14*, struct class_AutoTypeNode_203f67ecfa*);
+int64_t meth_List_AutoTypeNode__28b2c8eb14_find_only(struct class_List_AutoTypeNode__28b2c8eb14*, struct class_AutoTypeNode_203f67ecfa*);
+struct class_AutoTypeNode_203f67ecfa* meth_List_AutoTypeNode__28b2c8eb14_first(struct class_List_AutoTypeNode__28b2c8eb14*);
+struct class_AutoTypeNode_203f67ecfa* meth_List_AutoTypeNode__28b2c8eb14_get(struct class_List_AutoTypeNode__28b2c8eb14*, int64_t);
+void meth_List_AutoTypeNode__28b2c8eb14_insert(struct class_List_AutoTypeNode__28b2c8eb14*, int64_t, struct class_AutoTypeNode_203f67ecfa*);
+struct class_AutoTypeNode_203f67ecfa* meth_List_AutoTypeNode__28b2c8eb14_last(struct class_List_AutoTypeNode__28b2c8eb14*);
+int64_t meth_List_AutoTypeNode__28b2c8eb14_length(struct class_List_AutoTypeNode__28b2c8eb14*);
+struct class_AutoTypeNode_203f67ecfa* meth_List_AutoTypeNode__28b2c8eb14_pop(struct class_List_AutoTypeNode__28b2c8eb14*);
+void meth_List_AutoTypeNode__28b2c8eb14_push(struct class_List_AutoTypeNode__28b2c8eb14*, struct class_AutoTypeNode_203f67ecfa*);
+void meth_List_AutoTypeNode__28b2c8eb14_push_all(struct class_List_AutoTypeNode__28b2c8eb14*, struct class_List_AutoTypeNode__28b2c8eb14*);
+void meth_List_AutoTypeNode__28b2c8eb14_delete_first(struct class_List_AutoTypeNode__28b2c8eb14*, struct class_AutoTypeNode_203f67ecfa*);
+void meth_List_AutoTypeNode__28b2c8eb14_delete_last(struct class_List_AutoTypeNode__28b2c8eb14*, struct class_AutoTypeNode_203f67ecfa*);
+void meth_List_AutoTypeNode__28b2c8eb14_delete_only(struct class_List_AutoTypeNode__28b2c8eb14*, struct class_AutoTypeNode_203f67ecfa*);
+struct class_List_AutoTypeNode__28b2c8eb14* meth_List_AutoTypeNode__28b2c8eb14_reversed(struct class_List_AutoTypeNode__28b2c8eb14*);
+struct class_List_AutoTypeNode__28b2c8eb14* meth_List_AutoTypeNode__28b2c8eb14_slice(struct class_List_AutoTypeNode__28b2c8eb14*, int64_t, int64_t);
+bool meth_List_AutoTypeNode__28b2c8eb14_starts_with(struct class_List_AutoTypeNode__28b2c8eb14*, struct class_List_AutoTypeNode__28b2c8eb14*);
+struct class_Str meth_List_AutoTypeNode__28b2c8eb14_to_string(struct class_List_AutoTypeNode__28b2c8eb14*);
+struct class_Str meth_List_AutoTypeNode__28b2c8eb14_join(struct class_List_AutoTypeNode__28b2c8eb14*, struct class_Str);
+bool meth_List_AutoTypeNode__28b2c8eb14_equals(struct class_List_AutoTypeNode__28b2c8eb14*, struct class_List_AutoTypeNode__28b2c8eb14*);
+
+#define CONSTRUCTOR ctor_List_AutoTypeNode__28b2c8eb14
+
+#define DESTRUCTOR dtor_List_AutoTypeNode__28b2c8eb14
+
+#define TYPE struct class_List_AutoTypeNode__28b2c8eb14 *
+
+#define TYPE_STRUCT class_List_AutoTypeNode__28b2c8eb14
+
+#define METHOD(name) meth_List_AutoTypeNode__28b2c8eb14_##name
+
+#define ITEMTYPE struct class_AutoTypeNode_203f67ecfa*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_AutoTypeNode_203f67ecfa_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_AutoTypeNode_203f67ecfa)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_BuiltinVariable__27288a8fae
+                #define HEADER_GUARD_List_BuiltinVariable__27288a8fae
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "BuiltinVariable_f6e0cdd1b6.h"
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+
+#define CONSTRUCTOR ctor_List_BuiltinVariable__27288a8fae
+
+#define DESTRUCTOR dtor_List_BuiltinVariable__27288a8fae
+
+#define TYPE struct class_List_BuiltinVariable__27288a8fae *
+
+#define TYPE_STRUCT class_List_BuiltinVariable__27288a8fae
+
+#define METHOD(name) meth_List_BuiltinVariable__27288a8fae_##name
+
+#define ITEMTYPE struct class_BuiltinVariable_f6e0cdd1b6*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_BuiltinVariable_f6e0cdd1b6_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_BuiltinVariable_f6e0cdd1b6)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_BuiltinVariable__27288a8fae___contains(struct class_List_BuiltinVariable__27288a8fae*, struct class_BuiltinVariable_f6e0cdd1b6*);
+void meth_List_BuiltinVariable__27288a8fae___reserve(struct class_List_BuiltinVariable__27288a8fae*, int64_t);
+struct class_BuiltinVariable_f6e0cdd1b6* meth_List_BuiltinVariable__27288a8fae_delete_at_index(struct class_List_BuiltinVariable__27288a8fae*, int64_t);
+struct class_List_BuiltinVariable__27288a8fae* meth_List_BuiltinVariable__27288a8fae_delete_slice(struct class_List_BuiltinVariable__27288a8fae*, int64_t, int64_t);
+bool meth_List_BuiltinVariable__27288a8fae_ends_with(struct class_List_BuiltinVariable__27288a8fae*, struct class_List_BuiltinVariable__27288a8fae*);
+int64_t meth_List_BuiltinVariable__27288a8fae_find_first(struct class_List_BuiltinVariable__27288a8fae*, struct class_BuiltinVariable_f6e0cdd1b6*);
+int64_t meth_List_BuiltinVariable__27288a8fae_find_last(struct class_List_BuiltinVariable__27288a8fae*, struct class_BuiltinVariable_f6e0cdd1b6*);
+int64_t meth_List_BuiltinVariable__27288a8fae_find_only(struct class_List_BuiltinVariable__27288a8fae*, struct class_BuiltinVariable_f6e0cdd1b6*);
+struct class_BuiltinVariable_f6e0cdd1b6* meth_List_BuiltinVariable__27288a8fae_first(struct class_List_BuiltinVariable__27288a8fae*);
+struct class_BuiltinVariable_f6e0cdd1b6* meth_List_BuiltinVariable__27288a8fae_get(struct class_List_BuiltinVariable__27288a8fae*, int64_t);
+void meth_List_BuiltinVariable__27288a8fae_insert(struct class_List_BuiltinVariable__27288a8fae*, int64_t, struct class_BuiltinVariable_f6e0cdd1b6*);
+struct class_BuiltinVariable_f6e0cdd1b6* meth_List_BuiltinVariable__27288a8fae_last(struct class_List_BuiltinVariable__27288a8fae*);
+int64_t meth_List_BuiltinVariable__27288a8fae_length(struct class_List_BuiltinVariable__27288a8fae*);
+struct class_BuiltinVariable_f6e0cdd1b6* meth_List_BuiltinVariable__27288a8fae_pop(struct class_List_BuiltinVariable__27288a8fae*);
+void meth_List_BuiltinVariable__27288a8fae_push(struct class_List_BuiltinVariable__27288a8fae*, struct class_BuiltinVariable_f6e0cdd1b6*);
+void meth_List_BuiltinVariable__27288a8fae_push_all(struct class_List_BuiltinVariable__27288a8fae*, struct class_List_BuiltinVariable__27288a8fae*);
+void meth_List_BuiltinVariable__27288a8fae_delete_first(struct class_List_BuiltinVariable__27288a8fae*, struct class_BuiltinVariable_f6e0cdd1b6*);
+void meth_List_BuiltinVariable__27288a8fae_delete_last(struct class_List_BuiltinVariable__27288a8fae*, struct class_BuiltinVariable_f6e0cdd1b6*);
+void meth_List_BuiltinVariable__27288a8fae_delete_only(struct class_List_BuiltinVariable__27288a8fae*, struct class_BuiltinVariable_f6e0cdd1b6*);
+struct class_List_BuiltinVariable__27288a8fae* meth_List_BuiltinVariable__27288a8fae_reversed(struct class_List_BuiltinVariable__27288a8fae*);
+struct class_List_BuiltinVariable__27288a8fae* meth_List_BuiltinVariable__27288a8fae_slice(struct class_List_BuiltinVariable__27288a8fae*, int64_t, int64_t);
+bool meth_List_BuiltinVariable__27288a8fae_starts_with(struct class_List_BuiltinVariable__27288a8fae*, struct class_List_BuiltinVariable__27288a8fae*);
+struct class_Str meth_List_BuiltinVariable__27288a8fae_to_string(struct class_List_BuiltinVariable__27288a8fae*);
+struct class_Str meth_List_BuiltinVariable__27288a8fae_join(struct class_List_BuiltinVariable__27288a8fae*, struct class_Str);
+bool meth_List_BuiltinVariable__27288a8fae_equals(struct class_List_BuiltinVariable__27288a8fae*, struct class_List_BuiltinVariable__27288a8fae*);
+
+#define CONSTRUCTOR ctor_List_BuiltinVariable__27288a8fae
+
+#define DESTRUCTOR dtor_List_BuiltinVariable__27288a8fae
+
+#define TYPE struct class_List_BuiltinVariable__27288a8fae *
+
+#define TYPE_STRUCT class_List_BuiltinVariable__27288a8fae
+
+#define METHOD(name) meth_List_BuiltinVariable__27288a8fae_##name
+
+#define ITEMTYPE struct class_BuiltinVariable_f6e0cdd1b6*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_BuiltinVariable_f6e0cdd1b6_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_BuiltinVariable_f6e0cdd1b6)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
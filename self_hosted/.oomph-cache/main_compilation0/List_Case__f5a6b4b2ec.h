@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_Case__f5a6b4b2ec
+                #define HEADER_GUARD_List_Case__f5a6b4b2ec
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Case_458b8eeee1.h"
+struct class_Case_458b8eeee1;
+struct class_Case_458b8eeee1;
+struct class_Case_458b8eeee1;
+struct class_Case_458b8eeee1;
+struct class_Case_458b8eeee1;
+struct class_Case_458b8eeee1;
+struct class_Case_458b8eeee1;
+struct class_Case_458b8eeee1;
+struct class_Case_458b8eeee1;
+struct class_Case_458b8eeee1;
+struct class_Case_458b8eeee1;
+struct class_Case_458b8eeee1;
+struct class_Case_458b8eeee1;
+struct class_Case_458b8eeee1;
+
+#define CONSTRUCTOR ctor_List_Case__f5a6b4b2ec
+
+#define DESTRUCTOR dtor_List_Case__f5a6b4b2ec
+
+#define TYPE struct class_List_Case__f5a6b4b2ec *
+
+#define TYPE_STRUCT class_List_Case__f5a6b4b2ec
+
+#define METHOD(name) meth_List_Case__f5a6b4b2ec_##name
+
+#define ITEMTYPE struct class_Case_458b8eeee1*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Case_458b8eeee1_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Case_458b8eeee1)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Case__f5a6b4b2ec___contains(struct class_List_Case__f5a6b4b2ec*, struct class_Case_458b8eeee1*);
+void meth_List_Case__f5a6b4b2ec___reserve(struct class_List_Case__f5a6b4b2ec*, int64_t);
+struct class_Case_458b8eeee1* meth_List_Case__f5a6b4b2ec_delete_at_index(struct class_List_Case__f5a6b4b2ec*, int64_t);
+struct class_List_Case__f5a6b4b2ec* meth_List_Case__f5a6b4b2ec_delete_slice(struct class_List_Case__f5a6b4b2ec*, int64_t, int64_t);
+bool meth_List_Case__f5a6b4b2ec_ends_with(struct class_List_Case__f5a6b4b2ec*, struct class_List_Case__f5a6b4b2ec*);
+int64_t meth_List_Case__f5a6b4b2ec_find_first(struct class_List_Case__f5a6b4b2ec*, struct class_Case_458b8eeee1*);
+int64_t meth_List_Case__f5a6b4b2ec_find_last(struct class_List_Case__f5a6b4b2ec*, struct class_Case_458b8eeee1*);
+int64_t meth_List_Case__f5a6b4b2ec_find_only(struct class_List_Case__f5a6b4b2ec*, struct class_Case_458b8eeee1*);
+struct class_Case_458b8eeee1* meth_List_Case__f5a6b4b2ec_first(struct class_List_Case__f5a6b4b2ec*);
+struct class_Case_458b8eeee1* meth_List_Case__f5a6b4b2ec_get(struct class_List_Case__f5a6b4b2ec*, int64_t);
+void meth_List_Case__f5a6b4b2ec_insert(struct class_List_Case__f5a6b4b2ec*, int64_t, struct class_Case_458b8eeee1*);
+struct class_Case_458b8eeee1* meth_List_Case__f5a6b4b2ec_last(struct class_List_Case__f5a6b4b2ec*);
+int64_t meth_List_Case__f5a6b4b2ec_length(struct class_List_Case__f5a6b4b2ec*);
+struct class_Case_458b8eeee1* meth_List_Case__f5a6b4b2ec_pop(struct class_List_Case__f5a6b4b2ec*);
+void meth_List_Case__f5a6b4b2ec_push(struct class_List_Case__f5a6b4b2ec*, struct class_Case_458b8eeee1*);
+void meth_List_Case__f5a6b4b2ec_push_all(struct class_List_Case__f5a6b4b2ec*, struct class_List_Case__f5a6b4b2ec*);
+void meth_List_Case__f5a6b4b2ec_delete_first(struct class_List_Case__f5a6b4b2ec*, struct class_Case_458b8eeee1*);
+void meth_List_Case__f5a6b4b2ec_delete_last(struct class_List_Case__f5a6b4b2ec*, struct class_Case_458b8eeee1*);
+void meth_List_Case__f5a6b4b2ec_delete_only(struct class_List_Case__f5a6b4b2ec*, struct class_Case_458b8eeee1*);
+struct class_List_Case__f5a6b4b2ec* meth_List_Case__f5a6b4b2ec_reversed(struct class_List_Case__f5a6b4b2ec*);
+struct class_List_Case__f5a6b4b2ec* meth_List_Case__f5a6b4b2ec_slice(struct class_List_Case__f5a6b4b2ec*, int64_t, int64_t);
+bool meth_List_Case__f5a6b4b2ec_starts_with(struct class_List_Case__f5a6b4b2ec*, struct class_List_Case__f5a6b4b2ec*);
+struct class_Str meth_List_Case__f5a6b4b2ec_to_string(struct class_List_Case__f5a6b4b2ec*);
+struct class_Str meth_List_Case__f5a6b4b2ec_join(struct class_List_Case__f5a6b4b2ec*, struct class_Str);
+bool meth_List_Case__f5a6b4b2ec_equals(struct class_List_Case__f5a6b4b2ec*, struct class_List_Case__f5a6b4b2ec*);
+
+#define CONSTRUCTOR ctor_List_Case__f5a6b4b2ec
+
+#define DESTRUCTOR dtor_List_Case__f5a6b4b2ec
+
+#define TYPE struct class_List_Case__f5a6b4b2ec *
+
+#define TYPE_STRUCT class_List_Case__f5a6b4b2ec
+
+#define METHOD(name) meth_List_Case__f5a6b4b2ec_##name
+
+#define ITEMTYPE struct class_Case_458b8eeee1*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Case_458b8eeee1_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Case_458b8eeee1)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
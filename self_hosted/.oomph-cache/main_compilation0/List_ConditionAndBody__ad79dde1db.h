@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_ConditionAndBody__ad79dde1db
+                #define HEADER_GUARD_List_ConditionAndBody__ad79dde1db
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "ConditionAndBody_0e2f888e06.h"
+struct class_ConditionAndBody_0e2f888e06;
+struct class_ConditionAndBody_0e2f888e06;
+struct class_ConditionAndBody_0e2f888e06;
+struct class_ConditionAndBody_0e2f888e06;
+struct class_ConditionAndBody_0e2f888e06;
+struct class_ConditionAndBody_0e2f888e06;
+struct class_ConditionAndBody_0e2f888e06;
+struct class_ConditionAndBody_0e2f888e06;
+struct class_ConditionAndBody_0e2f888e06;
+struct class_ConditionAndBody_0e2f888e06;
+struct class_ConditionAndBody_0e2f888e06;
+struct class_ConditionAndBody_0e2f888e06;
+struct class_ConditionAndBody_0e2f888e06;
+struct class_ConditionAndBody_0e2f888e06;
+
+#define CONSTRUCTOR ctor_List_ConditionAndBody__ad79dde1db
+
+#define DESTRUCTOR dtor_List_ConditionAndBody__ad79dde1db
+
+#define TYPE struct class_List_ConditionAndBody__ad79dde1db *
+
+#define TYPE_STRUCT class_List_ConditionAndBody__ad79dde1db
+
+#define METHOD(name) meth_List_ConditionAndBody__ad79dde1db_##name
+
+#define ITEMTYPE struct class_ConditionAndBody_0e2f888e06*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_ConditionAndBody_0e2f888e06_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_ConditionAndBody_0e2f888e06)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_ConditionAndBody__ad79dde1db___contains(struct class_List_ConditionAndBody__ad79dde1db*, struct class_ConditionAndBody_0e2f888e06*);
+void meth_List_ConditionAndBody__ad79dde1db___reserve(struct class_List_ConditionAndBody__ad79dde1db*, int64_t);
+struct class_ConditionAndBody_0e2f888e06* meth_List_ConditionAndBody__ad79dde1db_delete_at_index(struct class_List_ConditionAndBody__ad79dde1db*, int64_t);
+struct class_List_ConditionAndBody__ad79dde1db* meth_List_ConditionAndBody__ad79dde1db_delete_slice(struct class_List_ConditionAndBody__ad79dde1db*, int64_t, int64_t);
+bool meth_List_ConditionAndBody__ad79dde1db_ends_with(struct class_List_ConditionAndBody__ad79dde1db*, struct class_List_ConditionAndBody__ad79dde1db*);
+int64_t meth_List_ConditionAndBody__ad79dde1db_find_first(struct class_List_ConditionAndBody__ad79dde1db*, struct class_ConditionAndBody_0e2f888e06*);
+int64_t meth_List_ConditionAndBody__ad79dde1db_find_last(struct class_List_ConditionAndBody__ad79dde1db*, struct class_ConditionAndBody_0e2f888e06*);
+int64_t meth_List_ConditionAndBody__ad79dde1db_find_only(struct class_List_ConditionAndBody__ad79dde1db*, struct class_ConditionAndBody_0e2f888e06*);
+struct class_ConditionAndBody_0e2f888e06* meth_List_ConditionAndBody__ad79dde1db_first(struct class_List_ConditionAndBody__ad79dde1db*);
+struct class_ConditionAndBody_0e2f888e06* meth_List_ConditionAndBody__ad79dde1db_get(struct class_List_ConditionAndBody__ad79dde1db*, int64_t);
+void meth_List_ConditionAndBody__ad79dde1db_insert(struct class_List_ConditionAndBody__ad79dde1db*, int64_t, struct class_ConditionAndBody_0e2f888e06*);
+struct class_ConditionAndBody_0e2f888e06* meth_List_ConditionAndBody__ad79dde1db_last(struct class_List_ConditionAndBody__ad79dde1db*);
+int64_t meth_List_ConditionAndBody__ad79dde1db_length(struct class_List_ConditionAndBody__ad79dde1db*);
+struct class_ConditionAndBody_0e2f888e06* meth_List_ConditionAndBody__ad79dde1db_pop(struct class_List_ConditionAndBody__ad79dde1db*);
+void meth_List_ConditionAndBody__ad79dde1db_push(struct class_List_ConditionAndBody__ad79dde1db*, struct class_ConditionAndBody_0e2f888e06*);
+void meth_List_ConditionAndBody__ad79dde1db_push_all(struct class_List_ConditionAndBody__ad79dde1db*, struct class_List_ConditionAndBody__ad79dde1db*);
+void meth_List_ConditionAndBody__ad79dde1db_delete_first(struct class_List_ConditionAndBody__ad79dde1db*, struct class_ConditionAndBody_0e2f888e06*);
+void meth_List_ConditionAndBody__ad79dde1db_delete_last(struct class_List_ConditionAndBody__ad79dde1db*, struct class_ConditionAndBody_0e2f888e06*);
+void meth_List_ConditionAndBody__ad79dde1db_delete_only(struct class_List_ConditionAndBody__ad79dde1db*, struct class_ConditionAndBody_0e2f888e06*);
+struct class_List_ConditionAndBody__ad79dde1db* meth_List_ConditionAndBody__ad79dde1db_reversed(struct class_List_ConditionAndBody__ad79dde1db*);
+struct class_List_ConditionAndBody__ad79dde1db* meth_List_ConditionAndBody__ad79dde1db_slice(struct class_List_ConditionAndBody__ad79dde1db*, int64_t, int64_t);
+bool meth_List_ConditionAndBody__ad79dde1db_starts_with(struct class_List_ConditionAndBody__ad79dde1db*, struct class_List_ConditionAndBody__ad79dde1db*);
+struct class_Str meth_List_ConditionAndBody__ad79dde1db_to_string(struct class_List_ConditionAndBody__ad79dde1db*);
+struct class_Str meth_List_ConditionAndBody__ad79dde1db_join(struct class_List_ConditionAndBody__ad79dde1db*, struct class_Str);
+bool meth_List_ConditionAndBody__ad79dde1db_equals(struct class_List_ConditionAndBody__ad79dde1db*, struct class_List_ConditionAndBody__ad79dde1db*);
+
+#define CONSTRUCTOR ctor_List_ConditionAndBody__ad79dde1db
+
+#define DESTRUCTOR dtor_List_ConditionAndBody__ad79dde1db
+
+#define TYPE struct class_List_ConditionAndBody__ad79dde1db *
+
+#define TYPE_STRUCT class_List_ConditionAndBody__ad79dde1db
+
+#define METHOD(name) meth_List_ConditionAndBody__ad79dde1db_##name
+
+#define ITEMTYPE struct class_ConditionAndBody_0e2f888e06*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_ConditionAndBody_0e2f888e06_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_ConditionAndBody_0e2f888e06)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,122 @@
+
+                #ifndef HEADER_GUARD_List_Expression__d162784c9e
+                #define HEADER_GUARD_List_Expression__d162784c9e
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+
+#define CONSTRUCTOR ctor_List_Expression__d162784c9e
+
+#define DESTRUCTOR dtor_List_Expression__d162784c9e
+
+#define TYPE struct class_List_Expression__d162784c9e *
+
+#define TYPE_STRUCT class_List_Expression__d162784c9e
+
+#define METHOD(name) meth_List_Expression__d162784c9e_##name
+
+#define ITEMTYPE struct class_Expression_35f2052bf4
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Expression_35f2052bf4_##name
+
+#define INCREF_ITEM(val) incref_Expression_35f2052bf4((val))
+
+#define DECREF_ITEM(val) decref_Expression_35f2052bf4((val))
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Expression__d162784c9e___contains(struct class_List_Expression__d162784c9e*, struct class_Expression_35f2052bf4);
+void meth_List_Expression__d162784c9e___reserve(struct class_List_Expression__d162784c9e*, int64_t);
+struct class_Expression_35f2052bf4 meth_List_Expression__d162784c9e_delete_at_index(struct class_List_Expression__d162784c9e*, int64_t);
+struct class_List_Expression__d162784c9e* meth_List_Expression__d162784c9e_delete_slice(struct class_List_Expression__d162784c9e*, int64_t, int64_t);
+bool meth_List_Expression__d162784c9e_ends_with(struct class_List_Expression__d162784c9e*, struct class_List_Expression__d162784c9e*);
+int64_t meth_List_Expression__d162784c9e_find_first(struct class_List_Expression__d162784c9e*, struct class_Expression_35f2052bf4);
+int64_t meth_List_Expression__d162784c9e_find_last(struct class_List_Expression__d162784c9e*, struct class_Expression_35f2052bf4);
+int64_t meth_List_Expression__d162784c9e_find_only(struct class_List_Expression__d162784c9e*, struct class_Expression_35f2052bf4);
+struct class_Expression_35f2052bf4 meth_List_Expression__d162784c9e_first(struct class_List_Expression__d162784c9e*);
+struct class_Expression_35f2052bf4 meth_List_Expression__d162784c9e_get(struct class_List_Expression__d162784c9e*, int64_t);
+void meth_List_Expression__d162784c9e_insert(struct class_List_Expression__d162784c9e*, int64_t, struct class_Expression_35f2052bf4);
+struct class_Expression_35f2052bf4 meth_List_Expression__d162784c9e_last(struct class_List_Expression__d162784c9e*);
+int64_t meth_List_Expression__d162784c9e_length(struct class_List_Expression__d162784c9e*);
+struct class_Expression_35f2052bf4 meth_List_Expression__d162784c9e_pop(struct class_List_Expression__d162784c9e*);
+void meth_List_Expression__d162784c9e_push(struct class_List_Expression__d162784c9e*, struct class_Expression_35f2052bf4);
+void meth_List_Expression__d162784c9e_push_all(struct class_List_Expression__d162784c9e*, struct class_List_Expression__d162784c9e*);
+void meth_List_Expression__d162784c9e_delete_first(struct class_List_Expression__d162784c9e*, struct class_Expression_35f2052bf4);
+void meth_List_Expression__d162784c9e_delete_last(struct class_List_Expression__d162784c9e*, struct class_Expression_35f2052bf4);
+void meth_List_Expression__d162784c9e_delete_only(struct class_List_Expression__d162784c9e*, struct class_Expression_35f2052bf4);
+struct class_List_Expression__d162784c9e* meth_List_Expression__d162784c9e_reversed(struct class_List_Expression__d162784c9e*);
+struct class_List_Expression__d162784c9e* meth_List_Expression__d162784c9e_slice(struct class_List_Expression__d162784c9e*, int64_t, int64_t);
+bool meth_List_Expression__d162784c9e_starts_with(struct class_List_Expression__d162784c9e*, struct class_List_Expression__d162784c9e*);
+struct class_Str meth_List_Expression__d162784c9e_to_string(struct class_List_Expression__d162784c9e*);
+struct class_Str meth_List_Expression__d162784c9e_join(struct class_List_Expression__d162784c9e*, struct class_Str);
+bool meth_List_Expression__d162784c9e_equals(struct class_List_Expression__d162784c9e*, struct class_List_Expression__d162784c9e*);
+
+#define CONSTRUCTOR ctor_List_Expression__d162784c9e
+
+#define DESTRUCTOR dtor_List_Expression__d162784c9e
+
+#define TYPE struct class_List_Expression__d162784c9e *
+
+#define TYPE_STRUCT class_List_Expression__d162784c9e
+
+#define METHOD(name) meth_List_Expression__d162784c9e_##name
+
+#define ITEMTYPE struct class_Expression_35f2052bf4
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Expression_35f2052bf4_##name
+
+#define INCREF_ITEM(val) incref_Expression_35f2052bf4((val))
+
+#define DECREF_ITEM(val) decref_Expression_35f2052bf4((val))
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_FilePair__2b6998ab5b
+                #define HEADER_GUARD_List_FilePair__2b6998ab5b
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "FilePair_99df852164.h"
+struct class_FilePair_99df852164;
+struct class_FilePair_99df852164;
+struct class_FilePair_99df852164;
+struct class_FilePair_99df852164;
+struct class_FilePair_99df852164;
+struct class_FilePair_99df852164;
+struct class_FilePair_99df852164;
+struct class_FilePair_99df852164;
+struct class_FilePair_99df852164;
+struct class_FilePair_99df852164;
+struct class_FilePair_99df852164;
+struct class_FilePair_99df852164;
+struct class_FilePair_99df852164;
+struct class_FilePair_99df852164;
+
+#define CONSTRUCTOR ctor_List_FilePair__2b6998ab5b
+
+#define DESTRUCTOR dtor_List_FilePair__2b6998ab5b
+
+#define TYPE struct class_List_FilePair__2b6998ab5b *
+
+#define TYPE_STRUCT class_List_FilePair__2b6998ab5b
+
+#define METHOD(name) meth_List_FilePair__2b6998ab5b_##name
+
+#define ITEMTYPE struct class_FilePair_99df852164*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_FilePair_99df852164_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_FilePair_99df852164)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_FilePair__2b6998ab5b___contains(struct class_List_FilePair__2b6998ab5b*, struct class_FilePair_99df852164*);
+void meth_List_FilePair__2b6998ab5b___reserve(struct class_List_FilePair__2b6998ab5b*, int64_t);
+struct class_FilePair_99df852164* meth_List_FilePair__2b6998ab5b_delete_at_index(struct class_List_FilePair__2b6998ab5b*, int64_t);
+struct class_List_FilePair__2b6998ab5b* meth_List_FilePair__2b6998ab5b_delete_slice(struct class_List_FilePair__2b6998ab5b*, int64_t, int64_t);
+bool meth_List_FilePair__2b6998ab5b_ends_with(struct class_List_FilePair__2b6998ab5b*, struct class_List_FilePair__2b6998ab5b*);
+int64_t meth_List_FilePair__2b6998ab5b_find_first(struct class_List_FilePair__2b6998ab5b*, struct class_FilePair_99df852164*);
+int64_t meth_List_FilePair__2b6998ab5b_find_last(struct class_List_FilePair__2b6998ab5b*, struct class_FilePair_99df852164*);
+int64_t meth_List_FilePair__2b6998ab5b_find_only(struct class_List_FilePair__2b6998ab5b*, struct class_FilePair_99df852164*);
+struct class_FilePair_99df852164* meth_List_FilePair__2b6998ab5b_first(struct class_List_FilePair__2b6998ab5b*);
+struct class_FilePair_99df852164* meth_List_FilePair__2b6998ab5b_get(struct class_List_FilePair__2b6998ab5b*, int64_t);
+void meth_List_FilePair__2b6998ab5b_insert(struct class_List_FilePair__2b6998ab5b*, int64_t, struct class_FilePair_99df852164*);
+struct class_FilePair_99df852164* meth_List_FilePair__2b6998ab5b_last(struct class_List_FilePair__2b6998ab5b*);
+int64_t meth_List_FilePair__2b6998ab5b_length(struct class_List_FilePair__2b6998ab5b*);
+struct class_FilePair_99df852164* meth_List_FilePair__2b6998ab5b_pop(struct class_List_FilePair__2b6998ab5b*);
+void meth_List_FilePair__2b6998ab5b_push(struct class_List_FilePair__2b6998ab5b*, struct class_FilePair_99df852164*);
+void meth_List_FilePair__2b6998ab5b_push_all(struct class_List_FilePair__2b6998ab5b*, struct class_List_FilePair__2b6998ab5b*);
+void meth_List_FilePair__2b6998ab5b_delete_first(struct class_List_FilePair__2b6998ab5b*, struct class_FilePair_99df852164*);
+void meth_List_FilePair__2b6998ab5b_delete_last(struct class_List_FilePair__2b6998ab5b*, struct class_FilePair_99df852164*);
+void meth_List_FilePair__2b6998ab5b_delete_only(struct class_List_FilePair__2b6998ab5b*, struct class_FilePair_99df852164*);
+struct class_List_FilePair__2b6998ab5b* meth_List_FilePair__2b6998ab5b_reversed(struct class_List_FilePair__2b6998ab5b*);
+struct class_List_FilePair__2b6998ab5b* meth_List_FilePair__2b6998ab5b_slice(struct class_List_FilePair__2b6998ab5b*, int64_t, int64_t);
+bool meth_List_FilePair__2b6998ab5b_starts_with(struct class_List_FilePair__2b6998ab5b*, struct class_List_FilePair__2b6998ab5b*);
+struct class_Str meth_List_FilePair__2b6998ab5b_to_string(struct class_List_FilePair__2b6998ab5b*);
+struct class_Str meth_List_FilePair__2b6998ab5b_join(struct class_List_FilePair__2b6998ab5b*, struct class_Str);
+bool meth_List_FilePair__2b6998ab5b_equals(struct class_List_FilePair__2b6998ab5b*, struct class_List_FilePair__2b6998ab5b*);
+
+#define CONSTRUCTOR ctor_List_FilePair__2b6998ab5b
+
+#define DESTRUCTOR dtor_List_FilePair__2b6998ab5b
+
+#define TYPE struct class_List_FilePair__2b6998ab5b *
+
+#define TYPE_STRUCT class_List_FilePair__2b6998ab5b
+
+#define METHOD(name) meth_List_FilePair__2b6998ab5b_##name
+
+#define ITEMTYPE struct class_FilePair_99df852164*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_FilePair_99df852164_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_FilePair_99df852164)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_FuncOrMethodDef__af5379b09e
+                #define HEADER_GUARD_List_FuncOrMethodDef__af5379b09e
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "FuncOrMethodDef_533c7b75ab.h"
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+
+#define CONSTRUCTOR ctor_List_FuncOrMethodDef__af5379b09e
+
+#define DESTRUCTOR dtor_List_FuncOrMethodDef__af5379b09e
+
+#define TYPE struct class_List_FuncOrMethodDef__af5379b09e *
+
+#define TYPE_STRUCT class_List_FuncOrMethodDef__af5379b09e
+
+#define METHOD(name) meth_List_FuncOrMethodDef__af5379b09e_##name
+
+#define ITEMTYPE struct class_FuncOrMethodDef_533c7b75ab*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_FuncOrMethodDef_533c7b75ab_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_FuncOrMethodDef_533c7b75ab)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_FuncOrMethodDef__af5379b09e___contains(struct class_List_FuncOrMethodDef__af5379b09e*, struct class_FuncOrMethodDef_533c7b75ab*);
+void meth_List_FuncOrMethodDef__af5379b09e___reserve(struct class_List_FuncOrMethodDef__af5379b09e*, int64_t);
+struct class_FuncOrMethodDef_533c7b75ab* meth_List_FuncOrMethodDef__af5379b09e_delete_at_index(struct class_List_FuncOrMethodDef__af5379b09e*, int64_t);
+struct class_List_FuncOrMethodDef__af5379b09e* meth_List_FuncOrMethodDef__af5379b09e_delete_slice(struct class_List_FuncOrMethodDef__af5379b09e*, int64_t, int64_t);
+bool meth_List_FuncOrMethodDef__af5379b09e_ends_with(struct class_List_FuncOrMethodDef__af5379b09e*, struct class_List_FuncOrMethodDef__af5379b09e*);
+int64_t meth_List_FuncOrMethodDef__af5379b09e_find_first(struct class_List_FuncOrMethodDef__af5379b09e*, struct class_FuncOrMethodDef_533c7b75ab*);
+int64_t meth_List_FuncOrMethodDef__af5379b09e_find_last(struct class_List_FuncOrMethodDef__af5379b09e*, struct class_FuncOrMethodDef_533c7b75ab*);
+int64_t meth_List_FuncOrMethodDef__af5379b09e_find_only(struct class_List_FuncOrMethodDef__af5379b09e*, struct class_FuncOrMethodDef_533c7b75ab*);
+struct class_FuncOrMethodDef_533c7b75ab* meth_List_FuncOrMethodDef__af5379b09e_first(struct class_List_FuncOrMethodDef__af5379b09e*);
+struct class_FuncOrMethodDef_533c7b75ab* meth_List_FuncOrMethodDef__af5379b09e_get(struct class_List_FuncOrMethodDef__af5379b09e*, int64_t);
+void meth_List_FuncOrMethodDef__af5379b09e_insert(struct class_List_FuncOrMethodDef__af5379b09e*, int64_t, struct class_FuncOrMethodDef_533c7b75ab*);
+struct class_FuncOrMethodDef_533c7b75ab* meth_List_FuncOrMethodDef__af5379b09e_last(struct class_List_FuncOrMethodDef__af5379b09e*);
+int64_t meth_List_FuncOrMethodDef__af5379b09e_length(struct class_List_FuncOrMethodDef__af5379b09e*);
+struct class_FuncOrMethodDef_533c7b75ab* meth_List_FuncOrMethodDef__af5379b09e_pop(struct class_List_FuncOrMethodDef__af5379b09e*);
+void meth_List_FuncOrMethodDef__af5379b09e_push(struct class_List_FuncOrMethodDef__af5379b09e*, struct class_FuncOrMethodDef_533c7b75ab*);
+void meth_List_FuncOrMethodDef__af5379b09e_push_all(struct class_List_FuncOrMethodDef__af5379b09e*, struct class_List_FuncOrMethodDef__af5379b09e*);
+void meth_List_FuncOrMethodDef__af5379b09e_delete_first(struct class_List_FuncOrMethodDef__af5379b09e*, struct class_FuncOrMethodDef_533c7b75ab*);
+void meth_List_FuncOrMethodDef__af5379b09e_delete_last(struct class_List_FuncOrMethodDef__af5379b09e*, struct class_FuncOrMethodDef_533c7b75ab*);
+void meth_List_FuncOrMethodDef__af5379b09e_delete_only(struct class_List_FuncOrMethodDef__af5379b09e*, struct class_FuncOrMethodDef_533c7b75ab*);
+struct class_List_FuncOrMethodDef__af5379b09e* meth_List_FuncOrMethodDef__af5379b09e_reversed(struct class_List_FuncOrMethodDef__af5379b09e*);
+struct class_List_FuncOrMethodDef__af5379b09e* meth_List_FuncOrMethodDef__af5379b09e_slice(struct class_List_FuncOrMethodDef__af5379b09e*, int64_t, int64_t);
+bool meth_List_FuncOrMethodDef__af5379b09e_starts_with(struct class_List_FuncOrMethodDef__af5379b09e*, struct class_List_FuncOrMethodDef__af5379b09e*);
+struct class_Str meth_List_FuncOrMethodDef__af5379b09e_to_string(struct class_List_FuncOrMethodDef__af5379b09e*);
+struct class_Str meth_List_FuncOrMethodDef__af5379b09e_join(struct class_List_FuncOrMethodDef__af5379b09e*, struct class_Str);
+bool meth_List_FuncOrMethodDef__af5379b09e_equals(struct class_List_FuncOrMethodDef__af5379b09e*, struct class_List_FuncOrMethodDef__af5379b09e*);
+
+#define CONSTRUCTOR ctor_List_FuncOrMethodDef__af5379b09e
+
+#define DESTRUCTOR dtor_List_FuncOrMethodDef__af5379b09e
+
+#define TYPE struct class_List_FuncOrMethodDef__af5379b09e *
+
+#define TYPE_STRUCT class_List_FuncOrMethodDef__af5379b09e
+
+#define METHOD(name) meth_List_FuncOrMethodDef__af5379b09e_##name
+
+#define ITEMTYPE struct class_FuncOrMethodDef_533c7b75ab*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_FuncOrMethodDef_533c7b75ab_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_FuncOrMethodDef_533c7b75ab)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_GotoLabel__152f526689
+                #define HEADER_GUARD_List_GotoLabel__152f526689
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "GotoLabel_9654b8ee6d.h"
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+
+#define CONSTRUCTOR ctor_List_GotoLabel__152f526689
+
+#define DESTRUCTOR dtor_List_GotoLabel__152f526689
+
+#define TYPE struct class_List_GotoLabel__152f526689 *
+
+#define TYPE_STRUCT class_List_GotoLabel__152f526689
+
+#define METHOD(name) meth_List_GotoLabel__152f526689_##name
+
+#define ITEMTYPE struct class_GotoLabel_9654b8ee6d*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_GotoLabel_9654b8ee6d_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_GotoLabel_9654b8ee6d)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_GotoLabel__152f526689___contains(struct class_List_GotoLabel__152f526689*, struct class_GotoLabel_9654b8ee6d*);
+void meth_List_GotoLabel__152f526689___reserve(struct class_List_GotoLabel__152f526689*, int64_t);
+struct class_GotoLabel_9654b8ee6d* meth_List_GotoLabel__152f526689_delete_at_index(struct class_List_GotoLabel__152f526689*, int64_t);
+struct class_List_GotoLabel__152f526689* meth_List_GotoLabel__152f526689_delete_slice(struct class_List_GotoLabel__152f526689*, int64_t, int64_t);
+bool meth_List_GotoLabel__152f526689_ends_with(struct class_List_GotoLabel__152f526689*, struct class_List_GotoLabel__152f526689*);
+int64_t meth_List_GotoLabel__152f526689_find_first(struct class_List_GotoLabel__152f526689*, struct class_GotoLabel_9654b8ee6d*);
+int64_t meth_List_GotoLabel__152f526689_find_last(struct class_List_GotoLabel__152f526689*, struct class_GotoLabel_9654b8ee6d*);
+int64_t meth_List_GotoLabel__152f526689_find_only(struct class_List_GotoLabel__152f526689*, struct class_GotoLabel_9654b8ee6d*);
+struct class_GotoLabel_9654b8ee6d* meth_List_GotoLabel__152f526689_first(struct class_List_GotoLabel__152f526689*);
+struct class_GotoLabel_9654b8ee6d* meth_List_GotoLabel__152f526689_get(struct class_List_GotoLabel__152f526689*, int64_t);
+void meth_List_GotoLabel__152f526689_insert(struct class_List_GotoLabel__152f526689*, int64_t, struct class_GotoLabel_9654b8ee6d*);
+struct class_GotoLabel_9654b8ee6d* meth_List_GotoLabel__152f526689_last(struct class_List_GotoLabel__152f526689*);
+int64_t meth_List_GotoLabel__152f526689_length(struct class_List_GotoLabel__152f526689*);
+struct class_GotoLabel_9654b8ee6d* meth_List_GotoLabel__152f526689_pop(struct class_List_GotoLabel__152f526689*);
+void meth_List_GotoLabel__152f526689_push(struct class_List_GotoLabel__152f526689*, struct class_GotoLabel_9654b8ee6d*);
+void meth_List_GotoLabel__152f526689_push_all(struct class_List_GotoLabel__152f526689*, struct class_List_GotoLabel__152f526689*);
+void meth_List_GotoLabel__152f526689_delete_first(struct class_List_GotoLabel__152f526689*, struct class_GotoLabel_9654b8ee6d*);
+void meth_List_GotoLabel__152f526689_delete_last(struct class_List_GotoLabel__152f526689*, struct class_GotoLabel_9654b8ee6d*);
+void meth_List_GotoLabel__152f526689_delete_only(struct class_List_GotoLabel__152f526689*, struct class_GotoLabel_9654b8ee6d*);
+struct class_List_GotoLabel__152f526689* meth_List_GotoLabel__152f526689_reversed(struct class_List_GotoLabel__152f526689*);
+struct class_List_GotoLabel__152f526689* meth_List_GotoLabel__152f526689_slice(struct class_List_GotoLabel__152f526689*, int64_t, int64_t);
+bool meth_List_GotoLabel__152f526689_starts_with(struct class_List_GotoLabel__152f526689*, struct class_List_GotoLabel__152f526689*);
+struct class_Str meth_List_GotoLabel__152f526689_to_string(struct class_List_GotoLabel__152f526689*);
+struct class_Str meth_List_GotoLabel__152f526689_join(struct class_List_GotoLabel__152f526689*, struct class_Str);
+bool meth_List_GotoLabel__152f526689_equals(struct class_List_GotoLabel__152f526689*, struct class_List_GotoLabel__152f526689*);
+
+#define CONSTRUCTOR ctor_List_GotoLabel__152f526689
+
+#define DESTRUCTOR dtor_List_GotoLabel__152f526689
+
+#define TYPE struct class_List_GotoLabel__152f526689 *
+
+#define TYPE_STRUCT class_List_GotoLabel__152f526689
+
+#define METHOD(name) meth_List_GotoLabel__152f526689_##name
+
+#define ITEMTYPE struct class_GotoLabel_9654b8ee6d*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_GotoLabel_9654b8ee6d_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_GotoLabel_9654b8ee6d)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,122 @@
+
+                #ifndef HEADER_GUARD_List_Instruction__6e475c861a
+                #define HEADER_GUARD_List_Instruction__6e475c861a
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Instruction_b0fafb4d55.h"
+
+#define CONSTRUCTOR ctor_List_Instruction__6e475c861a
+
+#define DESTRUCTOR dtor_List_Instruction__6e475c861a
+
+#define TYPE struct class_List_Instruction__6e475c861a *
+
+#define TYPE_STRUCT class_List_Instruction__6e475c861a
+
+#define METHOD(name) meth_List_Instruction__6e475c861a_##name
+
+#define ITEMTYPE struct class_Instruction_b0fafb4d55
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Instruction_b0fafb4d55_##name
+
+#define INCREF_ITEM(val) incref_Instruction_b0fafb4d55((val))
+
+#define DECREF_ITEM(val) decref_Instruction_b0fafb4d55((val))
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Instruction__6e475c861a___contains(struct class_List_Instruction__6e475c861a*, struct class_Instruction_b0fafb4d55);
+void meth_List_Instruction__6e475c861a___reserve(struct class_List_Instruction__6e475c861a*, int64_t);
+struct class_Instruction_b0fafb4d55 meth_List_Instruction__6e475c861a_delete_at_index(struct class_List_Instruction__6e475c861a*, int64_t);
+struct class_List_Instruction__6e475c861a* meth_List_Instruction__6e475c861a_delete_slice(struct class_List_Instruction__6e475c861a*, int64_t, int64_t);
+bool meth_List_Instruction__6e475c861a_ends_with(struct class_List_Instruction__6e475c861a*, struct class_List_Instruction__6e475c861a*);
+int64_t meth_List_Instruction__6e475c861a_find_first(struct class_List_Instruction__6e475c861a*, struct class_Instruction_b0fafb4d55);
+int64_t meth_List_Instruction__6e475c861a_find_last(struct class_List_Instruction__6e475c861a*, struct class_Instruction_b0fafb4d55);
+int64_t meth_List_Instruction__6e475c861a_find_only(struct class_List_Instruction__6e475c861a*, struct class_Instruction_b0fafb4d55);
+struct class_Instruction_b0fafb4d55 meth_List_Instruction__6e475c861a_first(struct class_List_Instruction__6e475c861a*);
+struct class_Instruction_b0fafb4d55 meth_List_Instruction__6e475c861a_get(struct class_List_Instruction__6e475c861a*, int64_t);
+void meth_List_Instruction__6e475c861a_insert(struct class_List_Instruction__6e475c861a*, int64_t, struct class_Instruction_b0fafb4d55);
+struct class_Instruction_b0fafb4d55 meth_List_Instruction__6e475c861a_last(struct class_List_Instruction__6e475c861a*);
+int64_t meth_List_Instruction__6e475c861a_length(struct class_List_Instruction__6e475c861a*);
+struct class_Instruction_b0fafb4d55 meth_List_Instruction__6e475c861a_pop(struct class_List_Instruction__6e475c861a*);
+void meth_List_Instruction__6e475c861a_push(struct class_List_Instruction__6e475c861a*, struct class_Instruction_b0fafb4d55);
+void meth_List_Instruction__6e475c861a_push_all(struct class_List_Instruction__6e475c861a*, struct class_List_Instruction__6e475c861a*);
+void meth_List_Instruction__6e475c861a_delete_first(struct class_List_Instruction__6e475c861a*, struct class_Instruction_b0fafb4d55);
+void meth_List_Instruction__6e475c861a_delete_last(struct class_List_Instruction__6e475c861a*, struct class_Instruction_b0fafb4d55);
+void meth_List_Instruction__6e475c861a_delete_only(struct class_List_Instruction__6e475c861a*, struct class_Instruction_b0fafb4d55);
+struct class_List_Instruction__6e475c861a* meth_List_Instruction__6e475c861a_reversed(struct class_List_Instruction__6e475c861a*);
+struct class_List_Instruction__6e475c861a* meth_List_Instruction__6e475c861a_slice(struct class_List_Instruction__6e475c861a*, int64_t, int64_t);
+bool meth_List_Instruction__6e475c861a_starts_with(struct class_List_Instruction__6e475c861a*, struct class_List_Instruction__6e475c861a*);
+struct class_Str meth_List_Instruction__6e475c861a_to_string(struct class_List_Instruction__6e475c861a*);
+struct class_Str meth_List_Instruction__6e475c861a_join(struct class_List_Instruction__6e475c861a*, struct class_Str);
+bool meth_List_Instruction__6e475c861a_equals(struct class_List_Instruction__6e475c861a*, struct class_List_Instruction__6e475c861a*);
+
+#define CONSTRUCTOR ctor_List_Instruction__6e475c861a
+
+#define DESTRUCTOR dtor_List_Instruction__6e475c861a
+
+#define TYPE struct class_List_Instruction__6e475c861a *
+
+#define TYPE_STRUCT class_List_Instruction__6e475c861a
+
+#define METHOD(name) meth_List_Instruction__6e475c861a_##name
+
+#define ITEMTYPE struct class_Instruction_b0fafb4d55
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Instruction_b0fafb4d55_##name
+
+#define INCREF_ITEM(val) incref_Instruction_b0fafb4d55((val))
+
+#define DECREF_ITEM(val) decref_Instruction_b0fafb4d55((val))
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_List_Instruction___d2e1d3bdd4
+                #define HEADER_GUARD_List_List_Instruction___d2e1d3bdd4
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Instruction__6e475c861a.h"
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+struct class_List_Instruction__6e475c861a;
+
+#define CONSTRUCTOR ctor_List_List_Instruction___d2e1d3bdd4
+
+#define DESTRUCTOR dtor_List_List_Instruction___d2e1d3bdd4
+
+#define TYPE struct class_List_List_Instruction___d2e1d3bdd4 *
+
+#define TYPE_STRUCT class_List_List_Instruction___d2e1d3bdd4
+
+#define METHOD(name) meth_List_List_Instruction___d2e1d3bdd4_##name
+
+#define ITEMTYPE struct class_List_Instruction__6e475c861a*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_List_Instruction__6e475c861a_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_List_Instruction__6e475c861a)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_List_Instruction___d2e1d3bdd4___contains(struct class_List_List_Instruction___d2e1d3bdd4*, struct class_List_Instruction__6e475c861a*);
+void meth_List_List_Instruction___d2e1d3bdd4___reserve(struct class_List_List_Instruction___d2e1d3bdd4*, int64_t);
+struct class_List_Instruction__6e475c861a* meth_List_List_Instruction___d2e1d3bdd4_delete_at_index(struct class_List_List_Instruction___d2e1d3bdd4*, int64_t);
+struct class_List_List_Instruction___d2e1d3bdd4* meth_List_List_Instruction___d2e1d3bdd4_delete_slice(struct class_List_List_Instruction___d2e1d3bdd4*, int64_t, int64_t);
+bool meth_List_List_Instruction___d2e1d3bdd4_ends_with(struct class_List_List_Instruction___d2e1d3bdd4*, struct class_List_List_Instruction___d2e1d3bdd4*);
+int64_t meth_List_List_Instruction___d2e1d3bdd4_find_first(struct class_List_List_Instruction___d2e1d3bdd4*, struct class_List_Instruction__6e475c861a*);
+int64_t meth_List_List_Instruction___d2e1d3bdd4_find_last(struct class_List_List_Instruction___d2e1d3bdd4*, struct class_List_Instruction__6e475c861a*);
+int64_t meth_List_List_Instruction___d2e1d3bdd4_find_only(struct class_List_List_Instruction___d2e1d3bdd4*, struct class_List_Instruction__6e475c861a*);
+struct class_List_Instruction__6e475c861a* meth_List_List_Instruction___d2e1d3bdd4_first(struct class_List_List_Instruction___d2e1d3bdd4*);
+struct class_List_Instruction__6e475c861a* meth_List_List_Instruction___d2e1d3bdd4_get(struct class_List_List_Instruction___d2e1d3bdd4*, int64_t);
+void meth_List_List_Instruction___d2e1d3bdd4_insert(struct class_List_List_Instruction___d2e1d3bdd4*, int64_t, struct class_List_Instruction__6e475c861a*);
+struct class_List_Instruction__6e475c861a* meth_List_List_Instruction___d2e1d3bdd4_last(struct class_List_List_Instruction___d2e1d3bdd4*);
+int64_t meth_List_List_Instruction___d2e1d3bdd4_length(struct class_List_List_Instruction___d2e1d3bdd4*);
+struct class_List_Instruction__6e475c861a* meth_List_List_Instruction___d2e1d3bdd4_pop(struct class_List_List_Instruction___d2e1d3bdd4*);
+void meth_List_List_Instruction___d2e1d3bdd4_push(struct class_List_List_Instruction___d2e1d3bdd4*, struct class_List_Instruction__6e475c861a*);
+void meth_List_List_Instruction___d2e1d3bdd4_push_all(struct class_List_List_Instruction___d2e1d3bdd4*, struct class_List_List_Instruction___d2e1d3bdd4*);
+void meth_List_List_Instruction___d2e1d3bdd4_delete_first(struct class_List_List_Instruction___d2e1d3bdd4*, struct class_List_Instruction__6e475c861a*);
+void meth_List_List_Instruction___d2e1d3bdd4_delete_last(struct class_List_List_Instruction___d2e1d3bdd4*, struct class_List_Instruction__6e475c861a*);
+void meth_List_List_Instruction___d2e1d3bdd4_delete_only(struct class_List_List_Instruction___d2e1d3bdd4*, struct class_List_Instruction__6e475c861a*);
+struct class_List_List_Instruction___d2e1d3bdd4* meth_List_List_Instruction___d2e1d3bdd4_reversed(struct class_List_List_Instruction___d2e1d3bdd4*);
+struct class_List_List_Instruction___d2e1d3bdd4* meth_List_List_Instruction___d2e1d3bdd4_slice(struct class_List_List_Instruction___d2e1d3bdd4*, int64_t, int64_t);
+bool meth_List_List_Instruction___d2e1d3bdd4_starts_with(struct class_List_List_Instruction___d2e1d3bdd4*, struct class_List_List_Instruction___d2e1d3bdd4*);
+struct class_Str meth_List_List_Instruction___d2e1d3bdd4_to_string(struct class_List_List_Instruction___d2e1d3bdd4*);
+struct class_Str meth_List_List_Instruction___d2e1d3bdd4_join(struct class_List_List_Instruction___d2e1d3bdd4*, struct class_Str);
+bool meth_List_List_Instruction___d2e1d3bdd4_equals(struct class_List_List_Instruction___d2e1d3bdd4*, struct class_List_List_Instruction___d2e1d3bdd4*);
+
+#define CONSTRUCTOR ctor_List_List_Instruction___d2e1d3bdd4
+
+#define DESTRUCTOR dtor_List_List_Instruction___d2e1d3bdd4
+
+#define TYPE struct class_List_List_Instruction___d2e1d3bdd4 *
+
+#define TYPE_STRUCT class_List_List_Instruction___d2e1d3bdd4
+
+#define METHOD(name) meth_List_List_Instruction___d2e1d3bdd4_##name
+
+#define ITEMTYPE struct class_List_Instruction__6e475c861a*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_List_Instruction__6e475c861a_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_List_Instruction__6e475c861a)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_List_Str___637f5f7ec1
+                #define HEADER_GUARD_List_List_Str___637f5f7ec1
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+
+#define CONSTRUCTOR ctor_List_List_Str___637f5f7ec1
+
+#define DESTRUCTOR dtor_List_List_Str___637f5f7ec1
+
+#define TYPE struct class_List_List_Str___637f5f7ec1 *
+
+#define TYPE_STRUCT class_List_List_Str___637f5f7ec1
+
+#define METHOD(name) meth_List_List_Str___637f5f7ec1_##name
+
+#define ITEMTYPE struct class_List_Str__43b70c06cb*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_List_Str__43b70c06cb_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_List_Str__43b70c06cb)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_List_Str___637f5f7ec1___contains(struct class_List_List_Str___637f5f7ec1*, struct class_List_Str__43b70c06cb*);
+void meth_List_List_Str___637f5f7ec1___reserve(struct class_List_List_Str___637f5f7ec1*, int64_t);
+struct class_List_Str__43b70c06cb* meth_List_List_Str___637f5f7ec1_delete_at_index(struct class_List_List_Str___637f5f7ec1*, int64_t);
+struct class_List_List_Str___637f5f7ec1* meth_List_List_Str___637f5f7ec1_delete_slice(struct class_List_List_Str___637f5f7ec1*, int64_t, int64_t);
+bool meth_List_List_Str___637f5f7ec1_ends_with(struct class_List_List_Str___637f5f7ec1*, struct class_List_List_Str___637f5f7ec1*);
+int64_t meth_List_List_Str___637f5f7ec1_find_first(struct class_List_List_Str___637f5f7ec1*, struct class_List_Str__43b70c06cb*);
+int64_t meth_List_List_Str___637f5f7ec1_find_last(struct class_List_List_Str___637f5f7ec1*, struct class_List_Str__43b70c06cb*);
+int64_t meth_List_List_Str___637f5f7ec1_find_only(struct class_List_List_Str___637f5f7ec1*, struct class_List_Str__43b70c06cb*);
+struct class_List_Str__43b70c06cb* meth_List_List_Str___637f5f7ec1_first(struct class_List_List_Str___637f5f7ec1*);
+struct class_List_Str__43b70c06cb* meth_List_List_Str___637f5f7ec1_get(struct class_List_List_Str___637f5f7ec1*, int64_t);
+void meth_List_List_Str___637f5f7ec1_insert(struct class_List_List_Str___637f5f7ec1*, int64_t, struct class_List_Str__43b70c06cb*);
+struct class_List_Str__43b70c06cb* meth_List_List_Str___637f5f7ec1_last(struct class_List_List_Str___637f5f7ec1*);
+int64_t meth_List_List_Str___637f5f7ec1_length(struct class_List_List_Str___637f5f7ec1*);
+struct class_List_Str__43b70c06cb* meth_List_List_Str___637f5f7ec1_pop(struct class_List_List_Str___637f5f7ec1*);
+void meth_List_List_Str___637f5f7ec1_push(struct class_List_List_Str___637f5f7ec1*, struct class_List_Str__43b70c06cb*);
+void meth_List_List_Str___637f5f7ec1_push_all(struct class_List_List_Str___637f5f7ec1*, struct class_List_List_Str___637f5f7ec1*);
+void meth_List_List_Str___637f5f7ec1_delete_first(struct class_List_List_Str___637f5f7ec1*, struct class_List_Str__43b70c06cb*);
+void meth_List_List_Str___637f5f7ec1_delete_last(struct class_List_List_Str___637f5f7ec1*, struct class_List_Str__43b70c06cb*);
+void meth_List_List_Str___637f5f7ec1_delete_only(struct class_List_List_Str___637f5f7ec1*, struct class_List_Str__43b70c06cb*);
+struct class_List_List_Str___637f5f7ec1* meth_List_List_Str___637f5f7ec1_reversed(struct class_List_List_Str___637f5f7ec1*);
+struct class_List_List_Str___637f5f7ec1* meth_List_List_Str___637f5f7ec1_slice(struct class_List_List_Str___637f5f7ec1*, int64_t, int64_t);
+bool meth_List_List_Str___637f5f7ec1_starts_with(struct class_List_List_Str___637f5f7ec1*, struct class_List_List_Str___637f5f7ec1*);
+struct class_Str meth_List_List_Str___637f5f7ec1_to_string(struct class_List_List_Str___637f5f7ec1*);
+struct class_Str meth_List_List_Str___637f5f7ec1_join(struct class_List_List_Str___637f5f7ec1*, struct class_Str);
+bool meth_List_List_Str___637f5f7ec1_equals(struct class_List_List_Str___637f5f7ec1*, struct class_List_List_Str___637f5f7ec1*);
+
+#define CONSTRUCTOR ctor_List_List_Str___637f5f7ec1
+
+#define DESTRUCTOR dtor_List_List_Str___637f5f7ec1
+
+#define TYPE struct class_List_List_Str___637f5f7ec1 *
+
+#define TYPE_STRUCT class_List_List_Str___637f5f7ec1
+
+#define METHOD(name) meth_List_List_Str___637f5f7ec1_##name
+
+#define ITEMTYPE struct class_List_Str__43b70c06cb*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_List_Str__43b70c06cb_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_List_Str__43b70c06cb)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
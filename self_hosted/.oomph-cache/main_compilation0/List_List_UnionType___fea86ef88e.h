@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_List_UnionType___fea86ef88e
+                #define HEADER_GUARD_List_List_UnionType___fea86ef88e
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "List_UnionType__f35bb76792.h"
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+
+#define CONSTRUCTOR ctor_List_List_UnionType___fea86ef88e
+
+#define DESTRUCTOR dtor_List_List_UnionType___fea86ef88e
+
+#define TYPE struct class_List_List_UnionType___fea86ef88e *
+
+#define TYPE_STRUCT class_List_List_UnionType___fea86ef88e
+
+#define METHOD(name) meth_List_List_UnionType___fea86ef88e_##name
+
+#define ITEMTYPE struct class_List_UnionType__f35bb76792*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_List_UnionType__f35bb76792_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_List_UnionType__f35bb76792)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_List_UnionType___fea86ef88e___contains(struct class_List_List_UnionType___fea86ef88e*, struct class_List_UnionType__f35bb76792*);
+void meth_List_List_UnionType___fea86ef88e___reserve(struct class_List_List_UnionType___fea86ef88e*, int64_t);
+struct class_List_UnionType__f35bb76792* meth_List_List_UnionType___fea86ef88e_delete_at_index(struct class_List_List_UnionType___fea86ef88e*, int64_t);
+struct class_List_List_UnionType___fea86ef88e* meth_List_List_UnionType___fea86ef88e_delete_slice(struct class_List_List_UnionType___fea86ef88e*, int64_t, int64_t);
+bool meth_List_List_UnionType___fea86ef88e_ends_with(struct class_List_List_UnionType___fea86ef88e*, struct class_List_List_UnionType___fea86ef88e*);
+int64_t meth_List_List_UnionType___fea86ef88e_find_first(struct class_List_List_UnionType___fea86ef88e*, struct class_List_UnionType__f35bb76792*);
+int64_t meth_List_List_UnionType___fea86ef88e_find_last(struct class_List_List_UnionType___fea86ef88e*, struct class_List_UnionType__f35bb76792*);
+int64_t meth_List_List_UnionType___fea86ef88e_find_only(struct class_List_List_UnionType___fea86ef88e*, struct class_List_UnionType__f35bb76792*);
+struct class_List_UnionType__f35bb76792* meth_List_List_UnionType___fea86ef88e_first(struct class_List_List_UnionType___fea86ef88e*);
+struct class_List_UnionType__f35bb76792* meth_List_List_UnionType___fea86ef88e_get(struct class_List_List_UnionType___fea86ef88e*, int64_t);
+void meth_List_List_UnionType___fea86ef88e_insert(struct class_List_List_UnionType___fea86ef88e*, int64_t, struct class_List_UnionType__f35bb76792*);
+struct class_List_UnionType__f35bb76792* meth_List_List_UnionType___fea86ef88e_last(struct class_List_List_UnionType___fea86ef88e*);
+int64_t meth_List_List_UnionType___fea86ef88e_length(struct class_List_List_UnionType___fea86ef88e*);
+struct class_List_UnionType__f35bb76792* meth_List_List_UnionType___fea86ef88e_pop(struct class_List_List_UnionType___fea86ef88e*);
+void meth_List_List_UnionType___fea86ef88e_push(struct class_List_List_UnionType___fea86ef88e*, struct class_List_UnionType__f35bb76792*);
+void meth_List_List_UnionType___fea86ef88e_push_all(struct class_List_List_UnionType___fea86ef88e*, struct class_List_List_UnionType___fea86ef88e*);
+void meth_List_List_UnionType___fea86ef88e_delete_first(struct class_List_List_UnionType___fea86ef88e*, struct class_List_UnionType__f35bb76792*);
+void meth_List_List_UnionType___fea86ef88e_delete_last(struct class_List_List_UnionType___fea86ef88e*, struct class_List_UnionType__f35bb76792*);
+void meth_List_List_UnionType___fea86ef88e_delete_only(struct class_List_List_UnionType___fea86ef88e*, struct class_List_UnionType__f35bb76792*);
+struct class_List_List_UnionType___fea86ef88e* meth_List_List_UnionType___fea86ef88e_reversed(struct class_List_List_UnionType___fea86ef88e*);
+struct class_List_List_UnionType___fea86ef88e* meth_List_List_UnionType___fea86ef88e_slice(struct class_List_List_UnionType___fea86ef88e*, int64_t, int64_t);
+bool meth_List_List_UnionType___fea86ef88e_starts_with(struct class_List_List_UnionType___fea86ef88e*, struct class_List_List_UnionType___fea86ef88e*);
+struct class_Str meth_List_List_UnionType___fea86ef88e_to_string(struct class_List_List_UnionType___fea86ef88e*);
+struct class_Str meth_List_List_UnionType___fea86ef88e_join(struct class_List_List_UnionType___fea86ef88e*, struct class_Str);
+bool meth_List_List_UnionType___fea86ef88e_equals(struct class_List_List_UnionType___fea86ef88e*, struct class_List_List_UnionType___fea86ef88e*);
+
+#define CONSTRUCTOR ctor_List_List_UnionType___fea86ef88e
+
+#define DESTRUCTOR dtor_List_List_UnionType___fea86ef88e
+
+#define TYPE struct class_List_List_UnionType___fea86ef88e *
+
+#define TYPE_STRUCT class_List_List_UnionType___fea86ef88e
+
+#define METHOD(name) meth_List_List_UnionType___fea86ef88e_##name
+
+#define ITEMTYPE struct class_List_UnionType__f35bb76792*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_List_UnionType__f35bb76792_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_List_UnionType__f35bb76792)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_LocalVariable__81e23234f3
+                #define HEADER_GUARD_List_LocalVariable__81e23234f3
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "LocalVariable_846080e5ae.h"
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+
+#define CONSTRUCTOR ctor_List_LocalVariable__81e23234f3
+
+#define DESTRUCTOR dtor_List_LocalVariable__81e23234f3
+
+#define TYPE struct class_List_LocalVariable__81e23234f3 *
+
+#define TYPE_STRUCT class_List_LocalVariable__81e23234f3
+
+#define METHOD(name) meth_List_LocalVariable__81e23234f3_##name
+
+#define ITEMTYPE struct class_LocalVariable_846080e5ae*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_LocalVariable_846080e5ae_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_LocalVariable_846080e5ae)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_LocalVariable__81e23234f3___contains(struct class_List_LocalVariable__81e23234f3*, struct class_LocalVariable_846080e5ae*);
+void meth_List_LocalVariable__81e23234f3___reserve(struct class_List_LocalVariable__81e23234f3*, int64_t);
+struct class_LocalVariable_846080e5ae* meth_List_LocalVariable__81e23234f3_delete_at_index(struct class_List_LocalVariable__81e23234f3*, int64_t);
+struct class_List_LocalVariable__81e23234f3* meth_List_LocalVariable__81e23234f3_delete_slice(struct class_List_LocalVariable__81e23234f3*, int64_t, int64_t);
+bool meth_List_LocalVariable__81e23234f3_ends_with(struct class_List_LocalVariable__81e23234f3*, struct class_List_LocalVariable__81e23234f3*);
+int64_t meth_List_LocalVariable__81e23234f3_find_first(struct class_List_LocalVariable__81e23234f3*, struct class_LocalVariable_846080e5ae*);
+int64_t meth_List_LocalVariable__81e23234f3_find_last(struct class_List_LocalVariable__81e23234f3*, struct class_LocalVariable_846080e5ae*);
+int64_t meth_List_LocalVariable__81e23234f3_find_only(struct class_List_LocalVariable__81e23234f3*, struct class_LocalVariable_846080e5ae*);
+struct class_LocalVariable_846080e5ae* meth_List_LocalVariable__81e23234f3_first(struct class_List_LocalVariable__81e23234f3*);
+struct class_LocalVariable_846080e5ae* meth_List_LocalVariable__81e23234f3_get(struct class_List_LocalVariable__81e23234f3*, int64_t);
+void meth_List_LocalVariable__81e23234f3_insert(struct class_List_LocalVariable__81e23234f3*, int64_t, struct class_LocalVariable_846080e5ae*);
+struct class_LocalVariable_846080e5ae* meth_List_LocalVariable__81e23234f3_last(struct class_List_LocalVariable__81e23234f3*);
+int64_t meth_List_LocalVariable__81e23234f3_length(struct class_List_LocalVariable__81e23234f3*);
+struct class_LocalVariable_846080e5ae* meth_List_LocalVariable__81e23234f3_pop(struct class_List_LocalVariable__81e23234f3*);
+void meth_List_LocalVariable__81e23234f3_push(struct class_List_LocalVariable__81e23234f3*, struct class_LocalVariable_846080e5ae*);
+void meth_List_LocalVariable__81e23234f3_push_all(struct class_List_LocalVariable__81e23234f3*, struct class_List_LocalVariable__81e23234f3*);
+void meth_List_LocalVariable__81e23234f3_delete_first(struct class_List_LocalVariable__81e23234f3*, struct class_LocalVariable_846080e5ae*);
+void meth_List_LocalVariable__81e23234f3_delete_last(struct class_List_LocalVariable__81e23234f3*, struct class_LocalVariable_846080e5ae*);
+void meth_List_LocalVariable__81e23234f3_delete_only(struct class_List_LocalVariable__81e23234f3*, struct class_LocalVariable_846080e5ae*);
+struct class_List_LocalVariable__81e23234f3* meth_List_LocalVariable__81e23234f3_reversed(struct class_List_LocalVariable__81e23234f3*);
+struct class_List_LocalVariable__81e23234f3* meth_List_LocalVariable__81e23234f3_slice(struct class_List_LocalVariable__81e23234f3*, int64_t, int64_t);
+bool meth_List_LocalVariable__81e23234f3_starts_with(struct class_List_LocalVariable__81e23234f3*, struct class_List_LocalVariable__81e23234f3*);
+struct class_Str meth_List_LocalVariable__81e23234f3_to_string(struct class_List_LocalVariable__81e23234f3*);
+struct class_Str meth_List_LocalVariable__81e23234f3_join(struct class_List_LocalVariable__81e23234f3*, struct class_Str);
+bool meth_List_LocalVariable__81e23234f3_equals(struct class_List_LocalVariable__81e23234f3*, struct class_List_LocalVariable__81e23234f3*);
+
+#define CONSTRUCTOR ctor_List_LocalVariable__81e23234f3
+
+#define DESTRUCTOR dtor_List_LocalVariable__81e23234f3
+
+#define TYPE struct class_List_LocalVariable__81e23234f3 *
+
+#define TYPE_STRUCT class_List_LocalVariable__81e23234f3
+
+#define METHOD(name) meth_List_LocalVariable__81e23234f3_##name
+
+#define ITEMTYPE struct class_LocalVariable_846080e5ae*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_LocalVariable_846080e5ae_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_LocalVariable_846080e5ae)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_LoopLabels__74a48e6cc9
+                #define HEADER_GUARD_List_LoopLabels__74a48e6cc9
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "LoopLabels_8e8d3917a5.h"
+struct class_LoopLabels_8e8d3917a5;
+struct class_LoopLabels_8e8d3917a5;
+struct class_LoopLabels_8e8d3917a5;
+struct class_LoopLabels_8e8d3917a5;
+struct class_LoopLabels_8e8d3917a5;
+struct class_LoopLabels_8e8d3917a5;
+struct class_LoopLabels_8e8d3917a5;
+struct class_LoopLabels_8e8d3917a5;
+struct class_LoopLabels_8e8d3917a5;
+struct class_LoopLabels_8e8d3917a5;
+struct class_LoopLabels_8e8d3917a5;
+struct class_LoopLabels_8e8d3917a5;
+struct class_LoopLabels_8e8d3917a5;
+struct class_LoopLabels_8e8d3917a5;
+
+#define CONSTRUCTOR ctor_List_LoopLabels__74a48e6cc9
+
+#define DESTRUCTOR dtor_List_LoopLabels__74a48e6cc9
+
+#define TYPE struct class_List_LoopLabels__74a48e6cc9 *
+
+#define TYPE_STRUCT class_List_LoopLabels__74a48e6cc9
+
+#define METHOD(name) meth_List_LoopLabels__74a48e6cc9_##name
+
+#define ITEMTYPE struct class_LoopLabels_8e8d3917a5*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_LoopLabels_8e8d3917a5_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_LoopLabels_8e8d3917a5)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_LoopLabels__74a48e6cc9___contains(struct class_List_LoopLabels__74a48e6cc9*, struct class_LoopLabels_8e8d3917a5*);
+void meth_List_LoopLabels__74a48e6cc9___reserve(struct class_List_LoopLabels__74a48e6cc9*, int64_t);
+struct class_LoopLabels_8e8d3917a5* meth_List_LoopLabels__74a48e6cc9_delete_at_index(struct class_List_LoopLabels__74a48e6cc9*, int64_t);
+struct class_List_LoopLabels__74a48e6cc9* meth_List_LoopLabels__74a48e6cc9_delete_slice(struct class_List_LoopLabels__74a48e6cc9*, int64_t, int64_t);
+bool meth_List_LoopLabels__74a48e6cc9_ends_with(struct class_List_LoopLabels__74a48e6cc9*, struct class_List_LoopLabels__74a48e6cc9*);
+int64_t meth_List_LoopLabels__74a48e6cc9_find_first(struct class_List_LoopLabels__74a48e6cc9*, struct class_LoopLabels_8e8d3917a5*);
+int64_t meth_List_LoopLabels__74a48e6cc9_find_last(struct class_List_LoopLabels__74a48e6cc9*, struct class_LoopLabels_8e8d3917a5*);
+int64_t meth_List_LoopLabels__74a48e6cc9_find_only(struct class_List_LoopLabels__74a48e6cc9*, struct class_LoopLabels_8e8d3917a5*);
+struct class_LoopLabels_8e8d3917a5* meth_List_LoopLabels__74a48e6cc9_first(struct class_List_LoopLabels__74a48e6cc9*);
+struct class_LoopLabels_8e8d3917a5* meth_List_LoopLabels__74a48e6cc9_get(struct class_List_LoopLabels__74a48e6cc9*, int64_t);
+void meth_List_LoopLabels__74a48e6cc9_insert(struct class_List_LoopLabels__74a48e6cc9*, int64_t, struct class_LoopLabels_8e8d3917a5*);
+struct class_LoopLabels_8e8d3917a5* meth_List_LoopLabels__74a48e6cc9_last(struct class_List_LoopLabels__74a48e6cc9*);
+int64_t meth_List_LoopLabels__74a48e6cc9_length(struct class_List_LoopLabels__74a48e6cc9*);
+struct class_LoopLabels_8e8d3917a5* meth_List_LoopLabels__74a48e6cc9_pop(struct class_List_LoopLabels__74a48e6cc9*);
+void meth_List_LoopLabels__74a48e6cc9_push(struct class_List_LoopLabels__74a48e6cc9*, struct class_LoopLabels_8e8d3917a5*);
+void meth_List_LoopLabels__74a48e6cc9_push_all(struct class_List_LoopLabels__74a48e6cc9*, struct class_List_LoopLabels__74a48e6cc9*);
+void meth_List_LoopLabels__74a48e6cc9_delete_first(struct class_List_LoopLabels__74a48e6cc9*, struct class_LoopLabels_8e8d3917a5*);
+void meth_List_LoopLabels__74a48e6cc9_delete_last(struct class_List_LoopLabels__74a48e6cc9*, struct class_LoopLabels_8e8d3917a5*);
+void meth_List_LoopLabels__74a48e6cc9_delete_only(struct class_List_LoopLabels__74a48e6cc9*, struct class_LoopLabels_8e8d3917a5*);
+struct class_List_LoopLabels__74a48e6cc9* meth_List_LoopLabels__74a48e6cc9_reversed(struct class_List_LoopLabels__74a48e6cc9*);
+struct class_List_LoopLabels__74a48e6cc9* meth_List_LoopLabels__74a48e6cc9_slice(struct class_List_LoopLabels__74a48e6cc9*, int64_t, int64_t);
+bool meth_List_LoopLabels__74a48e6cc9_starts_with(struct class_List_LoopLabels__74a48e6cc9*, struct class_List_LoopLabels__74a48e6cc9*);
+struct class_Str meth_List_LoopLabels__74a48e6cc9_to_string(struct class_List_LoopLabels__74a48e6cc9*);
+struct class_Str meth_List_LoopLabels__74a48e6cc9_join(struct class_List_LoopLabels__74a48e6cc9*, struct class_Str);
+bool meth_List_LoopLabels__74a48e6cc9_equals(struct class_List_LoopLabels__74a48e6cc9*, struct class_List_LoopLabels__74a48e6cc9*);
+
+#define CONSTRUCTOR ctor_List_LoopLabels__74a48e6cc9
+
+#define DESTRUCTOR dtor_List_LoopLabels__74a48e6cc9
+
+#define TYPE struct class_List_LoopLabels__74a48e6cc9 *
+
+#define TYPE_STRUCT class_List_LoopLabels__74a48e6cc9
+
+#define METHOD(name) meth_List_LoopLabels__74a48e6cc9_##name
+
+#define ITEMTYPE struct class_LoopLabels_8e8d3917a5*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_LoopLabels_8e8d3917a5_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_LoopLabels_8e8d3917a5)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_Member__7525bf27e3
+                #define HEADER_GUARD_List_Member__7525bf27e3
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Member_a3dd2b1b39.h"
+struct class_Member_a3dd2b1b39;
+struct class_Member_a3dd2b1b39;
+struct class_Member_a3dd2b1b39;
+struct class_Member_a3dd2b1b39;
+struct class_Member_a3dd2b1b39;
+struct class_Member_a3dd2b1b39;
+struct class_Member_a3dd2b1b39;
+struct class_Member_a3dd2b1b39;
+struct class_Member_a3dd2b1b39;
+struct class_Member_a3dd2b1b39;
+struct class_Member_a3dd2b1b39;
+struct class_Member_a3dd2b1b39;
+struct class_Member_a3dd2b1b39;
+struct class_Member_a3dd2b1b39;
+
+#define CONSTRUCTOR ctor_List_Member__7525bf27e3
+
+#define DESTRUCTOR dtor_List_Member__7525bf27e3
+
+#define TYPE struct class_List_Member__7525bf27e3 *
+
+#define TYPE_STRUCT class_List_Member__7525bf27e3
+
+#define METHOD(name) meth_List_Member__7525bf27e3_##name
+
+#define ITEMTYPE struct class_Member_a3dd2b1b39*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Member_a3dd2b1b39_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Member_a3dd2b1b39)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Member__7525bf27e3___contains(struct class_List_Member__7525bf27e3*, struct class_Member_a3dd2b1b39*);
+void meth_List_Member__7525bf27e3___reserve(struct class_List_Member__7525bf27e3*, int64_t);
+struct class_Member_a3dd2b1b39* meth_List_Member__7525bf27e3_delete_at_index(struct class_List_Member__7525bf27e3*, int64_t);
+struct class_List_Member__7525bf27e3* meth_List_Member__7525bf27e3_delete_slice(struct class_List_Member__7525bf27e3*, int64_t, int64_t);
+bool meth_List_Member__7525bf27e3_ends_with(struct class_List_Member__7525bf27e3*, struct class_List_Member__7525bf27e3*);
+int64_t meth_List_Member__7525bf27e3_find_first(struct class_List_Member__7525bf27e3*, struct class_Member_a3dd2b1b39*);
+int64_t meth_List_Member__7525bf27e3_find_last(struct class_List_Member__7525bf27e3*, struct class_Member_a3dd2b1b39*);
+int64_t meth_List_Member__7525bf27e3_find_only(struct class_List_Member__7525bf27e3*, struct class_Member_a3dd2b1b39*);
+struct class_Member_a3dd2b1b39* meth_List_Member__7525bf27e3_first(struct class_List_Member__7525bf27e3*);
+struct class_Member_a3dd2b1b39* meth_List_Member__7525bf27e3_get(struct class_List_Member__7525bf27e3*, int64_t);
+void meth_List_Member__7525bf27e3_insert(struct class_List_Member__7525bf27e3*, int64_t, struct class_Member_a3dd2b1b39*);
+struct class_Member_a3dd2b1b39* meth_List_Member__7525bf27e3_last(struct class_List_Member__7525bf27e3*);
+int64_t meth_List_Member__7525bf27e3_length(struct class_List_Member__7525bf27e3*);
+struct class_Member_a3dd2b1b39* meth_List_Member__7525bf27e3_pop(struct class_List_Member__7525bf27e3*);
+void meth_List_Member__7525bf27e3_push(struct class_List_Member__7525bf27e3*, struct class_Member_a3dd2b1b39*);
+void meth_List_Member__7525bf27e3_push_all(struct class_List_Member__7525bf27e3*, struct class_List_Member__7525bf27e3*);
+void meth_List_Member__7525bf27e3_delete_first(struct class_List_Member__7525bf27e3*, struct class_Member_a3dd2b1b39*);
+void meth_List_Member__7525bf27e3_delete_last(struct class_List_Member__7525bf27e3*, struct class_Member_a3dd2b1b39*);
+void meth_List_Member__7525bf27e3_delete_only(struct class_List_Member__7525bf27e3*, struct class_Member_a3dd2b1b39*);
+struct class_List_Member__7525bf27e3* meth_List_Member__7525bf27e3_reversed(struct class_List_Member__7525bf27e3*);
+struct class_List_Member__7525bf27e3* meth_List_Member__7525bf27e3_slice(struct class_List_Member__7525bf27e3*, int64_t, int64_t);
+bool meth_List_Member__7525bf27e3_starts_with(struct class_List_Member__7525bf27e3*, struct class_List_Member__7525bf27e3*);
+struct class_Str meth_List_Member__7525bf27e3_to_string(struct class_List_Member__7525bf27e3*);
+struct class_Str meth_List_Member__7525bf27e3_join(struct class_List_Member__7525bf27e3*, struct class_Str);
+bool meth_List_Member__7525bf27e3_equals(struct class_List_Member__7525bf27e3*, struct class_List_Member__7525bf27e3*);
+
+#define CONSTRUCTOR ctor_List_Member__7525bf27e3
+
+#define DESTRUCTOR dtor_List_Member__7525bf27e3
+
+#define TYPE struct class_List_Member__7525bf27e3 *
+
+#define TYPE_STRUCT class_List_Member__7525bf27e3
+
+#define METHOD(name) meth_List_Member__7525bf27e3_##name
+
+#define ITEMTYPE struct class_Member_a3dd2b1b39*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Member_a3dd2b1b39_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Member_a3dd2b1b39)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_Method__1e0ab9c757
+                #define HEADER_GUARD_List_Method__1e0ab9c757
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Method_bfbd73ad15.h"
+struct class_Method_bfbd73ad15;
+struct class_Method_bfbd73ad15;
+struct class_Method_bfbd73ad15;
+struct class_Method_bfbd73ad15;
+struct class_Method_bfbd73ad15;
+struct class_Method_bfbd73ad15;
+struct class_Method_bfbd73ad15;
+struct class_Method_bfbd73ad15;
+struct class_Method_bfbd73ad15;
+struct class_Method_bfbd73ad15;
+struct class_Method_bfbd73ad15;
+struct class_Method_bfbd73ad15;
+struct class_Method_bfbd73ad15;
+struct class_Method_bfbd73ad15;
+
+#define CONSTRUCTOR ctor_List_Method__1e0ab9c757
+
+#define DESTRUCTOR dtor_List_Method__1e0ab9c757
+
+#define TYPE struct class_List_Method__1e0ab9c757 *
+
+#define TYPE_STRUCT class_List_Method__1e0ab9c757
+
+#define METHOD(name) meth_List_Method__1e0ab9c757_##name
+
+#define ITEMTYPE struct class_Method_bfbd73ad15*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Method_bfbd73ad15_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Method_bfbd73ad15)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Method__1e0ab9c757___contains(struct class_List_Method__1e0ab9c757*, struct class_Method_bfbd73ad15*);
+void meth_List_Method__1e0ab9c757___reserve(struct class_List_Method__1e0ab9c757*, int64_t);
+struct class_Method_bfbd73ad15* meth_List_Method__1e0ab9c757_delete_at_index(struct class_List_Method__1e0ab9c757*, int64_t);
+struct class_List_Method__1e0ab9c757* meth_List_Method__1e0ab9c757_delete_slice(struct class_List_Method__1e0ab9c757*, int64_t, int64_t);
+bool meth_List_Method__1e0ab9c757_ends_with(struct class_List_Method__1e0ab9c757*, struct class_List_Method__1e0ab9c757*);
+int64_t meth_List_Method__1e0ab9c757_find_first(struct class_List_Method__1e0ab9c757*, struct class_Method_bfbd73ad15*);
+int64_t meth_List_Method__1e0ab9c757_find_last(struct class_List_Method__1e0ab9c757*, struct class_Method_bfbd73ad15*);
+int64_t meth_List_Method__1e0ab9c757_find_only(struct class_List_Method__1e0ab9c757*, struct class_Method_bfbd73ad15*);
+struct class_Method_bfbd73ad15* meth_List_Method__1e0ab9c757_first(struct class_List_Method__1e0ab9c757*);
+struct class_Method_bfbd73ad15* meth_List_Method__1e0ab9c757_get(struct class_List_Method__1e0ab9c757*, int64_t);
+void meth_List_Method__1e0ab9c757_insert(struct class_List_Method__1e0ab9c757*, int64_t, struct class_Method_bfbd73ad15*);
+struct class_Method_bfbd73ad15* meth_List_Method__1e0ab9c757_last(struct class_List_Method__1e0ab9c757*);
+int64_t meth_List_Method__1e0ab9c757_length(struct class_List_Method__1e0ab9c757*);
+struct class_Method_bfbd73ad15* meth_List_Method__1e0ab9c757_pop(struct class_List_Method__1e0ab9c757*);
+void meth_List_Method__1e0ab9c757_push(struct class_List_Method__1e0ab9c757*, struct class_Method_bfbd73ad15*);
+void meth_List_Method__1e0ab9c757_push_all(struct class_List_Method__1e0ab9c757*, struct class_List_Method__1e0ab9c757*);
+void meth_List_Method__1e0ab9c757_delete_first(struct class_List_Method__1e0ab9c757*, struct class_Method_bfbd73ad15*);
+void meth_List_Method__1e0ab9c757_delete_last(struct class_List_Method__1e0ab9c757*, struct class_Method_bfbd73ad15*);
+void meth_List_Method__1e0ab9c757_delete_only(struct class_List_Method__1e0ab9c757*, struct class_Method_bfbd73ad15*);
+struct class_List_Method__1e0ab9c757* meth_List_Method__1e0ab9c757_reversed(struct class_List_Method__1e0ab9c757*);
+struct class_List_Method__1e0ab9c757* meth_List_Method__1e0ab9c757_slice(struct class_List_Method__1e0ab9c757*, int64_t, int64_t);
+bool meth_List_Method__1e0ab9c757_starts_with(struct class_List_Method__1e0ab9c757*, struct class_List_Method__1e0ab9c757*);
+struct class_Str meth_List_Method__1e0ab9c757_to_string(struct class_List_Method__1e0ab9c757*);
+struct class_Str meth_List_Method__1e0ab9c757_join(struct class_List_Method__1e0ab9c757*, struct class_Str);
+bool meth_List_Method__1e0ab9c757_equals(struct class_List_Method__1e0ab9c757*, struct class_List_Method__1e0ab9c757*);
+
+#define CONSTRUCTOR ctor_List_Method__1e0ab9c757
+
+#define DESTRUCTOR dtor_List_Method__1e0ab9c757
+
+#define TYPE struct class_List_Method__1e0ab9c757 *
+
+#define TYPE_STRUCT class_List_Method__1e0ab9c757
+
+#define METHOD(name) meth_List_Method__1e0ab9c757_##name
+
+#define ITEMTYPE struct class_Method_bfbd73ad15*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Method_bfbd73ad15_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Method_bfbd73ad15)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
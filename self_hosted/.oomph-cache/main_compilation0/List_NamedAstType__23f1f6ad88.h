@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_NamedAstType__23f1f6ad88
+                #define HEADER_GUARD_List_NamedAstType__23f1f6ad88
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "NamedAstType_601829e0d0.h"
+struct class_NamedAstType_601829e0d0;
+struct class_NamedAstType_601829e0d0;
+struct class_NamedAstType_601829e0d0;
+struct class_NamedAstType_601829e0d0;
+struct class_NamedAstType_601829e0d0;
+struct class_NamedAstType_601829e0d0;
+struct class_NamedAstType_601829e0d0;
+struct class_NamedAstType_601829e0d0;
+struct class_NamedAstType_601829e0d0;
+struct class_NamedAstType_601829e0d0;
+struct class_NamedAstType_601829e0d0;
+struct class_NamedAstType_601829e0d0;
+struct class_NamedAstType_601829e0d0;
+struct class_NamedAstType_601829e0d0;
+
+#define CONSTRUCTOR ctor_List_NamedAstType__23f1f6ad88
+
+#define DESTRUCTOR dtor_List_NamedAstType__23f1f6ad88
+
+#define TYPE struct class_List_NamedAstType__23f1f6ad88 *
+
+#define TYPE_STRUCT class_List_NamedAstType__23f1f6ad88
+
+#define METHOD(name) meth_List_NamedAstType__23f1f6ad88_##name
+
+#define ITEMTYPE struct class_NamedAstType_601829e0d0*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_NamedAstType_601829e0d0_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_NamedAstType_601829e0d0)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_NamedAstType__23f1f6ad88___contains(struct class_List_NamedAstType__23f1f6ad88*, struct class_NamedAstType_601829e0d0*);
+void meth_List_NamedAstType__23f1f6ad88___reserve(struct class_List_NamedAstType__23f1f6ad88*, int64_t);
+struct class_NamedAstType_601829e0d0* meth_List_NamedAstType__23f1f6ad88_delete_at_index(struct class_List_NamedAstType__23f1f6ad88*, int64_t);
+struct class_List_NamedAstType__23f1f6ad88* meth_List_NamedAstType__23f1f6ad88_delete_slice(struct class_List_NamedAstType__23f1f6ad88*, int64_t, int64_t);
+bool meth_List_NamedAstType__23f1f6ad88_ends_with(struct class_List_NamedAstType__23f1f6ad88*, struct class_List_NamedAstType__23f1f6ad88*);
+int64_t meth_List_NamedAstType__23f1f6ad88_find_first(struct class_List_NamedAstType__23f1f6ad88*, struct class_NamedAstType_601829e0d0*);
+int64_t meth_List_NamedAstType__23f1f6ad88_find_last(struct class_List_NamedAstType__23f1f6ad88*, struct class_NamedAstType_601829e0d0*);
+int64_t meth_List_NamedAstType__23f1f6ad88_find_only(struct class_List_NamedAstType__23f1f6ad88*, struct class_NamedAstType_601829e0d0*);
+struct class_NamedAstType_601829e0d0* meth_List_NamedAstType__23f1f6ad88_first(struct class_List_NamedAstType__23f1f6ad88*);
+struct class_NamedAstType_601829e0d0* meth_List_NamedAstType__23f1f6ad88_get(struct class_List_NamedAstType__23f1f6ad88*, int64_t);
+void meth_List_NamedAstType__23f1f6ad88_insert(struct class_List_NamedAstType__23f1f6ad88*, int64_t, struct class_NamedAstType_601829e0d0*);
+struct class_NamedAstType_601829e0d0* meth_List_NamedAstType__23f1f6ad88_last(struct class_List_NamedAstType__23f1f6ad88*);
+int64_t meth_List_NamedAstType__23f1f6ad88_length(struct class_List_NamedAstType__23f1f6ad88*);
+struct class_NamedAstType_601829e0d0* meth_List_NamedAstType__23f1f6ad88_pop(struct class_List_NamedAstType__23f1f6ad88*);
+void meth_List_NamedAstType__23f1f6ad88_push(struct class_List_NamedAstType__23f1f6ad88*, struct class_NamedAstType_601829e0d0*);
+void meth_List_NamedAstType__23f1f6ad88_push_all(struct class_List_NamedAstType__23f1f6ad88*, struct class_List_NamedAstType__23f1f6ad88*);
+void meth_List_NamedAstType__23f1f6ad88_delete_first(struct class_List_NamedAstType__23f1f6ad88*, struct class_NamedAstType_601829e0d0*);
+void meth_List_NamedAstType__23f1f6ad88_delete_last(struct class_List_NamedAstType__23f1f6ad88*, struct class_NamedAstType_601829e0d0*);
+void meth_List_NamedAstType__23f1f6ad88_delete_only(struct class_List_NamedAstType__23f1f6ad88*, struct class_NamedAstType_601829e0d0*);
+struct class_List_NamedAstType__23f1f6ad88* meth_List_NamedAstType__23f1f6ad88_reversed(struct class_List_NamedAstType__23f1f6ad88*);
+struct class_List_NamedAstType__23f1f6ad88* meth_List_NamedAstType__23f1f6ad88_slice(struct class_List_NamedAstType__23f1f6ad88*, int64_t, int64_t);
+bool meth_List_NamedAstType__23f1f6ad88_starts_with(struct class_List_NamedAstType__23f1f6ad88*, struct class_List_NamedAstType__23f1f6ad88*);
+struct class_Str meth_List_NamedAstType__23f1f6ad88_to_string(struct class_List_NamedAstType__23f1f6ad88*);
+struct class_Str meth_List_NamedAstType__23f1f6ad88_join(struct class_List_NamedAstType__23f1f6ad88*, struct class_Str);
+bool meth_List_NamedAstType__23f1f6ad88_equals(struct class_List_NamedAstType__23f1f6ad88*, struct class_List_NamedAstType__23f1f6ad88*);
+
+#define CONSTRUCTOR ctor_List_NamedAstType__23f1f6ad88
+
+#define DESTRUCTOR dtor_List_NamedAstType__23f1f6ad88
+
+#define TYPE struct class_List_NamedAstType__23f1f6ad88 *
+
+#define TYPE_STRUCT class_List_NamedAstType__23f1f6ad88
+
+#define METHOD(name) meth_List_NamedAstType__23f1f6ad88_##name
+
+#define ITEMTYPE struct class_NamedAstType_601829e0d0*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_NamedAstType_601829e0d0_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_NamedAstType_601829e0d0)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_NamedGeneric__fd1333dbd0
+                #define HEADER_GUARD_List_NamedGeneric__fd1333dbd0
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "NamedGeneric_b3d994eaa0.h"
+struct class_NamedGeneric_b3d994eaa0;
+struct class_NamedGeneric_b3d994eaa0;
+struct class_NamedGeneric_b3d994eaa0;
+struct class_NamedGeneric_b3d994eaa0;
+struct class_NamedGeneric_b3d994eaa0;
+struct class_NamedGeneric_b3d994eaa0;
+struct class_NamedGeneric_b3d994eaa0;
+struct class_NamedGeneric_b3d994eaa0;
+struct class_NamedGeneric_b3d994eaa0;
+struct class_NamedGeneric_b3d994eaa0;
+struct class_NamedGeneric_b3d994eaa0;
+struct class_NamedGeneric_b3d994eaa0;
+struct class_NamedGeneric_b3d994eaa0;
+struct class_NamedGeneric_b3d994eaa0;
+
+#define CONSTRUCTOR ctor_List_NamedGeneric__fd1333dbd0
+
+#define DESTRUCTOR dtor_List_NamedGeneric__fd1333dbd0
+
+#define TYPE struct class_List_NamedGeneric__fd1333dbd0 *
+
+#define TYPE_STRUCT class_List_NamedGeneric__fd1333dbd0
+
+#define METHOD(name) meth_List_NamedGeneric__fd1333dbd0_##name
+
+#define ITEMTYPE struct class_NamedGeneric_b3d994eaa0*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_NamedGeneric_b3d994eaa0_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_NamedGeneric_b3d994eaa0)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_NamedGeneric__fd1333dbd0___contains(struct class_List_NamedGeneric__fd1333dbd0*, struct class_NamedGeneric_b3d994eaa0*);
+void meth_List_NamedGeneric__fd1333dbd0___reserve(struct class_List_NamedGeneric__fd1333dbd0*, int64_t);
+struct class_NamedGeneric_b3d994eaa0* meth_List_NamedGeneric__fd1333dbd0_delete_at_index(struct class_List_NamedGeneric__fd1333dbd0*, int64_t);
+struct class_List_NamedGeneric__fd1333dbd0* meth_List_NamedGeneric__fd1333dbd0_delete_slice(struct class_List_NamedGeneric__fd1333dbd0*, int64_t, int64_t);
+bool meth_List_NamedGeneric__fd1333dbd0_ends_with(struct class_List_NamedGeneric__fd1333dbd0*, struct class_List_NamedGeneric__fd1333dbd0*);
+int64_t meth_List_NamedGeneric__fd1333dbd0_find_first(struct class_List_NamedGeneric__fd1333dbd0*, struct class_NamedGeneric_b3d994eaa0*);
+int64_t meth_List_NamedGeneric__fd1333dbd0_find_last(struct class_List_NamedGeneric__fd1333dbd0*, struct class_NamedGeneric_b3d994eaa0*);
+int64_t meth_List_NamedGeneric__fd1333dbd0_find_only(struct class_List_NamedGeneric__fd1333dbd0*, struct class_NamedGeneric_b3d994eaa0*);
+struct class_NamedGeneric_b3d994eaa0* meth_List_NamedGeneric__fd1333dbd0_first(struct class_List_NamedGeneric__fd1333dbd0*);
+struct class_NamedGeneric_b3d994eaa0* meth_List_NamedGeneric__fd1333dbd0_get(struct class_List_NamedGeneric__fd1333dbd0*, int64_t);
+void meth_List_NamedGeneric__fd1333dbd0_insert(struct class_List_NamedGeneric__fd1333dbd0*, int64_t, struct class_NamedGeneric_b3d994eaa0*);
+struct class_NamedGeneric_b3d994eaa0* meth_List_NamedGeneric__fd1333dbd0_last(struct class_List_NamedGeneric__fd1333dbd0*);
+int64_t meth_List_NamedGeneric__fd1333dbd0_length(struct class_List_NamedGeneric__fd1333dbd0*);
+struct class_NamedGeneric_b3d994eaa0* meth_List_NamedGeneric__fd1333dbd0_pop(struct class_List_NamedGeneric__fd1333dbd0*);
+void meth_List_NamedGeneric__fd1333dbd0_push(struct class_List_NamedGeneric__fd1333dbd0*, struct class_NamedGeneric_b3d994eaa0*);
+void meth_List_NamedGeneric__fd1333dbd0_push_all(struct class_List_NamedGeneric__fd1333dbd0*, struct class_List_NamedGeneric__fd1333dbd0*);
+void meth_List_NamedGeneric__fd1333dbd0_delete_first(struct class_List_NamedGeneric__fd1333dbd0*, struct class_NamedGeneric_b3d994eaa0*);
+void meth_List_NamedGeneric__fd1333dbd0_delete_last(struct class_List_NamedGeneric__fd1333dbd0*, struct class_NamedGeneric_b3d994eaa0*);
+void meth_List_NamedGeneric__fd1333dbd0_delete_only(struct class_List_NamedGeneric__fd1333dbd0*, struct class_NamedGeneric_b3d994eaa0*);
+struct class_List_NamedGeneric__fd1333dbd0* meth_List_NamedGeneric__fd1333dbd0_reversed(struct class_List_NamedGeneric__fd1333dbd0*);
+struct class_List_NamedGeneric__fd1333dbd0* meth_List_NamedGeneric__fd1333dbd0_slice(struct class_List_NamedGeneric__fd1333dbd0*, int64_t, int64_t);
+bool meth_List_NamedGeneric__fd1333dbd0_starts_with(struct class_List_NamedGeneric__fd1333dbd0*, struct class_List_NamedGeneric__fd1333dbd0*);
+struct class_Str meth_List_NamedGeneric__fd1333dbd0_to_string(struct class_List_NamedGeneric__fd1333dbd0*);
+struct class_Str meth_List_NamedGeneric__fd1333dbd0_join(struct class_List_NamedGeneric__fd1333dbd0*, struct class_Str);
+bool meth_List_NamedGeneric__fd1333dbd0_equals(struct class_List_NamedGeneric__fd1333dbd0*, struct class_List_NamedGeneric__fd1333dbd0*);
+
+#define CONSTRUCTOR ctor_List_NamedGeneric__fd1333dbd0
+
+#define DESTRUCTOR dtor_List_NamedGeneric__fd1333dbd0
+
+#define TYPE struct class_List_NamedGeneric__fd1333dbd0 *
+
+#define TYPE_STRUCT class_List_NamedGeneric__fd1333dbd0
+
+#define METHOD(name) meth_List_NamedGeneric__fd1333dbd0_##name
+
+#define ITEMTYPE struct class_NamedGeneric_b3d994eaa0*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_NamedGeneric_b3d994eaa0_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_NamedGeneric_b3d994eaa0)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_NamedType__d1143722a6
+                #define HEADER_GUARD_List_NamedType__d1143722a6
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "NamedType_fe3e45e722.h"
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+
+#define CONSTRUCTOR ctor_List_NamedType__d1143722a6
+
+#define DESTRUCTOR dtor_List_NamedType__d1143722a6
+
+#define TYPE struct class_List_NamedType__d1143722a6 *
+
+#define TYPE_STRUCT class_List_NamedType__d1143722a6
+
+#define METHOD(name) meth_List_NamedType__d1143722a6_##name
+
+#define ITEMTYPE struct class_NamedType_fe3e45e722*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_NamedType_fe3e45e722_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_NamedType_fe3e45e722)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_NamedType__d1143722a6___contains(struct class_List_NamedType__d1143722a6*, struct class_NamedType_fe3e45e722*);
+void meth_List_NamedType__d1143722a6___reserve(struct class_List_NamedType__d1143722a6*, int64_t);
+struct class_NamedType_fe3e45e722* meth_List_NamedType__d1143722a6_delete_at_index(struct class_List_NamedType__d1143722a6*, int64_t);
+struct class_List_NamedType__d1143722a6* meth_List_NamedType__d1143722a6_delete_slice(struct class_List_NamedType__d1143722a6*, int64_t, int64_t);
+bool meth_List_NamedType__d1143722a6_ends_with(struct class_List_NamedType__d1143722a6*, struct class_List_NamedType__d1143722a6*);
+int64_t meth_List_NamedType__d1143722a6_find_first(struct class_List_NamedType__d1143722a6*, struct class_NamedType_fe3e45e722*);
+int64_t meth_List_NamedType__d1143722a6_find_last(struct class_List_NamedType__d1143722a6*, struct class_NamedType_fe3e45e722*);
+int64_t meth_List_NamedType__d1143722a6_find_only(struct class_List_NamedType__d1143722a6*, struct class_NamedType_fe3e45e722*);
+struct class_NamedType_fe3e45e722* meth_List_NamedType__d1143722a6_first(struct class_List_NamedType__d1143722a6*);
+struct class_NamedType_fe3e45e722* meth_List_NamedType__d1143722a6_get(struct class_List_NamedType__d1143722a6*, int64_t);
+void meth_List_NamedType__d1143722a6_insert(struct class_List_NamedType__d1143722a6*, int64_t, struct class_NamedType_fe3e45e722*);
+struct class_NamedType_fe3e45e722* meth_List_NamedType__d1143722a6_last(struct class_List_NamedType__d1143722a6*);
+int64_t meth_List_NamedType__d1143722a6_length(struct class_List_NamedType__d1143722a6*);
+struct class_NamedType_fe3e45e722* meth_List_NamedType__d1143722a6_pop(struct class_List_NamedType__d1143722a6*);
+void meth_List_NamedType__d1143722a6_push(struct class_List_NamedType__d1143722a6*, struct class_NamedType_fe3e45e722*);
+void meth_List_NamedType__d1143722a6_push_all(struct class_List_NamedType__d1143722a6*, struct class_List_NamedType__d1143722a6*);
+void meth_List_NamedType__d1143722a6_delete_first(struct class_List_NamedType__d1143722a6*, struct class_NamedType_fe3e45e722*);
+void meth_List_NamedType__d1143722a6_delete_last(struct class_List_NamedType__d1143722a6*, struct class_NamedType_fe3e45e722*);
+void meth_List_NamedType__d1143722a6_delete_only(struct class_List_NamedType__d1143722a6*, struct class_NamedType_fe3e45e722*);
+struct class_List_NamedType__d1143722a6* meth_List_NamedType__d1143722a6_reversed(struct class_List_NamedType__d1143722a6*);
+struct class_List_NamedType__d1143722a6* meth_List_NamedType__d1143722a6_slice(struct class_List_NamedType__d1143722a6*, int64_t, int64_t);
+bool meth_List_NamedType__d1143722a6_starts_with(struct class_List_NamedType__d1143722a6*, struct class_List_NamedType__d1143722a6*);
+struct class_Str meth_List_NamedType__d1143722a6_to_string(struct class_List_NamedType__d1143722a6*);
+struct class_Str meth_List_NamedType__d1143722a6_join(struct class_List_NamedType__d1143722a6*, struct class_Str);
+bool meth_List_NamedType__d1143722a6_equals(struct class_List_NamedType__d1143722a6*, struct class_List_NamedType__d1143722a6*);
+
+#define CONSTRUCTOR ctor_List_NamedType__d1143722a6
+
+#define DESTRUCTOR dtor_List_NamedType__d1143722a6
+
+#define TYPE struct class_List_NamedType__d1143722a6 *
+
+#define TYPE_STRUCT class_List_NamedType__d1143722a6
+
+#define METHOD(name) meth_List_NamedType__d1143722a6_##name
+
+#define ITEMTYPE struct class_NamedType_fe3e45e722*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_NamedType_fe3e45e722_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_NamedType_fe3e45e722)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_NamedVariable__2ad9e9e312
+                #define HEADER_GUARD_List_NamedVariable__2ad9e9e312
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "NamedVariable_ac0761c28d.h"
+struct class_NamedVariable_ac0761c28d;
+struct class_NamedVariable_ac0761c28d;
+struct class_NamedVariable_ac0761c28d;
+struct class_NamedVariable_ac0761c28d;
+struct class_NamedVariable_ac0761c28d;
+struct class_NamedVariable_ac0761c28d;
+struct class_NamedVariable_ac0761c28d;
+struct class_NamedVariable_ac0761c28d;
+struct class_NamedVariable_ac0761c28d;
+struct class_NamedVariable_ac0761c28d;
+struct class_NamedVariable_ac0761c28d;
+struct class_NamedVariable_ac0761c28d;
+struct class_NamedVariable_ac0761c28d;
+struct class_NamedVariable_ac0761c28d;
+
+#define CONSTRUCTOR ctor_List_NamedVariable__2ad9e9e312
+
+#define DESTRUCTOR dtor_List_NamedVariable__2ad9e9e312
+
+#define TYPE struct class_List_NamedVariable__2ad9e9e312 *
+
+#define TYPE_STRUCT class_List_NamedVariable__2ad9e9e312
+
+#define METHOD(name) meth_List_NamedVariable__2ad9e9e312_##name
+
+#define ITEMTYPE struct class_NamedVariable_ac0761c28d*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_NamedVariable_ac0761c28d_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_NamedVariable_ac0761c28d)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_NamedVariable__2ad9e9e312___contains(struct class_List_NamedVariable__2ad9e9e312*, struct class_NamedVariable_ac0761c28d*);
+void meth_List_NamedVariable__2ad9e9e312___reserve(struct class_List_NamedVariable__2ad9e9e312*, int64_t);
+struct class_NamedVariable_ac0761c28d* meth_List_NamedVariable__2ad9e9e312_delete_at_index(struct class_List_NamedVariable__2ad9e9e312*, int64_t);
+struct class_List_NamedVariable__2ad9e9e312* meth_List_NamedVariable__2ad9e9e312_delete_slice(struct class_List_NamedVariable__2ad9e9e312*, int64_t, int64_t);
+bool meth_List_NamedVariable__2ad9e9e312_ends_with(struct class_List_NamedVariable__2ad9e9e312*, struct class_List_NamedVariable__2ad9e9e312*);
+int64_t meth_List_NamedVariable__2ad9e9e312_find_first(struct class_List_NamedVariable__2ad9e9e312*, struct class_NamedVariable_ac0761c28d*);
+int64_t meth_List_NamedVariable__2ad9e9e312_find_last(struct class_List_NamedVariable__2ad9e9e312*, struct class_NamedVariable_ac0761c28d*);
+int64_t meth_List_NamedVariable__2ad9e9e312_find_only(struct class_List_NamedVariable__2ad9e9e312*, struct class_NamedVariable_ac0761c28d*);
+struct class_NamedVariable_ac0761c28d* meth_List_NamedVariable__2ad9e9e312_first(struct class_List_NamedVariable__2ad9e9e312*);
+struct class_NamedVariable_ac0761c28d* meth_List_NamedVariable__2ad9e9e312_get(struct class_List_NamedVariable__2ad9e9e312*, int64_t);
+void meth_List_NamedVariable__2ad9e9e312_insert(struct class_List_NamedVariable__2ad9e9e312*, int64_t, struct class_NamedVariable_ac0761c28d*);
+struct class_NamedVariable_ac0761c28d* meth_List_NamedVariable__2ad9e9e312_last(struct class_List_NamedVariable__2ad9e9e312*);
+int64_t meth_List_NamedVariable__2ad9e9e312_length(struct class_List_NamedVariable__2ad9e9e312*);
+struct class_NamedVariable_ac0761c28d* meth_List_NamedVariable__2ad9e9e312_pop(struct class_List_NamedVariable__2ad9e9e312*);
+void meth_List_NamedVariable__2ad9e9e312_push(struct class_List_NamedVariable__2ad9e9e312*, struct class_NamedVariable_ac0761c28d*);
+void meth_List_NamedVariable__2ad9e9e312_push_all(struct class_List_NamedVariable__2ad9e9e312*, struct class_List_NamedVariable__2ad9e9e312*);
+void meth_List_NamedVariable__2ad9e9e312_delete_first(struct class_List_NamedVariable__2ad9e9e312*, struct class_NamedVariable_ac0761c28d*);
+void meth_List_NamedVariable__2ad9e9e312_delete_last(struct class_List_NamedVariable__2ad9e9e312*, struct class_NamedVariable_ac0761c28d*);
+void meth_List_NamedVariable__2ad9e9e312_delete_only(struct class_List_NamedVariable__2ad9e9e312*, struct class_NamedVariable_ac0761c28d*);
+struct class_List_NamedVariable__2ad9e9e312* meth_List_NamedVariable__2ad9e9e312_reversed(struct class_List_NamedVariable__2ad9e9e312*);
+struct class_List_NamedVariable__2ad9e9e312* meth_List_NamedVariable__2ad9e9e312_slice(struct class_List_NamedVariable__2ad9e9e312*, int64_t, int64_t);
+bool meth_List_NamedVariable__2ad9e9e312_starts_with(struct class_List_NamedVariable__2ad9e9e312*, struct class_List_NamedVariable__2ad9e9e312*);
+struct class_Str meth_List_NamedVariable__2ad9e9e312_to_string(struct class_List_NamedVariable__2ad9e9e312*);
+struct class_Str meth_List_NamedVariable__2ad9e9e312_join(struct class_List_NamedVariable__2ad9e9e312*, struct class_Str);
+bool meth_List_NamedVariable__2ad9e9e312_equals(struct class_List_NamedVariable__2ad9e9e312*, struct class_List_NamedVariable__2ad9e9e312*);
+
+#define CONSTRUCTOR ctor_List_NamedVariable__2ad9e9e312
+
+#define DESTRUCTOR dtor_List_NamedVariable__2ad9e9e312
+
+#define TYPE struct class_List_NamedVariable__2ad9e9e312 *
+
+#define TYPE_STRUCT class_List_NamedVariable__2ad9e9e312
+
+#define METHOD(name) meth_List_NamedVariable__2ad9e9e312_##name
+
+#define ITEMTYPE struct class_NamedVariable_ac0761c28d*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_NamedVariable_ac0761c28d_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_NamedVariable_ac0761c28d)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
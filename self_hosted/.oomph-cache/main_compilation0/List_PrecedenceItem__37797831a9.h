@@ -0,0 +1,122 @@
+
+                #ifndef HEADER_GUARD_List_PrecedenceItem__37797831a9
+                #define HEADER_GUARD_List_PrecedenceItem__37797831a9
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "PrecedenceItem_f832c8ac03.h"
+
+#define CONSTRUCTOR ctor_List_PrecedenceItem__37797831a9
+
+#define DESTRUCTOR dtor_List_PrecedenceItem__37797831a9
+
+#define TYPE struct class_List_PrecedenceItem__37797831a9 *
+
+#define TYPE_STRUCT class_List_PrecedenceItem__37797831a9
+
+#define METHOD(name) meth_List_PrecedenceItem__37797831a9_##name
+
+#define ITEMTYPE struct class_PrecedenceItem_f832c8ac03
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_PrecedenceItem_f832c8ac03_##name
+
+#define INCREF_ITEM(val) incref_PrecedenceItem_f832c8ac03((val))
+
+#define DECREF_ITEM(val) decref_PrecedenceItem_f832c8ac03((val))
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_PrecedenceItem__37797831a9___contains(struct class_List_PrecedenceItem__37797831a9*, struct class_PrecedenceItem_f832c8ac03);
+void meth_List_PrecedenceItem__37797831a9___reserve(struct class_List_PrecedenceItem__37797831a9*, int64_t);
+struct class_PrecedenceItem_f832c8ac03 meth_List_PrecedenceItem__37797831a9_delete_at_index(struct class_List_PrecedenceItem__37797831a9*, int64_t);
+struct class_List_PrecedenceItem__37797831a9* meth_List_PrecedenceItem__37797831a9_delete_slice(struct class_List_PrecedenceItem__37797831a9*, int64_t, int64_t);
+bool meth_List_PrecedenceItem__37797831a9_ends_with(struct class_List_PrecedenceItem__37797831a9*, struct class_List_PrecedenceItem__37797831a9*);
+int64_t meth_List_PrecedenceItem__37797831a9_find_first(struct class_List_PrecedenceItem__37797831a9*, struct class_PrecedenceItem_f832c8ac03);
+int64_t meth_List_PrecedenceItem__37797831a9_find_last(struct class_List_PrecedenceItem__37797831a9*, struct class_PrecedenceItem_f832c8ac03);
+int64_t meth_List_PrecedenceItem__37797831a9_find_only(struct class_List_PrecedenceItem__37797831a9*, struct class_PrecedenceItem_f832c8ac03);
+struct class_PrecedenceItem_f832c8ac03 meth_List_PrecedenceItem__37797831a9_first(struct class_List_PrecedenceItem__37797831a9*);
+struct class_PrecedenceItem_f832c8ac03 meth_List_PrecedenceItem__37797831a9_get(struct class_List_PrecedenceItem__37797831a9*, int64_t);
+void meth_List_PrecedenceItem__37797831a9_insert(struct class_List_PrecedenceItem__37797831a9*, int64_t, struct class_PrecedenceItem_f832c8ac03);
+struct class_PrecedenceItem_f832c8ac03 meth_List_PrecedenceItem__37797831a9_last(struct class_List_PrecedenceItem__37797831a9*);
+int64_t meth_List_PrecedenceItem__37797831a9_length(struct class_List_PrecedenceItem__37797831a9*);
+struct class_PrecedenceItem_f832c8ac03 meth_List_PrecedenceItem__37797831a9_pop(struct class_List_PrecedenceItem__37797831a9*);
+void meth_List_PrecedenceItem__37797831a9_push(struct class_List_PrecedenceItem__37797831a9*, struct class_PrecedenceItem_f832c8ac03);
+void meth_List_PrecedenceItem__37797831a9_push_all(struct class_List_PrecedenceItem__37797831a9*, struct class_List_PrecedenceItem__37797831a9*);
+void meth_List_PrecedenceItem__37797831a9_delete_first(struct class_List_PrecedenceItem__37797831a9*, struct class_PrecedenceItem_f832c8ac03);
+void meth_List_PrecedenceItem__37797831a9_delete_last(struct class_List_PrecedenceItem__37797831a9*, struct class_PrecedenceItem_f832c8ac03);
+void meth_List_PrecedenceItem__37797831a9_delete_only(struct class_List_PrecedenceItem__37797831a9*, struct class_PrecedenceItem_f832c8ac03);
+struct class_List_PrecedenceItem__37797831a9* meth_List_PrecedenceItem__37797831a9_reversed(struct class_List_PrecedenceItem__37797831a9*);
+struct class_List_PrecedenceItem__37797831a9* meth_List_PrecedenceItem__37797831a9_slice(struct class_List_PrecedenceItem__37797831a9*, int64_t, int64_t);
+bool meth_List_PrecedenceItem__37797831a9_starts_with(struct class_List_PrecedenceItem__37797831a9*, struct class_List_PrecedenceItem__37797831a9*);
+struct class_Str meth_List_PrecedenceItem__37797831a9_to_string(struct class_List_PrecedenceItem__37797831a9*);
+struct class_Str meth_List_PrecedenceItem__37797831a9_join(struct class_List_PrecedenceItem__37797831a9*, struct class_Str);
+bool meth_List_PrecedenceItem__37797831a9_equals(struct class_List_PrecedenceItem__37797831a9*, struct class_List_PrecedenceItem__37797831a9*);
+
+#define CONSTRUCTOR ctor_List_PrecedenceItem__37797831a9
+
+#define DESTRUCTOR dtor_List_PrecedenceItem__37797831a9
+
+#define TYPE struct class_List_PrecedenceItem__37797831a9 *
+
+#define TYPE_STRUCT class_List_PrecedenceItem__37797831a9
+
+#define METHOD(name) meth_List_PrecedenceItem__37797831a9_##name
+
+#define ITEMTYPE struct class_PrecedenceItem_f832c8ac03
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_PrecedenceItem_f832c8ac03_##name
+
+#define INCREF_ITEM(val) incref_PrecedenceItem_f832c8ac03((val))
+
+#define DECREF_ITEM(val) decref_PrecedenceItem_f832c8ac03((val))
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
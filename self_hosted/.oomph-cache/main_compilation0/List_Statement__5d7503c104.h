@@ -0,0 +1,122 @@
+
+                #ifndef HEADER_GUARD_List_Statement__5d7503c104
+                #define HEADER_GUARD_List_Statement__5d7503c104
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Statement_1dc2e7090f.h"
+
+#define CONSTRUCTOR ctor_List_Statement__5d7503c104
+
+#define DESTRUCTOR dtor_List_Statement__5d7503c104
+
+#define TYPE struct class_List_Statement__5d7503c104 *
+
+#define TYPE_STRUCT class_List_Statement__5d7503c104
+
+#define METHOD(name) meth_List_Statement__5d7503c104_##name
+
+#define ITEMTYPE struct class_Statement_1dc2e7090f
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Statement_1dc2e7090f_##name
+
+#define INCREF_ITEM(val) incref_Statement_1dc2e7090f((val))
+
+#define DECREF_ITEM(val) decref_Statement_1dc2e7090f((val))
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Statement__5d7503c104___contains(struct class_List_Statement__5d7503c104*, struct class_Statement_1dc2e7090f);
+void meth_List_Statement__5d7503c104___reserve(struct class_List_Statement__5d7503c104*, int64_t);
+struct class_Statement_1dc2e7090f meth_List_Statement__5d7503c104_delete_at_index(struct class_List_Statement__5d7503c104*, int64_t);
+struct class_List_Statement__5d7503c104* meth_List_Statement__5d7503c104_delete_slice(struct class_List_Statement__5d7503c104*, int64_t, int64_t);
+bool meth_List_Statement__5d7503c104_ends_with(struct class_List_Statement__5d7503c104*, struct class_List_Statement__5d7503c104*);
+int64_t meth_List_Statement__5d7503c104_find_first(struct class_List_Statement__5d7503c104*, struct class_Statement_1dc2e7090f);
+int64_t meth_List_Statement__5d7503c104_find_last(struct class_List_Statement__5d7503c104*, struct class_Statement_1dc2e7090f);
+int64_t meth_List_Statement__5d7503c104_find_only(struct class_List_Statement__5d7503c104*, struct class_Statement_1dc2e7090f);
+struct class_Statement_1dc2e7090f meth_List_Statement__5d7503c104_first(struct class_List_Statement__5d7503c104*);
+struct class_Statement_1dc2e7090f meth_List_Statement__5d7503c104_get(struct class_List_Statement__5d7503c104*, int64_t);
+void meth_List_Statement__5d7503c104_insert(struct class_List_Statement__5d7503c104*, int64_t, struct class_Statement_1dc2e7090f);
+struct class_Statement_1dc2e7090f meth_List_Statement__5d7503c104_last(struct class_List_Statement__5d7503c104*);
+int64_t meth_List_Statement__5d7503c104_length(struct class_List_Statement__5d7503c104*);
+struct class_Statement_1dc2e7090f meth_List_Statement__5d7503c104_pop(struct class_List_Statement__5d7503c104*);
+void meth_List_Statement__5d7503c104_push(struct class_List_Statement__5d7503c104*, struct class_Statement_1dc2e7090f);
+void meth_List_Statement__5d7503c104_push_all(struct class_List_Statement__5d7503c104*, struct class_List_Statement__5d7503c104*);
+void meth_List_Statement__5d7503c104_delete_first(struct class_List_Statement__5d7503c104*, struct class_Statement_1dc2e7090f);
+void meth_List_Statement__5d7503c104_delete_last(struct class_List_Statement__5d7503c104*, struct class_Statement_1dc2e7090f);
+void meth_List_Statement__5d7503c104_delete_only(struct class_List_Statement__5d7503c104*, struct class_Statement_1dc2e7090f);
+struct class_List_Statement__5d7503c104* meth_List_Statement__5d7503c104_reversed(struct class_List_Statement__5d7503c104*);
+struct class_List_Statement__5d7503c104* meth_List_Statement__5d7503c104_slice(struct class_List_Statement__5d7503c104*, int64_t, int64_t);
+bool meth_List_Statement__5d7503c104_starts_with(struct class_List_Statement__5d7503c104*, struct class_List_Statement__5d7503c104*);
+struct class_Str meth_List_Statement__5d7503c104_to_string(struct class_List_Statement__5d7503c104*);
+struct class_Str meth_List_Statement__5d7503c104_join(struct class_List_Statement__5d7503c104*, struct class_Str);
+bool meth_List_Statement__5d7503c104_equals(struct class_List_Statement__5d7503c104*, struct class_List_Statement__5d7503c104*);
+
+#define CONSTRUCTOR ctor_List_Statement__5d7503c104
+
+#define DESTRUCTOR dtor_List_Statement__5d7503c104
+
+#define TYPE struct class_List_Statement__5d7503c104 *
+
+#define TYPE_STRUCT class_List_Statement__5d7503c104
+
+#define METHOD(name) meth_List_Statement__5d7503c104_##name
+
+#define ITEMTYPE struct class_Statement_1dc2e7090f
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Statement_1dc2e7090f_##name
+
+#define INCREF_ITEM(val) incref_Statement_1dc2e7090f((val))
+
+#define DECREF_ITEM(val) decref_Statement_1dc2e7090f((val))
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_Symbol__9a01330177
+                #define HEADER_GUARD_List_Symbol__9a01330177
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Symbol_037dd39afd.h"
+struct class_Symbol_037dd39afd;
+struct class_Symbol_037dd39afd;
+struct class_Symbol_037dd39afd;
+struct class_Symbol_037dd39afd;
+struct class_Symbol_037dd39afd;
+struct class_Symbol_037dd39afd;
+struct class_Symbol_037dd39afd;
+struct class_Symbol_037dd39afd;
+struct class_Symbol_037dd39afd;
+struct class_Symbol_037dd39afd;
+struct class_Symbol_037dd39afd;
+struct class_Symbol_037dd39afd;
+struct class_Symbol_037dd39afd;
+struct class_Symbol_037dd39afd;
+
+#define CONSTRUCTOR ctor_List_Symbol__9a01330177
+
+#define DESTRUCTOR dtor_List_Symbol__9a01330177
+
+#define TYPE struct class_List_Symbol__9a01330177 *
+
+#define TYPE_STRUCT class_List_Symbol__9a01330177
+
+#define METHOD(name) meth_List_Symbol__9a01330177_##name
+
+#define ITEMTYPE struct class_Symbol_037dd39afd*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Symbol_037dd39afd_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Symbol_037dd39afd)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Symbol__9a01330177___contains(struct class_List_Symbol__9a01330177*, struct class_Symbol_037dd39afd*);
+void meth_List_Symbol__9a01330177___reserve(struct class_List_Symbol__9a01330177*, int64_t);
+struct class_Symbol_037dd39afd* meth_List_Symbol__9a01330177_delete_at_index(struct class_List_Symbol__9a01330177*, int64_t);
+struct class_List_Symbol__9a01330177* meth_List_Symbol__9a01330177_delete_slice(struct class_List_Symbol__9a01330177*, int64_t, int64_t);
+bool meth_List_Symbol__9a01330177_ends_with(struct class_List_Symbol__9a01330177*, struct class_List_Symbol__9a01330177*);
+int64_t meth_List_Symbol__9a01330177_find_first(struct class_List_Symbol__9a01330177*, struct class_Symbol_037dd39afd*);
+int64_t meth_List_Symbol__9a01330177_find_last(struct class_List_Symbol__9a01330177*, struct class_Symbol_037dd39afd*);
+int64_t meth_List_Symbol__9a01330177_find_only(struct class_List_Symbol__9a01330177*, struct class_Symbol_037dd39afd*);
+struct class_Symbol_037dd39afd* meth_List_Symbol__9a01330177_first(struct class_List_Symbol__9a01330177*);
+struct class_Symbol_037dd39afd* meth_List_Symbol__9a01330177_get(struct class_List_Symbol__9a01330177*, int64_t);
+void meth_List_Symbol__9a01330177_insert(struct class_List_Symbol__9a01330177*, int64_t, struct class_Symbol_037dd39afd*);
+struct class_Symbol_037dd39afd* meth_List_Symbol__9a01330177_last(struct class_List_Symbol__9a01330177*);
+int64_t meth_List_Symbol__9a01330177_length(struct class_List_Symbol__9a01330177*);
+struct class_Symbol_037dd39afd* meth_List_Symbol__9a01330177_pop(struct class_List_Symbol__9a01330177*);
+void meth_List_Symbol__9a01330177_push(struct class_List_Symbol__9a01330177*, struct class_Symbol_037dd39afd*);
+void meth_List_Symbol__9a01330177_push_all(struct class_List_Symbol__9a01330177*, struct class_List_Symbol__9a01330177*);
+void meth_List_Symbol__9a01330177_delete_first(struct class_List_Symbol__9a01330177*, struct class_Symbol_037dd39afd*);
+void meth_List_Symbol__9a01330177_delete_last(struct class_List_Symbol__9a01330177*, struct class_Symbol_037dd39afd*);
+void meth_List_Symbol__9a01330177_delete_only(struct class_List_Symbol__9a01330177*, struct class_Symbol_037dd39afd*);
+struct class_List_Symbol__9a01330177* meth_List_Symbol__9a01330177_reversed(struct class_List_Symbol__9a01330177*);
+struct class_List_Symbol__9a01330177* meth_List_Symbol__9a01330177_slice(struct class_List_Symbol__9a01330177*, int64_t, int64_t);
+bool meth_List_Symbol__9a01330177_starts_with(struct class_List_Symbol__9a01330177*, struct class_List_Symbol__9a01330177*);
+struct class_Str meth_List_Symbol__9a01330177_to_string(struct class_List_Symbol__9a01330177*);
+struct class_Str meth_List_Symbol__9a01330177_join(struct class_List_Symbol__9a01330177*, struct class_Str);
+bool meth_List_Symbol__9a01330177_equals(struct class_List_Symbol__9a01330177*, struct class_List_Symbol__9a01330177*);
+
+#define CONSTRUCTOR ctor_List_Symbol__9a01330177
+
+#define DESTRUCTOR dtor_List_Symbol__9a01330177
+
+#define TYPE struct class_List_Symbol__9a01330177 *
+
+#define TYPE_STRUCT class_List_Symbol__9a01330177
+
+#define METHOD(name) meth_List_Symbol__9a01330177_##name
+
+#define ITEMTYPE struct class_Symbol_037dd39afd*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Symbol_037dd39afd_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Symbol_037dd39afd)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
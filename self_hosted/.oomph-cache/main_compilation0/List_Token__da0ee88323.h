@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_Token__da0ee88323
+                #define HEADER_GUARD_List_Token__da0ee88323
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Token_35f69eeb49.h"
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+
+#define CONSTRUCTOR ctor_List_Token__da0ee88323
+
+#define DESTRUCTOR dtor_List_Token__da0ee88323
+
+#define TYPE struct class_List_Token__da0ee88323 *
+
+#define TYPE_STRUCT class_List_Token__da0ee88323
+
+#define METHOD(name) meth_List_Token__da0ee88323_##name
+
+#define ITEMTYPE struct class_Token_35f69eeb49*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Token_35f69eeb49_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Token_35f69eeb49)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Token__da0ee88323___contains(struct class_List_Token__da0ee88323*, struct class_Token_35f69eeb49*);
+void meth_List_Token__da0ee88323___reserve(struct class_List_Token__da0ee88323*, int64_t);
+struct class_Token_35f69eeb49* meth_List_Token__da0ee88323_delete_at_index(struct class_List_Token__da0ee88323*, int64_t);
+struct class_List_Token__da0ee88323* meth_List_Token__da0ee88323_delete_slice(struct class_List_Token__da0ee88323*, int64_t, int64_t);
+bool meth_List_Token__da0ee88323_ends_with(struct class_List_Token__da0ee88323*, struct class_List_Token__da0ee88323*);
+int64_t meth_List_Token__da0ee88323_find_first(struct class_List_Token__da0ee88323*, struct class_Token_35f69eeb49*);
+int64_t meth_List_Token__da0ee88323_find_last(struct class_List_Token__da0ee88323*, struct class_Token_35f69eeb49*);
+int64_t meth_List_Token__da0ee88323_find_only(struct class_List_Token__da0ee88323*, struct class_Token_35f69eeb49*);
+struct class_Token_35f69eeb49* meth_List_Token__da0ee88323_first(struct class_List_Token__da0ee88323*);
+struct class_Token_35f69eeb49* meth_List_Token__da0ee88323_get(struct class_List_Token__da0ee88323*, int64_t);
+void meth_List_Token__da0ee88323_insert(struct class_List_Token__da0ee88323*, int64_t, struct class_Token_35f69eeb49*);
+struct class_Token_35f69eeb49* meth_List_Token__da0ee88323_last(struct class_List_Token__da0ee88323*);
+int64_t meth_List_Token__da0ee88323_length(struct class_List_Token__da0ee88323*);
+struct class_Token_35f69eeb49* meth_List_Token__da0ee88323_pop(struct class_List_Token__da0ee88323*);
+void meth_List_Token__da0ee88323_push(struct class_List_Token__da0ee88323*, struct class_Token_35f69eeb49*);
+void meth_List_Token__da0ee88323_push_all(struct class_List_Token__da0ee88323*, struct class_List_Token__da0ee88323*);
+void meth_List_Token__da0ee88323_delete_first(struct class_List_Token__da0ee88323*, struct class_Token_35f69eeb49*);
+void meth_List_Token__da0ee88323_delete_last(struct class_List_Token__da0ee88323*, struct class_Token_35f69eeb49*);
+void meth_List_Token__da0ee88323_delete_only(struct class_List_Token__da0ee88323*, struct class_Token_35f69eeb49*);
+struct class_List_Token__da0ee88323* meth_List_Token__da0ee88323_reversed(struct class_List_Token__da0ee88323*);
+struct class_List_Token__da0ee88323* meth_List_Token__da0ee88323_slice(struct class_List_Token__da0ee88323*, int64_t, int64_t);
+bool meth_List_Token__da0ee88323_starts_with(struct class_List_Token__da0ee88323*, struct class_List_Token__da0ee88323*);
+struct class_Str meth_List_Token__da0ee88323_to_string(struct class_List_Token__da0ee88323*);
+struct class_Str meth_List_Token__da0ee88323_join(struct class_List_Token__da0ee88323*, struct class_Str);
+bool meth_List_Token__da0ee88323_equals(struct class_List_Token__da0ee88323*, struct class_List_Token__da0ee88323*);
+
+#define CONSTRUCTOR ctor_List_Token__da0ee88323
+
+#define DESTRUCTOR dtor_List_Token__da0ee88323
+
+#define TYPE struct class_List_Token__da0ee88323 *
+
+#define TYPE_STRUCT class_List_Token__da0ee88323
+
+#define METHOD(name) meth_List_Token__da0ee88323_##name
+
+#define ITEMTYPE struct class_Token_35f69eeb49*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Token_35f69eeb49_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Token_35f69eeb49)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
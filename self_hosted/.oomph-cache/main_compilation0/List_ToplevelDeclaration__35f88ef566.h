@@ -0,0 +1,122 @@
+
+                #ifndef HEADER_GUARD_List_ToplevelDeclaration__35f88ef566
+                #define HEADER_GUARD_List_ToplevelDeclaration__35f88ef566
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "ToplevelDeclaration_5505a52ad0.h"
+
+#define CONSTRUCTOR ctor_List_ToplevelDeclaration__35f88ef566
+
+#define DESTRUCTOR dtor_List_ToplevelDeclaration__35f88ef566
+
+#define TYPE struct class_List_ToplevelDeclaration__35f88ef566 *
+
+#define TYPE_STRUCT class_List_ToplevelDeclaration__35f88ef566
+
+#define METHOD(name) meth_List_ToplevelDeclaration__35f88ef566_##name
+
+#define ITEMTYPE struct class_ToplevelDeclaration_5505a52ad0
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_ToplevelDeclaration_5505a52ad0_##name
+
+#define INCREF_ITEM(val) incref_ToplevelDeclaration_5505a52ad0((val))
+
+#define DECREF_ITEM(val) decref_ToplevelDeclaration_5505a52ad0((val))
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_ToplevelDeclaration__35f88ef566___contains(struct class_List_ToplevelDeclaration__35f88ef566*, struct class_ToplevelDeclaration_5505a52ad0);
+void meth_List_ToplevelDeclaration__35f88ef566___reserve(struct class_List_ToplevelDeclaration__35f88ef566*, int64_t);
+struct class_ToplevelDeclaration_5505a52ad0 meth_List_ToplevelDeclaration__35f88ef566_delete_at_index(struct class_List_ToplevelDeclaration__35f88ef566*, int64_t);
+struct class_List_ToplevelDeclaration__35f88ef566* meth_List_ToplevelDeclaration__35f88ef566_delete_slice(struct class_List_ToplevelDeclaration__35f88ef566*, int64_t, int64_t);
+bool meth_List_ToplevelDeclaration__35f88ef566_ends_with(struct class_List_ToplevelDeclaration__35f88ef566*, struct class_List_ToplevelDeclaration__35f88ef566*);
+int64_t meth_List_ToplevelDeclaration__35f88ef566_find_first(struct class_List_ToplevelDeclaration__35f88ef566*, struct class_ToplevelDeclaration_5505a52ad0);
+int64_t meth_List_ToplevelDeclaration__35f88ef566_find_last(struct class_List_ToplevelDeclaration__35f88ef566*, struct class_ToplevelDeclaration_5505a52ad0);
+int64_t meth_List_ToplevelDeclaration__35f88ef566_find_only(struct class_List_ToplevelDeclaration__35f88ef566*, struct class_ToplevelDeclaration_5505a52ad0);
+struct class_ToplevelDeclaration_5505a52ad0 meth_List_ToplevelDeclaration__35f88ef566_first(struct class_List_ToplevelDeclaration__35f88ef566*);
+struct class_ToplevelDeclaration_5505a52ad0 meth_List_ToplevelDeclaration__35f88ef566_get(struct class_List_ToplevelDeclaration__35f88ef566*, int64_t);
+void meth_List_ToplevelDeclaration__35f88ef566_insert(struct class_List_ToplevelDeclaration__35f88ef566*, int64_t, struct class_ToplevelDeclaration_5505a52ad0);
+struct class_ToplevelDeclaration_5505a52ad0 meth_List_ToplevelDeclaration__35f88ef566_last(struct class_List_ToplevelDeclaration__35f88ef566*);
+int64_t meth_List_ToplevelDeclaration__35f88ef566_length(struct class_List_ToplevelDeclaration__35f88ef566*);
+struct class_ToplevelDeclaration_5505a52ad0 meth_List_ToplevelDeclaration__35f88ef566_pop(struct class_List_ToplevelDeclaration__35f88ef566*);
+void meth_List_ToplevelDeclaration__35f88ef566_push(struct class_List_ToplevelDeclaration__35f88ef566*, struct class_ToplevelDeclaration_5505a52ad0);
+void meth_List_ToplevelDeclaration__35f88ef566_push_all(struct class_List_ToplevelDeclaration__35f88ef566*, struct class_List_ToplevelDeclaration__35f88ef566*);
+void meth_List_ToplevelDeclaration__35f88ef566_delete_first(struct class_List_ToplevelDeclaration__35f88ef566*, struct class_ToplevelDeclaration_5505a52ad0);
+void meth_List_ToplevelDeclaration__35f88ef566_delete_last(struct class_List_ToplevelDeclaration__35f88ef566*, struct class_ToplevelDeclaration_5505a52ad0);
+void meth_List_ToplevelDeclaration__35f88ef566_delete_only(struct class_List_ToplevelDeclaration__35f88ef566*, struct class_ToplevelDeclaration_5505a52ad0);
+struct class_List_ToplevelDeclaration__35f88ef566* meth_List_ToplevelDeclaration__35f88ef566_reversed(struct class_List_ToplevelDeclaration__35f88ef566*);
+struct class_List_ToplevelDeclaration__35f88ef566* meth_List_ToplevelDeclaration__35f88ef566_slice(struct class_List_ToplevelDeclaration__35f88ef566*, int64_t, int64_t);
+bool meth_List_ToplevelDeclaration__35f88ef566_starts_with(struct class_List_ToplevelDeclaration__35f88ef566*, struct class_List_ToplevelDeclaration__35f88ef566*);
+struct class_Str meth_List_ToplevelDeclaration__35f88ef566_to_string(struct class_List_ToplevelDeclaration__35f88ef566*);
+struct class_Str meth_List_ToplevelDeclaration__35f88ef566_join(struct class_List_ToplevelDeclaration__35f88ef566*, struct class_Str);
+bool meth_List_ToplevelDeclaration__35f88ef566_equals(struct class_List_ToplevelDeclaration__35f88ef566*, struct class_List_ToplevelDeclaration__35f88ef566*);
+
+#define CONSTRUCTOR ctor_List_ToplevelDeclaration__35f88ef566
+
+#define DESTRUCTOR dtor_List_ToplevelDeclaration__35f88ef566
+
+#define TYPE struct class_List_ToplevelDeclaration__35f88ef566 *
+
+#define TYPE_STRUCT class_List_ToplevelDeclaration__35f88ef566
+
+#define METHOD(name) meth_List_ToplevelDeclaration__35f88ef566_##name
+
+#define ITEMTYPE struct class_ToplevelDeclaration_5505a52ad0
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_ToplevelDeclaration_5505a52ad0_##name
+
+#define INCREF_ITEM(val) incref_ToplevelDeclaration_5505a52ad0((val))
+
+#define DECREF_ITEM(val) decref_ToplevelDeclaration_5505a52ad0((val))
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
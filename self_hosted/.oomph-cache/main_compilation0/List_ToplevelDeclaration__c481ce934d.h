@@ -0,0 +1,122 @@
+
+                #ifndef HEADER_GUARD_List_ToplevelDeclaration__c481ce934d
+                #define HEADER_GUARD_List_ToplevelDeclaration__c481ce934d
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+
+#define CONSTRUCTOR ctor_List_ToplevelDeclaration__c481ce934d
+
+#define DESTRUCTOR dtor_List_ToplevelDeclaration__c481ce934d
+
+#define TYPE struct class_List_ToplevelDeclaration__c481ce934d *
+
+#define TYPE_STRUCT class_List_ToplevelDeclaration__c481ce934d
+
+#define METHOD(name) meth_List_ToplevelDeclaration__c481ce934d_##name
+
+#define ITEMTYPE struct class_ToplevelDeclaration_054352d1cf
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_ToplevelDeclaration_054352d1cf_##name
+
+#define INCREF_ITEM(val) incref_ToplevelDeclaration_054352d1cf((val))
+
+#define DECREF_ITEM(val) decref_ToplevelDeclaration_054352d1cf((val))
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_ToplevelDeclaration__c481ce934d___contains(struct class_List_ToplevelDeclaration__c481ce934d*, struct class_ToplevelDeclaration_054352d1cf);
+void meth_List_ToplevelDeclaration__c481ce934d___reserve(struct class_List_ToplevelDeclaration__c481ce934d*, int64_t);
+struct class_ToplevelDeclaration_054352d1cf meth_List_ToplevelDeclaration__c481ce934d_delete_at_index(struct class_List_ToplevelDeclaration__c481ce934d*, int64_t);
+struct class_List_ToplevelDeclaration__c481ce934d* meth_List_ToplevelDeclaration__c481ce934d_delete_slice(struct class_List_ToplevelDeclaration__c481ce934d*, int64_t, int64_t);
+bool meth_List_ToplevelDeclaration__c481ce934d_ends_with(struct class_List_ToplevelDeclaration__c481ce934d*, struct class_List_ToplevelDeclaration__c481ce934d*);
+int64_t meth_List_ToplevelDeclaration__c481ce934d_find_first(struct class_List_ToplevelDeclaration__c481ce934d*, struct class_ToplevelDeclaration_054352d1cf);
+int64_t meth_List_ToplevelDeclaration__c481ce934d_find_last(struct class_List_ToplevelDeclaration__c481ce934d*, struct class_ToplevelDeclaration_054352d1cf);
+int64_t meth_List_ToplevelDeclaration__c481ce934d_find_only(struct class_List_ToplevelDeclaration__c481ce934d*, struct class_ToplevelDeclaration_054352d1cf);
+struct class_ToplevelDeclaration_054352d1cf meth_List_ToplevelDeclaration__c481ce934d_first(struct class_List_ToplevelDeclaration__c481ce934d*);
+struct class_ToplevelDeclaration_054352d1cf meth_List_ToplevelDeclaration__c481ce934d_get(struct class_List_ToplevelDeclaration__c481ce934d*, int64_t);
+void meth_List_ToplevelDeclaration__c481ce934d_insert(struct class_List_ToplevelDeclaration__c481ce934d*, int64_t, struct class_ToplevelDeclaration_054352d1cf);
+struct class_ToplevelDeclaration_054352d1cf meth_List_ToplevelDeclaration__c481ce934d_last(struct class_List_ToplevelDeclaration__c481ce934d*);
+int64_t meth_List_ToplevelDeclaration__c481ce934d_length(struct class_List_ToplevelDeclaration__c481ce934d*);
+struct class_ToplevelDeclaration_054352d1cf meth_List_ToplevelDeclaration__c481ce934d_pop(struct class_List_ToplevelDeclaration__c481ce934d*);
+void meth_List_ToplevelDeclaration__c481ce934d_push(struct class_List_ToplevelDeclaration__c481ce934d*, struct class_ToplevelDeclaration_054352d1cf);
+void meth_List_ToplevelDeclaration__c481ce934d_push_all(struct class_List_ToplevelDeclaration__c481ce934d*, struct class_List_ToplevelDeclaration__c481ce934d*);
+void meth_List_ToplevelDeclaration__c481ce934d_delete_first(struct class_List_ToplevelDeclaration__c481ce934d*, struct class_ToplevelDeclaration_054352d1cf);
+void meth_List_ToplevelDeclaration__c481ce934d_delete_last(struct class_List_ToplevelDeclaration__c481ce934d*, struct class_ToplevelDeclaration_054352d1cf);
+void meth_List_ToplevelDeclaration__c481ce934d_delete_only(struct class_List_ToplevelDeclaration__c481ce934d*, struct class_ToplevelDeclaration_054352d1cf);
+struct class_List_ToplevelDeclaration__c481ce934d* meth_List_ToplevelDeclaration__c481ce934d_reversed(struct class_List_ToplevelDeclaration__c481ce934d*);
+struct class_List_ToplevelDeclaration__c481ce934d* meth_List_ToplevelDeclaration__c481ce934d_slice(struct class_List_ToplevelDeclaration__c481ce934d*, int64_t, int64_t);
+bool meth_List_ToplevelDeclaration__c481ce934d_starts_with(struct class_List_ToplevelDeclaration__c481ce934d*, struct class_List_ToplevelDeclaration__c481ce934d*);
+struct class_Str meth_List_ToplevelDeclaration__c481ce934d_to_string(struct class_List_ToplevelDeclaration__c481ce934d*);
+struct class_Str meth_List_ToplevelDeclaration__c481ce934d_join(struct class_List_ToplevelDeclaration__c481ce934d*, struct class_Str);
+bool meth_List_ToplevelDeclaration__c481ce934d_equals(struct class_List_ToplevelDeclaration__c481ce934d*, struct class_List_ToplevelDeclaration__c481ce934d*);
+
+#define CONSTRUCTOR ctor_List_ToplevelDeclaration__c481ce934d
+
+#define DESTRUCTOR dtor_List_ToplevelDeclaration__c481ce934d
+
+#define TYPE struct class_List_ToplevelDeclaration__c481ce934d *
+
+#define TYPE_STRUCT class_List_ToplevelDeclaration__c481ce934d
+
+#define METHOD(name) meth_List_ToplevelDeclaration__c481ce934d_##name
+
+#define ITEMTYPE struct class_ToplevelDeclaration_054352d1cf
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_ToplevelDeclaration_054352d1cf_##name
+
+#define INCREF_ITEM(val) incref_ToplevelDeclaration_054352d1cf((val))
+
+#define DECREF_ITEM(val) decref_ToplevelDeclaration_054352d1cf((val))
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
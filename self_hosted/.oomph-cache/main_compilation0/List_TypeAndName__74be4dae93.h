@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_TypeAndName__74be4dae93
+                #define HEADER_GUARD_List_TypeAndName__74be4dae93
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "TypeAndName_fec99b5f94.h"
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+
+#define CONSTRUCTOR ctor_List_TypeAndName__74be4dae93
+
+#define DESTRUCTOR dtor_List_TypeAndName__74be4dae93
+
+#define TYPE struct class_List_TypeAndName__74be4dae93 *
+
+#define TYPE_STRUCT class_List_TypeAndName__74be4dae93
+
+#define METHOD(name) meth_List_TypeAndName__74be4dae93_##name
+
+#define ITEMTYPE struct class_TypeAndName_fec99b5f94*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_TypeAndName_fec99b5f94_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_TypeAndName_fec99b5f94)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_TypeAndName__74be4dae93___contains(struct class_List_TypeAndName__74be4dae93*, struct class_TypeAndName_fec99b5f94*);
+void meth_List_TypeAndName__74be4dae93___reserve(struct class_List_TypeAndName__74be4dae93*, int64_t);
+struct class_TypeAndName_fec99b5f94* meth_List_TypeAndName__74be4dae93_delete_at_index(struct class_List_TypeAndName__74be4dae93*, int64_t);
+struct class_List_TypeAndName__74be4dae93* meth_List_TypeAndName__74be4dae93_delete_slice(struct class_List_TypeAndName__74be4dae93*, int64_t, int64_t);
+bool meth_List_TypeAndName__74be4dae93_ends_with(struct class_List_TypeAndName__74be4dae93*, struct class_List_TypeAndName__74be4dae93*);
+int64_t meth_List_TypeAndName__74be4dae93_find_first(struct class_List_TypeAndName__74be4dae93*, struct class_TypeAndName_fec99b5f94*);
+int64_t meth_List_TypeAndName__74be4dae93_find_last(struct class_List_TypeAndName__74be4dae93*, struct class_TypeAndName_fec99b5f94*);
+int64_t meth_List_TypeAndName__74be4dae93_find_only(struct class_List_TypeAndName__74be4dae93*, struct class_TypeAndName_fec99b5f94*);
+struct class_TypeAndName_fec99b5f94* meth_List_TypeAndName__74be4dae93_first(struct class_List_TypeAndName__74be4dae93*);
+struct class_TypeAndName_fec99b5f94* meth_List_TypeAndName__74be4dae93_get(struct class_List_TypeAndName__74be4dae93*, int64_t);
+void meth_List_TypeAndName__74be4dae93_insert(struct class_List_TypeAndName__74be4dae93*, int64_t, struct class_TypeAndName_fec99b5f94*);
+struct class_TypeAndName_fec99b5f94* meth_List_TypeAndName__74be4dae93_last(struct class_List_TypeAndName__74be4dae93*);
+int64_t meth_List_TypeAndName__74be4dae93_length(struct class_List_TypeAndName__74be4dae93*);
+struct class_TypeAndName_fec99b5f94* meth_List_TypeAndName__74be4dae93_pop(struct class_List_TypeAndName__74be4dae93*);
+void meth_List_TypeAndName__74be4dae93_push(struct class_List_TypeAndName__74be4dae93*, struct class_TypeAndName_fec99b5f94*);
+void meth_List_TypeAndName__74be4dae93_push_all(struct class_List_TypeAndName__74be4dae93*, struct class_List_TypeAndName__74be4dae93*);
+void meth_List_TypeAndName__74be4dae93_delete_first(struct class_List_TypeAndName__74be4dae93*, struct class_TypeAndName_fec99b5f94*);
+void meth_List_TypeAndName__74be4dae93_delete_last(struct class_List_TypeAndName__74be4dae93*, struct class_TypeAndName_fec99b5f94*);
+void meth_List_TypeAndName__74be4dae93_delete_only(struct class_List_TypeAndName__74be4dae93*, struct class_TypeAndName_fec99b5f94*);
+struct class_List_TypeAndName__74be4dae93* meth_List_TypeAndName__74be4dae93_reversed(struct class_List_TypeAndName__74be4dae93*);
+struct class_List_TypeAndName__74be4dae93* meth_List_TypeAndName__74be4dae93_slice(struct class_List_TypeAndName__74be4dae93*, int64_t, int64_t);
+bool meth_List_TypeAndName__74be4dae93_starts_with(struct class_List_TypeAndName__74be4dae93*, struct class_List_TypeAndName__74be4dae93*);
+struct class_Str meth_List_TypeAndName__74be4dae93_to_string(struct class_List_TypeAndName__74be4dae93*);
+struct class_Str meth_List_TypeAndName__74be4dae93_join(struct class_List_TypeAndName__74be4dae93*, struct class_Str);
+bool meth_List_TypeAndName__74be4dae93_equals(struct class_List_TypeAndName__74be4dae93*, struct class_List_TypeAndName__74be4dae93*);
+
+#define CONSTRUCTOR ctor_List_TypeAndName__74be4dae93
+
+#define DESTRUCTOR dtor_List_TypeAndName__74be4dae93
+
+#define TYPE struct class_List_TypeAndName__74be4dae93 *
+
+#define TYPE_STRUCT class_List_TypeAndName__74be4dae93
+
+#define METHOD(name) meth_List_TypeAndName__74be4dae93_##name
+
+#define ITEMTYPE struct class_TypeAndName_fec99b5f94*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_TypeAndName_fec99b5f94_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_TypeAndName_fec99b5f94)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,122 @@
+
+                #ifndef HEADER_GUARD_List_Type__057f9c6088
+                #define HEADER_GUARD_List_Type__057f9c6088
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+
+#define CONSTRUCTOR ctor_List_Type__057f9c6088
+
+#define DESTRUCTOR dtor_List_Type__057f9c6088
+
+#define TYPE struct class_List_Type__057f9c6088 *
+
+#define TYPE_STRUCT class_List_Type__057f9c6088
+
+#define METHOD(name) meth_List_Type__057f9c6088_##name
+
+#define ITEMTYPE struct class_Type_87e1ce5c5e
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Type_87e1ce5c5e_##name
+
+#define INCREF_ITEM(val) incref_Type_87e1ce5c5e((val))
+
+#define DECREF_ITEM(val) decref_Type_87e1ce5c5e((val))
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Type__057f9c6088___contains(struct class_List_Type__057f9c6088*, struct class_Type_87e1ce5c5e);
+void meth_List_Type__057f9c6088___reserve(struct class_List_Type__057f9c6088*, int64_t);
+struct class_Type_87e1ce5c5e meth_List_Type__057f9c6088_delete_at_index(struct class_List_Type__057f9c6088*, int64_t);
+struct class_List_Type__057f9c6088* meth_List_Type__057f9c6088_delete_slice(struct class_List_Type__057f9c6088*, int64_t, int64_t);
+bool meth_List_Type__057f9c6088_ends_with(struct class_List_Type__057f9c6088*, struct class_List_Type__057f9c6088*);
+int64_t meth_List_Type__057f9c6088_find_first(struct class_List_Type__057f9c6088*, struct class_Type_87e1ce5c5e);
+int64_t meth_List_Type__057f9c6088_find_last(struct class_List_Type__057f9c6088*, struct class_Type_87e1ce5c5e);
+int64_t meth_List_Type__057f9c6088_find_only(struct class_List_Type__057f9c6088*, struct class_Type_87e1ce5c5e);
+struct class_Type_87e1ce5c5e meth_List_Type__057f9c6088_first(struct class_List_Type__057f9c6088*);
+struct class_Type_87e1ce5c5e meth_List_Type__057f9c6088_get(struct class_List_Type__057f9c6088*, int64_t);
+void meth_List_Type__057f9c6088_insert(struct class_List_Type__057f9c6088*, int64_t, struct class_Type_87e1ce5c5e);
+struct class_Type_87e1ce5c5e meth_List_Type__057f9c6088_last(struct class_List_Type__057f9c6088*);
+int64_t meth_List_Type__057f9c6088_length(struct class_List_Type__057f9c6088*);
+struct class_Type_87e1ce5c5e meth_List_Type__057f9c6088_pop(struct class_List_Type__057f9c6088*);
+void meth_List_Type__057f9c6088_push(struct class_List_Type__057f9c6088*, struct class_Type_87e1ce5c5e);
+void meth_List_Type__057f9c6088_push_all(struct class_List_Type__057f9c6088*, struct class_List_Type__057f9c6088*);
+void meth_List_Type__057f9c6088_delete_first(struct class_List_Type__057f9c6088*, struct class_Type_87e1ce5c5e);
+void meth_List_Type__057f9c6088_delete_last(struct class_List_Type__057f9c6088*, struct class_Type_87e1ce5c5e);
+void meth_List_Type__057f9c6088_delete_only(struct class_List_Type__057f9c6088*, struct class_Type_87e1ce5c5e);
+struct class_List_Type__057f9c6088* meth_List_Type__057f9c6088_reversed(struct class_List_Type__057f9c6088*);
+struct class_List_Type__057f9c6088* meth_List_Type__057f9c6088_slice(struct class_List_Type__057f9c6088*, int64_t, int64_t);
+bool meth_List_Type__057f9c6088_starts_with(struct class_List_Type__057f9c6088*, struct class_List_Type__057f9c6088*);
+struct class_Str meth_List_Type__057f9c6088_to_string(struct class_List_Type__057f9c6088*);
+struct class_Str meth_List_Type__057f9c6088_join(struct class_List_Type__057f9c6088*, struct class_Str);
+bool meth_List_Type__057f9c6088_equals(struct class_List_Type__057f9c6088*, struct class_List_Type__057f9c6088*);
+
+#define CONSTRUCTOR ctor_List_Type__057f9c6088
+
+#define DESTRUCTOR dtor_List_Type__057f9c6088
+
+#define TYPE struct class_List_Type__057f9c6088 *
+
+#define TYPE_STRUCT class_List_Type__057f9c6088
+
+#define METHOD(name) meth_List_Type__057f9c6088_##name
+
+#define ITEMTYPE struct class_Type_87e1ce5c5e
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Type_87e1ce5c5e_##name
+
+#define INCREF_ITEM(val) incref_Type_87e1ce5c5e((val))
+
+#define DECREF_ITEM(val) decref_Type_87e1ce5c5e((val))
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
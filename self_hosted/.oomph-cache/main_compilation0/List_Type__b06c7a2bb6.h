@@ -0,0 +1,122 @@
+
+                #ifndef HEADER_GUARD_List_Type__b06c7a2bb6
+                #define HEADER_GUARD_List_Type__b06c7a2bb6
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_e6cf7dd4e5.h"
+
+#define CONSTRUCTOR ctor_List_Type__b06c7a2bb6
+
+#define DESTRUCTOR dtor_List_Type__b06c7a2bb6
+
+#define TYPE struct class_List_Type__b06c7a2bb6 *
+
+#define TYPE_STRUCT class_List_Type__b06c7a2bb6
+
+#define METHOD(name) meth_List_Type__b06c7a2bb6_##name
+
+#define ITEMTYPE struct class_Type_e6cf7dd4e5
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Type_e6cf7dd4e5_##name
+
+#define INCREF_ITEM(val) incref_Type_e6cf7dd4e5((val))
+
+#define DECREF_ITEM(val) decref_Type_e6cf7dd4e5((val))
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Type__b06c7a2bb6___contains(struct class_List_Type__b06c7a2bb6*, struct class_Type_e6cf7dd4e5);
+void meth_List_Type__b06c7a2bb6___reserve(struct class_List_Type__b06c7a2bb6*, int64_t);
+struct class_Type_e6cf7dd4e5 meth_List_Type__b06c7a2bb6_delete_at_index(struct class_List_Type__b06c7a2bb6*, int64_t);
+struct class_List_Type__b06c7a2bb6* meth_List_Type__b06c7a2bb6_delete_slice(struct class_List_Type__b06c7a2bb6*, int64_t, int64_t);
+bool meth_List_Type__b06c7a2bb6_ends_with(struct class_List_Type__b06c7a2bb6*, struct class_List_Type__b06c7a2bb6*);
+int64_t meth_List_Type__b06c7a2bb6_find_first(struct class_List_Type__b06c7a2bb6*, struct class_Type_e6cf7dd4e5);
+int64_t meth_List_Type__b06c7a2bb6_find_last(struct class_List_Type__b06c7a2bb6*, struct class_Type_e6cf7dd4e5);
+int64_t meth_List_Type__b06c7a2bb6_find_only(struct class_List_Type__b06c7a2bb6*, struct class_Type_e6cf7dd4e5);
+struct class_Type_e6cf7dd4e5 meth_List_Type__b06c7a2bb6_first(struct class_List_Type__b06c7a2bb6*);
+struct class_Type_e6cf7dd4e5 meth_List_Type__b06c7a2bb6_get(struct class_List_Type__b06c7a2bb6*, int64_t);
+void meth_List_Type__b06c7a2bb6_insert(struct class_List_Type__b06c7a2bb6*, int64_t, struct class_Type_e6cf7dd4e5);
+struct class_Type_e6cf7dd4e5 meth_List_Type__b06c7a2bb6_last(struct class_List_Type__b06c7a2bb6*);
+int64_t meth_List_Type__b06c7a2bb6_length(struct class_List_Type__b06c7a2bb6*);
+struct class_Type_e6cf7dd4e5 meth_List_Type__b06c7a2bb6_pop(struct class_List_Type__b06c7a2bb6*);
+void meth_List_Type__b06c7a2bb6_push(struct class_List_Type__b06c7a2bb6*, struct class_Type_e6cf7dd4e5);
+void meth_List_Type__b06c7a2bb6_push_all(struct class_List_Type__b06c7a2bb6*, struct class_List_Type__b06c7a2bb6*);
+void meth_List_Type__b06c7a2bb6_delete_first(struct class_List_Type__b06c7a2bb6*, struct class_Type_e6cf7dd4e5);
+void meth_List_Type__b06c7a2bb6_delete_last(struct class_List_Type__b06c7a2bb6*, struct class_Type_e6cf7dd4e5);
+void meth_List_Type__b06c7a2bb6_delete_only(struct class_List_Type__b06c7a2bb6*, struct class_Type_e6cf7dd4e5);
+struct class_List_Type__b06c7a2bb6* meth_List_Type__b06c7a2bb6_reversed(struct class_List_Type__b06c7a2bb6*);
+struct class_List_Type__b06c7a2bb6* meth_List_Type__b06c7a2bb6_slice(struct class_List_Type__b06c7a2bb6*, int64_t, int64_t);
+bool meth_List_Type__b06c7a2bb6_starts_with(struct class_List_Type__b06c7a2bb6*, struct class_List_Type__b06c7a2bb6*);
+struct class_Str meth_List_Type__b06c7a2bb6_to_string(struct class_List_Type__b06c7a2bb6*);
+struct class_Str meth_List_Type__b06c7a2bb6_join(struct class_List_Type__b06c7a2bb6*, struct class_Str);
+bool meth_List_Type__b06c7a2bb6_equals(struct class_List_Type__b06c7a2bb6*, struct class_List_Type__b06c7a2bb6*);
+
+#define CONSTRUCTOR ctor_List_Type__b06c7a2bb6
+
+#define DESTRUCTOR dtor_List_Type__b06c7a2bb6
+
+#define TYPE struct class_List_Type__b06c7a2bb6 *
+
+#define TYPE_STRUCT class_List_Type__b06c7a2bb6
+
+#define METHOD(name) meth_List_Type__b06c7a2bb6_##name
+
+#define ITEMTYPE struct class_Type_e6cf7dd4e5
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Type_e6cf7dd4e5_##name
+
+#define INCREF_ITEM(val) incref_Type_e6cf7dd4e5((val))
+
+#define DECREF_ITEM(val) decref_Type_e6cf7dd4e5((val))
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
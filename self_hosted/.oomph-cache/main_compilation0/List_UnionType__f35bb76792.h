@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_UnionType__f35bb76792
+                #define HEADER_GUARD_List_UnionType__f35bb76792
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "UnionType_7f899bced1.h"
+struct class_UnionType_7f899bced1;
+struct class_UnionType_7f899bced1;
+struct class_UnionType_7f899bced1;
+struct class_UnionType_7f899bced1;
+struct class_UnionType_7f899bced1;
+struct class_UnionType_7f899bced1;
+struct class_UnionType_7f899bced1;
+struct class_UnionType_7f899bced1;
+struct class_UnionType_7f899bced1;
+struct class_UnionType_7f899bced1;
+struct class_UnionType_7f899bced1;
+struct class_UnionType_7f899bced1;
+struct class_UnionType_7f899bced1;
+struct class_UnionType_7f899bced1;
+
+#define CONSTRUCTOR ctor_List_UnionType__f35bb76792
+
+#define DESTRUCTOR dtor_List_UnionType__f35bb76792
+
+#define TYPE struct class_List_UnionType__f35bb76792 *
+
+#define TYPE_STRUCT class_List_UnionType__f35bb76792
+
+#define METHOD(name) meth_List_UnionType__f35bb76792_##name
+
+#define ITEMTYPE struct class_UnionType_7f899bced1*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_UnionType_7f899bced1_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_UnionType_7f899bced1)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_UnionType__f35bb76792___contains(struct class_List_UnionType__f35bb76792*, struct class_UnionType_7f899bced1*);
+void meth_List_UnionType__f35bb76792___reserve(struct class_List_UnionType__f35bb76792*, int64_t);
+struct class_UnionType_7f899bced1* meth_List_UnionType__f35bb76792_delete_at_index(struct class_List_UnionType__f35bb76792*, int64_t);
+struct class_List_UnionType__f35bb76792* meth_List_UnionType__f35bb76792_delete_slice(struct class_List_UnionType__f35bb76792*, int64_t, int64_t);
+bool meth_List_UnionType__f35bb76792_ends_with(struct class_List_UnionType__f35bb76792*, struct class_List_UnionType__f35bb76792*);
+int64_t meth_List_UnionType__f35bb76792_find_first(struct class_List_UnionType__f35bb76792*, struct class_UnionType_7f899bced1*);
+int64_t meth_List_UnionType__f35bb76792_find_last(struct class_List_UnionType__f35bb76792*, struct class_UnionType_7f899bced1*);
+int64_t meth_List_UnionType__f35bb76792_find_only(struct class_List_UnionType__f35bb76792*, struct class_UnionType_7f899bced1*);
+struct class_UnionType_7f899bced1* meth_List_UnionType__f35bb76792_first(struct class_List_UnionType__f35bb76792*);
+struct class_UnionType_7f899bced1* meth_List_UnionType__f35bb76792_get(struct class_List_UnionType__f35bb76792*, int64_t);
+void meth_List_UnionType__f35bb76792_insert(struct class_List_UnionType__f35bb76792*, int64_t, struct class_UnionType_7f899bced1*);
+struct class_UnionType_7f899bced1* meth_List_UnionType__f35bb76792_last(struct class_List_UnionType__f35bb76792*);
+int64_t meth_List_UnionType__f35bb76792_length(struct class_List_UnionType__f35bb76792*);
+struct class_UnionType_7f899bced1* meth_List_UnionType__f35bb76792_pop(struct class_List_UnionType__f35bb76792*);
+void meth_List_UnionType__f35bb76792_push(struct class_List_UnionType__f35bb76792*, struct class_UnionType_7f899bced1*);
+void meth_List_UnionType__f35bb76792_push_all(struct class_List_UnionType__f35bb76792*, struct class_List_UnionType__f35bb76792*);
+void meth_List_UnionType__f35bb76792_delete_first(struct class_List_UnionType__f35bb76792*, struct class_UnionType_7f899bced1*);
+void meth_List_UnionType__f35bb76792_delete_last(struct class_List_UnionType__f35bb76792*, struct class_UnionType_7f899bced1*);
+void meth_List_UnionType__f35bb76792_delete_only(struct class_List_UnionType__f35bb76792*, struct class_UnionType_7f899bced1*);
+struct class_List_UnionType__f35bb76792* meth_List_UnionType__f35bb76792_reversed(struct class_List_UnionType__f35bb76792*);
+struct class_List_UnionType__f35bb76792* meth_List_UnionType__f35bb76792_slice(struct class_List_UnionType__f35bb76792*, int64_t, int64_t);
+bool meth_List_UnionType__f35bb76792_starts_with(struct class_List_UnionType__f35bb76792*, struct class_List_UnionType__f35bb76792*);
+struct class_Str meth_List_UnionType__f35bb76792_to_string(struct class_List_UnionType__f35bb76792*);
+struct class_Str meth_List_UnionType__f35bb76792_join(struct class_List_UnionType__f35bb76792*, struct class_Str);
+bool meth_List_UnionType__f35bb76792_equals(struct class_List_UnionType__f35bb76792*, struct class_List_UnionType__f35bb76792*);
+
+#define CONSTRUCTOR ctor_List_UnionType__f35bb76792
+
+#define DESTRUCTOR dtor_List_UnionType__f35bb76792
+
+#define TYPE struct class_List_UnionType__f35bb76792 *
+
+#define TYPE_STRUCT class_List_UnionType__f35bb76792
+
+#define METHOD(name) meth_List_UnionType__f35bb76792_##name
+
+#define ITEMTYPE struct class_UnionType_7f899bced1*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_UnionType_7f899bced1_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_UnionType_7f899bced1)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,72 @@
+#include <lib/oomph.h>
+#include "LocalVariable_846080e5ae.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_500c4434c9.h"
+#include "Type_87e1ce5c5e.h"
+
+            static struct StringBuf string0_LocalVariable_309cb777a9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x63', '\x61', '\x6c', '\x56', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_LocalVariable_309cb777a9 = {
+                .buf = &string0_LocalVariable_309cb777a9_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            struct class_LocalVariable_846080e5ae* ctor_LocalVariable_846080e5ae(struct class_Type_87e1ce5c5e arg_type,int64_t arg_id,struct class_Location_500c4434c9* arg_location)
+            {
+                struct class_LocalVariable_846080e5ae* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_type = arg_type;
+obj->memb_id = arg_id;
+obj->memb_location = arg_location;
+
+                incref_Type_87e1ce5c5e(arg_type);
+(void)0;
+incref(arg_location);
+
+                return obj;
+            }
+
+            void dtor_LocalVariable_846080e5ae(void *ptr)
+            {
+                struct class_LocalVariable_846080e5ae *obj = ptr;
+                decref_Type_87e1ce5c5e(obj->memb_type);
+(void)0;
+decref((obj->memb_location), dtor_Location_500c4434c9);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_LocalVariable_846080e5ae_to_string(struct class_LocalVariable_846080e5ae* self)
+                {
+                    struct class_Str res = string0_LocalVariable_309cb777a9;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Int_to_string(self->memb_id);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_LocalVariable_846080e5ae_equals(struct class_LocalVariable_846080e5ae* var1, struct class_LocalVariable_846080e5ae* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_LocalVariable_846080e5ae
+                #define HEADER_GUARD_LocalVariable_846080e5ae
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_LocalVariable_846080e5ae {
+                REFCOUNT_HEADER
+                struct class_Type_87e1ce5c5e memb_type;
+int64_t memb_id;
+struct class_Location_500c4434c9* memb_location;
+
+            };
+            
+            struct class_LocalVariable_846080e5ae* ctor_LocalVariable_846080e5ae(struct class_Type_87e1ce5c5e arg_type,int64_t arg_id,struct class_Location_500c4434c9* arg_location);
+            void dtor_LocalVariable_846080e5ae(void *ptr);
+            
+                struct class_Str meth_LocalVariable_846080e5ae_to_string(struct class_LocalVariable_846080e5ae* obj);
+                bool meth_LocalVariable_846080e5ae_equals(struct class_LocalVariable_846080e5ae* var1, struct class_LocalVariable_846080e5ae* var2);
+
+                #endif
+                
@@ -0,0 +1,899 @@
+#include <lib/oomph.h>
+#include "Location_500c4434c9.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+#include "bundle_io_45f5b8a585.h"
+
+            static struct StringBuf string0_Location_6a0169fb2c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x63', '\x61', '\x74', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Location_6a0169fb2c = {
+                .buf = &string0_Location_6a0169fb2c_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1___b9b9aa2516_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string1___b9b9aa2516 = {
+                .buf = &string1___b9b9aa2516_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2___error___fd5bc5548e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x20', '\x65', '\x72', '\x72', '\x6f', '\x72', '\x3a', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string2___error___fd5bc5548e = {
+                .buf = &string2___error___fd5bc5548e_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3___293b6524b6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string3___293b6524b6 = {
+                .buf = &string3___293b6524b6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4___14689c791c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string4___14689c791c = {
+                .buf = &string4___14689c791c_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5__0c7d6f25df_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string5__0c7d6f25df = {
+                .buf = &string5__0c7d6f25df_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6______a4d1a6e6d2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string6______a4d1a6e6d2 = {
+                .buf = &string6______a4d1a6e6d2_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7___50aea4119d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5e' },
+                .malloced = false,
+            };
+            static struct class_Str string7___50aea4119d = {
+                .buf = &string7___50aea4119d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string8_self_hosted_error_oomph_5d9a61e9d1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x65', '\x72', '\x72', '\x6f', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string8_self_hosted_error_oomph_5d9a61e9d1 = {
+                .buf = &string8_self_hosted_error_oomph_5d9a61e9d1_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string9_Combine_error__6b4a69b74a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6f', '\x6d', '\x62', '\x69', '\x6e', '\x65', '\x20', '\x65', '\x72', '\x72', '\x6f', '\x72', '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string9_Combine_error__6b4a69b74a = {
+                .buf = &string9_Combine_error__6b4a69b74a_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string10___self____23709fd9a2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x20', '\x73', '\x65', '\x6c', '\x66', '\x3a', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string10___self____23709fd9a2 = {
+                .buf = &string10___self____23709fd9a2_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string11___2ff64e4fe6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7c' },
+                .malloced = false,
+            };
+            static struct class_Str string11___2ff64e4fe6 = {
+                .buf = &string11___2ff64e4fe6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string12___other___385b93f18b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x20', '\x6f', '\x74', '\x68', '\x65', '\x72', '\x3a', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string12___other___385b93f18b = {
+                .buf = &string12___other___385b93f18b_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            struct class_Location_500c4434c9* ctor_Location_500c4434c9(struct class_Str arg_path,int64_t arg_lineno,struct class_Str arg_line_prefix,struct class_Str arg_code)
+            {
+                struct class_Location_500c4434c9* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_path = arg_path;
+obj->memb_lineno = arg_lineno;
+obj->memb_line_prefix = arg_line_prefix;
+obj->memb_code = arg_code;
+
+                string_incref(arg_path);
+(void)0;
+string_incref(arg_line_prefix);
+string_incref(arg_code);
+
+                return obj;
+            }
+
+            void dtor_Location_500c4434c9(void *ptr)
+            {
+                struct class_Location_500c4434c9 *obj = ptr;
+                string_decref(obj->memb_path);
+(void)0;
+string_decref(obj->memb_line_prefix);
+string_decref(obj->memb_code);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Location_500c4434c9_to_string(struct class_Location_500c4434c9* self)
+                {
+                    struct class_Str res = string0_Location_6a0169fb2c;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_path);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Int_to_string(self->memb_lineno);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_line_prefix);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_code);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Location_500c4434c9_equals(struct class_Location_500c4434c9* var1, struct class_Location_500c4434c9* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}void meth_Location_500c4434c9_print_error(struct class_Location_500c4434c9* var1, struct class_Str var2){struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+int64_t var6;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_List_Str__43b70c06cb* var15;
+var15 = NULL;
+int64_t var16;
+int64_t var17;
+int64_t var18;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+bool var23;
+bool var25;
+struct class_Str var27;
+var27.buf = NULL;
+bool var28;
+bool var29;
+struct class_Str var31;
+var31.buf = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+bool var37;
+struct class_Str var39;
+var39.buf = NULL;
+int64_t var40;
+int64_t var41;
+struct class_Str var43;
+var43.buf = NULL;
+struct class_Str var44;
+var44.buf = NULL;
+struct class_List_Str__43b70c06cb* var45;
+var45 = NULL;
+struct class_Str var46;
+var46.buf = NULL;
+int64_t var47;
+int64_t var48;
+struct class_Str var49;
+var49.buf = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+struct class_Str var52;
+var52.buf = NULL;
+struct class_Str var53;
+var53.buf = NULL;
+int64_t var54;
+struct class_Str var55;
+var55.buf = NULL;
+struct class_Str var56;
+var56.buf = NULL;
+struct class_Str var57;
+var57.buf = NULL;
+struct class_Str var58;
+var58.buf = NULL;
+struct class_Str var59;
+var59.buf = NULL;
+struct class_Str var60;
+var60.buf = NULL;
+var3 = var1->memb_path;
+string_incref(var3);
+var4 = string1___b9b9aa2516; string_incref(var4);
+var5 = oomph_string_concat(var3,var4);
+var6 = var1->memb_lineno;
+var7 = meth_Int_to_string(var6);
+var8 = oomph_string_concat(var5,var7);
+var9 = string2___error___fd5bc5548e; string_incref(var9);
+var10 = oomph_string_concat(var8,var9);
+var11 = oomph_string_concat(var10,var2);
+oomph_print(var11);
+var12 = var1->memb_path;
+string_incref(var12);
+var13 = bundle_io_45f5b8a585_read_file(var12);
+var14 = string3___293b6524b6; string_incref(var14);
+var15 = meth_Str_split(var13,var14);
+var16 = var1->memb_lineno;
+var17 = 1LL;
+var18 = oomph_int_sub(var16,var17);
+var19 = meth_List_Str__43b70c06cb_get(var15,var18);
+var20 = var1->memb_line_prefix;
+string_incref(var20);
+label21: (void)0;
+string_decref(var22);
+var22.buf = NULL;
+var22 = string4___14689c791c; string_incref(var22);
+var23 = meth_Str_starts_with(var19,var22);
+if (var23) goto label24;
+var25 = oomph_false;
+if (oomph_true) goto label26;
+label24: (void)0;
+string_decref(var27);
+var27.buf = NULL;
+var27 = string4___14689c791c; string_incref(var27);
+var28 = meth_Str_starts_with(var20,var27);
+var25 = var28;
+label26: (void)0;
+var29 = oomph_bool_not(var25);
+if (var29) goto label30;
+string_decref(var31);
+var31.buf = NULL;
+var31 = string4___14689c791c; string_incref(var31);
+var32 = meth_Str_remove_prefix(var19,var31);
+string_decref(var19);
+var19 = var32;
+var32.buf = NULL;
+string_decref(var33);
+var33.buf = NULL;
+var33 = string4___14689c791c; string_incref(var33);
+var34 = meth_Str_remove_prefix(var20,var33);
+string_decref(var20);
+var20 = var34;
+var34.buf = NULL;
+if (oomph_true) goto label21;
+label30: (void)0;
+var35 = string3___293b6524b6; string_incref(var35);
+var36 = var1->memb_code;
+string_incref(var36);
+var37 = meth_Str___contains(var36,var35);
+if (var37) goto label38;
+var39 = var1->memb_code;
+string_incref(var39);
+var40 = meth_Str_length(var39);
+var41 = var40;
+if (oomph_true) goto label42;
+label38: (void)0;
+var43 = var1->memb_code;
+string_incref(var43);
+var44 = string3___293b6524b6; string_incref(var44);
+var45 = meth_Str_split(var43,var44);
+var46 = meth_List_Str__43b70c06cb_first(var45);
+var47 = meth_Str_length(var46);
+var48 = 4LL;
+var41 = oomph_int_add(var47,var48);
+label42: (void)0;
+var49 = string5__0c7d6f25df; string_incref(var49);
+oomph_print(var49);
+var50 = string6______a4d1a6e6d2; string_incref(var50);
+var51 = oomph_string_concat(var50,var19);
+oomph_print(var51);
+var52 = string6______a4d1a6e6d2; string_incref(var52);
+var53 = string4___14689c791c; string_incref(var53);
+var54 = meth_Str_length(var20);
+var55 = meth_Str_repeat(var53,var54);
+var56 = oomph_string_concat(var52,var55);
+var57 = string7___50aea4119d; string_incref(var57);
+var58 = meth_Str_repeat(var57,var41);
+var59 = oomph_string_concat(var56,var58);
+oomph_print(var59);
+var60 = string5__0c7d6f25df; string_incref(var60);
+oomph_print(var60);
+out: (void)0;
+string_decref(var60);
+string_decref(var59);
+string_decref(var58);
+string_decref(var57);
+string_decref(var56);
+string_decref(var55);
+(void)0;
+string_decref(var53);
+string_decref(var52);
+string_decref(var51);
+string_decref(var50);
+string_decref(var49);
+(void)0;
+(void)0;
+string_decref(var46);
+decref((var45), dtor_List_Str__43b70c06cb);
+string_decref(var44);
+string_decref(var43);
+(void)0;
+(void)0;
+string_decref(var39);
+(void)0;
+string_decref(var36);
+string_decref(var35);
+string_decref(var34);
+string_decref(var33);
+string_decref(var32);
+string_decref(var31);
+(void)0;
+(void)0;
+string_decref(var27);
+(void)0;
+(void)0;
+string_decref(var22);
+string_decref(var20);
+string_decref(var19);
+(void)0;
+(void)0;
+(void)0;
+decref((var15), dtor_List_Str__43b70c06cb);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+string_decref(var10);
+string_decref(var9);
+string_decref(var8);
+string_decref(var7);
+(void)0;
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+}void meth_Location_500c4434c9_error(struct class_Location_500c4434c9* var1, struct class_Str var2){bool var3;
+struct class_Str var4;
+var4.buf = NULL;
+int64_t var5;
+meth_Location_500c4434c9_print_error(var1,var2);
+var3 = oomph_false;
+var4 = string8_self_hosted_error_oomph_5d9a61e9d1; string_incref(var4);
+var5 = 40LL;
+oomph_assert(var3,var4,var5);
+out: (void)0;
+(void)0;
+string_decref(var4);
+(void)0;
+}struct class_Location_500c4434c9* meth_Location_500c4434c9_remove_prefix(struct class_Location_500c4434c9* var1, struct class_Str var2){struct class_Str var3;
+var3.buf = NULL;
+bool var4;
+struct class_Str var5;
+var5.buf = NULL;
+int64_t var6;
+struct class_Str var7;
+var7.buf = NULL;
+int64_t var8;
+struct class_Str var9;
+var9.buf = NULL;
+int64_t var10;
+int64_t var11;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_List_Str__43b70c06cb* var15;
+var15 = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Location_500c4434c9* var19;
+var19 = NULL;
+struct class_Location_500c4434c9* retval;
+var3 = var1->memb_code;
+string_incref(var3);
+var4 = meth_Str_starts_with(var3,var2);
+var5 = string8_self_hosted_error_oomph_5d9a61e9d1; string_incref(var5);
+var6 = 43LL;
+oomph_assert(var4,var5,var6);
+var7 = var1->memb_path;
+string_incref(var7);
+var8 = var1->memb_lineno;
+var9 = string3___293b6524b6; string_incref(var9);
+var10 = meth_Str_count(var2,var9);
+var11 = oomph_int_add(var8,var10);
+var12 = var1->memb_line_prefix;
+string_incref(var12);
+var13 = oomph_string_concat(var12,var2);
+var14 = string3___293b6524b6; string_incref(var14);
+var15 = meth_Str_split(var13,var14);
+var16 = meth_List_Str__43b70c06cb_last(var15);
+var17 = var1->memb_code;
+string_incref(var17);
+var18 = meth_Str_remove_prefix(var17,var2);
+var19 = ctor_Location_500c4434c9(var7,var11,var16,var18);
+retval = var19; var19 = NULL;
+goto out;
+out: (void)0;
+decref((var19), dtor_Location_500c4434c9);
+string_decref(var18);
+string_decref(var17);
+string_decref(var16);
+decref((var15), dtor_List_Str__43b70c06cb);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+(void)0;
+(void)0;
+string_decref(var9);
+(void)0;
+string_decref(var7);
+(void)0;
+string_decref(var5);
+(void)0;
+string_decref(var3);
+return retval;
+}struct class_Location_500c4434c9* meth_Location_500c4434c9_remove_suffix(struct class_Location_500c4434c9* var1, struct class_Str var2){struct class_Str var3;
+var3.buf = NULL;
+bool var4;
+struct class_Str var5;
+var5.buf = NULL;
+int64_t var6;
+struct class_Str var7;
+var7.buf = NULL;
+int64_t var8;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Location_500c4434c9* var12;
+var12 = NULL;
+struct class_Location_500c4434c9* retval;
+var3 = var1->memb_code;
+string_incref(var3);
+var4 = meth_Str_ends_with(var3,var2);
+var5 = string8_self_hosted_error_oomph_5d9a61e9d1; string_incref(var5);
+var6 = 52LL;
+oomph_assert(var4,var5,var6);
+var7 = var1->memb_path;
+string_incref(var7);
+var8 = var1->memb_lineno;
+var9 = var1->memb_line_prefix;
+string_incref(var9);
+var10 = var1->memb_code;
+string_incref(var10);
+var11 = meth_Str_remove_suffix(var10,var2);
+var12 = ctor_Location_500c4434c9(var7,var8,var9,var11);
+retval = var12; var12 = NULL;
+goto out;
+out: (void)0;
+decref((var12), dtor_Location_500c4434c9);
+string_decref(var11);
+string_decref(var10);
+string_decref(var9);
+(void)0;
+string_decref(var7);
+(void)0;
+string_decref(var5);
+(void)0;
+string_decref(var3);
+return retval;
+}struct class_Location_500c4434c9* meth_Location_500c4434c9_combine(struct class_Location_500c4434c9* var1, struct class_Location_500c4434c9* var2){struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+bool var5;
+struct class_Str var6;
+var6.buf = NULL;
+int64_t var7;
+int64_t var8;
+int64_t var9;
+bool var10;
+int64_t var13;
+int64_t var14;
+bool var15;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+bool var20;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+bool var24;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+bool var28;
+struct class_Str var30;
+var30.buf = NULL;
+struct class_Str var31;
+var31.buf = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+struct class_Str var37;
+var37.buf = NULL;
+struct class_Str var38;
+var38.buf = NULL;
+struct class_Str var39;
+var39.buf = NULL;
+struct class_Str var40;
+var40.buf = NULL;
+struct class_Str var41;
+var41.buf = NULL;
+struct class_Str var42;
+var42.buf = NULL;
+struct class_Str var43;
+var43.buf = NULL;
+struct class_Str var44;
+var44.buf = NULL;
+bool var45;
+struct class_Str var46;
+var46.buf = NULL;
+int64_t var47;
+struct class_Str var49;
+var49.buf = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+struct class_Str var52;
+var52.buf = NULL;
+struct class_Str var53;
+var53.buf = NULL;
+struct class_Str var54;
+var54.buf = NULL;
+struct class_Str var55;
+var55.buf = NULL;
+struct class_Str var56;
+var56.buf = NULL;
+struct class_Str var58;
+var58.buf = NULL;
+struct class_Str var59;
+var59.buf = NULL;
+struct class_Str var60;
+var60.buf = NULL;
+struct class_Str var61;
+var61.buf = NULL;
+struct class_Str var62;
+var62.buf = NULL;
+struct class_Str var63;
+var63.buf = NULL;
+struct class_Str var65;
+var65.buf = NULL;
+struct class_Str var66;
+var66.buf = NULL;
+bool var67;
+struct class_Str var69;
+var69.buf = NULL;
+struct class_Str var70;
+var70.buf = NULL;
+bool var71;
+bool var73;
+struct class_Str var74;
+var74.buf = NULL;
+int64_t var75;
+struct class_Str var77;
+var77.buf = NULL;
+struct class_Str var79;
+var79.buf = NULL;
+int64_t var80;
+struct class_Location_500c4434c9* var81;
+var81 = NULL;
+struct class_Location_500c4434c9* retval;
+var3 = var1->memb_path;
+string_incref(var3);
+var4 = var2->memb_path;
+string_incref(var4);
+var5 = meth_Str_equals(var3,var4);
+var6 = string8_self_hosted_error_oomph_5d9a61e9d1; string_incref(var6);
+var7 = 58LL;
+oomph_assert(var5,var6,var7);
+var8 = var1->memb_lineno;
+var9 = var2->memb_lineno;
+var10 = oomph_int_gt(var9,var8);
+if (var10) goto label11;
+if (oomph_true) goto label12;
+label11: (void)0;
+incref(var1); retval = var1; goto out;
+label12: (void)0;
+var13 = var1->memb_lineno;
+var14 = var2->memb_lineno;
+var15 = oomph_int_gt(var13,var14);
+if (var15) goto label16;
+if (oomph_true) goto label17;
+label16: (void)0;
+incref(var2); retval = var2; goto out;
+label17: (void)0;
+var18 = var1->memb_line_prefix;
+string_incref(var18);
+var19 = var2->memb_line_prefix;
+string_incref(var19);
+var20 = meth_Str_equals(var18,var19);
+if (var20) goto label21;
+var22 = var1->memb_line_prefix;
+string_incref(var22);
+var23 = var2->memb_line_prefix;
+string_incref(var23);
+var24 = meth_Str_starts_with(var22,var23);
+if (var24) goto label25;
+var26 = var2->memb_line_prefix;
+string_incref(var26);
+var27 = var1->memb_line_prefix;
+string_incref(var27);
+var28 = meth_Str_starts_with(var26,var27);
+if (var28) goto label29;
+var30 = string9_Combine_error__6b4a69b74a; string_incref(var30);
+oomph_print(var30);
+var31 = string10___self____23709fd9a2; string_incref(var31);
+var32 = var1->memb_line_prefix;
+string_incref(var32);
+var33 = oomph_string_concat(var31,var32);
+var34 = string11___2ff64e4fe6; string_incref(var34);
+var35 = oomph_string_concat(var33,var34);
+var36 = var1->memb_code;
+string_incref(var36);
+var37 = oomph_string_concat(var35,var36);
+oomph_print(var37);
+var38 = string12___other___385b93f18b; string_incref(var38);
+var39 = var2->memb_line_prefix;
+string_incref(var39);
+var40 = oomph_string_concat(var38,var39);
+var41 = string11___2ff64e4fe6; string_incref(var41);
+var42 = oomph_string_concat(var40,var41);
+var43 = var2->memb_code;
+string_incref(var43);
+var44 = oomph_string_concat(var42,var43);
+oomph_print(var44);
+var45 = oomph_false;
+var46 = string8_self_hosted_error_oomph_5d9a61e9d1; string_incref(var46);
+var47 = 85LL;
+oomph_assert(var45,var46,var47);
+if (oomph_true) goto label48;
+label29: (void)0;
+var49 = var1->memb_line_prefix;
+string_incref(var49);
+var50 = var49;
+var49.buf = NULL;
+var51 = var2->memb_line_prefix;
+string_incref(var51);
+var52 = var1->memb_line_prefix;
+string_incref(var52);
+var53 = meth_Str_remove_prefix(var51,var52);
+var54 = var2->memb_code;
+string_incref(var54);
+var55 = oomph_string_concat(var53,var54);
+var56 = var55;
+var55.buf = NULL;
+label48: (void)0;
+if (oomph_true) goto label57;
+label25: (void)0;
+var58 = var2->memb_line_prefix;
+string_incref(var58);
+var50 = var58;
+var58.buf = NULL;
+var59 = var1->memb_line_prefix;
+string_incref(var59);
+var60 = var2->memb_line_prefix;
+string_incref(var60);
+var61 = meth_Str_remove_prefix(var59,var60);
+var62 = var1->memb_code;
+string_incref(var62);
+var63 = oomph_string_concat(var61,var62);
+var56 = var63;
+var63.buf = NULL;
+label57: (void)0;
+if (oomph_true) goto label64;
+label21: (void)0;
+var50 = var1->memb_line_prefix;
+string_incref(var50);
+var65 = var1->memb_code;
+string_incref(var65);
+var66 = var2->memb_code;
+string_incref(var66);
+var67 = meth_Str_starts_with(var65,var66);
+if (var67) goto label68;
+var69 = var2->memb_code;
+string_incref(var69);
+var70 = var1->memb_code;
+string_incref(var70);
+var71 = meth_Str_starts_with(var69,var70);
+if (var71) goto label72;
+var73 = oomph_false;
+var74 = string8_self_hosted_error_oomph_5d9a61e9d1; string_incref(var74);
+var75 = 74LL;
+oomph_assert(var73,var74,var75);
+if (oomph_true) goto label76;
+label72: (void)0;
+var77 = var2->memb_code;
+string_incref(var77);
+var56 = var77;
+var77.buf = NULL;
+label76: (void)0;
+if (oomph_true) goto label78;
+label68: (void)0;
+var56 = var1->memb_code;
+string_incref(var56);
+label78: (void)0;
+label64: (void)0;
+var79 = var1->memb_path;
+string_incref(var79);
+var80 = var1->memb_lineno;
+var81 = ctor_Location_500c4434c9(var79,var80,var50,var56);
+retval = var81; var81 = NULL;
+goto out;
+out: (void)0;
+decref((var81), dtor_Location_500c4434c9);
+(void)0;
+string_decref(var79);
+string_decref(var77);
+(void)0;
+string_decref(var74);
+(void)0;
+(void)0;
+string_decref(var70);
+string_decref(var69);
+(void)0;
+string_decref(var66);
+string_decref(var65);
+string_decref(var63);
+string_decref(var62);
+string_decref(var61);
+string_decref(var60);
+string_decref(var59);
+string_decref(var58);
+string_decref(var56);
+string_decref(var55);
+string_decref(var54);
+string_decref(var53);
+string_decref(var52);
+string_decref(var51);
+string_decref(var50);
+string_decref(var49);
+(void)0;
+string_decref(var46);
+(void)0;
+string_decref(var44);
+string_decref(var43);
+string_decref(var42);
+string_decref(var41);
+string_decref(var40);
+string_decref(var39);
+string_decref(var38);
+string_decref(var37);
+string_decref(var36);
+string_decref(var35);
+string_decref(var34);
+string_decref(var33);
+string_decref(var32);
+string_decref(var31);
+string_decref(var30);
+(void)0;
+string_decref(var27);
+string_decref(var26);
+(void)0;
+string_decref(var23);
+string_decref(var22);
+(void)0;
+string_decref(var19);
+string_decref(var18);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var6);
+(void)0;
+string_decref(var4);
+string_decref(var3);
+return retval;
+}
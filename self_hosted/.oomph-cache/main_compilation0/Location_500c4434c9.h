@@ -0,0 +1,32 @@
+
+                #ifndef HEADER_GUARD_Location_500c4434c9
+                #define HEADER_GUARD_Location_500c4434c9
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_io_45f5b8a585.h"
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+
+            struct class_Location_500c4434c9 {
+                REFCOUNT_HEADER
+                struct class_Str memb_path;
+int64_t memb_lineno;
+struct class_Str memb_line_prefix;
+struct class_Str memb_code;
+
+            };
+            
+            struct class_Location_500c4434c9* ctor_Location_500c4434c9(struct class_Str arg_path,int64_t arg_lineno,struct class_Str arg_line_prefix,struct class_Str arg_code);
+            void dtor_Location_500c4434c9(void *ptr);
+            
+                struct class_Str meth_Location_500c4434c9_to_string(struct class_Location_500c4434c9* obj);
+                bool meth_Location_500c4434c9_equals(struct class_Location_500c4434c9* var1, struct class_Location_500c4434c9* var2);
+void meth_Location_500c4434c9_print_error(struct class_Location_500c4434c9* var1, struct class_Str var2);
+void meth_Location_500c4434c9_error(struct class_Location_500c4434c9* var1, struct class_Str var2);
+struct class_Location_500c4434c9* meth_Location_500c4434c9_remove_prefix(struct class_Location_500c4434c9* var1, struct class_Str var2);
+struct class_Location_500c4434c9* meth_Location_500c4434c9_remove_suffix(struct class_Location_500c4434c9* var1, struct class_Str var2);
+struct class_Location_500c4434c9* meth_Location_500c4434c9_combine(struct class_Location_500c4434c9* var1, struct class_Location_500c4434c9* var2);
+
+                #endif
+                
@@ -0,0 +1,100 @@
+#include <lib/oomph.h>
+#include "LoopHeader_23fd592271.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "ForLoopHeader_79606b2adb.h"
+#include "ForeachLoopHeader_ebcb7f3325.h"
+
+            static struct StringBuf string0_LoopHeader_66ca126f9f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x6f', '\x70', '\x48', '\x65', '\x61', '\x64', '\x65', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_LoopHeader_66ca126f9f = {
+                .buf = &string0_LoopHeader_66ca126f9f_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_LoopHeader_23fd592271_to_string(struct class_LoopHeader_23fd592271 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_ForLoopHeader_79606b2adb_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_ForeachLoopHeader_ebcb7f3325_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_LoopHeader_66ca126f9f), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_LoopHeader_66ca126f9f;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_LoopHeader_23fd592271_equals(struct class_LoopHeader_23fd592271 a, struct class_LoopHeader_23fd592271 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_ForLoopHeader_79606b2adb_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_ForeachLoopHeader_ebcb7f3325_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_LoopHeader_66ca126f9f), (int)a.membernum);
+                }
+            }
+            
+            void incref_LoopHeader_23fd592271(struct class_LoopHeader_23fd592271 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_LoopHeader_23fd592271(struct class_LoopHeader_23fd592271 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_ForLoopHeader_79606b2adb);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_ForeachLoopHeader_ebcb7f3325);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
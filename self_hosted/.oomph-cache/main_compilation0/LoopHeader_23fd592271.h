@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_LoopHeader_23fd592271
+                #define HEADER_GUARD_LoopHeader_23fd592271
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_ForLoopHeader_79606b2adb;
+struct class_ForeachLoopHeader_ebcb7f3325;
+
+            struct class_LoopHeader_23fd592271 {
+                union {
+                    	struct class_ForLoopHeader_79606b2adb* item0;
+	struct class_ForeachLoopHeader_ebcb7f3325* item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_LoopHeader_23fd592271_to_string(struct class_LoopHeader_23fd592271 obj);
+            bool meth_LoopHeader_23fd592271_equals(struct class_LoopHeader_23fd592271 a, struct class_LoopHeader_23fd592271 b);
+            
+            void incref_LoopHeader_23fd592271(struct class_LoopHeader_23fd592271 obj);
+            void decref_LoopHeader_23fd592271(struct class_LoopHeader_23fd592271 obj);
+            
+                #endif
+                
@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "LoopLabels_8e8d3917a5.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "GotoLabel_9654b8ee6d.h"
+
+            static struct StringBuf string0_LoopLabels_857c97d3b8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x6f', '\x70', '\x4c', '\x61', '\x62', '\x65', '\x6c', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string0_LoopLabels_857c97d3b8 = {
+                .buf = &string0_LoopLabels_857c97d3b8_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            struct class_LoopLabels_8e8d3917a5* ctor_LoopLabels_8e8d3917a5(struct class_GotoLabel_9654b8ee6d* arg_continue_label,struct class_GotoLabel_9654b8ee6d* arg_break_label)
+            {
+                struct class_LoopLabels_8e8d3917a5* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_continue_label = arg_continue_label;
+obj->memb_break_label = arg_break_label;
+
+                incref(arg_continue_label);
+incref(arg_break_label);
+
+                return obj;
+            }
+
+            void dtor_LoopLabels_8e8d3917a5(void *ptr)
+            {
+                struct class_LoopLabels_8e8d3917a5 *obj = ptr;
+                decref((obj->memb_continue_label), dtor_GotoLabel_9654b8ee6d);
+decref((obj->memb_break_label), dtor_GotoLabel_9654b8ee6d);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_LoopLabels_8e8d3917a5_to_string(struct class_LoopLabels_8e8d3917a5* self)
+                {
+                    struct class_Str res = string0_LoopLabels_857c97d3b8;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_GotoLabel_9654b8ee6d_to_string(self->memb_continue_label);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_GotoLabel_9654b8ee6d_to_string(self->memb_break_label);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_LoopLabels_8e8d3917a5_equals(struct class_LoopLabels_8e8d3917a5* var1, struct class_LoopLabels_8e8d3917a5* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
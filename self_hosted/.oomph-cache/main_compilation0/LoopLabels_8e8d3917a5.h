@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_LoopLabels_8e8d3917a5
+                #define HEADER_GUARD_LoopLabels_8e8d3917a5
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+struct class_GotoLabel_9654b8ee6d;
+
+            struct class_LoopLabels_8e8d3917a5 {
+                REFCOUNT_HEADER
+                struct class_GotoLabel_9654b8ee6d* memb_continue_label;
+struct class_GotoLabel_9654b8ee6d* memb_break_label;
+
+            };
+            
+            struct class_LoopLabels_8e8d3917a5* ctor_LoopLabels_8e8d3917a5(struct class_GotoLabel_9654b8ee6d* arg_continue_label,struct class_GotoLabel_9654b8ee6d* arg_break_label);
+            void dtor_LoopLabels_8e8d3917a5(void *ptr);
+            
+                struct class_Str meth_LoopLabels_8e8d3917a5_to_string(struct class_LoopLabels_8e8d3917a5* obj);
+                bool meth_LoopLabels_8e8d3917a5_equals(struct class_LoopLabels_8e8d3917a5* var1, struct class_LoopLabels_8e8d3917a5* var2);
+
+                #endif
+                
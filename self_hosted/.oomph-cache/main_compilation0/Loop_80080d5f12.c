@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "Loop_80080d5f12.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Statement__5d7503c104.h"
+#include "LoopHeader_23fd592271.h"
+
+            static struct StringBuf string0_Loop_66152b5410_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x6f', '\x70' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Loop_66152b5410 = {
+                .buf = &string0_Loop_66152b5410_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            struct class_Loop_80080d5f12* ctor_Loop_80080d5f12(struct class_LoopHeader_23fd592271 arg_loop_header,struct class_List_Statement__5d7503c104* arg_body)
+            {
+                struct class_Loop_80080d5f12* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_loop_header = arg_loop_header;
+obj->memb_body = arg_body;
+
+                incref_LoopHeader_23fd592271(arg_loop_header);
+incref(arg_body);
+
+                return obj;
+            }
+
+            void dtor_Loop_80080d5f12(void *ptr)
+            {
+                struct class_Loop_80080d5f12 *obj = ptr;
+                decref_LoopHeader_23fd592271(obj->memb_loop_header);
+decref((obj->memb_body), dtor_List_Statement__5d7503c104);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Loop_80080d5f12_to_string(struct class_Loop_80080d5f12* self)
+                {
+                    struct class_Str res = string0_Loop_66152b5410;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LoopHeader_23fd592271_to_string(self->memb_loop_header);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Statement__5d7503c104_to_string(self->memb_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Loop_80080d5f12_equals(struct class_Loop_80080d5f12* var1, struct class_Loop_80080d5f12* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,24 @@
+
+                #ifndef HEADER_GUARD_Loop_80080d5f12
+                #define HEADER_GUARD_Loop_80080d5f12
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "LoopHeader_23fd592271.h"
+struct class_List_Statement__5d7503c104;
+struct class_List_Statement__5d7503c104;
+
+            struct class_Loop_80080d5f12 {
+                REFCOUNT_HEADER
+                struct class_LoopHeader_23fd592271 memb_loop_header;
+struct class_List_Statement__5d7503c104* memb_body;
+
+            };
+            
+            struct class_Loop_80080d5f12* ctor_Loop_80080d5f12(struct class_LoopHeader_23fd592271 arg_loop_header,struct class_List_Statement__5d7503c104* arg_body);
+            void dtor_Loop_80080d5f12(void *ptr);
+            
+                struct class_Str meth_Loop_80080d5f12_to_string(struct class_Loop_80080d5f12* obj);
+                bool meth_Loop_80080d5f12_equals(struct class_Loop_80080d5f12* var1, struct class_Loop_80080d5f12* var2);
+
+                #endif
+                
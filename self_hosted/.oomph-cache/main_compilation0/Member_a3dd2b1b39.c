@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "Member_a3dd2b1b39.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+
+            static struct StringBuf string0_Member_e4855b646f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4d', '\x65', '\x6d', '\x62', '\x65', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Member_e4855b646f = {
+                .buf = &string0_Member_e4855b646f_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_Member_a3dd2b1b39* ctor_Member_a3dd2b1b39(struct class_Str arg_name,struct class_Type_87e1ce5c5e arg_type)
+            {
+                struct class_Member_a3dd2b1b39* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+
+                string_incref(arg_name);
+incref_Type_87e1ce5c5e(arg_type);
+
+                return obj;
+            }
+
+            void dtor_Member_a3dd2b1b39(void *ptr)
+            {
+                struct class_Member_a3dd2b1b39 *obj = ptr;
+                string_decref(obj->memb_name);
+decref_Type_87e1ce5c5e(obj->memb_type);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Member_a3dd2b1b39_to_string(struct class_Member_a3dd2b1b39* self)
+                {
+                    struct class_Str res = string0_Member_e4855b646f;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Member_a3dd2b1b39_equals(struct class_Member_a3dd2b1b39* var1, struct class_Member_a3dd2b1b39* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_Member_a3dd2b1b39
+                #define HEADER_GUARD_Member_a3dd2b1b39
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+
+            struct class_Member_a3dd2b1b39 {
+                REFCOUNT_HEADER
+                struct class_Str memb_name;
+struct class_Type_87e1ce5c5e memb_type;
+
+            };
+            
+            struct class_Member_a3dd2b1b39* ctor_Member_a3dd2b1b39(struct class_Str arg_name,struct class_Type_87e1ce5c5e arg_type);
+            void dtor_Member_a3dd2b1b39(void *ptr);
+            
+                struct class_Str meth_Member_a3dd2b1b39_to_string(struct class_Member_a3dd2b1b39* obj);
+                bool meth_Member_a3dd2b1b39_equals(struct class_Member_a3dd2b1b39* var1, struct class_Member_a3dd2b1b39* var2);
+
+                #endif
+                
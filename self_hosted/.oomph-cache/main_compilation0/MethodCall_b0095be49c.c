@@ -0,0 +1,88 @@
+#include <lib/oomph.h>
+#include "MethodCall_b0095be49c.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_LocalVariable__81e23234f3.h"
+#include "LocalVariable_846080e5ae.h"
+#include "Location_500c4434c9.h"
+#include "_null___LocalVariable__494c1a2e12.h"
+
+            static struct StringBuf string0_MethodCall_78f8d9634b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4d', '\x65', '\x74', '\x68', '\x6f', '\x64', '\x43', '\x61', '\x6c', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_MethodCall_78f8d9634b = {
+                .buf = &string0_MethodCall_78f8d9634b_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            struct class_MethodCall_b0095be49c* ctor_MethodCall_b0095be49c(struct class_LocalVariable_846080e5ae* arg_obj,struct class_Str arg_method_name,struct class_List_LocalVariable__81e23234f3* arg_args,struct class__null___LocalVariable__494c1a2e12 arg_result,struct class_Location_500c4434c9* arg_location)
+            {
+                struct class_MethodCall_b0095be49c* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_obj = arg_obj;
+obj->memb_method_name = arg_method_name;
+obj->memb_args = arg_args;
+obj->memb_result = arg_result;
+obj->memb_location = arg_location;
+
+                incref(arg_obj);
+string_incref(arg_method_name);
+incref(arg_args);
+incref__null___LocalVariable__494c1a2e12(arg_result);
+incref(arg_location);
+
+                return obj;
+            }
+
+            void dtor_MethodCall_b0095be49c(void *ptr)
+            {
+                struct class_MethodCall_b0095be49c *obj = ptr;
+                decref((obj->memb_obj), dtor_LocalVariable_846080e5ae);
+string_decref(obj->memb_method_name);
+decref((obj->memb_args), dtor_List_LocalVariable__81e23234f3);
+decref__null___LocalVariable__494c1a2e12(obj->memb_result);
+decref((obj->memb_location), dtor_Location_500c4434c9);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_MethodCall_b0095be49c_to_string(struct class_MethodCall_b0095be49c* self)
+                {
+                    struct class_Str res = string0_MethodCall_78f8d9634b;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_obj);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_method_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_LocalVariable__81e23234f3_to_string(self->memb_args);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__null___LocalVariable__494c1a2e12_to_string(self->memb_result);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_MethodCall_b0095be49c_equals(struct class_MethodCall_b0095be49c* var1, struct class_MethodCall_b0095be49c* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
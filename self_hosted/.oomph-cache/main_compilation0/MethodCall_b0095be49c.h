@@ -0,0 +1,31 @@
+
+                #ifndef HEADER_GUARD_MethodCall_b0095be49c
+                #define HEADER_GUARD_MethodCall_b0095be49c
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___LocalVariable__494c1a2e12.h"
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_Location_500c4434c9;
+struct class_LocalVariable_846080e5ae;
+struct class_List_LocalVariable__81e23234f3;
+struct class_Location_500c4434c9;
+
+            struct class_MethodCall_b0095be49c {
+                REFCOUNT_HEADER
+                struct class_LocalVariable_846080e5ae* memb_obj;
+struct class_Str memb_method_name;
+struct class_List_LocalVariable__81e23234f3* memb_args;
+struct class__null___LocalVariable__494c1a2e12 memb_result;
+struct class_Location_500c4434c9* memb_location;
+
+            };
+            
+            struct class_MethodCall_b0095be49c* ctor_MethodCall_b0095be49c(struct class_LocalVariable_846080e5ae* arg_obj,struct class_Str arg_method_name,struct class_List_LocalVariable__81e23234f3* arg_args,struct class__null___LocalVariable__494c1a2e12 arg_result,struct class_Location_500c4434c9* arg_location);
+            void dtor_MethodCall_b0095be49c(void *ptr);
+            
+                struct class_Str meth_MethodCall_b0095be49c_to_string(struct class_MethodCall_b0095be49c* obj);
+                bool meth_MethodCall_b0095be49c_equals(struct class_MethodCall_b0095be49c* var1, struct class_MethodCall_b0095be49c* var2);
+
+                #endif
+                
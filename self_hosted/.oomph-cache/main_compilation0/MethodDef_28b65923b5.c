@@ -0,0 +1,80 @@
+#include <lib/oomph.h>
+#include "MethodDef_28b65923b5.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "List_Instruction__6e475c861a.h"
+#include "List_LocalVariable__81e23234f3.h"
+
+            static struct StringBuf string0_MethodDef_ed751a4162_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4d', '\x65', '\x74', '\x68', '\x6f', '\x64', '\x44', '\x65', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string0_MethodDef_ed751a4162 = {
+                .buf = &string0_MethodDef_ed751a4162_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            struct class_MethodDef_28b65923b5* ctor_MethodDef_28b65923b5(struct class_Str arg_name,struct class_FunctionType_4e16d0ea53* arg_type,struct class_List_LocalVariable__81e23234f3* arg_argvars,struct class_List_Instruction__6e475c861a* arg_body)
+            {
+                struct class_MethodDef_28b65923b5* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+obj->memb_argvars = arg_argvars;
+obj->memb_body = arg_body;
+
+                string_incref(arg_name);
+incref(arg_type);
+incref(arg_argvars);
+incref(arg_body);
+
+                return obj;
+            }
+
+            void dtor_MethodDef_28b65923b5(void *ptr)
+            {
+                struct class_MethodDef_28b65923b5 *obj = ptr;
+                string_decref(obj->memb_name);
+decref((obj->memb_type), dtor_FunctionType_4e16d0ea53);
+decref((obj->memb_argvars), dtor_List_LocalVariable__81e23234f3);
+decref((obj->memb_body), dtor_List_Instruction__6e475c861a);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_MethodDef_28b65923b5_to_string(struct class_MethodDef_28b65923b5* self)
+                {
+                    struct class_Str res = string0_MethodDef_ed751a4162;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_FunctionType_4e16d0ea53_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_LocalVariable__81e23234f3_to_string(self->memb_argvars);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Instruction__6e475c861a_to_string(self->memb_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_MethodDef_28b65923b5_equals(struct class_MethodDef_28b65923b5* var1, struct class_MethodDef_28b65923b5* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,29 @@
+
+                #ifndef HEADER_GUARD_MethodDef_28b65923b5
+                #define HEADER_GUARD_MethodDef_28b65923b5
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_FunctionType_4e16d0ea53;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_Instruction__6e475c861a;
+struct class_FunctionType_4e16d0ea53;
+struct class_List_LocalVariable__81e23234f3;
+struct class_List_Instruction__6e475c861a;
+
+            struct class_MethodDef_28b65923b5 {
+                REFCOUNT_HEADER
+                struct class_Str memb_name;
+struct class_FunctionType_4e16d0ea53* memb_type;
+struct class_List_LocalVariable__81e23234f3* memb_argvars;
+struct class_List_Instruction__6e475c861a* memb_body;
+
+            };
+            
+            struct class_MethodDef_28b65923b5* ctor_MethodDef_28b65923b5(struct class_Str arg_name,struct class_FunctionType_4e16d0ea53* arg_type,struct class_List_LocalVariable__81e23234f3* arg_argvars,struct class_List_Instruction__6e475c861a* arg_body);
+            void dtor_MethodDef_28b65923b5(void *ptr);
+            
+                struct class_Str meth_MethodDef_28b65923b5_to_string(struct class_MethodDef_28b65923b5* obj);
+                bool meth_MethodDef_28b65923b5_equals(struct class_MethodDef_28b65923b5* var1, struct class_MethodDef_28b65923b5* var2);
+
+                #endif
+                
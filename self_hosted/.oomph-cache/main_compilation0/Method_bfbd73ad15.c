@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "Method_bfbd73ad15.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "FunctionType_4e16d0ea53.h"
+
+            static struct StringBuf string0_Method_edcbba0e25_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4d', '\x65', '\x74', '\x68', '\x6f', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Method_edcbba0e25 = {
+                .buf = &string0_Method_edcbba0e25_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_Method_bfbd73ad15* ctor_Method_bfbd73ad15(struct class_Str arg_name,struct class_FunctionType_4e16d0ea53* arg_functype)
+            {
+                struct class_Method_bfbd73ad15* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_name = arg_name;
+obj->memb_functype = arg_functype;
+
+                string_incref(arg_name);
+incref(arg_functype);
+
+                return obj;
+            }
+
+            void dtor_Method_bfbd73ad15(void *ptr)
+            {
+                struct class_Method_bfbd73ad15 *obj = ptr;
+                string_decref(obj->memb_name);
+decref((obj->memb_functype), dtor_FunctionType_4e16d0ea53);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Method_bfbd73ad15_to_string(struct class_Method_bfbd73ad15* self)
+                {
+                    struct class_Str res = string0_Method_edcbba0e25;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_FunctionType_4e16d0ea53_to_string(self->memb_functype);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Method_bfbd73ad15_equals(struct class_Method_bfbd73ad15* var1, struct class_Method_bfbd73ad15* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
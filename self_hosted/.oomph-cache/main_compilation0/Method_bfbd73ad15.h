@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_Method_bfbd73ad15
+                #define HEADER_GUARD_Method_bfbd73ad15
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_FunctionType_4e16d0ea53;
+struct class_FunctionType_4e16d0ea53;
+
+            struct class_Method_bfbd73ad15 {
+                REFCOUNT_HEADER
+                struct class_Str memb_name;
+struct class_FunctionType_4e16d0ea53* memb_functype;
+
+            };
+            
+            struct class_Method_bfbd73ad15* ctor_Method_bfbd73ad15(struct class_Str arg_name,struct class_FunctionType_4e16d0ea53* arg_functype);
+            void dtor_Method_bfbd73ad15(void *ptr);
+            
+                struct class_Str meth_Method_bfbd73ad15_to_string(struct class_Method_bfbd73ad15* obj);
+                bool meth_Method_bfbd73ad15_equals(struct class_Method_bfbd73ad15* var1, struct class_Method_bfbd73ad15* var2);
+
+                #endif
+                
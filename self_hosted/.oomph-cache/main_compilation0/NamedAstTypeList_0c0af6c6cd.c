@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "NamedAstTypeList_0c0af6c6cd.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Type__b06c7a2bb6.h"
+
+            static struct StringBuf string0_NamedAstTypeList_fb5a18cde6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4e', '\x61', '\x6d', '\x65', '\x64', '\x41', '\x73', '\x74', '\x54', '\x79', '\x70', '\x65', '\x4c', '\x69', '\x73', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string0_NamedAstTypeList_fb5a18cde6 = {
+                .buf = &string0_NamedAstTypeList_fb5a18cde6_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            struct class_NamedAstTypeList_0c0af6c6cd* ctor_NamedAstTypeList_0c0af6c6cd(struct class_Str arg_name,struct class_List_Type__b06c7a2bb6* arg_types)
+            {
+                struct class_NamedAstTypeList_0c0af6c6cd* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_name = arg_name;
+obj->memb_types = arg_types;
+
+                string_incref(arg_name);
+incref(arg_types);
+
+                return obj;
+            }
+
+            void dtor_NamedAstTypeList_0c0af6c6cd(void *ptr)
+            {
+                struct class_NamedAstTypeList_0c0af6c6cd *obj = ptr;
+                string_decref(obj->memb_name);
+decref((obj->memb_types), dtor_List_Type__b06c7a2bb6);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_NamedAstTypeList_0c0af6c6cd_to_string(struct class_NamedAstTypeList_0c0af6c6cd* self)
+                {
+                    struct class_Str res = string0_NamedAstTypeList_fb5a18cde6;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Type__b06c7a2bb6_to_string(self->memb_types);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_NamedAstTypeList_0c0af6c6cd_equals(struct class_NamedAstTypeList_0c0af6c6cd* var1, struct class_NamedAstTypeList_0c0af6c6cd* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_NamedAstTypeList_0c0af6c6cd
+                #define HEADER_GUARD_NamedAstTypeList_0c0af6c6cd
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Type__b06c7a2bb6;
+struct class_List_Type__b06c7a2bb6;
+
+            struct class_NamedAstTypeList_0c0af6c6cd {
+                REFCOUNT_HEADER
+                struct class_Str memb_name;
+struct class_List_Type__b06c7a2bb6* memb_types;
+
+            };
+            
+            struct class_NamedAstTypeList_0c0af6c6cd* ctor_NamedAstTypeList_0c0af6c6cd(struct class_Str arg_name,struct class_List_Type__b06c7a2bb6* arg_types);
+            void dtor_NamedAstTypeList_0c0af6c6cd(void *ptr);
+            
+                struct class_Str meth_NamedAstTypeList_0c0af6c6cd_to_string(struct class_NamedAstTypeList_0c0af6c6cd* obj);
+                bool meth_NamedAstTypeList_0c0af6c6cd_equals(struct class_NamedAstTypeList_0c0af6c6cd* var1, struct class_NamedAstTypeList_0c0af6c6cd* var2);
+
+                #endif
+                
@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "NamedAstType_601829e0d0.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_e6cf7dd4e5.h"
+
+            static struct StringBuf string0_NamedAstType_db5178ebf1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4e', '\x61', '\x6d', '\x65', '\x64', '\x41', '\x73', '\x74', '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_NamedAstType_db5178ebf1 = {
+                .buf = &string0_NamedAstType_db5178ebf1_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            struct class_NamedAstType_601829e0d0* ctor_NamedAstType_601829e0d0(struct class_Str arg_name,struct class_Type_e6cf7dd4e5 arg_type)
+            {
+                struct class_NamedAstType_601829e0d0* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+
+                string_incref(arg_name);
+incref_Type_e6cf7dd4e5(arg_type);
+
+                return obj;
+            }
+
+            void dtor_NamedAstType_601829e0d0(void *ptr)
+            {
+                struct class_NamedAstType_601829e0d0 *obj = ptr;
+                string_decref(obj->memb_name);
+decref_Type_e6cf7dd4e5(obj->memb_type);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_NamedAstType_601829e0d0_to_string(struct class_NamedAstType_601829e0d0* self)
+                {
+                    struct class_Str res = string0_NamedAstType_db5178ebf1;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_e6cf7dd4e5_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_NamedAstType_601829e0d0_equals(struct class_NamedAstType_601829e0d0* var1, struct class_NamedAstType_601829e0d0* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
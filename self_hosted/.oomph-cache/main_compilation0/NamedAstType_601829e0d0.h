@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_NamedAstType_601829e0d0
+                #define HEADER_GUARD_NamedAstType_601829e0d0
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_e6cf7dd4e5.h"
+
+            struct class_NamedAstType_601829e0d0 {
+                REFCOUNT_HEADER
+                struct class_Str memb_name;
+struct class_Type_e6cf7dd4e5 memb_type;
+
+            };
+            
+            struct class_NamedAstType_601829e0d0* ctor_NamedAstType_601829e0d0(struct class_Str arg_name,struct class_Type_e6cf7dd4e5 arg_type);
+            void dtor_NamedAstType_601829e0d0(void *ptr);
+            
+                struct class_Str meth_NamedAstType_601829e0d0_to_string(struct class_NamedAstType_601829e0d0* obj);
+                bool meth_NamedAstType_601829e0d0_equals(struct class_NamedAstType_601829e0d0* var1, struct class_NamedAstType_601829e0d0* var2);
+
+                #endif
+                
@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "NamedGeneric_b3d994eaa0.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Generic_c39b95ec73.h"
+
+            static struct StringBuf string0_NamedGeneric_9aa5e9071f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4e', '\x61', '\x6d', '\x65', '\x64', '\x47', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string0_NamedGeneric_9aa5e9071f = {
+                .buf = &string0_NamedGeneric_9aa5e9071f_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            struct class_NamedGeneric_b3d994eaa0* ctor_NamedGeneric_b3d994eaa0(struct class_Str arg_name,struct class_Generic_c39b95ec73* arg_generik)
+            {
+                struct class_NamedGeneric_b3d994eaa0* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_name = arg_name;
+obj->memb_generik = arg_generik;
+
+                string_incref(arg_name);
+incref(arg_generik);
+
+                return obj;
+            }
+
+            void dtor_NamedGeneric_b3d994eaa0(void *ptr)
+            {
+                struct class_NamedGeneric_b3d994eaa0 *obj = ptr;
+                string_decref(obj->memb_name);
+decref((obj->memb_generik), dtor_Generic_c39b95ec73);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_NamedGeneric_b3d994eaa0_to_string(struct class_NamedGeneric_b3d994eaa0* self)
+                {
+                    struct class_Str res = string0_NamedGeneric_9aa5e9071f;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Generic_c39b95ec73_to_string(self->memb_generik);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_NamedGeneric_b3d994eaa0_equals(struct class_NamedGeneric_b3d994eaa0* var1, struct class_NamedGeneric_b3d994eaa0* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_NamedGeneric_b3d994eaa0
+                #define HEADER_GUARD_NamedGeneric_b3d994eaa0
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Generic_c39b95ec73;
+struct class_Generic_c39b95ec73;
+
+            struct class_NamedGeneric_b3d994eaa0 {
+                REFCOUNT_HEADER
+                struct class_Str memb_name;
+struct class_Generic_c39b95ec73* memb_generik;
+
+            };
+            
+            struct class_NamedGeneric_b3d994eaa0* ctor_NamedGeneric_b3d994eaa0(struct class_Str arg_name,struct class_Generic_c39b95ec73* arg_generik);
+            void dtor_NamedGeneric_b3d994eaa0(void *ptr);
+            
+                struct class_Str meth_NamedGeneric_b3d994eaa0_to_string(struct class_NamedGeneric_b3d994eaa0* obj);
+                bool meth_NamedGeneric_b3d994eaa0_equals(struct class_NamedGeneric_b3d994eaa0* var1, struct class_NamedGeneric_b3d994eaa0* var2);
+
+                #endif
+                
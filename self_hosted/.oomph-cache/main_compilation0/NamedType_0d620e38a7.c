@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "NamedType_0d620e38a7.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_NamedType_e4f0daee52_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4e', '\x61', '\x6d', '\x65', '\x64', '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_NamedType_e4f0daee52 = {
+                .buf = &string0_NamedType_e4f0daee52_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            struct class_NamedType_0d620e38a7* ctor_NamedType_0d620e38a7(struct class_Location_500c4434c9* arg_location,struct class_Str arg_name)
+            {
+                struct class_NamedType_0d620e38a7* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+
+                incref(arg_location);
+string_incref(arg_name);
+
+                return obj;
+            }
+
+            void dtor_NamedType_0d620e38a7(void *ptr)
+            {
+                struct class_NamedType_0d620e38a7 *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+string_decref(obj->memb_name);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_NamedType_0d620e38a7_to_string(struct class_NamedType_0d620e38a7* self)
+                {
+                    struct class_Str res = string0_NamedType_e4f0daee52;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_NamedType_0d620e38a7_equals(struct class_NamedType_0d620e38a7* var1, struct class_NamedType_0d620e38a7* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_NamedType_0d620e38a7
+                #define HEADER_GUARD_NamedType_0d620e38a7
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_NamedType_0d620e38a7 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Str memb_name;
+
+            };
+            
+            struct class_NamedType_0d620e38a7* ctor_NamedType_0d620e38a7(struct class_Location_500c4434c9* arg_location,struct class_Str arg_name);
+            void dtor_NamedType_0d620e38a7(void *ptr);
+            
+                struct class_Str meth_NamedType_0d620e38a7_to_string(struct class_NamedType_0d620e38a7* obj);
+                bool meth_NamedType_0d620e38a7_equals(struct class_NamedType_0d620e38a7* var1, struct class_NamedType_0d620e38a7* var2);
+
+                #endif
+                
@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "NamedType_fe3e45e722.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+
+            static struct StringBuf string0_NamedType_8a19a36991_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4e', '\x61', '\x6d', '\x65', '\x64', '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_NamedType_8a19a36991 = {
+                .buf = &string0_NamedType_8a19a36991_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            struct class_NamedType_fe3e45e722* ctor_NamedType_fe3e45e722(struct class_Str arg_name,struct class_Type_87e1ce5c5e arg_type)
+            {
+                struct class_NamedType_fe3e45e722* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+
+                string_incref(arg_name);
+incref_Type_87e1ce5c5e(arg_type);
+
+                return obj;
+            }
+
+            void dtor_NamedType_fe3e45e722(void *ptr)
+            {
+                struct class_NamedType_fe3e45e722 *obj = ptr;
+                string_decref(obj->memb_name);
+decref_Type_87e1ce5c5e(obj->memb_type);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_NamedType_fe3e45e722_to_string(struct class_NamedType_fe3e45e722* self)
+                {
+                    struct class_Str res = string0_NamedType_8a19a36991;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_NamedType_fe3e45e722_equals(struct class_NamedType_fe3e45e722* var1, struct class_NamedType_fe3e45e722* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_NamedType_fe3e45e722
+                #define HEADER_GUARD_NamedType_fe3e45e722
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+
+            struct class_NamedType_fe3e45e722 {
+                REFCOUNT_HEADER
+                struct class_Str memb_name;
+struct class_Type_87e1ce5c5e memb_type;
+
+            };
+            
+            struct class_NamedType_fe3e45e722* ctor_NamedType_fe3e45e722(struct class_Str arg_name,struct class_Type_87e1ce5c5e arg_type);
+            void dtor_NamedType_fe3e45e722(void *ptr);
+            
+                struct class_Str meth_NamedType_fe3e45e722_to_string(struct class_NamedType_fe3e45e722* obj);
+                bool meth_NamedType_fe3e45e722_equals(struct class_NamedType_fe3e45e722* var1, struct class_NamedType_fe3e45e722* var2);
+
+                #endif
+                
@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "NamedVariable_ac0761c28d.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Variable_1aaa81c8d2.h"
+
+            static struct StringBuf string0_NamedVariable_a567de9b22_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4e', '\x61', '\x6d', '\x65', '\x64', '\x56', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_NamedVariable_a567de9b22 = {
+                .buf = &string0_NamedVariable_a567de9b22_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            struct class_NamedVariable_ac0761c28d* ctor_NamedVariable_ac0761c28d(struct class_Str arg_name,struct class_Variable_1aaa81c8d2 arg_var)
+            {
+                struct class_NamedVariable_ac0761c28d* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_name = arg_name;
+obj->memb_var = arg_var;
+
+                string_incref(arg_name);
+incref_Variable_1aaa81c8d2(arg_var);
+
+                return obj;
+            }
+
+            void dtor_NamedVariable_ac0761c28d(void *ptr)
+            {
+                struct class_NamedVariable_ac0761c28d *obj = ptr;
+                string_decref(obj->memb_name);
+decref_Variable_1aaa81c8d2(obj->memb_var);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_NamedVariable_ac0761c28d_to_string(struct class_NamedVariable_ac0761c28d* self)
+                {
+                    struct class_Str res = string0_NamedVariable_a567de9b22;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Variable_1aaa81c8d2_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_NamedVariable_ac0761c28d_equals(struct class_NamedVariable_ac0761c28d* var1, struct class_NamedVariable_ac0761c28d* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_NamedVariable_ac0761c28d
+                #define HEADER_GUARD_NamedVariable_ac0761c28d
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Variable_1aaa81c8d2.h"
+
+            struct class_NamedVariable_ac0761c28d {
+                REFCOUNT_HEADER
+                struct class_Str memb_name;
+struct class_Variable_1aaa81c8d2 memb_var;
+
+            };
+            
+            struct class_NamedVariable_ac0761c28d* ctor_NamedVariable_ac0761c28d(struct class_Str arg_name,struct class_Variable_1aaa81c8d2 arg_var);
+            void dtor_NamedVariable_ac0761c28d(void *ptr);
+            
+                struct class_Str meth_NamedVariable_ac0761c28d_to_string(struct class_NamedVariable_ac0761c28d* obj);
+                bool meth_NamedVariable_ac0761c28d_equals(struct class_NamedVariable_ac0761c28d* var1, struct class_NamedVariable_ac0761c28d* var2);
+
+                #endif
+                
@@ -0,0 +1,7036 @@
+#include <lib/oomph.h>
+#include "Parser_d28334dc68.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "As_a05f1f16b6.h"
+#include "AutoType_39f5d793d6.h"
+#include "BinaryOperator_e25f87d1b5.h"
+#include "Break_2f9897f5fd.h"
+#include "Call_d0fb9d6234.h"
+#include "Case_458b8eeee1.h"
+#include "ClassDef_ac59c4b64c.h"
+#include "ConditionAndBody_0e2f888e06.h"
+#include "Constructor_0c896e4031.h"
+#include "Continue_b54f3b332e.h"
+#include "Expression_35f2052bf4.h"
+#include "FloatConstant_4759845694.h"
+#include "ForLoopHeader_79606b2adb.h"
+#include "ForeachLoopHeader_ebcb7f3325.h"
+#include "FuncOrMethodDef_533c7b75ab.h"
+#include "GenericType_f44d8197cb.h"
+#include "GetAttribute_0758070446.h"
+#include "GetVar_642f116a6c.h"
+#include "If_8811dba942.h"
+#include "Import_6056d7e9c9.h"
+#include "IntConstant_4cbc4c5420.h"
+#include "Let_c9da3e3372.h"
+#include "ListComprehension_10c913d2dd.h"
+#include "ListLiteral_66e426dc17.h"
+#include "List_Case__f5a6b4b2ec.h"
+#include "List_ConditionAndBody__ad79dde1db.h"
+#include "List_Expression__d162784c9e.h"
+#include "List_FuncOrMethodDef__af5379b09e.h"
+#include "List_List_Str___637f5f7ec1.h"
+#include "List_PrecedenceItem__37797831a9.h"
+#include "List_Statement__5d7503c104.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Token__da0ee88323.h"
+#include "List_TypeAndName__74be4dae93.h"
+#include "List_Type__b06c7a2bb6.h"
+#include "Location_500c4434c9.h"
+#include "LoopHeader_23fd592271.h"
+#include "Loop_80080d5f12.h"
+#include "NamedType_0d620e38a7.h"
+#include "Pass_e49950b77e.h"
+#include "PrecedenceItem_f832c8ac03.h"
+#include "Return_33802009cd.h"
+#include "SetAttribute_6bd58fd9d3.h"
+#include "SetVar_6a19c6f350.h"
+#include "Statement_1dc2e7090f.h"
+#include "StringConstant_c2b1c10b4f.h"
+#include "StringFormatJoin_bc28806767.h"
+#include "Switch_9b8c881aeb.h"
+#include "Token_35f69eeb49.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "TypeAndName_fec99b5f94.h"
+#include "TypeDef_44471836ba.h"
+#include "Type_e6cf7dd4e5.h"
+#include "UnaryOperator_348525ebbe.h"
+#include "UnionType_0c977b4168.h"
+#include "_null___Expression__957e7d6409.h"
+#include "_null___Int__16c741706b.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "_null___TypeAndName__d7958d7e85.h"
+#include "_null___Type__7de1ddce50.h"
+#include "ast_91af7cbb25.h"
+#include "parser_6c64cd293c.h"
+#include "tokenizer_431c4db6a8.h"
+
+            static struct StringBuf string0_Parser_690a4197bd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x61', '\x72', '\x73', '\x65', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Parser_690a4197bd = {
+                .buf = &string0_Parser_690a4197bd_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_self_hosted_parser_oomph_0113086932_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x70', '\x61', '\x72', '\x73', '\x65', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string1_self_hosted_parser_oomph_0113086932 = {
+                .buf = &string1_self_hosted_parser_oomph_0113086932_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_Wrong_token_type__expected__731a55259e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x57', '\x72', '\x6f', '\x6e', '\x67', '\x20', '\x74', '\x6f', '\x6b', '\x65', '\x6e', '\x20', '\x74', '\x79', '\x70', '\x65', '\x3a', '\x20', '\x65', '\x78', '\x70', '\x65', '\x63', '\x74', '\x65', '\x64', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string2_Wrong_token_type__expected__731a55259e = {
+                .buf = &string2_Wrong_token_type__expected__731a55259e_buf,
+                .nbytes = 27,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3___got__1540ce8445_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x20', '\x67', '\x6f', '\x74', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string3___got__1540ce8445 = {
+                .buf = &string3___got__1540ce8445_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4___45fbfd7e60_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string4___45fbfd7e60 = {
+                .buf = &string4___45fbfd7e60_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_should_be_newline_2986cb6223_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x68', '\x6f', '\x75', '\x6c', '\x64', '\x20', '\x62', '\x65', '\x20', '\x6e', '\x65', '\x77', '\x6c', '\x69', '\x6e', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string5_should_be_newline_2986cb6223 = {
+                .buf = &string5_should_be_newline_2986cb6223_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6_should_be___339c11cbe1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x68', '\x6f', '\x75', '\x6c', '\x64', '\x20', '\x62', '\x65', '\x20', '\x27' },
+                .malloced = false,
+            };
+            static struct class_Str string6_should_be___339c11cbe1 = {
+                .buf = &string6_should_be___339c11cbe1_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7___0446cef4ad_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27' },
+                .malloced = false,
+            };
+            static struct class_Str string7___0446cef4ad = {
+                .buf = &string7___0446cef4ad_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string8_keyword_ab52a28662_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6b', '\x65', '\x79', '\x77', '\x6f', '\x72', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string8_keyword_ab52a28662 = {
+                .buf = &string8_keyword_ab52a28662_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string9_import_a688f8b972_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6d', '\x70', '\x6f', '\x72', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string9_import_a688f8b972 = {
+                .buf = &string9_import_a688f8b972_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string10_oneline_string_8354f3c980_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x6e', '\x65', '\x6c', '\x69', '\x6e', '\x65', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string10_oneline_string_8354f3c980 = {
+                .buf = &string10_oneline_string_8354f3c980_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string11_as_4913bd3281_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string11_as_4913bd3281 = {
+                .buf = &string11_as_4913bd3281_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string12_id_5bfb53972f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string12_id_5bfb53972f = {
+                .buf = &string12_id_5bfb53972f_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string13_op_2d685dde34_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x70' },
+                .malloced = false,
+            };
+            static struct class_Str string13_op_2d685dde34 = {
+                .buf = &string13_op_2d685dde34_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string14___0d4b18cc3d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x22' },
+                .malloced = false,
+            };
+            static struct class_Str string14___0d4b18cc3d = {
+                .buf = &string14___0d4b18cc3d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string15___052dc79f90_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5c' },
+                .malloced = false,
+            };
+            static struct class_Str string15___052dc79f90 = {
+                .buf = &string15___052dc79f90_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string16___ecd2ce37b3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7b' },
+                .malloced = false,
+            };
+            static struct class_Str string16___ecd2ce37b3 = {
+                .buf = &string16___ecd2ce37b3_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string17___842f93bc72_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7d' },
+                .malloced = false,
+            };
+            static struct class_Str string17___842f93bc72 = {
+                .buf = &string17___842f93bc72_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string18__stdlib___d6f7664d08_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3c', '\x73', '\x74', '\x64', '\x6c', '\x69', '\x62', '\x3e', '\x2f' },
+                .malloced = false,
+            };
+            static struct class_Str string18__stdlib___d6f7664d08 = {
+                .buf = &string18__stdlib___d6f7664d08_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string19___d27c7b3f3c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f' },
+                .malloced = false,
+            };
+            static struct class_Str string19___d27c7b3f3c = {
+                .buf = &string19___d27c7b3f3c_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string20___d56680faa2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c' },
+                .malloced = false,
+            };
+            static struct class_Str string20___d56680faa2 = {
+                .buf = &string20___d56680faa2_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string21___f5039684f7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28' },
+                .malloced = false,
+            };
+            static struct class_Str string21___f5039684f7 = {
+                .buf = &string21___f5039684f7_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string22___6ec62f9ee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string22___6ec62f9ee6 = {
+                .buf = &string22___6ec62f9ee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string23_begin_block_cd4b098ac0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x65', '\x67', '\x69', '\x6e', '\x5f', '\x62', '\x6c', '\x6f', '\x63', '\x6b' },
+                .malloced = false,
+            };
+            static struct class_Str string23_begin_block_cd4b098ac0 = {
+                .buf = &string23_begin_block_cd4b098ac0_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string24___dc60150654_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string24___dc60150654 = {
+                .buf = &string24___dc60150654_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string25_end_block_550305c23c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x6e', '\x64', '\x5f', '\x62', '\x6c', '\x6f', '\x63', '\x6b' },
+                .malloced = false,
+            };
+            static struct class_Str string25_end_block_550305c23c = {
+                .buf = &string25_end_block_550305c23c_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string26__6e998e6136_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string26__6e998e6136 = {
+                .buf = &string26__6e998e6136_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string27__n_51401217a8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5c', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string27__n_51401217a8 = {
+                .buf = &string27__n_51401217a8_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string28__t_9993414863_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5c', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string28__t_9993414863 = {
+                .buf = &string28__t_9993414863_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string29___9121d994e7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x09' },
+                .malloced = false,
+            };
+            static struct class_Str string29___9121d994e7 = {
+                .buf = &string29___9121d994e7_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string30____6a28ac553b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5c', '\x7b' },
+                .malloced = false,
+            };
+            static struct class_Str string30____6a28ac553b = {
+                .buf = &string30____6a28ac553b_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string31____02f9e7c396_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5c', '\x7d' },
+                .malloced = false,
+            };
+            static struct class_Str string31____02f9e7c396 = {
+                .buf = &string31____02f9e7c396_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string32____38f18abc4a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5c', '\x22' },
+                .malloced = false,
+            };
+            static struct class_Str string32____38f18abc4a = {
+                .buf = &string32____38f18abc4a_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string33____a253d5e00a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5c', '\x5c' },
+                .malloced = false,
+            };
+            static struct class_Str string33____a253d5e00a = {
+                .buf = &string33____a253d5e00a_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string34_multiline_string_ea7c283272_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x75', '\x6c', '\x74', '\x69', '\x6c', '\x69', '\x6e', '\x65', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string34_multiline_string_ea7c283272 = {
+                .buf = &string34_multiline_string_ea7c283272_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string35_int_8957befbef_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string35_int_8957befbef = {
+                .buf = &string35_int_8957befbef_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string36_float_4a2ac0101e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string36_float_4a2ac0101e = {
+                .buf = &string36_float_4a2ac0101e_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string37_new_2386c484ed_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x65', '\x77' },
+                .malloced = false,
+            };
+            static struct class_Str string37_new_2386c484ed = {
+                .buf = &string37_new_2386c484ed_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string38___fa376e52cd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5b' },
+                .malloced = false,
+            };
+            static struct class_Str string38___fa376e52cd = {
+                .buf = &string38___fa376e52cd_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string39_while_93e771812f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77', '\x68', '\x69', '\x6c', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string39_while_93e771812f = {
+                .buf = &string39_while_93e771812f_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string40_for_4e6e4e6d32_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6f', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string40_for_4e6e4e6d32 = {
+                .buf = &string40_for_4e6e4e6d32_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string41_foreach_2b3e8a8a16_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6f', '\x72', '\x65', '\x61', '\x63', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string41_foreach_2b3e8a8a16 = {
+                .buf = &string41_foreach_2b3e8a8a16_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string42___64da0476a2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5d' },
+                .malloced = false,
+            };
+            static struct class_Str string42___64da0476a2 = {
+                .buf = &string42___64da0476a2_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string43_____9f49eb898a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x22', '\x22', '\x22' },
+                .malloced = false,
+            };
+            static struct class_Str string43_____9f49eb898a = {
+                .buf = &string43_____9f49eb898a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string44___c381e79c68_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e' },
+                .malloced = false,
+            };
+            static struct class_Str string44___c381e79c68 = {
+                .buf = &string44___c381e79c68_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string45_ambiguous_operators_f8ca235a95_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x6d', '\x62', '\x69', '\x67', '\x75', '\x6f', '\x75', '\x73', '\x20', '\x6f', '\x70', '\x65', '\x72', '\x61', '\x74', '\x6f', '\x72', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string45_ambiguous_operators_f8ca235a95 = {
+                .buf = &string45_ambiguous_operators_f8ca235a95_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string46_not_74a6e9747c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x6f', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string46_not_74a6e9747c = {
+                .buf = &string46_not_74a6e9747c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string47___436c5e6693_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d' },
+                .malloced = false,
+            };
+            static struct class_Str string47___436c5e6693 = {
+                .buf = &string47___436c5e6693_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string48_should_be_an_expression_ff6dede615_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x68', '\x6f', '\x75', '\x6c', '\x64', '\x20', '\x62', '\x65', '\x20', '\x61', '\x6e', '\x20', '\x65', '\x78', '\x70', '\x72', '\x65', '\x73', '\x73', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string48_should_be_an_expression_ff6dede615 = {
+                .buf = &string48_should_be_an_expression_ff6dede615_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string49___9f81282eac_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2b' },
+                .malloced = false,
+            };
+            static struct class_Str string49___9f81282eac = {
+                .buf = &string49___9f81282eac_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string50___d3b1146f27_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2a' },
+                .malloced = false,
+            };
+            static struct class_Str string50___d3b1146f27 = {
+                .buf = &string50___d3b1146f27_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string51____5913148caa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3d', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string51____5913148caa = {
+                .buf = &string51____5913148caa_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string52____fb9ff04846_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x21', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string52____fb9ff04846 = {
+                .buf = &string52____fb9ff04846_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string53___6461204c0f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3c' },
+                .malloced = false,
+            };
+            static struct class_Str string53___6461204c0f = {
+                .buf = &string53___6461204c0f_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string54___28752bbc68_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3e' },
+                .malloced = false,
+            };
+            static struct class_Str string54___28752bbc68 = {
+                .buf = &string54___28752bbc68_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string55____1621b5e4a3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3c', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string55____1621b5e4a3 = {
+                .buf = &string55____1621b5e4a3_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string56____cbfe098cf3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3e', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string56____cbfe098cf3 = {
+                .buf = &string56____cbfe098cf3_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string57_mod_7e6617d30e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x6f', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string57_mod_7e6617d30e = {
+                .buf = &string57_mod_7e6617d30e_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string58_in_59cd12871e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string58_in_59cd12871e = {
+                .buf = &string58_in_59cd12871e_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string59_not_in_27e17f8cf4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x6f', '\x74', '\x20', '\x69', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string59_not_in_27e17f8cf4 = {
+                .buf = &string59_not_in_27e17f8cf4_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string60_and_632735ef57_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x6e', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string60_and_632735ef57 = {
+                .buf = &string60_and_632735ef57_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string61_or_27d1eae6e3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string61_or_27d1eae6e3 = {
+                .buf = &string61_or_27d1eae6e3_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string62_let_63898cc654_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x65', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string62_let_63898cc654 = {
+                .buf = &string62_let_63898cc654_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string63___f4c9a5a296_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string63___f4c9a5a296 = {
+                .buf = &string63___f4c9a5a296_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string64_return_53dba27a85_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string64_return_53dba27a85 = {
+                .buf = &string64_return_53dba27a85_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string65_pass_9d222979b6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x61', '\x73', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string65_pass_9d222979b6 = {
+                .buf = &string65_pass_9d222979b6_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string66_continue_ba82e33528_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x6f', '\x6e', '\x74', '\x69', '\x6e', '\x75', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string66_continue_ba82e33528 = {
+                .buf = &string66_continue_ba82e33528_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string67_break_8cab52584f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x72', '\x65', '\x61', '\x6b' },
+                .malloced = false,
+            };
+            static struct class_Str string67_break_8cab52584f = {
+                .buf = &string67_break_8cab52584f_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string68_should_be_a_statement_1988c846f7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x68', '\x6f', '\x75', '\x6c', '\x64', '\x20', '\x62', '\x65', '\x20', '\x61', '\x20', '\x73', '\x74', '\x61', '\x74', '\x65', '\x6d', '\x65', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string68_should_be_a_statement_1988c846f7 = {
+                .buf = &string68_should_be_a_statement_1988c846f7_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string69_can_t_assing_to__ff7d91fc39_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x61', '\x6e', '\x27', '\x74', '\x20', '\x61', '\x73', '\x73', '\x69', '\x6e', '\x67', '\x20', '\x74', '\x6f', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string69_can_t_assing_to__ff7d91fc39 = {
+                .buf = &string69_can_t_assing_to__ff7d91fc39_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string70_case_61d92c9fac_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x61', '\x73', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string70_case_61d92c9fac = {
+                .buf = &string70_case_61d92c9fac_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string71___82ce2bf515_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b' },
+                .malloced = false,
+            };
+            static struct class_Str string71___82ce2bf515 = {
+                .buf = &string71___82ce2bf515_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string72_of_31faf8f347_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string72_of_31faf8f347 = {
+                .buf = &string72_of_31faf8f347_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string73_if_835dc10143_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string73_if_835dc10143 = {
+                .buf = &string73_if_835dc10143_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string74_elif_2fe910af23_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x6c', '\x69', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string74_elif_2fe910af23 = {
+                .buf = &string74_elif_2fe910af23_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string75_else_fff4acf85d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string75_else_fff4acf85d = {
+                .buf = &string75_else_fff4acf85d_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string76_switch_dd2abe5bf9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x77', '\x69', '\x74', '\x63', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string76_switch_dd2abe5bf9 = {
+                .buf = &string76_switch_dd2abe5bf9_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string77_auto_6a7b878add_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x75', '\x74', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string77_auto_6a7b878add = {
+                .buf = &string77_auto_6a7b878add_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string78___efb88c3a7c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7c' },
+                .malloced = false,
+            };
+            static struct class_Str string78___efb88c3a7c = {
+                .buf = &string78___efb88c3a7c_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string79____bea779db3d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x3e' },
+                .malloced = false,
+            };
+            static struct class_Str string79____bea779db3d = {
+                .buf = &string79____bea779db3d_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string80_meth_b4faa6c4d6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x65', '\x74', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string80_meth_b4faa6c4d6 = {
+                .buf = &string80_meth_b4faa6c4d6_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string81_export_372718dd0a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x78', '\x70', '\x6f', '\x72', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string81_export_372718dd0a = {
+                .buf = &string81_export_372718dd0a_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string82_func_2c6b5f04d2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x75', '\x6e', '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string82_func_2c6b5f04d2 = {
+                .buf = &string82_func_2c6b5f04d2_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string83_class_ff765e86a5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x6c', '\x61', '\x73', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string83_class_ff765e86a5 = {
+                .buf = &string83_class_ff765e86a5_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string84_typedef_fe39013bca_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x79', '\x70', '\x65', '\x64', '\x65', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string84_typedef_fe39013bca = {
+                .buf = &string84_typedef_fe39013bca_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string85____b93f89958a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string85____b93f89958a = {
+                .buf = &string85____b93f89958a_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string86_typedef_name_must_not_contain______3fb5741dc0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x79', '\x70', '\x65', '\x64', '\x65', '\x66', '\x20', '\x6e', '\x61', '\x6d', '\x65', '\x20', '\x6d', '\x75', '\x73', '\x74', '\x20', '\x6e', '\x6f', '\x74', '\x20', '\x63', '\x6f', '\x6e', '\x74', '\x61', '\x69', '\x6e', '\x20', '\x27', '\x3a', '\x3a', '\x27' },
+                .malloced = false,
+            };
+            static struct class_Str string86_typedef_name_must_not_contain______3fb5741dc0 = {
+                .buf = &string86_typedef_name_must_not_contain______3fb5741dc0_buf,
+                .nbytes = 34,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string87_should_be_function__class__union_or_typedef_707a34a5c2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x68', '\x6f', '\x75', '\x6c', '\x64', '\x20', '\x62', '\x65', '\x20', '\x66', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x2c', '\x20', '\x63', '\x6c', '\x61', '\x73', '\x73', '\x2c', '\x20', '\x75', '\x6e', '\x69', '\x6f', '\x6e', '\x20', '\x6f', '\x72', '\x20', '\x74', '\x79', '\x70', '\x65', '\x64', '\x65', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string87_should_be_function__class__union_or_typedef_707a34a5c2 = {
+                .buf = &string87_should_be_function__class__union_or_typedef_707a34a5c2_buf,
+                .nbytes = 43,
+                .offset = 0,
+            };
+            
+            struct class_Parser_d28334dc68* ctor_Parser_d28334dc68(struct class_List_Token__da0ee88323* arg_tokens)
+            {
+                struct class_Parser_d28334dc68* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_tokens = arg_tokens;
+
+                incref(arg_tokens);
+
+                return obj;
+            }
+
+            void dtor_Parser_d28334dc68(void *ptr)
+            {
+                struct class_Parser_d28334dc68 *obj = ptr;
+                decref((obj->memb_tokens), dtor_List_Token__da0ee88323);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Parser_d28334dc68_to_string(struct class_Parser_d28334dc68* self)
+                {
+                    struct class_Str res = string0_Parser_690a4197bd;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_List_Token__da0ee88323_to_string(self->memb_tokens);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Parser_d28334dc68_equals(struct class_Parser_d28334dc68* var1, struct class_Parser_d28334dc68* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}struct class_Token_35f69eeb49* meth_Parser_d28334dc68_peek(struct class_Parser_d28334dc68* var1){struct class_List_Token__da0ee88323* var2;
+var2 = NULL;
+struct class_List_Token__da0ee88323* var3;
+var3 = NULL;
+bool var4;
+bool var5;
+struct class_Str var6;
+var6.buf = NULL;
+int64_t var7;
+struct class_List_Token__da0ee88323* var8;
+var8 = NULL;
+struct class_Token_35f69eeb49* var9;
+var9 = NULL;
+struct class_Token_35f69eeb49* retval;
+var2 = var1->memb_tokens;
+incref(var2);
+var3 = ctor_List_Token__da0ee88323();
+var4 = meth_List_Token__da0ee88323_equals(var2,var3);
+var5 = oomph_bool_not(var4);
+var6 = string1_self_hosted_parser_oomph_0113086932; string_incref(var6);
+var7 = 32LL;
+oomph_assert(var5,var6,var7);
+var8 = var1->memb_tokens;
+incref(var8);
+var9 = meth_List_Token__da0ee88323_last(var8);
+retval = var9; var9 = NULL;
+goto out;
+out: (void)0;
+decref((var9), dtor_Token_35f69eeb49);
+decref((var8), dtor_List_Token__da0ee88323);
+(void)0;
+string_decref(var6);
+(void)0;
+(void)0;
+decref((var3), dtor_List_Token__da0ee88323);
+decref((var2), dtor_List_Token__da0ee88323);
+return retval;
+}struct class_Token_35f69eeb49* meth_Parser_d28334dc68_get_token_by_type(struct class_Parser_d28334dc68* var1, struct class_Str var2){struct class_Token_35f69eeb49* var3;
+var3 = NULL;
+struct class_List_Token__da0ee88323* var4;
+var4 = NULL;
+struct class_Token_35f69eeb49* var5;
+var5 = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+bool var7;
+bool var8;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+bool var17;
+struct class_Str var18;
+var18.buf = NULL;
+int64_t var19;
+struct class_Token_35f69eeb49* retval;
+var3 = meth_Parser_d28334dc68_peek(var1);
+var4 = var1->memb_tokens;
+incref(var4);
+var5 = meth_List_Token__da0ee88323_pop(var4);
+var6 = var5->memb_type;
+string_incref(var6);
+var7 = meth_Str_equals(var6,var2);
+var8 = oomph_bool_not(var7);
+if (var8) goto label9;
+if (oomph_true) goto label10;
+label9: (void)0;
+var11 = string2_Wrong_token_type__expected__731a55259e; string_incref(var11);
+var12 = oomph_string_concat(var11,var2);
+var13 = string3___got__1540ce8445; string_incref(var13);
+var14 = oomph_string_concat(var12,var13);
+var15 = meth_Token_35f69eeb49_to_string(var5);
+var16 = oomph_string_concat(var14,var15);
+oomph_print(var16);
+var17 = oomph_false;
+var18 = string1_self_hosted_parser_oomph_0113086932; string_incref(var18);
+var19 = 40LL;
+oomph_assert(var17,var18,var19);
+label10: (void)0;
+retval = var5; var5 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+string_decref(var18);
+(void)0;
+string_decref(var16);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+(void)0;
+(void)0;
+string_decref(var6);
+decref((var5), dtor_Token_35f69eeb49);
+decref((var4), dtor_List_Token__da0ee88323);
+decref((var3), dtor_Token_35f69eeb49);
+return retval;
+}struct class_Token_35f69eeb49* meth_Parser_d28334dc68_get_token(struct class_Parser_d28334dc68* var1, struct class_Str var2, struct class_Str var3){struct class_Token_35f69eeb49* var4;
+var4 = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+bool var6;
+bool var7;
+struct class_Str var10;
+var10.buf = NULL;
+bool var11;
+struct class_Token_35f69eeb49* var14;
+var14 = NULL;
+struct class_Location_500c4434c9* var15;
+var15 = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Token_35f69eeb49* var17;
+var17 = NULL;
+struct class_Location_500c4434c9* var18;
+var18 = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Token_35f69eeb49* var23;
+var23 = NULL;
+struct class_Token_35f69eeb49* retval;
+var4 = meth_Parser_d28334dc68_peek(var1);
+var5 = var4->memb_value;
+string_incref(var5);
+var6 = meth_Str_equals(var5,var3);
+var7 = oomph_bool_not(var6);
+if (var7) goto label8;
+if (oomph_true) goto label9;
+label8: (void)0;
+var10 = string4___45fbfd7e60; string_incref(var10);
+var11 = meth_Str_equals(var3,var10);
+if (var11) goto label12;
+if (oomph_true) goto label13;
+label12: (void)0;
+var14 = meth_Parser_d28334dc68_peek(var1);
+var15 = var14->memb_location;
+incref(var15);
+var16 = string5_should_be_newline_2986cb6223; string_incref(var16);
+meth_Location_500c4434c9_error(var15,var16);
+label13: (void)0;
+var17 = meth_Parser_d28334dc68_peek(var1);
+var18 = var17->memb_location;
+incref(var18);
+var19 = string6_should_be___339c11cbe1; string_incref(var19);
+var20 = oomph_string_concat(var19,var3);
+var21 = string7___0446cef4ad; string_incref(var21);
+var22 = oomph_string_concat(var20,var21);
+meth_Location_500c4434c9_error(var18,var22);
+label9: (void)0;
+var23 = meth_Parser_d28334dc68_get_token_by_type(var1,var2);
+retval = var23; var23 = NULL;
+goto out;
+out: (void)0;
+decref((var23), dtor_Token_35f69eeb49);
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+string_decref(var19);
+decref((var18), dtor_Location_500c4434c9);
+decref((var17), dtor_Token_35f69eeb49);
+string_decref(var16);
+decref((var15), dtor_Location_500c4434c9);
+decref((var14), dtor_Token_35f69eeb49);
+(void)0;
+string_decref(var10);
+(void)0;
+(void)0;
+string_decref(var5);
+decref((var4), dtor_Token_35f69eeb49);
+return retval;
+}struct class_Import_6056d7e9c9* meth_Parser_d28334dc68_parse_import(struct class_Parser_d28334dc68* var1, struct class_Str var2, struct class_Str var3){struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Token_35f69eeb49* var6;
+var6 = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Token_35f69eeb49* var8;
+var8 = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Token_35f69eeb49* var12;
+var12 = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Token_35f69eeb49* var14;
+var14 = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Token_35f69eeb49* var18;
+var18 = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+bool var24;
+bool var25;
+struct class_Str var26;
+var26.buf = NULL;
+int64_t var27;
+struct class_Str var28;
+var28.buf = NULL;
+bool var29;
+bool var30;
+struct class_Str var31;
+var31.buf = NULL;
+int64_t var32;
+struct class_Str var33;
+var33.buf = NULL;
+bool var34;
+bool var35;
+struct class_Str var36;
+var36.buf = NULL;
+int64_t var37;
+struct class_Str var38;
+var38.buf = NULL;
+bool var39;
+bool var40;
+struct class_Str var41;
+var41.buf = NULL;
+int64_t var42;
+struct class_Str var43;
+var43.buf = NULL;
+bool var44;
+struct class_Str var46;
+var46.buf = NULL;
+struct class_Str var47;
+var47.buf = NULL;
+struct class_Str var48;
+var48.buf = NULL;
+struct class_Str var49;
+var49.buf = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_Str var52;
+var52.buf = NULL;
+struct class_Str var53;
+var53.buf = NULL;
+struct class_Str var54;
+var54.buf = NULL;
+struct class_Str var55;
+var55.buf = NULL;
+struct class_Location_500c4434c9* var56;
+var56 = NULL;
+struct class_Import_6056d7e9c9* var57;
+var57 = NULL;
+struct class_Import_6056d7e9c9* retval;
+var4 = string8_keyword_ab52a28662; string_incref(var4);
+var5 = string9_import_a688f8b972; string_incref(var5);
+var6 = meth_Parser_d28334dc68_get_token(var1,var4,var5);
+var7 = string10_oneline_string_8354f3c980; string_incref(var7);
+var8 = meth_Parser_d28334dc68_get_token_by_type(var1,var7);
+var9 = var8->memb_value;
+string_incref(var9);
+var10 = string8_keyword_ab52a28662; string_incref(var10);
+var11 = string11_as_4913bd3281; string_incref(var11);
+var12 = meth_Parser_d28334dc68_get_token(var1,var10,var11);
+var13 = string12_id_5bfb53972f; string_incref(var13);
+var14 = meth_Parser_d28334dc68_get_token_by_type(var1,var13);
+var15 = var14->memb_value;
+string_incref(var15);
+var16 = string13_op_2d685dde34; string_incref(var16);
+var17 = string4___45fbfd7e60; string_incref(var17);
+var18 = meth_Parser_d28334dc68_get_token(var1,var16,var17);
+var19 = string14___0d4b18cc3d; string_incref(var19);
+var20 = meth_Str_remove_prefix(var9,var19);
+var21 = string14___0d4b18cc3d; string_incref(var21);
+var22 = meth_Str_remove_suffix(var20,var21);
+string_decref(var9);
+var9 = var22;
+var22.buf = NULL;
+var23 = string14___0d4b18cc3d; string_incref(var23);
+var24 = meth_Str___contains(var9,var23);
+var25 = oomph_bool_not(var24);
+var26 = string1_self_hosted_parser_oomph_0113086932; string_incref(var26);
+var27 = 58LL;
+oomph_assert(var25,var26,var27);
+var28 = string15___052dc79f90; string_incref(var28);
+var29 = meth_Str___contains(var9,var28);
+var30 = oomph_bool_not(var29);
+var31 = string1_self_hosted_parser_oomph_0113086932; string_incref(var31);
+var32 = 59LL;
+oomph_assert(var30,var31,var32);
+var33 = string16___ecd2ce37b3; string_incref(var33);
+var34 = meth_Str___contains(var9,var33);
+var35 = oomph_bool_not(var34);
+var36 = string1_self_hosted_parser_oomph_0113086932; string_incref(var36);
+var37 = 60LL;
+oomph_assert(var35,var36,var37);
+var38 = string17___842f93bc72; string_incref(var38);
+var39 = meth_Str___contains(var9,var38);
+var40 = oomph_bool_not(var39);
+var41 = string1_self_hosted_parser_oomph_0113086932; string_incref(var41);
+var42 = 61LL;
+oomph_assert(var40,var41,var42);
+var43 = string18__stdlib___d6f7664d08; string_incref(var43);
+var44 = meth_Str_starts_with(var9,var43);
+if (var44) goto label45;
+var46 = parser_6c64cd293c_path_parent(var2);
+var47 = string19___d27c7b3f3c; string_incref(var47);
+var48 = oomph_string_concat(var46,var47);
+var49 = oomph_string_concat(var48,var9);
+var50 = var49;
+var49.buf = NULL;
+if (oomph_true) goto label51;
+label45: (void)0;
+var52 = string19___d27c7b3f3c; string_incref(var52);
+var53 = oomph_string_concat(var3,var52);
+var54 = string18__stdlib___d6f7664d08; string_incref(var54);
+var55 = meth_Str_remove_prefix(var9,var54);
+var50 = oomph_string_concat(var53,var55);
+label51: (void)0;
+var56 = var6->memb_location;
+incref(var56);
+var57 = ctor_Import_6056d7e9c9(var56,var50,var15);
+retval = var57; var57 = NULL;
+goto out;
+out: (void)0;
+decref((var57), dtor_Import_6056d7e9c9);
+decref((var56), dtor_Location_500c4434c9);
+string_decref(var55);
+string_decref(var54);
+string_decref(var53);
+string_decref(var52);
+string_decref(var50);
+string_decref(var49);
+string_decref(var48);
+string_decref(var47);
+string_decref(var46);
+(void)0;
+string_decref(var43);
+(void)0;
+string_decref(var41);
+(void)0;
+(void)0;
+string_decref(var38);
+(void)0;
+string_decref(var36);
+(void)0;
+(void)0;
+string_decref(var33);
+(void)0;
+string_decref(var31);
+(void)0;
+(void)0;
+string_decref(var28);
+(void)0;
+string_decref(var26);
+(void)0;
+(void)0;
+string_decref(var23);
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+string_decref(var19);
+decref((var18), dtor_Token_35f69eeb49);
+string_decref(var17);
+string_decref(var16);
+string_decref(var15);
+decref((var14), dtor_Token_35f69eeb49);
+string_decref(var13);
+decref((var12), dtor_Token_35f69eeb49);
+string_decref(var11);
+string_decref(var10);
+string_decref(var9);
+decref((var8), dtor_Token_35f69eeb49);
+string_decref(var7);
+decref((var6), dtor_Token_35f69eeb49);
+string_decref(var5);
+string_decref(var4);
+return retval;
+}struct class_List_Expression__d162784c9e* meth_Parser_d28334dc68_parse_commasep_expression_in_parens(struct class_Parser_d28334dc68* var1, struct class_Str var2, struct class_Str var3){struct class_Str var4;
+var4.buf = NULL;
+struct class_Token_35f69eeb49* var5;
+var5 = NULL;
+struct class_List_Expression__d162784c9e* var6;
+var6 = NULL;
+struct class_Token_35f69eeb49* var7;
+var7 = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+bool var9;
+bool var10;
+char var13;
+struct class__null___Str__5eca9cec4f var14;
+var14.membernum = -1;
+struct class_Expression_35f2052bf4 var15;
+var15.membernum = -1;
+struct class_Token_35f69eeb49* var17;
+var17 = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+bool var20;
+bool var21;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Token_35f69eeb49* var25;
+var25 = NULL;
+struct class_Token_35f69eeb49* var26;
+var26 = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+bool var28;
+char var31;
+struct class_Expression_35f2052bf4 var32;
+var32.membernum = -1;
+struct class__null___Str__5eca9cec4f var33;
+var33.membernum = -1;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_Token_35f69eeb49* var35;
+var35 = NULL;
+struct class_List_Expression__d162784c9e* retval;
+var4 = string13_op_2d685dde34; string_incref(var4);
+var5 = meth_Parser_d28334dc68_get_token(var1,var4,var2);
+var6 = ctor_List_Expression__d162784c9e();
+var7 = meth_Parser_d28334dc68_peek(var1);
+var8 = string13_op_2d685dde34; string_incref(var8);
+var9 = meth_Token_35f69eeb49_matches(var7,var8,var3);
+var10 = oomph_bool_not(var9);
+if (var10) goto label11;
+if (oomph_true) goto label12;
+label11: (void)0;
+var13 = oomph_null;
+var14 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var13 }, .membernum = 0 };
+var15 = meth_Parser_d28334dc68_parse_expression(var1,var14);
+meth_List_Expression__d162784c9e_push(var6,var15);
+label16: (void)0;
+decref((var17), dtor_Token_35f69eeb49);
+var17 = NULL;
+var17 = meth_Parser_d28334dc68_peek(var1);
+string_decref(var18);
+var18.buf = NULL;
+var18 = string13_op_2d685dde34; string_incref(var18);
+string_decref(var19);
+var19.buf = NULL;
+var19 = string20___d56680faa2; string_incref(var19);
+var20 = meth_Token_35f69eeb49_matches(var17,var18,var19);
+var21 = oomph_bool_not(var20);
+if (var21) goto label22;
+string_decref(var23);
+var23.buf = NULL;
+var23 = string13_op_2d685dde34; string_incref(var23);
+string_decref(var24);
+var24.buf = NULL;
+var24 = string20___d56680faa2; string_incref(var24);
+decref((var25), dtor_Token_35f69eeb49);
+var25 = NULL;
+var25 = meth_Parser_d28334dc68_get_token(var1,var23,var24);
+decref((var26), dtor_Token_35f69eeb49);
+var26 = NULL;
+var26 = meth_Parser_d28334dc68_peek(var1);
+string_decref(var27);
+var27.buf = NULL;
+var27 = string13_op_2d685dde34; string_incref(var27);
+var28 = meth_Token_35f69eeb49_matches(var26,var27,var3);
+if (var28) goto label29;
+if (oomph_true) goto label30;
+label29: (void)0;
+if (oomph_true) goto label22;
+label30: (void)0;
+var31 = oomph_null;
+decref_Expression_35f2052bf4(var32);
+var32.membernum = -1;
+decref__null___Str__5eca9cec4f(var33);
+var33.membernum = -1;
+var33 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var31 }, .membernum = 0 };
+var32 = meth_Parser_d28334dc68_parse_expression(var1,var33);
+meth_List_Expression__d162784c9e_push(var6,var32);
+if (oomph_true) goto label16;
+label22: (void)0;
+label12: (void)0;
+var34 = string13_op_2d685dde34; string_incref(var34);
+var35 = meth_Parser_d28334dc68_get_token(var1,var34,var3);
+retval = var6; var6 = NULL;
+goto out;
+out: (void)0;
+decref((var35), dtor_Token_35f69eeb49);
+string_decref(var34);
+decref__null___Str__5eca9cec4f(var33);
+decref_Expression_35f2052bf4(var32);
+(void)0;
+(void)0;
+string_decref(var27);
+decref((var26), dtor_Token_35f69eeb49);
+decref((var25), dtor_Token_35f69eeb49);
+string_decref(var24);
+string_decref(var23);
+(void)0;
+(void)0;
+string_decref(var19);
+string_decref(var18);
+decref((var17), dtor_Token_35f69eeb49);
+decref_Expression_35f2052bf4(var15);
+decref__null___Str__5eca9cec4f(var14);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var8);
+decref((var7), dtor_Token_35f69eeb49);
+decref((var6), dtor_List_Expression__d162784c9e);
+decref((var5), dtor_Token_35f69eeb49);
+string_decref(var4);
+return retval;
+}struct class_List_TypeAndName__74be4dae93* meth_Parser_d28334dc68_parse_commasep_types_and_names_in_parens(struct class_Parser_d28334dc68* var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Token_35f69eeb49* var4;
+var4 = NULL;
+struct class_List_TypeAndName__74be4dae93* var5;
+var5 = NULL;
+struct class_Token_35f69eeb49* var6;
+var6 = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+bool var9;
+bool var10;
+struct class_TypeAndName_fec99b5f94* var13;
+var13 = NULL;
+struct class_Token_35f69eeb49* var15;
+var15 = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+bool var18;
+bool var19;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Token_35f69eeb49* var23;
+var23 = NULL;
+struct class_Token_35f69eeb49* var24;
+var24 = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+bool var27;
+struct class_TypeAndName_fec99b5f94* var30;
+var30 = NULL;
+struct class_Str var31;
+var31.buf = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_Token_35f69eeb49* var33;
+var33 = NULL;
+struct class_List_TypeAndName__74be4dae93* retval;
+var2 = string13_op_2d685dde34; string_incref(var2);
+var3 = string21___f5039684f7; string_incref(var3);
+var4 = meth_Parser_d28334dc68_get_token(var1,var2,var3);
+var5 = ctor_List_TypeAndName__74be4dae93();
+var6 = meth_Parser_d28334dc68_peek(var1);
+var7 = string13_op_2d685dde34; string_incref(var7);
+var8 = string22___6ec62f9ee6; string_incref(var8);
+var9 = meth_Token_35f69eeb49_matches(var6,var7,var8);
+var10 = oomph_bool_not(var9);
+if (var10) goto label11;
+if (oomph_true) goto label12;
+label11: (void)0;
+var13 = meth_Parser_d28334dc68_parse_type_and_name(var1);
+meth_List_TypeAndName__74be4dae93_push(var5,var13);
+label14: (void)0;
+decref((var15), dtor_Token_35f69eeb49);
+var15 = NULL;
+var15 = meth_Parser_d28334dc68_peek(var1);
+string_decref(var16);
+var16.buf = NULL;
+var16 = string13_op_2d685dde34; string_incref(var16);
+string_decref(var17);
+var17.buf = NULL;
+var17 = string20___d56680faa2; string_incref(var17);
+var18 = meth_Token_35f69eeb49_matches(var15,var16,var17);
+var19 = oomph_bool_not(var18);
+if (var19) goto label20;
+string_decref(var21);
+var21.buf = NULL;
+var21 = string13_op_2d685dde34; string_incref(var21);
+string_decref(var22);
+var22.buf = NULL;
+var22 = string20___d56680faa2; string_incref(var22);
+decref((var23), dtor_Token_35f69eeb49);
+var23 = NULL;
+var23 = meth_Parser_d28334dc68_get_token(var1,var21,var22);
+decref((var24), dtor_Token_35f69eeb49);
+var24 = NULL;
+var24 = meth_Parser_d28334dc68_peek(var1);
+string_decref(var25);
+var25.buf = NULL;
+var25 = string13_op_2d685dde34; string_incref(var25);
+string_decref(var26);
+var26.buf = NULL;
+var26 = string22___6ec62f9ee6; string_incref(var26);
+var27 = meth_Token_35f69eeb49_matches(var24,var25,var26);
+if (var27) goto label28;
+if (oomph_true) goto label29;
+label28: (void)0;
+if (oomph_true) goto label20;
+label29: (void)0;
+decref((var30), dtor_TypeAndName_fec99b5f94);
+var30 = NULL;
+var30 = meth_Parser_d28334dc68_parse_type_and_name(var1);
+meth_List_TypeAndName__74be4dae93_push(var5,var30);
+if (oomph_true) goto label14;
+label20: (void)0;
+label12: (void)0;
+var31 = string13_op_2d685dde34; string_incref(var31);
+var32 = string22___6ec62f9ee6; string_incref(var32);
+var33 = meth_Parser_d28334dc68_get_token(var1,var31,var32);
+retval = var5; var5 = NULL;
+goto out;
+out: (void)0;
+decref((var33), dtor_Token_35f69eeb49);
+string_decref(var32);
+string_decref(var31);
+decref((var30), dtor_TypeAndName_fec99b5f94);
+(void)0;
+string_decref(var26);
+string_decref(var25);
+decref((var24), dtor_Token_35f69eeb49);
+decref((var23), dtor_Token_35f69eeb49);
+string_decref(var22);
+string_decref(var21);
+(void)0;
+(void)0;
+string_decref(var17);
+string_decref(var16);
+decref((var15), dtor_Token_35f69eeb49);
+decref((var13), dtor_TypeAndName_fec99b5f94);
+(void)0;
+(void)0;
+string_decref(var8);
+string_decref(var7);
+decref((var6), dtor_Token_35f69eeb49);
+decref((var5), dtor_List_TypeAndName__74be4dae93);
+decref((var4), dtor_Token_35f69eeb49);
+string_decref(var3);
+string_decref(var2);
+return retval;
+}struct class_List_Statement__5d7503c104* meth_Parser_d28334dc68_parse_block_of_statements(struct class_Parser_d28334dc68* var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Token_35f69eeb49* var4;
+var4 = NULL;
+struct class_List_Statement__5d7503c104* var5;
+var5 = NULL;
+struct class_List_Token__da0ee88323* var7;
+var7 = NULL;
+struct class_List_Token__da0ee88323* var8;
+var8 = NULL;
+bool var9;
+bool var10;
+bool var12;
+struct class_Token_35f69eeb49* var14;
+var14 = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+bool var17;
+bool var18;
+bool var19;
+struct class_List_Statement__5d7503c104* var21;
+var21 = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Token_35f69eeb49* var24;
+var24 = NULL;
+struct class_List_Statement__5d7503c104* retval;
+var2 = string23_begin_block_cd4b098ac0; string_incref(var2);
+var3 = string24___dc60150654; string_incref(var3);
+var4 = meth_Parser_d28334dc68_get_token(var1,var2,var3);
+var5 = ctor_List_Statement__5d7503c104();
+label6: (void)0;
+decref((var7), dtor_List_Token__da0ee88323);
+var7 = NULL;
+var7 = var1->memb_tokens;
+incref(var7);
+decref((var8), dtor_List_Token__da0ee88323);
+var8 = NULL;
+var8 = ctor_List_Token__da0ee88323();
+var9 = meth_List_Token__da0ee88323_equals(var7,var8);
+var10 = oomph_bool_not(var9);
+if (var10) goto label11;
+var12 = oomph_false;
+if (oomph_true) goto label13;
+label11: (void)0;
+decref((var14), dtor_Token_35f69eeb49);
+var14 = NULL;
+var14 = meth_Parser_d28334dc68_peek(var1);
+string_decref(var15);
+var15.buf = NULL;
+var15 = string25_end_block_550305c23c; string_incref(var15);
+string_decref(var16);
+var16.buf = NULL;
+var16 = string26__6e998e6136; string_incref(var16);
+var17 = meth_Token_35f69eeb49_matches(var14,var15,var16);
+var18 = oomph_bool_not(var17);
+var12 = var18;
+label13: (void)0;
+var19 = oomph_bool_not(var12);
+if (var19) goto label20;
+decref((var21), dtor_List_Statement__5d7503c104);
+var21 = NULL;
+var21 = meth_Parser_d28334dc68_parse_statement(var1);
+meth_List_Statement__5d7503c104_push_all(var5,var21);
+if (oomph_true) goto label6;
+label20: (void)0;
+var22 = string25_end_block_550305c23c; string_incref(var22);
+var23 = string26__6e998e6136; string_incref(var23);
+var24 = meth_Parser_d28334dc68_get_token(var1,var22,var23);
+retval = var5; var5 = NULL;
+goto out;
+out: (void)0;
+decref((var24), dtor_Token_35f69eeb49);
+string_decref(var23);
+string_decref(var22);
+decref((var21), dtor_List_Statement__5d7503c104);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var16);
+string_decref(var15);
+decref((var14), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+decref((var8), dtor_List_Token__da0ee88323);
+decref((var7), dtor_List_Token__da0ee88323);
+decref((var5), dtor_List_Statement__5d7503c104);
+decref((var4), dtor_Token_35f69eeb49);
+string_decref(var3);
+string_decref(var2);
+return retval;
+}struct class_List_FuncOrMethodDef__af5379b09e* meth_Parser_d28334dc68_parse_block_of_methods(struct class_Parser_d28334dc68* var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Token_35f69eeb49* var4;
+var4 = NULL;
+struct class_List_FuncOrMethodDef__af5379b09e* var5;
+var5 = NULL;
+struct class_List_Token__da0ee88323* var7;
+var7 = NULL;
+struct class_List_Token__da0ee88323* var8;
+var8 = NULL;
+bool var9;
+bool var10;
+bool var12;
+struct class_Token_35f69eeb49* var14;
+var14 = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+bool var17;
+bool var18;
+bool var19;
+struct class_FuncOrMethodDef_533c7b75ab* var21;
+var21 = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Token_35f69eeb49* var24;
+var24 = NULL;
+struct class_List_FuncOrMethodDef__af5379b09e* retval;
+var2 = string23_begin_block_cd4b098ac0; string_incref(var2);
+var3 = string24___dc60150654; string_incref(var3);
+var4 = meth_Parser_d28334dc68_get_token(var1,var2,var3);
+var5 = ctor_List_FuncOrMethodDef__af5379b09e();
+label6: (void)0;
+decref((var7), dtor_List_Token__da0ee88323);
+var7 = NULL;
+var7 = var1->memb_tokens;
+incref(var7);
+decref((var8), dtor_List_Token__da0ee88323);
+var8 = NULL;
+var8 = ctor_List_Token__da0ee88323();
+var9 = meth_List_Token__da0ee88323_equals(var7,var8);
+var10 = oomph_bool_not(var9);
+if (var10) goto label11;
+var12 = oomph_false;
+if (oomph_true) goto label13;
+label11: (void)0;
+decref((var14), dtor_Token_35f69eeb49);
+var14 = NULL;
+var14 = meth_Parser_d28334dc68_peek(var1);
+string_decref(var15);
+var15.buf = NULL;
+var15 = string25_end_block_550305c23c; string_incref(var15);
+string_decref(var16);
+var16.buf = NULL;
+var16 = string26__6e998e6136; string_incref(var16);
+var17 = meth_Token_35f69eeb49_matches(var14,var15,var16);
+var18 = oomph_bool_not(var17);
+var12 = var18;
+label13: (void)0;
+var19 = oomph_bool_not(var12);
+if (var19) goto label20;
+decref((var21), dtor_FuncOrMethodDef_533c7b75ab);
+var21 = NULL;
+var21 = meth_Parser_d28334dc68_parse_method(var1);
+meth_List_FuncOrMethodDef__af5379b09e_push(var5,var21);
+if (oomph_true) goto label6;
+label20: (void)0;
+var22 = string25_end_block_550305c23c; string_incref(var22);
+var23 = string26__6e998e6136; string_incref(var23);
+var24 = meth_Parser_d28334dc68_get_token(var1,var22,var23);
+retval = var5; var5 = NULL;
+goto out;
+out: (void)0;
+decref((var24), dtor_Token_35f69eeb49);
+string_decref(var23);
+string_decref(var22);
+decref((var21), dtor_FuncOrMethodDef_533c7b75ab);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var16);
+string_decref(var15);
+decref((var14), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+decref((var8), dtor_List_Token__da0ee88323);
+decref((var7), dtor_List_Token__da0ee88323);
+decref((var5), dtor_List_FuncOrMethodDef__af5379b09e);
+decref((var4), dtor_Token_35f69eeb49);
+string_decref(var3);
+string_decref(var2);
+return retval;
+}struct class_List_Case__f5a6b4b2ec* meth_Parser_d28334dc68_parse_block_of_cases(struct class_Parser_d28334dc68* var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Token_35f69eeb49* var4;
+var4 = NULL;
+struct class_List_Case__f5a6b4b2ec* var5;
+var5 = NULL;
+struct class_List_Token__da0ee88323* var7;
+var7 = NULL;
+struct class_List_Token__da0ee88323* var8;
+var8 = NULL;
+bool var9;
+bool var10;
+bool var12;
+struct class_Token_35f69eeb49* var14;
+var14 = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+bool var17;
+bool var18;
+bool var19;
+struct class_Case_458b8eeee1* var21;
+var21 = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Token_35f69eeb49* var24;
+var24 = NULL;
+struct class_List_Case__f5a6b4b2ec* retval;
+var2 = string23_begin_block_cd4b098ac0; string_incref(var2);
+var3 = string24___dc60150654; string_incref(var3);
+var4 = meth_Parser_d28334dc68_get_token(var1,var2,var3);
+var5 = ctor_List_Case__f5a6b4b2ec();
+label6: (void)0;
+decref((var7), dtor_List_Token__da0ee88323);
+var7 = NULL;
+var7 = var1->memb_tokens;
+incref(var7);
+decref((var8), dtor_List_Token__da0ee88323);
+var8 = NULL;
+var8 = ctor_List_Token__da0ee88323();
+var9 = meth_List_Token__da0ee88323_equals(var7,var8);
+var10 = oomph_bool_not(var9);
+if (var10) goto label11;
+var12 = oomph_false;
+if (oomph_true) goto label13;
+label11: (void)0;
+decref((var14), dtor_Token_35f69eeb49);
+var14 = NULL;
+var14 = meth_Parser_d28334dc68_peek(var1);
+string_decref(var15);
+var15.buf = NULL;
+var15 = string25_end_block_550305c23c; string_incref(var15);
+string_decref(var16);
+var16.buf = NULL;
+var16 = string26__6e998e6136; string_incref(var16);
+var17 = meth_Token_35f69eeb49_matches(var14,var15,var16);
+var18 = oomph_bool_not(var17);
+var12 = var18;
+label13: (void)0;
+var19 = oomph_bool_not(var12);
+if (var19) goto label20;
+decref((var21), dtor_Case_458b8eeee1);
+var21 = NULL;
+var21 = meth_Parser_d28334dc68_parse_case(var1);
+meth_List_Case__f5a6b4b2ec_push(var5,var21);
+if (oomph_true) goto label6;
+label20: (void)0;
+var22 = string25_end_block_550305c23c; string_incref(var22);
+var23 = string26__6e998e6136; string_incref(var23);
+var24 = meth_Parser_d28334dc68_get_token(var1,var22,var23);
+retval = var5; var5 = NULL;
+goto out;
+out: (void)0;
+decref((var24), dtor_Token_35f69eeb49);
+string_decref(var23);
+string_decref(var22);
+decref((var21), dtor_Case_458b8eeee1);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var16);
+string_decref(var15);
+decref((var14), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+decref((var8), dtor_List_Token__da0ee88323);
+decref((var7), dtor_List_Token__da0ee88323);
+decref((var5), dtor_List_Case__f5a6b4b2ec);
+decref((var4), dtor_Token_35f69eeb49);
+string_decref(var3);
+string_decref(var2);
+return retval;
+}struct class_Expression_35f2052bf4 meth_Parser_d28334dc68_tokenize_and_parse_expression(struct class_Parser_d28334dc68* var1, struct class_Str var2, struct class_Location_500c4434c9* var3){struct class_Str var4;
+var4.buf = NULL;
+int64_t var5;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_List_Token__da0ee88323* var7;
+var7 = NULL;
+struct class_List_Token__da0ee88323* var8;
+var8 = NULL;
+struct class_Parser_d28334dc68* var9;
+var9 = NULL;
+char var10;
+struct class__null___Str__5eca9cec4f var11;
+var11.membernum = -1;
+struct class_Expression_35f2052bf4 var12;
+var12.membernum = -1;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Token_35f69eeb49* var15;
+var15 = NULL;
+struct class_List_Token__da0ee88323* var16;
+var16 = NULL;
+struct class_List_Token__da0ee88323* var17;
+var17 = NULL;
+bool var18;
+struct class_Str var19;
+var19.buf = NULL;
+int64_t var20;
+struct class_Expression_35f2052bf4 retval;
+var4 = var3->memb_path;
+string_incref(var4);
+var5 = var3->memb_lineno;
+var6 = var3->memb_line_prefix;
+string_incref(var6);
+var7 = tokenizer_431c4db6a8_tokenize(var2,var4,var5,var6);
+var8 = meth_List_Token__da0ee88323_reversed(var7);
+var9 = ctor_Parser_d28334dc68(var8);
+var10 = oomph_null;
+var11 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var10 }, .membernum = 0 };
+var12 = meth_Parser_d28334dc68_parse_expression(var9,var11);
+var13 = string13_op_2d685dde34; string_incref(var13);
+var14 = string4___45fbfd7e60; string_incref(var14);
+var15 = meth_Parser_d28334dc68_get_token(var9,var13,var14);
+var16 = var9->memb_tokens;
+incref(var16);
+var17 = ctor_List_Token__da0ee88323();
+var18 = meth_List_Token__da0ee88323_equals(var16,var17);
+var19 = string1_self_hosted_parser_oomph_0113086932; string_incref(var19);
+var20 = 128LL;
+oomph_assert(var18,var19,var20);
+retval = var12; var12.membernum = -1;
+goto out;
+out: (void)0;
+(void)0;
+string_decref(var19);
+(void)0;
+decref((var17), dtor_List_Token__da0ee88323);
+decref((var16), dtor_List_Token__da0ee88323);
+decref((var15), dtor_Token_35f69eeb49);
+string_decref(var14);
+string_decref(var13);
+decref_Expression_35f2052bf4(var12);
+decref__null___Str__5eca9cec4f(var11);
+(void)0;
+decref((var9), dtor_Parser_d28334dc68);
+decref((var8), dtor_List_Token__da0ee88323);
+decref((var7), dtor_List_Token__da0ee88323);
+string_decref(var6);
+(void)0;
+string_decref(var4);
+return retval;
+}struct class_Expression_35f2052bf4 meth_Parser_d28334dc68_do_string_contents(struct class_Parser_d28334dc68* var1, struct class_Location_500c4434c9* var2){struct class_List_Expression__d162784c9e* var3;
+var3 = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_List_Str__43b70c06cb* var6;
+var6 = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_List_Str__43b70c06cb* var9;
+var9 = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_List_Str__43b70c06cb* var12;
+var12 = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_List_Str__43b70c06cb* var15;
+var15 = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_List_Str__43b70c06cb* var18;
+var18 = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_List_Str__43b70c06cb* var21;
+var21 = NULL;
+struct class_List_List_Str___637f5f7ec1* var22;
+var22 = NULL;
+struct class_Location_500c4434c9* var23;
+var23 = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+bool var27;
+bool var28;
+bool var29;
+struct class_Str var31;
+var31.buf = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+bool var33;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+bool var37;
+struct class_Str var39;
+var39.buf = NULL;
+struct class_Str var40;
+var40.buf = NULL;
+struct class_List_Str__43b70c06cb* var41;
+var41 = NULL;
+struct class_Str var42;
+var42.buf = NULL;
+struct class_Location_500c4434c9* var43;
+var43 = NULL;
+struct class_Str var45;
+var45.buf = NULL;
+struct class_Str var46;
+var46.buf = NULL;
+bool var47;
+struct class_Str var48;
+var48.buf = NULL;
+int64_t var49;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+struct class_List_Str__43b70c06cb* var52;
+var52 = NULL;
+struct class_Str var53;
+var53.buf = NULL;
+struct class_Str var54;
+var54.buf = NULL;
+struct class_Str var55;
+var55.buf = NULL;
+struct class_Str var56;
+var56.buf = NULL;
+int64_t var57;
+struct class_Str var58;
+var58.buf = NULL;
+struct class_Str var59;
+var59.buf = NULL;
+struct class_Str var60;
+var60.buf = NULL;
+struct class_Location_500c4434c9* var61;
+var61 = NULL;
+struct class_Str var62;
+var62.buf = NULL;
+bool var63;
+bool var64;
+struct class_Str var65;
+var65.buf = NULL;
+int64_t var66;
+struct class_Str var67;
+var67.buf = NULL;
+bool var68;
+bool var69;
+struct class_Str var70;
+var70.buf = NULL;
+int64_t var71;
+struct class_Str var72;
+var72.buf = NULL;
+bool var73;
+bool var74;
+struct class_Str var75;
+var75.buf = NULL;
+int64_t var76;
+struct class_Str var77;
+var77.buf = NULL;
+bool var78;
+bool var79;
+struct class_Str var80;
+var80.buf = NULL;
+int64_t var81;
+struct class_Expression_35f2052bf4 var82;
+var82.membernum = -1;
+struct class_Str var83;
+var83.buf = NULL;
+struct class_Location_500c4434c9* var84;
+var84 = NULL;
+struct class_Location_500c4434c9* var85;
+var85 = NULL;
+struct class_Str var86;
+var86.buf = NULL;
+struct class_Location_500c4434c9* var87;
+var87 = NULL;
+bool var89;
+int64_t var90;
+struct class_List_Str__43b70c06cb* var92;
+var92 = NULL;
+struct class_Str var94;
+var94.buf = NULL;
+struct class_Str var95;
+var95.buf = NULL;
+bool var96;
+struct class_Str var99;
+var99.buf = NULL;
+struct class_Str var100;
+var100.buf = NULL;
+struct class_Location_500c4434c9* var101;
+var101 = NULL;
+bool var102;
+struct class_Str var103;
+var103.buf = NULL;
+int64_t var104;
+struct class_List_Expression__d162784c9e* var105;
+var105 = NULL;
+bool var106;
+struct class_Str var109;
+var109.buf = NULL;
+struct class_StringConstant_c2b1c10b4f* var110;
+var110 = NULL;
+struct class_Expression_35f2052bf4 var111;
+var111.membernum = -1;
+int64_t var112;
+int64_t var113;
+bool var114;
+struct class_Expression_35f2052bf4 var117;
+var117.membernum = -1;
+struct class_StringFormatJoin_bc28806767* var118;
+var118 = NULL;
+struct class_Expression_35f2052bf4 var119;
+var119.membernum = -1;
+struct class_Expression_35f2052bf4 retval;
+var3 = ctor_List_Expression__d162784c9e();
+var4 = string27__n_51401217a8; string_incref(var4);
+var5 = string4___45fbfd7e60; string_incref(var5);
+var6 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var6,var4);
+meth_List_Str__43b70c06cb_push(var6,var5);
+var7 = string28__t_9993414863; string_incref(var7);
+var8 = string29___9121d994e7; string_incref(var8);
+var9 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var9,var7);
+meth_List_Str__43b70c06cb_push(var9,var8);
+var10 = string30____6a28ac553b; string_incref(var10);
+var11 = string16___ecd2ce37b3; string_incref(var11);
+var12 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var12,var10);
+meth_List_Str__43b70c06cb_push(var12,var11);
+var13 = string31____02f9e7c396; string_incref(var13);
+var14 = string17___842f93bc72; string_incref(var14);
+var15 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var15,var13);
+meth_List_Str__43b70c06cb_push(var15,var14);
+var16 = string32____38f18abc4a; string_incref(var16);
+var17 = string14___0d4b18cc3d; string_incref(var17);
+var18 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var18,var16);
+meth_List_Str__43b70c06cb_push(var18,var17);
+var19 = string33____a253d5e00a; string_incref(var19);
+var20 = string15___052dc79f90; string_incref(var20);
+var21 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var21,var19);
+meth_List_Str__43b70c06cb_push(var21,var20);
+var22 = ctor_List_List_Str___637f5f7ec1();
+meth_List_List_Str___637f5f7ec1_push(var22,var6);
+meth_List_List_Str___637f5f7ec1_push(var22,var9);
+meth_List_List_Str___637f5f7ec1_push(var22,var12);
+meth_List_List_Str___637f5f7ec1_push(var22,var15);
+meth_List_List_Str___637f5f7ec1_push(var22,var18);
+meth_List_List_Str___637f5f7ec1_push(var22,var21);
+var23 = var2;
+incref(var23);
+label24: (void)0;
+string_decref(var25);
+var25.buf = NULL;
+var25 = var23->memb_code;
+string_incref(var25);
+string_decref(var26);
+var26.buf = NULL;
+var26 = string26__6e998e6136; string_incref(var26);
+var27 = meth_Str_equals(var25,var26);
+var28 = oomph_bool_not(var27);
+var29 = oomph_bool_not(var28);
+if (var29) goto label30;
+string_decref(var31);
+var31.buf = NULL;
+var31 = var23->memb_code;
+string_incref(var31);
+string_decref(var32);
+var32.buf = NULL;
+var32 = string15___052dc79f90; string_incref(var32);
+var33 = meth_Str_starts_with(var31,var32);
+if (var33) goto label34;
+string_decref(var35);
+var35.buf = NULL;
+var35 = var23->memb_code;
+string_incref(var35);
+string_decref(var36);
+var36.buf = NULL;
+var36 = string16___ecd2ce37b3; string_incref(var36);
+var37 = meth_Str_starts_with(var35,var36);
+if (var37) goto label38;
+string_decref(var39);
+var39.buf = NULL;
+var39 = var23->memb_code;
+string_incref(var39);
+string_decref(var40);
+var40.buf = NULL;
+var40 = string26__6e998e6136; string_incref(var40);
+decref((var41), dtor_List_Str__43b70c06cb);
+var41 = NULL;
+var41 = meth_Str_split(var39,var40);
+string_decref(var42);
+var42.buf = NULL;
+var42 = meth_List_Str__43b70c06cb_first(var41);
+parser_6c64cd293c_add_string(var3,var42,var2);
+var43 = meth_Location_500c4434c9_remove_prefix(var23,var42);
+decref((var23), dtor_Location_500c4434c9);
+var23 = var43;
+var43 = NULL;
+if (oomph_true) goto label44;
+label38: (void)0;
+string_decref(var45);
+var45.buf = NULL;
+var45 = string17___842f93bc72; string_incref(var45);
+string_decref(var46);
+var46.buf = NULL;
+var46 = var23->memb_code;
+string_incref(var46);
+var47 = meth_Str___contains(var46,var45);
+string_decref(var48);
+var48.buf = NULL;
+var48 = string1_self_hosted_parser_oomph_0113086932; string_incref(var48);
+var49 = 156LL;
+oomph_assert(var47,var48,var49);
+string_decref(var50);
+var50.buf = NULL;
+var50 = var23->memb_code;
+string_incref(var50);
+string_decref(var51);
+var51.buf = NULL;
+var51 = string17___842f93bc72; string_incref(var51);
+decref((var52), dtor_List_Str__43b70c06cb);
+var52 = NULL;
+var52 = meth_Str_split(var50,var51);
+string_decref(var53);
+var53.buf = NULL;
+var53 = meth_List_Str__43b70c06cb_first(var52);
+string_decref(var54);
+var54.buf = NULL;
+var54 = string16___ecd2ce37b3; string_incref(var54);
+string_decref(var55);
+var55.buf = NULL;
+var55 = meth_Str_remove_prefix(var53,var54);
+string_decref(var56);
+var56.buf = NULL;
+var56 = var23->memb_path;
+string_incref(var56);
+var57 = var23->memb_lineno;
+string_decref(var58);
+var58.buf = NULL;
+var58 = var23->memb_line_prefix;
+string_incref(var58);
+string_decref(var59);
+var59.buf = NULL;
+var59 = string16___ecd2ce37b3; string_incref(var59);
+string_decref(var60);
+var60.buf = NULL;
+var60 = oomph_string_concat(var58,var59);
+decref((var61), dtor_Location_500c4434c9);
+var61 = NULL;
+var61 = ctor_Location_500c4434c9(var56,var57,var60,var55);
+string_decref(var62);
+var62.buf = NULL;
+var62 = string4___45fbfd7e60; string_incref(var62);
+var63 = meth_Str___contains(var55,var62);
+var64 = oomph_bool_not(var63);
+string_decref(var65);
+var65.buf = NULL;
+var65 = string1_self_hosted_parser_oomph_0113086932; string_incref(var65);
+var66 = 161LL;
+oomph_assert(var64,var65,var66);
+string_decref(var67);
+var67.buf = NULL;
+var67 = string16___ecd2ce37b3; string_incref(var67);
+var68 = meth_Str___contains(var55,var67);
+var69 = oomph_bool_not(var68);
+string_decref(var70);
+var70.buf = NULL;
+var70 = string1_self_hosted_parser_oomph_0113086932; string_incref(var70);
+var71 = 162LL;
+oomph_assert(var69,var70,var71);
+string_decref(var72);
+var72.buf = NULL;
+var72 = string17___842f93bc72; string_incref(var72);
+var73 = meth_Str___contains(var55,var72);
+var74 = oomph_bool_not(var73);
+string_decref(var75);
+var75.buf = NULL;
+var75 = string1_self_hosted_parser_oomph_0113086932; string_incref(var75);
+var76 = 163LL;
+oomph_assert(var74,var75,var76);
+string_decref(var77);
+var77.buf = NULL;
+var77 = string15___052dc79f90; string_incref(var77);
+var78 = meth_Str___contains(var55,var77);
+var79 = oomph_bool_not(var78);
+string_decref(var80);
+var80.buf = NULL;
+var80 = string1_self_hosted_parser_oomph_0113086932; string_incref(var80);
+var81 = 164LL;
+oomph_assert(var79,var80,var81);
+decref_Expression_35f2052bf4(var82);
+var82.membernum = -1;
+var82 = meth_Parser_d28334dc68_tokenize_and_parse_expression(var1,var55,var61);
+meth_List_Expression__d162784c9e_push(var3,var82);
+string_decref(var83);
+var83.buf = NULL;
+var83 = string16___ecd2ce37b3; string_incref(var83);
+decref((var84), dtor_Location_500c4434c9);
+var84 = NULL;
+var84 = meth_Location_500c4434c9_remove_prefix(var23,var83);
+decref((var85), dtor_Location_500c4434c9);
+var85 = NULL;
+var85 = meth_Location_500c4434c9_remove_prefix(var84,var55);
+string_decref(var86);
+var86.buf = NULL;
+var86 = string17___842f93bc72; string_incref(var86);
+var87 = meth_Location_500c4434c9_remove_prefix(var85,var86);
+decref((var23), dtor_Location_500c4434c9);
+var23 = var87;
+var87 = NULL;
+label44: (void)0;
+if (oomph_true) goto label88;
+label34: (void)0;
+var89 = oomph_false;
+var90 = 0LL;
+label91: (void)0;
+if (var90 >= var22->len) goto label93;
+decref((var92), dtor_List_Str__43b70c06cb); var92 = var22->data[var90++]; incref(var92);
+string_decref(var94);
+var94.buf = NULL;
+var94 = var23->memb_code;
+string_incref(var94);
+string_decref(var95);
+var95.buf = NULL;
+var95 = meth_List_Str__43b70c06cb_first(var92);
+var96 = meth_Str_starts_with(var94,var95);
+if (var96) goto label97;
+if (oomph_true) goto label98;
+label97: (void)0;
+string_decref(var99);
+var99.buf = NULL;
+var99 = meth_List_Str__43b70c06cb_last(var92);
+parser_6c64cd293c_add_string(var3,var99,var2);
+string_decref(var100);
+var100.buf = NULL;
+var100 = meth_List_Str__43b70c06cb_first(var92);
+var101 = meth_Location_500c4434c9_remove_prefix(var23,var100);
+decref((var23), dtor_Location_500c4434c9);
+var23 = var101;
+var101 = NULL;
+var102 = oomph_true;
+var89 = var102;
+if (oomph_true) goto label93;
+label98: (void)0;
+if (oomph_true) goto label91;
+label93: (void)0;
+string_decref(var103);
+var103.buf = NULL;
+var103 = string1_self_hosted_parser_oomph_0113086932; string_incref(var103);
+var104 = 154LL;
+oomph_assert(var89,var103,var104);
+label88: (void)0;
+if (oomph_true) goto label24;
+label30: (void)0;
+var105 = ctor_List_Expression__d162784c9e();
+var106 = meth_List_Expression__d162784c9e_equals(var3,var105);
+if (var106) goto label107;
+if (oomph_true) goto label108;
+label107: (void)0;
+var109 = string26__6e998e6136; string_incref(var109);
+var110 = ctor_StringConstant_c2b1c10b4f(var2,var109);
+var111 = (struct class_Expression_35f2052bf4){ .val = { .item11 = var110 }, .membernum = 11 };
+var110 = NULL;
+retval = var111; var111.membernum = -1;
+goto out;
+label108: (void)0;
+var112 = meth_List_Expression__d162784c9e_length(var3);
+var113 = 1LL;
+var114 = meth_Int_equals(var112,var113);
+if (var114) goto label115;
+if (oomph_true) goto label116;
+label115: (void)0;
+var117 = meth_List_Expression__d162784c9e_first(var3);
+retval = var117; var117.membernum = -1;
+goto out;
+label116: (void)0;
+var118 = ctor_StringFormatJoin_bc28806767(var2,var3);
+var119 = (struct class_Expression_35f2052bf4){ .val = { .item12 = var118 }, .membernum = 12 };
+var118 = NULL;
+retval = var119; var119.membernum = -1;
+goto out;
+out: (void)0;
+decref_Expression_35f2052bf4(var119);
+decref((var118), dtor_StringFormatJoin_bc28806767);
+decref_Expression_35f2052bf4(var117);
+(void)0;
+(void)0;
+(void)0;
+decref_Expression_35f2052bf4(var111);
+decref((var110), dtor_StringConstant_c2b1c10b4f);
+string_decref(var109);
+(void)0;
+decref((var105), dtor_List_Expression__d162784c9e);
+(void)0;
+string_decref(var103);
+(void)0;
+decref((var101), dtor_Location_500c4434c9);
+string_decref(var100);
+string_decref(var99);
+(void)0;
+string_decref(var95);
+string_decref(var94);
+decref((var92), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref((var87), dtor_Location_500c4434c9);
+string_decref(var86);
+decref((var85), dtor_Location_500c4434c9);
+decref((var84), dtor_Location_500c4434c9);
+string_decref(var83);
+decref_Expression_35f2052bf4(var82);
+(void)0;
+string_decref(var80);
+(void)0;
+(void)0;
+string_decref(var77);
+(void)0;
+string_decref(var75);
+(void)0;
+(void)0;
+string_decref(var72);
+(void)0;
+string_decref(var70);
+(void)0;
+(void)0;
+string_decref(var67);
+(void)0;
+string_decref(var65);
+(void)0;
+(void)0;
+string_decref(var62);
+decref((var61), dtor_Location_500c4434c9);
+string_decref(var60);
+string_decref(var59);
+string_decref(var58);
+(void)0;
+string_decref(var56);
+string_decref(var55);
+string_decref(var54);
+string_decref(var53);
+decref((var52), dtor_List_Str__43b70c06cb);
+string_decref(var51);
+string_decref(var50);
+(void)0;
+string_decref(var48);
+(void)0;
+string_decref(var46);
+string_decref(var45);
+decref((var43), dtor_Location_500c4434c9);
+string_decref(var42);
+decref((var41), dtor_List_Str__43b70c06cb);
+string_decref(var40);
+string_decref(var39);
+(void)0;
+string_decref(var36);
+string_decref(var35);
+(void)0;
+string_decref(var32);
+string_decref(var31);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var26);
+string_decref(var25);
+decref((var23), dtor_Location_500c4434c9);
+decref((var22), dtor_List_List_Str___637f5f7ec1);
+decref((var21), dtor_List_Str__43b70c06cb);
+string_decref(var20);
+string_decref(var19);
+decref((var18), dtor_List_Str__43b70c06cb);
+string_decref(var17);
+string_decref(var16);
+decref((var15), dtor_List_Str__43b70c06cb);
+string_decref(var14);
+string_decref(var13);
+decref((var12), dtor_List_Str__43b70c06cb);
+string_decref(var11);
+string_decref(var10);
+decref((var9), dtor_List_Str__43b70c06cb);
+string_decref(var8);
+string_decref(var7);
+decref((var6), dtor_List_Str__43b70c06cb);
+string_decref(var5);
+string_decref(var4);
+decref((var3), dtor_List_Expression__d162784c9e);
+return retval;
+}struct class_Expression_35f2052bf4 meth_Parser_d28334dc68_parse_simple_expression(struct class_Parser_d28334dc68* var1, struct class_Str var2){struct class_Token_35f69eeb49* var3;
+var3 = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+bool var6;
+struct class_Token_35f69eeb49* var8;
+var8 = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+bool var11;
+struct class_Token_35f69eeb49* var13;
+var13 = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+bool var16;
+struct class_Token_35f69eeb49* var18;
+var18 = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+bool var21;
+struct class_Token_35f69eeb49* var23;
+var23 = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+bool var26;
+struct class_Token_35f69eeb49* var28;
+var28 = NULL;
+struct class_Str var29;
+var29.buf = NULL;
+struct class_Str var30;
+var30.buf = NULL;
+bool var31;
+struct class_Token_35f69eeb49* var33;
+var33 = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_Str var35;
+var35.buf = NULL;
+bool var36;
+struct class_Token_35f69eeb49* var38;
+var38 = NULL;
+struct class_Str var39;
+var39.buf = NULL;
+struct class_Str var40;
+var40.buf = NULL;
+bool var41;
+struct class_Token_35f69eeb49* var43;
+var43 = NULL;
+struct class_Location_500c4434c9* var44;
+var44 = NULL;
+struct class_Str var46;
+var46.buf = NULL;
+struct class_Str var47;
+var47.buf = NULL;
+struct class_Token_35f69eeb49* var48;
+var48 = NULL;
+struct class_Token_35f69eeb49* var49;
+var49 = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+bool var52;
+struct class_Token_35f69eeb49* var54;
+var54 = NULL;
+struct class_Str var55;
+var55.buf = NULL;
+struct class_Str var56;
+var56.buf = NULL;
+bool var57;
+bool var58;
+struct class_Token_35f69eeb49* var61;
+var61 = NULL;
+struct class_Str var62;
+var62.buf = NULL;
+struct class_Str var63;
+var63.buf = NULL;
+bool var64;
+bool var65;
+struct class_List_Token__da0ee88323* var68;
+var68 = NULL;
+struct class_Location_500c4434c9* var69;
+var69 = NULL;
+struct class_Str var70;
+var70.buf = NULL;
+struct class_Str var71;
+var71.buf = NULL;
+struct class_List_Expression__d162784c9e* var72;
+var72 = NULL;
+struct class_ListLiteral_66e426dc17* var73;
+var73 = NULL;
+struct class_Expression_35f2052bf4 var74;
+var74.membernum = -1;
+struct class_Expression_35f2052bf4 var75;
+var75.membernum = -1;
+struct class_LoopHeader_23fd592271 var77;
+var77.membernum = -1;
+struct class_Str var78;
+var78.buf = NULL;
+struct class_Str var79;
+var79.buf = NULL;
+struct class_Token_35f69eeb49* var80;
+var80 = NULL;
+char var81;
+struct class__null___Str__5eca9cec4f var82;
+var82.membernum = -1;
+struct class_Expression_35f2052bf4 var83;
+var83.membernum = -1;
+struct class_Str var84;
+var84.buf = NULL;
+struct class_Str var85;
+var85.buf = NULL;
+struct class_Token_35f69eeb49* var86;
+var86 = NULL;
+struct class_ListComprehension_10c913d2dd* var87;
+var87 = NULL;
+struct class_Expression_35f2052bf4 var88;
+var88.membernum = -1;
+struct class_Str var90;
+var90.buf = NULL;
+struct class_Str var91;
+var91.buf = NULL;
+struct class_Token_35f69eeb49* var92;
+var92 = NULL;
+char var93;
+struct class__null___Str__5eca9cec4f var94;
+var94.membernum = -1;
+struct class_Expression_35f2052bf4 var95;
+var95.membernum = -1;
+struct class_Str var96;
+var96.buf = NULL;
+struct class_Str var97;
+var97.buf = NULL;
+struct class_Token_35f69eeb49* var98;
+var98 = NULL;
+struct class_Str var100;
+var100.buf = NULL;
+struct class_Str var101;
+var101.buf = NULL;
+struct class_Token_35f69eeb49* var102;
+var102 = NULL;
+struct class_Location_500c4434c9* var103;
+var103 = NULL;
+struct class_Type_e6cf7dd4e5 var104;
+var104.membernum = -1;
+struct class_Constructor_0c896e4031* var105;
+var105 = NULL;
+struct class_Expression_35f2052bf4 var106;
+var106.membernum = -1;
+struct class_Str var108;
+var108.buf = NULL;
+struct class_Token_35f69eeb49* var109;
+var109 = NULL;
+struct class_Location_500c4434c9* var110;
+var110 = NULL;
+struct class_Str var111;
+var111.buf = NULL;
+struct class_FloatConstant_4759845694* var112;
+var112 = NULL;
+struct class_Expression_35f2052bf4 var113;
+var113.membernum = -1;
+struct class_Str var115;
+var115.buf = NULL;
+struct class_Token_35f69eeb49* var116;
+var116 = NULL;
+struct class_Location_500c4434c9* var117;
+var117 = NULL;
+struct class_Str var118;
+var118.buf = NULL;
+int64_t var119;
+struct class_IntConstant_4cbc4c5420* var120;
+var120 = NULL;
+struct class_Expression_35f2052bf4 var121;
+var121.membernum = -1;
+struct class_Str var123;
+var123.buf = NULL;
+struct class_Token_35f69eeb49* var124;
+var124 = NULL;
+struct class_Location_500c4434c9* var125;
+var125 = NULL;
+struct class_Str var126;
+var126.buf = NULL;
+struct class_GetVar_642f116a6c* var127;
+var127 = NULL;
+struct class_Expression_35f2052bf4 var128;
+var128.membernum = -1;
+struct class_Str var130;
+var130.buf = NULL;
+struct class_Token_35f69eeb49* var131;
+var131 = NULL;
+struct class_Location_500c4434c9* var132;
+var132 = NULL;
+struct class_Str var133;
+var133.buf = NULL;
+struct class_Location_500c4434c9* var134;
+var134 = NULL;
+struct class_Str var135;
+var135.buf = NULL;
+struct class_Location_500c4434c9* var136;
+var136 = NULL;
+struct class_Expression_35f2052bf4 var137;
+var137.membernum = -1;
+struct class_Str var139;
+var139.buf = NULL;
+struct class_Token_35f69eeb49* var140;
+var140 = NULL;
+struct class_Location_500c4434c9* var141;
+var141 = NULL;
+struct class_Str var142;
+var142.buf = NULL;
+struct class_Location_500c4434c9* var143;
+var143 = NULL;
+struct class_Str var144;
+var144.buf = NULL;
+struct class_Location_500c4434c9* var145;
+var145 = NULL;
+struct class_Token_35f69eeb49* var147;
+var147 = NULL;
+struct class_Str var148;
+var148.buf = NULL;
+struct class_Str var149;
+var149.buf = NULL;
+bool var150;
+struct class_Token_35f69eeb49* var152;
+var152 = NULL;
+struct class_Str var153;
+var153.buf = NULL;
+struct class_Str var154;
+var154.buf = NULL;
+bool var155;
+struct class_Str var157;
+var157.buf = NULL;
+struct class_Str var158;
+var158.buf = NULL;
+struct class_Token_35f69eeb49* var159;
+var159 = NULL;
+struct class_Str var160;
+var160.buf = NULL;
+struct class_Token_35f69eeb49* var161;
+var161 = NULL;
+struct class_Location_500c4434c9* var162;
+var162 = NULL;
+struct class_Location_500c4434c9* var163;
+var163 = NULL;
+struct class_Location_500c4434c9* var164;
+var164 = NULL;
+struct class_Str var165;
+var165.buf = NULL;
+struct class_GetAttribute_0758070446* var166;
+var166 = NULL;
+struct class_Expression_35f2052bf4 var167;
+var167.membernum = -1;
+struct class_Token_35f69eeb49* var170;
+var170 = NULL;
+struct class_Location_500c4434c9* var171;
+var171 = NULL;
+struct class_Location_500c4434c9* var172;
+var172 = NULL;
+struct class_Location_500c4434c9* var173;
+var173 = NULL;
+struct class_Str var174;
+var174.buf = NULL;
+struct class_Str var175;
+var175.buf = NULL;
+struct class_List_Expression__d162784c9e* var176;
+var176 = NULL;
+struct class_Call_d0fb9d6234* var177;
+var177 = NULL;
+struct class_Expression_35f2052bf4 var178;
+var178.membernum = -1;
+struct class_Expression_35f2052bf4 retval;
+var3 = meth_Parser_d28334dc68_peek(var1);
+var4 = var3->memb_type;
+string_incref(var4);
+var5 = string10_oneline_string_8354f3c980; string_incref(var5);
+var6 = meth_Str_equals(var4,var5);
+if (var6) goto label7;
+var8 = meth_Parser_d28334dc68_peek(var1);
+var9 = var8->memb_type;
+string_incref(var9);
+var10 = string34_multiline_string_ea7c283272; string_incref(var10);
+var11 = meth_Str_equals(var9,var10);
+if (var11) goto label12;
+var13 = meth_Parser_d28334dc68_peek(var1);
+var14 = var13->memb_type;
+string_incref(var14);
+var15 = string12_id_5bfb53972f; string_incref(var15);
+var16 = meth_Str_equals(var14,var15);
+if (var16) goto label17;
+var18 = meth_Parser_d28334dc68_peek(var1);
+var19 = var18->memb_type;
+string_incref(var19);
+var20 = string35_int_8957befbef; string_incref(var20);
+var21 = meth_Str_equals(var19,var20);
+if (var21) goto label22;
+var23 = meth_Parser_d28334dc68_peek(var1);
+var24 = var23->memb_type;
+string_incref(var24);
+var25 = string36_float_4a2ac0101e; string_incref(var25);
+var26 = meth_Str_equals(var24,var25);
+if (var26) goto label27;
+var28 = meth_Parser_d28334dc68_peek(var1);
+var29 = string8_keyword_ab52a28662; string_incref(var29);
+var30 = string37_new_2386c484ed; string_incref(var30);
+var31 = meth_Token_35f69eeb49_matches(var28,var29,var30);
+if (var31) goto label32;
+var33 = meth_Parser_d28334dc68_peek(var1);
+var34 = string13_op_2d685dde34; string_incref(var34);
+var35 = string21___f5039684f7; string_incref(var35);
+var36 = meth_Token_35f69eeb49_matches(var33,var34,var35);
+if (var36) goto label37;
+var38 = meth_Parser_d28334dc68_peek(var1);
+var39 = string13_op_2d685dde34; string_incref(var39);
+var40 = string38___fa376e52cd; string_incref(var40);
+var41 = meth_Token_35f69eeb49_matches(var38,var39,var40);
+if (var41) goto label42;
+var43 = meth_Parser_d28334dc68_peek(var1);
+var44 = var43->memb_location;
+incref(var44);
+meth_Location_500c4434c9_error(var44,var2);
+if (oomph_true) goto label45;
+label42: (void)0;
+var46 = string13_op_2d685dde34; string_incref(var46);
+var47 = string38___fa376e52cd; string_incref(var47);
+var48 = meth_Parser_d28334dc68_get_token(var1,var46,var47);
+var49 = meth_Parser_d28334dc68_peek(var1);
+var50 = string8_keyword_ab52a28662; string_incref(var50);
+var51 = string39_while_93e771812f; string_incref(var51);
+var52 = meth_Token_35f69eeb49_matches(var49,var50,var51);
+if (var52) goto label53;
+var54 = meth_Parser_d28334dc68_peek(var1);
+var55 = string8_keyword_ab52a28662; string_incref(var55);
+var56 = string40_for_4e6e4e6d32; string_incref(var56);
+var57 = meth_Token_35f69eeb49_matches(var54,var55,var56);
+var58 = var57;
+if (oomph_true) goto label59;
+label53: (void)0;
+var58 = oomph_true;
+label59: (void)0;
+if (var58) goto label60;
+var61 = meth_Parser_d28334dc68_peek(var1);
+var62 = string8_keyword_ab52a28662; string_incref(var62);
+var63 = string41_foreach_2b3e8a8a16; string_incref(var63);
+var64 = meth_Token_35f69eeb49_matches(var61,var62,var63);
+var65 = var64;
+if (oomph_true) goto label66;
+label60: (void)0;
+var65 = oomph_true;
+label66: (void)0;
+if (var65) goto label67;
+var68 = var1->memb_tokens;
+incref(var68);
+meth_List_Token__da0ee88323_push(var68,var48);
+var69 = var48->memb_location;
+incref(var69);
+var70 = string38___fa376e52cd; string_incref(var70);
+var71 = string42___64da0476a2; string_incref(var71);
+var72 = meth_Parser_d28334dc68_parse_commasep_expression_in_parens(var1,var70,var71);
+var73 = ctor_ListLiteral_66e426dc17(var69,var72);
+var74 = (struct class_Expression_35f2052bf4){ .val = { .item9 = var73 }, .membernum = 9 };
+var73 = NULL;
+var75 = var74;
+var74.membernum = -1;
+if (oomph_true) goto label76;
+label67: (void)0;
+var77 = meth_Parser_d28334dc68_parse_loop_header(var1);
+var78 = string13_op_2d685dde34; string_incref(var78);
+var79 = string24___dc60150654; string_incref(var79);
+var80 = meth_Parser_d28334dc68_get_token(var1,var78,var79);
+var81 = oomph_null;
+var82 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var81 }, .membernum = 0 };
+var83 = meth_Parser_d28334dc68_parse_expression(var1,var82);
+var84 = string13_op_2d685dde34; string_incref(var84);
+var85 = string42___64da0476a2; string_incref(var85);
+var86 = meth_Parser_d28334dc68_get_token(var1,var84,var85);
+var87 = ctor_ListComprehension_10c913d2dd(var77,var83);
+var88 = (struct class_Expression_35f2052bf4){ .val = { .item8 = var87 }, .membernum = 8 };
+var87 = NULL;
+var75 = var88;
+var88.membernum = -1;
+label76: (void)0;
+label45: (void)0;
+if (oomph_true) goto label89;
+label37: (void)0;
+var90 = string13_op_2d685dde34; string_incref(var90);
+var91 = string21___f5039684f7; string_incref(var91);
+var92 = meth_Parser_d28334dc68_get_token(var1,var90,var91);
+var93 = oomph_null;
+var94 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var93 }, .membernum = 0 };
+var95 = meth_Parser_d28334dc68_parse_expression(var1,var94);
+var75 = var95;
+var95.membernum = -1;
+var96 = string13_op_2d685dde34; string_incref(var96);
+var97 = string22___6ec62f9ee6; string_incref(var97);
+var98 = meth_Parser_d28334dc68_get_token(var1,var96,var97);
+label89: (void)0;
+if (oomph_true) goto label99;
+label32: (void)0;
+var100 = string8_keyword_ab52a28662; string_incref(var100);
+var101 = string37_new_2386c484ed; string_incref(var101);
+var102 = meth_Parser_d28334dc68_get_token(var1,var100,var101);
+var103 = var102->memb_location;
+incref(var103);
+var104 = meth_Parser_d28334dc68_parse_type(var1);
+var105 = ctor_Constructor_0c896e4031(var103,var104);
+var106 = (struct class_Expression_35f2052bf4){ .val = { .item3 = var105 }, .membernum = 3 };
+var105 = NULL;
+var75 = var106;
+var106.membernum = -1;
+label99: (void)0;
+if (oomph_true) goto label107;
+label27: (void)0;
+var108 = string36_float_4a2ac0101e; string_incref(var108);
+var109 = meth_Parser_d28334dc68_get_token_by_type(var1,var108);
+var110 = var109->memb_location;
+incref(var110);
+var111 = var109->memb_value;
+string_incref(var111);
+var112 = ctor_FloatConstant_4759845694(var110,var111);
+var113 = (struct class_Expression_35f2052bf4){ .val = { .item4 = var112 }, .membernum = 4 };
+var112 = NULL;
+var75 = var113;
+var113.membernum = -1;
+label107: (void)0;
+if (oomph_true) goto label114;
+label22: (void)0;
+var115 = string35_int_8957befbef; string_incref(var115);
+var116 = meth_Parser_d28334dc68_get_token_by_type(var1,var115);
+var117 = var116->memb_location;
+incref(var117);
+var118 = var116->memb_value;
+string_incref(var118);
+var119 = meth_Str_to_int(var118);
+var120 = ctor_IntConstant_4cbc4c5420(var117,var119);
+var121 = (struct class_Expression_35f2052bf4){ .val = { .item7 = var120 }, .membernum = 7 };
+var120 = NULL;
+var75 = var121;
+var121.membernum = -1;
+label114: (void)0;
+if (oomph_true) goto label122;
+label17: (void)0;
+var123 = string12_id_5bfb53972f; string_incref(var123);
+var124 = meth_Parser_d28334dc68_get_token_by_type(var1,var123);
+var125 = var124->memb_location;
+incref(var125);
+var126 = var124->memb_value;
+string_incref(var126);
+var127 = ctor_GetVar_642f116a6c(var125,var126);
+var128 = (struct class_Expression_35f2052bf4){ .val = { .item6 = var127 }, .membernum = 6 };
+var127 = NULL;
+var75 = var128;
+var128.membernum = -1;
+label122: (void)0;
+if (oomph_true) goto label129;
+label12: (void)0;
+var130 = string34_multiline_string_ea7c283272; string_incref(var130);
+var131 = meth_Parser_d28334dc68_get_token_by_type(var1,var130);
+var132 = var131->memb_location;
+incref(var132);
+var133 = string43_____9f49eb898a; string_incref(var133);
+var134 = meth_Location_500c4434c9_remove_prefix(var132,var133);
+var135 = string43_____9f49eb898a; string_incref(var135);
+var136 = meth_Location_500c4434c9_remove_suffix(var134,var135);
+var137 = meth_Parser_d28334dc68_do_string_contents(var1,var136);
+var75 = var137;
+var137.membernum = -1;
+label129: (void)0;
+if (oomph_true) goto label138;
+label7: (void)0;
+var139 = string10_oneline_string_8354f3c980; string_incref(var139);
+var140 = meth_Parser_d28334dc68_get_token_by_type(var1,var139);
+var141 = var140->memb_location;
+incref(var141);
+var142 = string14___0d4b18cc3d; string_incref(var142);
+var143 = meth_Location_500c4434c9_remove_prefix(var141,var142);
+var144 = string14___0d4b18cc3d; string_incref(var144);
+var145 = meth_Location_500c4434c9_remove_suffix(var143,var144);
+var75 = meth_Parser_d28334dc68_do_string_contents(var1,var145);
+label138: (void)0;
+label146: (void)0;
+decref((var147), dtor_Token_35f69eeb49);
+var147 = NULL;
+var147 = meth_Parser_d28334dc68_peek(var1);
+string_decref(var148);
+var148.buf = NULL;
+var148 = string13_op_2d685dde34; string_incref(var148);
+string_decref(var149);
+var149.buf = NULL;
+var149 = string21___f5039684f7; string_incref(var149);
+var150 = meth_Token_35f69eeb49_matches(var147,var148,var149);
+if (var150) goto label151;
+decref((var152), dtor_Token_35f69eeb49);
+var152 = NULL;
+var152 = meth_Parser_d28334dc68_peek(var1);
+string_decref(var153);
+var153.buf = NULL;
+var153 = string13_op_2d685dde34; string_incref(var153);
+string_decref(var154);
+var154.buf = NULL;
+var154 = string44___c381e79c68; string_incref(var154);
+var155 = meth_Token_35f69eeb49_matches(var152,var153,var154);
+if (var155) goto label156;
+retval = var75; var75.membernum = -1;
+goto out;
+label156: (void)0;
+string_decref(var157);
+var157.buf = NULL;
+var157 = string13_op_2d685dde34; string_incref(var157);
+string_decref(var158);
+var158.buf = NULL;
+var158 = string44___c381e79c68; string_incref(var158);
+decref((var159), dtor_Token_35f69eeb49);
+var159 = NULL;
+var159 = meth_Parser_d28334dc68_get_token(var1,var157,var158);
+string_decref(var160);
+var160.buf = NULL;
+var160 = string12_id_5bfb53972f; string_incref(var160);
+decref((var161), dtor_Token_35f69eeb49);
+var161 = NULL;
+var161 = meth_Parser_d28334dc68_get_token_by_type(var1,var160);
+decref((var162), dtor_Location_500c4434c9);
+var162 = NULL;
+var162 = var159->memb_location;
+incref(var162);
+decref((var163), dtor_Location_500c4434c9);
+var163 = NULL;
+var163 = var161->memb_location;
+incref(var163);
+decref((var164), dtor_Location_500c4434c9);
+var164 = NULL;
+var164 = meth_Location_500c4434c9_combine(var162,var163);
+string_decref(var165);
+var165.buf = NULL;
+var165 = var161->memb_value;
+string_incref(var165);
+var166 = ctor_GetAttribute_0758070446(var164,var75,var165);
+decref_Expression_35f2052bf4(var75);
+var167 = (struct class_Expression_35f2052bf4){ .val = { .item5 = var166 }, .membernum = 5 };
+var166 = NULL;
+var75 = var167;
+var167.membernum = -1;
+label168: (void)0;
+if (oomph_true) goto label169;
+label151: (void)0;
+decref((var170), dtor_Token_35f69eeb49);
+var170 = NULL;
+var170 = meth_Parser_d28334dc68_peek(var1);
+decref((var171), dtor_Location_500c4434c9);
+var171 = NULL;
+var171 = ast_91af7cbb25_locate_expression(var75);
+decref((var172), dtor_Location_500c4434c9);
+var172 = NULL;
+var172 = var170->memb_location;
+incref(var172);
+decref((var173), dtor_Location_500c4434c9);
+var173 = NULL;
+var173 = meth_Location_500c4434c9_combine(var171,var172);
+string_decref(var174);
+var174.buf = NULL;
+var174 = string21___f5039684f7; string_incref(var174);
+string_decref(var175);
+var175.buf = NULL;
+var175 = string22___6ec62f9ee6; string_incref(var175);
+decref((var176), dtor_List_Expression__d162784c9e);
+var176 = NULL;
+var176 = meth_Parser_d28334dc68_parse_commasep_expression_in_parens(var1,var174,var175);
+var177 = ctor_Call_d0fb9d6234(var173,var75,var176);
+decref_Expression_35f2052bf4(var75);
+var178 = (struct class_Expression_35f2052bf4){ .val = { .item2 = var177 }, .membernum = 2 };
+var177 = NULL;
+var75 = var178;
+var178.membernum = -1;
+label169: (void)0;
+if (oomph_true) goto label146;
+out: (void)0;
+decref_Expression_35f2052bf4(var178);
+decref((var177), dtor_Call_d0fb9d6234);
+decref((var176), dtor_List_Expression__d162784c9e);
+string_decref(var175);
+string_decref(var174);
+decref((var173), dtor_Location_500c4434c9);
+decref((var172), dtor_Location_500c4434c9);
+decref((var171), dtor_Location_500c4434c9);
+decref((var170), dtor_Token_35f69eeb49);
+decref_Expression_35f2052bf4(var167);
+decref((var166), dtor_GetAttribute_0758070446);
+string_decref(var165);
+decref((var164), dtor_Location_500c4434c9);
+decref((var163), dtor_Location_500c4434c9);
+decref((var162), dtor_Location_500c4434c9);
+decref((var161), dtor_Token_35f69eeb49);
+string_decref(var160);
+decref((var159), dtor_Token_35f69eeb49);
+string_decref(var158);
+string_decref(var157);
+(void)0;
+string_decref(var154);
+string_decref(var153);
+decref((var152), dtor_Token_35f69eeb49);
+(void)0;
+string_decref(var149);
+string_decref(var148);
+decref((var147), dtor_Token_35f69eeb49);
+decref((var145), dtor_Location_500c4434c9);
+string_decref(var144);
+decref((var143), dtor_Location_500c4434c9);
+string_decref(var142);
+decref((var141), dtor_Location_500c4434c9);
+decref((var140), dtor_Token_35f69eeb49);
+string_decref(var139);
+decref_Expression_35f2052bf4(var137);
+decref((var136), dtor_Location_500c4434c9);
+string_decref(var135);
+decref((var134), dtor_Location_500c4434c9);
+string_decref(var133);
+decref((var132), dtor_Location_500c4434c9);
+decref((var131), dtor_Token_35f69eeb49);
+string_decref(var130);
+decref_Expression_35f2052bf4(var128);
+decref((var127), dtor_GetVar_642f116a6c);
+string_decref(var126);
+decref((var125), dtor_Location_500c4434c9);
+decref((var124), dtor_Token_35f69eeb49);
+string_decref(var123);
+decref_Expression_35f2052bf4(var121);
+decref((var120), dtor_IntConstant_4cbc4c5420);
+(void)0;
+string_decref(var118);
+decref((var117), dtor_Location_500c4434c9);
+decref((var116), dtor_Token_35f69eeb49);
+string_decref(var115);
+decref_Expression_35f2052bf4(var113);
+decref((var112), dtor_FloatConstant_4759845694);
+string_decref(var111);
+decref((var110), dtor_Location_500c4434c9);
+decref((var109), dtor_Token_35f69eeb49);
+string_decref(var108);
+decref_Expression_35f2052bf4(var106);
+decref((var105), dtor_Constructor_0c896e4031);
+decref_Type_e6cf7dd4e5(var104);
+decref((var103), dtor_Location_500c4434c9);
+decref((var102), dtor_Token_35f69eeb49);
+string_decref(var101);
+string_decref(var100);
+decref((var98), dtor_Token_35f69eeb49);
+string_decref(var97);
+string_decref(var96);
+decref_Expression_35f2052bf4(var95);
+decref__null___Str__5eca9cec4f(var94);
+(void)0;
+decref((var92), dtor_Token_35f69eeb49);
+string_decref(var91);
+string_decref(var90);
+decref_Expression_35f2052bf4(var88);
+decref((var87), dtor_ListComprehension_10c913d2dd);
+decref((var86), dtor_Token_35f69eeb49);
+string_decref(var85);
+string_decref(var84);
+decref_Expression_35f2052bf4(var83);
+decref__null___Str__5eca9cec4f(var82);
+(void)0;
+decref((var80), dtor_Token_35f69eeb49);
+string_decref(var79);
+string_decref(var78);
+decref_LoopHeader_23fd592271(var77);
+decref_Expression_35f2052bf4(var75);
+decref_Expression_35f2052bf4(var74);
+decref((var73), dtor_ListLiteral_66e426dc17);
+decref((var72), dtor_List_Expression__d162784c9e);
+string_decref(var71);
+string_decref(var70);
+decref((var69), dtor_Location_500c4434c9);
+decref((var68), dtor_List_Token__da0ee88323);
+(void)0;
+(void)0;
+string_decref(var63);
+string_decref(var62);
+decref((var61), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+string_decref(var56);
+string_decref(var55);
+decref((var54), dtor_Token_35f69eeb49);
+(void)0;
+string_decref(var51);
+string_decref(var50);
+decref((var49), dtor_Token_35f69eeb49);
+decref((var48), dtor_Token_35f69eeb49);
+string_decref(var47);
+string_decref(var46);
+decref((var44), dtor_Location_500c4434c9);
+decref((var43), dtor_Token_35f69eeb49);
+(void)0;
+string_decref(var40);
+string_decref(var39);
+decref((var38), dtor_Token_35f69eeb49);
+(void)0;
+string_decref(var35);
+string_decref(var34);
+decref((var33), dtor_Token_35f69eeb49);
+(void)0;
+string_decref(var30);
+string_decref(var29);
+decref((var28), dtor_Token_35f69eeb49);
+(void)0;
+string_decref(var25);
+string_decref(var24);
+decref((var23), dtor_Token_35f69eeb49);
+(void)0;
+string_decref(var20);
+string_decref(var19);
+decref((var18), dtor_Token_35f69eeb49);
+(void)0;
+string_decref(var15);
+string_decref(var14);
+decref((var13), dtor_Token_35f69eeb49);
+(void)0;
+string_decref(var10);
+string_decref(var9);
+decref((var8), dtor_Token_35f69eeb49);
+(void)0;
+string_decref(var5);
+string_decref(var4);
+decref((var3), dtor_Token_35f69eeb49);
+return retval;
+}struct class__null___Int__16c741706b meth_Parser_d28334dc68_find_unary_operator(struct class_Parser_d28334dc68* var1, struct class_List_PrecedenceItem__37797831a9* var2, struct class_List_Str__43b70c06cb* var3){int64_t var4;
+int64_t var6;
+int64_t var7;
+int64_t var8;
+bool var9;
+bool var10;
+struct class_PrecedenceItem_f832c8ac03 var12;
+var12.membernum = -1;
+struct class_Token_35f69eeb49* var13;
+var13 = NULL;
+bool var14;
+struct class_Str var17;
+var17.buf = NULL;
+bool var18;
+bool var19;
+int64_t var24;
+int64_t var25;
+struct class_PrecedenceItem_f832c8ac03 var26;
+var26.membernum = -1;
+bool var27;
+struct class_Expression_35f2052bf4 var30;
+var30.membernum = -1;
+struct class__null___Int__16c741706b var32;
+var32.membernum = -1;
+int64_t var33;
+int64_t var34;
+char var35;
+struct class__null___Int__16c741706b var36;
+var36.membernum = -1;
+struct class__null___Int__16c741706b retval;
+var4 = 0LL;
+label5: (void)0;
+var6 = meth_List_PrecedenceItem__37797831a9_length(var2);
+var7 = 1LL;
+var8 = oomph_int_sub(var6,var7);
+var9 = oomph_int_gt(var8,var4);
+var10 = oomph_bool_not(var9);
+if (var10) goto label11;
+decref_PrecedenceItem_f832c8ac03(var12);
+var12.membernum = -1;
+var12 = meth_List_PrecedenceItem__37797831a9_get(var2,var4);
+decref((var13), dtor_Token_35f69eeb49);
+var13 = NULL;
+
+            var14 = (
+                var12.membernum == 2
+            );
+            if (var14) goto label15;
+
+            var14 = (
+                var12.membernum == 0
+            );
+            if (var14) goto label16;
+
+            var14 = (
+                var12.membernum == 1
+            );
+            if (var14) goto label16;
+label15: (void)0;
+
+            if (var12.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var13 = var12.val.item2;
+            incref(var13);
+string_decref(var17);
+var17.buf = NULL;
+var17 = var13->memb_value;
+string_incref(var17);
+var18 = meth_List_Str__43b70c06cb___contains(var3,var17);
+var19 = oomph_bool_not(var18);
+if (var19) goto label20;
+if (oomph_true) goto label21;
+label20: (void)0;
+if (oomph_true) goto label22;
+label21: (void)0;
+if (oomph_true) goto label23;
+label16: (void)0;
+if (oomph_true) goto label22;
+label23: (void)0;
+var24 = 1LL;
+var25 = oomph_int_add(var4,var24);
+decref_PrecedenceItem_f832c8ac03(var26);
+var26.membernum = -1;
+var26 = meth_List_PrecedenceItem__37797831a9_get(var2,var25);
+
+            var27 = (
+                var26.membernum == 0
+            );
+            if (var27) goto label28;
+
+            var27 = (
+                var26.membernum == 1
+            );
+            if (var27) goto label29;
+
+            var27 = (
+                var26.membernum == 2
+            );
+            if (var27) goto label29;
+label28: (void)0;
+
+            if (var26.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var30 = var26.val.item0;
+            incref_Expression_35f2052bf4(var30);
+if (oomph_true) goto label31;
+label29: (void)0;
+if (oomph_true) goto label22;
+label31: (void)0;
+var32 = (struct class__null___Int__16c741706b){ .val = { .item1 = var4 }, .membernum = 1 };
+retval = var32; var32.membernum = -1;
+goto out;
+label22: (void)0;
+var33 = 1LL;
+var34 = oomph_int_add(var4,var33);
+var4 = var34;
+if (oomph_true) goto label5;
+label11: (void)0;
+var35 = oomph_null;
+var36 = (struct class__null___Int__16c741706b){ .val = { .item0 = var35 }, .membernum = 0 };
+retval = var36; var36.membernum = -1;
+goto out;
+out: (void)0;
+decref__null___Int__16c741706b(var36);
+(void)0;
+(void)0;
+(void)0;
+decref__null___Int__16c741706b(var32);
+decref_Expression_35f2052bf4(var30);
+(void)0;
+decref_PrecedenceItem_f832c8ac03(var26);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var17);
+(void)0;
+decref((var13), dtor_Token_35f69eeb49);
+decref_PrecedenceItem_f832c8ac03(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}struct class__null___Int__16c741706b meth_Parser_d28334dc68_find_binary_operator(struct class_Parser_d28334dc68* var1, struct class_List_PrecedenceItem__37797831a9* var2, struct class_List_Str__43b70c06cb* var3){int64_t var4;
+int64_t var6;
+int64_t var7;
+int64_t var8;
+bool var9;
+bool var10;
+bool var11;
+struct class_PrecedenceItem_f832c8ac03 var13;
+var13.membernum = -1;
+struct class_Expression_35f2052bf4 var14;
+var14.membernum = -1;
+bool var15;
+int64_t var20;
+int64_t var21;
+struct class_PrecedenceItem_f832c8ac03 var22;
+var22.membernum = -1;
+struct class_Token_35f69eeb49* var23;
+var23 = NULL;
+bool var24;
+struct class_Str var27;
+var27.buf = NULL;
+bool var28;
+bool var29;
+int64_t var33;
+int64_t var34;
+struct class_PrecedenceItem_f832c8ac03 var35;
+var35.membernum = -1;
+bool var36;
+struct class_Expression_35f2052bf4 var39;
+var39.membernum = -1;
+struct class__null___Int__16c741706b var41;
+var41.membernum = -1;
+int64_t var42;
+int64_t var43;
+char var44;
+struct class__null___Int__16c741706b var45;
+var45.membernum = -1;
+struct class__null___Int__16c741706b retval;
+var4 = 0LL;
+label5: (void)0;
+var6 = meth_List_PrecedenceItem__37797831a9_length(var2);
+var7 = 3LL;
+var8 = oomph_int_sub(var6,var7);
+var9 = oomph_int_gt(var4,var8);
+var10 = oomph_bool_not(var9);
+var11 = oomph_bool_not(var10);
+if (var11) goto label12;
+decref_PrecedenceItem_f832c8ac03(var13);
+var13.membernum = -1;
+var13 = meth_List_PrecedenceItem__37797831a9_get(var2,var4);
+decref_Expression_35f2052bf4(var14);
+var14.membernum = -1;
+
+            var15 = (
+                var13.membernum == 0
+            );
+            if (var15) goto label16;
+
+            var15 = (
+                var13.membernum == 1
+            );
+            if (var15) goto label17;
+
+            var15 = (
+                var13.membernum == 2
+            );
+            if (var15) goto label17;
+label16: (void)0;
+
+            if (var13.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var14 = var13.val.item0;
+            incref_Expression_35f2052bf4(var14);
+if (oomph_true) goto label18;
+label17: (void)0;
+if (oomph_true) goto label19;
+label18: (void)0;
+var20 = 1LL;
+var21 = oomph_int_add(var4,var20);
+decref_PrecedenceItem_f832c8ac03(var22);
+var22.membernum = -1;
+var22 = meth_List_PrecedenceItem__37797831a9_get(var2,var21);
+decref((var23), dtor_Token_35f69eeb49);
+var23 = NULL;
+
+            var24 = (
+                var22.membernum == 2
+            );
+            if (var24) goto label25;
+
+            var24 = (
+                var22.membernum == 0
+            );
+            if (var24) goto label26;
+
+            var24 = (
+                var22.membernum == 1
+            );
+            if (var24) goto label26;
+label25: (void)0;
+
+            if (var22.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var23 = var22.val.item2;
+            incref(var23);
+string_decref(var27);
+var27.buf = NULL;
+var27 = var23->memb_value;
+string_incref(var27);
+var28 = meth_List_Str__43b70c06cb___contains(var3,var27);
+var29 = oomph_bool_not(var28);
+if (var29) goto label30;
+if (oomph_true) goto label31;
+label30: (void)0;
+if (oomph_true) goto label19;
+label31: (void)0;
+if (oomph_true) goto label32;
+label26: (void)0;
+if (oomph_true) goto label19;
+label32: (void)0;
+var33 = 2LL;
+var34 = oomph_int_add(var4,var33);
+decref_PrecedenceItem_f832c8ac03(var35);
+var35.membernum = -1;
+var35 = meth_List_PrecedenceItem__37797831a9_get(var2,var34);
+
+            var36 = (
+                var35.membernum == 0
+            );
+            if (var36) goto label37;
+
+            var36 = (
+                var35.membernum == 1
+            );
+            if (var36) goto label38;
+
+            var36 = (
+                var35.membernum == 2
+            );
+            if (var36) goto label38;
+label37: (void)0;
+
+            if (var35.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var39 = var35.val.item0;
+            incref_Expression_35f2052bf4(var39);
+if (oomph_true) goto label40;
+label38: (void)0;
+if (oomph_true) goto label19;
+label40: (void)0;
+var41 = (struct class__null___Int__16c741706b){ .val = { .item1 = var4 }, .membernum = 1 };
+retval = var41; var41.membernum = -1;
+goto out;
+label19: (void)0;
+var42 = 1LL;
+var43 = oomph_int_add(var4,var42);
+var4 = var43;
+if (oomph_true) goto label5;
+label12: (void)0;
+var44 = oomph_null;
+var45 = (struct class__null___Int__16c741706b){ .val = { .item0 = var44 }, .membernum = 0 };
+retval = var45; var45.membernum = -1;
+goto out;
+out: (void)0;
+decref__null___Int__16c741706b(var45);
+(void)0;
+(void)0;
+(void)0;
+decref__null___Int__16c741706b(var41);
+decref_Expression_35f2052bf4(var39);
+(void)0;
+decref_PrecedenceItem_f832c8ac03(var35);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var27);
+(void)0;
+decref((var23), dtor_Token_35f69eeb49);
+decref_PrecedenceItem_f832c8ac03(var22);
+(void)0;
+(void)0;
+(void)0;
+decref_Expression_35f2052bf4(var14);
+decref_PrecedenceItem_f832c8ac03(var13);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}void meth_Parser_d28334dc68_eliminate_operators(struct class_Parser_d28334dc68* var1, struct class_List_PrecedenceItem__37797831a9* var2, struct class_List_Str__43b70c06cb* var3, struct class_List_Str__43b70c06cb* var4){int64_t var6;
+int64_t var7;
+bool var8;
+bool var9;
+bool var10;
+struct class__null___Int__16c741706b var12;
+var12.membernum = -1;
+struct class__null___Int__16c741706b var13;
+var13.membernum = -1;
+char var14;
+struct class__null___Int__16c741706b var15;
+var15.membernum = -1;
+bool var16;
+bool var17;
+bool var19;
+char var21;
+struct class__null___Int__16c741706b var22;
+var22.membernum = -1;
+bool var23;
+bool var24;
+int64_t var27;
+int64_t var28;
+bool var29;
+int64_t var31;
+int64_t var32;
+bool var33;
+struct class_Str var35;
+var35.buf = NULL;
+bool var36;
+struct class_Str var37;
+var37.buf = NULL;
+int64_t var38;
+char var40;
+struct class__null___Int__16c741706b var41;
+var41.membernum = -1;
+char var43;
+struct class__null___Int__16c741706b var44;
+var44.membernum = -1;
+char var45;
+struct class__null___Int__16c741706b var46;
+var46.membernum = -1;
+bool var47;
+bool var48;
+char var50;
+struct class__null___Int__16c741706b var51;
+var51.membernum = -1;
+bool var52;
+bool var53;
+int64_t var55;
+int64_t var56;
+int64_t var57;
+struct class_List_PrecedenceItem__37797831a9* var58;
+var58 = NULL;
+struct class_PrecedenceItem_f832c8ac03 var59;
+var59.membernum = -1;
+struct class_Expression_35f2052bf4 var60;
+var60.membernum = -1;
+int64_t var61;
+struct class_PrecedenceItem_f832c8ac03 var62;
+var62.membernum = -1;
+struct class_Token_35f69eeb49* var63;
+var63 = NULL;
+struct class_PrecedenceItem_f832c8ac03 var64;
+var64.membernum = -1;
+struct class_Expression_35f2052bf4 var65;
+var65.membernum = -1;
+struct class_Location_500c4434c9* var66;
+var66 = NULL;
+struct class_Str var67;
+var67.buf = NULL;
+struct class_BinaryOperator_e25f87d1b5* var68;
+var68 = NULL;
+struct class_Expression_35f2052bf4 var69;
+var69.membernum = -1;
+struct class_PrecedenceItem_f832c8ac03 var70;
+var70.membernum = -1;
+int64_t var73;
+int64_t var74;
+int64_t var75;
+struct class_List_PrecedenceItem__37797831a9* var76;
+var76 = NULL;
+struct class_PrecedenceItem_f832c8ac03 var77;
+var77.membernum = -1;
+struct class_Token_35f69eeb49* var78;
+var78 = NULL;
+struct class_PrecedenceItem_f832c8ac03 var79;
+var79.membernum = -1;
+struct class_Expression_35f2052bf4 var80;
+var80.membernum = -1;
+struct class_Location_500c4434c9* var81;
+var81 = NULL;
+struct class_Str var82;
+var82.buf = NULL;
+struct class_UnaryOperator_348525ebbe* var83;
+var83 = NULL;
+struct class_Expression_35f2052bf4 var84;
+var84.membernum = -1;
+struct class_PrecedenceItem_f832c8ac03 var85;
+var85.membernum = -1;
+label5: (void)0;
+var6 = meth_List_PrecedenceItem__37797831a9_length(var2);
+var7 = 2LL;
+var8 = oomph_int_gt(var7,var6);
+var9 = oomph_bool_not(var8);
+var10 = oomph_bool_not(var9);
+if (var10) goto label11;
+decref__null___Int__16c741706b(var12);
+var12.membernum = -1;
+var12 = meth_Parser_d28334dc68_find_unary_operator(var1,var2,var3);
+decref__null___Int__16c741706b(var13);
+var13.membernum = -1;
+var13 = meth_Parser_d28334dc68_find_binary_operator(var1,var2,var4);
+var14 = oomph_null;
+decref__null___Int__16c741706b(var15);
+var15.membernum = -1;
+var15 = (struct class__null___Int__16c741706b){ .val = { .item0 = var14 }, .membernum = 0 };
+var16 = meth__null___Int__16c741706b_equals(var12,var15);
+var17 = oomph_bool_not(var16);
+if (var17) goto label18;
+var19 = oomph_false;
+if (oomph_true) goto label20;
+label18: (void)0;
+var21 = oomph_null;
+decref__null___Int__16c741706b(var22);
+var22.membernum = -1;
+var22 = (struct class__null___Int__16c741706b){ .val = { .item0 = var21 }, .membernum = 0 };
+var23 = meth__null___Int__16c741706b_equals(var13,var22);
+var24 = oomph_bool_not(var23);
+var19 = var24;
+label20: (void)0;
+if (var19) goto label25;
+if (oomph_true) goto label26;
+label25: (void)0;
+var27 = meth__null___Int__16c741706b_get(var12);
+var28 = meth__null___Int__16c741706b_get(var13);
+var29 = oomph_int_gt(var28,var27);
+if (var29) goto label30;
+var31 = meth__null___Int__16c741706b_get(var12);
+var32 = meth__null___Int__16c741706b_get(var13);
+var33 = oomph_int_gt(var31,var32);
+if (var33) goto label34;
+string_decref(var35);
+var35.buf = NULL;
+var35 = string45_ambiguous_operators_f8ca235a95; string_incref(var35);
+oomph_print(var35);
+var36 = oomph_false;
+string_decref(var37);
+var37.buf = NULL;
+var37 = string1_self_hosted_parser_oomph_0113086932; string_incref(var37);
+var38 = 299LL;
+oomph_assert(var36,var37,var38);
+if (oomph_true) goto label39;
+label34: (void)0;
+var40 = oomph_null;
+decref__null___Int__16c741706b(var12);
+var41 = (struct class__null___Int__16c741706b){ .val = { .item0 = var40 }, .membernum = 0 };
+var12 = var41;
+var41.membernum = -1;
+label39: (void)0;
+if (oomph_true) goto label42;
+label30: (void)0;
+var43 = oomph_null;
+decref__null___Int__16c741706b(var13);
+var44 = (struct class__null___Int__16c741706b){ .val = { .item0 = var43 }, .membernum = 0 };
+var13 = var44;
+var44.membernum = -1;
+label42: (void)0;
+label26: (void)0;
+var45 = oomph_null;
+decref__null___Int__16c741706b(var46);
+var46.membernum = -1;
+var46 = (struct class__null___Int__16c741706b){ .val = { .item0 = var45 }, .membernum = 0 };
+var47 = meth__null___Int__16c741706b_equals(var12,var46);
+var48 = oomph_bool_not(var47);
+if (var48) goto label49;
+var50 = oomph_null;
+decref__null___Int__16c741706b(var51);
+var51.membernum = -1;
+var51 = (struct class__null___Int__16c741706b){ .val = { .item0 = var50 }, .membernum = 0 };
+var52 = meth__null___Int__16c741706b_equals(var13,var51);
+var53 = oomph_bool_not(var52);
+if (var53) goto label54;
+if (oomph_true) goto label11;
+label54: (void)0;
+var55 = meth__null___Int__16c741706b_get(var13);
+var56 = 3LL;
+var57 = oomph_int_add(var55,var56);
+decref((var58), dtor_List_PrecedenceItem__37797831a9);
+var58 = NULL;
+var58 = meth_List_PrecedenceItem__37797831a9_delete_slice(var2,var55,var57);
+decref_PrecedenceItem_f832c8ac03(var59);
+var59.membernum = -1;
+var59 = meth_List_PrecedenceItem__37797831a9_first(var58);
+decref_Expression_35f2052bf4(var60);
+var60.membernum = -1;
+
+            if (var59.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var60 = var59.val.item0;
+            incref_Expression_35f2052bf4(var60);
+var61 = 1LL;
+decref_PrecedenceItem_f832c8ac03(var62);
+var62.membernum = -1;
+var62 = meth_List_PrecedenceItem__37797831a9_get(var58,var61);
+decref((var63), dtor_Token_35f69eeb49);
+var63 = NULL;
+
+            if (var62.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var63 = var62.val.item2;
+            incref(var63);
+decref_PrecedenceItem_f832c8ac03(var64);
+var64.membernum = -1;
+var64 = meth_List_PrecedenceItem__37797831a9_last(var58);
+decref_Expression_35f2052bf4(var65);
+var65.membernum = -1;
+
+            if (var64.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var65 = var64.val.item0;
+            incref_Expression_35f2052bf4(var65);
+decref((var66), dtor_Location_500c4434c9);
+var66 = NULL;
+var66 = var63->memb_location;
+incref(var66);
+string_decref(var67);
+var67.buf = NULL;
+var67 = var63->memb_value;
+string_incref(var67);
+var68 = ctor_BinaryOperator_e25f87d1b5(var66,var60,var67,var65);
+var69 = (struct class_Expression_35f2052bf4){ .val = { .item1 = var68 }, .membernum = 1 };
+var68 = NULL;
+decref_PrecedenceItem_f832c8ac03(var70);
+var70.membernum = -1;
+var70 = (struct class_PrecedenceItem_f832c8ac03){ .val = { .item0 = var69 }, .membernum = 0 };
+var69.membernum = -1;
+meth_List_PrecedenceItem__37797831a9_insert(var2,var55,var70);
+label71: (void)0;
+if (oomph_true) goto label72;
+label49: (void)0;
+var73 = meth__null___Int__16c741706b_get(var12);
+var74 = 2LL;
+var75 = oomph_int_add(var73,var74);
+decref((var76), dtor_List_PrecedenceItem__37797831a9);
+var76 = NULL;
+var76 = meth_List_PrecedenceItem__37797831a9_delete_slice(var2,var73,var75);
+decref_PrecedenceItem_f832c8ac03(var77);
+var77.membernum = -1;
+var77 = meth_List_PrecedenceItem__37797831a9_first(var76);
+decref((var78), dtor_Token_35f69eeb49);
+var78 = NULL;
+
+            if (var77.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var78 = var77.val.item2;
+            incref(var78);
+decref_PrecedenceItem_f832c8ac03(var79);
+var79.membernum = -1;
+var79 = meth_List_PrecedenceItem__37797831a9_last(var76);
+decref_Expression_35f2052bf4(var80);
+var80.membernum = -1;
+
+            if (var79.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var80 = var79.val.item0;
+            incref_Expression_35f2052bf4(var80);
+decref((var81), dtor_Location_500c4434c9);
+var81 = NULL;
+var81 = var78->memb_location;
+incref(var81);
+string_decref(var82);
+var82.buf = NULL;
+var82 = var78->memb_value;
+string_incref(var82);
+var83 = ctor_UnaryOperator_348525ebbe(var81,var82,var80);
+var84 = (struct class_Expression_35f2052bf4){ .val = { .item13 = var83 }, .membernum = 13 };
+var83 = NULL;
+decref_PrecedenceItem_f832c8ac03(var85);
+var85.membernum = -1;
+var85 = (struct class_PrecedenceItem_f832c8ac03){ .val = { .item0 = var84 }, .membernum = 0 };
+var84.membernum = -1;
+meth_List_PrecedenceItem__37797831a9_insert(var2,var73,var85);
+label72: (void)0;
+if (oomph_true) goto label5;
+label11: (void)0;
+out: (void)0;
+decref_PrecedenceItem_f832c8ac03(var85);
+decref_Expression_35f2052bf4(var84);
+decref((var83), dtor_UnaryOperator_348525ebbe);
+string_decref(var82);
+decref((var81), dtor_Location_500c4434c9);
+decref_Expression_35f2052bf4(var80);
+decref_PrecedenceItem_f832c8ac03(var79);
+decref((var78), dtor_Token_35f69eeb49);
+decref_PrecedenceItem_f832c8ac03(var77);
+decref((var76), dtor_List_PrecedenceItem__37797831a9);
+(void)0;
+(void)0;
+(void)0;
+decref_PrecedenceItem_f832c8ac03(var70);
+decref_Expression_35f2052bf4(var69);
+decref((var68), dtor_BinaryOperator_e25f87d1b5);
+string_decref(var67);
+decref((var66), dtor_Location_500c4434c9);
+decref_Expression_35f2052bf4(var65);
+decref_PrecedenceItem_f832c8ac03(var64);
+decref((var63), dtor_Token_35f69eeb49);
+decref_PrecedenceItem_f832c8ac03(var62);
+(void)0;
+decref_Expression_35f2052bf4(var60);
+decref_PrecedenceItem_f832c8ac03(var59);
+decref((var58), dtor_List_PrecedenceItem__37797831a9);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__null___Int__16c741706b(var51);
+(void)0;
+(void)0;
+(void)0;
+decref__null___Int__16c741706b(var46);
+(void)0;
+decref__null___Int__16c741706b(var44);
+(void)0;
+decref__null___Int__16c741706b(var41);
+(void)0;
+(void)0;
+string_decref(var37);
+(void)0;
+string_decref(var35);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__null___Int__16c741706b(var22);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__null___Int__16c741706b(var15);
+(void)0;
+decref__null___Int__16c741706b(var13);
+decref__null___Int__16c741706b(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}void meth_Parser_d28334dc68_eliminate_as(struct class_Parser_d28334dc68* var1, struct class_List_PrecedenceItem__37797831a9* var2){bool var3;
+bool var5;
+bool var7;
+int64_t var8;
+int64_t var10;
+bool var11;
+bool var12;
+struct class_PrecedenceItem_f832c8ac03 var14;
+var14.membernum = -1;
+struct class_Token_35f69eeb49* var15;
+var15 = NULL;
+bool var16;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+bool var21;
+int64_t var24;
+int64_t var25;
+int64_t var26;
+bool var27;
+bool var28;
+bool var30;
+int64_t var32;
+int64_t var33;
+int64_t var34;
+bool var35;
+struct class_Str var36;
+var36.buf = NULL;
+int64_t var37;
+int64_t var38;
+int64_t var39;
+struct class_PrecedenceItem_f832c8ac03 var40;
+var40.membernum = -1;
+struct class_Expression_35f2052bf4 var41;
+var41.membernum = -1;
+int64_t var42;
+int64_t var43;
+struct class_PrecedenceItem_f832c8ac03 var44;
+var44.membernum = -1;
+struct class_Type_e6cf7dd4e5 var45;
+var45.membernum = -1;
+int64_t var46;
+int64_t var47;
+int64_t var48;
+int64_t var49;
+struct class_List_PrecedenceItem__37797831a9* var50;
+var50 = NULL;
+int64_t var51;
+int64_t var52;
+struct class_Location_500c4434c9* var53;
+var53 = NULL;
+struct class_As_a05f1f16b6* var54;
+var54 = NULL;
+struct class_Expression_35f2052bf4 var55;
+var55.membernum = -1;
+struct class_PrecedenceItem_f832c8ac03 var56;
+var56.membernum = -1;
+bool var57;
+int64_t var59;
+int64_t var60;
+var3 = oomph_true;
+label4: (void)0;
+var5 = oomph_bool_not(var3);
+if (var5) goto label6;
+var7 = oomph_false;
+var3 = var7;
+var8 = 0LL;
+label9: (void)0;
+var10 = meth_List_PrecedenceItem__37797831a9_length(var2);
+var11 = oomph_int_gt(var10,var8);
+var12 = oomph_bool_not(var11);
+if (var12) goto label13;
+decref_PrecedenceItem_f832c8ac03(var14);
+var14.membernum = -1;
+var14 = meth_List_PrecedenceItem__37797831a9_get(var2,var8);
+decref((var15), dtor_Token_35f69eeb49);
+var15 = NULL;
+
+            var16 = (
+                var14.membernum == 2
+            );
+            if (var16) goto label17;
+
+            var16 = (
+                var14.membernum == 0
+            );
+            if (var16) goto label18;
+
+            var16 = (
+                var14.membernum == 1
+            );
+            if (var16) goto label18;
+label17: (void)0;
+
+            if (var14.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var15 = var14.val.item2;
+            incref(var15);
+string_decref(var19);
+var19.buf = NULL;
+var19 = var15->memb_value;
+string_incref(var19);
+string_decref(var20);
+var20.buf = NULL;
+var20 = string11_as_4913bd3281; string_incref(var20);
+var21 = meth_Str_equals(var19,var20);
+if (var21) goto label22;
+if (oomph_true) goto label23;
+label22: (void)0;
+var24 = 0LL;
+var25 = 1LL;
+var26 = oomph_int_sub(var8,var25);
+var27 = oomph_int_gt(var24,var26);
+var28 = oomph_bool_not(var27);
+if (var28) goto label29;
+var30 = oomph_false;
+if (oomph_true) goto label31;
+label29: (void)0;
+var32 = 1LL;
+var33 = oomph_int_add(var8,var32);
+var34 = meth_List_PrecedenceItem__37797831a9_length(var2);
+var35 = oomph_int_gt(var34,var33);
+var30 = var35;
+label31: (void)0;
+string_decref(var36);
+var36.buf = NULL;
+var36 = string1_self_hosted_parser_oomph_0113086932; string_incref(var36);
+var37 = 326LL;
+oomph_assert(var30,var36,var37);
+var38 = 1LL;
+var39 = oomph_int_sub(var8,var38);
+decref_PrecedenceItem_f832c8ac03(var40);
+var40.membernum = -1;
+var40 = meth_List_PrecedenceItem__37797831a9_get(var2,var39);
+decref_Expression_35f2052bf4(var41);
+var41.membernum = -1;
+
+            if (var40.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var41 = var40.val.item0;
+            incref_Expression_35f2052bf4(var41);
+var42 = 1LL;
+var43 = oomph_int_add(var8,var42);
+decref_PrecedenceItem_f832c8ac03(var44);
+var44.membernum = -1;
+var44 = meth_List_PrecedenceItem__37797831a9_get(var2,var43);
+decref_Type_e6cf7dd4e5(var45);
+var45.membernum = -1;
+
+            if (var44.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var45 = var44.val.item1;
+            incref_Type_e6cf7dd4e5(var45);
+var46 = 1LL;
+var47 = oomph_int_sub(var8,var46);
+var48 = 2LL;
+var49 = oomph_int_add(var8,var48);
+decref((var50), dtor_List_PrecedenceItem__37797831a9);
+var50 = NULL;
+var50 = meth_List_PrecedenceItem__37797831a9_delete_slice(var2,var47,var49);
+var51 = 1LL;
+var52 = oomph_int_sub(var8,var51);
+decref((var53), dtor_Location_500c4434c9);
+var53 = NULL;
+var53 = var15->memb_location;
+incref(var53);
+var54 = ctor_As_a05f1f16b6(var53,var41,var45);
+var55 = (struct class_Expression_35f2052bf4){ .val = { .item0 = var54 }, .membernum = 0 };
+var54 = NULL;
+decref_PrecedenceItem_f832c8ac03(var56);
+var56.membernum = -1;
+var56 = (struct class_PrecedenceItem_f832c8ac03){ .val = { .item0 = var55 }, .membernum = 0 };
+var55.membernum = -1;
+meth_List_PrecedenceItem__37797831a9_insert(var2,var52,var56);
+var57 = oomph_true;
+var3 = var57;
+if (oomph_true) goto label13;
+label23: (void)0;
+if (oomph_true) goto label58;
+label18: (void)0;
+label58: (void)0;
+var59 = 1LL;
+var60 = oomph_int_add(var8,var59);
+var8 = var60;
+if (oomph_true) goto label9;
+label13: (void)0;
+if (oomph_true) goto label4;
+label6: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_PrecedenceItem_f832c8ac03(var56);
+decref_Expression_35f2052bf4(var55);
+decref((var54), dtor_As_a05f1f16b6);
+decref((var53), dtor_Location_500c4434c9);
+(void)0;
+(void)0;
+decref((var50), dtor_List_PrecedenceItem__37797831a9);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Type_e6cf7dd4e5(var45);
+decref_PrecedenceItem_f832c8ac03(var44);
+(void)0;
+(void)0;
+decref_Expression_35f2052bf4(var41);
+decref_PrecedenceItem_f832c8ac03(var40);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var36);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var20);
+string_decref(var19);
+(void)0;
+decref((var15), dtor_Token_35f69eeb49);
+decref_PrecedenceItem_f832c8ac03(var14);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}struct class_List_PrecedenceItem__37797831a9* meth_Parser_d28334dc68_get_unary_operators(struct class_Parser_d28334dc68* var1){struct class_List_PrecedenceItem__37797831a9* var2;
+var2 = NULL;
+struct class_Token_35f69eeb49* var4;
+var4 = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+bool var7;
+struct class_Token_35f69eeb49* var9;
+var9 = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+bool var12;
+bool var13;
+bool var15;
+struct class_List_Token__da0ee88323* var17;
+var17 = NULL;
+struct class_Token_35f69eeb49* var18;
+var18 = NULL;
+struct class_PrecedenceItem_f832c8ac03 var19;
+var19.membernum = -1;
+struct class_List_PrecedenceItem__37797831a9* retval;
+var2 = ctor_List_PrecedenceItem__37797831a9();
+label3: (void)0;
+decref((var4), dtor_Token_35f69eeb49);
+var4 = NULL;
+var4 = meth_Parser_d28334dc68_peek(var1);
+string_decref(var5);
+var5.buf = NULL;
+var5 = string8_keyword_ab52a28662; string_incref(var5);
+string_decref(var6);
+var6.buf = NULL;
+var6 = string46_not_74a6e9747c; string_incref(var6);
+var7 = meth_Token_35f69eeb49_matches(var4,var5,var6);
+if (var7) goto label8;
+decref((var9), dtor_Token_35f69eeb49);
+var9 = NULL;
+var9 = meth_Parser_d28334dc68_peek(var1);
+string_decref(var10);
+var10.buf = NULL;
+var10 = string13_op_2d685dde34; string_incref(var10);
+string_decref(var11);
+var11.buf = NULL;
+var11 = string47___436c5e6693; string_incref(var11);
+var12 = meth_Token_35f69eeb49_matches(var9,var10,var11);
+var13 = var12;
+if (oomph_true) goto label14;
+label8: (void)0;
+var13 = oomph_true;
+label14: (void)0;
+var15 = oomph_bool_not(var13);
+if (var15) goto label16;
+decref((var17), dtor_List_Token__da0ee88323);
+var17 = NULL;
+var17 = var1->memb_tokens;
+incref(var17);
+var18 = meth_List_Token__da0ee88323_pop(var17);
+decref_PrecedenceItem_f832c8ac03(var19);
+var19.membernum = -1;
+var19 = (struct class_PrecedenceItem_f832c8ac03){ .val = { .item2 = var18 }, .membernum = 2 };
+var18 = NULL;
+meth_List_PrecedenceItem__37797831a9_push(var2,var19);
+if (oomph_true) goto label3;
+label16: (void)0;
+retval = var2; var2 = NULL;
+goto out;
+out: (void)0;
+decref_PrecedenceItem_f832c8ac03(var19);
+decref((var18), dtor_Token_35f69eeb49);
+decref((var17), dtor_List_Token__da0ee88323);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var11);
+string_decref(var10);
+decref((var9), dtor_Token_35f69eeb49);
+(void)0;
+string_decref(var6);
+string_decref(var5);
+decref((var4), dtor_Token_35f69eeb49);
+decref((var2), dtor_List_PrecedenceItem__37797831a9);
+return retval;
+}struct class_Expression_35f2052bf4 meth_Parser_d28334dc68_parse_expression(struct class_Parser_d28334dc68* var1, struct class__null___Str__5eca9cec4f var2){struct class__null___Str__5eca9cec4f var3;
+var3.membernum = -1;
+char var4;
+struct class__null___Str__5eca9cec4f var5;
+var5.membernum = -1;
+bool var6;
+struct class_Str var9;
+var9.buf = NULL;
+struct class__null___Str__5eca9cec4f var10;
+var10.membernum = -1;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_List_Str__43b70c06cb* var27;
+var27 = NULL;
+struct class_List_PrecedenceItem__37797831a9* var28;
+var28 = NULL;
+struct class_Str var29;
+var29.buf = NULL;
+struct class_Expression_35f2052bf4 var30;
+var30.membernum = -1;
+struct class_PrecedenceItem_f832c8ac03 var31;
+var31.membernum = -1;
+struct class_Token_35f69eeb49* var33;
+var33 = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+bool var35;
+bool var36;
+struct class_List_Token__da0ee88323* var38;
+var38 = NULL;
+struct class_Token_35f69eeb49* var39;
+var39 = NULL;
+struct class_PrecedenceItem_f832c8ac03 var40;
+var40.membernum = -1;
+struct class_Str var41;
+var41.buf = NULL;
+struct class_Str var42;
+var42.buf = NULL;
+bool var43;
+struct class_List_PrecedenceItem__37797831a9* var45;
+var45 = NULL;
+struct class_Str var46;
+var46.buf = NULL;
+struct class_Expression_35f2052bf4 var47;
+var47.membernum = -1;
+struct class_PrecedenceItem_f832c8ac03 var48;
+var48.membernum = -1;
+struct class_Type_e6cf7dd4e5 var50;
+var50.membernum = -1;
+struct class_PrecedenceItem_f832c8ac03 var51;
+var51.membernum = -1;
+struct class_List_Str__43b70c06cb* var52;
+var52 = NULL;
+struct class_Str var53;
+var53.buf = NULL;
+struct class_Str var54;
+var54.buf = NULL;
+struct class_List_Str__43b70c06cb* var55;
+var55 = NULL;
+struct class_Str var56;
+var56.buf = NULL;
+struct class_List_Str__43b70c06cb* var57;
+var57 = NULL;
+struct class_Str var58;
+var58.buf = NULL;
+struct class_Str var59;
+var59.buf = NULL;
+struct class_List_Str__43b70c06cb* var60;
+var60 = NULL;
+struct class_List_Str__43b70c06cb* var61;
+var61 = NULL;
+struct class_Str var62;
+var62.buf = NULL;
+struct class_List_Str__43b70c06cb* var63;
+var63 = NULL;
+struct class_List_Str__43b70c06cb* var64;
+var64 = NULL;
+struct class_Str var65;
+var65.buf = NULL;
+struct class_Str var66;
+var66.buf = NULL;
+struct class_List_Str__43b70c06cb* var67;
+var67 = NULL;
+struct class_List_Str__43b70c06cb* var68;
+var68 = NULL;
+struct class_Str var69;
+var69.buf = NULL;
+struct class_Str var70;
+var70.buf = NULL;
+struct class_Str var71;
+var71.buf = NULL;
+struct class_Str var72;
+var72.buf = NULL;
+struct class_List_Str__43b70c06cb* var73;
+var73 = NULL;
+struct class_List_Str__43b70c06cb* var74;
+var74 = NULL;
+struct class_Str var75;
+var75.buf = NULL;
+struct class_Str var76;
+var76.buf = NULL;
+struct class_List_Str__43b70c06cb* var77;
+var77 = NULL;
+struct class_Str var78;
+var78.buf = NULL;
+struct class_List_Str__43b70c06cb* var79;
+var79 = NULL;
+struct class_List_Str__43b70c06cb* var80;
+var80 = NULL;
+struct class_List_Str__43b70c06cb* var81;
+var81 = NULL;
+struct class_Str var82;
+var82.buf = NULL;
+struct class_Str var83;
+var83.buf = NULL;
+struct class_List_Str__43b70c06cb* var84;
+var84 = NULL;
+int64_t var85;
+int64_t var86;
+bool var87;
+bool var88;
+struct class_Str var91;
+var91.buf = NULL;
+bool var92;
+struct class_Str var93;
+var93.buf = NULL;
+int64_t var94;
+struct class_PrecedenceItem_f832c8ac03 var95;
+var95.membernum = -1;
+struct class_Expression_35f2052bf4 var96;
+var96.membernum = -1;
+struct class_Expression_35f2052bf4 retval;
+var3 = var2;
+incref__null___Str__5eca9cec4f(var3);
+var4 = oomph_null;
+var5 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var4 }, .membernum = 0 };
+var6 = meth__null___Str__5eca9cec4f_equals(var3,var5);
+if (var6) goto label7;
+if (oomph_true) goto label8;
+label7: (void)0;
+var9 = string48_should_be_an_expression_ff6dede615; string_incref(var9);
+decref__null___Str__5eca9cec4f(var3);
+var10 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var9 }, .membernum = 1 };
+var9.buf = NULL;
+var3 = var10;
+var10.membernum = -1;
+label8: (void)0;
+var11 = string49___9f81282eac; string_incref(var11);
+var12 = string47___436c5e6693; string_incref(var12);
+var13 = string50___d3b1146f27; string_incref(var13);
+var14 = string19___d27c7b3f3c; string_incref(var14);
+var15 = string51____5913148caa; string_incref(var15);
+var16 = string52____fb9ff04846; string_incref(var16);
+var17 = string53___6461204c0f; string_incref(var17);
+var18 = string54___28752bbc68; string_incref(var18);
+var19 = string55____1621b5e4a3; string_incref(var19);
+var20 = string56____cbfe098cf3; string_incref(var20);
+var21 = string57_mod_7e6617d30e; string_incref(var21);
+var22 = string11_as_4913bd3281; string_incref(var22);
+var23 = string58_in_59cd12871e; string_incref(var23);
+var24 = string59_not_in_27e17f8cf4; string_incref(var24);
+var25 = string60_and_632735ef57; string_incref(var25);
+var26 = string61_or_27d1eae6e3; string_incref(var26);
+var27 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var27,var11);
+meth_List_Str__43b70c06cb_push(var27,var12);
+meth_List_Str__43b70c06cb_push(var27,var13);
+meth_List_Str__43b70c06cb_push(var27,var14);
+meth_List_Str__43b70c06cb_push(var27,var15);
+meth_List_Str__43b70c06cb_push(var27,var16);
+meth_List_Str__43b70c06cb_push(var27,var17);
+meth_List_Str__43b70c06cb_push(var27,var18);
+meth_List_Str__43b70c06cb_push(var27,var19);
+meth_List_Str__43b70c06cb_push(var27,var20);
+meth_List_Str__43b70c06cb_push(var27,var21);
+meth_List_Str__43b70c06cb_push(var27,var22);
+meth_List_Str__43b70c06cb_push(var27,var23);
+meth_List_Str__43b70c06cb_push(var27,var24);
+meth_List_Str__43b70c06cb_push(var27,var25);
+meth_List_Str__43b70c06cb_push(var27,var26);
+var28 = meth_Parser_d28334dc68_get_unary_operators(var1);
+var29 = meth__null___Str__5eca9cec4f_get(var3);
+var30 = meth_Parser_d28334dc68_parse_simple_expression(var1,var29);
+var31 = (struct class_PrecedenceItem_f832c8ac03){ .val = { .item0 = var30 }, .membernum = 0 };
+var30.membernum = -1;
+meth_List_PrecedenceItem__37797831a9_push(var28,var31);
+label32: (void)0;
+decref((var33), dtor_Token_35f69eeb49);
+var33 = NULL;
+var33 = meth_Parser_d28334dc68_peek(var1);
+string_decref(var34);
+var34.buf = NULL;
+var34 = var33->memb_value;
+string_incref(var34);
+var35 = meth_List_Str__43b70c06cb___contains(var27,var34);
+var36 = oomph_bool_not(var35);
+if (var36) goto label37;
+decref((var38), dtor_List_Token__da0ee88323);
+var38 = NULL;
+var38 = var1->memb_tokens;
+incref(var38);
+decref((var39), dtor_Token_35f69eeb49);
+var39 = NULL;
+var39 = meth_List_Token__da0ee88323_pop(var38);
+decref_PrecedenceItem_f832c8ac03(var40);
+var40.membernum = -1;
+var40 = (struct class_PrecedenceItem_f832c8ac03){ .val = { .item2 = var39 }, .membernum = 2 };
+incref(var39);
+meth_List_PrecedenceItem__37797831a9_push(var28,var40);
+string_decref(var41);
+var41.buf = NULL;
+var41 = var39->memb_value;
+string_incref(var41);
+string_decref(var42);
+var42.buf = NULL;
+var42 = string11_as_4913bd3281; string_incref(var42);
+var43 = meth_Str_equals(var41,var42);
+if (var43) goto label44;
+decref((var45), dtor_List_PrecedenceItem__37797831a9);
+var45 = NULL;
+var45 = meth_Parser_d28334dc68_get_unary_operators(var1);
+meth_List_PrecedenceItem__37797831a9_push_all(var28,var45);
+string_decref(var46);
+var46.buf = NULL;
+var46 = meth__null___Str__5eca9cec4f_get(var3);
+var47 = meth_Parser_d28334dc68_parse_simple_expression(var1,var46);
+decref_PrecedenceItem_f832c8ac03(var48);
+var48.membernum = -1;
+var48 = (struct class_PrecedenceItem_f832c8ac03){ .val = { .item0 = var47 }, .membernum = 0 };
+var47.membernum = -1;
+meth_List_PrecedenceItem__37797831a9_push(var28,var48);
+if (oomph_true) goto label49;
+label44: (void)0;
+var50 = meth_Parser_d28334dc68_parse_type(var1);
+decref_PrecedenceItem_f832c8ac03(var51);
+var51.membernum = -1;
+var51 = (struct class_PrecedenceItem_f832c8ac03){ .val = { .item1 = var50 }, .membernum = 1 };
+var50.membernum = -1;
+meth_List_PrecedenceItem__37797831a9_push(var28,var51);
+label49: (void)0;
+if (oomph_true) goto label32;
+label37: (void)0;
+var52 = ctor_List_Str__43b70c06cb();
+var53 = string50___d3b1146f27; string_incref(var53);
+var54 = string19___d27c7b3f3c; string_incref(var54);
+var55 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var55,var53);
+meth_List_Str__43b70c06cb_push(var55,var54);
+meth_Parser_d28334dc68_eliminate_operators(var1,var28,var52,var55);
+var56 = string47___436c5e6693; string_incref(var56);
+var57 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var57,var56);
+var58 = string49___9f81282eac; string_incref(var58);
+var59 = string47___436c5e6693; string_incref(var59);
+var60 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var60,var58);
+meth_List_Str__43b70c06cb_push(var60,var59);
+meth_Parser_d28334dc68_eliminate_operators(var1,var28,var57,var60);
+var61 = ctor_List_Str__43b70c06cb();
+var62 = string57_mod_7e6617d30e; string_incref(var62);
+var63 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var63,var62);
+meth_Parser_d28334dc68_eliminate_operators(var1,var28,var61,var63);
+var64 = ctor_List_Str__43b70c06cb();
+var65 = string51____5913148caa; string_incref(var65);
+var66 = string52____fb9ff04846; string_incref(var66);
+var67 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var67,var65);
+meth_List_Str__43b70c06cb_push(var67,var66);
+meth_Parser_d28334dc68_eliminate_operators(var1,var28,var64,var67);
+var68 = ctor_List_Str__43b70c06cb();
+var69 = string53___6461204c0f; string_incref(var69);
+var70 = string54___28752bbc68; string_incref(var70);
+var71 = string55____1621b5e4a3; string_incref(var71);
+var72 = string56____cbfe098cf3; string_incref(var72);
+var73 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var73,var69);
+meth_List_Str__43b70c06cb_push(var73,var70);
+meth_List_Str__43b70c06cb_push(var73,var71);
+meth_List_Str__43b70c06cb_push(var73,var72);
+meth_Parser_d28334dc68_eliminate_operators(var1,var28,var68,var73);
+meth_Parser_d28334dc68_eliminate_as(var1,var28);
+var74 = ctor_List_Str__43b70c06cb();
+var75 = string58_in_59cd12871e; string_incref(var75);
+var76 = string59_not_in_27e17f8cf4; string_incref(var76);
+var77 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var77,var75);
+meth_List_Str__43b70c06cb_push(var77,var76);
+meth_Parser_d28334dc68_eliminate_operators(var1,var28,var74,var77);
+var78 = string46_not_74a6e9747c; string_incref(var78);
+var79 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var79,var78);
+var80 = ctor_List_Str__43b70c06cb();
+meth_Parser_d28334dc68_eliminate_operators(var1,var28,var79,var80);
+var81 = ctor_List_Str__43b70c06cb();
+var82 = string60_and_632735ef57; string_incref(var82);
+var83 = string61_or_27d1eae6e3; string_incref(var83);
+var84 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var84,var82);
+meth_List_Str__43b70c06cb_push(var84,var83);
+meth_Parser_d28334dc68_eliminate_operators(var1,var28,var81,var84);
+var85 = meth_List_PrecedenceItem__37797831a9_length(var28);
+var86 = 1LL;
+var87 = meth_Int_equals(var85,var86);
+var88 = oomph_bool_not(var87);
+if (var88) goto label89;
+if (oomph_true) goto label90;
+label89: (void)0;
+var91 = meth_List_PrecedenceItem__37797831a9_to_string(var28);
+oomph_print(var91);
+var92 = oomph_false;
+var93 = string1_self_hosted_parser_oomph_0113086932; string_incref(var93);
+var94 = 376LL;
+oomph_assert(var92,var93,var94);
+label90: (void)0;
+var95 = meth_List_PrecedenceItem__37797831a9_first(var28);
+
+            if (var95.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var96 = var95.val.item0;
+            incref_Expression_35f2052bf4(var96);
+retval = var96; var96.membernum = -1;
+goto out;
+out: (void)0;
+decref_Expression_35f2052bf4(var96);
+decref_PrecedenceItem_f832c8ac03(var95);
+(void)0;
+string_decref(var93);
+(void)0;
+string_decref(var91);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var84), dtor_List_Str__43b70c06cb);
+string_decref(var83);
+string_decref(var82);
+decref((var81), dtor_List_Str__43b70c06cb);
+decref((var80), dtor_List_Str__43b70c06cb);
+decref((var79), dtor_List_Str__43b70c06cb);
+string_decref(var78);
+decref((var77), dtor_List_Str__43b70c06cb);
+string_decref(var76);
+string_decref(var75);
+decref((var74), dtor_List_Str__43b70c06cb);
+decref((var73), dtor_List_Str__43b70c06cb);
+string_decref(var72);
+string_decref(var71);
+string_decref(var70);
+string_decref(var69);
+decref((var68), dtor_List_Str__43b70c06cb);
+decref((var67), dtor_List_Str__43b70c06cb);
+string_decref(var66);
+string_decref(var65);
+decref((var64), dtor_List_Str__43b70c06cb);
+decref((var63), dtor_List_Str__43b70c06cb);
+string_decref(var62);
+decref((var61), dtor_List_Str__43b70c06cb);
+decref((var60), dtor_List_Str__43b70c06cb);
+string_decref(var59);
+string_decref(var58);
+decref((var57), dtor_List_Str__43b70c06cb);
+string_decref(var56);
+decref((var55), dtor_List_Str__43b70c06cb);
+string_decref(var54);
+string_decref(var53);
+decref((var52), dtor_List_Str__43b70c06cb);
+decref_PrecedenceItem_f832c8ac03(var51);
+decref_Type_e6cf7dd4e5(var50);
+decref_PrecedenceItem_f832c8ac03(var48);
+decref_Expression_35f2052bf4(var47);
+string_decref(var46);
+decref((var45), dtor_List_PrecedenceItem__37797831a9);
+(void)0;
+string_decref(var42);
+string_decref(var41);
+decref_PrecedenceItem_f832c8ac03(var40);
+decref((var39), dtor_Token_35f69eeb49);
+decref((var38), dtor_List_Token__da0ee88323);
+(void)0;
+(void)0;
+string_decref(var34);
+decref((var33), dtor_Token_35f69eeb49);
+decref_PrecedenceItem_f832c8ac03(var31);
+decref_Expression_35f2052bf4(var30);
+string_decref(var29);
+decref((var28), dtor_List_PrecedenceItem__37797831a9);
+decref((var27), dtor_List_Str__43b70c06cb);
+string_decref(var26);
+string_decref(var25);
+string_decref(var24);
+string_decref(var23);
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+string_decref(var19);
+string_decref(var18);
+string_decref(var17);
+string_decref(var16);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+decref__null___Str__5eca9cec4f(var10);
+string_decref(var9);
+(void)0;
+decref__null___Str__5eca9cec4f(var5);
+(void)0;
+decref__null___Str__5eca9cec4f(var3);
+return retval;
+}struct class_Statement_1dc2e7090f meth_Parser_d28334dc68_parse_oneline_ish_statement(struct class_Parser_d28334dc68* var1){struct class_Token_35f69eeb49* var2;
+var2 = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+bool var5;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Token_35f69eeb49* var10;
+var10 = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Token_35f69eeb49* var12;
+var12 = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Token_35f69eeb49* var16;
+var16 = NULL;
+char var17;
+struct class__null___Str__5eca9cec4f var18;
+var18.membernum = -1;
+struct class_Expression_35f2052bf4 var19;
+var19.membernum = -1;
+struct class_Location_500c4434c9* var20;
+var20 = NULL;
+struct class_Let_c9da3e3372* var21;
+var21 = NULL;
+struct class_Statement_1dc2e7090f var22;
+var22.membernum = -1;
+struct class_Token_35f69eeb49* var23;
+var23 = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+bool var26;
+struct class_Str var29;
+var29.buf = NULL;
+struct class_Str var30;
+var30.buf = NULL;
+struct class_Token_35f69eeb49* var31;
+var31 = NULL;
+struct class_Token_35f69eeb49* var32;
+var32 = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+bool var35;
+struct class_Location_500c4434c9* var38;
+var38 = NULL;
+char var39;
+struct class__null___Expression__957e7d6409 var40;
+var40.membernum = -1;
+struct class_Return_33802009cd* var41;
+var41 = NULL;
+struct class_Statement_1dc2e7090f var42;
+var42.membernum = -1;
+struct class_Location_500c4434c9* var43;
+var43 = NULL;
+char var44;
+struct class__null___Str__5eca9cec4f var45;
+var45.membernum = -1;
+struct class_Expression_35f2052bf4 var46;
+var46.membernum = -1;
+struct class__null___Expression__957e7d6409 var47;
+var47.membernum = -1;
+struct class_Return_33802009cd* var48;
+var48 = NULL;
+struct class_Statement_1dc2e7090f var49;
+var49.membernum = -1;
+struct class_Token_35f69eeb49* var50;
+var50 = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+struct class_Str var52;
+var52.buf = NULL;
+bool var53;
+struct class_Str var56;
+var56.buf = NULL;
+struct class_Str var57;
+var57.buf = NULL;
+struct class_Token_35f69eeb49* var58;
+var58 = NULL;
+struct class_Location_500c4434c9* var59;
+var59 = NULL;
+struct class_Pass_e49950b77e* var60;
+var60 = NULL;
+struct class_Statement_1dc2e7090f var61;
+var61.membernum = -1;
+struct class_Token_35f69eeb49* var62;
+var62 = NULL;
+struct class_Str var63;
+var63.buf = NULL;
+struct class_Str var64;
+var64.buf = NULL;
+bool var65;
+struct class_Str var68;
+var68.buf = NULL;
+struct class_Str var69;
+var69.buf = NULL;
+struct class_Token_35f69eeb49* var70;
+var70 = NULL;
+struct class_Location_500c4434c9* var71;
+var71 = NULL;
+struct class_Continue_b54f3b332e* var72;
+var72 = NULL;
+struct class_Statement_1dc2e7090f var73;
+var73.membernum = -1;
+struct class_Token_35f69eeb49* var74;
+var74 = NULL;
+struct class_Str var75;
+var75.buf = NULL;
+struct class_Str var76;
+var76.buf = NULL;
+bool var77;
+struct class_Str var80;
+var80.buf = NULL;
+struct class_Str var81;
+var81.buf = NULL;
+struct class_Token_35f69eeb49* var82;
+var82 = NULL;
+struct class_Location_500c4434c9* var83;
+var83 = NULL;
+struct class_Break_2f9897f5fd* var84;
+var84 = NULL;
+struct class_Statement_1dc2e7090f var85;
+var85.membernum = -1;
+struct class_Str var86;
+var86.buf = NULL;
+struct class__null___Str__5eca9cec4f var87;
+var87.membernum = -1;
+struct class_Expression_35f2052bf4 var88;
+var88.membernum = -1;
+struct class_Token_35f69eeb49* var89;
+var89 = NULL;
+struct class_Str var90;
+var90.buf = NULL;
+struct class_Str var91;
+var91.buf = NULL;
+bool var92;
+struct class_Str var95;
+var95.buf = NULL;
+struct class_Str var96;
+var96.buf = NULL;
+struct class_Token_35f69eeb49* var97;
+var97 = NULL;
+char var98;
+struct class__null___Str__5eca9cec4f var99;
+var99.membernum = -1;
+struct class_Expression_35f2052bf4 var100;
+var100.membernum = -1;
+bool var101;
+struct class_GetVar_642f116a6c* var105;
+var105 = NULL;
+struct class_Location_500c4434c9* var106;
+var106 = NULL;
+struct class_Str var107;
+var107.buf = NULL;
+struct class_SetVar_6a19c6f350* var108;
+var108 = NULL;
+struct class_Statement_1dc2e7090f var109;
+var109.membernum = -1;
+struct class_GetAttribute_0758070446* var110;
+var110 = NULL;
+struct class_Location_500c4434c9* var111;
+var111 = NULL;
+struct class_Expression_35f2052bf4 var112;
+var112.membernum = -1;
+struct class_Str var113;
+var113.buf = NULL;
+struct class_SetAttribute_6bd58fd9d3* var114;
+var114 = NULL;
+struct class_Statement_1dc2e7090f var115;
+var115.membernum = -1;
+struct class_Str var116;
+var116.buf = NULL;
+struct class_Str var117;
+var117.buf = NULL;
+struct class_Str var118;
+var118.buf = NULL;
+bool var119;
+struct class_Str var120;
+var120.buf = NULL;
+int64_t var121;
+struct class_Call_d0fb9d6234* var123;
+var123 = NULL;
+struct class_Statement_1dc2e7090f var124;
+var124.membernum = -1;
+struct class_Statement_1dc2e7090f retval;
+var2 = meth_Parser_d28334dc68_peek(var1);
+var3 = string8_keyword_ab52a28662; string_incref(var3);
+var4 = string62_let_63898cc654; string_incref(var4);
+var5 = meth_Token_35f69eeb49_matches(var2,var3,var4);
+if (var5) goto label6;
+if (oomph_true) goto label7;
+label6: (void)0;
+var8 = string8_keyword_ab52a28662; string_incref(var8);
+var9 = string62_let_63898cc654; string_incref(var9);
+var10 = meth_Parser_d28334dc68_get_token(var1,var8,var9);
+var11 = string12_id_5bfb53972f; string_incref(var11);
+var12 = meth_Parser_d28334dc68_get_token_by_type(var1,var11);
+var13 = var12->memb_value;
+string_incref(var13);
+var14 = string13_op_2d685dde34; string_incref(var14);
+var15 = string63___f4c9a5a296; string_incref(var15);
+var16 = meth_Parser_d28334dc68_get_token(var1,var14,var15);
+var17 = oomph_null;
+var18 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var17 }, .membernum = 0 };
+var19 = meth_Parser_d28334dc68_parse_expression(var1,var18);
+var20 = var10->memb_location;
+incref(var20);
+var21 = ctor_Let_c9da3e3372(var20,var13,var19);
+var22 = (struct class_Statement_1dc2e7090f){ .val = { .item4 = var21 }, .membernum = 4 };
+var21 = NULL;
+retval = var22; var22.membernum = -1;
+goto out;
+label7: (void)0;
+var23 = meth_Parser_d28334dc68_peek(var1);
+var24 = string8_keyword_ab52a28662; string_incref(var24);
+var25 = string64_return_53dba27a85; string_incref(var25);
+var26 = meth_Token_35f69eeb49_matches(var23,var24,var25);
+if (var26) goto label27;
+if (oomph_true) goto label28;
+label27: (void)0;
+var29 = string8_keyword_ab52a28662; string_incref(var29);
+var30 = string64_return_53dba27a85; string_incref(var30);
+var31 = meth_Parser_d28334dc68_get_token(var1,var29,var30);
+var32 = meth_Parser_d28334dc68_peek(var1);
+var33 = string13_op_2d685dde34; string_incref(var33);
+var34 = string4___45fbfd7e60; string_incref(var34);
+var35 = meth_Token_35f69eeb49_matches(var32,var33,var34);
+if (var35) goto label36;
+if (oomph_true) goto label37;
+label36: (void)0;
+var38 = var31->memb_location;
+incref(var38);
+var39 = oomph_null;
+var40 = (struct class__null___Expression__957e7d6409){ .val = { .item0 = var39 }, .membernum = 0 };
+var41 = ctor_Return_33802009cd(var38,var40);
+var42 = (struct class_Statement_1dc2e7090f){ .val = { .item7 = var41 }, .membernum = 7 };
+var41 = NULL;
+retval = var42; var42.membernum = -1;
+goto out;
+label37: (void)0;
+var43 = var31->memb_location;
+incref(var43);
+var44 = oomph_null;
+var45 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var44 }, .membernum = 0 };
+var46 = meth_Parser_d28334dc68_parse_expression(var1,var45);
+var47 = (struct class__null___Expression__957e7d6409){ .val = { .item1 = var46 }, .membernum = 1 };
+var46.membernum = -1;
+var48 = ctor_Return_33802009cd(var43,var47);
+var49 = (struct class_Statement_1dc2e7090f){ .val = { .item7 = var48 }, .membernum = 7 };
+var48 = NULL;
+retval = var49; var49.membernum = -1;
+goto out;
+label28: (void)0;
+var50 = meth_Parser_d28334dc68_peek(var1);
+var51 = string8_keyword_ab52a28662; string_incref(var51);
+var52 = string65_pass_9d222979b6; string_incref(var52);
+var53 = meth_Token_35f69eeb49_matches(var50,var51,var52);
+if (var53) goto label54;
+if (oomph_true) goto label55;
+label54: (void)0;
+var56 = string8_keyword_ab52a28662; string_incref(var56);
+var57 = string65_pass_9d222979b6; string_incref(var57);
+var58 = meth_Parser_d28334dc68_get_token(var1,var56,var57);
+var59 = var58->memb_location;
+incref(var59);
+var60 = ctor_Pass_e49950b77e(var59);
+var61 = (struct class_Statement_1dc2e7090f){ .val = { .item6 = var60 }, .membernum = 6 };
+var60 = NULL;
+retval = var61; var61.membernum = -1;
+goto out;
+label55: (void)0;
+var62 = meth_Parser_d28334dc68_peek(var1);
+var63 = string8_keyword_ab52a28662; string_incref(var63);
+var64 = string66_continue_ba82e33528; string_incref(var64);
+var65 = meth_Token_35f69eeb49_matches(var62,var63,var64);
+if (var65) goto label66;
+if (oomph_true) goto label67;
+label66: (void)0;
+var68 = string8_keyword_ab52a28662; string_incref(var68);
+var69 = string66_continue_ba82e33528; string_incref(var69);
+var70 = meth_Parser_d28334dc68_get_token(var1,var68,var69);
+var71 = var70->memb_location;
+incref(var71);
+var72 = ctor_Continue_b54f3b332e(var71);
+var73 = (struct class_Statement_1dc2e7090f){ .val = { .item2 = var72 }, .membernum = 2 };
+var72 = NULL;
+retval = var73; var73.membernum = -1;
+goto out;
+label67: (void)0;
+var74 = meth_Parser_d28334dc68_peek(var1);
+var75 = string8_keyword_ab52a28662; string_incref(var75);
+var76 = string67_break_8cab52584f; string_incref(var76);
+var77 = meth_Token_35f69eeb49_matches(var74,var75,var76);
+if (var77) goto label78;
+if (oomph_true) goto label79;
+label78: (void)0;
+var80 = string8_keyword_ab52a28662; string_incref(var80);
+var81 = string67_break_8cab52584f; string_incref(var81);
+var82 = meth_Parser_d28334dc68_get_token(var1,var80,var81);
+var83 = var82->memb_location;
+incref(var83);
+var84 = ctor_Break_2f9897f5fd(var83);
+var85 = (struct class_Statement_1dc2e7090f){ .val = { .item0 = var84 }, .membernum = 0 };
+var84 = NULL;
+retval = var85; var85.membernum = -1;
+goto out;
+label79: (void)0;
+var86 = string68_should_be_a_statement_1988c846f7; string_incref(var86);
+var87 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var86 }, .membernum = 1 };
+var86.buf = NULL;
+var88 = meth_Parser_d28334dc68_parse_expression(var1,var87);
+var89 = meth_Parser_d28334dc68_peek(var1);
+var90 = string13_op_2d685dde34; string_incref(var90);
+var91 = string63___f4c9a5a296; string_incref(var91);
+var92 = meth_Token_35f69eeb49_matches(var89,var90,var91);
+if (var92) goto label93;
+if (oomph_true) goto label94;
+label93: (void)0;
+var95 = string13_op_2d685dde34; string_incref(var95);
+var96 = string63___f4c9a5a296; string_incref(var96);
+var97 = meth_Parser_d28334dc68_get_token(var1,var95,var96);
+var98 = oomph_null;
+var99 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var98 }, .membernum = 0 };
+var100 = meth_Parser_d28334dc68_parse_expression(var1,var99);
+var19 = var100;
+var100.membernum = -1;
+
+            var101 = (
+                var88.membernum == 6
+            );
+            if (var101) goto label102;
+
+            var101 = (
+                var88.membernum == 5
+            );
+            if (var101) goto label103;
+
+            var101 = (
+                var88.membernum == 0
+            );
+            if (var101) goto label104;
+
+            var101 = (
+                var88.membernum == 1
+            );
+            if (var101) goto label104;
+
+            var101 = (
+                var88.membernum == 2
+            );
+            if (var101) goto label104;
+
+            var101 = (
+                var88.membernum == 3
+            );
+            if (var101) goto label104;
+
+            var101 = (
+                var88.membernum == 4
+            );
+            if (var101) goto label104;
+
+            var101 = (
+                var88.membernum == 7
+            );
+            if (var101) goto label104;
+
+            var101 = (
+                var88.membernum == 8
+            );
+            if (var101) goto label104;
+
+            var101 = (
+                var88.membernum == 9
+            );
+            if (var101) goto label104;
+
+            var101 = (
+                var88.membernum == 10
+            );
+            if (var101) goto label104;
+
+            var101 = (
+                var88.membernum == 11
+            );
+            if (var101) goto label104;
+
+            var101 = (
+                var88.membernum == 12
+            );
+            if (var101) goto label104;
+
+            var101 = (
+                var88.membernum == 13
+            );
+            if (var101) goto label104;
+label102: (void)0;
+
+            if (var88.membernum != 6)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var105 = var88.val.item6;
+            incref(var105);
+var106 = var97->memb_location;
+incref(var106);
+var107 = var105->memb_varname;
+string_incref(var107);
+var108 = ctor_SetVar_6a19c6f350(var106,var107,var19);
+var109 = (struct class_Statement_1dc2e7090f){ .val = { .item9 = var108 }, .membernum = 9 };
+var108 = NULL;
+retval = var109; var109.membernum = -1;
+goto out;
+label103: (void)0;
+
+            if (var88.membernum != 5)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var110 = var88.val.item5;
+            incref(var110);
+var111 = var97->memb_location;
+incref(var111);
+var112 = var110->memb_obj;
+incref_Expression_35f2052bf4(var112);
+var113 = var110->memb_attribute;
+string_incref(var113);
+var114 = ctor_SetAttribute_6bd58fd9d3(var111,var112,var113,var19);
+var115 = (struct class_Statement_1dc2e7090f){ .val = { .item8 = var114 }, .membernum = 8 };
+var114 = NULL;
+retval = var115; var115.membernum = -1;
+goto out;
+label104: (void)0;
+var116 = string69_can_t_assing_to__ff7d91fc39; string_incref(var116);
+var117 = meth_Expression_35f2052bf4_to_string(var88);
+var118 = oomph_string_concat(var116,var117);
+oomph_print(var118);
+var119 = oomph_false;
+var120 = string1_self_hosted_parser_oomph_0113086932; string_incref(var120);
+var121 = 416LL;
+oomph_assert(var119,var120,var121);
+label122: (void)0;
+label94: (void)0;
+
+            if (var88.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var123 = var88.val.item2;
+            incref(var123);
+var124 = (struct class_Statement_1dc2e7090f){ .val = { .item1 = var123 }, .membernum = 1 };
+var123 = NULL;
+retval = var124; var124.membernum = -1;
+goto out;
+out: (void)0;
+decref_Statement_1dc2e7090f(var124);
+decref((var123), dtor_Call_d0fb9d6234);
+(void)0;
+string_decref(var120);
+(void)0;
+string_decref(var118);
+string_decref(var117);
+string_decref(var116);
+decref_Statement_1dc2e7090f(var115);
+decref((var114), dtor_SetAttribute_6bd58fd9d3);
+string_decref(var113);
+decref_Expression_35f2052bf4(var112);
+decref((var111), dtor_Location_500c4434c9);
+decref((var110), dtor_GetAttribute_0758070446);
+decref_Statement_1dc2e7090f(var109);
+decref((var108), dtor_SetVar_6a19c6f350);
+string_decref(var107);
+decref((var106), dtor_Location_500c4434c9);
+decref((var105), dtor_GetVar_642f116a6c);
+(void)0;
+decref_Expression_35f2052bf4(var100);
+decref__null___Str__5eca9cec4f(var99);
+(void)0;
+decref((var97), dtor_Token_35f69eeb49);
+string_decref(var96);
+string_decref(var95);
+(void)0;
+string_decref(var91);
+string_decref(var90);
+decref((var89), dtor_Token_35f69eeb49);
+decref_Expression_35f2052bf4(var88);
+decref__null___Str__5eca9cec4f(var87);
+string_decref(var86);
+decref_Statement_1dc2e7090f(var85);
+decref((var84), dtor_Break_2f9897f5fd);
+decref((var83), dtor_Location_500c4434c9);
+decref((var82), dtor_Token_35f69eeb49);
+string_decref(var81);
+string_decref(var80);
+(void)0;
+string_decref(var76);
+string_decref(var75);
+decref((var74), dtor_Token_35f69eeb49);
+decref_Statement_1dc2e7090f(var73);
+decref((var72), dtor_Continue_b54f3b332e);
+decref((var71), dtor_Location_500c4434c9);
+decref((var70), dtor_Token_35f69eeb49);
+string_decref(var69);
+string_decref(var68);
+(void)0;
+string_decref(var64);
+string_decref(var63);
+decref((var62), dtor_Token_35f69eeb49);
+decref_Statement_1dc2e7090f(var61);
+decref((var60), dtor_Pass_e49950b77e);
+decref((var59), dtor_Location_500c4434c9);
+decref((var58), dtor_Token_35f69eeb49);
+string_decref(var57);
+string_decref(var56);
+(void)0;
+string_decref(var52);
+string_decref(var51);
+decref((var50), dtor_Token_35f69eeb49);
+decref_Statement_1dc2e7090f(var49);
+decref((var48), dtor_Return_33802009cd);
+decref__null___Expression__957e7d6409(var47);
+decref_Expression_35f2052bf4(var46);
+decref__null___Str__5eca9cec4f(var45);
+(void)0;
+decref((var43), dtor_Location_500c4434c9);
+decref_Statement_1dc2e7090f(var42);
+decref((var41), dtor_Return_33802009cd);
+decref__null___Expression__957e7d6409(var40);
+(void)0;
+decref((var38), dtor_Location_500c4434c9);
+(void)0;
+string_decref(var34);
+string_decref(var33);
+decref((var32), dtor_Token_35f69eeb49);
+decref((var31), dtor_Token_35f69eeb49);
+string_decref(var30);
+string_decref(var29);
+(void)0;
+string_decref(var25);
+string_decref(var24);
+decref((var23), dtor_Token_35f69eeb49);
+decref_Statement_1dc2e7090f(var22);
+decref((var21), dtor_Let_c9da3e3372);
+decref((var20), dtor_Location_500c4434c9);
+decref_Expression_35f2052bf4(var19);
+decref__null___Str__5eca9cec4f(var18);
+(void)0;
+decref((var16), dtor_Token_35f69eeb49);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+decref((var12), dtor_Token_35f69eeb49);
+string_decref(var11);
+decref((var10), dtor_Token_35f69eeb49);
+string_decref(var9);
+string_decref(var8);
+(void)0;
+string_decref(var4);
+string_decref(var3);
+decref((var2), dtor_Token_35f69eeb49);
+return retval;
+}struct class_Case_458b8eeee1* meth_Parser_d28334dc68_parse_case(struct class_Parser_d28334dc68* var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Token_35f69eeb49* var4;
+var4 = NULL;
+struct class_Token_35f69eeb49* var5;
+var5 = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+bool var8;
+struct class_TypeAndName_fec99b5f94* var10;
+var10 = NULL;
+struct class__null___TypeAndName__d7958d7e85 var11;
+var11.membernum = -1;
+struct class__null___TypeAndName__d7958d7e85 var12;
+var12.membernum = -1;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Token_35f69eeb49* var16;
+var16 = NULL;
+char var17;
+struct class_List_Statement__5d7503c104* var18;
+var18 = NULL;
+struct class_Location_500c4434c9* var19;
+var19 = NULL;
+struct class_Case_458b8eeee1* var20;
+var20 = NULL;
+struct class_Case_458b8eeee1* retval;
+var2 = string8_keyword_ab52a28662; string_incref(var2);
+var3 = string70_case_61d92c9fac; string_incref(var3);
+var4 = meth_Parser_d28334dc68_get_token(var1,var2,var3);
+var5 = meth_Parser_d28334dc68_peek(var1);
+var6 = string13_op_2d685dde34; string_incref(var6);
+var7 = string50___d3b1146f27; string_incref(var7);
+var8 = meth_Token_35f69eeb49_matches(var5,var6,var7);
+if (var8) goto label9;
+var10 = meth_Parser_d28334dc68_parse_type_and_name(var1);
+var11 = (struct class__null___TypeAndName__d7958d7e85){ .val = { .item1 = var10 }, .membernum = 1 };
+var10 = NULL;
+var12 = var11;
+var11.membernum = -1;
+if (oomph_true) goto label13;
+label9: (void)0;
+var14 = string13_op_2d685dde34; string_incref(var14);
+var15 = string50___d3b1146f27; string_incref(var15);
+var16 = meth_Parser_d28334dc68_get_token(var1,var14,var15);
+var17 = oomph_null;
+var12 = (struct class__null___TypeAndName__d7958d7e85){ .val = { .item0 = var17 }, .membernum = 0 };
+label13: (void)0;
+var18 = meth_Parser_d28334dc68_parse_block_of_statements(var1);
+var19 = var4->memb_location;
+incref(var19);
+var20 = ctor_Case_458b8eeee1(var19,var12,var18);
+retval = var20; var20 = NULL;
+goto out;
+out: (void)0;
+decref((var20), dtor_Case_458b8eeee1);
+decref((var19), dtor_Location_500c4434c9);
+decref((var18), dtor_List_Statement__5d7503c104);
+(void)0;
+decref((var16), dtor_Token_35f69eeb49);
+string_decref(var15);
+string_decref(var14);
+decref__null___TypeAndName__d7958d7e85(var12);
+decref__null___TypeAndName__d7958d7e85(var11);
+decref((var10), dtor_TypeAndName_fec99b5f94);
+(void)0;
+string_decref(var7);
+string_decref(var6);
+decref((var5), dtor_Token_35f69eeb49);
+decref((var4), dtor_Token_35f69eeb49);
+string_decref(var3);
+string_decref(var2);
+return retval;
+}struct class_LoopHeader_23fd592271 meth_Parser_d28334dc68_parse_loop_header(struct class_Parser_d28334dc68* var1){struct class_Token_35f69eeb49* var2;
+var2 = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+bool var5;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Token_35f69eeb49* var10;
+var10 = NULL;
+struct class_Location_500c4434c9* var11;
+var11 = NULL;
+struct class_List_Statement__5d7503c104* var12;
+var12 = NULL;
+char var13;
+struct class__null___Str__5eca9cec4f var14;
+var14.membernum = -1;
+struct class_Expression_35f2052bf4 var15;
+var15.membernum = -1;
+struct class_List_Statement__5d7503c104* var16;
+var16 = NULL;
+struct class__null___Expression__957e7d6409 var17;
+var17.membernum = -1;
+struct class_ForLoopHeader_79606b2adb* var18;
+var18 = NULL;
+struct class_LoopHeader_23fd592271 var19;
+var19.membernum = -1;
+struct class_Token_35f69eeb49* var20;
+var20 = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+bool var23;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+struct class_Token_35f69eeb49* var28;
+var28 = NULL;
+struct class_Location_500c4434c9* var29;
+var29 = NULL;
+struct class_Token_35f69eeb49* var30;
+var30 = NULL;
+struct class_Str var31;
+var31.buf = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+bool var33;
+struct class_Statement_1dc2e7090f var35;
+var35.membernum = -1;
+struct class_List_Statement__5d7503c104* var36;
+var36 = NULL;
+struct class_List_Statement__5d7503c104* var37;
+var37 = NULL;
+struct class_Str var39;
+var39.buf = NULL;
+struct class_Str var40;
+var40.buf = NULL;
+struct class_Token_35f69eeb49* var41;
+var41 = NULL;
+struct class_Token_35f69eeb49* var42;
+var42 = NULL;
+struct class_Str var43;
+var43.buf = NULL;
+struct class_Str var44;
+var44.buf = NULL;
+bool var45;
+char var47;
+struct class__null___Str__5eca9cec4f var48;
+var48.membernum = -1;
+struct class_Expression_35f2052bf4 var49;
+var49.membernum = -1;
+struct class__null___Expression__957e7d6409 var50;
+var50.membernum = -1;
+struct class__null___Expression__957e7d6409 var51;
+var51.membernum = -1;
+char var53;
+struct class_Str var54;
+var54.buf = NULL;
+struct class_Str var55;
+var55.buf = NULL;
+struct class_Token_35f69eeb49* var56;
+var56 = NULL;
+struct class_Token_35f69eeb49* var57;
+var57 = NULL;
+struct class_Str var58;
+var58.buf = NULL;
+struct class_Str var59;
+var59.buf = NULL;
+bool var60;
+struct class_Statement_1dc2e7090f var62;
+var62.membernum = -1;
+struct class_List_Statement__5d7503c104* var63;
+var63 = NULL;
+struct class_List_Statement__5d7503c104* var64;
+var64 = NULL;
+struct class_ForLoopHeader_79606b2adb* var66;
+var66 = NULL;
+struct class_LoopHeader_23fd592271 var67;
+var67.membernum = -1;
+struct class_Token_35f69eeb49* var68;
+var68 = NULL;
+struct class_Str var69;
+var69.buf = NULL;
+struct class_Str var70;
+var70.buf = NULL;
+bool var71;
+struct class_Str var74;
+var74.buf = NULL;
+struct class_Str var75;
+var75.buf = NULL;
+struct class_Token_35f69eeb49* var76;
+var76 = NULL;
+struct class_Location_500c4434c9* var77;
+var77 = NULL;
+struct class_Str var78;
+var78.buf = NULL;
+struct class_Token_35f69eeb49* var79;
+var79 = NULL;
+struct class_Str var80;
+var80.buf = NULL;
+struct class_Str var81;
+var81.buf = NULL;
+struct class_Str var82;
+var82.buf = NULL;
+struct class_Token_35f69eeb49* var83;
+var83 = NULL;
+char var84;
+struct class__null___Str__5eca9cec4f var85;
+var85.membernum = -1;
+struct class_Expression_35f2052bf4 var86;
+var86.membernum = -1;
+struct class_ForeachLoopHeader_ebcb7f3325* var87;
+var87 = NULL;
+struct class_LoopHeader_23fd592271 var88;
+var88.membernum = -1;
+bool var89;
+struct class_Str var90;
+var90.buf = NULL;
+int64_t var91;
+struct class_LoopHeader_23fd592271 retval;
+var2 = meth_Parser_d28334dc68_peek(var1);
+var3 = string8_keyword_ab52a28662; string_incref(var3);
+var4 = string39_while_93e771812f; string_incref(var4);
+var5 = meth_Token_35f69eeb49_matches(var2,var3,var4);
+if (var5) goto label6;
+if (oomph_true) goto label7;
+label6: (void)0;
+var8 = string8_keyword_ab52a28662; string_incref(var8);
+var9 = string39_while_93e771812f; string_incref(var9);
+var10 = meth_Parser_d28334dc68_get_token(var1,var8,var9);
+var11 = var10->memb_location;
+incref(var11);
+var12 = ctor_List_Statement__5d7503c104();
+var13 = oomph_null;
+var14 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var13 }, .membernum = 0 };
+var15 = meth_Parser_d28334dc68_parse_expression(var1,var14);
+var16 = ctor_List_Statement__5d7503c104();
+var17 = (struct class__null___Expression__957e7d6409){ .val = { .item1 = var15 }, .membernum = 1 };
+var15.membernum = -1;
+var18 = ctor_ForLoopHeader_79606b2adb(var11,var12,var17,var16);
+var19 = (struct class_LoopHeader_23fd592271){ .val = { .item0 = var18 }, .membernum = 0 };
+var18 = NULL;
+retval = var19; var19.membernum = -1;
+goto out;
+label7: (void)0;
+var20 = meth_Parser_d28334dc68_peek(var1);
+var21 = string8_keyword_ab52a28662; string_incref(var21);
+var22 = string40_for_4e6e4e6d32; string_incref(var22);
+var23 = meth_Token_35f69eeb49_matches(var20,var21,var22);
+if (var23) goto label24;
+if (oomph_true) goto label25;
+label24: (void)0;
+var26 = string8_keyword_ab52a28662; string_incref(var26);
+var27 = string40_for_4e6e4e6d32; string_incref(var27);
+var28 = meth_Parser_d28334dc68_get_token(var1,var26,var27);
+var29 = var28->memb_location;
+incref(var29);
+var30 = meth_Parser_d28334dc68_peek(var1);
+var31 = string13_op_2d685dde34; string_incref(var31);
+var32 = string71___82ce2bf515; string_incref(var32);
+var33 = meth_Token_35f69eeb49_matches(var30,var31,var32);
+if (var33) goto label34;
+var35 = meth_Parser_d28334dc68_parse_oneline_ish_statement(var1);
+var36 = ctor_List_Statement__5d7503c104();
+meth_List_Statement__5d7503c104_push(var36,var35);
+var37 = var36;
+var36 = NULL;
+if (oomph_true) goto label38;
+label34: (void)0;
+var37 = ctor_List_Statement__5d7503c104();
+label38: (void)0;
+var39 = string13_op_2d685dde34; string_incref(var39);
+var40 = string71___82ce2bf515; string_incref(var40);
+var41 = meth_Parser_d28334dc68_get_token(var1,var39,var40);
+var42 = meth_Parser_d28334dc68_peek(var1);
+var43 = string13_op_2d685dde34; string_incref(var43);
+var44 = string71___82ce2bf515; string_incref(var44);
+var45 = meth_Token_35f69eeb49_matches(var42,var43,var44);
+if (var45) goto label46;
+var47 = oomph_null;
+var48 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var47 }, .membernum = 0 };
+var49 = meth_Parser_d28334dc68_parse_expression(var1,var48);
+var50 = (struct class__null___Expression__957e7d6409){ .val = { .item1 = var49 }, .membernum = 1 };
+var49.membernum = -1;
+var51 = var50;
+var50.membernum = -1;
+if (oomph_true) goto label52;
+label46: (void)0;
+var53 = oomph_null;
+var51 = (struct class__null___Expression__957e7d6409){ .val = { .item0 = var53 }, .membernum = 0 };
+label52: (void)0;
+var54 = string13_op_2d685dde34; string_incref(var54);
+var55 = string71___82ce2bf515; string_incref(var55);
+var56 = meth_Parser_d28334dc68_get_token(var1,var54,var55);
+var57 = meth_Parser_d28334dc68_peek(var1);
+var58 = string23_begin_block_cd4b098ac0; string_incref(var58);
+var59 = string24___dc60150654; string_incref(var59);
+var60 = meth_Token_35f69eeb49_matches(var57,var58,var59);
+if (var60) goto label61;
+var62 = meth_Parser_d28334dc68_parse_oneline_ish_statement(var1);
+var63 = ctor_List_Statement__5d7503c104();
+meth_List_Statement__5d7503c104_push(var63,var62);
+var64 = var63;
+var63 = NULL;
+if (oomph_true) goto label65;
+label61: (void)0;
+var64 = ctor_List_Statement__5d7503c104();
+label65: (void)0;
+var66 = ctor_ForLoopHeader_79606b2adb(var29,var37,var51,var64);
+var67 = (struct class_LoopHeader_23fd592271){ .val = { .item0 = var66 }, .membernum = 0 };
+var66 = NULL;
+retval = var67; var67.membernum = -1;
+goto out;
+label25: (void)0;
+var68 = meth_Parser_d28334dc68_peek(var1);
+var69 = string8_keyword_ab52a28662; string_incref(var69);
+var70 = string41_foreach_2b3e8a8a16; string_incref(var70);
+var71 = meth_Token_35f69eeb49_matches(var68,var69,var70);
+if (var71) goto label72;
+if (oomph_true) goto label73;
+label72: (void)0;
+var74 = string8_keyword_ab52a28662; string_incref(var74);
+var75 = string41_foreach_2b3e8a8a16; string_incref(var75);
+var76 = meth_Parser_d28334dc68_get_token(var1,var74,var75);
+var77 = var76->memb_location;
+incref(var77);
+var78 = string12_id_5bfb53972f; string_incref(var78);
+var79 = meth_Parser_d28334dc68_get_token_by_type(var1,var78);
+var80 = var79->memb_value;
+string_incref(var80);
+var81 = string8_keyword_ab52a28662; string_incref(var81);
+var82 = string72_of_31faf8f347; string_incref(var82);
+var83 = meth_Parser_d28334dc68_get_token(var1,var81,var82);
+var84 = oomph_null;
+var85 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var84 }, .membernum = 0 };
+var86 = meth_Parser_d28334dc68_parse_expression(var1,var85);
+var87 = ctor_ForeachLoopHeader_ebcb7f3325(var77,var80,var86);
+var88 = (struct class_LoopHeader_23fd592271){ .val = { .item1 = var87 }, .membernum = 1 };
+var87 = NULL;
+retval = var88; var88.membernum = -1;
+goto out;
+label73: (void)0;
+var89 = oomph_false;
+var90 = string1_self_hosted_parser_oomph_0113086932; string_incref(var90);
+var91 = 463LL;
+oomph_assert(var89,var90,var91);
+out: (void)0;
+(void)0;
+string_decref(var90);
+(void)0;
+decref_LoopHeader_23fd592271(var88);
+decref((var87), dtor_ForeachLoopHeader_ebcb7f3325);
+decref_Expression_35f2052bf4(var86);
+decref__null___Str__5eca9cec4f(var85);
+(void)0;
+decref((var83), dtor_Token_35f69eeb49);
+string_decref(var82);
+string_decref(var81);
+string_decref(var80);
+decref((var79), dtor_Token_35f69eeb49);
+string_decref(var78);
+decref((var77), dtor_Location_500c4434c9);
+decref((var76), dtor_Token_35f69eeb49);
+string_decref(var75);
+string_decref(var74);
+(void)0;
+string_decref(var70);
+string_decref(var69);
+decref((var68), dtor_Token_35f69eeb49);
+decref_LoopHeader_23fd592271(var67);
+decref((var66), dtor_ForLoopHeader_79606b2adb);
+decref((var64), dtor_List_Statement__5d7503c104);
+decref((var63), dtor_List_Statement__5d7503c104);
+decref_Statement_1dc2e7090f(var62);
+(void)0;
+string_decref(var59);
+string_decref(var58);
+decref((var57), dtor_Token_35f69eeb49);
+decref((var56), dtor_Token_35f69eeb49);
+string_decref(var55);
+string_decref(var54);
+(void)0;
+decref__null___Expression__957e7d6409(var51);
+decref__null___Expression__957e7d6409(var50);
+decref_Expression_35f2052bf4(var49);
+decref__null___Str__5eca9cec4f(var48);
+(void)0;
+(void)0;
+string_decref(var44);
+string_decref(var43);
+decref((var42), dtor_Token_35f69eeb49);
+decref((var41), dtor_Token_35f69eeb49);
+string_decref(var40);
+string_decref(var39);
+decref((var37), dtor_List_Statement__5d7503c104);
+decref((var36), dtor_List_Statement__5d7503c104);
+decref_Statement_1dc2e7090f(var35);
+(void)0;
+string_decref(var32);
+string_decref(var31);
+decref((var30), dtor_Token_35f69eeb49);
+decref((var29), dtor_Location_500c4434c9);
+decref((var28), dtor_Token_35f69eeb49);
+string_decref(var27);
+string_decref(var26);
+(void)0;
+string_decref(var22);
+string_decref(var21);
+decref((var20), dtor_Token_35f69eeb49);
+decref_LoopHeader_23fd592271(var19);
+decref((var18), dtor_ForLoopHeader_79606b2adb);
+decref__null___Expression__957e7d6409(var17);
+decref((var16), dtor_List_Statement__5d7503c104);
+decref_Expression_35f2052bf4(var15);
+decref__null___Str__5eca9cec4f(var14);
+(void)0;
+decref((var12), dtor_List_Statement__5d7503c104);
+decref((var11), dtor_Location_500c4434c9);
+decref((var10), dtor_Token_35f69eeb49);
+string_decref(var9);
+string_decref(var8);
+(void)0;
+string_decref(var4);
+string_decref(var3);
+decref((var2), dtor_Token_35f69eeb49);
+return retval;
+}struct class_List_Statement__5d7503c104* meth_Parser_d28334dc68_parse_statement(struct class_Parser_d28334dc68* var1){struct class_Token_35f69eeb49* var2;
+var2 = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+bool var5;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Token_35f69eeb49* var10;
+var10 = NULL;
+char var11;
+struct class__null___Str__5eca9cec4f var12;
+var12.membernum = -1;
+struct class_Expression_35f2052bf4 var13;
+var13.membernum = -1;
+struct class_List_Statement__5d7503c104* var14;
+var14 = NULL;
+struct class_Location_500c4434c9* var15;
+var15 = NULL;
+struct class_ConditionAndBody_0e2f888e06* var16;
+var16 = NULL;
+struct class_List_ConditionAndBody__ad79dde1db* var17;
+var17 = NULL;
+struct class_Token_35f69eeb49* var19;
+var19 = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+bool var22;
+bool var23;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_Token_35f69eeb49* var27;
+var27 = NULL;
+char var28;
+struct class_Expression_35f2052bf4 var29;
+var29.membernum = -1;
+struct class__null___Str__5eca9cec4f var30;
+var30.membernum = -1;
+struct class_List_Statement__5d7503c104* var31;
+var31 = NULL;
+struct class_Location_500c4434c9* var32;
+var32 = NULL;
+struct class_ConditionAndBody_0e2f888e06* var33;
+var33 = NULL;
+struct class_Token_35f69eeb49* var34;
+var34 = NULL;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+bool var37;
+struct class_List_Statement__5d7503c104* var39;
+var39 = NULL;
+struct class_List_Statement__5d7503c104* var40;
+var40 = NULL;
+struct class_Str var42;
+var42.buf = NULL;
+struct class_Str var43;
+var43.buf = NULL;
+struct class_Token_35f69eeb49* var44;
+var44 = NULL;
+struct class_If_8811dba942* var45;
+var45 = NULL;
+struct class_Statement_1dc2e7090f var46;
+var46.membernum = -1;
+struct class_List_Statement__5d7503c104* var47;
+var47 = NULL;
+struct class_Token_35f69eeb49* var48;
+var48 = NULL;
+struct class_Str var49;
+var49.buf = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+bool var51;
+struct class_Token_35f69eeb49* var53;
+var53 = NULL;
+struct class_Str var54;
+var54.buf = NULL;
+struct class_Str var55;
+var55.buf = NULL;
+bool var56;
+bool var57;
+struct class_Token_35f69eeb49* var60;
+var60 = NULL;
+struct class_Str var61;
+var61.buf = NULL;
+struct class_Str var62;
+var62.buf = NULL;
+bool var63;
+bool var64;
+struct class_LoopHeader_23fd592271 var68;
+var68.membernum = -1;
+struct class_List_Statement__5d7503c104* var69;
+var69 = NULL;
+struct class_Loop_80080d5f12* var70;
+var70 = NULL;
+struct class_Statement_1dc2e7090f var71;
+var71.membernum = -1;
+struct class_List_Statement__5d7503c104* var72;
+var72 = NULL;
+struct class_Token_35f69eeb49* var73;
+var73 = NULL;
+struct class_Str var74;
+var74.buf = NULL;
+struct class_Str var75;
+var75.buf = NULL;
+bool var76;
+struct class_Str var79;
+var79.buf = NULL;
+struct class_Str var80;
+var80.buf = NULL;
+struct class_Token_35f69eeb49* var81;
+var81 = NULL;
+struct class_Location_500c4434c9* var82;
+var82 = NULL;
+char var83;
+struct class__null___Str__5eca9cec4f var84;
+var84.membernum = -1;
+struct class_Expression_35f2052bf4 var85;
+var85.membernum = -1;
+struct class_List_Case__f5a6b4b2ec* var86;
+var86 = NULL;
+struct class_Switch_9b8c881aeb* var87;
+var87 = NULL;
+struct class_Statement_1dc2e7090f var88;
+var88.membernum = -1;
+struct class_List_Statement__5d7503c104* var89;
+var89 = NULL;
+struct class_Statement_1dc2e7090f var90;
+var90.membernum = -1;
+struct class_Str var91;
+var91.buf = NULL;
+struct class_Str var92;
+var92.buf = NULL;
+struct class_Token_35f69eeb49* var93;
+var93 = NULL;
+struct class_List_Statement__5d7503c104* var94;
+var94 = NULL;
+struct class_List_Statement__5d7503c104* retval;
+var2 = meth_Parser_d28334dc68_peek(var1);
+var3 = string8_keyword_ab52a28662; string_incref(var3);
+var4 = string73_if_835dc10143; string_incref(var4);
+var5 = meth_Token_35f69eeb49_matches(var2,var3,var4);
+if (var5) goto label6;
+if (oomph_true) goto label7;
+label6: (void)0;
+var8 = string8_keyword_ab52a28662; string_incref(var8);
+var9 = string73_if_835dc10143; string_incref(var9);
+var10 = meth_Parser_d28334dc68_get_token(var1,var8,var9);
+var11 = oomph_null;
+var12 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var11 }, .membernum = 0 };
+var13 = meth_Parser_d28334dc68_parse_expression(var1,var12);
+var14 = meth_Parser_d28334dc68_parse_block_of_statements(var1);
+var15 = var10->memb_location;
+incref(var15);
+var16 = ctor_ConditionAndBody_0e2f888e06(var15,var13,var14);
+var17 = ctor_List_ConditionAndBody__ad79dde1db();
+meth_List_ConditionAndBody__ad79dde1db_push(var17,var16);
+label18: (void)0;
+decref((var19), dtor_Token_35f69eeb49);
+var19 = NULL;
+var19 = meth_Parser_d28334dc68_peek(var1);
+string_decref(var20);
+var20.buf = NULL;
+var20 = string8_keyword_ab52a28662; string_incref(var20);
+string_decref(var21);
+var21.buf = NULL;
+var21 = string74_elif_2fe910af23; string_incref(var21);
+var22 = meth_Token_35f69eeb49_matches(var19,var20,var21);
+var23 = oomph_bool_not(var22);
+if (var23) goto label24;
+string_decref(var25);
+var25.buf = NULL;
+var25 = string8_keyword_ab52a28662; string_incref(var25);
+string_decref(var26);
+var26.buf = NULL;
+var26 = string74_elif_2fe910af23; string_incref(var26);
+decref((var27), dtor_Token_35f69eeb49);
+var27 = NULL;
+var27 = meth_Parser_d28334dc68_get_token(var1,var25,var26);
+var28 = oomph_null;
+decref_Expression_35f2052bf4(var29);
+var29.membernum = -1;
+decref__null___Str__5eca9cec4f(var30);
+var30.membernum = -1;
+var30 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var28 }, .membernum = 0 };
+var29 = meth_Parser_d28334dc68_parse_expression(var1,var30);
+decref((var31), dtor_List_Statement__5d7503c104);
+var31 = NULL;
+var31 = meth_Parser_d28334dc68_parse_block_of_statements(var1);
+decref((var32), dtor_Location_500c4434c9);
+var32 = NULL;
+var32 = var27->memb_location;
+incref(var32);
+decref((var33), dtor_ConditionAndBody_0e2f888e06);
+var33 = NULL;
+var33 = ctor_ConditionAndBody_0e2f888e06(var32,var29,var31);
+meth_List_ConditionAndBody__ad79dde1db_push(var17,var33);
+if (oomph_true) goto label18;
+label24: (void)0;
+var34 = meth_Parser_d28334dc68_peek(var1);
+var35 = string8_keyword_ab52a28662; string_incref(var35);
+var36 = string75_else_fff4acf85d; string_incref(var36);
+var37 = meth_Token_35f69eeb49_matches(var34,var35,var36);
+if (var37) goto label38;
+var39 = ctor_List_Statement__5d7503c104();
+var40 = var39;
+var39 = NULL;
+if (oomph_true) goto label41;
+label38: (void)0;
+var42 = string8_keyword_ab52a28662; string_incref(var42);
+var43 = string75_else_fff4acf85d; string_incref(var43);
+var44 = meth_Parser_d28334dc68_get_token(var1,var42,var43);
+var40 = meth_Parser_d28334dc68_parse_block_of_statements(var1);
+label41: (void)0;
+var45 = ctor_If_8811dba942(var17,var40);
+var46 = (struct class_Statement_1dc2e7090f){ .val = { .item3 = var45 }, .membernum = 3 };
+var45 = NULL;
+var47 = ctor_List_Statement__5d7503c104();
+meth_List_Statement__5d7503c104_push(var47,var46);
+retval = var47; var47 = NULL;
+goto out;
+label7: (void)0;
+var48 = meth_Parser_d28334dc68_peek(var1);
+var49 = string8_keyword_ab52a28662; string_incref(var49);
+var50 = string39_while_93e771812f; string_incref(var50);
+var51 = meth_Token_35f69eeb49_matches(var48,var49,var50);
+if (var51) goto label52;
+var53 = meth_Parser_d28334dc68_peek(var1);
+var54 = string8_keyword_ab52a28662; string_incref(var54);
+var55 = string40_for_4e6e4e6d32; string_incref(var55);
+var56 = meth_Token_35f69eeb49_matches(var53,var54,var55);
+var57 = var56;
+if (oomph_true) goto label58;
+label52: (void)0;
+var57 = oomph_true;
+label58: (void)0;
+if (var57) goto label59;
+var60 = meth_Parser_d28334dc68_peek(var1);
+var61 = string8_keyword_ab52a28662; string_incref(var61);
+var62 = string41_foreach_2b3e8a8a16; string_incref(var62);
+var63 = meth_Token_35f69eeb49_matches(var60,var61,var62);
+var64 = var63;
+if (oomph_true) goto label65;
+label59: (void)0;
+var64 = oomph_true;
+label65: (void)0;
+if (var64) goto label66;
+if (oomph_true) goto label67;
+label66: (void)0;
+var68 = meth_Parser_d28334dc68_parse_loop_header(var1);
+var69 = meth_Parser_d28334dc68_parse_block_of_statements(var1);
+var70 = ctor_Loop_80080d5f12(var68,var69);
+var71 = (struct class_Statement_1dc2e7090f){ .val = { .item5 = var70 }, .membernum = 5 };
+var70 = NULL;
+var72 = ctor_List_Statement__5d7503c104();
+meth_List_Statement__5d7503c104_push(var72,var71);
+retval = var72; var72 = NULL;
+goto out;
+label67: (void)0;
+var73 = meth_Parser_d28334dc68_peek(var1);
+var74 = string8_keyword_ab52a28662; string_incref(var74);
+var75 = string76_switch_dd2abe5bf9; string_incref(var75);
+var76 = meth_Token_35f69eeb49_matches(var73,var74,var75);
+if (var76) goto label77;
+if (oomph_true) goto label78;
+label77: (void)0;
+var79 = string8_keyword_ab52a28662; string_incref(var79);
+var80 = string76_switch_dd2abe5bf9; string_incref(var80);
+var81 = meth_Parser_d28334dc68_get_token(var1,var79,var80);
+var82 = var81->memb_location;
+incref(var82);
+var83 = oomph_null;
+var84 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var83 }, .membernum = 0 };
+var85 = meth_Parser_d28334dc68_parse_expression(var1,var84);
+var86 = meth_Parser_d28334dc68_parse_block_of_cases(var1);
+var87 = ctor_Switch_9b8c881aeb(var82,var85,var86);
+var88 = (struct class_Statement_1dc2e7090f){ .val = { .item10 = var87 }, .membernum = 10 };
+var87 = NULL;
+var89 = ctor_List_Statement__5d7503c104();
+meth_List_Statement__5d7503c104_push(var89,var88);
+retval = var89; var89 = NULL;
+goto out;
+label78: (void)0;
+var90 = meth_Parser_d28334dc68_parse_oneline_ish_statement(var1);
+var91 = string13_op_2d685dde34; string_incref(var91);
+var92 = string4___45fbfd7e60; string_incref(var92);
+var93 = meth_Parser_d28334dc68_get_token(var1,var91,var92);
+var94 = ctor_List_Statement__5d7503c104();
+meth_List_Statement__5d7503c104_push(var94,var90);
+retval = var94; var94 = NULL;
+goto out;
+out: (void)0;
+decref((var94), dtor_List_Statement__5d7503c104);
+decref((var93), dtor_Token_35f69eeb49);
+string_decref(var92);
+string_decref(var91);
+decref_Statement_1dc2e7090f(var90);
+decref((var89), dtor_List_Statement__5d7503c104);
+decref_Statement_1dc2e7090f(var88);
+decref((var87), dtor_Switch_9b8c881aeb);
+decref((var86), dtor_List_Case__f5a6b4b2ec);
+decref_Expression_35f2052bf4(var85);
+decref__null___Str__5eca9cec4f(var84);
+(void)0;
+decref((var82), dtor_Location_500c4434c9);
+decref((var81), dtor_Token_35f69eeb49);
+string_decref(var80);
+string_decref(var79);
+(void)0;
+string_decref(var75);
+string_decref(var74);
+decref((var73), dtor_Token_35f69eeb49);
+decref((var72), dtor_List_Statement__5d7503c104);
+decref_Statement_1dc2e7090f(var71);
+decref((var70), dtor_Loop_80080d5f12);
+decref((var69), dtor_List_Statement__5d7503c104);
+decref_LoopHeader_23fd592271(var68);
+(void)0;
+(void)0;
+string_decref(var62);
+string_decref(var61);
+decref((var60), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+string_decref(var55);
+string_decref(var54);
+decref((var53), dtor_Token_35f69eeb49);
+(void)0;
+string_decref(var50);
+string_decref(var49);
+decref((var48), dtor_Token_35f69eeb49);
+decref((var47), dtor_List_Statement__5d7503c104);
+decref_Statement_1dc2e7090f(var46);
+decref((var45), dtor_If_8811dba942);
+decref((var44), dtor_Token_35f69eeb49);
+string_decref(var43);
+string_decref(var42);
+decref((var40), dtor_List_Statement__5d7503c104);
+decref((var39), dtor_List_Statement__5d7503c104);
+(void)0;
+string_decref(var36);
+string_decref(var35);
+decref((var34), dtor_Token_35f69eeb49);
+decref((var33), dtor_ConditionAndBody_0e2f888e06);
+decref((var32), dtor_Location_500c4434c9);
+decref((var31), dtor_List_Statement__5d7503c104);
+decref__null___Str__5eca9cec4f(var30);
+decref_Expression_35f2052bf4(var29);
+(void)0;
+decref((var27), dtor_Token_35f69eeb49);
+string_decref(var26);
+string_decref(var25);
+(void)0;
+(void)0;
+string_decref(var21);
+string_decref(var20);
+decref((var19), dtor_Token_35f69eeb49);
+decref((var17), dtor_List_ConditionAndBody__ad79dde1db);
+decref((var16), dtor_ConditionAndBody_0e2f888e06);
+decref((var15), dtor_Location_500c4434c9);
+decref((var14), dtor_List_Statement__5d7503c104);
+decref_Expression_35f2052bf4(var13);
+decref__null___Str__5eca9cec4f(var12);
+(void)0;
+decref((var10), dtor_Token_35f69eeb49);
+string_decref(var9);
+string_decref(var8);
+(void)0;
+string_decref(var4);
+string_decref(var3);
+decref((var2), dtor_Token_35f69eeb49);
+return retval;
+}struct class_Type_e6cf7dd4e5 meth_Parser_d28334dc68_parse_type_without_unions(struct class_Parser_d28334dc68* var1){struct class_Token_35f69eeb49* var2;
+var2 = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+bool var5;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Token_35f69eeb49* var10;
+var10 = NULL;
+struct class_Type_e6cf7dd4e5 var11;
+var11.membernum = -1;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Token_35f69eeb49* var14;
+var14 = NULL;
+struct class_Token_35f69eeb49* var15;
+var15 = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+bool var18;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Token_35f69eeb49* var23;
+var23 = NULL;
+struct class_Location_500c4434c9* var24;
+var24 = NULL;
+struct class_AutoType_39f5d793d6* var25;
+var25 = NULL;
+struct class_Type_e6cf7dd4e5 var26;
+var26.membernum = -1;
+struct class_Str var27;
+var27.buf = NULL;
+struct class_Token_35f69eeb49* var28;
+var28 = NULL;
+struct class_Token_35f69eeb49* var29;
+var29 = NULL;
+struct class_Str var30;
+var30.buf = NULL;
+struct class_Str var31;
+var31.buf = NULL;
+bool var32;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+struct class_Token_35f69eeb49* var37;
+var37 = NULL;
+struct class_Type_e6cf7dd4e5 var38;
+var38.membernum = -1;
+struct class_Str var39;
+var39.buf = NULL;
+struct class_Str var40;
+var40.buf = NULL;
+struct class_Token_35f69eeb49* var41;
+var41 = NULL;
+struct class_Location_500c4434c9* var42;
+var42 = NULL;
+struct class_Location_500c4434c9* var43;
+var43 = NULL;
+struct class_Location_500c4434c9* var44;
+var44 = NULL;
+struct class_Str var45;
+var45.buf = NULL;
+struct class_GenericType_f44d8197cb* var46;
+var46 = NULL;
+struct class_Type_e6cf7dd4e5 var47;
+var47.membernum = -1;
+struct class_Location_500c4434c9* var48;
+var48 = NULL;
+struct class_Str var49;
+var49.buf = NULL;
+struct class_NamedType_0d620e38a7* var50;
+var50 = NULL;
+struct class_Type_e6cf7dd4e5 var51;
+var51.membernum = -1;
+struct class_Type_e6cf7dd4e5 retval;
+var2 = meth_Parser_d28334dc68_peek(var1);
+var3 = string13_op_2d685dde34; string_incref(var3);
+var4 = string21___f5039684f7; string_incref(var4);
+var5 = meth_Token_35f69eeb49_matches(var2,var3,var4);
+if (var5) goto label6;
+if (oomph_true) goto label7;
+label6: (void)0;
+var8 = string13_op_2d685dde34; string_incref(var8);
+var9 = string21___f5039684f7; string_incref(var9);
+var10 = meth_Parser_d28334dc68_get_token(var1,var8,var9);
+var11 = meth_Parser_d28334dc68_parse_type(var1);
+var12 = string13_op_2d685dde34; string_incref(var12);
+var13 = string22___6ec62f9ee6; string_incref(var13);
+var14 = meth_Parser_d28334dc68_get_token(var1,var12,var13);
+retval = var11; var11.membernum = -1;
+goto out;
+label7: (void)0;
+var15 = meth_Parser_d28334dc68_peek(var1);
+var16 = string8_keyword_ab52a28662; string_incref(var16);
+var17 = string77_auto_6a7b878add; string_incref(var17);
+var18 = meth_Token_35f69eeb49_matches(var15,var16,var17);
+if (var18) goto label19;
+if (oomph_true) goto label20;
+label19: (void)0;
+var21 = string8_keyword_ab52a28662; string_incref(var21);
+var22 = string77_auto_6a7b878add; string_incref(var22);
+var23 = meth_Parser_d28334dc68_get_token(var1,var21,var22);
+var24 = var23->memb_location;
+incref(var24);
+var25 = ctor_AutoType_39f5d793d6(var24);
+var26 = (struct class_Type_e6cf7dd4e5){ .val = { .item0 = var25 }, .membernum = 0 };
+var25 = NULL;
+retval = var26; var26.membernum = -1;
+goto out;
+label20: (void)0;
+var27 = string12_id_5bfb53972f; string_incref(var27);
+var28 = meth_Parser_d28334dc68_get_token_by_type(var1,var27);
+var29 = meth_Parser_d28334dc68_peek(var1);
+var30 = string13_op_2d685dde34; string_incref(var30);
+var31 = string38___fa376e52cd; string_incref(var31);
+var32 = meth_Token_35f69eeb49_matches(var29,var30,var31);
+if (var32) goto label33;
+if (oomph_true) goto label34;
+label33: (void)0;
+var35 = string13_op_2d685dde34; string_incref(var35);
+var36 = string38___fa376e52cd; string_incref(var36);
+var37 = meth_Parser_d28334dc68_get_token(var1,var35,var36);
+var38 = meth_Parser_d28334dc68_parse_type(var1);
+var39 = string13_op_2d685dde34; string_incref(var39);
+var40 = string42___64da0476a2; string_incref(var40);
+var41 = meth_Parser_d28334dc68_get_token(var1,var39,var40);
+var42 = var28->memb_location;
+incref(var42);
+var43 = var41->memb_location;
+incref(var43);
+var44 = meth_Location_500c4434c9_combine(var42,var43);
+var45 = var28->memb_value;
+string_incref(var45);
+var46 = ctor_GenericType_f44d8197cb(var44,var45,var38);
+var47 = (struct class_Type_e6cf7dd4e5){ .val = { .item1 = var46 }, .membernum = 1 };
+var46 = NULL;
+retval = var47; var47.membernum = -1;
+goto out;
+label34: (void)0;
+var48 = var28->memb_location;
+incref(var48);
+var49 = var28->memb_value;
+string_incref(var49);
+var50 = ctor_NamedType_0d620e38a7(var48,var49);
+var51 = (struct class_Type_e6cf7dd4e5){ .val = { .item2 = var50 }, .membernum = 2 };
+var50 = NULL;
+retval = var51; var51.membernum = -1;
+goto out;
+out: (void)0;
+decref_Type_e6cf7dd4e5(var51);
+decref((var50), dtor_NamedType_0d620e38a7);
+string_decref(var49);
+decref((var48), dtor_Location_500c4434c9);
+decref_Type_e6cf7dd4e5(var47);
+decref((var46), dtor_GenericType_f44d8197cb);
+string_decref(var45);
+decref((var44), dtor_Location_500c4434c9);
+decref((var43), dtor_Location_500c4434c9);
+decref((var42), dtor_Location_500c4434c9);
+decref((var41), dtor_Token_35f69eeb49);
+string_decref(var40);
+string_decref(var39);
+decref_Type_e6cf7dd4e5(var38);
+decref((var37), dtor_Token_35f69eeb49);
+string_decref(var36);
+string_decref(var35);
+(void)0;
+string_decref(var31);
+string_decref(var30);
+decref((var29), dtor_Token_35f69eeb49);
+decref((var28), dtor_Token_35f69eeb49);
+string_decref(var27);
+decref_Type_e6cf7dd4e5(var26);
+decref((var25), dtor_AutoType_39f5d793d6);
+decref((var24), dtor_Location_500c4434c9);
+decref((var23), dtor_Token_35f69eeb49);
+string_decref(var22);
+string_decref(var21);
+(void)0;
+string_decref(var17);
+string_decref(var16);
+decref((var15), dtor_Token_35f69eeb49);
+decref((var14), dtor_Token_35f69eeb49);
+string_decref(var13);
+string_decref(var12);
+decref_Type_e6cf7dd4e5(var11);
+decref((var10), dtor_Token_35f69eeb49);
+string_decref(var9);
+string_decref(var8);
+(void)0;
+string_decref(var4);
+string_decref(var3);
+decref((var2), dtor_Token_35f69eeb49);
+return retval;
+}struct class_Type_e6cf7dd4e5 meth_Parser_d28334dc68_parse_type(struct class_Parser_d28334dc68* var1){struct class_Type_e6cf7dd4e5 var2;
+var2.membernum = -1;
+struct class_Token_35f69eeb49* var3;
+var3 = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+bool var6;
+bool var7;
+struct class_List_Type__b06c7a2bb6* var10;
+var10 = NULL;
+struct class_Token_35f69eeb49* var12;
+var12 = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+bool var15;
+bool var16;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Token_35f69eeb49* var20;
+var20 = NULL;
+struct class_Type_e6cf7dd4e5 var21;
+var21.membernum = -1;
+struct class_UnionType_0c977b4168* var22;
+var22 = NULL;
+struct class_Type_e6cf7dd4e5 var23;
+var23.membernum = -1;
+struct class_Type_e6cf7dd4e5 retval;
+var2 = meth_Parser_d28334dc68_parse_type_without_unions(var1);
+var3 = meth_Parser_d28334dc68_peek(var1);
+var4 = string13_op_2d685dde34; string_incref(var4);
+var5 = string78___efb88c3a7c; string_incref(var5);
+var6 = meth_Token_35f69eeb49_matches(var3,var4,var5);
+var7 = oomph_bool_not(var6);
+if (var7) goto label8;
+if (oomph_true) goto label9;
+label8: (void)0;
+retval = var2; var2.membernum = -1;
+goto out;
+label9: (void)0;
+var10 = ctor_List_Type__b06c7a2bb6();
+meth_List_Type__b06c7a2bb6_push(var10,var2);
+label11: (void)0;
+decref((var12), dtor_Token_35f69eeb49);
+var12 = NULL;
+var12 = meth_Parser_d28334dc68_peek(var1);
+string_decref(var13);
+var13.buf = NULL;
+var13 = string13_op_2d685dde34; string_incref(var13);
+string_decref(var14);
+var14.buf = NULL;
+var14 = string78___efb88c3a7c; string_incref(var14);
+var15 = meth_Token_35f69eeb49_matches(var12,var13,var14);
+var16 = oomph_bool_not(var15);
+if (var16) goto label17;
+string_decref(var18);
+var18.buf = NULL;
+var18 = string13_op_2d685dde34; string_incref(var18);
+string_decref(var19);
+var19.buf = NULL;
+var19 = string78___efb88c3a7c; string_incref(var19);
+decref((var20), dtor_Token_35f69eeb49);
+var20 = NULL;
+var20 = meth_Parser_d28334dc68_get_token(var1,var18,var19);
+decref_Type_e6cf7dd4e5(var21);
+var21.membernum = -1;
+var21 = meth_Parser_d28334dc68_parse_type_without_unions(var1);
+meth_List_Type__b06c7a2bb6_push(var10,var21);
+if (oomph_true) goto label11;
+label17: (void)0;
+var22 = ctor_UnionType_0c977b4168(var10);
+var23 = (struct class_Type_e6cf7dd4e5){ .val = { .item3 = var22 }, .membernum = 3 };
+var22 = NULL;
+retval = var23; var23.membernum = -1;
+goto out;
+out: (void)0;
+decref_Type_e6cf7dd4e5(var23);
+decref((var22), dtor_UnionType_0c977b4168);
+decref_Type_e6cf7dd4e5(var21);
+decref((var20), dtor_Token_35f69eeb49);
+string_decref(var19);
+string_decref(var18);
+(void)0;
+(void)0;
+string_decref(var14);
+string_decref(var13);
+decref((var12), dtor_Token_35f69eeb49);
+decref((var10), dtor_List_Type__b06c7a2bb6);
+(void)0;
+(void)0;
+string_decref(var5);
+string_decref(var4);
+decref((var3), dtor_Token_35f69eeb49);
+decref_Type_e6cf7dd4e5(var2);
+return retval;
+}struct class_TypeAndName_fec99b5f94* meth_Parser_d28334dc68_parse_type_and_name(struct class_Parser_d28334dc68* var1){struct class_Type_e6cf7dd4e5 var2;
+var2.membernum = -1;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Token_35f69eeb49* var4;
+var4 = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Location_500c4434c9* var6;
+var6 = NULL;
+struct class_TypeAndName_fec99b5f94* var7;
+var7 = NULL;
+struct class_TypeAndName_fec99b5f94* retval;
+var2 = meth_Parser_d28334dc68_parse_type(var1);
+var3 = string12_id_5bfb53972f; string_incref(var3);
+var4 = meth_Parser_d28334dc68_get_token_by_type(var1,var3);
+var5 = var4->memb_value;
+string_incref(var5);
+var6 = var4->memb_location;
+incref(var6);
+var7 = ctor_TypeAndName_fec99b5f94(var2,var5,var6);
+retval = var7; var7 = NULL;
+goto out;
+out: (void)0;
+decref((var7), dtor_TypeAndName_fec99b5f94);
+decref((var6), dtor_Location_500c4434c9);
+string_decref(var5);
+decref((var4), dtor_Token_35f69eeb49);
+string_decref(var3);
+decref_Type_e6cf7dd4e5(var2);
+return retval;
+}struct class_FuncOrMethodDef_533c7b75ab* meth_Parser_d28334dc68_parse_function_or_method(struct class_Parser_d28334dc68* var1, struct class_Location_500c4434c9* var2){struct class_Str var3;
+var3.buf = NULL;
+struct class_Token_35f69eeb49* var4;
+var4 = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_List_TypeAndName__74be4dae93* var6;
+var6 = NULL;
+struct class_Token_35f69eeb49* var7;
+var7 = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+bool var10;
+char var12;
+struct class__null___Type__7de1ddce50 var13;
+var13.membernum = -1;
+struct class__null___Type__7de1ddce50 var14;
+var14.membernum = -1;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Token_35f69eeb49* var18;
+var18 = NULL;
+struct class_Type_e6cf7dd4e5 var19;
+var19.membernum = -1;
+struct class_List_Statement__5d7503c104* var20;
+var20 = NULL;
+struct class_FuncOrMethodDef_533c7b75ab* var21;
+var21 = NULL;
+struct class_FuncOrMethodDef_533c7b75ab* retval;
+var3 = string12_id_5bfb53972f; string_incref(var3);
+var4 = meth_Parser_d28334dc68_get_token_by_type(var1,var3);
+var5 = var4->memb_value;
+string_incref(var5);
+var6 = meth_Parser_d28334dc68_parse_commasep_types_and_names_in_parens(var1);
+var7 = meth_Parser_d28334dc68_peek(var1);
+var8 = string13_op_2d685dde34; string_incref(var8);
+var9 = string79____bea779db3d; string_incref(var9);
+var10 = meth_Token_35f69eeb49_matches(var7,var8,var9);
+if (var10) goto label11;
+var12 = oomph_null;
+var13 = (struct class__null___Type__7de1ddce50){ .val = { .item0 = var12 }, .membernum = 0 };
+var14 = var13;
+var13.membernum = -1;
+if (oomph_true) goto label15;
+label11: (void)0;
+var16 = string13_op_2d685dde34; string_incref(var16);
+var17 = string79____bea779db3d; string_incref(var17);
+var18 = meth_Parser_d28334dc68_get_token(var1,var16,var17);
+var19 = meth_Parser_d28334dc68_parse_type(var1);
+var14 = (struct class__null___Type__7de1ddce50){ .val = { .item1 = var19 }, .membernum = 1 };
+var19.membernum = -1;
+label15: (void)0;
+var20 = meth_Parser_d28334dc68_parse_block_of_statements(var1);
+var21 = ctor_FuncOrMethodDef_533c7b75ab(var2,var5,var6,var14,var20);
+retval = var21; var21 = NULL;
+goto out;
+out: (void)0;
+decref((var21), dtor_FuncOrMethodDef_533c7b75ab);
+decref((var20), dtor_List_Statement__5d7503c104);
+decref_Type_e6cf7dd4e5(var19);
+decref((var18), dtor_Token_35f69eeb49);
+string_decref(var17);
+string_decref(var16);
+decref__null___Type__7de1ddce50(var14);
+decref__null___Type__7de1ddce50(var13);
+(void)0;
+(void)0;
+string_decref(var9);
+string_decref(var8);
+decref((var7), dtor_Token_35f69eeb49);
+decref((var6), dtor_List_TypeAndName__74be4dae93);
+string_decref(var5);
+decref((var4), dtor_Token_35f69eeb49);
+string_decref(var3);
+return retval;
+}struct class_FuncOrMethodDef_533c7b75ab* meth_Parser_d28334dc68_parse_method(struct class_Parser_d28334dc68* var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Token_35f69eeb49* var4;
+var4 = NULL;
+struct class_Location_500c4434c9* var5;
+var5 = NULL;
+struct class_FuncOrMethodDef_533c7b75ab* var6;
+var6 = NULL;
+struct class_FuncOrMethodDef_533c7b75ab* retval;
+var2 = string8_keyword_ab52a28662; string_incref(var2);
+var3 = string80_meth_b4faa6c4d6; string_incref(var3);
+var4 = meth_Parser_d28334dc68_get_token(var1,var2,var3);
+var5 = var4->memb_location;
+incref(var5);
+var6 = meth_Parser_d28334dc68_parse_function_or_method(var1,var5);
+retval = var6; var6 = NULL;
+goto out;
+out: (void)0;
+decref((var6), dtor_FuncOrMethodDef_533c7b75ab);
+decref((var5), dtor_Location_500c4434c9);
+decref((var4), dtor_Token_35f69eeb49);
+string_decref(var3);
+string_decref(var2);
+return retval;
+}struct class_ToplevelDeclaration_054352d1cf meth_Parser_d28334dc68_parse_toplevel(struct class_Parser_d28334dc68* var1){struct class_Token_35f69eeb49* var2;
+var2 = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+bool var5;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Token_35f69eeb49* var10;
+var10 = NULL;
+struct class_Token_35f69eeb49* var11;
+var11 = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+bool var14;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Token_35f69eeb49* var19;
+var19 = NULL;
+struct class_Location_500c4434c9* var20;
+var20 = NULL;
+struct class_FuncOrMethodDef_533c7b75ab* var21;
+var21 = NULL;
+struct class_ToplevelDeclaration_054352d1cf var22;
+var22.membernum = -1;
+struct class_Token_35f69eeb49* var23;
+var23 = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+bool var26;
+struct class_Str var29;
+var29.buf = NULL;
+struct class_Str var30;
+var30.buf = NULL;
+struct class_Token_35f69eeb49* var31;
+var31 = NULL;
+struct class_Location_500c4434c9* var32;
+var32 = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+struct class_Token_35f69eeb49* var34;
+var34 = NULL;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_List_TypeAndName__74be4dae93* var36;
+var36 = NULL;
+struct class_List_Token__da0ee88323* var37;
+var37 = NULL;
+struct class_List_Token__da0ee88323* var38;
+var38 = NULL;
+bool var39;
+bool var40;
+bool var42;
+struct class_Token_35f69eeb49* var44;
+var44 = NULL;
+struct class_Str var45;
+var45.buf = NULL;
+struct class_Str var46;
+var46.buf = NULL;
+bool var47;
+struct class_List_FuncOrMethodDef__af5379b09e* var49;
+var49 = NULL;
+struct class_List_FuncOrMethodDef__af5379b09e* var50;
+var50 = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+struct class_Str var52;
+var52.buf = NULL;
+struct class_Token_35f69eeb49* var53;
+var53 = NULL;
+struct class_ClassDef_ac59c4b64c* var55;
+var55 = NULL;
+struct class_ToplevelDeclaration_054352d1cf var56;
+var56.membernum = -1;
+struct class_Token_35f69eeb49* var57;
+var57 = NULL;
+struct class_Str var58;
+var58.buf = NULL;
+struct class_Str var59;
+var59.buf = NULL;
+bool var60;
+struct class_Str var63;
+var63.buf = NULL;
+struct class_Str var64;
+var64.buf = NULL;
+struct class_Token_35f69eeb49* var65;
+var65 = NULL;
+struct class_Location_500c4434c9* var66;
+var66 = NULL;
+struct class_Str var67;
+var67.buf = NULL;
+struct class_Token_35f69eeb49* var68;
+var68 = NULL;
+struct class_Str var69;
+var69.buf = NULL;
+struct class_Str var70;
+var70.buf = NULL;
+bool var71;
+struct class_Location_500c4434c9* var74;
+var74 = NULL;
+struct class_Str var75;
+var75.buf = NULL;
+struct class_Str var76;
+var76.buf = NULL;
+struct class_Str var77;
+var77.buf = NULL;
+struct class_Token_35f69eeb49* var78;
+var78 = NULL;
+struct class_Type_e6cf7dd4e5 var79;
+var79.membernum = -1;
+struct class_Str var80;
+var80.buf = NULL;
+struct class_Str var81;
+var81.buf = NULL;
+struct class_Token_35f69eeb49* var82;
+var82 = NULL;
+struct class_Str var83;
+var83.buf = NULL;
+struct class_TypeDef_44471836ba* var84;
+var84 = NULL;
+struct class_ToplevelDeclaration_054352d1cf var85;
+var85.membernum = -1;
+struct class_Token_35f69eeb49* var86;
+var86 = NULL;
+struct class_Location_500c4434c9* var87;
+var87 = NULL;
+struct class_Str var88;
+var88.buf = NULL;
+struct class_ToplevelDeclaration_054352d1cf retval;
+var2 = meth_Parser_d28334dc68_peek(var1);
+var3 = string8_keyword_ab52a28662; string_incref(var3);
+var4 = string81_export_372718dd0a; string_incref(var4);
+var5 = meth_Token_35f69eeb49_matches(var2,var3,var4);
+if (var5) goto label6;
+if (oomph_true) goto label7;
+label6: (void)0;
+var8 = string8_keyword_ab52a28662; string_incref(var8);
+var9 = string81_export_372718dd0a; string_incref(var9);
+var10 = meth_Parser_d28334dc68_get_token(var1,var8,var9);
+label7: (void)0;
+var11 = meth_Parser_d28334dc68_peek(var1);
+var12 = string8_keyword_ab52a28662; string_incref(var12);
+var13 = string82_func_2c6b5f04d2; string_incref(var13);
+var14 = meth_Token_35f69eeb49_matches(var11,var12,var13);
+if (var14) goto label15;
+if (oomph_true) goto label16;
+label15: (void)0;
+var17 = string8_keyword_ab52a28662; string_incref(var17);
+var18 = string82_func_2c6b5f04d2; string_incref(var18);
+var19 = meth_Parser_d28334dc68_get_token(var1,var17,var18);
+var20 = var19->memb_location;
+incref(var20);
+var21 = meth_Parser_d28334dc68_parse_function_or_method(var1,var20);
+var22 = (struct class_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var21 }, .membernum = 1 };
+var21 = NULL;
+retval = var22; var22.membernum = -1;
+goto out;
+label16: (void)0;
+var23 = meth_Parser_d28334dc68_peek(var1);
+var24 = string8_keyword_ab52a28662; string_incref(var24);
+var25 = string83_class_ff765e86a5; string_incref(var25);
+var26 = meth_Token_35f69eeb49_matches(var23,var24,var25);
+if (var26) goto label27;
+if (oomph_true) goto label28;
+label27: (void)0;
+var29 = string8_keyword_ab52a28662; string_incref(var29);
+var30 = string83_class_ff765e86a5; string_incref(var30);
+var31 = meth_Parser_d28334dc68_get_token(var1,var29,var30);
+var32 = var31->memb_location;
+incref(var32);
+var33 = string12_id_5bfb53972f; string_incref(var33);
+var34 = meth_Parser_d28334dc68_get_token_by_type(var1,var33);
+var35 = var34->memb_value;
+string_incref(var35);
+var36 = meth_Parser_d28334dc68_parse_commasep_types_and_names_in_parens(var1);
+var37 = var1->memb_tokens;
+incref(var37);
+var38 = ctor_List_Token__da0ee88323();
+var39 = meth_List_Token__da0ee88323_equals(var37,var38);
+var40 = oomph_bool_not(var39);
+if (var40) goto label41;
+var42 = oomph_false;
+if (oomph_true) goto label43;
+label41: (void)0;
+var44 = meth_Parser_d28334dc68_peek(var1);
+var45 = string23_begin_block_cd4b098ac0; string_incref(var45);
+var46 = string24___dc60150654; string_incref(var46);
+var47 = meth_Token_35f69eeb49_matches(var44,var45,var46);
+var42 = var47;
+label43: (void)0;
+if (var42) goto label48;
+var49 = ctor_List_FuncOrMethodDef__af5379b09e();
+var50 = var49;
+var49 = NULL;
+var51 = string13_op_2d685dde34; string_incref(var51);
+var52 = string4___45fbfd7e60; string_incref(var52);
+var53 = meth_Parser_d28334dc68_get_token(var1,var51,var52);
+if (oomph_true) goto label54;
+label48: (void)0;
+var50 = meth_Parser_d28334dc68_parse_block_of_methods(var1);
+label54: (void)0;
+var55 = ctor_ClassDef_ac59c4b64c(var32,var35,var36,var50);
+var56 = (struct class_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var55 }, .membernum = 0 };
+var55 = NULL;
+retval = var56; var56.membernum = -1;
+goto out;
+label28: (void)0;
+var57 = meth_Parser_d28334dc68_peek(var1);
+var58 = string8_keyword_ab52a28662; string_incref(var58);
+var59 = string84_typedef_fe39013bca; string_incref(var59);
+var60 = meth_Token_35f69eeb49_matches(var57,var58,var59);
+if (var60) goto label61;
+if (oomph_true) goto label62;
+label61: (void)0;
+var63 = string8_keyword_ab52a28662; string_incref(var63);
+var64 = string84_typedef_fe39013bca; string_incref(var64);
+var65 = meth_Parser_d28334dc68_get_token(var1,var63,var64);
+var66 = var65->memb_location;
+incref(var66);
+var67 = string12_id_5bfb53972f; string_incref(var67);
+var68 = meth_Parser_d28334dc68_get_token_by_type(var1,var67);
+var69 = string85____b93f89958a; string_incref(var69);
+var70 = var68->memb_value;
+string_incref(var70);
+var71 = meth_Str___contains(var70,var69);
+if (var71) goto label72;
+if (oomph_true) goto label73;
+label72: (void)0;
+var74 = var68->memb_location;
+incref(var74);
+var75 = string86_typedef_name_must_not_contain______3fb5741dc0; string_incref(var75);
+meth_Location_500c4434c9_error(var74,var75);
+label73: (void)0;
+var76 = string13_op_2d685dde34; string_incref(var76);
+var77 = string63___f4c9a5a296; string_incref(var77);
+var78 = meth_Parser_d28334dc68_get_token(var1,var76,var77);
+var79 = meth_Parser_d28334dc68_parse_type(var1);
+var80 = string13_op_2d685dde34; string_incref(var80);
+var81 = string4___45fbfd7e60; string_incref(var81);
+var82 = meth_Parser_d28334dc68_get_token(var1,var80,var81);
+var83 = var68->memb_value;
+string_incref(var83);
+var84 = ctor_TypeDef_44471836ba(var66,var83,var79);
+var85 = (struct class_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var84 }, .membernum = 3 };
+var84 = NULL;
+retval = var85; var85.membernum = -1;
+goto out;
+label62: (void)0;
+var86 = meth_Parser_d28334dc68_peek(var1);
+var87 = var86->memb_location;
+incref(var87);
+var88 = string87_should_be_function__class__union_or_typedef_707a34a5c2; string_incref(var88);
+meth_Location_500c4434c9_error(var87,var88);
+out: (void)0;
+string_decref(var88);
+decref((var87), dtor_Location_500c4434c9);
+decref((var86), dtor_Token_35f69eeb49);
+decref_ToplevelDeclaration_054352d1cf(var85);
+decref((var84), dtor_TypeDef_44471836ba);
+string_decref(var83);
+decref((var82), dtor_Token_35f69eeb49);
+string_decref(var81);
+string_decref(var80);
+decref_Type_e6cf7dd4e5(var79);
+decref((var78), dtor_Token_35f69eeb49);
+string_decref(var77);
+string_decref(var76);
+string_decref(var75);
+decref((var74), dtor_Location_500c4434c9);
+(void)0;
+string_decref(var70);
+string_decref(var69);
+decref((var68), dtor_Token_35f69eeb49);
+string_decref(var67);
+decref((var66), dtor_Location_500c4434c9);
+decref((var65), dtor_Token_35f69eeb49);
+string_decref(var64);
+string_decref(var63);
+(void)0;
+string_decref(var59);
+string_decref(var58);
+decref((var57), dtor_Token_35f69eeb49);
+decref_ToplevelDeclaration_054352d1cf(var56);
+decref((var55), dtor_ClassDef_ac59c4b64c);
+decref((var53), dtor_Token_35f69eeb49);
+string_decref(var52);
+string_decref(var51);
+decref((var50), dtor_List_FuncOrMethodDef__af5379b09e);
+decref((var49), dtor_List_FuncOrMethodDef__af5379b09e);
+(void)0;
+string_decref(var46);
+string_decref(var45);
+decref((var44), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+decref((var38), dtor_List_Token__da0ee88323);
+decref((var37), dtor_List_Token__da0ee88323);
+decref((var36), dtor_List_TypeAndName__74be4dae93);
+string_decref(var35);
+decref((var34), dtor_Token_35f69eeb49);
+string_decref(var33);
+decref((var32), dtor_Location_500c4434c9);
+decref((var31), dtor_Token_35f69eeb49);
+string_decref(var30);
+string_decref(var29);
+(void)0;
+string_decref(var25);
+string_decref(var24);
+decref((var23), dtor_Token_35f69eeb49);
+decref_ToplevelDeclaration_054352d1cf(var22);
+decref((var21), dtor_FuncOrMethodDef_533c7b75ab);
+decref((var20), dtor_Location_500c4434c9);
+decref((var19), dtor_Token_35f69eeb49);
+string_decref(var18);
+string_decref(var17);
+(void)0;
+string_decref(var13);
+string_decref(var12);
+decref((var11), dtor_Token_35f69eeb49);
+decref((var10), dtor_Token_35f69eeb49);
+string_decref(var9);
+string_decref(var8);
+(void)0;
+string_decref(var4);
+string_decref(var3);
+decref((var2), dtor_Token_35f69eeb49);
+return retval;
+}
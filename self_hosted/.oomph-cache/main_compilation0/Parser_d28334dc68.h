@@ -0,0 +1,445 @@
+
+                #ifndef HEADER_GUARD_Parser_d28334dc68
+                #define HEADER_GUARD_Parser_d28334dc68
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "LoopHeader_23fd592271.h"
+#include "PrecedenceItem_f832c8ac03.h"
+#include "Statement_1dc2e7090f.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "Type_e6cf7dd4e5.h"
+#include "_null___Expression__957e7d6409.h"
+#include "_null___Int__16c741706b.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "_null___TypeAndName__d7958d7e85.h"
+#include "_null___Type__7de1ddce50.h"
+#include "ast_91af7cbb25.h"
+#include "parser_6c64cd293c.h"
+#include "tokenizer_431c4db6a8.h"
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Import_6056d7e9c9;
+struct class_Import_6056d7e9c9;
+struct class_Import_6056d7e9c9;
+struct class_Token_35f69eeb49;
+struct class_List_Expression__d162784c9e;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_List_Expression__d162784c9e;
+struct class_List_Expression__d162784c9e;
+struct class_Token_35f69eeb49;
+struct class_List_TypeAndName__74be4dae93;
+struct class_Token_35f69eeb49;
+struct class_TypeAndName_fec99b5f94;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_TypeAndName_fec99b5f94;
+struct class_Token_35f69eeb49;
+struct class_List_TypeAndName__74be4dae93;
+struct class_List_TypeAndName__74be4dae93;
+struct class_Token_35f69eeb49;
+struct class_List_Statement__5d7503c104;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_List_Statement__5d7503c104;
+struct class_Token_35f69eeb49;
+struct class_List_Statement__5d7503c104;
+struct class_List_Statement__5d7503c104;
+struct class_Token_35f69eeb49;
+struct class_List_FuncOrMethodDef__af5379b09e;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_Token_35f69eeb49;
+struct class_List_FuncOrMethodDef__af5379b09e;
+struct class_List_FuncOrMethodDef__af5379b09e;
+struct class_Token_35f69eeb49;
+struct class_List_Case__f5a6b4b2ec;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_Case_458b8eeee1;
+struct class_Token_35f69eeb49;
+struct class_List_Case__f5a6b4b2ec;
+struct class_List_Case__f5a6b4b2ec;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_Location_500c4434c9;
+struct class_List_Expression__d162784c9e;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_List_Str___637f5f7ec1;
+struct class_Location_500c4434c9;
+struct class_List_Str__43b70c06cb;
+struct class_Location_500c4434c9;
+struct class_List_Str__43b70c06cb;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_List_Str__43b70c06cb;
+struct class_Location_500c4434c9;
+struct class_List_Expression__d162784c9e;
+struct class_StringConstant_c2b1c10b4f;
+struct class_StringFormatJoin_bc28806767;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_List_Token__da0ee88323;
+struct class_Location_500c4434c9;
+struct class_List_Expression__d162784c9e;
+struct class_ListLiteral_66e426dc17;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_ListComprehension_10c913d2dd;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Constructor_0c896e4031;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_FloatConstant_4759845694;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_IntConstant_4cbc4c5420;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_GetVar_642f116a6c;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_GetAttribute_0758070446;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_List_Expression__d162784c9e;
+struct class_Call_d0fb9d6234;
+struct class_Token_35f69eeb49;
+struct class_List_PrecedenceItem__37797831a9;
+struct class_List_Str__43b70c06cb;
+struct class_Token_35f69eeb49;
+struct class_List_PrecedenceItem__37797831a9;
+struct class_List_Str__43b70c06cb;
+struct class_List_PrecedenceItem__37797831a9;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_BinaryOperator_e25f87d1b5;
+struct class_List_PrecedenceItem__37797831a9;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_UnaryOperator_348525ebbe;
+struct class_List_PrecedenceItem__37797831a9;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_Token_35f69eeb49;
+struct class_List_PrecedenceItem__37797831a9;
+struct class_Location_500c4434c9;
+struct class_As_a05f1f16b6;
+struct class_List_PrecedenceItem__37797831a9;
+struct class_List_PrecedenceItem__37797831a9;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_List_PrecedenceItem__37797831a9;
+struct class_List_PrecedenceItem__37797831a9;
+struct class_List_Str__43b70c06cb;
+struct class_List_PrecedenceItem__37797831a9;
+struct class_Token_35f69eeb49;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_List_PrecedenceItem__37797831a9;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Let_c9da3e3372;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Return_33802009cd;
+struct class_Location_500c4434c9;
+struct class_Return_33802009cd;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Pass_e49950b77e;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Continue_b54f3b332e;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Break_2f9897f5fd;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_GetVar_642f116a6c;
+struct class_Location_500c4434c9;
+struct class_SetVar_6a19c6f350;
+struct class_GetAttribute_0758070446;
+struct class_Location_500c4434c9;
+struct class_SetAttribute_6bd58fd9d3;
+struct class_Call_d0fb9d6234;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_TypeAndName_fec99b5f94;
+struct class_Token_35f69eeb49;
+struct class_List_Statement__5d7503c104;
+struct class_Location_500c4434c9;
+struct class_Case_458b8eeee1;
+struct class_Case_458b8eeee1;
+struct class_Case_458b8eeee1;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_List_Statement__5d7503c104;
+struct class_List_Statement__5d7503c104;
+struct class_ForLoopHeader_79606b2adb;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_List_Statement__5d7503c104;
+struct class_List_Statement__5d7503c104;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_List_Statement__5d7503c104;
+struct class_List_Statement__5d7503c104;
+struct class_ForLoopHeader_79606b2adb;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_ForeachLoopHeader_ebcb7f3325;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_List_Statement__5d7503c104;
+struct class_Location_500c4434c9;
+struct class_ConditionAndBody_0e2f888e06;
+struct class_List_ConditionAndBody__ad79dde1db;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_List_Statement__5d7503c104;
+struct class_Location_500c4434c9;
+struct class_ConditionAndBody_0e2f888e06;
+struct class_Token_35f69eeb49;
+struct class_List_Statement__5d7503c104;
+struct class_List_Statement__5d7503c104;
+struct class_Token_35f69eeb49;
+struct class_If_8811dba942;
+struct class_List_Statement__5d7503c104;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_List_Statement__5d7503c104;
+struct class_Loop_80080d5f12;
+struct class_List_Statement__5d7503c104;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_List_Case__f5a6b4b2ec;
+struct class_Switch_9b8c881aeb;
+struct class_List_Statement__5d7503c104;
+struct class_Token_35f69eeb49;
+struct class_List_Statement__5d7503c104;
+struct class_List_Statement__5d7503c104;
+struct class_List_Statement__5d7503c104;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_AutoType_39f5d793d6;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_GenericType_f44d8197cb;
+struct class_Location_500c4434c9;
+struct class_NamedType_0d620e38a7;
+struct class_Token_35f69eeb49;
+struct class_List_Type__b06c7a2bb6;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_UnionType_0c977b4168;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+struct class_Token_35f69eeb49;
+struct class_List_TypeAndName__74be4dae93;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_List_Statement__5d7503c104;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_Location_500c4434c9;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_List_TypeAndName__74be4dae93;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_List_FuncOrMethodDef__af5379b09e;
+struct class_List_FuncOrMethodDef__af5379b09e;
+struct class_Token_35f69eeb49;
+struct class_ClassDef_ac59c4b64c;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_TypeDef_44471836ba;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+
+            struct class_Parser_d28334dc68 {
+                REFCOUNT_HEADER
+                struct class_List_Token__da0ee88323* memb_tokens;
+
+            };
+            
+            struct class_Parser_d28334dc68* ctor_Parser_d28334dc68(struct class_List_Token__da0ee88323* arg_tokens);
+            void dtor_Parser_d28334dc68(void *ptr);
+            
+                struct class_Str meth_Parser_d28334dc68_to_string(struct class_Parser_d28334dc68* obj);
+                bool meth_Parser_d28334dc68_equals(struct class_Parser_d28334dc68* var1, struct class_Parser_d28334dc68* var2);
+struct class_Token_35f69eeb49* meth_Parser_d28334dc68_peek(struct class_Parser_d28334dc68* var1);
+struct class_Token_35f69eeb49* meth_Parser_d28334dc68_get_token_by_type(struct class_Parser_d28334dc68* var1, struct class_Str var2);
+struct class_Token_35f69eeb49* meth_Parser_d28334dc68_get_token(struct class_Parser_d28334dc68* var1, struct class_Str var2, struct class_Str var3);
+struct class_Import_6056d7e9c9* meth_Parser_d28334dc68_parse_import(struct class_Parser_d28334dc68* var1, struct class_Str var2, struct class_Str var3);
+struct class_List_Expression__d162784c9e* meth_Parser_d28334dc68_parse_commasep_expression_in_parens(struct class_Parser_d28334dc68* var1, struct class_Str var2, struct class_Str var3);
+struct class_List_TypeAndName__74be4dae93* meth_Parser_d28334dc68_parse_commasep_types_and_names_in_parens(struct class_Parser_d28334dc68* var1);
+struct class_List_Statement__5d7503c104* meth_Parser_d28334dc68_parse_block_of_statements(struct class_Parser_d28334dc68* var1);
+struct class_List_FuncOrMethodDef__af5379b09e* meth_Parser_d28334dc68_parse_block_of_methods(struct class_Parser_d28334dc68* var1);
+struct class_List_Case__f5a6b4b2ec* meth_Parser_d28334dc68_parse_block_of_cases(struct class_Parser_d28334dc68* var1);
+struct class_Expression_35f2052bf4 meth_Parser_d28334dc68_tokenize_and_parse_expression(struct class_Parser_d28334dc68* var1, struct class_Str var2, struct class_Location_500c4434c9* var3);
+struct class_Expression_35f2052bf4 meth_Parser_d28334dc68_do_string_contents(struct class_Parser_d28334dc68* var1, struct class_Location_500c4434c9* var2);
+struct class_Expression_35f2052bf4 meth_Parser_d28334dc68_parse_simple_expression(struct class_Parser_d28334dc68* var1, struct class_Str var2);
+struct class__null___Int__16c741706b meth_Parser_d28334dc68_find_unary_operator(struct class_Parser_d28334dc68* var1, struct class_List_PrecedenceItem__37797831a9* var2, struct class_List_Str__43b70c06cb* var3);
+struct class__null___Int__16c741706b meth_Parser_d28334dc68_find_binary_operator(struct class_Parser_d28334dc68* var1, struct class_List_PrecedenceItem__37797831a9* var2, struct class_List_Str__43b70c06cb* var3);
+void meth_Parser_d28334dc68_eliminate_operators(struct class_Parser_d28334dc68* var1, struct class_List_PrecedenceItem__37797831a9* var2, struct class_List_Str__43b70c06cb* var3, struct class_List_Str__43b70c06cb* var4);
+void meth_Parser_d28334dc68_eliminate_as(struct class_Parser_d28334dc68* var1, struct class_List_PrecedenceItem__37797831a9* var2);
+struct class_List_PrecedenceItem__37797831a9* meth_Parser_d28334dc68_get_unary_operators(struct class_Parser_d28334dc68* var1);
+struct class_Expression_35f2052bf4 meth_Parser_d28334dc68_parse_expression(struct class_Parser_d28334dc68* var1, struct class__null___Str__5eca9cec4f var2);
+struct class_Statement_1dc2e7090f meth_Parser_d28334dc68_parse_oneline_ish_statement(struct class_Parser_d28334dc68* var1);
+struct class_Case_458b8eeee1* meth_Parser_d28334dc68_parse_case(struct class_Parser_d28334dc68* var1);
+struct class_LoopHeader_23fd592271 meth_Parser_d28334dc68_parse_loop_header(struct class_Parser_d28334dc68* var1);
+struct class_List_Statement__5d7503c104* meth_Parser_d28334dc68_parse_statement(struct class_Parser_d28334dc68* var1);
+struct class_Type_e6cf7dd4e5 meth_Parser_d28334dc68_parse_type_without_unions(struct class_Parser_d28334dc68* var1);
+struct class_Type_e6cf7dd4e5 meth_Parser_d28334dc68_parse_type(struct class_Parser_d28334dc68* var1);
+struct class_TypeAndName_fec99b5f94* meth_Parser_d28334dc68_parse_type_and_name(struct class_Parser_d28334dc68* var1);
+struct class_FuncOrMethodDef_533c7b75ab* meth_Parser_d28334dc68_parse_function_or_method(struct class_Parser_d28334dc68* var1, struct class_Location_500c4434c9* var2);
+struct class_FuncOrMethodDef_533c7b75ab* meth_Parser_d28334dc68_parse_method(struct class_Parser_d28334dc68* var1);
+struct class_ToplevelDeclaration_054352d1cf meth_Parser_d28334dc68_parse_toplevel(struct class_Parser_d28334dc68* var1);
+
+                #endif
+                
@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "Pass_e49950b77e.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_Pass_e17b46c0ea_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x61', '\x73', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Pass_e17b46c0ea = {
+                .buf = &string0_Pass_e17b46c0ea_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            struct class_Pass_e49950b77e* ctor_Pass_e49950b77e(struct class_Location_500c4434c9* arg_location)
+            {
+                struct class_Pass_e49950b77e* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+
+                incref(arg_location);
+
+                return obj;
+            }
+
+            void dtor_Pass_e49950b77e(void *ptr)
+            {
+                struct class_Pass_e49950b77e *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Pass_e49950b77e_to_string(struct class_Pass_e49950b77e* self)
+                {
+                    struct class_Str res = string0_Pass_e17b46c0ea;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Pass_e49950b77e_equals(struct class_Pass_e49950b77e* var1, struct class_Pass_e49950b77e* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_Pass_e49950b77e
+                #define HEADER_GUARD_Pass_e49950b77e
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_Pass_e49950b77e {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+
+            };
+            
+            struct class_Pass_e49950b77e* ctor_Pass_e49950b77e(struct class_Location_500c4434c9* arg_location);
+            void dtor_Pass_e49950b77e(void *ptr);
+            
+                struct class_Str meth_Pass_e49950b77e_to_string(struct class_Pass_e49950b77e* obj);
+                bool meth_Pass_e49950b77e_equals(struct class_Pass_e49950b77e* var1, struct class_Pass_e49950b77e* var2);
+
+                #endif
+                
@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "PointersEqual_deb0abf3fc.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf string0_PointersEqual_1ece54b732_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x6f', '\x69', '\x6e', '\x74', '\x65', '\x72', '\x73', '\x45', '\x71', '\x75', '\x61', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_PointersEqual_1ece54b732 = {
+                .buf = &string0_PointersEqual_1ece54b732_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            struct class_PointersEqual_deb0abf3fc* ctor_PointersEqual_deb0abf3fc(struct class_LocalVariable_846080e5ae* arg_lhs,struct class_LocalVariable_846080e5ae* arg_rhs,struct class_LocalVariable_846080e5ae* arg_result)
+            {
+                struct class_PointersEqual_deb0abf3fc* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_lhs = arg_lhs;
+obj->memb_rhs = arg_rhs;
+obj->memb_result = arg_result;
+
+                incref(arg_lhs);
+incref(arg_rhs);
+incref(arg_result);
+
+                return obj;
+            }
+
+            void dtor_PointersEqual_deb0abf3fc(void *ptr)
+            {
+                struct class_PointersEqual_deb0abf3fc *obj = ptr;
+                decref((obj->memb_lhs), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_rhs), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_PointersEqual_deb0abf3fc_to_string(struct class_PointersEqual_deb0abf3fc* self)
+                {
+                    struct class_Str res = string0_PointersEqual_1ece54b732;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_lhs);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_rhs);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_result);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_PointersEqual_deb0abf3fc_equals(struct class_PointersEqual_deb0abf3fc* var1, struct class_PointersEqual_deb0abf3fc* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,28 @@
+
+                #ifndef HEADER_GUARD_PointersEqual_deb0abf3fc
+                #define HEADER_GUARD_PointersEqual_deb0abf3fc
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+
+            struct class_PointersEqual_deb0abf3fc {
+                REFCOUNT_HEADER
+                struct class_LocalVariable_846080e5ae* memb_lhs;
+struct class_LocalVariable_846080e5ae* memb_rhs;
+struct class_LocalVariable_846080e5ae* memb_result;
+
+            };
+            
+            struct class_PointersEqual_deb0abf3fc* ctor_PointersEqual_deb0abf3fc(struct class_LocalVariable_846080e5ae* arg_lhs,struct class_LocalVariable_846080e5ae* arg_rhs,struct class_LocalVariable_846080e5ae* arg_result);
+            void dtor_PointersEqual_deb0abf3fc(void *ptr);
+            
+                struct class_Str meth_PointersEqual_deb0abf3fc_to_string(struct class_PointersEqual_deb0abf3fc* obj);
+                bool meth_PointersEqual_deb0abf3fc_equals(struct class_PointersEqual_deb0abf3fc* var1, struct class_PointersEqual_deb0abf3fc* var2);
+
+                #endif
+                
@@ -0,0 +1,117 @@
+#include <lib/oomph.h>
+#include "PrecedenceItem_f832c8ac03.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "Token_35f69eeb49.h"
+#include "Type_e6cf7dd4e5.h"
+
+            static struct StringBuf string0_PrecedenceItem_d9c5455eeb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x72', '\x65', '\x63', '\x65', '\x64', '\x65', '\x6e', '\x63', '\x65', '\x49', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+            };
+            static struct class_Str string0_PrecedenceItem_d9c5455eeb = {
+                .buf = &string0_PrecedenceItem_d9c5455eeb_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_PrecedenceItem_f832c8ac03_to_string(struct class_PrecedenceItem_f832c8ac03 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_Expression_35f2052bf4_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Type_e6cf7dd4e5_to_string(obj.val.item1);
+                    break;
+                
+                case 2:
+                    valstr = meth_Token_35f69eeb49_to_string(obj.val.item2);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_PrecedenceItem_d9c5455eeb), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_PrecedenceItem_d9c5455eeb;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_PrecedenceItem_f832c8ac03_equals(struct class_PrecedenceItem_f832c8ac03 a, struct class_PrecedenceItem_f832c8ac03 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_Expression_35f2052bf4_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Type_e6cf7dd4e5_equals(
+                        a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_Token_35f69eeb49_equals(
+                        a.val.item2, b.val.item2);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_PrecedenceItem_d9c5455eeb), (int)a.membernum);
+                }
+            }
+            
+            void incref_PrecedenceItem_f832c8ac03(struct class_PrecedenceItem_f832c8ac03 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref_Expression_35f2052bf4(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref_Type_e6cf7dd4e5(obj.val.item1);
+                    break;
+                
+                case 2:
+                    incref(obj.val.item2);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_PrecedenceItem_f832c8ac03(struct class_PrecedenceItem_f832c8ac03 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref_Expression_35f2052bf4(obj.val.item0);
+                    break;
+                
+                case 1:
+                    decref_Type_e6cf7dd4e5(obj.val.item1);
+                    break;
+                
+                case 2:
+                    decref((obj.val.item2), dtor_Token_35f69eeb49);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
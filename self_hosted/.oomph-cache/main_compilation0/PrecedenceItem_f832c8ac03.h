@@ -0,0 +1,27 @@
+
+                #ifndef HEADER_GUARD_PrecedenceItem_f832c8ac03
+                #define HEADER_GUARD_PrecedenceItem_f832c8ac03
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "Type_e6cf7dd4e5.h"
+struct class_Token_35f69eeb49;
+
+            struct class_PrecedenceItem_f832c8ac03 {
+                union {
+                    	struct class_Expression_35f2052bf4 item0;
+	struct class_Type_e6cf7dd4e5 item1;
+	struct class_Token_35f69eeb49* item2;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_PrecedenceItem_f832c8ac03_to_string(struct class_PrecedenceItem_f832c8ac03 obj);
+            bool meth_PrecedenceItem_f832c8ac03_equals(struct class_PrecedenceItem_f832c8ac03 a, struct class_PrecedenceItem_f832c8ac03 b);
+            
+            void incref_PrecedenceItem_f832c8ac03(struct class_PrecedenceItem_f832c8ac03 obj);
+            void decref_PrecedenceItem_f832c8ac03(struct class_PrecedenceItem_f832c8ac03 obj);
+            
+                #endif
+                
@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "Return_33802009cd.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_500c4434c9.h"
+#include "_null___Expression__957e7d6409.h"
+
+            static struct StringBuf string0_Return_33a7de6492_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x52', '\x65', '\x74', '\x75', '\x72', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Return_33a7de6492 = {
+                .buf = &string0_Return_33a7de6492_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_Return_33802009cd* ctor_Return_33802009cd(struct class_Location_500c4434c9* arg_location,struct class__null___Expression__957e7d6409 arg_value)
+            {
+                struct class_Return_33802009cd* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_value = arg_value;
+
+                incref(arg_location);
+incref__null___Expression__957e7d6409(arg_value);
+
+                return obj;
+            }
+
+            void dtor_Return_33802009cd(void *ptr)
+            {
+                struct class_Return_33802009cd *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+decref__null___Expression__957e7d6409(obj->memb_value);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Return_33802009cd_to_string(struct class_Return_33802009cd* self)
+                {
+                    struct class_Str res = string0_Return_33a7de6492;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__null___Expression__957e7d6409_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Return_33802009cd_equals(struct class_Return_33802009cd* var1, struct class_Return_33802009cd* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
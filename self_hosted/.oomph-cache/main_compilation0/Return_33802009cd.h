@@ -0,0 +1,24 @@
+
+                #ifndef HEADER_GUARD_Return_33802009cd
+                #define HEADER_GUARD_Return_33802009cd
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Expression__957e7d6409.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_Return_33802009cd {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class__null___Expression__957e7d6409 memb_value;
+
+            };
+            
+            struct class_Return_33802009cd* ctor_Return_33802009cd(struct class_Location_500c4434c9* arg_location,struct class__null___Expression__957e7d6409 arg_value);
+            void dtor_Return_33802009cd(void *ptr);
+            
+                struct class_Str meth_Return_33802009cd_to_string(struct class_Return_33802009cd* obj);
+                bool meth_Return_33802009cd_equals(struct class_Return_33802009cd* var1, struct class_Return_33802009cd* var2);
+
+                #endif
+                
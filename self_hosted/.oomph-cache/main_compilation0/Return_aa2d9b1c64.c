@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "Return_aa2d9b1c64.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___LocalVariable__494c1a2e12.h"
+
+            static struct StringBuf string0_Return_a9cf5ea7df_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x52', '\x65', '\x74', '\x75', '\x72', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Return_a9cf5ea7df = {
+                .buf = &string0_Return_a9cf5ea7df_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_Return_aa2d9b1c64* ctor_Return_aa2d9b1c64(struct class__null___LocalVariable__494c1a2e12 arg_value)
+            {
+                struct class_Return_aa2d9b1c64* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_value = arg_value;
+
+                incref__null___LocalVariable__494c1a2e12(arg_value);
+
+                return obj;
+            }
+
+            void dtor_Return_aa2d9b1c64(void *ptr)
+            {
+                struct class_Return_aa2d9b1c64 *obj = ptr;
+                decref__null___LocalVariable__494c1a2e12(obj->memb_value);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Return_aa2d9b1c64_to_string(struct class_Return_aa2d9b1c64* self)
+                {
+                    struct class_Str res = string0_Return_a9cf5ea7df;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth__null___LocalVariable__494c1a2e12_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Return_aa2d9b1c64_equals(struct class_Return_aa2d9b1c64* var1, struct class_Return_aa2d9b1c64* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,21 @@
+
+                #ifndef HEADER_GUARD_Return_aa2d9b1c64
+                #define HEADER_GUARD_Return_aa2d9b1c64
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___LocalVariable__494c1a2e12.h"
+
+            struct class_Return_aa2d9b1c64 {
+                REFCOUNT_HEADER
+                struct class__null___LocalVariable__494c1a2e12 memb_value;
+
+            };
+            
+            struct class_Return_aa2d9b1c64* ctor_Return_aa2d9b1c64(struct class__null___LocalVariable__494c1a2e12 arg_value);
+            void dtor_Return_aa2d9b1c64(void *ptr);
+            
+                struct class_Str meth_Return_aa2d9b1c64_to_string(struct class_Return_aa2d9b1c64* obj);
+                bool meth_Return_aa2d9b1c64_equals(struct class_Return_aa2d9b1c64* var1, struct class_Return_aa2d9b1c64* var2);
+
+                #endif
+                
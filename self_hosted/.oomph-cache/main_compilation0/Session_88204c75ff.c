@@ -0,0 +1,1640 @@
+#include <lib/oomph.h>
+#include "Session_88204c75ff.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Builtins_bd980a9f08.h"
+#include "FilePair_99df852164.h"
+#include "List_FilePair__2b6998ab5b.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Symbol__9a01330177.h"
+#include "List_ToplevelDeclaration__35f88ef566.h"
+#include "List_Type__057f9c6088.h"
+#include "ToplevelDeclaration_5505a52ad0.h"
+#include "Type_87e1ce5c5e.h"
+#include "UnionType_7f899bced1.h"
+#include "_Type___Str__e7feb8bffc.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "bundle_io_45f5b8a585.h"
+#include "c_output_6a23cf54cc.h"
+#include "ir_4b1a3e0393.h"
+
+            static struct StringBuf string0_Session_c990cb37d2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x65', '\x73', '\x73', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Session_c990cb37d2 = {
+                .buf = &string0_Session_c990cb37d2_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_self_hosted_c_output_oomph_acd42f96df_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x63', '\x5f', '\x6f', '\x75', '\x74', '\x70', '\x75', '\x74', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string1_self_hosted_c_output_oomph_acd42f96df = {
+                .buf = &string1_self_hosted_c_output_oomph_acd42f96df_buf,
+                .nbytes = 26,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2__f806646b23_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string2__f806646b23 = {
+                .buf = &string2__f806646b23_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_string_incref__c7b6c652d6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x69', '\x6e', '\x63', '\x72', '\x65', '\x66', '\x28' },
+                .malloced = false,
+            };
+            static struct class_Str string3_string_incref__c7b6c652d6 = {
+                .buf = &string3_string_incref__c7b6c652d6_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4___161cf12644_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string4___161cf12644 = {
+                .buf = &string4___161cf12644_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_incref__266c688595_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x63', '\x72', '\x65', '\x66', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string5_incref__266c688595 = {
+                .buf = &string5_incref__266c688595_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6___0927d8d400_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28' },
+                .malloced = false,
+            };
+            static struct class_Str string6___0927d8d400 = {
+                .buf = &string6___0927d8d400_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7_incref__90ae905b6b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x63', '\x72', '\x65', '\x66', '\x28' },
+                .malloced = false,
+            };
+            static struct class_Str string7_incref__90ae905b6b = {
+                .buf = &string7_incref__90ae905b6b_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string8__void_0_88c491b2bb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x76', '\x6f', '\x69', '\x64', '\x29', '\x30' },
+                .malloced = false,
+            };
+            static struct class_Str string8__void_0_88c491b2bb = {
+                .buf = &string8__void_0_88c491b2bb_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string9_string_decref__bdceb2462b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x64', '\x65', '\x63', '\x72', '\x65', '\x66', '\x28' },
+                .malloced = false,
+            };
+            static struct class_Str string9_string_decref__bdceb2462b = {
+                .buf = &string9_string_decref__bdceb2462b_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string10_decref__efbf6a75ea_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x65', '\x63', '\x72', '\x65', '\x66', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string10_decref__efbf6a75ea = {
+                .buf = &string10_decref__efbf6a75ea_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string11_decref___1006645f18_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x65', '\x63', '\x72', '\x65', '\x66', '\x28', '\x28' },
+                .malloced = false,
+            };
+            static struct class_Str string11_decref___1006645f18 = {
+                .buf = &string11_decref___1006645f18_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string12____dtor__f8e4b5798e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x2c', '\x20', '\x64', '\x74', '\x6f', '\x72', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string12____dtor__f8e4b5798e = {
+                .buf = &string12____dtor__f8e4b5798e_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string13___d819f496d3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f' },
+                .malloced = false,
+            };
+            static struct class_Str string13___d819f496d3 = {
+                .buf = &string13___d819f496d3_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string14___6148708968_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e' },
+                .malloced = false,
+            };
+            static struct class_Str string14___6148708968 = {
+                .buf = &string14___6148708968_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string15__c_7b3aa67a33_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string15__c_7b3aa67a33 = {
+                .buf = &string15__c_7b3aa67a33_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string16__h_bb2a330ea9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string16__h_bb2a330ea9 = {
+                .buf = &string16__h_bb2a330ea9_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string17__include__lib_oomph_h___d24439adbe_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x23', '\x69', '\x6e', '\x63', '\x6c', '\x75', '\x64', '\x65', '\x20', '\x3c', '\x6c', '\x69', '\x62', '\x2f', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x2e', '\x68', '\x3e', '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string17__include__lib_oomph_h___d24439adbe = {
+                .buf = &string17__include__lib_oomph_h___d24439adbe_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string18__include___46475c3262_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x23', '\x69', '\x6e', '\x63', '\x6c', '\x75', '\x64', '\x65', '\x20', '\x22' },
+                .malloced = false,
+            };
+            static struct class_Str string18__include___46475c3262 = {
+                .buf = &string18__include___46475c3262_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string19____ab47a6a6ac_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x22', '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string19____ab47a6a6ac = {
+                .buf = &string19____ab47a6a6ac_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string20_HEADER_GUARD__57c50a7caf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x48', '\x45', '\x41', '\x44', '\x45', '\x52', '\x5f', '\x47', '\x55', '\x41', '\x52', '\x44', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string20_HEADER_GUARD__57c50a7caf = {
+                .buf = &string20_HEADER_GUARD__57c50a7caf_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string21_______________ifndef__23e930503f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x23', '\x69', '\x66', '\x6e', '\x64', '\x65', '\x66', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string21_______________ifndef__23e930503f = {
+                .buf = &string21_______________ifndef__23e930503f_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string22_______________define__ffb25c75fa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x23', '\x64', '\x65', '\x66', '\x69', '\x6e', '\x65', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string22_______________define__ffb25c75fa = {
+                .buf = &string22_______________define__ffb25c75fa_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string23_______________978455ca69_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string23_______________978455ca69 = {
+                .buf = &string23_______________978455ca69_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string24_______________endif______________b8ef240427_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x23', '\x65', '\x6e', '\x64', '\x69', '\x66', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string24_______________endif______________b8ef240427 = {
+                .buf = &string24_______________endif______________b8ef240427_buf,
+                .nbytes = 32,
+                .offset = 0,
+            };
+            
+            struct class_Session_88204c75ff* ctor_Session_88204c75ff(struct class_Builtins_bd980a9f08* arg_builtins,struct class_Str arg_compilation_dir,struct class_List_Symbol__9a01330177* arg_symbols,struct class_List_FilePair__2b6998ab5b* arg_file_pairs)
+            {
+                struct class_Session_88204c75ff* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_builtins = arg_builtins;
+obj->memb_compilation_dir = arg_compilation_dir;
+obj->memb_symbols = arg_symbols;
+obj->memb_file_pairs = arg_file_pairs;
+
+                incref(arg_builtins);
+string_incref(arg_compilation_dir);
+incref(arg_symbols);
+incref(arg_file_pairs);
+
+                return obj;
+            }
+
+            void dtor_Session_88204c75ff(void *ptr)
+            {
+                struct class_Session_88204c75ff *obj = ptr;
+                decref((obj->memb_builtins), dtor_Builtins_bd980a9f08);
+string_decref(obj->memb_compilation_dir);
+decref((obj->memb_symbols), dtor_List_Symbol__9a01330177);
+decref((obj->memb_file_pairs), dtor_List_FilePair__2b6998ab5b);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Session_88204c75ff_to_string(struct class_Session_88204c75ff* self)
+                {
+                    struct class_Str res = string0_Session_c990cb37d2;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Builtins_bd980a9f08_to_string(self->memb_builtins);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_compilation_dir);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Symbol__9a01330177_to_string(self->memb_symbols);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_FilePair__2b6998ab5b_to_string(self->memb_file_pairs);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Session_88204c75ff_equals(struct class_Session_88204c75ff* var1, struct class_Session_88204c75ff* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}void meth_Session_88204c75ff_destroy(struct class_Session_88204c75ff* var1){struct class_List_FilePair__2b6998ab5b* var3;
+var3 = NULL;
+struct class_List_FilePair__2b6998ab5b* var4;
+var4 = NULL;
+bool var5;
+bool var6;
+bool var7;
+struct class_List_FilePair__2b6998ab5b* var9;
+var9 = NULL;
+struct class_FilePair_99df852164* var10;
+var10 = NULL;
+label2: (void)0;
+decref((var3), dtor_List_FilePair__2b6998ab5b);
+var3 = NULL;
+var3 = var1->memb_file_pairs;
+incref(var3);
+decref((var4), dtor_List_FilePair__2b6998ab5b);
+var4 = NULL;
+var4 = ctor_List_FilePair__2b6998ab5b();
+var5 = meth_List_FilePair__2b6998ab5b_equals(var3,var4);
+var6 = oomph_bool_not(var5);
+var7 = oomph_bool_not(var6);
+if (var7) goto label8;
+decref((var9), dtor_List_FilePair__2b6998ab5b);
+var9 = NULL;
+var9 = var1->memb_file_pairs;
+incref(var9);
+decref((var10), dtor_FilePair_99df852164);
+var10 = NULL;
+var10 = meth_List_FilePair__2b6998ab5b_pop(var9);
+if (oomph_true) goto label2;
+label8: (void)0;
+out: (void)0;
+decref((var10), dtor_FilePair_99df852164);
+decref((var9), dtor_List_FilePair__2b6998ab5b);
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_FilePair__2b6998ab5b);
+decref((var3), dtor_List_FilePair__2b6998ab5b);
+}struct class_FilePair_99df852164* meth_Session_88204c75ff_source_path_to_file_pair(struct class_Session_88204c75ff* var1, struct class_Str var2){struct class_List_FilePair__2b6998ab5b* var3;
+var3 = NULL;
+int64_t var4;
+struct class_FilePair_99df852164* var6;
+var6 = NULL;
+struct class__Type___Str__e7feb8bffc var8;
+var8.membernum = -1;
+struct class__Type___Str__e7feb8bffc var9;
+var9.membernum = -1;
+bool var10;
+bool var13;
+struct class_Str var14;
+var14.buf = NULL;
+int64_t var15;
+struct class_FilePair_99df852164* retval;
+var3 = var1->memb_file_pairs;
+incref(var3);
+var4 = 0LL;
+label5: (void)0;
+if (var4 >= var3->len) goto label7;
+decref((var6), dtor_FilePair_99df852164); var6 = var3->data[var4++]; incref(var6);
+decref__Type___Str__e7feb8bffc(var8);
+var8.membernum = -1;
+var8 = var6->memb_type_or_source_path;
+incref__Type___Str__e7feb8bffc(var8);
+decref__Type___Str__e7feb8bffc(var9);
+var9.membernum = -1;
+var9 = (struct class__Type___Str__e7feb8bffc){ .val = { .item1 = var2 }, .membernum = 1 };
+string_incref(var2);
+var10 = meth__Type___Str__e7feb8bffc_equals(var8,var9);
+if (var10) goto label11;
+if (oomph_true) goto label12;
+label11: (void)0;
+retval = var6; var6 = NULL;
+goto out;
+label12: (void)0;
+if (oomph_true) goto label5;
+label7: (void)0;
+var13 = oomph_false;
+var14 = string1_self_hosted_c_output_oomph_acd42f96df; string_incref(var14);
+var15 = 687LL;
+oomph_assert(var13,var14,var15);
+out: (void)0;
+(void)0;
+string_decref(var14);
+(void)0;
+(void)0;
+decref__Type___Str__e7feb8bffc(var9);
+decref__Type___Str__e7feb8bffc(var8);
+decref((var6), dtor_FilePair_99df852164);
+(void)0;
+decref((var3), dtor_List_FilePair__2b6998ab5b);
+return retval;
+}struct class_FilePair_99df852164* meth_Session_88204c75ff_type_to_file_pair(struct class_Session_88204c75ff* var1, struct class_Type_87e1ce5c5e var2){struct class_List_FilePair__2b6998ab5b* var3;
+var3 = NULL;
+int64_t var4;
+struct class_FilePair_99df852164* var6;
+var6 = NULL;
+struct class__Type___Str__e7feb8bffc var8;
+var8.membernum = -1;
+struct class__Type___Str__e7feb8bffc var9;
+var9.membernum = -1;
+bool var10;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_List_Str__43b70c06cb* var16;
+var16 = NULL;
+char var17;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_List_FilePair__2b6998ab5b* var21;
+var21 = NULL;
+struct class_List_FilePair__2b6998ab5b* var22;
+var22 = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class__Type___Str__e7feb8bffc var24;
+var24.membernum = -1;
+struct class__null___Str__5eca9cec4f var25;
+var25.membernum = -1;
+struct class_FilePair_99df852164* var26;
+var26 = NULL;
+struct class_List_FilePair__2b6998ab5b* var27;
+var27 = NULL;
+struct class_FilePair_99df852164* retval;
+var3 = var1->memb_file_pairs;
+incref(var3);
+var4 = 0LL;
+label5: (void)0;
+if (var4 >= var3->len) goto label7;
+decref((var6), dtor_FilePair_99df852164); var6 = var3->data[var4++]; incref(var6);
+decref__Type___Str__e7feb8bffc(var8);
+var8.membernum = -1;
+var8 = var6->memb_type_or_source_path;
+incref__Type___Str__e7feb8bffc(var8);
+decref__Type___Str__e7feb8bffc(var9);
+var9.membernum = -1;
+var9 = (struct class__Type___Str__e7feb8bffc){ .val = { .item0 = var2 }, .membernum = 0 };
+incref_Type_87e1ce5c5e(var2);
+var10 = meth__Type___Str__e7feb8bffc_equals(var8,var9);
+if (var10) goto label11;
+if (oomph_true) goto label12;
+label11: (void)0;
+retval = var6; var6 = NULL;
+goto out;
+label12: (void)0;
+if (oomph_true) goto label5;
+label7: (void)0;
+var13 = ir_4b1a3e0393_type_name(var2);
+var14 = ir_4b1a3e0393_type_id_string(var2);
+var15 = c_output_6a23cf54cc_create_id(var13,var14);
+var16 = ctor_List_Str__43b70c06cb();
+var17 = oomph_null;
+var18 = string2__f806646b23; string_incref(var18);
+var19 = string2__f806646b23; string_incref(var19);
+var20 = string2__f806646b23; string_incref(var20);
+var21 = ctor_List_FilePair__2b6998ab5b();
+var22 = ctor_List_FilePair__2b6998ab5b();
+var23 = string2__f806646b23; string_incref(var23);
+var24 = (struct class__Type___Str__e7feb8bffc){ .val = { .item0 = var2 }, .membernum = 0 };
+incref_Type_87e1ce5c5e(var2);
+var25 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var17 }, .membernum = 0 };
+var26 = ctor_FilePair_99df852164(var1,var15,var24,var16,var25,var18,var19,var20,var21,var22,var23);
+var27 = var1->memb_file_pairs;
+incref(var27);
+meth_List_FilePair__2b6998ab5b_push(var27,var26);
+meth_FilePair_99df852164_define_type(var26,var2);
+retval = var26; var26 = NULL;
+goto out;
+out: (void)0;
+decref((var27), dtor_List_FilePair__2b6998ab5b);
+decref((var26), dtor_FilePair_99df852164);
+decref__null___Str__5eca9cec4f(var25);
+decref__Type___Str__e7feb8bffc(var24);
+string_decref(var23);
+decref((var22), dtor_List_FilePair__2b6998ab5b);
+decref((var21), dtor_List_FilePair__2b6998ab5b);
+string_decref(var20);
+string_decref(var19);
+string_decref(var18);
+(void)0;
+decref((var16), dtor_List_Str__43b70c06cb);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+(void)0;
+decref__Type___Str__e7feb8bffc(var9);
+decref__Type___Str__e7feb8bffc(var8);
+decref((var6), dtor_FilePair_99df852164);
+(void)0;
+decref((var3), dtor_List_FilePair__2b6998ab5b);
+return retval;
+}struct class_Str meth_Session_88204c75ff_get_type_c_name(struct class_Session_88204c75ff* var1, struct class_Type_87e1ce5c5e var2){struct class_Builtins_bd980a9f08* var3;
+var3 = NULL;
+struct class_List_Type__057f9c6088* var4;
+var4 = NULL;
+bool var5;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_FilePair_99df852164* var9;
+var9 = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str retval;
+var3 = var1->memb_builtins;
+incref(var3);
+var4 = meth_Builtins_bd980a9f08_get_builtin_types(var3);
+var5 = meth_List_Type__057f9c6088___contains(var4,var2);
+if (var5) goto label6;
+if (oomph_true) goto label7;
+label6: (void)0;
+var8 = ir_4b1a3e0393_type_name(var2);
+retval = var8; var8.buf = NULL;
+goto out;
+label7: (void)0;
+var9 = meth_Session_88204c75ff_type_to_file_pair(var1,var2);
+var10 = var9->memb_id;
+string_incref(var10);
+retval = var10; var10.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var10);
+decref((var9), dtor_FilePair_99df852164);
+string_decref(var8);
+(void)0;
+decref((var4), dtor_List_Type__057f9c6088);
+decref((var3), dtor_Builtins_bd980a9f08);
+return retval;
+}struct class_Str meth_Session_88204c75ff_emit_incref(struct class_Session_88204c75ff* var1, struct class_Str var2, struct class_Type_87e1ce5c5e var3){struct class_Builtins_bd980a9f08* var4;
+var4 = NULL;
+struct class_Type_87e1ce5c5e var5;
+var5.membernum = -1;
+bool var6;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+bool var13;
+struct class_UnionType_7f899bced1* var16;
+var16 = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Type_87e1ce5c5e var18;
+var18.membernum = -1;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+bool var26;
+struct class_Str var29;
+var29.buf = NULL;
+struct class_Str var30;
+var30.buf = NULL;
+struct class_Str var31;
+var31.buf = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+struct class_Str retval;
+var4 = var1->memb_builtins;
+var5 = var4->memb_STR;
+var4 = NULL;
+incref_Type_87e1ce5c5e(var5);
+var6 = meth_Type_87e1ce5c5e_equals(var3,var5);
+if (var6) goto label7;
+if (oomph_true) goto label8;
+label7: (void)0;
+var9 = string3_string_incref__c7b6c652d6; string_incref(var9);
+var10 = oomph_string_concat(var9,var2);
+var11 = string4___161cf12644; string_incref(var11);
+var12 = oomph_string_concat(var10,var11);
+retval = var12; var12.buf = NULL;
+goto out;
+label8: (void)0;
+
+            var13 = (
+                var3.membernum == 3
+            );
+            if (var13) goto label14;
+
+            var13 = (
+                var3.membernum == 0
+            );
+            if (var13) goto label15;
+
+            var13 = (
+                var3.membernum == 1
+            );
+            if (var13) goto label15;
+
+            var13 = (
+                var3.membernum == 2
+            );
+            if (var13) goto label15;
+label14: (void)0;
+
+            if (var3.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var16 = var3.val.item3;
+            incref(var16);
+var17 = string5_incref__266c688595; string_incref(var17);
+var18 = (struct class_Type_87e1ce5c5e){ .val = { .item3 = var16 }, .membernum = 3 };
+var16 = NULL;
+var19 = meth_Session_88204c75ff_get_type_c_name(var1,var18);
+var20 = oomph_string_concat(var17,var19);
+var21 = string6___0927d8d400; string_incref(var21);
+var22 = oomph_string_concat(var20,var21);
+var23 = oomph_string_concat(var22,var2);
+var24 = string4___161cf12644; string_incref(var24);
+var25 = oomph_string_concat(var23,var24);
+retval = var25; var25.buf = NULL;
+goto out;
+label15: (void)0;
+var26 = ir_4b1a3e0393_is_refcounted(var3);
+if (var26) goto label27;
+if (oomph_true) goto label28;
+label27: (void)0;
+var29 = string7_incref__90ae905b6b; string_incref(var29);
+var30 = oomph_string_concat(var29,var2);
+var31 = string4___161cf12644; string_incref(var31);
+var32 = oomph_string_concat(var30,var31);
+retval = var32; var32.buf = NULL;
+goto out;
+label28: (void)0;
+var33 = string8__void_0_88c491b2bb; string_incref(var33);
+retval = var33; var33.buf = NULL;
+goto out;
+label34: (void)0;
+out: (void)0;
+string_decref(var33);
+string_decref(var32);
+string_decref(var31);
+string_decref(var30);
+string_decref(var29);
+(void)0;
+string_decref(var25);
+string_decref(var24);
+string_decref(var23);
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+string_decref(var19);
+decref_Type_87e1ce5c5e(var18);
+string_decref(var17);
+decref((var16), dtor_UnionType_7f899bced1);
+(void)0;
+string_decref(var12);
+string_decref(var11);
+string_decref(var10);
+string_decref(var9);
+(void)0;
+decref_Type_87e1ce5c5e(var5);
+decref((var4), dtor_Builtins_bd980a9f08);
+return retval;
+}struct class_Str meth_Session_88204c75ff_emit_decref(struct class_Session_88204c75ff* var1, struct class_Str var2, struct class_Type_87e1ce5c5e var3){struct class_Builtins_bd980a9f08* var4;
+var4 = NULL;
+struct class_Type_87e1ce5c5e var5;
+var5.membernum = -1;
+bool var6;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+bool var13;
+struct class_UnionType_7f899bced1* var16;
+var16 = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+bool var25;
+struct class_Str var28;
+var28.buf = NULL;
+struct class_Str var29;
+var29.buf = NULL;
+struct class_Str var30;
+var30.buf = NULL;
+struct class_Str var31;
+var31.buf = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+struct class_Str retval;
+var4 = var1->memb_builtins;
+var5 = var4->memb_STR;
+var4 = NULL;
+incref_Type_87e1ce5c5e(var5);
+var6 = meth_Type_87e1ce5c5e_equals(var3,var5);
+if (var6) goto label7;
+if (oomph_true) goto label8;
+label7: (void)0;
+var9 = string9_string_decref__bdceb2462b; string_incref(var9);
+var10 = oomph_string_concat(var9,var2);
+var11 = string4___161cf12644; string_incref(var11);
+var12 = oomph_string_concat(var10,var11);
+retval = var12; var12.buf = NULL;
+goto out;
+label8: (void)0;
+
+            var13 = (
+                var3.membernum == 3
+            );
+            if (var13) goto label14;
+
+            var13 = (
+                var3.membernum == 0
+            );
+            if (var13) goto label15;
+
+            var13 = (
+                var3.membernum == 1
+            );
+            if (var13) goto label15;
+
+            var13 = (
+                var3.membernum == 2
+            );
+            if (var13) goto label15;
+label14: (void)0;
+
+            if (var3.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var16 = var3.val.item3;
+            incref(var16);
+var17 = string10_decref__efbf6a75ea; string_incref(var17);
+var18 = meth_Session_88204c75ff_get_type_c_name(var1,var3);
+var19 = oomph_string_concat(var17,var18);
+var20 = string6___0927d8d400; string_incref(var20);
+var21 = oomph_string_concat(var19,var20);
+var22 = oomph_string_concat(var21,var2);
+var23 = string4___161cf12644; string_incref(var23);
+var24 = oomph_string_concat(var22,var23);
+retval = var24; var24.buf = NULL;
+goto out;
+label15: (void)0;
+var25 = ir_4b1a3e0393_is_refcounted(var3);
+if (var25) goto label26;
+if (oomph_true) goto label27;
+label26: (void)0;
+var28 = string11_decref___1006645f18; string_incref(var28);
+var29 = oomph_string_concat(var28,var2);
+var30 = string12____dtor__f8e4b5798e; string_incref(var30);
+var31 = oomph_string_concat(var29,var30);
+var32 = meth_Session_88204c75ff_get_type_c_name(var1,var3);
+var33 = oomph_string_concat(var31,var32);
+var34 = string4___161cf12644; string_incref(var34);
+var35 = oomph_string_concat(var33,var34);
+retval = var35; var35.buf = NULL;
+goto out;
+label27: (void)0;
+var36 = string8__void_0_88c491b2bb; string_incref(var36);
+retval = var36; var36.buf = NULL;
+goto out;
+label37: (void)0;
+out: (void)0;
+string_decref(var36);
+string_decref(var35);
+string_decref(var34);
+string_decref(var33);
+string_decref(var32);
+string_decref(var31);
+string_decref(var30);
+string_decref(var29);
+string_decref(var28);
+(void)0;
+string_decref(var24);
+string_decref(var23);
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+string_decref(var19);
+string_decref(var18);
+string_decref(var17);
+decref((var16), dtor_UnionType_7f899bced1);
+(void)0;
+string_decref(var12);
+string_decref(var11);
+string_decref(var10);
+string_decref(var9);
+(void)0;
+decref_Type_87e1ce5c5e(var5);
+decref((var4), dtor_Builtins_bd980a9f08);
+return retval;
+}void meth_Session_88204c75ff_create_c_code(struct class_Session_88204c75ff* var1, struct class_List_ToplevelDeclaration__35f88ef566* var2, struct class_Str var3){struct class_List_FilePair__2b6998ab5b* var4;
+var4 = NULL;
+int64_t var5;
+struct class_FilePair_99df852164* var7;
+var7 = NULL;
+struct class__Type___Str__e7feb8bffc var9;
+var9.membernum = -1;
+struct class__Type___Str__e7feb8bffc var10;
+var10.membernum = -1;
+bool var11;
+bool var12;
+struct class_Str var13;
+var13.buf = NULL;
+int64_t var14;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_List_Str__43b70c06cb* var16;
+var16 = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_List_Str__43b70c06cb* var19;
+var19 = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_List_Str__43b70c06cb* var22;
+var22 = NULL;
+char var23;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_List_FilePair__2b6998ab5b* var27;
+var27 = NULL;
+struct class_List_FilePair__2b6998ab5b* var28;
+var28 = NULL;
+struct class_Str var29;
+var29.buf = NULL;
+struct class__Type___Str__e7feb8bffc var30;
+var30.membernum = -1;
+struct class__null___Str__5eca9cec4f var31;
+var31.membernum = -1;
+struct class_FilePair_99df852164* var32;
+var32 = NULL;
+struct class_List_FilePair__2b6998ab5b* var33;
+var33 = NULL;
+int64_t var34;
+struct class_ToplevelDeclaration_5505a52ad0 var36;
+var36.membernum = -1;
+var4 = var1->memb_file_pairs;
+incref(var4);
+var5 = 0LL;
+label6: (void)0;
+if (var5 >= var4->len) goto label8;
+decref((var7), dtor_FilePair_99df852164); var7 = var4->data[var5++]; incref(var7);
+decref__Type___Str__e7feb8bffc(var9);
+var9.membernum = -1;
+var9 = var7->memb_type_or_source_path;
+incref__Type___Str__e7feb8bffc(var9);
+decref__Type___Str__e7feb8bffc(var10);
+var10.membernum = -1;
+var10 = (struct class__Type___Str__e7feb8bffc){ .val = { .item1 = var3 }, .membernum = 1 };
+string_incref(var3);
+var11 = meth__Type___Str__e7feb8bffc_equals(var9,var10);
+var12 = oomph_bool_not(var11);
+string_decref(var13);
+var13.buf = NULL;
+var13 = string1_self_hosted_c_output_oomph_acd42f96df; string_incref(var13);
+var14 = 735LL;
+oomph_assert(var12,var13,var14);
+if (oomph_true) goto label6;
+label8: (void)0;
+var15 = string13___d819f496d3; string_incref(var15);
+var16 = meth_Str_split(var3,var15);
+var17 = meth_List_Str__43b70c06cb_last(var16);
+var18 = string14___6148708968; string_incref(var18);
+var19 = meth_Str_split(var17,var18);
+var20 = meth_List_Str__43b70c06cb_first(var19);
+var21 = c_output_6a23cf54cc_create_id(var20,var3);
+var22 = ctor_List_Str__43b70c06cb();
+var23 = oomph_null;
+var24 = string2__f806646b23; string_incref(var24);
+var25 = string2__f806646b23; string_incref(var25);
+var26 = string2__f806646b23; string_incref(var26);
+var27 = ctor_List_FilePair__2b6998ab5b();
+var28 = ctor_List_FilePair__2b6998ab5b();
+var29 = string2__f806646b23; string_incref(var29);
+var30 = (struct class__Type___Str__e7feb8bffc){ .val = { .item1 = var3 }, .membernum = 1 };
+string_incref(var3);
+var31 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var23 }, .membernum = 0 };
+var32 = ctor_FilePair_99df852164(var1,var21,var30,var22,var31,var24,var25,var26,var27,var28,var29);
+var33 = var1->memb_file_pairs;
+incref(var33);
+meth_List_FilePair__2b6998ab5b_push(var33,var32);
+var34 = 0LL;
+label35: (void)0;
+if (var34 >= var2->len) goto label37;
+decref_ToplevelDeclaration_5505a52ad0(var36); var36 = var2->data[var34++]; incref_ToplevelDeclaration_5505a52ad0(var36);
+meth_FilePair_99df852164_emit_toplevel_declaration(var32,var36);
+if (oomph_true) goto label35;
+label37: (void)0;
+out: (void)0;
+decref_ToplevelDeclaration_5505a52ad0(var36);
+(void)0;
+decref((var33), dtor_List_FilePair__2b6998ab5b);
+decref((var32), dtor_FilePair_99df852164);
+decref__null___Str__5eca9cec4f(var31);
+decref__Type___Str__e7feb8bffc(var30);
+string_decref(var29);
+decref((var28), dtor_List_FilePair__2b6998ab5b);
+decref((var27), dtor_List_FilePair__2b6998ab5b);
+string_decref(var26);
+string_decref(var25);
+string_decref(var24);
+(void)0;
+decref((var22), dtor_List_Str__43b70c06cb);
+string_decref(var21);
+string_decref(var20);
+decref((var19), dtor_List_Str__43b70c06cb);
+string_decref(var18);
+string_decref(var17);
+decref((var16), dtor_List_Str__43b70c06cb);
+string_decref(var15);
+(void)0;
+string_decref(var13);
+(void)0;
+(void)0;
+decref__Type___Str__e7feb8bffc(var10);
+decref__Type___Str__e7feb8bffc(var9);
+decref((var7), dtor_FilePair_99df852164);
+(void)0;
+decref((var4), dtor_List_FilePair__2b6998ab5b);
+}struct class_List_Str__43b70c06cb* meth_Session_88204c75ff_write_everything(struct class_Session_88204c75ff* var1, struct class_Str var2){struct class_FilePair_99df852164* var3;
+var3 = NULL;
+struct class_List_Str__43b70c06cb* var4;
+var4 = NULL;
+struct class_List_FilePair__2b6998ab5b* var5;
+var5 = NULL;
+int64_t var6;
+struct class_FilePair_99df852164* var8;
+var8 = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_List_Str__43b70c06cb* var27;
+var27 = NULL;
+struct class_List_Str__43b70c06cb* var28;
+var28 = NULL;
+bool var29;
+bool var30;
+struct class_Str var33;
+var33.buf = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+struct class_Str var37;
+var37.buf = NULL;
+struct class_Str var38;
+var38.buf = NULL;
+struct class_List_FilePair__2b6998ab5b* var39;
+var39 = NULL;
+struct class_List_Str__43b70c06cb* var40;
+var40 = NULL;
+int64_t var41;
+int64_t var42;
+struct class_FilePair_99df852164* var44;
+var44 = NULL;
+struct class_Str var46;
+var46.buf = NULL;
+struct class_Str var47;
+var47.buf = NULL;
+struct class_Str var48;
+var48.buf = NULL;
+struct class_List_FilePair__2b6998ab5b* var49;
+var49 = NULL;
+struct class_List_Str__43b70c06cb* var50;
+var50 = NULL;
+int64_t var51;
+int64_t var52;
+struct class_FilePair_99df852164* var54;
+var54 = NULL;
+struct class_Str var56;
+var56.buf = NULL;
+struct class_Str var57;
+var57.buf = NULL;
+struct class_Str var58;
+var58.buf = NULL;
+struct class__null___Str__5eca9cec4f var59;
+var59.membernum = -1;
+char var60;
+struct class__null___Str__5eca9cec4f var61;
+var61.membernum = -1;
+bool var62;
+struct class__null___Str__5eca9cec4f var64;
+var64.membernum = -1;
+struct class_Str var65;
+var65.buf = NULL;
+struct class_Str var66;
+var66.buf = NULL;
+struct class_Str var68;
+var68.buf = NULL;
+struct class_List_Str__43b70c06cb* var69;
+var69 = NULL;
+int64_t var70;
+int64_t var71;
+struct class_Str var73;
+var73.buf = NULL;
+struct class_Str var75;
+var75.buf = NULL;
+struct class_Str var76;
+var76.buf = NULL;
+struct class_Str var77;
+var77.buf = NULL;
+struct class_Str var78;
+var78.buf = NULL;
+struct class_Str var79;
+var79.buf = NULL;
+struct class_Str var80;
+var80.buf = NULL;
+struct class_Str var81;
+var81.buf = NULL;
+struct class_Str var82;
+var82.buf = NULL;
+struct class_Str var83;
+var83.buf = NULL;
+struct class_Str var84;
+var84.buf = NULL;
+struct class_Str var85;
+var85.buf = NULL;
+struct class_Str var86;
+var86.buf = NULL;
+struct class_Str var87;
+var87.buf = NULL;
+struct class_List_Str__43b70c06cb* var88;
+var88 = NULL;
+int64_t var89;
+int64_t var90;
+struct class_Str var92;
+var92.buf = NULL;
+struct class_Str var94;
+var94.buf = NULL;
+struct class_Str var95;
+var95.buf = NULL;
+struct class_Str var96;
+var96.buf = NULL;
+struct class_Str var97;
+var97.buf = NULL;
+struct class_Str var98;
+var98.buf = NULL;
+struct class_Str var99;
+var99.buf = NULL;
+struct class_Str var100;
+var100.buf = NULL;
+struct class_Str var101;
+var101.buf = NULL;
+struct class_Str var102;
+var102.buf = NULL;
+struct class_Str var103;
+var103.buf = NULL;
+struct class_Str var104;
+var104.buf = NULL;
+struct class_Str var105;
+var105.buf = NULL;
+struct class_Str var106;
+var106.buf = NULL;
+struct class_Str var107;
+var107.buf = NULL;
+struct class_Str var108;
+var108.buf = NULL;
+struct class_Str var109;
+var109.buf = NULL;
+struct class_Str var110;
+var110.buf = NULL;
+struct class_Str var111;
+var111.buf = NULL;
+struct class_Str var112;
+var112.buf = NULL;
+struct class_Str var113;
+var113.buf = NULL;
+struct class_Str var114;
+var114.buf = NULL;
+struct class_Str var115;
+var115.buf = NULL;
+struct class_Str var116;
+var116.buf = NULL;
+struct class_Str var117;
+var117.buf = NULL;
+struct class_List_Str__43b70c06cb* retval;
+var3 = meth_Session_88204c75ff_source_path_to_file_pair(var1,var2);
+var4 = ctor_List_Str__43b70c06cb();
+var5 = var1->memb_file_pairs;
+incref(var5);
+var6 = 0LL;
+label7: (void)0;
+if (var6 >= var5->len) goto label9;
+decref((var8), dtor_FilePair_99df852164); var8 = var5->data[var6++]; incref(var8);
+string_decref(var10);
+var10.buf = NULL;
+var10 = var1->memb_compilation_dir;
+string_incref(var10);
+string_decref(var11);
+var11.buf = NULL;
+var11 = string13___d819f496d3; string_incref(var11);
+string_decref(var12);
+var12.buf = NULL;
+var12 = oomph_string_concat(var10,var11);
+string_decref(var13);
+var13.buf = NULL;
+var13 = var8->memb_id;
+string_incref(var13);
+string_decref(var14);
+var14.buf = NULL;
+var14 = oomph_string_concat(var12,var13);
+string_decref(var15);
+var15.buf = NULL;
+var15 = string15__c_7b3aa67a33; string_incref(var15);
+string_decref(var16);
+var16.buf = NULL;
+var16 = oomph_string_concat(var14,var15);
+string_decref(var17);
+var17.buf = NULL;
+var17 = var1->memb_compilation_dir;
+string_incref(var17);
+string_decref(var18);
+var18.buf = NULL;
+var18 = string13___d819f496d3; string_incref(var18);
+string_decref(var19);
+var19.buf = NULL;
+var19 = oomph_string_concat(var17,var18);
+string_decref(var20);
+var20.buf = NULL;
+var20 = var8->memb_id;
+string_incref(var20);
+string_decref(var21);
+var21.buf = NULL;
+var21 = oomph_string_concat(var19,var20);
+string_decref(var22);
+var22.buf = NULL;
+var22 = string16__h_bb2a330ea9; string_incref(var22);
+string_decref(var23);
+var23.buf = NULL;
+var23 = oomph_string_concat(var21,var22);
+meth_List_Str__43b70c06cb_push(var4,var16);
+string_decref(var24);
+var24.buf = NULL;
+var24 = var8->memb_id;
+string_incref(var24);
+string_decref(var25);
+var25.buf = NULL;
+var25 = string16__h_bb2a330ea9; string_incref(var25);
+string_decref(var26);
+var26.buf = NULL;
+var26 = oomph_string_concat(var24,var25);
+decref((var27), dtor_List_Str__43b70c06cb);
+var27 = NULL;
+var27 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var27,var26);
+decref((var28), dtor_List_Str__43b70c06cb);
+var28 = NULL;
+var28 = ctor_List_Str__43b70c06cb();
+var29 = meth_FilePair_99df852164_equals(var8,var3);
+var30 = oomph_bool_not(var29);
+if (var30) goto label31;
+if (oomph_true) goto label32;
+label31: (void)0;
+string_decref(var33);
+var33.buf = NULL;
+var33 = var3->memb_id;
+string_incref(var33);
+string_decref(var34);
+var34.buf = NULL;
+var34 = string16__h_bb2a330ea9; string_incref(var34);
+string_decref(var35);
+var35.buf = NULL;
+var35 = oomph_string_concat(var33,var34);
+meth_List_Str__43b70c06cb_push(var27,var35);
+string_decref(var36);
+var36.buf = NULL;
+var36 = var3->memb_id;
+string_incref(var36);
+string_decref(var37);
+var37.buf = NULL;
+var37 = string16__h_bb2a330ea9; string_incref(var37);
+string_decref(var38);
+var38.buf = NULL;
+var38 = oomph_string_concat(var36,var37);
+meth_List_Str__43b70c06cb_push(var28,var38);
+label32: (void)0;
+decref((var39), dtor_List_FilePair__2b6998ab5b);
+var39 = NULL;
+var39 = var8->memb_c_includes;
+incref(var39);
+decref((var40), dtor_List_Str__43b70c06cb);
+var40 = NULL;
+var40 = ctor_List_Str__43b70c06cb();
+var41 = meth_List_FilePair__2b6998ab5b_length(var39);
+meth_List_Str__43b70c06cb___reserve(var40,var41);
+var42 = 0LL;
+label43: (void)0;
+if (var42 >= var39->len) goto label45;
+var44 = var39->data[var42++];
+string_decref(var46);
+var46.buf = NULL;
+var46 = var44->memb_id;
+string_incref(var46);
+string_decref(var47);
+var47.buf = NULL;
+var47 = string16__h_bb2a330ea9; string_incref(var47);
+string_decref(var48);
+var48.buf = NULL;
+var48 = oomph_string_concat(var46,var47);
+meth_List_Str__43b70c06cb_push(var40,var48);
+if (oomph_true) goto label43;
+label45: (void)0;
+meth_List_Str__43b70c06cb_push_all(var27,var40);
+decref((var49), dtor_List_FilePair__2b6998ab5b);
+var49 = NULL;
+var49 = var8->memb_c_includes;
+incref(var49);
+decref((var50), dtor_List_Str__43b70c06cb);
+var50 = NULL;
+var50 = ctor_List_Str__43b70c06cb();
+var51 = meth_List_FilePair__2b6998ab5b_length(var49);
+meth_List_Str__43b70c06cb___reserve(var50,var51);
+var52 = 0LL;
+label53: (void)0;
+if (var52 >= var49->len) goto label55;
+var54 = var49->data[var52++];
+string_decref(var56);
+var56.buf = NULL;
+var56 = var54->memb_id;
+string_incref(var56);
+string_decref(var57);
+var57.buf = NULL;
+var57 = string16__h_bb2a330ea9; string_incref(var57);
+string_decref(var58);
+var58.buf = NULL;
+var58 = oomph_string_concat(var56,var57);
+meth_List_Str__43b70c06cb_push(var50,var58);
+if (oomph_true) goto label53;
+label55: (void)0;
+meth_List_Str__43b70c06cb_push_all(var28,var50);
+decref__null___Str__5eca9cec4f(var59);
+var59.membernum = -1;
+var59 = var8->memb_struct;
+incref__null___Str__5eca9cec4f(var59);
+var60 = oomph_null;
+decref__null___Str__5eca9cec4f(var61);
+var61.membernum = -1;
+var61 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var60 }, .membernum = 0 };
+var62 = meth__null___Str__5eca9cec4f_equals(var59,var61);
+if (var62) goto label63;
+decref__null___Str__5eca9cec4f(var64);
+var64.membernum = -1;
+var64 = var8->memb_struct;
+incref__null___Str__5eca9cec4f(var64);
+var65 = meth__null___Str__5eca9cec4f_get(var64);
+string_decref(var66);
+var66 = var65;
+var65.buf = NULL;
+if (oomph_true) goto label67;
+label63: (void)0;
+string_decref(var66);
+var66.buf = NULL;
+var66 = string2__f806646b23; string_incref(var66);
+label67: (void)0;
+string_decref(var68);
+var68.buf = NULL;
+var68 = string17__include__lib_oomph_h___d24439adbe; string_incref(var68);
+decref((var69), dtor_List_Str__43b70c06cb);
+var69 = NULL;
+var69 = ctor_List_Str__43b70c06cb();
+var70 = meth_List_Str__43b70c06cb_length(var28);
+meth_List_Str__43b70c06cb___reserve(var69,var70);
+var71 = 0LL;
+label72: (void)0;
+if (var71 >= var28->len) goto label74;
+var73 = var28->data[var71++];
+string_decref(var75);
+var75.buf = NULL;
+var75 = string18__include___46475c3262; string_incref(var75);
+string_decref(var76);
+var76.buf = NULL;
+var76 = oomph_string_concat(var75,var73);
+string_decref(var77);
+var77.buf = NULL;
+var77 = string19____ab47a6a6ac; string_incref(var77);
+string_decref(var78);
+var78.buf = NULL;
+var78 = oomph_string_concat(var76,var77);
+meth_List_Str__43b70c06cb_push(var69,var78);
+if (oomph_true) goto label72;
+label74: (void)0;
+string_decref(var79);
+var79.buf = NULL;
+var79 = string2__f806646b23; string_incref(var79);
+string_decref(var80);
+var80.buf = NULL;
+var80 = meth_List_Str__43b70c06cb_join(var69,var79);
+string_decref(var81);
+var81.buf = NULL;
+var81 = oomph_string_concat(var68,var80);
+string_decref(var82);
+var82.buf = NULL;
+var82 = var8->memb_h_fwd_decls;
+string_incref(var82);
+string_decref(var83);
+var83.buf = NULL;
+var83 = oomph_string_concat(var81,var82);
+string_decref(var84);
+var84.buf = NULL;
+var84 = oomph_string_concat(var83,var66);
+string_decref(var85);
+var85.buf = NULL;
+var85 = var8->memb_function_decls;
+string_incref(var85);
+string_decref(var86);
+var86.buf = NULL;
+var86 = oomph_string_concat(var84,var85);
+string_decref(var87);
+var87.buf = NULL;
+var87 = string17__include__lib_oomph_h___d24439adbe; string_incref(var87);
+decref((var88), dtor_List_Str__43b70c06cb);
+var88 = NULL;
+var88 = ctor_List_Str__43b70c06cb();
+var89 = meth_List_Str__43b70c06cb_length(var27);
+meth_List_Str__43b70c06cb___reserve(var88,var89);
+var90 = 0LL;
+label91: (void)0;
+if (var90 >= var27->len) goto label93;
+var92 = var27->data[var90++];
+string_decref(var94);
+var94.buf = NULL;
+var94 = string18__include___46475c3262; string_incref(var94);
+string_decref(var95);
+var95.buf = NULL;
+var95 = oomph_string_concat(var94,var92);
+string_decref(var96);
+var96.buf = NULL;
+var96 = string19____ab47a6a6ac; string_incref(var96);
+string_decref(var97);
+var97.buf = NULL;
+var97 = oomph_string_concat(var95,var96);
+meth_List_Str__43b70c06cb_push(var88,var97);
+if (oomph_true) goto label91;
+label93: (void)0;
+string_decref(var98);
+var98.buf = NULL;
+var98 = string2__f806646b23; string_incref(var98);
+string_decref(var99);
+var99.buf = NULL;
+var99 = meth_List_Str__43b70c06cb_join(var88,var98);
+string_decref(var100);
+var100.buf = NULL;
+var100 = oomph_string_concat(var87,var99);
+string_decref(var101);
+var101.buf = NULL;
+var101 = var8->memb_string_defs;
+string_incref(var101);
+string_decref(var102);
+var102.buf = NULL;
+var102 = oomph_string_concat(var100,var101);
+string_decref(var103);
+var103.buf = NULL;
+var103 = var8->memb_function_defs;
+string_incref(var103);
+string_decref(var104);
+var104.buf = NULL;
+var104 = oomph_string_concat(var102,var103);
+string_decref(var105);
+var105.buf = NULL;
+var105 = string20_HEADER_GUARD__57c50a7caf; string_incref(var105);
+string_decref(var106);
+var106.buf = NULL;
+var106 = var8->memb_id;
+string_incref(var106);
+string_decref(var107);
+var107.buf = NULL;
+var107 = oomph_string_concat(var105,var106);
+bundle_io_45f5b8a585_write_file(var16,var104);
+string_decref(var108);
+var108.buf = NULL;
+var108 = string21_______________ifndef__23e930503f; string_incref(var108);
+string_decref(var109);
+var109.buf = NULL;
+var109 = oomph_string_concat(var108,var107);
+string_decref(var110);
+var110.buf = NULL;
+var110 = string22_______________define__ffb25c75fa; string_incref(var110);
+string_decref(var111);
+var111.buf = NULL;
+var111 = oomph_string_concat(var109,var110);
+string_decref(var112);
+var112.buf = NULL;
+var112 = oomph_string_concat(var111,var107);
+string_decref(var113);
+var113.buf = NULL;
+var113 = string23_______________978455ca69; string_incref(var113);
+string_decref(var114);
+var114.buf = NULL;
+var114 = oomph_string_concat(var112,var113);
+string_decref(var115);
+var115.buf = NULL;
+var115 = oomph_string_concat(var114,var86);
+string_decref(var116);
+var116.buf = NULL;
+var116 = string24_______________endif______________b8ef240427; string_incref(var116);
+string_decref(var117);
+var117.buf = NULL;
+var117 = oomph_string_concat(var115,var116);
+bundle_io_45f5b8a585_write_file(var23,var117);
+if (oomph_true) goto label7;
+label9: (void)0;
+retval = var4; var4 = NULL;
+goto out;
+out: (void)0;
+string_decref(var117);
+string_decref(var116);
+string_decref(var115);
+string_decref(var114);
+string_decref(var113);
+string_decref(var112);
+string_decref(var111);
+string_decref(var110);
+string_decref(var109);
+string_decref(var108);
+string_decref(var107);
+string_decref(var106);
+string_decref(var105);
+string_decref(var104);
+string_decref(var103);
+string_decref(var102);
+string_decref(var101);
+string_decref(var100);
+string_decref(var99);
+string_decref(var98);
+string_decref(var97);
+string_decref(var96);
+string_decref(var95);
+string_decref(var94);
+(void)0;
+(void)0;
+decref((var88), dtor_List_Str__43b70c06cb);
+string_decref(var87);
+string_decref(var86);
+string_decref(var85);
+string_decref(var84);
+string_decref(var83);
+string_decref(var82);
+string_decref(var81);
+string_decref(var80);
+string_decref(var79);
+string_decref(var78);
+string_decref(var77);
+string_decref(var76);
+string_decref(var75);
+(void)0;
+(void)0;
+decref((var69), dtor_List_Str__43b70c06cb);
+string_decref(var68);
+string_decref(var66);
+string_decref(var65);
+decref__null___Str__5eca9cec4f(var64);
+(void)0;
+decref__null___Str__5eca9cec4f(var61);
+(void)0;
+decref__null___Str__5eca9cec4f(var59);
+string_decref(var58);
+string_decref(var57);
+string_decref(var56);
+(void)0;
+(void)0;
+decref((var50), dtor_List_Str__43b70c06cb);
+decref((var49), dtor_List_FilePair__2b6998ab5b);
+string_decref(var48);
+string_decref(var47);
+string_decref(var46);
+(void)0;
+(void)0;
+decref((var40), dtor_List_Str__43b70c06cb);
+decref((var39), dtor_List_FilePair__2b6998ab5b);
+string_decref(var38);
+string_decref(var37);
+string_decref(var36);
+string_decref(var35);
+string_decref(var34);
+string_decref(var33);
+(void)0;
+(void)0;
+decref((var28), dtor_List_Str__43b70c06cb);
+decref((var27), dtor_List_Str__43b70c06cb);
+string_decref(var26);
+string_decref(var25);
+string_decref(var24);
+string_decref(var23);
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+string_decref(var19);
+string_decref(var18);
+string_decref(var17);
+string_decref(var16);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+string_decref(var10);
+decref((var8), dtor_FilePair_99df852164);
+(void)0;
+decref((var5), dtor_List_FilePair__2b6998ab5b);
+decref((var4), dtor_List_Str__43b70c06cb);
+decref((var3), dtor_FilePair_99df852164);
+return retval;
+}
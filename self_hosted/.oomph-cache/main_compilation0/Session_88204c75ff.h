@@ -0,0 +1,94 @@
+
+                #ifndef HEADER_GUARD_Session_88204c75ff
+                #define HEADER_GUARD_Session_88204c75ff
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "ToplevelDeclaration_5505a52ad0.h"
+#include "Type_87e1ce5c5e.h"
+#include "_Type___Str__e7feb8bffc.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "bundle_io_45f5b8a585.h"
+#include "c_output_6a23cf54cc.h"
+#include "ir_4b1a3e0393.h"
+struct class_Builtins_bd980a9f08;
+struct class_List_Symbol__9a01330177;
+struct class_List_FilePair__2b6998ab5b;
+struct class_Builtins_bd980a9f08;
+struct class_List_Symbol__9a01330177;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_FilePair__2b6998ab5b;
+struct class_FilePair_99df852164;
+struct class_List_FilePair__2b6998ab5b;
+struct class_FilePair_99df852164;
+struct class_FilePair_99df852164;
+struct class_FilePair_99df852164;
+struct class_List_FilePair__2b6998ab5b;
+struct class_FilePair_99df852164;
+struct class_List_Str__43b70c06cb;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_FilePair__2b6998ab5b;
+struct class_FilePair_99df852164;
+struct class_List_FilePair__2b6998ab5b;
+struct class_FilePair_99df852164;
+struct class_FilePair_99df852164;
+struct class_Builtins_bd980a9f08;
+struct class_List_Type__057f9c6088;
+struct class_FilePair_99df852164;
+struct class_Builtins_bd980a9f08;
+struct class_UnionType_7f899bced1;
+struct class_Builtins_bd980a9f08;
+struct class_UnionType_7f899bced1;
+struct class_List_FilePair__2b6998ab5b;
+struct class_FilePair_99df852164;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_FilePair__2b6998ab5b;
+struct class_FilePair_99df852164;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_ToplevelDeclaration__35f88ef566;
+struct class_FilePair_99df852164;
+struct class_List_Str__43b70c06cb;
+struct class_List_FilePair__2b6998ab5b;
+struct class_FilePair_99df852164;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_Str__43b70c06cb;
+struct class_FilePair_99df852164;
+struct class_List_FilePair__2b6998ab5b;
+struct class_List_Str__43b70c06cb;
+struct class_FilePair_99df852164;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+
+            struct class_Session_88204c75ff {
+                REFCOUNT_HEADER
+                struct class_Builtins_bd980a9f08* memb_builtins;
+struct class_Str memb_compilation_dir;
+struct class_List_Symbol__9a01330177* memb_symbols;
+struct class_List_FilePair__2b6998ab5b* memb_file_pairs;
+
+            };
+            
+            struct class_Session_88204c75ff* ctor_Session_88204c75ff(struct class_Builtins_bd980a9f08* arg_builtins,struct class_Str arg_compilation_dir,struct class_List_Symbol__9a01330177* arg_symbols,struct class_List_FilePair__2b6998ab5b* arg_file_pairs);
+            void dtor_Session_88204c75ff(void *ptr);
+            
+                struct class_Str meth_Session_88204c75ff_to_string(struct class_Session_88204c75ff* obj);
+                bool meth_Session_88204c75ff_equals(struct class_Session_88204c75ff* var1, struct class_Session_88204c75ff* var2);
+void meth_Session_88204c75ff_destroy(struct class_Session_88204c75ff* var1);
+struct class_FilePair_99df852164* meth_Session_88204c75ff_source_path_to_file_pair(struct class_Session_88204c75ff* var1, struct class_Str var2);
+struct class_FilePair_99df852164* meth_Session_88204c75ff_type_to_file_pair(struct class_Session_88204c75ff* var1, struct class_Type_87e1ce5c5e var2);
+struct class_Str meth_Session_88204c75ff_get_type_c_name(struct class_Session_88204c75ff* var1, struct class_Type_87e1ce5c5e var2);
+struct class_Str meth_Session_88204c75ff_emit_incref(struct class_Session_88204c75ff* var1, struct class_Str var2, struct class_Type_87e1ce5c5e var3);
+struct class_Str meth_Session_88204c75ff_emit_decref(struct class_Session_88204c75ff* var1, struct class_Str var2, struct class_Type_87e1ce5c5e var3);
+void meth_Session_88204c75ff_create_c_code(struct class_Session_88204c75ff* var1, struct class_List_ToplevelDeclaration__35f88ef566* var2, struct class_Str var3);
+struct class_List_Str__43b70c06cb* meth_Session_88204c75ff_write_everything(struct class_Session_88204c75ff* var1, struct class_Str var2);
+
+                #endif
+                
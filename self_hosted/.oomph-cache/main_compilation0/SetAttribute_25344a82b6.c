@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "SetAttribute_25344a82b6.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf string0_SetAttribute_55bc4a7127_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x65', '\x74', '\x41', '\x74', '\x74', '\x72', '\x69', '\x62', '\x75', '\x74', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_SetAttribute_55bc4a7127 = {
+                .buf = &string0_SetAttribute_55bc4a7127_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            struct class_SetAttribute_25344a82b6* ctor_SetAttribute_25344a82b6(struct class_LocalVariable_846080e5ae* arg_obj,struct class_Str arg_attribute,struct class_LocalVariable_846080e5ae* arg_value)
+            {
+                struct class_SetAttribute_25344a82b6* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_obj = arg_obj;
+obj->memb_attribute = arg_attribute;
+obj->memb_value = arg_value;
+
+                incref(arg_obj);
+string_incref(arg_attribute);
+incref(arg_value);
+
+                return obj;
+            }
+
+            void dtor_SetAttribute_25344a82b6(void *ptr)
+            {
+                struct class_SetAttribute_25344a82b6 *obj = ptr;
+                decref((obj->memb_obj), dtor_LocalVariable_846080e5ae);
+string_decref(obj->memb_attribute);
+decref((obj->memb_value), dtor_LocalVariable_846080e5ae);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_SetAttribute_25344a82b6_to_string(struct class_SetAttribute_25344a82b6* self)
+                {
+                    struct class_Str res = string0_SetAttribute_55bc4a7127;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_obj);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_attribute);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_SetAttribute_25344a82b6_equals(struct class_SetAttribute_25344a82b6* var1, struct class_SetAttribute_25344a82b6* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
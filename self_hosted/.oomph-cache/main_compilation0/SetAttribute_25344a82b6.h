@@ -0,0 +1,26 @@
+
+                #ifndef HEADER_GUARD_SetAttribute_25344a82b6
+                #define HEADER_GUARD_SetAttribute_25344a82b6
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+
+            struct class_SetAttribute_25344a82b6 {
+                REFCOUNT_HEADER
+                struct class_LocalVariable_846080e5ae* memb_obj;
+struct class_Str memb_attribute;
+struct class_LocalVariable_846080e5ae* memb_value;
+
+            };
+            
+            struct class_SetAttribute_25344a82b6* ctor_SetAttribute_25344a82b6(struct class_LocalVariable_846080e5ae* arg_obj,struct class_Str arg_attribute,struct class_LocalVariable_846080e5ae* arg_value);
+            void dtor_SetAttribute_25344a82b6(void *ptr);
+            
+                struct class_Str meth_SetAttribute_25344a82b6_to_string(struct class_SetAttribute_25344a82b6* obj);
+                bool meth_SetAttribute_25344a82b6_equals(struct class_SetAttribute_25344a82b6* var1, struct class_SetAttribute_25344a82b6* var2);
+
+                #endif
+                
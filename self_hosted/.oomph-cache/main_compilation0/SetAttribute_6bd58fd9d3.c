@@ -0,0 +1,79 @@
+#include <lib/oomph.h>
+#include "SetAttribute_6bd58fd9d3.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_SetAttribute_ee23558955_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x65', '\x74', '\x41', '\x74', '\x74', '\x72', '\x69', '\x62', '\x75', '\x74', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_SetAttribute_ee23558955 = {
+                .buf = &string0_SetAttribute_ee23558955_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            struct class_SetAttribute_6bd58fd9d3* ctor_SetAttribute_6bd58fd9d3(struct class_Location_500c4434c9* arg_attribute_location,struct class_Expression_35f2052bf4 arg_obj,struct class_Str arg_attribute,struct class_Expression_35f2052bf4 arg_value)
+            {
+                struct class_SetAttribute_6bd58fd9d3* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_attribute_location = arg_attribute_location;
+obj->memb_obj = arg_obj;
+obj->memb_attribute = arg_attribute;
+obj->memb_value = arg_value;
+
+                incref(arg_attribute_location);
+incref_Expression_35f2052bf4(arg_obj);
+string_incref(arg_attribute);
+incref_Expression_35f2052bf4(arg_value);
+
+                return obj;
+            }
+
+            void dtor_SetAttribute_6bd58fd9d3(void *ptr)
+            {
+                struct class_SetAttribute_6bd58fd9d3 *obj = ptr;
+                decref((obj->memb_attribute_location), dtor_Location_500c4434c9);
+decref_Expression_35f2052bf4(obj->memb_obj);
+string_decref(obj->memb_attribute);
+decref_Expression_35f2052bf4(obj->memb_value);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_SetAttribute_6bd58fd9d3_to_string(struct class_SetAttribute_6bd58fd9d3* self)
+                {
+                    struct class_Str res = string0_SetAttribute_ee23558955;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_attribute_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_35f2052bf4_to_string(self->memb_obj);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_attribute);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_35f2052bf4_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_SetAttribute_6bd58fd9d3_equals(struct class_SetAttribute_6bd58fd9d3* var1, struct class_SetAttribute_6bd58fd9d3* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,26 @@
+
+                #ifndef HEADER_GUARD_SetAttribute_6bd58fd9d3
+                #define HEADER_GUARD_SetAttribute_6bd58fd9d3
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_SetAttribute_6bd58fd9d3 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_attribute_location;
+struct class_Expression_35f2052bf4 memb_obj;
+struct class_Str memb_attribute;
+struct class_Expression_35f2052bf4 memb_value;
+
+            };
+            
+            struct class_SetAttribute_6bd58fd9d3* ctor_SetAttribute_6bd58fd9d3(struct class_Location_500c4434c9* arg_attribute_location,struct class_Expression_35f2052bf4 arg_obj,struct class_Str arg_attribute,struct class_Expression_35f2052bf4 arg_value);
+            void dtor_SetAttribute_6bd58fd9d3(void *ptr);
+            
+                struct class_Str meth_SetAttribute_6bd58fd9d3_to_string(struct class_SetAttribute_6bd58fd9d3* obj);
+                bool meth_SetAttribute_6bd58fd9d3_equals(struct class_SetAttribute_6bd58fd9d3* var1, struct class_SetAttribute_6bd58fd9d3* var2);
+
+                #endif
+                
@@ -0,0 +1,72 @@
+#include <lib/oomph.h>
+#include "SetVar_6a19c6f350.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_SetVar_1e2f774d65_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x65', '\x74', '\x56', '\x61', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_SetVar_1e2f774d65 = {
+                .buf = &string0_SetVar_1e2f774d65_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_SetVar_6a19c6f350* ctor_SetVar_6a19c6f350(struct class_Location_500c4434c9* arg_location,struct class_Str arg_varname,struct class_Expression_35f2052bf4 arg_value)
+            {
+                struct class_SetVar_6a19c6f350* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_varname = arg_varname;
+obj->memb_value = arg_value;
+
+                incref(arg_location);
+string_incref(arg_varname);
+incref_Expression_35f2052bf4(arg_value);
+
+                return obj;
+            }
+
+            void dtor_SetVar_6a19c6f350(void *ptr)
+            {
+                struct class_SetVar_6a19c6f350 *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+string_decref(obj->memb_varname);
+decref_Expression_35f2052bf4(obj->memb_value);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_SetVar_6a19c6f350_to_string(struct class_SetVar_6a19c6f350* self)
+                {
+                    struct class_Str res = string0_SetVar_1e2f774d65;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_varname);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_35f2052bf4_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_SetVar_6a19c6f350_equals(struct class_SetVar_6a19c6f350* var1, struct class_SetVar_6a19c6f350* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
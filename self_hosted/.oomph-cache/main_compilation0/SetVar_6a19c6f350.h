@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_SetVar_6a19c6f350
+                #define HEADER_GUARD_SetVar_6a19c6f350
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_SetVar_6a19c6f350 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Str memb_varname;
+struct class_Expression_35f2052bf4 memb_value;
+
+            };
+            
+            struct class_SetVar_6a19c6f350* ctor_SetVar_6a19c6f350(struct class_Location_500c4434c9* arg_location,struct class_Str arg_varname,struct class_Expression_35f2052bf4 arg_value);
+            void dtor_SetVar_6a19c6f350(void *ptr);
+            
+                struct class_Str meth_SetVar_6a19c6f350_to_string(struct class_SetVar_6a19c6f350* obj);
+                bool meth_SetVar_6a19c6f350_equals(struct class_SetVar_6a19c6f350* var1, struct class_SetVar_6a19c6f350* var2);
+
+                #endif
+                
@@ -0,0 +1,253 @@
+#include <lib/oomph.h>
+#include "Statement_1dc2e7090f.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Break_2f9897f5fd.h"
+#include "Call_d0fb9d6234.h"
+#include "Continue_b54f3b332e.h"
+#include "If_8811dba942.h"
+#include "Let_c9da3e3372.h"
+#include "Loop_80080d5f12.h"
+#include "Pass_e49950b77e.h"
+#include "Return_33802009cd.h"
+#include "SetAttribute_6bd58fd9d3.h"
+#include "SetVar_6a19c6f350.h"
+#include "Switch_9b8c881aeb.h"
+
+            static struct StringBuf string0_Statement_36907a3096_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x74', '\x61', '\x74', '\x65', '\x6d', '\x65', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Statement_36907a3096 = {
+                .buf = &string0_Statement_36907a3096_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_Statement_1dc2e7090f_to_string(struct class_Statement_1dc2e7090f obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_Break_2f9897f5fd_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Call_d0fb9d6234_to_string(obj.val.item1);
+                    break;
+                
+                case 2:
+                    valstr = meth_Continue_b54f3b332e_to_string(obj.val.item2);
+                    break;
+                
+                case 3:
+                    valstr = meth_If_8811dba942_to_string(obj.val.item3);
+                    break;
+                
+                case 4:
+                    valstr = meth_Let_c9da3e3372_to_string(obj.val.item4);
+                    break;
+                
+                case 5:
+                    valstr = meth_Loop_80080d5f12_to_string(obj.val.item5);
+                    break;
+                
+                case 6:
+                    valstr = meth_Pass_e49950b77e_to_string(obj.val.item6);
+                    break;
+                
+                case 7:
+                    valstr = meth_Return_33802009cd_to_string(obj.val.item7);
+                    break;
+                
+                case 8:
+                    valstr = meth_SetAttribute_6bd58fd9d3_to_string(obj.val.item8);
+                    break;
+                
+                case 9:
+                    valstr = meth_SetVar_6a19c6f350_to_string(obj.val.item9);
+                    break;
+                
+                case 10:
+                    valstr = meth_Switch_9b8c881aeb_to_string(obj.val.item10);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Statement_36907a3096), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_Statement_36907a3096;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_Statement_1dc2e7090f_equals(struct class_Statement_1dc2e7090f a, struct class_Statement_1dc2e7090f b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_Break_2f9897f5fd_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Call_d0fb9d6234_equals(
+                        a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_Continue_b54f3b332e_equals(
+                        a.val.item2, b.val.item2);
+                
+                case 3:
+                    return meth_If_8811dba942_equals(
+                        a.val.item3, b.val.item3);
+                
+                case 4:
+                    return meth_Let_c9da3e3372_equals(
+                        a.val.item4, b.val.item4);
+                
+                case 5:
+                    return meth_Loop_80080d5f12_equals(
+                        a.val.item5, b.val.item5);
+                
+                case 6:
+                    return meth_Pass_e49950b77e_equals(
+                        a.val.item6, b.val.item6);
+                
+                case 7:
+                    return meth_Return_33802009cd_equals(
+                        a.val.item7, b.val.item7);
+                
+                case 8:
+                    return meth_SetAttribute_6bd58fd9d3_equals(
+                        a.val.item8, b.val.item8);
+                
+                case 9:
+                    return meth_SetVar_6a19c6f350_equals(
+                        a.val.item9, b.val.item9);
+                
+                case 10:
+                    return meth_Switch_9b8c881aeb_equals(
+                        a.val.item10, b.val.item10);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Statement_36907a3096), (int)a.membernum);
+                }
+            }
+            
+            void incref_Statement_1dc2e7090f(struct class_Statement_1dc2e7090f obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                case 2:
+                    incref(obj.val.item2);
+                    break;
+                
+                case 3:
+                    incref(obj.val.item3);
+                    break;
+                
+                case 4:
+                    incref(obj.val.item4);
+                    break;
+                
+                case 5:
+                    incref(obj.val.item5);
+                    break;
+                
+                case 6:
+                    incref(obj.val.item6);
+                    break;
+                
+                case 7:
+                    incref(obj.val.item7);
+                    break;
+                
+                case 8:
+                    incref(obj.val.item8);
+                    break;
+                
+                case 9:
+                    incref(obj.val.item9);
+                    break;
+                
+                case 10:
+                    incref(obj.val.item10);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_Statement_1dc2e7090f(struct class_Statement_1dc2e7090f obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_Break_2f9897f5fd);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_Call_d0fb9d6234);
+                    break;
+                
+                case 2:
+                    decref((obj.val.item2), dtor_Continue_b54f3b332e);
+                    break;
+                
+                case 3:
+                    decref((obj.val.item3), dtor_If_8811dba942);
+                    break;
+                
+                case 4:
+                    decref((obj.val.item4), dtor_Let_c9da3e3372);
+                    break;
+                
+                case 5:
+                    decref((obj.val.item5), dtor_Loop_80080d5f12);
+                    break;
+                
+                case 6:
+                    decref((obj.val.item6), dtor_Pass_e49950b77e);
+                    break;
+                
+                case 7:
+                    decref((obj.val.item7), dtor_Return_33802009cd);
+                    break;
+                
+                case 8:
+                    decref((obj.val.item8), dtor_SetAttribute_6bd58fd9d3);
+                    break;
+                
+                case 9:
+                    decref((obj.val.item9), dtor_SetVar_6a19c6f350);
+                    break;
+                
+                case 10:
+                    decref((obj.val.item10), dtor_Switch_9b8c881aeb);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
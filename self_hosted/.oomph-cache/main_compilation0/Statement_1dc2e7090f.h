@@ -0,0 +1,43 @@
+
+                #ifndef HEADER_GUARD_Statement_1dc2e7090f
+                #define HEADER_GUARD_Statement_1dc2e7090f
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Break_2f9897f5fd;
+struct class_Call_d0fb9d6234;
+struct class_Continue_b54f3b332e;
+struct class_If_8811dba942;
+struct class_Let_c9da3e3372;
+struct class_Loop_80080d5f12;
+struct class_Pass_e49950b77e;
+struct class_Return_33802009cd;
+struct class_SetAttribute_6bd58fd9d3;
+struct class_SetVar_6a19c6f350;
+struct class_Switch_9b8c881aeb;
+
+            struct class_Statement_1dc2e7090f {
+                union {
+                    	struct class_Break_2f9897f5fd* item0;
+	struct class_Call_d0fb9d6234* item1;
+	struct class_Continue_b54f3b332e* item2;
+	struct class_If_8811dba942* item3;
+	struct class_Let_c9da3e3372* item4;
+	struct class_Loop_80080d5f12* item5;
+	struct class_Pass_e49950b77e* item6;
+	struct class_Return_33802009cd* item7;
+	struct class_SetAttribute_6bd58fd9d3* item8;
+	struct class_SetVar_6a19c6f350* item9;
+	struct class_Switch_9b8c881aeb* item10;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_Statement_1dc2e7090f_to_string(struct class_Statement_1dc2e7090f obj);
+            bool meth_Statement_1dc2e7090f_equals(struct class_Statement_1dc2e7090f a, struct class_Statement_1dc2e7090f b);
+            
+            void incref_Statement_1dc2e7090f(struct class_Statement_1dc2e7090f obj);
+            void decref_Statement_1dc2e7090f(struct class_Statement_1dc2e7090f obj);
+            
+                #endif
+                
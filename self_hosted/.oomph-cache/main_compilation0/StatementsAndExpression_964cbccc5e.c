@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "StatementsAndExpression_964cbccc5e.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "List_Statement__5d7503c104.h"
+
+            static struct StringBuf string0_StatementsAndExpression_4e23268293_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x74', '\x61', '\x74', '\x65', '\x6d', '\x65', '\x6e', '\x74', '\x73', '\x41', '\x6e', '\x64', '\x45', '\x78', '\x70', '\x72', '\x65', '\x73', '\x73', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string0_StatementsAndExpression_4e23268293 = {
+                .buf = &string0_StatementsAndExpression_4e23268293_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            
+            struct class_StatementsAndExpression_964cbccc5e* ctor_StatementsAndExpression_964cbccc5e(struct class_List_Statement__5d7503c104* arg_statements,struct class_Expression_35f2052bf4 arg_expression)
+            {
+                struct class_StatementsAndExpression_964cbccc5e* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_statements = arg_statements;
+obj->memb_expression = arg_expression;
+
+                incref(arg_statements);
+incref_Expression_35f2052bf4(arg_expression);
+
+                return obj;
+            }
+
+            void dtor_StatementsAndExpression_964cbccc5e(void *ptr)
+            {
+                struct class_StatementsAndExpression_964cbccc5e *obj = ptr;
+                decref((obj->memb_statements), dtor_List_Statement__5d7503c104);
+decref_Expression_35f2052bf4(obj->memb_expression);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_StatementsAndExpression_964cbccc5e_to_string(struct class_StatementsAndExpression_964cbccc5e* self)
+                {
+                    struct class_Str res = string0_StatementsAndExpression_4e23268293;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_List_Statement__5d7503c104_to_string(self->memb_statements);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_35f2052bf4_to_string(self->memb_expression);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_StatementsAndExpression_964cbccc5e_equals(struct class_StatementsAndExpression_964cbccc5e* var1, struct class_StatementsAndExpression_964cbccc5e* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,24 @@
+
+                #ifndef HEADER_GUARD_StatementsAndExpression_964cbccc5e
+                #define HEADER_GUARD_StatementsAndExpression_964cbccc5e
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+struct class_List_Statement__5d7503c104;
+struct class_List_Statement__5d7503c104;
+
+            struct class_StatementsAndExpression_964cbccc5e {
+                REFCOUNT_HEADER
+                struct class_List_Statement__5d7503c104* memb_statements;
+struct class_Expression_35f2052bf4 memb_expression;
+
+            };
+            
+            struct class_StatementsAndExpression_964cbccc5e* ctor_StatementsAndExpression_964cbccc5e(struct class_List_Statement__5d7503c104* arg_statements,struct class_Expression_35f2052bf4 arg_expression);
+            void dtor_StatementsAndExpression_964cbccc5e(void *ptr);
+            
+                struct class_Str meth_StatementsAndExpression_964cbccc5e_to_string(struct class_StatementsAndExpression_964cbccc5e* obj);
+                bool meth_StatementsAndExpression_964cbccc5e_equals(struct class_StatementsAndExpression_964cbccc5e* var1, struct class_StatementsAndExpression_964cbccc5e* var2);
+
+                #endif
+                
@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_StringConstant_c2b1c10b4f
+                #define HEADER_GUARD_StringConstant_c2b1c10b4f
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_StringConstant_c2b1c10b4f {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Str memb_value;
+
+            };
+            
+            struct class_StringConstant_c2b1c10b4f* ctor_StringConstant_c2b1c10b4f(struct class_Location_500c4434c9* arg_location,struct class_Str arg_value);
+            void dtor_StringConstant_c2b1c10b4f(void *ptr);
+            
+                struct class_Str meth_StringConstant_c2b1c10b4f_to_string(struct class_StringConstant_c2b1c10b4f* obj);
+                bool meth_StringConstant_c2b1c10b4f_equals(struct class_StringConstant_c2b1c10b4f* var1, struct class_StringConstant_c2b1c10b4f* var2);
+
+                #endif
+                
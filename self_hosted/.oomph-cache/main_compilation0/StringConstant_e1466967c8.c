@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "StringConstant_e1466967c8.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf string0_StringConstant_1e41701f17_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x61', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string0_StringConstant_1e41701f17 = {
+                .buf = &string0_StringConstant_1e41701f17_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            struct class_StringConstant_e1466967c8* ctor_StringConstant_e1466967c8(struct class_Str arg_value,struct class_LocalVariable_846080e5ae* arg_var)
+            {
+                struct class_StringConstant_e1466967c8* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_value = arg_value;
+obj->memb_var = arg_var;
+
+                string_incref(arg_value);
+incref(arg_var);
+
+                return obj;
+            }
+
+            void dtor_StringConstant_e1466967c8(void *ptr)
+            {
+                struct class_StringConstant_e1466967c8 *obj = ptr;
+                string_decref(obj->memb_value);
+decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_StringConstant_e1466967c8_to_string(struct class_StringConstant_e1466967c8* self)
+                {
+                    struct class_Str res = string0_StringConstant_1e41701f17;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_StringConstant_e1466967c8_equals(struct class_StringConstant_e1466967c8* var1, struct class_StringConstant_e1466967c8* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
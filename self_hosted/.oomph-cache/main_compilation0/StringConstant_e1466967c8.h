@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_StringConstant_e1466967c8
+                #define HEADER_GUARD_StringConstant_e1466967c8
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+
+            struct class_StringConstant_e1466967c8 {
+                REFCOUNT_HEADER
+                struct class_Str memb_value;
+struct class_LocalVariable_846080e5ae* memb_var;
+
+            };
+            
+            struct class_StringConstant_e1466967c8* ctor_StringConstant_e1466967c8(struct class_Str arg_value,struct class_LocalVariable_846080e5ae* arg_var);
+            void dtor_StringConstant_e1466967c8(void *ptr);
+            
+                struct class_Str meth_StringConstant_e1466967c8_to_string(struct class_StringConstant_e1466967c8* obj);
+                bool meth_StringConstant_e1466967c8_equals(struct class_StringConstant_e1466967c8* var1, struct class_StringConstant_e1466967c8* var2);
+
+                #endif
+                
@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "StringFormatJoin_bc28806767.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Expression__d162784c9e.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_StringFormatJoin_f517c183d7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x46', '\x6f', '\x72', '\x6d', '\x61', '\x74', '\x4a', '\x6f', '\x69', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string0_StringFormatJoin_f517c183d7 = {
+                .buf = &string0_StringFormatJoin_f517c183d7_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            struct class_StringFormatJoin_bc28806767* ctor_StringFormatJoin_bc28806767(struct class_Location_500c4434c9* arg_location,struct class_List_Expression__d162784c9e* arg_parts)
+            {
+                struct class_StringFormatJoin_bc28806767* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_parts = arg_parts;
+
+                incref(arg_location);
+incref(arg_parts);
+
+                return obj;
+            }
+
+            void dtor_StringFormatJoin_bc28806767(void *ptr)
+            {
+                struct class_StringFormatJoin_bc28806767 *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+decref((obj->memb_parts), dtor_List_Expression__d162784c9e);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_StringFormatJoin_bc28806767_to_string(struct class_StringFormatJoin_bc28806767* self)
+                {
+                    struct class_Str res = string0_StringFormatJoin_f517c183d7;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Expression__d162784c9e_to_string(self->memb_parts);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_StringFormatJoin_bc28806767_equals(struct class_StringFormatJoin_bc28806767* var1, struct class_StringFormatJoin_bc28806767* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
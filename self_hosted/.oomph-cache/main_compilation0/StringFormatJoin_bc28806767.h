@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_StringFormatJoin_bc28806767
+                #define HEADER_GUARD_StringFormatJoin_bc28806767
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_500c4434c9;
+struct class_List_Expression__d162784c9e;
+struct class_Location_500c4434c9;
+struct class_List_Expression__d162784c9e;
+
+            struct class_StringFormatJoin_bc28806767 {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_List_Expression__d162784c9e* memb_parts;
+
+            };
+            
+            struct class_StringFormatJoin_bc28806767* ctor_StringFormatJoin_bc28806767(struct class_Location_500c4434c9* arg_location,struct class_List_Expression__d162784c9e* arg_parts);
+            void dtor_StringFormatJoin_bc28806767(void *ptr);
+            
+                struct class_Str meth_StringFormatJoin_bc28806767_to_string(struct class_StringFormatJoin_bc28806767* obj);
+                bool meth_StringFormatJoin_bc28806767_equals(struct class_StringFormatJoin_bc28806767* var1, struct class_StringFormatJoin_bc28806767* var2);
+
+                #endif
+                
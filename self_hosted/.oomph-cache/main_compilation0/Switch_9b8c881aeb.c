@@ -0,0 +1,73 @@
+#include <lib/oomph.h>
+#include "Switch_9b8c881aeb.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "List_Case__f5a6b4b2ec.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_Switch_ea2253f367_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x77', '\x69', '\x74', '\x63', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Switch_ea2253f367 = {
+                .buf = &string0_Switch_ea2253f367_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_Switch_9b8c881aeb* ctor_Switch_9b8c881aeb(struct class_Location_500c4434c9* arg_location,struct class_Expression_35f2052bf4 arg_union_obj,struct class_List_Case__f5a6b4b2ec* arg_cases)
+            {
+                struct class_Switch_9b8c881aeb* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_union_obj = arg_union_obj;
+obj->memb_cases = arg_cases;
+
+                incref(arg_location);
+incref_Expression_35f2052bf4(arg_union_obj);
+incref(arg_cases);
+
+                return obj;
+            }
+
+            void dtor_Switch_9b8c881aeb(void *ptr)
+            {
+                struct class_Switch_9b8c881aeb *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+decref_Expression_35f2052bf4(obj->memb_union_obj);
+decref((obj->memb_cases), dtor_List_Case__f5a6b4b2ec);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Switch_9b8c881aeb_to_string(struct class_Switch_9b8c881aeb* self)
+                {
+                    struct class_Str res = string0_Switch_ea2253f367;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_35f2052bf4_to_string(self->memb_union_obj);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Case__f5a6b4b2ec_to_string(self->memb_cases);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Switch_9b8c881aeb_equals(struct class_Switch_9b8c881aeb* var1, struct class_Switch_9b8c881aeb* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,27 @@
+
+                #ifndef HEADER_GUARD_Switch_9b8c881aeb
+                #define HEADER_GUARD_Switch_9b8c881aeb
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+struct class_Location_500c4434c9;
+struct class_List_Case__f5a6b4b2ec;
+struct class_Location_500c4434c9;
+struct class_List_Case__f5a6b4b2ec;
+
+            struct class_Switch_9b8c881aeb {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Expression_35f2052bf4 memb_union_obj;
+struct class_List_Case__f5a6b4b2ec* memb_cases;
+
+            };
+            
+            struct class_Switch_9b8c881aeb* ctor_Switch_9b8c881aeb(struct class_Location_500c4434c9* arg_location,struct class_Expression_35f2052bf4 arg_union_obj,struct class_List_Case__f5a6b4b2ec* arg_cases);
+            void dtor_Switch_9b8c881aeb(void *ptr);
+            
+                struct class_Str meth_Switch_9b8c881aeb_to_string(struct class_Switch_9b8c881aeb* obj);
+                bool meth_Switch_9b8c881aeb_equals(struct class_Switch_9b8c881aeb* var1, struct class_Switch_9b8c881aeb* var2);
+
+                #endif
+                
@@ -0,0 +1,100 @@
+#include <lib/oomph.h>
+#include "SymbolValue_b2eed984e4.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "FileVariable_a7b8ca651f.h"
+#include "Type_87e1ce5c5e.h"
+
+            static struct StringBuf string0_SymbolValue_9013c38153_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x79', '\x6d', '\x62', '\x6f', '\x6c', '\x56', '\x61', '\x6c', '\x75', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_SymbolValue_9013c38153 = {
+                .buf = &string0_SymbolValue_9013c38153_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_SymbolValue_b2eed984e4_to_string(struct class_SymbolValue_b2eed984e4 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_Type_87e1ce5c5e_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_FileVariable_a7b8ca651f_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_SymbolValue_9013c38153), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_SymbolValue_9013c38153;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_SymbolValue_b2eed984e4_equals(struct class_SymbolValue_b2eed984e4 a, struct class_SymbolValue_b2eed984e4 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_Type_87e1ce5c5e_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_FileVariable_a7b8ca651f_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_SymbolValue_9013c38153), (int)a.membernum);
+                }
+            }
+            
+            void incref_SymbolValue_b2eed984e4(struct class_SymbolValue_b2eed984e4 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref_Type_87e1ce5c5e(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_SymbolValue_b2eed984e4(struct class_SymbolValue_b2eed984e4 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref_Type_87e1ce5c5e(obj.val.item0);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_FileVariable_a7b8ca651f);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_SymbolValue_b2eed984e4
+                #define HEADER_GUARD_SymbolValue_b2eed984e4
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+struct class_FileVariable_a7b8ca651f;
+
+            struct class_SymbolValue_b2eed984e4 {
+                union {
+                    	struct class_Type_87e1ce5c5e item0;
+	struct class_FileVariable_a7b8ca651f* item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_SymbolValue_b2eed984e4_to_string(struct class_SymbolValue_b2eed984e4 obj);
+            bool meth_SymbolValue_b2eed984e4_equals(struct class_SymbolValue_b2eed984e4 a, struct class_SymbolValue_b2eed984e4 b);
+            
+            void incref_SymbolValue_b2eed984e4(struct class_SymbolValue_b2eed984e4 obj);
+            void decref_SymbolValue_b2eed984e4(struct class_SymbolValue_b2eed984e4 obj);
+            
+                #endif
+                
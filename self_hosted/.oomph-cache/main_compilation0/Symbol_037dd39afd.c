@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "Symbol_037dd39afd.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "SymbolValue_b2eed984e4.h"
+
+            static struct StringBuf string0_Symbol_bbe5d8230a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x79', '\x6d', '\x62', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Symbol_bbe5d8230a = {
+                .buf = &string0_Symbol_bbe5d8230a_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_Symbol_037dd39afd* ctor_Symbol_037dd39afd(struct class_Str arg_path,struct class_Str arg_name,struct class_SymbolValue_b2eed984e4 arg_value)
+            {
+                struct class_Symbol_037dd39afd* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_path = arg_path;
+obj->memb_name = arg_name;
+obj->memb_value = arg_value;
+
+                string_incref(arg_path);
+string_incref(arg_name);
+incref_SymbolValue_b2eed984e4(arg_value);
+
+                return obj;
+            }
+
+            void dtor_Symbol_037dd39afd(void *ptr)
+            {
+                struct class_Symbol_037dd39afd *obj = ptr;
+                string_decref(obj->memb_path);
+string_decref(obj->memb_name);
+decref_SymbolValue_b2eed984e4(obj->memb_value);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Symbol_037dd39afd_to_string(struct class_Symbol_037dd39afd* self)
+                {
+                    struct class_Str res = string0_Symbol_bbe5d8230a;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_path);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_SymbolValue_b2eed984e4_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Symbol_037dd39afd_equals(struct class_Symbol_037dd39afd* var1, struct class_Symbol_037dd39afd* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_Symbol_037dd39afd
+                #define HEADER_GUARD_Symbol_037dd39afd
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "SymbolValue_b2eed984e4.h"
+
+            struct class_Symbol_037dd39afd {
+                REFCOUNT_HEADER
+                struct class_Str memb_path;
+struct class_Str memb_name;
+struct class_SymbolValue_b2eed984e4 memb_value;
+
+            };
+            
+            struct class_Symbol_037dd39afd* ctor_Symbol_037dd39afd(struct class_Str arg_path,struct class_Str arg_name,struct class_SymbolValue_b2eed984e4 arg_value);
+            void dtor_Symbol_037dd39afd(void *ptr);
+            
+                struct class_Str meth_Symbol_037dd39afd_to_string(struct class_Symbol_037dd39afd* obj);
+                bool meth_Symbol_037dd39afd_equals(struct class_Symbol_037dd39afd* var1, struct class_Symbol_037dd39afd* var2);
+
+                #endif
+                
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_Token_35f69eeb49
+                #define HEADER_GUARD_Token_35f69eeb49
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_Token_35f69eeb49 {
+                REFCOUNT_HEADER
+                struct class_Str memb_type;
+struct class_Str memb_value;
+struct class_Location_500c4434c9* memb_location;
+
+            };
+            
+            struct class_Token_35f69eeb49* ctor_Token_35f69eeb49(struct class_Str arg_type,struct class_Str arg_value,struct class_Location_500c4434c9* arg_location);
+            void dtor_Token_35f69eeb49(void *ptr);
+            
+                struct class_Str meth_Token_35f69eeb49_to_string(struct class_Token_35f69eeb49* obj);
+                bool meth_Token_35f69eeb49_equals(struct class_Token_35f69eeb49* var1, struct class_Token_35f69eeb49* var2);
+bool meth_Token_35f69eeb49_matches(struct class_Token_35f69eeb49* var1, struct class_Str var2, struct class_Str var3);
+
+                #endif
+                
@@ -0,0 +1,134 @@
+#include <lib/oomph.h>
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "ClassDef_ac59c4b64c.h"
+#include "FuncOrMethodDef_533c7b75ab.h"
+#include "Import_6056d7e9c9.h"
+#include "TypeDef_44471836ba.h"
+
+            static struct StringBuf string0_ToplevelDeclaration_75a430a41f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x6f', '\x70', '\x6c', '\x65', '\x76', '\x65', '\x6c', '\x44', '\x65', '\x63', '\x6c', '\x61', '\x72', '\x61', '\x74', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string0_ToplevelDeclaration_75a430a41f = {
+                .buf = &string0_ToplevelDeclaration_75a430a41f_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_ToplevelDeclaration_054352d1cf_to_string(struct class_ToplevelDeclaration_054352d1cf obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_ClassDef_ac59c4b64c_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_FuncOrMethodDef_533c7b75ab_to_string(obj.val.item1);
+                    break;
+                
+                case 2:
+                    valstr = meth_Import_6056d7e9c9_to_string(obj.val.item2);
+                    break;
+                
+                case 3:
+                    valstr = meth_TypeDef_44471836ba_to_string(obj.val.item3);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_ToplevelDeclaration_75a430a41f), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_ToplevelDeclaration_75a430a41f;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_ToplevelDeclaration_054352d1cf_equals(struct class_ToplevelDeclaration_054352d1cf a, struct class_ToplevelDeclaration_054352d1cf b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_ClassDef_ac59c4b64c_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_FuncOrMethodDef_533c7b75ab_equals(
+                        a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_Import_6056d7e9c9_equals(
+                        a.val.item2, b.val.item2);
+                
+                case 3:
+                    return meth_TypeDef_44471836ba_equals(
+                        a.val.item3, b.val.item3);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_ToplevelDeclaration_75a430a41f), (int)a.membernum);
+                }
+            }
+            
+            void incref_ToplevelDeclaration_054352d1cf(struct class_ToplevelDeclaration_054352d1cf obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                case 2:
+                    incref(obj.val.item2);
+                    break;
+                
+                case 3:
+                    incref(obj.val.item3);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_ToplevelDeclaration_054352d1cf(struct class_ToplevelDeclaration_054352d1cf obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_ClassDef_ac59c4b64c);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_FuncOrMethodDef_533c7b75ab);
+                    break;
+                
+                case 2:
+                    decref((obj.val.item2), dtor_Import_6056d7e9c9);
+                    break;
+                
+                case 3:
+                    decref((obj.val.item3), dtor_TypeDef_44471836ba);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
@@ -0,0 +1,29 @@
+
+                #ifndef HEADER_GUARD_ToplevelDeclaration_054352d1cf
+                #define HEADER_GUARD_ToplevelDeclaration_054352d1cf
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_ClassDef_ac59c4b64c;
+struct class_FuncOrMethodDef_533c7b75ab;
+struct class_Import_6056d7e9c9;
+struct class_TypeDef_44471836ba;
+
+            struct class_ToplevelDeclaration_054352d1cf {
+                union {
+                    	struct class_ClassDef_ac59c4b64c* item0;
+	struct class_FuncOrMethodDef_533c7b75ab* item1;
+	struct class_Import_6056d7e9c9* item2;
+	struct class_TypeDef_44471836ba* item3;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_ToplevelDeclaration_054352d1cf_to_string(struct class_ToplevelDeclaration_054352d1cf obj);
+            bool meth_ToplevelDeclaration_054352d1cf_equals(struct class_ToplevelDeclaration_054352d1cf a, struct class_ToplevelDeclaration_054352d1cf b);
+            
+            void incref_ToplevelDeclaration_054352d1cf(struct class_ToplevelDeclaration_054352d1cf obj);
+            void decref_ToplevelDeclaration_054352d1cf(struct class_ToplevelDeclaration_054352d1cf obj);
+            
+                #endif
+                
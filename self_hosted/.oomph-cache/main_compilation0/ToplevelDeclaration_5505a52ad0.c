@@ -0,0 +1,100 @@
+#include <lib/oomph.h>
+#include "ToplevelDeclaration_5505a52ad0.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "FuncDef_2bd6886a53.h"
+#include "MethodDef_28b65923b5.h"
+
+            static struct StringBuf string0_ToplevelDeclaration_7fd7d73db7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x6f', '\x70', '\x6c', '\x65', '\x76', '\x65', '\x6c', '\x44', '\x65', '\x63', '\x6c', '\x61', '\x72', '\x61', '\x74', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string0_ToplevelDeclaration_7fd7d73db7 = {
+                .buf = &string0_ToplevelDeclaration_7fd7d73db7_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_ToplevelDeclaration_5505a52ad0_to_string(struct class_ToplevelDeclaration_5505a52ad0 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_FuncDef_2bd6886a53_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_MethodDef_28b65923b5_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_ToplevelDeclaration_7fd7d73db7), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_ToplevelDeclaration_7fd7d73db7;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_ToplevelDeclaration_5505a52ad0_equals(struct class_ToplevelDeclaration_5505a52ad0 a, struct class_ToplevelDeclaration_5505a52ad0 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_FuncDef_2bd6886a53_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_MethodDef_28b65923b5_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_ToplevelDeclaration_7fd7d73db7), (int)a.membernum);
+                }
+            }
+            
+            void incref_ToplevelDeclaration_5505a52ad0(struct class_ToplevelDeclaration_5505a52ad0 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_ToplevelDeclaration_5505a52ad0(struct class_ToplevelDeclaration_5505a52ad0 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_FuncDef_2bd6886a53);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_MethodDef_28b65923b5);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_ToplevelDeclaration_5505a52ad0
+                #define HEADER_GUARD_ToplevelDeclaration_5505a52ad0
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_FuncDef_2bd6886a53;
+struct class_MethodDef_28b65923b5;
+
+            struct class_ToplevelDeclaration_5505a52ad0 {
+                union {
+                    	struct class_FuncDef_2bd6886a53* item0;
+	struct class_MethodDef_28b65923b5* item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_ToplevelDeclaration_5505a52ad0_to_string(struct class_ToplevelDeclaration_5505a52ad0 obj);
+            bool meth_ToplevelDeclaration_5505a52ad0_equals(struct class_ToplevelDeclaration_5505a52ad0 a, struct class_ToplevelDeclaration_5505a52ad0 b);
+            
+            void incref_ToplevelDeclaration_5505a52ad0(struct class_ToplevelDeclaration_5505a52ad0 obj);
+            void decref_ToplevelDeclaration_5505a52ad0(struct class_ToplevelDeclaration_5505a52ad0 obj);
+            
+                #endif
+                
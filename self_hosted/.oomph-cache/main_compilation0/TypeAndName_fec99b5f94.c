@@ -0,0 +1,72 @@
+#include <lib/oomph.h>
+#include "TypeAndName_fec99b5f94.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_500c4434c9.h"
+#include "Type_e6cf7dd4e5.h"
+
+            static struct StringBuf string0_TypeAndName_0c60f33e87_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65', '\x41', '\x6e', '\x64', '\x4e', '\x61', '\x6d', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_TypeAndName_0c60f33e87 = {
+                .buf = &string0_TypeAndName_0c60f33e87_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            struct class_TypeAndName_fec99b5f94* ctor_TypeAndName_fec99b5f94(struct class_Type_e6cf7dd4e5 arg_type,struct class_Str arg_name,struct class_Location_500c4434c9* arg_name_location)
+            {
+                struct class_TypeAndName_fec99b5f94* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_type = arg_type;
+obj->memb_name = arg_name;
+obj->memb_name_location = arg_name_location;
+
+                incref_Type_e6cf7dd4e5(arg_type);
+string_incref(arg_name);
+incref(arg_name_location);
+
+                return obj;
+            }
+
+            void dtor_TypeAndName_fec99b5f94(void *ptr)
+            {
+                struct class_TypeAndName_fec99b5f94 *obj = ptr;
+                decref_Type_e6cf7dd4e5(obj->memb_type);
+string_decref(obj->memb_name);
+decref((obj->memb_name_location), dtor_Location_500c4434c9);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_TypeAndName_fec99b5f94_to_string(struct class_TypeAndName_fec99b5f94* self)
+                {
+                    struct class_Str res = string0_TypeAndName_0c60f33e87;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Type_e6cf7dd4e5_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_name_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_TypeAndName_fec99b5f94_equals(struct class_TypeAndName_fec99b5f94* var1, struct class_TypeAndName_fec99b5f94* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
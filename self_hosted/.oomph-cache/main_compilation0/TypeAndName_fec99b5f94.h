@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_TypeAndName_fec99b5f94
+                #define HEADER_GUARD_TypeAndName_fec99b5f94
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_e6cf7dd4e5.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_TypeAndName_fec99b5f94 {
+                REFCOUNT_HEADER
+                struct class_Type_e6cf7dd4e5 memb_type;
+struct class_Str memb_name;
+struct class_Location_500c4434c9* memb_name_location;
+
+            };
+            
+            struct class_TypeAndName_fec99b5f94* ctor_TypeAndName_fec99b5f94(struct class_Type_e6cf7dd4e5 arg_type,struct class_Str arg_name,struct class_Location_500c4434c9* arg_name_location);
+            void dtor_TypeAndName_fec99b5f94(void *ptr);
+            
+                struct class_Str meth_TypeAndName_fec99b5f94_to_string(struct class_TypeAndName_fec99b5f94* obj);
+                bool meth_TypeAndName_fec99b5f94_equals(struct class_TypeAndName_fec99b5f94* var1, struct class_TypeAndName_fec99b5f94* var2);
+
+                #endif
+                
@@ -0,0 +1,72 @@
+#include <lib/oomph.h>
+#include "TypeDef_44471836ba.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_500c4434c9.h"
+#include "Type_e6cf7dd4e5.h"
+
+            static struct StringBuf string0_TypeDef_f4d43bd93f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65', '\x44', '\x65', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string0_TypeDef_f4d43bd93f = {
+                .buf = &string0_TypeDef_f4d43bd93f_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            struct class_TypeDef_44471836ba* ctor_TypeDef_44471836ba(struct class_Location_500c4434c9* arg_location,struct class_Str arg_name,struct class_Type_e6cf7dd4e5 arg_type)
+            {
+                struct class_TypeDef_44471836ba* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+
+                incref(arg_location);
+string_incref(arg_name);
+incref_Type_e6cf7dd4e5(arg_type);
+
+                return obj;
+            }
+
+            void dtor_TypeDef_44471836ba(void *ptr)
+            {
+                struct class_TypeDef_44471836ba *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+string_decref(obj->memb_name);
+decref_Type_e6cf7dd4e5(obj->memb_type);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_TypeDef_44471836ba_to_string(struct class_TypeDef_44471836ba* self)
+                {
+                    struct class_Str res = string0_TypeDef_f4d43bd93f;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_e6cf7dd4e5_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_TypeDef_44471836ba_equals(struct class_TypeDef_44471836ba* var1, struct class_TypeDef_44471836ba* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
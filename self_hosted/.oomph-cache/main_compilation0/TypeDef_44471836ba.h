@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_TypeDef_44471836ba
+                #define HEADER_GUARD_TypeDef_44471836ba
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_e6cf7dd4e5.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_TypeDef_44471836ba {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Str memb_name;
+struct class_Type_e6cf7dd4e5 memb_type;
+
+            };
+            
+            struct class_TypeDef_44471836ba* ctor_TypeDef_44471836ba(struct class_Location_500c4434c9* arg_location,struct class_Str arg_name,struct class_Type_e6cf7dd4e5 arg_type);
+            void dtor_TypeDef_44471836ba(void *ptr);
+            
+                struct class_Str meth_TypeDef_44471836ba_to_string(struct class_TypeDef_44471836ba* obj);
+                bool meth_TypeDef_44471836ba_equals(struct class_TypeDef_44471836ba* var1, struct class_TypeDef_44471836ba* var2);
+
+                #endif
+                
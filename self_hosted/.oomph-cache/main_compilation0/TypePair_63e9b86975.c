@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "TypePair_63e9b86975.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+
+            static struct StringBuf string0_TypePair_8f30f3fca4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65', '\x50', '\x61', '\x69', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_TypePair_8f30f3fca4 = {
+                .buf = &string0_TypePair_8f30f3fca4_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            struct class_TypePair_63e9b86975* ctor_TypePair_63e9b86975(struct class_Type_87e1ce5c5e arg_first,struct class_Type_87e1ce5c5e arg_second)
+            {
+                struct class_TypePair_63e9b86975* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_first = arg_first;
+obj->memb_second = arg_second;
+
+                incref_Type_87e1ce5c5e(arg_first);
+incref_Type_87e1ce5c5e(arg_second);
+
+                return obj;
+            }
+
+            void dtor_TypePair_63e9b86975(void *ptr)
+            {
+                struct class_TypePair_63e9b86975 *obj = ptr;
+                decref_Type_87e1ce5c5e(obj->memb_first);
+decref_Type_87e1ce5c5e(obj->memb_second);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_TypePair_63e9b86975_to_string(struct class_TypePair_63e9b86975* self)
+                {
+                    struct class_Str res = string0_TypePair_8f30f3fca4;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_first);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_second);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_TypePair_63e9b86975_equals(struct class_TypePair_63e9b86975* var1, struct class_TypePair_63e9b86975* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_TypePair_63e9b86975
+                #define HEADER_GUARD_TypePair_63e9b86975
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+
+            struct class_TypePair_63e9b86975 {
+                REFCOUNT_HEADER
+                struct class_Type_87e1ce5c5e memb_first;
+struct class_Type_87e1ce5c5e memb_second;
+
+            };
+            
+            struct class_TypePair_63e9b86975* ctor_TypePair_63e9b86975(struct class_Type_87e1ce5c5e arg_first,struct class_Type_87e1ce5c5e arg_second);
+            void dtor_TypePair_63e9b86975(void *ptr);
+            
+                struct class_Str meth_TypePair_63e9b86975_to_string(struct class_TypePair_63e9b86975* obj);
+                bool meth_TypePair_63e9b86975_equals(struct class_TypePair_63e9b86975* var1, struct class_TypePair_63e9b86975* var2);
+
+                #endif
+                
@@ -0,0 +1,134 @@
+#include <lib/oomph.h>
+#include "Type_87e1ce5c5e.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "AutoType_33a5d572cb.h"
+#include "BasicType_899b9c9f8e.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "UnionType_7f899bced1.h"
+
+            static struct StringBuf string0_Type_ed0265c5e7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Type_ed0265c5e7 = {
+                .buf = &string0_Type_ed0265c5e7_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_Type_87e1ce5c5e_to_string(struct class_Type_87e1ce5c5e obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_AutoType_33a5d572cb_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_BasicType_899b9c9f8e_to_string(obj.val.item1);
+                    break;
+                
+                case 2:
+                    valstr = meth_FunctionType_4e16d0ea53_to_string(obj.val.item2);
+                    break;
+                
+                case 3:
+                    valstr = meth_UnionType_7f899bced1_to_string(obj.val.item3);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Type_ed0265c5e7), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_Type_ed0265c5e7;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_Type_87e1ce5c5e_equals(struct class_Type_87e1ce5c5e a, struct class_Type_87e1ce5c5e b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_AutoType_33a5d572cb_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_BasicType_899b9c9f8e_equals(
+                        a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_FunctionType_4e16d0ea53_equals(
+                        a.val.item2, b.val.item2);
+                
+                case 3:
+                    return meth_UnionType_7f899bced1_equals(
+                        a.val.item3, b.val.item3);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Type_ed0265c5e7), (int)a.membernum);
+                }
+            }
+            
+            void incref_Type_87e1ce5c5e(struct class_Type_87e1ce5c5e obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                case 2:
+                    incref(obj.val.item2);
+                    break;
+                
+                case 3:
+                    incref(obj.val.item3);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_Type_87e1ce5c5e(struct class_Type_87e1ce5c5e obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_AutoType_33a5d572cb);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_BasicType_899b9c9f8e);
+                    break;
+                
+                case 2:
+                    decref((obj.val.item2), dtor_FunctionType_4e16d0ea53);
+                    break;
+                
+                case 3:
+                    decref((obj.val.item3), dtor_UnionType_7f899bced1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
@@ -0,0 +1,29 @@
+
+                #ifndef HEADER_GUARD_Type_87e1ce5c5e
+                #define HEADER_GUARD_Type_87e1ce5c5e
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_AutoType_33a5d572cb;
+struct class_BasicType_899b9c9f8e;
+struct class_FunctionType_4e16d0ea53;
+struct class_UnionType_7f899bced1;
+
+            struct class_Type_87e1ce5c5e {
+                union {
+                    	struct class_AutoType_33a5d572cb* item0;
+	struct class_BasicType_899b9c9f8e* item1;
+	struct class_FunctionType_4e16d0ea53* item2;
+	struct class_UnionType_7f899bced1* item3;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_Type_87e1ce5c5e_to_string(struct class_Type_87e1ce5c5e obj);
+            bool meth_Type_87e1ce5c5e_equals(struct class_Type_87e1ce5c5e a, struct class_Type_87e1ce5c5e b);
+            
+            void incref_Type_87e1ce5c5e(struct class_Type_87e1ce5c5e obj);
+            void decref_Type_87e1ce5c5e(struct class_Type_87e1ce5c5e obj);
+            
+                #endif
+                
@@ -0,0 +1,134 @@
+#include <lib/oomph.h>
+#include "Type_e6cf7dd4e5.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "AutoType_39f5d793d6.h"
+#include "GenericType_f44d8197cb.h"
+#include "NamedType_0d620e38a7.h"
+#include "UnionType_0c977b4168.h"
+
+            static struct StringBuf string0_Type_b418f6399b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Type_b418f6399b = {
+                .buf = &string0_Type_b418f6399b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_Type_e6cf7dd4e5_to_string(struct class_Type_e6cf7dd4e5 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_AutoType_39f5d793d6_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_GenericType_f44d8197cb_to_string(obj.val.item1);
+                    break;
+                
+                case 2:
+                    valstr = meth_NamedType_0d620e38a7_to_string(obj.val.item2);
+                    break;
+                
+                case 3:
+                    valstr = meth_UnionType_0c977b4168_to_string(obj.val.item3);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Type_b418f6399b), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_Type_b418f6399b;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_Type_e6cf7dd4e5_equals(struct class_Type_e6cf7dd4e5 a, struct class_Type_e6cf7dd4e5 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_AutoType_39f5d793d6_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_GenericType_f44d8197cb_equals(
+                        a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_NamedType_0d620e38a7_equals(
+                        a.val.item2, b.val.item2);
+                
+                case 3:
+                    return meth_UnionType_0c977b4168_equals(
+                        a.val.item3, b.val.item3);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Type_b418f6399b), (int)a.membernum);
+                }
+            }
+            
+            void incref_Type_e6cf7dd4e5(struct class_Type_e6cf7dd4e5 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                case 2:
+                    incref(obj.val.item2);
+                    break;
+                
+                case 3:
+                    incref(obj.val.item3);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_Type_e6cf7dd4e5(struct class_Type_e6cf7dd4e5 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_AutoType_39f5d793d6);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_GenericType_f44d8197cb);
+                    break;
+                
+                case 2:
+                    decref((obj.val.item2), dtor_NamedType_0d620e38a7);
+                    break;
+                
+                case 3:
+                    decref((obj.val.item3), dtor_UnionType_0c977b4168);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
@@ -0,0 +1,29 @@
+
+                #ifndef HEADER_GUARD_Type_e6cf7dd4e5
+                #define HEADER_GUARD_Type_e6cf7dd4e5
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_AutoType_39f5d793d6;
+struct class_GenericType_f44d8197cb;
+struct class_NamedType_0d620e38a7;
+struct class_UnionType_0c977b4168;
+
+            struct class_Type_e6cf7dd4e5 {
+                union {
+                    	struct class_AutoType_39f5d793d6* item0;
+	struct class_GenericType_f44d8197cb* item1;
+	struct class_NamedType_0d620e38a7* item2;
+	struct class_UnionType_0c977b4168* item3;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_Type_e6cf7dd4e5_to_string(struct class_Type_e6cf7dd4e5 obj);
+            bool meth_Type_e6cf7dd4e5_equals(struct class_Type_e6cf7dd4e5 a, struct class_Type_e6cf7dd4e5 b);
+            
+            void incref_Type_e6cf7dd4e5(struct class_Type_e6cf7dd4e5 obj);
+            void decref_Type_e6cf7dd4e5(struct class_Type_e6cf7dd4e5 obj);
+            
+                #endif
+                
@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "UnSet_a1ce71f609.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf string0_UnSet_95f774dbe5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x55', '\x6e', '\x53', '\x65', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string0_UnSet_95f774dbe5 = {
+                .buf = &string0_UnSet_95f774dbe5_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            struct class_UnSet_a1ce71f609* ctor_UnSet_a1ce71f609(struct class_LocalVariable_846080e5ae* arg_var)
+            {
+                struct class_UnSet_a1ce71f609* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_var = arg_var;
+
+                incref(arg_var);
+
+                return obj;
+            }
+
+            void dtor_UnSet_a1ce71f609(void *ptr)
+            {
+                struct class_UnSet_a1ce71f609 *obj = ptr;
+                decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_UnSet_a1ce71f609_to_string(struct class_UnSet_a1ce71f609* self)
+                {
+                    struct class_Str res = string0_UnSet_95f774dbe5;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_UnSet_a1ce71f609_equals(struct class_UnSet_a1ce71f609* var1, struct class_UnSet_a1ce71f609* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_UnSet_a1ce71f609
+                #define HEADER_GUARD_UnSet_a1ce71f609
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+
+            struct class_UnSet_a1ce71f609 {
+                REFCOUNT_HEADER
+                struct class_LocalVariable_846080e5ae* memb_var;
+
+            };
+            
+            struct class_UnSet_a1ce71f609* ctor_UnSet_a1ce71f609(struct class_LocalVariable_846080e5ae* arg_var);
+            void dtor_UnSet_a1ce71f609(void *ptr);
+            
+                struct class_Str meth_UnSet_a1ce71f609_to_string(struct class_UnSet_a1ce71f609* obj);
+                bool meth_UnSet_a1ce71f609_equals(struct class_UnSet_a1ce71f609* var1, struct class_UnSet_a1ce71f609* var2);
+
+                #endif
+                
@@ -0,0 +1,72 @@
+#include <lib/oomph.h>
+#include "UnaryOperator_348525ebbe.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "Location_500c4434c9.h"
+
+            static struct StringBuf string0_UnaryOperator_426986d8d9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x55', '\x6e', '\x61', '\x72', '\x79', '\x4f', '\x70', '\x65', '\x72', '\x61', '\x74', '\x6f', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_UnaryOperator_426986d8d9 = {
+                .buf = &string0_UnaryOperator_426986d8d9_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            struct class_UnaryOperator_348525ebbe* ctor_UnaryOperator_348525ebbe(struct class_Location_500c4434c9* arg_location,struct class_Str arg_op,struct class_Expression_35f2052bf4 arg_obj)
+            {
+                struct class_UnaryOperator_348525ebbe* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_location = arg_location;
+obj->memb_op = arg_op;
+obj->memb_obj = arg_obj;
+
+                incref(arg_location);
+string_incref(arg_op);
+incref_Expression_35f2052bf4(arg_obj);
+
+                return obj;
+            }
+
+            void dtor_UnaryOperator_348525ebbe(void *ptr)
+            {
+                struct class_UnaryOperator_348525ebbe *obj = ptr;
+                decref((obj->memb_location), dtor_Location_500c4434c9);
+string_decref(obj->memb_op);
+decref_Expression_35f2052bf4(obj->memb_obj);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_UnaryOperator_348525ebbe_to_string(struct class_UnaryOperator_348525ebbe* self)
+                {
+                    struct class_Str res = string0_UnaryOperator_426986d8d9;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_500c4434c9_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_op);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_35f2052bf4_to_string(self->memb_obj);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_UnaryOperator_348525ebbe_equals(struct class_UnaryOperator_348525ebbe* var1, struct class_UnaryOperator_348525ebbe* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_UnaryOperator_348525ebbe
+                #define HEADER_GUARD_UnaryOperator_348525ebbe
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class_UnaryOperator_348525ebbe {
+                REFCOUNT_HEADER
+                struct class_Location_500c4434c9* memb_location;
+struct class_Str memb_op;
+struct class_Expression_35f2052bf4 memb_obj;
+
+            };
+            
+            struct class_UnaryOperator_348525ebbe* ctor_UnaryOperator_348525ebbe(struct class_Location_500c4434c9* arg_location,struct class_Str arg_op,struct class_Expression_35f2052bf4 arg_obj);
+            void dtor_UnaryOperator_348525ebbe(void *ptr);
+            
+                struct class_Str meth_UnaryOperator_348525ebbe_to_string(struct class_UnaryOperator_348525ebbe* obj);
+                bool meth_UnaryOperator_348525ebbe_equals(struct class_UnaryOperator_348525ebbe* var1, struct class_UnaryOperator_348525ebbe* var2);
+
+                #endif
+                
@@ -0,0 +1,72 @@
+#include <lib/oomph.h>
+#include "UnionMemberCheck_7021628c40.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "LocalVariable_846080e5ae.h"
+#include "Type_87e1ce5c5e.h"
+
+            static struct StringBuf string0_UnionMemberCheck_473841c284_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x55', '\x6e', '\x69', '\x6f', '\x6e', '\x4d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x43', '\x68', '\x65', '\x63', '\x6b' },
+                .malloced = false,
+            };
+            static struct class_Str string0_UnionMemberCheck_473841c284 = {
+                .buf = &string0_UnionMemberCheck_473841c284_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            struct class_UnionMemberCheck_7021628c40* ctor_UnionMemberCheck_7021628c40(struct class_LocalVariable_846080e5ae* arg_result,struct class_LocalVariable_846080e5ae* arg_union_var,struct class_Type_87e1ce5c5e arg_member_type)
+            {
+                struct class_UnionMemberCheck_7021628c40* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_result = arg_result;
+obj->memb_union_var = arg_union_var;
+obj->memb_member_type = arg_member_type;
+
+                incref(arg_result);
+incref(arg_union_var);
+incref_Type_87e1ce5c5e(arg_member_type);
+
+                return obj;
+            }
+
+            void dtor_UnionMemberCheck_7021628c40(void *ptr)
+            {
+                struct class_UnionMemberCheck_7021628c40 *obj = ptr;
+                decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_union_var), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(obj->memb_member_type);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_UnionMemberCheck_7021628c40_to_string(struct class_UnionMemberCheck_7021628c40* self)
+                {
+                    struct class_Str res = string0_UnionMemberCheck_473841c284;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_result);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_union_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_member_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_UnionMemberCheck_7021628c40_equals(struct class_UnionMemberCheck_7021628c40* var1, struct class_UnionMemberCheck_7021628c40* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,27 @@
+
+                #ifndef HEADER_GUARD_UnionMemberCheck_7021628c40
+                #define HEADER_GUARD_UnionMemberCheck_7021628c40
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+
+            struct class_UnionMemberCheck_7021628c40 {
+                REFCOUNT_HEADER
+                struct class_LocalVariable_846080e5ae* memb_result;
+struct class_LocalVariable_846080e5ae* memb_union_var;
+struct class_Type_87e1ce5c5e memb_member_type;
+
+            };
+            
+            struct class_UnionMemberCheck_7021628c40* ctor_UnionMemberCheck_7021628c40(struct class_LocalVariable_846080e5ae* arg_result,struct class_LocalVariable_846080e5ae* arg_union_var,struct class_Type_87e1ce5c5e arg_member_type);
+            void dtor_UnionMemberCheck_7021628c40(void *ptr);
+            
+                struct class_Str meth_UnionMemberCheck_7021628c40_to_string(struct class_UnionMemberCheck_7021628c40* obj);
+                bool meth_UnionMemberCheck_7021628c40_equals(struct class_UnionMemberCheck_7021628c40* var1, struct class_UnionMemberCheck_7021628c40* var2);
+
+                #endif
+                
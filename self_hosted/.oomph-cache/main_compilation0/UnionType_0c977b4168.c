@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "UnionType_0c977b4168.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Type__b06c7a2bb6.h"
+
+            static struct StringBuf string0_UnionType_c89a42a4d2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x55', '\x6e', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_UnionType_c89a42a4d2 = {
+                .buf = &string0_UnionType_c89a42a4d2_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            struct class_UnionType_0c977b4168* ctor_UnionType_0c977b4168(struct class_List_Type__b06c7a2bb6* arg_unioned)
+            {
+                struct class_UnionType_0c977b4168* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_unioned = arg_unioned;
+
+                incref(arg_unioned);
+
+                return obj;
+            }
+
+            void dtor_UnionType_0c977b4168(void *ptr)
+            {
+                struct class_UnionType_0c977b4168 *obj = ptr;
+                decref((obj->memb_unioned), dtor_List_Type__b06c7a2bb6);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_UnionType_0c977b4168_to_string(struct class_UnionType_0c977b4168* self)
+                {
+                    struct class_Str res = string0_UnionType_c89a42a4d2;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_List_Type__b06c7a2bb6_to_string(self->memb_unioned);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_UnionType_0c977b4168_equals(struct class_UnionType_0c977b4168* var1, struct class_UnionType_0c977b4168* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
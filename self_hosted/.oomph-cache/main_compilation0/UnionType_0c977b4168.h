@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_UnionType_0c977b4168
+                #define HEADER_GUARD_UnionType_0c977b4168
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Type__b06c7a2bb6;
+struct class_List_Type__b06c7a2bb6;
+
+            struct class_UnionType_0c977b4168 {
+                REFCOUNT_HEADER
+                struct class_List_Type__b06c7a2bb6* memb_unioned;
+
+            };
+            
+            struct class_UnionType_0c977b4168* ctor_UnionType_0c977b4168(struct class_List_Type__b06c7a2bb6* arg_unioned);
+            void dtor_UnionType_0c977b4168(void *ptr);
+            
+                struct class_Str meth_UnionType_0c977b4168_to_string(struct class_UnionType_0c977b4168* obj);
+                bool meth_UnionType_0c977b4168_equals(struct class_UnionType_0c977b4168* var1, struct class_UnionType_0c977b4168* var2);
+
+                #endif
+                
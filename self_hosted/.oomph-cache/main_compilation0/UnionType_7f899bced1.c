@@ -0,0 +1,102 @@
+#include <lib/oomph.h>
+#include "UnionType_7f899bced1.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Builtins_bd980a9f08.h"
+#include "List_Type__057f9c6088.h"
+#include "_null___Str__5eca9cec4f.h"
+
+            static struct StringBuf string0__UnionType__custom_name__f4c46de24f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3c', '\x55', '\x6e', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x3a', '\x20', '\x63', '\x75', '\x73', '\x74', '\x6f', '\x6d', '\x5f', '\x6e', '\x61', '\x6d', '\x65', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string0__UnionType__custom_name__f4c46de24f = {
+                .buf = &string0__UnionType__custom_name__f4c46de24f_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1___3a9857d87a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3e' },
+                .malloced = false,
+            };
+            static struct class_Str string1___3a9857d87a = {
+                .buf = &string1___3a9857d87a_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            struct class_UnionType_7f899bced1* ctor_UnionType_7f899bced1(struct class_List_Type__057f9c6088* arg_type_members,struct class__null___Str__5eca9cec4f arg_custom_name,struct class_Builtins_bd980a9f08* arg_builtins)
+            {
+                struct class_UnionType_7f899bced1* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_type_members = arg_type_members;
+obj->memb_custom_name = arg_custom_name;
+obj->memb_builtins = arg_builtins;
+
+                incref(arg_type_members);
+incref__null___Str__5eca9cec4f(arg_custom_name);
+incref(arg_builtins);
+
+                return obj;
+            }
+
+            void dtor_UnionType_7f899bced1(void *ptr)
+            {
+                struct class_UnionType_7f899bced1 *obj = ptr;
+                decref((obj->memb_type_members), dtor_List_Type__057f9c6088);
+decref__null___Str__5eca9cec4f(obj->memb_custom_name);
+decref((obj->memb_builtins), dtor_Builtins_bd980a9f08);
+
+                free(obj);
+            }
+            struct class_Str meth_UnionType_7f899bced1_to_string(struct class_UnionType_7f899bced1* var1){struct class_Str var2;
+var2.buf = NULL;
+struct class__null___Str__5eca9cec4f var3;
+var3.membernum = -1;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str retval;
+var2 = string0__UnionType__custom_name__f4c46de24f; string_incref(var2);
+var3 = var1->memb_custom_name;
+incref__null___Str__5eca9cec4f(var3);
+var4 = meth__null___Str__5eca9cec4f_to_string(var3);
+var5 = oomph_string_concat(var2,var4);
+var6 = string1___3a9857d87a; string_incref(var6);
+var7 = oomph_string_concat(var5,var6);
+retval = var7; var7.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var7);
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+decref__null___Str__5eca9cec4f(var3);
+string_decref(var2);
+return retval;
+}bool meth_UnionType_7f899bced1_equals(struct class_UnionType_7f899bced1* var1, struct class_UnionType_7f899bced1* var2){struct class_List_Type__057f9c6088* var3;
+var3 = NULL;
+struct class_List_Type__057f9c6088* var4;
+var4 = NULL;
+bool var5;
+bool retval;
+var3 = var1->memb_type_members;
+incref(var3);
+var4 = var2->memb_type_members;
+incref(var4);
+var5 = meth_List_Type__057f9c6088_equals(var3,var4);
+(void)0; retval = var5; goto out;
+out: (void)0;
+(void)0;
+decref((var4), dtor_List_Type__057f9c6088);
+decref((var3), dtor_List_Type__057f9c6088);
+return retval;
+}
@@ -0,0 +1,28 @@
+
+                #ifndef HEADER_GUARD_UnionType_7f899bced1
+                #define HEADER_GUARD_UnionType_7f899bced1
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Str__5eca9cec4f.h"
+struct class_List_Type__057f9c6088;
+struct class_Builtins_bd980a9f08;
+struct class_List_Type__057f9c6088;
+struct class_Builtins_bd980a9f08;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+
+            struct class_UnionType_7f899bced1 {
+                REFCOUNT_HEADER
+                struct class_List_Type__057f9c6088* memb_type_members;
+struct class__null___Str__5eca9cec4f memb_custom_name;
+struct class_Builtins_bd980a9f08* memb_builtins;
+
+            };
+            
+            struct class_UnionType_7f899bced1* ctor_UnionType_7f899bced1(struct class_List_Type__057f9c6088* arg_type_members,struct class__null___Str__5eca9cec4f arg_custom_name,struct class_Builtins_bd980a9f08* arg_builtins);
+            void dtor_UnionType_7f899bced1(void *ptr);
+            struct class_Str meth_UnionType_7f899bced1_to_string(struct class_UnionType_7f899bced1* var1);
+bool meth_UnionType_7f899bced1_equals(struct class_UnionType_7f899bced1* var1, struct class_UnionType_7f899bced1* var2);
+
+                #endif
+                
@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "VarCpy_e77a538911.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "LocalVariable_846080e5ae.h"
+#include "Variable_1aaa81c8d2.h"
+
+            static struct StringBuf string0_VarCpy_ad31fcd51f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x56', '\x61', '\x72', '\x43', '\x70', '\x79' },
+                .malloced = false,
+            };
+            static struct class_Str string0_VarCpy_ad31fcd51f = {
+                .buf = &string0_VarCpy_ad31fcd51f_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_VarCpy_e77a538911* ctor_VarCpy_e77a538911(struct class_LocalVariable_846080e5ae* arg_dest,struct class_Variable_1aaa81c8d2 arg_source)
+            {
+                struct class_VarCpy_e77a538911* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_dest = arg_dest;
+obj->memb_source = arg_source;
+
+                incref(arg_dest);
+incref_Variable_1aaa81c8d2(arg_source);
+
+                return obj;
+            }
+
+            void dtor_VarCpy_e77a538911(void *ptr)
+            {
+                struct class_VarCpy_e77a538911 *obj = ptr;
+                decref((obj->memb_dest), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(obj->memb_source);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_VarCpy_e77a538911_to_string(struct class_VarCpy_e77a538911* self)
+                {
+                    struct class_Str res = string0_VarCpy_ad31fcd51f;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_dest);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Variable_1aaa81c8d2_to_string(self->memb_source);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_VarCpy_e77a538911_equals(struct class_VarCpy_e77a538911* var1, struct class_VarCpy_e77a538911* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,24 @@
+
+                #ifndef HEADER_GUARD_VarCpy_e77a538911
+                #define HEADER_GUARD_VarCpy_e77a538911
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Variable_1aaa81c8d2.h"
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+
+            struct class_VarCpy_e77a538911 {
+                REFCOUNT_HEADER
+                struct class_LocalVariable_846080e5ae* memb_dest;
+struct class_Variable_1aaa81c8d2 memb_source;
+
+            };
+            
+            struct class_VarCpy_e77a538911* ctor_VarCpy_e77a538911(struct class_LocalVariable_846080e5ae* arg_dest,struct class_Variable_1aaa81c8d2 arg_source);
+            void dtor_VarCpy_e77a538911(void *ptr);
+            
+                struct class_Str meth_VarCpy_e77a538911_to_string(struct class_VarCpy_e77a538911* obj);
+                bool meth_VarCpy_e77a538911_equals(struct class_VarCpy_e77a538911* var1, struct class_VarCpy_e77a538911* var2);
+
+                #endif
+                
@@ -0,0 +1,117 @@
+#include <lib/oomph.h>
+#include "Variable_1aaa81c8d2.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "BuiltinVariable_f6e0cdd1b6.h"
+#include "FileVariable_a7b8ca651f.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf string0_Variable_016f0fdda9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x56', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Variable_016f0fdda9 = {
+                .buf = &string0_Variable_016f0fdda9_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_Variable_1aaa81c8d2_to_string(struct class_Variable_1aaa81c8d2 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_BuiltinVariable_f6e0cdd1b6_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_FileVariable_a7b8ca651f_to_string(obj.val.item1);
+                    break;
+                
+                case 2:
+                    valstr = meth_LocalVariable_846080e5ae_to_string(obj.val.item2);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Variable_016f0fdda9), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_Variable_016f0fdda9;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_Variable_1aaa81c8d2_equals(struct class_Variable_1aaa81c8d2 a, struct class_Variable_1aaa81c8d2 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_BuiltinVariable_f6e0cdd1b6_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_FileVariable_a7b8ca651f_equals(
+                        a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_LocalVariable_846080e5ae_equals(
+                        a.val.item2, b.val.item2);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Variable_016f0fdda9), (int)a.membernum);
+                }
+            }
+            
+            void incref_Variable_1aaa81c8d2(struct class_Variable_1aaa81c8d2 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                case 2:
+                    incref(obj.val.item2);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_Variable_1aaa81c8d2(struct class_Variable_1aaa81c8d2 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_BuiltinVariable_f6e0cdd1b6);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_FileVariable_a7b8ca651f);
+                    break;
+                
+                case 2:
+                    decref((obj.val.item2), dtor_LocalVariable_846080e5ae);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
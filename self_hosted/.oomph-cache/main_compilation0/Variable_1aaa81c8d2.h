@@ -0,0 +1,27 @@
+
+                #ifndef HEADER_GUARD_Variable_1aaa81c8d2
+                #define HEADER_GUARD_Variable_1aaa81c8d2
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_FileVariable_a7b8ca651f;
+struct class_LocalVariable_846080e5ae;
+
+            struct class_Variable_1aaa81c8d2 {
+                union {
+                    	struct class_BuiltinVariable_f6e0cdd1b6* item0;
+	struct class_FileVariable_a7b8ca651f* item1;
+	struct class_LocalVariable_846080e5ae* item2;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_Variable_1aaa81c8d2_to_string(struct class_Variable_1aaa81c8d2 obj);
+            bool meth_Variable_1aaa81c8d2_equals(struct class_Variable_1aaa81c8d2 a, struct class_Variable_1aaa81c8d2 b);
+            
+            void incref_Variable_1aaa81c8d2(struct class_Variable_1aaa81c8d2 obj);
+            void decref_Variable_1aaa81c8d2(struct class_Variable_1aaa81c8d2 obj);
+            
+                #endif
+                
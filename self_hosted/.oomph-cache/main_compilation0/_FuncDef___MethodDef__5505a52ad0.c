@@ -0,0 +1,100 @@
+#include <lib/oomph.h>
+#include "_FuncDef___MethodDef__5505a52ad0.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "FuncDef_2bd6886a53.h"
+#include "MethodDef_28b65923b5.h"
+
+            static struct StringBuf string0__FuncDef___MethodDef__3371cacd07_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x46', '\x75', '\x6e', '\x63', '\x44', '\x65', '\x66', '\x20', '\x7c', '\x20', '\x4d', '\x65', '\x74', '\x68', '\x6f', '\x64', '\x44', '\x65', '\x66', '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string0__FuncDef___MethodDef__3371cacd07 = {
+                .buf = &string0__FuncDef___MethodDef__3371cacd07_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            
+            struct class_Str meth__FuncDef___MethodDef__5505a52ad0_to_string(struct class__FuncDef___MethodDef__5505a52ad0 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_FuncDef_2bd6886a53_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_MethodDef_28b65923b5_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__FuncDef___MethodDef__3371cacd07), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0__FuncDef___MethodDef__3371cacd07;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth__FuncDef___MethodDef__5505a52ad0_equals(struct class__FuncDef___MethodDef__5505a52ad0 a, struct class__FuncDef___MethodDef__5505a52ad0 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_FuncDef_2bd6886a53_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_MethodDef_28b65923b5_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__FuncDef___MethodDef__3371cacd07), (int)a.membernum);
+                }
+            }
+            
+            void incref__FuncDef___MethodDef__5505a52ad0(struct class__FuncDef___MethodDef__5505a52ad0 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref__FuncDef___MethodDef__5505a52ad0(struct class__FuncDef___MethodDef__5505a52ad0 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_FuncDef_2bd6886a53);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_MethodDef_28b65923b5);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
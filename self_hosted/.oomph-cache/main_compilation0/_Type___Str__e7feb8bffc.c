@@ -0,0 +1,99 @@
+#include <lib/oomph.h>
+#include "_Type___Str__e7feb8bffc.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+
+            static struct StringBuf string0__Type___Str__b21ce8bd69_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x53', '\x74', '\x72', '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string0__Type___Str__b21ce8bd69 = {
+                .buf = &string0__Type___Str__b21ce8bd69_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            struct class_Str meth__Type___Str__e7feb8bffc_to_string(struct class__Type___Str__e7feb8bffc obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_Type_87e1ce5c5e_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Str_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__Type___Str__b21ce8bd69), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0__Type___Str__b21ce8bd69;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth__Type___Str__e7feb8bffc_equals(struct class__Type___Str__e7feb8bffc a, struct class__Type___Str__e7feb8bffc b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_Type_87e1ce5c5e_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Str_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__Type___Str__b21ce8bd69), (int)a.membernum);
+                }
+            }
+            
+            void incref__Type___Str__e7feb8bffc(struct class__Type___Str__e7feb8bffc obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref_Type_87e1ce5c5e(obj.val.item0);
+                    break;
+                
+                case 1:
+                    string_incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref__Type___Str__e7feb8bffc(struct class__Type___Str__e7feb8bffc obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref_Type_87e1ce5c5e(obj.val.item0);
+                    break;
+                
+                case 1:
+                    string_decref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
@@ -0,0 +1,24 @@
+
+                #ifndef HEADER_GUARD__Type___Str__e7feb8bffc
+                #define HEADER_GUARD__Type___Str__e7feb8bffc
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+
+            struct class__Type___Str__e7feb8bffc {
+                union {
+                    	struct class_Type_87e1ce5c5e item0;
+	struct class_Str item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth__Type___Str__e7feb8bffc_to_string(struct class__Type___Str__e7feb8bffc obj);
+            bool meth__Type___Str__e7feb8bffc_equals(struct class__Type___Str__e7feb8bffc a, struct class__Type___Str__e7feb8bffc b);
+            
+            void incref__Type___Str__e7feb8bffc(struct class__Type___Str__e7feb8bffc obj);
+            void decref__Type___Str__e7feb8bffc(struct class__Type___Str__e7feb8bffc obj);
+            
+                #endif
+                
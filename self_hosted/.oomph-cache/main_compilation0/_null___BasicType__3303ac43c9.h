@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD__null___BasicType__3303ac43c9
+                #define HEADER_GUARD__null___BasicType__3303ac43c9
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_BasicType_899b9c9f8e;
+struct class_BasicType_899b9c9f8e;
+
+            struct class__null___BasicType__3303ac43c9 {
+                union {
+                    	char item0;
+	struct class_BasicType_899b9c9f8e* item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth__null___BasicType__3303ac43c9_to_string(struct class__null___BasicType__3303ac43c9 obj);
+            bool meth__null___BasicType__3303ac43c9_equals(struct class__null___BasicType__3303ac43c9 a, struct class__null___BasicType__3303ac43c9 b);
+            
+            void incref__null___BasicType__3303ac43c9(struct class__null___BasicType__3303ac43c9 obj);
+            void decref__null___BasicType__3303ac43c9(struct class__null___BasicType__3303ac43c9 obj);
+            struct class_BasicType_899b9c9f8e* meth__null___BasicType__3303ac43c9_get(struct class__null___BasicType__3303ac43c9 obj);
+                #endif
+                
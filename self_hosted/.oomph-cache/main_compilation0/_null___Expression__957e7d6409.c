@@ -0,0 +1,108 @@
+#include <lib/oomph.h>
+#include "_null___Expression__957e7d6409.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+
+            static struct StringBuf string0__null___Expression__fa30c8578e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x6e', '\x75', '\x6c', '\x6c', '\x20', '\x7c', '\x20', '\x45', '\x78', '\x70', '\x72', '\x65', '\x73', '\x73', '\x69', '\x6f', '\x6e', '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string0__null___Expression__fa30c8578e = {
+                .buf = &string0__null___Expression__fa30c8578e_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            
+            struct class_Str meth__null___Expression__957e7d6409_to_string(struct class__null___Expression__957e7d6409 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_null_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Expression_35f2052bf4_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__null___Expression__fa30c8578e), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0__null___Expression__fa30c8578e;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth__null___Expression__957e7d6409_equals(struct class__null___Expression__957e7d6409 a, struct class__null___Expression__957e7d6409 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_null_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Expression_35f2052bf4_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__null___Expression__fa30c8578e), (int)a.membernum);
+                }
+            }
+            
+            void incref__null___Expression__957e7d6409(struct class__null___Expression__957e7d6409 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    incref_Expression_35f2052bf4(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref__null___Expression__957e7d6409(struct class__null___Expression__957e7d6409 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    decref_Expression_35f2052bf4(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
+                struct class_Expression_35f2052bf4 meth__null___Expression__957e7d6409_get(struct class__null___Expression__957e7d6409 obj)
+                {
+                    if (obj.membernum == 0)
+                        panic_printf("Error: null.get() was called");
+                    assert(obj.membernum == 1);
+                    incref_Expression_35f2052bf4(obj.val.item1);
+                    return obj.val.item1;
+                }
+                
@@ -0,0 +1,24 @@
+
+                #ifndef HEADER_GUARD__null___Expression__957e7d6409
+                #define HEADER_GUARD__null___Expression__957e7d6409
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+
+            struct class__null___Expression__957e7d6409 {
+                union {
+                    	char item0;
+	struct class_Expression_35f2052bf4 item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth__null___Expression__957e7d6409_to_string(struct class__null___Expression__957e7d6409 obj);
+            bool meth__null___Expression__957e7d6409_equals(struct class__null___Expression__957e7d6409 a, struct class__null___Expression__957e7d6409 b);
+            
+            void incref__null___Expression__957e7d6409(struct class__null___Expression__957e7d6409 obj);
+            void decref__null___Expression__957e7d6409(struct class__null___Expression__957e7d6409 obj);
+            struct class_Expression_35f2052bf4 meth__null___Expression__957e7d6409_get(struct class__null___Expression__957e7d6409 obj);
+                #endif
+                
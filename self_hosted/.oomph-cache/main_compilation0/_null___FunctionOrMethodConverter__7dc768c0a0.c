@@ -0,0 +1,108 @@
+#include <lib/oomph.h>
+#include "_null___FunctionOrMethodConverter__7dc768c0a0.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "FunctionOrMethodConverter_14d05c56fc.h"
+
+            static struct StringBuf string0__null___FunctionOrMethodConverter__a7f27cde36_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x6e', '\x75', '\x6c', '\x6c', '\x20', '\x7c', '\x20', '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x4f', '\x72', '\x4d', '\x65', '\x74', '\x68', '\x6f', '\x64', '\x43', '\x6f', '\x6e', '\x76', '\x65', '\x72', '\x74', '\x65', '\x72', '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string0__null___FunctionOrMethodConverter__a7f27cde36 = {
+                .buf = &string0__null___FunctionOrMethodConverter__a7f27cde36_buf,
+                .nbytes = 34,
+                .offset = 0,
+            };
+            
+            struct class_Str meth__null___FunctionOrMethodConverter__7dc768c0a0_to_string(struct class__null___FunctionOrMethodConverter__7dc768c0a0 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_null_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_FunctionOrMethodConverter_14d05c56fc_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__null___FunctionOrMethodConverter__a7f27cde36), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0__null___FunctionOrMethodConverter__a7f27cde36;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth__null___FunctionOrMethodConverter__7dc768c0a0_equals(struct class__null___FunctionOrMethodConverter__7dc768c0a0 a, struct class__null___FunctionOrMethodConverter__7dc768c0a0 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_null_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_FunctionOrMethodConverter_14d05c56fc_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__null___FunctionOrMethodConverter__a7f27cde36), (int)a.membernum);
+                }
+            }
+            
+            void incref__null___FunctionOrMethodConverter__7dc768c0a0(struct class__null___FunctionOrMethodConverter__7dc768c0a0 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref__null___FunctionOrMethodConverter__7dc768c0a0(struct class__null___FunctionOrMethodConverter__7dc768c0a0 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_FunctionOrMethodConverter_14d05c56fc);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
+                struct class_FunctionOrMethodConverter_14d05c56fc* meth__null___FunctionOrMethodConverter__7dc768c0a0_get(struct class__null___FunctionOrMethodConverter__7dc768c0a0 obj)
+                {
+                    if (obj.membernum == 0)
+                        panic_printf("Error: null.get() was called");
+                    assert(obj.membernum == 1);
+                    incref(obj.val.item1);
+                    return obj.val.item1;
+                }
+                
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD__null___FunctionOrMethodConverter__7dc768c0a0
+                #define HEADER_GUARD__null___FunctionOrMethodConverter__7dc768c0a0
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_FunctionOrMethodConverter_14d05c56fc;
+struct class_FunctionOrMethodConverter_14d05c56fc;
+
+            struct class__null___FunctionOrMethodConverter__7dc768c0a0 {
+                union {
+                    	char item0;
+	struct class_FunctionOrMethodConverter_14d05c56fc* item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth__null___FunctionOrMethodConverter__7dc768c0a0_to_string(struct class__null___FunctionOrMethodConverter__7dc768c0a0 obj);
+            bool meth__null___FunctionOrMethodConverter__7dc768c0a0_equals(struct class__null___FunctionOrMethodConverter__7dc768c0a0 a, struct class__null___FunctionOrMethodConverter__7dc768c0a0 b);
+            
+            void incref__null___FunctionOrMethodConverter__7dc768c0a0(struct class__null___FunctionOrMethodConverter__7dc768c0a0 obj);
+            void decref__null___FunctionOrMethodConverter__7dc768c0a0(struct class__null___FunctionOrMethodConverter__7dc768c0a0 obj);
+            struct class_FunctionOrMethodConverter_14d05c56fc* meth__null___FunctionOrMethodConverter__7dc768c0a0_get(struct class__null___FunctionOrMethodConverter__7dc768c0a0 obj);
+                #endif
+                
@@ -0,0 +1,108 @@
+#include <lib/oomph.h>
+#include "_null___GenericSource__4440b6073d.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "GenericSource_35cfcd932e.h"
+
+            static struct StringBuf string0__null___GenericSource__ab1a913409_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x6e', '\x75', '\x6c', '\x6c', '\x20', '\x7c', '\x20', '\x47', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x53', '\x6f', '\x75', '\x72', '\x63', '\x65', '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string0__null___GenericSource__ab1a913409 = {
+                .buf = &string0__null___GenericSource__ab1a913409_buf,
+                .nbytes = 22,
+                .offset = 0,
+            };
+            
+            struct class_Str meth__null___GenericSource__4440b6073d_to_string(struct class__null___GenericSource__4440b6073d obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_null_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_GenericSource_35cfcd932e_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__null___GenericSource__ab1a913409), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0__null___GenericSource__ab1a913409;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth__null___GenericSource__4440b6073d_equals(struct class__null___GenericSource__4440b6073d a, struct class__null___GenericSource__4440b6073d b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_null_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_GenericSource_35cfcd932e_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__null___GenericSource__ab1a913409), (int)a.membernum);
+                }
+            }
+            
+            void incref__null___GenericSource__4440b6073d(struct class__null___GenericSource__4440b6073d obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref__null___GenericSource__4440b6073d(struct class__null___GenericSource__4440b6073d obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_GenericSource_35cfcd932e);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
+                struct class_GenericSource_35cfcd932e* meth__null___GenericSource__4440b6073d_get(struct class__null___GenericSource__4440b6073d obj)
+                {
+                    if (obj.membernum == 0)
+                        panic_printf("Error: null.get() was called");
+                    assert(obj.membernum == 1);
+                    incref(obj.val.item1);
+                    return obj.val.item1;
+                }
+                
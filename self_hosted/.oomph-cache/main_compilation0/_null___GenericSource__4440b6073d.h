@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD__null___GenericSource__4440b6073d
+                #define HEADER_GUARD__null___GenericSource__4440b6073d
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_GenericSource_35cfcd932e;
+struct class_GenericSource_35cfcd932e;
+
+            struct class__null___GenericSource__4440b6073d {
+                union {
+                    	char item0;
+	struct class_GenericSource_35cfcd932e* item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth__null___GenericSource__4440b6073d_to_string(struct class__null___GenericSource__4440b6073d obj);
+            bool meth__null___GenericSource__4440b6073d_equals(struct class__null___GenericSource__4440b6073d a, struct class__null___GenericSource__4440b6073d b);
+            
+            void incref__null___GenericSource__4440b6073d(struct class__null___GenericSource__4440b6073d obj);
+            void decref__null___GenericSource__4440b6073d(struct class__null___GenericSource__4440b6073d obj);
+            struct class_GenericSource_35cfcd932e* meth__null___GenericSource__4440b6073d_get(struct class__null___GenericSource__4440b6073d obj);
+                #endif
+                
@@ -0,0 +1,108 @@
+#include <lib/oomph.h>
+#include "_null___List_Str___1b0213dad9.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0__null___List_Str___d8098541ca_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x6e', '\x75', '\x6c', '\x6c', '\x20', '\x7c', '\x20', '\x4c', '\x69', '\x73', '\x74', '\x5b', '\x53', '\x74', '\x72', '\x5d', '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string0__null___List_Str___d8098541ca = {
+                .buf = &string0__null___List_Str___d8098541ca_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            
+            struct class_Str meth__null___List_Str___1b0213dad9_to_string(struct class__null___List_Str___1b0213dad9 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_null_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_List_Str__43b70c06cb_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__null___List_Str___d8098541ca), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0__null___List_Str___d8098541ca;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth__null___List_Str___1b0213dad9_equals(struct class__null___List_Str___1b0213dad9 a, struct class__null___List_Str___1b0213dad9 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_null_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_List_Str__43b70c06cb_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__null___List_Str___d8098541ca), (int)a.membernum);
+                }
+            }
+            
+            void incref__null___List_Str___1b0213dad9(struct class__null___List_Str___1b0213dad9 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref__null___List_Str___1b0213dad9(struct class__null___List_Str___1b0213dad9 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_List_Str__43b70c06cb);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
+                struct class_List_Str__43b70c06cb* meth__null___List_Str___1b0213dad9_get(struct class__null___List_Str___1b0213dad9 obj)
+                {
+                    if (obj.membernum == 0)
+                        panic_printf("Error: null.get() was called");
+                    assert(obj.membernum == 1);
+                    incref(obj.val.item1);
+                    return obj.val.item1;
+                }
+                
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD__null___List_Str___1b0213dad9
+                #define HEADER_GUARD__null___List_Str___1b0213dad9
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+
+            struct class__null___List_Str___1b0213dad9 {
+                union {
+                    	char item0;
+	struct class_List_Str__43b70c06cb* item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth__null___List_Str___1b0213dad9_to_string(struct class__null___List_Str___1b0213dad9 obj);
+            bool meth__null___List_Str___1b0213dad9_equals(struct class__null___List_Str___1b0213dad9 a, struct class__null___List_Str___1b0213dad9 b);
+            
+            void incref__null___List_Str___1b0213dad9(struct class__null___List_Str___1b0213dad9 obj);
+            void decref__null___List_Str___1b0213dad9(struct class__null___List_Str___1b0213dad9 obj);
+            struct class_List_Str__43b70c06cb* meth__null___List_Str___1b0213dad9_get(struct class__null___List_Str___1b0213dad9 obj);
+                #endif
+                
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD__null___List_Type___114a421a91
+                #define HEADER_GUARD__null___List_Type___114a421a91
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+
+            struct class__null___List_Type___114a421a91 {
+                union {
+                    	char item0;
+	struct class_List_Type__057f9c6088* item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth__null___List_Type___114a421a91_to_string(struct class__null___List_Type___114a421a91 obj);
+            bool meth__null___List_Type___114a421a91_equals(struct class__null___List_Type___114a421a91 a, struct class__null___List_Type___114a421a91 b);
+            
+            void incref__null___List_Type___114a421a91(struct class__null___List_Type___114a421a91 obj);
+            void decref__null___List_Type___114a421a91(struct class__null___List_Type___114a421a91 obj);
+            struct class_List_Type__057f9c6088* meth__null___List_Type___114a421a91_get(struct class__null___List_Type___114a421a91 obj);
+                #endif
+                
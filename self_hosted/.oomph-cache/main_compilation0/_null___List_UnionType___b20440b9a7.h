@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD__null___List_UnionType___b20440b9a7
+                #define HEADER_GUARD__null___List_UnionType___b20440b9a7
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_UnionType__f35bb76792;
+struct class_List_UnionType__f35bb76792;
+
+            struct class__null___List_UnionType___b20440b9a7 {
+                union {
+                    	char item0;
+	struct class_List_UnionType__f35bb76792* item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth__null___List_UnionType___b20440b9a7_to_string(struct class__null___List_UnionType___b20440b9a7 obj);
+            bool meth__null___List_UnionType___b20440b9a7_equals(struct class__null___List_UnionType___b20440b9a7 a, struct class__null___List_UnionType___b20440b9a7 b);
+            
+            void incref__null___List_UnionType___b20440b9a7(struct class__null___List_UnionType___b20440b9a7 obj);
+            void decref__null___List_UnionType___b20440b9a7(struct class__null___List_UnionType___b20440b9a7 obj);
+            struct class_List_UnionType__f35bb76792* meth__null___List_UnionType___b20440b9a7_get(struct class__null___List_UnionType___b20440b9a7 obj);
+                #endif
+                
@@ -0,0 +1,108 @@
+#include <lib/oomph.h>
+#include "_null___LocalVariable__494c1a2e12.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf string0__null___LocalVariable__1b41a6dce1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x6e', '\x75', '\x6c', '\x6c', '\x20', '\x7c', '\x20', '\x4c', '\x6f', '\x63', '\x61', '\x6c', '\x56', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65', '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string0__null___LocalVariable__1b41a6dce1 = {
+                .buf = &string0__null___LocalVariable__1b41a6dce1_buf,
+                .nbytes = 22,
+                .offset = 0,
+            };
+            
+            struct class_Str meth__null___LocalVariable__494c1a2e12_to_string(struct class__null___LocalVariable__494c1a2e12 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_null_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_LocalVariable_846080e5ae_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__null___LocalVariable__1b41a6dce1), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0__null___LocalVariable__1b41a6dce1;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth__null___LocalVariable__494c1a2e12_equals(struct class__null___LocalVariable__494c1a2e12 a, struct class__null___LocalVariable__494c1a2e12 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_null_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_LocalVariable_846080e5ae_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__null___LocalVariable__1b41a6dce1), (int)a.membernum);
+                }
+            }
+            
+            void incref__null___LocalVariable__494c1a2e12(struct class__null___LocalVariable__494c1a2e12 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref__null___LocalVariable__494c1a2e12(struct class__null___LocalVariable__494c1a2e12 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_LocalVariable_846080e5ae);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
+                struct class_LocalVariable_846080e5ae* meth__null___LocalVariable__494c1a2e12_get(struct class__null___LocalVariable__494c1a2e12 obj)
+                {
+                    if (obj.membernum == 0)
+                        panic_printf("Error: null.get() was called");
+                    assert(obj.membernum == 1);
+                    incref(obj.val.item1);
+                    return obj.val.item1;
+                }
+                
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD__null___LocalVariable__494c1a2e12
+                #define HEADER_GUARD__null___LocalVariable__494c1a2e12
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+
+            struct class__null___LocalVariable__494c1a2e12 {
+                union {
+                    	char item0;
+	struct class_LocalVariable_846080e5ae* item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth__null___LocalVariable__494c1a2e12_to_string(struct class__null___LocalVariable__494c1a2e12 obj);
+            bool meth__null___LocalVariable__494c1a2e12_equals(struct class__null___LocalVariable__494c1a2e12 a, struct class__null___LocalVariable__494c1a2e12 b);
+            
+            void incref__null___LocalVariable__494c1a2e12(struct class__null___LocalVariable__494c1a2e12 obj);
+            void decref__null___LocalVariable__494c1a2e12(struct class__null___LocalVariable__494c1a2e12 obj);
+            struct class_LocalVariable_846080e5ae* meth__null___LocalVariable__494c1a2e12_get(struct class__null___LocalVariable__494c1a2e12 obj);
+                #endif
+                
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD__null___Location__87aaae6467
+                #define HEADER_GUARD__null___Location__87aaae6467
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+
+            struct class__null___Location__87aaae6467 {
+                union {
+                    	char item0;
+	struct class_Location_500c4434c9* item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth__null___Location__87aaae6467_to_string(struct class__null___Location__87aaae6467 obj);
+            bool meth__null___Location__87aaae6467_equals(struct class__null___Location__87aaae6467 a, struct class__null___Location__87aaae6467 b);
+            
+            void incref__null___Location__87aaae6467(struct class__null___Location__87aaae6467 obj);
+            void decref__null___Location__87aaae6467(struct class__null___Location__87aaae6467 obj);
+            struct class_Location_500c4434c9* meth__null___Location__87aaae6467_get(struct class__null___Location__87aaae6467 obj);
+                #endif
+                
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD__null___TypeAndName__d7958d7e85
+                #define HEADER_GUARD__null___TypeAndName__d7958d7e85
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_TypeAndName_fec99b5f94;
+struct class_TypeAndName_fec99b5f94;
+
+            struct class__null___TypeAndName__d7958d7e85 {
+                union {
+                    	char item0;
+	struct class_TypeAndName_fec99b5f94* item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth__null___TypeAndName__d7958d7e85_to_string(struct class__null___TypeAndName__d7958d7e85 obj);
+            bool meth__null___TypeAndName__d7958d7e85_equals(struct class__null___TypeAndName__d7958d7e85 a, struct class__null___TypeAndName__d7958d7e85 b);
+            
+            void incref__null___TypeAndName__d7958d7e85(struct class__null___TypeAndName__d7958d7e85 obj);
+            void decref__null___TypeAndName__d7958d7e85(struct class__null___TypeAndName__d7958d7e85 obj);
+            struct class_TypeAndName_fec99b5f94* meth__null___TypeAndName__d7958d7e85_get(struct class__null___TypeAndName__d7958d7e85 obj);
+                #endif
+                
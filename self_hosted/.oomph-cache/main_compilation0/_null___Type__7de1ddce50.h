@@ -0,0 +1,24 @@
+
+                #ifndef HEADER_GUARD__null___Type__7de1ddce50
+                #define HEADER_GUARD__null___Type__7de1ddce50
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_e6cf7dd4e5.h"
+
+            struct class__null___Type__7de1ddce50 {
+                union {
+                    	char item0;
+	struct class_Type_e6cf7dd4e5 item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth__null___Type__7de1ddce50_to_string(struct class__null___Type__7de1ddce50 obj);
+            bool meth__null___Type__7de1ddce50_equals(struct class__null___Type__7de1ddce50 a, struct class__null___Type__7de1ddce50 b);
+            
+            void incref__null___Type__7de1ddce50(struct class__null___Type__7de1ddce50 obj);
+            void decref__null___Type__7de1ddce50(struct class__null___Type__7de1ddce50 obj);
+            struct class_Type_e6cf7dd4e5 meth__null___Type__7de1ddce50_get(struct class__null___Type__7de1ddce50 obj);
+                #endif
+                
@@ -0,0 +1,24 @@
+
+                #ifndef HEADER_GUARD__null___Type__8438ac3dcf
+                #define HEADER_GUARD__null___Type__8438ac3dcf
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+
+            struct class__null___Type__8438ac3dcf {
+                union {
+                    	char item0;
+	struct class_Type_87e1ce5c5e item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth__null___Type__8438ac3dcf_to_string(struct class__null___Type__8438ac3dcf obj);
+            bool meth__null___Type__8438ac3dcf_equals(struct class__null___Type__8438ac3dcf a, struct class__null___Type__8438ac3dcf b);
+            
+            void incref__null___Type__8438ac3dcf(struct class__null___Type__8438ac3dcf obj);
+            void decref__null___Type__8438ac3dcf(struct class__null___Type__8438ac3dcf obj);
+            struct class_Type_87e1ce5c5e meth__null___Type__8438ac3dcf_get(struct class__null___Type__8438ac3dcf obj);
+                #endif
+                
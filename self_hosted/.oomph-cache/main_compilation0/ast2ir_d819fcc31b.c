@@ -0,0 +1,535 @@
+#include <lib/oomph.h>
+#include "ast2ir_d819fcc31b.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "AutoType_33a5d572cb.h"
+#include "BuiltinVariable_f6e0cdd1b6.h"
+#include "Builtins_bd980a9f08.h"
+#include "FileConverter_c79636dcc7.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "Generic_c39b95ec73.h"
+#include "Instruction_b0fafb4d55.h"
+#include "List_BuiltinVariable__27288a8fae.h"
+#include "List_Instruction__6e475c861a.h"
+#include "List_LocalVariable__81e23234f3.h"
+#include "List_NamedAstType__23f1f6ad88.h"
+#include "List_NamedGeneric__fd1333dbd0.h"
+#include "List_NamedType__d1143722a6.h"
+#include "List_NamedVariable__2ad9e9e312.h"
+#include "List_Symbol__9a01330177.h"
+#include "List_ToplevelDeclaration__35f88ef566.h"
+#include "List_ToplevelDeclaration__c481ce934d.h"
+#include "LocalVariable_846080e5ae.h"
+#include "Location_500c4434c9.h"
+#include "MethodDef_28b65923b5.h"
+#include "NamedGeneric_b3d994eaa0.h"
+#include "NamedType_fe3e45e722.h"
+#include "NamedVariable_ac0761c28d.h"
+#include "PointersEqual_deb0abf3fc.h"
+#include "Return_aa2d9b1c64.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "Type_87e1ce5c5e.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_null___LocalVariable__494c1a2e12.h"
+#include "_null___Location__87aaae6467.h"
+#include "ir_4b1a3e0393.h"
+
+            static struct StringBuf string0_variable_not_found___d9e6ff272d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x76', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65', '\x20', '\x6e', '\x6f', '\x74', '\x20', '\x66', '\x6f', '\x75', '\x6e', '\x64', '\x3a', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string0_variable_not_found___d9e6ff272d = {
+                .buf = &string0_variable_not_found___d9e6ff272d_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_equals_6555eee8c6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x71', '\x75', '\x61', '\x6c', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string1_equals_6555eee8c6 = {
+                .buf = &string1_equals_6555eee8c6_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_Bool_b2b41b8957_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x6f', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string2_Bool_b2b41b8957 = {
+                .buf = &string2_Bool_b2b41b8957_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_Float_55be85c234_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6c', '\x6f', '\x61', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string3_Float_55be85c234 = {
+                .buf = &string3_Float_55be85c234_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_Int_2ec66a0a60_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string4_Int_2ec66a0a60 = {
+                .buf = &string4_Int_2ec66a0a60_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_Str_0389c543ca_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x74', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string5_Str_0389c543ca = {
+                .buf = &string5_Str_0389c543ca_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6_null_add8843330_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x75', '\x6c', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string6_null_add8843330 = {
+                .buf = &string6_null_add8843330_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7_List_988221d8e1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x69', '\x73', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string7_List_988221d8e1 = {
+                .buf = &string7_List_988221d8e1_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string8_self_hosted_ast2ir_oomph_aeb0948fc2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x61', '\x73', '\x74', '\x32', '\x69', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string8_self_hosted_ast2ir_oomph_aeb0948fc2 = {
+                .buf = &string8_self_hosted_ast2ir_oomph_aeb0948fc2_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            bool ast2ir_d819fcc31b_is_autotype(struct class_Type_87e1ce5c5e var1){bool var2;
+struct class_AutoType_33a5d572cb* var5;
+var5 = NULL;
+bool var6;
+bool var7;
+bool retval;
+
+            var2 = (
+                var1.membernum == 0
+            );
+            if (var2) goto label3;
+
+            var2 = (
+                var1.membernum == 1
+            );
+            if (var2) goto label4;
+
+            var2 = (
+                var1.membernum == 2
+            );
+            if (var2) goto label4;
+
+            var2 = (
+                var1.membernum == 3
+            );
+            if (var2) goto label4;
+label3: (void)0;
+
+            if (var1.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var5 = var1.val.item0;
+            incref(var5);
+var6 = oomph_true;
+(void)0; retval = var6; goto out;
+label4: (void)0;
+var7 = oomph_false;
+(void)0; retval = var7; goto out;
+label8: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var5), dtor_AutoType_33a5d572cb);
+(void)0;
+return retval;
+}struct class_Variable_1aaa81c8d2 ast2ir_d819fcc31b_find_variable(struct class_List_NamedVariable__2ad9e9e312* var1, struct class_Str var2, struct class__null___Location__87aaae6467 var3){int64_t var4;
+struct class_NamedVariable_ac0761c28d* var6;
+var6 = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+bool var9;
+struct class_Variable_1aaa81c8d2 var12;
+var12.membernum = -1;
+struct class_Location_500c4434c9* var13;
+var13 = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Variable_1aaa81c8d2 retval;
+var4 = 0LL;
+label5: (void)0;
+if (var4 >= var1->len) goto label7;
+var6 = var1->data[var4++];
+string_decref(var8);
+var8.buf = NULL;
+var8 = var6->memb_name;
+string_incref(var8);
+var9 = meth_Str_equals(var8,var2);
+if (var9) goto label10;
+if (oomph_true) goto label11;
+label10: (void)0;
+var12 = var6->memb_var;
+incref_Variable_1aaa81c8d2(var12);
+retval = var12; var12.membernum = -1;
+goto out;
+label11: (void)0;
+if (oomph_true) goto label5;
+label7: (void)0;
+var13 = meth__null___Location__87aaae6467_get(var3);
+var14 = string0_variable_not_found___d9e6ff272d; string_incref(var14);
+var15 = oomph_string_concat(var14,var2);
+meth_Location_500c4434c9_error(var13,var15);
+out: (void)0;
+string_decref(var15);
+string_decref(var14);
+decref((var13), dtor_Location_500c4434c9);
+decref_Variable_1aaa81c8d2(var12);
+(void)0;
+string_decref(var8);
+(void)0;
+return retval;
+}struct class_MethodDef_28b65923b5* ast2ir_d819fcc31b_create_pointers_equal_method(struct class_Builtins_bd980a9f08* var1, struct class_Type_87e1ce5c5e var2, struct class_Location_500c4434c9* var3){int64_t var4;
+struct class_LocalVariable_846080e5ae* var5;
+var5 = NULL;
+int64_t var6;
+struct class_LocalVariable_846080e5ae* var7;
+var7 = NULL;
+struct class_Type_87e1ce5c5e var8;
+var8.membernum = -1;
+int64_t var9;
+struct class_LocalVariable_846080e5ae* var10;
+var10 = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_FunctionType_4e16d0ea53* var13;
+var13 = NULL;
+struct class_List_LocalVariable__81e23234f3* var14;
+var14 = NULL;
+struct class_PointersEqual_deb0abf3fc* var15;
+var15 = NULL;
+struct class_Instruction_b0fafb4d55 var16;
+var16.membernum = -1;
+struct class__null___LocalVariable__494c1a2e12 var17;
+var17.membernum = -1;
+struct class_Return_aa2d9b1c64* var18;
+var18 = NULL;
+struct class_Instruction_b0fafb4d55 var19;
+var19.membernum = -1;
+struct class_List_Instruction__6e475c861a* var20;
+var20 = NULL;
+struct class_MethodDef_28b65923b5* var21;
+var21 = NULL;
+struct class_MethodDef_28b65923b5* retval;
+var4 = 0LL;
+var5 = ctor_LocalVariable_846080e5ae(var2,var4,var3);
+var6 = 1LL;
+var7 = ctor_LocalVariable_846080e5ae(var2,var6,var3);
+var8 = var1->memb_BOOL;
+incref_Type_87e1ce5c5e(var8);
+var9 = 2LL;
+var10 = ctor_LocalVariable_846080e5ae(var8,var9,var3);
+var11 = string1_equals_6555eee8c6; string_incref(var11);
+var12 = string1_equals_6555eee8c6; string_incref(var12);
+var13 = ir_4b1a3e0393_get_method(var2,var12,var1);
+var14 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var14,var5);
+meth_List_LocalVariable__81e23234f3_push(var14,var7);
+var15 = ctor_PointersEqual_deb0abf3fc(var5,var7,var10);
+var16 = (struct class_Instruction_b0fafb4d55){ .val = { .item12 = var15 }, .membernum = 12 };
+var15 = NULL;
+var17 = (struct class__null___LocalVariable__494c1a2e12){ .val = { .item1 = var10 }, .membernum = 1 };
+var10 = NULL;
+var18 = ctor_Return_aa2d9b1c64(var17);
+var19 = (struct class_Instruction_b0fafb4d55){ .val = { .item13 = var18 }, .membernum = 13 };
+var18 = NULL;
+var20 = ctor_List_Instruction__6e475c861a();
+meth_List_Instruction__6e475c861a_push(var20,var16);
+meth_List_Instruction__6e475c861a_push(var20,var19);
+var21 = ctor_MethodDef_28b65923b5(var11,var13,var14,var20);
+retval = var21; var21 = NULL;
+goto out;
+out: (void)0;
+decref((var21), dtor_MethodDef_28b65923b5);
+decref((var20), dtor_List_Instruction__6e475c861a);
+decref_Instruction_b0fafb4d55(var19);
+decref((var18), dtor_Return_aa2d9b1c64);
+decref__null___LocalVariable__494c1a2e12(var17);
+decref_Instruction_b0fafb4d55(var16);
+decref((var15), dtor_PointersEqual_deb0abf3fc);
+decref((var14), dtor_List_LocalVariable__81e23234f3);
+decref((var13), dtor_FunctionType_4e16d0ea53);
+string_decref(var12);
+string_decref(var11);
+decref((var10), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref_Type_87e1ce5c5e(var8);
+decref((var7), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref((var5), dtor_LocalVariable_846080e5ae);
+(void)0;
+return retval;
+}struct class_List_ToplevelDeclaration__35f88ef566* ast2ir_d819fcc31b_convert_program(struct class_Builtins_bd980a9f08* var1, struct class_List_ToplevelDeclaration__c481ce934d* var2, struct class_Str var3, struct class_List_Symbol__9a01330177* var4){struct class_Str var5;
+var5.buf = NULL;
+struct class_Type_87e1ce5c5e var6;
+var6.membernum = -1;
+struct class_NamedType_fe3e45e722* var7;
+var7 = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Type_87e1ce5c5e var9;
+var9.membernum = -1;
+struct class_NamedType_fe3e45e722* var10;
+var10 = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Type_87e1ce5c5e var12;
+var12.membernum = -1;
+struct class_NamedType_fe3e45e722* var13;
+var13 = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Type_87e1ce5c5e var15;
+var15.membernum = -1;
+struct class_NamedType_fe3e45e722* var16;
+var16 = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Type_87e1ce5c5e var18;
+var18.membernum = -1;
+struct class_NamedType_fe3e45e722* var19;
+var19 = NULL;
+struct class_List_NamedType__d1143722a6* var20;
+var20 = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Generic_c39b95ec73* var22;
+var22 = NULL;
+struct class_NamedGeneric_b3d994eaa0* var23;
+var23 = NULL;
+struct class_List_NamedGeneric__fd1333dbd0* var24;
+var24 = NULL;
+struct class_List_BuiltinVariable__27288a8fae* var25;
+var25 = NULL;
+struct class_List_NamedVariable__2ad9e9e312* var26;
+var26 = NULL;
+int64_t var27;
+int64_t var28;
+struct class_BuiltinVariable_f6e0cdd1b6* var30;
+var30 = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_Variable_1aaa81c8d2 var33;
+var33.membernum = -1;
+struct class_NamedVariable_ac0761c28d* var34;
+var34 = NULL;
+struct class_List_NamedAstType__23f1f6ad88* var35;
+var35 = NULL;
+struct class_FileConverter_c79636dcc7* var36;
+var36 = NULL;
+int64_t var37;
+struct class_ToplevelDeclaration_054352d1cf var39;
+var39.membernum = -1;
+int64_t var41;
+struct class_ToplevelDeclaration_054352d1cf var43;
+var43.membernum = -1;
+struct class_List_NamedAstType__23f1f6ad88* var45;
+var45 = NULL;
+struct class_List_NamedAstType__23f1f6ad88* var46;
+var46 = NULL;
+bool var47;
+struct class_Str var48;
+var48.buf = NULL;
+int64_t var49;
+int64_t var50;
+struct class_ToplevelDeclaration_054352d1cf var52;
+var52.membernum = -1;
+struct class_List_ToplevelDeclaration__35f88ef566* var54;
+var54 = NULL;
+int64_t var55;
+struct class_ToplevelDeclaration_054352d1cf var57;
+var57.membernum = -1;
+struct class_List_ToplevelDeclaration__35f88ef566* var59;
+var59 = NULL;
+struct class_List_ToplevelDeclaration__35f88ef566* retval;
+var5 = string2_Bool_b2b41b8957; string_incref(var5);
+var6 = var1->memb_BOOL;
+incref_Type_87e1ce5c5e(var6);
+var7 = ctor_NamedType_fe3e45e722(var5,var6);
+var8 = string3_Float_55be85c234; string_incref(var8);
+var9 = var1->memb_FLOAT;
+incref_Type_87e1ce5c5e(var9);
+var10 = ctor_NamedType_fe3e45e722(var8,var9);
+var11 = string4_Int_2ec66a0a60; string_incref(var11);
+var12 = var1->memb_INT;
+incref_Type_87e1ce5c5e(var12);
+var13 = ctor_NamedType_fe3e45e722(var11,var12);
+var14 = string5_Str_0389c543ca; string_incref(var14);
+var15 = var1->memb_STR;
+incref_Type_87e1ce5c5e(var15);
+var16 = ctor_NamedType_fe3e45e722(var14,var15);
+var17 = string6_null_add8843330; string_incref(var17);
+var18 = var1->memb_NULL_TYPE;
+incref_Type_87e1ce5c5e(var18);
+var19 = ctor_NamedType_fe3e45e722(var17,var18);
+var20 = ctor_List_NamedType__d1143722a6();
+meth_List_NamedType__d1143722a6_push(var20,var7);
+meth_List_NamedType__d1143722a6_push(var20,var10);
+meth_List_NamedType__d1143722a6_push(var20,var13);
+meth_List_NamedType__d1143722a6_push(var20,var16);
+meth_List_NamedType__d1143722a6_push(var20,var19);
+var21 = string7_List_988221d8e1; string_incref(var21);
+var22 = var1->memb_LIST;
+incref(var22);
+var23 = ctor_NamedGeneric_b3d994eaa0(var21,var22);
+var24 = ctor_List_NamedGeneric__fd1333dbd0();
+meth_List_NamedGeneric__fd1333dbd0_push(var24,var23);
+var25 = var1->memb_visible_vars;
+incref(var25);
+var26 = ctor_List_NamedVariable__2ad9e9e312();
+var27 = meth_List_BuiltinVariable__27288a8fae_length(var25);
+meth_List_NamedVariable__2ad9e9e312___reserve(var26,var27);
+var28 = 0LL;
+label29: (void)0;
+if (var28 >= var25->len) goto label31;
+var30 = var25->data[var28++];
+string_decref(var32);
+var32.buf = NULL;
+var32 = var30->memb_name;
+string_incref(var32);
+decref_Variable_1aaa81c8d2(var33);
+var33.membernum = -1;
+var33 = (struct class_Variable_1aaa81c8d2){ .val = { .item0 = var30 }, .membernum = 0 };
+incref(var30);
+decref((var34), dtor_NamedVariable_ac0761c28d);
+var34 = NULL;
+var34 = ctor_NamedVariable_ac0761c28d(var32,var33);
+meth_List_NamedVariable__2ad9e9e312_push(var26,var34);
+if (oomph_true) goto label29;
+label31: (void)0;
+var35 = ctor_List_NamedAstType__23f1f6ad88();
+var36 = ctor_FileConverter_c79636dcc7(var1,var3,var4,var20,var24,var26,var35);
+var37 = 0LL;
+label38: (void)0;
+if (var37 >= var2->len) goto label40;
+decref_ToplevelDeclaration_054352d1cf(var39); var39 = var2->data[var37++]; incref_ToplevelDeclaration_054352d1cf(var39);
+meth_FileConverter_c79636dcc7_do_step1(var36,var39);
+if (oomph_true) goto label38;
+label40: (void)0;
+var41 = 0LL;
+label42: (void)0;
+if (var41 >= var2->len) goto label44;
+decref_ToplevelDeclaration_054352d1cf(var43); var43 = var2->data[var41++]; incref_ToplevelDeclaration_054352d1cf(var43);
+meth_FileConverter_c79636dcc7_do_step2(var36,var43);
+if (oomph_true) goto label42;
+label44: (void)0;
+var45 = var36->memb_typedef_laziness;
+incref(var45);
+var46 = ctor_List_NamedAstType__23f1f6ad88();
+var47 = meth_List_NamedAstType__23f1f6ad88_equals(var45,var46);
+var48 = string8_self_hosted_ast2ir_oomph_aeb0948fc2; string_incref(var48);
+var49 = 1276LL;
+oomph_assert(var47,var48,var49);
+var50 = 0LL;
+label51: (void)0;
+if (var50 >= var2->len) goto label53;
+decref_ToplevelDeclaration_054352d1cf(var52); var52 = var2->data[var50++]; incref_ToplevelDeclaration_054352d1cf(var52);
+meth_FileConverter_c79636dcc7_do_step3(var36,var52);
+if (oomph_true) goto label51;
+label53: (void)0;
+var54 = ctor_List_ToplevelDeclaration__35f88ef566();
+var55 = 0LL;
+label56: (void)0;
+if (var55 >= var2->len) goto label58;
+decref_ToplevelDeclaration_054352d1cf(var57); var57 = var2->data[var55++]; incref_ToplevelDeclaration_054352d1cf(var57);
+decref((var59), dtor_List_ToplevelDeclaration__35f88ef566);
+var59 = NULL;
+var59 = meth_FileConverter_c79636dcc7_do_step4(var36,var57);
+meth_List_ToplevelDeclaration__35f88ef566_push_all(var54,var59);
+if (oomph_true) goto label56;
+label58: (void)0;
+retval = var54; var54 = NULL;
+goto out;
+out: (void)0;
+decref((var59), dtor_List_ToplevelDeclaration__35f88ef566);
+decref_ToplevelDeclaration_054352d1cf(var57);
+(void)0;
+decref((var54), dtor_List_ToplevelDeclaration__35f88ef566);
+decref_ToplevelDeclaration_054352d1cf(var52);
+(void)0;
+(void)0;
+string_decref(var48);
+(void)0;
+decref((var46), dtor_List_NamedAstType__23f1f6ad88);
+decref((var45), dtor_List_NamedAstType__23f1f6ad88);
+decref_ToplevelDeclaration_054352d1cf(var43);
+(void)0;
+decref_ToplevelDeclaration_054352d1cf(var39);
+(void)0;
+decref((var36), dtor_FileConverter_c79636dcc7);
+decref((var35), dtor_List_NamedAstType__23f1f6ad88);
+decref((var34), dtor_NamedVariable_ac0761c28d);
+decref_Variable_1aaa81c8d2(var33);
+string_decref(var32);
+(void)0;
+(void)0;
+decref((var26), dtor_List_NamedVariable__2ad9e9e312);
+decref((var25), dtor_List_BuiltinVariable__27288a8fae);
+decref((var24), dtor_List_NamedGeneric__fd1333dbd0);
+decref((var23), dtor_NamedGeneric_b3d994eaa0);
+decref((var22), dtor_Generic_c39b95ec73);
+string_decref(var21);
+decref((var20), dtor_List_NamedType__d1143722a6);
+decref((var19), dtor_NamedType_fe3e45e722);
+decref_Type_87e1ce5c5e(var18);
+string_decref(var17);
+decref((var16), dtor_NamedType_fe3e45e722);
+decref_Type_87e1ce5c5e(var15);
+string_decref(var14);
+decref((var13), dtor_NamedType_fe3e45e722);
+decref_Type_87e1ce5c5e(var12);
+string_decref(var11);
+decref((var10), dtor_NamedType_fe3e45e722);
+decref_Type_87e1ce5c5e(var9);
+string_decref(var8);
+decref((var7), dtor_NamedType_fe3e45e722);
+decref_Type_87e1ce5c5e(var6);
+string_decref(var5);
+return retval;
+}
@@ -0,0 +1,60 @@
+
+                #ifndef HEADER_GUARD_ast2ir_d819fcc31b
+                #define HEADER_GUARD_ast2ir_d819fcc31b
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Instruction_b0fafb4d55.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "Type_87e1ce5c5e.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_null___LocalVariable__494c1a2e12.h"
+#include "_null___Location__87aaae6467.h"
+#include "ir_4b1a3e0393.h"
+struct class_AutoType_33a5d572cb;
+struct class_NamedVariable_ac0761c28d;
+struct class_Location_500c4434c9;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_LocalVariable_846080e5ae;
+struct class_FunctionType_4e16d0ea53;
+struct class_List_LocalVariable__81e23234f3;
+struct class_PointersEqual_deb0abf3fc;
+struct class_Return_aa2d9b1c64;
+struct class_List_Instruction__6e475c861a;
+struct class_MethodDef_28b65923b5;
+struct class_MethodDef_28b65923b5;
+struct class_Builtins_bd980a9f08;
+struct class_Location_500c4434c9;
+struct class_MethodDef_28b65923b5;
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+struct class_NamedType_fe3e45e722;
+struct class_List_NamedType__d1143722a6;
+struct class_Generic_c39b95ec73;
+struct class_NamedGeneric_b3d994eaa0;
+struct class_List_NamedGeneric__fd1333dbd0;
+struct class_List_BuiltinVariable__27288a8fae;
+struct class_List_NamedVariable__2ad9e9e312;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_NamedVariable_ac0761c28d;
+struct class_List_NamedAstType__23f1f6ad88;
+struct class_FileConverter_c79636dcc7;
+struct class_List_NamedAstType__23f1f6ad88;
+struct class_List_NamedAstType__23f1f6ad88;
+struct class_List_ToplevelDeclaration__35f88ef566;
+struct class_List_ToplevelDeclaration__35f88ef566;
+struct class_List_ToplevelDeclaration__35f88ef566;
+struct class_Builtins_bd980a9f08;
+struct class_List_ToplevelDeclaration__c481ce934d;
+struct class_List_Symbol__9a01330177;
+struct class_List_ToplevelDeclaration__35f88ef566;
+bool ast2ir_d819fcc31b_is_autotype(struct class_Type_87e1ce5c5e var1);
+struct class_Variable_1aaa81c8d2 ast2ir_d819fcc31b_find_variable(struct class_List_NamedVariable__2ad9e9e312* var1, struct class_Str var2, struct class__null___Location__87aaae6467 var3);
+struct class_MethodDef_28b65923b5* ast2ir_d819fcc31b_create_pointers_equal_method(struct class_Builtins_bd980a9f08* var1, struct class_Type_87e1ce5c5e var2, struct class_Location_500c4434c9* var3);
+struct class_List_ToplevelDeclaration__35f88ef566* ast2ir_d819fcc31b_convert_program(struct class_Builtins_bd980a9f08* var1, struct class_List_ToplevelDeclaration__c481ce934d* var2, struct class_Str var3, struct class_List_Symbol__9a01330177* var4);
+
+                #endif
+                
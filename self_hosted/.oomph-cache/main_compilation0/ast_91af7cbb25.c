@@ -0,0 +1,607 @@
+#include <lib/oomph.h>
+#include "ast_91af7cbb25.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "As_a05f1f16b6.h"
+#include "AutoType_39f5d793d6.h"
+#include "BinaryOperator_e25f87d1b5.h"
+#include "Call_d0fb9d6234.h"
+#include "Constructor_0c896e4031.h"
+#include "Expression_35f2052bf4.h"
+#include "FloatConstant_4759845694.h"
+#include "ForLoopHeader_79606b2adb.h"
+#include "ForeachLoopHeader_ebcb7f3325.h"
+#include "GenericType_f44d8197cb.h"
+#include "GetAttribute_0758070446.h"
+#include "GetVar_642f116a6c.h"
+#include "IntConstant_4cbc4c5420.h"
+#include "ListComprehension_10c913d2dd.h"
+#include "ListLiteral_66e426dc17.h"
+#include "List_Type__b06c7a2bb6.h"
+#include "Location_500c4434c9.h"
+#include "LoopHeader_23fd592271.h"
+#include "NamedType_0d620e38a7.h"
+#include "StatementsAndExpression_964cbccc5e.h"
+#include "StringConstant_c2b1c10b4f.h"
+#include "StringFormatJoin_bc28806767.h"
+#include "Type_e6cf7dd4e5.h"
+#include "UnaryOperator_348525ebbe.h"
+#include "UnionType_0c977b4168.h"
+struct class_Location_500c4434c9* ast_91af7cbb25_locate_type(struct class_Type_e6cf7dd4e5 var1){bool var2;
+struct class_AutoType_39f5d793d6* var7;
+var7 = NULL;
+struct class_Location_500c4434c9* var8;
+var8 = NULL;
+struct class_GenericType_f44d8197cb* var9;
+var9 = NULL;
+struct class_Location_500c4434c9* var10;
+var10 = NULL;
+struct class_NamedType_0d620e38a7* var11;
+var11 = NULL;
+struct class_Location_500c4434c9* var12;
+var12 = NULL;
+struct class_UnionType_0c977b4168* var13;
+var13 = NULL;
+struct class_List_Type__b06c7a2bb6* var14;
+var14 = NULL;
+struct class_Type_e6cf7dd4e5 var15;
+var15.membernum = -1;
+struct class_Location_500c4434c9* var16;
+var16 = NULL;
+struct class_List_Type__b06c7a2bb6* var17;
+var17 = NULL;
+int64_t var18;
+struct class_List_Type__b06c7a2bb6* var19;
+var19 = NULL;
+int64_t var20;
+struct class_List_Type__b06c7a2bb6* var21;
+var21 = NULL;
+int64_t var22;
+struct class_Type_e6cf7dd4e5 var24;
+var24.membernum = -1;
+struct class_Location_500c4434c9* var26;
+var26 = NULL;
+struct class_Location_500c4434c9* var27;
+var27 = NULL;
+struct class_Location_500c4434c9* retval;
+
+            var2 = (
+                var1.membernum == 0
+            );
+            if (var2) goto label3;
+
+            var2 = (
+                var1.membernum == 1
+            );
+            if (var2) goto label4;
+
+            var2 = (
+                var1.membernum == 2
+            );
+            if (var2) goto label5;
+
+            var2 = (
+                var1.membernum == 3
+            );
+            if (var2) goto label6;
+label3: (void)0;
+
+            if (var1.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var7 = var1.val.item0;
+            incref(var7);
+var8 = var7->memb_location;
+incref(var8);
+retval = var8; var8 = NULL;
+goto out;
+label4: (void)0;
+
+            if (var1.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var9 = var1.val.item1;
+            incref(var9);
+var10 = var9->memb_location;
+incref(var10);
+retval = var10; var10 = NULL;
+goto out;
+label5: (void)0;
+
+            if (var1.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var11 = var1.val.item2;
+            incref(var11);
+var12 = var11->memb_location;
+incref(var12);
+retval = var12; var12 = NULL;
+goto out;
+label6: (void)0;
+
+            if (var1.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var13 = var1.val.item3;
+            incref(var13);
+var14 = var13->memb_unioned;
+incref(var14);
+var15 = meth_List_Type__b06c7a2bb6_first(var14);
+var16 = ast_91af7cbb25_locate_type(var15);
+var17 = var13->memb_unioned;
+incref(var17);
+var18 = 1LL;
+var19 = var13->memb_unioned;
+incref(var19);
+var20 = meth_List_Type__b06c7a2bb6_length(var19);
+var21 = meth_List_Type__b06c7a2bb6_slice(var17,var18,var20);
+var22 = 0LL;
+label23: (void)0;
+if (var22 >= var21->len) goto label25;
+decref_Type_e6cf7dd4e5(var24); var24 = var21->data[var22++]; incref_Type_e6cf7dd4e5(var24);
+decref((var26), dtor_Location_500c4434c9);
+var26 = NULL;
+var26 = ast_91af7cbb25_locate_type(var24);
+var27 = meth_Location_500c4434c9_combine(var16,var26);
+decref((var16), dtor_Location_500c4434c9);
+var16 = var27;
+var27 = NULL;
+if (oomph_true) goto label23;
+label25: (void)0;
+retval = var16; var16 = NULL;
+goto out;
+label28: (void)0;
+out: (void)0;
+decref((var27), dtor_Location_500c4434c9);
+decref((var26), dtor_Location_500c4434c9);
+decref_Type_e6cf7dd4e5(var24);
+(void)0;
+decref((var21), dtor_List_Type__b06c7a2bb6);
+(void)0;
+decref((var19), dtor_List_Type__b06c7a2bb6);
+(void)0;
+decref((var17), dtor_List_Type__b06c7a2bb6);
+decref((var16), dtor_Location_500c4434c9);
+decref_Type_e6cf7dd4e5(var15);
+decref((var14), dtor_List_Type__b06c7a2bb6);
+decref((var13), dtor_UnionType_0c977b4168);
+decref((var12), dtor_Location_500c4434c9);
+decref((var11), dtor_NamedType_0d620e38a7);
+decref((var10), dtor_Location_500c4434c9);
+decref((var9), dtor_GenericType_f44d8197cb);
+decref((var8), dtor_Location_500c4434c9);
+decref((var7), dtor_AutoType_39f5d793d6);
+(void)0;
+return retval;
+}struct class_Location_500c4434c9* ast_91af7cbb25_locate_loop_header(struct class_LoopHeader_23fd592271 var1){bool var2;
+struct class_ForLoopHeader_79606b2adb* var5;
+var5 = NULL;
+struct class_Location_500c4434c9* var6;
+var6 = NULL;
+struct class_ForeachLoopHeader_ebcb7f3325* var7;
+var7 = NULL;
+struct class_Location_500c4434c9* var8;
+var8 = NULL;
+struct class_Location_500c4434c9* retval;
+
+            var2 = (
+                var1.membernum == 0
+            );
+            if (var2) goto label3;
+
+            var2 = (
+                var1.membernum == 1
+            );
+            if (var2) goto label4;
+label3: (void)0;
+
+            if (var1.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var5 = var1.val.item0;
+            incref(var5);
+var6 = var5->memb_keyword_location;
+incref(var6);
+retval = var6; var6 = NULL;
+goto out;
+label4: (void)0;
+
+            if (var1.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var7 = var1.val.item1;
+            incref(var7);
+var8 = var7->memb_keyword_location;
+incref(var8);
+retval = var8; var8 = NULL;
+goto out;
+label9: (void)0;
+out: (void)0;
+decref((var8), dtor_Location_500c4434c9);
+decref((var7), dtor_ForeachLoopHeader_ebcb7f3325);
+decref((var6), dtor_Location_500c4434c9);
+decref((var5), dtor_ForLoopHeader_79606b2adb);
+(void)0;
+return retval;
+}struct class_Location_500c4434c9* ast_91af7cbb25_locate_expression(struct class_Expression_35f2052bf4 var1){bool var2;
+struct class_As_a05f1f16b6* var17;
+var17 = NULL;
+struct class_Expression_35f2052bf4 var18;
+var18.membernum = -1;
+struct class_Location_500c4434c9* var19;
+var19 = NULL;
+struct class_Type_e6cf7dd4e5 var20;
+var20.membernum = -1;
+struct class_Location_500c4434c9* var21;
+var21 = NULL;
+struct class_Location_500c4434c9* var22;
+var22 = NULL;
+struct class_BinaryOperator_e25f87d1b5* var23;
+var23 = NULL;
+struct class_Expression_35f2052bf4 var24;
+var24.membernum = -1;
+struct class_Location_500c4434c9* var25;
+var25 = NULL;
+struct class_Expression_35f2052bf4 var26;
+var26.membernum = -1;
+struct class_Location_500c4434c9* var27;
+var27 = NULL;
+struct class_Location_500c4434c9* var28;
+var28 = NULL;
+struct class_Call_d0fb9d6234* var29;
+var29 = NULL;
+struct class_Expression_35f2052bf4 var30;
+var30.membernum = -1;
+struct class_Location_500c4434c9* var31;
+var31 = NULL;
+struct class_Location_500c4434c9* var32;
+var32 = NULL;
+struct class_Location_500c4434c9* var33;
+var33 = NULL;
+struct class_Constructor_0c896e4031* var34;
+var34 = NULL;
+struct class_Location_500c4434c9* var35;
+var35 = NULL;
+struct class_FloatConstant_4759845694* var36;
+var36 = NULL;
+struct class_Location_500c4434c9* var37;
+var37 = NULL;
+struct class_GetAttribute_0758070446* var38;
+var38 = NULL;
+struct class_Expression_35f2052bf4 var39;
+var39.membernum = -1;
+struct class_Location_500c4434c9* var40;
+var40 = NULL;
+struct class_Location_500c4434c9* var41;
+var41 = NULL;
+struct class_Location_500c4434c9* var42;
+var42 = NULL;
+struct class_GetVar_642f116a6c* var43;
+var43 = NULL;
+struct class_Location_500c4434c9* var44;
+var44 = NULL;
+struct class_IntConstant_4cbc4c5420* var45;
+var45 = NULL;
+struct class_Location_500c4434c9* var46;
+var46 = NULL;
+struct class_ListComprehension_10c913d2dd* var47;
+var47 = NULL;
+struct class_LoopHeader_23fd592271 var48;
+var48.membernum = -1;
+struct class_Location_500c4434c9* var49;
+var49 = NULL;
+struct class_ListLiteral_66e426dc17* var50;
+var50 = NULL;
+struct class_Location_500c4434c9* var51;
+var51 = NULL;
+struct class_StatementsAndExpression_964cbccc5e* var52;
+var52 = NULL;
+struct class_Expression_35f2052bf4 var53;
+var53.membernum = -1;
+struct class_Location_500c4434c9* var54;
+var54 = NULL;
+struct class_StringConstant_c2b1c10b4f* var55;
+var55 = NULL;
+struct class_Location_500c4434c9* var56;
+var56 = NULL;
+struct class_StringFormatJoin_bc28806767* var57;
+var57 = NULL;
+struct class_Location_500c4434c9* var58;
+var58 = NULL;
+struct class_UnaryOperator_348525ebbe* var59;
+var59 = NULL;
+struct class_Location_500c4434c9* var60;
+var60 = NULL;
+struct class_Location_500c4434c9* retval;
+
+            var2 = (
+                var1.membernum == 0
+            );
+            if (var2) goto label3;
+
+            var2 = (
+                var1.membernum == 1
+            );
+            if (var2) goto label4;
+
+            var2 = (
+                var1.membernum == 2
+            );
+            if (var2) goto label5;
+
+            var2 = (
+                var1.membernum == 3
+            );
+            if (var2) goto label6;
+
+            var2 = (
+                var1.membernum == 4
+            );
+            if (var2) goto label7;
+
+            var2 = (
+                var1.membernum == 5
+            );
+            if (var2) goto label8;
+
+            var2 = (
+                var1.membernum == 6
+            );
+            if (var2) goto label9;
+
+            var2 = (
+                var1.membernum == 7
+            );
+            if (var2) goto label10;
+
+            var2 = (
+                var1.membernum == 8
+            );
+            if (var2) goto label11;
+
+            var2 = (
+                var1.membernum == 9
+            );
+            if (var2) goto label12;
+
+            var2 = (
+                var1.membernum == 10
+            );
+            if (var2) goto label13;
+
+            var2 = (
+                var1.membernum == 11
+            );
+            if (var2) goto label14;
+
+            var2 = (
+                var1.membernum == 12
+            );
+            if (var2) goto label15;
+
+            var2 = (
+                var1.membernum == 13
+            );
+            if (var2) goto label16;
+label3: (void)0;
+
+            if (var1.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var17 = var1.val.item0;
+            incref(var17);
+var18 = var17->memb_expr;
+incref_Expression_35f2052bf4(var18);
+var19 = ast_91af7cbb25_locate_expression(var18);
+var20 = var17->memb_type;
+incref_Type_e6cf7dd4e5(var20);
+var21 = ast_91af7cbb25_locate_type(var20);
+var22 = meth_Location_500c4434c9_combine(var19,var21);
+retval = var22; var22 = NULL;
+goto out;
+label4: (void)0;
+
+            if (var1.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var23 = var1.val.item1;
+            incref(var23);
+var24 = var23->memb_lhs;
+incref_Expression_35f2052bf4(var24);
+var25 = ast_91af7cbb25_locate_expression(var24);
+var26 = var23->memb_rhs;
+incref_Expression_35f2052bf4(var26);
+var27 = ast_91af7cbb25_locate_expression(var26);
+var28 = meth_Location_500c4434c9_combine(var25,var27);
+retval = var28; var28 = NULL;
+goto out;
+label5: (void)0;
+
+            if (var1.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var29 = var1.val.item2;
+            incref(var29);
+var30 = var29->memb_function;
+incref_Expression_35f2052bf4(var30);
+var31 = ast_91af7cbb25_locate_expression(var30);
+var32 = var29->memb_location;
+incref(var32);
+var33 = meth_Location_500c4434c9_combine(var31,var32);
+retval = var33; var33 = NULL;
+goto out;
+label6: (void)0;
+
+            if (var1.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var34 = var1.val.item3;
+            incref(var34);
+var35 = var34->memb_location;
+incref(var35);
+retval = var35; var35 = NULL;
+goto out;
+label7: (void)0;
+
+            if (var1.membernum != 4)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var36 = var1.val.item4;
+            incref(var36);
+var37 = var36->memb_location;
+incref(var37);
+retval = var37; var37 = NULL;
+goto out;
+label8: (void)0;
+
+            if (var1.membernum != 5)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var38 = var1.val.item5;
+            incref(var38);
+var39 = var38->memb_obj;
+incref_Expression_35f2052bf4(var39);
+var40 = ast_91af7cbb25_locate_expression(var39);
+var41 = var38->memb_attribute_location;
+incref(var41);
+var42 = meth_Location_500c4434c9_combine(var40,var41);
+retval = var42; var42 = NULL;
+goto out;
+label9: (void)0;
+
+            if (var1.membernum != 6)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var43 = var1.val.item6;
+            incref(var43);
+var44 = var43->memb_location;
+incref(var44);
+retval = var44; var44 = NULL;
+goto out;
+label10: (void)0;
+
+            if (var1.membernum != 7)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var45 = var1.val.item7;
+            incref(var45);
+var46 = var45->memb_location;
+incref(var46);
+retval = var46; var46 = NULL;
+goto out;
+label11: (void)0;
+
+            if (var1.membernum != 8)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var47 = var1.val.item8;
+            incref(var47);
+var48 = var47->memb_loop_header;
+incref_LoopHeader_23fd592271(var48);
+var49 = ast_91af7cbb25_locate_loop_header(var48);
+retval = var49; var49 = NULL;
+goto out;
+label12: (void)0;
+
+            if (var1.membernum != 9)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var50 = var1.val.item9;
+            incref(var50);
+var51 = var50->memb_location;
+incref(var51);
+retval = var51; var51 = NULL;
+goto out;
+label13: (void)0;
+
+            if (var1.membernum != 10)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var52 = var1.val.item10;
+            incref(var52);
+var53 = var52->memb_expression;
+incref_Expression_35f2052bf4(var53);
+var54 = ast_91af7cbb25_locate_expression(var53);
+retval = var54; var54 = NULL;
+goto out;
+label14: (void)0;
+
+            if (var1.membernum != 11)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var55 = var1.val.item11;
+            incref(var55);
+var56 = var55->memb_location;
+incref(var56);
+retval = var56; var56 = NULL;
+goto out;
+label15: (void)0;
+
+            if (var1.membernum != 12)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var57 = var1.val.item12;
+            incref(var57);
+var58 = var57->memb_location;
+incref(var58);
+retval = var58; var58 = NULL;
+goto out;
+label16: (void)0;
+
+            if (var1.membernum != 13)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var59 = var1.val.item13;
+            incref(var59);
+var60 = var59->memb_location;
+incref(var60);
+retval = var60; var60 = NULL;
+goto out;
+label61: (void)0;
+out: (void)0;
+decref((var60), dtor_Location_500c4434c9);
+decref((var59), dtor_UnaryOperator_348525ebbe);
+decref((var58), dtor_Location_500c4434c9);
+decref((var57), dtor_StringFormatJoin_bc28806767);
+decref((var56), dtor_Location_500c4434c9);
+decref((var55), dtor_StringConstant_c2b1c10b4f);
+decref((var54), dtor_Location_500c4434c9);
+decref_Expression_35f2052bf4(var53);
+decref((var52), dtor_StatementsAndExpression_964cbccc5e);
+decref((var51), dtor_Location_500c4434c9);
+decref((var50), dtor_ListLiteral_66e426dc17);
+decref((var49), dtor_Location_500c4434c9);
+decref_LoopHeader_23fd592271(var48);
+decref((var47), dtor_ListComprehension_10c913d2dd);
+decref((var46), dtor_Location_500c4434c9);
+decref((var45), dtor_IntConstant_4cbc4c5420);
+decref((var44), dtor_Location_500c4434c9);
+decref((var43), dtor_GetVar_642f116a6c);
+decref((var42), dtor_Location_500c4434c9);
+decref((var41), dtor_Location_500c4434c9);
+decref((var40), dtor_Location_500c4434c9);
+decref_Expression_35f2052bf4(var39);
+decref((var38), dtor_GetAttribute_0758070446);
+decref((var37), dtor_Location_500c4434c9);
+decref((var36), dtor_FloatConstant_4759845694);
+decref((var35), dtor_Location_500c4434c9);
+decref((var34), dtor_Constructor_0c896e4031);
+decref((var33), dtor_Location_500c4434c9);
+decref((var32), dtor_Location_500c4434c9);
+decref((var31), dtor_Location_500c4434c9);
+decref_Expression_35f2052bf4(var30);
+decref((var29), dtor_Call_d0fb9d6234);
+decref((var28), dtor_Location_500c4434c9);
+decref((var27), dtor_Location_500c4434c9);
+decref_Expression_35f2052bf4(var26);
+decref((var25), dtor_Location_500c4434c9);
+decref_Expression_35f2052bf4(var24);
+decref((var23), dtor_BinaryOperator_e25f87d1b5);
+decref((var22), dtor_Location_500c4434c9);
+decref((var21), dtor_Location_500c4434c9);
+decref_Type_e6cf7dd4e5(var20);
+decref((var19), dtor_Location_500c4434c9);
+decref_Expression_35f2052bf4(var18);
+decref((var17), dtor_As_a05f1f16b6);
+(void)0;
+return retval;
+}
@@ -0,0 +1,74 @@
+
+                #ifndef HEADER_GUARD_ast_91af7cbb25
+                #define HEADER_GUARD_ast_91af7cbb25
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "LoopHeader_23fd592271.h"
+#include "Type_e6cf7dd4e5.h"
+struct class_AutoType_39f5d793d6;
+struct class_Location_500c4434c9;
+struct class_GenericType_f44d8197cb;
+struct class_Location_500c4434c9;
+struct class_NamedType_0d620e38a7;
+struct class_Location_500c4434c9;
+struct class_UnionType_0c977b4168;
+struct class_List_Type__b06c7a2bb6;
+struct class_Location_500c4434c9;
+struct class_List_Type__b06c7a2bb6;
+struct class_List_Type__b06c7a2bb6;
+struct class_List_Type__b06c7a2bb6;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_ForLoopHeader_79606b2adb;
+struct class_Location_500c4434c9;
+struct class_ForeachLoopHeader_ebcb7f3325;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_As_a05f1f16b6;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_BinaryOperator_e25f87d1b5;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Call_d0fb9d6234;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Constructor_0c896e4031;
+struct class_Location_500c4434c9;
+struct class_FloatConstant_4759845694;
+struct class_Location_500c4434c9;
+struct class_GetAttribute_0758070446;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_GetVar_642f116a6c;
+struct class_Location_500c4434c9;
+struct class_IntConstant_4cbc4c5420;
+struct class_Location_500c4434c9;
+struct class_ListComprehension_10c913d2dd;
+struct class_Location_500c4434c9;
+struct class_ListLiteral_66e426dc17;
+struct class_Location_500c4434c9;
+struct class_StatementsAndExpression_964cbccc5e;
+struct class_Location_500c4434c9;
+struct class_StringConstant_c2b1c10b4f;
+struct class_Location_500c4434c9;
+struct class_StringFormatJoin_bc28806767;
+struct class_Location_500c4434c9;
+struct class_UnaryOperator_348525ebbe;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9* ast_91af7cbb25_locate_type(struct class_Type_e6cf7dd4e5 var1);
+struct class_Location_500c4434c9* ast_91af7cbb25_locate_loop_header(struct class_LoopHeader_23fd592271 var1);
+struct class_Location_500c4434c9* ast_91af7cbb25_locate_expression(struct class_Expression_35f2052bf4 var1);
+
+                #endif
+                
@@ -0,0 +1,204 @@
+#include <lib/oomph.h>
+#include "c_output_6a23cf54cc.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+#include "bundle_hash_1d0f330ece.h"
+
+            static struct StringBuf string0____void_0___30f2361213_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x20', '\x28', '\x76', '\x6f', '\x69', '\x64', '\x29', '\x30', '\x3b', '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string0____void_0___30f2361213 = {
+                .buf = &string0____void_0___30f2361213_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1__3fb0691b91_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string1__3fb0691b91 = {
+                .buf = &string1__3fb0691b91_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_0123456789_4f97d38ad7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62', '\x63', '\x64', '\x65', '\x66', '\x67', '\x68', '\x69', '\x6a', '\x6b', '\x6c', '\x6d', '\x6e', '\x6f', '\x70', '\x71', '\x72', '\x73', '\x74', '\x75', '\x76', '\x77', '\x78', '\x79', '\x7a', '\x41', '\x42', '\x43', '\x44', '\x45', '\x46', '\x47', '\x48', '\x49', '\x4a', '\x4b', '\x4c', '\x4d', '\x4e', '\x4f', '\x50', '\x51', '\x52', '\x53', '\x54', '\x55', '\x56', '\x57', '\x58', '\x59', '\x5a', '\x5f', '\x30', '\x31', '\x32', '\x33', '\x34', '\x35', '\x36', '\x37', '\x38', '\x39' },
+                .malloced = false,
+            };
+            static struct class_Str string2_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_0123456789_4f97d38ad7 = {
+                .buf = &string2_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_0123456789_4f97d38ad7_buf,
+                .nbytes = 63,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3___5943a65dc1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string3___5943a65dc1 = {
+                .buf = &string3___5943a65dc1_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            struct class_Str c_output_6a23cf54cc_emit_label(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str retval;
+var2 = string0____void_0___30f2361213; string_incref(var2);
+var3 = oomph_string_concat(var1,var2);
+retval = var3; var3.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var3);
+string_decref(var2);
+return retval;
+}struct class_Str c_output_6a23cf54cc_create_id(struct class_Str var1, struct class_Str var2){struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_List_Str__43b70c06cb* var5;
+var5 = NULL;
+int64_t var6;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+bool var11;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_List_Str__43b70c06cb* var21;
+var21 = NULL;
+int64_t var22;
+int64_t var23;
+struct class_List_Str__43b70c06cb* var24;
+var24 = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+struct class_Str retval;
+var3 = string1__3fb0691b91; string_incref(var3);
+var4 = string1__3fb0691b91; string_incref(var4);
+var5 = meth_Str_split(var1,var4);
+var6 = 0LL;
+label7: (void)0;
+if (var6 >= var5->len) goto label9;
+var8 = var5->data[var6++];
+string_decref(var10);
+var10.buf = NULL;
+var10 = string2_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_0123456789_4f97d38ad7; string_incref(var10);
+var11 = meth_Str___contains(var10,var8);
+if (var11) goto label12;
+string_decref(var13);
+var13.buf = NULL;
+var13 = string3___5943a65dc1; string_incref(var13);
+var14 = oomph_string_concat(var3,var13);
+string_decref(var3);
+var3 = var14;
+var14.buf = NULL;
+if (oomph_true) goto label15;
+label12: (void)0;
+var16 = oomph_string_concat(var3,var8);
+string_decref(var3);
+var3 = var16;
+var16.buf = NULL;
+label15: (void)0;
+if (oomph_true) goto label7;
+label9: (void)0;
+var17 = string3___5943a65dc1; string_incref(var17);
+var18 = oomph_string_concat(var3,var17);
+var19 = bundle_hash_1d0f330ece_md5(var2);
+var20 = string1__3fb0691b91; string_incref(var20);
+var21 = meth_Str_split(var19,var20);
+var22 = 0LL;
+var23 = 10LL;
+var24 = meth_List_Str__43b70c06cb_slice(var21,var22,var23);
+var25 = string1__3fb0691b91; string_incref(var25);
+var26 = meth_List_Str__43b70c06cb_join(var24,var25);
+var27 = oomph_string_concat(var18,var26);
+retval = var27; var27.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var27);
+string_decref(var26);
+string_decref(var25);
+decref((var24), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref((var21), dtor_List_Str__43b70c06cb);
+string_decref(var20);
+string_decref(var19);
+string_decref(var18);
+string_decref(var17);
+string_decref(var16);
+string_decref(var14);
+string_decref(var13);
+(void)0;
+string_decref(var10);
+(void)0;
+decref((var5), dtor_List_Str__43b70c06cb);
+string_decref(var4);
+string_decref(var3);
+return retval;
+}struct class_Str c_output_6a23cf54cc_trim_leading_underscores(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+bool var5;
+bool var6;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str retval;
+var2 = var1;
+string_incref(var2);
+label3: (void)0;
+string_decref(var4);
+var4.buf = NULL;
+var4 = string3___5943a65dc1; string_incref(var4);
+var5 = meth_Str_starts_with(var2,var4);
+var6 = oomph_bool_not(var5);
+if (var6) goto label7;
+string_decref(var8);
+var8.buf = NULL;
+var8 = string3___5943a65dc1; string_incref(var8);
+var9 = meth_Str_remove_prefix(var2,var8);
+string_decref(var2);
+var2 = var9;
+var9.buf = NULL;
+if (oomph_true) goto label3;
+label7: (void)0;
+retval = var2; var2.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var9);
+string_decref(var8);
+(void)0;
+(void)0;
+string_decref(var4);
+string_decref(var2);
+return retval;
+}
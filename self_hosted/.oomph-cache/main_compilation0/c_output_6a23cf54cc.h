@@ -0,0 +1,15 @@
+
+                #ifndef HEADER_GUARD_c_output_6a23cf54cc
+                #define HEADER_GUARD_c_output_6a23cf54cc
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_hash_1d0f330ece.h"
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_Str c_output_6a23cf54cc_emit_label(struct class_Str var1);
+struct class_Str c_output_6a23cf54cc_create_id(struct class_Str var1, struct class_Str var2);
+struct class_Str c_output_6a23cf54cc_trim_leading_underscores(struct class_Str var1);
+
+                #endif
+                
@@ -0,0 +1,4 @@
+#include <lib/oomph.h>
+#include "error_97ed4bb3d5.h"
+#include "bundle_builtins_c399a735f1.h"
+
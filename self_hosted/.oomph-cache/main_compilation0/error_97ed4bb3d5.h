@@ -0,0 +1,8 @@
+
+                #ifndef HEADER_GUARD_error_97ed4bb3d5
+                #define HEADER_GUARD_error_97ed4bb3d5
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+                #endif
+                
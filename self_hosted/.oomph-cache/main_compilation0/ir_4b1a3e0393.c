@@ -0,0 +1,4511 @@
+#include <lib/oomph.h>
+#include "ir_4b1a3e0393.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "AutoType_33a5d572cb.h"
+#include "BasicType_899b9c9f8e.h"
+#include "BuiltinVariable_f6e0cdd1b6.h"
+#include "Builtins_bd980a9f08.h"
+#include "FileVariable_a7b8ca651f.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "GenericSource_35cfcd932e.h"
+#include "Generic_c39b95ec73.h"
+#include "List_BasicType__d02960f5a1.h"
+#include "List_BuiltinVariable__27288a8fae.h"
+#include "List_Member__7525bf27e3.h"
+#include "List_Method__1e0ab9c757.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Type__057f9c6088.h"
+#include "LocalVariable_846080e5ae.h"
+#include "Location_500c4434c9.h"
+#include "Member_a3dd2b1b39.h"
+#include "Method_bfbd73ad15.h"
+#include "Type_87e1ce5c5e.h"
+#include "UnionType_7f899bced1.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_null___GenericSource__4440b6073d.h"
+#include "_null___List_Type___114a421a91.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "_null___Type__8438ac3dcf.h"
+
+            static struct StringBuf string0_repeated_union_member___90b880ae10_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x70', '\x65', '\x61', '\x74', '\x65', '\x64', '\x20', '\x75', '\x6e', '\x69', '\x6f', '\x6e', '\x20', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x20', '\x27' },
+                .malloced = false,
+            };
+            static struct class_Str string0_repeated_union_member___90b880ae10 = {
+                .buf = &string0_repeated_union_member___90b880ae10_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1___ea8406a754_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27' },
+                .malloced = false,
+            };
+            static struct class_Str string1___ea8406a754 = {
+                .buf = &string1___ea8406a754_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_self_hosted_ir_oomph_cc2414ff62_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x69', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string2_self_hosted_ir_oomph_cc2414ff62 = {
+                .buf = &string2_self_hosted_ir_oomph_cc2414ff62_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_auto_a469f3dd41_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x75', '\x74', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string3_auto_a469f3dd41 = {
+                .buf = &string3_auto_a469f3dd41_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4__function_type__dba178671b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3c', '\x66', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x20', '\x74', '\x79', '\x70', '\x65', '\x3e' },
+                .malloced = false,
+            };
+            static struct class_Str string4__function_type__dba178671b = {
+                .buf = &string4__function_type__dba178671b_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5___636e046e1d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28' },
+                .malloced = false,
+            };
+            static struct class_Str string5___636e046e1d = {
+                .buf = &string5___636e046e1d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6_____ffce99c85c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x7c', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string6_____ffce99c85c = {
+                .buf = &string6_____ffce99c85c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7___20a8e6168a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string7___20a8e6168a = {
+                .buf = &string7___20a8e6168a_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string8___3b8387c3f0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7c' },
+                .malloced = false,
+            };
+            static struct class_Str string8___3b8387c3f0 = {
+                .buf = &string8___3b8387c3f0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string9_Bool_acbf1f6d10_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x6f', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string9_Bool_acbf1f6d10 = {
+                .buf = &string9_Bool_acbf1f6d10_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string10_Float_55d3a95f58_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6c', '\x6f', '\x61', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string10_Float_55d3a95f58 = {
+                .buf = &string10_Float_55d3a95f58_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string11_Int_5038c54e80_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string11_Int_5038c54e80 = {
+                .buf = &string11_Int_5038c54e80_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string12_null_aa5fdd6b0a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x75', '\x6c', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string12_null_aa5fdd6b0a = {
+                .buf = &string12_null_aa5fdd6b0a_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string13_Str_20e4558410_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x74', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string13_Str_20e4558410 = {
+                .buf = &string13_Str_20e4558410_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string14_List_0158030c4b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x69', '\x73', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string14_List_0158030c4b = {
+                .buf = &string14_List_0158030c4b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string15_bool_eq_f3ca56a82f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x6f', '\x6f', '\x6c', '\x5f', '\x65', '\x71' },
+                .malloced = false,
+            };
+            static struct class_Str string15_bool_eq_f3ca56a82f = {
+                .buf = &string15_bool_eq_f3ca56a82f_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string16_bool_not_0ab0afb19e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x6f', '\x6f', '\x6c', '\x5f', '\x6e', '\x6f', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string16_bool_not_0ab0afb19e = {
+                .buf = &string16_bool_not_0ab0afb19e_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string17_float_add_f2b48acb0e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x61', '\x64', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string17_float_add_f2b48acb0e = {
+                .buf = &string17_float_add_f2b48acb0e_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string18_float_div_b672f0f5f3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x64', '\x69', '\x76' },
+                .malloced = false,
+            };
+            static struct class_Str string18_float_div_b672f0f5f3 = {
+                .buf = &string18_float_div_b672f0f5f3_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string19_float_eq_4b557ebd3b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x65', '\x71' },
+                .malloced = false,
+            };
+            static struct class_Str string19_float_eq_4b557ebd3b = {
+                .buf = &string19_float_eq_4b557ebd3b_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string20_float_gt_a968637788_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x67', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string20_float_gt_a968637788 = {
+                .buf = &string20_float_gt_a968637788_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string21_float_mod_c3094f1920_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x6d', '\x6f', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string21_float_mod_c3094f1920 = {
+                .buf = &string21_float_mod_c3094f1920_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string22_float_mul_f4198b04ce_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x6d', '\x75', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string22_float_mul_f4198b04ce = {
+                .buf = &string22_float_mul_f4198b04ce_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string23_float_neg_cd6ba905c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x6e', '\x65', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string23_float_neg_cd6ba905c0 = {
+                .buf = &string23_float_neg_cd6ba905c0_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string24_float_sub_18c5b015e8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x73', '\x75', '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string24_float_sub_18c5b015e8 = {
+                .buf = &string24_float_sub_18c5b015e8_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string25_int2float_1dcccb8517_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x32', '\x66', '\x6c', '\x6f', '\x61', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string25_int2float_1dcccb8517 = {
+                .buf = &string25_int2float_1dcccb8517_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string26_int_add_8de62f669a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x61', '\x64', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string26_int_add_8de62f669a = {
+                .buf = &string26_int_add_8de62f669a_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string27_int_eq_72ff05e4e8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x65', '\x71' },
+                .malloced = false,
+            };
+            static struct class_Str string27_int_eq_72ff05e4e8 = {
+                .buf = &string27_int_eq_72ff05e4e8_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string28_int_gt_6af61ee36a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x67', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string28_int_gt_6af61ee36a = {
+                .buf = &string28_int_gt_6af61ee36a_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string29_int_mod_80f233a6b5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x6d', '\x6f', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string29_int_mod_80f233a6b5 = {
+                .buf = &string29_int_mod_80f233a6b5_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string30_int_mul_7001dbacd9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x6d', '\x75', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string30_int_mul_7001dbacd9 = {
+                .buf = &string30_int_mul_7001dbacd9_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string31_int_neg_c50305453f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x6e', '\x65', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string31_int_neg_c50305453f = {
+                .buf = &string31_int_neg_c50305453f_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string32_int_sub_1f22107be0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x73', '\x75', '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string32_int_sub_1f22107be0 = {
+                .buf = &string32_int_sub_1f22107be0_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string33_string_concat_2f0423f2b2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x63', '\x6f', '\x6e', '\x63', '\x61', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string33_string_concat_2f0423f2b2 = {
+                .buf = &string33_string_concat_2f0423f2b2_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string34_string_eq_bddc122938_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x65', '\x71' },
+                .malloced = false,
+            };
+            static struct class_Str string34_string_eq_bddc122938 = {
+                .buf = &string34_string_eq_bddc122938_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string35___argv_count_47de45ce18_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x61', '\x72', '\x67', '\x76', '\x5f', '\x63', '\x6f', '\x75', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string35___argv_count_47de45ce18 = {
+                .buf = &string35___argv_count_47de45ce18_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string36___argv_get_b1144bfd80_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x61', '\x72', '\x67', '\x76', '\x5f', '\x67', '\x65', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string36___argv_get_b1144bfd80 = {
+                .buf = &string36___argv_get_b1144bfd80_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string37___get_first_char_9b22e105de_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x67', '\x65', '\x74', '\x5f', '\x66', '\x69', '\x72', '\x73', '\x74', '\x5f', '\x63', '\x68', '\x61', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string37___get_first_char_9b22e105de = {
+                .buf = &string37___get_first_char_9b22e105de_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string38___get_utf8_byte_1c89d88bf6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x67', '\x65', '\x74', '\x5f', '\x75', '\x74', '\x66', '\x38', '\x5f', '\x62', '\x79', '\x74', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string38___get_utf8_byte_1c89d88bf6 = {
+                .buf = &string38___get_utf8_byte_1c89d88bf6_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string39___hash_48b11e2146_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x68', '\x61', '\x73', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string39___hash_48b11e2146 = {
+                .buf = &string39___hash_48b11e2146_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string40___io_mkdir_d5bc8c82b6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x69', '\x6f', '\x5f', '\x6d', '\x6b', '\x64', '\x69', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string40___io_mkdir_d5bc8c82b6 = {
+                .buf = &string40___io_mkdir_d5bc8c82b6_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string41___io_read_file_1011907c81_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x69', '\x6f', '\x5f', '\x72', '\x65', '\x61', '\x64', '\x5f', '\x66', '\x69', '\x6c', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string41___io_read_file_1011907c81 = {
+                .buf = &string41___io_read_file_1011907c81_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string42___io_write_file_ba52f693db_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x69', '\x6f', '\x5f', '\x77', '\x72', '\x69', '\x74', '\x65', '\x5f', '\x66', '\x69', '\x6c', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string42___io_write_file_ba52f693db = {
+                .buf = &string42___io_write_file_ba52f693db_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string43___remove_prefix_e6b351428c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x72', '\x65', '\x6d', '\x6f', '\x76', '\x65', '\x5f', '\x70', '\x72', '\x65', '\x66', '\x69', '\x78' },
+                .malloced = false,
+            };
+            static struct class_Str string43___remove_prefix_e6b351428c = {
+                .buf = &string43___remove_prefix_e6b351428c_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string44___remove_suffix_92f8025a60_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x72', '\x65', '\x6d', '\x6f', '\x76', '\x65', '\x5f', '\x73', '\x75', '\x66', '\x66', '\x69', '\x78' },
+                .malloced = false,
+            };
+            static struct class_Str string44___remove_suffix_92f8025a60 = {
+                .buf = &string44___remove_suffix_92f8025a60_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string45___run_subprocess_a2e002945a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x72', '\x75', '\x6e', '\x5f', '\x73', '\x75', '\x62', '\x70', '\x72', '\x6f', '\x63', '\x65', '\x73', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string45___run_subprocess_a2e002945a = {
+                .buf = &string45___run_subprocess_a2e002945a_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string46___slice_until_substring_a840ec4846_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x73', '\x6c', '\x69', '\x63', '\x65', '\x5f', '\x75', '\x6e', '\x74', '\x69', '\x6c', '\x5f', '\x73', '\x75', '\x62', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string46___slice_until_substring_a840ec4846 = {
+                .buf = &string46___slice_until_substring_a840ec4846_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string47___utf8_len_5e5e780503_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x75', '\x74', '\x66', '\x38', '\x5f', '\x6c', '\x65', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string47___utf8_len_5e5e780503 = {
+                .buf = &string47___utf8_len_5e5e780503_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string48_assert_800309a970_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x73', '\x73', '\x65', '\x72', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string48_assert_800309a970 = {
+                .buf = &string48_assert_800309a970_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string49_false_7d64c96b4e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string49_false_7d64c96b4e = {
+                .buf = &string49_false_7d64c96b4e_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string50_print_b674acfe88_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x72', '\x69', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string50_print_b674acfe88 = {
+                .buf = &string50_print_b674acfe88_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string51_true_d9943797fa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string51_true_d9943797fa = {
+                .buf = &string51_true_d9943797fa_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string52_ceil_14eb2d9b52_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x65', '\x69', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string52_ceil_14eb2d9b52 = {
+                .buf = &string52_ceil_14eb2d9b52_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string53_equals_3cdacaa0de_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x71', '\x75', '\x61', '\x6c', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string53_equals_3cdacaa0de = {
+                .buf = &string53_equals_3cdacaa0de_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string54_floor_4b9e75023f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x6f', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string54_floor_4b9e75023f = {
+                .buf = &string54_floor_4b9e75023f_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string55_round_909be8906b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x6f', '\x75', '\x6e', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string55_round_909be8906b = {
+                .buf = &string55_round_909be8906b_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string56_to_string_2072f858fb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string56_to_string_2072f858fb = {
+                .buf = &string56_to_string_2072f858fb_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string57_truncate_7397b4c57d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x6e', '\x63', '\x61', '\x74', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string57_truncate_7397b4c57d = {
+                .buf = &string57_truncate_7397b4c57d_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string58___contains_5cbfa333fa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x63', '\x6f', '\x6e', '\x74', '\x61', '\x69', '\x6e', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string58___contains_5cbfa333fa = {
+                .buf = &string58___contains_5cbfa333fa_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string59_center_pad_085e2097d2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x65', '\x6e', '\x74', '\x65', '\x72', '\x5f', '\x70', '\x61', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string59_center_pad_085e2097d2 = {
+                .buf = &string59_center_pad_085e2097d2_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string60_count_1b74a44a8f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x6f', '\x75', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string60_count_1b74a44a8f = {
+                .buf = &string60_count_1b74a44a8f_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string61_ends_with_f8ce01c236_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x6e', '\x64', '\x73', '\x5f', '\x77', '\x69', '\x74', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string61_ends_with_f8ce01c236 = {
+                .buf = &string61_ends_with_f8ce01c236_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string62_get_utf8_499e039cac_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x67', '\x65', '\x74', '\x5f', '\x75', '\x74', '\x66', '\x38' },
+                .malloced = false,
+            };
+            static struct class_Str string62_get_utf8_499e039cac = {
+                .buf = &string62_get_utf8_499e039cac_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string63_left_pad_eaa934aa4e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x65', '\x66', '\x74', '\x5f', '\x70', '\x61', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string63_left_pad_eaa934aa4e = {
+                .buf = &string63_left_pad_eaa934aa4e_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string64_left_trim_d6db1f99c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x65', '\x66', '\x74', '\x5f', '\x74', '\x72', '\x69', '\x6d' },
+                .malloced = false,
+            };
+            static struct class_Str string64_left_trim_d6db1f99c7 = {
+                .buf = &string64_left_trim_d6db1f99c7_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string65_length_e4a90d14d3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x65', '\x6e', '\x67', '\x74', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string65_length_e4a90d14d3 = {
+                .buf = &string65_length_e4a90d14d3_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string66_remove_prefix_4ff6a671da_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x6d', '\x6f', '\x76', '\x65', '\x5f', '\x70', '\x72', '\x65', '\x66', '\x69', '\x78' },
+                .malloced = false,
+            };
+            static struct class_Str string66_remove_prefix_4ff6a671da = {
+                .buf = &string66_remove_prefix_4ff6a671da_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string67_remove_suffix_dfe859affe_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x6d', '\x6f', '\x76', '\x65', '\x5f', '\x73', '\x75', '\x66', '\x66', '\x69', '\x78' },
+                .malloced = false,
+            };
+            static struct class_Str string67_remove_suffix_dfe859affe = {
+                .buf = &string67_remove_suffix_dfe859affe_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string68_repeat_f64b7ddd32_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x70', '\x65', '\x61', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string68_repeat_f64b7ddd32 = {
+                .buf = &string68_repeat_f64b7ddd32_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string69_replace_b97b01c74d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x70', '\x6c', '\x61', '\x63', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string69_replace_b97b01c74d = {
+                .buf = &string69_replace_b97b01c74d_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string70_right_pad_b63d58a469_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x69', '\x67', '\x68', '\x74', '\x5f', '\x70', '\x61', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string70_right_pad_b63d58a469 = {
+                .buf = &string70_right_pad_b63d58a469_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string71_right_trim_88161a8c73_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x69', '\x67', '\x68', '\x74', '\x5f', '\x74', '\x72', '\x69', '\x6d' },
+                .malloced = false,
+            };
+            static struct class_Str string71_right_trim_88161a8c73 = {
+                .buf = &string71_right_trim_88161a8c73_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string72_split_ebbdffc086_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x70', '\x6c', '\x69', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string72_split_ebbdffc086 = {
+                .buf = &string72_split_ebbdffc086_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string73_starts_with_618203f4e4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x61', '\x72', '\x74', '\x73', '\x5f', '\x77', '\x69', '\x74', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string73_starts_with_618203f4e4 = {
+                .buf = &string73_starts_with_618203f4e4_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string74_to_float_3ec08fb023_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x6f', '\x5f', '\x66', '\x6c', '\x6f', '\x61', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string74_to_float_3ec08fb023 = {
+                .buf = &string74_to_float_3ec08fb023_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string75_to_int_611dcf308a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x6f', '\x5f', '\x69', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string75_to_int_611dcf308a = {
+                .buf = &string75_to_int_611dcf308a_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string76_trim_59b4d02c51_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x69', '\x6d' },
+                .malloced = false,
+            };
+            static struct class_Str string76_trim_59b4d02c51 = {
+                .buf = &string76_trim_59b4d02c51_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string77_get_5c2836eeb7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x67', '\x65', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string77_get_5c2836eeb7 = {
+                .buf = &string77_get_5c2836eeb7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string78_type__a6f8d0e494_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x79', '\x70', '\x65', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string78_type__a6f8d0e494 = {
+                .buf = &string78_type__a6f8d0e494_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string79__has_no_method_named__0fd0c6edde_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x68', '\x61', '\x73', '\x20', '\x6e', '\x6f', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x6f', '\x64', '\x20', '\x6e', '\x61', '\x6d', '\x65', '\x64', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string79__has_no_method_named__0fd0c6edde = {
+                .buf = &string79__has_no_method_named__0fd0c6edde_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string80__has_no_member_named__b72822579b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x68', '\x61', '\x73', '\x20', '\x6e', '\x6f', '\x20', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x20', '\x6e', '\x61', '\x6d', '\x65', '\x64', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string80__has_no_member_named__b72822579b = {
+                .buf = &string80__has_no_member_named__b72822579b_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            struct class_UnionType_7f899bced1* ir_4b1a3e0393_make_union(struct class_Builtins_bd980a9f08* var1, struct class_List_Type__057f9c6088* var2, struct class_Location_500c4434c9* var3){struct class_List_Type__057f9c6088* var4;
+var4 = NULL;
+struct class_List_Type__057f9c6088* var5;
+var5 = NULL;
+struct class_List_Type__057f9c6088* var6;
+var6 = NULL;
+int64_t var7;
+int64_t var9;
+bool var10;
+bool var11;
+struct class_Type_87e1ce5c5e var13;
+var13.membernum = -1;
+int64_t var14;
+struct class_List_Type__057f9c6088* var15;
+var15 = NULL;
+bool var16;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Type_87e1ce5c5e var21;
+var21.membernum = -1;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+int64_t var25;
+int64_t var26;
+struct class_Type_87e1ce5c5e var27;
+var27.membernum = -1;
+bool var28;
+struct class_Type_87e1ce5c5e var31;
+var31.membernum = -1;
+int64_t var32;
+struct class_Type_87e1ce5c5e var33;
+var33.membernum = -1;
+char var34;
+struct class__null___Str__5eca9cec4f var35;
+var35.membernum = -1;
+struct class_UnionType_7f899bced1* var36;
+var36 = NULL;
+struct class_UnionType_7f899bced1* retval;
+var4 = var2;
+incref(var4);
+var5 = meth_List_Type__057f9c6088_reversed(var4);
+var6 = meth_List_Type__057f9c6088_reversed(var5);
+decref((var4), dtor_List_Type__057f9c6088);
+var4 = var6;
+var6 = NULL;
+var7 = 0LL;
+label8: (void)0;
+var9 = meth_List_Type__057f9c6088_length(var4);
+var10 = oomph_int_gt(var9,var7);
+var11 = oomph_bool_not(var10);
+if (var11) goto label12;
+decref_Type_87e1ce5c5e(var13);
+var13.membernum = -1;
+var13 = meth_List_Type__057f9c6088_get(var4,var7);
+var14 = 0LL;
+decref((var15), dtor_List_Type__057f9c6088);
+var15 = NULL;
+var15 = meth_List_Type__057f9c6088_slice(var4,var14,var7);
+var16 = meth_List_Type__057f9c6088___contains(var15,var13);
+if (var16) goto label17;
+if (oomph_true) goto label18;
+label17: (void)0;
+string_decref(var19);
+var19.buf = NULL;
+var19 = string0_repeated_union_member___90b880ae10; string_incref(var19);
+string_decref(var20);
+var20.buf = NULL;
+decref_Type_87e1ce5c5e(var21);
+var21.membernum = -1;
+var21 = meth_List_Type__057f9c6088_get(var4,var7);
+var20 = ir_4b1a3e0393_type_name(var21);
+string_decref(var22);
+var22.buf = NULL;
+var22 = oomph_string_concat(var19,var20);
+string_decref(var23);
+var23.buf = NULL;
+var23 = string1___ea8406a754; string_incref(var23);
+string_decref(var24);
+var24.buf = NULL;
+var24 = oomph_string_concat(var22,var23);
+meth_Location_500c4434c9_error(var3,var24);
+label18: (void)0;
+var25 = 1LL;
+var26 = oomph_int_add(var7,var25);
+var7 = var26;
+if (oomph_true) goto label8;
+label12: (void)0;
+var27 = var1->memb_NULL_TYPE;
+incref_Type_87e1ce5c5e(var27);
+var28 = meth_List_Type__057f9c6088___contains(var4,var27);
+if (var28) goto label29;
+if (oomph_true) goto label30;
+label29: (void)0;
+var31 = var1->memb_NULL_TYPE;
+incref_Type_87e1ce5c5e(var31);
+meth_List_Type__057f9c6088_delete_only(var4,var31);
+var32 = 0LL;
+var33 = var1->memb_NULL_TYPE;
+incref_Type_87e1ce5c5e(var33);
+meth_List_Type__057f9c6088_insert(var4,var32,var33);
+label30: (void)0;
+var34 = oomph_null;
+var35 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var34 }, .membernum = 0 };
+var36 = ctor_UnionType_7f899bced1(var4,var35,var1);
+retval = var36; var36 = NULL;
+goto out;
+out: (void)0;
+decref((var36), dtor_UnionType_7f899bced1);
+decref__null___Str__5eca9cec4f(var35);
+(void)0;
+decref_Type_87e1ce5c5e(var33);
+(void)0;
+decref_Type_87e1ce5c5e(var31);
+(void)0;
+decref_Type_87e1ce5c5e(var27);
+(void)0;
+(void)0;
+string_decref(var24);
+string_decref(var23);
+string_decref(var22);
+decref_Type_87e1ce5c5e(var21);
+string_decref(var20);
+string_decref(var19);
+(void)0;
+decref((var15), dtor_List_Type__057f9c6088);
+(void)0;
+decref_Type_87e1ce5c5e(var13);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var6), dtor_List_Type__057f9c6088);
+decref((var5), dtor_List_Type__057f9c6088);
+decref((var4), dtor_List_Type__057f9c6088);
+return retval;
+}bool ir_4b1a3e0393_is_refcounted(struct class_Type_87e1ce5c5e var1){bool var2;
+struct class_AutoType_33a5d572cb* var7;
+var7 = NULL;
+bool var8;
+struct class_Str var9;
+var9.buf = NULL;
+int64_t var10;
+struct class_BasicType_899b9c9f8e* var12;
+var12 = NULL;
+bool var13;
+struct class_FunctionType_4e16d0ea53* var14;
+var14 = NULL;
+bool var15;
+struct class_UnionType_7f899bced1* var16;
+var16 = NULL;
+bool var17;
+bool retval;
+
+            var2 = (
+                var1.membernum == 0
+            );
+            if (var2) goto label3;
+
+            var2 = (
+                var1.membernum == 1
+            );
+            if (var2) goto label4;
+
+            var2 = (
+                var1.membernum == 2
+            );
+            if (var2) goto label5;
+
+            var2 = (
+                var1.membernum == 3
+            );
+            if (var2) goto label6;
+label3: (void)0;
+
+            if (var1.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var7 = var1.val.item0;
+            incref(var7);
+var8 = oomph_false;
+var9 = string2_self_hosted_ir_oomph_cc2414ff62; string_incref(var9);
+var10 = 81LL;
+oomph_assert(var8,var9,var10);
+if (oomph_true) goto label11;
+label4: (void)0;
+
+            if (var1.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var12 = var1.val.item1;
+            incref(var12);
+var13 = var12->memb_refcounted;
+(void)0; retval = var13; goto out;
+label5: (void)0;
+
+            if (var1.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var14 = var1.val.item2;
+            incref(var14);
+var15 = oomph_false;
+(void)0; retval = var15; goto out;
+label6: (void)0;
+
+            if (var1.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var16 = var1.val.item3;
+            incref(var16);
+var17 = oomph_true;
+(void)0; retval = var17; goto out;
+label11: (void)0;
+out: (void)0;
+(void)0;
+decref((var16), dtor_UnionType_7f899bced1);
+(void)0;
+decref((var14), dtor_FunctionType_4e16d0ea53);
+(void)0;
+decref((var12), dtor_BasicType_899b9c9f8e);
+(void)0;
+string_decref(var9);
+(void)0;
+decref((var7), dtor_AutoType_33a5d572cb);
+(void)0;
+return retval;
+}struct class__null___List_Type___114a421a91 ir_4b1a3e0393_get_constructor_argtypes(struct class_Type_87e1ce5c5e var1){bool var2;
+struct class_AutoType_33a5d572cb* var7;
+var7 = NULL;
+bool var8;
+struct class_Str var9;
+var9.buf = NULL;
+int64_t var10;
+struct class_BasicType_899b9c9f8e* var12;
+var12 = NULL;
+struct class__null___List_Type___114a421a91 var13;
+var13.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var14;
+var14 = NULL;
+char var15;
+struct class__null___List_Type___114a421a91 var16;
+var16.membernum = -1;
+struct class_UnionType_7f899bced1* var17;
+var17 = NULL;
+bool var18;
+struct class_Str var19;
+var19.buf = NULL;
+int64_t var20;
+struct class__null___List_Type___114a421a91 retval;
+
+            var2 = (
+                var1.membernum == 0
+            );
+            if (var2) goto label3;
+
+            var2 = (
+                var1.membernum == 1
+            );
+            if (var2) goto label4;
+
+            var2 = (
+                var1.membernum == 2
+            );
+            if (var2) goto label5;
+
+            var2 = (
+                var1.membernum == 3
+            );
+            if (var2) goto label6;
+label3: (void)0;
+
+            if (var1.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var7 = var1.val.item0;
+            incref(var7);
+var8 = oomph_false;
+var9 = string2_self_hosted_ir_oomph_cc2414ff62; string_incref(var9);
+var10 = 93LL;
+oomph_assert(var8,var9,var10);
+if (oomph_true) goto label11;
+label4: (void)0;
+
+            if (var1.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var12 = var1.val.item1;
+            incref(var12);
+var13 = var12->memb_constructor_argtypes;
+incref__null___List_Type___114a421a91(var13);
+retval = var13; var13.membernum = -1;
+goto out;
+label5: (void)0;
+
+            if (var1.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var14 = var1.val.item2;
+            incref(var14);
+var15 = oomph_null;
+var16 = (struct class__null___List_Type___114a421a91){ .val = { .item0 = var15 }, .membernum = 0 };
+retval = var16; var16.membernum = -1;
+goto out;
+label6: (void)0;
+
+            if (var1.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var17 = var1.val.item3;
+            incref(var17);
+var18 = oomph_false;
+var19 = string2_self_hosted_ir_oomph_cc2414ff62; string_incref(var19);
+var20 = 101LL;
+oomph_assert(var18,var19,var20);
+label11: (void)0;
+out: (void)0;
+(void)0;
+string_decref(var19);
+(void)0;
+decref((var17), dtor_UnionType_7f899bced1);
+decref__null___List_Type___114a421a91(var16);
+(void)0;
+decref((var14), dtor_FunctionType_4e16d0ea53);
+decref__null___List_Type___114a421a91(var13);
+decref((var12), dtor_BasicType_899b9c9f8e);
+(void)0;
+string_decref(var9);
+(void)0;
+decref((var7), dtor_AutoType_33a5d572cb);
+(void)0;
+return retval;
+}struct class_Str ir_4b1a3e0393_type_name(struct class_Type_87e1ce5c5e var1){bool var2;
+struct class_AutoType_33a5d572cb* var7;
+var7 = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+int64_t var9;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_BasicType_899b9c9f8e* var12;
+var12 = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_FunctionType_4e16d0ea53* var14;
+var14 = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_UnionType_7f899bced1* var16;
+var16 = NULL;
+struct class__null___Str__5eca9cec4f var17;
+var17.membernum = -1;
+char var18;
+struct class__null___Str__5eca9cec4f var19;
+var19.membernum = -1;
+bool var20;
+struct class_List_Type__057f9c6088* var22;
+var22 = NULL;
+int64_t var23;
+int64_t var24;
+bool var25;
+bool var27;
+struct class_List_Type__057f9c6088* var29;
+var29 = NULL;
+struct class_Type_87e1ce5c5e var30;
+var30.membernum = -1;
+struct class_Builtins_bd980a9f08* var31;
+var31 = NULL;
+struct class_Type_87e1ce5c5e var32;
+var32.membernum = -1;
+bool var33;
+bool var34;
+struct class_Str var38;
+var38.buf = NULL;
+struct class_List_Type__057f9c6088* var39;
+var39 = NULL;
+struct class_List_Str__43b70c06cb* var40;
+var40 = NULL;
+int64_t var41;
+int64_t var42;
+struct class_Type_87e1ce5c5e var44;
+var44.membernum = -1;
+struct class_Str var46;
+var46.buf = NULL;
+struct class_Str var47;
+var47.buf = NULL;
+struct class_Str var48;
+var48.buf = NULL;
+struct class_Str var49;
+var49.buf = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+struct class__null___Str__5eca9cec4f var52;
+var52.membernum = -1;
+struct class_Str var53;
+var53.buf = NULL;
+struct class_Str retval;
+
+            var2 = (
+                var1.membernum == 0
+            );
+            if (var2) goto label3;
+
+            var2 = (
+                var1.membernum == 1
+            );
+            if (var2) goto label4;
+
+            var2 = (
+                var1.membernum == 2
+            );
+            if (var2) goto label5;
+
+            var2 = (
+                var1.membernum == 3
+            );
+            if (var2) goto label6;
+label3: (void)0;
+
+            if (var1.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var7 = var1.val.item0;
+            incref(var7);
+var8 = string3_auto_a469f3dd41; string_incref(var8);
+var9 = var7->memb_id;
+var10 = meth_Int_to_string(var9);
+var11 = oomph_string_concat(var8,var10);
+retval = var11; var11.buf = NULL;
+goto out;
+label4: (void)0;
+
+            if (var1.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var12 = var1.val.item1;
+            incref(var12);
+var13 = var12->memb_name;
+string_incref(var13);
+retval = var13; var13.buf = NULL;
+goto out;
+label5: (void)0;
+
+            if (var1.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var14 = var1.val.item2;
+            incref(var14);
+var15 = string4__function_type__dba178671b; string_incref(var15);
+retval = var15; var15.buf = NULL;
+goto out;
+label6: (void)0;
+
+            if (var1.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var16 = var1.val.item3;
+            incref(var16);
+var17 = var16->memb_custom_name;
+incref__null___Str__5eca9cec4f(var17);
+var18 = oomph_null;
+var19 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var18 }, .membernum = 0 };
+var20 = meth__null___Str__5eca9cec4f_equals(var17,var19);
+if (var20) goto label21;
+var22 = var16->memb_type_members;
+incref(var22);
+var23 = meth_List_Type__057f9c6088_length(var22);
+var24 = 2LL;
+var25 = meth_Int_equals(var23,var24);
+if (var25) goto label26;
+var27 = oomph_false;
+if (oomph_true) goto label28;
+label26: (void)0;
+var29 = var16->memb_type_members;
+incref(var29);
+var30 = meth_List_Type__057f9c6088_first(var29);
+var31 = var16->memb_builtins;
+var32 = var31->memb_NULL_TYPE;
+var31 = NULL;
+incref_Type_87e1ce5c5e(var32);
+var33 = meth_Type_87e1ce5c5e_equals(var30,var32);
+var27 = var33;
+label28: (void)0;
+var34 = var27;
+if (oomph_true) goto label35;
+label21: (void)0;
+var34 = oomph_true;
+label35: (void)0;
+if (var34) goto label36;
+if (oomph_true) goto label37;
+label36: (void)0;
+var38 = string5___636e046e1d; string_incref(var38);
+var39 = var16->memb_type_members;
+incref(var39);
+var40 = ctor_List_Str__43b70c06cb();
+var41 = meth_List_Type__057f9c6088_length(var39);
+meth_List_Str__43b70c06cb___reserve(var40,var41);
+var42 = 0LL;
+label43: (void)0;
+if (var42 >= var39->len) goto label45;
+decref_Type_87e1ce5c5e(var44); var44 = var39->data[var42++]; incref_Type_87e1ce5c5e(var44);
+string_decref(var46);
+var46.buf = NULL;
+var46 = ir_4b1a3e0393_type_name(var44);
+meth_List_Str__43b70c06cb_push(var40,var46);
+if (oomph_true) goto label43;
+label45: (void)0;
+var47 = string6_____ffce99c85c; string_incref(var47);
+var48 = meth_List_Str__43b70c06cb_join(var40,var47);
+var49 = oomph_string_concat(var38,var48);
+var50 = string7___20a8e6168a; string_incref(var50);
+var51 = oomph_string_concat(var49,var50);
+retval = var51; var51.buf = NULL;
+goto out;
+label37: (void)0;
+var52 = var16->memb_custom_name;
+incref__null___Str__5eca9cec4f(var52);
+var53 = meth__null___Str__5eca9cec4f_get(var52);
+retval = var53; var53.buf = NULL;
+goto out;
+label54: (void)0;
+out: (void)0;
+string_decref(var53);
+decref__null___Str__5eca9cec4f(var52);
+string_decref(var51);
+string_decref(var50);
+string_decref(var49);
+string_decref(var48);
+string_decref(var47);
+string_decref(var46);
+decref_Type_87e1ce5c5e(var44);
+(void)0;
+(void)0;
+decref((var40), dtor_List_Str__43b70c06cb);
+decref((var39), dtor_List_Type__057f9c6088);
+string_decref(var38);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var32);
+decref((var31), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var30);
+decref((var29), dtor_List_Type__057f9c6088);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var22), dtor_List_Type__057f9c6088);
+(void)0;
+decref__null___Str__5eca9cec4f(var19);
+(void)0;
+decref__null___Str__5eca9cec4f(var17);
+decref((var16), dtor_UnionType_7f899bced1);
+string_decref(var15);
+decref((var14), dtor_FunctionType_4e16d0ea53);
+string_decref(var13);
+decref((var12), dtor_BasicType_899b9c9f8e);
+string_decref(var11);
+string_decref(var10);
+(void)0;
+string_decref(var8);
+decref((var7), dtor_AutoType_33a5d572cb);
+(void)0;
+return retval;
+}struct class_Str ir_4b1a3e0393_type_id_string(struct class_Type_87e1ce5c5e var1){bool var2;
+struct class_AutoType_33a5d572cb* var7;
+var7 = NULL;
+bool var8;
+struct class_Str var9;
+var9.buf = NULL;
+int64_t var10;
+struct class_BasicType_899b9c9f8e* var12;
+var12 = NULL;
+struct class__null___GenericSource__4440b6073d var13;
+var13.membernum = -1;
+char var14;
+struct class__null___GenericSource__4440b6073d var15;
+var15.membernum = -1;
+bool var16;
+struct class_Str var19;
+var19.buf = NULL;
+struct class__null___GenericSource__4440b6073d var20;
+var20.membernum = -1;
+struct class_GenericSource_35cfcd932e* var21;
+var21 = NULL;
+struct class_Generic_c39b95ec73* var22;
+var22 = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Type_87e1ce5c5e var24;
+var24.membernum = -1;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_UnionType_7f899bced1* var27;
+var27 = NULL;
+struct class_List_Type__057f9c6088* var28;
+var28 = NULL;
+struct class_List_Str__43b70c06cb* var29;
+var29 = NULL;
+int64_t var30;
+int64_t var31;
+struct class_Type_87e1ce5c5e var33;
+var33.membernum = -1;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+struct class_Str var37;
+var37.buf = NULL;
+struct class_FunctionType_4e16d0ea53* var38;
+var38 = NULL;
+bool var39;
+struct class_Str var40;
+var40.buf = NULL;
+int64_t var41;
+struct class_Str retval;
+
+            var2 = (
+                var1.membernum == 0
+            );
+            if (var2) goto label3;
+
+            var2 = (
+                var1.membernum == 1
+            );
+            if (var2) goto label4;
+
+            var2 = (
+                var1.membernum == 3
+            );
+            if (var2) goto label5;
+
+            var2 = (
+                var1.membernum == 2
+            );
+            if (var2) goto label6;
+label3: (void)0;
+
+            if (var1.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var7 = var1.val.item0;
+            incref(var7);
+var8 = oomph_false;
+var9 = string2_self_hosted_ir_oomph_cc2414ff62; string_incref(var9);
+var10 = 125LL;
+oomph_assert(var8,var9,var10);
+if (oomph_true) goto label11;
+label4: (void)0;
+
+            if (var1.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var12 = var1.val.item1;
+            incref(var12);
+var13 = var12->memb_generic_source;
+incref__null___GenericSource__4440b6073d(var13);
+var14 = oomph_null;
+var15 = (struct class__null___GenericSource__4440b6073d){ .val = { .item0 = var14 }, .membernum = 0 };
+var16 = meth__null___GenericSource__4440b6073d_equals(var13,var15);
+if (var16) goto label17;
+if (oomph_true) goto label18;
+label17: (void)0;
+var19 = var12->memb_name;
+string_incref(var19);
+retval = var19; var19.buf = NULL;
+goto out;
+label18: (void)0;
+var20 = var12->memb_generic_source;
+incref__null___GenericSource__4440b6073d(var20);
+var21 = meth__null___GenericSource__4440b6073d_get(var20);
+var22 = var21->memb_generik;
+var23 = var22->memb_name;
+var22 = NULL;
+string_incref(var23);
+var24 = var21->memb_arg;
+incref_Type_87e1ce5c5e(var24);
+var25 = ir_4b1a3e0393_type_id_string(var24);
+var26 = oomph_string_concat(var23,var25);
+retval = var26; var26.buf = NULL;
+goto out;
+label5: (void)0;
+
+            if (var1.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var27 = var1.val.item3;
+            incref(var27);
+var28 = var27->memb_type_members;
+incref(var28);
+var29 = ctor_List_Str__43b70c06cb();
+var30 = meth_List_Type__057f9c6088_length(var28);
+meth_List_Str__43b70c06cb___reserve(var29,var30);
+var31 = 0LL;
+label32: (void)0;
+if (var31 >= var28->len) goto label34;
+decref_Type_87e1ce5c5e(var33); var33 = var28->data[var31++]; incref_Type_87e1ce5c5e(var33);
+string_decref(var35);
+var35.buf = NULL;
+var35 = ir_4b1a3e0393_type_id_string(var33);
+meth_List_Str__43b70c06cb_push(var29,var35);
+if (oomph_true) goto label32;
+label34: (void)0;
+var36 = string8___3b8387c3f0; string_incref(var36);
+var37 = meth_List_Str__43b70c06cb_join(var29,var36);
+retval = var37; var37.buf = NULL;
+goto out;
+label6: (void)0;
+
+            if (var1.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var38 = var1.val.item2;
+            incref(var38);
+var39 = oomph_false;
+var40 = string2_self_hosted_ir_oomph_cc2414ff62; string_incref(var40);
+var41 = 135LL;
+oomph_assert(var39,var40,var41);
+label11: (void)0;
+out: (void)0;
+(void)0;
+string_decref(var40);
+(void)0;
+decref((var38), dtor_FunctionType_4e16d0ea53);
+string_decref(var37);
+string_decref(var36);
+string_decref(var35);
+decref_Type_87e1ce5c5e(var33);
+(void)0;
+(void)0;
+decref((var29), dtor_List_Str__43b70c06cb);
+decref((var28), dtor_List_Type__057f9c6088);
+decref((var27), dtor_UnionType_7f899bced1);
+string_decref(var26);
+string_decref(var25);
+decref_Type_87e1ce5c5e(var24);
+string_decref(var23);
+decref((var22), dtor_Generic_c39b95ec73);
+decref((var21), dtor_GenericSource_35cfcd932e);
+decref__null___GenericSource__4440b6073d(var20);
+string_decref(var19);
+(void)0;
+decref__null___GenericSource__4440b6073d(var15);
+(void)0;
+decref__null___GenericSource__4440b6073d(var13);
+decref((var12), dtor_BasicType_899b9c9f8e);
+(void)0;
+string_decref(var9);
+(void)0;
+decref((var7), dtor_AutoType_33a5d572cb);
+(void)0;
+return retval;
+}struct class__null___GenericSource__4440b6073d ir_4b1a3e0393_get_generic_source(struct class_Type_87e1ce5c5e var1){bool var2;
+struct class_AutoType_33a5d572cb* var7;
+var7 = NULL;
+bool var8;
+struct class_Str var9;
+var9.buf = NULL;
+int64_t var10;
+struct class_BasicType_899b9c9f8e* var12;
+var12 = NULL;
+struct class__null___GenericSource__4440b6073d var13;
+var13.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var14;
+var14 = NULL;
+char var15;
+struct class__null___GenericSource__4440b6073d var16;
+var16.membernum = -1;
+struct class_UnionType_7f899bced1* var17;
+var17 = NULL;
+char var18;
+struct class__null___GenericSource__4440b6073d var19;
+var19.membernum = -1;
+struct class__null___GenericSource__4440b6073d retval;
+
+            var2 = (
+                var1.membernum == 0
+            );
+            if (var2) goto label3;
+
+            var2 = (
+                var1.membernum == 1
+            );
+            if (var2) goto label4;
+
+            var2 = (
+                var1.membernum == 2
+            );
+            if (var2) goto label5;
+
+            var2 = (
+                var1.membernum == 3
+            );
+            if (var2) goto label6;
+label3: (void)0;
+
+            if (var1.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var7 = var1.val.item0;
+            incref(var7);
+var8 = oomph_false;
+var9 = string2_self_hosted_ir_oomph_cc2414ff62; string_incref(var9);
+var10 = 140LL;
+oomph_assert(var8,var9,var10);
+if (oomph_true) goto label11;
+label4: (void)0;
+
+            if (var1.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var12 = var1.val.item1;
+            incref(var12);
+var13 = var12->memb_generic_source;
+incref__null___GenericSource__4440b6073d(var13);
+retval = var13; var13.membernum = -1;
+goto out;
+label5: (void)0;
+
+            if (var1.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var14 = var1.val.item2;
+            incref(var14);
+var15 = oomph_null;
+var16 = (struct class__null___GenericSource__4440b6073d){ .val = { .item0 = var15 }, .membernum = 0 };
+retval = var16; var16.membernum = -1;
+goto out;
+label6: (void)0;
+
+            if (var1.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var17 = var1.val.item3;
+            incref(var17);
+var18 = oomph_null;
+var19 = (struct class__null___GenericSource__4440b6073d){ .val = { .item0 = var18 }, .membernum = 0 };
+retval = var19; var19.membernum = -1;
+goto out;
+label11: (void)0;
+out: (void)0;
+decref__null___GenericSource__4440b6073d(var19);
+(void)0;
+decref((var17), dtor_UnionType_7f899bced1);
+decref__null___GenericSource__4440b6073d(var16);
+(void)0;
+decref((var14), dtor_FunctionType_4e16d0ea53);
+decref__null___GenericSource__4440b6073d(var13);
+decref((var12), dtor_BasicType_899b9c9f8e);
+(void)0;
+string_decref(var9);
+(void)0;
+decref((var7), dtor_AutoType_33a5d572cb);
+(void)0;
+return retval;
+}struct class_Type_87e1ce5c5e ir_4b1a3e0393_var_type(struct class_Variable_1aaa81c8d2 var1){bool var2;
+struct class_BuiltinVariable_f6e0cdd1b6* var6;
+var6 = NULL;
+struct class_Type_87e1ce5c5e var7;
+var7.membernum = -1;
+struct class_FileVariable_a7b8ca651f* var8;
+var8 = NULL;
+struct class_Type_87e1ce5c5e var9;
+var9.membernum = -1;
+struct class_LocalVariable_846080e5ae* var10;
+var10 = NULL;
+struct class_Type_87e1ce5c5e var11;
+var11.membernum = -1;
+struct class_Type_87e1ce5c5e retval;
+
+            var2 = (
+                var1.membernum == 0
+            );
+            if (var2) goto label3;
+
+            var2 = (
+                var1.membernum == 1
+            );
+            if (var2) goto label4;
+
+            var2 = (
+                var1.membernum == 2
+            );
+            if (var2) goto label5;
+label3: (void)0;
+
+            if (var1.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var6 = var1.val.item0;
+            incref(var6);
+var7 = var6->memb_type;
+incref_Type_87e1ce5c5e(var7);
+retval = var7; var7.membernum = -1;
+goto out;
+label4: (void)0;
+
+            if (var1.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var8 = var1.val.item1;
+            incref(var8);
+var9 = var8->memb_type;
+incref_Type_87e1ce5c5e(var9);
+retval = var9; var9.membernum = -1;
+goto out;
+label5: (void)0;
+
+            if (var1.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var10 = var1.val.item2;
+            incref(var10);
+var11 = var10->memb_type;
+incref_Type_87e1ce5c5e(var11);
+retval = var11; var11.membernum = -1;
+goto out;
+label12: (void)0;
+out: (void)0;
+decref_Type_87e1ce5c5e(var11);
+decref((var10), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(var9);
+decref((var8), dtor_FileVariable_a7b8ca651f);
+decref_Type_87e1ce5c5e(var7);
+decref((var6), dtor_BuiltinVariable_f6e0cdd1b6);
+(void)0;
+return retval;
+}struct class_Builtins_bd980a9f08* ir_4b1a3e0393_create_builtins(void){struct class_Str var1;
+var1.buf = NULL;
+bool var2;
+struct class_List_Method__1e0ab9c757* var3;
+var3 = NULL;
+struct class_List_Member__7525bf27e3* var4;
+var4 = NULL;
+char var5;
+char var6;
+bool var7;
+struct class__null___List_Type___114a421a91 var8;
+var8.membernum = -1;
+struct class__null___GenericSource__4440b6073d var9;
+var9.membernum = -1;
+struct class_BasicType_899b9c9f8e* var10;
+var10 = NULL;
+struct class_Type_87e1ce5c5e var11;
+var11.membernum = -1;
+struct class_Str var12;
+var12.buf = NULL;
+bool var13;
+struct class_List_Method__1e0ab9c757* var14;
+var14 = NULL;
+struct class_List_Member__7525bf27e3* var15;
+var15 = NULL;
+char var16;
+char var17;
+bool var18;
+struct class__null___List_Type___114a421a91 var19;
+var19.membernum = -1;
+struct class__null___GenericSource__4440b6073d var20;
+var20.membernum = -1;
+struct class_BasicType_899b9c9f8e* var21;
+var21 = NULL;
+struct class_Type_87e1ce5c5e var22;
+var22.membernum = -1;
+struct class_Str var23;
+var23.buf = NULL;
+bool var24;
+struct class_List_Method__1e0ab9c757* var25;
+var25 = NULL;
+struct class_List_Member__7525bf27e3* var26;
+var26 = NULL;
+char var27;
+char var28;
+bool var29;
+struct class__null___List_Type___114a421a91 var30;
+var30.membernum = -1;
+struct class__null___GenericSource__4440b6073d var31;
+var31.membernum = -1;
+struct class_BasicType_899b9c9f8e* var32;
+var32 = NULL;
+struct class_Type_87e1ce5c5e var33;
+var33.membernum = -1;
+struct class_Str var34;
+var34.buf = NULL;
+bool var35;
+struct class_List_Method__1e0ab9c757* var36;
+var36 = NULL;
+struct class_List_Member__7525bf27e3* var37;
+var37 = NULL;
+char var38;
+char var39;
+bool var40;
+struct class__null___List_Type___114a421a91 var41;
+var41.membernum = -1;
+struct class__null___GenericSource__4440b6073d var42;
+var42.membernum = -1;
+struct class_BasicType_899b9c9f8e* var43;
+var43 = NULL;
+struct class_Type_87e1ce5c5e var44;
+var44.membernum = -1;
+struct class_Str var45;
+var45.buf = NULL;
+bool var46;
+struct class_List_Method__1e0ab9c757* var47;
+var47 = NULL;
+struct class_List_Member__7525bf27e3* var48;
+var48 = NULL;
+char var49;
+char var50;
+bool var51;
+struct class__null___List_Type___114a421a91 var52;
+var52.membernum = -1;
+struct class__null___GenericSource__4440b6073d var53;
+var53.membernum = -1;
+struct class_BasicType_899b9c9f8e* var54;
+var54 = NULL;
+struct class_Type_87e1ce5c5e var55;
+var55.membernum = -1;
+struct class_Str var56;
+var56.buf = NULL;
+struct class_Generic_c39b95ec73* var57;
+var57 = NULL;
+struct class_Str var58;
+var58.buf = NULL;
+struct class_List_Type__057f9c6088* var59;
+var59 = NULL;
+struct class__null___Type__8438ac3dcf var60;
+var60.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var61;
+var61 = NULL;
+struct class_Type_87e1ce5c5e var62;
+var62.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var63;
+var63 = NULL;
+struct class_Str var64;
+var64.buf = NULL;
+struct class_List_Type__057f9c6088* var65;
+var65 = NULL;
+struct class__null___Type__8438ac3dcf var66;
+var66.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var67;
+var67 = NULL;
+struct class_Type_87e1ce5c5e var68;
+var68.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var69;
+var69 = NULL;
+struct class_Str var70;
+var70.buf = NULL;
+struct class_List_Type__057f9c6088* var71;
+var71 = NULL;
+struct class__null___Type__8438ac3dcf var72;
+var72.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var73;
+var73 = NULL;
+struct class_Type_87e1ce5c5e var74;
+var74.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var75;
+var75 = NULL;
+struct class_Str var76;
+var76.buf = NULL;
+struct class_List_Type__057f9c6088* var77;
+var77 = NULL;
+struct class__null___Type__8438ac3dcf var78;
+var78.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var79;
+var79 = NULL;
+struct class_Type_87e1ce5c5e var80;
+var80.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var81;
+var81 = NULL;
+struct class_Str var82;
+var82.buf = NULL;
+struct class_List_Type__057f9c6088* var83;
+var83 = NULL;
+struct class__null___Type__8438ac3dcf var84;
+var84.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var85;
+var85 = NULL;
+struct class_Type_87e1ce5c5e var86;
+var86.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var87;
+var87 = NULL;
+struct class_Str var88;
+var88.buf = NULL;
+struct class_List_Type__057f9c6088* var89;
+var89 = NULL;
+struct class__null___Type__8438ac3dcf var90;
+var90.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var91;
+var91 = NULL;
+struct class_Type_87e1ce5c5e var92;
+var92.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var93;
+var93 = NULL;
+struct class_Str var94;
+var94.buf = NULL;
+struct class_List_Type__057f9c6088* var95;
+var95 = NULL;
+struct class__null___Type__8438ac3dcf var96;
+var96.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var97;
+var97 = NULL;
+struct class_Type_87e1ce5c5e var98;
+var98.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var99;
+var99 = NULL;
+struct class_Str var100;
+var100.buf = NULL;
+struct class_List_Type__057f9c6088* var101;
+var101 = NULL;
+struct class__null___Type__8438ac3dcf var102;
+var102.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var103;
+var103 = NULL;
+struct class_Type_87e1ce5c5e var104;
+var104.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var105;
+var105 = NULL;
+struct class_Str var106;
+var106.buf = NULL;
+struct class_List_Type__057f9c6088* var107;
+var107 = NULL;
+struct class__null___Type__8438ac3dcf var108;
+var108.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var109;
+var109 = NULL;
+struct class_Type_87e1ce5c5e var110;
+var110.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var111;
+var111 = NULL;
+struct class_Str var112;
+var112.buf = NULL;
+struct class_List_Type__057f9c6088* var113;
+var113 = NULL;
+struct class__null___Type__8438ac3dcf var114;
+var114.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var115;
+var115 = NULL;
+struct class_Type_87e1ce5c5e var116;
+var116.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var117;
+var117 = NULL;
+struct class_Str var118;
+var118.buf = NULL;
+struct class_List_Type__057f9c6088* var119;
+var119 = NULL;
+struct class__null___Type__8438ac3dcf var120;
+var120.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var121;
+var121 = NULL;
+struct class_Type_87e1ce5c5e var122;
+var122.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var123;
+var123 = NULL;
+struct class_Str var124;
+var124.buf = NULL;
+struct class_List_Type__057f9c6088* var125;
+var125 = NULL;
+struct class__null___Type__8438ac3dcf var126;
+var126.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var127;
+var127 = NULL;
+struct class_Type_87e1ce5c5e var128;
+var128.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var129;
+var129 = NULL;
+struct class_Str var130;
+var130.buf = NULL;
+struct class_List_Type__057f9c6088* var131;
+var131 = NULL;
+struct class__null___Type__8438ac3dcf var132;
+var132.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var133;
+var133 = NULL;
+struct class_Type_87e1ce5c5e var134;
+var134.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var135;
+var135 = NULL;
+struct class_Str var136;
+var136.buf = NULL;
+struct class_List_Type__057f9c6088* var137;
+var137 = NULL;
+struct class__null___Type__8438ac3dcf var138;
+var138.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var139;
+var139 = NULL;
+struct class_Type_87e1ce5c5e var140;
+var140.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var141;
+var141 = NULL;
+struct class_Str var142;
+var142.buf = NULL;
+struct class_List_Type__057f9c6088* var143;
+var143 = NULL;
+struct class__null___Type__8438ac3dcf var144;
+var144.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var145;
+var145 = NULL;
+struct class_Type_87e1ce5c5e var146;
+var146.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var147;
+var147 = NULL;
+struct class_Str var148;
+var148.buf = NULL;
+struct class_List_Type__057f9c6088* var149;
+var149 = NULL;
+struct class__null___Type__8438ac3dcf var150;
+var150.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var151;
+var151 = NULL;
+struct class_Type_87e1ce5c5e var152;
+var152.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var153;
+var153 = NULL;
+struct class_Str var154;
+var154.buf = NULL;
+struct class_List_Type__057f9c6088* var155;
+var155 = NULL;
+struct class__null___Type__8438ac3dcf var156;
+var156.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var157;
+var157 = NULL;
+struct class_Type_87e1ce5c5e var158;
+var158.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var159;
+var159 = NULL;
+struct class_Str var160;
+var160.buf = NULL;
+struct class_List_Type__057f9c6088* var161;
+var161 = NULL;
+struct class__null___Type__8438ac3dcf var162;
+var162.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var163;
+var163 = NULL;
+struct class_Type_87e1ce5c5e var164;
+var164.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var165;
+var165 = NULL;
+struct class_Str var166;
+var166.buf = NULL;
+struct class_List_Type__057f9c6088* var167;
+var167 = NULL;
+struct class__null___Type__8438ac3dcf var168;
+var168.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var169;
+var169 = NULL;
+struct class_Type_87e1ce5c5e var170;
+var170.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var171;
+var171 = NULL;
+struct class_Str var172;
+var172.buf = NULL;
+struct class_List_Type__057f9c6088* var173;
+var173 = NULL;
+struct class__null___Type__8438ac3dcf var174;
+var174.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var175;
+var175 = NULL;
+struct class_Type_87e1ce5c5e var176;
+var176.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var177;
+var177 = NULL;
+struct class_List_BuiltinVariable__27288a8fae* var178;
+var178 = NULL;
+struct class_List_BuiltinVariable__27288a8fae* var179;
+var179 = NULL;
+struct class_List_BasicType__d02960f5a1* var180;
+var180 = NULL;
+struct class_Builtins_bd980a9f08* var181;
+var181 = NULL;
+struct class_List_BasicType__d02960f5a1* var182;
+var182 = NULL;
+struct class_List_Type__057f9c6088* var183;
+var183 = NULL;
+struct class_List_BasicType__d02960f5a1* var184;
+var184 = NULL;
+int64_t var185;
+int64_t var186;
+struct class_Type_87e1ce5c5e var188;
+var188.membernum = -1;
+struct class_BasicType_899b9c9f8e* var190;
+var190 = NULL;
+struct class_Str var191;
+var191.buf = NULL;
+struct class_List_Type__057f9c6088* var192;
+var192 = NULL;
+struct class__null___Type__8438ac3dcf var193;
+var193.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var194;
+var194 = NULL;
+struct class_Type_87e1ce5c5e var195;
+var195.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var196;
+var196 = NULL;
+struct class_Str var197;
+var197.buf = NULL;
+struct class_List_Type__057f9c6088* var198;
+var198 = NULL;
+struct class__null___Type__8438ac3dcf var199;
+var199.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var200;
+var200 = NULL;
+struct class_Type_87e1ce5c5e var201;
+var201.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var202;
+var202 = NULL;
+struct class_Str var203;
+var203.buf = NULL;
+struct class_List_Type__057f9c6088* var204;
+var204 = NULL;
+struct class__null___Type__8438ac3dcf var205;
+var205.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var206;
+var206 = NULL;
+struct class_Type_87e1ce5c5e var207;
+var207.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var208;
+var208 = NULL;
+struct class_Str var209;
+var209.buf = NULL;
+struct class_List_Type__057f9c6088* var210;
+var210 = NULL;
+struct class__null___Type__8438ac3dcf var211;
+var211.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var212;
+var212 = NULL;
+struct class_Type_87e1ce5c5e var213;
+var213.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var214;
+var214 = NULL;
+struct class_Str var215;
+var215.buf = NULL;
+struct class_List_Type__057f9c6088* var216;
+var216 = NULL;
+struct class__null___Type__8438ac3dcf var217;
+var217.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var218;
+var218 = NULL;
+struct class_Type_87e1ce5c5e var219;
+var219.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var220;
+var220 = NULL;
+struct class_Str var221;
+var221.buf = NULL;
+struct class_List_Type__057f9c6088* var222;
+var222 = NULL;
+char var223;
+struct class__null___Type__8438ac3dcf var224;
+var224.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var225;
+var225 = NULL;
+struct class_Type_87e1ce5c5e var226;
+var226.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var227;
+var227 = NULL;
+struct class_Str var228;
+var228.buf = NULL;
+struct class_List_Type__057f9c6088* var229;
+var229 = NULL;
+struct class__null___Type__8438ac3dcf var230;
+var230.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var231;
+var231 = NULL;
+struct class_Type_87e1ce5c5e var232;
+var232.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var233;
+var233 = NULL;
+struct class_Str var234;
+var234.buf = NULL;
+struct class_List_Type__057f9c6088* var235;
+var235 = NULL;
+char var236;
+struct class__null___Type__8438ac3dcf var237;
+var237.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var238;
+var238 = NULL;
+struct class_Type_87e1ce5c5e var239;
+var239.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var240;
+var240 = NULL;
+struct class_Str var241;
+var241.buf = NULL;
+struct class_List_Type__057f9c6088* var242;
+var242 = NULL;
+struct class__null___Type__8438ac3dcf var243;
+var243.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var244;
+var244 = NULL;
+struct class_Type_87e1ce5c5e var245;
+var245.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var246;
+var246 = NULL;
+struct class_Str var247;
+var247.buf = NULL;
+struct class_List_Type__057f9c6088* var248;
+var248 = NULL;
+struct class__null___Type__8438ac3dcf var249;
+var249.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var250;
+var250 = NULL;
+struct class_Type_87e1ce5c5e var251;
+var251.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var252;
+var252 = NULL;
+struct class_Str var253;
+var253.buf = NULL;
+struct class_Type_87e1ce5c5e var254;
+var254.membernum = -1;
+struct class_List_Type__057f9c6088* var255;
+var255 = NULL;
+struct class__null___Type__8438ac3dcf var256;
+var256.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var257;
+var257 = NULL;
+struct class_Type_87e1ce5c5e var258;
+var258.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var259;
+var259 = NULL;
+struct class_Str var260;
+var260.buf = NULL;
+struct class_List_Type__057f9c6088* var261;
+var261 = NULL;
+struct class__null___Type__8438ac3dcf var262;
+var262.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var263;
+var263 = NULL;
+struct class_Type_87e1ce5c5e var264;
+var264.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var265;
+var265 = NULL;
+struct class_Str var266;
+var266.buf = NULL;
+struct class_List_Type__057f9c6088* var267;
+var267 = NULL;
+struct class__null___Type__8438ac3dcf var268;
+var268.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var269;
+var269 = NULL;
+struct class_Type_87e1ce5c5e var270;
+var270.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var271;
+var271 = NULL;
+struct class_Str var272;
+var272.buf = NULL;
+struct class_List_Type__057f9c6088* var273;
+var273 = NULL;
+char var274;
+struct class__null___Type__8438ac3dcf var275;
+var275.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var276;
+var276 = NULL;
+struct class_Type_87e1ce5c5e var277;
+var277.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var278;
+var278 = NULL;
+struct class_Str var279;
+var279.buf = NULL;
+struct class_BuiltinVariable_f6e0cdd1b6* var280;
+var280 = NULL;
+struct class_Str var281;
+var281.buf = NULL;
+struct class_BuiltinVariable_f6e0cdd1b6* var282;
+var282 = NULL;
+struct class_Str var283;
+var283.buf = NULL;
+struct class_List_Type__057f9c6088* var284;
+var284 = NULL;
+char var285;
+struct class__null___Type__8438ac3dcf var286;
+var286.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var287;
+var287 = NULL;
+struct class_Type_87e1ce5c5e var288;
+var288.membernum = -1;
+struct class_BuiltinVariable_f6e0cdd1b6* var289;
+var289 = NULL;
+struct class_Str var290;
+var290.buf = NULL;
+struct class_BuiltinVariable_f6e0cdd1b6* var291;
+var291 = NULL;
+struct class_List_BuiltinVariable__27288a8fae* var292;
+var292 = NULL;
+struct class_BasicType_899b9c9f8e* var293;
+var293 = NULL;
+struct class_List_Method__1e0ab9c757* var294;
+var294 = NULL;
+struct class_Str var295;
+var295.buf = NULL;
+struct class_List_Type__057f9c6088* var296;
+var296 = NULL;
+struct class__null___Type__8438ac3dcf var297;
+var297.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var298;
+var298 = NULL;
+struct class_Method_bfbd73ad15* var299;
+var299 = NULL;
+struct class_Str var300;
+var300.buf = NULL;
+struct class_List_Type__057f9c6088* var301;
+var301 = NULL;
+struct class__null___Type__8438ac3dcf var302;
+var302.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var303;
+var303 = NULL;
+struct class_Method_bfbd73ad15* var304;
+var304 = NULL;
+struct class_Str var305;
+var305.buf = NULL;
+struct class_List_Type__057f9c6088* var306;
+var306 = NULL;
+struct class__null___Type__8438ac3dcf var307;
+var307.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var308;
+var308 = NULL;
+struct class_Method_bfbd73ad15* var309;
+var309 = NULL;
+struct class_Str var310;
+var310.buf = NULL;
+struct class_List_Type__057f9c6088* var311;
+var311 = NULL;
+struct class__null___Type__8438ac3dcf var312;
+var312.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var313;
+var313 = NULL;
+struct class_Method_bfbd73ad15* var314;
+var314 = NULL;
+struct class_Str var315;
+var315.buf = NULL;
+struct class_List_Type__057f9c6088* var316;
+var316 = NULL;
+struct class__null___Type__8438ac3dcf var317;
+var317.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var318;
+var318 = NULL;
+struct class_Method_bfbd73ad15* var319;
+var319 = NULL;
+struct class_Str var320;
+var320.buf = NULL;
+struct class_List_Type__057f9c6088* var321;
+var321 = NULL;
+struct class__null___Type__8438ac3dcf var322;
+var322.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var323;
+var323 = NULL;
+struct class_Method_bfbd73ad15* var324;
+var324 = NULL;
+struct class_List_Method__1e0ab9c757* var325;
+var325 = NULL;
+struct class_BasicType_899b9c9f8e* var326;
+var326 = NULL;
+struct class_List_Method__1e0ab9c757* var327;
+var327 = NULL;
+struct class_Str var328;
+var328.buf = NULL;
+struct class_List_Type__057f9c6088* var329;
+var329 = NULL;
+struct class__null___Type__8438ac3dcf var330;
+var330.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var331;
+var331 = NULL;
+struct class_Method_bfbd73ad15* var332;
+var332 = NULL;
+struct class_Str var333;
+var333.buf = NULL;
+struct class_List_Type__057f9c6088* var334;
+var334 = NULL;
+struct class__null___Type__8438ac3dcf var335;
+var335.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var336;
+var336 = NULL;
+struct class_Method_bfbd73ad15* var337;
+var337 = NULL;
+struct class_Str var338;
+var338.buf = NULL;
+struct class_List_Type__057f9c6088* var339;
+var339 = NULL;
+struct class__null___Type__8438ac3dcf var340;
+var340.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var341;
+var341 = NULL;
+struct class_Method_bfbd73ad15* var342;
+var342 = NULL;
+struct class_Str var343;
+var343.buf = NULL;
+struct class_List_Type__057f9c6088* var344;
+var344 = NULL;
+struct class__null___Type__8438ac3dcf var345;
+var345.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var346;
+var346 = NULL;
+struct class_Method_bfbd73ad15* var347;
+var347 = NULL;
+struct class_Str var348;
+var348.buf = NULL;
+struct class_List_Type__057f9c6088* var349;
+var349 = NULL;
+struct class__null___Type__8438ac3dcf var350;
+var350.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var351;
+var351 = NULL;
+struct class_Method_bfbd73ad15* var352;
+var352 = NULL;
+struct class_Str var353;
+var353.buf = NULL;
+struct class_List_Type__057f9c6088* var354;
+var354 = NULL;
+struct class_Type_87e1ce5c5e var355;
+var355.membernum = -1;
+struct class__null___Type__8438ac3dcf var356;
+var356.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var357;
+var357 = NULL;
+struct class_Method_bfbd73ad15* var358;
+var358 = NULL;
+struct class_Str var359;
+var359.buf = NULL;
+struct class_List_Type__057f9c6088* var360;
+var360 = NULL;
+struct class__null___Type__8438ac3dcf var361;
+var361.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var362;
+var362 = NULL;
+struct class_Method_bfbd73ad15* var363;
+var363 = NULL;
+struct class_Str var364;
+var364.buf = NULL;
+struct class_List_Type__057f9c6088* var365;
+var365 = NULL;
+struct class__null___Type__8438ac3dcf var366;
+var366.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var367;
+var367 = NULL;
+struct class_Method_bfbd73ad15* var368;
+var368 = NULL;
+struct class_Str var369;
+var369.buf = NULL;
+struct class_List_Type__057f9c6088* var370;
+var370 = NULL;
+struct class__null___Type__8438ac3dcf var371;
+var371.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var372;
+var372 = NULL;
+struct class_Method_bfbd73ad15* var373;
+var373 = NULL;
+struct class_Str var374;
+var374.buf = NULL;
+struct class_List_Type__057f9c6088* var375;
+var375 = NULL;
+struct class__null___Type__8438ac3dcf var376;
+var376.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var377;
+var377 = NULL;
+struct class_Method_bfbd73ad15* var378;
+var378 = NULL;
+struct class_Str var379;
+var379.buf = NULL;
+struct class_List_Type__057f9c6088* var380;
+var380 = NULL;
+struct class__null___Type__8438ac3dcf var381;
+var381.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var382;
+var382 = NULL;
+struct class_Method_bfbd73ad15* var383;
+var383 = NULL;
+struct class_Str var384;
+var384.buf = NULL;
+struct class_List_Type__057f9c6088* var385;
+var385 = NULL;
+struct class__null___Type__8438ac3dcf var386;
+var386.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var387;
+var387 = NULL;
+struct class_Method_bfbd73ad15* var388;
+var388 = NULL;
+struct class_Str var389;
+var389.buf = NULL;
+struct class_List_Type__057f9c6088* var390;
+var390 = NULL;
+struct class__null___Type__8438ac3dcf var391;
+var391.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var392;
+var392 = NULL;
+struct class_Method_bfbd73ad15* var393;
+var393 = NULL;
+struct class_Str var394;
+var394.buf = NULL;
+struct class_List_Type__057f9c6088* var395;
+var395 = NULL;
+struct class__null___Type__8438ac3dcf var396;
+var396.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var397;
+var397 = NULL;
+struct class_Method_bfbd73ad15* var398;
+var398 = NULL;
+struct class_Str var399;
+var399.buf = NULL;
+struct class_List_Type__057f9c6088* var400;
+var400 = NULL;
+struct class__null___Type__8438ac3dcf var401;
+var401.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var402;
+var402 = NULL;
+struct class_Method_bfbd73ad15* var403;
+var403 = NULL;
+struct class_Str var404;
+var404.buf = NULL;
+struct class_List_Type__057f9c6088* var405;
+var405 = NULL;
+struct class_Type_87e1ce5c5e var406;
+var406.membernum = -1;
+struct class__null___Type__8438ac3dcf var407;
+var407.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var408;
+var408 = NULL;
+struct class_Method_bfbd73ad15* var409;
+var409 = NULL;
+struct class_Str var410;
+var410.buf = NULL;
+struct class_List_Type__057f9c6088* var411;
+var411 = NULL;
+struct class__null___Type__8438ac3dcf var412;
+var412.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var413;
+var413 = NULL;
+struct class_Method_bfbd73ad15* var414;
+var414 = NULL;
+struct class_Str var415;
+var415.buf = NULL;
+struct class_List_Type__057f9c6088* var416;
+var416 = NULL;
+struct class__null___Type__8438ac3dcf var417;
+var417.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var418;
+var418 = NULL;
+struct class_Method_bfbd73ad15* var419;
+var419 = NULL;
+struct class_Str var420;
+var420.buf = NULL;
+struct class_List_Type__057f9c6088* var421;
+var421 = NULL;
+struct class__null___Type__8438ac3dcf var422;
+var422.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var423;
+var423 = NULL;
+struct class_Method_bfbd73ad15* var424;
+var424 = NULL;
+struct class_Str var425;
+var425.buf = NULL;
+struct class_List_Type__057f9c6088* var426;
+var426 = NULL;
+struct class__null___Type__8438ac3dcf var427;
+var427.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var428;
+var428 = NULL;
+struct class_Method_bfbd73ad15* var429;
+var429 = NULL;
+struct class_Str var430;
+var430.buf = NULL;
+struct class_List_Type__057f9c6088* var431;
+var431 = NULL;
+struct class__null___Type__8438ac3dcf var432;
+var432.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var433;
+var433 = NULL;
+struct class_Method_bfbd73ad15* var434;
+var434 = NULL;
+struct class_List_Method__1e0ab9c757* var435;
+var435 = NULL;
+struct class_BasicType_899b9c9f8e* var436;
+var436 = NULL;
+struct class_List_Method__1e0ab9c757* var437;
+var437 = NULL;
+struct class_Str var438;
+var438.buf = NULL;
+struct class_List_Type__057f9c6088* var439;
+var439 = NULL;
+struct class__null___Type__8438ac3dcf var440;
+var440.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var441;
+var441 = NULL;
+struct class_Method_bfbd73ad15* var442;
+var442 = NULL;
+struct class_Str var443;
+var443.buf = NULL;
+struct class_List_Type__057f9c6088* var444;
+var444 = NULL;
+struct class__null___Type__8438ac3dcf var445;
+var445.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var446;
+var446 = NULL;
+struct class_Method_bfbd73ad15* var447;
+var447 = NULL;
+struct class_List_Method__1e0ab9c757* var448;
+var448 = NULL;
+struct class_BasicType_899b9c9f8e* var449;
+var449 = NULL;
+struct class_List_Method__1e0ab9c757* var450;
+var450 = NULL;
+struct class_Str var451;
+var451.buf = NULL;
+struct class_List_Type__057f9c6088* var452;
+var452 = NULL;
+struct class__null___Type__8438ac3dcf var453;
+var453.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var454;
+var454 = NULL;
+struct class_Method_bfbd73ad15* var455;
+var455 = NULL;
+struct class_Str var456;
+var456.buf = NULL;
+struct class_List_Type__057f9c6088* var457;
+var457 = NULL;
+struct class__null___Type__8438ac3dcf var458;
+var458.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var459;
+var459 = NULL;
+struct class_Method_bfbd73ad15* var460;
+var460 = NULL;
+struct class_List_Method__1e0ab9c757* var461;
+var461 = NULL;
+struct class_BasicType_899b9c9f8e* var462;
+var462 = NULL;
+struct class_List_Method__1e0ab9c757* var463;
+var463 = NULL;
+struct class_Str var464;
+var464.buf = NULL;
+struct class_List_Type__057f9c6088* var465;
+var465 = NULL;
+struct class__null___Type__8438ac3dcf var466;
+var466.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var467;
+var467 = NULL;
+struct class_Method_bfbd73ad15* var468;
+var468 = NULL;
+struct class_Str var469;
+var469.buf = NULL;
+struct class_List_Type__057f9c6088* var470;
+var470 = NULL;
+struct class__null___Type__8438ac3dcf var471;
+var471.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var472;
+var472 = NULL;
+struct class_Method_bfbd73ad15* var473;
+var473 = NULL;
+struct class_List_Method__1e0ab9c757* var474;
+var474 = NULL;
+struct class_Builtins_bd980a9f08* retval;
+var1 = string9_Bool_acbf1f6d10; string_incref(var1);
+var2 = oomph_false;
+var3 = ctor_List_Method__1e0ab9c757();
+var4 = ctor_List_Member__7525bf27e3();
+var5 = oomph_null;
+var6 = oomph_null;
+var7 = oomph_false;
+var8 = (struct class__null___List_Type___114a421a91){ .val = { .item0 = var5 }, .membernum = 0 };
+var9 = (struct class__null___GenericSource__4440b6073d){ .val = { .item0 = var6 }, .membernum = 0 };
+var10 = ctor_BasicType_899b9c9f8e(var1,var2,var3,var4,var8,var9,var7);
+var11 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var10 }, .membernum = 1 };
+var10 = NULL;
+var12 = string10_Float_55d3a95f58; string_incref(var12);
+var13 = oomph_false;
+var14 = ctor_List_Method__1e0ab9c757();
+var15 = ctor_List_Member__7525bf27e3();
+var16 = oomph_null;
+var17 = oomph_null;
+var18 = oomph_false;
+var19 = (struct class__null___List_Type___114a421a91){ .val = { .item0 = var16 }, .membernum = 0 };
+var20 = (struct class__null___GenericSource__4440b6073d){ .val = { .item0 = var17 }, .membernum = 0 };
+var21 = ctor_BasicType_899b9c9f8e(var12,var13,var14,var15,var19,var20,var18);
+var22 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var21 }, .membernum = 1 };
+var21 = NULL;
+var23 = string11_Int_5038c54e80; string_incref(var23);
+var24 = oomph_false;
+var25 = ctor_List_Method__1e0ab9c757();
+var26 = ctor_List_Member__7525bf27e3();
+var27 = oomph_null;
+var28 = oomph_null;
+var29 = oomph_false;
+var30 = (struct class__null___List_Type___114a421a91){ .val = { .item0 = var27 }, .membernum = 0 };
+var31 = (struct class__null___GenericSource__4440b6073d){ .val = { .item0 = var28 }, .membernum = 0 };
+var32 = ctor_BasicType_899b9c9f8e(var23,var24,var25,var26,var30,var31,var29);
+var33 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var32 }, .membernum = 1 };
+var32 = NULL;
+var34 = string12_null_aa5fdd6b0a; string_incref(var34);
+var35 = oomph_false;
+var36 = ctor_List_Method__1e0ab9c757();
+var37 = ctor_List_Member__7525bf27e3();
+var38 = oomph_null;
+var39 = oomph_null;
+var40 = oomph_false;
+var41 = (struct class__null___List_Type___114a421a91){ .val = { .item0 = var38 }, .membernum = 0 };
+var42 = (struct class__null___GenericSource__4440b6073d){ .val = { .item0 = var39 }, .membernum = 0 };
+var43 = ctor_BasicType_899b9c9f8e(var34,var35,var36,var37,var41,var42,var40);
+var44 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var43 }, .membernum = 1 };
+var43 = NULL;
+var45 = string13_Str_20e4558410; string_incref(var45);
+var46 = oomph_true;
+var47 = ctor_List_Method__1e0ab9c757();
+var48 = ctor_List_Member__7525bf27e3();
+var49 = oomph_null;
+var50 = oomph_null;
+var51 = oomph_false;
+var52 = (struct class__null___List_Type___114a421a91){ .val = { .item0 = var49 }, .membernum = 0 };
+var53 = (struct class__null___GenericSource__4440b6073d){ .val = { .item0 = var50 }, .membernum = 0 };
+var54 = ctor_BasicType_899b9c9f8e(var45,var46,var47,var48,var52,var53,var51);
+var55 = (struct class_Type_87e1ce5c5e){ .val = { .item1 = var54 }, .membernum = 1 };
+var54 = NULL;
+var56 = string14_List_0158030c4b; string_incref(var56);
+var57 = ctor_Generic_c39b95ec73(var56);
+var58 = string15_bool_eq_f3ca56a82f; string_incref(var58);
+var59 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var59,var11);
+meth_List_Type__057f9c6088_push(var59,var11);
+var60 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var11 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var11);
+var61 = ctor_FunctionType_4e16d0ea53(var59,var60);
+var62 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var61 }, .membernum = 2 };
+var61 = NULL;
+var63 = ctor_BuiltinVariable_f6e0cdd1b6(var58,var62);
+var64 = string16_bool_not_0ab0afb19e; string_incref(var64);
+var65 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var65,var11);
+var66 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var11 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var11);
+var67 = ctor_FunctionType_4e16d0ea53(var65,var66);
+var68 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var67 }, .membernum = 2 };
+var67 = NULL;
+var69 = ctor_BuiltinVariable_f6e0cdd1b6(var64,var68);
+var70 = string17_float_add_f2b48acb0e; string_incref(var70);
+var71 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var71,var22);
+meth_List_Type__057f9c6088_push(var71,var22);
+var72 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var22 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var22);
+var73 = ctor_FunctionType_4e16d0ea53(var71,var72);
+var74 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var73 }, .membernum = 2 };
+var73 = NULL;
+var75 = ctor_BuiltinVariable_f6e0cdd1b6(var70,var74);
+var76 = string18_float_div_b672f0f5f3; string_incref(var76);
+var77 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var77,var22);
+meth_List_Type__057f9c6088_push(var77,var22);
+var78 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var22 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var22);
+var79 = ctor_FunctionType_4e16d0ea53(var77,var78);
+var80 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var79 }, .membernum = 2 };
+var79 = NULL;
+var81 = ctor_BuiltinVariable_f6e0cdd1b6(var76,var80);
+var82 = string19_float_eq_4b557ebd3b; string_incref(var82);
+var83 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var83,var22);
+meth_List_Type__057f9c6088_push(var83,var22);
+var84 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var11 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var11);
+var85 = ctor_FunctionType_4e16d0ea53(var83,var84);
+var86 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var85 }, .membernum = 2 };
+var85 = NULL;
+var87 = ctor_BuiltinVariable_f6e0cdd1b6(var82,var86);
+var88 = string20_float_gt_a968637788; string_incref(var88);
+var89 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var89,var22);
+meth_List_Type__057f9c6088_push(var89,var22);
+var90 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var11 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var11);
+var91 = ctor_FunctionType_4e16d0ea53(var89,var90);
+var92 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var91 }, .membernum = 2 };
+var91 = NULL;
+var93 = ctor_BuiltinVariable_f6e0cdd1b6(var88,var92);
+var94 = string21_float_mod_c3094f1920; string_incref(var94);
+var95 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var95,var22);
+meth_List_Type__057f9c6088_push(var95,var22);
+var96 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var22 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var22);
+var97 = ctor_FunctionType_4e16d0ea53(var95,var96);
+var98 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var97 }, .membernum = 2 };
+var97 = NULL;
+var99 = ctor_BuiltinVariable_f6e0cdd1b6(var94,var98);
+var100 = string22_float_mul_f4198b04ce; string_incref(var100);
+var101 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var101,var22);
+meth_List_Type__057f9c6088_push(var101,var22);
+var102 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var22 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var22);
+var103 = ctor_FunctionType_4e16d0ea53(var101,var102);
+var104 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var103 }, .membernum = 2 };
+var103 = NULL;
+var105 = ctor_BuiltinVariable_f6e0cdd1b6(var100,var104);
+var106 = string23_float_neg_cd6ba905c0; string_incref(var106);
+var107 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var107,var22);
+var108 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var22 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var22);
+var109 = ctor_FunctionType_4e16d0ea53(var107,var108);
+var110 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var109 }, .membernum = 2 };
+var109 = NULL;
+var111 = ctor_BuiltinVariable_f6e0cdd1b6(var106,var110);
+var112 = string24_float_sub_18c5b015e8; string_incref(var112);
+var113 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var113,var22);
+meth_List_Type__057f9c6088_push(var113,var22);
+var114 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var22 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var22);
+var115 = ctor_FunctionType_4e16d0ea53(var113,var114);
+var116 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var115 }, .membernum = 2 };
+var115 = NULL;
+var117 = ctor_BuiltinVariable_f6e0cdd1b6(var112,var116);
+var118 = string25_int2float_1dcccb8517; string_incref(var118);
+var119 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var119,var33);
+var120 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var22 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var22);
+var121 = ctor_FunctionType_4e16d0ea53(var119,var120);
+var122 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var121 }, .membernum = 2 };
+var121 = NULL;
+var123 = ctor_BuiltinVariable_f6e0cdd1b6(var118,var122);
+var124 = string26_int_add_8de62f669a; string_incref(var124);
+var125 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var125,var33);
+meth_List_Type__057f9c6088_push(var125,var33);
+var126 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var33 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var33);
+var127 = ctor_FunctionType_4e16d0ea53(var125,var126);
+var128 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var127 }, .membernum = 2 };
+var127 = NULL;
+var129 = ctor_BuiltinVariable_f6e0cdd1b6(var124,var128);
+var130 = string27_int_eq_72ff05e4e8; string_incref(var130);
+var131 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var131,var33);
+meth_List_Type__057f9c6088_push(var131,var33);
+var132 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var11 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var11);
+var133 = ctor_FunctionType_4e16d0ea53(var131,var132);
+var134 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var133 }, .membernum = 2 };
+var133 = NULL;
+var135 = ctor_BuiltinVariable_f6e0cdd1b6(var130,var134);
+var136 = string28_int_gt_6af61ee36a; string_incref(var136);
+var137 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var137,var33);
+meth_List_Type__057f9c6088_push(var137,var33);
+var138 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var11 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var11);
+var139 = ctor_FunctionType_4e16d0ea53(var137,var138);
+var140 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var139 }, .membernum = 2 };
+var139 = NULL;
+var141 = ctor_BuiltinVariable_f6e0cdd1b6(var136,var140);
+var142 = string29_int_mod_80f233a6b5; string_incref(var142);
+var143 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var143,var33);
+meth_List_Type__057f9c6088_push(var143,var33);
+var144 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var33 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var33);
+var145 = ctor_FunctionType_4e16d0ea53(var143,var144);
+var146 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var145 }, .membernum = 2 };
+var145 = NULL;
+var147 = ctor_BuiltinVariable_f6e0cdd1b6(var142,var146);
+var148 = string30_int_mul_7001dbacd9; string_incref(var148);
+var149 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var149,var33);
+meth_List_Type__057f9c6088_push(var149,var33);
+var150 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var33 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var33);
+var151 = ctor_FunctionType_4e16d0ea53(var149,var150);
+var152 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var151 }, .membernum = 2 };
+var151 = NULL;
+var153 = ctor_BuiltinVariable_f6e0cdd1b6(var148,var152);
+var154 = string31_int_neg_c50305453f; string_incref(var154);
+var155 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var155,var33);
+var156 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var33 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var33);
+var157 = ctor_FunctionType_4e16d0ea53(var155,var156);
+var158 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var157 }, .membernum = 2 };
+var157 = NULL;
+var159 = ctor_BuiltinVariable_f6e0cdd1b6(var154,var158);
+var160 = string32_int_sub_1f22107be0; string_incref(var160);
+var161 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var161,var33);
+meth_List_Type__057f9c6088_push(var161,var33);
+var162 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var33 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var33);
+var163 = ctor_FunctionType_4e16d0ea53(var161,var162);
+var164 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var163 }, .membernum = 2 };
+var163 = NULL;
+var165 = ctor_BuiltinVariable_f6e0cdd1b6(var160,var164);
+var166 = string33_string_concat_2f0423f2b2; string_incref(var166);
+var167 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var167,var55);
+meth_List_Type__057f9c6088_push(var167,var55);
+var168 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var169 = ctor_FunctionType_4e16d0ea53(var167,var168);
+var170 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var169 }, .membernum = 2 };
+var169 = NULL;
+var171 = ctor_BuiltinVariable_f6e0cdd1b6(var166,var170);
+var172 = string34_string_eq_bddc122938; string_incref(var172);
+var173 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var173,var55);
+meth_List_Type__057f9c6088_push(var173,var55);
+var174 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var11 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var11);
+var175 = ctor_FunctionType_4e16d0ea53(var173,var174);
+var176 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var175 }, .membernum = 2 };
+var175 = NULL;
+var177 = ctor_BuiltinVariable_f6e0cdd1b6(var172,var176);
+var178 = ctor_List_BuiltinVariable__27288a8fae();
+meth_List_BuiltinVariable__27288a8fae_push(var178,var63);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var69);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var75);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var81);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var87);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var93);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var99);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var105);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var111);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var117);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var123);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var129);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var135);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var141);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var147);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var153);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var159);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var165);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var171);
+meth_List_BuiltinVariable__27288a8fae_push(var178,var177);
+var179 = ctor_List_BuiltinVariable__27288a8fae();
+var180 = ctor_List_BasicType__d02960f5a1();
+var181 = ctor_Builtins_bd980a9f08(var11,var22,var33,var44,var55,var57,var179,var178,var180);
+var182 = var181->memb_cleanup_list;
+incref(var182);
+var183 = meth_Builtins_bd980a9f08_get_builtin_types(var181);
+var184 = ctor_List_BasicType__d02960f5a1();
+var185 = meth_List_Type__057f9c6088_length(var183);
+meth_List_BasicType__d02960f5a1___reserve(var184,var185);
+var186 = 0LL;
+label187: (void)0;
+if (var186 >= var183->len) goto label189;
+var188 = var183->data[var186++];
+decref((var190), dtor_BasicType_899b9c9f8e);
+var190 = NULL;
+
+            if (var188.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var190 = var188.val.item1;
+            incref(var190);
+meth_List_BasicType__d02960f5a1_push(var184,var190);
+if (oomph_true) goto label187;
+label189: (void)0;
+meth_List_BasicType__d02960f5a1_push_all(var182,var184);
+var191 = string35___argv_count_47de45ce18; string_incref(var191);
+var192 = ctor_List_Type__057f9c6088();
+var193 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var33 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var33);
+var194 = ctor_FunctionType_4e16d0ea53(var192,var193);
+var195 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var194 }, .membernum = 2 };
+var194 = NULL;
+var196 = ctor_BuiltinVariable_f6e0cdd1b6(var191,var195);
+var197 = string36___argv_get_b1144bfd80; string_incref(var197);
+var198 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var198,var33);
+var199 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var200 = ctor_FunctionType_4e16d0ea53(var198,var199);
+var201 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var200 }, .membernum = 2 };
+var200 = NULL;
+var202 = ctor_BuiltinVariable_f6e0cdd1b6(var197,var201);
+var203 = string37___get_first_char_9b22e105de; string_incref(var203);
+var204 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var204,var55);
+var205 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var206 = ctor_FunctionType_4e16d0ea53(var204,var205);
+var207 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var206 }, .membernum = 2 };
+var206 = NULL;
+var208 = ctor_BuiltinVariable_f6e0cdd1b6(var203,var207);
+var209 = string38___get_utf8_byte_1c89d88bf6; string_incref(var209);
+var210 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var210,var55);
+meth_List_Type__057f9c6088_push(var210,var33);
+var211 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var33 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var33);
+var212 = ctor_FunctionType_4e16d0ea53(var210,var211);
+var213 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var212 }, .membernum = 2 };
+var212 = NULL;
+var214 = ctor_BuiltinVariable_f6e0cdd1b6(var209,var213);
+var215 = string39___hash_48b11e2146; string_incref(var215);
+var216 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var216,var55);
+meth_List_Type__057f9c6088_push(var216,var55);
+var217 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var218 = ctor_FunctionType_4e16d0ea53(var216,var217);
+var219 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var218 }, .membernum = 2 };
+var218 = NULL;
+var220 = ctor_BuiltinVariable_f6e0cdd1b6(var215,var219);
+var221 = string40___io_mkdir_d5bc8c82b6; string_incref(var221);
+var222 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var222,var55);
+var223 = oomph_null;
+var224 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var223 }, .membernum = 0 };
+var225 = ctor_FunctionType_4e16d0ea53(var222,var224);
+var226 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var225 }, .membernum = 2 };
+var225 = NULL;
+var227 = ctor_BuiltinVariable_f6e0cdd1b6(var221,var226);
+var228 = string41___io_read_file_1011907c81; string_incref(var228);
+var229 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var229,var55);
+var230 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var231 = ctor_FunctionType_4e16d0ea53(var229,var230);
+var232 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var231 }, .membernum = 2 };
+var231 = NULL;
+var233 = ctor_BuiltinVariable_f6e0cdd1b6(var228,var232);
+var234 = string42___io_write_file_ba52f693db; string_incref(var234);
+var235 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var235,var55);
+meth_List_Type__057f9c6088_push(var235,var55);
+var236 = oomph_null;
+var237 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var236 }, .membernum = 0 };
+var238 = ctor_FunctionType_4e16d0ea53(var235,var237);
+var239 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var238 }, .membernum = 2 };
+var238 = NULL;
+var240 = ctor_BuiltinVariable_f6e0cdd1b6(var234,var239);
+var241 = string43___remove_prefix_e6b351428c; string_incref(var241);
+var242 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var242,var55);
+meth_List_Type__057f9c6088_push(var242,var55);
+var243 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var244 = ctor_FunctionType_4e16d0ea53(var242,var243);
+var245 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var244 }, .membernum = 2 };
+var244 = NULL;
+var246 = ctor_BuiltinVariable_f6e0cdd1b6(var241,var245);
+var247 = string44___remove_suffix_92f8025a60; string_incref(var247);
+var248 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var248,var55);
+meth_List_Type__057f9c6088_push(var248,var55);
+var249 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var250 = ctor_FunctionType_4e16d0ea53(var248,var249);
+var251 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var250 }, .membernum = 2 };
+var250 = NULL;
+var252 = ctor_BuiltinVariable_f6e0cdd1b6(var247,var251);
+var253 = string45___run_subprocess_a2e002945a; string_incref(var253);
+var254 = meth_Builtins_bd980a9f08_generic2type(var181,var57,var55);
+var255 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var255,var254);
+var256 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var33 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var33);
+var257 = ctor_FunctionType_4e16d0ea53(var255,var256);
+var258 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var257 }, .membernum = 2 };
+var257 = NULL;
+var259 = ctor_BuiltinVariable_f6e0cdd1b6(var253,var258);
+var260 = string46___slice_until_substring_a840ec4846; string_incref(var260);
+var261 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var261,var55);
+meth_List_Type__057f9c6088_push(var261,var55);
+var262 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var263 = ctor_FunctionType_4e16d0ea53(var261,var262);
+var264 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var263 }, .membernum = 2 };
+var263 = NULL;
+var265 = ctor_BuiltinVariable_f6e0cdd1b6(var260,var264);
+var266 = string47___utf8_len_5e5e780503; string_incref(var266);
+var267 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var267,var55);
+var268 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var33 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var33);
+var269 = ctor_FunctionType_4e16d0ea53(var267,var268);
+var270 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var269 }, .membernum = 2 };
+var269 = NULL;
+var271 = ctor_BuiltinVariable_f6e0cdd1b6(var266,var270);
+var272 = string48_assert_800309a970; string_incref(var272);
+var273 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var273,var11);
+meth_List_Type__057f9c6088_push(var273,var55);
+meth_List_Type__057f9c6088_push(var273,var33);
+var274 = oomph_null;
+var275 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var274 }, .membernum = 0 };
+var276 = ctor_FunctionType_4e16d0ea53(var273,var275);
+var277 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var276 }, .membernum = 2 };
+var276 = NULL;
+var278 = ctor_BuiltinVariable_f6e0cdd1b6(var272,var277);
+var279 = string49_false_7d64c96b4e; string_incref(var279);
+var280 = ctor_BuiltinVariable_f6e0cdd1b6(var279,var11);
+var281 = string12_null_aa5fdd6b0a; string_incref(var281);
+var282 = ctor_BuiltinVariable_f6e0cdd1b6(var281,var44);
+var283 = string50_print_b674acfe88; string_incref(var283);
+var284 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var284,var55);
+var285 = oomph_null;
+var286 = (struct class__null___Type__8438ac3dcf){ .val = { .item0 = var285 }, .membernum = 0 };
+var287 = ctor_FunctionType_4e16d0ea53(var284,var286);
+var288 = (struct class_Type_87e1ce5c5e){ .val = { .item2 = var287 }, .membernum = 2 };
+var287 = NULL;
+var289 = ctor_BuiltinVariable_f6e0cdd1b6(var283,var288);
+var290 = string51_true_d9943797fa; string_incref(var290);
+var291 = ctor_BuiltinVariable_f6e0cdd1b6(var290,var11);
+var292 = ctor_List_BuiltinVariable__27288a8fae();
+meth_List_BuiltinVariable__27288a8fae_push(var292,var196);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var202);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var208);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var214);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var220);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var227);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var233);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var240);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var246);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var252);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var259);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var265);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var271);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var278);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var280);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var282);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var289);
+meth_List_BuiltinVariable__27288a8fae_push(var292,var291);
+meth_List_BuiltinVariable__27288a8fae_push_all(var179,var292);
+
+            if (var22.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var293 = var22.val.item1;
+            incref(var293);
+var294 = var293->memb_methods;
+incref(var294);
+var295 = string52_ceil_14eb2d9b52; string_incref(var295);
+var296 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var296,var22);
+var297 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var33 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var33);
+var298 = ctor_FunctionType_4e16d0ea53(var296,var297);
+var299 = ctor_Method_bfbd73ad15(var295,var298);
+var300 = string53_equals_3cdacaa0de; string_incref(var300);
+var301 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var301,var22);
+meth_List_Type__057f9c6088_push(var301,var22);
+var302 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var11 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var11);
+var303 = ctor_FunctionType_4e16d0ea53(var301,var302);
+var304 = ctor_Method_bfbd73ad15(var300,var303);
+var305 = string54_floor_4b9e75023f; string_incref(var305);
+var306 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var306,var22);
+var307 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var33 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var33);
+var308 = ctor_FunctionType_4e16d0ea53(var306,var307);
+var309 = ctor_Method_bfbd73ad15(var305,var308);
+var310 = string55_round_909be8906b; string_incref(var310);
+var311 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var311,var22);
+var312 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var33 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var33);
+var313 = ctor_FunctionType_4e16d0ea53(var311,var312);
+var314 = ctor_Method_bfbd73ad15(var310,var313);
+var315 = string56_to_string_2072f858fb; string_incref(var315);
+var316 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var316,var22);
+var317 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var318 = ctor_FunctionType_4e16d0ea53(var316,var317);
+var319 = ctor_Method_bfbd73ad15(var315,var318);
+var320 = string57_truncate_7397b4c57d; string_incref(var320);
+var321 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var321,var22);
+var322 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var33 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var33);
+var323 = ctor_FunctionType_4e16d0ea53(var321,var322);
+var324 = ctor_Method_bfbd73ad15(var320,var323);
+var325 = ctor_List_Method__1e0ab9c757();
+meth_List_Method__1e0ab9c757_push(var325,var299);
+meth_List_Method__1e0ab9c757_push(var325,var304);
+meth_List_Method__1e0ab9c757_push(var325,var309);
+meth_List_Method__1e0ab9c757_push(var325,var314);
+meth_List_Method__1e0ab9c757_push(var325,var319);
+meth_List_Method__1e0ab9c757_push(var325,var324);
+meth_List_Method__1e0ab9c757_push_all(var294,var325);
+
+            if (var55.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var326 = var55.val.item1;
+            incref(var326);
+var327 = var326->memb_methods;
+incref(var327);
+var328 = string58___contains_5cbfa333fa; string_incref(var328);
+var329 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var329,var55);
+meth_List_Type__057f9c6088_push(var329,var55);
+var330 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var11 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var11);
+var331 = ctor_FunctionType_4e16d0ea53(var329,var330);
+var332 = ctor_Method_bfbd73ad15(var328,var331);
+var333 = string59_center_pad_085e2097d2; string_incref(var333);
+var334 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var334,var55);
+meth_List_Type__057f9c6088_push(var334,var33);
+meth_List_Type__057f9c6088_push(var334,var55);
+var335 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var336 = ctor_FunctionType_4e16d0ea53(var334,var335);
+var337 = ctor_Method_bfbd73ad15(var333,var336);
+var338 = string60_count_1b74a44a8f; string_incref(var338);
+var339 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var339,var55);
+meth_List_Type__057f9c6088_push(var339,var55);
+var340 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var33 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var33);
+var341 = ctor_FunctionType_4e16d0ea53(var339,var340);
+var342 = ctor_Method_bfbd73ad15(var338,var341);
+var343 = string61_ends_with_f8ce01c236; string_incref(var343);
+var344 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var344,var55);
+meth_List_Type__057f9c6088_push(var344,var55);
+var345 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var11 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var11);
+var346 = ctor_FunctionType_4e16d0ea53(var344,var345);
+var347 = ctor_Method_bfbd73ad15(var343,var346);
+var348 = string53_equals_3cdacaa0de; string_incref(var348);
+var349 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var349,var55);
+meth_List_Type__057f9c6088_push(var349,var55);
+var350 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var11 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var11);
+var351 = ctor_FunctionType_4e16d0ea53(var349,var350);
+var352 = ctor_Method_bfbd73ad15(var348,var351);
+var353 = string62_get_utf8_499e039cac; string_incref(var353);
+var354 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var354,var55);
+var355 = meth_Builtins_bd980a9f08_generic2type(var181,var57,var33);
+var356 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var355 }, .membernum = 1 };
+var355.membernum = -1;
+var357 = ctor_FunctionType_4e16d0ea53(var354,var356);
+var358 = ctor_Method_bfbd73ad15(var353,var357);
+var359 = string63_left_pad_eaa934aa4e; string_incref(var359);
+var360 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var360,var55);
+meth_List_Type__057f9c6088_push(var360,var33);
+meth_List_Type__057f9c6088_push(var360,var55);
+var361 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var362 = ctor_FunctionType_4e16d0ea53(var360,var361);
+var363 = ctor_Method_bfbd73ad15(var359,var362);
+var364 = string64_left_trim_d6db1f99c7; string_incref(var364);
+var365 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var365,var55);
+var366 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var367 = ctor_FunctionType_4e16d0ea53(var365,var366);
+var368 = ctor_Method_bfbd73ad15(var364,var367);
+var369 = string65_length_e4a90d14d3; string_incref(var369);
+var370 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var370,var55);
+var371 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var33 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var33);
+var372 = ctor_FunctionType_4e16d0ea53(var370,var371);
+var373 = ctor_Method_bfbd73ad15(var369,var372);
+var374 = string66_remove_prefix_4ff6a671da; string_incref(var374);
+var375 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var375,var55);
+meth_List_Type__057f9c6088_push(var375,var55);
+var376 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var377 = ctor_FunctionType_4e16d0ea53(var375,var376);
+var378 = ctor_Method_bfbd73ad15(var374,var377);
+var379 = string67_remove_suffix_dfe859affe; string_incref(var379);
+var380 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var380,var55);
+meth_List_Type__057f9c6088_push(var380,var55);
+var381 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var382 = ctor_FunctionType_4e16d0ea53(var380,var381);
+var383 = ctor_Method_bfbd73ad15(var379,var382);
+var384 = string68_repeat_f64b7ddd32; string_incref(var384);
+var385 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var385,var55);
+meth_List_Type__057f9c6088_push(var385,var33);
+var386 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var387 = ctor_FunctionType_4e16d0ea53(var385,var386);
+var388 = ctor_Method_bfbd73ad15(var384,var387);
+var389 = string69_replace_b97b01c74d; string_incref(var389);
+var390 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var390,var55);
+meth_List_Type__057f9c6088_push(var390,var55);
+meth_List_Type__057f9c6088_push(var390,var55);
+var391 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var392 = ctor_FunctionType_4e16d0ea53(var390,var391);
+var393 = ctor_Method_bfbd73ad15(var389,var392);
+var394 = string70_right_pad_b63d58a469; string_incref(var394);
+var395 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var395,var55);
+meth_List_Type__057f9c6088_push(var395,var33);
+meth_List_Type__057f9c6088_push(var395,var55);
+var396 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var397 = ctor_FunctionType_4e16d0ea53(var395,var396);
+var398 = ctor_Method_bfbd73ad15(var394,var397);
+var399 = string71_right_trim_88161a8c73; string_incref(var399);
+var400 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var400,var55);
+var401 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var402 = ctor_FunctionType_4e16d0ea53(var400,var401);
+var403 = ctor_Method_bfbd73ad15(var399,var402);
+var404 = string72_split_ebbdffc086; string_incref(var404);
+var405 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var405,var55);
+meth_List_Type__057f9c6088_push(var405,var55);
+var406 = meth_Builtins_bd980a9f08_generic2type(var181,var57,var55);
+var407 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var406 }, .membernum = 1 };
+var406.membernum = -1;
+var408 = ctor_FunctionType_4e16d0ea53(var405,var407);
+var409 = ctor_Method_bfbd73ad15(var404,var408);
+var410 = string73_starts_with_618203f4e4; string_incref(var410);
+var411 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var411,var55);
+meth_List_Type__057f9c6088_push(var411,var55);
+var412 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var11 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var11);
+var413 = ctor_FunctionType_4e16d0ea53(var411,var412);
+var414 = ctor_Method_bfbd73ad15(var410,var413);
+var415 = string74_to_float_3ec08fb023; string_incref(var415);
+var416 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var416,var55);
+var417 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var22 }, .membernum = 1 };
+var22.membernum = -1;
+var418 = ctor_FunctionType_4e16d0ea53(var416,var417);
+var419 = ctor_Method_bfbd73ad15(var415,var418);
+var420 = string75_to_int_611dcf308a; string_incref(var420);
+var421 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var421,var55);
+var422 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var33 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var33);
+var423 = ctor_FunctionType_4e16d0ea53(var421,var422);
+var424 = ctor_Method_bfbd73ad15(var420,var423);
+var425 = string56_to_string_2072f858fb; string_incref(var425);
+var426 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var426,var55);
+var427 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var428 = ctor_FunctionType_4e16d0ea53(var426,var427);
+var429 = ctor_Method_bfbd73ad15(var425,var428);
+var430 = string76_trim_59b4d02c51; string_incref(var430);
+var431 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var431,var55);
+var432 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var433 = ctor_FunctionType_4e16d0ea53(var431,var432);
+var434 = ctor_Method_bfbd73ad15(var430,var433);
+var435 = ctor_List_Method__1e0ab9c757();
+meth_List_Method__1e0ab9c757_push(var435,var332);
+meth_List_Method__1e0ab9c757_push(var435,var337);
+meth_List_Method__1e0ab9c757_push(var435,var342);
+meth_List_Method__1e0ab9c757_push(var435,var347);
+meth_List_Method__1e0ab9c757_push(var435,var352);
+meth_List_Method__1e0ab9c757_push(var435,var358);
+meth_List_Method__1e0ab9c757_push(var435,var363);
+meth_List_Method__1e0ab9c757_push(var435,var368);
+meth_List_Method__1e0ab9c757_push(var435,var373);
+meth_List_Method__1e0ab9c757_push(var435,var378);
+meth_List_Method__1e0ab9c757_push(var435,var383);
+meth_List_Method__1e0ab9c757_push(var435,var388);
+meth_List_Method__1e0ab9c757_push(var435,var393);
+meth_List_Method__1e0ab9c757_push(var435,var398);
+meth_List_Method__1e0ab9c757_push(var435,var403);
+meth_List_Method__1e0ab9c757_push(var435,var409);
+meth_List_Method__1e0ab9c757_push(var435,var414);
+meth_List_Method__1e0ab9c757_push(var435,var419);
+meth_List_Method__1e0ab9c757_push(var435,var424);
+meth_List_Method__1e0ab9c757_push(var435,var429);
+meth_List_Method__1e0ab9c757_push(var435,var434);
+meth_List_Method__1e0ab9c757_push_all(var327,var435);
+
+            if (var11.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var436 = var11.val.item1;
+            incref(var436);
+var437 = var436->memb_methods;
+incref(var437);
+var438 = string53_equals_3cdacaa0de; string_incref(var438);
+var439 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var439,var11);
+meth_List_Type__057f9c6088_push(var439,var11);
+var440 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var11 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var11);
+var441 = ctor_FunctionType_4e16d0ea53(var439,var440);
+var442 = ctor_Method_bfbd73ad15(var438,var441);
+var443 = string56_to_string_2072f858fb; string_incref(var443);
+var444 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var444,var11);
+var445 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var446 = ctor_FunctionType_4e16d0ea53(var444,var445);
+var447 = ctor_Method_bfbd73ad15(var443,var446);
+var448 = ctor_List_Method__1e0ab9c757();
+meth_List_Method__1e0ab9c757_push(var448,var442);
+meth_List_Method__1e0ab9c757_push(var448,var447);
+meth_List_Method__1e0ab9c757_push_all(var437,var448);
+
+            if (var33.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var449 = var33.val.item1;
+            incref(var449);
+var450 = var449->memb_methods;
+incref(var450);
+var451 = string53_equals_3cdacaa0de; string_incref(var451);
+var452 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var452,var33);
+meth_List_Type__057f9c6088_push(var452,var33);
+var453 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var11 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var11);
+var454 = ctor_FunctionType_4e16d0ea53(var452,var453);
+var455 = ctor_Method_bfbd73ad15(var451,var454);
+var456 = string56_to_string_2072f858fb; string_incref(var456);
+var457 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var457,var33);
+var458 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var55);
+var459 = ctor_FunctionType_4e16d0ea53(var457,var458);
+var460 = ctor_Method_bfbd73ad15(var456,var459);
+var461 = ctor_List_Method__1e0ab9c757();
+meth_List_Method__1e0ab9c757_push(var461,var455);
+meth_List_Method__1e0ab9c757_push(var461,var460);
+meth_List_Method__1e0ab9c757_push_all(var450,var461);
+
+            if (var44.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var462 = var44.val.item1;
+            incref(var462);
+var463 = var462->memb_methods;
+incref(var463);
+var464 = string53_equals_3cdacaa0de; string_incref(var464);
+var465 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var465,var44);
+meth_List_Type__057f9c6088_push(var465,var44);
+var466 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var11 }, .membernum = 1 };
+var11.membernum = -1;
+var467 = ctor_FunctionType_4e16d0ea53(var465,var466);
+var468 = ctor_Method_bfbd73ad15(var464,var467);
+var469 = string56_to_string_2072f858fb; string_incref(var469);
+var470 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var470,var44);
+var471 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var55 }, .membernum = 1 };
+var55.membernum = -1;
+var472 = ctor_FunctionType_4e16d0ea53(var470,var471);
+var473 = ctor_Method_bfbd73ad15(var469,var472);
+var474 = ctor_List_Method__1e0ab9c757();
+meth_List_Method__1e0ab9c757_push(var474,var468);
+meth_List_Method__1e0ab9c757_push(var474,var473);
+meth_List_Method__1e0ab9c757_push_all(var463,var474);
+retval = var181; var181 = NULL;
+goto out;
+out: (void)0;
+decref((var474), dtor_List_Method__1e0ab9c757);
+decref((var473), dtor_Method_bfbd73ad15);
+decref((var472), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var471);
+decref((var470), dtor_List_Type__057f9c6088);
+string_decref(var469);
+decref((var468), dtor_Method_bfbd73ad15);
+decref((var467), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var466);
+decref((var465), dtor_List_Type__057f9c6088);
+string_decref(var464);
+decref((var463), dtor_List_Method__1e0ab9c757);
+decref((var462), dtor_BasicType_899b9c9f8e);
+decref((var461), dtor_List_Method__1e0ab9c757);
+decref((var460), dtor_Method_bfbd73ad15);
+decref((var459), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var458);
+decref((var457), dtor_List_Type__057f9c6088);
+string_decref(var456);
+decref((var455), dtor_Method_bfbd73ad15);
+decref((var454), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var453);
+decref((var452), dtor_List_Type__057f9c6088);
+string_decref(var451);
+decref((var450), dtor_List_Method__1e0ab9c757);
+decref((var449), dtor_BasicType_899b9c9f8e);
+decref((var448), dtor_List_Method__1e0ab9c757);
+decref((var447), dtor_Method_bfbd73ad15);
+decref((var446), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var445);
+decref((var444), dtor_List_Type__057f9c6088);
+string_decref(var443);
+decref((var442), dtor_Method_bfbd73ad15);
+decref((var441), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var440);
+decref((var439), dtor_List_Type__057f9c6088);
+string_decref(var438);
+decref((var437), dtor_List_Method__1e0ab9c757);
+decref((var436), dtor_BasicType_899b9c9f8e);
+decref((var435), dtor_List_Method__1e0ab9c757);
+decref((var434), dtor_Method_bfbd73ad15);
+decref((var433), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var432);
+decref((var431), dtor_List_Type__057f9c6088);
+string_decref(var430);
+decref((var429), dtor_Method_bfbd73ad15);
+decref((var428), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var427);
+decref((var426), dtor_List_Type__057f9c6088);
+string_decref(var425);
+decref((var424), dtor_Method_bfbd73ad15);
+decref((var423), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var422);
+decref((var421), dtor_List_Type__057f9c6088);
+string_decref(var420);
+decref((var419), dtor_Method_bfbd73ad15);
+decref((var418), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var417);
+decref((var416), dtor_List_Type__057f9c6088);
+string_decref(var415);
+decref((var414), dtor_Method_bfbd73ad15);
+decref((var413), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var412);
+decref((var411), dtor_List_Type__057f9c6088);
+string_decref(var410);
+decref((var409), dtor_Method_bfbd73ad15);
+decref((var408), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var407);
+decref_Type_87e1ce5c5e(var406);
+decref((var405), dtor_List_Type__057f9c6088);
+string_decref(var404);
+decref((var403), dtor_Method_bfbd73ad15);
+decref((var402), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var401);
+decref((var400), dtor_List_Type__057f9c6088);
+string_decref(var399);
+decref((var398), dtor_Method_bfbd73ad15);
+decref((var397), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var396);
+decref((var395), dtor_List_Type__057f9c6088);
+string_decref(var394);
+decref((var393), dtor_Method_bfbd73ad15);
+decref((var392), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var391);
+decref((var390), dtor_List_Type__057f9c6088);
+string_decref(var389);
+decref((var388), dtor_Method_bfbd73ad15);
+decref((var387), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var386);
+decref((var385), dtor_List_Type__057f9c6088);
+string_decref(var384);
+decref((var383), dtor_Method_bfbd73ad15);
+decref((var382), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var381);
+decref((var380), dtor_List_Type__057f9c6088);
+string_decref(var379);
+decref((var378), dtor_Method_bfbd73ad15);
+decref((var377), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var376);
+decref((var375), dtor_List_Type__057f9c6088);
+string_decref(var374);
+decref((var373), dtor_Method_bfbd73ad15);
+decref((var372), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var371);
+decref((var370), dtor_List_Type__057f9c6088);
+string_decref(var369);
+decref((var368), dtor_Method_bfbd73ad15);
+decref((var367), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var366);
+decref((var365), dtor_List_Type__057f9c6088);
+string_decref(var364);
+decref((var363), dtor_Method_bfbd73ad15);
+decref((var362), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var361);
+decref((var360), dtor_List_Type__057f9c6088);
+string_decref(var359);
+decref((var358), dtor_Method_bfbd73ad15);
+decref((var357), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var356);
+decref_Type_87e1ce5c5e(var355);
+decref((var354), dtor_List_Type__057f9c6088);
+string_decref(var353);
+decref((var352), dtor_Method_bfbd73ad15);
+decref((var351), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var350);
+decref((var349), dtor_List_Type__057f9c6088);
+string_decref(var348);
+decref((var347), dtor_Method_bfbd73ad15);
+decref((var346), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var345);
+decref((var344), dtor_List_Type__057f9c6088);
+string_decref(var343);
+decref((var342), dtor_Method_bfbd73ad15);
+decref((var341), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var340);
+decref((var339), dtor_List_Type__057f9c6088);
+string_decref(var338);
+decref((var337), dtor_Method_bfbd73ad15);
+decref((var336), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var335);
+decref((var334), dtor_List_Type__057f9c6088);
+string_decref(var333);
+decref((var332), dtor_Method_bfbd73ad15);
+decref((var331), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var330);
+decref((var329), dtor_List_Type__057f9c6088);
+string_decref(var328);
+decref((var327), dtor_List_Method__1e0ab9c757);
+decref((var326), dtor_BasicType_899b9c9f8e);
+decref((var325), dtor_List_Method__1e0ab9c757);
+decref((var324), dtor_Method_bfbd73ad15);
+decref((var323), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var322);
+decref((var321), dtor_List_Type__057f9c6088);
+string_decref(var320);
+decref((var319), dtor_Method_bfbd73ad15);
+decref((var318), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var317);
+decref((var316), dtor_List_Type__057f9c6088);
+string_decref(var315);
+decref((var314), dtor_Method_bfbd73ad15);
+decref((var313), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var312);
+decref((var311), dtor_List_Type__057f9c6088);
+string_decref(var310);
+decref((var309), dtor_Method_bfbd73ad15);
+decref((var308), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var307);
+decref((var306), dtor_List_Type__057f9c6088);
+string_decref(var305);
+decref((var304), dtor_Method_bfbd73ad15);
+decref((var303), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var302);
+decref((var301), dtor_List_Type__057f9c6088);
+string_decref(var300);
+decref((var299), dtor_Method_bfbd73ad15);
+decref((var298), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var297);
+decref((var296), dtor_List_Type__057f9c6088);
+string_decref(var295);
+decref((var294), dtor_List_Method__1e0ab9c757);
+decref((var293), dtor_BasicType_899b9c9f8e);
+decref((var292), dtor_List_BuiltinVariable__27288a8fae);
+decref((var291), dtor_BuiltinVariable_f6e0cdd1b6);
+string_decref(var290);
+decref((var289), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var288);
+decref((var287), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var286);
+(void)0;
+decref((var284), dtor_List_Type__057f9c6088);
+string_decref(var283);
+decref((var282), dtor_BuiltinVariable_f6e0cdd1b6);
+string_decref(var281);
+decref((var280), dtor_BuiltinVariable_f6e0cdd1b6);
+string_decref(var279);
+decref((var278), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var277);
+decref((var276), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var275);
+(void)0;
+decref((var273), dtor_List_Type__057f9c6088);
+string_decref(var272);
+decref((var271), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var270);
+decref((var269), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var268);
+decref((var267), dtor_List_Type__057f9c6088);
+string_decref(var266);
+decref((var265), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var264);
+decref((var263), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var262);
+decref((var261), dtor_List_Type__057f9c6088);
+string_decref(var260);
+decref((var259), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var258);
+decref((var257), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var256);
+decref((var255), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var254);
+string_decref(var253);
+decref((var252), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var251);
+decref((var250), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var249);
+decref((var248), dtor_List_Type__057f9c6088);
+string_decref(var247);
+decref((var246), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var245);
+decref((var244), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var243);
+decref((var242), dtor_List_Type__057f9c6088);
+string_decref(var241);
+decref((var240), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var239);
+decref((var238), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var237);
+(void)0;
+decref((var235), dtor_List_Type__057f9c6088);
+string_decref(var234);
+decref((var233), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var232);
+decref((var231), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var230);
+decref((var229), dtor_List_Type__057f9c6088);
+string_decref(var228);
+decref((var227), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var226);
+decref((var225), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var224);
+(void)0;
+decref((var222), dtor_List_Type__057f9c6088);
+string_decref(var221);
+decref((var220), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var219);
+decref((var218), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var217);
+decref((var216), dtor_List_Type__057f9c6088);
+string_decref(var215);
+decref((var214), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var213);
+decref((var212), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var211);
+decref((var210), dtor_List_Type__057f9c6088);
+string_decref(var209);
+decref((var208), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var207);
+decref((var206), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var205);
+decref((var204), dtor_List_Type__057f9c6088);
+string_decref(var203);
+decref((var202), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var201);
+decref((var200), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var199);
+decref((var198), dtor_List_Type__057f9c6088);
+string_decref(var197);
+decref((var196), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var195);
+decref((var194), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var193);
+decref((var192), dtor_List_Type__057f9c6088);
+string_decref(var191);
+decref((var190), dtor_BasicType_899b9c9f8e);
+(void)0;
+(void)0;
+decref((var184), dtor_List_BasicType__d02960f5a1);
+decref((var183), dtor_List_Type__057f9c6088);
+decref((var182), dtor_List_BasicType__d02960f5a1);
+decref((var181), dtor_Builtins_bd980a9f08);
+decref((var180), dtor_List_BasicType__d02960f5a1);
+decref((var179), dtor_List_BuiltinVariable__27288a8fae);
+decref((var178), dtor_List_BuiltinVariable__27288a8fae);
+decref((var177), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var176);
+decref((var175), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var174);
+decref((var173), dtor_List_Type__057f9c6088);
+string_decref(var172);
+decref((var171), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var170);
+decref((var169), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var168);
+decref((var167), dtor_List_Type__057f9c6088);
+string_decref(var166);
+decref((var165), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var164);
+decref((var163), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var162);
+decref((var161), dtor_List_Type__057f9c6088);
+string_decref(var160);
+decref((var159), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var158);
+decref((var157), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var156);
+decref((var155), dtor_List_Type__057f9c6088);
+string_decref(var154);
+decref((var153), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var152);
+decref((var151), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var150);
+decref((var149), dtor_List_Type__057f9c6088);
+string_decref(var148);
+decref((var147), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var146);
+decref((var145), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var144);
+decref((var143), dtor_List_Type__057f9c6088);
+string_decref(var142);
+decref((var141), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var140);
+decref((var139), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var138);
+decref((var137), dtor_List_Type__057f9c6088);
+string_decref(var136);
+decref((var135), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var134);
+decref((var133), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var132);
+decref((var131), dtor_List_Type__057f9c6088);
+string_decref(var130);
+decref((var129), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var128);
+decref((var127), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var126);
+decref((var125), dtor_List_Type__057f9c6088);
+string_decref(var124);
+decref((var123), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var122);
+decref((var121), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var120);
+decref((var119), dtor_List_Type__057f9c6088);
+string_decref(var118);
+decref((var117), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var116);
+decref((var115), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var114);
+decref((var113), dtor_List_Type__057f9c6088);
+string_decref(var112);
+decref((var111), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var110);
+decref((var109), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var108);
+decref((var107), dtor_List_Type__057f9c6088);
+string_decref(var106);
+decref((var105), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var104);
+decref((var103), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var102);
+decref((var101), dtor_List_Type__057f9c6088);
+string_decref(var100);
+decref((var99), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var98);
+decref((var97), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var96);
+decref((var95), dtor_List_Type__057f9c6088);
+string_decref(var94);
+decref((var93), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var92);
+decref((var91), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var90);
+decref((var89), dtor_List_Type__057f9c6088);
+string_decref(var88);
+decref((var87), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var86);
+decref((var85), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var84);
+decref((var83), dtor_List_Type__057f9c6088);
+string_decref(var82);
+decref((var81), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var80);
+decref((var79), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var78);
+decref((var77), dtor_List_Type__057f9c6088);
+string_decref(var76);
+decref((var75), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var74);
+decref((var73), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var72);
+decref((var71), dtor_List_Type__057f9c6088);
+string_decref(var70);
+decref((var69), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var68);
+decref((var67), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var66);
+decref((var65), dtor_List_Type__057f9c6088);
+string_decref(var64);
+decref((var63), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var62);
+decref((var61), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var60);
+decref((var59), dtor_List_Type__057f9c6088);
+string_decref(var58);
+decref((var57), dtor_Generic_c39b95ec73);
+string_decref(var56);
+decref_Type_87e1ce5c5e(var55);
+decref((var54), dtor_BasicType_899b9c9f8e);
+decref__null___GenericSource__4440b6073d(var53);
+decref__null___List_Type___114a421a91(var52);
+(void)0;
+(void)0;
+(void)0;
+decref((var48), dtor_List_Member__7525bf27e3);
+decref((var47), dtor_List_Method__1e0ab9c757);
+(void)0;
+string_decref(var45);
+decref_Type_87e1ce5c5e(var44);
+decref((var43), dtor_BasicType_899b9c9f8e);
+decref__null___GenericSource__4440b6073d(var42);
+decref__null___List_Type___114a421a91(var41);
+(void)0;
+(void)0;
+(void)0;
+decref((var37), dtor_List_Member__7525bf27e3);
+decref((var36), dtor_List_Method__1e0ab9c757);
+(void)0;
+string_decref(var34);
+decref_Type_87e1ce5c5e(var33);
+decref((var32), dtor_BasicType_899b9c9f8e);
+decref__null___GenericSource__4440b6073d(var31);
+decref__null___List_Type___114a421a91(var30);
+(void)0;
+(void)0;
+(void)0;
+decref((var26), dtor_List_Member__7525bf27e3);
+decref((var25), dtor_List_Method__1e0ab9c757);
+(void)0;
+string_decref(var23);
+decref_Type_87e1ce5c5e(var22);
+decref((var21), dtor_BasicType_899b9c9f8e);
+decref__null___GenericSource__4440b6073d(var20);
+decref__null___List_Type___114a421a91(var19);
+(void)0;
+(void)0;
+(void)0;
+decref((var15), dtor_List_Member__7525bf27e3);
+decref((var14), dtor_List_Method__1e0ab9c757);
+(void)0;
+string_decref(var12);
+decref_Type_87e1ce5c5e(var11);
+decref((var10), dtor_BasicType_899b9c9f8e);
+decref__null___GenericSource__4440b6073d(var9);
+decref__null___List_Type___114a421a91(var8);
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Member__7525bf27e3);
+decref((var3), dtor_List_Method__1e0ab9c757);
+(void)0;
+string_decref(var1);
+return retval;
+}struct class_List_Method__1e0ab9c757* ir_4b1a3e0393_get_methods(struct class_Type_87e1ce5c5e var1, struct class_Builtins_bd980a9f08* var2){bool var3;
+struct class_AutoType_33a5d572cb* var8;
+var8 = NULL;
+bool var9;
+struct class_Str var10;
+var10.buf = NULL;
+int64_t var11;
+struct class_BasicType_899b9c9f8e* var13;
+var13 = NULL;
+struct class_List_Method__1e0ab9c757* var14;
+var14 = NULL;
+struct class_FunctionType_4e16d0ea53* var15;
+var15 = NULL;
+struct class_List_Method__1e0ab9c757* var16;
+var16 = NULL;
+struct class_UnionType_7f899bced1* var17;
+var17 = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_List_Type__057f9c6088* var19;
+var19 = NULL;
+struct class_Type_87e1ce5c5e var20;
+var20.membernum = -1;
+struct class__null___Type__8438ac3dcf var21;
+var21.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var22;
+var22 = NULL;
+struct class_Method_bfbd73ad15* var23;
+var23 = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_List_Type__057f9c6088* var25;
+var25 = NULL;
+struct class_Type_87e1ce5c5e var26;
+var26.membernum = -1;
+struct class__null___Type__8438ac3dcf var27;
+var27.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var28;
+var28 = NULL;
+struct class_Method_bfbd73ad15* var29;
+var29 = NULL;
+struct class_List_Method__1e0ab9c757* var30;
+var30 = NULL;
+struct class_List_Type__057f9c6088* var31;
+var31 = NULL;
+int64_t var32;
+int64_t var33;
+bool var34;
+bool var36;
+struct class_List_Type__057f9c6088* var38;
+var38 = NULL;
+struct class_Type_87e1ce5c5e var39;
+var39.membernum = -1;
+struct class_Type_87e1ce5c5e var40;
+var40.membernum = -1;
+bool var41;
+struct class_List_Type__057f9c6088* var44;
+var44 = NULL;
+struct class_Type_87e1ce5c5e var45;
+var45.membernum = -1;
+struct class_Str var46;
+var46.buf = NULL;
+struct class_Type_87e1ce5c5e var47;
+var47.membernum = -1;
+struct class_List_Type__057f9c6088* var48;
+var48 = NULL;
+struct class__null___Type__8438ac3dcf var49;
+var49.membernum = -1;
+struct class_FunctionType_4e16d0ea53* var50;
+var50 = NULL;
+struct class_Method_bfbd73ad15* var51;
+var51 = NULL;
+struct class_List_Method__1e0ab9c757* retval;
+
+            var3 = (
+                var1.membernum == 0
+            );
+            if (var3) goto label4;
+
+            var3 = (
+                var1.membernum == 1
+            );
+            if (var3) goto label5;
+
+            var3 = (
+                var1.membernum == 2
+            );
+            if (var3) goto label6;
+
+            var3 = (
+                var1.membernum == 3
+            );
+            if (var3) goto label7;
+label4: (void)0;
+
+            if (var1.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var8 = var1.val.item0;
+            incref(var8);
+var9 = oomph_false;
+var10 = string2_self_hosted_ir_oomph_cc2414ff62; string_incref(var10);
+var11 = 368LL;
+oomph_assert(var9,var10,var11);
+if (oomph_true) goto label12;
+label5: (void)0;
+
+            if (var1.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var13 = var1.val.item1;
+            incref(var13);
+var14 = var13->memb_methods;
+incref(var14);
+retval = var14; var14 = NULL;
+goto out;
+label6: (void)0;
+
+            if (var1.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var15 = var1.val.item2;
+            incref(var15);
+var16 = ctor_List_Method__1e0ab9c757();
+retval = var16; var16 = NULL;
+goto out;
+label7: (void)0;
+
+            if (var1.membernum != 3)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var17 = var1.val.item3;
+            incref(var17);
+var18 = string53_equals_3cdacaa0de; string_incref(var18);
+var19 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var19,var1);
+meth_List_Type__057f9c6088_push(var19,var1);
+var20 = var2->memb_BOOL;
+incref_Type_87e1ce5c5e(var20);
+var21 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var20 }, .membernum = 1 };
+var20.membernum = -1;
+var22 = ctor_FunctionType_4e16d0ea53(var19,var21);
+var23 = ctor_Method_bfbd73ad15(var18,var22);
+var24 = string56_to_string_2072f858fb; string_incref(var24);
+var25 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var25,var1);
+var26 = var2->memb_STR;
+incref_Type_87e1ce5c5e(var26);
+var27 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var26 }, .membernum = 1 };
+var26.membernum = -1;
+var28 = ctor_FunctionType_4e16d0ea53(var25,var27);
+var29 = ctor_Method_bfbd73ad15(var24,var28);
+var30 = ctor_List_Method__1e0ab9c757();
+meth_List_Method__1e0ab9c757_push(var30,var23);
+meth_List_Method__1e0ab9c757_push(var30,var29);
+var31 = var17->memb_type_members;
+incref(var31);
+var32 = meth_List_Type__057f9c6088_length(var31);
+var33 = 2LL;
+var34 = meth_Int_equals(var32,var33);
+if (var34) goto label35;
+var36 = oomph_false;
+if (oomph_true) goto label37;
+label35: (void)0;
+var38 = var17->memb_type_members;
+incref(var38);
+var39 = meth_List_Type__057f9c6088_first(var38);
+var40 = var2->memb_NULL_TYPE;
+incref_Type_87e1ce5c5e(var40);
+var41 = meth_Type_87e1ce5c5e_equals(var39,var40);
+var36 = var41;
+label37: (void)0;
+if (var36) goto label42;
+if (oomph_true) goto label43;
+label42: (void)0;
+var44 = var17->memb_type_members;
+incref(var44);
+var45 = meth_List_Type__057f9c6088_last(var44);
+var46 = string77_get_5c2836eeb7; string_incref(var46);
+var47 = (struct class_Type_87e1ce5c5e){ .val = { .item3 = var17 }, .membernum = 3 };
+var17 = NULL;
+var48 = ctor_List_Type__057f9c6088();
+meth_List_Type__057f9c6088_push(var48,var47);
+var49 = (struct class__null___Type__8438ac3dcf){ .val = { .item1 = var45 }, .membernum = 1 };
+var45.membernum = -1;
+var50 = ctor_FunctionType_4e16d0ea53(var48,var49);
+var51 = ctor_Method_bfbd73ad15(var46,var50);
+meth_List_Method__1e0ab9c757_push(var30,var51);
+label43: (void)0;
+retval = var30; var30 = NULL;
+goto out;
+label12: (void)0;
+out: (void)0;
+decref((var51), dtor_Method_bfbd73ad15);
+decref((var50), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var49);
+decref((var48), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var47);
+string_decref(var46);
+decref_Type_87e1ce5c5e(var45);
+decref((var44), dtor_List_Type__057f9c6088);
+(void)0;
+decref_Type_87e1ce5c5e(var40);
+decref_Type_87e1ce5c5e(var39);
+decref((var38), dtor_List_Type__057f9c6088);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var31), dtor_List_Type__057f9c6088);
+decref((var30), dtor_List_Method__1e0ab9c757);
+decref((var29), dtor_Method_bfbd73ad15);
+decref((var28), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var27);
+decref_Type_87e1ce5c5e(var26);
+decref((var25), dtor_List_Type__057f9c6088);
+string_decref(var24);
+decref((var23), dtor_Method_bfbd73ad15);
+decref((var22), dtor_FunctionType_4e16d0ea53);
+decref__null___Type__8438ac3dcf(var21);
+decref_Type_87e1ce5c5e(var20);
+decref((var19), dtor_List_Type__057f9c6088);
+string_decref(var18);
+decref((var17), dtor_UnionType_7f899bced1);
+decref((var16), dtor_List_Method__1e0ab9c757);
+decref((var15), dtor_FunctionType_4e16d0ea53);
+decref((var14), dtor_List_Method__1e0ab9c757);
+decref((var13), dtor_BasicType_899b9c9f8e);
+(void)0;
+string_decref(var10);
+(void)0;
+decref((var8), dtor_AutoType_33a5d572cb);
+(void)0;
+return retval;
+}struct class_FunctionType_4e16d0ea53* ir_4b1a3e0393_get_method(struct class_Type_87e1ce5c5e var1, struct class_Str var2, struct class_Builtins_bd980a9f08* var3){struct class_List_Method__1e0ab9c757* var4;
+var4 = NULL;
+int64_t var5;
+struct class_Method_bfbd73ad15* var7;
+var7 = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+bool var10;
+struct class_FunctionType_4e16d0ea53* var13;
+var13 = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+bool var20;
+struct class_Str var21;
+var21.buf = NULL;
+int64_t var22;
+struct class_FunctionType_4e16d0ea53* retval;
+var4 = ir_4b1a3e0393_get_methods(var1,var3);
+var5 = 0LL;
+label6: (void)0;
+if (var5 >= var4->len) goto label8;
+var7 = var4->data[var5++];
+string_decref(var9);
+var9.buf = NULL;
+var9 = var7->memb_name;
+string_incref(var9);
+var10 = meth_Str_equals(var9,var2);
+if (var10) goto label11;
+if (oomph_true) goto label12;
+label11: (void)0;
+var13 = var7->memb_functype;
+incref(var13);
+retval = var13; var13 = NULL;
+goto out;
+label12: (void)0;
+if (oomph_true) goto label6;
+label8: (void)0;
+var14 = string78_type__a6f8d0e494; string_incref(var14);
+var15 = ir_4b1a3e0393_type_name(var1);
+var16 = oomph_string_concat(var14,var15);
+var17 = string79__has_no_method_named__0fd0c6edde; string_incref(var17);
+var18 = oomph_string_concat(var16,var17);
+var19 = oomph_string_concat(var18,var2);
+oomph_print(var19);
+var20 = oomph_false;
+var21 = string2_self_hosted_ir_oomph_cc2414ff62; string_incref(var21);
+var22 = 392LL;
+oomph_assert(var20,var21,var22);
+out: (void)0;
+(void)0;
+string_decref(var21);
+(void)0;
+string_decref(var19);
+string_decref(var18);
+string_decref(var17);
+string_decref(var16);
+string_decref(var15);
+string_decref(var14);
+decref((var13), dtor_FunctionType_4e16d0ea53);
+(void)0;
+string_decref(var9);
+(void)0;
+decref((var4), dtor_List_Method__1e0ab9c757);
+return retval;
+}struct class_Type_87e1ce5c5e ir_4b1a3e0393_get_member(struct class_Type_87e1ce5c5e var1, struct class_Str var2){bool var3;
+struct class_AutoType_33a5d572cb* var7;
+var7 = NULL;
+bool var8;
+struct class_Str var9;
+var9.buf = NULL;
+int64_t var10;
+struct class_BasicType_899b9c9f8e* var12;
+var12 = NULL;
+struct class_List_Member__7525bf27e3* var13;
+var13 = NULL;
+struct class_List_Member__7525bf27e3* var14;
+var14 = NULL;
+struct class_List_Member__7525bf27e3* var15;
+var15 = NULL;
+int64_t var16;
+struct class_Member_a3dd2b1b39* var18;
+var18 = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+bool var21;
+struct class_Type_87e1ce5c5e var24;
+var24.membernum = -1;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+struct class_Str var28;
+var28.buf = NULL;
+struct class_Str var29;
+var29.buf = NULL;
+struct class_Str var30;
+var30.buf = NULL;
+bool var31;
+struct class_Str var32;
+var32.buf = NULL;
+int64_t var33;
+struct class_Type_87e1ce5c5e retval;
+
+            var3 = (
+                var1.membernum == 0
+            );
+            if (var3) goto label4;
+
+            var3 = (
+                var1.membernum == 1
+            );
+            if (var3) goto label5;
+
+            var3 = (
+                var1.membernum == 2
+            );
+            if (var3) goto label6;
+
+            var3 = (
+                var1.membernum == 3
+            );
+            if (var3) goto label6;
+label4: (void)0;
+
+            if (var1.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var7 = var1.val.item0;
+            incref(var7);
+var8 = oomph_false;
+var9 = string2_self_hosted_ir_oomph_cc2414ff62; string_incref(var9);
+var10 = 397LL;
+oomph_assert(var8,var9,var10);
+if (oomph_true) goto label11;
+label5: (void)0;
+
+            if (var1.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var12 = var1.val.item1;
+            incref(var12);
+var13 = var12->memb_members;
+incref(var13);
+if (oomph_true) goto label11;
+label6: (void)0;
+var14 = ctor_List_Member__7525bf27e3();
+var13 = var14;
+var14 = NULL;
+label11: (void)0;
+var15 = var13;
+var13 = NULL;
+var16 = 0LL;
+label17: (void)0;
+if (var16 >= var15->len) goto label19;
+var18 = var15->data[var16++];
+string_decref(var20);
+var20.buf = NULL;
+var20 = var18->memb_name;
+string_incref(var20);
+var21 = meth_Str_equals(var20,var2);
+if (var21) goto label22;
+if (oomph_true) goto label23;
+label22: (void)0;
+var24 = var18->memb_type;
+incref_Type_87e1ce5c5e(var24);
+retval = var24; var24.membernum = -1;
+goto out;
+label23: (void)0;
+if (oomph_true) goto label17;
+label19: (void)0;
+var25 = string78_type__a6f8d0e494; string_incref(var25);
+var26 = ir_4b1a3e0393_type_name(var1);
+var27 = oomph_string_concat(var25,var26);
+var28 = string80__has_no_member_named__b72822579b; string_incref(var28);
+var29 = oomph_string_concat(var27,var28);
+var30 = oomph_string_concat(var29,var2);
+oomph_print(var30);
+var31 = oomph_false;
+var32 = string2_self_hosted_ir_oomph_cc2414ff62; string_incref(var32);
+var33 = 408LL;
+oomph_assert(var31,var32,var33);
+out: (void)0;
+(void)0;
+string_decref(var32);
+(void)0;
+string_decref(var30);
+string_decref(var29);
+string_decref(var28);
+string_decref(var27);
+string_decref(var26);
+string_decref(var25);
+decref_Type_87e1ce5c5e(var24);
+(void)0;
+string_decref(var20);
+(void)0;
+decref((var15), dtor_List_Member__7525bf27e3);
+decref((var14), dtor_List_Member__7525bf27e3);
+decref((var13), dtor_List_Member__7525bf27e3);
+decref((var12), dtor_BasicType_899b9c9f8e);
+(void)0;
+string_decref(var9);
+(void)0;
+decref((var7), dtor_AutoType_33a5d572cb);
+(void)0;
+return retval;
+}
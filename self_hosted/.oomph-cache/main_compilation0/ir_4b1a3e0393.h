@@ -0,0 +1,350 @@
+
+                #ifndef HEADER_GUARD_ir_4b1a3e0393
+                #define HEADER_GUARD_ir_4b1a3e0393
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Type_87e1ce5c5e.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_null___GenericSource__4440b6073d.h"
+#include "_null___List_Type___114a421a91.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "_null___Type__8438ac3dcf.h"
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_UnionType_7f899bced1;
+struct class_UnionType_7f899bced1;
+struct class_Builtins_bd980a9f08;
+struct class_List_Type__057f9c6088;
+struct class_Location_500c4434c9;
+struct class_UnionType_7f899bced1;
+struct class_AutoType_33a5d572cb;
+struct class_BasicType_899b9c9f8e;
+struct class_FunctionType_4e16d0ea53;
+struct class_UnionType_7f899bced1;
+struct class_AutoType_33a5d572cb;
+struct class_BasicType_899b9c9f8e;
+struct class_FunctionType_4e16d0ea53;
+struct class_UnionType_7f899bced1;
+struct class_AutoType_33a5d572cb;
+struct class_BasicType_899b9c9f8e;
+struct class_FunctionType_4e16d0ea53;
+struct class_UnionType_7f899bced1;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_Builtins_bd980a9f08;
+struct class_List_Type__057f9c6088;
+struct class_List_Str__43b70c06cb;
+struct class_AutoType_33a5d572cb;
+struct class_BasicType_899b9c9f8e;
+struct class_GenericSource_35cfcd932e;
+struct class_Generic_c39b95ec73;
+struct class_UnionType_7f899bced1;
+struct class_List_Type__057f9c6088;
+struct class_List_Str__43b70c06cb;
+struct class_FunctionType_4e16d0ea53;
+struct class_AutoType_33a5d572cb;
+struct class_BasicType_899b9c9f8e;
+struct class_FunctionType_4e16d0ea53;
+struct class_UnionType_7f899bced1;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_FileVariable_a7b8ca651f;
+struct class_LocalVariable_846080e5ae;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Member__7525bf27e3;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Member__7525bf27e3;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Member__7525bf27e3;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Member__7525bf27e3;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Member__7525bf27e3;
+struct class_BasicType_899b9c9f8e;
+struct class_Generic_c39b95ec73;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_BuiltinVariable__27288a8fae;
+struct class_List_BuiltinVariable__27288a8fae;
+struct class_List_BasicType__d02960f5a1;
+struct class_Builtins_bd980a9f08;
+struct class_List_BasicType__d02960f5a1;
+struct class_List_Type__057f9c6088;
+struct class_List_BasicType__d02960f5a1;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_BuiltinVariable_f6e0cdd1b6;
+struct class_List_BuiltinVariable__27288a8fae;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Method__1e0ab9c757;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Method__1e0ab9c757;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Method__1e0ab9c757;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Method__1e0ab9c757;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Method__1e0ab9c757;
+struct class_Builtins_bd980a9f08;
+struct class_Builtins_bd980a9f08;
+struct class_AutoType_33a5d572cb;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Method__1e0ab9c757;
+struct class_FunctionType_4e16d0ea53;
+struct class_List_Method__1e0ab9c757;
+struct class_UnionType_7f899bced1;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_List_Type__057f9c6088;
+struct class_FunctionType_4e16d0ea53;
+struct class_Method_bfbd73ad15;
+struct class_List_Method__1e0ab9c757;
+struct class_Builtins_bd980a9f08;
+struct class_List_Method__1e0ab9c757;
+struct class_List_Method__1e0ab9c757;
+struct class_Method_bfbd73ad15;
+struct class_FunctionType_4e16d0ea53;
+struct class_FunctionType_4e16d0ea53;
+struct class_Builtins_bd980a9f08;
+struct class_FunctionType_4e16d0ea53;
+struct class_AutoType_33a5d572cb;
+struct class_BasicType_899b9c9f8e;
+struct class_List_Member__7525bf27e3;
+struct class_List_Member__7525bf27e3;
+struct class_List_Member__7525bf27e3;
+struct class_Member_a3dd2b1b39;
+struct class_UnionType_7f899bced1* ir_4b1a3e0393_make_union(struct class_Builtins_bd980a9f08* var1, struct class_List_Type__057f9c6088* var2, struct class_Location_500c4434c9* var3);
+bool ir_4b1a3e0393_is_refcounted(struct class_Type_87e1ce5c5e var1);
+struct class__null___List_Type___114a421a91 ir_4b1a3e0393_get_constructor_argtypes(struct class_Type_87e1ce5c5e var1);
+struct class_Str ir_4b1a3e0393_type_name(struct class_Type_87e1ce5c5e var1);
+struct class_Str ir_4b1a3e0393_type_id_string(struct class_Type_87e1ce5c5e var1);
+struct class__null___GenericSource__4440b6073d ir_4b1a3e0393_get_generic_source(struct class_Type_87e1ce5c5e var1);
+struct class_Type_87e1ce5c5e ir_4b1a3e0393_var_type(struct class_Variable_1aaa81c8d2 var1);
+struct class_Builtins_bd980a9f08* ir_4b1a3e0393_create_builtins(void);
+struct class_List_Method__1e0ab9c757* ir_4b1a3e0393_get_methods(struct class_Type_87e1ce5c5e var1, struct class_Builtins_bd980a9f08* var2);
+struct class_FunctionType_4e16d0ea53* ir_4b1a3e0393_get_method(struct class_Type_87e1ce5c5e var1, struct class_Str var2, struct class_Builtins_bd980a9f08* var3);
+struct class_Type_87e1ce5c5e ir_4b1a3e0393_get_member(struct class_Type_87e1ce5c5e var1, struct class_Str var2);
+
+                #endif
+                
@@ -0,0 +1,960 @@
+#include <lib/oomph.h>
+#include "main_5a555a7e9d.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Builtins_bd980a9f08.h"
+#include "List_FilePair__2b6998ab5b.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Symbol__9a01330177.h"
+#include "List_Token__da0ee88323.h"
+#include "List_ToplevelDeclaration__35f88ef566.h"
+#include "List_ToplevelDeclaration__c481ce934d.h"
+#include "Session_88204c75ff.h"
+#include "Token_35f69eeb49.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "ast2ir_d819fcc31b.h"
+#include "bundle_io_45f5b8a585.h"
+#include "bundle_process_e29aff3881.h"
+#include "ir_4b1a3e0393.h"
+#include "parser_6c64cd293c.h"
+#include "tokenizer_431c4db6a8.h"
+
+            static struct StringBuf string0___1629443077_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string0___1629443077 = {
+                .buf = &string0___1629443077_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1__42dfdd1f40_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string1__42dfdd1f40 = {
+                .buf = &string1__42dfdd1f40_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_obj_compile_info_txt_13f74b676b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2f', '\x63', '\x6f', '\x6d', '\x70', '\x69', '\x6c', '\x65', '\x5f', '\x69', '\x6e', '\x66', '\x6f', '\x2e', '\x74', '\x78', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string2_obj_compile_info_txt_13f74b676b = {
+                .buf = &string2_obj_compile_info_txt_13f74b676b_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3___d96b190b41_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string3___d96b190b41 = {
+                .buf = &string3___d96b190b41_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_cc__e4c3237771_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x63', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string4_cc__e4c3237771 = {
+                .buf = &string4_cc__e4c3237771_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_cflags__129fceec7e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x66', '\x6c', '\x61', '\x67', '\x73', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string5_cflags__129fceec7e = {
+                .buf = &string5_cflags__129fceec7e_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6_ldflags__ea83ed0b86_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x64', '\x66', '\x6c', '\x61', '\x67', '\x73', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string6_ldflags__ea83ed0b86 = {
+                .buf = &string6_ldflags__ea83ed0b86_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7_self_hosted_main_oomph_dfba5447e3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x6d', '\x61', '\x69', '\x6e', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string7_self_hosted_main_oomph_dfba5447e3 = {
+                .buf = &string7_self_hosted_main_oomph_dfba5447e3_buf,
+                .nbytes = 22,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string8_obj_io_o_d57291f9a2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2f', '\x69', '\x6f', '\x2e', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string8_obj_io_o_d57291f9a2 = {
+                .buf = &string8_obj_io_o_d57291f9a2_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string9_obj_misc_o_f744563392_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2f', '\x6d', '\x69', '\x73', '\x63', '\x2e', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string9_obj_misc_o_f744563392 = {
+                .buf = &string9_obj_misc_o_f744563392_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string10_obj_numbers_o_b84272b3d2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2f', '\x6e', '\x75', '\x6d', '\x62', '\x65', '\x72', '\x73', '\x2e', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string10_obj_numbers_o_b84272b3d2 = {
+                .buf = &string10_obj_numbers_o_b84272b3d2_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string11_obj_ref_o_641cffad80_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2f', '\x72', '\x65', '\x66', '\x2e', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string11_obj_ref_o_641cffad80 = {
+                .buf = &string11_obj_ref_o_641cffad80_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string12_obj_string_o_bc438458f8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x2e', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string12_obj_string_o_bc438458f8 = {
+                .buf = &string12_obj_string_o_bc438458f8_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string13_obj_process_o_75be91d90c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2f', '\x70', '\x72', '\x6f', '\x63', '\x65', '\x73', '\x73', '\x2e', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string13_obj_process_o_75be91d90c = {
+                .buf = &string13_obj_process_o_75be91d90c_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string14__o_8d7e6e5f39_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string14__o_8d7e6e5f39 = {
+                .buf = &string14__o_8d7e6e5f39_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string15__I_059446a524_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x49' },
+                .malloced = false,
+            };
+            static struct class_Str string15__I_059446a524 = {
+                .buf = &string15__I_059446a524_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string16___358833c474_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e' },
+                .malloced = false,
+            };
+            static struct class_Str string16___358833c474 = {
+                .buf = &string16___358833c474_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string17_stdlib_oomph_ca400e0be7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x64', '\x6c', '\x69', '\x62', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string17_stdlib_oomph_ca400e0be7 = {
+                .buf = &string17_stdlib_oomph_ca400e0be7_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string18__oomph_cache_5b41418706_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x2d', '\x63', '\x61', '\x63', '\x68', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string18__oomph_cache_5b41418706 = {
+                .buf = &string18__oomph_cache_5b41418706_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string19____384b9c0d83_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x2d' },
+                .malloced = false,
+            };
+            static struct class_Str string19____384b9c0d83 = {
+                .buf = &string19____384b9c0d83_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string20___tokens_da160272d4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x2d', '\x74', '\x6f', '\x6b', '\x65', '\x6e', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string20___tokens_da160272d4 = {
+                .buf = &string20___tokens_da160272d4_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string21___ast_8ff1fa145b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x2d', '\x61', '\x73', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string21___ast_8ff1fa145b = {
+                .buf = &string21___ast_8ff1fa145b_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string22___valgrind__d64308d8e0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x2d', '\x76', '\x61', '\x6c', '\x67', '\x72', '\x69', '\x6e', '\x64', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string22___valgrind__d64308d8e0 = {
+                .buf = &string22___valgrind__d64308d8e0_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string23_bad_arg___c98c47fedc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x61', '\x64', '\x20', '\x61', '\x72', '\x67', '\x3a', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string23_bad_arg___c98c47fedc = {
+                .buf = &string23_bad_arg___c98c47fedc_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string24_stdlib_68fd48e424_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x64', '\x6c', '\x69', '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string24_stdlib_68fd48e424 = {
+                .buf = &string24_stdlib_68fd48e424_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string25_builtins_oomph_f5bcbe7bde_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x75', '\x69', '\x6c', '\x74', '\x69', '\x6e', '\x73', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string25_builtins_oomph_f5bcbe7bde = {
+                .buf = &string25_builtins_oomph_f5bcbe7bde_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string26__oomph_cache_out_6249fbff58_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x2d', '\x63', '\x61', '\x63', '\x68', '\x65', '\x2f', '\x6f', '\x75', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string26__oomph_cache_out_6249fbff58 = {
+                .buf = &string26__oomph_cache_out_6249fbff58_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            struct class_List_Str__43b70c06cb* main_5a555a7e9d_split(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+bool var6;
+bool var7;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_List_Str__43b70c06cb* retval;
+var2 = string0___1629443077; string_incref(var2);
+var3 = meth_Str_split(var1,var2);
+label4: (void)0;
+string_decref(var5);
+var5.buf = NULL;
+var5 = string1__42dfdd1f40; string_incref(var5);
+var6 = meth_List_Str__43b70c06cb___contains(var3,var5);
+var7 = oomph_bool_not(var6);
+if (var7) goto label8;
+string_decref(var9);
+var9.buf = NULL;
+var9 = string1__42dfdd1f40; string_incref(var9);
+meth_List_Str__43b70c06cb_delete_first(var3,var9);
+if (oomph_true) goto label4;
+label8: (void)0;
+retval = var3; var3 = NULL;
+goto out;
+out: (void)0;
+string_decref(var9);
+(void)0;
+(void)0;
+string_decref(var5);
+decref((var3), dtor_List_Str__43b70c06cb);
+string_decref(var2);
+return retval;
+}struct class_List_Str__43b70c06cb* main_5a555a7e9d_get_c_compiler_command(struct class_List_Str__43b70c06cb* var1, struct class_Str var2){struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_List_Str__43b70c06cb* var9;
+var9 = NULL;
+int64_t var10;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+bool var15;
+struct class_Str var18;
+var18.buf = NULL;
+bool var19;
+struct class_Str var21;
+var21.buf = NULL;
+bool var22;
+struct class_Str var24;
+var24.buf = NULL;
+bool var25;
+bool var27;
+struct class_Str var28;
+var28.buf = NULL;
+int64_t var29;
+struct class_Str var31;
+var31.buf = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var37;
+var37.buf = NULL;
+struct class_Str var38;
+var38.buf = NULL;
+struct class_List_Str__43b70c06cb* var39;
+var39 = NULL;
+struct class_List_Str__43b70c06cb* var40;
+var40 = NULL;
+struct class_Str var41;
+var41.buf = NULL;
+struct class_Str var42;
+var42.buf = NULL;
+struct class_Str var43;
+var43.buf = NULL;
+struct class_Str var44;
+var44.buf = NULL;
+struct class_Str var45;
+var45.buf = NULL;
+struct class_Str var46;
+var46.buf = NULL;
+struct class_List_Str__43b70c06cb* var47;
+var47 = NULL;
+struct class_Str var48;
+var48.buf = NULL;
+struct class_List_Str__43b70c06cb* var49;
+var49 = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+struct class_List_Str__43b70c06cb* retval;
+var3 = string1__42dfdd1f40; string_incref(var3);
+var4 = string1__42dfdd1f40; string_incref(var4);
+var5 = string1__42dfdd1f40; string_incref(var5);
+var6 = string2_obj_compile_info_txt_13f74b676b; string_incref(var6);
+var7 = bundle_io_45f5b8a585_read_file(var6);
+var8 = string3___d96b190b41; string_incref(var8);
+var9 = meth_Str_split(var7,var8);
+var10 = 0LL;
+label11: (void)0;
+if (var10 >= var9->len) goto label13;
+var12 = var9->data[var10++];
+string_decref(var14);
+var14.buf = NULL;
+var14 = string1__42dfdd1f40; string_incref(var14);
+var15 = meth_Str_equals(var12,var14);
+if (var15) goto label16;
+if (oomph_true) goto label17;
+label16: (void)0;
+if (oomph_true) goto label11;
+label17: (void)0;
+string_decref(var18);
+var18.buf = NULL;
+var18 = string4_cc__e4c3237771; string_incref(var18);
+var19 = meth_Str_starts_with(var12,var18);
+if (var19) goto label20;
+string_decref(var21);
+var21.buf = NULL;
+var21 = string5_cflags__129fceec7e; string_incref(var21);
+var22 = meth_Str_starts_with(var12,var21);
+if (var22) goto label23;
+string_decref(var24);
+var24.buf = NULL;
+var24 = string6_ldflags__ea83ed0b86; string_incref(var24);
+var25 = meth_Str_starts_with(var12,var24);
+if (var25) goto label26;
+var27 = oomph_false;
+string_decref(var28);
+var28.buf = NULL;
+var28 = string7_self_hosted_main_oomph_dfba5447e3; string_incref(var28);
+var29 = 32LL;
+oomph_assert(var27,var28,var29);
+if (oomph_true) goto label30;
+label26: (void)0;
+string_decref(var31);
+var31.buf = NULL;
+var31 = string6_ldflags__ea83ed0b86; string_incref(var31);
+var32 = meth_Str_remove_prefix(var12,var31);
+string_decref(var5);
+var5 = var32;
+var32.buf = NULL;
+label30: (void)0;
+if (oomph_true) goto label33;
+label23: (void)0;
+string_decref(var34);
+var34.buf = NULL;
+var34 = string5_cflags__129fceec7e; string_incref(var34);
+var35 = meth_Str_remove_prefix(var12,var34);
+string_decref(var4);
+var4 = var35;
+var35.buf = NULL;
+label33: (void)0;
+if (oomph_true) goto label36;
+label20: (void)0;
+string_decref(var37);
+var37.buf = NULL;
+var37 = string4_cc__e4c3237771; string_incref(var37);
+var38 = meth_Str_remove_prefix(var12,var37);
+string_decref(var3);
+var3 = var38;
+var38.buf = NULL;
+label36: (void)0;
+if (oomph_true) goto label11;
+label13: (void)0;
+var39 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var39,var3);
+var40 = main_5a555a7e9d_split(var4);
+meth_List_Str__43b70c06cb_push_all(var39,var40);
+var41 = string8_obj_io_o_d57291f9a2; string_incref(var41);
+var42 = string9_obj_misc_o_f744563392; string_incref(var42);
+var43 = string10_obj_numbers_o_b84272b3d2; string_incref(var43);
+var44 = string11_obj_ref_o_641cffad80; string_incref(var44);
+var45 = string12_obj_string_o_bc438458f8; string_incref(var45);
+var46 = string13_obj_process_o_75be91d90c; string_incref(var46);
+var47 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var47,var41);
+meth_List_Str__43b70c06cb_push(var47,var42);
+meth_List_Str__43b70c06cb_push(var47,var43);
+meth_List_Str__43b70c06cb_push(var47,var44);
+meth_List_Str__43b70c06cb_push(var47,var45);
+meth_List_Str__43b70c06cb_push(var47,var46);
+meth_List_Str__43b70c06cb_push_all(var39,var47);
+meth_List_Str__43b70c06cb_push_all(var39,var1);
+var48 = string14__o_8d7e6e5f39; string_incref(var48);
+meth_List_Str__43b70c06cb_push(var39,var48);
+meth_List_Str__43b70c06cb_push(var39,var2);
+var49 = main_5a555a7e9d_split(var5);
+meth_List_Str__43b70c06cb_push_all(var39,var49);
+var50 = string15__I_059446a524; string_incref(var50);
+meth_List_Str__43b70c06cb_push(var39,var50);
+var51 = string16___358833c474; string_incref(var51);
+meth_List_Str__43b70c06cb_push(var39,var51);
+retval = var39; var39 = NULL;
+goto out;
+out: (void)0;
+string_decref(var51);
+string_decref(var50);
+decref((var49), dtor_List_Str__43b70c06cb);
+string_decref(var48);
+decref((var47), dtor_List_Str__43b70c06cb);
+string_decref(var46);
+string_decref(var45);
+string_decref(var44);
+string_decref(var43);
+string_decref(var42);
+string_decref(var41);
+decref((var40), dtor_List_Str__43b70c06cb);
+decref((var39), dtor_List_Str__43b70c06cb);
+string_decref(var38);
+string_decref(var37);
+string_decref(var35);
+string_decref(var34);
+string_decref(var32);
+string_decref(var31);
+(void)0;
+string_decref(var28);
+(void)0;
+(void)0;
+string_decref(var24);
+(void)0;
+string_decref(var21);
+(void)0;
+string_decref(var18);
+(void)0;
+string_decref(var14);
+(void)0;
+decref((var9), dtor_List_Str__43b70c06cb);
+string_decref(var8);
+string_decref(var7);
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+return retval;
+}struct class_List_ToplevelDeclaration__35f88ef566* main_5a555a7e9d_create_ir(struct class_Builtins_bd980a9f08* var1, struct class_Str var2){struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class__null___Str__5eca9cec4f var5;
+var5.membernum = -1;
+struct class_List_ToplevelDeclaration__c481ce934d* var6;
+var6 = NULL;
+struct class_List_Symbol__9a01330177* var7;
+var7 = NULL;
+struct class_List_ToplevelDeclaration__35f88ef566* var8;
+var8 = NULL;
+struct class_List_ToplevelDeclaration__35f88ef566* retval;
+var3 = bundle_io_45f5b8a585_read_file(var2);
+var4 = string17_stdlib_oomph_ca400e0be7; string_incref(var4);
+var5 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var4 }, .membernum = 1 };
+var4.buf = NULL;
+var6 = parser_6c64cd293c_parse_file(var3,var2,var5);
+var7 = ctor_List_Symbol__9a01330177();
+var8 = ast2ir_d819fcc31b_convert_program(var1,var6,var2,var7);
+retval = var8; var8 = NULL;
+goto out;
+out: (void)0;
+decref((var8), dtor_List_ToplevelDeclaration__35f88ef566);
+decref((var7), dtor_List_Symbol__9a01330177);
+decref((var6), dtor_List_ToplevelDeclaration__c481ce934d);
+decref__null___Str__5eca9cec4f(var5);
+string_decref(var4);
+string_decref(var3);
+return retval;
+}void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_List_Str__43b70c06cb* var2;
+var2 = NULL;
+bool var3;
+bool var4;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_List_Str__43b70c06cb* var7;
+var7 = NULL;
+bool var8;
+bool var9;
+bool var11;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+bool var15;
+bool var16;
+int64_t var18;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+bool var21;
+struct class_Str var23;
+var23.buf = NULL;
+bool var24;
+struct class_Str var26;
+var26.buf = NULL;
+bool var27;
+struct class_Str var29;
+var29.buf = NULL;
+struct class_Str var30;
+var30.buf = NULL;
+bool var31;
+struct class_Str var32;
+var32.buf = NULL;
+int64_t var33;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+bool var38;
+bool var40;
+bool var42;
+bool var44;
+struct class_Str var45;
+var45.buf = NULL;
+int64_t var46;
+struct class_List_Str__43b70c06cb* var47;
+var47 = NULL;
+bool var48;
+bool var49;
+struct class_Str var50;
+var50.buf = NULL;
+int64_t var51;
+int64_t var52;
+struct class_Str var53;
+var53.buf = NULL;
+struct class_Str var56;
+var56.buf = NULL;
+int64_t var57;
+struct class_Str var58;
+var58.buf = NULL;
+struct class_List_Token__da0ee88323* var59;
+var59 = NULL;
+int64_t var60;
+struct class_Token_35f69eeb49* var62;
+var62 = NULL;
+struct class_Str var64;
+var64.buf = NULL;
+struct class_Str var67;
+var67.buf = NULL;
+struct class_Str var68;
+var68.buf = NULL;
+struct class__null___Str__5eca9cec4f var69;
+var69.membernum = -1;
+struct class_List_ToplevelDeclaration__c481ce934d* var70;
+var70 = NULL;
+struct class_Str var71;
+var71.buf = NULL;
+struct class_Builtins_bd980a9f08* var72;
+var72 = NULL;
+struct class_Str var73;
+var73.buf = NULL;
+struct class_List_ToplevelDeclaration__35f88ef566* var74;
+var74 = NULL;
+struct class_List_ToplevelDeclaration__35f88ef566* var75;
+var75 = NULL;
+struct class_List_Symbol__9a01330177* var76;
+var76 = NULL;
+struct class_List_FilePair__2b6998ab5b* var77;
+var77 = NULL;
+struct class_Session_88204c75ff* var78;
+var78 = NULL;
+struct class_Str var79;
+var79.buf = NULL;
+struct class_Str var80;
+var80.buf = NULL;
+struct class_List_Str__43b70c06cb* var81;
+var81 = NULL;
+struct class_Str var82;
+var82.buf = NULL;
+struct class_List_Str__43b70c06cb* var83;
+var83 = NULL;
+int64_t var84;
+int64_t var85;
+bool var86;
+struct class_Str var87;
+var87.buf = NULL;
+int64_t var88;
+struct class_List_Str__43b70c06cb* var89;
+var89 = NULL;
+struct class_Str var90;
+var90.buf = NULL;
+int64_t var91;
+int64_t var92;
+bool var93;
+struct class_Str var94;
+var94.buf = NULL;
+int64_t var95;
+var1 = string18__oomph_cache_5b41418706; string_incref(var1);
+bundle_io_45f5b8a585_mkdir(var1);
+var2 = bundle_process_e29aff3881_get_args();
+var3 = oomph_false;
+var4 = oomph_false;
+var5 = string1__42dfdd1f40; string_incref(var5);
+label6: (void)0;
+decref((var7), dtor_List_Str__43b70c06cb);
+var7 = NULL;
+var7 = ctor_List_Str__43b70c06cb();
+var8 = meth_List_Str__43b70c06cb_equals(var2,var7);
+var9 = oomph_bool_not(var8);
+if (var9) goto label10;
+var11 = oomph_false;
+if (oomph_true) goto label12;
+label10: (void)0;
+string_decref(var13);
+var13.buf = NULL;
+var13 = meth_List_Str__43b70c06cb_first(var2);
+string_decref(var14);
+var14.buf = NULL;
+var14 = string19____384b9c0d83; string_incref(var14);
+var15 = meth_Str_starts_with(var13,var14);
+var11 = var15;
+label12: (void)0;
+var16 = oomph_bool_not(var11);
+if (var16) goto label17;
+var18 = 0LL;
+string_decref(var19);
+var19.buf = NULL;
+var19 = meth_List_Str__43b70c06cb_delete_at_index(var2,var18);
+string_decref(var20);
+var20.buf = NULL;
+var20 = string20___tokens_da160272d4; string_incref(var20);
+var21 = meth_Str_equals(var19,var20);
+if (var21) goto label22;
+string_decref(var23);
+var23.buf = NULL;
+var23 = string21___ast_8ff1fa145b; string_incref(var23);
+var24 = meth_Str_equals(var19,var23);
+if (var24) goto label25;
+string_decref(var26);
+var26.buf = NULL;
+var26 = string22___valgrind__d64308d8e0; string_incref(var26);
+var27 = meth_Str_starts_with(var19,var26);
+if (var27) goto label28;
+string_decref(var29);
+var29.buf = NULL;
+var29 = string23_bad_arg___c98c47fedc; string_incref(var29);
+string_decref(var30);
+var30.buf = NULL;
+var30 = oomph_string_concat(var29,var19);
+oomph_print(var30);
+var31 = oomph_false;
+string_decref(var32);
+var32.buf = NULL;
+var32 = string7_self_hosted_main_oomph_dfba5447e3; string_incref(var32);
+var33 = 78LL;
+oomph_assert(var31,var32,var33);
+if (oomph_true) goto label34;
+label28: (void)0;
+string_decref(var35);
+var35.buf = NULL;
+var35 = string22___valgrind__d64308d8e0; string_incref(var35);
+var36 = meth_Str_remove_prefix(var19,var35);
+string_decref(var5);
+var5 = var36;
+var36.buf = NULL;
+label34: (void)0;
+if (oomph_true) goto label37;
+label25: (void)0;
+var38 = oomph_true;
+var4 = var38;
+label37: (void)0;
+if (oomph_true) goto label39;
+label22: (void)0;
+var40 = oomph_true;
+var3 = var40;
+label39: (void)0;
+if (oomph_true) goto label6;
+label17: (void)0;
+if (var4) goto label41;
+var42 = oomph_false;
+if (oomph_true) goto label43;
+label41: (void)0;
+var42 = var3;
+label43: (void)0;
+var44 = oomph_bool_not(var42);
+var45 = string7_self_hosted_main_oomph_dfba5447e3; string_incref(var45);
+var46 = 80LL;
+oomph_assert(var44,var45,var46);
+var47 = ctor_List_Str__43b70c06cb();
+var48 = meth_List_Str__43b70c06cb_equals(var2,var47);
+var49 = oomph_bool_not(var48);
+var50 = string7_self_hosted_main_oomph_dfba5447e3; string_incref(var50);
+var51 = 81LL;
+oomph_assert(var49,var50,var51);
+var52 = 0LL;
+var53 = meth_List_Str__43b70c06cb_delete_at_index(var2,var52);
+if (var3) goto label54;
+if (oomph_true) goto label55;
+label54: (void)0;
+var56 = bundle_io_45f5b8a585_read_file(var53);
+var57 = 1LL;
+var58 = string1__42dfdd1f40; string_incref(var58);
+var59 = tokenizer_431c4db6a8_tokenize(var56,var53,var57,var58);
+var60 = 0LL;
+label61: (void)0;
+if (var60 >= var59->len) goto label63;
+decref((var62), dtor_Token_35f69eeb49); var62 = var59->data[var60++]; incref(var62);
+string_decref(var64);
+var64.buf = NULL;
+var64 = meth_Token_35f69eeb49_to_string(var62);
+oomph_print(var64);
+if (oomph_true) goto label61;
+label63: (void)0;
+goto out;
+label55: (void)0;
+if (var4) goto label65;
+if (oomph_true) goto label66;
+label65: (void)0;
+var67 = bundle_io_45f5b8a585_read_file(var53);
+var68 = string24_stdlib_68fd48e424; string_incref(var68);
+var69 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var68 }, .membernum = 1 };
+var68.buf = NULL;
+var70 = parser_6c64cd293c_parse_file(var67,var53,var69);
+var71 = meth_List_ToplevelDeclaration__c481ce934d_to_string(var70);
+oomph_print(var71);
+goto out;
+label66: (void)0;
+var72 = ir_4b1a3e0393_create_builtins();
+var73 = string25_builtins_oomph_f5bcbe7bde; string_incref(var73);
+var74 = main_5a555a7e9d_create_ir(var72,var73);
+var75 = main_5a555a7e9d_create_ir(var72,var53);
+var76 = ctor_List_Symbol__9a01330177();
+var77 = ctor_List_FilePair__2b6998ab5b();
+var78 = ctor_Session_88204c75ff(var72,var1,var76,var77);
+var79 = string25_builtins_oomph_f5bcbe7bde; string_incref(var79);
+meth_Session_88204c75ff_create_c_code(var78,var74,var79);
+meth_Session_88204c75ff_create_c_code(var78,var75,var53);
+var80 = string25_builtins_oomph_f5bcbe7bde; string_incref(var80);
+var81 = meth_Session_88204c75ff_write_everything(var78,var80);
+var82 = string26__oomph_cache_out_6249fbff58; string_incref(var82);
+var83 = main_5a555a7e9d_get_c_compiler_command(var81,var82);
+var84 = bundle_process_e29aff3881_run(var83);
+var85 = 0LL;
+var86 = meth_Int_equals(var84,var85);
+var87 = string7_self_hosted_main_oomph_dfba5447e3; string_incref(var87);
+var88 = 106LL;
+oomph_assert(var86,var87,var88);
+var89 = main_5a555a7e9d_split(var5);
+var90 = string26__oomph_cache_out_6249fbff58; string_incref(var90);
+meth_List_Str__43b70c06cb_push(var89,var90);
+meth_List_Str__43b70c06cb_push_all(var89,var2);
+var91 = bundle_process_e29aff3881_run(var89);
+var92 = 0LL;
+var93 = meth_Int_equals(var91,var92);
+var94 = string7_self_hosted_main_oomph_dfba5447e3; string_incref(var94);
+var95 = 113LL;
+oomph_assert(var93,var94,var95);
+meth_Session_88204c75ff_destroy(var78);
+meth_Builtins_bd980a9f08_destroy(var72);
+out: (void)0;
+(void)0;
+string_decref(var94);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var90);
+decref((var89), dtor_List_Str__43b70c06cb);
+(void)0;
+string_decref(var87);
+(void)0;
+(void)0;
+(void)0;
+decref((var83), dtor_List_Str__43b70c06cb);
+string_decref(var82);
+decref((var81), dtor_List_Str__43b70c06cb);
+string_decref(var80);
+string_decref(var79);
+decref((var78), dtor_Session_88204c75ff);
+decref((var77), dtor_List_FilePair__2b6998ab5b);
+decref((var76), dtor_List_Symbol__9a01330177);
+decref((var75), dtor_List_ToplevelDeclaration__35f88ef566);
+decref((var74), dtor_List_ToplevelDeclaration__35f88ef566);
+string_decref(var73);
+decref((var72), dtor_Builtins_bd980a9f08);
+string_decref(var71);
+decref((var70), dtor_List_ToplevelDeclaration__c481ce934d);
+decref__null___Str__5eca9cec4f(var69);
+string_decref(var68);
+string_decref(var67);
+string_decref(var64);
+decref((var62), dtor_Token_35f69eeb49);
+(void)0;
+decref((var59), dtor_List_Token__da0ee88323);
+string_decref(var58);
+(void)0;
+string_decref(var56);
+string_decref(var53);
+(void)0;
+(void)0;
+string_decref(var50);
+(void)0;
+(void)0;
+decref((var47), dtor_List_Str__43b70c06cb);
+(void)0;
+string_decref(var45);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var36);
+string_decref(var35);
+(void)0;
+string_decref(var32);
+(void)0;
+string_decref(var30);
+string_decref(var29);
+(void)0;
+string_decref(var26);
+(void)0;
+string_decref(var23);
+(void)0;
+string_decref(var20);
+string_decref(var19);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var14);
+string_decref(var13);
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_Str__43b70c06cb);
+string_decref(var5);
+(void)0;
+(void)0;
+decref((var2), dtor_List_Str__43b70c06cb);
+string_decref(var1);
+}
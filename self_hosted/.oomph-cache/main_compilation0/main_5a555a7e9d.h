@@ -0,0 +1,51 @@
+
+                #ifndef HEADER_GUARD_main_5a555a7e9d
+                #define HEADER_GUARD_main_5a555a7e9d
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "ast2ir_d819fcc31b.h"
+#include "bundle_io_45f5b8a585.h"
+#include "bundle_process_e29aff3881.h"
+#include "ir_4b1a3e0393.h"
+#include "parser_6c64cd293c.h"
+#include "tokenizer_431c4db6a8.h"
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_ToplevelDeclaration__c481ce934d;
+struct class_List_Symbol__9a01330177;
+struct class_List_ToplevelDeclaration__35f88ef566;
+struct class_List_ToplevelDeclaration__35f88ef566;
+struct class_Builtins_bd980a9f08;
+struct class_List_ToplevelDeclaration__35f88ef566;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_List_ToplevelDeclaration__c481ce934d;
+struct class_Builtins_bd980a9f08;
+struct class_List_ToplevelDeclaration__35f88ef566;
+struct class_List_ToplevelDeclaration__35f88ef566;
+struct class_List_Symbol__9a01330177;
+struct class_List_FilePair__2b6998ab5b;
+struct class_Session_88204c75ff;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb* main_5a555a7e9d_split(struct class_Str var1);
+struct class_List_Str__43b70c06cb* main_5a555a7e9d_get_c_compiler_command(struct class_List_Str__43b70c06cb* var1, struct class_Str var2);
+struct class_List_ToplevelDeclaration__35f88ef566* main_5a555a7e9d_create_ir(struct class_Builtins_bd980a9f08* var1, struct class_Str var2);
+void oomph_main(void);
+
+                #endif
+                
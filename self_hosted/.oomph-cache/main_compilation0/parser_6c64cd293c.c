@@ -0,0 +1,433 @@
+#include <lib/oomph.h>
+#include "parser_6c64cd293c.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "Import_6056d7e9c9.h"
+#include "List_Expression__d162784c9e.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Token__da0ee88323.h"
+#include "List_ToplevelDeclaration__c481ce934d.h"
+#include "Location_500c4434c9.h"
+#include "Parser_d28334dc68.h"
+#include "StringConstant_c2b1c10b4f.h"
+#include "Token_35f69eeb49.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "tokenizer_431c4db6a8.h"
+
+            static struct StringBuf string0___779da127b4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f' },
+                .malloced = false,
+            };
+            static struct class_Str string0___779da127b4 = {
+                .buf = &string0___779da127b4_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1___8394507300_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e' },
+                .malloced = false,
+            };
+            static struct class_Str string1___8394507300 = {
+                .buf = &string1___8394507300_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2__51efd6930c_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string2__51efd6930c = {
+                .buf = &string2__51efd6930c_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_keyword_3d4e852023_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6b', '\x65', '\x79', '\x77', '\x6f', '\x72', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string3_keyword_3d4e852023 = {
+                .buf = &string3_keyword_3d4e852023_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_import_8afafacce8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6d', '\x70', '\x6f', '\x72', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string4_import_8afafacce8 = {
+                .buf = &string4_import_8afafacce8_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_self_hosted_parser_oomph_971762f815_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x70', '\x61', '\x72', '\x73', '\x65', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string5_self_hosted_parser_oomph_971762f815 = {
+                .buf = &string5_self_hosted_parser_oomph_971762f815_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            struct class_Str parser_6c64cd293c_path_parent(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct class_List_Str__43b70c06cb* var4;
+var4 = NULL;
+bool var5;
+struct class_Str var8;
+var8.buf = NULL;
+int64_t var9;
+int64_t var10;
+int64_t var11;
+int64_t var12;
+struct class_List_Str__43b70c06cb* var13;
+var13 = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str retval;
+var2 = string0___779da127b4; string_incref(var2);
+var3 = meth_Str_split(var1,var2);
+var4 = ctor_List_Str__43b70c06cb();
+var5 = meth_List_Str__43b70c06cb_equals(var3,var4);
+if (var5) goto label6;
+if (oomph_true) goto label7;
+label6: (void)0;
+var8 = string1___8394507300; string_incref(var8);
+retval = var8; var8.buf = NULL;
+goto out;
+label7: (void)0;
+var9 = 0LL;
+var10 = meth_List_Str__43b70c06cb_length(var3);
+var11 = 1LL;
+var12 = oomph_int_sub(var10,var11);
+var13 = meth_List_Str__43b70c06cb_slice(var3,var9,var12);
+var14 = string0___779da127b4; string_incref(var14);
+var15 = meth_List_Str__43b70c06cb_join(var13,var14);
+retval = var15; var15.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var15);
+string_decref(var14);
+decref((var13), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var8);
+(void)0;
+decref((var4), dtor_List_Str__43b70c06cb);
+decref((var3), dtor_List_Str__43b70c06cb);
+string_decref(var2);
+return retval;
+}void parser_6c64cd293c_add_string(struct class_List_Expression__d162784c9e* var1, struct class_Str var2, struct class_Location_500c4434c9* var3){struct class_List_Expression__d162784c9e* var4;
+var4 = NULL;
+bool var5;
+bool var6;
+struct class_Expression_35f2052bf4 var9;
+var9.membernum = -1;
+bool var10;
+struct class_StringConstant_c2b1c10b4f* var13;
+var13 = NULL;
+struct class_Expression_35f2052bf4 var14;
+var14.membernum = -1;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_StringConstant_c2b1c10b4f* var17;
+var17 = NULL;
+struct class_Expression_35f2052bf4 var18;
+var18.membernum = -1;
+struct class_StringConstant_c2b1c10b4f* var20;
+var20 = NULL;
+struct class_Expression_35f2052bf4 var21;
+var21.membernum = -1;
+var4 = ctor_List_Expression__d162784c9e();
+var5 = meth_List_Expression__d162784c9e_equals(var1,var4);
+var6 = oomph_bool_not(var5);
+if (var6) goto label7;
+if (oomph_true) goto label8;
+label7: (void)0;
+var9 = meth_List_Expression__d162784c9e_last(var1);
+
+            var10 = (
+                var9.membernum == 11
+            );
+            if (var10) goto label11;
+
+            var10 = (
+                var9.membernum == 0
+            );
+            if (var10) goto label12;
+
+            var10 = (
+                var9.membernum == 1
+            );
+            if (var10) goto label12;
+
+            var10 = (
+                var9.membernum == 2
+            );
+            if (var10) goto label12;
+
+            var10 = (
+                var9.membernum == 3
+            );
+            if (var10) goto label12;
+
+            var10 = (
+                var9.membernum == 4
+            );
+            if (var10) goto label12;
+
+            var10 = (
+                var9.membernum == 5
+            );
+            if (var10) goto label12;
+
+            var10 = (
+                var9.membernum == 6
+            );
+            if (var10) goto label12;
+
+            var10 = (
+                var9.membernum == 7
+            );
+            if (var10) goto label12;
+
+            var10 = (
+                var9.membernum == 8
+            );
+            if (var10) goto label12;
+
+            var10 = (
+                var9.membernum == 9
+            );
+            if (var10) goto label12;
+
+            var10 = (
+                var9.membernum == 10
+            );
+            if (var10) goto label12;
+
+            var10 = (
+                var9.membernum == 12
+            );
+            if (var10) goto label12;
+
+            var10 = (
+                var9.membernum == 13
+            );
+            if (var10) goto label12;
+label11: (void)0;
+
+            if (var9.membernum != 11)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var13 = var9.val.item11;
+            incref(var13);
+var14 = meth_List_Expression__d162784c9e_pop(var1);
+var15 = var13->memb_value;
+string_incref(var15);
+var16 = oomph_string_concat(var15,var2);
+var17 = ctor_StringConstant_c2b1c10b4f(var3,var16);
+var18 = (struct class_Expression_35f2052bf4){ .val = { .item11 = var17 }, .membernum = 11 };
+var17 = NULL;
+meth_List_Expression__d162784c9e_push(var1,var18);
+goto out;
+label12: (void)0;
+label19: (void)0;
+label8: (void)0;
+var20 = ctor_StringConstant_c2b1c10b4f(var3,var2);
+var21 = (struct class_Expression_35f2052bf4){ .val = { .item11 = var20 }, .membernum = 11 };
+var20 = NULL;
+meth_List_Expression__d162784c9e_push(var1,var21);
+out: (void)0;
+decref_Expression_35f2052bf4(var21);
+decref((var20), dtor_StringConstant_c2b1c10b4f);
+decref_Expression_35f2052bf4(var18);
+decref((var17), dtor_StringConstant_c2b1c10b4f);
+string_decref(var16);
+string_decref(var15);
+decref_Expression_35f2052bf4(var14);
+decref((var13), dtor_StringConstant_c2b1c10b4f);
+(void)0;
+decref_Expression_35f2052bf4(var9);
+(void)0;
+(void)0;
+decref((var4), dtor_List_Expression__d162784c9e);
+}struct class_List_ToplevelDeclaration__c481ce934d* parser_6c64cd293c_parse_file(struct class_Str var1, struct class_Str var2, struct class__null___Str__5eca9cec4f var3){int64_t var4;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_List_Token__da0ee88323* var6;
+var6 = NULL;
+struct class_List_Token__da0ee88323* var7;
+var7 = NULL;
+struct class_Parser_d28334dc68* var8;
+var8 = NULL;
+struct class_List_ToplevelDeclaration__c481ce934d* var9;
+var9 = NULL;
+struct class_List_Token__da0ee88323* var11;
+var11 = NULL;
+struct class_List_Token__da0ee88323* var12;
+var12 = NULL;
+bool var13;
+bool var14;
+bool var16;
+struct class_Token_35f69eeb49* var18;
+var18 = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+bool var21;
+bool var22;
+char var24;
+struct class__null___Str__5eca9cec4f var25;
+var25.membernum = -1;
+bool var26;
+bool var27;
+struct class_Str var28;
+var28.buf = NULL;
+int64_t var29;
+struct class_Str var30;
+var30.buf = NULL;
+struct class_Import_6056d7e9c9* var31;
+var31 = NULL;
+struct class_ToplevelDeclaration_054352d1cf var32;
+var32.membernum = -1;
+struct class_List_Token__da0ee88323* var34;
+var34 = NULL;
+struct class_List_Token__da0ee88323* var35;
+var35 = NULL;
+bool var36;
+bool var37;
+bool var38;
+struct class_ToplevelDeclaration_054352d1cf var40;
+var40.membernum = -1;
+struct class_List_ToplevelDeclaration__c481ce934d* retval;
+var4 = 1LL;
+var5 = string2__51efd6930c; string_incref(var5);
+var6 = tokenizer_431c4db6a8_tokenize(var1,var2,var4,var5);
+var7 = meth_List_Token__da0ee88323_reversed(var6);
+var8 = ctor_Parser_d28334dc68(var7);
+var9 = ctor_List_ToplevelDeclaration__c481ce934d();
+label10: (void)0;
+decref((var11), dtor_List_Token__da0ee88323);
+var11 = NULL;
+var11 = var8->memb_tokens;
+incref(var11);
+decref((var12), dtor_List_Token__da0ee88323);
+var12 = NULL;
+var12 = ctor_List_Token__da0ee88323();
+var13 = meth_List_Token__da0ee88323_equals(var11,var12);
+var14 = oomph_bool_not(var13);
+if (var14) goto label15;
+var16 = oomph_false;
+if (oomph_true) goto label17;
+label15: (void)0;
+decref((var18), dtor_Token_35f69eeb49);
+var18 = NULL;
+var18 = meth_Parser_d28334dc68_peek(var8);
+string_decref(var19);
+var19.buf = NULL;
+var19 = string3_keyword_3d4e852023; string_incref(var19);
+string_decref(var20);
+var20.buf = NULL;
+var20 = string4_import_8afafacce8; string_incref(var20);
+var21 = meth_Token_35f69eeb49_matches(var18,var19,var20);
+var16 = var21;
+label17: (void)0;
+var22 = oomph_bool_not(var16);
+if (var22) goto label23;
+var24 = oomph_null;
+decref__null___Str__5eca9cec4f(var25);
+var25.membernum = -1;
+var25 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var24 }, .membernum = 0 };
+var26 = meth__null___Str__5eca9cec4f_equals(var3,var25);
+var27 = oomph_bool_not(var26);
+string_decref(var28);
+var28.buf = NULL;
+var28 = string5_self_hosted_parser_oomph_971762f815; string_incref(var28);
+var29 = 604LL;
+oomph_assert(var27,var28,var29);
+string_decref(var30);
+var30.buf = NULL;
+var30 = meth__null___Str__5eca9cec4f_get(var3);
+var31 = meth_Parser_d28334dc68_parse_import(var8,var2,var30);
+decref_ToplevelDeclaration_054352d1cf(var32);
+var32.membernum = -1;
+var32 = (struct class_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var31 }, .membernum = 2 };
+var31 = NULL;
+meth_List_ToplevelDeclaration__c481ce934d_push(var9,var32);
+if (oomph_true) goto label10;
+label23: (void)0;
+label33: (void)0;
+decref((var34), dtor_List_Token__da0ee88323);
+var34 = NULL;
+var34 = var8->memb_tokens;
+incref(var34);
+decref((var35), dtor_List_Token__da0ee88323);
+var35 = NULL;
+var35 = ctor_List_Token__da0ee88323();
+var36 = meth_List_Token__da0ee88323_equals(var34,var35);
+var37 = oomph_bool_not(var36);
+var38 = oomph_bool_not(var37);
+if (var38) goto label39;
+decref_ToplevelDeclaration_054352d1cf(var40);
+var40.membernum = -1;
+var40 = meth_Parser_d28334dc68_parse_toplevel(var8);
+meth_List_ToplevelDeclaration__c481ce934d_push(var9,var40);
+if (oomph_true) goto label33;
+label39: (void)0;
+retval = var9; var9 = NULL;
+goto out;
+out: (void)0;
+decref_ToplevelDeclaration_054352d1cf(var40);
+(void)0;
+(void)0;
+(void)0;
+decref((var35), dtor_List_Token__da0ee88323);
+decref((var34), dtor_List_Token__da0ee88323);
+decref_ToplevelDeclaration_054352d1cf(var32);
+decref((var31), dtor_Import_6056d7e9c9);
+string_decref(var30);
+(void)0;
+string_decref(var28);
+(void)0;
+(void)0;
+decref__null___Str__5eca9cec4f(var25);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var20);
+string_decref(var19);
+decref((var18), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+decref((var12), dtor_List_Token__da0ee88323);
+decref((var11), dtor_List_Token__da0ee88323);
+decref((var9), dtor_List_ToplevelDeclaration__c481ce934d);
+decref((var8), dtor_Parser_d28334dc68);
+decref((var7), dtor_List_Token__da0ee88323);
+decref((var6), dtor_List_Token__da0ee88323);
+string_decref(var5);
+(void)0;
+return retval;
+}
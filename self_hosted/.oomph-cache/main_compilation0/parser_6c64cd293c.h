@@ -0,0 +1,36 @@
+
+                #ifndef HEADER_GUARD_parser_6c64cd293c
+                #define HEADER_GUARD_parser_6c64cd293c
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Expression_35f2052bf4.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "tokenizer_431c4db6a8.h"
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Expression__d162784c9e;
+struct class_StringConstant_c2b1c10b4f;
+struct class_StringConstant_c2b1c10b4f;
+struct class_StringConstant_c2b1c10b4f;
+struct class_List_Expression__d162784c9e;
+struct class_Location_500c4434c9;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_Parser_d28334dc68;
+struct class_List_ToplevelDeclaration__c481ce934d;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_Import_6056d7e9c9;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_ToplevelDeclaration__c481ce934d;
+struct class_List_ToplevelDeclaration__c481ce934d;
+struct class_Str parser_6c64cd293c_path_parent(struct class_Str var1);
+void parser_6c64cd293c_add_string(struct class_List_Expression__d162784c9e* var1, struct class_Str var2, struct class_Location_500c4434c9* var3);
+struct class_List_ToplevelDeclaration__c481ce934d* parser_6c64cd293c_parse_file(struct class_Str var1, struct class_Str var2, struct class__null___Str__5eca9cec4f var3);
+
+                #endif
+                
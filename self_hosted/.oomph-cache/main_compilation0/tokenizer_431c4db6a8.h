@@ -0,0 +1,131 @@
+
+                #ifndef HEADER_GUARD_tokenizer_431c4db6a8
+                #define HEADER_GUARD_tokenizer_431c4db6a8
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Str__5eca9cec4f.h"
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_Location_500c4434c9;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_List_Token__da0ee88323;
+struct class_List_Str__43b70c06cb;
+struct class_Location_500c4434c9;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_Location_500c4434c9;
+struct class_List_Str__43b70c06cb;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_List_Str__43b70c06cb;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_List_Token__da0ee88323;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_List_Str__43b70c06cb;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_Location_500c4434c9;
+struct class_Token_35f69eeb49;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class_List_Token__da0ee88323;
+struct class__null___Str__5eca9cec4f tokenizer_431c4db6a8_starts_with_any(struct class_Str var1, struct class_List_Str__43b70c06cb* var2);
+struct class__null___Str__5eca9cec4f tokenizer_431c4db6a8_get_simple_identifier(struct class_Str var1);
+struct class__null___Str__5eca9cec4f tokenizer_431c4db6a8_get_identifier(struct class_Str var1);
+struct class_Str tokenizer_431c4db6a8_get_int(struct class_Str var1);
+struct class_Str tokenizer_431c4db6a8_extract_string(struct class_Str var1, struct class_Str var2, struct class_Location_500c4434c9* var3);
+struct class_Str tokenizer_431c4db6a8_get_prefix_spaces(struct class_Str var1);
+struct class_List_Token__da0ee88323* tokenizer_431c4db6a8_raw_tokenize(struct class_Str var1, struct class_Str var2, int64_t var3, struct class_Str var4);
+struct class_Str tokenizer_431c4db6a8_flip_paren(struct class_Str var1);
+struct class_List_Token__da0ee88323* tokenizer_431c4db6a8_ignore_whitespace_in_parens(struct class_List_Token__da0ee88323* var1);
+struct class_List_Token__da0ee88323* tokenizer_431c4db6a8_combine_not_in(struct class_List_Token__da0ee88323* var1);
+void tokenizer_431c4db6a8_skip_newlines(struct class_List_Token__da0ee88323* var1);
+struct class_List_Token__da0ee88323* tokenizer_431c4db6a8_clean_newlines(struct class_List_Token__da0ee88323* var1);
+struct class_List_Token__da0ee88323* tokenizer_431c4db6a8_find_blocks(struct class_List_Token__da0ee88323* var1);
+struct class_List_Token__da0ee88323* tokenizer_431c4db6a8_tokenize(struct class_Str var1, struct class_Str var2, int64_t var3, struct class_Str var4);
+
+                #endif
+                
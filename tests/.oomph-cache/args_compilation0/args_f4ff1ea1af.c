@@ -0,0 +1,16 @@
+#include <lib/oomph.h>
+#include "args_f4ff1ea1af.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+#include "bundle_process_e29aff3881.h"
+void oomph_main(void){struct class_List_Str__43b70c06cb* var1;
+var1 = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+var1 = bundle_process_e29aff3881_get_args();
+var2 = meth_List_Str__43b70c06cb_to_string(var1);
+oomph_print(var2);
+out: (void)0;
+string_decref(var2);
+decref((var1), dtor_List_Str__43b70c06cb);
+}
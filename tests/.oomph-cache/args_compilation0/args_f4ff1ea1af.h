@@ -0,0 +1,11 @@
+
+                #ifndef HEADER_GUARD_args_f4ff1ea1af
+                #define HEADER_GUARD_args_f4ff1ea1af
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_process_e29aff3881.h"
+struct class_List_Str__43b70c06cb;
+void oomph_main(void);
+
+                #endif
+                
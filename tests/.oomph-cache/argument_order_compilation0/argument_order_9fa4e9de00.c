@@ -0,0 +1,34 @@
+#include <lib/oomph.h>
+#include "argument_order_9fa4e9de00.h"
+#include "bundle_builtins_c399a735f1.h"
+int64_t argument_order_9fa4e9de00_do_thing(int64_t var1){struct class_Str var2;
+var2.buf = NULL;
+int64_t retval;
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+(void)0; retval = var1; goto out;
+out: (void)0;
+string_decref(var2);
+return retval;
+}void argument_order_9fa4e9de00_ignore_all_args(int64_t var1, int64_t var2, int64_t var3){out: (void)0;
+}void oomph_main(void){int64_t var1;
+int64_t var2;
+int64_t var3;
+int64_t var4;
+int64_t var5;
+int64_t var6;
+var1 = 1LL;
+var2 = argument_order_9fa4e9de00_do_thing(var1);
+var3 = 2LL;
+var4 = argument_order_9fa4e9de00_do_thing(var3);
+var5 = 3LL;
+var6 = argument_order_9fa4e9de00_do_thing(var5);
+argument_order_9fa4e9de00_ignore_all_args(var2,var4,var6);
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,11 @@
+
+                #ifndef HEADER_GUARD_argument_order_9fa4e9de00
+                #define HEADER_GUARD_argument_order_9fa4e9de00
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+int64_t argument_order_9fa4e9de00_do_thing(int64_t var1);
+void argument_order_9fa4e9de00_ignore_all_args(int64_t var1, int64_t var2, int64_t var3);
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,98 @@
+#include <lib/oomph.h>
+#include "Foo_6cfe0bd2e0.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo_6f32b2f650_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_6f32b2f650 = {
+                .buf = &string0_Foo_6f32b2f650_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_Foo_6cfe0bd2e0_to_string(struct class_Foo_6cfe0bd2e0 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_Int_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Str_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Foo_6f32b2f650), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_Foo_6f32b2f650;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_Foo_6cfe0bd2e0_equals(struct class_Foo_6cfe0bd2e0 a, struct class_Foo_6cfe0bd2e0 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_Int_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Str_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Foo_6f32b2f650), (int)a.membernum);
+                }
+            }
+            
+            void incref_Foo_6cfe0bd2e0(struct class_Foo_6cfe0bd2e0 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    string_incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_Foo_6cfe0bd2e0(struct class_Foo_6cfe0bd2e0 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    string_decref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
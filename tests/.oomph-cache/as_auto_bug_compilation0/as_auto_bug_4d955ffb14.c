@@ -0,0 +1,54 @@
+#include <lib/oomph.h>
+#include "as_auto_bug_4d955ffb14.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_6cfe0bd2e0.h"
+#include "List_Foo__8e4a9adb5d.h"
+
+            static struct StringBuf string0_lol_e2512865ef_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_lol_e2512865ef = {
+                .buf = &string0_lol_e2512865ef_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_List_Foo__8e4a9adb5d* var1;
+var1 = NULL;
+int64_t var2;
+struct class_Foo_6cfe0bd2e0 var4;
+var4.membernum = -1;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Foo_6cfe0bd2e0 var8;
+var8.membernum = -1;
+var1 = ctor_List_Foo__8e4a9adb5d();
+var2 = 0LL;
+label3: (void)0;
+if (var2 >= var1->len) goto label5;
+var4 = var1->data[var2++];
+string_decref(var6);
+var6.buf = NULL;
+
+            if (var4.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var6 = var4.val.item1;
+            string_incref(var6);
+oomph_print(var6);
+if (oomph_true) goto label3;
+label5: (void)0;
+var7 = string0_lol_e2512865ef; string_incref(var7);
+var8 = (struct class_Foo_6cfe0bd2e0){ .val = { .item1 = var7 }, .membernum = 1 };
+var7.buf = NULL;
+meth_List_Foo__8e4a9adb5d_push(var1,var8);
+out: (void)0;
+decref_Foo_6cfe0bd2e0(var8);
+string_decref(var7);
+string_decref(var6);
+(void)0;
+decref((var1), dtor_List_Foo__8e4a9adb5d);
+}
@@ -0,0 +1,11 @@
+
+                #ifndef HEADER_GUARD_as_auto_bug_4d955ffb14
+                #define HEADER_GUARD_as_auto_bug_4d955ffb14
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_6cfe0bd2e0.h"
+struct class_List_Foo__8e4a9adb5d;
+void oomph_main(void);
+
+                #endif
+                
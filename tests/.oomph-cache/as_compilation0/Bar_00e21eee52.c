@@ -0,0 +1,99 @@
+#include <lib/oomph.h>
+#include "Bar_00e21eee52.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_193784b07b.h"
+
+            static struct StringBuf string0_Bar_a2488af8c2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Bar_a2488af8c2 = {
+                .buf = &string0_Bar_a2488af8c2_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_Bar_00e21eee52_to_string(struct class_Bar_00e21eee52 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_Foo_193784b07b_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Str_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Bar_a2488af8c2), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_Bar_a2488af8c2;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_Bar_00e21eee52_equals(struct class_Bar_00e21eee52 a, struct class_Bar_00e21eee52 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_Foo_193784b07b_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Str_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Bar_a2488af8c2), (int)a.membernum);
+                }
+            }
+            
+            void incref_Bar_00e21eee52(struct class_Bar_00e21eee52 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    string_incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_Bar_00e21eee52(struct class_Bar_00e21eee52 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_Foo_193784b07b);
+                    break;
+                
+                case 1:
+                    string_decref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
@@ -0,0 +1,24 @@
+
+                #ifndef HEADER_GUARD_Bar_00e21eee52
+                #define HEADER_GUARD_Bar_00e21eee52
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Foo_193784b07b;
+
+            struct class_Bar_00e21eee52 {
+                union {
+                    	struct class_Foo_193784b07b* item0;
+	struct class_Str item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_Bar_00e21eee52_to_string(struct class_Bar_00e21eee52 obj);
+            bool meth_Bar_00e21eee52_equals(struct class_Bar_00e21eee52 a, struct class_Bar_00e21eee52 b);
+            
+            void incref_Bar_00e21eee52(struct class_Bar_00e21eee52 obj);
+            void decref_Bar_00e21eee52(struct class_Bar_00e21eee52 obj);
+            
+                #endif
+                
@@ -0,0 +1,56 @@
+#include <lib/oomph.h>
+#include "Foo_193784b07b.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo_b88be1f0f6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_b88be1f0f6 = {
+                .buf = &string0_Foo_b88be1f0f6_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Foo_193784b07b* ctor_Foo_193784b07b(int64_t arg_value)
+            {
+                struct class_Foo_193784b07b* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_value = arg_value;
+
+                (void)0;
+
+                return obj;
+            }
+
+            void dtor_Foo_193784b07b(void *ptr)
+            {
+                struct class_Foo_193784b07b *obj = ptr;
+                (void)0;
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo_193784b07b_to_string(struct class_Foo_193784b07b* self)
+                {
+                    struct class_Str res = string0_Foo_b88be1f0f6;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_193784b07b_equals(struct class_Foo_193784b07b* var1, struct class_Foo_193784b07b* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,20 @@
+
+                #ifndef HEADER_GUARD_Foo_193784b07b
+                #define HEADER_GUARD_Foo_193784b07b
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_193784b07b {
+                REFCOUNT_HEADER
+                int64_t memb_value;
+
+            };
+            
+            struct class_Foo_193784b07b* ctor_Foo_193784b07b(int64_t arg_value);
+            void dtor_Foo_193784b07b(void *ptr);
+            
+                struct class_Str meth_Foo_193784b07b_to_string(struct class_Foo_193784b07b* obj);
+                bool meth_Foo_193784b07b_equals(struct class_Foo_193784b07b* var1, struct class_Foo_193784b07b* var2);
+
+                #endif
+                
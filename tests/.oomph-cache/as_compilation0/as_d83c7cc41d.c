@@ -0,0 +1,33 @@
+#include <lib/oomph.h>
+#include "as_d83c7cc41d.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_00e21eee52.h"
+#include "Foo_193784b07b.h"
+void oomph_main(void){int64_t var1;
+struct class_Foo_193784b07b* var2;
+var2 = NULL;
+struct class_Bar_00e21eee52 var3;
+var3.membernum = -1;
+struct class_Foo_193784b07b* var4;
+var4 = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+var1 = 123LL;
+var2 = ctor_Foo_193784b07b(var1);
+var3 = (struct class_Bar_00e21eee52){ .val = { .item0 = var2 }, .membernum = 0 };
+var2 = NULL;
+
+            if (var3.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var4 = var3.val.item0;
+            incref(var4);
+var5 = meth_Foo_193784b07b_to_string(var4);
+oomph_print(var5);
+out: (void)0;
+string_decref(var5);
+decref((var4), dtor_Foo_193784b07b);
+decref_Bar_00e21eee52(var3);
+decref((var2), dtor_Foo_193784b07b);
+(void)0;
+}
@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_as_d83c7cc41d
+                #define HEADER_GUARD_as_d83c7cc41d
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_00e21eee52.h"
+struct class_Foo_193784b07b;
+struct class_Foo_193784b07b;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,99 @@
+#include <lib/oomph.h>
+#include "Bar_fc4f45ccb1.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_36393e6bc4.h"
+
+            static struct StringBuf string0_Bar_7fbba11fee_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Bar_7fbba11fee = {
+                .buf = &string0_Bar_7fbba11fee_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_Bar_fc4f45ccb1_to_string(struct class_Bar_fc4f45ccb1 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_Foo_36393e6bc4_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Str_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Bar_7fbba11fee), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_Bar_7fbba11fee;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_Bar_fc4f45ccb1_equals(struct class_Bar_fc4f45ccb1 a, struct class_Bar_fc4f45ccb1 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_Foo_36393e6bc4_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Str_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Bar_7fbba11fee), (int)a.membernum);
+                }
+            }
+            
+            void incref_Bar_fc4f45ccb1(struct class_Bar_fc4f45ccb1 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    string_incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_Bar_fc4f45ccb1(struct class_Bar_fc4f45ccb1 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_Foo_36393e6bc4);
+                    break;
+                
+                case 1:
+                    string_decref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
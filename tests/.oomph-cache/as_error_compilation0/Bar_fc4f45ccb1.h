@@ -0,0 +1,24 @@
+
+                #ifndef HEADER_GUARD_Bar_fc4f45ccb1
+                #define HEADER_GUARD_Bar_fc4f45ccb1
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Foo_36393e6bc4;
+
+            struct class_Bar_fc4f45ccb1 {
+                union {
+                    	struct class_Foo_36393e6bc4* item0;
+	struct class_Str item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_Bar_fc4f45ccb1_to_string(struct class_Bar_fc4f45ccb1 obj);
+            bool meth_Bar_fc4f45ccb1_equals(struct class_Bar_fc4f45ccb1 a, struct class_Bar_fc4f45ccb1 b);
+            
+            void incref_Bar_fc4f45ccb1(struct class_Bar_fc4f45ccb1 obj);
+            void decref_Bar_fc4f45ccb1(struct class_Bar_fc4f45ccb1 obj);
+            
+                #endif
+                
@@ -0,0 +1,56 @@
+#include <lib/oomph.h>
+#include "Foo_36393e6bc4.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo_dbd760aa45_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_dbd760aa45 = {
+                .buf = &string0_Foo_dbd760aa45_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Foo_36393e6bc4* ctor_Foo_36393e6bc4(int64_t arg_value)
+            {
+                struct class_Foo_36393e6bc4* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_value = arg_value;
+
+                (void)0;
+
+                return obj;
+            }
+
+            void dtor_Foo_36393e6bc4(void *ptr)
+            {
+                struct class_Foo_36393e6bc4 *obj = ptr;
+                (void)0;
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo_36393e6bc4_to_string(struct class_Foo_36393e6bc4* self)
+                {
+                    struct class_Str res = string0_Foo_dbd760aa45;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_36393e6bc4_equals(struct class_Foo_36393e6bc4* var1, struct class_Foo_36393e6bc4* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
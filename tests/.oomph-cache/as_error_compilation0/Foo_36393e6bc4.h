@@ -0,0 +1,20 @@
+
+                #ifndef HEADER_GUARD_Foo_36393e6bc4
+                #define HEADER_GUARD_Foo_36393e6bc4
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_36393e6bc4 {
+                REFCOUNT_HEADER
+                int64_t memb_value;
+
+            };
+            
+            struct class_Foo_36393e6bc4* ctor_Foo_36393e6bc4(int64_t arg_value);
+            void dtor_Foo_36393e6bc4(void *ptr);
+            
+                struct class_Str meth_Foo_36393e6bc4_to_string(struct class_Foo_36393e6bc4* obj);
+                bool meth_Foo_36393e6bc4_equals(struct class_Foo_36393e6bc4* var1, struct class_Foo_36393e6bc4* var2);
+
+                #endif
+                
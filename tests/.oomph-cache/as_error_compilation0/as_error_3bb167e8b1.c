@@ -0,0 +1,41 @@
+#include <lib/oomph.h>
+#include "as_error_3bb167e8b1.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_fc4f45ccb1.h"
+#include "Foo_36393e6bc4.h"
+
+            static struct StringBuf string0_lol_0a588c1762_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_lol_0a588c1762 = {
+                .buf = &string0_lol_0a588c1762_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Bar_fc4f45ccb1 var2;
+var2.membernum = -1;
+struct class_Foo_36393e6bc4* var3;
+var3 = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+var1 = string0_lol_0a588c1762; string_incref(var1);
+var2 = (struct class_Bar_fc4f45ccb1){ .val = { .item1 = var1 }, .membernum = 1 };
+var1.buf = NULL;
+
+            if (var2.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var3 = var2.val.item0;
+            incref(var3);
+var4 = meth_Foo_36393e6bc4_to_string(var3);
+oomph_print(var4);
+out: (void)0;
+string_decref(var4);
+decref((var3), dtor_Foo_36393e6bc4);
+decref_Bar_fc4f45ccb1(var2);
+string_decref(var1);
+}
@@ -0,0 +1,11 @@
+
+                #ifndef HEADER_GUARD_as_error_3bb167e8b1
+                #define HEADER_GUARD_as_error_3bb167e8b1
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_fc4f45ccb1.h"
+struct class_Foo_36393e6bc4;
+void oomph_main(void);
+
+                #endif
+                
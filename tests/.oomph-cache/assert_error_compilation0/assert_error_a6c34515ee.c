@@ -0,0 +1,38 @@
+#include <lib/oomph.h>
+#include "assert_error_a6c34515ee.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_tests_assert_error_oomph_52689a9615_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73', '\x2f', '\x61', '\x73', '\x73', '\x65', '\x72', '\x74', '\x5f', '\x65', '\x72', '\x72', '\x6f', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string0_tests_assert_error_oomph_52689a9615 = {
+                .buf = &string0_tests_assert_error_oomph_52689a9615_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            void oomph_main(void){bool var1;
+struct class_Str var2;
+var2.buf = NULL;
+int64_t var3;
+bool var4;
+struct class_Str var5;
+var5.buf = NULL;
+int64_t var6;
+var1 = oomph_true;
+var2 = string0_tests_assert_error_oomph_52689a9615; string_incref(var2);
+var3 = 2LL;
+oomph_assert(var1,var2,var3);
+var4 = oomph_false;
+var5 = string0_tests_assert_error_oomph_52689a9615; string_incref(var5);
+var6 = 3LL;
+oomph_assert(var4,var5,var6);
+out: (void)0;
+(void)0;
+string_decref(var5);
+(void)0;
+(void)0;
+string_decref(var2);
+(void)0;
+}
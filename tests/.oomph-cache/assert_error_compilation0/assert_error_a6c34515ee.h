@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_assert_error_a6c34515ee
+                #define HEADER_GUARD_assert_error_a6c34515ee
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
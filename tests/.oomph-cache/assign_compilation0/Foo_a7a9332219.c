@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "Foo_a7a9332219.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo_707d29e68a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_707d29e68a = {
+                .buf = &string0_Foo_707d29e68a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Foo_a7a9332219* ctor_Foo_a7a9332219(int64_t arg_x)
+            {
+                struct class_Foo_a7a9332219* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_x = arg_x;
+
+                (void)0;
+
+                return obj;
+            }
+
+            void dtor_Foo_a7a9332219(void *ptr)
+            {
+                struct class_Foo_a7a9332219 *obj = ptr;
+                (void)0;
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo_a7a9332219_to_string(struct class_Foo_a7a9332219* self)
+                {
+                    struct class_Str res = string0_Foo_707d29e68a;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_x);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_a7a9332219_equals(struct class_Foo_a7a9332219* var1, struct class_Foo_a7a9332219* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}void meth_Foo_a7a9332219_show(struct class_Foo_a7a9332219* var1){int64_t var2;
+struct class_Str var3;
+var3.buf = NULL;
+var2 = var1->memb_x;
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+out: (void)0;
+string_decref(var3);
+(void)0;
+}
@@ -0,0 +1,21 @@
+
+                #ifndef HEADER_GUARD_Foo_a7a9332219
+                #define HEADER_GUARD_Foo_a7a9332219
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_a7a9332219 {
+                REFCOUNT_HEADER
+                int64_t memb_x;
+
+            };
+            
+            struct class_Foo_a7a9332219* ctor_Foo_a7a9332219(int64_t arg_x);
+            void dtor_Foo_a7a9332219(void *ptr);
+            
+                struct class_Str meth_Foo_a7a9332219_to_string(struct class_Foo_a7a9332219* obj);
+                bool meth_Foo_a7a9332219_equals(struct class_Foo_a7a9332219* var1, struct class_Foo_a7a9332219* var2);
+void meth_Foo_a7a9332219_show(struct class_Foo_a7a9332219* var1);
+
+                #endif
+                
@@ -0,0 +1,25 @@
+#include <lib/oomph.h>
+#include "assign_471c94ccf1.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_a7a9332219.h"
+void oomph_main(void){int64_t var1;
+struct class_Foo_a7a9332219* var2;
+var2 = NULL;
+int64_t var3;
+struct class_Foo_a7a9332219* var4;
+var4 = NULL;
+var1 = 1LL;
+var2 = ctor_Foo_a7a9332219(var1);
+meth_Foo_a7a9332219_show(var2);
+var3 = 2LL;
+var4 = ctor_Foo_a7a9332219(var3);
+decref((var2), dtor_Foo_a7a9332219);
+var2 = var4;
+var4 = NULL;
+meth_Foo_a7a9332219_show(var2);
+out: (void)0;
+decref((var4), dtor_Foo_a7a9332219);
+(void)0;
+decref((var2), dtor_Foo_a7a9332219);
+(void)0;
+}
@@ -0,0 +1,11 @@
+
+                #ifndef HEADER_GUARD_assign_471c94ccf1
+                #define HEADER_GUARD_assign_471c94ccf1
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Foo_a7a9332219;
+struct class_Foo_a7a9332219;
+void oomph_main(void);
+
+                #endif
+                
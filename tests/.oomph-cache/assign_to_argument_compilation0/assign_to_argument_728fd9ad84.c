@@ -0,0 +1,95 @@
+#include <lib/oomph.h>
+#include "assign_to_argument_728fd9ad84.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_a_f1c8f4cff2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string0_a_f1c8f4cff2 = {
+                .buf = &string0_a_f1c8f4cff2_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_b_34d1749c7b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string1_b_34d1749c7b = {
+                .buf = &string1_b_34d1749c7b_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_c_b061619158_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string2_c_b061619158 = {
+                .buf = &string2_c_b061619158_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3__2bfb507a2d_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string3__2bfb507a2d = {
+                .buf = &string3__2bfb507a2d_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            void assign_to_argument_728fd9ad84_foo(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+var2 = var1;
+string_incref(var2);
+var3 = string0_a_f1c8f4cff2; string_incref(var3);
+var4 = meth_Str_remove_prefix(var2,var3);
+string_decref(var2);
+var2 = var4;
+var4.buf = NULL;
+out: (void)0;
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+}void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_List_Str__43b70c06cb* var4;
+var4 = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+var1 = string0_a_f1c8f4cff2; string_incref(var1);
+var2 = string1_b_34d1749c7b; string_incref(var2);
+var3 = string2_c_b061619158; string_incref(var3);
+var4 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var4,var1);
+meth_List_Str__43b70c06cb_push(var4,var2);
+meth_List_Str__43b70c06cb_push(var4,var3);
+var5 = string3__2bfb507a2d; string_incref(var5);
+var6 = meth_List_Str__43b70c06cb_join(var4,var5);
+assign_to_argument_728fd9ad84_foo(var6);
+out: (void)0;
+string_decref(var6);
+string_decref(var5);
+decref((var4), dtor_List_Str__43b70c06cb);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+}
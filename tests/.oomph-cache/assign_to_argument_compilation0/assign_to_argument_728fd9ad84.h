@@ -0,0 +1,11 @@
+
+                #ifndef HEADER_GUARD_assign_to_argument_728fd9ad84
+                #define HEADER_GUARD_assign_to_argument_728fd9ad84
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Str__43b70c06cb;
+void assign_to_argument_728fd9ad84_foo(struct class_Str var1);
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,56 @@
+#include <lib/oomph.h>
+#include "Foo_03086374d7.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo_c2cf34f230_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_c2cf34f230 = {
+                .buf = &string0_Foo_c2cf34f230_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Foo_03086374d7* ctor_Foo_03086374d7(struct class_Str arg_s)
+            {
+                struct class_Foo_03086374d7* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_s = arg_s;
+
+                string_incref(arg_s);
+
+                return obj;
+            }
+
+            void dtor_Foo_03086374d7(void *ptr)
+            {
+                struct class_Foo_03086374d7 *obj = ptr;
+                string_decref(obj->memb_s);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo_03086374d7_to_string(struct class_Foo_03086374d7* self)
+                {
+                    struct class_Str res = string0_Foo_c2cf34f230;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_s);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_03086374d7_equals(struct class_Foo_03086374d7* var1, struct class_Foo_03086374d7* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
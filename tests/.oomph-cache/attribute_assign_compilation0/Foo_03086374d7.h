@@ -0,0 +1,20 @@
+
+                #ifndef HEADER_GUARD_Foo_03086374d7
+                #define HEADER_GUARD_Foo_03086374d7
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_03086374d7 {
+                REFCOUNT_HEADER
+                struct class_Str memb_s;
+
+            };
+            
+            struct class_Foo_03086374d7* ctor_Foo_03086374d7(struct class_Str arg_s);
+            void dtor_Foo_03086374d7(void *ptr);
+            
+                struct class_Str meth_Foo_03086374d7_to_string(struct class_Foo_03086374d7* obj);
+                bool meth_Foo_03086374d7_equals(struct class_Foo_03086374d7* var1, struct class_Foo_03086374d7* var2);
+
+                #endif
+                
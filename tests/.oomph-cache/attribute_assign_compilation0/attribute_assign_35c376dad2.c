@@ -0,0 +1,222 @@
+#include <lib/oomph.h>
+#include "attribute_assign_35c376dad2.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_03086374d7.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_l_0507220d4f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_l_0507220d4f = {
+                .buf = &string0_l_0507220d4f_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_o_088ce5582f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string1_o_088ce5582f = {
+                .buf = &string1_o_088ce5582f_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2__041bbd662f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string2__041bbd662f = {
+                .buf = &string2__041bbd662f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_w_317da81718_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77' },
+                .malloced = false,
+            };
+            static struct class_Str string3_w_317da81718 = {
+                .buf = &string3_w_317da81718_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_u_8b8ef5acc5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x75' },
+                .malloced = false,
+            };
+            static struct class_Str string4_u_8b8ef5acc5 = {
+                .buf = &string4_u_8b8ef5acc5_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_t_871dc54a05_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string5_t_871dc54a05 = {
+                .buf = &string5_t_871dc54a05_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6_blah_d1e9cf5883_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x6c', '\x61', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string6_blah_d1e9cf5883 = {
+                .buf = &string6_blah_d1e9cf5883_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_List_Str__43b70c06cb* var4;
+var4 = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Foo_03086374d7* var7;
+var7 = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_List_Str__43b70c06cb* var14;
+var14 = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+int64_t var19;
+int64_t var21;
+bool var22;
+bool var23;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+struct class_Str var28;
+var28.buf = NULL;
+struct class_Str var29;
+var29.buf = NULL;
+int64_t var30;
+int64_t var31;
+var1 = string0_l_0507220d4f; string_incref(var1);
+var2 = string1_o_088ce5582f; string_incref(var2);
+var3 = string0_l_0507220d4f; string_incref(var3);
+var4 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var4,var1);
+meth_List_Str__43b70c06cb_push(var4,var2);
+meth_List_Str__43b70c06cb_push(var4,var3);
+var5 = string2__041bbd662f; string_incref(var5);
+var6 = meth_List_Str__43b70c06cb_join(var4,var5);
+var7 = ctor_Foo_03086374d7(var6);
+var8 = meth_Foo_03086374d7_to_string(var7);
+oomph_print(var8);
+var9 = string3_w_317da81718; string_incref(var9);
+var10 = string4_u_8b8ef5acc5; string_incref(var10);
+var11 = string5_t_871dc54a05; string_incref(var11);
+var12 = string5_t_871dc54a05; string_incref(var12);
+var13 = string5_t_871dc54a05; string_incref(var13);
+var14 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var14,var9);
+meth_List_Str__43b70c06cb_push(var14,var10);
+meth_List_Str__43b70c06cb_push(var14,var11);
+meth_List_Str__43b70c06cb_push(var14,var12);
+meth_List_Str__43b70c06cb_push(var14,var13);
+var15 = string2__041bbd662f; string_incref(var15);
+var16 = meth_List_Str__43b70c06cb_join(var14,var15);
+var17 = var7->memb_s;
+var7->memb_s = var16;
+var16.buf = NULL;
+var18 = meth_Foo_03086374d7_to_string(var7);
+oomph_print(var18);
+var19 = 0LL;
+label20: (void)0;
+var21 = 10LL;
+var22 = oomph_int_gt(var21,var19);
+var23 = oomph_bool_not(var22);
+if (var23) goto label24;
+string_decref(var25);
+var25.buf = NULL;
+var25 = string6_blah_d1e9cf5883; string_incref(var25);
+string_decref(var26);
+var26.buf = NULL;
+var26 = meth_Int_to_string(var19);
+var27 = oomph_string_concat(var25,var26);
+string_decref(var28);
+var28.buf = NULL;
+var28 = var7->memb_s;
+var7->memb_s = var27;
+var27.buf = NULL;
+string_decref(var29);
+var29.buf = NULL;
+var29 = meth_Foo_03086374d7_to_string(var7);
+oomph_print(var29);
+var30 = 1LL;
+var31 = oomph_int_add(var19,var30);
+var19 = var31;
+if (oomph_true) goto label20;
+label24: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+string_decref(var29);
+string_decref(var28);
+string_decref(var27);
+string_decref(var26);
+string_decref(var25);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var18);
+string_decref(var17);
+string_decref(var16);
+string_decref(var15);
+decref((var14), dtor_List_Str__43b70c06cb);
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+string_decref(var10);
+string_decref(var9);
+string_decref(var8);
+decref((var7), dtor_Foo_03086374d7);
+string_decref(var6);
+string_decref(var5);
+decref((var4), dtor_List_Str__43b70c06cb);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+}
@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_attribute_assign_35c376dad2
+                #define HEADER_GUARD_attribute_assign_35c376dad2
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Str__43b70c06cb;
+struct class_Foo_03086374d7;
+struct class_List_Str__43b70c06cb;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "Bar_d814e6ec66.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_ac409b4831.h"
+
+            static struct StringBuf string0_Bar_989793ca35_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Bar_989793ca35 = {
+                .buf = &string0_Bar_989793ca35_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Bar_d814e6ec66* ctor_Bar_d814e6ec66(struct class_Foo_ac409b4831* arg_foo)
+            {
+                struct class_Bar_d814e6ec66* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_foo = arg_foo;
+
+                incref(arg_foo);
+
+                return obj;
+            }
+
+            void dtor_Bar_d814e6ec66(void *ptr)
+            {
+                struct class_Bar_d814e6ec66 *obj = ptr;
+                decref((obj->memb_foo), dtor_Foo_ac409b4831);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Bar_d814e6ec66_to_string(struct class_Bar_d814e6ec66* self)
+                {
+                    struct class_Str res = string0_Bar_989793ca35;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Foo_ac409b4831_to_string(self->memb_foo);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Bar_d814e6ec66_equals(struct class_Bar_d814e6ec66* var1, struct class_Bar_d814e6ec66* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_Bar_d814e6ec66
+                #define HEADER_GUARD_Bar_d814e6ec66
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Foo_ac409b4831;
+struct class_Foo_ac409b4831;
+
+            struct class_Bar_d814e6ec66 {
+                REFCOUNT_HEADER
+                struct class_Foo_ac409b4831* memb_foo;
+
+            };
+            
+            struct class_Bar_d814e6ec66* ctor_Bar_d814e6ec66(struct class_Foo_ac409b4831* arg_foo);
+            void dtor_Bar_d814e6ec66(void *ptr);
+            
+                struct class_Str meth_Bar_d814e6ec66_to_string(struct class_Bar_d814e6ec66* obj);
+                bool meth_Bar_d814e6ec66_equals(struct class_Bar_d814e6ec66* var1, struct class_Bar_d814e6ec66* var2);
+
+                #endif
+                
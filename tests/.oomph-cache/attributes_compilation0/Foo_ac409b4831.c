@@ -0,0 +1,49 @@
+#include <lib/oomph.h>
+#include "Foo_ac409b4831.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo_f358567445_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_f358567445 = {
+                .buf = &string0_Foo_f358567445_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Foo_ac409b4831* ctor_Foo_ac409b4831(void)
+            {
+                struct class_Foo_ac409b4831* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_Foo_ac409b4831(void *ptr)
+            {
+                struct class_Foo_ac409b4831 *obj = ptr;
+                
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo_ac409b4831_to_string(struct class_Foo_ac409b4831* self)
+                {
+                    struct class_Str res = string0_Foo_f358567445;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_ac409b4831_equals(struct class_Foo_ac409b4831* var1, struct class_Foo_ac409b4831* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
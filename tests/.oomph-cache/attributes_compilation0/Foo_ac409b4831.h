@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Foo_ac409b4831
+                #define HEADER_GUARD_Foo_ac409b4831
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_ac409b4831 {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Foo_ac409b4831* ctor_Foo_ac409b4831(void);
+            void dtor_Foo_ac409b4831(void *ptr);
+            
+                struct class_Str meth_Foo_ac409b4831_to_string(struct class_Foo_ac409b4831* obj);
+                bool meth_Foo_ac409b4831_equals(struct class_Foo_ac409b4831* var1, struct class_Foo_ac409b4831* var2);
+
+                #endif
+                
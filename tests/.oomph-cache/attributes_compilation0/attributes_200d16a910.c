@@ -0,0 +1,24 @@
+#include <lib/oomph.h>
+#include "attributes_200d16a910.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_d814e6ec66.h"
+#include "Foo_ac409b4831.h"
+struct class_Bar_d814e6ec66* attributes_200d16a910_blah(void){struct class_Foo_ac409b4831* var1;
+var1 = NULL;
+struct class_Bar_d814e6ec66* var2;
+var2 = NULL;
+struct class_Bar_d814e6ec66* retval;
+var1 = ctor_Foo_ac409b4831();
+var2 = ctor_Bar_d814e6ec66(var1);
+retval = var2; var2 = NULL;
+goto out;
+out: (void)0;
+decref((var2), dtor_Bar_d814e6ec66);
+decref((var1), dtor_Foo_ac409b4831);
+return retval;
+}void oomph_main(void){struct class_Bar_d814e6ec66* var1;
+var1 = NULL;
+var1 = attributes_200d16a910_blah();
+out: (void)0;
+decref((var1), dtor_Bar_d814e6ec66);
+}
@@ -0,0 +1,15 @@
+
+                #ifndef HEADER_GUARD_attributes_200d16a910
+                #define HEADER_GUARD_attributes_200d16a910
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Foo_ac409b4831;
+struct class_Bar_d814e6ec66;
+struct class_Bar_d814e6ec66;
+struct class_Bar_d814e6ec66;
+struct class_Bar_d814e6ec66;
+struct class_Bar_d814e6ec66* attributes_200d16a910_blah(void);
+void oomph_main(void);
+
+                #endif
+                
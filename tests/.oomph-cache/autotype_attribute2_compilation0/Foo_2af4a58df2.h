@@ -0,0 +1,20 @@
+
+                #ifndef HEADER_GUARD_Foo_2af4a58df2
+                #define HEADER_GUARD_Foo_2af4a58df2
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_2af4a58df2 {
+                REFCOUNT_HEADER
+                struct class_Str memb_lol;
+
+            };
+            
+            struct class_Foo_2af4a58df2* ctor_Foo_2af4a58df2(struct class_Str arg_lol);
+            void dtor_Foo_2af4a58df2(void *ptr);
+            
+                struct class_Str meth_Foo_2af4a58df2_to_string(struct class_Foo_2af4a58df2* obj);
+                bool meth_Foo_2af4a58df2_equals(struct class_Foo_2af4a58df2* var1, struct class_Foo_2af4a58df2* var2);
+
+                #endif
+                
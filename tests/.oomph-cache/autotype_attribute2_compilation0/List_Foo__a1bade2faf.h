@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_Foo__a1bade2faf
+                #define HEADER_GUARD_List_Foo__a1bade2faf
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_2af4a58df2.h"
+struct class_Foo_2af4a58df2;
+struct class_Foo_2af4a58df2;
+struct class_Foo_2af4a58df2;
+struct class_Foo_2af4a58df2;
+struct class_Foo_2af4a58df2;
+struct class_Foo_2af4a58df2;
+struct class_Foo_2af4a58df2;
+struct class_Foo_2af4a58df2;
+struct class_Foo_2af4a58df2;
+struct class_Foo_2af4a58df2;
+struct class_Foo_2af4a58df2;
+struct class_Foo_2af4a58df2;
+struct class_Foo_2af4a58df2;
+struct class_Foo_2af4a58df2;
+
+#define CONSTRUCTOR ctor_List_Foo__a1bade2faf
+
+#define DESTRUCTOR dtor_List_Foo__a1bade2faf
+
+#define TYPE struct class_List_Foo__a1bade2faf *
+
+#define TYPE_STRUCT class_List_Foo__a1bade2faf
+
+#define METHOD(name) meth_List_Foo__a1bade2faf_##name
+
+#define ITEMTYPE struct class_Foo_2af4a58df2*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Foo_2af4a58df2_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Foo_2af4a58df2)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Foo__a1bade2faf___contains(struct class_List_Foo__a1bade2faf*, struct class_Foo_2af4a58df2*);
+void meth_List_Foo__a1bade2faf___reserve(struct class_List_Foo__a1bade2faf*, int64_t);
+struct class_Foo_2af4a58df2* meth_List_Foo__a1bade2faf_delete_at_index(struct class_List_Foo__a1bade2faf*, int64_t);
+struct class_List_Foo__a1bade2faf* meth_List_Foo__a1bade2faf_delete_slice(struct class_List_Foo__a1bade2faf*, int64_t, int64_t);
+bool meth_List_Foo__a1bade2faf_ends_with(struct class_List_Foo__a1bade2faf*, struct class_List_Foo__a1bade2faf*);
+int64_t meth_List_Foo__a1bade2faf_find_first(struct class_List_Foo__a1bade2faf*, struct class_Foo_2af4a58df2*);
+int64_t meth_List_Foo__a1bade2faf_find_last(struct class_List_Foo__a1bade2faf*, struct class_Foo_2af4a58df2*);
+int64_t meth_List_Foo__a1bade2faf_find_only(struct class_List_Foo__a1bade2faf*, struct class_Foo_2af4a58df2*);
+struct class_Foo_2af4a58df2* meth_List_Foo__a1bade2faf_first(struct class_List_Foo__a1bade2faf*);
+struct class_Foo_2af4a58df2* meth_List_Foo__a1bade2faf_get(struct class_List_Foo__a1bade2faf*, int64_t);
+void meth_List_Foo__a1bade2faf_insert(struct class_List_Foo__a1bade2faf*, int64_t, struct class_Foo_2af4a58df2*);
+struct class_Foo_2af4a58df2* meth_List_Foo__a1bade2faf_last(struct class_List_Foo__a1bade2faf*);
+int64_t meth_List_Foo__a1bade2faf_length(struct class_List_Foo__a1bade2faf*);
+struct class_Foo_2af4a58df2* meth_List_Foo__a1bade2faf_pop(struct class_List_Foo__a1bade2faf*);
+void meth_List_Foo__a1bade2faf_push(struct class_List_Foo__a1bade2faf*, struct class_Foo_2af4a58df2*);
+void meth_List_Foo__a1bade2faf_push_all(struct class_List_Foo__a1bade2faf*, struct class_List_Foo__a1bade2faf*);
+void meth_List_Foo__a1bade2faf_delete_first(struct class_List_Foo__a1bade2faf*, struct class_Foo_2af4a58df2*);
+void meth_List_Foo__a1bade2faf_delete_last(struct class_List_Foo__a1bade2faf*, struct class_Foo_2af4a58df2*);
+void meth_List_Foo__a1bade2faf_delete_only(struct class_List_Foo__a1bade2faf*, struct class_Foo_2af4a58df2*);
+struct class_List_Foo__a1bade2faf* meth_List_Foo__a1bade2faf_reversed(struct class_List_Foo__a1bade2faf*);
+struct class_List_Foo__a1bade2faf* meth_List_Foo__a1bade2faf_slice(struct class_List_Foo__a1bade2faf*, int64_t, int64_t);
+bool meth_List_Foo__a1bade2faf_starts_with(struct class_List_Foo__a1bade2faf*, struct class_List_Foo__a1bade2faf*);
+struct class_Str meth_List_Foo__a1bade2faf_to_string(struct class_List_Foo__a1bade2faf*);
+struct class_Str meth_List_Foo__a1bade2faf_join(struct class_List_Foo__a1bade2faf*, struct class_Str);
+bool meth_List_Foo__a1bade2faf_equals(struct class_List_Foo__a1bade2faf*, struct class_List_Foo__a1bade2faf*);
+
+#define CONSTRUCTOR ctor_List_Foo__a1bade2faf
+
+#define DESTRUCTOR dtor_List_Foo__a1bade2faf
+
+#define TYPE struct class_List_Foo__a1bade2faf *
+
+#define TYPE_STRUCT class_List_Foo__a1bade2faf
+
+#define METHOD(name) meth_List_Foo__a1bade2faf_##name
+
+#define ITEMTYPE struct class_Foo_2af4a58df2*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Foo_2af4a58df2_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Foo_2af4a58df2)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
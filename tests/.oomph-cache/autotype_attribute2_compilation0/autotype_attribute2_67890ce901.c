@@ -0,0 +1,56 @@
+#include <lib/oomph.h>
+#include "autotype_attribute2_67890ce901.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_2af4a58df2.h"
+#include "List_Foo__a1bade2faf.h"
+
+            static struct StringBuf string0_lol_332b03af61_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_lol_332b03af61 = {
+                .buf = &string0_lol_332b03af61_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_List_Foo__a1bade2faf* var1;
+var1 = NULL;
+int64_t var2;
+struct class_Foo_2af4a58df2* var4;
+var4 = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Foo_2af4a58df2* var9;
+var9 = NULL;
+var1 = ctor_List_Foo__a1bade2faf();
+var2 = 0LL;
+label3: (void)0;
+if (var2 >= var1->len) goto label5;
+decref((var4), dtor_Foo_2af4a58df2); var4 = var1->data[var2++]; incref(var4);
+string_decref(var6);
+var6.buf = NULL;
+var6 = var4->memb_lol;
+string_incref(var6);
+string_decref(var7);
+var7.buf = NULL;
+var7 = meth_Str_to_string(var6);
+oomph_print(var7);
+if (oomph_true) goto label3;
+label5: (void)0;
+var8 = string0_lol_332b03af61; string_incref(var8);
+var9 = ctor_Foo_2af4a58df2(var8);
+meth_List_Foo__a1bade2faf_push(var1,var9);
+out: (void)0;
+decref((var9), dtor_Foo_2af4a58df2);
+string_decref(var8);
+string_decref(var7);
+string_decref(var6);
+decref((var4), dtor_Foo_2af4a58df2);
+(void)0;
+decref((var1), dtor_List_Foo__a1bade2faf);
+}
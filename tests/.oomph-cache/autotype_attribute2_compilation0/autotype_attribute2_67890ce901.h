@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_autotype_attribute2_67890ce901
+                #define HEADER_GUARD_autotype_attribute2_67890ce901
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Foo__a1bade2faf;
+struct class_Foo_2af4a58df2;
+struct class_Foo_2af4a58df2;
+void oomph_main(void);
+
+                #endif
+                
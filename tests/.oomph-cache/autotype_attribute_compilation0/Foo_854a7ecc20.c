@@ -0,0 +1,56 @@
+#include <lib/oomph.h>
+#include "Foo_854a7ecc20.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo_e85d88fce7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_e85d88fce7 = {
+                .buf = &string0_Foo_e85d88fce7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Foo_854a7ecc20* ctor_Foo_854a7ecc20(struct class_Str arg_lol)
+            {
+                struct class_Foo_854a7ecc20* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_lol = arg_lol;
+
+                string_incref(arg_lol);
+
+                return obj;
+            }
+
+            void dtor_Foo_854a7ecc20(void *ptr)
+            {
+                struct class_Foo_854a7ecc20 *obj = ptr;
+                string_decref(obj->memb_lol);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo_854a7ecc20_to_string(struct class_Foo_854a7ecc20* self)
+                {
+                    struct class_Str res = string0_Foo_e85d88fce7;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_lol);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_854a7ecc20_equals(struct class_Foo_854a7ecc20* var1, struct class_Foo_854a7ecc20* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
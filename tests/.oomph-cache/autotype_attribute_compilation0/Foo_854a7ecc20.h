@@ -0,0 +1,20 @@
+
+                #ifndef HEADER_GUARD_Foo_854a7ecc20
+                #define HEADER_GUARD_Foo_854a7ecc20
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_854a7ecc20 {
+                REFCOUNT_HEADER
+                struct class_Str memb_lol;
+
+            };
+            
+            struct class_Foo_854a7ecc20* ctor_Foo_854a7ecc20(struct class_Str arg_lol);
+            void dtor_Foo_854a7ecc20(void *ptr);
+            
+                struct class_Str meth_Foo_854a7ecc20_to_string(struct class_Foo_854a7ecc20* obj);
+                bool meth_Foo_854a7ecc20_equals(struct class_Foo_854a7ecc20* var1, struct class_Foo_854a7ecc20* var2);
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_Foo__da44aa0960
+                #define HEADER_GUARD_List_Foo__da44aa0960
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_854a7ecc20.h"
+struct class_Foo_854a7ecc20;
+struct class_Foo_854a7ecc20;
+struct class_Foo_854a7ecc20;
+struct class_Foo_854a7ecc20;
+struct class_Foo_854a7ecc20;
+struct class_Foo_854a7ecc20;
+struct class_Foo_854a7ecc20;
+struct class_Foo_854a7ecc20;
+struct class_Foo_854a7ecc20;
+struct class_Foo_854a7ecc20;
+struct class_Foo_854a7ecc20;
+struct class_Foo_854a7ecc20;
+struct class_Foo_854a7ecc20;
+struct class_Foo_854a7ecc20;
+
+#define CONSTRUCTOR ctor_List_Foo__da44aa0960
+
+#define DESTRUCTOR dtor_List_Foo__da44aa0960
+
+#define TYPE struct class_List_Foo__da44aa0960 *
+
+#define TYPE_STRUCT class_List_Foo__da44aa0960
+
+#define METHOD(name) meth_List_Foo__da44aa0960_##name
+
+#define ITEMTYPE struct class_Foo_854a7ecc20*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Foo_854a7ecc20_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Foo_854a7ecc20)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Foo__da44aa0960___contains(struct class_List_Foo__da44aa0960*, struct class_Foo_854a7ecc20*);
+void meth_List_Foo__da44aa0960___reserve(struct class_List_Foo__da44aa0960*, int64_t);
+struct class_Foo_854a7ecc20* meth_List_Foo__da44aa0960_delete_at_index(struct class_List_Foo__da44aa0960*, int64_t);
+struct class_List_Foo__da44aa0960* meth_List_Foo__da44aa0960_delete_slice(struct class_List_Foo__da44aa0960*, int64_t, int64_t);
+bool meth_List_Foo__da44aa0960_ends_with(struct class_List_Foo__da44aa0960*, struct class_List_Foo__da44aa0960*);
+int64_t meth_List_Foo__da44aa0960_find_first(struct class_List_Foo__da44aa0960*, struct class_Foo_854a7ecc20*);
+int64_t meth_List_Foo__da44aa0960_find_last(struct class_List_Foo__da44aa0960*, struct class_Foo_854a7ecc20*);
+int64_t meth_List_Foo__da44aa0960_find_only(struct class_List_Foo__da44aa0960*, struct class_Foo_854a7ecc20*);
+struct class_Foo_854a7ecc20* meth_List_Foo__da44aa0960_first(struct class_List_Foo__da44aa0960*);
+struct class_Foo_854a7ecc20* meth_List_Foo__da44aa0960_get(struct class_List_Foo__da44aa0960*, int64_t);
+void meth_List_Foo__da44aa0960_insert(struct class_List_Foo__da44aa0960*, int64_t, struct class_Foo_854a7ecc20*);
+struct class_Foo_854a7ecc20* meth_List_Foo__da44aa0960_last(struct class_List_Foo__da44aa0960*);
+int64_t meth_List_Foo__da44aa0960_length(struct class_List_Foo__da44aa0960*);
+struct class_Foo_854a7ecc20* meth_List_Foo__da44aa0960_pop(struct class_List_Foo__da44aa0960*);
+void meth_List_Foo__da44aa0960_push(struct class_List_Foo__da44aa0960*, struct class_Foo_854a7ecc20*);
+void meth_List_Foo__da44aa0960_push_all(struct class_List_Foo__da44aa0960*, struct class_List_Foo__da44aa0960*);
+void meth_List_Foo__da44aa0960_delete_first(struct class_List_Foo__da44aa0960*, struct class_Foo_854a7ecc20*);
+void meth_List_Foo__da44aa0960_delete_last(struct class_List_Foo__da44aa0960*, struct class_Foo_854a7ecc20*);
+void meth_List_Foo__da44aa0960_delete_only(struct class_List_Foo__da44aa0960*, struct class_Foo_854a7ecc20*);
+struct class_List_Foo__da44aa0960* meth_List_Foo__da44aa0960_reversed(struct class_List_Foo__da44aa0960*);
+struct class_List_Foo__da44aa0960* meth_List_Foo__da44aa0960_slice(struct class_List_Foo__da44aa0960*, int64_t, int64_t);
+bool meth_List_Foo__da44aa0960_starts_with(struct class_List_Foo__da44aa0960*, struct class_List_Foo__da44aa0960*);
+struct class_Str meth_List_Foo__da44aa0960_to_string(struct class_List_Foo__da44aa0960*);
+struct class_Str meth_List_Foo__da44aa0960_join(struct class_List_Foo__da44aa0960*, struct class_Str);
+bool meth_List_Foo__da44aa0960_equals(struct class_List_Foo__da44aa0960*, struct class_List_Foo__da44aa0960*);
+
+#define CONSTRUCTOR ctor_List_Foo__da44aa0960
+
+#define DESTRUCTOR dtor_List_Foo__da44aa0960
+
+#define TYPE struct class_List_Foo__da44aa0960 *
+
+#define TYPE_STRUCT class_List_Foo__da44aa0960
+
+#define METHOD(name) meth_List_Foo__da44aa0960_##name
+
+#define ITEMTYPE struct class_Foo_854a7ecc20*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Foo_854a7ecc20_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Foo_854a7ecc20)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,49 @@
+#include <lib/oomph.h>
+#include "autotype_attribute_bcddff4c7a.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_854a7ecc20.h"
+#include "List_Foo__da44aa0960.h"
+
+            static struct StringBuf string0_lol_9014aa0b3c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_lol_9014aa0b3c = {
+                .buf = &string0_lol_9014aa0b3c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_List_Foo__da44aa0960* var1;
+var1 = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_Foo_854a7ecc20* var3;
+var3 = NULL;
+int64_t var4;
+struct class_Foo_854a7ecc20* var6;
+var6 = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+var1 = ctor_List_Foo__da44aa0960();
+var2 = string0_lol_9014aa0b3c; string_incref(var2);
+var3 = ctor_Foo_854a7ecc20(var2);
+meth_List_Foo__da44aa0960_push(var1,var3);
+var4 = 0LL;
+label5: (void)0;
+if (var4 >= var1->len) goto label7;
+var6 = var1->data[var4++];
+string_decref(var8);
+var8.buf = NULL;
+var8 = var6->memb_lol;
+string_incref(var8);
+oomph_print(var8);
+if (oomph_true) goto label5;
+label7: (void)0;
+out: (void)0;
+string_decref(var8);
+(void)0;
+decref((var3), dtor_Foo_854a7ecc20);
+string_decref(var2);
+decref((var1), dtor_List_Foo__da44aa0960);
+}
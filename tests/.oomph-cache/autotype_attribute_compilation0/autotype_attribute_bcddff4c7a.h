@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_autotype_attribute_bcddff4c7a
+                #define HEADER_GUARD_autotype_attribute_bcddff4c7a
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Foo__da44aa0960;
+struct class_Foo_854a7ecc20;
+struct class_Foo_854a7ecc20;
+void oomph_main(void);
+
+                #endif
+                
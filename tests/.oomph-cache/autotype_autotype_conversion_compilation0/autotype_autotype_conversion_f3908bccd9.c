@@ -0,0 +1,40 @@
+#include <lib/oomph.h>
+#include "autotype_autotype_conversion_f3908bccd9.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Int__df8a64abf3.h"
+void oomph_main(void){struct class_List_Int__df8a64abf3* var1;
+var1 = NULL;
+int64_t var2;
+int64_t var4;
+struct class_List_Int__df8a64abf3* var6;
+var6 = NULL;
+int64_t var7;
+int64_t var9;
+int64_t var11;
+var1 = ctor_List_Int__df8a64abf3();
+var2 = 0LL;
+label3: (void)0;
+if (var2 >= var1->len) goto label5;
+(void)0; var4 = var1->data[var2++]; (void)0;
+decref((var6), dtor_List_Int__df8a64abf3);
+var6 = NULL;
+var6 = ctor_List_Int__df8a64abf3();
+var7 = 0LL;
+label8: (void)0;
+if (var7 >= var6->len) goto label10;
+var9 = var6->data[var7++];
+var4 = var9;
+if (oomph_true) goto label8;
+label10: (void)0;
+var11 = 1LL;
+meth_List_Int__df8a64abf3_push(var6,var11);
+if (oomph_true) goto label3;
+label5: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var6), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref((var1), dtor_List_Int__df8a64abf3);
+}
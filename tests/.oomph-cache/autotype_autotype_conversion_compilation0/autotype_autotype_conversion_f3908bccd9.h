@@ -0,0 +1,11 @@
+
+                #ifndef HEADER_GUARD_autotype_autotype_conversion_f3908bccd9
+                #define HEADER_GUARD_autotype_autotype_conversion_f3908bccd9
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,56 @@
+#include <lib/oomph.h>
+#include "autotype_bug_50c3a82246.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_lol_a5ba3ef820_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_lol_a5ba3ef820 = {
+                .buf = &string0_lol_a5ba3ef820_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_a_5d46c450bd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string1_a_5d46c450bd = {
+                .buf = &string1_a_5d46c450bd_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_List_Str__43b70c06cb* var1;
+var1 = NULL;
+struct class_List_Str__43b70c06cb* var2;
+var2 = NULL;
+bool var3;
+bool var4;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+var1 = ctor_List_Str__43b70c06cb();
+var2 = ctor_List_Str__43b70c06cb();
+var3 = meth_List_Str__43b70c06cb_equals(var1,var2);
+var4 = oomph_bool_not(var3);
+if (var4) goto label5;
+if (oomph_true) goto label6;
+label5: (void)0;
+var7 = string0_lol_a5ba3ef820; string_incref(var7);
+oomph_print(var7);
+label6: (void)0;
+var8 = string1_a_5d46c450bd; string_incref(var8);
+meth_List_Str__43b70c06cb_push(var1,var8);
+out: (void)0;
+string_decref(var8);
+string_decref(var7);
+(void)0;
+(void)0;
+decref((var2), dtor_List_Str__43b70c06cb);
+decref((var1), dtor_List_Str__43b70c06cb);
+}
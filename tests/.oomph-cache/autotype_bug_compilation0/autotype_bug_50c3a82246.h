@@ -0,0 +1,11 @@
+
+                #ifndef HEADER_GUARD_autotype_bug_50c3a82246
+                #define HEADER_GUARD_autotype_bug_50c3a82246
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+void oomph_main(void);
+
+                #endif
+                
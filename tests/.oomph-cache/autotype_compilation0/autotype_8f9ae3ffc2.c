@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "autotype_8f9ae3ffc2.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Int__df8a64abf3.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_lol_a61538d6d6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_lol_a61538d6d6 = {
+                .buf = &string0_lol_a61538d6d6_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            struct class_List_Str__43b70c06cb* autotype_8f9ae3ffc2_auto_inside_list(void){struct class_List_Int__df8a64abf3* var1;
+var1 = NULL;
+struct class_List_Int__df8a64abf3* var2;
+var2 = NULL;
+struct class_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct class_List_Str__43b70c06cb* retval;
+var1 = ctor_List_Int__df8a64abf3();
+var2 = ctor_List_Int__df8a64abf3();
+decref((var1), dtor_List_Int__df8a64abf3);
+var1 = var2;
+var2 = NULL;
+var3 = ctor_List_Str__43b70c06cb();
+retval = var3; var3 = NULL;
+goto out;
+out: (void)0;
+decref((var3), dtor_List_Str__43b70c06cb);
+decref((var2), dtor_List_Int__df8a64abf3);
+decref((var1), dtor_List_Int__df8a64abf3);
+return retval;
+}void oomph_main(void){struct class_List_Int__df8a64abf3* var1;
+var1 = NULL;
+int64_t var2;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_List_Str__43b70c06cb* var4;
+var4 = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+var1 = ctor_List_Int__df8a64abf3();
+var2 = 1LL;
+meth_List_Int__df8a64abf3_push(var1,var2);
+var3 = meth_List_Int__df8a64abf3_to_string(var1);
+oomph_print(var3);
+var4 = autotype_8f9ae3ffc2_auto_inside_list();
+var5 = string0_lol_a61538d6d6; string_incref(var5);
+meth_List_Str__43b70c06cb_push(var4,var5);
+out: (void)0;
+string_decref(var5);
+decref((var4), dtor_List_Str__43b70c06cb);
+string_decref(var3);
+(void)0;
+decref((var1), dtor_List_Int__df8a64abf3);
+}
@@ -0,0 +1,17 @@
+
+                #ifndef HEADER_GUARD_autotype_8f9ae3ffc2
+                #define HEADER_GUARD_autotype_8f9ae3ffc2
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Int__df8a64abf3;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb* autotype_8f9ae3ffc2_auto_inside_list(void);
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,62 @@
+#include <lib/oomph.h>
+#include "autotype_join_bug_789343d451.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_a_2f38455750_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string0_a_2f38455750 = {
+                .buf = &string0_a_2f38455750_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_b_879155cfed_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string1_b_879155cfed = {
+                .buf = &string1_b_879155cfed_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2__and__791908ade5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x61', '\x6e', '\x64', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string2__and__791908ade5 = {
+                .buf = &string2__and__791908ade5_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_List_Str__43b70c06cb* var1;
+var1 = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+var1 = ctor_List_Str__43b70c06cb();
+var2 = string0_a_2f38455750; string_incref(var2);
+meth_List_Str__43b70c06cb_push(var1,var2);
+var3 = string1_b_879155cfed; string_incref(var3);
+meth_List_Str__43b70c06cb_push(var1,var3);
+var4 = string2__and__791908ade5; string_incref(var4);
+var5 = meth_List_Str__43b70c06cb_join(var1,var4);
+oomph_print(var5);
+out: (void)0;
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+decref((var1), dtor_List_Str__43b70c06cb);
+}
@@ -0,0 +1,66 @@
+#include <lib/oomph.h>
+#include "Foo_b3224be025.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo_30af92b3f4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_30af92b3f4 = {
+                .buf = &string0_Foo_30af92b3f4_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_lollll_662c92b658_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c', '\x6c', '\x6c', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string1_lollll_662c92b658 = {
+                .buf = &string1_lollll_662c92b658_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_Foo_b3224be025* ctor_Foo_b3224be025(void)
+            {
+                struct class_Foo_b3224be025* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_Foo_b3224be025(void *ptr)
+            {
+                struct class_Foo_b3224be025 *obj = ptr;
+                
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo_b3224be025_to_string(struct class_Foo_b3224be025* self)
+                {
+                    struct class_Str res = string0_Foo_30af92b3f4;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_b3224be025_equals(struct class_Foo_b3224be025* var1, struct class_Foo_b3224be025* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}void meth_Foo_b3224be025_lol(struct class_Foo_b3224be025* var1){struct class_Str var2;
+var2.buf = NULL;
+var2 = string1_lollll_662c92b658; string_incref(var2);
+oomph_print(var2);
+out: (void)0;
+string_decref(var2);
+}
@@ -0,0 +1,20 @@
+
+                #ifndef HEADER_GUARD_Foo_b3224be025
+                #define HEADER_GUARD_Foo_b3224be025
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_b3224be025 {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Foo_b3224be025* ctor_Foo_b3224be025(void);
+            void dtor_Foo_b3224be025(void *ptr);
+            
+                struct class_Str meth_Foo_b3224be025_to_string(struct class_Foo_b3224be025* obj);
+                bool meth_Foo_b3224be025_equals(struct class_Foo_b3224be025* var1, struct class_Foo_b3224be025* var2);
+void meth_Foo_b3224be025_lol(struct class_Foo_b3224be025* var1);
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_Foo__df113dedee
+                #define HEADER_GUARD_List_Foo__df113dedee
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_b3224be025.h"
+struct class_Foo_b3224be025;
+struct class_Foo_b3224be025;
+struct class_Foo_b3224be025;
+struct class_Foo_b3224be025;
+struct class_Foo_b3224be025;
+struct class_Foo_b3224be025;
+struct class_Foo_b3224be025;
+struct class_Foo_b3224be025;
+struct class_Foo_b3224be025;
+struct class_Foo_b3224be025;
+struct class_Foo_b3224be025;
+struct class_Foo_b3224be025;
+struct class_Foo_b3224be025;
+struct class_Foo_b3224be025;
+
+#define CONSTRUCTOR ctor_List_Foo__df113dedee
+
+#define DESTRUCTOR dtor_List_Foo__df113dedee
+
+#define TYPE struct class_List_Foo__df113dedee *
+
+#define TYPE_STRUCT class_List_Foo__df113dedee
+
+#define METHOD(name) meth_List_Foo__df113dedee_##name
+
+#define ITEMTYPE struct class_Foo_b3224be025*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Foo_b3224be025_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Foo_b3224be025)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Foo__df113dedee___contains(struct class_List_Foo__df113dedee*, struct class_Foo_b3224be025*);
+void meth_List_Foo__df113dedee___reserve(struct class_List_Foo__df113dedee*, int64_t);
+struct class_Foo_b3224be025* meth_List_Foo__df113dedee_delete_at_index(struct class_List_Foo__df113dedee*, int64_t);
+struct class_List_Foo__df113dedee* meth_List_Foo__df113dedee_delete_slice(struct class_List_Foo__df113dedee*, int64_t, int64_t);
+bool meth_List_Foo__df113dedee_ends_with(struct class_List_Foo__df113dedee*, struct class_List_Foo__df113dedee*);
+int64_t meth_List_Foo__df113dedee_find_first(struct class_List_Foo__df113dedee*, struct class_Foo_b3224be025*);
+int64_t meth_List_Foo__df113dedee_find_last(struct class_List_Foo__df113dedee*, struct class_Foo_b3224be025*);
+int64_t meth_List_Foo__df113dedee_find_only(struct class_List_Foo__df113dedee*, struct class_Foo_b3224be025*);
+struct class_Foo_b3224be025* meth_List_Foo__df113dedee_first(struct class_List_Foo__df113dedee*);
+struct class_Foo_b3224be025* meth_List_Foo__df113dedee_get(struct class_List_Foo__df113dedee*, int64_t);
+void meth_List_Foo__df113dedee_insert(struct class_List_Foo__df113dedee*, int64_t, struct class_Foo_b3224be025*);
+struct class_Foo_b3224be025* meth_List_Foo__df113dedee_last(struct class_List_Foo__df113dedee*);
+int64_t meth_List_Foo__df113dedee_length(struct class_List_Foo__df113dedee*);
+struct class_Foo_b3224be025* meth_List_Foo__df113dedee_pop(struct class_List_Foo__df113dedee*);
+void meth_List_Foo__df113dedee_push(struct class_List_Foo__df113dedee*, struct class_Foo_b3224be025*);
+void meth_List_Foo__df113dedee_push_all(struct class_List_Foo__df113dedee*, struct class_List_Foo__df113dedee*);
+void meth_List_Foo__df113dedee_delete_first(struct class_List_Foo__df113dedee*, struct class_Foo_b3224be025*);
+void meth_List_Foo__df113dedee_delete_last(struct class_List_Foo__df113dedee*, struct class_Foo_b3224be025*);
+void meth_List_Foo__df113dedee_delete_only(struct class_List_Foo__df113dedee*, struct class_Foo_b3224be025*);
+struct class_List_Foo__df113dedee* meth_List_Foo__df113dedee_reversed(struct class_List_Foo__df113dedee*);
+struct class_List_Foo__df113dedee* meth_List_Foo__df113dedee_slice(struct class_List_Foo__df113dedee*, int64_t, int64_t);
+bool meth_List_Foo__df113dedee_starts_with(struct class_List_Foo__df113dedee*, struct class_List_Foo__df113dedee*);
+struct class_Str meth_List_Foo__df113dedee_to_string(struct class_List_Foo__df113dedee*);
+struct class_Str meth_List_Foo__df113dedee_join(struct class_List_Foo__df113dedee*, struct class_Str);
+bool meth_List_Foo__df113dedee_equals(struct class_List_Foo__df113dedee*, struct class_List_Foo__df113dedee*);
+
+#define CONSTRUCTOR ctor_List_Foo__df113dedee
+
+#define DESTRUCTOR dtor_List_Foo__df113dedee
+
+#define TYPE struct class_List_Foo__df113dedee *
+
+#define TYPE_STRUCT class_List_Foo__df113dedee
+
+#define METHOD(name) meth_List_Foo__df113dedee_##name
+
+#define ITEMTYPE struct class_Foo_b3224be025*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Foo_b3224be025_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Foo_b3224be025)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
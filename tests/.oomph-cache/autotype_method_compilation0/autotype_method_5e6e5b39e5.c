@@ -0,0 +1,28 @@
+#include <lib/oomph.h>
+#include "autotype_method_5e6e5b39e5.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_b3224be025.h"
+#include "List_Foo__df113dedee.h"
+void oomph_main(void){struct class_List_Foo__df113dedee* var1;
+var1 = NULL;
+struct class_Foo_b3224be025* var2;
+var2 = NULL;
+int64_t var3;
+struct class_Foo_b3224be025* var5;
+var5 = NULL;
+var1 = ctor_List_Foo__df113dedee();
+var2 = ctor_Foo_b3224be025();
+meth_List_Foo__df113dedee_push(var1,var2);
+var3 = 0LL;
+label4: (void)0;
+if (var3 >= var1->len) goto label6;
+decref((var5), dtor_Foo_b3224be025); var5 = var1->data[var3++]; incref(var5);
+meth_Foo_b3224be025_lol(var5);
+if (oomph_true) goto label4;
+label6: (void)0;
+out: (void)0;
+decref((var5), dtor_Foo_b3224be025);
+(void)0;
+decref((var2), dtor_Foo_b3224be025);
+decref((var1), dtor_List_Foo__df113dedee);
+}
@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_autotype_method_5e6e5b39e5
+                #define HEADER_GUARD_autotype_method_5e6e5b39e5
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Foo__df113dedee;
+struct class_Foo_b3224be025;
+struct class_Foo_b3224be025;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,66 @@
+#include <lib/oomph.h>
+#include "Foo_83f7bbe476.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo_c78f4b01b7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_c78f4b01b7 = {
+                .buf = &string0_Foo_c78f4b01b7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_lollll_f0cb03d6cc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c', '\x6c', '\x6c', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string1_lollll_f0cb03d6cc = {
+                .buf = &string1_lollll_f0cb03d6cc_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_Foo_83f7bbe476* ctor_Foo_83f7bbe476(void)
+            {
+                struct class_Foo_83f7bbe476* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_Foo_83f7bbe476(void *ptr)
+            {
+                struct class_Foo_83f7bbe476 *obj = ptr;
+                
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo_83f7bbe476_to_string(struct class_Foo_83f7bbe476* self)
+                {
+                    struct class_Str res = string0_Foo_c78f4b01b7;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_83f7bbe476_equals(struct class_Foo_83f7bbe476* var1, struct class_Foo_83f7bbe476* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}void meth_Foo_83f7bbe476_lol(struct class_Foo_83f7bbe476* var1){struct class_Str var2;
+var2.buf = NULL;
+var2 = string1_lollll_f0cb03d6cc; string_incref(var2);
+oomph_print(var2);
+out: (void)0;
+string_decref(var2);
+}
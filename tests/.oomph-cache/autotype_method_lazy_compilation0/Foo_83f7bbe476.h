@@ -0,0 +1,20 @@
+
+                #ifndef HEADER_GUARD_Foo_83f7bbe476
+                #define HEADER_GUARD_Foo_83f7bbe476
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_83f7bbe476 {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Foo_83f7bbe476* ctor_Foo_83f7bbe476(void);
+            void dtor_Foo_83f7bbe476(void *ptr);
+            
+                struct class_Str meth_Foo_83f7bbe476_to_string(struct class_Foo_83f7bbe476* obj);
+                bool meth_Foo_83f7bbe476_equals(struct class_Foo_83f7bbe476* var1, struct class_Foo_83f7bbe476* var2);
+void meth_Foo_83f7bbe476_lol(struct class_Foo_83f7bbe476* var1);
+
+                #endif
+                
@@ -0,0 +1,28 @@
+#include <lib/oomph.h>
+#include "autotype_method_lazy_6ed4297059.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_83f7bbe476.h"
+#include "List_Foo__3ccd5955c9.h"
+void oomph_main(void){struct class_List_Foo__3ccd5955c9* var1;
+var1 = NULL;
+int64_t var2;
+struct class_Foo_83f7bbe476* var4;
+var4 = NULL;
+struct class_Foo_83f7bbe476* var6;
+var6 = NULL;
+var1 = ctor_List_Foo__3ccd5955c9();
+var2 = 0LL;
+label3: (void)0;
+if (var2 >= var1->len) goto label5;
+decref((var4), dtor_Foo_83f7bbe476); var4 = var1->data[var2++]; incref(var4);
+meth_Foo_83f7bbe476_lol(var4);
+if (oomph_true) goto label3;
+label5: (void)0;
+var6 = ctor_Foo_83f7bbe476();
+meth_List_Foo__3ccd5955c9_push(var1,var6);
+out: (void)0;
+decref((var6), dtor_Foo_83f7bbe476);
+decref((var4), dtor_Foo_83f7bbe476);
+(void)0;
+decref((var1), dtor_List_Foo__3ccd5955c9);
+}
@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_autotype_method_lazy_6ed4297059
+                #define HEADER_GUARD_autotype_method_lazy_6ed4297059
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Foo__3ccd5955c9;
+struct class_Foo_83f7bbe476;
+struct class_Foo_83f7bbe476;
+void oomph_main(void);
+
+                #endif
+                
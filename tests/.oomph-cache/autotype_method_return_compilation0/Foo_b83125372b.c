@@ -0,0 +1,76 @@
+#include <lib/oomph.h>
+#include "Foo_b83125372b.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo_6064c8f902_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_6064c8f902 = {
+                .buf = &string0_Foo_6064c8f902_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_abc_55cad3aafd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62', '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string1_abc_55cad3aafd = {
+                .buf = &string1_abc_55cad3aafd_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Foo_b83125372b* ctor_Foo_b83125372b(struct class_Str arg_thing)
+            {
+                struct class_Foo_b83125372b* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_thing = arg_thing;
+
+                string_incref(arg_thing);
+
+                return obj;
+            }
+
+            void dtor_Foo_b83125372b(void *ptr)
+            {
+                struct class_Foo_b83125372b *obj = ptr;
+                string_decref(obj->memb_thing);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo_b83125372b_to_string(struct class_Foo_b83125372b* self)
+                {
+                    struct class_Str res = string0_Foo_6064c8f902;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_thing);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_b83125372b_equals(struct class_Foo_b83125372b* var1, struct class_Foo_b83125372b* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}struct class_Str meth_Foo_b83125372b_bar(struct class_Foo_b83125372b* var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str retval;
+var2 = string1_abc_55cad3aafd; string_incref(var2);
+retval = var2; var2.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var2);
+return retval;
+}
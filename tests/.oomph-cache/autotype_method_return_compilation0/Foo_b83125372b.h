@@ -0,0 +1,21 @@
+
+                #ifndef HEADER_GUARD_Foo_b83125372b
+                #define HEADER_GUARD_Foo_b83125372b
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_b83125372b {
+                REFCOUNT_HEADER
+                struct class_Str memb_thing;
+
+            };
+            
+            struct class_Foo_b83125372b* ctor_Foo_b83125372b(struct class_Str arg_thing);
+            void dtor_Foo_b83125372b(void *ptr);
+            
+                struct class_Str meth_Foo_b83125372b_to_string(struct class_Foo_b83125372b* obj);
+                bool meth_Foo_b83125372b_equals(struct class_Foo_b83125372b* var1, struct class_Foo_b83125372b* var2);
+struct class_Str meth_Foo_b83125372b_bar(struct class_Foo_b83125372b* var1);
+
+                #endif
+                
@@ -0,0 +1,55 @@
+#include <lib/oomph.h>
+#include "autotype_method_return_686c856050.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_b83125372b.h"
+#include "List_Foo__27fc8ee9a6.h"
+
+            static struct StringBuf string0__d975c937f1_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string0__d975c937f1 = {
+                .buf = &string0__d975c937f1_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_List_Foo__27fc8ee9a6* var1;
+var1 = NULL;
+int64_t var2;
+struct class_Foo_b83125372b* var4;
+var4 = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Foo_b83125372b* var9;
+var9 = NULL;
+var1 = ctor_List_Foo__27fc8ee9a6();
+var2 = 0LL;
+label3: (void)0;
+if (var2 >= var1->len) goto label5;
+decref((var4), dtor_Foo_b83125372b); var4 = var1->data[var2++]; incref(var4);
+string_decref(var6);
+var6.buf = NULL;
+var6 = meth_Foo_b83125372b_bar(var4);
+string_decref(var7);
+var7.buf = NULL;
+var7 = meth_Str_to_string(var6);
+oomph_print(var7);
+if (oomph_true) goto label3;
+label5: (void)0;
+var8 = string0__d975c937f1; string_incref(var8);
+var9 = ctor_Foo_b83125372b(var8);
+meth_List_Foo__27fc8ee9a6_push(var1,var9);
+out: (void)0;
+decref((var9), dtor_Foo_b83125372b);
+string_decref(var8);
+string_decref(var7);
+string_decref(var6);
+decref((var4), dtor_Foo_b83125372b);
+(void)0;
+decref((var1), dtor_List_Foo__27fc8ee9a6);
+}
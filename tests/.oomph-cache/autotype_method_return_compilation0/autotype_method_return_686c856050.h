@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_autotype_method_return_686c856050
+                #define HEADER_GUARD_autotype_method_return_686c856050
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Foo__27fc8ee9a6;
+struct class_Foo_b83125372b;
+struct class_Foo_b83125372b;
+void oomph_main(void);
+
+                #endif
+                
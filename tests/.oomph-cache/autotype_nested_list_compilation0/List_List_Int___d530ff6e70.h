@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_List_Int___d530ff6e70
+                #define HEADER_GUARD_List_List_Int___d530ff6e70
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Int__df8a64abf3.h"
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+
+#define CONSTRUCTOR ctor_List_List_Int___d530ff6e70
+
+#define DESTRUCTOR dtor_List_List_Int___d530ff6e70
+
+#define TYPE struct class_List_List_Int___d530ff6e70 *
+
+#define TYPE_STRUCT class_List_List_Int___d530ff6e70
+
+#define METHOD(name) meth_List_List_Int___d530ff6e70_##name
+
+#define ITEMTYPE struct class_List_Int__df8a64abf3*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_List_Int__df8a64abf3_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_List_Int__df8a64abf3)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_List_Int___d530ff6e70___contains(struct class_List_List_Int___d530ff6e70*, struct class_List_Int__df8a64abf3*);
+void meth_List_List_Int___d530ff6e70___reserve(struct class_List_List_Int___d530ff6e70*, int64_t);
+struct class_List_Int__df8a64abf3* meth_List_List_Int___d530ff6e70_delete_at_index(struct class_List_List_Int___d530ff6e70*, int64_t);
+struct class_List_List_Int___d530ff6e70* meth_List_List_Int___d530ff6e70_delete_slice(struct class_List_List_Int___d530ff6e70*, int64_t, int64_t);
+bool meth_List_List_Int___d530ff6e70_ends_with(struct class_List_List_Int___d530ff6e70*, struct class_List_List_Int___d530ff6e70*);
+int64_t meth_List_List_Int___d530ff6e70_find_first(struct class_List_List_Int___d530ff6e70*, struct class_List_Int__df8a64abf3*);
+int64_t meth_List_List_Int___d530ff6e70_find_last(struct class_List_List_Int___d530ff6e70*, struct class_List_Int__df8a64abf3*);
+int64_t meth_List_List_Int___d530ff6e70_find_only(struct class_List_List_Int___d530ff6e70*, struct class_List_Int__df8a64abf3*);
+struct class_List_Int__df8a64abf3* meth_List_List_Int___d530ff6e70_first(struct class_List_List_Int___d530ff6e70*);
+struct class_List_Int__df8a64abf3* meth_List_List_Int___d530ff6e70_get(struct class_List_List_Int___d530ff6e70*, int64_t);
+void meth_List_List_Int___d530ff6e70_insert(struct class_List_List_Int___d530ff6e70*, int64_t, struct class_List_Int__df8a64abf3*);
+struct class_List_Int__df8a64abf3* meth_List_List_Int___d530ff6e70_last(struct class_List_List_Int___d530ff6e70*);
+int64_t meth_List_List_Int___d530ff6e70_length(struct class_List_List_Int___d530ff6e70*);
+struct class_List_Int__df8a64abf3* meth_List_List_Int___d530ff6e70_pop(struct class_List_List_Int___d530ff6e70*);
+void meth_List_List_Int___d530ff6e70_push(struct class_List_List_Int___d530ff6e70*, struct class_List_Int__df8a64abf3*);
+void meth_List_List_Int___d530ff6e70_push_all(struct class_List_List_Int___d530ff6e70*, struct class_List_List_Int___d530ff6e70*);
+void meth_List_List_Int___d530ff6e70_delete_first(struct class_List_List_Int___d530ff6e70*, struct class_List_Int__df8a64abf3*);
+void meth_List_List_Int___d530ff6e70_delete_last(struct class_List_List_Int___d530ff6e70*, struct class_List_Int__df8a64abf3*);
+void meth_List_List_Int___d530ff6e70_delete_only(struct class_List_List_Int___d530ff6e70*, struct class_List_Int__df8a64abf3*);
+struct class_List_List_Int___d530ff6e70* meth_List_List_Int___d530ff6e70_reversed(struct class_List_List_Int___d530ff6e70*);
+struct class_List_List_Int___d530ff6e70* meth_List_List_Int___d530ff6e70_slice(struct class_List_List_Int___d530ff6e70*, int64_t, int64_t);
+bool meth_List_List_Int___d530ff6e70_starts_with(struct class_List_List_Int___d530ff6e70*, struct class_List_List_Int___d530ff6e70*);
+struct class_Str meth_List_List_Int___d530ff6e70_to_string(struct class_List_List_Int___d530ff6e70*);
+struct class_Str meth_List_List_Int___d530ff6e70_join(struct class_List_List_Int___d530ff6e70*, struct class_Str);
+bool meth_List_List_Int___d530ff6e70_equals(struct class_List_List_Int___d530ff6e70*, struct class_List_List_Int___d530ff6e70*);
+
+#define CONSTRUCTOR ctor_List_List_Int___d530ff6e70
+
+#define DESTRUCTOR dtor_List_List_Int___d530ff6e70
+
+#define TYPE struct class_List_List_Int___d530ff6e70 *
+
+#define TYPE_STRUCT class_List_List_Int___d530ff6e70
+
+#define METHOD(name) meth_List_List_Int___d530ff6e70_##name
+
+#define ITEMTYPE struct class_List_Int__df8a64abf3*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_List_Int__df8a64abf3_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_List_Int__df8a64abf3)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,42 @@
+#include <lib/oomph.h>
+#include "autotype_nested_list_132a99fff6.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Int__df8a64abf3.h"
+#include "List_List_Int___d530ff6e70.h"
+void oomph_main(void){struct class_List_Int__df8a64abf3* var1;
+var1 = NULL;
+struct class_List_List_Int___d530ff6e70* var2;
+var2 = NULL;
+int64_t var3;
+struct class_List_Int__df8a64abf3* var4;
+var4 = NULL;
+struct class_List_List_Int___d530ff6e70* var5;
+var5 = NULL;
+bool var6;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+var1 = ctor_List_Int__df8a64abf3();
+var2 = ctor_List_List_Int___d530ff6e70();
+meth_List_List_Int___d530ff6e70_push(var2,var1);
+var3 = 1LL;
+var4 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var4,var3);
+var5 = ctor_List_List_Int___d530ff6e70();
+meth_List_List_Int___d530ff6e70_push(var5,var4);
+var6 = meth_List_List_Int___d530ff6e70_equals(var2,var5);
+var7 = meth_Bool_to_string(var6);
+oomph_print(var7);
+var8 = meth_List_List_Int___d530ff6e70_to_string(var2);
+oomph_print(var8);
+out: (void)0;
+string_decref(var8);
+string_decref(var7);
+(void)0;
+decref((var5), dtor_List_List_Int___d530ff6e70);
+decref((var4), dtor_List_Int__df8a64abf3);
+(void)0;
+decref((var2), dtor_List_List_Int___d530ff6e70);
+decref((var1), dtor_List_Int__df8a64abf3);
+}
@@ -0,0 +1,13 @@
+
+                #ifndef HEADER_GUARD_autotype_nested_list_132a99fff6
+                #define HEADER_GUARD_autotype_nested_list_132a99fff6
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Int__df8a64abf3;
+struct class_List_List_Int___d530ff6e70;
+struct class_List_Int__df8a64abf3;
+struct class_List_List_Int___d530ff6e70;
+void oomph_main(void);
+
+                #endif
+                
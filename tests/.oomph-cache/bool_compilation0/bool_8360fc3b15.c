@@ -0,0 +1,181 @@
+#include <lib/oomph.h>
+#include "bool_8360fc3b15.h"
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void){bool var1;
+struct class_Str var2;
+var2.buf = NULL;
+bool var3;
+struct class_Str var4;
+var4.buf = NULL;
+bool var6;
+bool var7;
+struct class_Str var9;
+var9.buf = NULL;
+bool var11;
+bool var12;
+struct class_Str var14;
+var14.buf = NULL;
+bool var15;
+struct class_Str var17;
+var17.buf = NULL;
+bool var18;
+struct class_Str var20;
+var20.buf = NULL;
+bool var22;
+struct class_Str var24;
+var24.buf = NULL;
+bool var26;
+struct class_Str var28;
+var28.buf = NULL;
+bool var29;
+bool var30;
+struct class_Str var32;
+var32.buf = NULL;
+bool var33;
+bool var34;
+struct class_Str var36;
+var36.buf = NULL;
+bool var37;
+struct class_Str var38;
+var38.buf = NULL;
+bool var39;
+struct class_Str var40;
+var40.buf = NULL;
+bool var41;
+struct class_Str var43;
+var43.buf = NULL;
+bool var44;
+struct class_Str var46;
+var46.buf = NULL;
+bool var48;
+bool var49;
+struct class_Str var51;
+var51.buf = NULL;
+bool var53;
+bool var54;
+struct class_Str var56;
+var56.buf = NULL;
+var1 = oomph_true;
+var2 = meth_Bool_to_string(var1);
+oomph_print(var2);
+var3 = oomph_false;
+var4 = meth_Bool_to_string(var3);
+oomph_print(var4);
+if (oomph_true) goto label5;
+label5: (void)0;
+var6 = oomph_true;
+var7 = var6;
+label8: (void)0;
+var9 = meth_Bool_to_string(var7);
+oomph_print(var9);
+if (oomph_true) goto label10;
+label10: (void)0;
+var11 = oomph_false;
+var12 = var11;
+label13: (void)0;
+var14 = meth_Bool_to_string(var12);
+oomph_print(var14);
+var15 = oomph_false;
+if (oomph_true) goto label16;
+label16: (void)0;
+var17 = meth_Bool_to_string(var15);
+oomph_print(var17);
+var18 = oomph_false;
+if (oomph_true) goto label19;
+label19: (void)0;
+var20 = meth_Bool_to_string(var18);
+oomph_print(var20);
+if (oomph_true) goto label21;
+label21: (void)0;
+var22 = oomph_true;
+label23: (void)0;
+var24 = meth_Bool_to_string(var22);
+oomph_print(var24);
+if (oomph_true) goto label25;
+label25: (void)0;
+var26 = oomph_true;
+label27: (void)0;
+var28 = meth_Bool_to_string(var26);
+oomph_print(var28);
+var29 = oomph_true;
+var30 = var29;
+if (oomph_true) goto label31;
+label31: (void)0;
+var32 = meth_Bool_to_string(var30);
+oomph_print(var32);
+var33 = oomph_false;
+var34 = var33;
+if (oomph_true) goto label35;
+label35: (void)0;
+var36 = meth_Bool_to_string(var34);
+oomph_print(var36);
+var37 = oomph_false;
+var38 = meth_Bool_to_string(var37);
+oomph_print(var38);
+var39 = oomph_true;
+var40 = meth_Bool_to_string(var39);
+oomph_print(var40);
+var41 = oomph_false;
+if (oomph_true) goto label42;
+label42: (void)0;
+var43 = meth_Bool_to_string(var41);
+oomph_print(var43);
+var44 = oomph_false;
+if (oomph_true) goto label45;
+label45: (void)0;
+var46 = meth_Bool_to_string(var44);
+oomph_print(var46);
+if (oomph_true) goto label47;
+label47: (void)0;
+var48 = oomph_false;
+var49 = var48;
+label50: (void)0;
+var51 = meth_Bool_to_string(var49);
+oomph_print(var51);
+if (oomph_true) goto label52;
+label52: (void)0;
+var53 = oomph_true;
+var54 = var53;
+label55: (void)0;
+var56 = meth_Bool_to_string(var54);
+oomph_print(var56);
+out: (void)0;
+string_decref(var56);
+(void)0;
+(void)0;
+string_decref(var51);
+(void)0;
+(void)0;
+string_decref(var46);
+(void)0;
+string_decref(var43);
+(void)0;
+string_decref(var40);
+(void)0;
+string_decref(var38);
+(void)0;
+string_decref(var36);
+(void)0;
+(void)0;
+string_decref(var32);
+(void)0;
+(void)0;
+string_decref(var28);
+(void)0;
+string_decref(var24);
+(void)0;
+string_decref(var20);
+(void)0;
+string_decref(var17);
+(void)0;
+string_decref(var14);
+(void)0;
+(void)0;
+string_decref(var9);
+(void)0;
+(void)0;
+string_decref(var4);
+(void)0;
+string_decref(var2);
+(void)0;
+}
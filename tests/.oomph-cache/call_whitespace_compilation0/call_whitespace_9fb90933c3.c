@@ -0,0 +1,21 @@
+#include <lib/oomph.h>
+#include "call_whitespace_9fb90933c3.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_hello_world_c7271c519c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f', '\x20', '\x77', '\x6f', '\x72', '\x6c', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string0_hello_world_c7271c519c = {
+                .buf = &string0_hello_world_c7271c519c_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+var1 = string0_hello_world_c7271c519c; string_incref(var1);
+oomph_print(var1);
+out: (void)0;
+string_decref(var1);
+}
@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_call_whitespace_9fb90933c3
+                #define HEADER_GUARD_call_whitespace_9fb90933c3
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,63 @@
+#include <lib/oomph.h>
+#include "Point_7f23fdd7e0.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Point_0c8a89161e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x6f', '\x69', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Point_0c8a89161e = {
+                .buf = &string0_Point_0c8a89161e_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            struct class_Point_7f23fdd7e0* ctor_Point_7f23fdd7e0(int64_t arg_x,int64_t arg_y)
+            {
+                struct class_Point_7f23fdd7e0* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+                (void)0;
+(void)0;
+
+                return obj;
+            }
+
+            void dtor_Point_7f23fdd7e0(void *ptr)
+            {
+                struct class_Point_7f23fdd7e0 *obj = ptr;
+                (void)0;
+(void)0;
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Point_7f23fdd7e0_to_string(struct class_Point_7f23fdd7e0* self)
+                {
+                    struct class_Str res = string0_Point_0c8a89161e;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_x);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Int_to_string(self->memb_y);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Point_7f23fdd7e0_equals(struct class_Point_7f23fdd7e0* var1, struct class_Point_7f23fdd7e0* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
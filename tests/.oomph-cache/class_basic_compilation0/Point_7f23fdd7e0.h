@@ -0,0 +1,21 @@
+
+                #ifndef HEADER_GUARD_Point_7f23fdd7e0
+                #define HEADER_GUARD_Point_7f23fdd7e0
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Point_7f23fdd7e0 {
+                REFCOUNT_HEADER
+                int64_t memb_x;
+int64_t memb_y;
+
+            };
+            
+            struct class_Point_7f23fdd7e0* ctor_Point_7f23fdd7e0(int64_t arg_x,int64_t arg_y);
+            void dtor_Point_7f23fdd7e0(void *ptr);
+            
+                struct class_Str meth_Point_7f23fdd7e0_to_string(struct class_Point_7f23fdd7e0* obj);
+                bool meth_Point_7f23fdd7e0_equals(struct class_Point_7f23fdd7e0* var1, struct class_Point_7f23fdd7e0* var2);
+
+                #endif
+                
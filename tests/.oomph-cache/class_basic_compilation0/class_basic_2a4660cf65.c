@@ -0,0 +1,55 @@
+#include <lib/oomph.h>
+#include "class_basic_2a4660cf65.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Point_7f23fdd7e0.h"
+void class_basic_2a4660cf65_print_point(struct class_Point_7f23fdd7e0* var1){int64_t var2;
+struct class_Str var3;
+var3.buf = NULL;
+int64_t var4;
+struct class_Str var5;
+var5.buf = NULL;
+var2 = var1->memb_x;
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+var4 = var1->memb_y;
+var5 = meth_Int_to_string(var4);
+oomph_print(var5);
+out: (void)0;
+string_decref(var5);
+(void)0;
+string_decref(var3);
+(void)0;
+}void oomph_main(void){int64_t var1;
+int64_t var2;
+struct class_Point_7f23fdd7e0* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var5;
+struct class_Point_7f23fdd7e0* var6;
+var6 = NULL;
+int64_t var7;
+int64_t var8;
+struct class_Point_7f23fdd7e0* var9;
+var9 = NULL;
+var1 = 1LL;
+var2 = 2LL;
+var3 = ctor_Point_7f23fdd7e0(var1,var2);
+var4 = 123LL;
+var5 = 456LL;
+var6 = ctor_Point_7f23fdd7e0(var4,var5);
+class_basic_2a4660cf65_print_point(var6);
+var7 = 111LL;
+var8 = 222LL;
+var9 = ctor_Point_7f23fdd7e0(var7,var8);
+class_basic_2a4660cf65_print_point(var9);
+out: (void)0;
+decref((var9), dtor_Point_7f23fdd7e0);
+(void)0;
+(void)0;
+decref((var6), dtor_Point_7f23fdd7e0);
+(void)0;
+(void)0;
+decref((var3), dtor_Point_7f23fdd7e0);
+(void)0;
+(void)0;
+}
@@ -0,0 +1,14 @@
+
+                #ifndef HEADER_GUARD_class_basic_2a4660cf65
+                #define HEADER_GUARD_class_basic_2a4660cf65
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Point_7f23fdd7e0;
+struct class_Point_7f23fdd7e0;
+struct class_Point_7f23fdd7e0;
+struct class_Point_7f23fdd7e0;
+void class_basic_2a4660cf65_print_point(struct class_Point_7f23fdd7e0* var1);
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,21 @@
+#include <lib/oomph.h>
+#include "comments_ffc12a7200.h"
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void){int64_t var1;
+struct class_Str var2;
+var2.buf = NULL;
+int64_t var3;
+struct class_Str var4;
+var4.buf = NULL;
+var1 = 1LL;
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+var3 = 2LL;
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+out: (void)0;
+string_decref(var4);
+(void)0;
+string_decref(var2);
+(void)0;
+}
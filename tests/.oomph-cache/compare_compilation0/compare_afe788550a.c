@@ -0,0 +1,117 @@
+#include <lib/oomph.h>
+#include "compare_afe788550a.h"
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void){bool var1;
+struct class_Str var2;
+var2.buf = NULL;
+bool var3;
+struct class_Str var4;
+var4.buf = NULL;
+bool var5;
+struct class_Str var6;
+var6.buf = NULL;
+bool var7;
+struct class_Str var8;
+var8.buf = NULL;
+bool var9;
+struct class_Str var10;
+var10.buf = NULL;
+bool var11;
+struct class_Str var12;
+var12.buf = NULL;
+bool var13;
+struct class_Str var14;
+var14.buf = NULL;
+bool var15;
+struct class_Str var16;
+var16.buf = NULL;
+bool var17;
+struct class_Str var18;
+var18.buf = NULL;
+bool var19;
+struct class_Str var20;
+var20.buf = NULL;
+bool var21;
+struct class_Str var22;
+var22.buf = NULL;
+bool var23;
+struct class_Str var24;
+var24.buf = NULL;
+bool var25;
+struct class_Str var26;
+var26.buf = NULL;
+bool var27;
+struct class_Str var28;
+var28.buf = NULL;
+var1 = oomph_true;
+var2 = meth_Bool_to_string(var1);
+oomph_print(var2);
+var3 = oomph_false;
+var4 = meth_Bool_to_string(var3);
+oomph_print(var4);
+var5 = oomph_true;
+var6 = meth_Bool_to_string(var5);
+oomph_print(var6);
+var7 = oomph_false;
+var8 = meth_Bool_to_string(var7);
+oomph_print(var8);
+var9 = oomph_true;
+var10 = meth_Bool_to_string(var9);
+oomph_print(var10);
+var11 = oomph_false;
+var12 = meth_Bool_to_string(var11);
+oomph_print(var12);
+var13 = oomph_true;
+var14 = meth_Bool_to_string(var13);
+oomph_print(var14);
+var15 = oomph_false;
+var16 = meth_Bool_to_string(var15);
+oomph_print(var16);
+var17 = oomph_true;
+var18 = meth_Bool_to_string(var17);
+oomph_print(var18);
+var19 = oomph_false;
+var20 = meth_Bool_to_string(var19);
+oomph_print(var20);
+var21 = oomph_false;
+var22 = meth_Bool_to_string(var21);
+oomph_print(var22);
+var23 = oomph_false;
+var24 = meth_Bool_to_string(var23);
+oomph_print(var24);
+var25 = oomph_true;
+var26 = meth_Bool_to_string(var25);
+oomph_print(var26);
+var27 = oomph_true;
+var28 = meth_Bool_to_string(var27);
+oomph_print(var28);
+out: (void)0;
+string_decref(var28);
+(void)0;
+string_decref(var26);
+(void)0;
+string_decref(var24);
+(void)0;
+string_decref(var22);
+(void)0;
+string_decref(var20);
+(void)0;
+string_decref(var18);
+(void)0;
+string_decref(var16);
+(void)0;
+string_decref(var14);
+(void)0;
+string_decref(var12);
+(void)0;
+string_decref(var10);
+(void)0;
+string_decref(var8);
+(void)0;
+string_decref(var6);
+(void)0;
+string_decref(var4);
+(void)0;
+string_decref(var2);
+(void)0;
+}
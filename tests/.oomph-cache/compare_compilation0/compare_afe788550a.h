@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_compare_afe788550a
+                #define HEADER_GUARD_compare_afe788550a
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
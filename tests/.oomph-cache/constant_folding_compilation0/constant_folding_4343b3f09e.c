@@ -0,0 +1,173 @@
+#include <lib/oomph.h>
+#include "constant_folding_4343b3f09e.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_returned_26c5e69a83_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x65', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string0_returned_26c5e69a83 = {
+                .buf = &string0_returned_26c5e69a83_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_elif_f3fabe30ad_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x6c', '\x69', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string1_elif_f3fabe30ad = {
+                .buf = &string1_elif_f3fabe30ad_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            struct class_Str constant_folding_4343b3f09e_after_return(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str retval;
+var1 = string0_returned_26c5e69a83; string_incref(var1);
+retval = var1; var1.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var1);
+return retval;
+}void oomph_main(void){int64_t var1;
+struct class_Str var2;
+var2.buf = NULL;
+int64_t var3;
+struct class_Str var4;
+var4.buf = NULL;
+int64_t var5;
+struct class_Str var6;
+var6.buf = NULL;
+int64_t var7;
+struct class_Str var8;
+var8.buf = NULL;
+double var9;
+struct class_Str var10;
+var10.buf = NULL;
+double var11;
+struct class_Str var12;
+var12.buf = NULL;
+bool var13;
+struct class_Str var14;
+var14.buf = NULL;
+bool var15;
+bool var16;
+struct class_Str var18;
+var18.buf = NULL;
+bool var19;
+struct class_Str var20;
+var20.buf = NULL;
+bool var21;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+int64_t var27;
+int64_t var28;
+int64_t var30;
+int64_t var31;
+int64_t var32;
+bool var33;
+struct class_Str var37;
+var37.buf = NULL;
+struct class_Str var38;
+var38.buf = NULL;
+struct class_Str var39;
+var39.buf = NULL;
+var1 = 3LL;
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+var3 = 3LL;
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+var5 = 9223372036854775807LL;
+var6 = meth_Int_to_string(var5);
+oomph_print(var6);
+var7 = -9223372036854775807LL;
+var8 = meth_Int_to_string(var7);
+oomph_print(var8);
+var9 = 0.25;
+var10 = meth_Float_to_string(var9);
+oomph_print(var10);
+var11 = 0.30000000000000004;
+var12 = meth_Float_to_string(var11);
+oomph_print(var12);
+var13 = oomph_true;
+var14 = meth_Bool_to_string(var13);
+oomph_print(var14);
+var15 = oomph_true;
+var16 = var15;
+if (oomph_true) goto label17;
+label17: (void)0;
+var18 = meth_Bool_to_string(var16);
+oomph_print(var18);
+var19 = oomph_true;
+var20 = meth_Bool_to_string(var19);
+oomph_print(var20);
+var21 = oomph_false;
+var22 = meth_Bool_to_string(var21);
+oomph_print(var22);
+if (oomph_true) goto label23;
+label23: (void)0;
+var24 = string1_elif_f3fabe30ad; string_incref(var24);
+oomph_print(var24);
+label25: (void)0;
+if (oomph_true) goto label26;
+label26: (void)0;
+var27 = 10LL;
+var28 = var27;
+label29: (void)0;
+var30 = 3LL;
+var31 = oomph_int_sub(var28,var30);
+var28 = var31;
+var32 = 0LL;
+var33 = oomph_int_gt(var32,var28);
+if (var33) goto label34;
+if (oomph_true) goto label35;
+label34: (void)0;
+if (oomph_true) goto label36;
+label35: (void)0;
+if (oomph_true) goto label29;
+label36: (void)0;
+var37 = meth_Int_to_string(var28);
+oomph_print(var37);
+var38 = meth_Int_to_string(var27);
+oomph_print(var38);
+var39 = constant_folding_4343b3f09e_after_return();
+oomph_print(var39);
+out: (void)0;
+string_decref(var39);
+string_decref(var38);
+string_decref(var37);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var24);
+string_decref(var22);
+(void)0;
+string_decref(var20);
+(void)0;
+string_decref(var18);
+(void)0;
+(void)0;
+string_decref(var14);
+(void)0;
+string_decref(var12);
+(void)0;
+string_decref(var10);
+(void)0;
+string_decref(var8);
+(void)0;
+string_decref(var6);
+(void)0;
+string_decref(var4);
+(void)0;
+string_decref(var2);
+(void)0;
+}
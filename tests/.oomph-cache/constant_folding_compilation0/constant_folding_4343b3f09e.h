@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_constant_folding_4343b3f09e
+                #define HEADER_GUARD_constant_folding_4343b3f09e
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Str constant_folding_4343b3f09e_after_return(void);
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,147 @@
+#include <lib/oomph.h>
+#include "count_and_splitlen_7bb96f4339.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_abcb_83b13236a4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62', '\x63', '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string0_abcb_83b13236a4 = {
+                .buf = &string0_abcb_83b13236a4_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_b_b5129aada1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string1_b_b5129aada1 = {
+                .buf = &string1_b_b5129aada1_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2__dea33cdd82_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string2__dea33cdd82 = {
+                .buf = &string2__dea33cdd82_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+int64_t var3;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_List_Str__43b70c06cb* var7;
+var7 = NULL;
+int64_t var8;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+int64_t var12;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_List_Str__43b70c06cb* var16;
+var16 = NULL;
+int64_t var17;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+int64_t var21;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_List_Str__43b70c06cb* var25;
+var25 = NULL;
+int64_t var26;
+struct class_Str var27;
+var27.buf = NULL;
+var1 = string0_abcb_83b13236a4; string_incref(var1);
+var2 = string1_b_b5129aada1; string_incref(var2);
+var3 = meth_Str_count(var1,var2);
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+var5 = string0_abcb_83b13236a4; string_incref(var5);
+var6 = string1_b_b5129aada1; string_incref(var6);
+var7 = meth_Str_split(var5,var6);
+var8 = meth_List_Str__43b70c06cb_length(var7);
+var9 = meth_Int_to_string(var8);
+oomph_print(var9);
+var10 = string0_abcb_83b13236a4; string_incref(var10);
+var11 = string2__dea33cdd82; string_incref(var11);
+var12 = meth_Str_count(var10,var11);
+var13 = meth_Int_to_string(var12);
+oomph_print(var13);
+var14 = string0_abcb_83b13236a4; string_incref(var14);
+var15 = string2__dea33cdd82; string_incref(var15);
+var16 = meth_Str_split(var14,var15);
+var17 = meth_List_Str__43b70c06cb_length(var16);
+var18 = meth_Int_to_string(var17);
+oomph_print(var18);
+var19 = string2__dea33cdd82; string_incref(var19);
+var20 = string1_b_b5129aada1; string_incref(var20);
+var21 = meth_Str_count(var19,var20);
+var22 = meth_Int_to_string(var21);
+oomph_print(var22);
+var23 = string2__dea33cdd82; string_incref(var23);
+var24 = string1_b_b5129aada1; string_incref(var24);
+var25 = meth_Str_split(var23,var24);
+var26 = meth_List_Str__43b70c06cb_length(var25);
+var27 = meth_Int_to_string(var26);
+oomph_print(var27);
+out: (void)0;
+string_decref(var27);
+(void)0;
+decref((var25), dtor_List_Str__43b70c06cb);
+string_decref(var24);
+string_decref(var23);
+string_decref(var22);
+(void)0;
+string_decref(var20);
+string_decref(var19);
+string_decref(var18);
+(void)0;
+decref((var16), dtor_List_Str__43b70c06cb);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+(void)0;
+string_decref(var11);
+string_decref(var10);
+string_decref(var9);
+(void)0;
+decref((var7), dtor_List_Str__43b70c06cb);
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+(void)0;
+string_decref(var2);
+string_decref(var1);
+}
@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_count_and_splitlen_7bb96f4339
+                #define HEADER_GUARD_count_and_splitlen_7bb96f4339
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+void oomph_main(void);
+
+                #endif
+                
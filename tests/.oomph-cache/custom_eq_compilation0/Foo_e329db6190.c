@@ -0,0 +1,49 @@
+#include <lib/oomph.h>
+#include "Foo_e329db6190.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo_e5a6e5b757_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_e5a6e5b757 = {
+                .buf = &string0_Foo_e5a6e5b757_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Foo_e329db6190* ctor_Foo_e329db6190(void)
+            {
+                struct class_Foo_e329db6190* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_Foo_e329db6190(void *ptr)
+            {
+                struct class_Foo_e329db6190 *obj = ptr;
+                
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo_e329db6190_to_string(struct class_Foo_e329db6190* self)
+                {
+                    struct class_Str res = string0_Foo_e5a6e5b757;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_e329db6190_equals(struct class_Foo_e329db6190* var1, struct class_Foo_e329db6190* var2){bool var3;
+bool retval;
+var3 = oomph_true;
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
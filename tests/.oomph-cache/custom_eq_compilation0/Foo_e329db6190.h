@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Foo_e329db6190
+                #define HEADER_GUARD_Foo_e329db6190
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_e329db6190 {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Foo_e329db6190* ctor_Foo_e329db6190(void);
+            void dtor_Foo_e329db6190(void *ptr);
+            
+                struct class_Str meth_Foo_e329db6190_to_string(struct class_Foo_e329db6190* obj);
+                bool meth_Foo_e329db6190_equals(struct class_Foo_e329db6190* var1, struct class_Foo_e329db6190* var2);
+
+                #endif
+                
@@ -0,0 +1,22 @@
+#include <lib/oomph.h>
+#include "custom_eq_7fd92a601a.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_e329db6190.h"
+void oomph_main(void){struct class_Foo_e329db6190* var1;
+var1 = NULL;
+struct class_Foo_e329db6190* var2;
+var2 = NULL;
+bool var3;
+struct class_Str var4;
+var4.buf = NULL;
+var1 = ctor_Foo_e329db6190();
+var2 = ctor_Foo_e329db6190();
+var3 = meth_Foo_e329db6190_equals(var1,var2);
+var4 = meth_Bool_to_string(var3);
+oomph_print(var4);
+out: (void)0;
+string_decref(var4);
+(void)0;
+decref((var2), dtor_Foo_e329db6190);
+decref((var1), dtor_Foo_e329db6190);
+}
@@ -0,0 +1,11 @@
+
+                #ifndef HEADER_GUARD_custom_eq_7fd92a601a
+                #define HEADER_GUARD_custom_eq_7fd92a601a
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Foo_e329db6190;
+struct class_Foo_e329db6190;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,48 @@
+#include <lib/oomph.h>
+#include "Foo_27e13026dc.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_lol_2e258dead3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_lol_2e258dead3 = {
+                .buf = &string0_lol_2e258dead3_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Foo_27e13026dc* ctor_Foo_27e13026dc(void)
+            {
+                struct class_Foo_27e13026dc* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_Foo_27e13026dc(void *ptr)
+            {
+                struct class_Foo_27e13026dc *obj = ptr;
+                
+                free(obj);
+            }
+            bool meth_Foo_27e13026dc_equals(struct class_Foo_27e13026dc* var1, struct class_Foo_27e13026dc* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}struct class_Str meth_Foo_27e13026dc_to_string(struct class_Foo_27e13026dc* var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str retval;
+var2 = string0_lol_2e258dead3; string_incref(var2);
+retval = var2; var2.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var2);
+return retval;
+}
@@ -0,0 +1,18 @@
+
+                #ifndef HEADER_GUARD_Foo_27e13026dc
+                #define HEADER_GUARD_Foo_27e13026dc
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_27e13026dc {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Foo_27e13026dc* ctor_Foo_27e13026dc(void);
+            void dtor_Foo_27e13026dc(void *ptr);
+            bool meth_Foo_27e13026dc_equals(struct class_Foo_27e13026dc* var1, struct class_Foo_27e13026dc* var2);
+struct class_Str meth_Foo_27e13026dc_to_string(struct class_Foo_27e13026dc* var1);
+
+                #endif
+                
@@ -0,0 +1,15 @@
+#include <lib/oomph.h>
+#include "custom_tostring_280da503e5.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_27e13026dc.h"
+void oomph_main(void){struct class_Foo_27e13026dc* var1;
+var1 = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+var1 = ctor_Foo_27e13026dc();
+var2 = meth_Foo_27e13026dc_to_string(var1);
+oomph_print(var2);
+out: (void)0;
+string_decref(var2);
+decref((var1), dtor_Foo_27e13026dc);
+}
@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_custom_tostring_280da503e5
+                #define HEADER_GUARD_custom_tostring_280da503e5
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Foo_27e13026dc;
+void oomph_main(void);
+
+                #endif
+                
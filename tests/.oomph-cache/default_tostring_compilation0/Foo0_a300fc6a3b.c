@@ -0,0 +1,49 @@
+#include <lib/oomph.h>
+#include "Foo0_a300fc6a3b.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo0_ebda857809_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x30' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo0_ebda857809 = {
+                .buf = &string0_Foo0_ebda857809_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            struct class_Foo0_a300fc6a3b* ctor_Foo0_a300fc6a3b(void)
+            {
+                struct class_Foo0_a300fc6a3b* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_Foo0_a300fc6a3b(void *ptr)
+            {
+                struct class_Foo0_a300fc6a3b *obj = ptr;
+                
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo0_a300fc6a3b_to_string(struct class_Foo0_a300fc6a3b* self)
+                {
+                    struct class_Str res = string0_Foo0_ebda857809;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo0_a300fc6a3b_equals(struct class_Foo0_a300fc6a3b* var1, struct class_Foo0_a300fc6a3b* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
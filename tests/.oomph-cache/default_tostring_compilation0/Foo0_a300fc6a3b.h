@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Foo0_a300fc6a3b
+                #define HEADER_GUARD_Foo0_a300fc6a3b
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo0_a300fc6a3b {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Foo0_a300fc6a3b* ctor_Foo0_a300fc6a3b(void);
+            void dtor_Foo0_a300fc6a3b(void *ptr);
+            
+                struct class_Str meth_Foo0_a300fc6a3b_to_string(struct class_Foo0_a300fc6a3b* obj);
+                bool meth_Foo0_a300fc6a3b_equals(struct class_Foo0_a300fc6a3b* var1, struct class_Foo0_a300fc6a3b* var2);
+
+                #endif
+                
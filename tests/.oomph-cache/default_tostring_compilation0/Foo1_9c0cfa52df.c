@@ -0,0 +1,56 @@
+#include <lib/oomph.h>
+#include "Foo1_9c0cfa52df.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo1_dba9cf14e0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x31' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo1_dba9cf14e0 = {
+                .buf = &string0_Foo1_dba9cf14e0_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            struct class_Foo1_9c0cfa52df* ctor_Foo1_9c0cfa52df(int64_t arg_x)
+            {
+                struct class_Foo1_9c0cfa52df* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_x = arg_x;
+
+                (void)0;
+
+                return obj;
+            }
+
+            void dtor_Foo1_9c0cfa52df(void *ptr)
+            {
+                struct class_Foo1_9c0cfa52df *obj = ptr;
+                (void)0;
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo1_9c0cfa52df_to_string(struct class_Foo1_9c0cfa52df* self)
+                {
+                    struct class_Str res = string0_Foo1_dba9cf14e0;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_x);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo1_9c0cfa52df_equals(struct class_Foo1_9c0cfa52df* var1, struct class_Foo1_9c0cfa52df* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
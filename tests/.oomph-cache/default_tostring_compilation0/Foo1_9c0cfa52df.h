@@ -0,0 +1,20 @@
+
+                #ifndef HEADER_GUARD_Foo1_9c0cfa52df
+                #define HEADER_GUARD_Foo1_9c0cfa52df
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo1_9c0cfa52df {
+                REFCOUNT_HEADER
+                int64_t memb_x;
+
+            };
+            
+            struct class_Foo1_9c0cfa52df* ctor_Foo1_9c0cfa52df(int64_t arg_x);
+            void dtor_Foo1_9c0cfa52df(void *ptr);
+            
+                struct class_Str meth_Foo1_9c0cfa52df_to_string(struct class_Foo1_9c0cfa52df* obj);
+                bool meth_Foo1_9c0cfa52df_equals(struct class_Foo1_9c0cfa52df* var1, struct class_Foo1_9c0cfa52df* var2);
+
+                #endif
+                
@@ -0,0 +1,63 @@
+#include <lib/oomph.h>
+#include "Foo2_94dc6527bb.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo2_5dfad5b40a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x32' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo2_5dfad5b40a = {
+                .buf = &string0_Foo2_5dfad5b40a_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            struct class_Foo2_94dc6527bb* ctor_Foo2_94dc6527bb(int64_t arg_x,struct class_Str arg_y)
+            {
+                struct class_Foo2_94dc6527bb* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+                (void)0;
+string_incref(arg_y);
+
+                return obj;
+            }
+
+            void dtor_Foo2_94dc6527bb(void *ptr)
+            {
+                struct class_Foo2_94dc6527bb *obj = ptr;
+                (void)0;
+string_decref(obj->memb_y);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo2_94dc6527bb_to_string(struct class_Foo2_94dc6527bb* self)
+                {
+                    struct class_Str res = string0_Foo2_5dfad5b40a;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_x);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_y);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo2_94dc6527bb_equals(struct class_Foo2_94dc6527bb* var1, struct class_Foo2_94dc6527bb* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,21 @@
+
+                #ifndef HEADER_GUARD_Foo2_94dc6527bb
+                #define HEADER_GUARD_Foo2_94dc6527bb
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo2_94dc6527bb {
+                REFCOUNT_HEADER
+                int64_t memb_x;
+struct class_Str memb_y;
+
+            };
+            
+            struct class_Foo2_94dc6527bb* ctor_Foo2_94dc6527bb(int64_t arg_x,struct class_Str arg_y);
+            void dtor_Foo2_94dc6527bb(void *ptr);
+            
+                struct class_Str meth_Foo2_94dc6527bb_to_string(struct class_Foo2_94dc6527bb* obj);
+                bool meth_Foo2_94dc6527bb_equals(struct class_Foo2_94dc6527bb* var1, struct class_Foo2_94dc6527bb* var2);
+
+                #endif
+                
@@ -0,0 +1,70 @@
+#include <lib/oomph.h>
+#include "Foo3_9f18dd28e7.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo3_45f785a8da_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x33' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo3_45f785a8da = {
+                .buf = &string0_Foo3_45f785a8da_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            struct class_Foo3_9f18dd28e7* ctor_Foo3_9f18dd28e7(int64_t arg_x,struct class_Str arg_y,bool arg_z)
+            {
+                struct class_Foo3_9f18dd28e7* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+obj->memb_z = arg_z;
+
+                (void)0;
+string_incref(arg_y);
+(void)0;
+
+                return obj;
+            }
+
+            void dtor_Foo3_9f18dd28e7(void *ptr)
+            {
+                struct class_Foo3_9f18dd28e7 *obj = ptr;
+                (void)0;
+string_decref(obj->memb_y);
+(void)0;
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo3_9f18dd28e7_to_string(struct class_Foo3_9f18dd28e7* self)
+                {
+                    struct class_Str res = string0_Foo3_45f785a8da;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_x);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_y);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Bool_to_string(self->memb_z);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo3_9f18dd28e7_equals(struct class_Foo3_9f18dd28e7* var1, struct class_Foo3_9f18dd28e7* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_Foo3_9f18dd28e7
+                #define HEADER_GUARD_Foo3_9f18dd28e7
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo3_9f18dd28e7 {
+                REFCOUNT_HEADER
+                int64_t memb_x;
+struct class_Str memb_y;
+bool memb_z;
+
+            };
+            
+            struct class_Foo3_9f18dd28e7* ctor_Foo3_9f18dd28e7(int64_t arg_x,struct class_Str arg_y,bool arg_z);
+            void dtor_Foo3_9f18dd28e7(void *ptr);
+            
+                struct class_Str meth_Foo3_9f18dd28e7_to_string(struct class_Foo3_9f18dd28e7* obj);
+                bool meth_Foo3_9f18dd28e7_equals(struct class_Foo3_9f18dd28e7* var1, struct class_Foo3_9f18dd28e7* var2);
+
+                #endif
+                
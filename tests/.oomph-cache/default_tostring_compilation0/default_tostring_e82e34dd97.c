@@ -0,0 +1,87 @@
+#include <lib/oomph.h>
+#include "default_tostring_e82e34dd97.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo0_a300fc6a3b.h"
+#include "Foo1_9c0cfa52df.h"
+#include "Foo2_94dc6527bb.h"
+#include "Foo3_9f18dd28e7.h"
+
+            static struct StringBuf string0_lol_f83a254b9c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_lol_f83a254b9c = {
+                .buf = &string0_lol_f83a254b9c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_wat_511a942491_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77', '\x61', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string1_wat_511a942491 = {
+                .buf = &string1_wat_511a942491_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Foo0_a300fc6a3b* var1;
+var1 = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+int64_t var3;
+struct class_Foo1_9c0cfa52df* var4;
+var4 = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+int64_t var6;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Foo2_94dc6527bb* var8;
+var8 = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+int64_t var10;
+struct class_Str var11;
+var11.buf = NULL;
+bool var12;
+struct class_Foo3_9f18dd28e7* var13;
+var13 = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+var1 = ctor_Foo0_a300fc6a3b();
+var2 = meth_Foo0_a300fc6a3b_to_string(var1);
+oomph_print(var2);
+var3 = 1LL;
+var4 = ctor_Foo1_9c0cfa52df(var3);
+var5 = meth_Foo1_9c0cfa52df_to_string(var4);
+oomph_print(var5);
+var6 = 2LL;
+var7 = string0_lol_f83a254b9c; string_incref(var7);
+var8 = ctor_Foo2_94dc6527bb(var6,var7);
+var9 = meth_Foo2_94dc6527bb_to_string(var8);
+oomph_print(var9);
+var10 = 3LL;
+var11 = string1_wat_511a942491; string_incref(var11);
+var12 = oomph_true;
+var13 = ctor_Foo3_9f18dd28e7(var10,var11,var12);
+var14 = meth_Foo3_9f18dd28e7_to_string(var13);
+oomph_print(var14);
+out: (void)0;
+string_decref(var14);
+decref((var13), dtor_Foo3_9f18dd28e7);
+(void)0;
+string_decref(var11);
+(void)0;
+string_decref(var9);
+decref((var8), dtor_Foo2_94dc6527bb);
+string_decref(var7);
+(void)0;
+string_decref(var5);
+decref((var4), dtor_Foo1_9c0cfa52df);
+(void)0;
+string_decref(var2);
+decref((var1), dtor_Foo0_a300fc6a3b);
+}
@@ -0,0 +1,13 @@
+
+                #ifndef HEADER_GUARD_default_tostring_e82e34dd97
+                #define HEADER_GUARD_default_tostring_e82e34dd97
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Foo0_a300fc6a3b;
+struct class_Foo1_9c0cfa52df;
+struct class_Foo2_94dc6527bb;
+struct class_Foo3_9f18dd28e7;
+void oomph_main(void);
+
+                #endif
+                
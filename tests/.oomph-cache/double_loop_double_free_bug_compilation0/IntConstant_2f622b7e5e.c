@@ -0,0 +1,49 @@
+#include <lib/oomph.h>
+#include "IntConstant_2f622b7e5e.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_IntConstant_a1e8d83d06_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6e', '\x74', '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x61', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string0_IntConstant_a1e8d83d06 = {
+                .buf = &string0_IntConstant_a1e8d83d06_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            struct class_IntConstant_2f622b7e5e* ctor_IntConstant_2f622b7e5e(void)
+            {
+                struct class_IntConstant_2f622b7e5e* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_IntConstant_2f622b7e5e(void *ptr)
+            {
+                struct class_IntConstant_2f622b7e5e *obj = ptr;
+                
+                free(obj);
+            }
+            
+                struct class_Str meth_IntConstant_2f622b7e5e_to_string(struct class_IntConstant_2f622b7e5e* self)
+                {
+                    struct class_Str res = string0_IntConstant_a1e8d83d06;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_IntConstant_2f622b7e5e_equals(struct class_IntConstant_2f622b7e5e* var1, struct class_IntConstant_2f622b7e5e* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_IntConstant_2f622b7e5e
+                #define HEADER_GUARD_IntConstant_2f622b7e5e
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_IntConstant_2f622b7e5e {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_IntConstant_2f622b7e5e* ctor_IntConstant_2f622b7e5e(void);
+            void dtor_IntConstant_2f622b7e5e(void *ptr);
+            
+                struct class_Str meth_IntConstant_2f622b7e5e_to_string(struct class_IntConstant_2f622b7e5e* obj);
+                bool meth_IntConstant_2f622b7e5e_equals(struct class_IntConstant_2f622b7e5e* var1, struct class_IntConstant_2f622b7e5e* var2);
+
+                #endif
+                
@@ -0,0 +1,122 @@
+
+                #ifndef HEADER_GUARD_List_PrecedenceItem__0a39a2f546
+                #define HEADER_GUARD_List_PrecedenceItem__0a39a2f546
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "PrecedenceItem_c77278f57b.h"
+
+#define CONSTRUCTOR ctor_List_PrecedenceItem__0a39a2f546
+
+#define DESTRUCTOR dtor_List_PrecedenceItem__0a39a2f546
+
+#define TYPE struct class_List_PrecedenceItem__0a39a2f546 *
+
+#define TYPE_STRUCT class_List_PrecedenceItem__0a39a2f546
+
+#define METHOD(name) meth_List_PrecedenceItem__0a39a2f546_##name
+
+#define ITEMTYPE struct class_PrecedenceItem_c77278f57b
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_PrecedenceItem_c77278f57b_##name
+
+#define INCREF_ITEM(val) incref_PrecedenceItem_c77278f57b((val))
+
+#define DECREF_ITEM(val) decref_PrecedenceItem_c77278f57b((val))
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_PrecedenceItem__0a39a2f546___contains(struct class_List_PrecedenceItem__0a39a2f546*, struct class_PrecedenceItem_c77278f57b);
+void meth_List_PrecedenceItem__0a39a2f546___reserve(struct class_List_PrecedenceItem__0a39a2f546*, int64_t);
+struct class_PrecedenceItem_c77278f57b meth_List_PrecedenceItem__0a39a2f546_delete_at_index(struct class_List_PrecedenceItem__0a39a2f546*, int64_t);
+struct class_List_PrecedenceItem__0a39a2f546* meth_List_PrecedenceItem__0a39a2f546_delete_slice(struct class_List_PrecedenceItem__0a39a2f546*, int64_t, int64_t);
+bool meth_List_PrecedenceItem__0a39a2f546_ends_with(struct class_List_PrecedenceItem__0a39a2f546*, struct class_List_PrecedenceItem__0a39a2f546*);
+int64_t meth_List_PrecedenceItem__0a39a2f546_find_first(struct class_List_PrecedenceItem__0a39a2f546*, struct class_PrecedenceItem_c77278f57b);
+int64_t meth_List_PrecedenceItem__0a39a2f546_find_last(struct class_List_PrecedenceItem__0a39a2f546*, struct class_PrecedenceItem_c77278f57b);
+int64_t meth_List_PrecedenceItem__0a39a2f546_find_only(struct class_List_PrecedenceItem__0a39a2f546*, struct class_PrecedenceItem_c77278f57b);
+struct class_PrecedenceItem_c77278f57b meth_List_PrecedenceItem__0a39a2f546_first(struct class_List_PrecedenceItem__0a39a2f546*);
+struct class_PrecedenceItem_c77278f57b meth_List_PrecedenceItem__0a39a2f546_get(struct class_List_PrecedenceItem__0a39a2f546*, int64_t);
+void meth_List_PrecedenceItem__0a39a2f546_insert(struct class_List_PrecedenceItem__0a39a2f546*, int64_t, struct class_PrecedenceItem_c77278f57b);
+struct class_PrecedenceItem_c77278f57b meth_List_PrecedenceItem__0a39a2f546_last(struct class_List_PrecedenceItem__0a39a2f546*);
+int64_t meth_List_PrecedenceItem__0a39a2f546_length(struct class_List_PrecedenceItem__0a39a2f546*);
+struct class_PrecedenceItem_c77278f57b meth_List_PrecedenceItem__0a39a2f546_pop(struct class_List_PrecedenceItem__0a39a2f546*);
+void meth_List_PrecedenceItem__0a39a2f546_push(struct class_List_PrecedenceItem__0a39a2f546*, struct class_PrecedenceItem_c77278f57b);
+void meth_List_PrecedenceItem__0a39a2f546_push_all(struct class_List_PrecedenceItem__0a39a2f546*, struct class_List_PrecedenceItem__0a39a2f546*);
+void meth_List_PrecedenceItem__0a39a2f546_delete_first(struct class_List_PrecedenceItem__0a39a2f546*, struct class_PrecedenceItem_c77278f57b);
+void meth_List_PrecedenceItem__0a39a2f546_delete_last(struct class_List_PrecedenceItem__0a39a2f546*, struct class_PrecedenceItem_c77278f57b);
+void meth_List_PrecedenceItem__0a39a2f546_delete_only(struct class_List_PrecedenceItem__0a39a2f546*, struct class_PrecedenceItem_c77278f57b);
+struct class_List_PrecedenceItem__0a39a2f546* meth_List_PrecedenceItem__0a39a2f546_reversed(struct class_List_PrecedenceItem__0a39a2f546*);
+struct class_List_PrecedenceItem__0a39a2f546* meth_List_PrecedenceItem__0a39a2f546_slice(struct class_List_PrecedenceItem__0a39a2f546*, int64_t, int64_t);
+bool meth_List_PrecedenceItem__0a39a2f546_starts_with(struct class_List_PrecedenceItem__0a39a2f546*, struct class_List_PrecedenceItem__0a39a2f546*);
+struct class_Str meth_List_PrecedenceItem__0a39a2f546_to_string(struct class_List_PrecedenceItem__0a39a2f546*);
+struct class_Str meth_List_PrecedenceItem__0a39a2f546_join(struct class_List_PrecedenceItem__0a39a2f546*, struct class_Str);
+bool meth_List_PrecedenceItem__0a39a2f546_equals(struct class_List_PrecedenceItem__0a39a2f546*, struct class_List_PrecedenceItem__0a39a2f546*);
+
+#define CONSTRUCTOR ctor_List_PrecedenceItem__0a39a2f546
+
+#define DESTRUCTOR dtor_List_PrecedenceItem__0a39a2f546
+
+#define TYPE struct class_List_PrecedenceItem__0a39a2f546 *
+
+#define TYPE_STRUCT class_List_PrecedenceItem__0a39a2f546
+
+#define METHOD(name) meth_List_PrecedenceItem__0a39a2f546_##name
+
+#define ITEMTYPE struct class_PrecedenceItem_c77278f57b
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_PrecedenceItem_c77278f57b_##name
+
+#define INCREF_ITEM(val) incref_PrecedenceItem_c77278f57b((val))
+
+#define DECREF_ITEM(val) decref_PrecedenceItem_c77278f57b((val))
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
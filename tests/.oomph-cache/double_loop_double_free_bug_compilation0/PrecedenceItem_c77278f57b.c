@@ -0,0 +1,99 @@
+#include <lib/oomph.h>
+#include "PrecedenceItem_c77278f57b.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "IntConstant_2f622b7e5e.h"
+
+            static struct StringBuf string0_PrecedenceItem_540021811b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x72', '\x65', '\x63', '\x65', '\x64', '\x65', '\x6e', '\x63', '\x65', '\x49', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+            };
+            static struct class_Str string0_PrecedenceItem_540021811b = {
+                .buf = &string0_PrecedenceItem_540021811b_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_PrecedenceItem_c77278f57b_to_string(struct class_PrecedenceItem_c77278f57b obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_IntConstant_2f622b7e5e_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Str_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_PrecedenceItem_540021811b), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_PrecedenceItem_540021811b;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_PrecedenceItem_c77278f57b_equals(struct class_PrecedenceItem_c77278f57b a, struct class_PrecedenceItem_c77278f57b b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_IntConstant_2f622b7e5e_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Str_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_PrecedenceItem_540021811b), (int)a.membernum);
+                }
+            }
+            
+            void incref_PrecedenceItem_c77278f57b(struct class_PrecedenceItem_c77278f57b obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    string_incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_PrecedenceItem_c77278f57b(struct class_PrecedenceItem_c77278f57b obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_IntConstant_2f622b7e5e);
+                    break;
+                
+                case 1:
+                    string_decref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
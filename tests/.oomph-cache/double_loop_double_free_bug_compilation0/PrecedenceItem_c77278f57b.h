@@ -0,0 +1,24 @@
+
+                #ifndef HEADER_GUARD_PrecedenceItem_c77278f57b
+                #define HEADER_GUARD_PrecedenceItem_c77278f57b
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_IntConstant_2f622b7e5e;
+
+            struct class_PrecedenceItem_c77278f57b {
+                union {
+                    	struct class_IntConstant_2f622b7e5e* item0;
+	struct class_Str item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_PrecedenceItem_c77278f57b_to_string(struct class_PrecedenceItem_c77278f57b obj);
+            bool meth_PrecedenceItem_c77278f57b_equals(struct class_PrecedenceItem_c77278f57b a, struct class_PrecedenceItem_c77278f57b b);
+            
+            void incref_PrecedenceItem_c77278f57b(struct class_PrecedenceItem_c77278f57b obj);
+            void decref_PrecedenceItem_c77278f57b(struct class_PrecedenceItem_c77278f57b obj);
+            
+                #endif
+                
@@ -0,0 +1,114 @@
+#include <lib/oomph.h>
+#include "double_loop_double_free_bug_5ef7ea98fe.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "IntConstant_2f622b7e5e.h"
+#include "List_PrecedenceItem__0a39a2f546.h"
+#include "PrecedenceItem_c77278f57b.h"
+
+            static struct StringBuf string0___ce4d38ea54_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2b' },
+                .malloced = false,
+            };
+            static struct class_Str string0___ce4d38ea54 = {
+                .buf = &string0___ce4d38ea54_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_List_PrecedenceItem__0a39a2f546* var1;
+var1 = NULL;
+struct class_IntConstant_2f622b7e5e* var2;
+var2 = NULL;
+struct class_PrecedenceItem_c77278f57b var3;
+var3.membernum = -1;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_PrecedenceItem_c77278f57b var5;
+var5.membernum = -1;
+int64_t var6;
+int64_t var8;
+bool var9;
+bool var10;
+int64_t var12;
+struct class_PrecedenceItem_c77278f57b var14;
+var14.membernum = -1;
+struct class_Str var16;
+var16.buf = NULL;
+bool var17;
+struct class_IntConstant_2f622b7e5e* var19;
+var19 = NULL;
+int64_t var22;
+int64_t var23;
+var1 = ctor_List_PrecedenceItem__0a39a2f546();
+var2 = ctor_IntConstant_2f622b7e5e();
+var3 = (struct class_PrecedenceItem_c77278f57b){ .val = { .item0 = var2 }, .membernum = 0 };
+var2 = NULL;
+meth_List_PrecedenceItem__0a39a2f546_push(var1,var3);
+var4 = string0___ce4d38ea54; string_incref(var4);
+var5 = (struct class_PrecedenceItem_c77278f57b){ .val = { .item1 = var4 }, .membernum = 1 };
+var4.buf = NULL;
+meth_List_PrecedenceItem__0a39a2f546_push(var1,var5);
+var6 = 0LL;
+label7: (void)0;
+var8 = 10LL;
+var9 = oomph_int_gt(var8,var6);
+var10 = oomph_bool_not(var9);
+if (var10) goto label11;
+var12 = 0LL;
+label13: (void)0;
+if (var12 >= var1->len) goto label15;
+var14 = var1->data[var12++];
+string_decref(var16);
+var16.buf = NULL;
+
+            var17 = (
+                var14.membernum == 1
+            );
+            if (var17) goto label18;
+decref((var19), dtor_IntConstant_2f622b7e5e);
+var19 = NULL;
+
+            var17 = (
+                var14.membernum == 0
+            );
+            if (var17) goto label20;
+label18: (void)0;
+
+            if (var14.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var16 = var14.val.item1;
+            string_incref(var16);
+if (oomph_true) goto label21;
+label20: (void)0;
+
+            if (var14.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var19 = var14.val.item0;
+            incref(var19);
+label21: (void)0;
+if (oomph_true) goto label13;
+label15: (void)0;
+var22 = 1LL;
+var23 = oomph_int_add(var6,var22);
+var6 = var23;
+if (oomph_true) goto label7;
+label11: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var19), dtor_IntConstant_2f622b7e5e);
+(void)0;
+string_decref(var16);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_PrecedenceItem_c77278f57b(var5);
+string_decref(var4);
+decref_PrecedenceItem_c77278f57b(var3);
+decref((var2), dtor_IntConstant_2f622b7e5e);
+decref((var1), dtor_List_PrecedenceItem__0a39a2f546);
+}
@@ -0,0 +1,13 @@
+
+                #ifndef HEADER_GUARD_double_loop_double_free_bug_5ef7ea98fe
+                #define HEADER_GUARD_double_loop_double_free_bug_5ef7ea98fe
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "PrecedenceItem_c77278f57b.h"
+struct class_List_PrecedenceItem__0a39a2f546;
+struct class_IntConstant_2f622b7e5e;
+struct class_IntConstant_2f622b7e5e;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_early_return_b750283d86
+                #define HEADER_GUARD_early_return_b750283d86
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,80 @@
+#include <lib/oomph.h>
+#include "elif_80c10e63a5.h"
+#include "bundle_builtins_c399a735f1.h"
+void elif_80c10e63a5_foo(int64_t var1){int64_t var2;
+bool var3;
+int64_t var5;
+bool var6;
+int64_t var8;
+bool var9;
+int64_t var11;
+struct class_Str var12;
+var12.buf = NULL;
+int64_t var14;
+struct class_Str var15;
+var15.buf = NULL;
+int64_t var17;
+struct class_Str var18;
+var18.buf = NULL;
+int64_t var20;
+struct class_Str var21;
+var21.buf = NULL;
+var2 = 1LL;
+var3 = meth_Int_equals(var1,var2);
+if (var3) goto label4;
+var5 = 2LL;
+var6 = meth_Int_equals(var1,var5);
+if (var6) goto label7;
+var8 = 1LL;
+var9 = meth_Int_equals(var1,var8);
+if (var9) goto label10;
+var11 = 1234LL;
+var12 = meth_Int_to_string(var11);
+oomph_print(var12);
+if (oomph_true) goto label13;
+label10: (void)0;
+var14 = 666LL;
+var15 = meth_Int_to_string(var14);
+oomph_print(var15);
+label13: (void)0;
+if (oomph_true) goto label16;
+label7: (void)0;
+var17 = 222LL;
+var18 = meth_Int_to_string(var17);
+oomph_print(var18);
+label16: (void)0;
+if (oomph_true) goto label19;
+label4: (void)0;
+var20 = 111LL;
+var21 = meth_Int_to_string(var20);
+oomph_print(var21);
+label19: (void)0;
+out: (void)0;
+string_decref(var21);
+(void)0;
+string_decref(var18);
+(void)0;
+string_decref(var15);
+(void)0;
+string_decref(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}void oomph_main(void){int64_t var1;
+int64_t var2;
+int64_t var3;
+var1 = 1LL;
+elif_80c10e63a5_foo(var1);
+var2 = 2LL;
+elif_80c10e63a5_foo(var2);
+var3 = 3LL;
+elif_80c10e63a5_foo(var3);
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+}
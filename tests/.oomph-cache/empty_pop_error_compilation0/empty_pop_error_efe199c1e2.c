@@ -0,0 +1,15 @@
+#include <lib/oomph.h>
+#include "empty_pop_error_efe199c1e2.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+void oomph_main(void){struct class_List_Str__43b70c06cb* var1;
+var1 = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+var1 = ctor_List_Str__43b70c06cb();
+var2 = meth_List_Str__43b70c06cb_pop(var1);
+oomph_print(var2);
+out: (void)0;
+string_decref(var2);
+decref((var1), dtor_List_Str__43b70c06cb);
+}
@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_empty_pop_error_efe199c1e2
+                #define HEADER_GUARD_empty_pop_error_efe199c1e2
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Str__43b70c06cb;
+void oomph_main(void);
+
+                #endif
+                
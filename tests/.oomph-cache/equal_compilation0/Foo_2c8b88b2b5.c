@@ -0,0 +1,49 @@
+#include <lib/oomph.h>
+#include "Foo_2c8b88b2b5.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo_260b16d6d9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_260b16d6d9 = {
+                .buf = &string0_Foo_260b16d6d9_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Foo_2c8b88b2b5* ctor_Foo_2c8b88b2b5(void)
+            {
+                struct class_Foo_2c8b88b2b5* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_Foo_2c8b88b2b5(void *ptr)
+            {
+                struct class_Foo_2c8b88b2b5 *obj = ptr;
+                
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo_2c8b88b2b5_to_string(struct class_Foo_2c8b88b2b5* self)
+                {
+                    struct class_Str res = string0_Foo_260b16d6d9;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_2c8b88b2b5_equals(struct class_Foo_2c8b88b2b5* var1, struct class_Foo_2c8b88b2b5* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
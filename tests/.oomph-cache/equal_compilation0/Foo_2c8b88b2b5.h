@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Foo_2c8b88b2b5
+                #define HEADER_GUARD_Foo_2c8b88b2b5
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_2c8b88b2b5 {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Foo_2c8b88b2b5* ctor_Foo_2c8b88b2b5(void);
+            void dtor_Foo_2c8b88b2b5(void *ptr);
+            
+                struct class_Str meth_Foo_2c8b88b2b5_to_string(struct class_Foo_2c8b88b2b5* obj);
+                bool meth_Foo_2c8b88b2b5_equals(struct class_Foo_2c8b88b2b5* var1, struct class_Foo_2c8b88b2b5* var2);
+
+                #endif
+                
@@ -0,0 +1,278 @@
+#include <lib/oomph.h>
+#include "equal_1c305eeb97.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_2c8b88b2b5.h"
+
+            static struct StringBuf string0_____________1693558e6a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d' },
+                .malloced = false,
+            };
+            static struct class_Str string0_____________1693558e6a = {
+                .buf = &string0_____________1693558e6a_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_left_8aba12227c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x65', '\x66', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string1_left_8aba12227c = {
+                .buf = &string1_left_8aba12227c_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_right_4f3c3651e5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x69', '\x67', '\x68', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string2_right_4f3c3651e5 = {
+                .buf = &string2_right_4f3c3651e5_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            int64_t equal_1c305eeb97_bar(struct class_Str var1){int64_t var2;
+int64_t retval;
+oomph_print(var1);
+var2 = 123LL;
+(void)0; retval = var2; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}void oomph_main(void){struct class_Foo_2c8b88b2b5* var1;
+var1 = NULL;
+struct class_Foo_2c8b88b2b5* var2;
+var2 = NULL;
+bool var3;
+struct class_Str var4;
+var4.buf = NULL;
+bool var5;
+struct class_Str var6;
+var6.buf = NULL;
+bool var7;
+struct class_Str var8;
+var8.buf = NULL;
+bool var9;
+struct class_Str var10;
+var10.buf = NULL;
+bool var11;
+struct class_Str var12;
+var12.buf = NULL;
+bool var13;
+struct class_Str var14;
+var14.buf = NULL;
+bool var15;
+struct class_Str var16;
+var16.buf = NULL;
+bool var17;
+struct class_Str var18;
+var18.buf = NULL;
+bool var19;
+struct class_Str var20;
+var20.buf = NULL;
+bool var21;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+bool var24;
+bool var25;
+struct class_Str var26;
+var26.buf = NULL;
+bool var27;
+bool var28;
+struct class_Str var29;
+var29.buf = NULL;
+bool var30;
+struct class_Str var31;
+var31.buf = NULL;
+bool var32;
+struct class_Str var33;
+var33.buf = NULL;
+bool var34;
+struct class_Str var35;
+var35.buf = NULL;
+bool var36;
+struct class_Str var37;
+var37.buf = NULL;
+bool var38;
+struct class_Str var39;
+var39.buf = NULL;
+bool var40;
+struct class_Str var41;
+var41.buf = NULL;
+bool var42;
+struct class_Str var43;
+var43.buf = NULL;
+bool var44;
+struct class_Str var45;
+var45.buf = NULL;
+struct class_Str var46;
+var46.buf = NULL;
+struct class_Str var47;
+var47.buf = NULL;
+int64_t var48;
+struct class_Str var49;
+var49.buf = NULL;
+int64_t var50;
+bool var51;
+struct class_Str var52;
+var52.buf = NULL;
+struct class_Str var53;
+var53.buf = NULL;
+int64_t var54;
+struct class_Str var55;
+var55.buf = NULL;
+int64_t var56;
+bool var57;
+bool var58;
+struct class_Str var59;
+var59.buf = NULL;
+var1 = ctor_Foo_2c8b88b2b5();
+var2 = ctor_Foo_2c8b88b2b5();
+var3 = meth_Foo_2c8b88b2b5_equals(var1,var1);
+var4 = meth_Bool_to_string(var3);
+oomph_print(var4);
+var5 = meth_Foo_2c8b88b2b5_equals(var1,var2);
+var6 = meth_Bool_to_string(var5);
+oomph_print(var6);
+var7 = oomph_true;
+var8 = meth_Bool_to_string(var7);
+oomph_print(var8);
+var9 = oomph_false;
+var10 = meth_Bool_to_string(var9);
+oomph_print(var10);
+var11 = oomph_true;
+var12 = meth_Bool_to_string(var11);
+oomph_print(var12);
+var13 = oomph_false;
+var14 = meth_Bool_to_string(var13);
+oomph_print(var14);
+var15 = oomph_true;
+var16 = meth_Bool_to_string(var15);
+oomph_print(var16);
+var17 = oomph_false;
+var18 = meth_Bool_to_string(var17);
+oomph_print(var18);
+var19 = oomph_true;
+var20 = meth_Bool_to_string(var19);
+oomph_print(var20);
+var21 = oomph_false;
+var22 = meth_Bool_to_string(var21);
+oomph_print(var22);
+var23 = string0_____________1693558e6a; string_incref(var23);
+oomph_print(var23);
+var24 = meth_Foo_2c8b88b2b5_equals(var1,var1);
+var25 = oomph_bool_not(var24);
+var26 = meth_Bool_to_string(var25);
+oomph_print(var26);
+var27 = meth_Foo_2c8b88b2b5_equals(var1,var2);
+var28 = oomph_bool_not(var27);
+var29 = meth_Bool_to_string(var28);
+oomph_print(var29);
+var30 = oomph_false;
+var31 = meth_Bool_to_string(var30);
+oomph_print(var31);
+var32 = oomph_true;
+var33 = meth_Bool_to_string(var32);
+oomph_print(var33);
+var34 = oomph_false;
+var35 = meth_Bool_to_string(var34);
+oomph_print(var35);
+var36 = oomph_true;
+var37 = meth_Bool_to_string(var36);
+oomph_print(var37);
+var38 = oomph_false;
+var39 = meth_Bool_to_string(var38);
+oomph_print(var39);
+var40 = oomph_true;
+var41 = meth_Bool_to_string(var40);
+oomph_print(var41);
+var42 = oomph_false;
+var43 = meth_Bool_to_string(var42);
+oomph_print(var43);
+var44 = oomph_true;
+var45 = meth_Bool_to_string(var44);
+oomph_print(var45);
+var46 = string0_____________1693558e6a; string_incref(var46);
+oomph_print(var46);
+var47 = string1_left_8aba12227c; string_incref(var47);
+var48 = equal_1c305eeb97_bar(var47);
+var49 = string2_right_4f3c3651e5; string_incref(var49);
+var50 = equal_1c305eeb97_bar(var49);
+var51 = meth_Int_equals(var48,var50);
+var52 = meth_Bool_to_string(var51);
+oomph_print(var52);
+var53 = string1_left_8aba12227c; string_incref(var53);
+var54 = equal_1c305eeb97_bar(var53);
+var55 = string2_right_4f3c3651e5; string_incref(var55);
+var56 = equal_1c305eeb97_bar(var55);
+var57 = meth_Int_equals(var54,var56);
+var58 = oomph_bool_not(var57);
+var59 = meth_Bool_to_string(var58);
+oomph_print(var59);
+out: (void)0;
+string_decref(var59);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var55);
+(void)0;
+string_decref(var53);
+string_decref(var52);
+(void)0;
+(void)0;
+string_decref(var49);
+(void)0;
+string_decref(var47);
+string_decref(var46);
+string_decref(var45);
+(void)0;
+string_decref(var43);
+(void)0;
+string_decref(var41);
+(void)0;
+string_decref(var39);
+(void)0;
+string_decref(var37);
+(void)0;
+string_decref(var35);
+(void)0;
+string_decref(var33);
+(void)0;
+string_decref(var31);
+(void)0;
+string_decref(var29);
+(void)0;
+(void)0;
+string_decref(var26);
+(void)0;
+(void)0;
+string_decref(var23);
+string_decref(var22);
+(void)0;
+string_decref(var20);
+(void)0;
+string_decref(var18);
+(void)0;
+string_decref(var16);
+(void)0;
+string_decref(var14);
+(void)0;
+string_decref(var12);
+(void)0;
+string_decref(var10);
+(void)0;
+string_decref(var8);
+(void)0;
+string_decref(var6);
+(void)0;
+string_decref(var4);
+(void)0;
+decref((var2), dtor_Foo_2c8b88b2b5);
+decref((var1), dtor_Foo_2c8b88b2b5);
+}
@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_equal_1c305eeb97
+                #define HEADER_GUARD_equal_1c305eeb97
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Foo_2c8b88b2b5;
+struct class_Foo_2c8b88b2b5;
+int64_t equal_1c305eeb97_bar(struct class_Str var1);
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,69 @@
+#include <lib/oomph.h>
+#include "escape_9e9c02803e.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_a_b_b235bc6293_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x5c', '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string0_a_b_b235bc6293 = {
+                .buf = &string0_a_b_b235bc6293_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_a_b_c_d_e_f_g_b543379fd2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x7b', '\x62', '\x7d', '\x63', '\x5c', '\x64', '\x0a', '\x65', '\x09', '\x66', '\x22', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string1_a_b_c_d_e_f_g_b543379fd2 = {
+                .buf = &string1_a_b_c_d_e_f_g_b543379fd2_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2___8ac6a19ac4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x22' },
+                .malloced = false,
+            };
+            static struct class_Str string2___8ac6a19ac4 = {
+                .buf = &string2___8ac6a19ac4_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3__n_7b9531c0ac_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5c', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string3__n_7b9531c0ac = {
+                .buf = &string3__n_7b9531c0ac_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+var1 = string0_a_b_b235bc6293; string_incref(var1);
+oomph_print(var1);
+var2 = string1_a_b_c_d_e_f_g_b543379fd2; string_incref(var2);
+oomph_print(var2);
+var3 = string2___8ac6a19ac4; string_incref(var3);
+oomph_print(var3);
+var4 = string3__n_7b9531c0ac; string_incref(var4);
+oomph_print(var4);
+out: (void)0;
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+}
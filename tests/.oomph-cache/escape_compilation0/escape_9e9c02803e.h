@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_escape_9e9c02803e
+                #define HEADER_GUARD_escape_9e9c02803e
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
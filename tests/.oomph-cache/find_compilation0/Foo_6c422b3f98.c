@@ -0,0 +1,69 @@
+#include <lib/oomph.h>
+#include "Foo_6c422b3f98.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo_76a65391b6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_76a65391b6 = {
+                .buf = &string0_Foo_76a65391b6_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Foo_6c422b3f98* ctor_Foo_6c422b3f98(int64_t arg_id,struct class_Str arg_name)
+            {
+                struct class_Foo_6c422b3f98* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_id = arg_id;
+obj->memb_name = arg_name;
+
+                (void)0;
+string_incref(arg_name);
+
+                return obj;
+            }
+
+            void dtor_Foo_6c422b3f98(void *ptr)
+            {
+                struct class_Foo_6c422b3f98 *obj = ptr;
+                (void)0;
+string_decref(obj->memb_name);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo_6c422b3f98_to_string(struct class_Foo_6c422b3f98* self)
+                {
+                    struct class_Str res = string0_Foo_76a65391b6;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_id);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_6c422b3f98_equals(struct class_Foo_6c422b3f98* var1, struct class_Foo_6c422b3f98* var2){int64_t var3;
+int64_t var4;
+bool var5;
+bool retval;
+var3 = var1->memb_id;
+var4 = var2->memb_id;
+var5 = meth_Int_equals(var3,var4);
+(void)0; retval = var5; goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,21 @@
+
+                #ifndef HEADER_GUARD_Foo_6c422b3f98
+                #define HEADER_GUARD_Foo_6c422b3f98
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_6c422b3f98 {
+                REFCOUNT_HEADER
+                int64_t memb_id;
+struct class_Str memb_name;
+
+            };
+            
+            struct class_Foo_6c422b3f98* ctor_Foo_6c422b3f98(int64_t arg_id,struct class_Str arg_name);
+            void dtor_Foo_6c422b3f98(void *ptr);
+            
+                struct class_Str meth_Foo_6c422b3f98_to_string(struct class_Foo_6c422b3f98* obj);
+                bool meth_Foo_6c422b3f98_equals(struct class_Foo_6c422b3f98* var1, struct class_Foo_6c422b3f98* var2);
+
+                #endif
+                
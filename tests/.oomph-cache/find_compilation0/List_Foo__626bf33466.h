@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_Foo__626bf33466
+                #define HEADER_GUARD_List_Foo__626bf33466
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_6c422b3f98.h"
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+
+#define CONSTRUCTOR ctor_List_Foo__626bf33466
+
+#define DESTRUCTOR dtor_List_Foo__626bf33466
+
+#define TYPE struct class_List_Foo__626bf33466 *
+
+#define TYPE_STRUCT class_List_Foo__626bf33466
+
+#define METHOD(name) meth_List_Foo__626bf33466_##name
+
+#define ITEMTYPE struct class_Foo_6c422b3f98*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Foo_6c422b3f98_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Foo_6c422b3f98)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Foo__626bf33466___contains(struct class_List_Foo__626bf33466*, struct class_Foo_6c422b3f98*);
+void meth_List_Foo__626bf33466___reserve(struct class_List_Foo__626bf33466*, int64_t);
+struct class_Foo_6c422b3f98* meth_List_Foo__626bf33466_delete_at_index(struct class_List_Foo__626bf33466*, int64_t);
+struct class_List_Foo__626bf33466* meth_List_Foo__626bf33466_delete_slice(struct class_List_Foo__626bf33466*, int64_t, int64_t);
+bool meth_List_Foo__626bf33466_ends_with(struct class_List_Foo__626bf33466*, struct class_List_Foo__626bf33466*);
+int64_t meth_List_Foo__626bf33466_find_first(struct class_List_Foo__626bf33466*, struct class_Foo_6c422b3f98*);
+int64_t meth_List_Foo__626bf33466_find_last(struct class_List_Foo__626bf33466*, struct class_Foo_6c422b3f98*);
+int64_t meth_List_Foo__626bf33466_find_only(struct class_List_Foo__626bf33466*, struct class_Foo_6c422b3f98*);
+struct class_Foo_6c422b3f98* meth_List_Foo__626bf33466_first(struct class_List_Foo__626bf33466*);
+struct class_Foo_6c422b3f98* meth_List_Foo__626bf33466_get(struct class_List_Foo__626bf33466*, int64_t);
+void meth_List_Foo__626bf33466_insert(struct class_List_Foo__626bf33466*, int64_t, struct class_Foo_6c422b3f98*);
+struct class_Foo_6c422b3f98* meth_List_Foo__626bf33466_last(struct class_List_Foo__626bf33466*);
+int64_t meth_List_Foo__626bf33466_length(struct class_List_Foo__626bf33466*);
+struct class_Foo_6c422b3f98* meth_List_Foo__626bf33466_pop(struct class_List_Foo__626bf33466*);
+void meth_List_Foo__626bf33466_push(struct class_List_Foo__626bf33466*, struct class_Foo_6c422b3f98*);
+void meth_List_Foo__626bf33466_push_all(struct class_List_Foo__626bf33466*, struct class_List_Foo__626bf33466*);
+void meth_List_Foo__626bf33466_delete_first(struct class_List_Foo__626bf33466*, struct class_Foo_6c422b3f98*);
+void meth_List_Foo__626bf33466_delete_last(struct class_List_Foo__626bf33466*, struct class_Foo_6c422b3f98*);
+void meth_List_Foo__626bf33466_delete_only(struct class_List_Foo__626bf33466*, struct class_Foo_6c422b3f98*);
+struct class_List_Foo__626bf33466* meth_List_Foo__626bf33466_reversed(struct class_List_Foo__626bf33466*);
+struct class_List_Foo__626bf33466* meth_List_Foo__626bf33466_slice(struct class_List_Foo__626bf33466*, int64_t, int64_t);
+bool meth_List_Foo__626bf33466_starts_with(struct class_List_Foo__626bf33466*, struct class_List_Foo__626bf33466*);
+struct class_Str meth_List_Foo__626bf33466_to_string(struct class_List_Foo__626bf33466*);
+struct class_Str meth_List_Foo__626bf33466_join(struct class_List_Foo__626bf33466*, struct class_Str);
+bool meth_List_Foo__626bf33466_equals(struct class_List_Foo__626bf33466*, struct class_List_Foo__626bf33466*);
+
+#define CONSTRUCTOR ctor_List_Foo__626bf33466
+
+#define DESTRUCTOR dtor_List_Foo__626bf33466
+
+#define TYPE struct class_List_Foo__626bf33466 *
+
+#define TYPE_STRUCT class_List_Foo__626bf33466
+
+#define METHOD(name) meth_List_Foo__626bf33466_##name
+
+#define ITEMTYPE struct class_Foo_6c422b3f98*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Foo_6c422b3f98_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Foo_6c422b3f98)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,250 @@
+#include <lib/oomph.h>
+#include "find_d7a17e09cb.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_6c422b3f98.h"
+#include "List_Foo__626bf33466.h"
+
+            static struct StringBuf string0_a_d18a80e6c1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string0_a_d18a80e6c1 = {
+                .buf = &string0_a_d18a80e6c1_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_b_a88f8dfb24_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string1_b_a88f8dfb24 = {
+                .buf = &string1_b_a88f8dfb24_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_c_7902896ea0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string2_c_7902896ea0 = {
+                .buf = &string2_c_7902896ea0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_d_84a276b085_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string3_d_84a276b085 = {
+                .buf = &string3_d_84a276b085_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_e_d57227621a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string4_e_d57227621a = {
+                .buf = &string4_e_d57227621a_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_lol_fd84b131c2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string5_lol_fd84b131c2 = {
+                .buf = &string5_lol_fd84b131c2_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void oomph_main(void){int64_t var1;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_Foo_6c422b3f98* var3;
+var3 = NULL;
+int64_t var4;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Foo_6c422b3f98* var6;
+var6 = NULL;
+int64_t var7;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Foo_6c422b3f98* var9;
+var9 = NULL;
+int64_t var10;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Foo_6c422b3f98* var12;
+var12 = NULL;
+int64_t var13;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Foo_6c422b3f98* var15;
+var15 = NULL;
+struct class_List_Foo__626bf33466* var16;
+var16 = NULL;
+int64_t var17;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Foo_6c422b3f98* var19;
+var19 = NULL;
+int64_t var20;
+struct class_Str var21;
+var21.buf = NULL;
+int64_t var22;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Foo_6c422b3f98* var24;
+var24 = NULL;
+int64_t var25;
+struct class_Str var26;
+var26.buf = NULL;
+int64_t var27;
+struct class_Str var28;
+var28.buf = NULL;
+struct class_Foo_6c422b3f98* var29;
+var29 = NULL;
+int64_t var30;
+struct class_Str var31;
+var31.buf = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+int64_t var33;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_Foo_6c422b3f98* var35;
+var35 = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+int64_t var37;
+struct class_Str var38;
+var38.buf = NULL;
+struct class_Foo_6c422b3f98* var39;
+var39 = NULL;
+struct class_Str var40;
+var40.buf = NULL;
+int64_t var41;
+struct class_Str var42;
+var42.buf = NULL;
+struct class_Foo_6c422b3f98* var43;
+var43 = NULL;
+struct class_Str var44;
+var44.buf = NULL;
+var1 = 1LL;
+var2 = string0_a_d18a80e6c1; string_incref(var2);
+var3 = ctor_Foo_6c422b3f98(var1,var2);
+var4 = 2LL;
+var5 = string1_b_a88f8dfb24; string_incref(var5);
+var6 = ctor_Foo_6c422b3f98(var4,var5);
+var7 = 2LL;
+var8 = string2_c_7902896ea0; string_incref(var8);
+var9 = ctor_Foo_6c422b3f98(var7,var8);
+var10 = 2LL;
+var11 = string3_d_84a276b085; string_incref(var11);
+var12 = ctor_Foo_6c422b3f98(var10,var11);
+var13 = 3LL;
+var14 = string4_e_d57227621a; string_incref(var14);
+var15 = ctor_Foo_6c422b3f98(var13,var14);
+var16 = ctor_List_Foo__626bf33466();
+meth_List_Foo__626bf33466_push(var16,var3);
+meth_List_Foo__626bf33466_push(var16,var6);
+meth_List_Foo__626bf33466_push(var16,var9);
+meth_List_Foo__626bf33466_push(var16,var12);
+meth_List_Foo__626bf33466_push(var16,var15);
+var17 = 2LL;
+var18 = string5_lol_fd84b131c2; string_incref(var18);
+var19 = ctor_Foo_6c422b3f98(var17,var18);
+var20 = meth_List_Foo__626bf33466_find_first(var16,var19);
+var21 = meth_Int_to_string(var20);
+oomph_print(var21);
+var22 = 2LL;
+var23 = string5_lol_fd84b131c2; string_incref(var23);
+var24 = ctor_Foo_6c422b3f98(var22,var23);
+var25 = meth_List_Foo__626bf33466_find_last(var16,var24);
+var26 = meth_Int_to_string(var25);
+oomph_print(var26);
+var27 = 1LL;
+var28 = string5_lol_fd84b131c2; string_incref(var28);
+var29 = ctor_Foo_6c422b3f98(var27,var28);
+var30 = meth_List_Foo__626bf33466_find_only(var16,var29);
+var31 = meth_Int_to_string(var30);
+oomph_print(var31);
+var32 = meth_List_Foo__626bf33466_to_string(var16);
+oomph_print(var32);
+var33 = 2LL;
+var34 = string5_lol_fd84b131c2; string_incref(var34);
+var35 = ctor_Foo_6c422b3f98(var33,var34);
+meth_List_Foo__626bf33466_delete_first(var16,var35);
+var36 = meth_List_Foo__626bf33466_to_string(var16);
+oomph_print(var36);
+var37 = 2LL;
+var38 = string5_lol_fd84b131c2; string_incref(var38);
+var39 = ctor_Foo_6c422b3f98(var37,var38);
+meth_List_Foo__626bf33466_delete_last(var16,var39);
+var40 = meth_List_Foo__626bf33466_to_string(var16);
+oomph_print(var40);
+var41 = 2LL;
+var42 = string5_lol_fd84b131c2; string_incref(var42);
+var43 = ctor_Foo_6c422b3f98(var41,var42);
+meth_List_Foo__626bf33466_delete_only(var16,var43);
+var44 = meth_List_Foo__626bf33466_to_string(var16);
+oomph_print(var44);
+out: (void)0;
+string_decref(var44);
+decref((var43), dtor_Foo_6c422b3f98);
+string_decref(var42);
+(void)0;
+string_decref(var40);
+decref((var39), dtor_Foo_6c422b3f98);
+string_decref(var38);
+(void)0;
+string_decref(var36);
+decref((var35), dtor_Foo_6c422b3f98);
+string_decref(var34);
+(void)0;
+string_decref(var32);
+string_decref(var31);
+(void)0;
+decref((var29), dtor_Foo_6c422b3f98);
+string_decref(var28);
+(void)0;
+string_decref(var26);
+(void)0;
+decref((var24), dtor_Foo_6c422b3f98);
+string_decref(var23);
+(void)0;
+string_decref(var21);
+(void)0;
+decref((var19), dtor_Foo_6c422b3f98);
+string_decref(var18);
+(void)0;
+decref((var16), dtor_List_Foo__626bf33466);
+decref((var15), dtor_Foo_6c422b3f98);
+string_decref(var14);
+(void)0;
+decref((var12), dtor_Foo_6c422b3f98);
+string_decref(var11);
+(void)0;
+decref((var9), dtor_Foo_6c422b3f98);
+string_decref(var8);
+(void)0;
+decref((var6), dtor_Foo_6c422b3f98);
+string_decref(var5);
+(void)0;
+decref((var3), dtor_Foo_6c422b3f98);
+string_decref(var2);
+(void)0;
+}
@@ -0,0 +1,21 @@
+
+                #ifndef HEADER_GUARD_find_d7a17e09cb
+                #define HEADER_GUARD_find_d7a17e09cb
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_List_Foo__626bf33466;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+struct class_Foo_6c422b3f98;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_find_first_error_81f95c91e7
+                #define HEADER_GUARD_find_first_error_81f95c91e7
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Int__df8a64abf3;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_find_only_404_error_66ca1c2b4a
+                #define HEADER_GUARD_find_only_404_error_66ca1c2b4a
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Int__df8a64abf3;
+void oomph_main(void);
+
+                #endif
+                
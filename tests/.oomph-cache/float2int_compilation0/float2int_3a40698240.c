@@ -0,0 +1,181 @@
+#include <lib/oomph.h>
+#include "float2int_3a40698240.h"
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void){double var1;
+int64_t var2;
+struct class_Str var3;
+var3.buf = NULL;
+double var4;
+int64_t var5;
+struct class_Str var6;
+var6.buf = NULL;
+double var7;
+int64_t var8;
+struct class_Str var9;
+var9.buf = NULL;
+double var10;
+int64_t var11;
+struct class_Str var12;
+var12.buf = NULL;
+double var13;
+int64_t var14;
+struct class_Str var15;
+var15.buf = NULL;
+double var16;
+int64_t var17;
+struct class_Str var18;
+var18.buf = NULL;
+double var19;
+int64_t var20;
+struct class_Str var21;
+var21.buf = NULL;
+double var22;
+int64_t var23;
+struct class_Str var24;
+var24.buf = NULL;
+double var25;
+int64_t var26;
+struct class_Str var27;
+var27.buf = NULL;
+double var28;
+int64_t var29;
+struct class_Str var30;
+var30.buf = NULL;
+double var31;
+int64_t var32;
+struct class_Str var33;
+var33.buf = NULL;
+double var34;
+int64_t var35;
+struct class_Str var36;
+var36.buf = NULL;
+double var37;
+int64_t var38;
+struct class_Str var39;
+var39.buf = NULL;
+double var40;
+int64_t var41;
+struct class_Str var42;
+var42.buf = NULL;
+double var43;
+int64_t var44;
+struct class_Str var45;
+var45.buf = NULL;
+double var46;
+int64_t var47;
+struct class_Str var48;
+var48.buf = NULL;
+var1 = 1.23;
+var2 = meth_Float_floor(var1);
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+var4 = -1.23;
+var5 = meth_Float_floor(var4);
+var6 = meth_Int_to_string(var5);
+oomph_print(var6);
+var7 = 1.23;
+var8 = meth_Float_ceil(var7);
+var9 = meth_Int_to_string(var8);
+oomph_print(var9);
+var10 = -1.23;
+var11 = meth_Float_ceil(var10);
+var12 = meth_Int_to_string(var11);
+oomph_print(var12);
+var13 = 1.23;
+var14 = meth_Float_truncate(var13);
+var15 = meth_Int_to_string(var14);
+oomph_print(var15);
+var16 = -1.23;
+var17 = meth_Float_truncate(var16);
+var18 = meth_Int_to_string(var17);
+oomph_print(var18);
+var19 = 1.23;
+var20 = meth_Float_round(var19);
+var21 = meth_Int_to_string(var20);
+oomph_print(var21);
+var22 = -1.23;
+var23 = meth_Float_round(var22);
+var24 = meth_Int_to_string(var23);
+oomph_print(var24);
+var25 = 4.56;
+var26 = meth_Float_floor(var25);
+var27 = meth_Int_to_string(var26);
+oomph_print(var27);
+var28 = -4.56;
+var29 = meth_Float_floor(var28);
+var30 = meth_Int_to_string(var29);
+oomph_print(var30);
+var31 = 4.56;
+var32 = meth_Float_ceil(var31);
+var33 = meth_Int_to_string(var32);
+oomph_print(var33);
+var34 = -4.56;
+var35 = meth_Float_ceil(var34);
+var36 = meth_Int_to_string(var35);
+oomph_print(var36);
+var37 = 4.56;
+var38 = meth_Float_truncate(var37);
+var39 = meth_Int_to_string(var38);
+oomph_print(var39);
+var40 = -4.56;
+var41 = meth_Float_truncate(var40);
+var42 = meth_Int_to_string(var41);
+oomph_print(var42);
+var43 = 4.56;
+var44 = meth_Float_round(var43);
+var45 = meth_Int_to_string(var44);
+oomph_print(var45);
+var46 = -4.56;
+var47 = meth_Float_round(var46);
+var48 = meth_Int_to_string(var47);
+oomph_print(var48);
+out: (void)0;
+string_decref(var48);
+(void)0;
+(void)0;
+string_decref(var45);
+(void)0;
+(void)0;
+string_decref(var42);
+(void)0;
+(void)0;
+string_decref(var39);
+(void)0;
+(void)0;
+string_decref(var36);
+(void)0;
+(void)0;
+string_decref(var33);
+(void)0;
+(void)0;
+string_decref(var30);
+(void)0;
+(void)0;
+string_decref(var27);
+(void)0;
+(void)0;
+string_decref(var24);
+(void)0;
+(void)0;
+string_decref(var21);
+(void)0;
+(void)0;
+string_decref(var18);
+(void)0;
+(void)0;
+string_decref(var15);
+(void)0;
+(void)0;
+string_decref(var12);
+(void)0;
+(void)0;
+string_decref(var9);
+(void)0;
+(void)0;
+string_decref(var6);
+(void)0;
+(void)0;
+string_decref(var3);
+(void)0;
+(void)0;
+}
@@ -0,0 +1,56 @@
+#include <lib/oomph.h>
+#include "Box_1003ef4590.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Box_e735a0448c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x6f', '\x78' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Box_e735a0448c = {
+                .buf = &string0_Box_e735a0448c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Box_1003ef4590* ctor_Box_1003ef4590(struct class_Str arg_name)
+            {
+                struct class_Box_1003ef4590* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_name = arg_name;
+
+                string_incref(arg_name);
+
+                return obj;
+            }
+
+            void dtor_Box_1003ef4590(void *ptr)
+            {
+                struct class_Box_1003ef4590 *obj = ptr;
+                string_decref(obj->memb_name);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Box_1003ef4590_to_string(struct class_Box_1003ef4590* self)
+                {
+                    struct class_Str res = string0_Box_e735a0448c;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Box_1003ef4590_equals(struct class_Box_1003ef4590* var1, struct class_Box_1003ef4590* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,20 @@
+
+                #ifndef HEADER_GUARD_Box_1003ef4590
+                #define HEADER_GUARD_Box_1003ef4590
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Box_1003ef4590 {
+                REFCOUNT_HEADER
+                struct class_Str memb_name;
+
+            };
+            
+            struct class_Box_1003ef4590* ctor_Box_1003ef4590(struct class_Str arg_name);
+            void dtor_Box_1003ef4590(void *ptr);
+            
+                struct class_Str meth_Box_1003ef4590_to_string(struct class_Box_1003ef4590* obj);
+                bool meth_Box_1003ef4590_equals(struct class_Box_1003ef4590* var1, struct class_Box_1003ef4590* var2);
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_Box__5bc5d84e38
+                #define HEADER_GUARD_List_Box__5bc5d84e38
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Box_1003ef4590.h"
+struct class_Box_1003ef4590;
+struct class_Box_1003ef4590;
+struct class_Box_1003ef4590;
+struct class_Box_1003ef4590;
+struct class_Box_1003ef4590;
+struct class_Box_1003ef4590;
+struct class_Box_1003ef4590;
+struct class_Box_1003ef4590;
+struct class_Box_1003ef4590;
+struct class_Box_1003ef4590;
+struct class_Box_1003ef4590;
+struct class_Box_1003ef4590;
+struct class_Box_1003ef4590;
+struct class_Box_1003ef4590;
+
+#define CONSTRUCTOR ctor_List_Box__5bc5d84e38
+
+#define DESTRUCTOR dtor_List_Box__5bc5d84e38
+
+#define TYPE struct class_List_Box__5bc5d84e38 *
+
+#define TYPE_STRUCT class_List_Box__5bc5d84e38
+
+#define METHOD(name) meth_List_Box__5bc5d84e38_##name
+
+#define ITEMTYPE struct class_Box_1003ef4590*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Box_1003ef4590_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Box_1003ef4590)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Box__5bc5d84e38___contains(struct class_List_Box__5bc5d84e38*, struct class_Box_1003ef4590*);
+void meth_List_Box__5bc5d84e38___reserve(struct class_List_Box__5bc5d84e38*, int64_t);
+struct class_Box_1003ef4590* meth_List_Box__5bc5d84e38_delete_at_index(struct class_List_Box__5bc5d84e38*, int64_t);
+struct class_List_Box__5bc5d84e38* meth_List_Box__5bc5d84e38_delete_slice(struct class_List_Box__5bc5d84e38*, int64_t, int64_t);
+bool meth_List_Box__5bc5d84e38_ends_with(struct class_List_Box__5bc5d84e38*, struct class_List_Box__5bc5d84e38*);
+int64_t meth_List_Box__5bc5d84e38_find_first(struct class_List_Box__5bc5d84e38*, struct class_Box_1003ef4590*);
+int64_t meth_List_Box__5bc5d84e38_find_last(struct class_List_Box__5bc5d84e38*, struct class_Box_1003ef4590*);
+int64_t meth_List_Box__5bc5d84e38_find_only(struct class_List_Box__5bc5d84e38*, struct class_Box_1003ef4590*);
+struct class_Box_1003ef4590* meth_List_Box__5bc5d84e38_first(struct class_List_Box__5bc5d84e38*);
+struct class_Box_1003ef4590* meth_List_Box__5bc5d84e38_get(struct class_List_Box__5bc5d84e38*, int64_t);
+void meth_List_Box__5bc5d84e38_insert(struct class_List_Box__5bc5d84e38*, int64_t, struct class_Box_1003ef4590*);
+struct class_Box_1003ef4590* meth_List_Box__5bc5d84e38_last(struct class_List_Box__5bc5d84e38*);
+int64_t meth_List_Box__5bc5d84e38_length(struct class_List_Box__5bc5d84e38*);
+struct class_Box_1003ef4590* meth_List_Box__5bc5d84e38_pop(struct class_List_Box__5bc5d84e38*);
+void meth_List_Box__5bc5d84e38_push(struct class_List_Box__5bc5d84e38*, struct class_Box_1003ef4590*);
+void meth_List_Box__5bc5d84e38_push_all(struct class_List_Box__5bc5d84e38*, struct class_List_Box__5bc5d84e38*);
+void meth_List_Box__5bc5d84e38_delete_first(struct class_List_Box__5bc5d84e38*, struct class_Box_1003ef4590*);
+void meth_List_Box__5bc5d84e38_delete_last(struct class_List_Box__5bc5d84e38*, struct class_Box_1003ef4590*);
+void meth_List_Box__5bc5d84e38_delete_only(struct class_List_Box__5bc5d84e38*, struct class_Box_1003ef4590*);
+struct class_List_Box__5bc5d84e38* meth_List_Box__5bc5d84e38_reversed(struct class_List_Box__5bc5d84e38*);
+struct class_List_Box__5bc5d84e38* meth_List_Box__5bc5d84e38_slice(struct class_List_Box__5bc5d84e38*, int64_t, int64_t);
+bool meth_List_Box__5bc5d84e38_starts_with(struct class_List_Box__5bc5d84e38*, struct class_List_Box__5bc5d84e38*);
+struct class_Str meth_List_Box__5bc5d84e38_to_string(struct class_List_Box__5bc5d84e38*);
+struct class_Str meth_List_Box__5bc5d84e38_join(struct class_List_Box__5bc5d84e38*, struct class_Str);
+bool meth_List_Box__5bc5d84e38_equals(struct class_List_Box__5bc5d84e38*, struct class_List_Box__5bc5d84e38*);
+
+#define CONSTRUCTOR ctor_List_Box__5bc5d84e38
+
+#define DESTRUCTOR dtor_List_Box__5bc5d84e38
+
+#define TYPE struct class_List_Box__5bc5d84e38 *
+
+#define TYPE_STRUCT class_List_Box__5bc5d84e38
+
+#define METHOD(name) meth_List_Box__5bc5d84e38_##name
+
+#define ITEMTYPE struct class_Box_1003ef4590*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Box_1003ef4590_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Box_1003ef4590)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
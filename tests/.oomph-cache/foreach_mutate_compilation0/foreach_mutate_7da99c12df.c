@@ -0,0 +1,314 @@
+#include <lib/oomph.h>
+#include "foreach_mutate_7da99c12df.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Box_1003ef4590.h"
+#include "List_Box__5bc5d84e38.h"
+#include "List_Int__df8a64abf3.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_a_bcbeda5411_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string0_a_bcbeda5411 = {
+                .buf = &string0_a_bcbeda5411_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_b_e46671097c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string1_b_e46671097c = {
+                .buf = &string1_b_e46671097c_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_c_499c39393e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string2_c_499c39393e = {
+                .buf = &string2_c_499c39393e_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_d_5f74508df3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string3_d_5f74508df3 = {
+                .buf = &string3_d_5f74508df3_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_x_9a0ae21471_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x78' },
+                .malloced = false,
+            };
+            static struct class_Str string4_x_9a0ae21471 = {
+                .buf = &string4_x_9a0ae21471_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_y_e4a2038c20_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x79' },
+                .malloced = false,
+            };
+            static struct class_Str string5_y_e4a2038c20 = {
+                .buf = &string5_y_e4a2038c20_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6_z_f966999148_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7a' },
+                .malloced = false,
+            };
+            static struct class_Str string6_z_f966999148 = {
+                .buf = &string6_z_f966999148_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7_new_f0fd7b2c4f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x65', '\x77' },
+                .malloced = false,
+            };
+            static struct class_Str string7_new_f0fd7b2c4f = {
+                .buf = &string7_new_f0fd7b2c4f_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void foreach_mutate_7da99c12df_clear(struct class_List_Box__5bc5d84e38* var1){int64_t var3;
+int64_t var4;
+bool var5;
+bool var6;
+bool var7;
+struct class_Box_1003ef4590* var9;
+var9 = NULL;
+label2: (void)0;
+var3 = meth_List_Box__5bc5d84e38_length(var1);
+var4 = 0LL;
+var5 = meth_Int_equals(var3,var4);
+var6 = oomph_bool_not(var5);
+var7 = oomph_bool_not(var6);
+if (var7) goto label8;
+decref((var9), dtor_Box_1003ef4590);
+var9 = NULL;
+var9 = meth_List_Box__5bc5d84e38_pop(var1);
+if (oomph_true) goto label2;
+label8: (void)0;
+out: (void)0;
+decref((var9), dtor_Box_1003ef4590);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_List_Str__43b70c06cb* var5;
+var5 = NULL;
+struct class_List_Str__43b70c06cb* var6;
+var6 = NULL;
+int64_t var7;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+bool var12;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Box_1003ef4590* var17;
+var17 = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Box_1003ef4590* var19;
+var19 = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Box_1003ef4590* var21;
+var21 = NULL;
+struct class_List_Box__5bc5d84e38* var22;
+var22 = NULL;
+int64_t var23;
+struct class_Box_1003ef4590* var25;
+var25 = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+int64_t var28;
+int64_t var29;
+struct class_List_Int__df8a64abf3* var30;
+var30 = NULL;
+int64_t var31;
+int64_t var33;
+int64_t var35;
+bool var36;
+int64_t var39;
+int64_t var40;
+struct class_Str var41;
+var41.buf = NULL;
+struct class_List_Str__43b70c06cb* var42;
+var42 = NULL;
+int64_t var43;
+struct class_Str var45;
+var45.buf = NULL;
+struct class_Str var47;
+var47.buf = NULL;
+struct class_List_Str__43b70c06cb* var48;
+var48 = NULL;
+struct class_Str var49;
+var49.buf = NULL;
+var1 = string0_a_bcbeda5411; string_incref(var1);
+var2 = string1_b_e46671097c; string_incref(var2);
+var3 = string2_c_499c39393e; string_incref(var3);
+var4 = string3_d_5f74508df3; string_incref(var4);
+var5 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var5,var1);
+meth_List_Str__43b70c06cb_push(var5,var2);
+meth_List_Str__43b70c06cb_push(var5,var3);
+meth_List_Str__43b70c06cb_push(var5,var4);
+var6 = var5;
+incref(var6);
+var7 = 0LL;
+label8: (void)0;
+if (var7 >= var6->len) goto label10;
+string_decref(var9); var9 = var6->data[var7++]; string_incref(var9);
+string_decref(var11);
+var11.buf = NULL;
+var11 = string1_b_e46671097c; string_incref(var11);
+var12 = meth_Str_equals(var9,var11);
+if (var12) goto label13;
+if (oomph_true) goto label14;
+label13: (void)0;
+string_decref(var15);
+var15.buf = NULL;
+var15 = meth_List_Str__43b70c06cb_pop(var5);
+label14: (void)0;
+oomph_print(var9);
+if (oomph_true) goto label8;
+label10: (void)0;
+var16 = string4_x_9a0ae21471; string_incref(var16);
+var17 = ctor_Box_1003ef4590(var16);
+var18 = string5_y_e4a2038c20; string_incref(var18);
+var19 = ctor_Box_1003ef4590(var18);
+var20 = string6_z_f966999148; string_incref(var20);
+var21 = ctor_Box_1003ef4590(var20);
+var22 = ctor_List_Box__5bc5d84e38();
+meth_List_Box__5bc5d84e38_push(var22,var17);
+meth_List_Box__5bc5d84e38_push(var22,var19);
+meth_List_Box__5bc5d84e38_push(var22,var21);
+var23 = 0LL;
+label24: (void)0;
+if (var23 >= var22->len) goto label26;
+decref((var25), dtor_Box_1003ef4590); var25 = var22->data[var23++]; incref(var25);
+foreach_mutate_7da99c12df_clear(var22);
+string_decref(var27);
+var27.buf = NULL;
+var27 = var25->memb_name;
+string_incref(var27);
+oomph_print(var27);
+if (oomph_true) goto label24;
+label26: (void)0;
+var28 = 1LL;
+var29 = 2LL;
+var30 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var30,var28);
+meth_List_Int__df8a64abf3_push(var30,var29);
+var31 = 0LL;
+label32: (void)0;
+if (var31 >= var30->len) goto label34;
+var33 = var30->data[var31++];
+var35 = 4LL;
+var36 = oomph_int_gt(var35,var33);
+if (var36) goto label37;
+if (oomph_true) goto label38;
+label37: (void)0;
+var39 = 2LL;
+var40 = oomph_int_add(var33,var39);
+meth_List_Int__df8a64abf3_push(var30,var40);
+label38: (void)0;
+string_decref(var41);
+var41.buf = NULL;
+var41 = meth_Int_to_string(var33);
+oomph_print(var41);
+if (oomph_true) goto label32;
+label34: (void)0;
+var42 = var5;
+incref(var42);
+var43 = 0LL;
+label44: (void)0;
+if (var43 >= var42->len) goto label46;
+var45 = var42->data[var43++];
+string_decref(var47);
+var47.buf = NULL;
+var47 = string7_new_f0fd7b2c4f; string_incref(var47);
+var48 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var48,var47);
+decref((var5), dtor_List_Str__43b70c06cb);
+var5 = var48;
+var48 = NULL;
+oomph_print(var45);
+if (oomph_true) goto label44;
+label46: (void)0;
+var49 = meth_List_Str__43b70c06cb_to_string(var5);
+oomph_print(var49);
+out: (void)0;
+string_decref(var49);
+decref((var48), dtor_List_Str__43b70c06cb);
+string_decref(var47);
+(void)0;
+decref((var42), dtor_List_Str__43b70c06cb);
+string_decref(var41);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var30), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+string_decref(var27);
+decref((var25), dtor_Box_1003ef4590);
+(void)0;
+decref((var22), dtor_List_Box__5bc5d84e38);
+decref((var21), dtor_Box_1003ef4590);
+string_decref(var20);
+decref((var19), dtor_Box_1003ef4590);
+string_decref(var18);
+decref((var17), dtor_Box_1003ef4590);
+string_decref(var16);
+string_decref(var15);
+(void)0;
+string_decref(var11);
+string_decref(var9);
+(void)0;
+decref((var6), dtor_List_Str__43b70c06cb);
+decref((var5), dtor_List_Str__43b70c06cb);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+}
@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_foreach_mutate_7da99c12df
+                #define HEADER_GUARD_foreach_mutate_7da99c12df
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Box_1003ef4590;
+struct class_List_Box__5bc5d84e38;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_Box_1003ef4590;
+struct class_Box_1003ef4590;
+struct class_Box_1003ef4590;
+struct class_List_Box__5bc5d84e38;
+struct class_Box_1003ef4590;
+struct class_List_Int__df8a64abf3;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+void foreach_mutate_7da99c12df_clear(struct class_List_Box__5bc5d84e38* var1);
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,117 @@
+#include <lib/oomph.h>
+#include "format_c0226beea0.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_World_aec67b0d6a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x57', '\x6f', '\x72', '\x6c', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string0_World_aec67b0d6a = {
+                .buf = &string0_World_aec67b0d6a_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_Hello_World__6f0484c8e0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x48', '\x65', '\x6c', '\x6c', '\x6f', '\x20', '\x57', '\x6f', '\x72', '\x6c', '\x64', '\x21' },
+                .malloced = false,
+            };
+            static struct class_Str string1_Hello_World__6f0484c8e0 = {
+                .buf = &string1_Hello_World__6f0484c8e0_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_1___2____e86ad46209_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x31', '\x20', '\x2b', '\x20', '\x32', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string2_1___2____e86ad46209 = {
+                .buf = &string2_1___2____e86ad46209_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_1_4____2b6c75e187_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x31', '\x2f', '\x34', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string3_1_4____2b6c75e187 = {
+                .buf = &string3_1_4____2b6c75e187_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_Is_0_1_0_2____0_3___83ddd72963_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x73', '\x20', '\x30', '\x2e', '\x31', '\x2b', '\x30', '\x2e', '\x32', '\x20', '\x3d', '\x3d', '\x20', '\x30', '\x2e', '\x33', '\x3f', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string4_Is_0_1_0_2____0_3___83ddd72963 = {
+                .buf = &string4_Is_0_1_0_2____0_3___83ddd72963_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+int64_t var4;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+double var8;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+bool var12;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+var1 = string0_World_aec67b0d6a; string_incref(var1);
+var2 = string1_Hello_World__6f0484c8e0; string_incref(var2);
+oomph_print(var2);
+var3 = string2_1___2____e86ad46209; string_incref(var3);
+var4 = 3LL;
+var5 = meth_Int_to_string(var4);
+var6 = oomph_string_concat(var3,var5);
+oomph_print(var6);
+var7 = string3_1_4____2b6c75e187; string_incref(var7);
+var8 = 0.25;
+var9 = meth_Float_to_string(var8);
+var10 = oomph_string_concat(var7,var9);
+oomph_print(var10);
+var11 = string4_Is_0_1_0_2____0_3___83ddd72963; string_incref(var11);
+var12 = oomph_false;
+var13 = meth_Bool_to_string(var12);
+var14 = oomph_string_concat(var11,var13);
+oomph_print(var14);
+out: (void)0;
+string_decref(var14);
+string_decref(var13);
+(void)0;
+string_decref(var11);
+string_decref(var10);
+string_decref(var9);
+(void)0;
+string_decref(var7);
+string_decref(var6);
+string_decref(var5);
+(void)0;
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+}
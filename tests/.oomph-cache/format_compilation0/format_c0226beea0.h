@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_format_c0226beea0
+                #define HEADER_GUARD_format_c0226beea0
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
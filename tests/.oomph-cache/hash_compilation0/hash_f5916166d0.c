@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "hash_f5916166d0.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_hash_1d0f330ece.h"
+
+            static struct StringBuf string0_hello_602de074d4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_hello_602de074d4 = {
+                .buf = &string0_hello_602de074d4_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+var1 = string0_hello_602de074d4; string_incref(var1);
+var2 = bundle_hash_1d0f330ece_md5(var1);
+oomph_print(var2);
+var3 = string0_hello_602de074d4; string_incref(var3);
+var4 = bundle_hash_1d0f330ece_sha1(var3);
+oomph_print(var4);
+var5 = string0_hello_602de074d4; string_incref(var5);
+var6 = bundle_hash_1d0f330ece_sha256(var5);
+oomph_print(var6);
+var7 = string0_hello_602de074d4; string_incref(var7);
+var8 = bundle_hash_1d0f330ece_sha512(var7);
+oomph_print(var8);
+out: (void)0;
+string_decref(var8);
+string_decref(var7);
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+}
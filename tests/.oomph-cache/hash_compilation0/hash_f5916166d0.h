@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_hash_f5916166d0
+                #define HEADER_GUARD_hash_f5916166d0
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_hash_1d0f330ece.h"
+void oomph_main(void);
+
+                #endif
+                
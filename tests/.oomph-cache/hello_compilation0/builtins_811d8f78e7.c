@@ -0,0 +1,761 @@
+#include <lib/oomph.h>
+#include "builtins_811d8f78e7.h"
+#include "List_Int__df8a64abf3.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_true_9123c4cf28_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string0_true_9123c4cf28 = {
+                .buf = &string0_true_9123c4cf28_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_false_65a729e328_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string1_false_65a729e328 = {
+                .buf = &string1_false_65a729e328_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2__6bcc1ff225_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string2__6bcc1ff225 = {
+                .buf = &string2__6bcc1ff225_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3___c2ccf02f4b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string3___c2ccf02f4b = {
+                .buf = &string3___c2ccf02f4b_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4___fb47c58fc0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string4___fb47c58fc0 = {
+                .buf = &string4___fb47c58fc0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            struct class_Str meth_Bool_to_string(bool var1){struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str retval;
+if (var1) goto label2;
+if (oomph_true) goto label3;
+label2: (void)0;
+var4 = string0_true_9123c4cf28; string_incref(var4);
+retval = var4; var4.buf = NULL;
+goto out;
+label3: (void)0;
+var5 = string1_false_65a729e328; string_incref(var5);
+retval = var5; var5.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var5);
+string_decref(var4);
+return retval;
+}struct class_List_Int__df8a64abf3* meth_Str_get_utf8(struct class_Str var1){struct class_List_Int__df8a64abf3* var2;
+var2 = NULL;
+int64_t var3;
+int64_t var4;
+int64_t var6;
+bool var7;
+bool var8;
+int64_t var10;
+int64_t var11;
+int64_t var12;
+struct class_List_Int__df8a64abf3* retval;
+var2 = ctor_List_Int__df8a64abf3();
+var3 = oomph_utf8_len(var1);
+meth_List_Int__df8a64abf3___reserve(var2,var3);
+var4 = 0LL;
+label5: (void)0;
+var6 = oomph_utf8_len(var1);
+var7 = oomph_int_gt(var6,var4);
+var8 = oomph_bool_not(var7);
+if (var8) goto label9;
+var10 = oomph_get_utf8_byte(var1,var4);
+meth_List_Int__df8a64abf3_push(var2,var10);
+var11 = 1LL;
+var12 = oomph_int_add(var4,var11);
+var4 = var12;
+if (oomph_true) goto label5;
+label9: (void)0;
+retval = var2; var2 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Int__df8a64abf3);
+return retval;
+}struct class_Str meth_Str_repeat(struct class_Str var1, int64_t var2){int64_t var3;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+int64_t var7;
+bool var8;
+bool var9;
+int64_t var11;
+int64_t var12;
+int64_t var13;
+bool var14;
+struct class_Str var17;
+var17.buf = NULL;
+double var18;
+double var19;
+double var20;
+int64_t var21;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str retval;
+var3 = var2;
+var4 = string2__6bcc1ff225; string_incref(var4);
+var5 = var1;
+string_incref(var5);
+label6: (void)0;
+var7 = 0LL;
+var8 = oomph_int_gt(var3,var7);
+var9 = oomph_bool_not(var8);
+if (var9) goto label10;
+var11 = 2LL;
+var12 = oomph_int_mod(var3,var11);
+var13 = 1LL;
+var14 = meth_Int_equals(var12,var13);
+if (var14) goto label15;
+if (oomph_true) goto label16;
+label15: (void)0;
+var17 = oomph_string_concat(var4,var5);
+string_decref(var4);
+var4 = var17;
+var17.buf = NULL;
+label16: (void)0;
+var18 = oomph_int2float(var3);
+var19 = 2.0;
+var20 = oomph_float_div(var18,var19);
+var21 = meth_Float_floor(var20);
+var3 = var21;
+var22 = oomph_string_concat(var5,var5);
+string_decref(var5);
+var5 = var22;
+var22.buf = NULL;
+if (oomph_true) goto label6;
+label10: (void)0;
+retval = var4; var4.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var22);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var17);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var5);
+string_decref(var4);
+(void)0;
+return retval;
+}bool meth_Str_starts_with(struct class_Str var1, struct class_Str var2){struct class_Str var3;
+var3.buf = NULL;
+bool var4;
+struct class_Str var6;
+var6.buf = NULL;
+bool var7;
+bool var8;
+bool var9;
+bool retval;
+var3 = string2__6bcc1ff225; string_incref(var3);
+var4 = meth_Str_equals(var2,var3);
+if (var4) goto label5;
+var6 = meth_Str_remove_prefix(var1,var2);
+var7 = meth_Str_equals(var6,var1);
+var8 = oomph_bool_not(var7);
+var9 = var8;
+if (oomph_true) goto label10;
+label5: (void)0;
+var9 = oomph_true;
+label10: (void)0;
+(void)0; retval = var9; goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var6);
+(void)0;
+string_decref(var3);
+return retval;
+}bool meth_Str_ends_with(struct class_Str var1, struct class_Str var2){struct class_Str var3;
+var3.buf = NULL;
+bool var4;
+struct class_Str var6;
+var6.buf = NULL;
+bool var7;
+bool var8;
+bool var9;
+bool retval;
+var3 = string2__6bcc1ff225; string_incref(var3);
+var4 = meth_Str_equals(var2,var3);
+if (var4) goto label5;
+var6 = meth_Str_remove_suffix(var1,var2);
+var7 = meth_Str_equals(var6,var1);
+var8 = oomph_bool_not(var7);
+var9 = var8;
+if (oomph_true) goto label10;
+label5: (void)0;
+var9 = oomph_true;
+label10: (void)0;
+(void)0; retval = var9; goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var6);
+(void)0;
+string_decref(var3);
+return retval;
+}bool meth_Str___contains(struct class_Str var1, struct class_Str var2){struct class_Str var3;
+var3.buf = NULL;
+bool var4;
+bool var6;
+struct class_Str var8;
+var8.buf = NULL;
+bool var9;
+struct class_Str var11;
+var11.buf = NULL;
+bool var12;
+bool var13;
+bool var14;
+bool retval;
+var3 = string2__6bcc1ff225; string_incref(var3);
+var4 = meth_Str_equals(var1,var3);
+if (var4) goto label5;
+var6 = oomph_false;
+if (oomph_true) goto label7;
+label5: (void)0;
+var8 = string2__6bcc1ff225; string_incref(var8);
+var9 = meth_Str_equals(var2,var8);
+var6 = var9;
+label7: (void)0;
+if (var6) goto label10;
+var11 = oomph_slice_until_substring(var1,var2);
+var12 = meth_Str_equals(var11,var1);
+var13 = oomph_bool_not(var12);
+var14 = var13;
+if (oomph_true) goto label15;
+label10: (void)0;
+var14 = oomph_true;
+label15: (void)0;
+(void)0; retval = var14; goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var11);
+(void)0;
+string_decref(var8);
+(void)0;
+(void)0;
+string_decref(var3);
+return retval;
+}struct class_Str meth_Str_left_pad(struct class_Str var1, int64_t var2, struct class_Str var3){int64_t var4;
+int64_t var5;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str retval;
+var4 = meth_Str_length(var1);
+var5 = oomph_int_sub(var2,var4);
+var6 = meth_Str_repeat(var3,var5);
+var7 = oomph_string_concat(var6,var1);
+retval = var7; var7.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var7);
+string_decref(var6);
+(void)0;
+(void)0;
+return retval;
+}struct class_Str meth_Str_right_pad(struct class_Str var1, int64_t var2, struct class_Str var3){int64_t var4;
+int64_t var5;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str retval;
+var4 = meth_Str_length(var1);
+var5 = oomph_int_sub(var2,var4);
+var6 = meth_Str_repeat(var3,var5);
+var7 = oomph_string_concat(var1,var6);
+retval = var7; var7.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var7);
+string_decref(var6);
+(void)0;
+(void)0;
+return retval;
+}struct class_Str meth_Str_center_pad(struct class_Str var1, int64_t var2, struct class_Str var3){int64_t var4;
+int64_t var5;
+double var6;
+double var7;
+double var8;
+int64_t var9;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str retval;
+var4 = meth_Str_length(var1);
+var5 = oomph_int_add(var4,var2);
+var6 = oomph_int2float(var5);
+var7 = 2.0;
+var8 = oomph_float_div(var6,var7);
+var9 = meth_Float_floor(var8);
+var10 = meth_Str_left_pad(var1,var9,var3);
+var11 = meth_Str_right_pad(var10,var2,var3);
+retval = var11; var11.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var11);
+string_decref(var10);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}int64_t meth_Str_count(struct class_Str var1, struct class_Str var2){struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+bool var5;
+int64_t var8;
+int64_t var9;
+int64_t var10;
+int64_t var11;
+struct class_Str var13;
+var13.buf = NULL;
+bool var14;
+int64_t var17;
+int64_t var18;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+int64_t retval;
+var3 = var1;
+string_incref(var3);
+var4 = string2__6bcc1ff225; string_incref(var4);
+var5 = meth_Str_equals(var2,var4);
+if (var5) goto label6;
+if (oomph_true) goto label7;
+label6: (void)0;
+var8 = meth_Str_length(var3);
+var9 = 1LL;
+var10 = oomph_int_sub(var8,var9);
+(void)0; retval = var10; goto out;
+label7: (void)0;
+var11 = 0LL;
+label12: (void)0;
+string_decref(var13);
+var13.buf = NULL;
+var13 = oomph_slice_until_substring(var3,var2);
+var14 = meth_Str_equals(var13,var3);
+if (var14) goto label15;
+if (oomph_true) goto label16;
+label15: (void)0;
+(void)0; retval = var11; goto out;
+label16: (void)0;
+var17 = 1LL;
+var18 = oomph_int_add(var11,var17);
+var11 = var18;
+string_decref(var19);
+var19.buf = NULL;
+var19 = meth_Str_remove_prefix(var3,var13);
+var20 = meth_Str_remove_prefix(var19,var2);
+string_decref(var3);
+var3 = var20;
+var20.buf = NULL;
+if (oomph_true) goto label12;
+out: (void)0;
+string_decref(var20);
+string_decref(var19);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var13);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var4);
+string_decref(var3);
+return retval;
+}struct class_Str meth_Str_left_trim(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+bool var5;
+struct class_Str var7;
+var7.buf = NULL;
+bool var8;
+bool var9;
+bool var11;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str retval;
+var2 = var1;
+string_incref(var2);
+label3: (void)0;
+string_decref(var4);
+var4.buf = NULL;
+var4 = string3___c2ccf02f4b; string_incref(var4);
+var5 = meth_Str_starts_with(var2,var4);
+if (var5) goto label6;
+string_decref(var7);
+var7.buf = NULL;
+var7 = string4___fb47c58fc0; string_incref(var7);
+var8 = meth_Str_starts_with(var2,var7);
+var9 = var8;
+if (oomph_true) goto label10;
+label6: (void)0;
+var9 = oomph_true;
+label10: (void)0;
+var11 = oomph_bool_not(var9);
+if (var11) goto label12;
+string_decref(var13);
+var13.buf = NULL;
+var13 = string3___c2ccf02f4b; string_incref(var13);
+string_decref(var14);
+var14.buf = NULL;
+var14 = meth_Str_remove_prefix(var2,var13);
+string_decref(var15);
+var15.buf = NULL;
+var15 = string4___fb47c58fc0; string_incref(var15);
+var16 = meth_Str_remove_prefix(var14,var15);
+string_decref(var2);
+var2 = var16;
+var16.buf = NULL;
+if (oomph_true) goto label3;
+label12: (void)0;
+retval = var2; var2.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var16);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var7);
+(void)0;
+string_decref(var4);
+string_decref(var2);
+return retval;
+}struct class_Str meth_Str_right_trim(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+bool var5;
+struct class_Str var7;
+var7.buf = NULL;
+bool var8;
+bool var9;
+bool var11;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str retval;
+var2 = var1;
+string_incref(var2);
+label3: (void)0;
+string_decref(var4);
+var4.buf = NULL;
+var4 = string3___c2ccf02f4b; string_incref(var4);
+var5 = meth_Str_ends_with(var2,var4);
+if (var5) goto label6;
+string_decref(var7);
+var7.buf = NULL;
+var7 = string4___fb47c58fc0; string_incref(var7);
+var8 = meth_Str_ends_with(var2,var7);
+var9 = var8;
+if (oomph_true) goto label10;
+label6: (void)0;
+var9 = oomph_true;
+label10: (void)0;
+var11 = oomph_bool_not(var9);
+if (var11) goto label12;
+string_decref(var13);
+var13.buf = NULL;
+var13 = string3___c2ccf02f4b; string_incref(var13);
+string_decref(var14);
+var14.buf = NULL;
+var14 = meth_Str_remove_suffix(var2,var13);
+string_decref(var15);
+var15.buf = NULL;
+var15 = string4___fb47c58fc0; string_incref(var15);
+var16 = meth_Str_remove_suffix(var14,var15);
+string_decref(var2);
+var2 = var16;
+var16.buf = NULL;
+if (oomph_true) goto label3;
+label12: (void)0;
+retval = var2; var2.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var16);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var7);
+(void)0;
+string_decref(var4);
+string_decref(var2);
+return retval;
+}struct class_Str meth_Str_trim(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str retval;
+var2 = meth_Str_left_trim(var1);
+var3 = meth_Str_right_trim(var2);
+retval = var3; var3.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var3);
+string_decref(var2);
+return retval;
+}struct class_Str meth_Str_replace(struct class_Str var1, struct class_Str var2, struct class_Str var3){struct class_List_Str__43b70c06cb* var4;
+var4 = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str retval;
+var4 = meth_Str_split(var1,var2);
+var5 = meth_List_Str__43b70c06cb_join(var4,var3);
+retval = var5; var5.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var5);
+decref((var4), dtor_List_Str__43b70c06cb);
+return retval;
+}struct class_List_Str__43b70c06cb* meth_Str_split(struct class_Str var1, struct class_Str var2){struct class_Str var3;
+var3.buf = NULL;
+struct class_List_Str__43b70c06cb* var4;
+var4 = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+bool var6;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+bool var12;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+bool var18;
+bool var19;
+bool var20;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_List_Str__43b70c06cb* retval;
+var3 = var1;
+string_incref(var3);
+var4 = ctor_List_Str__43b70c06cb();
+var5 = string2__6bcc1ff225; string_incref(var5);
+var6 = meth_Str_equals(var2,var5);
+if (var6) goto label7;
+label8: (void)0;
+string_decref(var9);
+var9.buf = NULL;
+var9 = oomph_slice_until_substring(var3,var2);
+meth_List_Str__43b70c06cb_push(var4,var9);
+var10 = meth_Str_remove_prefix(var3,var9);
+string_decref(var3);
+var3 = var10;
+var10.buf = NULL;
+string_decref(var11);
+var11.buf = NULL;
+var11 = string2__6bcc1ff225; string_incref(var11);
+var12 = meth_Str_equals(var3,var11);
+if (var12) goto label13;
+if (oomph_true) goto label14;
+label13: (void)0;
+retval = var4; var4 = NULL;
+goto out;
+label14: (void)0;
+var15 = meth_Str_remove_prefix(var3,var2);
+string_decref(var3);
+var3 = var15;
+var15.buf = NULL;
+if (oomph_true) goto label8;
+label7: (void)0;
+label16: (void)0;
+string_decref(var17);
+var17.buf = NULL;
+var17 = string2__6bcc1ff225; string_incref(var17);
+var18 = meth_Str_equals(var3,var17);
+var19 = oomph_bool_not(var18);
+var20 = oomph_bool_not(var19);
+if (var20) goto label21;
+string_decref(var22);
+var22.buf = NULL;
+var22 = oomph_get_first_char(var3);
+meth_List_Str__43b70c06cb_push(var4,var22);
+string_decref(var23);
+var23.buf = NULL;
+var23 = meth_List_Str__43b70c06cb_last(var4);
+var24 = meth_Str_remove_prefix(var3,var23);
+string_decref(var3);
+var3 = var24;
+var24.buf = NULL;
+if (oomph_true) goto label16;
+label21: (void)0;
+retval = var4; var4 = NULL;
+goto out;
+out: (void)0;
+string_decref(var24);
+string_decref(var23);
+string_decref(var22);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var17);
+string_decref(var15);
+(void)0;
+string_decref(var11);
+string_decref(var10);
+string_decref(var9);
+(void)0;
+string_decref(var5);
+decref((var4), dtor_List_Str__43b70c06cb);
+string_decref(var3);
+return retval;
+}struct class_Str meth_List_Str_join(struct class_List_Str__43b70c06cb* var1, struct class_Str var2){struct class_List_Str__43b70c06cb* var3;
+var3 = NULL;
+bool var4;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+int64_t var9;
+int64_t var11;
+bool var12;
+bool var13;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+int64_t var18;
+int64_t var19;
+struct class_Str retval;
+var3 = ctor_List_Str__43b70c06cb();
+var4 = meth_List_Str__43b70c06cb_equals(var1,var3);
+if (var4) goto label5;
+if (oomph_true) goto label6;
+label5: (void)0;
+var7 = string2__6bcc1ff225; string_incref(var7);
+retval = var7; var7.buf = NULL;
+goto out;
+label6: (void)0;
+var8 = meth_List_Str__43b70c06cb_first(var1);
+var9 = 1LL;
+label10: (void)0;
+var11 = meth_List_Str__43b70c06cb_length(var1);
+var12 = oomph_int_gt(var11,var9);
+var13 = oomph_bool_not(var12);
+if (var13) goto label14;
+string_decref(var15);
+var15.buf = NULL;
+var15 = oomph_string_concat(var8,var2);
+string_decref(var16);
+var16.buf = NULL;
+var16 = meth_List_Str__43b70c06cb_get(var1,var9);
+var17 = oomph_string_concat(var15,var16);
+string_decref(var8);
+var8 = var17;
+var17.buf = NULL;
+var18 = 1LL;
+var19 = oomph_int_add(var9,var18);
+var9 = var19;
+if (oomph_true) goto label10;
+label14: (void)0;
+retval = var8; var8.buf = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+string_decref(var17);
+string_decref(var16);
+string_decref(var15);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var8);
+string_decref(var7);
+(void)0;
+decref((var3), dtor_List_Str__43b70c06cb);
+return retval;
+}
@@ -0,0 +1,21 @@
+#include <lib/oomph.h>
+#include "hello_8713d30cbf.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_hello_a35db06286_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_hello_a35db06286 = {
+                .buf = &string0_hello_a35db06286_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+var1 = string0_hello_a35db06286; string_incref(var1);
+oomph_print(var1);
+out: (void)0;
+string_decref(var1);
+}
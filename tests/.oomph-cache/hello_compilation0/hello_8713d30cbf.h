@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_hello_8713d30cbf
+                #define HEADER_GUARD_hello_8713d30cbf
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
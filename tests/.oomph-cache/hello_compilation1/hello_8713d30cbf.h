@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_hello_8713d30cbf
+                #define HEADER_GUARD_hello_8713d30cbf
+                #include <lib/oomph.h>
+#include "builtins_811d8f78e7.h"
+void oomph_main(void);
+
+                #endif
+                
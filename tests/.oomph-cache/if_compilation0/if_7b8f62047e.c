@@ -0,0 +1,18 @@
+#include <lib/oomph.h>
+#include "if_7b8f62047e.h"
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void){int64_t var2;
+struct class_Str var3;
+var3.buf = NULL;
+if (oomph_true) goto label1;
+label1: (void)0;
+var2 = 123LL;
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+label4: (void)0;
+if (oomph_true) goto label5;
+label5: (void)0;
+out: (void)0;
+string_decref(var3);
+(void)0;
+}
@@ -0,0 +1,27 @@
+#include <lib/oomph.h>
+#include "implicit_float_convert_37acafa388.h"
+#include "bundle_builtins_c399a735f1.h"
+void implicit_float_convert_37acafa388_foo(double var1){struct class_Str var2;
+var2.buf = NULL;
+var2 = meth_Float_to_string(var1);
+oomph_print(var2);
+out: (void)0;
+string_decref(var2);
+}void oomph_main(void){double var1;
+double var2;
+double var3;
+struct class_Str var4;
+var4.buf = NULL;
+var1 = 123.0;
+implicit_float_convert_37acafa388_foo(var1);
+var2 = 1.23;
+var3 = 45.0;
+var2 = var3;
+var4 = meth_Float_to_string(var2);
+oomph_print(var4);
+out: (void)0;
+string_decref(var4);
+(void)0;
+(void)0;
+(void)0;
+}
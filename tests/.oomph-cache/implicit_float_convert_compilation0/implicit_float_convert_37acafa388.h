@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_implicit_float_convert_37acafa388
+                #define HEADER_GUARD_implicit_float_convert_37acafa388
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void implicit_float_convert_37acafa388_foo(double var1);
+void oomph_main(void);
+
+                #endif
+                
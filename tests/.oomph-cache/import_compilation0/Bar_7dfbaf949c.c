@@ -0,0 +1,124 @@
+#include <lib/oomph.h>
+#include "Bar_7dfbaf949c.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Str__5eca9cec4f.h"
+
+            static struct StringBuf string0_Bar_ff1e9541c5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Bar_ff1e9541c5 = {
+                .buf = &string0_Bar_ff1e9541c5_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_Lol__88f50d30a8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x6c', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string1_Lol__88f50d30a8 = {
+                .buf = &string1_Lol__88f50d30a8_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2___d53b5b62f4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string2___d53b5b62f4 = {
+                .buf = &string2___d53b5b62f4_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            struct class_Bar_7dfbaf949c* ctor_Bar_7dfbaf949c(int64_t arg_thing,struct class__null___Str__5eca9cec4f arg_optional_thing)
+            {
+                struct class_Bar_7dfbaf949c* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_thing = arg_thing;
+obj->memb_optional_thing = arg_optional_thing;
+
+                (void)0;
+incref__null___Str__5eca9cec4f(arg_optional_thing);
+
+                return obj;
+            }
+
+            void dtor_Bar_7dfbaf949c(void *ptr)
+            {
+                struct class_Bar_7dfbaf949c *obj = ptr;
+                (void)0;
+decref__null___Str__5eca9cec4f(obj->memb_optional_thing);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Bar_7dfbaf949c_to_string(struct class_Bar_7dfbaf949c* self)
+                {
+                    struct class_Str res = string0_Bar_ff1e9541c5;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_thing);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__null___Str__5eca9cec4f_to_string(self->memb_optional_thing);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Bar_7dfbaf949c_equals(struct class_Bar_7dfbaf949c* var1, struct class_Bar_7dfbaf949c* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}void meth_Bar_7dfbaf949c_lol(struct class_Bar_7dfbaf949c* var1){struct class_Str var2;
+var2.buf = NULL;
+int64_t var3;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class__null___Str__5eca9cec4f var8;
+var8.membernum = -1;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+var2 = string1_Lol__88f50d30a8; string_incref(var2);
+var3 = var1->memb_thing;
+var4 = meth_Int_to_string(var3);
+var5 = oomph_string_concat(var2,var4);
+var6 = string2___d53b5b62f4; string_incref(var6);
+var7 = oomph_string_concat(var5,var6);
+var8 = var1->memb_optional_thing;
+incref__null___Str__5eca9cec4f(var8);
+var9 = meth__null___Str__5eca9cec4f_to_string(var8);
+var10 = oomph_string_concat(var7,var9);
+oomph_print(var10);
+out: (void)0;
+string_decref(var10);
+string_decref(var9);
+decref__null___Str__5eca9cec4f(var8);
+string_decref(var7);
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+(void)0;
+string_decref(var2);
+}
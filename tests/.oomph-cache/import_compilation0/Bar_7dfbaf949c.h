@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_Bar_7dfbaf949c
+                #define HEADER_GUARD_Bar_7dfbaf949c
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Str__5eca9cec4f.h"
+
+            struct class_Bar_7dfbaf949c {
+                REFCOUNT_HEADER
+                int64_t memb_thing;
+struct class__null___Str__5eca9cec4f memb_optional_thing;
+
+            };
+            
+            struct class_Bar_7dfbaf949c* ctor_Bar_7dfbaf949c(int64_t arg_thing,struct class__null___Str__5eca9cec4f arg_optional_thing);
+            void dtor_Bar_7dfbaf949c(void *ptr);
+            
+                struct class_Str meth_Bar_7dfbaf949c_to_string(struct class_Bar_7dfbaf949c* obj);
+                bool meth_Bar_7dfbaf949c_equals(struct class_Bar_7dfbaf949c* var1, struct class_Bar_7dfbaf949c* var2);
+void meth_Bar_7dfbaf949c_lol(struct class_Bar_7dfbaf949c* var1);
+
+                #endif
+                
@@ -0,0 +1,100 @@
+#include <lib/oomph.h>
+#include "FooBar_5d1d371a89.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_7dfbaf949c.h"
+#include "Foo_441fa4257f.h"
+
+            static struct StringBuf string0_FooBar_e230a981df_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x42', '\x61', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_FooBar_e230a981df = {
+                .buf = &string0_FooBar_e230a981df_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_FooBar_5d1d371a89_to_string(struct class_FooBar_5d1d371a89 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_Bar_7dfbaf949c_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Foo_441fa4257f_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_FooBar_e230a981df), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_FooBar_e230a981df;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_FooBar_5d1d371a89_equals(struct class_FooBar_5d1d371a89 a, struct class_FooBar_5d1d371a89 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_Bar_7dfbaf949c_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Foo_441fa4257f_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_FooBar_e230a981df), (int)a.membernum);
+                }
+            }
+            
+            void incref_FooBar_5d1d371a89(struct class_FooBar_5d1d371a89 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_FooBar_5d1d371a89(struct class_FooBar_5d1d371a89 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_Bar_7dfbaf949c);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_Foo_441fa4257f);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_FooBar_5d1d371a89
+                #define HEADER_GUARD_FooBar_5d1d371a89
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Bar_7dfbaf949c;
+struct class_Foo_441fa4257f;
+
+            struct class_FooBar_5d1d371a89 {
+                union {
+                    	struct class_Bar_7dfbaf949c* item0;
+	struct class_Foo_441fa4257f* item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_FooBar_5d1d371a89_to_string(struct class_FooBar_5d1d371a89 obj);
+            bool meth_FooBar_5d1d371a89_equals(struct class_FooBar_5d1d371a89 a, struct class_FooBar_5d1d371a89 b);
+            
+            void incref_FooBar_5d1d371a89(struct class_FooBar_5d1d371a89 obj);
+            void decref_FooBar_5d1d371a89(struct class_FooBar_5d1d371a89 obj);
+            
+                #endif
+                
@@ -0,0 +1,49 @@
+#include <lib/oomph.h>
+#include "Foo_441fa4257f.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo_ab3ed55db2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_ab3ed55db2 = {
+                .buf = &string0_Foo_ab3ed55db2_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Foo_441fa4257f* ctor_Foo_441fa4257f(void)
+            {
+                struct class_Foo_441fa4257f* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_Foo_441fa4257f(void *ptr)
+            {
+                struct class_Foo_441fa4257f *obj = ptr;
+                
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo_441fa4257f_to_string(struct class_Foo_441fa4257f* self)
+                {
+                    struct class_Str res = string0_Foo_ab3ed55db2;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_441fa4257f_equals(struct class_Foo_441fa4257f* var1, struct class_Foo_441fa4257f* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
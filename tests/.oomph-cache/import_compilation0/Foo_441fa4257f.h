@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Foo_441fa4257f
+                #define HEADER_GUARD_Foo_441fa4257f
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_441fa4257f {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Foo_441fa4257f* ctor_Foo_441fa4257f(void);
+            void dtor_Foo_441fa4257f(void *ptr);
+            
+                struct class_Str meth_Foo_441fa4257f_to_string(struct class_Foo_441fa4257f* obj);
+                bool meth_Foo_441fa4257f_equals(struct class_Foo_441fa4257f* var1, struct class_Foo_441fa4257f* var2);
+
+                #endif
+                
@@ -0,0 +1,107 @@
+#include <lib/oomph.h>
+#include "_null___Str__5eca9cec4f.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0__null___Str__f07477f0fa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x6e', '\x75', '\x6c', '\x6c', '\x20', '\x7c', '\x20', '\x53', '\x74', '\x72', '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string0__null___Str__f07477f0fa = {
+                .buf = &string0__null___Str__f07477f0fa_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            struct class_Str meth__null___Str__5eca9cec4f_to_string(struct class__null___Str__5eca9cec4f obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_null_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Str_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__null___Str__f07477f0fa), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0__null___Str__f07477f0fa;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth__null___Str__5eca9cec4f_equals(struct class__null___Str__5eca9cec4f a, struct class__null___Str__5eca9cec4f b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_null_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Str_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__null___Str__f07477f0fa), (int)a.membernum);
+                }
+            }
+            
+            void incref__null___Str__5eca9cec4f(struct class__null___Str__5eca9cec4f obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    string_incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref__null___Str__5eca9cec4f(struct class__null___Str__5eca9cec4f obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    string_decref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
+                struct class_Str meth__null___Str__5eca9cec4f_get(struct class__null___Str__5eca9cec4f obj)
+                {
+                    if (obj.membernum == 0)
+                        panic_printf("Error: null.get() was called");
+                    assert(obj.membernum == 1);
+                    string_incref(obj.val.item1);
+                    return obj.val.item1;
+                }
+                
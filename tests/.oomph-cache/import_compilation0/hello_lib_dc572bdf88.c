@@ -0,0 +1,21 @@
+#include <lib/oomph.h>
+#include "hello_lib_dc572bdf88.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_hello_3d1304860e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_hello_3d1304860e = {
+                .buf = &string0_hello_3d1304860e_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            void hello_lib_dc572bdf88_print_hello(void){struct class_Str var1;
+var1.buf = NULL;
+var1 = string0_hello_3d1304860e; string_incref(var1);
+oomph_print(var1);
+out: (void)0;
+string_decref(var1);
+}
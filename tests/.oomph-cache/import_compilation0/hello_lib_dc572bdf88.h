@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_hello_lib_dc572bdf88
+                #define HEADER_GUARD_hello_lib_dc572bdf88
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void hello_lib_dc572bdf88_print_hello(void);
+
+                #endif
+                
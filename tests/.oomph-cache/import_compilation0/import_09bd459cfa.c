@@ -0,0 +1,159 @@
+#include <lib/oomph.h>
+#include "import_09bd459cfa.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_7dfbaf949c.h"
+#include "FooBar_5d1d371a89.h"
+#include "Foo_441fa4257f.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "hello_lib_dc572bdf88.h"
+
+            static struct StringBuf string0_lol_d7258b46ef_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_lol_d7258b46ef = {
+                .buf = &string0_lol_d7258b46ef_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_Foo_from_switch___c744255fe9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x20', '\x66', '\x72', '\x6f', '\x6d', '\x20', '\x73', '\x77', '\x69', '\x74', '\x63', '\x68', '\x3a', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string1_Foo_from_switch___c744255fe9 = {
+                .buf = &string1_Foo_from_switch___c744255fe9_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_Bar_from_switch___ecdaf93176_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x72', '\x20', '\x66', '\x72', '\x6f', '\x6d', '\x20', '\x73', '\x77', '\x69', '\x74', '\x63', '\x68', '\x3a', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string2_Bar_from_switch___ecdaf93176 = {
+                .buf = &string2_Bar_from_switch___ecdaf93176_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            void oomph_main(void){int64_t var1;
+struct class_Str var2;
+var2.buf = NULL;
+struct class__null___Str__5eca9cec4f var3;
+var3.membernum = -1;
+struct class_Bar_7dfbaf949c* var4;
+var4 = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+int64_t var6;
+struct class_Str var7;
+var7.buf = NULL;
+struct class__null___Str__5eca9cec4f var8;
+var8.membernum = -1;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_FooBar_5d1d371a89 var10;
+var10.membernum = -1;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_FooBar_5d1d371a89 var12;
+var12.membernum = -1;
+bool var13;
+struct class_Foo_441fa4257f* var16;
+var16 = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Bar_7dfbaf949c* var21;
+var21 = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+hello_lib_dc572bdf88_print_hello();
+var1 = 123LL;
+var2 = string0_lol_d7258b46ef; string_incref(var2);
+var3 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var2 }, .membernum = 1 };
+var2.buf = NULL;
+var4 = ctor_Bar_7dfbaf949c(var1,var3);
+var5 = meth_Bar_7dfbaf949c_to_string(var4);
+oomph_print(var5);
+var6 = var4->memb_thing;
+var7 = meth_Int_to_string(var6);
+oomph_print(var7);
+var8 = var4->memb_optional_thing;
+incref__null___Str__5eca9cec4f(var8);
+var9 = meth__null___Str__5eca9cec4f_to_string(var8);
+oomph_print(var9);
+meth_Bar_7dfbaf949c_lol(var4);
+var10 = (struct class_FooBar_5d1d371a89){ .val = { .item0 = var4 }, .membernum = 0 };
+incref(var4);
+var11 = meth_FooBar_5d1d371a89_to_string(var10);
+oomph_print(var11);
+var12 = (struct class_FooBar_5d1d371a89){ .val = { .item0 = var4 }, .membernum = 0 };
+var4 = NULL;
+
+            var13 = (
+                var12.membernum == 1
+            );
+            if (var13) goto label14;
+
+            var13 = (
+                var12.membernum == 0
+            );
+            if (var13) goto label15;
+label14: (void)0;
+
+            if (var12.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var16 = var12.val.item1;
+            incref(var16);
+var17 = string1_Foo_from_switch___c744255fe9; string_incref(var17);
+var18 = meth_Foo_441fa4257f_to_string(var16);
+var19 = oomph_string_concat(var17,var18);
+oomph_print(var19);
+if (oomph_true) goto label20;
+label15: (void)0;
+
+            if (var12.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var21 = var12.val.item0;
+            incref(var21);
+var22 = string2_Bar_from_switch___ecdaf93176; string_incref(var22);
+var23 = meth_Bar_7dfbaf949c_to_string(var21);
+var24 = oomph_string_concat(var22,var23);
+oomph_print(var24);
+label20: (void)0;
+out: (void)0;
+string_decref(var24);
+string_decref(var23);
+string_decref(var22);
+decref((var21), dtor_Bar_7dfbaf949c);
+string_decref(var19);
+string_decref(var18);
+string_decref(var17);
+decref((var16), dtor_Foo_441fa4257f);
+(void)0;
+decref_FooBar_5d1d371a89(var12);
+string_decref(var11);
+decref_FooBar_5d1d371a89(var10);
+string_decref(var9);
+decref__null___Str__5eca9cec4f(var8);
+string_decref(var7);
+(void)0;
+string_decref(var5);
+decref((var4), dtor_Bar_7dfbaf949c);
+decref__null___Str__5eca9cec4f(var3);
+string_decref(var2);
+(void)0;
+}
@@ -0,0 +1,15 @@
+
+                #ifndef HEADER_GUARD_import_09bd459cfa
+                #define HEADER_GUARD_import_09bd459cfa
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "FooBar_5d1d371a89.h"
+#include "_null___Str__5eca9cec4f.h"
+#include "hello_lib_dc572bdf88.h"
+struct class_Bar_7dfbaf949c;
+struct class_Foo_441fa4257f;
+struct class_Bar_7dfbaf949c;
+void oomph_main(void);
+
+                #endif
+                
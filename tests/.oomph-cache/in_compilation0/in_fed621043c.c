@@ -0,0 +1,136 @@
+#include <lib/oomph.h>
+#include "in_fed621043c.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Int__df8a64abf3.h"
+void oomph_main(void){int64_t var1;
+int64_t var2;
+struct class_List_Int__df8a64abf3* var3;
+var3 = NULL;
+bool var4;
+struct class_Str var5;
+var5.buf = NULL;
+int64_t var6;
+int64_t var7;
+struct class_List_Int__df8a64abf3* var8;
+var8 = NULL;
+bool var9;
+struct class_Str var10;
+var10.buf = NULL;
+int64_t var12;
+struct class_List_Int__df8a64abf3* var13;
+var13 = NULL;
+bool var14;
+bool var15;
+bool var16;
+struct class_Str var18;
+var18.buf = NULL;
+int64_t var19;
+int64_t var20;
+struct class_List_Int__df8a64abf3* var21;
+var21 = NULL;
+bool var22;
+bool var23;
+struct class_Str var24;
+var24.buf = NULL;
+int64_t var25;
+int64_t var26;
+struct class_List_Int__df8a64abf3* var27;
+var27 = NULL;
+bool var28;
+bool var29;
+struct class_Str var30;
+var30.buf = NULL;
+int64_t var32;
+struct class_List_Int__df8a64abf3* var33;
+var33 = NULL;
+bool var34;
+bool var35;
+bool var36;
+struct class_Str var38;
+var38.buf = NULL;
+var1 = 1LL;
+var2 = 2LL;
+var3 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var3,var2);
+var4 = meth_List_Int__df8a64abf3___contains(var3,var1);
+var5 = meth_Bool_to_string(var4);
+oomph_print(var5);
+var6 = 2LL;
+var7 = 2LL;
+var8 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var8,var7);
+var9 = meth_List_Int__df8a64abf3___contains(var8,var6);
+var10 = meth_Bool_to_string(var9);
+oomph_print(var10);
+if (oomph_true) goto label11;
+label11: (void)0;
+var12 = 3LL;
+var13 = ctor_List_Int__df8a64abf3();
+var14 = meth_List_Int__df8a64abf3___contains(var13,var12);
+var15 = oomph_bool_not(var14);
+var16 = var15;
+label17: (void)0;
+var18 = meth_Bool_to_string(var16);
+oomph_print(var18);
+var19 = 1LL;
+var20 = 2LL;
+var21 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var21,var20);
+var22 = meth_List_Int__df8a64abf3___contains(var21,var19);
+var23 = oomph_bool_not(var22);
+var24 = meth_Bool_to_string(var23);
+oomph_print(var24);
+var25 = 2LL;
+var26 = 2LL;
+var27 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var27,var26);
+var28 = meth_List_Int__df8a64abf3___contains(var27,var25);
+var29 = oomph_bool_not(var28);
+var30 = meth_Bool_to_string(var29);
+oomph_print(var30);
+if (oomph_true) goto label31;
+label31: (void)0;
+var32 = 3LL;
+var33 = ctor_List_Int__df8a64abf3();
+var34 = meth_List_Int__df8a64abf3___contains(var33,var32);
+var35 = oomph_bool_not(var34);
+var36 = var35;
+label37: (void)0;
+var38 = meth_Bool_to_string(var36);
+oomph_print(var38);
+out: (void)0;
+string_decref(var38);
+(void)0;
+(void)0;
+(void)0;
+decref((var33), dtor_List_Int__df8a64abf3);
+(void)0;
+string_decref(var30);
+(void)0;
+(void)0;
+decref((var27), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+string_decref(var24);
+(void)0;
+(void)0;
+decref((var21), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+string_decref(var18);
+(void)0;
+(void)0;
+(void)0;
+decref((var13), dtor_List_Int__df8a64abf3);
+(void)0;
+string_decref(var10);
+(void)0;
+decref((var8), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+string_decref(var5);
+(void)0;
+decref((var3), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+}
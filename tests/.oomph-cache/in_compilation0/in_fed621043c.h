@@ -0,0 +1,15 @@
+
+                #ifndef HEADER_GUARD_in_fed621043c
+                #define HEADER_GUARD_in_fed621043c
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,142 @@
+#include <lib/oomph.h>
+#include "insert_9fb2cb2cfe.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_a_f64f30d9e7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string0_a_f64f30d9e7 = {
+                .buf = &string0_a_f64f30d9e7_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_b_ccb689bda9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string1_b_ccb689bda9 = {
+                .buf = &string1_b_ccb689bda9_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_c_acca1d22ed_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string2_c_acca1d22ed = {
+                .buf = &string2_c_acca1d22ed_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_d_3dfc226f06_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string3_d_3dfc226f06 = {
+                .buf = &string3_d_3dfc226f06_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_e_fc3be093a5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string4_e_fc3be093a5 = {
+                .buf = &string4_e_fc3be093a5_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_beginning_75f2a7c0ed_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x65', '\x67', '\x69', '\x6e', '\x6e', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string5_beginning_75f2a7c0ed = {
+                .buf = &string5_beginning_75f2a7c0ed_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6_end_914f3b6039_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x6e', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string6_end_914f3b6039 = {
+                .buf = &string6_end_914f3b6039_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_List_Str__43b70c06cb* var3;
+var3 = NULL;
+int64_t var4;
+struct class_Str var5;
+var5.buf = NULL;
+int64_t var6;
+struct class_Str var7;
+var7.buf = NULL;
+int64_t var8;
+struct class_Str var9;
+var9.buf = NULL;
+int64_t var10;
+struct class_Str var11;
+var11.buf = NULL;
+int64_t var12;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+var1 = string0_a_f64f30d9e7; string_incref(var1);
+var2 = string1_b_ccb689bda9; string_incref(var2);
+var3 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var3,var1);
+meth_List_Str__43b70c06cb_push(var3,var2);
+var4 = 0LL;
+var5 = string2_c_acca1d22ed; string_incref(var5);
+meth_List_Str__43b70c06cb_insert(var3,var4,var5);
+var6 = 3LL;
+var7 = string3_d_3dfc226f06; string_incref(var7);
+meth_List_Str__43b70c06cb_insert(var3,var6,var7);
+var8 = 1LL;
+var9 = string4_e_fc3be093a5; string_incref(var9);
+meth_List_Str__43b70c06cb_insert(var3,var8,var9);
+var10 = -2LL;
+var11 = string5_beginning_75f2a7c0ed; string_incref(var11);
+meth_List_Str__43b70c06cb_insert(var3,var10,var11);
+var12 = 69LL;
+var13 = string6_end_914f3b6039; string_incref(var13);
+meth_List_Str__43b70c06cb_insert(var3,var12,var13);
+var14 = meth_List_Str__43b70c06cb_to_string(var3);
+oomph_print(var14);
+out: (void)0;
+string_decref(var14);
+string_decref(var13);
+(void)0;
+string_decref(var11);
+(void)0;
+string_decref(var9);
+(void)0;
+string_decref(var7);
+(void)0;
+string_decref(var5);
+(void)0;
+decref((var3), dtor_List_Str__43b70c06cb);
+string_decref(var2);
+string_decref(var1);
+}
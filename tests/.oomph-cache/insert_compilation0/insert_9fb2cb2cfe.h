@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_insert_9fb2cb2cfe
+                #define HEADER_GUARD_insert_9fb2cb2cfe
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Str__43b70c06cb;
+void oomph_main(void);
+
+                #endif
+                
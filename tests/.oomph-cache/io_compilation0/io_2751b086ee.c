@@ -0,0 +1,114 @@
+#include <lib/oomph.h>
+#include "io_2751b086ee.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+#include "bundle_io_45f5b8a585.h"
+
+            static struct StringBuf string0_README_md_9a35bb5812_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x52', '\x45', '\x41', '\x44', '\x4d', '\x45', '\x2e', '\x6d', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string0_README_md_9a35bb5812 = {
+                .buf = &string0_README_md_9a35bb5812_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1___707538ee3d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string1___707538ee3d = {
+                .buf = &string1___707538ee3d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_test_out_io_testing_dir_e60c0b4b68_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x5f', '\x6f', '\x75', '\x74', '\x2f', '\x69', '\x6f', '\x5f', '\x74', '\x65', '\x73', '\x74', '\x69', '\x6e', '\x67', '\x5f', '\x64', '\x69', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string2_test_out_io_testing_dir_e60c0b4b68 = {
+                .buf = &string2_test_out_io_testing_dir_e60c0b4b68_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_test_out_io_testing_dir_hello_txt_5a991c7a61_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x5f', '\x6f', '\x75', '\x74', '\x2f', '\x69', '\x6f', '\x5f', '\x74', '\x65', '\x73', '\x74', '\x69', '\x6e', '\x67', '\x5f', '\x64', '\x69', '\x72', '\x2f', '\x68', '\x65', '\x6c', '\x6c', '\x6f', '\x2e', '\x74', '\x78', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string3_test_out_io_testing_dir_hello_txt_5a991c7a61 = {
+                .buf = &string3_test_out_io_testing_dir_hello_txt_5a991c7a61_buf,
+                .nbytes = 33,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_Hello_Files_5297985729_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x48', '\x65', '\x6c', '\x6c', '\x6f', '\x20', '\x46', '\x69', '\x6c', '\x65', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string4_Hello_Files_5297985729 = {
+                .buf = &string4_Hello_Files_5297985729_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_List_Str__43b70c06cb* var4;
+var4 = NULL;
+int64_t var5;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+var1 = string0_README_md_9a35bb5812; string_incref(var1);
+var2 = bundle_io_45f5b8a585_read_file(var1);
+var3 = string1___707538ee3d; string_incref(var3);
+var4 = meth_Str_split(var2,var3);
+var5 = 0LL;
+var6 = meth_List_Str__43b70c06cb_get(var4,var5);
+oomph_print(var6);
+var7 = string2_test_out_io_testing_dir_e60c0b4b68; string_incref(var7);
+bundle_io_45f5b8a585_mkdir(var7);
+var8 = string2_test_out_io_testing_dir_e60c0b4b68; string_incref(var8);
+bundle_io_45f5b8a585_mkdir(var8);
+var9 = string3_test_out_io_testing_dir_hello_txt_5a991c7a61; string_incref(var9);
+var10 = string4_Hello_Files_5297985729; string_incref(var10);
+bundle_io_45f5b8a585_write_file(var9,var10);
+var11 = string3_test_out_io_testing_dir_hello_txt_5a991c7a61; string_incref(var11);
+var12 = bundle_io_45f5b8a585_read_file(var11);
+oomph_print(var12);
+out: (void)0;
+string_decref(var12);
+string_decref(var11);
+string_decref(var10);
+string_decref(var9);
+string_decref(var8);
+string_decref(var7);
+string_decref(var6);
+(void)0;
+decref((var4), dtor_List_Str__43b70c06cb);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+}
@@ -0,0 +1,11 @@
+
+                #ifndef HEADER_GUARD_io_2751b086ee
+                #define HEADER_GUARD_io_2751b086ee
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_io_45f5b8a585.h"
+struct class_List_Str__43b70c06cb;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,314 @@
+#include <lib/oomph.h>
+#include "join_and_split_0063427ac1.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_hello_world_a919723c0f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f', '\x20', '\x77', '\x6f', '\x72', '\x6c', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string0_hello_world_a919723c0f = {
+                .buf = &string0_hello_world_a919723c0f_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_ll_53285de4cf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string1_ll_53285de4cf = {
+                .buf = &string1_ll_53285de4cf_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_o_d6bc4b15bb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string2_o_d6bc4b15bb = {
+                .buf = &string2_o_d6bc4b15bb_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_l_dfe716a04e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string3_l_dfe716a04e = {
+                .buf = &string3_l_dfe716a04e_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_x_d21616386e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x78' },
+                .malloced = false,
+            };
+            static struct class_Str string4_x_d21616386e = {
+                .buf = &string4_x_d21616386e_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5__06174ad452_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string5__06174ad452 = {
+                .buf = &string5__06174ad452_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6_a_2e55ff245c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string6_a_2e55ff245c = {
+                .buf = &string6_a_2e55ff245c_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7_hell__c925017c22_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\xc3', '\xb6' },
+                .malloced = false,
+            };
+            static struct class_Str string7_hell__c925017c22 = {
+                .buf = &string7_hell__c925017c22_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_List_Str__43b70c06cb* var7;
+var7 = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_List_Str__43b70c06cb* var11;
+var11 = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_List_Str__43b70c06cb* var15;
+var15 = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_List_Str__43b70c06cb* var19;
+var19 = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_List_Str__43b70c06cb* var23;
+var23 = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+struct class_List_Str__43b70c06cb* var28;
+var28 = NULL;
+struct class_Str var29;
+var29.buf = NULL;
+struct class_Str var30;
+var30.buf = NULL;
+struct class_Str var31;
+var31.buf = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_List_Str__43b70c06cb* var33;
+var33 = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+struct class_Str var37;
+var37.buf = NULL;
+struct class_List_Str__43b70c06cb* var38;
+var38 = NULL;
+struct class_Str var39;
+var39.buf = NULL;
+struct class_Str var40;
+var40.buf = NULL;
+struct class_Str var41;
+var41.buf = NULL;
+struct class_Str var42;
+var42.buf = NULL;
+struct class_List_Str__43b70c06cb* var43;
+var43 = NULL;
+struct class_Str var44;
+var44.buf = NULL;
+struct class_Str var45;
+var45.buf = NULL;
+struct class_List_Str__43b70c06cb* var46;
+var46 = NULL;
+struct class_Str var47;
+var47.buf = NULL;
+struct class_Str var48;
+var48.buf = NULL;
+struct class_Str var49;
+var49.buf = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_List_Str__43b70c06cb* var51;
+var51 = NULL;
+struct class_Str var52;
+var52.buf = NULL;
+var1 = string0_hello_world_a919723c0f; string_incref(var1);
+var2 = string1_ll_53285de4cf; string_incref(var2);
+var3 = meth_Str_split(var1,var2);
+var4 = meth_List_Str__43b70c06cb_to_string(var3);
+oomph_print(var4);
+var5 = string0_hello_world_a919723c0f; string_incref(var5);
+var6 = string2_o_d6bc4b15bb; string_incref(var6);
+var7 = meth_Str_split(var5,var6);
+var8 = meth_List_Str__43b70c06cb_to_string(var7);
+oomph_print(var8);
+var9 = string0_hello_world_a919723c0f; string_incref(var9);
+var10 = string3_l_dfe716a04e; string_incref(var10);
+var11 = meth_Str_split(var9,var10);
+var12 = meth_List_Str__43b70c06cb_to_string(var11);
+oomph_print(var12);
+var13 = string0_hello_world_a919723c0f; string_incref(var13);
+var14 = string4_x_d21616386e; string_incref(var14);
+var15 = meth_Str_split(var13,var14);
+var16 = meth_List_Str__43b70c06cb_to_string(var15);
+oomph_print(var16);
+var17 = string0_hello_world_a919723c0f; string_incref(var17);
+var18 = string5__06174ad452; string_incref(var18);
+var19 = meth_Str_split(var17,var18);
+var20 = meth_List_Str__43b70c06cb_to_string(var19);
+oomph_print(var20);
+var21 = string0_hello_world_a919723c0f; string_incref(var21);
+var22 = string1_ll_53285de4cf; string_incref(var22);
+var23 = meth_Str_split(var21,var22);
+var24 = string1_ll_53285de4cf; string_incref(var24);
+var25 = meth_List_Str__43b70c06cb_join(var23,var24);
+oomph_print(var25);
+var26 = string0_hello_world_a919723c0f; string_incref(var26);
+var27 = string2_o_d6bc4b15bb; string_incref(var27);
+var28 = meth_Str_split(var26,var27);
+var29 = string2_o_d6bc4b15bb; string_incref(var29);
+var30 = meth_List_Str__43b70c06cb_join(var28,var29);
+oomph_print(var30);
+var31 = string0_hello_world_a919723c0f; string_incref(var31);
+var32 = string3_l_dfe716a04e; string_incref(var32);
+var33 = meth_Str_split(var31,var32);
+var34 = string3_l_dfe716a04e; string_incref(var34);
+var35 = meth_List_Str__43b70c06cb_join(var33,var34);
+oomph_print(var35);
+var36 = string0_hello_world_a919723c0f; string_incref(var36);
+var37 = string4_x_d21616386e; string_incref(var37);
+var38 = meth_Str_split(var36,var37);
+var39 = string4_x_d21616386e; string_incref(var39);
+var40 = meth_List_Str__43b70c06cb_join(var38,var39);
+oomph_print(var40);
+var41 = string0_hello_world_a919723c0f; string_incref(var41);
+var42 = string5__06174ad452; string_incref(var42);
+var43 = meth_Str_split(var41,var42);
+var44 = string5__06174ad452; string_incref(var44);
+var45 = meth_List_Str__43b70c06cb_join(var43,var44);
+oomph_print(var45);
+var46 = ctor_List_Str__43b70c06cb();
+var47 = string6_a_2e55ff245c; string_incref(var47);
+var48 = meth_List_Str__43b70c06cb_join(var46,var47);
+oomph_print(var48);
+var49 = string7_hell__c925017c22; string_incref(var49);
+var50 = string5__06174ad452; string_incref(var50);
+var51 = meth_Str_split(var49,var50);
+var52 = meth_List_Str__43b70c06cb_to_string(var51);
+oomph_print(var52);
+out: (void)0;
+string_decref(var52);
+decref((var51), dtor_List_Str__43b70c06cb);
+string_decref(var50);
+string_decref(var49);
+string_decref(var48);
+string_decref(var47);
+decref((var46), dtor_List_Str__43b70c06cb);
+string_decref(var45);
+string_decref(var44);
+decref((var43), dtor_List_Str__43b70c06cb);
+string_decref(var42);
+string_decref(var41);
+string_decref(var40);
+string_decref(var39);
+decref((var38), dtor_List_Str__43b70c06cb);
+string_decref(var37);
+string_decref(var36);
+string_decref(var35);
+string_decref(var34);
+decref((var33), dtor_List_Str__43b70c06cb);
+string_decref(var32);
+string_decref(var31);
+string_decref(var30);
+string_decref(var29);
+decref((var28), dtor_List_Str__43b70c06cb);
+string_decref(var27);
+string_decref(var26);
+string_decref(var25);
+string_decref(var24);
+decref((var23), dtor_List_Str__43b70c06cb);
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+decref((var19), dtor_List_Str__43b70c06cb);
+string_decref(var18);
+string_decref(var17);
+string_decref(var16);
+decref((var15), dtor_List_Str__43b70c06cb);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+decref((var11), dtor_List_Str__43b70c06cb);
+string_decref(var10);
+string_decref(var9);
+string_decref(var8);
+decref((var7), dtor_List_Str__43b70c06cb);
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+decref((var3), dtor_List_Str__43b70c06cb);
+string_decref(var2);
+string_decref(var1);
+}
@@ -0,0 +1,39 @@
+#include <lib/oomph.h>
+#include "lazy_and_c519ca35e1.h"
+#include "bundle_builtins_c399a735f1.h"
+bool lazy_and_c519ca35e1_foo(int64_t var1){struct class_Str var2;
+var2.buf = NULL;
+bool var3;
+bool retval;
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+var3 = oomph_true;
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+string_decref(var2);
+return retval;
+}void oomph_main(void){int64_t var2;
+bool var3;
+int64_t var8;
+bool var9;
+if (oomph_true) goto label1;
+label1: (void)0;
+var2 = 1LL;
+var3 = lazy_and_c519ca35e1_foo(var2);
+label4: (void)0;
+if (oomph_true) goto label5;
+label5: (void)0;
+if (oomph_true) goto label6;
+label6: (void)0;
+label7: (void)0;
+var8 = 4LL;
+var9 = lazy_and_c519ca35e1_foo(var8);
+if (oomph_true) goto label10;
+label10: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_lazy_and_c519ca35e1
+                #define HEADER_GUARD_lazy_and_c519ca35e1
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+bool lazy_and_c519ca35e1_foo(int64_t var1);
+void oomph_main(void);
+
+                #endif
+                
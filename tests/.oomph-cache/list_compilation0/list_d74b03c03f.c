@@ -0,0 +1,176 @@
+#include <lib/oomph.h>
+#include "list_d74b03c03f.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Int__df8a64abf3.h"
+void oomph_main(void){struct class_List_Int__df8a64abf3* var1;
+var1 = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+int64_t var3;
+struct class_Str var4;
+var4.buf = NULL;
+int64_t var5;
+int64_t var7;
+bool var8;
+bool var9;
+int64_t var11;
+int64_t var12;
+int64_t var13;
+int64_t var14;
+struct class_Str var15;
+var15.buf = NULL;
+int64_t var16;
+struct class_Str var17;
+var17.buf = NULL;
+int64_t var18;
+int64_t var20;
+bool var21;
+bool var22;
+int64_t var24;
+struct class_Str var25;
+var25.buf = NULL;
+int64_t var26;
+int64_t var27;
+struct class_Str var28;
+var28.buf = NULL;
+int64_t var29;
+struct class_Str var30;
+var30.buf = NULL;
+int64_t var31;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+struct class_List_Int__df8a64abf3* var34;
+var34 = NULL;
+int64_t var35;
+int64_t var36;
+struct class_Str var37;
+var37.buf = NULL;
+struct class_Str var38;
+var38.buf = NULL;
+struct class_List_Int__df8a64abf3* var39;
+var39 = NULL;
+struct class_Str var40;
+var40.buf = NULL;
+struct class_Str var41;
+var41.buf = NULL;
+int64_t var42;
+struct class_Str var43;
+var43.buf = NULL;
+struct class_Str var44;
+var44.buf = NULL;
+var1 = ctor_List_Int__df8a64abf3();
+var2 = meth_List_Int__df8a64abf3_to_string(var1);
+oomph_print(var2);
+var3 = meth_List_Int__df8a64abf3_length(var1);
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+var5 = 0LL;
+label6: (void)0;
+var7 = 10LL;
+var8 = oomph_int_gt(var7,var5);
+var9 = oomph_bool_not(var8);
+if (var9) goto label10;
+var11 = 100LL;
+var12 = oomph_int_add(var11,var5);
+meth_List_Int__df8a64abf3_push(var1,var12);
+var13 = 1LL;
+var14 = oomph_int_add(var5,var13);
+var5 = var14;
+if (oomph_true) goto label6;
+label10: (void)0;
+var15 = meth_List_Int__df8a64abf3_to_string(var1);
+oomph_print(var15);
+var16 = meth_List_Int__df8a64abf3_length(var1);
+var17 = meth_Int_to_string(var16);
+oomph_print(var17);
+var18 = 0LL;
+label19: (void)0;
+var20 = meth_List_Int__df8a64abf3_length(var1);
+var21 = oomph_int_gt(var20,var18);
+var22 = oomph_bool_not(var21);
+if (var22) goto label23;
+var24 = meth_List_Int__df8a64abf3_get(var1,var18);
+string_decref(var25);
+var25.buf = NULL;
+var25 = meth_Int_to_string(var24);
+oomph_print(var25);
+var26 = 1LL;
+var27 = oomph_int_add(var18,var26);
+var18 = var27;
+if (oomph_true) goto label19;
+label23: (void)0;
+var28 = meth_List_Int__df8a64abf3_to_string(var1);
+oomph_print(var28);
+var29 = meth_List_Int__df8a64abf3_first(var1);
+var30 = meth_Int_to_string(var29);
+oomph_print(var30);
+var31 = meth_List_Int__df8a64abf3_last(var1);
+var32 = meth_Int_to_string(var31);
+oomph_print(var32);
+var33 = meth_List_Int__df8a64abf3_to_string(var1);
+oomph_print(var33);
+var34 = ctor_List_Int__df8a64abf3();
+var35 = 69LL;
+meth_List_Int__df8a64abf3_push(var34,var35);
+var36 = 123LL;
+meth_List_Int__df8a64abf3_push(var34,var36);
+meth_List_Int__df8a64abf3_push_all(var1,var34);
+var37 = meth_List_Int__df8a64abf3_to_string(var1);
+oomph_print(var37);
+meth_List_Int__df8a64abf3_push_all(var34,var34);
+var38 = meth_List_Int__df8a64abf3_to_string(var34);
+oomph_print(var38);
+var39 = meth_List_Int__df8a64abf3_reversed(var34);
+var40 = meth_List_Int__df8a64abf3_to_string(var39);
+oomph_print(var40);
+var41 = meth_List_Int__df8a64abf3_to_string(var34);
+oomph_print(var41);
+var42 = meth_List_Int__df8a64abf3_pop(var34);
+var43 = meth_Int_to_string(var42);
+oomph_print(var43);
+var44 = meth_List_Int__df8a64abf3_to_string(var34);
+oomph_print(var44);
+out: (void)0;
+string_decref(var44);
+string_decref(var43);
+(void)0;
+string_decref(var41);
+string_decref(var40);
+decref((var39), dtor_List_Int__df8a64abf3);
+string_decref(var38);
+string_decref(var37);
+(void)0;
+(void)0;
+decref((var34), dtor_List_Int__df8a64abf3);
+string_decref(var33);
+string_decref(var32);
+(void)0;
+string_decref(var30);
+(void)0;
+string_decref(var28);
+(void)0;
+(void)0;
+string_decref(var25);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var17);
+(void)0;
+string_decref(var15);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var4);
+(void)0;
+string_decref(var2);
+decref((var1), dtor_List_Int__df8a64abf3);
+}
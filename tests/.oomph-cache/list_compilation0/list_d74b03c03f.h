@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_list_d74b03c03f
+                #define HEADER_GUARD_list_d74b03c03f
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+void oomph_main(void);
+
+                #endif
+                
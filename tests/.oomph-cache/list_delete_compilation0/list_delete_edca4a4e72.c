@@ -0,0 +1,111 @@
+#include <lib/oomph.h>
+#include "list_delete_edca4a4e72.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_a_5cb8fdbbfa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string0_a_5cb8fdbbfa = {
+                .buf = &string0_a_5cb8fdbbfa_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_b_b20f829815_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string1_b_b20f829815 = {
+                .buf = &string1_b_b20f829815_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_c_d699c57bf3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string2_c_d699c57bf3 = {
+                .buf = &string2_c_d699c57bf3_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_Deleted___16aa26ea1e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x44', '\x65', '\x6c', '\x65', '\x74', '\x65', '\x64', '\x3a', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string3_Deleted___16aa26ea1e = {
+                .buf = &string3_Deleted___16aa26ea1e_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_List_Str__43b70c06cb* var4;
+var4 = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+int64_t var6;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+int64_t var11;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+var1 = string0_a_5cb8fdbbfa; string_incref(var1);
+var2 = string1_b_b20f829815; string_incref(var2);
+var3 = string2_c_d699c57bf3; string_incref(var3);
+var4 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var4,var1);
+meth_List_Str__43b70c06cb_push(var4,var2);
+meth_List_Str__43b70c06cb_push(var4,var3);
+var5 = string3_Deleted___16aa26ea1e; string_incref(var5);
+var6 = 0LL;
+var7 = meth_List_Str__43b70c06cb_delete_at_index(var4,var6);
+var8 = oomph_string_concat(var5,var7);
+oomph_print(var8);
+var9 = meth_List_Str__43b70c06cb_to_string(var4);
+oomph_print(var9);
+var10 = string3_Deleted___16aa26ea1e; string_incref(var10);
+var11 = 1LL;
+var12 = meth_List_Str__43b70c06cb_delete_at_index(var4,var11);
+var13 = oomph_string_concat(var10,var12);
+oomph_print(var13);
+var14 = meth_List_Str__43b70c06cb_to_string(var4);
+oomph_print(var14);
+out: (void)0;
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+(void)0;
+string_decref(var10);
+string_decref(var9);
+string_decref(var8);
+string_decref(var7);
+(void)0;
+string_decref(var5);
+decref((var4), dtor_List_Str__43b70c06cb);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+}
@@ -0,0 +1,146 @@
+#include <lib/oomph.h>
+#include "list_equal_08175d18a7.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Int__df8a64abf3.h"
+void oomph_main(void){int64_t var1;
+int64_t var2;
+struct class_List_Int__df8a64abf3* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var5;
+struct class_List_Int__df8a64abf3* var6;
+var6 = NULL;
+bool var7;
+struct class_Str var8;
+var8.buf = NULL;
+int64_t var9;
+int64_t var10;
+struct class_List_Int__df8a64abf3* var11;
+var11 = NULL;
+int64_t var12;
+int64_t var13;
+struct class_List_Int__df8a64abf3* var14;
+var14 = NULL;
+bool var15;
+struct class_Str var16;
+var16.buf = NULL;
+int64_t var17;
+int64_t var18;
+struct class_List_Int__df8a64abf3* var19;
+var19 = NULL;
+int64_t var20;
+int64_t var21;
+int64_t var22;
+struct class_List_Int__df8a64abf3* var23;
+var23 = NULL;
+bool var24;
+struct class_Str var25;
+var25.buf = NULL;
+int64_t var26;
+int64_t var27;
+struct class_List_Int__df8a64abf3* var28;
+var28 = NULL;
+struct class_List_Int__df8a64abf3* var29;
+var29 = NULL;
+bool var30;
+struct class_Str var31;
+var31.buf = NULL;
+struct class_List_Int__df8a64abf3* var32;
+var32 = NULL;
+struct class_List_Int__df8a64abf3* var33;
+var33 = NULL;
+bool var34;
+struct class_Str var35;
+var35.buf = NULL;
+var1 = 1LL;
+var2 = 2LL;
+var3 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var3,var1);
+meth_List_Int__df8a64abf3_push(var3,var2);
+var4 = 1LL;
+var5 = 2LL;
+var6 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var6,var4);
+meth_List_Int__df8a64abf3_push(var6,var5);
+var7 = meth_List_Int__df8a64abf3_equals(var3,var6);
+var8 = meth_Bool_to_string(var7);
+oomph_print(var8);
+var9 = 1LL;
+var10 = 2LL;
+var11 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var11,var9);
+meth_List_Int__df8a64abf3_push(var11,var10);
+var12 = 2LL;
+var13 = 2LL;
+var14 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var14,var12);
+meth_List_Int__df8a64abf3_push(var14,var13);
+var15 = meth_List_Int__df8a64abf3_equals(var11,var14);
+var16 = meth_Bool_to_string(var15);
+oomph_print(var16);
+var17 = 1LL;
+var18 = 2LL;
+var19 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var19,var17);
+meth_List_Int__df8a64abf3_push(var19,var18);
+var20 = 1LL;
+var21 = 2LL;
+var22 = 3LL;
+var23 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var23,var20);
+meth_List_Int__df8a64abf3_push(var23,var21);
+meth_List_Int__df8a64abf3_push(var23,var22);
+var24 = meth_List_Int__df8a64abf3_equals(var19,var23);
+var25 = meth_Bool_to_string(var24);
+oomph_print(var25);
+var26 = 1LL;
+var27 = 2LL;
+var28 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var28,var26);
+meth_List_Int__df8a64abf3_push(var28,var27);
+var29 = ctor_List_Int__df8a64abf3();
+var30 = meth_List_Int__df8a64abf3_equals(var28,var29);
+var31 = meth_Bool_to_string(var30);
+oomph_print(var31);
+var32 = ctor_List_Int__df8a64abf3();
+var33 = ctor_List_Int__df8a64abf3();
+var34 = meth_List_Int__df8a64abf3_equals(var32,var33);
+var35 = meth_Bool_to_string(var34);
+oomph_print(var35);
+out: (void)0;
+string_decref(var35);
+(void)0;
+decref((var33), dtor_List_Int__df8a64abf3);
+decref((var32), dtor_List_Int__df8a64abf3);
+string_decref(var31);
+(void)0;
+decref((var29), dtor_List_Int__df8a64abf3);
+decref((var28), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+string_decref(var25);
+(void)0;
+decref((var23), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+(void)0;
+decref((var19), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+string_decref(var16);
+(void)0;
+decref((var14), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref((var11), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+string_decref(var8);
+(void)0;
+decref((var6), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref((var3), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+}
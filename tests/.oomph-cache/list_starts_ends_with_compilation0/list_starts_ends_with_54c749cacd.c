@@ -0,0 +1,230 @@
+#include <lib/oomph.h>
+#include "list_starts_ends_with_54c749cacd.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Int__df8a64abf3.h"
+void oomph_main(void){int64_t var1;
+int64_t var2;
+struct class_List_Int__df8a64abf3* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var5;
+struct class_List_Int__df8a64abf3* var6;
+var6 = NULL;
+bool var7;
+struct class_Str var8;
+var8.buf = NULL;
+int64_t var9;
+int64_t var10;
+struct class_List_Int__df8a64abf3* var11;
+var11 = NULL;
+int64_t var12;
+struct class_List_Int__df8a64abf3* var13;
+var13 = NULL;
+bool var14;
+struct class_Str var15;
+var15.buf = NULL;
+int64_t var16;
+int64_t var17;
+struct class_List_Int__df8a64abf3* var18;
+var18 = NULL;
+int64_t var19;
+struct class_List_Int__df8a64abf3* var20;
+var20 = NULL;
+bool var21;
+struct class_Str var22;
+var22.buf = NULL;
+int64_t var23;
+int64_t var24;
+struct class_List_Int__df8a64abf3* var25;
+var25 = NULL;
+struct class_List_Int__df8a64abf3* var26;
+var26 = NULL;
+bool var27;
+struct class_Str var28;
+var28.buf = NULL;
+int64_t var29;
+int64_t var30;
+struct class_List_Int__df8a64abf3* var31;
+var31 = NULL;
+int64_t var32;
+int64_t var33;
+struct class_List_Int__df8a64abf3* var34;
+var34 = NULL;
+bool var35;
+struct class_Str var36;
+var36.buf = NULL;
+int64_t var37;
+int64_t var38;
+struct class_List_Int__df8a64abf3* var39;
+var39 = NULL;
+int64_t var40;
+struct class_List_Int__df8a64abf3* var41;
+var41 = NULL;
+bool var42;
+struct class_Str var43;
+var43.buf = NULL;
+int64_t var44;
+int64_t var45;
+struct class_List_Int__df8a64abf3* var46;
+var46 = NULL;
+int64_t var47;
+struct class_List_Int__df8a64abf3* var48;
+var48 = NULL;
+bool var49;
+struct class_Str var50;
+var50.buf = NULL;
+int64_t var51;
+int64_t var52;
+struct class_List_Int__df8a64abf3* var53;
+var53 = NULL;
+struct class_List_Int__df8a64abf3* var54;
+var54 = NULL;
+bool var55;
+struct class_Str var56;
+var56.buf = NULL;
+var1 = 1LL;
+var2 = 2LL;
+var3 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var3,var1);
+meth_List_Int__df8a64abf3_push(var3,var2);
+var4 = 1LL;
+var5 = 2LL;
+var6 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var6,var4);
+meth_List_Int__df8a64abf3_push(var6,var5);
+var7 = meth_List_Int__df8a64abf3_starts_with(var3,var6);
+var8 = meth_Bool_to_string(var7);
+oomph_print(var8);
+var9 = 1LL;
+var10 = 2LL;
+var11 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var11,var9);
+meth_List_Int__df8a64abf3_push(var11,var10);
+var12 = 1LL;
+var13 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var13,var12);
+var14 = meth_List_Int__df8a64abf3_starts_with(var11,var13);
+var15 = meth_Bool_to_string(var14);
+oomph_print(var15);
+var16 = 1LL;
+var17 = 2LL;
+var18 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var18,var16);
+meth_List_Int__df8a64abf3_push(var18,var17);
+var19 = 2LL;
+var20 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var20,var19);
+var21 = meth_List_Int__df8a64abf3_starts_with(var18,var20);
+var22 = meth_Bool_to_string(var21);
+oomph_print(var22);
+var23 = 1LL;
+var24 = 2LL;
+var25 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var25,var23);
+meth_List_Int__df8a64abf3_push(var25,var24);
+var26 = ctor_List_Int__df8a64abf3();
+var27 = meth_List_Int__df8a64abf3_starts_with(var25,var26);
+var28 = meth_Bool_to_string(var27);
+oomph_print(var28);
+var29 = 1LL;
+var30 = 2LL;
+var31 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var31,var29);
+meth_List_Int__df8a64abf3_push(var31,var30);
+var32 = 1LL;
+var33 = 2LL;
+var34 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var34,var32);
+meth_List_Int__df8a64abf3_push(var34,var33);
+var35 = meth_List_Int__df8a64abf3_ends_with(var31,var34);
+var36 = meth_Bool_to_string(var35);
+oomph_print(var36);
+var37 = 1LL;
+var38 = 2LL;
+var39 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var39,var37);
+meth_List_Int__df8a64abf3_push(var39,var38);
+var40 = 1LL;
+var41 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var41,var40);
+var42 = meth_List_Int__df8a64abf3_ends_with(var39,var41);
+var43 = meth_Bool_to_string(var42);
+oomph_print(var43);
+var44 = 1LL;
+var45 = 2LL;
+var46 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var46,var44);
+meth_List_Int__df8a64abf3_push(var46,var45);
+var47 = 2LL;
+var48 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var48,var47);
+var49 = meth_List_Int__df8a64abf3_ends_with(var46,var48);
+var50 = meth_Bool_to_string(var49);
+oomph_print(var50);
+var51 = 1LL;
+var52 = 2LL;
+var53 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var53,var51);
+meth_List_Int__df8a64abf3_push(var53,var52);
+var54 = ctor_List_Int__df8a64abf3();
+var55 = meth_List_Int__df8a64abf3_ends_with(var53,var54);
+var56 = meth_Bool_to_string(var55);
+oomph_print(var56);
+out: (void)0;
+string_decref(var56);
+(void)0;
+decref((var54), dtor_List_Int__df8a64abf3);
+decref((var53), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+string_decref(var50);
+(void)0;
+decref((var48), dtor_List_Int__df8a64abf3);
+(void)0;
+decref((var46), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+string_decref(var43);
+(void)0;
+decref((var41), dtor_List_Int__df8a64abf3);
+(void)0;
+decref((var39), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+string_decref(var36);
+(void)0;
+decref((var34), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref((var31), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+string_decref(var28);
+(void)0;
+decref((var26), dtor_List_Int__df8a64abf3);
+decref((var25), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+string_decref(var22);
+(void)0;
+decref((var20), dtor_List_Int__df8a64abf3);
+(void)0;
+decref((var18), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+string_decref(var15);
+(void)0;
+decref((var13), dtor_List_Int__df8a64abf3);
+(void)0;
+decref((var11), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+string_decref(var8);
+(void)0;
+decref((var6), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref((var3), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+}
@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "list_syntax_2a7fe85b48.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_lol_ad5591508f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_lol_ad5591508f = {
+                .buf = &string0_lol_ad5591508f_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_wat_7e901a1f04_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77', '\x61', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string1_wat_7e901a1f04 = {
+                .buf = &string1_wat_7e901a1f04_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+var1 = string0_lol_ad5591508f; string_incref(var1);
+var2 = string1_wat_7e901a1f04; string_incref(var2);
+var3 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var3,var1);
+meth_List_Str__43b70c06cb_push(var3,var2);
+var4 = meth_List_Str__43b70c06cb_to_string(var3);
+oomph_print(var4);
+var5 = meth_List_Str__43b70c06cb_first(var3);
+oomph_print(var5);
+var6 = meth_List_Str__43b70c06cb_last(var3);
+oomph_print(var6);
+out: (void)0;
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+decref((var3), dtor_List_Str__43b70c06cb);
+string_decref(var2);
+string_decref(var1);
+}
@@ -0,0 +1,47 @@
+#include <lib/oomph.h>
+#include "list_whitespace_4ce67370b3.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_lol_1710baf13d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_lol_1710baf13d = {
+                .buf = &string0_lol_1710baf13d_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_wat_774b3635e5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77', '\x61', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string1_wat_774b3635e5 = {
+                .buf = &string1_wat_774b3635e5_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+var1 = string0_lol_1710baf13d; string_incref(var1);
+var2 = string1_wat_774b3635e5; string_incref(var2);
+var3 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var3,var1);
+meth_List_Str__43b70c06cb_push(var3,var2);
+var4 = meth_List_Str__43b70c06cb_to_string(var3);
+oomph_print(var4);
+out: (void)0;
+string_decref(var4);
+decref((var3), dtor_List_Str__43b70c06cb);
+string_decref(var2);
+string_decref(var1);
+}
@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_list_whitespace_4ce67370b3
+                #define HEADER_GUARD_list_whitespace_4ce67370b3
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Str__43b70c06cb;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,382 @@
+#include <lib/oomph.h>
+#include "listcomp_007bb77dc8.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Int__df8a64abf3.h"
+#include "List_List_Int___d530ff6e70.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_a_83809db8c8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string0_a_83809db8c8 = {
+                .buf = &string0_a_83809db8c8_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_b_310a22fb61_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string1_b_310a22fb61 = {
+                .buf = &string1_b_310a22fb61_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_c_8b74d486d2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string2_c_8b74d486d2 = {
+                .buf = &string2_c_8b74d486d2_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_lol__aeca51d97b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string3_lol__aeca51d97b = {
+                .buf = &string3_lol__aeca51d97b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_List_Int__df8a64abf3* var1;
+var1 = NULL;
+int64_t var2;
+int64_t var4;
+bool var5;
+bool var6;
+int64_t var8;
+int64_t var9;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_List_Str__43b70c06cb* var14;
+var14 = NULL;
+struct class_List_Str__43b70c06cb* var15;
+var15 = NULL;
+int64_t var16;
+int64_t var17;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+int64_t var24;
+int64_t var25;
+int64_t var26;
+struct class_List_Int__df8a64abf3* var27;
+var27 = NULL;
+struct class_List_Int__df8a64abf3* var28;
+var28 = NULL;
+struct class_List_Int__df8a64abf3* var30;
+var30 = NULL;
+bool var31;
+bool var32;
+bool var33;
+int64_t var35;
+struct class_Str var36;
+var36.buf = NULL;
+struct class_List_List_Int___d530ff6e70* var37;
+var37 = NULL;
+int64_t var38;
+int64_t var40;
+bool var41;
+bool var42;
+struct class_List_Int__df8a64abf3* var44;
+var44 = NULL;
+int64_t var45;
+int64_t var47;
+bool var48;
+bool var49;
+bool var50;
+int64_t var52;
+int64_t var53;
+int64_t var54;
+int64_t var55;
+struct class_Str var56;
+var56.buf = NULL;
+struct class_List_Int__df8a64abf3* var57;
+var57 = NULL;
+int64_t var58;
+int64_t var60;
+bool var61;
+bool var62;
+int64_t var64;
+int64_t var65;
+struct class_List_Int__df8a64abf3* var66;
+var66 = NULL;
+int64_t var67;
+int64_t var68;
+int64_t var70;
+int64_t var72;
+struct class_Str var73;
+var73.buf = NULL;
+struct class_List_Int__df8a64abf3* var74;
+var74 = NULL;
+int64_t var75;
+int64_t var76;
+int64_t var78;
+struct class_List_Int__df8a64abf3* var80;
+var80 = NULL;
+int64_t var81;
+int64_t var82;
+int64_t var84;
+int64_t var86;
+struct class_Str var87;
+var87.buf = NULL;
+struct class_List_Str__43b70c06cb* var88;
+var88 = NULL;
+struct class_List_Str__43b70c06cb* var89;
+var89 = NULL;
+int64_t var90;
+int64_t var91;
+struct class_Str var93;
+var93.buf = NULL;
+struct class_Str var95;
+var95.buf = NULL;
+var1 = ctor_List_Int__df8a64abf3();
+var2 = 0LL;
+label3: (void)0;
+var4 = 10LL;
+var5 = oomph_int_gt(var4,var2);
+var6 = oomph_bool_not(var5);
+if (var6) goto label7;
+meth_List_Int__df8a64abf3_push(var1,var2);
+var8 = 1LL;
+var9 = oomph_int_add(var2,var8);
+var2 = var9;
+if (oomph_true) goto label3;
+label7: (void)0;
+var10 = meth_List_Int__df8a64abf3_to_string(var1);
+oomph_print(var10);
+var11 = string0_a_83809db8c8; string_incref(var11);
+var12 = string1_b_310a22fb61; string_incref(var12);
+var13 = string2_c_8b74d486d2; string_incref(var13);
+var14 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var14,var11);
+meth_List_Str__43b70c06cb_push(var14,var12);
+meth_List_Str__43b70c06cb_push(var14,var13);
+var15 = ctor_List_Str__43b70c06cb();
+var16 = meth_List_Str__43b70c06cb_length(var14);
+meth_List_Str__43b70c06cb___reserve(var15,var16);
+var17 = 0LL;
+label18: (void)0;
+if (var17 >= var14->len) goto label20;
+var19 = var14->data[var17++];
+string_decref(var21);
+var21.buf = NULL;
+var21 = string3_lol__aeca51d97b; string_incref(var21);
+string_decref(var22);
+var22.buf = NULL;
+var22 = oomph_string_concat(var21,var19);
+meth_List_Str__43b70c06cb_push(var15,var22);
+if (oomph_true) goto label18;
+label20: (void)0;
+var23 = meth_List_Str__43b70c06cb_to_string(var15);
+oomph_print(var23);
+var24 = 1LL;
+var25 = 2LL;
+var26 = 3LL;
+var27 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var27,var24);
+meth_List_Int__df8a64abf3_push(var27,var25);
+meth_List_Int__df8a64abf3_push(var27,var26);
+var28 = ctor_List_Int__df8a64abf3();
+label29: (void)0;
+decref((var30), dtor_List_Int__df8a64abf3);
+var30 = NULL;
+var30 = ctor_List_Int__df8a64abf3();
+var31 = meth_List_Int__df8a64abf3_equals(var27,var30);
+var32 = oomph_bool_not(var31);
+var33 = oomph_bool_not(var32);
+if (var33) goto label34;
+var35 = meth_List_Int__df8a64abf3_pop(var27);
+meth_List_Int__df8a64abf3_push(var28,var35);
+if (oomph_true) goto label29;
+label34: (void)0;
+var36 = meth_List_Int__df8a64abf3_to_string(var28);
+oomph_print(var36);
+var37 = ctor_List_List_Int___d530ff6e70();
+var38 = 0LL;
+label39: (void)0;
+var40 = 3LL;
+var41 = oomph_int_gt(var40,var38);
+var42 = oomph_bool_not(var41);
+if (var42) goto label43;
+decref((var44), dtor_List_Int__df8a64abf3);
+var44 = NULL;
+var44 = ctor_List_Int__df8a64abf3();
+var45 = 0LL;
+label46: (void)0;
+var47 = 5LL;
+var48 = oomph_int_gt(var45,var47);
+var49 = oomph_bool_not(var48);
+var50 = oomph_bool_not(var49);
+if (var50) goto label51;
+meth_List_Int__df8a64abf3_push(var44,var45);
+var52 = 1LL;
+var53 = oomph_int_add(var45,var52);
+var45 = var53;
+if (oomph_true) goto label46;
+label51: (void)0;
+meth_List_List_Int___d530ff6e70_push(var37,var44);
+var54 = 1LL;
+var55 = oomph_int_add(var38,var54);
+var38 = var55;
+if (oomph_true) goto label39;
+label43: (void)0;
+var56 = meth_List_List_Int___d530ff6e70_to_string(var37);
+oomph_print(var56);
+var57 = ctor_List_Int__df8a64abf3();
+var58 = 0LL;
+label59: (void)0;
+var60 = 20LL;
+var61 = oomph_int_gt(var60,var58);
+var62 = oomph_bool_not(var61);
+if (var62) goto label63;
+meth_List_Int__df8a64abf3_push(var57,var58);
+var64 = 1LL;
+var65 = oomph_int_add(var58,var64);
+var58 = var65;
+if (oomph_true) goto label59;
+label63: (void)0;
+var66 = ctor_List_Int__df8a64abf3();
+var67 = meth_List_Int__df8a64abf3_length(var57);
+meth_List_Int__df8a64abf3___reserve(var66,var67);
+var68 = 0LL;
+label69: (void)0;
+if (var68 >= var57->len) goto label71;
+var70 = var57->data[var68++];
+var72 = oomph_int_mul(var70,var70);
+meth_List_Int__df8a64abf3_push(var66,var72);
+if (oomph_true) goto label69;
+label71: (void)0;
+var73 = meth_List_Int__df8a64abf3_to_string(var66);
+oomph_print(var73);
+var74 = ctor_List_Int__df8a64abf3();
+var75 = meth_List_Int__df8a64abf3_length(var57);
+meth_List_Int__df8a64abf3___reserve(var74,var75);
+var76 = 0LL;
+label77: (void)0;
+if (var76 >= var57->len) goto label79;
+var78 = var57->data[var76++];
+decref((var80), dtor_List_Int__df8a64abf3);
+var80 = NULL;
+var80 = ctor_List_Int__df8a64abf3();
+var81 = meth_List_Int__df8a64abf3_length(var57);
+meth_List_Int__df8a64abf3___reserve(var80,var81);
+var82 = 0LL;
+label83: (void)0;
+if (var82 >= var57->len) goto label85;
+var84 = var57->data[var82++];
+meth_List_Int__df8a64abf3_push(var80,var84);
+if (oomph_true) goto label83;
+label85: (void)0;
+var86 = meth_List_Int__df8a64abf3_length(var80);
+meth_List_Int__df8a64abf3_push(var74,var86);
+if (oomph_true) goto label77;
+label79: (void)0;
+var87 = meth_List_Int__df8a64abf3_to_string(var74);
+oomph_print(var87);
+var88 = ctor_List_Str__43b70c06cb();
+var89 = ctor_List_Str__43b70c06cb();
+var90 = meth_List_Str__43b70c06cb_length(var88);
+meth_List_Str__43b70c06cb___reserve(var89,var90);
+var91 = 0LL;
+label92: (void)0;
+if (var91 >= var88->len) goto label94;
+var93 = var88->data[var91++];
+meth_List_Str__43b70c06cb_push(var89,var93);
+if (oomph_true) goto label92;
+label94: (void)0;
+var95 = meth_List_Str__43b70c06cb_to_string(var89);
+oomph_print(var95);
+out: (void)0;
+string_decref(var95);
+(void)0;
+(void)0;
+decref((var89), dtor_List_Str__43b70c06cb);
+decref((var88), dtor_List_Str__43b70c06cb);
+string_decref(var87);
+(void)0;
+(void)0;
+(void)0;
+decref((var80), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref((var74), dtor_List_Int__df8a64abf3);
+string_decref(var73);
+(void)0;
+(void)0;
+(void)0;
+decref((var66), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var57), dtor_List_Int__df8a64abf3);
+string_decref(var56);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var44), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var37), dtor_List_List_Int___d530ff6e70);
+string_decref(var36);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var30), dtor_List_Int__df8a64abf3);
+decref((var28), dtor_List_Int__df8a64abf3);
+decref((var27), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var23);
+string_decref(var22);
+string_decref(var21);
+(void)0;
+(void)0;
+decref((var15), dtor_List_Str__43b70c06cb);
+decref((var14), dtor_List_Str__43b70c06cb);
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+string_decref(var10);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var1), dtor_List_Int__df8a64abf3);
+}
@@ -0,0 +1,46 @@
+#include <lib/oomph.h>
+#include "loop_body_var_in_incr_7de0fa88c7.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_lol_935ee60257_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_lol_935ee60257 = {
+                .buf = &string0_lol_935ee60257_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void oomph_main(void){int64_t var1;
+int64_t var3;
+bool var4;
+bool var5;
+struct class_Str var7;
+var7.buf = NULL;
+int64_t var8;
+int64_t var9;
+var1 = 0LL;
+label2: (void)0;
+var3 = 10LL;
+var4 = oomph_int_gt(var3,var1);
+var5 = oomph_bool_not(var4);
+if (var5) goto label6;
+string_decref(var7);
+var7.buf = NULL;
+var7 = string0_lol_935ee60257; string_incref(var7);
+var8 = 1LL;
+var9 = oomph_int_add(var1,var8);
+var1 = var9;
+oomph_print(var7);
+if (oomph_true) goto label2;
+label6: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+string_decref(var7);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,208 @@
+#include <lib/oomph.h>
+#include "loop_390abae538.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_Lol_824b02cfc2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Lol_824b02cfc2 = {
+                .buf = &string0_Lol_824b02cfc2_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_hello_df932c068f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string1_hello_df932c068f = {
+                .buf = &string1_hello_df932c068f_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_world_67c6642a4e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77', '\x6f', '\x72', '\x6c', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string2_world_67c6642a4e = {
+                .buf = &string2_world_67c6642a4e_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            void oomph_main(void){int64_t var1;
+int64_t var3;
+bool var4;
+bool var5;
+bool var6;
+struct class_Str var8;
+var8.buf = NULL;
+int64_t var9;
+int64_t var10;
+int64_t var11;
+int64_t var13;
+bool var14;
+bool var15;
+bool var16;
+int64_t var18;
+bool var19;
+int64_t var21;
+bool var22;
+bool var23;
+int64_t var28;
+bool var29;
+struct class_Str var32;
+var32.buf = NULL;
+int64_t var33;
+int64_t var34;
+struct class_Str var36;
+var36.buf = NULL;
+int64_t var38;
+int64_t var40;
+bool var41;
+bool var42;
+bool var43;
+struct class_Str var45;
+var45.buf = NULL;
+int64_t var46;
+int64_t var47;
+struct class_List_Str__43b70c06cb* var48;
+var48 = NULL;
+struct class_Str var49;
+var49.buf = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+int64_t var51;
+struct class_Str var53;
+var53.buf = NULL;
+var1 = 0LL;
+label2: (void)0;
+var3 = 10LL;
+var4 = meth_Int_equals(var1,var3);
+var5 = oomph_bool_not(var4);
+var6 = oomph_bool_not(var5);
+if (var6) goto label7;
+string_decref(var8);
+var8.buf = NULL;
+var8 = meth_Int_to_string(var1);
+oomph_print(var8);
+var9 = 1LL;
+var10 = oomph_int_add(var1,var9);
+var1 = var10;
+if (oomph_true) goto label2;
+label7: (void)0;
+var11 = 0LL;
+label12: (void)0;
+var13 = 10LL;
+var14 = meth_Int_equals(var11,var13);
+var15 = oomph_bool_not(var14);
+var16 = oomph_bool_not(var15);
+if (var16) goto label17;
+var18 = 5LL;
+var19 = meth_Int_equals(var11,var18);
+if (var19) goto label20;
+var21 = 6LL;
+var22 = meth_Int_equals(var11,var21);
+var23 = var22;
+if (oomph_true) goto label24;
+label20: (void)0;
+var23 = oomph_true;
+label24: (void)0;
+if (var23) goto label25;
+if (oomph_true) goto label26;
+label25: (void)0;
+if (oomph_true) goto label27;
+label26: (void)0;
+var28 = 8LL;
+var29 = meth_Int_equals(var11,var28);
+if (var29) goto label30;
+if (oomph_true) goto label31;
+label30: (void)0;
+if (oomph_true) goto label17;
+label31: (void)0;
+string_decref(var32);
+var32.buf = NULL;
+var32 = meth_Int_to_string(var11);
+oomph_print(var32);
+label27: (void)0;
+var33 = 1LL;
+var34 = oomph_int_add(var11,var33);
+var11 = var34;
+if (oomph_true) goto label12;
+label17: (void)0;
+label35: (void)0;
+var36 = string0_Lol_824b02cfc2; string_incref(var36);
+oomph_print(var36);
+if (oomph_true) goto label37;
+label37: (void)0;
+var38 = 0LL;
+label39: (void)0;
+var40 = 5LL;
+var41 = meth_Int_equals(var38,var40);
+var42 = oomph_bool_not(var41);
+var43 = oomph_bool_not(var42);
+if (var43) goto label44;
+string_decref(var45);
+var45.buf = NULL;
+var45 = meth_Int_to_string(var38);
+oomph_print(var45);
+var46 = 1LL;
+var47 = oomph_int_add(var38,var46);
+var38 = var47;
+if (oomph_true) goto label39;
+label44: (void)0;
+var48 = ctor_List_Str__43b70c06cb();
+var49 = string1_hello_df932c068f; string_incref(var49);
+meth_List_Str__43b70c06cb_push(var48,var49);
+var50 = string2_world_67c6642a4e; string_incref(var50);
+meth_List_Str__43b70c06cb_push(var48,var50);
+var51 = 0LL;
+label52: (void)0;
+if (var51 >= var48->len) goto label54;
+var53 = var48->data[var51++];
+oomph_print(var53);
+if (oomph_true) goto label52;
+label54: (void)0;
+out: (void)0;
+(void)0;
+string_decref(var50);
+string_decref(var49);
+decref((var48), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+string_decref(var45);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var36);
+(void)0;
+(void)0;
+string_decref(var32);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var8);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
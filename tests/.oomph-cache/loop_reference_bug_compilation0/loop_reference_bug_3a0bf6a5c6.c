@@ -0,0 +1,120 @@
+#include <lib/oomph.h>
+#include "loop_reference_bug_3a0bf6a5c6.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0__7c008edc0e_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string0__7c008edc0e = {
+                .buf = &string0__7c008edc0e_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_c_098a896a4c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string1_c_098a896a4c = {
+                .buf = &string1_c_098a896a4c_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_cc___70d3261161_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x63', '\x3a', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string2_cc___70d3261161 = {
+                .buf = &string2_cc___70d3261161_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+int64_t var2;
+int64_t var4;
+bool var5;
+bool var6;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_List_Str__43b70c06cb* var10;
+var10 = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+int64_t var13;
+bool var14;
+int64_t var17;
+int64_t var18;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+var1 = string0__7c008edc0e; string_incref(var1);
+var2 = 0LL;
+label3: (void)0;
+var4 = 2LL;
+var5 = oomph_int_gt(var4,var2);
+var6 = oomph_bool_not(var5);
+if (var6) goto label7;
+string_decref(var8);
+var8.buf = NULL;
+var8 = string1_c_098a896a4c; string_incref(var8);
+string_decref(var9);
+var9.buf = NULL;
+var9 = string1_c_098a896a4c; string_incref(var9);
+decref((var10), dtor_List_Str__43b70c06cb);
+var10 = NULL;
+var10 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var10,var8);
+meth_List_Str__43b70c06cb_push(var10,var9);
+string_decref(var11);
+var11.buf = NULL;
+var11 = string0__7c008edc0e; string_incref(var11);
+string_decref(var12);
+var12.buf = NULL;
+var12 = meth_List_Str__43b70c06cb_join(var10,var11);
+var13 = 0LL;
+var14 = meth_Int_equals(var2,var13);
+if (var14) goto label15;
+if (oomph_true) goto label16;
+label15: (void)0;
+string_decref(var1);
+var1 = var12;
+var12.buf = NULL;
+label16: (void)0;
+var17 = 1LL;
+var18 = oomph_int_add(var2,var17);
+var2 = var18;
+if (oomph_true) goto label3;
+label7: (void)0;
+var19 = string2_cc___70d3261161; string_incref(var19);
+var20 = oomph_string_concat(var19,var1);
+oomph_print(var20);
+out: (void)0;
+string_decref(var20);
+string_decref(var19);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var12);
+string_decref(var11);
+decref((var10), dtor_List_Str__43b70c06cb);
+string_decref(var9);
+string_decref(var8);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var1);
+}
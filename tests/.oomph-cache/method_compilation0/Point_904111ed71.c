@@ -0,0 +1,107 @@
+#include <lib/oomph.h>
+#include "Point_904111ed71.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Point_f0f392c072_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x6f', '\x69', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Point_f0f392c072 = {
+                .buf = &string0_Point_f0f392c072_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            struct class_Point_904111ed71* ctor_Point_904111ed71(int64_t arg_x,int64_t arg_y)
+            {
+                struct class_Point_904111ed71* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+                (void)0;
+(void)0;
+
+                return obj;
+            }
+
+            void dtor_Point_904111ed71(void *ptr)
+            {
+                struct class_Point_904111ed71 *obj = ptr;
+                (void)0;
+(void)0;
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Point_904111ed71_to_string(struct class_Point_904111ed71* self)
+                {
+                    struct class_Str res = string0_Point_f0f392c072;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_x);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Int_to_string(self->memb_y);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Point_904111ed71_equals(struct class_Point_904111ed71* var1, struct class_Point_904111ed71* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}void meth_Point_904111ed71_print(struct class_Point_904111ed71* var1){int64_t var2;
+struct class_Str var3;
+var3.buf = NULL;
+int64_t var4;
+struct class_Str var5;
+var5.buf = NULL;
+var2 = var1->memb_x;
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+var4 = var1->memb_y;
+var5 = meth_Int_to_string(var4);
+oomph_print(var5);
+out: (void)0;
+string_decref(var5);
+(void)0;
+string_decref(var3);
+(void)0;
+}struct class_Point_904111ed71* meth_Point_904111ed71_add(struct class_Point_904111ed71* var1, struct class_Point_904111ed71* var2){int64_t var3;
+int64_t var4;
+int64_t var5;
+int64_t var6;
+int64_t var7;
+int64_t var8;
+struct class_Point_904111ed71* var9;
+var9 = NULL;
+struct class_Point_904111ed71* retval;
+var3 = var1->memb_x;
+var4 = var2->memb_x;
+var5 = oomph_int_add(var3,var4);
+var6 = var1->memb_y;
+var7 = var2->memb_y;
+var8 = oomph_int_add(var6,var7);
+var9 = ctor_Point_904111ed71(var5,var8);
+retval = var9; var9 = NULL;
+goto out;
+out: (void)0;
+decref((var9), dtor_Point_904111ed71);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_Point_904111ed71
+                #define HEADER_GUARD_Point_904111ed71
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Point_904111ed71 {
+                REFCOUNT_HEADER
+                int64_t memb_x;
+int64_t memb_y;
+
+            };
+            
+            struct class_Point_904111ed71* ctor_Point_904111ed71(int64_t arg_x,int64_t arg_y);
+            void dtor_Point_904111ed71(void *ptr);
+            
+                struct class_Str meth_Point_904111ed71_to_string(struct class_Point_904111ed71* obj);
+                bool meth_Point_904111ed71_equals(struct class_Point_904111ed71* var1, struct class_Point_904111ed71* var2);
+void meth_Point_904111ed71_print(struct class_Point_904111ed71* var1);
+struct class_Point_904111ed71* meth_Point_904111ed71_add(struct class_Point_904111ed71* var1, struct class_Point_904111ed71* var2);
+
+                #endif
+                
@@ -0,0 +1,42 @@
+#include <lib/oomph.h>
+#include "method_7dfb2e859c.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Point_904111ed71.h"
+void oomph_main(void){int64_t var1;
+int64_t var2;
+struct class_Point_904111ed71* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var5;
+struct class_Point_904111ed71* var6;
+var6 = NULL;
+int64_t var7;
+int64_t var8;
+struct class_Point_904111ed71* var9;
+var9 = NULL;
+struct class_Point_904111ed71* var10;
+var10 = NULL;
+var1 = 100LL;
+var2 = 200LL;
+var3 = ctor_Point_904111ed71(var1,var2);
+meth_Point_904111ed71_print(var3);
+var4 = 100LL;
+var5 = 200LL;
+var6 = ctor_Point_904111ed71(var4,var5);
+var7 = 1LL;
+var8 = 2LL;
+var9 = ctor_Point_904111ed71(var7,var8);
+var10 = meth_Point_904111ed71_add(var6,var9);
+meth_Point_904111ed71_print(var10);
+out: (void)0;
+decref((var10), dtor_Point_904111ed71);
+decref((var9), dtor_Point_904111ed71);
+(void)0;
+(void)0;
+decref((var6), dtor_Point_904111ed71);
+(void)0;
+(void)0;
+decref((var3), dtor_Point_904111ed71);
+(void)0;
+(void)0;
+}
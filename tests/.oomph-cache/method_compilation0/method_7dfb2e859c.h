@@ -0,0 +1,13 @@
+
+                #ifndef HEADER_GUARD_method_7dfb2e859c
+                #define HEADER_GUARD_method_7dfb2e859c
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Point_904111ed71;
+struct class_Point_904111ed71;
+struct class_Point_904111ed71;
+struct class_Point_904111ed71;
+void oomph_main(void);
+
+                #endif
+                
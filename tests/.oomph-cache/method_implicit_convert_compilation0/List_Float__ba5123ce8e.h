@@ -0,0 +1,121 @@
+
+                #ifndef HEADER_GUARD_List_Float__ba5123ce8e
+                #define HEADER_GUARD_List_Float__ba5123ce8e
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+#define CONSTRUCTOR ctor_List_Float__ba5123ce8e
+
+#define DESTRUCTOR dtor_List_Float__ba5123ce8e
+
+#define TYPE struct class_List_Float__ba5123ce8e *
+
+#define TYPE_STRUCT class_List_Float__ba5123ce8e
+
+#define METHOD(name) meth_List_Float__ba5123ce8e_##name
+
+#define ITEMTYPE double
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Float_##name
+
+#define INCREF_ITEM(val) (void)0
+
+#define DECREF_ITEM(val) (void)0
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Float__ba5123ce8e___contains(struct class_List_Float__ba5123ce8e*, double);
+void meth_List_Float__ba5123ce8e___reserve(struct class_List_Float__ba5123ce8e*, int64_t);
+double meth_List_Float__ba5123ce8e_delete_at_index(struct class_List_Float__ba5123ce8e*, int64_t);
+struct class_List_Float__ba5123ce8e* meth_List_Float__ba5123ce8e_delete_slice(struct class_List_Float__ba5123ce8e*, int64_t, int64_t);
+bool meth_List_Float__ba5123ce8e_ends_with(struct class_List_Float__ba5123ce8e*, struct class_List_Float__ba5123ce8e*);
+int64_t meth_List_Float__ba5123ce8e_find_first(struct class_List_Float__ba5123ce8e*, double);
+int64_t meth_List_Float__ba5123ce8e_find_last(struct class_List_Float__ba5123ce8e*, double);
+int64_t meth_List_Float__ba5123ce8e_find_only(struct class_List_Float__ba5123ce8e*, double);
+double meth_List_Float__ba5123ce8e_first(struct class_List_Float__ba5123ce8e*);
+double meth_List_Float__ba5123ce8e_get(struct class_List_Float__ba5123ce8e*, int64_t);
+void meth_List_Float__ba5123ce8e_insert(struct class_List_Float__ba5123ce8e*, int64_t, double);
+double meth_List_Float__ba5123ce8e_last(struct class_List_Float__ba5123ce8e*);
+int64_t meth_List_Float__ba5123ce8e_length(struct class_List_Float__ba5123ce8e*);
+double meth_List_Float__ba5123ce8e_pop(struct class_List_Float__ba5123ce8e*);
+void meth_List_Float__ba5123ce8e_push(struct class_List_Float__ba5123ce8e*, double);
+void meth_List_Float__ba5123ce8e_push_all(struct class_List_Float__ba5123ce8e*, struct class_List_Float__ba5123ce8e*);
+void meth_List_Float__ba5123ce8e_delete_first(struct class_List_Float__ba5123ce8e*, double);
+void meth_List_Float__ba5123ce8e_delete_last(struct class_List_Float__ba5123ce8e*, double);
+void meth_List_Float__ba5123ce8e_delete_only(struct class_List_Float__ba5123ce8e*, double);
+struct class_List_Float__ba5123ce8e* meth_List_Float__ba5123ce8e_reversed(struct class_List_Float__ba5123ce8e*);
+struct class_List_Float__ba5123ce8e* meth_List_Float__ba5123ce8e_slice(struct class_List_Float__ba5123ce8e*, int64_t, int64_t);
+bool meth_List_Float__ba5123ce8e_starts_with(struct class_List_Float__ba5123ce8e*, struct class_List_Float__ba5123ce8e*);
+struct class_Str meth_List_Float__ba5123ce8e_to_string(struct class_List_Float__ba5123ce8e*);
+struct class_Str meth_List_Float__ba5123ce8e_join(struct class_List_Float__ba5123ce8e*, struct class_Str);
+bool meth_List_Float__ba5123ce8e_equals(struct class_List_Float__ba5123ce8e*, struct class_List_Float__ba5123ce8e*);
+
+#define CONSTRUCTOR ctor_List_Float__ba5123ce8e
+
+#define DESTRUCTOR dtor_List_Float__ba5123ce8e
+
+#define TYPE struct class_List_Float__ba5123ce8e *
+
+#define TYPE_STRUCT class_List_Float__ba5123ce8e
+
+#define METHOD(name) meth_List_Float__ba5123ce8e_##name
+
+#define ITEMTYPE double
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Float_##name
+
+#define INCREF_ITEM(val) (void)0
+
+#define DECREF_ITEM(val) (void)0
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
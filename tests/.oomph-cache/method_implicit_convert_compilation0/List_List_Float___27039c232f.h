@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_List_Float___27039c232f
+                #define HEADER_GUARD_List_List_Float___27039c232f
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Float__ba5123ce8e.h"
+struct class_List_Float__ba5123ce8e;
+struct class_List_Float__ba5123ce8e;
+struct class_List_Float__ba5123ce8e;
+struct class_List_Float__ba5123ce8e;
+struct class_List_Float__ba5123ce8e;
+struct class_List_Float__ba5123ce8e;
+struct class_List_Float__ba5123ce8e;
+struct class_List_Float__ba5123ce8e;
+struct class_List_Float__ba5123ce8e;
+struct class_List_Float__ba5123ce8e;
+struct class_List_Float__ba5123ce8e;
+struct class_List_Float__ba5123ce8e;
+struct class_List_Float__ba5123ce8e;
+struct class_List_Float__ba5123ce8e;
+
+#define CONSTRUCTOR ctor_List_List_Float___27039c232f
+
+#define DESTRUCTOR dtor_List_List_Float___27039c232f
+
+#define TYPE struct class_List_List_Float___27039c232f *
+
+#define TYPE_STRUCT class_List_List_Float___27039c232f
+
+#define METHOD(name) meth_List_List_Float___27039c232f_##name
+
+#define ITEMTYPE struct class_List_Float__ba5123ce8e*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_List_Float__ba5123ce8e_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_List_Float__ba5123ce8e)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_List_Float___27039c232f___contains(struct class_List_List_Float___27039c232f*, struct class_List_Float__ba5123ce8e*);
+void meth_List_List_Float___27039c232f___reserve(struct class_List_List_Float___27039c232f*, int64_t);
+struct class_List_Float__ba5123ce8e* meth_List_List_Float___27039c232f_delete_at_index(struct class_List_List_Float___27039c232f*, int64_t);
+struct class_List_List_Float___27039c232f* meth_List_List_Float___27039c232f_delete_slice(struct class_List_List_Float___27039c232f*, int64_t, int64_t);
+bool meth_List_List_Float___27039c232f_ends_with(struct class_List_List_Float___27039c232f*, struct class_List_List_Float___27039c232f*);
+int64_t meth_List_List_Float___27039c232f_find_first(struct class_List_List_Float___27039c232f*, struct class_List_Float__ba5123ce8e*);
+int64_t meth_List_List_Float___27039c232f_find_last(struct class_List_List_Float___27039c232f*, struct class_List_Float__ba5123ce8e*);
+int64_t meth_List_List_Float___27039c232f_find_only(struct class_List_List_Float___27039c232f*, struct class_List_Float__ba5123ce8e*);
+struct class_List_Float__ba5123ce8e* meth_List_List_Float___27039c232f_first(struct class_List_List_Float___27039c232f*);
+struct class_List_Float__ba5123ce8e* meth_List_List_Float___27039c232f_get(struct class_List_List_Float___27039c232f*, int64_t);
+void meth_List_List_Float___27039c232f_insert(struct class_List_List_Float___27039c232f*, int64_t, struct class_List_Float__ba5123ce8e*);
+struct class_List_Float__ba5123ce8e* meth_List_List_Float___27039c232f_last(struct class_List_List_Float___27039c232f*);
+int64_t meth_List_List_Float___27039c232f_length(struct class_List_List_Float___27039c232f*);
+struct class_List_Float__ba5123ce8e* meth_List_List_Float___27039c232f_pop(struct class_List_List_Float___27039c232f*);
+void meth_List_List_Float___27039c232f_push(struct class_List_List_Float___27039c232f*, struct class_List_Float__ba5123ce8e*);
+void meth_List_List_Float___27039c232f_push_all(struct class_List_List_Float___27039c232f*, struct class_List_List_Float___27039c232f*);
+void meth_List_List_Float___27039c232f_delete_first(struct class_List_List_Float___27039c232f*, struct class_List_Float__ba5123ce8e*);
+void meth_List_List_Float___27039c232f_delete_last(struct class_List_List_Float___27039c232f*, struct class_List_Float__ba5123ce8e*);
+void meth_List_List_Float___27039c232f_delete_only(struct class_List_List_Float___27039c232f*, struct class_List_Float__ba5123ce8e*);
+struct class_List_List_Float___27039c232f* meth_List_List_Float___27039c232f_reversed(struct class_List_List_Float___27039c232f*);
+struct class_List_List_Float___27039c232f* meth_List_List_Float___27039c232f_slice(struct class_List_List_Float___27039c232f*, int64_t, int64_t);
+bool meth_List_List_Float___27039c232f_starts_with(struct class_List_List_Float___27039c232f*, struct class_List_List_Float___27039c232f*);
+struct class_Str meth_List_List_Float___27039c232f_to_string(struct class_List_List_Float___27039c232f*);
+struct class_Str meth_List_List_Float___27039c232f_join(struct class_List_List_Float___27039c232f*, struct class_Str);
+bool meth_List_List_Float___27039c232f_equals(struct class_List_List_Float___27039c232f*, struct class_List_List_Float___27039c232f*);
+
+#define CONSTRUCTOR ctor_List_List_Float___27039c232f
+
+#define DESTRUCTOR dtor_List_List_Float___27039c232f
+
+#define TYPE struct class_List_List_Float___27039c232f *
+
+#define TYPE_STRUCT class_List_List_Float___27039c232f
+
+#define METHOD(name) meth_List_List_Float___27039c232f_##name
+
+#define ITEMTYPE struct class_List_Float__ba5123ce8e*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_List_Float__ba5123ce8e_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_List_Float__ba5123ce8e)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,54 @@
+#include <lib/oomph.h>
+#include "method_implicit_convert_0d56b1601a.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Float__ba5123ce8e.h"
+#include "List_List_Float___27039c232f.h"
+void oomph_main(void){struct class_List_List_Float___27039c232f* var1;
+var1 = NULL;
+int64_t var2;
+struct class_List_Float__ba5123ce8e* var4;
+var4 = NULL;
+double var6;
+double var7;
+struct class_List_Float__ba5123ce8e* var8;
+var8 = NULL;
+int64_t var9;
+struct class_List_Float__ba5123ce8e* var11;
+var11 = NULL;
+double var13;
+struct class_Str var14;
+var14.buf = NULL;
+var1 = ctor_List_List_Float___27039c232f();
+var2 = 0LL;
+label3: (void)0;
+if (var2 >= var1->len) goto label5;
+decref((var4), dtor_List_Float__ba5123ce8e); var4 = var1->data[var2++]; incref(var4);
+var6 = 1.0;
+meth_List_Float__ba5123ce8e_push(var4,var6);
+if (oomph_true) goto label3;
+label5: (void)0;
+var7 = 1.2;
+var8 = ctor_List_Float__ba5123ce8e();
+meth_List_Float__ba5123ce8e_push(var8,var7);
+meth_List_List_Float___27039c232f_push(var1,var8);
+var9 = 0LL;
+label10: (void)0;
+if (var9 >= var1->len) goto label12;
+var11 = var1->data[var9++];
+var13 = 1.0;
+meth_List_Float__ba5123ce8e_push(var11,var13);
+if (oomph_true) goto label10;
+label12: (void)0;
+var14 = meth_List_List_Float___27039c232f_to_string(var1);
+oomph_print(var14);
+out: (void)0;
+string_decref(var14);
+(void)0;
+(void)0;
+decref((var8), dtor_List_Float__ba5123ce8e);
+(void)0;
+(void)0;
+decref((var4), dtor_List_Float__ba5123ce8e);
+(void)0;
+decref((var1), dtor_List_List_Float___27039c232f);
+}
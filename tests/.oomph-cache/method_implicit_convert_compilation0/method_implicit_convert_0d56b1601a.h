@@ -0,0 +1,13 @@
+
+                #ifndef HEADER_GUARD_method_implicit_convert_0d56b1601a
+                #define HEADER_GUARD_method_implicit_convert_0d56b1601a
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_List_Float___27039c232f;
+struct class_List_Float__ba5123ce8e;
+struct class_List_Float__ba5123ce8e;
+struct class_List_Float__ba5123ce8e;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,44 @@
+#include <lib/oomph.h>
+#include "mkdir_assert_error_2ef9e01a7b.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_io_45f5b8a585.h"
+
+            static struct StringBuf string0_tests_cdbe87d006_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string0_tests_cdbe87d006 = {
+                .buf = &string0_tests_cdbe87d006_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_tests_mkdir_assert_error_oomph_a8f33d59f0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73', '\x2f', '\x6d', '\x6b', '\x64', '\x69', '\x72', '\x5f', '\x61', '\x73', '\x73', '\x65', '\x72', '\x74', '\x5f', '\x65', '\x72', '\x72', '\x6f', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string1_tests_mkdir_assert_error_oomph_a8f33d59f0 = {
+                .buf = &string1_tests_mkdir_assert_error_oomph_a8f33d59f0_buf,
+                .nbytes = 30,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+bool var2;
+struct class_Str var3;
+var3.buf = NULL;
+int64_t var4;
+var1 = string0_tests_cdbe87d006; string_incref(var1);
+bundle_io_45f5b8a585_mkdir(var1);
+var2 = oomph_false;
+var3 = string1_tests_mkdir_assert_error_oomph_a8f33d59f0; string_incref(var3);
+var4 = 5LL;
+oomph_assert(var2,var3,var4);
+out: (void)0;
+(void)0;
+string_decref(var3);
+(void)0;
+string_decref(var1);
+}
@@ -0,0 +1,22 @@
+#include <lib/oomph.h>
+#include "mkdir_error_348d6931b6.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_io_45f5b8a585.h"
+
+            static struct StringBuf string0__foo_7a893e7462_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f', '\x66', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0__foo_7a893e7462 = {
+                .buf = &string0__foo_7a893e7462_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+var1 = string0__foo_7a893e7462; string_incref(var1);
+bundle_io_45f5b8a585_mkdir(var1);
+out: (void)0;
+string_decref(var1);
+}
@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_mkdir_error_348d6931b6
+                #define HEADER_GUARD_mkdir_error_348d6931b6
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_io_45f5b8a585.h"
+void oomph_main(void);
+
+                #endif
+                
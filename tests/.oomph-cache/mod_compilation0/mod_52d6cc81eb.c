@@ -0,0 +1,141 @@
+#include <lib/oomph.h>
+#include "mod_52d6cc81eb.h"
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void){int64_t var1;
+struct class_Str var2;
+var2.buf = NULL;
+int64_t var3;
+struct class_Str var4;
+var4.buf = NULL;
+int64_t var5;
+struct class_Str var6;
+var6.buf = NULL;
+int64_t var7;
+struct class_Str var8;
+var8.buf = NULL;
+int64_t var9;
+struct class_Str var10;
+var10.buf = NULL;
+int64_t var11;
+struct class_Str var12;
+var12.buf = NULL;
+int64_t var13;
+struct class_Str var14;
+var14.buf = NULL;
+int64_t var15;
+struct class_Str var16;
+var16.buf = NULL;
+int64_t var17;
+struct class_Str var18;
+var18.buf = NULL;
+int64_t var19;
+struct class_Str var20;
+var20.buf = NULL;
+double var21;
+double var22;
+double var23;
+struct class_Str var24;
+var24.buf = NULL;
+double var25;
+double var26;
+double var27;
+struct class_Str var28;
+var28.buf = NULL;
+double var29;
+double var30;
+double var31;
+struct class_Str var32;
+var32.buf = NULL;
+double var33;
+double var34;
+double var35;
+struct class_Str var36;
+var36.buf = NULL;
+var1 = 2LL;
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+var3 = 2LL;
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+var5 = 2LL;
+var6 = meth_Int_to_string(var5);
+oomph_print(var6);
+var7 = 2LL;
+var8 = meth_Int_to_string(var7);
+oomph_print(var8);
+var9 = -3LL;
+var10 = meth_Int_to_string(var9);
+oomph_print(var10);
+var11 = -3LL;
+var12 = meth_Int_to_string(var11);
+oomph_print(var12);
+var13 = -3LL;
+var14 = meth_Int_to_string(var13);
+oomph_print(var14);
+var15 = -3LL;
+var16 = meth_Int_to_string(var15);
+oomph_print(var16);
+var17 = 0LL;
+var18 = meth_Int_to_string(var17);
+oomph_print(var18);
+var19 = 0LL;
+var20 = meth_Int_to_string(var19);
+oomph_print(var20);
+var21 = 2.5;
+var22 = 1.0;
+var23 = oomph_float_mod(var22,var21);
+var24 = meth_Float_to_string(var23);
+oomph_print(var24);
+var25 = -1.5;
+var26 = 2.5;
+var27 = oomph_float_mod(var25,var26);
+var28 = meth_Float_to_string(var27);
+oomph_print(var28);
+var29 = -2.5;
+var30 = 1.0;
+var31 = oomph_float_mod(var30,var29);
+var32 = meth_Float_to_string(var31);
+oomph_print(var32);
+var33 = -1.5;
+var34 = -2.5;
+var35 = oomph_float_mod(var33,var34);
+var36 = meth_Float_to_string(var35);
+oomph_print(var36);
+out: (void)0;
+string_decref(var36);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var32);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var28);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var24);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var20);
+(void)0;
+string_decref(var18);
+(void)0;
+string_decref(var16);
+(void)0;
+string_decref(var14);
+(void)0;
+string_decref(var12);
+(void)0;
+string_decref(var10);
+(void)0;
+string_decref(var8);
+(void)0;
+string_decref(var6);
+(void)0;
+string_decref(var4);
+(void)0;
+string_decref(var2);
+(void)0;
+}
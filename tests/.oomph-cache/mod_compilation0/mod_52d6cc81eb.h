@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_mod_52d6cc81eb
+                #define HEADER_GUARD_mod_52d6cc81eb
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
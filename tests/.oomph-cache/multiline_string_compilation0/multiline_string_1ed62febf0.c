@@ -0,0 +1,67 @@
+#include <lib/oomph.h>
+#include "multiline_string_1ed62febf0.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Hello_world__This_is_a__multiline_string___Blah_blah_blah__Yadda_yadda_yadda__Some_code__Lol_d12a483ea1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x48', '\x65', '\x6c', '\x6c', '\x6f', '\x20', '\x77', '\x6f', '\x72', '\x6c', '\x64', '\x21', '\x0a', '\x54', '\x68', '\x69', '\x73', '\x20', '\x69', '\x73', '\x20', '\x61', '\x20', '\x22', '\x6d', '\x75', '\x6c', '\x74', '\x69', '\x6c', '\x69', '\x6e', '\x65', '\x20', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x22', '\x2e', '\x0a', '\x42', '\x6c', '\x61', '\x68', '\x20', '\x62', '\x6c', '\x61', '\x68', '\x20', '\x62', '\x6c', '\x61', '\x68', '\x2e', '\x20', '\x59', '\x61', '\x64', '\x64', '\x61', '\x20', '\x79', '\x61', '\x64', '\x64', '\x61', '\x20', '\x79', '\x61', '\x64', '\x64', '\x61', '\x2e', '\x20', '\x53', '\x6f', '\x6d', '\x65', '\x20', '\x63', '\x6f', '\x64', '\x65', '\x2e', '\x0a', '\x4c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Hello_world__This_is_a__multiline_string___Blah_blah_blah__Yadda_yadda_yadda__Some_code__Lol_d12a483ea1 = {
+                .buf = &string0_Hello_world__This_is_a__multiline_string___Blah_blah_blah__Yadda_yadda_yadda__Some_code__Lol_d12a483ea1_buf,
+                .nbytes = 92,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_This_is_another_multiline_string__Value_of_x_is__a6d36ed067_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x68', '\x69', '\x73', '\x20', '\x69', '\x73', '\x20', '\x61', '\x6e', '\x6f', '\x74', '\x68', '\x65', '\x72', '\x20', '\x6d', '\x75', '\x6c', '\x74', '\x69', '\x6c', '\x69', '\x6e', '\x65', '\x20', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x2e', '\x0a', '\x56', '\x61', '\x6c', '\x75', '\x65', '\x20', '\x6f', '\x66', '\x20', '\x78', '\x20', '\x69', '\x73', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string1_This_is_another_multiline_string__Value_of_x_is__a6d36ed067 = {
+                .buf = &string1_This_is_another_multiline_string__Value_of_x_is__a6d36ed067_buf,
+                .nbytes = 48,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2___fc457e7007_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e' },
+                .malloced = false,
+            };
+            static struct class_Str string2___fc457e7007 = {
+                .buf = &string2___fc457e7007_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+int64_t var2;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+var1 = string0_Hello_world__This_is_a__multiline_string___Blah_blah_blah__Yadda_yadda_yadda__Some_code__Lol_d12a483ea1; string_incref(var1);
+oomph_print(var1);
+var2 = 1LL;
+var3 = string1_This_is_another_multiline_string__Value_of_x_is__a6d36ed067; string_incref(var3);
+var4 = meth_Int_to_string(var2);
+var5 = oomph_string_concat(var3,var4);
+var6 = string2___fc457e7007; string_incref(var6);
+var7 = oomph_string_concat(var5,var6);
+oomph_print(var7);
+out: (void)0;
+string_decref(var7);
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+(void)0;
+string_decref(var1);
+}
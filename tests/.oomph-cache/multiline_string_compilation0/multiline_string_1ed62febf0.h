@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_multiline_string_1ed62febf0
+                #define HEADER_GUARD_multiline_string_1ed62febf0
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,49 @@
+#include <lib/oomph.h>
+#include "Foo_1e9cfb5ec1.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo_fecc79446e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_fecc79446e = {
+                .buf = &string0_Foo_fecc79446e_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Foo_1e9cfb5ec1* ctor_Foo_1e9cfb5ec1(void)
+            {
+                struct class_Foo_1e9cfb5ec1* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_Foo_1e9cfb5ec1(void *ptr)
+            {
+                struct class_Foo_1e9cfb5ec1 *obj = ptr;
+                
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo_1e9cfb5ec1_to_string(struct class_Foo_1e9cfb5ec1* self)
+                {
+                    struct class_Str res = string0_Foo_fecc79446e;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_1e9cfb5ec1_equals(struct class_Foo_1e9cfb5ec1* var1, struct class_Foo_1e9cfb5ec1* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Foo_1e9cfb5ec1
+                #define HEADER_GUARD_Foo_1e9cfb5ec1
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_1e9cfb5ec1 {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Foo_1e9cfb5ec1* ctor_Foo_1e9cfb5ec1(void);
+            void dtor_Foo_1e9cfb5ec1(void *ptr);
+            
+                struct class_Str meth_Foo_1e9cfb5ec1_to_string(struct class_Foo_1e9cfb5ec1* obj);
+                bool meth_Foo_1e9cfb5ec1_equals(struct class_Foo_1e9cfb5ec1* var1, struct class_Foo_1e9cfb5ec1* var2);
+
+                #endif
+                
@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Foo_dd51798f4b
+                #define HEADER_GUARD_Foo_dd51798f4b
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_dd51798f4b {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Foo_dd51798f4b* ctor_Foo_dd51798f4b(void);
+            void dtor_Foo_dd51798f4b(void *ptr);
+            
+                struct class_Str meth_Foo_dd51798f4b_to_string(struct class_Foo_dd51798f4b* obj);
+                bool meth_Foo_dd51798f4b_equals(struct class_Foo_dd51798f4b* var1, struct class_Foo_dd51798f4b* var2);
+
+                #endif
+                
@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_Foo__0049b85012
+                #define HEADER_GUARD_List_Foo__0049b85012
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_1e9cfb5ec1.h"
+struct class_Foo_1e9cfb5ec1;
+struct class_Foo_1e9cfb5ec1;
+struct class_Foo_1e9cfb5ec1;
+struct class_Foo_1e9cfb5ec1;
+struct class_Foo_1e9cfb5ec1;
+struct class_Foo_1e9cfb5ec1;
+struct class_Foo_1e9cfb5ec1;
+struct class_Foo_1e9cfb5ec1;
+struct class_Foo_1e9cfb5ec1;
+struct class_Foo_1e9cfb5ec1;
+struct class_Foo_1e9cfb5ec1;
+struct class_Foo_1e9cfb5ec1;
+struct class_Foo_1e9cfb5ec1;
+struct class_Foo_1e9cfb5ec1;
+
+#define CONSTRUCTOR ctor_List_Foo__0049b85012
+
+#define DESTRUCTOR dtor_List_Foo__0049b85012
+
+#define TYPE struct class_List_Foo__0049b85012 *
+
+#define TYPE_STRUCT class_List_Foo__0049b85012
+
+#define METHOD(name) meth_List_Foo__0049b85012_##name
+
+#define ITEMTYPE struct class_Foo_1e9cfb5ec1*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Foo_1e9cfb5ec1_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Foo_1e9cfb5ec1)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Foo__0049b85012___contains(struct class_List_Foo__0049b85012*, struct class_Foo_1e9cfb5ec1*);
+void meth_List_Foo__0049b85012___reserve(struct class_List_Foo__0049b85012*, int64_t);
+struct class_Foo_1e9cfb5ec1* meth_List_Foo__0049b85012_delete_at_index(struct class_List_Foo__0049b85012*, int64_t);
+struct class_List_Foo__0049b85012* meth_List_Foo__0049b85012_delete_slice(struct class_List_Foo__0049b85012*, int64_t, int64_t);
+bool meth_List_Foo__0049b85012_ends_with(struct class_List_Foo__0049b85012*, struct class_List_Foo__0049b85012*);
+int64_t meth_List_Foo__0049b85012_find_first(struct class_List_Foo__0049b85012*, struct class_Foo_1e9cfb5ec1*);
+int64_t meth_List_Foo__0049b85012_find_last(struct class_List_Foo__0049b85012*, struct class_Foo_1e9cfb5ec1*);
+int64_t meth_List_Foo__0049b85012_find_only(struct class_List_Foo__0049b85012*, struct class_Foo_1e9cfb5ec1*);
+struct class_Foo_1e9cfb5ec1* meth_List_Foo__0049b85012_first(struct class_List_Foo__0049b85012*);
+struct class_Foo_1e9cfb5ec1* meth_List_Foo__0049b85012_get(struct class_List_Foo__0049b85012*, int64_t);
+void meth_List_Foo__0049b85012_insert(struct class_List_Foo__0049b85012*, int64_t, struct class_Foo_1e9cfb5ec1*);
+struct class_Foo_1e9cfb5ec1* meth_List_Foo__0049b85012_last(struct class_List_Foo__0049b85012*);
+int64_t meth_List_Foo__0049b85012_length(struct class_List_Foo__0049b85012*);
+struct class_Foo_1e9cfb5ec1* meth_List_Foo__0049b85012_pop(struct class_List_Foo__0049b85012*);
+void meth_List_Foo__0049b85012_push(struct class_List_Foo__0049b85012*, struct class_Foo_1e9cfb5ec1*);
+void meth_List_Foo__0049b85012_push_all(struct class_List_Foo__0049b85012*, struct class_List_Foo__0049b85012*);
+void meth_List_Foo__0049b85012_delete_first(struct class_List_Foo__0049b85012*, struct class_Foo_1e9cfb5ec1*);
+void meth_List_Foo__0049b85012_delete_last(struct class_List_Foo__0049b85012*, struct class_Foo_1e9cfb5ec1*);
+void meth_List_Foo__0049b85012_delete_only(struct class_List_Foo__0049b85012*, struct class_Foo_1e9cfb5ec1*);
+struct class_List_Foo__0049b85012* meth_List_Foo__0049b85012_reversed(struct class_List_Foo__0049b85012*);
+struct class_List_Foo__0049b85012* meth_List_Foo__0049b85012_slice(struct class_List_Foo__0049b85012*, int64_t, int64_t);
+bool meth_List_Foo__0049b85012_starts_with(struct class_List_Foo__0049b85012*, struct class_List_Foo__0049b85012*);
+struct class_Str meth_List_Foo__0049b85012_to_string(struct class_List_Foo__0049b85012*);
+struct class_Str meth_List_Foo__0049b85012_join(struct class_List_Foo__0049b85012*, struct class_Str);
+bool meth_List_Foo__0049b85012_equals(struct class_List_Foo__0049b85012*, struct class_List_Foo__0049b85012*);
+
+#define CONSTRUCTOR ctor_List_Foo__0049b85012
+
+#define DESTRUCTOR dtor_List_Foo__0049b85012
+
+#define TYPE struct class_List_Foo__0049b85012 *
+
+#define TYPE_STRUCT class_List_Foo__0049b85012
+
+#define METHOD(name) meth_List_Foo__0049b85012_##name
+
+#define ITEMTYPE struct class_Foo_1e9cfb5ec1*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Foo_1e9cfb5ec1_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Foo_1e9cfb5ec1)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
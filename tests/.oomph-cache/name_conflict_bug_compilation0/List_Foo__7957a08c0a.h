@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_Foo__7957a08c0a
+                #define HEADER_GUARD_List_Foo__7957a08c0a
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_dd51798f4b.h"
+struct class_Foo_dd51798f4b;
+struct class_Foo_dd51798f4b;
+struct class_Foo_dd51798f4b;
+struct class_Foo_dd51798f4b;
+struct class_Foo_dd51798f4b;
+struct class_Foo_dd51798f4b;
+struct class_Foo_dd51798f4b;
+struct class_Foo_dd51798f4b;
+struct class_Foo_dd51798f4b;
+struct class_Foo_dd51798f4b;
+struct class_Foo_dd51798f4b;
+struct class_Foo_dd51798f4b;
+struct class_Foo_dd51798f4b;
+struct class_Foo_dd51798f4b;
+
+#define CONSTRUCTOR ctor_List_Foo__7957a08c0a
+
+#define DESTRUCTOR dtor_List_Foo__7957a08c0a
+
+#define TYPE struct class_List_Foo__7957a08c0a *
+
+#define TYPE_STRUCT class_List_Foo__7957a08c0a
+
+#define METHOD(name) meth_List_Foo__7957a08c0a_##name
+
+#define ITEMTYPE struct class_Foo_dd51798f4b*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Foo_dd51798f4b_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Foo_dd51798f4b)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Foo__7957a08c0a___contains(struct class_List_Foo__7957a08c0a*, struct class_Foo_dd51798f4b*);
+void meth_List_Foo__7957a08c0a___reserve(struct class_List_Foo__7957a08c0a*, int64_t);
+struct class_Foo_dd51798f4b* meth_List_Foo__7957a08c0a_delete_at_index(struct class_List_Foo__7957a08c0a*, int64_t);
+struct class_List_Foo__7957a08c0a* meth_List_Foo__7957a08c0a_delete_slice(struct class_List_Foo__7957a08c0a*, int64_t, int64_t);
+bool meth_List_Foo__7957a08c0a_ends_with(struct class_List_Foo__7957a08c0a*, struct class_List_Foo__7957a08c0a*);
+int64_t meth_List_Foo__7957a08c0a_find_first(struct class_List_Foo__7957a08c0a*, struct class_Foo_dd51798f4b*);
+int64_t meth_List_Foo__7957a08c0a_find_last(struct class_List_Foo__7957a08c0a*, struct class_Foo_dd51798f4b*);
+int64_t meth_List_Foo__7957a08c0a_find_only(struct class_List_Foo__7957a08c0a*, struct class_Foo_dd51798f4b*);
+struct class_Foo_dd51798f4b* meth_List_Foo__7957a08c0a_first(struct class_List_Foo__7957a08c0a*);
+struct class_Foo_dd51798f4b* meth_List_Foo__7957a08c0a_get(struct class_List_Foo__7957a08c0a*, int64_t);
+void meth_List_Foo__7957a08c0a_insert(struct class_List_Foo__7957a08c0a*, int64_t, struct class_Foo_dd51798f4b*);
+struct class_Foo_dd51798f4b* meth_List_Foo__7957a08c0a_last(struct class_List_Foo__7957a08c0a*);
+int64_t meth_List_Foo__7957a08c0a_length(struct class_List_Foo__7957a08c0a*);
+struct class_Foo_dd51798f4b* meth_List_Foo__7957a08c0a_pop(struct class_List_Foo__7957a08c0a*);
+void meth_List_Foo__7957a08c0a_push(struct class_List_Foo__7957a08c0a*, struct class_Foo_dd51798f4b*);
+void meth_List_Foo__7957a08c0a_push_all(struct class_List_Foo__7957a08c0a*, struct class_List_Foo__7957a08c0a*);
+void meth_List_Foo__7957a08c0a_delete_first(struct class_List_Foo__7957a08c0a*, struct class_Foo_dd51798f4b*);
+void meth_List_Foo__7957a08c0a_delete_last(struct class_List_Foo__7957a08c0a*, struct class_Foo_dd51798f4b*);
+void meth_List_Foo__7957a08c0a_delete_only(struct class_List_Foo__7957a08c0a*, struct class_Foo_dd51798f4b*);
+struct class_List_Foo__7957a08c0a* meth_List_Foo__7957a08c0a_reversed(struct class_List_Foo__7957a08c0a*);
+struct class_List_Foo__7957a08c0a* meth_List_Foo__7957a08c0a_slice(struct class_List_Foo__7957a08c0a*, int64_t, int64_t);
+bool meth_List_Foo__7957a08c0a_starts_with(struct class_List_Foo__7957a08c0a*, struct class_List_Foo__7957a08c0a*);
+struct class_Str meth_List_Foo__7957a08c0a_to_string(struct class_List_Foo__7957a08c0a*);
+struct class_Str meth_List_Foo__7957a08c0a_join(struct class_List_Foo__7957a08c0a*, struct class_Str);
+bool meth_List_Foo__7957a08c0a_equals(struct class_List_Foo__7957a08c0a*, struct class_List_Foo__7957a08c0a*);
+
+#define CONSTRUCTOR ctor_List_Foo__7957a08c0a
+
+#define DESTRUCTOR dtor_List_Foo__7957a08c0a
+
+#define TYPE struct class_List_Foo__7957a08c0a *
+
+#define TYPE_STRUCT class_List_Foo__7957a08c0a
+
+#define METHOD(name) meth_List_Foo__7957a08c0a_##name
+
+#define ITEMTYPE struct class_Foo_dd51798f4b*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Foo_dd51798f4b_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Foo_dd51798f4b)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,4 @@
+#include <lib/oomph.h>
+#include "a_lib_0841e65b8d.h"
+#include "bundle_builtins_c399a735f1.h"
+
@@ -0,0 +1,8 @@
+
+                #ifndef HEADER_GUARD_a_lib_0841e65b8d
+                #define HEADER_GUARD_a_lib_0841e65b8d
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+                #endif
+                
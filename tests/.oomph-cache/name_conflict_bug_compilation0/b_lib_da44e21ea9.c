@@ -0,0 +1,4 @@
+#include <lib/oomph.h>
+#include "b_lib_da44e21ea9.h"
+#include "bundle_builtins_c399a735f1.h"
+
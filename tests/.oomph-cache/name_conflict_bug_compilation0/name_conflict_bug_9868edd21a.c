@@ -0,0 +1,27 @@
+#include <lib/oomph.h>
+#include "name_conflict_bug_9868edd21a.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_1e9cfb5ec1.h"
+#include "Foo_dd51798f4b.h"
+#include "List_Foo__0049b85012.h"
+#include "List_Foo__7957a08c0a.h"
+void oomph_main(void){struct class_List_Foo__7957a08c0a* var1;
+var1 = NULL;
+struct class_Foo_dd51798f4b* var2;
+var2 = NULL;
+struct class_List_Foo__0049b85012* var3;
+var3 = NULL;
+struct class_Foo_1e9cfb5ec1* var4;
+var4 = NULL;
+var1 = ctor_List_Foo__7957a08c0a();
+var2 = ctor_Foo_dd51798f4b();
+meth_List_Foo__7957a08c0a_push(var1,var2);
+var3 = ctor_List_Foo__0049b85012();
+var4 = ctor_Foo_1e9cfb5ec1();
+meth_List_Foo__0049b85012_push(var3,var4);
+out: (void)0;
+decref((var4), dtor_Foo_1e9cfb5ec1);
+decref((var3), dtor_List_Foo__0049b85012);
+decref((var2), dtor_Foo_dd51798f4b);
+decref((var1), dtor_List_Foo__7957a08c0a);
+}
@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Bar_9b5172fea6
+                #define HEADER_GUARD_Bar_9b5172fea6
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Bar_9b5172fea6 {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Bar_9b5172fea6* ctor_Bar_9b5172fea6(void);
+            void dtor_Bar_9b5172fea6(void *ptr);
+            
+                struct class_Str meth_Bar_9b5172fea6_to_string(struct class_Bar_9b5172fea6* obj);
+                bool meth_Bar_9b5172fea6_equals(struct class_Bar_9b5172fea6* var1, struct class_Bar_9b5172fea6* var2);
+
+                #endif
+                
@@ -0,0 +1,49 @@
+#include <lib/oomph.h>
+#include "Baz_83e90470ca.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Baz_e783b749ca_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x7a' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Baz_e783b749ca = {
+                .buf = &string0_Baz_e783b749ca_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Baz_83e90470ca* ctor_Baz_83e90470ca(void)
+            {
+                struct class_Baz_83e90470ca* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_Baz_83e90470ca(void *ptr)
+            {
+                struct class_Baz_83e90470ca *obj = ptr;
+                
+                free(obj);
+            }
+            
+                struct class_Str meth_Baz_83e90470ca_to_string(struct class_Baz_83e90470ca* self)
+                {
+                    struct class_Str res = string0_Baz_e783b749ca;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Baz_83e90470ca_equals(struct class_Baz_83e90470ca* var1, struct class_Baz_83e90470ca* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Baz_83e90470ca
+                #define HEADER_GUARD_Baz_83e90470ca
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Baz_83e90470ca {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Baz_83e90470ca* ctor_Baz_83e90470ca(void);
+            void dtor_Baz_83e90470ca(void *ptr);
+            
+                struct class_Str meth_Baz_83e90470ca_to_string(struct class_Baz_83e90470ca* obj);
+                bool meth_Baz_83e90470ca_equals(struct class_Baz_83e90470ca* var1, struct class_Baz_83e90470ca* var2);
+
+                #endif
+                
@@ -0,0 +1,117 @@
+#include <lib/oomph.h>
+#include "Flat_ce6a9786cf.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_9b5172fea6.h"
+#include "Baz_83e90470ca.h"
+#include "Foo_8751e19a5d.h"
+
+            static struct StringBuf string0_Flat_2148556fff_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6c', '\x61', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Flat_2148556fff = {
+                .buf = &string0_Flat_2148556fff_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_Flat_ce6a9786cf_to_string(struct class_Flat_ce6a9786cf obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_Bar_9b5172fea6_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Baz_83e90470ca_to_string(obj.val.item1);
+                    break;
+                
+                case 2:
+                    valstr = meth_Foo_8751e19a5d_to_string(obj.val.item2);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Flat_2148556fff), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_Flat_2148556fff;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_Flat_ce6a9786cf_equals(struct class_Flat_ce6a9786cf a, struct class_Flat_ce6a9786cf b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_Bar_9b5172fea6_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Baz_83e90470ca_equals(
+                        a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_Foo_8751e19a5d_equals(
+                        a.val.item2, b.val.item2);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Flat_2148556fff), (int)a.membernum);
+                }
+            }
+            
+            void incref_Flat_ce6a9786cf(struct class_Flat_ce6a9786cf obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                case 2:
+                    incref(obj.val.item2);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_Flat_ce6a9786cf(struct class_Flat_ce6a9786cf obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_Bar_9b5172fea6);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_Baz_83e90470ca);
+                    break;
+                
+                case 2:
+                    decref((obj.val.item2), dtor_Foo_8751e19a5d);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
@@ -0,0 +1,27 @@
+
+                #ifndef HEADER_GUARD_Flat_ce6a9786cf
+                #define HEADER_GUARD_Flat_ce6a9786cf
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Bar_9b5172fea6;
+struct class_Baz_83e90470ca;
+struct class_Foo_8751e19a5d;
+
+            struct class_Flat_ce6a9786cf {
+                union {
+                    	struct class_Bar_9b5172fea6* item0;
+	struct class_Baz_83e90470ca* item1;
+	struct class_Foo_8751e19a5d* item2;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_Flat_ce6a9786cf_to_string(struct class_Flat_ce6a9786cf obj);
+            bool meth_Flat_ce6a9786cf_equals(struct class_Flat_ce6a9786cf a, struct class_Flat_ce6a9786cf b);
+            
+            void incref_Flat_ce6a9786cf(struct class_Flat_ce6a9786cf obj);
+            void decref_Flat_ce6a9786cf(struct class_Flat_ce6a9786cf obj);
+            
+                #endif
+                
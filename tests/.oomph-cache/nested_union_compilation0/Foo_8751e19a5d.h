@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Foo_8751e19a5d
+                #define HEADER_GUARD_Foo_8751e19a5d
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_8751e19a5d {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Foo_8751e19a5d* ctor_Foo_8751e19a5d(void);
+            void dtor_Foo_8751e19a5d(void *ptr);
+            
+                struct class_Str meth_Foo_8751e19a5d_to_string(struct class_Foo_8751e19a5d* obj);
+                bool meth_Foo_8751e19a5d_equals(struct class_Foo_8751e19a5d* var1, struct class_Foo_8751e19a5d* var2);
+
+                #endif
+                
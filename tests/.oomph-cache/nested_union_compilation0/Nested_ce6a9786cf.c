@@ -0,0 +1,100 @@
+#include <lib/oomph.h>
+#include "Nested_ce6a9786cf.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_8751e19a5d.h"
+#include "_Bar___Baz__a56a64ac39.h"
+
+            static struct StringBuf string0_Nested_e3c7e42320_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4e', '\x65', '\x73', '\x74', '\x65', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Nested_e3c7e42320 = {
+                .buf = &string0_Nested_e3c7e42320_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_Nested_ce6a9786cf_to_string(struct class_Nested_ce6a9786cf obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth__Bar___Baz__a56a64ac39_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Foo_8751e19a5d_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Nested_e3c7e42320), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_Nested_e3c7e42320;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_Nested_ce6a9786cf_equals(struct class_Nested_ce6a9786cf a, struct class_Nested_ce6a9786cf b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth__Bar___Baz__a56a64ac39_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Foo_8751e19a5d_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Nested_e3c7e42320), (int)a.membernum);
+                }
+            }
+            
+            void incref_Nested_ce6a9786cf(struct class_Nested_ce6a9786cf obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref__Bar___Baz__a56a64ac39(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_Nested_ce6a9786cf(struct class_Nested_ce6a9786cf obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref__Bar___Baz__a56a64ac39(obj.val.item0);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_Foo_8751e19a5d);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_Nested_ce6a9786cf
+                #define HEADER_GUARD_Nested_ce6a9786cf
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_Bar___Baz__a56a64ac39.h"
+struct class_Foo_8751e19a5d;
+
+            struct class_Nested_ce6a9786cf {
+                union {
+                    	struct class__Bar___Baz__a56a64ac39 item0;
+	struct class_Foo_8751e19a5d* item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_Nested_ce6a9786cf_to_string(struct class_Nested_ce6a9786cf obj);
+            bool meth_Nested_ce6a9786cf_equals(struct class_Nested_ce6a9786cf a, struct class_Nested_ce6a9786cf b);
+            
+            void incref_Nested_ce6a9786cf(struct class_Nested_ce6a9786cf obj);
+            void decref_Nested_ce6a9786cf(struct class_Nested_ce6a9786cf obj);
+            
+                #endif
+                
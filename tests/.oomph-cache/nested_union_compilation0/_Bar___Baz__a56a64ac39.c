@@ -0,0 +1,100 @@
+#include <lib/oomph.h>
+#include "_Bar___Baz__a56a64ac39.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_9b5172fea6.h"
+#include "Baz_83e90470ca.h"
+
+            static struct StringBuf string0__Bar___Baz__3c02a4fde0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x42', '\x61', '\x72', '\x20', '\x7c', '\x20', '\x42', '\x61', '\x7a', '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string0__Bar___Baz__3c02a4fde0 = {
+                .buf = &string0__Bar___Baz__3c02a4fde0_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            struct class_Str meth__Bar___Baz__a56a64ac39_to_string(struct class__Bar___Baz__a56a64ac39 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_Bar_9b5172fea6_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Baz_83e90470ca_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__Bar___Baz__3c02a4fde0), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0__Bar___Baz__3c02a4fde0;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth__Bar___Baz__a56a64ac39_equals(struct class__Bar___Baz__a56a64ac39 a, struct class__Bar___Baz__a56a64ac39 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_Bar_9b5172fea6_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Baz_83e90470ca_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__Bar___Baz__3c02a4fde0), (int)a.membernum);
+                }
+            }
+            
+            void incref__Bar___Baz__a56a64ac39(struct class__Bar___Baz__a56a64ac39 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref__Bar___Baz__a56a64ac39(struct class__Bar___Baz__a56a64ac39 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_Bar_9b5172fea6);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_Baz_83e90470ca);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD__Bar___Baz__a56a64ac39
+                #define HEADER_GUARD__Bar___Baz__a56a64ac39
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Bar_9b5172fea6;
+struct class_Baz_83e90470ca;
+
+            struct class__Bar___Baz__a56a64ac39 {
+                union {
+                    	struct class_Bar_9b5172fea6* item0;
+	struct class_Baz_83e90470ca* item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth__Bar___Baz__a56a64ac39_to_string(struct class__Bar___Baz__a56a64ac39 obj);
+            bool meth__Bar___Baz__a56a64ac39_equals(struct class__Bar___Baz__a56a64ac39 a, struct class__Bar___Baz__a56a64ac39 b);
+            
+            void incref__Bar___Baz__a56a64ac39(struct class__Bar___Baz__a56a64ac39 obj);
+            void decref__Bar___Baz__a56a64ac39(struct class__Bar___Baz__a56a64ac39 obj);
+            
+                #endif
+                
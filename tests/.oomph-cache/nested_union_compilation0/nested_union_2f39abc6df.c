@@ -0,0 +1,42 @@
+#include <lib/oomph.h>
+#include "nested_union_2f39abc6df.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_9b5172fea6.h"
+#include "Flat_ce6a9786cf.h"
+#include "Nested_ce6a9786cf.h"
+#include "_Bar___Baz__a56a64ac39.h"
+void oomph_main(void){struct class_Bar_9b5172fea6* var1;
+var1 = NULL;
+struct class_Flat_ce6a9786cf var2;
+var2.membernum = -1;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Bar_9b5172fea6* var4;
+var4 = NULL;
+struct class__Bar___Baz__a56a64ac39 var5;
+var5.membernum = -1;
+struct class_Nested_ce6a9786cf var6;
+var6.membernum = -1;
+struct class_Str var7;
+var7.buf = NULL;
+var1 = ctor_Bar_9b5172fea6();
+var2 = (struct class_Flat_ce6a9786cf){ .val = { .item0 = var1 }, .membernum = 0 };
+var1 = NULL;
+var3 = meth_Flat_ce6a9786cf_to_string(var2);
+oomph_print(var3);
+var4 = ctor_Bar_9b5172fea6();
+var5 = (struct class__Bar___Baz__a56a64ac39){ .val = { .item0 = var4 }, .membernum = 0 };
+var4 = NULL;
+var6 = (struct class_Nested_ce6a9786cf){ .val = { .item0 = var5 }, .membernum = 0 };
+var5.membernum = -1;
+var7 = meth_Nested_ce6a9786cf_to_string(var6);
+oomph_print(var7);
+out: (void)0;
+string_decref(var7);
+decref_Nested_ce6a9786cf(var6);
+decref__Bar___Baz__a56a64ac39(var5);
+decref((var4), dtor_Bar_9b5172fea6);
+string_decref(var3);
+decref_Flat_ce6a9786cf(var2);
+decref((var1), dtor_Bar_9b5172fea6);
+}
@@ -0,0 +1,14 @@
+
+                #ifndef HEADER_GUARD_nested_union_2f39abc6df
+                #define HEADER_GUARD_nested_union_2f39abc6df
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Flat_ce6a9786cf.h"
+#include "Nested_ce6a9786cf.h"
+#include "_Bar___Baz__a56a64ac39.h"
+struct class_Bar_9b5172fea6;
+struct class_Bar_9b5172fea6;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,8 @@
+
+                #ifndef HEADER_GUARD_error_4d2ce83d39
+                #define HEADER_GUARD_error_4d2ce83d39
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+                #endif
+                
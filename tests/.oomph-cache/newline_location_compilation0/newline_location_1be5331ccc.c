@@ -0,0 +1,74 @@
+#include <lib/oomph.h>
+#include "newline_location_1be5331ccc.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_d6140b9ecf.h"
+
+            static struct StringBuf string0_tests_newline_location_oomph_fd94ee6d95_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73', '\x2f', '\x6e', '\x65', '\x77', '\x6c', '\x69', '\x6e', '\x65', '\x5f', '\x6c', '\x6f', '\x63', '\x61', '\x74', '\x69', '\x6f', '\x6e', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string0_tests_newline_location_oomph_fd94ee6d95 = {
+                .buf = &string0_tests_newline_location_oomph_fd94ee6d95_buf,
+                .nbytes = 28,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1___foo_c3ff1f2698_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x23', '\x20', '\x66', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string1___foo_c3ff1f2698 = {
+                .buf = &string1___foo_c3ff1f2698_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2___0bebdaeba9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string2___0bebdaeba9 = {
+                .buf = &string2___0bebdaeba9_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_this_error_is_right_where_a_newline_is_1ff7ce38f6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x68', '\x69', '\x73', '\x20', '\x65', '\x72', '\x72', '\x6f', '\x72', '\x20', '\x69', '\x73', '\x20', '\x72', '\x69', '\x67', '\x68', '\x74', '\x20', '\x77', '\x68', '\x65', '\x72', '\x65', '\x20', '\x61', '\x20', '\x6e', '\x65', '\x77', '\x6c', '\x69', '\x6e', '\x65', '\x20', '\x69', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string3_this_error_is_right_where_a_newline_is_1ff7ce38f6 = {
+                .buf = &string3_this_error_is_right_where_a_newline_is_1ff7ce38f6_buf,
+                .nbytes = 38,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+int64_t var2;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Location_d6140b9ecf* var5;
+var5 = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+var1 = string0_tests_newline_location_oomph_fd94ee6d95; string_incref(var1);
+var2 = 1LL;
+var3 = string1___foo_c3ff1f2698; string_incref(var3);
+var4 = string2___0bebdaeba9; string_incref(var4);
+var5 = ctor_Location_d6140b9ecf(var1,var2,var3,var4);
+var6 = string3_this_error_is_right_where_a_newline_is_1ff7ce38f6; string_incref(var6);
+meth_Location_d6140b9ecf_print_error(var5,var6);
+out: (void)0;
+string_decref(var6);
+decref((var5), dtor_Location_d6140b9ecf);
+string_decref(var4);
+string_decref(var3);
+(void)0;
+string_decref(var1);
+}
@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_newline_location_1be5331ccc
+                #define HEADER_GUARD_newline_location_1be5331ccc
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_d6140b9ecf;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_no_trailing_newline_9952ff61cb
+                #define HEADER_GUARD_no_trailing_newline_9952ff61cb
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,121 @@
+
+                #ifndef HEADER_GUARD_List_Bool__3b4b12bc11
+                #define HEADER_GUARD_List_Bool__3b4b12bc11
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+#define CONSTRUCTOR ctor_List_Bool__3b4b12bc11
+
+#define DESTRUCTOR dtor_List_Bool__3b4b12bc11
+
+#define TYPE struct class_List_Bool__3b4b12bc11 *
+
+#define TYPE_STRUCT class_List_Bool__3b4b12bc11
+
+#define METHOD(name) meth_List_Bool__3b4b12bc11_##name
+
+#define ITEMTYPE bool
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Bool_##name
+
+#define INCREF_ITEM(val) (void)0
+
+#define DECREF_ITEM(val) (void)0
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Bool__3b4b12bc11___contains(struct class_List_Bool__3b4b12bc11*, bool);
+void meth_List_Bool__3b4b12bc11___reserve(struct class_List_Bool__3b4b12bc11*, int64_t);
+bool meth_List_Bool__3b4b12bc11_delete_at_index(struct class_List_Bool__3b4b12bc11*, int64_t);
+struct class_List_Bool__3b4b12bc11* meth_List_Bool__3b4b12bc11_delete_slice(struct class_List_Bool__3b4b12bc11*, int64_t, int64_t);
+bool meth_List_Bool__3b4b12bc11_ends_with(struct class_List_Bool__3b4b12bc11*, struct class_List_Bool__3b4b12bc11*);
+int64_t meth_List_Bool__3b4b12bc11_find_first(struct class_List_Bool__3b4b12bc11*, bool);
+int64_t meth_List_Bool__3b4b12bc11_find_last(struct class_List_Bool__3b4b12bc11*, bool);
+int64_t meth_List_Bool__3b4b12bc11_find_only(struct class_List_Bool__3b4b12bc11*, bool);
+bool meth_List_Bool__3b4b12bc11_first(struct class_List_Bool__3b4b12bc11*);
+bool meth_List_Bool__3b4b12bc11_get(struct class_List_Bool__3b4b12bc11*, int64_t);
+void meth_List_Bool__3b4b12bc11_insert(struct class_List_Bool__3b4b12bc11*, int64_t, bool);
+bool meth_List_Bool__3b4b12bc11_last(struct class_List_Bool__3b4b12bc11*);
+int64_t meth_List_Bool__3b4b12bc11_length(struct class_List_Bool__3b4b12bc11*);
+bool meth_List_Bool__3b4b12bc11_pop(struct class_List_Bool__3b4b12bc11*);
+void meth_List_Bool__3b4b12bc11_push(struct class_List_Bool__3b4b12bc11*, bool);
+void meth_List_Bool__3b4b12bc11_push_all(struct class_List_Bool__3b4b12bc11*, struct class_List_Bool__3b4b12bc11*);
+void meth_List_Bool__3b4b12bc11_delete_first(struct class_List_Bool__3b4b12bc11*, bool);
+void meth_List_Bool__3b4b12bc11_delete_last(struct class_List_Bool__3b4b12bc11*, bool);
+void meth_List_Bool__3b4b12bc11_delete_only(struct class_List_Bool__3b4b12bc11*, bool);
+struct class_List_Bool__3b4b12bc11* meth_List_Bool__3b4b12bc11_reversed(struct class_List_Bool__3b4b12bc11*);
+struct class_List_Bool__3b4b12bc11* meth_List_Bool__3b4b12bc11_slice(struct class_List_Bool__3b4b12bc11*, int64_t, int64_t);
+bool meth_List_Bool__3b4b12bc11_starts_with(struct class_List_Bool__3b4b12bc11*, struct class_List_Bool__3b4b12bc11*);
+struct class_Str meth_List_Bool__3b4b12bc11_to_string(struct class_List_Bool__3b4b12bc11*);
+struct class_Str meth_List_Bool__3b4b12bc11_join(struct class_List_Bool__3b4b12bc11*, struct class_Str);
+bool meth_List_Bool__3b4b12bc11_equals(struct class_List_Bool__3b4b12bc11*, struct class_List_Bool__3b4b12bc11*);
+
+#define CONSTRUCTOR ctor_List_Bool__3b4b12bc11
+
+#define DESTRUCTOR dtor_List_Bool__3b4b12bc11
+
+#define TYPE struct class_List_Bool__3b4b12bc11 *
+
+#define TYPE_STRUCT class_List_Bool__3b4b12bc11
+
+#define METHOD(name) meth_List_Bool__3b4b12bc11_##name
+
+#define ITEMTYPE bool
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Bool_##name
+
+#define INCREF_ITEM(val) (void)0
+
+#define DECREF_ITEM(val) (void)0
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
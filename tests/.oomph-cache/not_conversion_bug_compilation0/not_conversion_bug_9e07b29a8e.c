@@ -0,0 +1,29 @@
+#include <lib/oomph.h>
+#include "not_conversion_bug_9e07b29a8e.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Bool__3b4b12bc11.h"
+void oomph_main(void){struct class_List_Bool__3b4b12bc11* var1;
+var1 = NULL;
+int64_t var2;
+bool var4;
+bool var6;
+struct class_Str var7;
+var7.buf = NULL;
+var1 = ctor_List_Bool__3b4b12bc11();
+var2 = 0LL;
+label3: (void)0;
+if (var2 >= var1->len) goto label5;
+var4 = var1->data[var2++];
+var6 = oomph_bool_not(var4);
+string_decref(var7);
+var7.buf = NULL;
+var7 = meth_Bool_to_string(var6);
+oomph_print(var7);
+if (oomph_true) goto label3;
+label5: (void)0;
+out: (void)0;
+string_decref(var7);
+(void)0;
+(void)0;
+decref((var1), dtor_List_Bool__3b4b12bc11);
+}
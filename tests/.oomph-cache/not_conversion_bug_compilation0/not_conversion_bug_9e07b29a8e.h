@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_not_conversion_bug_9e07b29a8e
+                #define HEADER_GUARD_not_conversion_bug_9e07b29a8e
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Bool__3b4b12bc11;
+void oomph_main(void);
+
+                #endif
+                
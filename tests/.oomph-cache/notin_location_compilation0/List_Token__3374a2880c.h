@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_Token__3374a2880c
+                #define HEADER_GUARD_List_Token__3374a2880c
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Token_7a77c10982.h"
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+
+#define CONSTRUCTOR ctor_List_Token__3374a2880c
+
+#define DESTRUCTOR dtor_List_Token__3374a2880c
+
+#define TYPE struct class_List_Token__3374a2880c *
+
+#define TYPE_STRUCT class_List_Token__3374a2880c
+
+#define METHOD(name) meth_List_Token__3374a2880c_##name
+
+#define ITEMTYPE struct class_Token_7a77c10982*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Token_7a77c10982_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Token_7a77c10982)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Token__3374a2880c___contains(struct class_List_Token__3374a2880c*, struct class_Token_7a77c10982*);
+void meth_List_Token__3374a2880c___reserve(struct class_List_Token__3374a2880c*, int64_t);
+struct class_Token_7a77c10982* meth_List_Token__3374a2880c_delete_at_index(struct class_List_Token__3374a2880c*, int64_t);
+struct class_List_Token__3374a2880c* meth_List_Token__3374a2880c_delete_slice(struct class_List_Token__3374a2880c*, int64_t, int64_t);
+bool meth_List_Token__3374a2880c_ends_with(struct class_List_Token__3374a2880c*, struct class_List_Token__3374a2880c*);
+int64_t meth_List_Token__3374a2880c_find_first(struct class_List_Token__3374a2880c*, struct class_Token_7a77c10982*);
+int64_t meth_List_Token__3374a2880c_find_last(struct class_List_Token__3374a2880c*, struct class_Token_7a77c10982*);
+int64_t meth_List_Token__3374a2880c_find_only(struct class_List_Token__3374a2880c*, struct class_Token_7a77c10982*);
+struct class_Token_7a77c10982* meth_List_Token__3374a2880c_first(struct class_List_Token__3374a2880c*);
+struct class_Token_7a77c10982* meth_List_Token__3374a2880c_get(struct class_List_Token__3374a2880c*, int64_t);
+void meth_List_Token__3374a2880c_insert(struct class_List_Token__3374a2880c*, int64_t, struct class_Token_7a77c10982*);
+struct class_Token_7a77c10982* meth_List_Token__3374a2880c_last(struct class_List_Token__3374a2880c*);
+int64_t meth_List_Token__3374a2880c_length(struct class_List_Token__3374a2880c*);
+struct class_Token_7a77c10982* meth_List_Token__3374a2880c_pop(struct class_List_Token__3374a2880c*);
+void meth_List_Token__3374a2880c_push(struct class_List_Token__3374a2880c*, struct class_Token_7a77c10982*);
+void meth_List_Token__3374a2880c_push_all(struct class_List_Token__3374a2880c*, struct class_List_Token__3374a2880c*);
+void meth_List_Token__3374a2880c_delete_first(struct class_List_Token__3374a2880c*, struct class_Token_7a77c10982*);
+void meth_List_Token__3374a2880c_delete_last(struct class_List_Token__3374a2880c*, struct class_Token_7a77c10982*);
+void meth_List_Token__3374a2880c_delete_only(struct class_List_Token__3374a2880c*, struct class_Token_7a77c10982*);
+struct class_List_Token__3374a2880c* meth_List_Token__3374a2880c_reversed(struct class_List_Token__3374a2880c*);
+struct class_List_Token__3374a2880c* meth_List_Token__3374a2880c_slice(struct class_List_Token__3374a2880c*, int64_t, int64_t);
+bool meth_List_Token__3374a2880c_starts_with(struct class_List_Token__3374a2880c*, struct class_List_Token__3374a2880c*);
+struct class_Str meth_List_Token__3374a2880c_to_string(struct class_List_Token__3374a2880c*);
+struct class_Str meth_List_Token__3374a2880c_join(struct class_List_Token__3374a2880c*, struct class_Str);
+bool meth_List_Token__3374a2880c_equals(struct class_List_Token__3374a2880c*, struct class_List_Token__3374a2880c*);
+
+#define CONSTRUCTOR ctor_List_Token__3374a2880c
+
+#define DESTRUCTOR dtor_List_Token__3374a2880c
+
+#define TYPE struct class_List_Token__3374a2880c *
+
+#define TYPE_STRUCT class_List_Token__3374a2880c
+
+#define METHOD(name) meth_List_Token__3374a2880c_##name
+
+#define ITEMTYPE struct class_Token_7a77c10982*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Token_7a77c10982_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Token_7a77c10982)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,99 @@
+#include <lib/oomph.h>
+#include "Token_7a77c10982.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Location_d6140b9ecf.h"
+
+            static struct StringBuf string0_Token_89613b5604_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x6f', '\x6b', '\x65', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Token_89613b5604 = {
+                .buf = &string0_Token_89613b5604_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            struct class_Token_7a77c10982* ctor_Token_7a77c10982(struct class_Str arg_type,struct class_Str arg_value,struct class_Location_d6140b9ecf* arg_location)
+            {
+                struct class_Token_7a77c10982* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_type = arg_type;
+obj->memb_value = arg_value;
+obj->memb_location = arg_location;
+
+                string_incref(arg_type);
+string_incref(arg_value);
+incref(arg_location);
+
+                return obj;
+            }
+
+            void dtor_Token_7a77c10982(void *ptr)
+            {
+                struct class_Token_7a77c10982 *obj = ptr;
+                string_decref(obj->memb_type);
+string_decref(obj->memb_value);
+decref((obj->memb_location), dtor_Location_d6140b9ecf);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Token_7a77c10982_to_string(struct class_Token_7a77c10982* self)
+                {
+                    struct class_Str res = string0_Token_89613b5604;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Location_d6140b9ecf_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Token_7a77c10982_equals(struct class_Token_7a77c10982* var1, struct class_Token_7a77c10982* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}bool meth_Token_7a77c10982_matches(struct class_Token_7a77c10982* var1, struct class_Str var2, struct class_Str var3){struct class_Str var4;
+var4.buf = NULL;
+bool var5;
+bool var7;
+struct class_Str var9;
+var9.buf = NULL;
+bool var10;
+bool retval;
+var4 = var1->memb_type;
+string_incref(var4);
+var5 = meth_Str_equals(var4,var2);
+if (var5) goto label6;
+var7 = oomph_false;
+if (oomph_true) goto label8;
+label6: (void)0;
+var9 = var1->memb_value;
+string_incref(var9);
+var10 = meth_Str_equals(var9,var3);
+var7 = var10;
+label8: (void)0;
+(void)0; retval = var7; goto out;
+out: (void)0;
+(void)0;
+string_decref(var9);
+(void)0;
+(void)0;
+string_decref(var4);
+return retval;
+}
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_Token_7a77c10982
+                #define HEADER_GUARD_Token_7a77c10982
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Location_d6140b9ecf;
+struct class_Location_d6140b9ecf;
+
+            struct class_Token_7a77c10982 {
+                REFCOUNT_HEADER
+                struct class_Str memb_type;
+struct class_Str memb_value;
+struct class_Location_d6140b9ecf* memb_location;
+
+            };
+            
+            struct class_Token_7a77c10982* ctor_Token_7a77c10982(struct class_Str arg_type,struct class_Str arg_value,struct class_Location_d6140b9ecf* arg_location);
+            void dtor_Token_7a77c10982(void *ptr);
+            
+                struct class_Str meth_Token_7a77c10982_to_string(struct class_Token_7a77c10982* obj);
+                bool meth_Token_7a77c10982_equals(struct class_Token_7a77c10982* var1, struct class_Token_7a77c10982* var2);
+bool meth_Token_7a77c10982_matches(struct class_Token_7a77c10982* var1, struct class_Str var2, struct class_Str var3);
+
+                #endif
+                
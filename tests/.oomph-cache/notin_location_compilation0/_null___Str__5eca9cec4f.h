@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD__null___Str__5eca9cec4f
+                #define HEADER_GUARD__null___Str__5eca9cec4f
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class__null___Str__5eca9cec4f {
+                union {
+                    	char item0;
+	struct class_Str item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth__null___Str__5eca9cec4f_to_string(struct class__null___Str__5eca9cec4f obj);
+            bool meth__null___Str__5eca9cec4f_equals(struct class__null___Str__5eca9cec4f a, struct class__null___Str__5eca9cec4f b);
+            
+            void incref__null___Str__5eca9cec4f(struct class__null___Str__5eca9cec4f obj);
+            void decref__null___Str__5eca9cec4f(struct class__null___Str__5eca9cec4f obj);
+            struct class_Str meth__null___Str__5eca9cec4f_get(struct class__null___Str__5eca9cec4f obj);
+                #endif
+                
@@ -0,0 +1,4 @@
+#include <lib/oomph.h>
+#include "error_4d2ce83d39.h"
+#include "bundle_builtins_c399a735f1.h"
+
@@ -0,0 +1,72 @@
+#include <lib/oomph.h>
+#include "notin_location_a39ba9ff1b.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Token__3374a2880c.h"
+#include "Token_7a77c10982.h"
+#include "tokenizer_ccb2934fe5.h"
+
+            static struct StringBuf string0_foo_not_in_bar_96d0a72151_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6f', '\x6f', '\x20', '\x6e', '\x6f', '\x74', '\x20', '\x69', '\x6e', '\x20', '\x62', '\x61', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_foo_not_in_bar_96d0a72151 = {
+                .buf = &string0_foo_not_in_bar_96d0a72151_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_filename_oomph_8f18351f4d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x69', '\x6c', '\x65', '\x6e', '\x61', '\x6d', '\x65', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string1_filename_oomph_8f18351f4d = {
+                .buf = &string1_filename_oomph_8f18351f4d_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2__7f0008e781_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string2__7f0008e781 = {
+                .buf = &string2__7f0008e781_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+int64_t var3;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_List_Token__3374a2880c* var5;
+var5 = NULL;
+int64_t var6;
+struct class_Token_7a77c10982* var7;
+var7 = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+var1 = string0_foo_not_in_bar_96d0a72151; string_incref(var1);
+var2 = string1_filename_oomph_8f18351f4d; string_incref(var2);
+var3 = 1LL;
+var4 = string2__7f0008e781; string_incref(var4);
+var5 = tokenizer_ccb2934fe5_tokenize(var1,var2,var3,var4);
+var6 = 1LL;
+var7 = meth_List_Token__3374a2880c_get(var5,var6);
+var8 = meth_Token_7a77c10982_to_string(var7);
+oomph_print(var8);
+out: (void)0;
+string_decref(var8);
+decref((var7), dtor_Token_7a77c10982);
+(void)0;
+decref((var5), dtor_List_Token__3374a2880c);
+string_decref(var4);
+(void)0;
+string_decref(var2);
+string_decref(var1);
+}
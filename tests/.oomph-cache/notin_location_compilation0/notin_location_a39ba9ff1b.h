@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_notin_location_a39ba9ff1b
+                #define HEADER_GUARD_notin_location_a39ba9ff1b
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "tokenizer_ccb2934fe5.h"
+struct class_List_Token__3374a2880c;
+struct class_Token_7a77c10982;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,3883 @@
+#include <lib/oomph.h>
+#include "tokenizer_ccb2934fe5.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Token__3374a2880c.h"
+#include "Location_d6140b9ecf.h"
+#include "Token_7a77c10982.h"
+#include "_null___Str__5eca9cec4f.h"
+
+            static struct StringBuf string0_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ__26c40fe89e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62', '\x63', '\x64', '\x65', '\x66', '\x67', '\x68', '\x69', '\x6a', '\x6b', '\x6c', '\x6d', '\x6e', '\x6f', '\x70', '\x71', '\x72', '\x73', '\x74', '\x75', '\x76', '\x77', '\x78', '\x79', '\x7a', '\x41', '\x42', '\x43', '\x44', '\x45', '\x46', '\x47', '\x48', '\x49', '\x4a', '\x4b', '\x4c', '\x4d', '\x4e', '\x4f', '\x50', '\x51', '\x52', '\x53', '\x54', '\x55', '\x56', '\x57', '\x58', '\x59', '\x5a', '\x5f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ__26c40fe89e = {
+                .buf = &string0_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ__26c40fe89e_buf,
+                .nbytes = 53,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_0123456789_f72fa25eb9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62', '\x63', '\x64', '\x65', '\x66', '\x67', '\x68', '\x69', '\x6a', '\x6b', '\x6c', '\x6d', '\x6e', '\x6f', '\x70', '\x71', '\x72', '\x73', '\x74', '\x75', '\x76', '\x77', '\x78', '\x79', '\x7a', '\x41', '\x42', '\x43', '\x44', '\x45', '\x46', '\x47', '\x48', '\x49', '\x4a', '\x4b', '\x4c', '\x4d', '\x4e', '\x4f', '\x50', '\x51', '\x52', '\x53', '\x54', '\x55', '\x56', '\x57', '\x58', '\x59', '\x5a', '\x5f', '\x30', '\x31', '\x32', '\x33', '\x34', '\x35', '\x36', '\x37', '\x38', '\x39' },
+                .malloced = false,
+            };
+            static struct class_Str string1_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_0123456789_f72fa25eb9 = {
+                .buf = &string1_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_0123456789_f72fa25eb9_buf,
+                .nbytes = 63,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2__3a4b14b752_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string2__3a4b14b752 = {
+                .buf = &string2__3a4b14b752_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3____f499224aec_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string3____f499224aec = {
+                .buf = &string3____f499224aec_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_0123456789_d248592cdd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x30', '\x31', '\x32', '\x33', '\x34', '\x35', '\x36', '\x37', '\x38', '\x39' },
+                .malloced = false,
+            };
+            static struct class_Str string4_0123456789_d248592cdd = {
+                .buf = &string4_0123456789_d248592cdd_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5___20728d44e5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5c' },
+                .malloced = false,
+            };
+            static struct class_Str string5___20728d44e5 = {
+                .buf = &string5___20728d44e5_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6_string_does_not_terminate_079a8df524_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x20', '\x64', '\x6f', '\x65', '\x73', '\x20', '\x6e', '\x6f', '\x74', '\x20', '\x74', '\x65', '\x72', '\x6d', '\x69', '\x6e', '\x61', '\x74', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string6_string_does_not_terminate_079a8df524 = {
+                .buf = &string6_string_does_not_terminate_079a8df524_buf,
+                .nbytes = 25,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7___9e35624995_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string7___9e35624995 = {
+                .buf = &string7___9e35624995_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string8___9e4a377626_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string8___9e4a377626 = {
+                .buf = &string8___9e4a377626_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string9_tests____self_hosted_tokenizer_oomph_1fc92f08e6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73', '\x2f', '\x2e', '\x2e', '\x2f', '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x74', '\x6f', '\x6b', '\x65', '\x6e', '\x69', '\x7a', '\x65', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string9_tests____self_hosted_tokenizer_oomph_1fc92f08e6 = {
+                .buf = &string9_tests____self_hosted_tokenizer_oomph_1fc92f08e6_buf,
+                .nbytes = 36,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string10____173e58179e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x3e' },
+                .malloced = false,
+            };
+            static struct class_Str string10____173e58179e = {
+                .buf = &string10____173e58179e_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string11____c837118b21_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3d', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string11____c837118b21 = {
+                .buf = &string11____c837118b21_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string12____80a9993c85_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x21', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string12____80a9993c85 = {
+                .buf = &string12____80a9993c85_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string13____1f49364b80_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3c', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string13____1f49364b80 = {
+                .buf = &string13____1f49364b80_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string14____3f51cb70c1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3e', '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string14____3f51cb70c1 = {
+                .buf = &string14____3f51cb70c1_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string15___3ff5073c88_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3c' },
+                .malloced = false,
+            };
+            static struct class_Str string15___3ff5073c88 = {
+                .buf = &string15___3ff5073c88_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string16___f9d39b3bff_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3e' },
+                .malloced = false,
+            };
+            static struct class_Str string16___f9d39b3bff = {
+                .buf = &string16___f9d39b3bff_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string17___26a6e05995_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b' },
+                .malloced = false,
+            };
+            static struct class_Str string17___26a6e05995 = {
+                .buf = &string17___26a6e05995_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string18___afbab3e290_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c' },
+                .malloced = false,
+            };
+            static struct class_Str string18___afbab3e290 = {
+                .buf = &string18___afbab3e290_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string19___9177238483_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e' },
+                .malloced = false,
+            };
+            static struct class_Str string19___9177238483 = {
+                .buf = &string19___9177238483_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string20___5dca4e0c44_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string20___5dca4e0c44 = {
+                .buf = &string20___5dca4e0c44_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string21___8688112020_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28' },
+                .malloced = false,
+            };
+            static struct class_Str string21___8688112020 = {
+                .buf = &string21___8688112020_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string22___2736484013_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string22___2736484013 = {
+                .buf = &string22___2736484013_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string23___93b8aa563b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5b' },
+                .malloced = false,
+            };
+            static struct class_Str string23___93b8aa563b = {
+                .buf = &string23___93b8aa563b_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string24___e193d6ad2b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5d' },
+                .malloced = false,
+            };
+            static struct class_Str string24___e193d6ad2b = {
+                .buf = &string24___e193d6ad2b_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string25___05a0668f8f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2b' },
+                .malloced = false,
+            };
+            static struct class_Str string25___05a0668f8f = {
+                .buf = &string25___05a0668f8f_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string26___5d904f1703_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d' },
+                .malloced = false,
+            };
+            static struct class_Str string26___5d904f1703 = {
+                .buf = &string26___5d904f1703_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string27___a41e0d379f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2a' },
+                .malloced = false,
+            };
+            static struct class_Str string27___a41e0d379f = {
+                .buf = &string27___a41e0d379f_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string28___b0d3e4daf1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f' },
+                .malloced = false,
+            };
+            static struct class_Str string28___b0d3e4daf1 = {
+                .buf = &string28___b0d3e4daf1_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string29___125d619f19_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3d' },
+                .malloced = false,
+            };
+            static struct class_Str string29___125d619f19 = {
+                .buf = &string29___125d619f19_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string30___5819b767b8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7c' },
+                .malloced = false,
+            };
+            static struct class_Str string30___5819b767b8 = {
+                .buf = &string30___5819b767b8_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string31_let_a119abca84_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x65', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string31_let_a119abca84 = {
+                .buf = &string31_let_a119abca84_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string32_import_ba0e19c424_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6d', '\x70', '\x6f', '\x72', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string32_import_ba0e19c424 = {
+                .buf = &string32_import_ba0e19c424_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string33_as_6a2b36517e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string33_as_6a2b36517e = {
+                .buf = &string33_as_6a2b36517e_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string34_export_c597b866eb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x78', '\x70', '\x6f', '\x72', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string34_export_c597b866eb = {
+                .buf = &string34_export_c597b866eb_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string35_func_453b4fabdd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x75', '\x6e', '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string35_func_453b4fabdd = {
+                .buf = &string35_func_453b4fabdd_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string36_meth_7ce158e9b3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x65', '\x74', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string36_meth_7ce158e9b3 = {
+                .buf = &string36_meth_7ce158e9b3_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string37_class_2c92b750d9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x6c', '\x61', '\x73', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string37_class_2c92b750d9 = {
+                .buf = &string37_class_2c92b750d9_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string38_typedef_1d661a2809_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x79', '\x70', '\x65', '\x64', '\x65', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string38_typedef_1d661a2809 = {
+                .buf = &string38_typedef_1d661a2809_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string39_switch_ee44d69366_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x77', '\x69', '\x74', '\x63', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string39_switch_ee44d69366 = {
+                .buf = &string39_switch_ee44d69366_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string40_case_89fcdfec00_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x61', '\x73', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string40_case_89fcdfec00 = {
+                .buf = &string40_case_89fcdfec00_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string41_auto_c61a2891fb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x75', '\x74', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string41_auto_c61a2891fb = {
+                .buf = &string41_auto_c61a2891fb_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string42_generic_61521fe905_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x67', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string42_generic_61521fe905 = {
+                .buf = &string42_generic_61521fe905_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string43_new_2fb392f3f1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x65', '\x77' },
+                .malloced = false,
+            };
+            static struct class_Str string43_new_2fb392f3f1 = {
+                .buf = &string43_new_2fb392f3f1_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string44_return_52d4ad5a2e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string44_return_52d4ad5a2e = {
+                .buf = &string44_return_52d4ad5a2e_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string45_pass_cd94ddd362_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x61', '\x73', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string45_pass_cd94ddd362 = {
+                .buf = &string45_pass_cd94ddd362_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string46_mod_e951a5442a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x6f', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string46_mod_e951a5442a = {
+                .buf = &string46_mod_e951a5442a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string47_and_e9cdfc7973_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x6e', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string47_and_e9cdfc7973 = {
+                .buf = &string47_and_e9cdfc7973_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string48_or_4e07f1e590_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string48_or_4e07f1e590 = {
+                .buf = &string48_or_4e07f1e590_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string49_not_74119d62e2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x6f', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string49_not_74119d62e2 = {
+                .buf = &string49_not_74119d62e2_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string50_in_8e94c3bfe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string50_in_8e94c3bfe3 = {
+                .buf = &string50_in_8e94c3bfe3_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string51_if_b0b3230d96_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string51_if_b0b3230d96 = {
+                .buf = &string51_if_b0b3230d96_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string52_elif_ae9ba3ec98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x6c', '\x69', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string52_elif_ae9ba3ec98 = {
+                .buf = &string52_elif_ae9ba3ec98_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string53_else_514775e613_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string53_else_514775e613 = {
+                .buf = &string53_else_514775e613_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string54_while_0fb5265a4b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77', '\x68', '\x69', '\x6c', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string54_while_0fb5265a4b = {
+                .buf = &string54_while_0fb5265a4b_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string55_for_602d1fb247_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6f', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string55_for_602d1fb247 = {
+                .buf = &string55_for_602d1fb247_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string56_foreach_e0b11b2b68_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6f', '\x72', '\x65', '\x61', '\x63', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string56_foreach_e0b11b2b68 = {
+                .buf = &string56_foreach_e0b11b2b68_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string57_of_2041dae915_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string57_of_2041dae915 = {
+                .buf = &string57_of_2041dae915_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string58_continue_db29bfb87d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x6f', '\x6e', '\x74', '\x69', '\x6e', '\x75', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string58_continue_db29bfb87d = {
+                .buf = &string58_continue_db29bfb87d_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string59_break_2de74f5adc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x72', '\x65', '\x61', '\x6b' },
+                .malloced = false,
+            };
+            static struct class_Str string59_break_2de74f5adc = {
+                .buf = &string59_break_2de74f5adc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string60_op_0f0538832e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x70' },
+                .malloced = false,
+            };
+            static struct class_Str string60_op_0f0538832e = {
+                .buf = &string60_op_0f0538832e_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string61___cb299989be_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x22' },
+                .malloced = false,
+            };
+            static struct class_Str string61___cb299989be = {
+                .buf = &string61___cb299989be_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string62___ad82680fac_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x23' },
+                .malloced = false,
+            };
+            static struct class_Str string62___ad82680fac = {
+                .buf = &string62___ad82680fac_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string63_invalid_syntax_8e34d59e63_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x76', '\x61', '\x6c', '\x69', '\x64', '\x20', '\x73', '\x79', '\x6e', '\x74', '\x61', '\x78' },
+                .malloced = false,
+            };
+            static struct class_Str string63_invalid_syntax_8e34d59e63 = {
+                .buf = &string63_invalid_syntax_8e34d59e63_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string64_float_cae4f28ecf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string64_float_cae4f28ecf = {
+                .buf = &string64_float_cae4f28ecf_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string65_int_3be339fea5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string65_int_3be339fea5 = {
+                .buf = &string65_int_3be339fea5_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string66_id_bbfc8a3864_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string66_id_bbfc8a3864 = {
+                .buf = &string66_id_bbfc8a3864_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string67_keyword_3f671b4d6f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6b', '\x65', '\x79', '\x77', '\x6f', '\x72', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string67_keyword_3f671b4d6f = {
+                .buf = &string67_keyword_3f671b4d6f_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string68_skip_fdf8dcabbe_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x6b', '\x69', '\x70' },
+                .malloced = false,
+            };
+            static struct class_Str string68_skip_fdf8dcabbe = {
+                .buf = &string68_skip_fdf8dcabbe_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string69_____e051cfd2f7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x22', '\x22', '\x22' },
+                .malloced = false,
+            };
+            static struct class_Str string69_____e051cfd2f7 = {
+                .buf = &string69_____e051cfd2f7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string70_oneline_string_9dd512d368_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x6e', '\x65', '\x6c', '\x69', '\x6e', '\x65', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string70_oneline_string_9dd512d368 = {
+                .buf = &string70_oneline_string_9dd512d368_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string71_multiline_string_7013e259b2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x75', '\x6c', '\x74', '\x69', '\x6c', '\x69', '\x6e', '\x65', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string71_multiline_string_7013e259b2 = {
+                .buf = &string71_multiline_string_7013e259b2_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string72_indent_74b0f2b7bb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x64', '\x65', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string72_indent_74b0f2b7bb = {
+                .buf = &string72_indent_74b0f2b7bb_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string73_0_08a8d7b7ad_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x30' },
+                .malloced = false,
+            };
+            static struct class_Str string73_0_08a8d7b7ad = {
+                .buf = &string73_0_08a8d7b7ad_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string74_leading_zeros_are_not_allowed_5d37807bb9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x65', '\x61', '\x64', '\x69', '\x6e', '\x67', '\x20', '\x7a', '\x65', '\x72', '\x6f', '\x73', '\x20', '\x61', '\x72', '\x65', '\x20', '\x6e', '\x6f', '\x74', '\x20', '\x61', '\x6c', '\x6c', '\x6f', '\x77', '\x65', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string74_leading_zeros_are_not_allowed_5d37807bb9 = {
+                .buf = &string74_leading_zeros_are_not_allowed_5d37807bb9_buf,
+                .nbytes = 29,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string75_no_matching___09e188e9e3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x6f', '\x20', '\x6d', '\x61', '\x74', '\x63', '\x68', '\x69', '\x6e', '\x67', '\x20', '\x27' },
+                .malloced = false,
+            };
+            static struct class_Str string75_no_matching___09e188e9e3 = {
+                .buf = &string75_no_matching___09e188e9e3_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string76___743502ce91_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27' },
+                .malloced = false,
+            };
+            static struct class_Str string76___743502ce91 = {
+                .buf = &string76___743502ce91_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string77___and___f0e8e886a3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x20', '\x61', '\x6e', '\x64', '\x20', '\x27' },
+                .malloced = false,
+            };
+            static struct class_Str string77___and___f0e8e886a3 = {
+                .buf = &string77___and___f0e8e886a3_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string78___don_t_match_efd015de45_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x20', '\x64', '\x6f', '\x6e', '\x27', '\x74', '\x20', '\x6d', '\x61', '\x74', '\x63', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string78___don_t_match_efd015de45 = {
+                .buf = &string78___don_t_match_efd015de45_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string79_missing___bed4957c8f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x69', '\x73', '\x73', '\x69', '\x6e', '\x67', '\x20', '\x27' },
+                .malloced = false,
+            };
+            static struct class_Str string79_missing___bed4957c8f = {
+                .buf = &string79_missing___bed4957c8f_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string80_not_in_a408c36185_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x6f', '\x74', '\x20', '\x69', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string80_not_in_a408c36185 = {
+                .buf = &string80_not_in_a408c36185_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string81_begin_block_373cb47c14_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x65', '\x67', '\x69', '\x6e', '\x5f', '\x62', '\x6c', '\x6f', '\x63', '\x6b' },
+                .malloced = false,
+            };
+            static struct class_Str string81_begin_block_373cb47c14 = {
+                .buf = &string81_begin_block_373cb47c14_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string82_end_block_beae10de3f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x6e', '\x64', '\x5f', '\x62', '\x6c', '\x6f', '\x63', '\x6b' },
+                .malloced = false,
+            };
+            static struct class_Str string82_end_block_beae10de3f = {
+                .buf = &string82_end_block_beae10de3f_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string83_indentation_must_be_a_multiple_of_4_spaces_d2a7649d5c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x64', '\x65', '\x6e', '\x74', '\x61', '\x74', '\x69', '\x6f', '\x6e', '\x20', '\x6d', '\x75', '\x73', '\x74', '\x20', '\x62', '\x65', '\x20', '\x61', '\x20', '\x6d', '\x75', '\x6c', '\x74', '\x69', '\x70', '\x6c', '\x65', '\x20', '\x6f', '\x66', '\x20', '\x34', '\x20', '\x73', '\x70', '\x61', '\x63', '\x65', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string83_indentation_must_be_a_multiple_of_4_spaces_d2a7649d5c = {
+                .buf = &string83_indentation_must_be_a_multiple_of_4_spaces_d2a7649d5c_buf,
+                .nbytes = 42,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string84_indent_without_____at_end_of_previous_line_2547a62f42_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x64', '\x65', '\x6e', '\x74', '\x20', '\x77', '\x69', '\x74', '\x68', '\x6f', '\x75', '\x74', '\x20', '\x27', '\x3a', '\x27', '\x20', '\x61', '\x74', '\x20', '\x65', '\x6e', '\x64', '\x20', '\x6f', '\x66', '\x20', '\x70', '\x72', '\x65', '\x76', '\x69', '\x6f', '\x75', '\x73', '\x20', '\x6c', '\x69', '\x6e', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string84_indent_without_____at_end_of_previous_line_2547a62f42 = {
+                .buf = &string84_indent_without_____at_end_of_previous_line_2547a62f42_buf,
+                .nbytes = 42,
+                .offset = 0,
+            };
+            struct class__null___Str__5eca9cec4f tokenizer_ccb2934fe5_starts_with_any(struct class_Str var1, struct class_List_Str__43b70c06cb* var2){int64_t var3;
+struct class_Str var5;
+var5.buf = NULL;
+bool var7;
+struct class__null___Str__5eca9cec4f var10;
+var10.membernum = -1;
+char var11;
+struct class__null___Str__5eca9cec4f var12;
+var12.membernum = -1;
+struct class__null___Str__5eca9cec4f retval;
+var3 = 0LL;
+label4: (void)0;
+if (var3 >= var2->len) goto label6;
+var5 = var2->data[var3++];
+var7 = meth_Str_starts_with(var1,var5);
+if (var7) goto label8;
+if (oomph_true) goto label9;
+label8: (void)0;
+var10 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var5 }, .membernum = 1 };
+string_incref(var5);
+retval = var10; var10.membernum = -1;
+goto out;
+label9: (void)0;
+if (oomph_true) goto label4;
+label6: (void)0;
+var11 = oomph_null;
+var12 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var11 }, .membernum = 0 };
+retval = var12; var12.membernum = -1;
+goto out;
+out: (void)0;
+decref__null___Str__5eca9cec4f(var12);
+(void)0;
+decref__null___Str__5eca9cec4f(var10);
+(void)0;
+(void)0;
+return retval;
+}struct class__null___Str__5eca9cec4f tokenizer_ccb2934fe5_get_simple_identifier(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_List_Str__43b70c06cb* var5;
+var5 = NULL;
+struct class__null___Str__5eca9cec4f var6;
+var6.membernum = -1;
+char var7;
+struct class__null___Str__5eca9cec4f var8;
+var8.membernum = -1;
+bool var9;
+char var12;
+struct class__null___Str__5eca9cec4f var13;
+var13.membernum = -1;
+struct class_Str var14;
+var14.buf = NULL;
+struct class__null___Str__5eca9cec4f var16;
+var16.membernum = -1;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_List_Str__43b70c06cb* var19;
+var19 = NULL;
+char var20;
+struct class__null___Str__5eca9cec4f var21;
+var21.membernum = -1;
+bool var22;
+struct class__null___Str__5eca9cec4f var25;
+var25.membernum = -1;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+struct class__null___Str__5eca9cec4f retval;
+var2 = string0_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ__26c40fe89e; string_incref(var2);
+var3 = string1_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_0123456789_f72fa25eb9; string_incref(var3);
+var4 = string2__3a4b14b752; string_incref(var4);
+var5 = meth_Str_split(var2,var4);
+var6 = tokenizer_ccb2934fe5_starts_with_any(var1,var5);
+var7 = oomph_null;
+var8 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var7 }, .membernum = 0 };
+var9 = meth__null___Str__5eca9cec4f_equals(var6,var8);
+if (var9) goto label10;
+if (oomph_true) goto label11;
+label10: (void)0;
+var12 = oomph_null;
+var13 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var12 }, .membernum = 0 };
+retval = var13; var13.membernum = -1;
+goto out;
+label11: (void)0;
+var14 = meth__null___Str__5eca9cec4f_get(var6);
+label15: (void)0;
+decref__null___Str__5eca9cec4f(var16);
+var16.membernum = -1;
+string_decref(var17);
+var17.buf = NULL;
+var17 = meth_Str_remove_prefix(var1,var14);
+string_decref(var18);
+var18.buf = NULL;
+var18 = string2__3a4b14b752; string_incref(var18);
+decref((var19), dtor_List_Str__43b70c06cb);
+var19 = NULL;
+var19 = meth_Str_split(var3,var18);
+var16 = tokenizer_ccb2934fe5_starts_with_any(var17,var19);
+var20 = oomph_null;
+decref__null___Str__5eca9cec4f(var21);
+var21.membernum = -1;
+var21 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var20 }, .membernum = 0 };
+var22 = meth__null___Str__5eca9cec4f_equals(var16,var21);
+if (var22) goto label23;
+if (oomph_true) goto label24;
+label23: (void)0;
+var25 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var14 }, .membernum = 1 };
+var14.buf = NULL;
+retval = var25; var25.membernum = -1;
+goto out;
+label24: (void)0;
+string_decref(var26);
+var26.buf = NULL;
+var26 = meth__null___Str__5eca9cec4f_get(var16);
+var27 = oomph_string_concat(var14,var26);
+string_decref(var14);
+var14 = var27;
+var27.buf = NULL;
+if (oomph_true) goto label15;
+out: (void)0;
+string_decref(var27);
+string_decref(var26);
+decref__null___Str__5eca9cec4f(var25);
+(void)0;
+decref__null___Str__5eca9cec4f(var21);
+(void)0;
+decref((var19), dtor_List_Str__43b70c06cb);
+string_decref(var18);
+string_decref(var17);
+decref__null___Str__5eca9cec4f(var16);
+string_decref(var14);
+decref__null___Str__5eca9cec4f(var13);
+(void)0;
+(void)0;
+decref__null___Str__5eca9cec4f(var8);
+(void)0;
+decref__null___Str__5eca9cec4f(var6);
+decref((var5), dtor_List_Str__43b70c06cb);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+return retval;
+}struct class__null___Str__5eca9cec4f tokenizer_ccb2934fe5_get_identifier(struct class_Str var1){struct class__null___Str__5eca9cec4f var2;
+var2.membernum = -1;
+bool var3;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+bool var9;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class__null___Str__5eca9cec4f var16;
+var16.membernum = -1;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class__null___Str__5eca9cec4f var19;
+var19.membernum = -1;
+struct class__null___Str__5eca9cec4f var20;
+var20.membernum = -1;
+char var21;
+struct class__null___Str__5eca9cec4f var22;
+var22.membernum = -1;
+struct class__null___Str__5eca9cec4f retval;
+var2 = tokenizer_ccb2934fe5_get_simple_identifier(var1);
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) goto label4;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) goto label5;
+label4: (void)0;
+
+            if (var2.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var6 = var2.val.item1;
+            string_incref(var6);
+var7 = meth_Str_remove_prefix(var1,var6);
+var8 = string3____f499224aec; string_incref(var8);
+var9 = meth_Str_starts_with(var7,var8);
+if (var9) goto label10;
+if (oomph_true) goto label11;
+label10: (void)0;
+var12 = string3____f499224aec; string_incref(var12);
+var13 = oomph_string_concat(var6,var12);
+var14 = string3____f499224aec; string_incref(var14);
+var15 = meth_Str_remove_prefix(var7,var14);
+var16 = tokenizer_ccb2934fe5_get_simple_identifier(var15);
+var17 = meth__null___Str__5eca9cec4f_get(var16);
+var18 = oomph_string_concat(var13,var17);
+var19 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var18 }, .membernum = 1 };
+var18.buf = NULL;
+retval = var19; var19.membernum = -1;
+goto out;
+label11: (void)0;
+var20 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var6 }, .membernum = 1 };
+var6.buf = NULL;
+retval = var20; var20.membernum = -1;
+goto out;
+label5: (void)0;
+var21 = oomph_null;
+var22 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var21 }, .membernum = 0 };
+retval = var22; var22.membernum = -1;
+goto out;
+label23: (void)0;
+out: (void)0;
+decref__null___Str__5eca9cec4f(var22);
+(void)0;
+decref__null___Str__5eca9cec4f(var20);
+decref__null___Str__5eca9cec4f(var19);
+string_decref(var18);
+string_decref(var17);
+decref__null___Str__5eca9cec4f(var16);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+(void)0;
+string_decref(var8);
+string_decref(var7);
+string_decref(var6);
+(void)0;
+decref__null___Str__5eca9cec4f(var2);
+return retval;
+}struct class_Str tokenizer_ccb2934fe5_get_int(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+struct class__null___Str__5eca9cec4f var4;
+var4.membernum = -1;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_List_Str__43b70c06cb* var8;
+var8 = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+bool var10;
+struct class_Str var13;
+var13.buf = NULL;
+char var15;
+struct class_Str retval;
+var2 = string2__3a4b14b752; string_incref(var2);
+label3: (void)0;
+decref__null___Str__5eca9cec4f(var4);
+var4.membernum = -1;
+string_decref(var5);
+var5.buf = NULL;
+var5 = meth_Str_remove_prefix(var1,var2);
+string_decref(var6);
+var6.buf = NULL;
+var6 = string4_0123456789_d248592cdd; string_incref(var6);
+string_decref(var7);
+var7.buf = NULL;
+var7 = string2__3a4b14b752; string_incref(var7);
+decref((var8), dtor_List_Str__43b70c06cb);
+var8 = NULL;
+var8 = meth_Str_split(var6,var7);
+var4 = tokenizer_ccb2934fe5_starts_with_any(var5,var8);
+string_decref(var9);
+var9.buf = NULL;
+
+            var10 = (
+                var4.membernum == 1
+            );
+            if (var10) goto label11;
+
+            var10 = (
+                var4.membernum == 0
+            );
+            if (var10) goto label12;
+label11: (void)0;
+
+            if (var4.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var9 = var4.val.item1;
+            string_incref(var9);
+var13 = oomph_string_concat(var2,var9);
+string_decref(var2);
+var2 = var13;
+var13.buf = NULL;
+if (oomph_true) goto label14;
+label12: (void)0;
+
+            if (var4.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var15 = var4.val.item0;
+            retval = var2; var2.buf = NULL;
+goto out;
+label14: (void)0;
+if (oomph_true) goto label3;
+out: (void)0;
+(void)0;
+string_decref(var13);
+(void)0;
+string_decref(var9);
+decref((var8), dtor_List_Str__43b70c06cb);
+string_decref(var7);
+string_decref(var6);
+string_decref(var5);
+decref__null___Str__5eca9cec4f(var4);
+string_decref(var2);
+return retval;
+}struct class_Str tokenizer_ccb2934fe5_extract_string(struct class_Str var1, struct class_Str var2, struct class_Location_d6140b9ecf* var3){struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+bool var7;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+bool var13;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+bool var18;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_List_Str__43b70c06cb* var24;
+var24 = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+bool var27;
+struct class_Str var30;
+var30.buf = NULL;
+struct class_Str retval;
+var4 = var2;
+string_incref(var4);
+label5: (void)0;
+string_decref(var6);
+var6.buf = NULL;
+var6 = meth_Str_remove_prefix(var1,var4);
+var7 = meth_Str_starts_with(var6,var2);
+if (var7) goto label8;
+if (oomph_true) goto label9;
+label8: (void)0;
+var10 = oomph_string_concat(var4,var2);
+retval = var10; var10.buf = NULL;
+goto out;
+label9: (void)0;
+string_decref(var11);
+var11.buf = NULL;
+var11 = meth_Str_remove_prefix(var1,var4);
+string_decref(var12);
+var12.buf = NULL;
+var12 = string5___20728d44e5; string_incref(var12);
+var13 = meth_Str_starts_with(var11,var12);
+if (var13) goto label14;
+if (oomph_true) goto label15;
+label14: (void)0;
+string_decref(var16);
+var16.buf = NULL;
+var16 = string5___20728d44e5; string_incref(var16);
+var17 = oomph_string_concat(var4,var16);
+string_decref(var4);
+var4 = var17;
+var17.buf = NULL;
+label15: (void)0;
+var18 = meth_Str_equals(var1,var4);
+if (var18) goto label19;
+if (oomph_true) goto label20;
+label19: (void)0;
+string_decref(var21);
+var21.buf = NULL;
+var21 = string6_string_does_not_terminate_079a8df524; string_incref(var21);
+meth_Location_d6140b9ecf_error(var3,var21);
+label20: (void)0;
+string_decref(var22);
+var22.buf = NULL;
+var22 = meth_Str_remove_prefix(var1,var4);
+string_decref(var23);
+var23.buf = NULL;
+var23 = string2__3a4b14b752; string_incref(var23);
+decref((var24), dtor_List_Str__43b70c06cb);
+var24 = NULL;
+var24 = meth_Str_split(var22,var23);
+string_decref(var25);
+var25.buf = NULL;
+var25 = meth_List_Str__43b70c06cb_first(var24);
+var26 = oomph_string_concat(var4,var25);
+string_decref(var4);
+var4 = var26;
+var26.buf = NULL;
+var27 = meth_Str_equals(var1,var4);
+if (var27) goto label28;
+if (oomph_true) goto label29;
+label28: (void)0;
+string_decref(var30);
+var30.buf = NULL;
+var30 = string6_string_does_not_terminate_079a8df524; string_incref(var30);
+meth_Location_d6140b9ecf_error(var3,var30);
+label29: (void)0;
+if (oomph_true) goto label5;
+out: (void)0;
+string_decref(var30);
+(void)0;
+string_decref(var26);
+string_decref(var25);
+decref((var24), dtor_List_Str__43b70c06cb);
+string_decref(var23);
+string_decref(var22);
+string_decref(var21);
+(void)0;
+string_decref(var17);
+string_decref(var16);
+(void)0;
+string_decref(var12);
+string_decref(var11);
+string_decref(var10);
+(void)0;
+string_decref(var6);
+string_decref(var4);
+return retval;
+}struct class_Str tokenizer_ccb2934fe5_get_prefix_spaces(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+int64_t var3;
+struct class_Str var5;
+var5.buf = NULL;
+bool var6;
+bool var7;
+int64_t var9;
+int64_t var10;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str retval;
+var2 = var1;
+string_incref(var2);
+var3 = 0LL;
+label4: (void)0;
+string_decref(var5);
+var5.buf = NULL;
+var5 = string7___9e35624995; string_incref(var5);
+var6 = meth_Str_starts_with(var2,var5);
+var7 = oomph_bool_not(var6);
+if (var7) goto label8;
+var9 = 1LL;
+var10 = oomph_int_add(var3,var9);
+var3 = var10;
+string_decref(var11);
+var11.buf = NULL;
+var11 = string7___9e35624995; string_incref(var11);
+var12 = meth_Str_remove_prefix(var2,var11);
+string_decref(var2);
+var2 = var12;
+var12.buf = NULL;
+if (oomph_true) goto label4;
+label8: (void)0;
+var13 = string7___9e35624995; string_incref(var13);
+var14 = meth_Str_repeat(var13,var3);
+retval = var14; var14.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var5);
+(void)0;
+string_decref(var2);
+return retval;
+}struct class_List_Token__3374a2880c* tokenizer_ccb2934fe5_raw_tokenize(struct class_Str var1, struct class_Str var2, int64_t var3, struct class_Str var4){struct class_Str var5;
+var5.buf = NULL;
+int64_t var6;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+bool var9;
+bool var10;
+struct class_Str var11;
+var11.buf = NULL;
+int64_t var12;
+struct class_Str var13;
+var13.buf = NULL;
+bool var14;
+bool var15;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+struct class_Str var28;
+var28.buf = NULL;
+struct class_Str var29;
+var29.buf = NULL;
+struct class_Str var30;
+var30.buf = NULL;
+struct class_Str var31;
+var31.buf = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+struct class_Str var37;
+var37.buf = NULL;
+struct class_Str var38;
+var38.buf = NULL;
+struct class_Str var39;
+var39.buf = NULL;
+struct class_Str var40;
+var40.buf = NULL;
+struct class_Str var41;
+var41.buf = NULL;
+struct class_List_Str__43b70c06cb* var42;
+var42 = NULL;
+struct class_Str var43;
+var43.buf = NULL;
+struct class_Str var44;
+var44.buf = NULL;
+struct class_Str var45;
+var45.buf = NULL;
+struct class_Str var46;
+var46.buf = NULL;
+struct class_Str var47;
+var47.buf = NULL;
+struct class_Str var48;
+var48.buf = NULL;
+struct class_Str var49;
+var49.buf = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+struct class_Str var52;
+var52.buf = NULL;
+struct class_Str var53;
+var53.buf = NULL;
+struct class_Str var54;
+var54.buf = NULL;
+struct class_Str var55;
+var55.buf = NULL;
+struct class_Str var56;
+var56.buf = NULL;
+struct class_Str var57;
+var57.buf = NULL;
+struct class_Str var58;
+var58.buf = NULL;
+struct class_Str var59;
+var59.buf = NULL;
+struct class_Str var60;
+var60.buf = NULL;
+struct class_Str var61;
+var61.buf = NULL;
+struct class_Str var62;
+var62.buf = NULL;
+struct class_Str var63;
+var63.buf = NULL;
+struct class_Str var64;
+var64.buf = NULL;
+struct class_Str var65;
+var65.buf = NULL;
+struct class_Str var66;
+var66.buf = NULL;
+struct class_Str var67;
+var67.buf = NULL;
+struct class_Str var68;
+var68.buf = NULL;
+struct class_Str var69;
+var69.buf = NULL;
+struct class_Str var70;
+var70.buf = NULL;
+struct class_Str var71;
+var71.buf = NULL;
+struct class_List_Str__43b70c06cb* var72;
+var72 = NULL;
+struct class_Str var73;
+var73.buf = NULL;
+struct class_Str var74;
+var74.buf = NULL;
+struct class_Str var75;
+var75.buf = NULL;
+struct class_Location_d6140b9ecf* var76;
+var76 = NULL;
+struct class_Token_7a77c10982* var77;
+var77 = NULL;
+struct class_List_Token__3374a2880c* var78;
+var78 = NULL;
+struct class_Str var80;
+var80.buf = NULL;
+bool var81;
+bool var82;
+bool var83;
+struct class__null___Str__5eca9cec4f var85;
+var85.membernum = -1;
+char var86;
+struct class__null___Str__5eca9cec4f var87;
+var87.membernum = -1;
+bool var88;
+bool var89;
+struct class_Str var91;
+var91.buf = NULL;
+bool var92;
+struct class_Str var94;
+var94.buf = NULL;
+bool var95;
+struct class_Str var97;
+var97.buf = NULL;
+bool var98;
+struct class__null___Str__5eca9cec4f var100;
+var100.membernum = -1;
+char var101;
+struct class__null___Str__5eca9cec4f var102;
+var102.membernum = -1;
+bool var103;
+bool var104;
+struct class_Str var106;
+var106.buf = NULL;
+struct class_Str var107;
+var107.buf = NULL;
+bool var108;
+bool var109;
+struct class_Str var111;
+var111.buf = NULL;
+struct class_List_Str__43b70c06cb* var112;
+var112 = NULL;
+struct class_Str var113;
+var113.buf = NULL;
+struct class_Location_d6140b9ecf* var114;
+var114 = NULL;
+struct class_Str var115;
+var115.buf = NULL;
+struct class_Str var117;
+var117.buf = NULL;
+struct class_Str var118;
+var118.buf = NULL;
+bool var119;
+char var121;
+struct class__null___Str__5eca9cec4f var122;
+var122.membernum = -1;
+struct class__null___Str__5eca9cec4f var123;
+var123.membernum = -1;
+struct class_Str var125;
+var125.buf = NULL;
+struct class_Str var126;
+var126.buf = NULL;
+struct class_Str var127;
+var127.buf = NULL;
+struct class_Str var128;
+var128.buf = NULL;
+struct class_List_Str__43b70c06cb* var129;
+var129 = NULL;
+char var130;
+struct class__null___Str__5eca9cec4f var131;
+var131.membernum = -1;
+bool var132;
+struct class_Str var134;
+var134.buf = NULL;
+struct class_Str var135;
+var135.buf = NULL;
+struct class_Str var136;
+var136.buf = NULL;
+struct class_Str var137;
+var137.buf = NULL;
+struct class_Str var138;
+var138.buf = NULL;
+struct class_Str var139;
+var139.buf = NULL;
+struct class_Str var140;
+var140.buf = NULL;
+struct class_Str var141;
+var141.buf = NULL;
+struct class_Str var142;
+var142.buf = NULL;
+struct class_Str var144;
+var144.buf = NULL;
+struct class_Str var146;
+var146.buf = NULL;
+bool var147;
+struct class_Str var149;
+var149.buf = NULL;
+struct class_Str var151;
+var151.buf = NULL;
+struct class_Str var153;
+var153.buf = NULL;
+struct class_Str var154;
+var154.buf = NULL;
+struct class_List_Str__43b70c06cb* var155;
+var155 = NULL;
+struct class_Str var156;
+var156.buf = NULL;
+struct class_Str var158;
+var158.buf = NULL;
+struct class_List_Str__43b70c06cb* var159;
+var159 = NULL;
+struct class_Str var160;
+var160.buf = NULL;
+struct class_Location_d6140b9ecf* var161;
+var161 = NULL;
+struct class_Str var162;
+var162.buf = NULL;
+bool var163;
+struct class_Str var165;
+var165.buf = NULL;
+struct class_Str var166;
+var166.buf = NULL;
+struct class_List_Str__43b70c06cb* var167;
+var167 = NULL;
+struct class_Str var168;
+var168.buf = NULL;
+struct class_Str var169;
+var169.buf = NULL;
+struct class_Str var170;
+var170.buf = NULL;
+struct class_Str var172;
+var172.buf = NULL;
+struct class_Str var173;
+var173.buf = NULL;
+struct class_Str var174;
+var174.buf = NULL;
+struct class_List_Token__3374a2880c* var176;
+var176 = NULL;
+bool var177;
+bool var178;
+bool var180;
+struct class_Token_7a77c10982* var182;
+var182 = NULL;
+struct class_Str var183;
+var183.buf = NULL;
+struct class_Str var184;
+var184.buf = NULL;
+bool var185;
+struct class_Str var187;
+var187.buf = NULL;
+struct class_Str var188;
+var188.buf = NULL;
+struct class_Str var190;
+var190.buf = NULL;
+struct class_Str var191;
+var191.buf = NULL;
+struct class_Str var192;
+var192.buf = NULL;
+bool var193;
+struct class_Str var195;
+var195.buf = NULL;
+struct class_Str var196;
+var196.buf = NULL;
+bool var197;
+bool var198;
+struct class_Str var201;
+var201.buf = NULL;
+struct class_Str var203;
+var203.buf = NULL;
+struct class_Str var205;
+var205.buf = NULL;
+bool var206;
+bool var207;
+struct class_Location_d6140b9ecf* var210;
+var210 = NULL;
+struct class_Str var211;
+var211.buf = NULL;
+bool var212;
+bool var214;
+struct class_Str var216;
+var216.buf = NULL;
+bool var217;
+bool var219;
+struct class_Str var221;
+var221.buf = NULL;
+bool var222;
+bool var223;
+struct class_Str var226;
+var226.buf = NULL;
+struct class_Token_7a77c10982* var227;
+var227 = NULL;
+struct class_Str var228;
+var228.buf = NULL;
+int64_t var229;
+int64_t var230;
+struct class_Str var231;
+var231.buf = NULL;
+struct class_Str var232;
+var232.buf = NULL;
+struct class_List_Str__43b70c06cb* var233;
+var233 = NULL;
+struct class_Str var234;
+var234.buf = NULL;
+struct class_Str var235;
+var235.buf = NULL;
+struct class_List_Token__3374a2880c* retval;
+var5 = var1;
+string_incref(var5);
+var6 = var3;
+var7 = var4;
+string_incref(var7);
+var8 = string8___9e4a377626; string_incref(var8);
+var9 = meth_Str___contains(var7,var8);
+var10 = oomph_bool_not(var9);
+var11 = string9_tests____self_hosted_tokenizer_oomph_1fc92f08e6; string_incref(var11);
+var12 = 74LL;
+oomph_assert(var10,var11,var12);
+var13 = string8___9e4a377626; string_incref(var13);
+var14 = meth_Str_ends_with(var5,var13);
+var15 = oomph_bool_not(var14);
+if (var15) goto label16;
+if (oomph_true) goto label17;
+label16: (void)0;
+var18 = string8___9e4a377626; string_incref(var18);
+var19 = oomph_string_concat(var5,var18);
+string_decref(var5);
+var5 = var19;
+var19.buf = NULL;
+label17: (void)0;
+var20 = string10____173e58179e; string_incref(var20);
+var21 = string11____c837118b21; string_incref(var21);
+var22 = string12____80a9993c85; string_incref(var22);
+var23 = string13____1f49364b80; string_incref(var23);
+var24 = string14____3f51cb70c1; string_incref(var24);
+var25 = string15___3ff5073c88; string_incref(var25);
+var26 = string16___f9d39b3bff; string_incref(var26);
+var27 = string17___26a6e05995; string_incref(var27);
+var28 = string18___afbab3e290; string_incref(var28);
+var29 = string19___9177238483; string_incref(var29);
+var30 = string20___5dca4e0c44; string_incref(var30);
+var31 = string21___8688112020; string_incref(var31);
+var32 = string22___2736484013; string_incref(var32);
+var33 = string23___93b8aa563b; string_incref(var33);
+var34 = string24___e193d6ad2b; string_incref(var34);
+var35 = string25___05a0668f8f; string_incref(var35);
+var36 = string26___5d904f1703; string_incref(var36);
+var37 = string27___a41e0d379f; string_incref(var37);
+var38 = string28___b0d3e4daf1; string_incref(var38);
+var39 = string29___125d619f19; string_incref(var39);
+var40 = string30___5819b767b8; string_incref(var40);
+var41 = string8___9e4a377626; string_incref(var41);
+var42 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var42,var20);
+meth_List_Str__43b70c06cb_push(var42,var21);
+meth_List_Str__43b70c06cb_push(var42,var22);
+meth_List_Str__43b70c06cb_push(var42,var23);
+meth_List_Str__43b70c06cb_push(var42,var24);
+meth_List_Str__43b70c06cb_push(var42,var25);
+meth_List_Str__43b70c06cb_push(var42,var26);
+meth_List_Str__43b70c06cb_push(var42,var27);
+meth_List_Str__43b70c06cb_push(var42,var28);
+meth_List_Str__43b70c06cb_push(var42,var29);
+meth_List_Str__43b70c06cb_push(var42,var30);
+meth_List_Str__43b70c06cb_push(var42,var31);
+meth_List_Str__43b70c06cb_push(var42,var32);
+meth_List_Str__43b70c06cb_push(var42,var33);
+meth_List_Str__43b70c06cb_push(var42,var34);
+meth_List_Str__43b70c06cb_push(var42,var35);
+meth_List_Str__43b70c06cb_push(var42,var36);
+meth_List_Str__43b70c06cb_push(var42,var37);
+meth_List_Str__43b70c06cb_push(var42,var38);
+meth_List_Str__43b70c06cb_push(var42,var39);
+meth_List_Str__43b70c06cb_push(var42,var40);
+meth_List_Str__43b70c06cb_push(var42,var41);
+var43 = string31_let_a119abca84; string_incref(var43);
+var44 = string32_import_ba0e19c424; string_incref(var44);
+var45 = string33_as_6a2b36517e; string_incref(var45);
+var46 = string34_export_c597b866eb; string_incref(var46);
+var47 = string35_func_453b4fabdd; string_incref(var47);
+var48 = string36_meth_7ce158e9b3; string_incref(var48);
+var49 = string37_class_2c92b750d9; string_incref(var49);
+var50 = string38_typedef_1d661a2809; string_incref(var50);
+var51 = string39_switch_ee44d69366; string_incref(var51);
+var52 = string40_case_89fcdfec00; string_incref(var52);
+var53 = string41_auto_c61a2891fb; string_incref(var53);
+var54 = string42_generic_61521fe905; string_incref(var54);
+var55 = string43_new_2fb392f3f1; string_incref(var55);
+var56 = string44_return_52d4ad5a2e; string_incref(var56);
+var57 = string45_pass_cd94ddd362; string_incref(var57);
+var58 = string46_mod_e951a5442a; string_incref(var58);
+var59 = string47_and_e9cdfc7973; string_incref(var59);
+var60 = string48_or_4e07f1e590; string_incref(var60);
+var61 = string49_not_74119d62e2; string_incref(var61);
+var62 = string50_in_8e94c3bfe3; string_incref(var62);
+var63 = string51_if_b0b3230d96; string_incref(var63);
+var64 = string52_elif_ae9ba3ec98; string_incref(var64);
+var65 = string53_else_514775e613; string_incref(var65);
+var66 = string54_while_0fb5265a4b; string_incref(var66);
+var67 = string55_for_602d1fb247; string_incref(var67);
+var68 = string56_foreach_e0b11b2b68; string_incref(var68);
+var69 = string57_of_2041dae915; string_incref(var69);
+var70 = string58_continue_db29bfb87d; string_incref(var70);
+var71 = string59_break_2de74f5adc; string_incref(var71);
+var72 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var72,var43);
+meth_List_Str__43b70c06cb_push(var72,var44);
+meth_List_Str__43b70c06cb_push(var72,var45);
+meth_List_Str__43b70c06cb_push(var72,var46);
+meth_List_Str__43b70c06cb_push(var72,var47);
+meth_List_Str__43b70c06cb_push(var72,var48);
+meth_List_Str__43b70c06cb_push(var72,var49);
+meth_List_Str__43b70c06cb_push(var72,var50);
+meth_List_Str__43b70c06cb_push(var72,var51);
+meth_List_Str__43b70c06cb_push(var72,var52);
+meth_List_Str__43b70c06cb_push(var72,var53);
+meth_List_Str__43b70c06cb_push(var72,var54);
+meth_List_Str__43b70c06cb_push(var72,var55);
+meth_List_Str__43b70c06cb_push(var72,var56);
+meth_List_Str__43b70c06cb_push(var72,var57);
+meth_List_Str__43b70c06cb_push(var72,var58);
+meth_List_Str__43b70c06cb_push(var72,var59);
+meth_List_Str__43b70c06cb_push(var72,var60);
+meth_List_Str__43b70c06cb_push(var72,var61);
+meth_List_Str__43b70c06cb_push(var72,var62);
+meth_List_Str__43b70c06cb_push(var72,var63);
+meth_List_Str__43b70c06cb_push(var72,var64);
+meth_List_Str__43b70c06cb_push(var72,var65);
+meth_List_Str__43b70c06cb_push(var72,var66);
+meth_List_Str__43b70c06cb_push(var72,var67);
+meth_List_Str__43b70c06cb_push(var72,var68);
+meth_List_Str__43b70c06cb_push(var72,var69);
+meth_List_Str__43b70c06cb_push(var72,var70);
+meth_List_Str__43b70c06cb_push(var72,var71);
+var73 = string60_op_0f0538832e; string_incref(var73);
+var74 = string8___9e4a377626; string_incref(var74);
+var75 = string2__3a4b14b752; string_incref(var75);
+var76 = ctor_Location_d6140b9ecf(var2,var6,var7,var75);
+var77 = ctor_Token_7a77c10982(var73,var74,var76);
+var78 = ctor_List_Token__3374a2880c();
+meth_List_Token__3374a2880c_push(var78,var77);
+label79: (void)0;
+string_decref(var80);
+var80.buf = NULL;
+var80 = string2__3a4b14b752; string_incref(var80);
+var81 = meth_Str_equals(var5,var80);
+var82 = oomph_bool_not(var81);
+var83 = oomph_bool_not(var82);
+if (var83) goto label84;
+decref__null___Str__5eca9cec4f(var85);
+var85.membernum = -1;
+var85 = tokenizer_ccb2934fe5_starts_with_any(var5,var42);
+var86 = oomph_null;
+decref__null___Str__5eca9cec4f(var87);
+var87.membernum = -1;
+var87 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var86 }, .membernum = 0 };
+var88 = meth__null___Str__5eca9cec4f_equals(var85,var87);
+var89 = oomph_bool_not(var88);
+if (var89) goto label90;
+string_decref(var91);
+var91.buf = NULL;
+var91 = string7___9e35624995; string_incref(var91);
+var92 = meth_Str_starts_with(var5,var91);
+if (var92) goto label93;
+string_decref(var94);
+var94.buf = NULL;
+var94 = string61___cb299989be; string_incref(var94);
+var95 = meth_Str_starts_with(var5,var94);
+if (var95) goto label96;
+string_decref(var97);
+var97.buf = NULL;
+var97 = string62___ad82680fac; string_incref(var97);
+var98 = meth_Str_starts_with(var5,var97);
+if (var98) goto label99;
+decref__null___Str__5eca9cec4f(var100);
+var100.membernum = -1;
+var100 = tokenizer_ccb2934fe5_get_identifier(var5);
+var101 = oomph_null;
+decref__null___Str__5eca9cec4f(var102);
+var102.membernum = -1;
+var102 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var101 }, .membernum = 0 };
+var103 = meth__null___Str__5eca9cec4f_equals(var100,var102);
+var104 = oomph_bool_not(var103);
+if (var104) goto label105;
+string_decref(var106);
+var106.buf = NULL;
+var106 = tokenizer_ccb2934fe5_get_int(var5);
+string_decref(var107);
+var107.buf = NULL;
+var107 = string2__3a4b14b752; string_incref(var107);
+var108 = meth_Str_equals(var106,var107);
+var109 = oomph_bool_not(var108);
+if (var109) goto label110;
+string_decref(var111);
+var111.buf = NULL;
+var111 = string8___9e4a377626; string_incref(var111);
+decref((var112), dtor_List_Str__43b70c06cb);
+var112 = NULL;
+var112 = meth_Str_split(var5,var111);
+string_decref(var113);
+var113.buf = NULL;
+var113 = meth_List_Str__43b70c06cb_first(var112);
+decref((var114), dtor_Location_d6140b9ecf);
+var114 = NULL;
+var114 = ctor_Location_d6140b9ecf(var2,var6,var7,var113);
+string_decref(var115);
+var115.buf = NULL;
+var115 = string63_invalid_syntax_8e34d59e63; string_incref(var115);
+meth_Location_d6140b9ecf_error(var114,var115);
+if (oomph_true) goto label116;
+label110: (void)0;
+string_decref(var117);
+var117.buf = NULL;
+var117 = meth_Str_remove_prefix(var5,var106);
+string_decref(var118);
+var118.buf = NULL;
+var118 = string19___9177238483; string_incref(var118);
+var119 = meth_Str_starts_with(var117,var118);
+if (var119) goto label120;
+var121 = oomph_null;
+decref__null___Str__5eca9cec4f(var122);
+var123 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var121 }, .membernum = 0 };
+var122 = var123;
+var123.membernum = -1;
+if (oomph_true) goto label124;
+label120: (void)0;
+decref__null___Str__5eca9cec4f(var122);
+var122.membernum = -1;
+string_decref(var125);
+var125.buf = NULL;
+var125 = string19___9177238483; string_incref(var125);
+string_decref(var126);
+var126.buf = NULL;
+var126 = meth_Str_remove_prefix(var117,var125);
+string_decref(var127);
+var127.buf = NULL;
+var127 = string4_0123456789_d248592cdd; string_incref(var127);
+string_decref(var128);
+var128.buf = NULL;
+var128 = string2__3a4b14b752; string_incref(var128);
+decref((var129), dtor_List_Str__43b70c06cb);
+var129 = NULL;
+var129 = meth_Str_split(var127,var128);
+var122 = tokenizer_ccb2934fe5_starts_with_any(var126,var129);
+label124: (void)0;
+var130 = oomph_null;
+decref__null___Str__5eca9cec4f(var131);
+var131.membernum = -1;
+var131 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var130 }, .membernum = 0 };
+var132 = meth__null___Str__5eca9cec4f_equals(var122,var131);
+if (var132) goto label133;
+var134 = string64_float_cae4f28ecf; string_incref(var134);
+string_decref(var135);
+var135 = var134;
+var134.buf = NULL;
+string_decref(var136);
+var136.buf = NULL;
+var136 = string19___9177238483; string_incref(var136);
+string_decref(var137);
+var137.buf = NULL;
+var137 = oomph_string_concat(var106,var136);
+string_decref(var138);
+var138.buf = NULL;
+string_decref(var139);
+var139.buf = NULL;
+var139 = string19___9177238483; string_incref(var139);
+string_decref(var140);
+var140.buf = NULL;
+var140 = meth_Str_remove_prefix(var117,var139);
+var138 = tokenizer_ccb2934fe5_get_int(var140);
+var141 = oomph_string_concat(var137,var138);
+string_decref(var142);
+var142 = var141;
+var141.buf = NULL;
+if (oomph_true) goto label143;
+label133: (void)0;
+var144 = string65_int_3be339fea5; string_incref(var144);
+string_decref(var135);
+var135 = var144;
+var144.buf = NULL;
+string_decref(var142);
+var142 = var106;
+var106.buf = NULL;
+label143: (void)0;
+label116: (void)0;
+if (oomph_true) goto label145;
+label105: (void)0;
+var146 = meth__null___Str__5eca9cec4f_get(var100);
+string_decref(var142);
+var142 = var146;
+var146.buf = NULL;
+var147 = meth_List_Str__43b70c06cb___contains(var72,var142);
+if (var147) goto label148;
+var149 = string66_id_bbfc8a3864; string_incref(var149);
+string_decref(var135);
+var135 = var149;
+var149.buf = NULL;
+if (oomph_true) goto label150;
+label148: (void)0;
+var151 = string67_keyword_3f671b4d6f; string_incref(var151);
+string_decref(var135);
+var135 = var151;
+var151.buf = NULL;
+label150: (void)0;
+label145: (void)0;
+if (oomph_true) goto label152;
+label99: (void)0;
+var153 = string68_skip_fdf8dcabbe; string_incref(var153);
+string_decref(var135);
+var135 = var153;
+var153.buf = NULL;
+string_decref(var154);
+var154.buf = NULL;
+var154 = string8___9e4a377626; string_incref(var154);
+decref((var155), dtor_List_Str__43b70c06cb);
+var155 = NULL;
+var155 = meth_Str_split(var5,var154);
+var156 = meth_List_Str__43b70c06cb_first(var155);
+string_decref(var142);
+var142 = var156;
+var156.buf = NULL;
+label152: (void)0;
+if (oomph_true) goto label157;
+label96: (void)0;
+string_decref(var158);
+var158.buf = NULL;
+var158 = string8___9e4a377626; string_incref(var158);
+decref((var159), dtor_List_Str__43b70c06cb);
+var159 = NULL;
+var159 = meth_Str_split(var5,var158);
+string_decref(var160);
+var160.buf = NULL;
+var160 = meth_List_Str__43b70c06cb_first(var159);
+decref((var161), dtor_Location_d6140b9ecf);
+var161 = NULL;
+var161 = ctor_Location_d6140b9ecf(var2,var6,var7,var160);
+string_decref(var162);
+var162.buf = NULL;
+var162 = string69_____e051cfd2f7; string_incref(var162);
+var163 = meth_Str_starts_with(var5,var162);
+if (var163) goto label164;
+var165 = string70_oneline_string_9dd512d368; string_incref(var165);
+string_decref(var135);
+var135 = var165;
+var165.buf = NULL;
+string_decref(var166);
+var166.buf = NULL;
+var166 = string8___9e4a377626; string_incref(var166);
+decref((var167), dtor_List_Str__43b70c06cb);
+var167 = NULL;
+var167 = meth_Str_split(var5,var166);
+string_decref(var168);
+var168.buf = NULL;
+var168 = meth_List_Str__43b70c06cb_first(var167);
+string_decref(var169);
+var169.buf = NULL;
+var169 = string61___cb299989be; string_incref(var169);
+var170 = tokenizer_ccb2934fe5_extract_string(var168,var169,var161);
+string_decref(var142);
+var142 = var170;
+var170.buf = NULL;
+if (oomph_true) goto label171;
+label164: (void)0;
+var172 = string71_multiline_string_7013e259b2; string_incref(var172);
+string_decref(var135);
+var135 = var172;
+var172.buf = NULL;
+string_decref(var173);
+var173.buf = NULL;
+var173 = string69_____e051cfd2f7; string_incref(var173);
+var174 = tokenizer_ccb2934fe5_extract_string(var5,var173,var161);
+string_decref(var142);
+var142 = var174;
+var174.buf = NULL;
+label171: (void)0;
+label157: (void)0;
+if (oomph_true) goto label175;
+label93: (void)0;
+decref((var176), dtor_List_Token__3374a2880c);
+var176 = NULL;
+var176 = ctor_List_Token__3374a2880c();
+var177 = meth_List_Token__3374a2880c_equals(var78,var176);
+var178 = oomph_bool_not(var177);
+if (var178) goto label179;
+var180 = oomph_false;
+if (oomph_true) goto label181;
+label179: (void)0;
+decref((var182), dtor_Token_7a77c10982);
+var182 = NULL;
+var182 = meth_List_Token__3374a2880c_last(var78);
+string_decref(var183);
+var183.buf = NULL;
+var183 = string60_op_0f0538832e; string_incref(var183);
+string_decref(var184);
+var184.buf = NULL;
+var184 = string8___9e4a377626; string_incref(var184);
+var185 = meth_Token_7a77c10982_matches(var182,var183,var184);
+var180 = var185;
+label181: (void)0;
+if (var180) goto label186;
+var187 = string68_skip_fdf8dcabbe; string_incref(var187);
+string_decref(var135);
+var135 = var187;
+var187.buf = NULL;
+var188 = string7___9e35624995; string_incref(var188);
+string_decref(var142);
+var142 = var188;
+var188.buf = NULL;
+if (oomph_true) goto label189;
+label186: (void)0;
+var190 = tokenizer_ccb2934fe5_get_prefix_spaces(var5);
+string_decref(var191);
+var191.buf = NULL;
+var191 = meth_Str_remove_prefix(var5,var190);
+string_decref(var192);
+var192.buf = NULL;
+var192 = string62___ad82680fac; string_incref(var192);
+var193 = meth_Str_starts_with(var191,var192);
+if (var193) goto label194;
+string_decref(var195);
+var195.buf = NULL;
+var195 = meth_Str_remove_prefix(var5,var190);
+string_decref(var196);
+var196.buf = NULL;
+var196 = string8___9e4a377626; string_incref(var196);
+var197 = meth_Str_starts_with(var195,var196);
+var198 = var197;
+if (oomph_true) goto label199;
+label194: (void)0;
+var198 = oomph_true;
+label199: (void)0;
+if (var198) goto label200;
+var201 = string72_indent_74b0f2b7bb; string_incref(var201);
+string_decref(var135);
+var135 = var201;
+var201.buf = NULL;
+if (oomph_true) goto label202;
+label200: (void)0;
+var203 = string68_skip_fdf8dcabbe; string_incref(var203);
+string_decref(var135);
+var135 = var203;
+var203.buf = NULL;
+label202: (void)0;
+string_decref(var142);
+var142 = var190;
+var190.buf = NULL;
+label189: (void)0;
+label175: (void)0;
+if (oomph_true) goto label204;
+label90: (void)0;
+string_decref(var135);
+var135.buf = NULL;
+var135 = string60_op_0f0538832e; string_incref(var135);
+string_decref(var142);
+var142.buf = NULL;
+var142 = meth__null___Str__5eca9cec4f_get(var85);
+label204: (void)0;
+string_decref(var205);
+var205.buf = NULL;
+var205 = string68_skip_fdf8dcabbe; string_incref(var205);
+var206 = meth_Str_equals(var135,var205);
+var207 = oomph_bool_not(var206);
+if (var207) goto label208;
+if (oomph_true) goto label209;
+label208: (void)0;
+decref((var210), dtor_Location_d6140b9ecf);
+var210 = NULL;
+var210 = ctor_Location_d6140b9ecf(var2,var6,var7,var142);
+string_decref(var211);
+var211.buf = NULL;
+var211 = string65_int_3be339fea5; string_incref(var211);
+var212 = meth_Str_equals(var135,var211);
+if (var212) goto label213;
+var214 = oomph_false;
+if (oomph_true) goto label215;
+label213: (void)0;
+string_decref(var216);
+var216.buf = NULL;
+var216 = string73_0_08a8d7b7ad; string_incref(var216);
+var217 = meth_Str_starts_with(var142,var216);
+var214 = var217;
+label215: (void)0;
+if (var214) goto label218;
+var219 = oomph_false;
+if (oomph_true) goto label220;
+label218: (void)0;
+string_decref(var221);
+var221.buf = NULL;
+var221 = string73_0_08a8d7b7ad; string_incref(var221);
+var222 = meth_Str_equals(var142,var221);
+var223 = oomph_bool_not(var222);
+var219 = var223;
+label220: (void)0;
+if (var219) goto label224;
+if (oomph_true) goto label225;
+label224: (void)0;
+string_decref(var226);
+var226.buf = NULL;
+var226 = string74_leading_zeros_are_not_allowed_5d37807bb9; string_incref(var226);
+meth_Location_d6140b9ecf_error(var210,var226);
+label225: (void)0;
+decref((var227), dtor_Token_7a77c10982);
+var227 = NULL;
+var227 = ctor_Token_7a77c10982(var135,var142,var210);
+meth_List_Token__3374a2880c_push(var78,var227);
+label209: (void)0;
+string_decref(var228);
+var228.buf = NULL;
+var228 = string8___9e4a377626; string_incref(var228);
+var229 = meth_Str_count(var142,var228);
+var230 = oomph_int_add(var6,var229);
+var6 = var230;
+string_decref(var231);
+var231.buf = NULL;
+var231 = oomph_string_concat(var7,var142);
+string_decref(var232);
+var232.buf = NULL;
+var232 = string8___9e4a377626; string_incref(var232);
+decref((var233), dtor_List_Str__43b70c06cb);
+var233 = NULL;
+var233 = meth_Str_split(var231,var232);
+var234 = meth_List_Str__43b70c06cb_last(var233);
+string_decref(var7);
+var7 = var234;
+var234.buf = NULL;
+var235 = meth_Str_remove_prefix(var5,var142);
+string_decref(var5);
+var5 = var235;
+var235.buf = NULL;
+if (oomph_true) goto label79;
+label84: (void)0;
+retval = var78; var78 = NULL;
+goto out;
+out: (void)0;
+string_decref(var235);
+string_decref(var234);
+decref((var233), dtor_List_Str__43b70c06cb);
+string_decref(var232);
+string_decref(var231);
+(void)0;
+(void)0;
+string_decref(var228);
+decref((var227), dtor_Token_7a77c10982);
+string_decref(var226);
+(void)0;
+(void)0;
+string_decref(var221);
+(void)0;
+(void)0;
+string_decref(var216);
+(void)0;
+(void)0;
+string_decref(var211);
+decref((var210), dtor_Location_d6140b9ecf);
+(void)0;
+(void)0;
+string_decref(var205);
+string_decref(var203);
+string_decref(var201);
+(void)0;
+(void)0;
+string_decref(var196);
+string_decref(var195);
+(void)0;
+string_decref(var192);
+string_decref(var191);
+string_decref(var190);
+string_decref(var188);
+string_decref(var187);
+(void)0;
+string_decref(var184);
+string_decref(var183);
+decref((var182), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+(void)0;
+decref((var176), dtor_List_Token__3374a2880c);
+string_decref(var174);
+string_decref(var173);
+string_decref(var172);
+string_decref(var170);
+string_decref(var169);
+string_decref(var168);
+decref((var167), dtor_List_Str__43b70c06cb);
+string_decref(var166);
+string_decref(var165);
+(void)0;
+string_decref(var162);
+decref((var161), dtor_Location_d6140b9ecf);
+string_decref(var160);
+decref((var159), dtor_List_Str__43b70c06cb);
+string_decref(var158);
+string_decref(var156);
+decref((var155), dtor_List_Str__43b70c06cb);
+string_decref(var154);
+string_decref(var153);
+string_decref(var151);
+string_decref(var149);
+(void)0;
+string_decref(var146);
+string_decref(var144);
+string_decref(var142);
+string_decref(var141);
+string_decref(var140);
+string_decref(var139);
+string_decref(var138);
+string_decref(var137);
+string_decref(var136);
+string_decref(var135);
+string_decref(var134);
+(void)0;
+decref__null___Str__5eca9cec4f(var131);
+(void)0;
+decref((var129), dtor_List_Str__43b70c06cb);
+string_decref(var128);
+string_decref(var127);
+string_decref(var126);
+string_decref(var125);
+decref__null___Str__5eca9cec4f(var123);
+decref__null___Str__5eca9cec4f(var122);
+(void)0;
+(void)0;
+string_decref(var118);
+string_decref(var117);
+string_decref(var115);
+decref((var114), dtor_Location_d6140b9ecf);
+string_decref(var113);
+decref((var112), dtor_List_Str__43b70c06cb);
+string_decref(var111);
+(void)0;
+(void)0;
+string_decref(var107);
+string_decref(var106);
+(void)0;
+(void)0;
+decref__null___Str__5eca9cec4f(var102);
+(void)0;
+decref__null___Str__5eca9cec4f(var100);
+(void)0;
+string_decref(var97);
+(void)0;
+string_decref(var94);
+(void)0;
+string_decref(var91);
+(void)0;
+(void)0;
+decref__null___Str__5eca9cec4f(var87);
+(void)0;
+decref__null___Str__5eca9cec4f(var85);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var80);
+decref((var78), dtor_List_Token__3374a2880c);
+decref((var77), dtor_Token_7a77c10982);
+decref((var76), dtor_Location_d6140b9ecf);
+string_decref(var75);
+string_decref(var74);
+string_decref(var73);
+decref((var72), dtor_List_Str__43b70c06cb);
+string_decref(var71);
+string_decref(var70);
+string_decref(var69);
+string_decref(var68);
+string_decref(var67);
+string_decref(var66);
+string_decref(var65);
+string_decref(var64);
+string_decref(var63);
+string_decref(var62);
+string_decref(var61);
+string_decref(var60);
+string_decref(var59);
+string_decref(var58);
+string_decref(var57);
+string_decref(var56);
+string_decref(var55);
+string_decref(var54);
+string_decref(var53);
+string_decref(var52);
+string_decref(var51);
+string_decref(var50);
+string_decref(var49);
+string_decref(var48);
+string_decref(var47);
+string_decref(var46);
+string_decref(var45);
+string_decref(var44);
+string_decref(var43);
+decref((var42), dtor_List_Str__43b70c06cb);
+string_decref(var41);
+string_decref(var40);
+string_decref(var39);
+string_decref(var38);
+string_decref(var37);
+string_decref(var36);
+string_decref(var35);
+string_decref(var34);
+string_decref(var33);
+string_decref(var32);
+string_decref(var31);
+string_decref(var30);
+string_decref(var29);
+string_decref(var28);
+string_decref(var27);
+string_decref(var26);
+string_decref(var25);
+string_decref(var24);
+string_decref(var23);
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+string_decref(var19);
+string_decref(var18);
+(void)0;
+(void)0;
+string_decref(var13);
+(void)0;
+string_decref(var11);
+(void)0;
+(void)0;
+string_decref(var8);
+string_decref(var7);
+(void)0;
+string_decref(var5);
+return retval;
+}struct class_Str tokenizer_ccb2934fe5_flip_paren(struct class_Str var1){struct class_Str var2;
+var2.buf = NULL;
+bool var3;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+bool var8;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+bool var13;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+bool var18;
+struct class_Str var21;
+var21.buf = NULL;
+bool var22;
+struct class_Str var23;
+var23.buf = NULL;
+int64_t var24;
+struct class_Str retval;
+var2 = string21___8688112020; string_incref(var2);
+var3 = meth_Str_equals(var1,var2);
+if (var3) goto label4;
+if (oomph_true) goto label5;
+label4: (void)0;
+var6 = string22___2736484013; string_incref(var6);
+retval = var6; var6.buf = NULL;
+goto out;
+label5: (void)0;
+var7 = string22___2736484013; string_incref(var7);
+var8 = meth_Str_equals(var1,var7);
+if (var8) goto label9;
+if (oomph_true) goto label10;
+label9: (void)0;
+var11 = string21___8688112020; string_incref(var11);
+retval = var11; var11.buf = NULL;
+goto out;
+label10: (void)0;
+var12 = string23___93b8aa563b; string_incref(var12);
+var13 = meth_Str_equals(var1,var12);
+if (var13) goto label14;
+if (oomph_true) goto label15;
+label14: (void)0;
+var16 = string24___e193d6ad2b; string_incref(var16);
+retval = var16; var16.buf = NULL;
+goto out;
+label15: (void)0;
+var17 = string24___e193d6ad2b; string_incref(var17);
+var18 = meth_Str_equals(var1,var17);
+if (var18) goto label19;
+if (oomph_true) goto label20;
+label19: (void)0;
+var21 = string23___93b8aa563b; string_incref(var21);
+retval = var21; var21.buf = NULL;
+goto out;
+label20: (void)0;
+var22 = oomph_false;
+var23 = string9_tests____self_hosted_tokenizer_oomph_1fc92f08e6; string_incref(var23);
+var24 = 198LL;
+oomph_assert(var22,var23,var24);
+out: (void)0;
+(void)0;
+string_decref(var23);
+(void)0;
+string_decref(var21);
+(void)0;
+string_decref(var17);
+string_decref(var16);
+(void)0;
+string_decref(var12);
+string_decref(var11);
+(void)0;
+string_decref(var7);
+string_decref(var6);
+(void)0;
+string_decref(var2);
+return retval;
+}struct class_List_Token__3374a2880c* tokenizer_ccb2934fe5_ignore_whitespace_in_parens(struct class_List_Token__3374a2880c* var1){struct class_List_Token__3374a2880c* var2;
+var2 = NULL;
+struct class_List_Token__3374a2880c* var3;
+var3 = NULL;
+int64_t var4;
+struct class_Token_7a77c10982* var6;
+var6 = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+bool var10;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+bool var14;
+bool var15;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+bool var20;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+bool var24;
+bool var25;
+struct class_List_Token__3374a2880c* var29;
+var29 = NULL;
+bool var30;
+struct class_Location_d6140b9ecf* var33;
+var33 = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+struct class_Str var37;
+var37.buf = NULL;
+struct class_Str var38;
+var38.buf = NULL;
+struct class_Str var39;
+var39.buf = NULL;
+struct class_Token_7a77c10982* var40;
+var40 = NULL;
+struct class_Str var41;
+var41.buf = NULL;
+struct class_Str var42;
+var42.buf = NULL;
+struct class_Str var43;
+var43.buf = NULL;
+bool var44;
+bool var45;
+struct class_Location_d6140b9ecf* var48;
+var48 = NULL;
+struct class_Str var49;
+var49.buf = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+struct class_Str var52;
+var52.buf = NULL;
+struct class_Str var53;
+var53.buf = NULL;
+struct class_Str var54;
+var54.buf = NULL;
+struct class_Str var55;
+var55.buf = NULL;
+struct class_Str var56;
+var56.buf = NULL;
+struct class_Str var57;
+var57.buf = NULL;
+struct class_List_Token__3374a2880c* var59;
+var59 = NULL;
+bool var60;
+struct class_Str var62;
+var62.buf = NULL;
+struct class_Str var63;
+var63.buf = NULL;
+struct class_Str var64;
+var64.buf = NULL;
+bool var65;
+bool var66;
+bool var67;
+struct class_List_Token__3374a2880c* var71;
+var71 = NULL;
+bool var72;
+bool var73;
+struct class_Token_7a77c10982* var76;
+var76 = NULL;
+struct class_Location_d6140b9ecf* var77;
+var77 = NULL;
+struct class_Str var78;
+var78.buf = NULL;
+struct class_Token_7a77c10982* var79;
+var79 = NULL;
+struct class_Str var80;
+var80.buf = NULL;
+struct class_Str var81;
+var81.buf = NULL;
+struct class_Str var82;
+var82.buf = NULL;
+struct class_Str var83;
+var83.buf = NULL;
+struct class_Str var84;
+var84.buf = NULL;
+struct class_List_Token__3374a2880c* retval;
+var2 = ctor_List_Token__3374a2880c();
+var3 = ctor_List_Token__3374a2880c();
+var4 = 0LL;
+label5: (void)0;
+if (var4 >= var1->len) goto label7;
+decref((var6), dtor_Token_7a77c10982); var6 = var1->data[var4++]; incref(var6);
+string_decref(var8);
+var8.buf = NULL;
+var8 = string60_op_0f0538832e; string_incref(var8);
+string_decref(var9);
+var9.buf = NULL;
+var9 = string21___8688112020; string_incref(var9);
+var10 = meth_Token_7a77c10982_matches(var6,var8,var9);
+if (var10) goto label11;
+string_decref(var12);
+var12.buf = NULL;
+var12 = string60_op_0f0538832e; string_incref(var12);
+string_decref(var13);
+var13.buf = NULL;
+var13 = string23___93b8aa563b; string_incref(var13);
+var14 = meth_Token_7a77c10982_matches(var6,var12,var13);
+var15 = var14;
+if (oomph_true) goto label16;
+label11: (void)0;
+var15 = oomph_true;
+label16: (void)0;
+if (var15) goto label17;
+string_decref(var18);
+var18.buf = NULL;
+var18 = string60_op_0f0538832e; string_incref(var18);
+string_decref(var19);
+var19.buf = NULL;
+var19 = string22___2736484013; string_incref(var19);
+var20 = meth_Token_7a77c10982_matches(var6,var18,var19);
+if (var20) goto label21;
+string_decref(var22);
+var22.buf = NULL;
+var22 = string60_op_0f0538832e; string_incref(var22);
+string_decref(var23);
+var23.buf = NULL;
+var23 = string24___e193d6ad2b; string_incref(var23);
+var24 = meth_Token_7a77c10982_matches(var6,var22,var23);
+var25 = var24;
+if (oomph_true) goto label26;
+label21: (void)0;
+var25 = oomph_true;
+label26: (void)0;
+if (var25) goto label27;
+if (oomph_true) goto label28;
+label27: (void)0;
+decref((var29), dtor_List_Token__3374a2880c);
+var29 = NULL;
+var29 = ctor_List_Token__3374a2880c();
+var30 = meth_List_Token__3374a2880c_equals(var3,var29);
+if (var30) goto label31;
+if (oomph_true) goto label32;
+label31: (void)0;
+decref((var33), dtor_Location_d6140b9ecf);
+var33 = NULL;
+var33 = var6->memb_location;
+incref(var33);
+string_decref(var34);
+var34.buf = NULL;
+var34 = string75_no_matching___09e188e9e3; string_incref(var34);
+string_decref(var35);
+var35.buf = NULL;
+string_decref(var36);
+var36.buf = NULL;
+var36 = var6->memb_value;
+string_incref(var36);
+var35 = tokenizer_ccb2934fe5_flip_paren(var36);
+string_decref(var37);
+var37.buf = NULL;
+var37 = oomph_string_concat(var34,var35);
+string_decref(var38);
+var38.buf = NULL;
+var38 = string76___743502ce91; string_incref(var38);
+string_decref(var39);
+var39.buf = NULL;
+var39 = oomph_string_concat(var37,var38);
+meth_Location_d6140b9ecf_error(var33,var39);
+label32: (void)0;
+decref((var40), dtor_Token_7a77c10982);
+var40 = NULL;
+var40 = meth_List_Token__3374a2880c_pop(var3);
+string_decref(var41);
+var41.buf = NULL;
+var41 = var40->memb_value;
+string_incref(var41);
+string_decref(var42);
+var42.buf = NULL;
+string_decref(var43);
+var43.buf = NULL;
+var43 = var6->memb_value;
+string_incref(var43);
+var42 = tokenizer_ccb2934fe5_flip_paren(var43);
+var44 = meth_Str_equals(var41,var42);
+var45 = oomph_bool_not(var44);
+if (var45) goto label46;
+if (oomph_true) goto label47;
+label46: (void)0;
+decref((var48), dtor_Location_d6140b9ecf);
+var48 = NULL;
+var48 = var6->memb_location;
+incref(var48);
+string_decref(var49);
+var49.buf = NULL;
+var49 = string76___743502ce91; string_incref(var49);
+string_decref(var50);
+var50.buf = NULL;
+var50 = var40->memb_value;
+string_incref(var50);
+string_decref(var51);
+var51.buf = NULL;
+var51 = oomph_string_concat(var49,var50);
+string_decref(var52);
+var52.buf = NULL;
+var52 = string77___and___f0e8e886a3; string_incref(var52);
+string_decref(var53);
+var53.buf = NULL;
+var53 = oomph_string_concat(var51,var52);
+string_decref(var54);
+var54.buf = NULL;
+var54 = var6->memb_value;
+string_incref(var54);
+string_decref(var55);
+var55.buf = NULL;
+var55 = oomph_string_concat(var53,var54);
+string_decref(var56);
+var56.buf = NULL;
+var56 = string78___don_t_match_efd015de45; string_incref(var56);
+string_decref(var57);
+var57.buf = NULL;
+var57 = oomph_string_concat(var55,var56);
+meth_Location_d6140b9ecf_error(var48,var57);
+label47: (void)0;
+label28: (void)0;
+if (oomph_true) goto label58;
+label17: (void)0;
+meth_List_Token__3374a2880c_push(var3,var6);
+label58: (void)0;
+decref((var59), dtor_List_Token__3374a2880c);
+var59 = NULL;
+var59 = ctor_List_Token__3374a2880c();
+var60 = meth_List_Token__3374a2880c_equals(var3,var59);
+if (var60) goto label61;
+string_decref(var62);
+var62.buf = NULL;
+var62 = var6->memb_value;
+string_incref(var62);
+string_decref(var63);
+var63.buf = NULL;
+var63 = meth_Str_trim(var62);
+string_decref(var64);
+var64.buf = NULL;
+var64 = string2__3a4b14b752; string_incref(var64);
+var65 = meth_Str_equals(var63,var64);
+var66 = oomph_bool_not(var65);
+var67 = var66;
+if (oomph_true) goto label68;
+label61: (void)0;
+var67 = oomph_true;
+label68: (void)0;
+if (var67) goto label69;
+if (oomph_true) goto label70;
+label69: (void)0;
+meth_List_Token__3374a2880c_push(var2,var6);
+label70: (void)0;
+if (oomph_true) goto label5;
+label7: (void)0;
+var71 = ctor_List_Token__3374a2880c();
+var72 = meth_List_Token__3374a2880c_equals(var3,var71);
+var73 = oomph_bool_not(var72);
+if (var73) goto label74;
+if (oomph_true) goto label75;
+label74: (void)0;
+var76 = meth_List_Token__3374a2880c_first(var3);
+var77 = var76->memb_location;
+incref(var77);
+var78 = string79_missing___bed4957c8f; string_incref(var78);
+var79 = meth_List_Token__3374a2880c_first(var3);
+var80 = var79->memb_value;
+string_incref(var80);
+var81 = tokenizer_ccb2934fe5_flip_paren(var80);
+var82 = oomph_string_concat(var78,var81);
+var83 = string76___743502ce91; string_incref(var83);
+var84 = oomph_string_concat(var82,var83);
+meth_Location_d6140b9ecf_error(var77,var84);
+label75: (void)0;
+retval = var2; var2 = NULL;
+goto out;
+out: (void)0;
+string_decref(var84);
+string_decref(var83);
+string_decref(var82);
+string_decref(var81);
+string_decref(var80);
+decref((var79), dtor_Token_7a77c10982);
+string_decref(var78);
+decref((var77), dtor_Location_d6140b9ecf);
+decref((var76), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+decref((var71), dtor_List_Token__3374a2880c);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var64);
+string_decref(var63);
+string_decref(var62);
+(void)0;
+decref((var59), dtor_List_Token__3374a2880c);
+string_decref(var57);
+string_decref(var56);
+string_decref(var55);
+string_decref(var54);
+string_decref(var53);
+string_decref(var52);
+string_decref(var51);
+string_decref(var50);
+string_decref(var49);
+decref((var48), dtor_Location_d6140b9ecf);
+(void)0;
+(void)0;
+string_decref(var43);
+string_decref(var42);
+string_decref(var41);
+decref((var40), dtor_Token_7a77c10982);
+string_decref(var39);
+string_decref(var38);
+string_decref(var37);
+string_decref(var36);
+string_decref(var35);
+string_decref(var34);
+decref((var33), dtor_Location_d6140b9ecf);
+(void)0;
+decref((var29), dtor_List_Token__3374a2880c);
+(void)0;
+(void)0;
+string_decref(var23);
+string_decref(var22);
+(void)0;
+string_decref(var19);
+string_decref(var18);
+(void)0;
+(void)0;
+string_decref(var13);
+string_decref(var12);
+(void)0;
+string_decref(var9);
+string_decref(var8);
+decref((var6), dtor_Token_7a77c10982);
+(void)0;
+decref((var3), dtor_List_Token__3374a2880c);
+decref((var2), dtor_List_Token__3374a2880c);
+return retval;
+}struct class_List_Token__3374a2880c* tokenizer_ccb2934fe5_combine_not_in(struct class_List_Token__3374a2880c* var1){struct class_List_Token__3374a2880c* var2;
+var2 = NULL;
+int64_t var3;
+int64_t var5;
+bool var6;
+bool var7;
+int64_t var9;
+int64_t var10;
+int64_t var11;
+bool var12;
+bool var14;
+struct class_Token_7a77c10982* var16;
+var16 = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+bool var19;
+bool var21;
+int64_t var23;
+int64_t var24;
+struct class_Token_7a77c10982* var25;
+var25 = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+bool var28;
+struct class_Token_7a77c10982* var30;
+var30 = NULL;
+int64_t var31;
+int64_t var32;
+struct class_Token_7a77c10982* var34;
+var34 = NULL;
+struct class_Location_d6140b9ecf* var35;
+var35 = NULL;
+int64_t var36;
+int64_t var37;
+struct class_Token_7a77c10982* var38;
+var38 = NULL;
+struct class_Location_d6140b9ecf* var39;
+var39 = NULL;
+struct class_Location_d6140b9ecf* var40;
+var40 = NULL;
+struct class_Str var41;
+var41.buf = NULL;
+struct class_Str var42;
+var42.buf = NULL;
+struct class_Token_7a77c10982* var43;
+var43 = NULL;
+int64_t var44;
+int64_t var45;
+struct class_List_Token__3374a2880c* retval;
+var2 = ctor_List_Token__3374a2880c();
+var3 = 0LL;
+label4: (void)0;
+var5 = meth_List_Token__3374a2880c_length(var1);
+var6 = oomph_int_gt(var5,var3);
+var7 = oomph_bool_not(var6);
+if (var7) goto label8;
+var9 = 1LL;
+var10 = oomph_int_add(var3,var9);
+var11 = meth_List_Token__3374a2880c_length(var1);
+var12 = oomph_int_gt(var11,var10);
+if (var12) goto label13;
+var14 = oomph_false;
+if (oomph_true) goto label15;
+label13: (void)0;
+decref((var16), dtor_Token_7a77c10982);
+var16 = NULL;
+var16 = meth_List_Token__3374a2880c_get(var1,var3);
+string_decref(var17);
+var17.buf = NULL;
+var17 = string67_keyword_3f671b4d6f; string_incref(var17);
+string_decref(var18);
+var18.buf = NULL;
+var18 = string49_not_74119d62e2; string_incref(var18);
+var19 = meth_Token_7a77c10982_matches(var16,var17,var18);
+var14 = var19;
+label15: (void)0;
+if (var14) goto label20;
+var21 = oomph_false;
+if (oomph_true) goto label22;
+label20: (void)0;
+var23 = 1LL;
+var24 = oomph_int_add(var3,var23);
+decref((var25), dtor_Token_7a77c10982);
+var25 = NULL;
+var25 = meth_List_Token__3374a2880c_get(var1,var24);
+string_decref(var26);
+var26.buf = NULL;
+var26 = string67_keyword_3f671b4d6f; string_incref(var26);
+string_decref(var27);
+var27.buf = NULL;
+var27 = string50_in_8e94c3bfe3; string_incref(var27);
+var28 = meth_Token_7a77c10982_matches(var25,var26,var27);
+var21 = var28;
+label22: (void)0;
+if (var21) goto label29;
+decref((var30), dtor_Token_7a77c10982);
+var30 = NULL;
+var30 = meth_List_Token__3374a2880c_get(var1,var3);
+meth_List_Token__3374a2880c_push(var2,var30);
+var31 = 1LL;
+var32 = oomph_int_add(var3,var31);
+var3 = var32;
+if (oomph_true) goto label33;
+label29: (void)0;
+decref((var34), dtor_Token_7a77c10982);
+var34 = NULL;
+var34 = meth_List_Token__3374a2880c_get(var1,var3);
+decref((var35), dtor_Location_d6140b9ecf);
+var35 = NULL;
+var35 = var34->memb_location;
+incref(var35);
+var36 = 1LL;
+var37 = oomph_int_add(var3,var36);
+decref((var38), dtor_Token_7a77c10982);
+var38 = NULL;
+var38 = meth_List_Token__3374a2880c_get(var1,var37);
+decref((var39), dtor_Location_d6140b9ecf);
+var39 = NULL;
+var39 = var38->memb_location;
+incref(var39);
+decref((var40), dtor_Location_d6140b9ecf);
+var40 = NULL;
+var40 = meth_Location_d6140b9ecf_combine(var35,var39);
+string_decref(var41);
+var41.buf = NULL;
+var41 = string67_keyword_3f671b4d6f; string_incref(var41);
+string_decref(var42);
+var42.buf = NULL;
+var42 = string80_not_in_a408c36185; string_incref(var42);
+decref((var43), dtor_Token_7a77c10982);
+var43 = NULL;
+var43 = ctor_Token_7a77c10982(var41,var42,var40);
+meth_List_Token__3374a2880c_push(var2,var43);
+var44 = 2LL;
+var45 = oomph_int_add(var3,var44);
+var3 = var45;
+label33: (void)0;
+if (oomph_true) goto label4;
+label8: (void)0;
+retval = var2; var2 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var43), dtor_Token_7a77c10982);
+string_decref(var42);
+string_decref(var41);
+decref((var40), dtor_Location_d6140b9ecf);
+decref((var39), dtor_Location_d6140b9ecf);
+decref((var38), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+decref((var35), dtor_Location_d6140b9ecf);
+decref((var34), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+decref((var30), dtor_Token_7a77c10982);
+(void)0;
+string_decref(var27);
+string_decref(var26);
+decref((var25), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var18);
+string_decref(var17);
+decref((var16), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Token__3374a2880c);
+return retval;
+}void tokenizer_ccb2934fe5_skip_newlines(struct class_List_Token__3374a2880c* var1){struct class_List_Token__3374a2880c* var3;
+var3 = NULL;
+bool var4;
+bool var5;
+bool var7;
+struct class_Token_7a77c10982* var9;
+var9 = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+bool var12;
+bool var13;
+struct class_Token_7a77c10982* var15;
+var15 = NULL;
+label2: (void)0;
+decref((var3), dtor_List_Token__3374a2880c);
+var3 = NULL;
+var3 = ctor_List_Token__3374a2880c();
+var4 = meth_List_Token__3374a2880c_equals(var1,var3);
+var5 = oomph_bool_not(var4);
+if (var5) goto label6;
+var7 = oomph_false;
+if (oomph_true) goto label8;
+label6: (void)0;
+decref((var9), dtor_Token_7a77c10982);
+var9 = NULL;
+var9 = meth_List_Token__3374a2880c_last(var1);
+string_decref(var10);
+var10.buf = NULL;
+var10 = string60_op_0f0538832e; string_incref(var10);
+string_decref(var11);
+var11.buf = NULL;
+var11 = string8___9e4a377626; string_incref(var11);
+var12 = meth_Token_7a77c10982_matches(var9,var10,var11);
+var7 = var12;
+label8: (void)0;
+var13 = oomph_bool_not(var7);
+if (var13) goto label14;
+decref((var15), dtor_Token_7a77c10982);
+var15 = NULL;
+var15 = meth_List_Token__3374a2880c_pop(var1);
+if (oomph_true) goto label2;
+label14: (void)0;
+out: (void)0;
+decref((var15), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+string_decref(var11);
+string_decref(var10);
+decref((var9), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_List_Token__3374a2880c);
+}struct class_List_Token__3374a2880c* tokenizer_ccb2934fe5_clean_newlines(struct class_List_Token__3374a2880c* var1){struct class_List_Token__3374a2880c* var2;
+var2 = NULL;
+struct class_List_Token__3374a2880c* var3;
+var3 = NULL;
+struct class_List_Token__3374a2880c* var4;
+var4 = NULL;
+struct class_List_Token__3374a2880c* var6;
+var6 = NULL;
+bool var7;
+bool var8;
+bool var9;
+struct class_Token_7a77c10982* var11;
+var11 = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+bool var14;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_List_Str__43b70c06cb* var19;
+var19 = NULL;
+bool var20;
+bool var21;
+struct class_List_Token__3374a2880c* retval;
+var2 = var1;
+incref(var2);
+var3 = ctor_List_Token__3374a2880c();
+var4 = meth_List_Token__3374a2880c_reversed(var2);
+decref((var2), dtor_List_Token__3374a2880c);
+var2 = var4;
+var4 = NULL;
+tokenizer_ccb2934fe5_skip_newlines(var2);
+label5: (void)0;
+decref((var6), dtor_List_Token__3374a2880c);
+var6 = NULL;
+var6 = ctor_List_Token__3374a2880c();
+var7 = meth_List_Token__3374a2880c_equals(var2,var6);
+var8 = oomph_bool_not(var7);
+var9 = oomph_bool_not(var8);
+if (var9) goto label10;
+decref((var11), dtor_Token_7a77c10982);
+var11 = NULL;
+var11 = meth_List_Token__3374a2880c_pop(var2);
+meth_List_Token__3374a2880c_push(var3,var11);
+string_decref(var12);
+var12.buf = NULL;
+var12 = string60_op_0f0538832e; string_incref(var12);
+string_decref(var13);
+var13.buf = NULL;
+var13 = string8___9e4a377626; string_incref(var13);
+var14 = meth_Token_7a77c10982_matches(var11,var12,var13);
+if (var14) goto label15;
+string_decref(var16);
+var16.buf = NULL;
+var16 = var11->memb_type;
+string_incref(var16);
+string_decref(var17);
+var17.buf = NULL;
+var17 = string81_begin_block_373cb47c14; string_incref(var17);
+string_decref(var18);
+var18.buf = NULL;
+var18 = string82_end_block_beae10de3f; string_incref(var18);
+decref((var19), dtor_List_Str__43b70c06cb);
+var19 = NULL;
+var19 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var19,var17);
+meth_List_Str__43b70c06cb_push(var19,var18);
+var20 = meth_List_Str__43b70c06cb___contains(var19,var16);
+var21 = var20;
+if (oomph_true) goto label22;
+label15: (void)0;
+var21 = oomph_true;
+label22: (void)0;
+if (var21) goto label23;
+if (oomph_true) goto label24;
+label23: (void)0;
+tokenizer_ccb2934fe5_skip_newlines(var2);
+label24: (void)0;
+if (oomph_true) goto label5;
+label10: (void)0;
+retval = var3; var3 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var19), dtor_List_Str__43b70c06cb);
+string_decref(var18);
+string_decref(var17);
+string_decref(var16);
+(void)0;
+string_decref(var13);
+string_decref(var12);
+decref((var11), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+(void)0;
+decref((var6), dtor_List_Token__3374a2880c);
+decref((var4), dtor_List_Token__3374a2880c);
+decref((var3), dtor_List_Token__3374a2880c);
+decref((var2), dtor_List_Token__3374a2880c);
+return retval;
+}struct class_List_Token__3374a2880c* tokenizer_ccb2934fe5_find_blocks(struct class_List_Token__3374a2880c* var1){struct class_List_Token__3374a2880c* var2;
+var2 = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+int64_t var4;
+struct class_List_Token__3374a2880c* var5;
+var5 = NULL;
+struct class_List_Token__3374a2880c* var6;
+var6 = NULL;
+struct class_List_Token__3374a2880c* var8;
+var8 = NULL;
+bool var9;
+bool var10;
+bool var11;
+struct class_List_Token__3374a2880c* var13;
+var13 = NULL;
+int64_t var14;
+int64_t var15;
+struct class_List_Token__3374a2880c* var16;
+var16 = NULL;
+int64_t var17;
+int64_t var18;
+bool var19;
+bool var21;
+int64_t var23;
+struct class_Token_7a77c10982* var24;
+var24 = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+bool var27;
+bool var29;
+int64_t var31;
+struct class_Token_7a77c10982* var32;
+var32 = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+bool var35;
+bool var37;
+int64_t var39;
+struct class_Token_7a77c10982* var40;
+var40 = NULL;
+struct class_Str var41;
+var41.buf = NULL;
+struct class_Str var42;
+var42.buf = NULL;
+bool var43;
+int64_t var46;
+int64_t var47;
+int64_t var48;
+struct class_Token_7a77c10982* var49;
+var49 = NULL;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+int64_t var52;
+int64_t var53;
+struct class_Str var54;
+var54.buf = NULL;
+bool var55;
+bool var56;
+int64_t var59;
+struct class_Token_7a77c10982* var60;
+var60 = NULL;
+struct class_Location_d6140b9ecf* var61;
+var61 = NULL;
+struct class_Str var62;
+var62.buf = NULL;
+struct class_Str var63;
+var63.buf = NULL;
+struct class_Token_7a77c10982* var64;
+var64 = NULL;
+struct class_Location_d6140b9ecf* var65;
+var65 = NULL;
+struct class_Token_7a77c10982* var66;
+var66 = NULL;
+struct class_Token_7a77c10982* var67;
+var67 = NULL;
+struct class_Token_7a77c10982* var68;
+var68 = NULL;
+struct class_Token_7a77c10982* var69;
+var69 = NULL;
+struct class_Token_7a77c10982* var71;
+var71 = NULL;
+struct class_Token_7a77c10982* var72;
+var72 = NULL;
+struct class_Token_7a77c10982* var73;
+var73 = NULL;
+struct class_Str var74;
+var74.buf = NULL;
+struct class_Str var75;
+var75.buf = NULL;
+bool var76;
+int64_t var79;
+int64_t var80;
+bool var81;
+bool var82;
+bool var84;
+int64_t var86;
+struct class_Token_7a77c10982* var87;
+var87 = NULL;
+struct class_Str var88;
+var88.buf = NULL;
+struct class_Str var89;
+var89.buf = NULL;
+bool var90;
+int64_t var92;
+int64_t var93;
+int64_t var95;
+struct class_Token_7a77c10982* var96;
+var96 = NULL;
+struct class_Str var97;
+var97.buf = NULL;
+int64_t var98;
+double var99;
+double var100;
+double var101;
+struct class_Token_7a77c10982* var102;
+var102 = NULL;
+int64_t var103;
+struct class_Token_7a77c10982* var104;
+var104 = NULL;
+struct class_Str var105;
+var105.buf = NULL;
+struct class_Str var106;
+var106.buf = NULL;
+int64_t var107;
+int64_t var108;
+struct class_Str var109;
+var109.buf = NULL;
+bool var110;
+bool var111;
+struct class_Location_d6140b9ecf* var114;
+var114 = NULL;
+bool var115;
+int64_t var118;
+struct class_Token_7a77c10982* var119;
+var119 = NULL;
+struct class_Location_d6140b9ecf* var120;
+var120 = NULL;
+struct class_Str var121;
+var121.buf = NULL;
+bool var123;
+bool var124;
+struct class_Str var126;
+var126.buf = NULL;
+struct class_Str var127;
+var127.buf = NULL;
+struct class_Token_7a77c10982* var128;
+var128 = NULL;
+struct class_Location_d6140b9ecf* var129;
+var129 = NULL;
+struct class_Token_7a77c10982* var130;
+var130 = NULL;
+int64_t var131;
+int64_t var132;
+struct class_List_Token__3374a2880c* retval;
+var2 = var1;
+incref(var2);
+var3 = string83_indentation_must_be_a_multiple_of_4_spaces_d2a7649d5c; string_incref(var3);
+var4 = 0LL;
+var5 = ctor_List_Token__3374a2880c();
+var6 = meth_List_Token__3374a2880c_reversed(var2);
+decref((var2), dtor_List_Token__3374a2880c);
+var2 = var6;
+var6 = NULL;
+label7: (void)0;
+decref((var8), dtor_List_Token__3374a2880c);
+var8 = NULL;
+var8 = ctor_List_Token__3374a2880c();
+var9 = meth_List_Token__3374a2880c_equals(var2,var8);
+var10 = oomph_bool_not(var9);
+var11 = oomph_bool_not(var10);
+if (var11) goto label12;
+decref((var13), dtor_List_Token__3374a2880c);
+var13 = NULL;
+var13 = meth_List_Token__3374a2880c_reversed(var2);
+var14 = 0LL;
+var15 = 3LL;
+decref((var16), dtor_List_Token__3374a2880c);
+var16 = NULL;
+var16 = meth_List_Token__3374a2880c_slice(var13,var14,var15);
+var17 = meth_List_Token__3374a2880c_length(var16);
+var18 = 3LL;
+var19 = meth_Int_equals(var17,var18);
+if (var19) goto label20;
+var21 = oomph_false;
+if (oomph_true) goto label22;
+label20: (void)0;
+var23 = 0LL;
+decref((var24), dtor_Token_7a77c10982);
+var24 = NULL;
+var24 = meth_List_Token__3374a2880c_get(var16,var23);
+string_decref(var25);
+var25.buf = NULL;
+var25 = string60_op_0f0538832e; string_incref(var25);
+string_decref(var26);
+var26.buf = NULL;
+var26 = string20___5dca4e0c44; string_incref(var26);
+var27 = meth_Token_7a77c10982_matches(var24,var25,var26);
+var21 = var27;
+label22: (void)0;
+if (var21) goto label28;
+var29 = oomph_false;
+if (oomph_true) goto label30;
+label28: (void)0;
+var31 = 1LL;
+decref((var32), dtor_Token_7a77c10982);
+var32 = NULL;
+var32 = meth_List_Token__3374a2880c_get(var16,var31);
+string_decref(var33);
+var33.buf = NULL;
+var33 = string60_op_0f0538832e; string_incref(var33);
+string_decref(var34);
+var34.buf = NULL;
+var34 = string8___9e4a377626; string_incref(var34);
+var35 = meth_Token_7a77c10982_matches(var32,var33,var34);
+var29 = var35;
+label30: (void)0;
+if (var29) goto label36;
+var37 = oomph_false;
+if (oomph_true) goto label38;
+label36: (void)0;
+var39 = 2LL;
+decref((var40), dtor_Token_7a77c10982);
+var40 = NULL;
+var40 = meth_List_Token__3374a2880c_get(var16,var39);
+string_decref(var41);
+var41.buf = NULL;
+var41 = var40->memb_type;
+string_incref(var41);
+string_decref(var42);
+var42.buf = NULL;
+var42 = string72_indent_74b0f2b7bb; string_incref(var42);
+var43 = meth_Str_equals(var41,var42);
+var37 = var43;
+label38: (void)0;
+if (var37) goto label44;
+if (oomph_true) goto label45;
+label44: (void)0;
+var46 = 1LL;
+var47 = oomph_int_add(var4,var46);
+var4 = var47;
+var48 = 2LL;
+decref((var49), dtor_Token_7a77c10982);
+var49 = NULL;
+var49 = meth_List_Token__3374a2880c_get(var16,var48);
+string_decref(var50);
+var50.buf = NULL;
+var50 = var49->memb_value;
+string_incref(var50);
+string_decref(var51);
+var51.buf = NULL;
+var51 = string7___9e35624995; string_incref(var51);
+var52 = 4LL;
+var53 = oomph_int_mul(var52,var4);
+string_decref(var54);
+var54.buf = NULL;
+var54 = meth_Str_repeat(var51,var53);
+var55 = meth_Str_equals(var50,var54);
+var56 = oomph_bool_not(var55);
+if (var56) goto label57;
+if (oomph_true) goto label58;
+label57: (void)0;
+var59 = 2LL;
+decref((var60), dtor_Token_7a77c10982);
+var60 = NULL;
+var60 = meth_List_Token__3374a2880c_get(var16,var59);
+decref((var61), dtor_Location_d6140b9ecf);
+var61 = NULL;
+var61 = var60->memb_location;
+incref(var61);
+meth_Location_d6140b9ecf_error(var61,var3);
+label58: (void)0;
+string_decref(var62);
+var62.buf = NULL;
+var62 = string81_begin_block_373cb47c14; string_incref(var62);
+string_decref(var63);
+var63.buf = NULL;
+var63 = string20___5dca4e0c44; string_incref(var63);
+decref((var64), dtor_Token_7a77c10982);
+var64 = NULL;
+var64 = meth_List_Token__3374a2880c_first(var16);
+decref((var65), dtor_Location_d6140b9ecf);
+var65 = NULL;
+var65 = var64->memb_location;
+incref(var65);
+decref((var66), dtor_Token_7a77c10982);
+var66 = NULL;
+var66 = ctor_Token_7a77c10982(var62,var63,var65);
+meth_List_Token__3374a2880c_push(var5,var66);
+decref((var67), dtor_Token_7a77c10982);
+var67 = NULL;
+var67 = meth_List_Token__3374a2880c_pop(var2);
+decref((var68), dtor_Token_7a77c10982);
+var68 = NULL;
+var68 = meth_List_Token__3374a2880c_pop(var2);
+decref((var69), dtor_Token_7a77c10982);
+var69 = NULL;
+var69 = meth_List_Token__3374a2880c_pop(var2);
+if (oomph_true) goto label70;
+label45: (void)0;
+decref((var71), dtor_Token_7a77c10982);
+var71 = NULL;
+var71 = meth_List_Token__3374a2880c_first(var16);
+meth_List_Token__3374a2880c_push(var5,var71);
+decref((var72), dtor_Token_7a77c10982);
+var72 = NULL;
+var72 = meth_List_Token__3374a2880c_pop(var2);
+decref((var73), dtor_Token_7a77c10982);
+var73 = NULL;
+var73 = meth_List_Token__3374a2880c_first(var16);
+string_decref(var74);
+var74.buf = NULL;
+var74 = string60_op_0f0538832e; string_incref(var74);
+string_decref(var75);
+var75.buf = NULL;
+var75 = string8___9e4a377626; string_incref(var75);
+var76 = meth_Token_7a77c10982_matches(var73,var74,var75);
+if (var76) goto label77;
+if (oomph_true) goto label78;
+label77: (void)0;
+var79 = meth_List_Token__3374a2880c_length(var16);
+var80 = 2LL;
+var81 = oomph_int_gt(var80,var79);
+var82 = oomph_bool_not(var81);
+if (var82) goto label83;
+var84 = oomph_false;
+if (oomph_true) goto label85;
+label83: (void)0;
+var86 = 1LL;
+decref((var87), dtor_Token_7a77c10982);
+var87 = NULL;
+var87 = meth_List_Token__3374a2880c_get(var16,var86);
+string_decref(var88);
+var88.buf = NULL;
+var88 = var87->memb_type;
+string_incref(var88);
+string_decref(var89);
+var89.buf = NULL;
+var89 = string72_indent_74b0f2b7bb; string_incref(var89);
+var90 = meth_Str_equals(var88,var89);
+var84 = var90;
+label85: (void)0;
+if (var84) goto label91;
+var92 = 0LL;
+var93 = var92;
+if (oomph_true) goto label94;
+label91: (void)0;
+var95 = 1LL;
+decref((var96), dtor_Token_7a77c10982);
+var96 = NULL;
+var96 = meth_List_Token__3374a2880c_get(var16,var95);
+string_decref(var97);
+var97.buf = NULL;
+var97 = var96->memb_value;
+string_incref(var97);
+var98 = meth_Str_length(var97);
+var99 = oomph_int2float(var98);
+var100 = 4.0;
+var101 = oomph_float_div(var99,var100);
+var93 = meth_Float_round(var101);
+decref((var102), dtor_Token_7a77c10982);
+var102 = NULL;
+var102 = meth_List_Token__3374a2880c_pop(var2);
+var103 = 1LL;
+decref((var104), dtor_Token_7a77c10982);
+var104 = NULL;
+var104 = meth_List_Token__3374a2880c_get(var16,var103);
+string_decref(var105);
+var105.buf = NULL;
+var105 = var104->memb_value;
+string_incref(var105);
+string_decref(var106);
+var106.buf = NULL;
+var106 = string7___9e35624995; string_incref(var106);
+var107 = 4LL;
+var108 = oomph_int_mul(var107,var93);
+string_decref(var109);
+var109.buf = NULL;
+var109 = meth_Str_repeat(var106,var108);
+var110 = meth_Str_equals(var105,var109);
+var111 = oomph_bool_not(var110);
+if (var111) goto label112;
+if (oomph_true) goto label113;
+label112: (void)0;
+decref((var114), dtor_Location_d6140b9ecf);
+var114 = NULL;
+var114 = var102->memb_location;
+incref(var114);
+meth_Location_d6140b9ecf_error(var114,var3);
+label113: (void)0;
+var115 = oomph_int_gt(var93,var4);
+if (var115) goto label116;
+if (oomph_true) goto label117;
+label116: (void)0;
+var118 = 1LL;
+decref((var119), dtor_Token_7a77c10982);
+var119 = NULL;
+var119 = meth_List_Token__3374a2880c_get(var16,var118);
+decref((var120), dtor_Location_d6140b9ecf);
+var120 = NULL;
+var120 = var119->memb_location;
+incref(var120);
+string_decref(var121);
+var121.buf = NULL;
+var121 = string84_indent_without_____at_end_of_previous_line_2547a62f42; string_incref(var121);
+meth_Location_d6140b9ecf_error(var120,var121);
+label117: (void)0;
+label94: (void)0;
+label122: (void)0;
+var123 = oomph_int_gt(var4,var93);
+var124 = oomph_bool_not(var123);
+if (var124) goto label125;
+string_decref(var126);
+var126.buf = NULL;
+var126 = string82_end_block_beae10de3f; string_incref(var126);
+string_decref(var127);
+var127.buf = NULL;
+var127 = string2__3a4b14b752; string_incref(var127);
+decref((var128), dtor_Token_7a77c10982);
+var128 = NULL;
+var128 = meth_List_Token__3374a2880c_first(var16);
+decref((var129), dtor_Location_d6140b9ecf);
+var129 = NULL;
+var129 = var128->memb_location;
+incref(var129);
+decref((var130), dtor_Token_7a77c10982);
+var130 = NULL;
+var130 = ctor_Token_7a77c10982(var126,var127,var129);
+meth_List_Token__3374a2880c_push(var5,var130);
+var131 = 1LL;
+var132 = oomph_int_sub(var4,var131);
+var4 = var132;
+if (oomph_true) goto label122;
+label125: (void)0;
+label78: (void)0;
+label70: (void)0;
+if (oomph_true) goto label7;
+label12: (void)0;
+retval = var5; var5 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var130), dtor_Token_7a77c10982);
+decref((var129), dtor_Location_d6140b9ecf);
+decref((var128), dtor_Token_7a77c10982);
+string_decref(var127);
+string_decref(var126);
+(void)0;
+(void)0;
+string_decref(var121);
+decref((var120), dtor_Location_d6140b9ecf);
+decref((var119), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+decref((var114), dtor_Location_d6140b9ecf);
+(void)0;
+(void)0;
+string_decref(var109);
+(void)0;
+(void)0;
+string_decref(var106);
+string_decref(var105);
+decref((var104), dtor_Token_7a77c10982);
+(void)0;
+decref((var102), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var97);
+decref((var96), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var89);
+string_decref(var88);
+decref((var87), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var75);
+string_decref(var74);
+decref((var73), dtor_Token_7a77c10982);
+decref((var72), dtor_Token_7a77c10982);
+decref((var71), dtor_Token_7a77c10982);
+decref((var69), dtor_Token_7a77c10982);
+decref((var68), dtor_Token_7a77c10982);
+decref((var67), dtor_Token_7a77c10982);
+decref((var66), dtor_Token_7a77c10982);
+decref((var65), dtor_Location_d6140b9ecf);
+decref((var64), dtor_Token_7a77c10982);
+string_decref(var63);
+string_decref(var62);
+decref((var61), dtor_Location_d6140b9ecf);
+decref((var60), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var54);
+(void)0;
+(void)0;
+string_decref(var51);
+string_decref(var50);
+decref((var49), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+string_decref(var42);
+string_decref(var41);
+decref((var40), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var34);
+string_decref(var33);
+decref((var32), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var26);
+string_decref(var25);
+decref((var24), dtor_Token_7a77c10982);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var16), dtor_List_Token__3374a2880c);
+(void)0;
+(void)0;
+decref((var13), dtor_List_Token__3374a2880c);
+(void)0;
+(void)0;
+(void)0;
+decref((var8), dtor_List_Token__3374a2880c);
+decref((var6), dtor_List_Token__3374a2880c);
+decref((var5), dtor_List_Token__3374a2880c);
+(void)0;
+string_decref(var3);
+decref((var2), dtor_List_Token__3374a2880c);
+return retval;
+}struct class_List_Token__3374a2880c* tokenizer_ccb2934fe5_tokenize(struct class_Str var1, struct class_Str var2, int64_t var3, struct class_Str var4){struct class_List_Token__3374a2880c* var5;
+var5 = NULL;
+struct class_List_Token__3374a2880c* var6;
+var6 = NULL;
+struct class_List_Token__3374a2880c* var7;
+var7 = NULL;
+struct class_List_Token__3374a2880c* var8;
+var8 = NULL;
+struct class_List_Token__3374a2880c* var9;
+var9 = NULL;
+struct class_List_Token__3374a2880c* var10;
+var10 = NULL;
+struct class_List_Token__3374a2880c* retval;
+var5 = tokenizer_ccb2934fe5_raw_tokenize(var1,var2,var3,var4);
+var6 = tokenizer_ccb2934fe5_ignore_whitespace_in_parens(var5);
+var7 = tokenizer_ccb2934fe5_combine_not_in(var6);
+var8 = tokenizer_ccb2934fe5_clean_newlines(var7);
+var9 = tokenizer_ccb2934fe5_find_blocks(var8);
+var10 = tokenizer_ccb2934fe5_clean_newlines(var9);
+retval = var10; var10 = NULL;
+goto out;
+out: (void)0;
+decref((var10), dtor_List_Token__3374a2880c);
+decref((var9), dtor_List_Token__3374a2880c);
+decref((var8), dtor_List_Token__3374a2880c);
+decref((var7), dtor_List_Token__3374a2880c);
+decref((var6), dtor_List_Token__3374a2880c);
+decref((var5), dtor_List_Token__3374a2880c);
+return retval;
+}
@@ -0,0 +1,131 @@
+
+                #ifndef HEADER_GUARD_tokenizer_ccb2934fe5
+                #define HEADER_GUARD_tokenizer_ccb2934fe5
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Str__5eca9cec4f.h"
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_Location_d6140b9ecf;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_Location_d6140b9ecf;
+struct class_Token_7a77c10982;
+struct class_List_Token__3374a2880c;
+struct class_List_Str__43b70c06cb;
+struct class_Location_d6140b9ecf;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_Location_d6140b9ecf;
+struct class_List_Str__43b70c06cb;
+struct class_List_Token__3374a2880c;
+struct class_Token_7a77c10982;
+struct class_Location_d6140b9ecf;
+struct class_Token_7a77c10982;
+struct class_List_Str__43b70c06cb;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_Token_7a77c10982;
+struct class_List_Token__3374a2880c;
+struct class_Location_d6140b9ecf;
+struct class_Token_7a77c10982;
+struct class_Location_d6140b9ecf;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_Token_7a77c10982;
+struct class_Location_d6140b9ecf;
+struct class_Token_7a77c10982;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Location_d6140b9ecf;
+struct class_Token_7a77c10982;
+struct class_Location_d6140b9ecf;
+struct class_Location_d6140b9ecf;
+struct class_Token_7a77c10982;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_Token_7a77c10982;
+struct class_List_Str__43b70c06cb;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Location_d6140b9ecf;
+struct class_Token_7a77c10982;
+struct class_Location_d6140b9ecf;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Token_7a77c10982;
+struct class_Location_d6140b9ecf;
+struct class_Token_7a77c10982;
+struct class_Location_d6140b9ecf;
+struct class_Token_7a77c10982;
+struct class_Location_d6140b9ecf;
+struct class_Token_7a77c10982;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class_List_Token__3374a2880c;
+struct class__null___Str__5eca9cec4f tokenizer_ccb2934fe5_starts_with_any(struct class_Str var1, struct class_List_Str__43b70c06cb* var2);
+struct class__null___Str__5eca9cec4f tokenizer_ccb2934fe5_get_simple_identifier(struct class_Str var1);
+struct class__null___Str__5eca9cec4f tokenizer_ccb2934fe5_get_identifier(struct class_Str var1);
+struct class_Str tokenizer_ccb2934fe5_get_int(struct class_Str var1);
+struct class_Str tokenizer_ccb2934fe5_extract_string(struct class_Str var1, struct class_Str var2, struct class_Location_d6140b9ecf* var3);
+struct class_Str tokenizer_ccb2934fe5_get_prefix_spaces(struct class_Str var1);
+struct class_List_Token__3374a2880c* tokenizer_ccb2934fe5_raw_tokenize(struct class_Str var1, struct class_Str var2, int64_t var3, struct class_Str var4);
+struct class_Str tokenizer_ccb2934fe5_flip_paren(struct class_Str var1);
+struct class_List_Token__3374a2880c* tokenizer_ccb2934fe5_ignore_whitespace_in_parens(struct class_List_Token__3374a2880c* var1);
+struct class_List_Token__3374a2880c* tokenizer_ccb2934fe5_combine_not_in(struct class_List_Token__3374a2880c* var1);
+void tokenizer_ccb2934fe5_skip_newlines(struct class_List_Token__3374a2880c* var1);
+struct class_List_Token__3374a2880c* tokenizer_ccb2934fe5_clean_newlines(struct class_List_Token__3374a2880c* var1);
+struct class_List_Token__3374a2880c* tokenizer_ccb2934fe5_find_blocks(struct class_List_Token__3374a2880c* var1);
+struct class_List_Token__3374a2880c* tokenizer_ccb2934fe5_tokenize(struct class_Str var1, struct class_Str var2, int64_t var3, struct class_Str var4);
+
+                #endif
+                
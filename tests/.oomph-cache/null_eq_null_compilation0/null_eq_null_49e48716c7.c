@@ -0,0 +1,19 @@
+#include <lib/oomph.h>
+#include "null_eq_null_49e48716c7.h"
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void){char var1;
+char var2;
+bool var3;
+struct class_Str var4;
+var4.buf = NULL;
+var1 = oomph_null;
+var2 = oomph_null;
+var3 = meth_null_equals(var1,var2);
+var4 = meth_Bool_to_string(var3);
+oomph_print(var4);
+out: (void)0;
+string_decref(var4);
+(void)0;
+(void)0;
+(void)0;
+}
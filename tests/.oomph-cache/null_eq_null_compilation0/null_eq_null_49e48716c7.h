@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_null_eq_null_49e48716c7
+                #define HEADER_GUARD_null_eq_null_49e48716c7
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
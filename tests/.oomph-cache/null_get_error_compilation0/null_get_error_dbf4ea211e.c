@@ -0,0 +1,17 @@
+#include <lib/oomph.h>
+#include "null_get_error_dbf4ea211e.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Str__5eca9cec4f.h"
+void oomph_main(void){char var1;
+struct class__null___Str__5eca9cec4f var2;
+var2.membernum = -1;
+struct class_Str var3;
+var3.buf = NULL;
+var1 = oomph_null;
+var2 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var1 }, .membernum = 0 };
+var3 = meth__null___Str__5eca9cec4f_get(var2);
+out: (void)0;
+string_decref(var3);
+decref__null___Str__5eca9cec4f(var2);
+(void)0;
+}
@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_null_get_error_dbf4ea211e
+                #define HEADER_GUARD_null_get_error_dbf4ea211e
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Str__5eca9cec4f.h"
+void oomph_main(void);
+
+                #endif
+                
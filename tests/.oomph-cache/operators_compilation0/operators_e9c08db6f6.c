@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "operators_e9c08db6f6.h"
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void){int64_t var1;
+struct class_Str var2;
+var2.buf = NULL;
+int64_t var3;
+struct class_Str var4;
+var4.buf = NULL;
+int64_t var5;
+struct class_Str var6;
+var6.buf = NULL;
+double var7;
+struct class_Str var8;
+var8.buf = NULL;
+double var9;
+struct class_Str var10;
+var10.buf = NULL;
+double var11;
+struct class_Str var12;
+var12.buf = NULL;
+double var13;
+struct class_Str var14;
+var14.buf = NULL;
+var1 = 7LL;
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+var3 = 9LL;
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+var5 = -5LL;
+var6 = meth_Int_to_string(var5);
+oomph_print(var6);
+var7 = 9.0;
+var8 = meth_Float_to_string(var7);
+oomph_print(var8);
+var9 = -3.0;
+var10 = meth_Float_to_string(var9);
+oomph_print(var10);
+var11 = 0.25;
+var12 = meth_Float_to_string(var11);
+oomph_print(var12);
+var13 = 84.0;
+var14 = meth_Float_to_string(var13);
+oomph_print(var14);
+out: (void)0;
+string_decref(var14);
+(void)0;
+string_decref(var12);
+(void)0;
+string_decref(var10);
+(void)0;
+string_decref(var8);
+(void)0;
+string_decref(var6);
+(void)0;
+string_decref(var4);
+(void)0;
+string_decref(var2);
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_operators_e9c08db6f6
+                #define HEADER_GUARD_operators_e9c08db6f6
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
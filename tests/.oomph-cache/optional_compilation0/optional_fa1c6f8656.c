@@ -0,0 +1,245 @@
+#include <lib/oomph.h>
+#include "optional_fa1c6f8656.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Str__5eca9cec4f.h"
+
+            static struct StringBuf string0_show___c55c78a73d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x68', '\x6f', '\x77', '\x3a', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string0_show___c55c78a73d = {
+                .buf = &string0_show___c55c78a73d_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1___b14becdd42_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string1___b14becdd42 = {
+                .buf = &string1___b14becdd42_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_lolwat_44dea0ea84_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c', '\x77', '\x61', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string2_lolwat_44dea0ea84 = {
+                .buf = &string2_lolwat_44dea0ea84_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_main___e09729fdb1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x61', '\x69', '\x6e', '\x3a', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string3_main___e09729fdb1 = {
+                .buf = &string3_main___e09729fdb1_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            void optional_fa1c6f8656_show(struct class__null___Str__5eca9cec4f var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+char var7;
+struct class__null___Str__5eca9cec4f var8;
+var8.membernum = -1;
+bool var9;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+var2 = string0_show___c55c78a73d; string_incref(var2);
+var3 = meth__null___Str__5eca9cec4f_to_string(var1);
+var4 = oomph_string_concat(var2,var3);
+var5 = string1___b14becdd42; string_incref(var5);
+var6 = oomph_string_concat(var4,var5);
+var7 = oomph_null;
+var8 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var7 }, .membernum = 0 };
+var9 = meth__null___Str__5eca9cec4f_equals(var1,var8);
+var10 = meth_Bool_to_string(var9);
+var11 = oomph_string_concat(var6,var10);
+oomph_print(var11);
+out: (void)0;
+string_decref(var11);
+string_decref(var10);
+(void)0;
+decref__null___Str__5eca9cec4f(var8);
+(void)0;
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+}void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class__null___Str__5eca9cec4f var2;
+var2.membernum = -1;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+char var8;
+struct class__null___Str__5eca9cec4f var9;
+var9.membernum = -1;
+bool var10;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+char var13;
+struct class__null___Str__5eca9cec4f var14;
+var14.membernum = -1;
+char var15;
+struct class__null___Str__5eca9cec4f var16;
+var16.membernum = -1;
+char var17;
+struct class__null___Str__5eca9cec4f var18;
+var18.membernum = -1;
+bool var19;
+struct class_Str var20;
+var20.buf = NULL;
+char var21;
+struct class__null___Str__5eca9cec4f var22;
+var22.membernum = -1;
+char var23;
+struct class__null___Str__5eca9cec4f var24;
+var24.membernum = -1;
+bool var25;
+struct class_Str var26;
+var26.buf = NULL;
+char var27;
+char var28;
+struct class__null___Str__5eca9cec4f var29;
+var29.membernum = -1;
+struct class__null___Str__5eca9cec4f var30;
+var30.membernum = -1;
+bool var31;
+struct class_Str var32;
+var32.buf = NULL;
+char var33;
+struct class__null___Str__5eca9cec4f var34;
+var34.membernum = -1;
+bool var35;
+struct class_Str var36;
+var36.buf = NULL;
+struct class_Str var37;
+var37.buf = NULL;
+struct class__null___Str__5eca9cec4f var38;
+var38.membernum = -1;
+bool var39;
+struct class_Str var40;
+var40.buf = NULL;
+var1 = string2_lolwat_44dea0ea84; string_incref(var1);
+var2 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var1 }, .membernum = 1 };
+var1.buf = NULL;
+var3 = string3_main___e09729fdb1; string_incref(var3);
+var4 = meth__null___Str__5eca9cec4f_to_string(var2);
+var5 = oomph_string_concat(var3,var4);
+var6 = string1___b14becdd42; string_incref(var6);
+var7 = oomph_string_concat(var5,var6);
+var8 = oomph_null;
+var9 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var8 }, .membernum = 0 };
+var10 = meth__null___Str__5eca9cec4f_equals(var2,var9);
+var11 = meth_Bool_to_string(var10);
+var12 = oomph_string_concat(var7,var11);
+oomph_print(var12);
+optional_fa1c6f8656_show(var2);
+var13 = oomph_null;
+var14 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var13 }, .membernum = 0 };
+optional_fa1c6f8656_show(var14);
+var15 = oomph_null;
+var16 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var15 }, .membernum = 0 };
+var17 = oomph_null;
+var18 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var17 }, .membernum = 0 };
+var19 = meth__null___Str__5eca9cec4f_equals(var16,var18);
+var20 = meth_Bool_to_string(var19);
+oomph_print(var20);
+var21 = oomph_null;
+var22 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var21 }, .membernum = 0 };
+var23 = oomph_null;
+var24 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var23 }, .membernum = 0 };
+var25 = meth__null___Str__5eca9cec4f_equals(var22,var24);
+var26 = meth_Bool_to_string(var25);
+oomph_print(var26);
+var27 = oomph_null;
+var28 = oomph_null;
+var29 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var28 }, .membernum = 0 };
+var30 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var27 }, .membernum = 0 };
+var31 = meth__null___Str__5eca9cec4f_equals(var30,var29);
+var32 = meth_Bool_to_string(var31);
+oomph_print(var32);
+var33 = oomph_null;
+var34 = (struct class__null___Str__5eca9cec4f){ .val = { .item0 = var33 }, .membernum = 0 };
+var35 = meth__null___Str__5eca9cec4f_equals(var2,var34);
+var36 = meth_Bool_to_string(var35);
+oomph_print(var36);
+var37 = string2_lolwat_44dea0ea84; string_incref(var37);
+var38 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var37 }, .membernum = 1 };
+var37.buf = NULL;
+var39 = meth__null___Str__5eca9cec4f_equals(var2,var38);
+var40 = meth_Bool_to_string(var39);
+oomph_print(var40);
+out: (void)0;
+string_decref(var40);
+(void)0;
+decref__null___Str__5eca9cec4f(var38);
+string_decref(var37);
+string_decref(var36);
+(void)0;
+decref__null___Str__5eca9cec4f(var34);
+(void)0;
+string_decref(var32);
+(void)0;
+decref__null___Str__5eca9cec4f(var30);
+decref__null___Str__5eca9cec4f(var29);
+(void)0;
+(void)0;
+string_decref(var26);
+(void)0;
+decref__null___Str__5eca9cec4f(var24);
+(void)0;
+decref__null___Str__5eca9cec4f(var22);
+(void)0;
+string_decref(var20);
+(void)0;
+decref__null___Str__5eca9cec4f(var18);
+(void)0;
+decref__null___Str__5eca9cec4f(var16);
+(void)0;
+decref__null___Str__5eca9cec4f(var14);
+(void)0;
+string_decref(var12);
+string_decref(var11);
+(void)0;
+decref__null___Str__5eca9cec4f(var9);
+(void)0;
+string_decref(var7);
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+decref__null___Str__5eca9cec4f(var2);
+string_decref(var1);
+}
@@ -0,0 +1,11 @@
+
+                #ifndef HEADER_GUARD_optional_fa1c6f8656
+                #define HEADER_GUARD_optional_fa1c6f8656
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Str__5eca9cec4f.h"
+void optional_fa1c6f8656_show(struct class__null___Str__5eca9cec4f var1);
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "optional_refcount_bug_f780f03ec0.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+#include "_null___Str__5eca9cec4f.h"
+
+            static struct StringBuf string0_aaa_2c687b84aa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x61', '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string0_aaa_2c687b84aa = {
+                .buf = &string0_aaa_2c687b84aa_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1__b21ca44fba_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string1__b21ca44fba = {
+                .buf = &string1__b21ca44fba_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            struct class__null___Str__5eca9cec4f optional_refcount_bug_f780f03ec0_foo(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class__null___Str__5eca9cec4f var5;
+var5.membernum = -1;
+struct class__null___Str__5eca9cec4f retval;
+var1 = string0_aaa_2c687b84aa; string_incref(var1);
+var2 = string1__b21ca44fba; string_incref(var2);
+var3 = meth_Str_split(var1,var2);
+var4 = meth_List_Str__43b70c06cb_first(var3);
+var5 = (struct class__null___Str__5eca9cec4f){ .val = { .item1 = var4 }, .membernum = 1 };
+var4.buf = NULL;
+retval = var5; var5.membernum = -1;
+goto out;
+out: (void)0;
+decref__null___Str__5eca9cec4f(var5);
+string_decref(var4);
+decref((var3), dtor_List_Str__43b70c06cb);
+string_decref(var2);
+string_decref(var1);
+return retval;
+}void oomph_main(void){struct class__null___Str__5eca9cec4f var1;
+var1.membernum = -1;
+struct class_Str var2;
+var2.buf = NULL;
+var1 = optional_refcount_bug_f780f03ec0_foo();
+var2 = meth__null___Str__5eca9cec4f_to_string(var1);
+oomph_print(var2);
+out: (void)0;
+string_decref(var2);
+decref__null___Str__5eca9cec4f(var1);
+}
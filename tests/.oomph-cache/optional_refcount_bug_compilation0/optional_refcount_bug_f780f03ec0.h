@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_optional_refcount_bug_f780f03ec0
+                #define HEADER_GUARD_optional_refcount_bug_f780f03ec0
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Str__5eca9cec4f.h"
+struct class_List_Str__43b70c06cb;
+struct class__null___Str__5eca9cec4f optional_refcount_bug_f780f03ec0_foo(void);
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,49 @@
+#include <lib/oomph.h>
+#include "Bar_8b8a048fa4.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Bar_e47fc9a9d2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Bar_e47fc9a9d2 = {
+                .buf = &string0_Bar_e47fc9a9d2_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Bar_8b8a048fa4* ctor_Bar_8b8a048fa4(void)
+            {
+                struct class_Bar_8b8a048fa4* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_Bar_8b8a048fa4(void *ptr)
+            {
+                struct class_Bar_8b8a048fa4 *obj = ptr;
+                
+                free(obj);
+            }
+            
+                struct class_Str meth_Bar_8b8a048fa4_to_string(struct class_Bar_8b8a048fa4* self)
+                {
+                    struct class_Str res = string0_Bar_e47fc9a9d2;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Bar_8b8a048fa4_equals(struct class_Bar_8b8a048fa4* var1, struct class_Bar_8b8a048fa4* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
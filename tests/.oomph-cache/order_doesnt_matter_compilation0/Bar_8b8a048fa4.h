@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Bar_8b8a048fa4
+                #define HEADER_GUARD_Bar_8b8a048fa4
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Bar_8b8a048fa4 {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Bar_8b8a048fa4* ctor_Bar_8b8a048fa4(void);
+            void dtor_Bar_8b8a048fa4(void *ptr);
+            
+                struct class_Str meth_Bar_8b8a048fa4_to_string(struct class_Bar_8b8a048fa4* obj);
+                bool meth_Bar_8b8a048fa4_equals(struct class_Bar_8b8a048fa4* var1, struct class_Bar_8b8a048fa4* var2);
+
+                #endif
+                
@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "Foo_1ba8ce56d8.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_8b8a048fa4.h"
+
+            static struct StringBuf string0_Foo_876043fca8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_876043fca8 = {
+                .buf = &string0_Foo_876043fca8_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Foo_1ba8ce56d8* ctor_Foo_1ba8ce56d8(struct class_Bar_8b8a048fa4* arg_b)
+            {
+                struct class_Foo_1ba8ce56d8* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_b = arg_b;
+
+                incref(arg_b);
+
+                return obj;
+            }
+
+            void dtor_Foo_1ba8ce56d8(void *ptr)
+            {
+                struct class_Foo_1ba8ce56d8 *obj = ptr;
+                decref((obj->memb_b), dtor_Bar_8b8a048fa4);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo_1ba8ce56d8_to_string(struct class_Foo_1ba8ce56d8* self)
+                {
+                    struct class_Str res = string0_Foo_876043fca8;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Bar_8b8a048fa4_to_string(self->memb_b);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_1ba8ce56d8_equals(struct class_Foo_1ba8ce56d8* var1, struct class_Foo_1ba8ce56d8* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
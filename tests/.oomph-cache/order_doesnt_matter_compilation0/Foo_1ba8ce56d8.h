@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_Foo_1ba8ce56d8
+                #define HEADER_GUARD_Foo_1ba8ce56d8
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Bar_8b8a048fa4;
+struct class_Bar_8b8a048fa4;
+
+            struct class_Foo_1ba8ce56d8 {
+                REFCOUNT_HEADER
+                struct class_Bar_8b8a048fa4* memb_b;
+
+            };
+            
+            struct class_Foo_1ba8ce56d8* ctor_Foo_1ba8ce56d8(struct class_Bar_8b8a048fa4* arg_b);
+            void dtor_Foo_1ba8ce56d8(void *ptr);
+            
+                struct class_Str meth_Foo_1ba8ce56d8_to_string(struct class_Foo_1ba8ce56d8* obj);
+                bool meth_Foo_1ba8ce56d8_equals(struct class_Foo_1ba8ce56d8* var1, struct class_Foo_1ba8ce56d8* var2);
+
+                #endif
+                
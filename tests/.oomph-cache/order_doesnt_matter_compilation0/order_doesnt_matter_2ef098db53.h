@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_order_doesnt_matter_2ef098db53
+                #define HEADER_GUARD_order_doesnt_matter_2ef098db53
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
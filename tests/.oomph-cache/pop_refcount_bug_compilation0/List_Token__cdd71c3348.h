@@ -0,0 +1,136 @@
+
+                #ifndef HEADER_GUARD_List_Token__cdd71c3348
+                #define HEADER_GUARD_List_Token__cdd71c3348
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Token_3a0ef69ca0.h"
+struct class_Token_3a0ef69ca0;
+struct class_Token_3a0ef69ca0;
+struct class_Token_3a0ef69ca0;
+struct class_Token_3a0ef69ca0;
+struct class_Token_3a0ef69ca0;
+struct class_Token_3a0ef69ca0;
+struct class_Token_3a0ef69ca0;
+struct class_Token_3a0ef69ca0;
+struct class_Token_3a0ef69ca0;
+struct class_Token_3a0ef69ca0;
+struct class_Token_3a0ef69ca0;
+struct class_Token_3a0ef69ca0;
+struct class_Token_3a0ef69ca0;
+struct class_Token_3a0ef69ca0;
+
+#define CONSTRUCTOR ctor_List_Token__cdd71c3348
+
+#define DESTRUCTOR dtor_List_Token__cdd71c3348
+
+#define TYPE struct class_List_Token__cdd71c3348 *
+
+#define TYPE_STRUCT class_List_Token__cdd71c3348
+
+#define METHOD(name) meth_List_Token__cdd71c3348_##name
+
+#define ITEMTYPE struct class_Token_3a0ef69ca0*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Token_3a0ef69ca0_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Token_3a0ef69ca0)
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_Token__cdd71c3348___contains(struct class_List_Token__cdd71c3348*, struct class_Token_3a0ef69ca0*);
+void meth_List_Token__cdd71c3348___reserve(struct class_List_Token__cdd71c3348*, int64_t);
+struct class_Token_3a0ef69ca0* meth_List_Token__cdd71c3348_delete_at_index(struct class_List_Token__cdd71c3348*, int64_t);
+struct class_List_Token__cdd71c3348* meth_List_Token__cdd71c3348_delete_slice(struct class_List_Token__cdd71c3348*, int64_t, int64_t);
+bool meth_List_Token__cdd71c3348_ends_with(struct class_List_Token__cdd71c3348*, struct class_List_Token__cdd71c3348*);
+int64_t meth_List_Token__cdd71c3348_find_first(struct class_List_Token__cdd71c3348*, struct class_Token_3a0ef69ca0*);
+int64_t meth_List_Token__cdd71c3348_find_last(struct class_List_Token__cdd71c3348*, struct class_Token_3a0ef69ca0*);
+int64_t meth_List_Token__cdd71c3348_find_only(struct class_List_Token__cdd71c3348*, struct class_Token_3a0ef69ca0*);
+struct class_Token_3a0ef69ca0* meth_List_Token__cdd71c3348_first(struct class_List_Token__cdd71c3348*);
+struct class_Token_3a0ef69ca0* meth_List_Token__cdd71c3348_get(struct class_List_Token__cdd71c3348*, int64_t);
+void meth_List_Token__cdd71c3348_insert(struct class_List_Token__cdd71c3348*, int64_t, struct class_Token_3a0ef69ca0*);
+struct class_Token_3a0ef69ca0* meth_List_Token__cdd71c3348_last(struct class_List_Token__cdd71c3348*);
+int64_t meth_List_Token__cdd71c3348_length(struct class_List_Token__cdd71c3348*);
+struct class_Token_3a0ef69ca0* meth_List_Token__cdd71c3348_pop(struct class_List_Token__cdd71c3348*);
+void meth_List_Token__cdd71c3348_push(struct class_List_Token__cdd71c3348*, struct class_Token_3a0ef69ca0*);
+void meth_List_Token__cdd71c3348_push_all(struct class_List_Token__cdd71c3348*, struct class_List_Token__cdd71c3348*);
+void meth_List_Token__cdd71c3348_delete_first(struct class_List_Token__cdd71c3348*, struct class_Token_3a0ef69ca0*);
+void meth_List_Token__cdd71c3348_delete_last(struct class_List_Token__cdd71c3348*, struct class_Token_3a0ef69ca0*);
+void meth_List_Token__cdd71c3348_delete_only(struct class_List_Token__cdd71c3348*, struct class_Token_3a0ef69ca0*);
+struct class_List_Token__cdd71c3348* meth_List_Token__cdd71c3348_reversed(struct class_List_Token__cdd71c3348*);
+struct class_List_Token__cdd71c3348* meth_List_Token__cdd71c3348_slice(struct class_List_Token__cdd71c3348*, int64_t, int64_t);
+bool meth_List_Token__cdd71c3348_starts_with(struct class_List_Token__cdd71c3348*, struct class_List_Token__cdd71c3348*);
+struct class_Str meth_List_Token__cdd71c3348_to_string(struct class_List_Token__cdd71c3348*);
+struct class_Str meth_List_Token__cdd71c3348_join(struct class_List_Token__cdd71c3348*, struct class_Str);
+bool meth_List_Token__cdd71c3348_equals(struct class_List_Token__cdd71c3348*, struct class_List_Token__cdd71c3348*);
+
+#define CONSTRUCTOR ctor_List_Token__cdd71c3348
+
+#define DESTRUCTOR dtor_List_Token__cdd71c3348
+
+#define TYPE struct class_List_Token__cdd71c3348 *
+
+#define TYPE_STRUCT class_List_Token__cdd71c3348
+
+#define METHOD(name) meth_List_Token__cdd71c3348_##name
+
+#define ITEMTYPE struct class_Token_3a0ef69ca0*
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_Token_3a0ef69ca0_##name
+
+#define INCREF_ITEM(val) incref((val))
+
+#define DECREF_ITEM(val) decref(((val)), dtor_Token_3a0ef69ca0)
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
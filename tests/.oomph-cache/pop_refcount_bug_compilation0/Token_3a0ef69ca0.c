@@ -0,0 +1,49 @@
+#include <lib/oomph.h>
+#include "Token_3a0ef69ca0.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Token_cf672ce2d4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x6f', '\x6b', '\x65', '\x6e' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Token_cf672ce2d4 = {
+                .buf = &string0_Token_cf672ce2d4_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            struct class_Token_3a0ef69ca0* ctor_Token_3a0ef69ca0(void)
+            {
+                struct class_Token_3a0ef69ca0* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_Token_3a0ef69ca0(void *ptr)
+            {
+                struct class_Token_3a0ef69ca0 *obj = ptr;
+                
+                free(obj);
+            }
+            
+                struct class_Str meth_Token_3a0ef69ca0_to_string(struct class_Token_3a0ef69ca0* self)
+                {
+                    struct class_Str res = string0_Token_cf672ce2d4;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Token_3a0ef69ca0_equals(struct class_Token_3a0ef69ca0* var1, struct class_Token_3a0ef69ca0* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
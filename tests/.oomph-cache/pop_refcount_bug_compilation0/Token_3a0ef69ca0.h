@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Token_3a0ef69ca0
+                #define HEADER_GUARD_Token_3a0ef69ca0
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Token_3a0ef69ca0 {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Token_3a0ef69ca0* ctor_Token_3a0ef69ca0(void);
+            void dtor_Token_3a0ef69ca0(void *ptr);
+            
+                struct class_Str meth_Token_3a0ef69ca0_to_string(struct class_Token_3a0ef69ca0* obj);
+                bool meth_Token_3a0ef69ca0_equals(struct class_Token_3a0ef69ca0* var1, struct class_Token_3a0ef69ca0* var2);
+
+                #endif
+                
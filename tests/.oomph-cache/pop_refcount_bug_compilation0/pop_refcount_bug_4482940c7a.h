@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_pop_refcount_bug_4482940c7a
+                #define HEADER_GUARD_pop_refcount_bug_4482940c7a
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Token__cdd71c3348;
+struct class_Token_3a0ef69ca0;
+struct class_Token_3a0ef69ca0;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,18 @@
+#include <lib/oomph.h>
+#include "prefix_minus_bug_1f4818ee33.h"
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void){bool var1;
+bool var2;
+struct class_Str var4;
+var4.buf = NULL;
+var1 = oomph_false;
+var2 = var1;
+if (oomph_true) goto label3;
+label3: (void)0;
+var4 = meth_Bool_to_string(var2);
+oomph_print(var4);
+out: (void)0;
+string_decref(var4);
+(void)0;
+(void)0;
+}
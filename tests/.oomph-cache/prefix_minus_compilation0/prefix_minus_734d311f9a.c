@@ -0,0 +1,29 @@
+#include <lib/oomph.h>
+#include "prefix_minus_734d311f9a.h"
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void){int64_t var1;
+struct class_Str var2;
+var2.buf = NULL;
+int64_t var3;
+struct class_Str var4;
+var4.buf = NULL;
+double var5;
+struct class_Str var6;
+var6.buf = NULL;
+var1 = 3LL;
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+var3 = 2LL;
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+var5 = 2.0;
+var6 = meth_Float_to_string(var5);
+oomph_print(var6);
+out: (void)0;
+string_decref(var6);
+(void)0;
+string_decref(var4);
+(void)0;
+string_decref(var2);
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_prefix_minus_734d311f9a
+                #define HEADER_GUARD_prefix_minus_734d311f9a
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
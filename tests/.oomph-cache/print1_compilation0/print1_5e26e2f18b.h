@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_print1_5e26e2f18b
+                #define HEADER_GUARD_print1_5e26e2f18b
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
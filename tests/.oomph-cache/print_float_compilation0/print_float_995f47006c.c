@@ -0,0 +1,13 @@
+#include <lib/oomph.h>
+#include "print_float_995f47006c.h"
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void){double var1;
+struct class_Str var2;
+var2.buf = NULL;
+var1 = 12.34;
+var2 = meth_Float_to_string(var1);
+oomph_print(var2);
+out: (void)0;
+string_decref(var2);
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_print_float_995f47006c
+                #define HEADER_GUARD_print_float_995f47006c
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,182 @@
+#include <lib/oomph.h>
+#include "process_edf78a1270.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+#include "bundle_io_45f5b8a585.h"
+#include "bundle_process_e29aff3881.h"
+
+            static struct StringBuf string0_cp_b09eb4dd73_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x70' },
+                .malloced = false,
+            };
+            static struct class_Str string0_cp_b09eb4dd73 = {
+                .buf = &string0_cp_b09eb4dd73_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_README_md_1fbdbd89ba_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x52', '\x45', '\x41', '\x44', '\x4d', '\x45', '\x2e', '\x6d', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string1_README_md_1fbdbd89ba = {
+                .buf = &string1_README_md_1fbdbd89ba_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_test_out__5ea16626c3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x5f', '\x6f', '\x75', '\x74', '\x2f' },
+                .malloced = false,
+            };
+            static struct class_Str string2_test_out__5ea16626c3 = {
+                .buf = &string2_test_out__5ea16626c3_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_test_out_README_md_f4f7dd1b25_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x5f', '\x6f', '\x75', '\x74', '\x2f', '\x52', '\x45', '\x41', '\x44', '\x4d', '\x45', '\x2e', '\x6d', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string3_test_out_README_md_f4f7dd1b25 = {
+                .buf = &string3_test_out_README_md_f4f7dd1b25_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4___384adfad49_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string4___384adfad49 = {
+                .buf = &string4___384adfad49_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_sh_6c3b7f53b3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string5_sh_6c3b7f53b3 = {
+                .buf = &string5_sh_6c3b7f53b3_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6__c_1859e8d215_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string6__c_1859e8d215 = {
+                .buf = &string6__c_1859e8d215_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7_exit_69_e08e3d2ff1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x78', '\x69', '\x74', '\x20', '\x36', '\x39' },
+                .malloced = false,
+            };
+            static struct class_Str string7_exit_69_e08e3d2ff1 = {
+                .buf = &string7_exit_69_e08e3d2ff1_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_List_Str__43b70c06cb* var1;
+var1 = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+int64_t var5;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_List_Str__43b70c06cb* var11;
+var11 = NULL;
+int64_t var12;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_List_Str__43b70c06cb* var14;
+var14 = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+int64_t var18;
+struct class_Str var19;
+var19.buf = NULL;
+var1 = ctor_List_Str__43b70c06cb();
+var2 = string0_cp_b09eb4dd73; string_incref(var2);
+meth_List_Str__43b70c06cb_push(var1,var2);
+var3 = string1_README_md_1fbdbd89ba; string_incref(var3);
+meth_List_Str__43b70c06cb_push(var1,var3);
+var4 = string2_test_out__5ea16626c3; string_incref(var4);
+meth_List_Str__43b70c06cb_push(var1,var4);
+var5 = bundle_process_e29aff3881_run(var1);
+var6 = meth_Int_to_string(var5);
+oomph_print(var6);
+var7 = meth_List_Str__43b70c06cb_to_string(var1);
+oomph_print(var7);
+var8 = string3_test_out_README_md_f4f7dd1b25; string_incref(var8);
+var9 = bundle_io_45f5b8a585_read_file(var8);
+var10 = string4___384adfad49; string_incref(var10);
+var11 = meth_Str_split(var9,var10);
+var12 = 0LL;
+var13 = meth_List_Str__43b70c06cb_get(var11,var12);
+oomph_print(var13);
+var14 = ctor_List_Str__43b70c06cb();
+decref((var1), dtor_List_Str__43b70c06cb);
+var1 = var14;
+var14 = NULL;
+var15 = string5_sh_6c3b7f53b3; string_incref(var15);
+meth_List_Str__43b70c06cb_push(var1,var15);
+var16 = string6__c_1859e8d215; string_incref(var16);
+meth_List_Str__43b70c06cb_push(var1,var16);
+var17 = string7_exit_69_e08e3d2ff1; string_incref(var17);
+meth_List_Str__43b70c06cb_push(var1,var17);
+var18 = bundle_process_e29aff3881_run(var1);
+var19 = meth_Int_to_string(var18);
+oomph_print(var19);
+out: (void)0;
+string_decref(var19);
+(void)0;
+string_decref(var17);
+string_decref(var16);
+string_decref(var15);
+decref((var14), dtor_List_Str__43b70c06cb);
+string_decref(var13);
+(void)0;
+decref((var11), dtor_List_Str__43b70c06cb);
+string_decref(var10);
+string_decref(var9);
+string_decref(var8);
+string_decref(var7);
+string_decref(var6);
+(void)0;
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+decref((var1), dtor_List_Str__43b70c06cb);
+}
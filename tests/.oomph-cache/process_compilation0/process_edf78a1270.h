@@ -0,0 +1,14 @@
+
+                #ifndef HEADER_GUARD_process_edf78a1270
+                #define HEADER_GUARD_process_edf78a1270
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_io_45f5b8a585.h"
+#include "bundle_process_e29aff3881.h"
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+void oomph_main(void);
+
+                #endif
+                
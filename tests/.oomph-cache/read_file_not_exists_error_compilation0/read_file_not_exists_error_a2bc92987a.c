@@ -0,0 +1,25 @@
+#include <lib/oomph.h>
+#include "read_file_not_exists_error_a2bc92987a.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_io_45f5b8a585.h"
+
+            static struct StringBuf string0__foo_2fc66050db_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f', '\x66', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0__foo_2fc66050db = {
+                .buf = &string0__foo_2fc66050db_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+var1 = string0__foo_2fc66050db; string_incref(var1);
+var2 = bundle_io_45f5b8a585_read_file(var1);
+out: (void)0;
+string_decref(var2);
+string_decref(var1);
+}
@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_read_file_not_exists_error_a2bc92987a
+                #define HEADER_GUARD_read_file_not_exists_error_a2bc92987a
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_io_45f5b8a585.h"
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,33 @@
+#include <lib/oomph.h>
+#include "read_file_zero_455a03089c.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_io_45f5b8a585.h"
+
+            static struct StringBuf string0_tests_10_zero_bytes_3e24b9147f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73', '\x2f', '\x31', '\x30', '\x5f', '\x7a', '\x65', '\x72', '\x6f', '\x5f', '\x62', '\x79', '\x74', '\x65', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string0_tests_10_zero_bytes_3e24b9147f = {
+                .buf = &string0_tests_10_zero_bytes_3e24b9147f_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+int64_t var3;
+struct class_Str var4;
+var4.buf = NULL;
+var1 = string0_tests_10_zero_bytes_3e24b9147f; string_incref(var1);
+var2 = bundle_io_45f5b8a585_read_file(var1);
+var3 = meth_Str_length(var2);
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+out: (void)0;
+string_decref(var4);
+(void)0;
+string_decref(var2);
+string_decref(var1);
+}
@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_read_file_zero_455a03089c
+                #define HEADER_GUARD_read_file_zero_455a03089c
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_io_45f5b8a585.h"
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,77 @@
+#include <lib/oomph.h>
+#include "Count_aa323296ff.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Count_619a2d65a1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6f', '\x75', '\x6e', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Count_619a2d65a1 = {
+                .buf = &string0_Count_619a2d65a1_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            struct class_Count_aa323296ff* ctor_Count_aa323296ff(void)
+            {
+                struct class_Count_aa323296ff* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_Count_aa323296ff(void *ptr)
+            {
+                struct class_Count_aa323296ff *obj = ptr;
+                
+                free(obj);
+            }
+            
+                struct class_Str meth_Count_aa323296ff_to_string(struct class_Count_aa323296ff* self)
+                {
+                    struct class_Str res = string0_Count_619a2d65a1;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Count_aa323296ff_equals(struct class_Count_aa323296ff* var1, struct class_Count_aa323296ff* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}void meth_Count_aa323296ff_down(struct class_Count_aa323296ff* var1, int64_t var2){int64_t var3;
+bool var4;
+bool var5;
+struct class_Str var8;
+var8.buf = NULL;
+var3 = 0LL;
+var4 = meth_Int_equals(var2,var3);
+var5 = oomph_bool_not(var4);
+if (var5) goto label6;
+if (oomph_true) goto label7;
+label6: (void)0;
+var8 = meth_Int_to_string(var2);
+oomph_print(var8);
+meth_Count_aa323296ff_down2(var1,var2);
+label7: (void)0;
+out: (void)0;
+string_decref(var8);
+(void)0;
+(void)0;
+(void)0;
+}void meth_Count_aa323296ff_down2(struct class_Count_aa323296ff* var1, int64_t var2){int64_t var3;
+int64_t var4;
+var3 = 1LL;
+var4 = oomph_int_sub(var2,var3);
+meth_Count_aa323296ff_down(var1,var4);
+out: (void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,21 @@
+
+                #ifndef HEADER_GUARD_Count_aa323296ff
+                #define HEADER_GUARD_Count_aa323296ff
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Count_aa323296ff {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Count_aa323296ff* ctor_Count_aa323296ff(void);
+            void dtor_Count_aa323296ff(void *ptr);
+            
+                struct class_Str meth_Count_aa323296ff_to_string(struct class_Count_aa323296ff* obj);
+                bool meth_Count_aa323296ff_equals(struct class_Count_aa323296ff* var1, struct class_Count_aa323296ff* var2);
+void meth_Count_aa323296ff_down(struct class_Count_aa323296ff* var1, int64_t var2);
+void meth_Count_aa323296ff_down2(struct class_Count_aa323296ff* var1, int64_t var2);
+
+                #endif
+                
@@ -0,0 +1,46 @@
+#include <lib/oomph.h>
+#include "recurse_bba1ebf91f.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Count_aa323296ff.h"
+void recurse_bba1ebf91f_countdown(int64_t var1){int64_t var2;
+bool var3;
+bool var4;
+struct class_Str var7;
+var7.buf = NULL;
+var2 = 0LL;
+var3 = meth_Int_equals(var1,var2);
+var4 = oomph_bool_not(var3);
+if (var4) goto label5;
+if (oomph_true) goto label6;
+label5: (void)0;
+var7 = meth_Int_to_string(var1);
+oomph_print(var7);
+recurse_bba1ebf91f_countdown2(var1);
+label6: (void)0;
+out: (void)0;
+string_decref(var7);
+(void)0;
+(void)0;
+(void)0;
+}void recurse_bba1ebf91f_countdown2(int64_t var1){int64_t var2;
+int64_t var3;
+var2 = 1LL;
+var3 = oomph_int_sub(var1,var2);
+recurse_bba1ebf91f_countdown(var3);
+out: (void)0;
+(void)0;
+(void)0;
+}void oomph_main(void){int64_t var1;
+struct class_Count_aa323296ff* var2;
+var2 = NULL;
+int64_t var3;
+var1 = 10LL;
+recurse_bba1ebf91f_countdown(var1);
+var2 = ctor_Count_aa323296ff();
+var3 = 20LL;
+meth_Count_aa323296ff_down(var2,var3);
+out: (void)0;
+(void)0;
+decref((var2), dtor_Count_aa323296ff);
+(void)0;
+}
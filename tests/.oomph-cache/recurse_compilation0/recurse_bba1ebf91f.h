@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_recurse_bba1ebf91f
+                #define HEADER_GUARD_recurse_bba1ebf91f
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Count_aa323296ff;
+void recurse_bba1ebf91f_countdown(int64_t var1);
+void recurse_bba1ebf91f_countdown2(int64_t var1);
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,56 @@
+#include <lib/oomph.h>
+#include "Inner_b1bbe028aa.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Inner_34cf7035c5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6e', '\x6e', '\x65', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Inner_34cf7035c5 = {
+                .buf = &string0_Inner_34cf7035c5_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            struct class_Inner_b1bbe028aa* ctor_Inner_b1bbe028aa(struct class_Str arg_name)
+            {
+                struct class_Inner_b1bbe028aa* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_name = arg_name;
+
+                string_incref(arg_name);
+
+                return obj;
+            }
+
+            void dtor_Inner_b1bbe028aa(void *ptr)
+            {
+                struct class_Inner_b1bbe028aa *obj = ptr;
+                string_decref(obj->memb_name);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Inner_b1bbe028aa_to_string(struct class_Inner_b1bbe028aa* self)
+                {
+                    struct class_Str res = string0_Inner_34cf7035c5;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Inner_b1bbe028aa_equals(struct class_Inner_b1bbe028aa* var1, struct class_Inner_b1bbe028aa* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,20 @@
+
+                #ifndef HEADER_GUARD_Inner_b1bbe028aa
+                #define HEADER_GUARD_Inner_b1bbe028aa
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Inner_b1bbe028aa {
+                REFCOUNT_HEADER
+                struct class_Str memb_name;
+
+            };
+            
+            struct class_Inner_b1bbe028aa* ctor_Inner_b1bbe028aa(struct class_Str arg_name);
+            void dtor_Inner_b1bbe028aa(void *ptr);
+            
+                struct class_Str meth_Inner_b1bbe028aa_to_string(struct class_Inner_b1bbe028aa* obj);
+                bool meth_Inner_b1bbe028aa_equals(struct class_Inner_b1bbe028aa* var1, struct class_Inner_b1bbe028aa* var2);
+
+                #endif
+                
@@ -0,0 +1,122 @@
+
+                #ifndef HEADER_GUARD_List_StrOrInt__8e4a9adb5d
+                #define HEADER_GUARD_List_StrOrInt__8e4a9adb5d
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "StrOrInt_6cfe0bd2e0.h"
+
+#define CONSTRUCTOR ctor_List_StrOrInt__8e4a9adb5d
+
+#define DESTRUCTOR dtor_List_StrOrInt__8e4a9adb5d
+
+#define TYPE struct class_List_StrOrInt__8e4a9adb5d *
+
+#define TYPE_STRUCT class_List_StrOrInt__8e4a9adb5d
+
+#define METHOD(name) meth_List_StrOrInt__8e4a9adb5d_##name
+
+#define ITEMTYPE struct class_StrOrInt_6cfe0bd2e0
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_StrOrInt_6cfe0bd2e0_##name
+
+#define INCREF_ITEM(val) incref_StrOrInt_6cfe0bd2e0((val))
+
+#define DECREF_ITEM(val) decref_StrOrInt_6cfe0bd2e0((val))
+// TODO: have this struct on stack when possible, same with strings
+struct TYPE_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEMTYPE smalldata[8];
+	ITEMTYPE *data;
+};
+
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+bool meth_List_StrOrInt__8e4a9adb5d___contains(struct class_List_StrOrInt__8e4a9adb5d*, struct class_StrOrInt_6cfe0bd2e0);
+void meth_List_StrOrInt__8e4a9adb5d___reserve(struct class_List_StrOrInt__8e4a9adb5d*, int64_t);
+struct class_StrOrInt_6cfe0bd2e0 meth_List_StrOrInt__8e4a9adb5d_delete_at_index(struct class_List_StrOrInt__8e4a9adb5d*, int64_t);
+struct class_List_StrOrInt__8e4a9adb5d* meth_List_StrOrInt__8e4a9adb5d_delete_slice(struct class_List_StrOrInt__8e4a9adb5d*, int64_t, int64_t);
+bool meth_List_StrOrInt__8e4a9adb5d_ends_with(struct class_List_StrOrInt__8e4a9adb5d*, struct class_List_StrOrInt__8e4a9adb5d*);
+int64_t meth_List_StrOrInt__8e4a9adb5d_find_first(struct class_List_StrOrInt__8e4a9adb5d*, struct class_StrOrInt_6cfe0bd2e0);
+int64_t meth_List_StrOrInt__8e4a9adb5d_find_last(struct class_List_StrOrInt__8e4a9adb5d*, struct class_StrOrInt_6cfe0bd2e0);
+int64_t meth_List_StrOrInt__8e4a9adb5d_find_only(struct class_List_StrOrInt__8e4a9adb5d*, struct class_StrOrInt_6cfe0bd2e0);
+struct class_StrOrInt_6cfe0bd2e0 meth_List_StrOrInt__8e4a9adb5d_first(struct class_List_StrOrInt__8e4a9adb5d*);
+struct class_StrOrInt_6cfe0bd2e0 meth_List_StrOrInt__8e4a9adb5d_get(struct class_List_StrOrInt__8e4a9adb5d*, int64_t);
+void meth_List_StrOrInt__8e4a9adb5d_insert(struct class_List_StrOrInt__8e4a9adb5d*, int64_t, struct class_StrOrInt_6cfe0bd2e0);
+struct class_StrOrInt_6cfe0bd2e0 meth_List_StrOrInt__8e4a9adb5d_last(struct class_List_StrOrInt__8e4a9adb5d*);
+int64_t meth_List_StrOrInt__8e4a9adb5d_length(struct class_List_StrOrInt__8e4a9adb5d*);
+struct class_StrOrInt_6cfe0bd2e0 meth_List_StrOrInt__8e4a9adb5d_pop(struct class_List_StrOrInt__8e4a9adb5d*);
+void meth_List_StrOrInt__8e4a9adb5d_push(struct class_List_StrOrInt__8e4a9adb5d*, struct class_StrOrInt_6cfe0bd2e0);
+void meth_List_StrOrInt__8e4a9adb5d_push_all(struct class_List_StrOrInt__8e4a9adb5d*, struct class_List_StrOrInt__8e4a9adb5d*);
+void meth_List_StrOrInt__8e4a9adb5d_delete_first(struct class_List_StrOrInt__8e4a9adb5d*, struct class_StrOrInt_6cfe0bd2e0);
+void meth_List_StrOrInt__8e4a9adb5d_delete_last(struct class_List_StrOrInt__8e4a9adb5d*, struct class_StrOrInt_6cfe0bd2e0);
+void meth_List_StrOrInt__8e4a9adb5d_delete_only(struct class_List_StrOrInt__8e4a9adb5d*, struct class_StrOrInt_6cfe0bd2e0);
+struct class_List_StrOrInt__8e4a9adb5d* meth_List_StrOrInt__8e4a9adb5d_reversed(struct class_List_StrOrInt__8e4a9adb5d*);
+struct class_List_StrOrInt__8e4a9adb5d* meth_List_StrOrInt__8e4a9adb5d_slice(struct class_List_StrOrInt__8e4a9adb5d*, int64_t, int64_t);
+bool meth_List_StrOrInt__8e4a9adb5d_starts_with(struct class_List_StrOrInt__8e4a9adb5d*, struct class_List_StrOrInt__8e4a9adb5d*);
+struct class_Str meth_List_StrOrInt__8e4a9adb5d_to_string(struct class_List_StrOrInt__8e4a9adb5d*);
+struct class_Str meth_List_StrOrInt__8e4a9adb5d_join(struct class_List_StrOrInt__8e4a9adb5d*, struct class_Str);
+bool meth_List_StrOrInt__8e4a9adb5d_equals(struct class_List_StrOrInt__8e4a9adb5d*, struct class_List_StrOrInt__8e4a9adb5d*);
+
+#define CONSTRUCTOR ctor_List_StrOrInt__8e4a9adb5d
+
+#define DESTRUCTOR dtor_List_StrOrInt__8e4a9adb5d
+
+#define TYPE struct class_List_StrOrInt__8e4a9adb5d *
+
+#define TYPE_STRUCT class_List_StrOrInt__8e4a9adb5d
+
+#define METHOD(name) meth_List_StrOrInt__8e4a9adb5d_##name
+
+#define ITEMTYPE struct class_StrOrInt_6cfe0bd2e0
+
+#define ITEMTYPE_IS_STRING 0
+
+#define ITEMTYPE_METHOD(name) meth_StrOrInt_6cfe0bd2e0_##name
+
+#define INCREF_ITEM(val) incref_StrOrInt_6cfe0bd2e0((val))
+
+#define DECREF_ITEM(val) decref_StrOrInt_6cfe0bd2e0((val))
+TYPE CONSTRUCTOR(void); void DESTRUCTOR(void *ptr);
+#undef CONSTRUCTOR
+
+#undef DESTRUCTOR
+
+#undef TYPE
+
+#undef TYPE_STRUCT
+
+#undef METHOD
+
+#undef ITEMTYPE
+
+#undef ITEMTYPE_IS_STRING
+
+#undef ITEMTYPE_METHOD
+
+#undef INCREF_ITEM
+
+#undef DECREF_ITEM
+
+                #endif
+                
@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "Outer_6317f6af89.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Inner_b1bbe028aa.h"
+
+            static struct StringBuf string0_Outer_49d38fb45e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4f', '\x75', '\x74', '\x65', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Outer_49d38fb45e = {
+                .buf = &string0_Outer_49d38fb45e_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            struct class_Outer_6317f6af89* ctor_Outer_6317f6af89(struct class_Inner_b1bbe028aa* arg_inner)
+            {
+                struct class_Outer_6317f6af89* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_inner = arg_inner;
+
+                incref(arg_inner);
+
+                return obj;
+            }
+
+            void dtor_Outer_6317f6af89(void *ptr)
+            {
+                struct class_Outer_6317f6af89 *obj = ptr;
+                decref((obj->memb_inner), dtor_Inner_b1bbe028aa);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Outer_6317f6af89_to_string(struct class_Outer_6317f6af89* self)
+                {
+                    struct class_Str res = string0_Outer_49d38fb45e;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Inner_b1bbe028aa_to_string(self->memb_inner);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Outer_6317f6af89_equals(struct class_Outer_6317f6af89* var1, struct class_Outer_6317f6af89* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,22 @@
+
+                #ifndef HEADER_GUARD_Outer_6317f6af89
+                #define HEADER_GUARD_Outer_6317f6af89
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Inner_b1bbe028aa;
+struct class_Inner_b1bbe028aa;
+
+            struct class_Outer_6317f6af89 {
+                REFCOUNT_HEADER
+                struct class_Inner_b1bbe028aa* memb_inner;
+
+            };
+            
+            struct class_Outer_6317f6af89* ctor_Outer_6317f6af89(struct class_Inner_b1bbe028aa* arg_inner);
+            void dtor_Outer_6317f6af89(void *ptr);
+            
+                struct class_Str meth_Outer_6317f6af89_to_string(struct class_Outer_6317f6af89* obj);
+                bool meth_Outer_6317f6af89_equals(struct class_Outer_6317f6af89* var1, struct class_Outer_6317f6af89* var2);
+
+                #endif
+                
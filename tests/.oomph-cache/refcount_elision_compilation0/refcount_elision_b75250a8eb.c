@@ -0,0 +1,675 @@
+#include <lib/oomph.h>
+#include "refcount_elision_b75250a8eb.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Inner_b1bbe028aa.h"
+#include "List_StrOrInt__8e4a9adb5d.h"
+#include "List_Str__43b70c06cb.h"
+#include "Outer_6317f6af89.h"
+#include "StrOrInt_6cfe0bd2e0.h"
+
+            static struct StringBuf string0___7fbc5f4d54_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x21' },
+                .malloced = false,
+            };
+            static struct class_Str string0___7fbc5f4d54 = {
+                .buf = &string0___7fbc5f4d54_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1___04ae3b8ad0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3f' },
+                .malloced = false,
+            };
+            static struct class_Str string1___04ae3b8ad0 = {
+                .buf = &string1___04ae3b8ad0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2___82cf4956a7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string2___82cf4956a7 = {
+                .buf = &string2___82cf4956a7_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3__3c4b45c5c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string3__3c4b45c5c0 = {
+                .buf = &string3__3c4b45c5c0_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4___961b596efb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string4___961b596efb = {
+                .buf = &string4___961b596efb_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_ab_eb8150a997_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string5_ab_eb8150a997 = {
+                .buf = &string5_ab_eb8150a997_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6_cd_3732b629b0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string6_cd_3732b629b0 = {
+                .buf = &string6_cd_3732b629b0_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7_ef_7418e48c7b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string7_ef_7418e48c7b = {
+                .buf = &string7_ef_7418e48c7b_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string8_g_7f9c375c07_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string8_g_7f9c375c07 = {
+                .buf = &string8_g_7f9c375c07_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string9_a_16d95e13c6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string9_a_16d95e13c6 = {
+                .buf = &string9_a_16d95e13c6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string10_b_780405b68f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string10_b_780405b68f = {
+                .buf = &string10_b_780405b68f_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string11_xy_dfcaaa2431_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x78', '\x79' },
+                .malloced = false,
+            };
+            static struct class_Str string11_xy_dfcaaa2431 = {
+                .buf = &string11_xy_dfcaaa2431_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string12_x_bac1c61409_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x78' },
+                .malloced = false,
+            };
+            static struct class_Str string12_x_bac1c61409 = {
+                .buf = &string12_x_bac1c61409_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string13_y_f268d308f7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x79' },
+                .malloced = false,
+            };
+            static struct class_Str string13_y_f268d308f7 = {
+                .buf = &string13_y_f268d308f7_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string14_foo_8b94783b12_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string14_foo_8b94783b12 = {
+                .buf = &string14_foo_8b94783b12_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string15_bar_3edf60a447_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x61', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string15_bar_3edf60a447 = {
+                .buf = &string15_bar_3edf60a447_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            struct class_Str refcount_elision_b75250a8eb_maybe_append(struct class_Str var1, bool var2){struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str retval;
+var3 = string0___7fbc5f4d54; string_incref(var3);
+var4 = oomph_string_concat(var1,var3);
+if (var2) goto label5;
+if (oomph_true) goto label6;
+label5: (void)0;
+var7 = string1___04ae3b8ad0; string_incref(var7);
+var8 = oomph_string_concat(var4,var7);
+string_decref(var4);
+var4 = var8;
+var8.buf = NULL;
+label6: (void)0;
+retval = var4; var4.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var8);
+string_decref(var7);
+string_decref(var4);
+string_decref(var3);
+return retval;
+}struct class_Str refcount_elision_b75250a8eb_first_or_concat(struct class_List_Str__43b70c06cb* var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+int64_t var4;
+int64_t var5;
+bool var6;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str retval;
+var2 = string2___82cf4956a7; string_incref(var2);
+var3 = meth_List_Str__43b70c06cb_join(var1,var2);
+var4 = meth_List_Str__43b70c06cb_length(var1);
+var5 = 1LL;
+var6 = meth_Int_equals(var4,var5);
+if (var6) goto label7;
+if (oomph_true) goto label8;
+label7: (void)0;
+var9 = meth_List_Str__43b70c06cb_first(var1);
+retval = var9; var9.buf = NULL;
+goto out;
+label8: (void)0;
+retval = var3; var3.buf = NULL;
+goto out;
+out: (void)0;
+string_decref(var9);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var3);
+string_decref(var2);
+return retval;
+}struct class_List_Str__43b70c06cb* refcount_elision_b75250a8eb_exclaim_all(struct class_List_Str__43b70c06cb* var1){struct class_List_Str__43b70c06cb* var2;
+var2 = NULL;
+int64_t var3;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_List_Str__43b70c06cb* retval;
+var2 = ctor_List_Str__43b70c06cb();
+var3 = 0LL;
+label4: (void)0;
+if (var3 >= var1->len) goto label6;
+var5 = var1->data[var3++];
+string_decref(var7);
+var7.buf = NULL;
+var7 = string0___7fbc5f4d54; string_incref(var7);
+string_decref(var8);
+var8.buf = NULL;
+var8 = oomph_string_concat(var5,var7);
+meth_List_Str__43b70c06cb_push(var2,var8);
+if (oomph_true) goto label4;
+label6: (void)0;
+retval = var2; var2 = NULL;
+goto out;
+out: (void)0;
+string_decref(var8);
+string_decref(var7);
+(void)0;
+decref((var2), dtor_List_Str__43b70c06cb);
+return retval;
+}struct class_List_Str__43b70c06cb* refcount_elision_b75250a8eb_prefix_all(struct class_List_Str__43b70c06cb* var1){struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_List_Str__43b70c06cb* var6;
+var6 = NULL;
+int64_t var7;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_List_Str__43b70c06cb* retval;
+var2 = string3__3c4b45c5c0; string_incref(var2);
+var3 = meth_List_Str__43b70c06cb_join(var1,var2);
+var4 = string4___961b596efb; string_incref(var4);
+var5 = oomph_string_concat(var3,var4);
+var6 = ctor_List_Str__43b70c06cb();
+var7 = 0LL;
+label8: (void)0;
+if (var7 >= var1->len) goto label10;
+var9 = var1->data[var7++];
+string_decref(var11);
+var11.buf = NULL;
+var11 = var5;
+string_incref(var11);
+var12 = oomph_string_concat(var11,var9);
+string_decref(var11);
+var11 = var12;
+var12.buf = NULL;
+meth_List_Str__43b70c06cb_push(var6,var11);
+if (oomph_true) goto label8;
+label10: (void)0;
+meth_List_Str__43b70c06cb_push(var6,var5);
+retval = var6; var6 = NULL;
+goto out;
+out: (void)0;
+string_decref(var12);
+string_decref(var11);
+(void)0;
+decref((var6), dtor_List_Str__43b70c06cb);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+return retval;
+}struct class_List_StrOrInt__8e4a9adb5d* refcount_elision_b75250a8eb_wrap_all(struct class_List_Str__43b70c06cb* var1){struct class_List_StrOrInt__8e4a9adb5d* var2;
+var2 = NULL;
+int64_t var3;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_StrOrInt_6cfe0bd2e0 var8;
+var8.membernum = -1;
+struct class_List_StrOrInt__8e4a9adb5d* retval;
+var2 = ctor_List_StrOrInt__8e4a9adb5d();
+var3 = 0LL;
+label4: (void)0;
+if (var3 >= var1->len) goto label6;
+var5 = var1->data[var3++];
+var7 = oomph_string_concat(var5,var5);
+decref_StrOrInt_6cfe0bd2e0(var8);
+var8.membernum = -1;
+var8 = (struct class_StrOrInt_6cfe0bd2e0){ .val = { .item1 = var7 }, .membernum = 1 };
+var7.buf = NULL;
+meth_List_StrOrInt__8e4a9adb5d_push(var2,var8);
+if (oomph_true) goto label4;
+label6: (void)0;
+retval = var2; var2 = NULL;
+goto out;
+out: (void)0;
+decref_StrOrInt_6cfe0bd2e0(var8);
+string_decref(var7);
+(void)0;
+decref((var2), dtor_List_StrOrInt__8e4a9adb5d);
+return retval;
+}void refcount_elision_b75250a8eb_reassign_while_borrowed(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Inner_b1bbe028aa* var2;
+var2 = NULL;
+struct class_Outer_6317f6af89* var3;
+var3 = NULL;
+struct class_Inner_b1bbe028aa* var4;
+var4 = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Inner_b1bbe028aa* var7;
+var7 = NULL;
+struct class_Outer_6317f6af89* var8;
+var8 = NULL;
+struct class_Inner_b1bbe028aa* var9;
+var9 = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Inner_b1bbe028aa* var11;
+var11 = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Inner_b1bbe028aa* var13;
+var13 = NULL;
+struct class_Inner_b1bbe028aa* var14;
+var14 = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Inner_b1bbe028aa* var16;
+var16 = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Inner_b1bbe028aa* var19;
+var19 = NULL;
+struct class_Inner_b1bbe028aa* var20;
+var20 = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Inner_b1bbe028aa* var25;
+var25 = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+var1 = string5_ab_eb8150a997; string_incref(var1);
+var2 = ctor_Inner_b1bbe028aa(var1);
+var3 = ctor_Outer_6317f6af89(var2);
+var4 = var3->memb_inner;
+var5 = var4->memb_name;
+var4 = NULL;
+string_incref(var5);
+var6 = string6_cd_3732b629b0; string_incref(var6);
+var7 = ctor_Inner_b1bbe028aa(var6);
+var8 = ctor_Outer_6317f6af89(var7);
+decref((var3), dtor_Outer_6317f6af89);
+var3 = var8;
+var8 = NULL;
+oomph_print(var5);
+var9 = var3->memb_inner;
+var10 = var9->memb_name;
+var9 = NULL;
+string_incref(var10);
+oomph_print(var10);
+var11 = var3->memb_inner;
+incref(var11);
+var12 = string7_ef_7418e48c7b; string_incref(var12);
+var13 = ctor_Inner_b1bbe028aa(var12);
+var14 = var3->memb_inner;
+var3->memb_inner = var13;
+var13 = NULL;
+var15 = var11->memb_name;
+string_incref(var15);
+var16 = var3->memb_inner;
+var17 = var16->memb_name;
+var16 = NULL;
+string_incref(var17);
+var18 = oomph_string_concat(var15,var17);
+oomph_print(var18);
+var19 = var3->memb_inner;
+incref(var19);
+var20 = var3->memb_inner;
+var21 = var20->memb_name;
+var20 = NULL;
+string_incref(var21);
+var22 = string8_g_7f9c375c07; string_incref(var22);
+var23 = oomph_string_concat(var21,var22);
+var24 = var19->memb_name;
+var19->memb_name = var23;
+var23.buf = NULL;
+var25 = var3->memb_inner;
+var26 = var25->memb_name;
+var25 = NULL;
+string_incref(var26);
+oomph_print(var26);
+out: (void)0;
+string_decref(var26);
+decref((var25), dtor_Inner_b1bbe028aa);
+string_decref(var24);
+string_decref(var23);
+string_decref(var22);
+string_decref(var21);
+decref((var20), dtor_Inner_b1bbe028aa);
+decref((var19), dtor_Inner_b1bbe028aa);
+string_decref(var18);
+string_decref(var17);
+decref((var16), dtor_Inner_b1bbe028aa);
+string_decref(var15);
+decref((var14), dtor_Inner_b1bbe028aa);
+decref((var13), dtor_Inner_b1bbe028aa);
+string_decref(var12);
+decref((var11), dtor_Inner_b1bbe028aa);
+string_decref(var10);
+decref((var9), dtor_Inner_b1bbe028aa);
+decref((var8), dtor_Outer_6317f6af89);
+decref((var7), dtor_Inner_b1bbe028aa);
+string_decref(var6);
+string_decref(var5);
+decref((var4), dtor_Inner_b1bbe028aa);
+decref((var3), dtor_Outer_6317f6af89);
+decref((var2), dtor_Inner_b1bbe028aa);
+string_decref(var1);
+}struct class_Outer_6317f6af89* refcount_elision_b75250a8eb_make_outer(struct class_Str var1){struct class_Inner_b1bbe028aa* var2;
+var2 = NULL;
+struct class_Outer_6317f6af89* var3;
+var3 = NULL;
+struct class_Outer_6317f6af89* retval;
+var2 = ctor_Inner_b1bbe028aa(var1);
+var3 = ctor_Outer_6317f6af89(var2);
+retval = var3; var3 = NULL;
+goto out;
+out: (void)0;
+decref((var3), dtor_Outer_6317f6af89);
+decref((var2), dtor_Inner_b1bbe028aa);
+return retval;
+}void refcount_elision_b75250a8eb_reassign_after_borrowing(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Outer_6317f6af89* var2;
+var2 = NULL;
+struct class_Inner_b1bbe028aa* var3;
+var3 = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Outer_6317f6af89* var5;
+var5 = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Inner_b1bbe028aa* var7;
+var7 = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+var1 = string5_ab_eb8150a997; string_incref(var1);
+var2 = refcount_elision_b75250a8eb_make_outer(var1);
+var3 = var2->memb_inner;
+incref(var3);
+var4 = string6_cd_3732b629b0; string_incref(var4);
+var5 = refcount_elision_b75250a8eb_make_outer(var4);
+decref((var2), dtor_Outer_6317f6af89);
+var2 = var5;
+var5 = NULL;
+var6 = var3->memb_name;
+string_incref(var6);
+var7 = var2->memb_inner;
+var8 = var7->memb_name;
+var7 = NULL;
+string_incref(var8);
+var9 = oomph_string_concat(var6,var8);
+oomph_print(var9);
+out: (void)0;
+string_decref(var9);
+string_decref(var8);
+decref((var7), dtor_Inner_b1bbe028aa);
+string_decref(var6);
+decref((var5), dtor_Outer_6317f6af89);
+string_decref(var4);
+decref((var3), dtor_Inner_b1bbe028aa);
+decref((var2), dtor_Outer_6317f6af89);
+string_decref(var1);
+}void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+bool var2;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+bool var5;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_List_Str__43b70c06cb* var8;
+var8 = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_List_Str__43b70c06cb* var12;
+var12 = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_List_Str__43b70c06cb* var16;
+var16 = NULL;
+struct class_List_Str__43b70c06cb* var17;
+var17 = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_List_Str__43b70c06cb* var21;
+var21 = NULL;
+struct class_List_Str__43b70c06cb* var22;
+var22 = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_List_Str__43b70c06cb* var26;
+var26 = NULL;
+struct class_List_StrOrInt__8e4a9adb5d* var27;
+var27 = NULL;
+struct class_Str var28;
+var28.buf = NULL;
+var1 = string9_a_16d95e13c6; string_incref(var1);
+var2 = oomph_true;
+var3 = refcount_elision_b75250a8eb_maybe_append(var1,var2);
+oomph_print(var3);
+var4 = string10_b_780405b68f; string_incref(var4);
+var5 = oomph_false;
+var6 = refcount_elision_b75250a8eb_maybe_append(var4,var5);
+oomph_print(var6);
+var7 = string11_xy_dfcaaa2431; string_incref(var7);
+var8 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var8,var7);
+var9 = refcount_elision_b75250a8eb_first_or_concat(var8);
+oomph_print(var9);
+var10 = string12_x_bac1c61409; string_incref(var10);
+var11 = string13_y_f268d308f7; string_incref(var11);
+var12 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var12,var10);
+meth_List_Str__43b70c06cb_push(var12,var11);
+var13 = refcount_elision_b75250a8eb_first_or_concat(var12);
+oomph_print(var13);
+var14 = string14_foo_8b94783b12; string_incref(var14);
+var15 = string15_bar_3edf60a447; string_incref(var15);
+var16 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var16,var14);
+meth_List_Str__43b70c06cb_push(var16,var15);
+var17 = refcount_elision_b75250a8eb_exclaim_all(var16);
+var18 = meth_List_Str__43b70c06cb_to_string(var17);
+oomph_print(var18);
+var19 = string14_foo_8b94783b12; string_incref(var19);
+var20 = string15_bar_3edf60a447; string_incref(var20);
+var21 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var21,var19);
+meth_List_Str__43b70c06cb_push(var21,var20);
+var22 = refcount_elision_b75250a8eb_prefix_all(var21);
+var23 = meth_List_Str__43b70c06cb_to_string(var22);
+oomph_print(var23);
+var24 = string14_foo_8b94783b12; string_incref(var24);
+var25 = string15_bar_3edf60a447; string_incref(var25);
+var26 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var26,var24);
+meth_List_Str__43b70c06cb_push(var26,var25);
+var27 = refcount_elision_b75250a8eb_wrap_all(var26);
+var28 = meth_List_StrOrInt__8e4a9adb5d_to_string(var27);
+oomph_print(var28);
+refcount_elision_b75250a8eb_reassign_while_borrowed();
+refcount_elision_b75250a8eb_reassign_after_borrowing();
+out: (void)0;
+string_decref(var28);
+decref((var27), dtor_List_StrOrInt__8e4a9adb5d);
+decref((var26), dtor_List_Str__43b70c06cb);
+string_decref(var25);
+string_decref(var24);
+string_decref(var23);
+decref((var22), dtor_List_Str__43b70c06cb);
+decref((var21), dtor_List_Str__43b70c06cb);
+string_decref(var20);
+string_decref(var19);
+string_decref(var18);
+decref((var17), dtor_List_Str__43b70c06cb);
+decref((var16), dtor_List_Str__43b70c06cb);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+decref((var12), dtor_List_Str__43b70c06cb);
+string_decref(var11);
+string_decref(var10);
+string_decref(var9);
+decref((var8), dtor_List_Str__43b70c06cb);
+string_decref(var7);
+string_decref(var6);
+(void)0;
+string_decref(var4);
+string_decref(var3);
+(void)0;
+string_decref(var1);
+}
@@ -0,0 +1,60 @@
+
+                #ifndef HEADER_GUARD_refcount_elision_b75250a8eb
+                #define HEADER_GUARD_refcount_elision_b75250a8eb
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "StrOrInt_6cfe0bd2e0.h"
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_StrOrInt__8e4a9adb5d;
+struct class_List_StrOrInt__8e4a9adb5d;
+struct class_List_Str__43b70c06cb;
+struct class_List_StrOrInt__8e4a9adb5d;
+struct class_Inner_b1bbe028aa;
+struct class_Outer_6317f6af89;
+struct class_Inner_b1bbe028aa;
+struct class_Inner_b1bbe028aa;
+struct class_Outer_6317f6af89;
+struct class_Inner_b1bbe028aa;
+struct class_Inner_b1bbe028aa;
+struct class_Inner_b1bbe028aa;
+struct class_Inner_b1bbe028aa;
+struct class_Inner_b1bbe028aa;
+struct class_Inner_b1bbe028aa;
+struct class_Inner_b1bbe028aa;
+struct class_Inner_b1bbe028aa;
+struct class_Inner_b1bbe028aa;
+struct class_Outer_6317f6af89;
+struct class_Outer_6317f6af89;
+struct class_Outer_6317f6af89;
+struct class_Outer_6317f6af89;
+struct class_Inner_b1bbe028aa;
+struct class_Outer_6317f6af89;
+struct class_Inner_b1bbe028aa;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+struct class_List_StrOrInt__8e4a9adb5d;
+struct class_Str refcount_elision_b75250a8eb_maybe_append(struct class_Str var1, bool var2);
+struct class_Str refcount_elision_b75250a8eb_first_or_concat(struct class_List_Str__43b70c06cb* var1);
+struct class_List_Str__43b70c06cb* refcount_elision_b75250a8eb_exclaim_all(struct class_List_Str__43b70c06cb* var1);
+struct class_List_Str__43b70c06cb* refcount_elision_b75250a8eb_prefix_all(struct class_List_Str__43b70c06cb* var1);
+struct class_List_StrOrInt__8e4a9adb5d* refcount_elision_b75250a8eb_wrap_all(struct class_List_Str__43b70c06cb* var1);
+void refcount_elision_b75250a8eb_reassign_while_borrowed(void);
+struct class_Outer_6317f6af89* refcount_elision_b75250a8eb_make_outer(struct class_Str var1);
+void refcount_elision_b75250a8eb_reassign_after_borrowing(void);
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,153 @@
+#include <lib/oomph.h>
+#include "remove_prefix_suffix_dadbde7927.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_lllol_599a7ae5cc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6c', '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_lllol_599a7ae5cc = {
+                .buf = &string0_lllol_599a7ae5cc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_l_cef948c8f3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string1_l_cef948c8f3 = {
+                .buf = &string1_l_cef948c8f3_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_x_39a6b0b719_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x78' },
+                .malloced = false,
+            };
+            static struct class_Str string2_x_39a6b0b719 = {
+                .buf = &string2_x_39a6b0b719_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_lolll_280575b76b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c', '\x6c', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string3_lolll_280575b76b = {
+                .buf = &string3_lolll_280575b76b_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Str var11;
+var11.buf = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_Str var21;
+var21.buf = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+var1 = string0_lllol_599a7ae5cc; string_incref(var1);
+var2 = string1_l_cef948c8f3; string_incref(var2);
+var3 = meth_Str_remove_prefix(var1,var2);
+oomph_print(var3);
+var4 = string0_lllol_599a7ae5cc; string_incref(var4);
+var5 = string2_x_39a6b0b719; string_incref(var5);
+var6 = meth_Str_remove_prefix(var4,var5);
+oomph_print(var6);
+var7 = string0_lllol_599a7ae5cc; string_incref(var7);
+var8 = string1_l_cef948c8f3; string_incref(var8);
+var9 = meth_Str_remove_suffix(var7,var8);
+oomph_print(var9);
+var10 = string0_lllol_599a7ae5cc; string_incref(var10);
+var11 = string2_x_39a6b0b719; string_incref(var11);
+var12 = meth_Str_remove_suffix(var10,var11);
+oomph_print(var12);
+var13 = string3_lolll_280575b76b; string_incref(var13);
+var14 = string1_l_cef948c8f3; string_incref(var14);
+var15 = meth_Str_remove_prefix(var13,var14);
+oomph_print(var15);
+var16 = string3_lolll_280575b76b; string_incref(var16);
+var17 = string2_x_39a6b0b719; string_incref(var17);
+var18 = meth_Str_remove_prefix(var16,var17);
+oomph_print(var18);
+var19 = string3_lolll_280575b76b; string_incref(var19);
+var20 = string1_l_cef948c8f3; string_incref(var20);
+var21 = meth_Str_remove_suffix(var19,var20);
+oomph_print(var21);
+var22 = string3_lolll_280575b76b; string_incref(var22);
+var23 = string2_x_39a6b0b719; string_incref(var23);
+var24 = meth_Str_remove_suffix(var22,var23);
+oomph_print(var24);
+out: (void)0;
+string_decref(var24);
+string_decref(var23);
+string_decref(var22);
+string_decref(var21);
+string_decref(var20);
+string_decref(var19);
+string_decref(var18);
+string_decref(var17);
+string_decref(var16);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+string_decref(var11);
+string_decref(var10);
+string_decref(var9);
+string_decref(var8);
+string_decref(var7);
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+}
@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Foo_2a847bd778
+                #define HEADER_GUARD_Foo_2a847bd778
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_2a847bd778 {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Foo_2a847bd778* ctor_Foo_2a847bd778(void);
+            void dtor_Foo_2a847bd778(void *ptr);
+            
+                struct class_Str meth_Foo_2a847bd778_to_string(struct class_Foo_2a847bd778* obj);
+                bool meth_Foo_2a847bd778_equals(struct class_Foo_2a847bd778* var1, struct class_Foo_2a847bd778* var2);
+
+                #endif
+                
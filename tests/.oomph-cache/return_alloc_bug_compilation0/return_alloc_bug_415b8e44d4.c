@@ -0,0 +1,23 @@
+#include <lib/oomph.h>
+#include "return_alloc_bug_415b8e44d4.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_2a847bd778.h"
+struct class_Foo_2a847bd778* return_alloc_bug_415b8e44d4_bar(void){struct class_Foo_2a847bd778* var1;
+var1 = NULL;
+struct class_Foo_2a847bd778* var2;
+var2 = NULL;
+struct class_Foo_2a847bd778* retval;
+var1 = ctor_Foo_2a847bd778();
+var2 = ctor_Foo_2a847bd778();
+retval = var2; var2 = NULL;
+goto out;
+out: (void)0;
+decref((var2), dtor_Foo_2a847bd778);
+decref((var1), dtor_Foo_2a847bd778);
+return retval;
+}void oomph_main(void){struct class_Foo_2a847bd778* var1;
+var1 = NULL;
+var1 = return_alloc_bug_415b8e44d4_bar();
+out: (void)0;
+decref((var1), dtor_Foo_2a847bd778);
+}
@@ -0,0 +1,15 @@
+
+                #ifndef HEADER_GUARD_return_alloc_bug_415b8e44d4
+                #define HEADER_GUARD_return_alloc_bug_415b8e44d4
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Foo_2a847bd778;
+struct class_Foo_2a847bd778;
+struct class_Foo_2a847bd778;
+struct class_Foo_2a847bd778;
+struct class_Foo_2a847bd778;
+struct class_Foo_2a847bd778* return_alloc_bug_415b8e44d4_bar(void);
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,20 @@
+#include <lib/oomph.h>
+#include "return_int_0a4dbca7cb.h"
+#include "bundle_builtins_c399a735f1.h"
+int64_t return_int_0a4dbca7cb_foo(void){int64_t var1;
+int64_t retval;
+var1 = 123LL;
+(void)0; retval = var1; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}void oomph_main(void){int64_t var1;
+struct class_Str var2;
+var2.buf = NULL;
+var1 = return_int_0a4dbca7cb_foo();
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+out: (void)0;
+string_decref(var2);
+(void)0;
+}
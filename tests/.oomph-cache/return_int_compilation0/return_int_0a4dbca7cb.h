@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_return_int_0a4dbca7cb
+                #define HEADER_GUARD_return_int_0a4dbca7cb
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+int64_t return_int_0a4dbca7cb_foo(void);
+void oomph_main(void);
+
+                #endif
+                
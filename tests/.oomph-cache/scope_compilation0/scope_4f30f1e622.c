@@ -0,0 +1,16 @@
+#include <lib/oomph.h>
+#include "scope_4f30f1e622.h"
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void){int64_t var2;
+struct class_Str var4;
+var4.buf = NULL;
+if (oomph_true) goto label1;
+label1: (void)0;
+var2 = 123LL;
+label3: (void)0;
+var4 = meth_Int_to_string(var2);
+oomph_print(var4);
+out: (void)0;
+string_decref(var4);
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_scope_4f30f1e622
+                #define HEADER_GUARD_scope_4f30f1e622
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,56 @@
+#include <lib/oomph.h>
+#include "SelfRef_4c781df36d.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_SelfRef_25801b6bcd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x65', '\x6c', '\x66', '\x52', '\x65', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string0_SelfRef_25801b6bcd = {
+                .buf = &string0_SelfRef_25801b6bcd_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            struct class_SelfRef_4c781df36d* ctor_SelfRef_4c781df36d(struct class_SelfRef_4c781df36d* arg_x)
+            {
+                struct class_SelfRef_4c781df36d* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_x = arg_x;
+
+                incref(arg_x);
+
+                return obj;
+            }
+
+            void dtor_SelfRef_4c781df36d(void *ptr)
+            {
+                struct class_SelfRef_4c781df36d *obj = ptr;
+                decref((obj->memb_x), dtor_SelfRef_4c781df36d);
+
+                free(obj);
+            }
+            
+                struct class_Str meth_SelfRef_4c781df36d_to_string(struct class_SelfRef_4c781df36d* self)
+                {
+                    struct class_Str res = string0_SelfRef_25801b6bcd;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_SelfRef_4c781df36d_to_string(self->memb_x);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_SelfRef_4c781df36d_equals(struct class_SelfRef_4c781df36d* var1, struct class_SelfRef_4c781df36d* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,20 @@
+
+                #ifndef HEADER_GUARD_SelfRef_4c781df36d
+                #define HEADER_GUARD_SelfRef_4c781df36d
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_SelfRef_4c781df36d {
+                REFCOUNT_HEADER
+                struct class_SelfRef_4c781df36d* memb_x;
+
+            };
+            
+            struct class_SelfRef_4c781df36d* ctor_SelfRef_4c781df36d(struct class_SelfRef_4c781df36d* arg_x);
+            void dtor_SelfRef_4c781df36d(void *ptr);
+            
+                struct class_Str meth_SelfRef_4c781df36d_to_string(struct class_SelfRef_4c781df36d* obj);
+                bool meth_SelfRef_4c781df36d_equals(struct class_SelfRef_4c781df36d* var1, struct class_SelfRef_4c781df36d* var2);
+
+                #endif
+                
@@ -0,0 +1,5 @@
+#include <lib/oomph.h>
+#include "selfref_0730acb4f5.h"
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void){out: (void)0;
+}
@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_selfref_0730acb4f5
+                #define HEADER_GUARD_selfref_0730acb4f5
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,246 @@
+#include <lib/oomph.h>
+#include "slice_ccc84811cc.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_a_139533591e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string0_a_139533591e = {
+                .buf = &string0_a_139533591e_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_b_0f94e84713_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string1_b_0f94e84713 = {
+                .buf = &string1_b_0f94e84713_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_c_30c6c366b9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string2_c_30c6c366b9 = {
+                .buf = &string2_c_30c6c366b9_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_d_b5fe645619_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string3_d_b5fe645619 = {
+                .buf = &string3_d_b5fe645619_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_e_50ca6d9bbd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string4_e_50ca6d9bbd = {
+                .buf = &string4_e_50ca6d9bbd_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_______________________b58842bb68_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d' },
+                .malloced = false,
+            };
+            static struct class_Str string5_______________________b58842bb68 = {
+                .buf = &string5_______________________b58842bb68_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_List_Str__43b70c06cb* var6;
+var6 = NULL;
+int64_t var7;
+int64_t var8;
+struct class_List_Str__43b70c06cb* var9;
+var9 = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+int64_t var11;
+int64_t var12;
+struct class_List_Str__43b70c06cb* var13;
+var13 = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+int64_t var15;
+int64_t var16;
+struct class_List_Str__43b70c06cb* var17;
+var17 = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+int64_t var19;
+int64_t var20;
+struct class_List_Str__43b70c06cb* var21;
+var21 = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+int64_t var24;
+int64_t var25;
+struct class_List_Str__43b70c06cb* var26;
+var26 = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+struct class_Str var28;
+var28.buf = NULL;
+int64_t var29;
+int64_t var30;
+struct class_List_Str__43b70c06cb* var31;
+var31 = NULL;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+int64_t var34;
+int64_t var35;
+struct class_List_Str__43b70c06cb* var36;
+var36 = NULL;
+struct class_Str var37;
+var37.buf = NULL;
+struct class_Str var38;
+var38.buf = NULL;
+int64_t var39;
+int64_t var40;
+struct class_List_Str__43b70c06cb* var41;
+var41 = NULL;
+struct class_Str var42;
+var42.buf = NULL;
+struct class_Str var43;
+var43.buf = NULL;
+var1 = string0_a_139533591e; string_incref(var1);
+var2 = string1_b_0f94e84713; string_incref(var2);
+var3 = string2_c_30c6c366b9; string_incref(var3);
+var4 = string3_d_b5fe645619; string_incref(var4);
+var5 = string4_e_50ca6d9bbd; string_incref(var5);
+var6 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var6,var1);
+meth_List_Str__43b70c06cb_push(var6,var2);
+meth_List_Str__43b70c06cb_push(var6,var3);
+meth_List_Str__43b70c06cb_push(var6,var4);
+meth_List_Str__43b70c06cb_push(var6,var5);
+var7 = 3LL;
+var8 = 2LL;
+var9 = meth_List_Str__43b70c06cb_slice(var6,var7,var8);
+var10 = meth_List_Str__43b70c06cb_to_string(var9);
+oomph_print(var10);
+var11 = 3LL;
+var12 = 3LL;
+var13 = meth_List_Str__43b70c06cb_slice(var6,var11,var12);
+var14 = meth_List_Str__43b70c06cb_to_string(var13);
+oomph_print(var14);
+var15 = 3LL;
+var16 = 7LL;
+var17 = meth_List_Str__43b70c06cb_slice(var6,var15,var16);
+var18 = meth_List_Str__43b70c06cb_to_string(var17);
+oomph_print(var18);
+var19 = -1LL;
+var20 = 2LL;
+var21 = meth_List_Str__43b70c06cb_slice(var6,var19,var20);
+var22 = meth_List_Str__43b70c06cb_to_string(var21);
+oomph_print(var22);
+var23 = string5_______________________b58842bb68; string_incref(var23);
+oomph_print(var23);
+var24 = 3LL;
+var25 = 2LL;
+var26 = meth_List_Str__43b70c06cb_delete_slice(var6,var24,var25);
+var27 = meth_List_Str__43b70c06cb_to_string(var26);
+oomph_print(var27);
+var28 = meth_List_Str__43b70c06cb_to_string(var6);
+oomph_print(var28);
+var29 = 3LL;
+var30 = 3LL;
+var31 = meth_List_Str__43b70c06cb_delete_slice(var6,var29,var30);
+var32 = meth_List_Str__43b70c06cb_to_string(var31);
+oomph_print(var32);
+var33 = meth_List_Str__43b70c06cb_to_string(var6);
+oomph_print(var33);
+var34 = 3LL;
+var35 = 7LL;
+var36 = meth_List_Str__43b70c06cb_delete_slice(var6,var34,var35);
+var37 = meth_List_Str__43b70c06cb_to_string(var36);
+oomph_print(var37);
+var38 = meth_List_Str__43b70c06cb_to_string(var6);
+oomph_print(var38);
+var39 = -1LL;
+var40 = 2LL;
+var41 = meth_List_Str__43b70c06cb_delete_slice(var6,var39,var40);
+var42 = meth_List_Str__43b70c06cb_to_string(var41);
+oomph_print(var42);
+var43 = meth_List_Str__43b70c06cb_to_string(var6);
+oomph_print(var43);
+out: (void)0;
+string_decref(var43);
+string_decref(var42);
+decref((var41), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+string_decref(var38);
+string_decref(var37);
+decref((var36), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+string_decref(var33);
+string_decref(var32);
+decref((var31), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+string_decref(var28);
+string_decref(var27);
+decref((var26), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+string_decref(var23);
+string_decref(var22);
+decref((var21), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+string_decref(var18);
+decref((var17), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+string_decref(var14);
+decref((var13), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+string_decref(var10);
+decref((var9), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref((var6), dtor_List_Str__43b70c06cb);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+}
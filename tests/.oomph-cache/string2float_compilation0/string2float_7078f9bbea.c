@@ -0,0 +1,63 @@
+#include <lib/oomph.h>
+#include "string2float_7078f9bbea.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_12_345_da269af8bc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x31', '\x32', '\x2e', '\x33', '\x34', '\x35' },
+                .malloced = false,
+            };
+            static struct class_Str string0_12_345_da269af8bc = {
+                .buf = &string0_12_345_da269af8bc_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1__69_0_fc073436b4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x36', '\x39', '\x2e', '\x30' },
+                .malloced = false,
+            };
+            static struct class_Str string1__69_0_fc073436b4 = {
+                .buf = &string1__69_0_fc073436b4_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+double var2;
+double var3;
+bool var4;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+double var7;
+double var8;
+bool var9;
+struct class_Str var10;
+var10.buf = NULL;
+var1 = string0_12_345_da269af8bc; string_incref(var1);
+var2 = meth_Str_to_float(var1);
+var3 = 12.345;
+var4 = meth_Float_equals(var2,var3);
+var5 = meth_Bool_to_string(var4);
+oomph_print(var5);
+var6 = string1__69_0_fc073436b4; string_incref(var6);
+var7 = meth_Str_to_float(var6);
+var8 = -69.0;
+var9 = meth_Float_equals(var7,var8);
+var10 = meth_Bool_to_string(var9);
+oomph_print(var10);
+out: (void)0;
+string_decref(var10);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var6);
+string_decref(var5);
+(void)0;
+(void)0;
+(void)0;
+string_decref(var1);
+}
@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_string2float_7078f9bbea
+                #define HEADER_GUARD_string2float_7078f9bbea
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
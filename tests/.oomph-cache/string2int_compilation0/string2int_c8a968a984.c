@@ -0,0 +1,51 @@
+#include <lib/oomph.h>
+#include "string2int_c8a968a984.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_123_43b730f954_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x31', '\x32', '\x33' },
+                .malloced = false,
+            };
+            static struct class_Str string0_123_43b730f954 = {
+                .buf = &string0_123_43b730f954_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1__123_2f2f32e4ce_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x31', '\x32', '\x33' },
+                .malloced = false,
+            };
+            static struct class_Str string1__123_2f2f32e4ce = {
+                .buf = &string1__123_2f2f32e4ce_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+int64_t var2;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+int64_t var5;
+struct class_Str var6;
+var6.buf = NULL;
+var1 = string0_123_43b730f954; string_incref(var1);
+var2 = meth_Str_to_int(var1);
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+var4 = string1__123_2f2f32e4ce; string_incref(var4);
+var5 = meth_Str_to_int(var4);
+var6 = meth_Int_to_string(var5);
+oomph_print(var6);
+out: (void)0;
+string_decref(var6);
+(void)0;
+string_decref(var4);
+string_decref(var3);
+(void)0;
+string_decref(var1);
+}
@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_string2int_c8a968a984
+                #define HEADER_GUARD_string2int_c8a968a984
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,1167 @@
+#include <lib/oomph.h>
+#include "string_e6cc0e6141.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Int__df8a64abf3.h"
+
+            static struct StringBuf string0_hello_world_619f09370d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f', '\x20', '\x77', '\x6f', '\x72', '\x6c', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string0_hello_world_619f09370d = {
+                .buf = &string0_hello_world_619f09370d_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1___7b0ad93271_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27' },
+                .malloced = false,
+            };
+            static struct class_Str string1___7b0ad93271 = {
+                .buf = &string1___7b0ad93271_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_Length__6b0760c8dc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x65', '\x6e', '\x67', '\x74', '\x68', '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string2_Length__6b0760c8dc = {
+                .buf = &string2_Length__6b0760c8dc_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_hello_36bb310a40_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string3_hello_36bb310a40 = {
+                .buf = &string3_hello_36bb310a40_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_hell__373c02fdeb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\xc3', '\xb6' },
+                .malloced = false,
+            };
+            static struct class_Str string4_hell__373c02fdeb = {
+                .buf = &string4_hell__373c02fdeb_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5__55e553086e_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+            };
+            static struct class_Str string5__55e553086e = {
+                .buf = &string5__55e553086e_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string6_UTF_8__0b53385654_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x55', '\x54', '\x46', '\x2d', '\x38', '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string6_UTF_8__0b53385654 = {
+                .buf = &string6_UTF_8__0b53385654_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string7_Repeats__7da67b8b0a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x52', '\x65', '\x70', '\x65', '\x61', '\x74', '\x73', '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string7_Repeats__7da67b8b0a = {
+                .buf = &string7_Repeats__7da67b8b0a_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string8_abc_385b7eb265_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62', '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string8_abc_385b7eb265 = {
+                .buf = &string8_abc_385b7eb265_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string9__in__operator__1de3844105_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x69', '\x6e', '\x27', '\x20', '\x6f', '\x70', '\x65', '\x72', '\x61', '\x74', '\x6f', '\x72', '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string9__in__operator__1de3844105 = {
+                .buf = &string9__in__operator__1de3844105_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string10_a_1fab3de8f6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string10_a_1fab3de8f6 = {
+                .buf = &string10_a_1fab3de8f6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string11_x_4f2e88c655_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x78' },
+                .malloced = false,
+            };
+            static struct class_Str string11_x_4f2e88c655 = {
+                .buf = &string11_x_4f2e88c655_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string12_abcd_db50432bde_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62', '\x63', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string12_abcd_db50432bde = {
+                .buf = &string12_abcd_db50432bde_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string13_Starts_with__b7e90e0f1b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x74', '\x61', '\x72', '\x74', '\x73', '\x20', '\x77', '\x69', '\x74', '\x68', '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string13_Starts_with__b7e90e0f1b = {
+                .buf = &string13_Starts_with__b7e90e0f1b_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string14_ab_d89ec63bc5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string14_ab_d89ec63bc5 = {
+                .buf = &string14_ab_d89ec63bc5_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string15_bc_3b248e268b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string15_bc_3b248e268b = {
+                .buf = &string15_bc_3b248e268b_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string16_abcx_2daf1413db_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62', '\x63', '\x78' },
+                .malloced = false,
+            };
+            static struct class_Str string16_abcx_2daf1413db = {
+                .buf = &string16_abcx_2daf1413db_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string17_xabc_53855fc58e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x78', '\x61', '\x62', '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string17_xabc_53855fc58e = {
+                .buf = &string17_xabc_53855fc58e_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string18_Ends_with__a3b62a076e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x45', '\x6e', '\x64', '\x73', '\x20', '\x77', '\x69', '\x74', '\x68', '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string18_Ends_with__a3b62a076e = {
+                .buf = &string18_Ends_with__a3b62a076e_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string19_Pad__abe7b49b93_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x61', '\x64', '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string19_Pad__abe7b49b93 = {
+                .buf = &string19_Pad__abe7b49b93_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string20___14b55c297a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2a' },
+                .malloced = false,
+            };
+            static struct class_Str string20___14b55c297a = {
+                .buf = &string20___14b55c297a_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string21_Count__a6a0bcad30_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6f', '\x75', '\x6e', '\x74', '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string21_Count__a6a0bcad30 = {
+                .buf = &string21_Count__a6a0bcad30_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string22_abclolwatlolabc_41f08a4e76_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62', '\x63', '\x6c', '\x6f', '\x6c', '\x77', '\x61', '\x74', '\x6c', '\x6f', '\x6c', '\x61', '\x62', '\x63' },
+                .malloced = false,
+            };
+            static struct class_Str string22_abclolwatlolabc_41f08a4e76 = {
+                .buf = &string22_abclolwatlolabc_41f08a4e76_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string23_lol_e3fe89adbd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string23_lol_e3fe89adbd = {
+                .buf = &string23_lol_e3fe89adbd_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string24_aaaa_4dc3bdb622_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x61', '\x61', '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string24_aaaa_4dc3bdb622 = {
+                .buf = &string24_aaaa_4dc3bdb622_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string25_aa_9d22e7fa05_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string25_aa_9d22e7fa05 = {
+                .buf = &string25_aa_9d22e7fa05_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string26_b_3d29c93ae2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string26_b_3d29c93ae2 = {
+                .buf = &string26_b_3d29c93ae2_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string27_Trim__85b1f10105_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x72', '\x69', '\x6d', '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string27_Trim__85b1f10105 = {
+                .buf = &string27_Trim__85b1f10105_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string28__a__b84fca6a18_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x61', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string28__a__b84fca6a18 = {
+                .buf = &string28__a__b84fca6a18_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string29_Replace__460c86a898_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x52', '\x65', '\x70', '\x6c', '\x61', '\x63', '\x65', '\x3a' },
+                .malloced = false,
+            };
+            static struct class_Str string29_Replace__460c86a898 = {
+                .buf = &string29_Replace__460c86a898_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string30_abcab_3f28a1d624_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62', '\x63', '\x61', '\x62' },
+                .malloced = false,
+            };
+            static struct class_Str string30_abcab_3f28a1d624 = {
+                .buf = &string30_abcab_3f28a1d624_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string31_aaaaa_91d3148734_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x61', '\x61', '\x61', '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string31_aaaaa_91d3148734 = {
+                .buf = &string31_aaaaa_91d3148734_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string32_xxxx_ee87db7078_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x78', '\x78', '\x78', '\x78' },
+                .malloced = false,
+            };
+            static struct class_Str string32_xxxx_ee87db7078 = {
+                .buf = &string32_xxxx_ee87db7078_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string33_asdf_ed4c910d35_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x73', '\x64', '\x66' },
+                .malloced = false,
+            };
+            static struct class_Str string33_asdf_ed4c910d35 = {
+                .buf = &string33_asdf_ed4c910d35_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+bool var2;
+struct class_Str var3;
+var3.buf = NULL;
+bool var4;
+struct class_Str var5;
+var5.buf = NULL;
+bool var6;
+struct class_Str var7;
+var7.buf = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+int64_t var11;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+int64_t var14;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+int64_t var17;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+struct class_Str var20;
+var20.buf = NULL;
+struct class_List_Int__df8a64abf3* var21;
+var21 = NULL;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_List_Int__df8a64abf3* var24;
+var24 = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_List_Int__df8a64abf3* var27;
+var27 = NULL;
+struct class_Str var28;
+var28.buf = NULL;
+struct class_Str var29;
+var29.buf = NULL;
+struct class_Str var30;
+var30.buf = NULL;
+int64_t var31;
+struct class_Str var32;
+var32.buf = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+int64_t var34;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+int64_t var37;
+struct class_Str var38;
+var38.buf = NULL;
+struct class_Str var39;
+var39.buf = NULL;
+int64_t var40;
+struct class_Str var41;
+var41.buf = NULL;
+struct class_Str var42;
+var42.buf = NULL;
+int64_t var43;
+struct class_Str var44;
+var44.buf = NULL;
+struct class_Str var45;
+var45.buf = NULL;
+int64_t var46;
+struct class_Str var47;
+var47.buf = NULL;
+struct class_Str var48;
+var48.buf = NULL;
+int64_t var49;
+struct class_Str var50;
+var50.buf = NULL;
+struct class_Str var51;
+var51.buf = NULL;
+struct class_Str var52;
+var52.buf = NULL;
+struct class_Str var53;
+var53.buf = NULL;
+bool var54;
+struct class_Str var55;
+var55.buf = NULL;
+struct class_Str var56;
+var56.buf = NULL;
+struct class_Str var57;
+var57.buf = NULL;
+bool var58;
+struct class_Str var59;
+var59.buf = NULL;
+struct class_Str var60;
+var60.buf = NULL;
+struct class_Str var61;
+var61.buf = NULL;
+bool var62;
+struct class_Str var63;
+var63.buf = NULL;
+struct class_Str var64;
+var64.buf = NULL;
+struct class_Str var65;
+var65.buf = NULL;
+bool var66;
+struct class_Str var67;
+var67.buf = NULL;
+struct class_Str var68;
+var68.buf = NULL;
+struct class_Str var69;
+var69.buf = NULL;
+bool var70;
+struct class_Str var71;
+var71.buf = NULL;
+struct class_Str var72;
+var72.buf = NULL;
+struct class_Str var73;
+var73.buf = NULL;
+bool var74;
+struct class_Str var75;
+var75.buf = NULL;
+struct class_Str var76;
+var76.buf = NULL;
+struct class_Str var77;
+var77.buf = NULL;
+bool var78;
+struct class_Str var79;
+var79.buf = NULL;
+struct class_Str var80;
+var80.buf = NULL;
+struct class_Str var81;
+var81.buf = NULL;
+struct class_Str var82;
+var82.buf = NULL;
+bool var83;
+struct class_Str var84;
+var84.buf = NULL;
+struct class_Str var85;
+var85.buf = NULL;
+struct class_Str var86;
+var86.buf = NULL;
+bool var87;
+struct class_Str var88;
+var88.buf = NULL;
+struct class_Str var89;
+var89.buf = NULL;
+struct class_Str var90;
+var90.buf = NULL;
+bool var91;
+struct class_Str var92;
+var92.buf = NULL;
+struct class_Str var93;
+var93.buf = NULL;
+struct class_Str var94;
+var94.buf = NULL;
+bool var95;
+struct class_Str var96;
+var96.buf = NULL;
+struct class_Str var97;
+var97.buf = NULL;
+struct class_Str var98;
+var98.buf = NULL;
+bool var99;
+struct class_Str var100;
+var100.buf = NULL;
+struct class_Str var101;
+var101.buf = NULL;
+struct class_Str var102;
+var102.buf = NULL;
+bool var103;
+struct class_Str var104;
+var104.buf = NULL;
+struct class_Str var105;
+var105.buf = NULL;
+struct class_Str var106;
+var106.buf = NULL;
+struct class_Str var107;
+var107.buf = NULL;
+bool var108;
+struct class_Str var109;
+var109.buf = NULL;
+struct class_Str var110;
+var110.buf = NULL;
+struct class_Str var111;
+var111.buf = NULL;
+bool var112;
+struct class_Str var113;
+var113.buf = NULL;
+struct class_Str var114;
+var114.buf = NULL;
+struct class_Str var115;
+var115.buf = NULL;
+bool var116;
+struct class_Str var117;
+var117.buf = NULL;
+struct class_Str var118;
+var118.buf = NULL;
+struct class_Str var119;
+var119.buf = NULL;
+bool var120;
+struct class_Str var121;
+var121.buf = NULL;
+struct class_Str var122;
+var122.buf = NULL;
+struct class_Str var123;
+var123.buf = NULL;
+bool var124;
+struct class_Str var125;
+var125.buf = NULL;
+struct class_Str var126;
+var126.buf = NULL;
+struct class_Str var127;
+var127.buf = NULL;
+bool var128;
+struct class_Str var129;
+var129.buf = NULL;
+struct class_Str var130;
+var130.buf = NULL;
+struct class_Str var131;
+var131.buf = NULL;
+int64_t var132;
+struct class_Str var133;
+var133.buf = NULL;
+struct class_Str var134;
+var134.buf = NULL;
+struct class_Str var135;
+var135.buf = NULL;
+int64_t var136;
+struct class_Str var137;
+var137.buf = NULL;
+struct class_Str var138;
+var138.buf = NULL;
+struct class_Str var139;
+var139.buf = NULL;
+int64_t var140;
+struct class_Str var141;
+var141.buf = NULL;
+struct class_Str var142;
+var142.buf = NULL;
+struct class_Str var143;
+var143.buf = NULL;
+int64_t var144;
+struct class_Str var145;
+var145.buf = NULL;
+struct class_Str var146;
+var146.buf = NULL;
+struct class_Str var147;
+var147.buf = NULL;
+struct class_Str var148;
+var148.buf = NULL;
+struct class_Str var149;
+var149.buf = NULL;
+int64_t var150;
+struct class_Str var151;
+var151.buf = NULL;
+struct class_Str var152;
+var152.buf = NULL;
+struct class_Str var153;
+var153.buf = NULL;
+int64_t var154;
+struct class_Str var155;
+var155.buf = NULL;
+struct class_Str var156;
+var156.buf = NULL;
+struct class_Str var157;
+var157.buf = NULL;
+int64_t var158;
+struct class_Str var159;
+var159.buf = NULL;
+struct class_Str var160;
+var160.buf = NULL;
+struct class_Str var161;
+var161.buf = NULL;
+int64_t var162;
+struct class_Str var163;
+var163.buf = NULL;
+struct class_Str var164;
+var164.buf = NULL;
+struct class_Str var165;
+var165.buf = NULL;
+struct class_Str var166;
+var166.buf = NULL;
+struct class_Str var167;
+var167.buf = NULL;
+struct class_Str var168;
+var168.buf = NULL;
+struct class_Str var169;
+var169.buf = NULL;
+struct class_Str var170;
+var170.buf = NULL;
+struct class_Str var171;
+var171.buf = NULL;
+struct class_Str var172;
+var172.buf = NULL;
+struct class_Str var173;
+var173.buf = NULL;
+struct class_Str var174;
+var174.buf = NULL;
+struct class_Str var175;
+var175.buf = NULL;
+struct class_Str var176;
+var176.buf = NULL;
+struct class_Str var177;
+var177.buf = NULL;
+struct class_Str var178;
+var178.buf = NULL;
+struct class_Str var179;
+var179.buf = NULL;
+struct class_Str var180;
+var180.buf = NULL;
+struct class_Str var181;
+var181.buf = NULL;
+struct class_Str var182;
+var182.buf = NULL;
+struct class_Str var183;
+var183.buf = NULL;
+struct class_Str var184;
+var184.buf = NULL;
+struct class_Str var185;
+var185.buf = NULL;
+struct class_Str var186;
+var186.buf = NULL;
+struct class_Str var187;
+var187.buf = NULL;
+struct class_Str var188;
+var188.buf = NULL;
+struct class_Str var189;
+var189.buf = NULL;
+struct class_Str var190;
+var190.buf = NULL;
+struct class_Str var191;
+var191.buf = NULL;
+var1 = string0_hello_world_619f09370d; string_incref(var1);
+oomph_print(var1);
+var2 = oomph_true;
+var3 = meth_Bool_to_string(var2);
+oomph_print(var3);
+var4 = oomph_false;
+var5 = meth_Bool_to_string(var4);
+oomph_print(var5);
+var6 = oomph_false;
+var7 = meth_Bool_to_string(var6);
+oomph_print(var7);
+var8 = string1___7b0ad93271; string_incref(var8);
+oomph_print(var8);
+var9 = string2_Length__6b0760c8dc; string_incref(var9);
+oomph_print(var9);
+var10 = string3_hello_36bb310a40; string_incref(var10);
+var11 = meth_Str_length(var10);
+var12 = meth_Int_to_string(var11);
+oomph_print(var12);
+var13 = string4_hell__373c02fdeb; string_incref(var13);
+var14 = meth_Str_length(var13);
+var15 = meth_Int_to_string(var14);
+oomph_print(var15);
+var16 = string5__55e553086e; string_incref(var16);
+var17 = meth_Str_length(var16);
+var18 = meth_Int_to_string(var17);
+oomph_print(var18);
+var19 = string6_UTF_8__0b53385654; string_incref(var19);
+oomph_print(var19);
+var20 = string3_hello_36bb310a40; string_incref(var20);
+var21 = meth_Str_get_utf8(var20);
+var22 = meth_List_Int__df8a64abf3_to_string(var21);
+oomph_print(var22);
+var23 = string4_hell__373c02fdeb; string_incref(var23);
+var24 = meth_Str_get_utf8(var23);
+var25 = meth_List_Int__df8a64abf3_to_string(var24);
+oomph_print(var25);
+var26 = string5__55e553086e; string_incref(var26);
+var27 = meth_Str_get_utf8(var26);
+var28 = meth_List_Int__df8a64abf3_to_string(var27);
+oomph_print(var28);
+var29 = string7_Repeats__7da67b8b0a; string_incref(var29);
+oomph_print(var29);
+var30 = string8_abc_385b7eb265; string_incref(var30);
+var31 = -5LL;
+var32 = meth_Str_repeat(var30,var31);
+oomph_print(var32);
+var33 = string8_abc_385b7eb265; string_incref(var33);
+var34 = 0LL;
+var35 = meth_Str_repeat(var33,var34);
+oomph_print(var35);
+var36 = string8_abc_385b7eb265; string_incref(var36);
+var37 = 1LL;
+var38 = meth_Str_repeat(var36,var37);
+oomph_print(var38);
+var39 = string8_abc_385b7eb265; string_incref(var39);
+var40 = 2LL;
+var41 = meth_Str_repeat(var39,var40);
+oomph_print(var41);
+var42 = string8_abc_385b7eb265; string_incref(var42);
+var43 = 3LL;
+var44 = meth_Str_repeat(var42,var43);
+oomph_print(var44);
+var45 = string8_abc_385b7eb265; string_incref(var45);
+var46 = 4LL;
+var47 = meth_Str_repeat(var45,var46);
+oomph_print(var47);
+var48 = string8_abc_385b7eb265; string_incref(var48);
+var49 = 5LL;
+var50 = meth_Str_repeat(var48,var49);
+oomph_print(var50);
+var51 = string9__in__operator__1de3844105; string_incref(var51);
+oomph_print(var51);
+var52 = string10_a_1fab3de8f6; string_incref(var52);
+var53 = string8_abc_385b7eb265; string_incref(var53);
+var54 = meth_Str___contains(var53,var52);
+var55 = meth_Bool_to_string(var54);
+oomph_print(var55);
+var56 = string11_x_4f2e88c655; string_incref(var56);
+var57 = string8_abc_385b7eb265; string_incref(var57);
+var58 = meth_Str___contains(var57,var56);
+var59 = meth_Bool_to_string(var58);
+oomph_print(var59);
+var60 = string8_abc_385b7eb265; string_incref(var60);
+var61 = string8_abc_385b7eb265; string_incref(var61);
+var62 = meth_Str___contains(var61,var60);
+var63 = meth_Bool_to_string(var62);
+oomph_print(var63);
+var64 = string12_abcd_db50432bde; string_incref(var64);
+var65 = string8_abc_385b7eb265; string_incref(var65);
+var66 = meth_Str___contains(var65,var64);
+var67 = meth_Bool_to_string(var66);
+oomph_print(var67);
+var68 = string5__55e553086e; string_incref(var68);
+var69 = string8_abc_385b7eb265; string_incref(var69);
+var70 = meth_Str___contains(var69,var68);
+var71 = meth_Bool_to_string(var70);
+oomph_print(var71);
+var72 = string10_a_1fab3de8f6; string_incref(var72);
+var73 = string5__55e553086e; string_incref(var73);
+var74 = meth_Str___contains(var73,var72);
+var75 = meth_Bool_to_string(var74);
+oomph_print(var75);
+var76 = string5__55e553086e; string_incref(var76);
+var77 = string5__55e553086e; string_incref(var77);
+var78 = meth_Str___contains(var77,var76);
+var79 = meth_Bool_to_string(var78);
+oomph_print(var79);
+var80 = string13_Starts_with__b7e90e0f1b; string_incref(var80);
+oomph_print(var80);
+var81 = string8_abc_385b7eb265; string_incref(var81);
+var82 = string14_ab_d89ec63bc5; string_incref(var82);
+var83 = meth_Str_starts_with(var81,var82);
+var84 = meth_Bool_to_string(var83);
+oomph_print(var84);
+var85 = string8_abc_385b7eb265; string_incref(var85);
+var86 = string15_bc_3b248e268b; string_incref(var86);
+var87 = meth_Str_starts_with(var85,var86);
+var88 = meth_Bool_to_string(var87);
+oomph_print(var88);
+var89 = string8_abc_385b7eb265; string_incref(var89);
+var90 = string8_abc_385b7eb265; string_incref(var90);
+var91 = meth_Str_starts_with(var89,var90);
+var92 = meth_Bool_to_string(var91);
+oomph_print(var92);
+var93 = string8_abc_385b7eb265; string_incref(var93);
+var94 = string5__55e553086e; string_incref(var94);
+var95 = meth_Str_starts_with(var93,var94);
+var96 = meth_Bool_to_string(var95);
+oomph_print(var96);
+var97 = string8_abc_385b7eb265; string_incref(var97);
+var98 = string16_abcx_2daf1413db; string_incref(var98);
+var99 = meth_Str_starts_with(var97,var98);
+var100 = meth_Bool_to_string(var99);
+oomph_print(var100);
+var101 = string8_abc_385b7eb265; string_incref(var101);
+var102 = string17_xabc_53855fc58e; string_incref(var102);
+var103 = meth_Str_starts_with(var101,var102);
+var104 = meth_Bool_to_string(var103);
+oomph_print(var104);
+var105 = string18_Ends_with__a3b62a076e; string_incref(var105);
+oomph_print(var105);
+var106 = string8_abc_385b7eb265; string_incref(var106);
+var107 = string14_ab_d89ec63bc5; string_incref(var107);
+var108 = meth_Str_ends_with(var106,var107);
+var109 = meth_Bool_to_string(var108);
+oomph_print(var109);
+var110 = string8_abc_385b7eb265; string_incref(var110);
+var111 = string15_bc_3b248e268b; string_incref(var111);
+var112 = meth_Str_ends_with(var110,var111);
+var113 = meth_Bool_to_string(var112);
+oomph_print(var113);
+var114 = string8_abc_385b7eb265; string_incref(var114);
+var115 = string8_abc_385b7eb265; string_incref(var115);
+var116 = meth_Str_ends_with(var114,var115);
+var117 = meth_Bool_to_string(var116);
+oomph_print(var117);
+var118 = string8_abc_385b7eb265; string_incref(var118);
+var119 = string5__55e553086e; string_incref(var119);
+var120 = meth_Str_ends_with(var118,var119);
+var121 = meth_Bool_to_string(var120);
+oomph_print(var121);
+var122 = string8_abc_385b7eb265; string_incref(var122);
+var123 = string16_abcx_2daf1413db; string_incref(var123);
+var124 = meth_Str_ends_with(var122,var123);
+var125 = meth_Bool_to_string(var124);
+oomph_print(var125);
+var126 = string8_abc_385b7eb265; string_incref(var126);
+var127 = string17_xabc_53855fc58e; string_incref(var127);
+var128 = meth_Str_ends_with(var126,var127);
+var129 = meth_Bool_to_string(var128);
+oomph_print(var129);
+var130 = string19_Pad__abe7b49b93; string_incref(var130);
+oomph_print(var130);
+var131 = string8_abc_385b7eb265; string_incref(var131);
+var132 = 5LL;
+var133 = string20___14b55c297a; string_incref(var133);
+var134 = meth_Str_left_pad(var131,var132,var133);
+oomph_print(var134);
+var135 = string8_abc_385b7eb265; string_incref(var135);
+var136 = 5LL;
+var137 = string20___14b55c297a; string_incref(var137);
+var138 = meth_Str_right_pad(var135,var136,var137);
+oomph_print(var138);
+var139 = string8_abc_385b7eb265; string_incref(var139);
+var140 = 5LL;
+var141 = string20___14b55c297a; string_incref(var141);
+var142 = meth_Str_center_pad(var139,var140,var141);
+oomph_print(var142);
+var143 = string8_abc_385b7eb265; string_incref(var143);
+var144 = 6LL;
+var145 = string20___14b55c297a; string_incref(var145);
+var146 = meth_Str_center_pad(var143,var144,var145);
+oomph_print(var146);
+var147 = string21_Count__a6a0bcad30; string_incref(var147);
+oomph_print(var147);
+var148 = string22_abclolwatlolabc_41f08a4e76; string_incref(var148);
+var149 = string23_lol_e3fe89adbd; string_incref(var149);
+var150 = meth_Str_count(var148,var149);
+var151 = meth_Int_to_string(var150);
+oomph_print(var151);
+var152 = string24_aaaa_4dc3bdb622; string_incref(var152);
+var153 = string25_aa_9d22e7fa05; string_incref(var153);
+var154 = meth_Str_count(var152,var153);
+var155 = meth_Int_to_string(var154);
+oomph_print(var155);
+var156 = string24_aaaa_4dc3bdb622; string_incref(var156);
+var157 = string26_b_3d29c93ae2; string_incref(var157);
+var158 = meth_Str_count(var156,var157);
+var159 = meth_Int_to_string(var158);
+oomph_print(var159);
+var160 = string24_aaaa_4dc3bdb622; string_incref(var160);
+var161 = string5__55e553086e; string_incref(var161);
+var162 = meth_Str_count(var160,var161);
+var163 = meth_Int_to_string(var162);
+oomph_print(var163);
+var164 = string27_Trim__85b1f10105; string_incref(var164);
+oomph_print(var164);
+var165 = string28__a__b84fca6a18; string_incref(var165);
+var166 = meth_Str_left_trim(var165);
+oomph_print(var166);
+var167 = string28__a__b84fca6a18; string_incref(var167);
+var168 = meth_Str_right_trim(var167);
+oomph_print(var168);
+var169 = string28__a__b84fca6a18; string_incref(var169);
+var170 = meth_Str_trim(var169);
+oomph_print(var170);
+var171 = string29_Replace__460c86a898; string_incref(var171);
+oomph_print(var171);
+var172 = string30_abcab_3f28a1d624; string_incref(var172);
+var173 = string14_ab_d89ec63bc5; string_incref(var173);
+var174 = string11_x_4f2e88c655; string_incref(var174);
+var175 = meth_Str_replace(var172,var173,var174);
+oomph_print(var175);
+var176 = string31_aaaaa_91d3148734; string_incref(var176);
+var177 = string25_aa_9d22e7fa05; string_incref(var177);
+var178 = string11_x_4f2e88c655; string_incref(var178);
+var179 = meth_Str_replace(var176,var177,var178);
+oomph_print(var179);
+var180 = string24_aaaa_4dc3bdb622; string_incref(var180);
+var181 = string25_aa_9d22e7fa05; string_incref(var181);
+var182 = string11_x_4f2e88c655; string_incref(var182);
+var183 = meth_Str_replace(var180,var181,var182);
+oomph_print(var183);
+var184 = string24_aaaa_4dc3bdb622; string_incref(var184);
+var185 = string25_aa_9d22e7fa05; string_incref(var185);
+var186 = string32_xxxx_ee87db7078; string_incref(var186);
+var187 = meth_Str_replace(var184,var185,var186);
+oomph_print(var187);
+var188 = string33_asdf_ed4c910d35; string_incref(var188);
+var189 = string5__55e553086e; string_incref(var189);
+var190 = string11_x_4f2e88c655; string_incref(var190);
+var191 = meth_Str_replace(var188,var189,var190);
+oomph_print(var191);
+out: (void)0;
+string_decref(var191);
+string_decref(var190);
+string_decref(var189);
+string_decref(var188);
+string_decref(var187);
+string_decref(var186);
+string_decref(var185);
+string_decref(var184);
+string_decref(var183);
+string_decref(var182);
+string_decref(var181);
+string_decref(var180);
+string_decref(var179);
+string_decref(var178);
+string_decref(var177);
+string_decref(var176);
+string_decref(var175);
+string_decref(var174);
+string_decref(var173);
+string_decref(var172);
+string_decref(var171);
+string_decref(var170);
+string_decref(var169);
+string_decref(var168);
+string_decref(var167);
+string_decref(var166);
+string_decref(var165);
+string_decref(var164);
+string_decref(var163);
+(void)0;
+string_decref(var161);
+string_decref(var160);
+string_decref(var159);
+(void)0;
+string_decref(var157);
+string_decref(var156);
+string_decref(var155);
+(void)0;
+string_decref(var153);
+string_decref(var152);
+string_decref(var151);
+(void)0;
+string_decref(var149);
+string_decref(var148);
+string_decref(var147);
+string_decref(var146);
+string_decref(var145);
+(void)0;
+string_decref(var143);
+string_decref(var142);
+string_decref(var141);
+(void)0;
+string_decref(var139);
+string_decref(var138);
+string_decref(var137);
+(void)0;
+string_decref(var135);
+string_decref(var134);
+string_decref(var133);
+(void)0;
+string_decref(var131);
+string_decref(var130);
+string_decref(var129);
+(void)0;
+string_decref(var127);
+string_decref(var126);
+string_decref(var125);
+(void)0;
+string_decref(var123);
+string_decref(var122);
+string_decref(var121);
+(void)0;
+string_decref(var119);
+string_decref(var118);
+string_decref(var117);
+(void)0;
+string_decref(var115);
+string_decref(var114);
+string_decref(var113);
+(void)0;
+string_decref(var111);
+string_decref(var110);
+string_decref(var109);
+(void)0;
+string_decref(var107);
+string_decref(var106);
+string_decref(var105);
+string_decref(var104);
+(void)0;
+string_decref(var102);
+string_decref(var101);
+string_decref(var100);
+(void)0;
+string_decref(var98);
+string_decref(var97);
+string_decref(var96);
+(void)0;
+string_decref(var94);
+string_decref(var93);
+string_decref(var92);
+(void)0;
+string_decref(var90);
+string_decref(var89);
+string_decref(var88);
+(void)0;
+string_decref(var86);
+string_decref(var85);
+string_decref(var84);
+(void)0;
+string_decref(var82);
+string_decref(var81);
+string_decref(var80);
+string_decref(var79);
+(void)0;
+string_decref(var77);
+string_decref(var76);
+string_decref(var75);
+(void)0;
+string_decref(var73);
+string_decref(var72);
+string_decref(var71);
+(void)0;
+string_decref(var69);
+string_decref(var68);
+string_decref(var67);
+(void)0;
+string_decref(var65);
+string_decref(var64);
+string_decref(var63);
+(void)0;
+string_decref(var61);
+string_decref(var60);
+string_decref(var59);
+(void)0;
+string_decref(var57);
+string_decref(var56);
+string_decref(var55);
+(void)0;
+string_decref(var53);
+string_decref(var52);
+string_decref(var51);
+string_decref(var50);
+(void)0;
+string_decref(var48);
+string_decref(var47);
+(void)0;
+string_decref(var45);
+string_decref(var44);
+(void)0;
+string_decref(var42);
+string_decref(var41);
+(void)0;
+string_decref(var39);
+string_decref(var38);
+(void)0;
+string_decref(var36);
+string_decref(var35);
+(void)0;
+string_decref(var33);
+string_decref(var32);
+(void)0;
+string_decref(var30);
+string_decref(var29);
+string_decref(var28);
+decref((var27), dtor_List_Int__df8a64abf3);
+string_decref(var26);
+string_decref(var25);
+decref((var24), dtor_List_Int__df8a64abf3);
+string_decref(var23);
+string_decref(var22);
+decref((var21), dtor_List_Int__df8a64abf3);
+string_decref(var20);
+string_decref(var19);
+string_decref(var18);
+(void)0;
+string_decref(var16);
+string_decref(var15);
+(void)0;
+string_decref(var13);
+string_decref(var12);
+(void)0;
+string_decref(var10);
+string_decref(var9);
+string_decref(var8);
+string_decref(var7);
+(void)0;
+string_decref(var5);
+(void)0;
+string_decref(var3);
+(void)0;
+string_decref(var1);
+}
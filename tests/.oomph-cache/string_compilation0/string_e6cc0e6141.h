@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_string_e6cc0e6141
+                #define HEADER_GUARD_string_e6cc0e6141
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+struct class_List_Int__df8a64abf3;
+void oomph_main(void);
+
+                #endif
+                
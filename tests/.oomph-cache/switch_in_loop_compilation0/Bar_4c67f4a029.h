@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Bar_4c67f4a029
+                #define HEADER_GUARD_Bar_4c67f4a029
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Bar_4c67f4a029 {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Bar_4c67f4a029* ctor_Bar_4c67f4a029(void);
+            void dtor_Bar_4c67f4a029(void *ptr);
+            
+                struct class_Str meth_Bar_4c67f4a029_to_string(struct class_Bar_4c67f4a029* obj);
+                bool meth_Bar_4c67f4a029_equals(struct class_Bar_4c67f4a029* var1, struct class_Bar_4c67f4a029* var2);
+
+                #endif
+                
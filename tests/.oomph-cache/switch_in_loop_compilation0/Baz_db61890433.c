@@ -0,0 +1,49 @@
+#include <lib/oomph.h>
+#include "Baz_db61890433.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Baz_ad035dd06f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x7a' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Baz_ad035dd06f = {
+                .buf = &string0_Baz_ad035dd06f_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Baz_db61890433* ctor_Baz_db61890433(void)
+            {
+                struct class_Baz_db61890433* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_Baz_db61890433(void *ptr)
+            {
+                struct class_Baz_db61890433 *obj = ptr;
+                
+                free(obj);
+            }
+            
+                struct class_Str meth_Baz_db61890433_to_string(struct class_Baz_db61890433* self)
+                {
+                    struct class_Str res = string0_Baz_ad035dd06f;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Baz_db61890433_equals(struct class_Baz_db61890433* var1, struct class_Baz_db61890433* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
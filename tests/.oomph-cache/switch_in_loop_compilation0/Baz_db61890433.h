@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Baz_db61890433
+                #define HEADER_GUARD_Baz_db61890433
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Baz_db61890433 {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Baz_db61890433* ctor_Baz_db61890433(void);
+            void dtor_Baz_db61890433(void *ptr);
+            
+                struct class_Str meth_Baz_db61890433_to_string(struct class_Baz_db61890433* obj);
+                bool meth_Baz_db61890433_equals(struct class_Baz_db61890433* var1, struct class_Baz_db61890433* var2);
+
+                #endif
+                
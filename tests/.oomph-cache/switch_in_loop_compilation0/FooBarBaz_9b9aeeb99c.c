@@ -0,0 +1,117 @@
+#include <lib/oomph.h>
+#include "FooBarBaz_9b9aeeb99c.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_4c67f4a029.h"
+#include "Baz_db61890433.h"
+#include "Foo_1d567e1342.h"
+
+            static struct StringBuf string0_FooBarBaz_4753e39901_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x42', '\x61', '\x72', '\x42', '\x61', '\x7a' },
+                .malloced = false,
+            };
+            static struct class_Str string0_FooBarBaz_4753e39901 = {
+                .buf = &string0_FooBarBaz_4753e39901_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_FooBarBaz_9b9aeeb99c_to_string(struct class_FooBarBaz_9b9aeeb99c obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_Bar_4c67f4a029_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Baz_db61890433_to_string(obj.val.item1);
+                    break;
+                
+                case 2:
+                    valstr = meth_Foo_1d567e1342_to_string(obj.val.item2);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_FooBarBaz_4753e39901), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_FooBarBaz_4753e39901;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_FooBarBaz_9b9aeeb99c_equals(struct class_FooBarBaz_9b9aeeb99c a, struct class_FooBarBaz_9b9aeeb99c b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_Bar_4c67f4a029_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Baz_db61890433_equals(
+                        a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_Foo_1d567e1342_equals(
+                        a.val.item2, b.val.item2);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_FooBarBaz_4753e39901), (int)a.membernum);
+                }
+            }
+            
+            void incref_FooBarBaz_9b9aeeb99c(struct class_FooBarBaz_9b9aeeb99c obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                case 2:
+                    incref(obj.val.item2);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_FooBarBaz_9b9aeeb99c(struct class_FooBarBaz_9b9aeeb99c obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_Bar_4c67f4a029);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_Baz_db61890433);
+                    break;
+                
+                case 2:
+                    decref((obj.val.item2), dtor_Foo_1d567e1342);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
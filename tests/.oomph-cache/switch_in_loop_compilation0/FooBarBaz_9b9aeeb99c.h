@@ -0,0 +1,27 @@
+
+                #ifndef HEADER_GUARD_FooBarBaz_9b9aeeb99c
+                #define HEADER_GUARD_FooBarBaz_9b9aeeb99c
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Bar_4c67f4a029;
+struct class_Baz_db61890433;
+struct class_Foo_1d567e1342;
+
+            struct class_FooBarBaz_9b9aeeb99c {
+                union {
+                    	struct class_Bar_4c67f4a029* item0;
+	struct class_Baz_db61890433* item1;
+	struct class_Foo_1d567e1342* item2;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_FooBarBaz_9b9aeeb99c_to_string(struct class_FooBarBaz_9b9aeeb99c obj);
+            bool meth_FooBarBaz_9b9aeeb99c_equals(struct class_FooBarBaz_9b9aeeb99c a, struct class_FooBarBaz_9b9aeeb99c b);
+            
+            void incref_FooBarBaz_9b9aeeb99c(struct class_FooBarBaz_9b9aeeb99c obj);
+            void decref_FooBarBaz_9b9aeeb99c(struct class_FooBarBaz_9b9aeeb99c obj);
+            
+                #endif
+                
@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Foo_1d567e1342
+                #define HEADER_GUARD_Foo_1d567e1342
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_1d567e1342 {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Foo_1d567e1342* ctor_Foo_1d567e1342(void);
+            void dtor_Foo_1d567e1342(void *ptr);
+            
+                struct class_Str meth_Foo_1d567e1342_to_string(struct class_Foo_1d567e1342* obj);
+                bool meth_Foo_1d567e1342_equals(struct class_Foo_1d567e1342* var1, struct class_Foo_1d567e1342* var2);
+
+                #endif
+                
@@ -0,0 +1,309 @@
+#include <lib/oomph.h>
+#include "switch_in_loop_89a336ad9a.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_4c67f4a029.h"
+#include "Baz_db61890433.h"
+#include "FooBarBaz_9b9aeeb99c.h"
+#include "Foo_1d567e1342.h"
+
+            static struct StringBuf string0_Foo_on_iteration__9aec0ac6db_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x20', '\x6f', '\x6e', '\x20', '\x69', '\x74', '\x65', '\x72', '\x61', '\x74', '\x69', '\x6f', '\x6e', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_on_iteration__9aec0ac6db = {
+                .buf = &string0_Foo_on_iteration__9aec0ac6db_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1____83b1a32ed4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string1____83b1a32ed4 = {
+                .buf = &string1____83b1a32ed4_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_Bar_on_iteration__a0abc55132_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x72', '\x20', '\x6f', '\x6e', '\x20', '\x69', '\x74', '\x65', '\x72', '\x61', '\x74', '\x69', '\x6f', '\x6e', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string2_Bar_on_iteration__a0abc55132 = {
+                .buf = &string2_Bar_on_iteration__a0abc55132_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3_Baz_on_iteration__327a582cd7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x7a', '\x20', '\x6f', '\x6e', '\x20', '\x69', '\x74', '\x65', '\x72', '\x61', '\x74', '\x69', '\x6f', '\x6e', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string3_Baz_on_iteration__327a582cd7 = {
+                .buf = &string3_Baz_on_iteration__327a582cd7_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4_Switch_done_70d03f1633_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x77', '\x69', '\x74', '\x63', '\x68', '\x20', '\x64', '\x6f', '\x6e', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string4_Switch_done_70d03f1633 = {
+                .buf = &string4_Switch_done_70d03f1633_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5_Loop_done_d31d3e503f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x6f', '\x70', '\x20', '\x64', '\x6f', '\x6e', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string5_Loop_done_d31d3e503f = {
+                .buf = &string5_Loop_done_d31d3e503f_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Foo_1d567e1342* var1;
+var1 = NULL;
+struct class_FooBarBaz_9b9aeeb99c var2;
+var2.membernum = -1;
+int64_t var3;
+struct class_FooBarBaz_9b9aeeb99c var5;
+var5.membernum = -1;
+struct class_Foo_1d567e1342* var6;
+var6 = NULL;
+bool var7;
+struct class_Bar_4c67f4a029* var9;
+var9 = NULL;
+struct class_Str var12;
+var12.buf = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Str var16;
+var16.buf = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Bar_4c67f4a029* var19;
+var19 = NULL;
+struct class_FooBarBaz_9b9aeeb99c var20;
+var20.membernum = -1;
+struct class_Str var22;
+var22.buf = NULL;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Str var25;
+var25.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+struct class_Str var27;
+var27.buf = NULL;
+struct class_Str var28;
+var28.buf = NULL;
+struct class_Baz_db61890433* var29;
+var29 = NULL;
+struct class_FooBarBaz_9b9aeeb99c var30;
+var30.membernum = -1;
+struct class_Baz_db61890433* var32;
+var32 = NULL;
+struct class_Str var33;
+var33.buf = NULL;
+struct class_Str var34;
+var34.buf = NULL;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Str var36;
+var36.buf = NULL;
+struct class_Str var37;
+var37.buf = NULL;
+struct class_Str var38;
+var38.buf = NULL;
+struct class_Str var39;
+var39.buf = NULL;
+struct class_Str var41;
+var41.buf = NULL;
+int64_t var42;
+int64_t var43;
+struct class_Str var44;
+var44.buf = NULL;
+var1 = ctor_Foo_1d567e1342();
+var2 = (struct class_FooBarBaz_9b9aeeb99c){ .val = { .item2 = var1 }, .membernum = 2 };
+var1 = NULL;
+var3 = 0LL;
+label4: (void)0;
+decref_FooBarBaz_9b9aeeb99c(var5);
+var5.membernum = -1;
+var5 = var2;
+var2.membernum = -1;
+decref((var6), dtor_Foo_1d567e1342);
+var6 = NULL;
+
+            var7 = (
+                var5.membernum == 2
+            );
+            if (var7) goto label8;
+decref((var9), dtor_Bar_4c67f4a029);
+var9 = NULL;
+
+            var7 = (
+                var5.membernum == 0
+            );
+            if (var7) goto label10;
+
+            var7 = (
+                var5.membernum == 1
+            );
+            if (var7) goto label11;
+label8: (void)0;
+
+            if (var5.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var6 = var5.val.item2;
+            incref(var6);
+string_decref(var12);
+var12.buf = NULL;
+var12 = string0_Foo_on_iteration__9aec0ac6db; string_incref(var12);
+string_decref(var13);
+var13.buf = NULL;
+var13 = meth_Int_to_string(var3);
+string_decref(var14);
+var14.buf = NULL;
+var14 = oomph_string_concat(var12,var13);
+string_decref(var15);
+var15.buf = NULL;
+var15 = string1____83b1a32ed4; string_incref(var15);
+string_decref(var16);
+var16.buf = NULL;
+var16 = oomph_string_concat(var14,var15);
+string_decref(var17);
+var17.buf = NULL;
+var17 = meth_Foo_1d567e1342_to_string(var6);
+string_decref(var18);
+var18.buf = NULL;
+var18 = oomph_string_concat(var16,var17);
+oomph_print(var18);
+var19 = ctor_Bar_4c67f4a029();
+var20 = (struct class_FooBarBaz_9b9aeeb99c){ .val = { .item0 = var19 }, .membernum = 0 };
+var19 = NULL;
+var2 = var20;
+var20.membernum = -1;
+if (oomph_true) goto label21;
+label10: (void)0;
+
+            if (var5.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var9 = var5.val.item0;
+            incref(var9);
+string_decref(var22);
+var22.buf = NULL;
+var22 = string2_Bar_on_iteration__a0abc55132; string_incref(var22);
+string_decref(var23);
+var23.buf = NULL;
+var23 = meth_Int_to_string(var3);
+string_decref(var24);
+var24.buf = NULL;
+var24 = oomph_string_concat(var22,var23);
+string_decref(var25);
+var25.buf = NULL;
+var25 = string1____83b1a32ed4; string_incref(var25);
+string_decref(var26);
+var26.buf = NULL;
+var26 = oomph_string_concat(var24,var25);
+string_decref(var27);
+var27.buf = NULL;
+var27 = meth_Bar_4c67f4a029_to_string(var9);
+string_decref(var28);
+var28.buf = NULL;
+var28 = oomph_string_concat(var26,var27);
+oomph_print(var28);
+var29 = ctor_Baz_db61890433();
+var30 = (struct class_FooBarBaz_9b9aeeb99c){ .val = { .item1 = var29 }, .membernum = 1 };
+var29 = NULL;
+var2 = var30;
+var30.membernum = -1;
+if (oomph_true) goto label31;
+label11: (void)0;
+
+            if (var5.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var32 = var5.val.item1;
+            incref(var32);
+var33 = string3_Baz_on_iteration__327a582cd7; string_incref(var33);
+var34 = meth_Int_to_string(var3);
+var35 = oomph_string_concat(var33,var34);
+var36 = string1____83b1a32ed4; string_incref(var36);
+var37 = oomph_string_concat(var35,var36);
+var38 = meth_Baz_db61890433_to_string(var32);
+var39 = oomph_string_concat(var37,var38);
+oomph_print(var39);
+if (oomph_true) goto label40;
+label31: (void)0;
+string_decref(var41);
+var41.buf = NULL;
+var41 = string4_Switch_done_70d03f1633; string_incref(var41);
+oomph_print(var41);
+label21: (void)0;
+var42 = 1LL;
+var43 = oomph_int_add(var3,var42);
+var3 = var43;
+if (oomph_true) goto label4;
+label40: (void)0;
+var44 = string5_Loop_done_d31d3e503f; string_incref(var44);
+oomph_print(var44);
+out: (void)0;
+string_decref(var44);
+(void)0;
+(void)0;
+string_decref(var41);
+string_decref(var39);
+string_decref(var38);
+string_decref(var37);
+string_decref(var36);
+string_decref(var35);
+string_decref(var34);
+string_decref(var33);
+decref((var32), dtor_Baz_db61890433);
+decref_FooBarBaz_9b9aeeb99c(var30);
+decref((var29), dtor_Baz_db61890433);
+string_decref(var28);
+string_decref(var27);
+string_decref(var26);
+string_decref(var25);
+string_decref(var24);
+string_decref(var23);
+string_decref(var22);
+decref_FooBarBaz_9b9aeeb99c(var20);
+decref((var19), dtor_Bar_4c67f4a029);
+string_decref(var18);
+string_decref(var17);
+string_decref(var16);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+string_decref(var12);
+decref((var9), dtor_Bar_4c67f4a029);
+(void)0;
+decref((var6), dtor_Foo_1d567e1342);
+decref_FooBarBaz_9b9aeeb99c(var5);
+(void)0;
+decref_FooBarBaz_9b9aeeb99c(var2);
+decref((var1), dtor_Foo_1d567e1342);
+}
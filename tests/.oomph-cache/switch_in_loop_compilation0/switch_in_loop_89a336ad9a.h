@@ -0,0 +1,16 @@
+
+                #ifndef HEADER_GUARD_switch_in_loop_89a336ad9a
+                #define HEADER_GUARD_switch_in_loop_89a336ad9a
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "FooBarBaz_9b9aeeb99c.h"
+struct class_Foo_1d567e1342;
+struct class_Foo_1d567e1342;
+struct class_Bar_4c67f4a029;
+struct class_Bar_4c67f4a029;
+struct class_Baz_db61890433;
+struct class_Baz_db61890433;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,77 @@
+#include <lib/oomph.h>
+#include "to_string_e54a1abe2a.h"
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void){bool var1;
+struct class_Str var2;
+var2.buf = NULL;
+bool var3;
+struct class_Str var4;
+var4.buf = NULL;
+bool var5;
+struct class_Str var6;
+var6.buf = NULL;
+double var7;
+struct class_Str var8;
+var8.buf = NULL;
+double var9;
+struct class_Str var10;
+var10.buf = NULL;
+double var11;
+struct class_Str var12;
+var12.buf = NULL;
+double var13;
+struct class_Str var14;
+var14.buf = NULL;
+double var15;
+struct class_Str var16;
+var16.buf = NULL;
+double var17;
+struct class_Str var18;
+var18.buf = NULL;
+var1 = oomph_true;
+var2 = meth_Bool_to_string(var1);
+oomph_print(var2);
+var3 = oomph_true;
+var4 = meth_Bool_to_string(var3);
+oomph_print(var4);
+var5 = oomph_false;
+var6 = meth_Bool_to_string(var5);
+oomph_print(var6);
+var7 = 0.3;
+var8 = meth_Float_to_string(var7);
+oomph_print(var8);
+var9 = 0.30000000000000004;
+var10 = meth_Float_to_string(var9);
+oomph_print(var10);
+var11 = 0.03;
+var12 = meth_Float_to_string(var11);
+oomph_print(var12);
+var13 = 12.345;
+var14 = meth_Float_to_string(var13);
+oomph_print(var14);
+var15 = 123.456;
+var16 = meth_Float_to_string(var15);
+oomph_print(var16);
+var17 = -69.0;
+var18 = meth_Float_to_string(var17);
+oomph_print(var18);
+out: (void)0;
+string_decref(var18);
+(void)0;
+string_decref(var16);
+(void)0;
+string_decref(var14);
+(void)0;
+string_decref(var12);
+(void)0;
+string_decref(var10);
+(void)0;
+string_decref(var8);
+(void)0;
+string_decref(var6);
+(void)0;
+string_decref(var4);
+(void)0;
+string_decref(var2);
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_to_string_e54a1abe2a
+                #define HEADER_GUARD_to_string_e54a1abe2a
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,66 @@
+#include <lib/oomph.h>
+#include "trailing_comma_80e5616a15.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf string0_hello_4968d03e3d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_hello_4968d03e3d = {
+                .buf = &string0_hello_4968d03e3d_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_world_d26b126af1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77', '\x6f', '\x72', '\x6c', '\x64' },
+                .malloced = false,
+            };
+            static struct class_Str string1_world_d26b126af1 = {
+                .buf = &string1_world_d26b126af1_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_List_Str__43b70c06cb* var7;
+var7 = NULL;
+struct class_Str var8;
+var8.buf = NULL;
+var1 = string0_hello_4968d03e3d; string_incref(var1);
+oomph_print(var1);
+var2 = string0_hello_4968d03e3d; string_incref(var2);
+var3 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var3,var2);
+var4 = meth_List_Str__43b70c06cb_to_string(var3);
+oomph_print(var4);
+var5 = string0_hello_4968d03e3d; string_incref(var5);
+var6 = string1_world_d26b126af1; string_incref(var6);
+var7 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var7,var5);
+meth_List_Str__43b70c06cb_push(var7,var6);
+var8 = meth_List_Str__43b70c06cb_to_string(var7);
+oomph_print(var8);
+out: (void)0;
+string_decref(var8);
+decref((var7), dtor_List_Str__43b70c06cb);
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+decref((var3), dtor_List_Str__43b70c06cb);
+string_decref(var2);
+string_decref(var1);
+}
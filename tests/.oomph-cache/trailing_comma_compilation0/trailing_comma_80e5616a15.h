@@ -0,0 +1,11 @@
+
+                #ifndef HEADER_GUARD_trailing_comma_80e5616a15
+                #define HEADER_GUARD_trailing_comma_80e5616a15
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_List_Str__43b70c06cb;
+struct class_List_Str__43b70c06cb;
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_trailing_ws_55d6dd09a7
+                #define HEADER_GUARD_trailing_ws_55d6dd09a7
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
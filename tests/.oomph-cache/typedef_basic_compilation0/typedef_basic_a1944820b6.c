@@ -0,0 +1,21 @@
+#include <lib/oomph.h>
+#include "typedef_basic_a1944820b6.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_lol_19d6f1557b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0_lol_19d6f1557b = {
+                .buf = &string0_lol_19d6f1557b_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+var1 = string0_lol_19d6f1557b; string_incref(var1);
+oomph_print(var1);
+out: (void)0;
+string_decref(var1);
+}
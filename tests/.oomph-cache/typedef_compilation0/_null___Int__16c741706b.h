@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD__null___Int__16c741706b
+                #define HEADER_GUARD__null___Int__16c741706b
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class__null___Int__16c741706b {
+                union {
+                    	char item0;
+	int64_t item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth__null___Int__16c741706b_to_string(struct class__null___Int__16c741706b obj);
+            bool meth__null___Int__16c741706b_equals(struct class__null___Int__16c741706b a, struct class__null___Int__16c741706b b);
+            
+            void incref__null___Int__16c741706b(struct class__null___Int__16c741706b obj);
+            void decref__null___Int__16c741706b(struct class__null___Int__16c741706b obj);
+            int64_t meth__null___Int__16c741706b_get(struct class__null___Int__16c741706b obj);
+                #endif
+                
@@ -0,0 +1,18 @@
+#include <lib/oomph.h>
+#include "typedef_9c332041ef.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Int__16c741706b.h"
+void oomph_main(void){int64_t var1;
+struct class__null___Int__16c741706b var2;
+var2.membernum = -1;
+struct class_Str var3;
+var3.buf = NULL;
+var1 = 123LL;
+var2 = (struct class__null___Int__16c741706b){ .val = { .item1 = var1 }, .membernum = 1 };
+var3 = meth__null___Int__16c741706b_to_string(var2);
+oomph_print(var3);
+out: (void)0;
+string_decref(var3);
+decref__null___Int__16c741706b(var2);
+(void)0;
+}
@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_typedef_9c332041ef
+                #define HEADER_GUARD_typedef_9c332041ef
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "_null___Int__16c741706b.h"
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_Bar_6cfe0bd2e0
+                #define HEADER_GUARD_Bar_6cfe0bd2e0
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Bar_6cfe0bd2e0 {
+                union {
+                    	int64_t item0;
+	struct class_Str item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_Bar_6cfe0bd2e0_to_string(struct class_Bar_6cfe0bd2e0 obj);
+            bool meth_Bar_6cfe0bd2e0_equals(struct class_Bar_6cfe0bd2e0 a, struct class_Bar_6cfe0bd2e0 b);
+            
+            void incref_Bar_6cfe0bd2e0(struct class_Bar_6cfe0bd2e0 obj);
+            void decref_Bar_6cfe0bd2e0(struct class_Bar_6cfe0bd2e0 obj);
+            
+                #endif
+                
@@ -0,0 +1,107 @@
+#include <lib/oomph.h>
+#include "_null___Int__16c741706b.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0__null___Int__937e1a929a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x6e', '\x75', '\x6c', '\x6c', '\x20', '\x7c', '\x20', '\x49', '\x6e', '\x74', '\x29' },
+                .malloced = false,
+            };
+            static struct class_Str string0__null___Int__937e1a929a = {
+                .buf = &string0__null___Int__937e1a929a_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            struct class_Str meth__null___Int__16c741706b_to_string(struct class__null___Int__16c741706b obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_null_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Int_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__null___Int__937e1a929a), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0__null___Int__937e1a929a;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth__null___Int__16c741706b_equals(struct class__null___Int__16c741706b a, struct class__null___Int__16c741706b b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_null_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Int_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0__null___Int__937e1a929a), (int)a.membernum);
+                }
+            }
+            
+            void incref__null___Int__16c741706b(struct class__null___Int__16c741706b obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    (void)0;
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref__null___Int__16c741706b(struct class__null___Int__16c741706b obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    (void)0;
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
+                int64_t meth__null___Int__16c741706b_get(struct class__null___Int__16c741706b obj)
+                {
+                    if (obj.membernum == 0)
+                        panic_printf("Error: null.get() was called");
+                    assert(obj.membernum == 1);
+                    (void)0;
+                    return obj.val.item1;
+                }
+                
@@ -0,0 +1,31 @@
+#include <lib/oomph.h>
+#include "typedef_optional_06c482c1f2.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_6cfe0bd2e0.h"
+#include "_null___Int__16c741706b.h"
+void oomph_main(void){int64_t var1;
+struct class__null___Int__16c741706b var2;
+var2.membernum = -1;
+struct class_Str var3;
+var3.buf = NULL;
+int64_t var4;
+struct class_Bar_6cfe0bd2e0 var5;
+var5.membernum = -1;
+struct class_Str var6;
+var6.buf = NULL;
+var1 = 123LL;
+var2 = (struct class__null___Int__16c741706b){ .val = { .item1 = var1 }, .membernum = 1 };
+var3 = meth__null___Int__16c741706b_to_string(var2);
+oomph_print(var3);
+var4 = 123LL;
+var5 = (struct class_Bar_6cfe0bd2e0){ .val = { .item0 = var4 }, .membernum = 0 };
+var6 = meth_Bar_6cfe0bd2e0_to_string(var5);
+oomph_print(var6);
+out: (void)0;
+string_decref(var6);
+decref_Bar_6cfe0bd2e0(var5);
+(void)0;
+string_decref(var3);
+decref__null___Int__16c741706b(var2);
+(void)0;
+}
@@ -0,0 +1,11 @@
+
+                #ifndef HEADER_GUARD_typedef_optional_06c482c1f2
+                #define HEADER_GUARD_typedef_optional_06c482c1f2
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_6cfe0bd2e0.h"
+#include "_null___Int__16c741706b.h"
+void oomph_main(void);
+
+                #endif
+                
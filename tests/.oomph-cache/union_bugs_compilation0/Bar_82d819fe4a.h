@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Bar_82d819fe4a
+                #define HEADER_GUARD_Bar_82d819fe4a
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Bar_82d819fe4a {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Bar_82d819fe4a* ctor_Bar_82d819fe4a(void);
+            void dtor_Bar_82d819fe4a(void *ptr);
+            
+                struct class_Str meth_Bar_82d819fe4a_to_string(struct class_Bar_82d819fe4a* obj);
+                bool meth_Bar_82d819fe4a_equals(struct class_Bar_82d819fe4a* var1, struct class_Bar_82d819fe4a* var2);
+
+                #endif
+                
@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Foo_ef44dc347a
+                #define HEADER_GUARD_Foo_ef44dc347a
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_ef44dc347a {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Foo_ef44dc347a* ctor_Foo_ef44dc347a(void);
+            void dtor_Foo_ef44dc347a(void *ptr);
+            
+                struct class_Str meth_Foo_ef44dc347a_to_string(struct class_Foo_ef44dc347a* obj);
+                bool meth_Foo_ef44dc347a_equals(struct class_Foo_ef44dc347a* var1, struct class_Foo_ef44dc347a* var2);
+
+                #endif
+                
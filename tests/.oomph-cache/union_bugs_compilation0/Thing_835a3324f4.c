@@ -0,0 +1,100 @@
+#include <lib/oomph.h>
+#include "Thing_835a3324f4.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_82d819fe4a.h"
+#include "Foo_ef44dc347a.h"
+
+            static struct StringBuf string0_Thing_b47373bf7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x68', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Thing_b47373bf7d = {
+                .buf = &string0_Thing_b47373bf7d_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_Thing_835a3324f4_to_string(struct class_Thing_835a3324f4 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_Bar_82d819fe4a_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Foo_ef44dc347a_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Thing_b47373bf7d), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_Thing_b47373bf7d;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_Thing_835a3324f4_equals(struct class_Thing_835a3324f4 a, struct class_Thing_835a3324f4 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_Bar_82d819fe4a_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Foo_ef44dc347a_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Thing_b47373bf7d), (int)a.membernum);
+                }
+            }
+            
+            void incref_Thing_835a3324f4(struct class_Thing_835a3324f4 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_Thing_835a3324f4(struct class_Thing_835a3324f4 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_Bar_82d819fe4a);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_Foo_ef44dc347a);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
@@ -0,0 +1,25 @@
+
+                #ifndef HEADER_GUARD_Thing_835a3324f4
+                #define HEADER_GUARD_Thing_835a3324f4
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Bar_82d819fe4a;
+struct class_Foo_ef44dc347a;
+
+            struct class_Thing_835a3324f4 {
+                union {
+                    	struct class_Bar_82d819fe4a* item0;
+	struct class_Foo_ef44dc347a* item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_Thing_835a3324f4_to_string(struct class_Thing_835a3324f4 obj);
+            bool meth_Thing_835a3324f4_equals(struct class_Thing_835a3324f4 a, struct class_Thing_835a3324f4 b);
+            
+            void incref_Thing_835a3324f4(struct class_Thing_835a3324f4 obj);
+            void decref_Thing_835a3324f4(struct class_Thing_835a3324f4 obj);
+            
+                #endif
+                
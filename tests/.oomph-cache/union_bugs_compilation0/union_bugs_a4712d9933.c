@@ -0,0 +1,43 @@
+#include <lib/oomph.h>
+#include "union_bugs_a4712d9933.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_82d819fe4a.h"
+#include "Foo_ef44dc347a.h"
+#include "Thing_835a3324f4.h"
+struct class_Thing_835a3324f4 union_bugs_a4712d9933_do_nothing(struct class_Thing_835a3324f4 var1){struct class_Thing_835a3324f4 retval;
+incref_Thing_835a3324f4(var1); retval = var1; goto out;
+out: (void)0;
+return retval;
+}struct class_Thing_835a3324f4 union_bugs_a4712d9933_make_thing(void){struct class_Bar_82d819fe4a* var1;
+var1 = NULL;
+struct class_Thing_835a3324f4 var2;
+var2.membernum = -1;
+struct class_Thing_835a3324f4 retval;
+var1 = ctor_Bar_82d819fe4a();
+var2 = (struct class_Thing_835a3324f4){ .val = { .item0 = var1 }, .membernum = 0 };
+var1 = NULL;
+retval = var2; var2.membernum = -1;
+goto out;
+out: (void)0;
+decref_Thing_835a3324f4(var2);
+decref((var1), dtor_Bar_82d819fe4a);
+return retval;
+}void oomph_main(void){struct class_Foo_ef44dc347a* var1;
+var1 = NULL;
+struct class_Thing_835a3324f4 var2;
+var2.membernum = -1;
+struct class_Thing_835a3324f4 var3;
+var3.membernum = -1;
+struct class_Thing_835a3324f4 var4;
+var4.membernum = -1;
+var1 = ctor_Foo_ef44dc347a();
+var2 = (struct class_Thing_835a3324f4){ .val = { .item1 = var1 }, .membernum = 1 };
+var1 = NULL;
+var3 = union_bugs_a4712d9933_do_nothing(var2);
+var4 = union_bugs_a4712d9933_make_thing();
+out: (void)0;
+decref_Thing_835a3324f4(var4);
+decref_Thing_835a3324f4(var3);
+decref_Thing_835a3324f4(var2);
+decref((var1), dtor_Foo_ef44dc347a);
+}
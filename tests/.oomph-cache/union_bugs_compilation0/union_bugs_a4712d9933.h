@@ -0,0 +1,14 @@
+
+                #ifndef HEADER_GUARD_union_bugs_a4712d9933
+                #define HEADER_GUARD_union_bugs_a4712d9933
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Thing_835a3324f4.h"
+struct class_Bar_82d819fe4a;
+struct class_Foo_ef44dc347a;
+struct class_Thing_835a3324f4 union_bugs_a4712d9933_do_nothing(struct class_Thing_835a3324f4 var1);
+struct class_Thing_835a3324f4 union_bugs_a4712d9933_make_thing(void);
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Bar_821e9c7c1b
+                #define HEADER_GUARD_Bar_821e9c7c1b
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Bar_821e9c7c1b {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Bar_821e9c7c1b* ctor_Bar_821e9c7c1b(void);
+            void dtor_Bar_821e9c7c1b(void *ptr);
+            
+                struct class_Str meth_Bar_821e9c7c1b_to_string(struct class_Bar_821e9c7c1b* obj);
+                bool meth_Bar_821e9c7c1b_equals(struct class_Bar_821e9c7c1b* var1, struct class_Bar_821e9c7c1b* var2);
+
+                #endif
+                
@@ -0,0 +1,49 @@
+#include <lib/oomph.h>
+#include "Baz_598fd2f620.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Baz_a00b76263f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x7a' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Baz_a00b76263f = {
+                .buf = &string0_Baz_a00b76263f_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Baz_598fd2f620* ctor_Baz_598fd2f620(void)
+            {
+                struct class_Baz_598fd2f620* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_Baz_598fd2f620(void *ptr)
+            {
+                struct class_Baz_598fd2f620 *obj = ptr;
+                
+                free(obj);
+            }
+            
+                struct class_Str meth_Baz_598fd2f620_to_string(struct class_Baz_598fd2f620* self)
+                {
+                    struct class_Str res = string0_Baz_a00b76263f;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Baz_598fd2f620_equals(struct class_Baz_598fd2f620* var1, struct class_Baz_598fd2f620* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,19 @@
+
+                #ifndef HEADER_GUARD_Baz_598fd2f620
+                #define HEADER_GUARD_Baz_598fd2f620
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Baz_598fd2f620 {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_Baz_598fd2f620* ctor_Baz_598fd2f620(void);
+            void dtor_Baz_598fd2f620(void *ptr);
+            
+                struct class_Str meth_Baz_598fd2f620_to_string(struct class_Baz_598fd2f620* obj);
+                bool meth_Baz_598fd2f620_equals(struct class_Baz_598fd2f620* var1, struct class_Baz_598fd2f620* var2);
+
+                #endif
+                
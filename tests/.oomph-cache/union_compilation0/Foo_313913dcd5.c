@@ -0,0 +1,56 @@
+#include <lib/oomph.h>
+#include "Foo_313913dcd5.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Foo_24a4dd43f1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo_24a4dd43f1 = {
+                .buf = &string0_Foo_24a4dd43f1_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            
+            struct class_Foo_313913dcd5* ctor_Foo_313913dcd5(int64_t arg_foo_thing)
+            {
+                struct class_Foo_313913dcd5* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                obj->memb_foo_thing = arg_foo_thing;
+
+                (void)0;
+
+                return obj;
+            }
+
+            void dtor_Foo_313913dcd5(void *ptr)
+            {
+                struct class_Foo_313913dcd5 *obj = ptr;
+                (void)0;
+
+                free(obj);
+            }
+            
+                struct class_Str meth_Foo_313913dcd5_to_string(struct class_Foo_313913dcd5* self)
+                {
+                    struct class_Str res = string0_Foo_24a4dd43f1;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_foo_thing);
+                    oomph_string_concat_inplace(&res, tmp);
+                    string_decref(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_313913dcd5_equals(struct class_Foo_313913dcd5* var1, struct class_Foo_313913dcd5* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
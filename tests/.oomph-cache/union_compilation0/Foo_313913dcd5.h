@@ -0,0 +1,20 @@
+
+                #ifndef HEADER_GUARD_Foo_313913dcd5
+                #define HEADER_GUARD_Foo_313913dcd5
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Foo_313913dcd5 {
+                REFCOUNT_HEADER
+                int64_t memb_foo_thing;
+
+            };
+            
+            struct class_Foo_313913dcd5* ctor_Foo_313913dcd5(int64_t arg_foo_thing);
+            void dtor_Foo_313913dcd5(void *ptr);
+            
+                struct class_Str meth_Foo_313913dcd5_to_string(struct class_Foo_313913dcd5* obj);
+                bool meth_Foo_313913dcd5_equals(struct class_Foo_313913dcd5* var1, struct class_Foo_313913dcd5* var2);
+
+                #endif
+                
@@ -0,0 +1,117 @@
+#include <lib/oomph.h>
+#include "Thing_aaeeb95640.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_821e9c7c1b.h"
+#include "Baz_598fd2f620.h"
+#include "Foo_313913dcd5.h"
+
+            static struct StringBuf string0_Thing_0e56f914b2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x68', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Thing_0e56f914b2 = {
+                .buf = &string0_Thing_0e56f914b2_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_Thing_aaeeb95640_to_string(struct class_Thing_aaeeb95640 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_Bar_821e9c7c1b_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Baz_598fd2f620_to_string(obj.val.item1);
+                    break;
+                
+                case 2:
+                    valstr = meth_Foo_313913dcd5_to_string(obj.val.item2);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Thing_0e56f914b2), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_Thing_0e56f914b2;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_Thing_aaeeb95640_equals(struct class_Thing_aaeeb95640 a, struct class_Thing_aaeeb95640 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_Bar_821e9c7c1b_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Baz_598fd2f620_equals(
+                        a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_Foo_313913dcd5_equals(
+                        a.val.item2, b.val.item2);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Thing_0e56f914b2), (int)a.membernum);
+                }
+            }
+            
+            void incref_Thing_aaeeb95640(struct class_Thing_aaeeb95640 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    incref(obj.val.item0);
+                    break;
+                
+                case 1:
+                    incref(obj.val.item1);
+                    break;
+                
+                case 2:
+                    incref(obj.val.item2);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_Thing_aaeeb95640(struct class_Thing_aaeeb95640 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    decref((obj.val.item0), dtor_Bar_821e9c7c1b);
+                    break;
+                
+                case 1:
+                    decref((obj.val.item1), dtor_Baz_598fd2f620);
+                    break;
+                
+                case 2:
+                    decref((obj.val.item2), dtor_Foo_313913dcd5);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
@@ -0,0 +1,27 @@
+
+                #ifndef HEADER_GUARD_Thing_aaeeb95640
+                #define HEADER_GUARD_Thing_aaeeb95640
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+struct class_Bar_821e9c7c1b;
+struct class_Baz_598fd2f620;
+struct class_Foo_313913dcd5;
+
+            struct class_Thing_aaeeb95640 {
+                union {
+                    	struct class_Bar_821e9c7c1b* item0;
+	struct class_Baz_598fd2f620* item1;
+	struct class_Foo_313913dcd5* item2;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_Thing_aaeeb95640_to_string(struct class_Thing_aaeeb95640 obj);
+            bool meth_Thing_aaeeb95640_equals(struct class_Thing_aaeeb95640 a, struct class_Thing_aaeeb95640 b);
+            
+            void incref_Thing_aaeeb95640(struct class_Thing_aaeeb95640 obj);
+            void decref_Thing_aaeeb95640(struct class_Thing_aaeeb95640 obj);
+            
+                #endif
+                
@@ -0,0 +1,423 @@
+#include <lib/oomph.h>
+#include "union_82cff30ab9.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Bar_821e9c7c1b.h"
+#include "Baz_598fd2f620.h"
+#include "Foo_313913dcd5.h"
+#include "Thing_aaeeb95640.h"
+
+            static struct StringBuf string0_Foo__236b2da4d5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Foo__236b2da4d5 = {
+                .buf = &string0_Foo__236b2da4d5_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_Bar__9262a8e5d3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x72', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string1_Bar__9262a8e5d3 = {
+                .buf = &string1_Bar__9262a8e5d3_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_Baz__67ce7166fd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x7a', '\x20' },
+                .malloced = false,
+            };
+            static struct class_Str string2_Baz__67ce7166fd = {
+                .buf = &string2_Baz__67ce7166fd_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3___it_s_a_Foo_1ee0ba083a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x20', '\x69', '\x74', '\x27', '\x73', '\x20', '\x61', '\x20', '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string3___it_s_a_Foo_1ee0ba083a = {
+                .buf = &string3___it_s_a_Foo_1ee0ba083a_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4___it_s_not_a_Foo_1a93156ebb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x20', '\x69', '\x74', '\x27', '\x73', '\x20', '\x6e', '\x6f', '\x74', '\x20', '\x61', '\x20', '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string4___it_s_not_a_Foo_1a93156ebb = {
+                .buf = &string4___it_s_not_a_Foo_1a93156ebb_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string5__With_implicit_conversions___55895112a1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x57', '\x69', '\x74', '\x68', '\x20', '\x69', '\x6d', '\x70', '\x6c', '\x69', '\x63', '\x69', '\x74', '\x20', '\x63', '\x6f', '\x6e', '\x76', '\x65', '\x72', '\x73', '\x69', '\x6f', '\x6e', '\x73', '\x3a', '\x0a' },
+                .malloced = false,
+            };
+            static struct class_Str string5__With_implicit_conversions___55895112a1 = {
+                .buf = &string5__With_implicit_conversions___55895112a1_buf,
+                .nbytes = 28,
+                .offset = 0,
+            };
+            void union_82cff30ab9_print_thing(struct class_Thing_aaeeb95640 var1){bool var2;
+struct class_Foo_313913dcd5* var6;
+var6 = NULL;
+struct class_Str var7;
+var7.buf = NULL;
+int64_t var8;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+struct class_Bar_821e9c7c1b* var12;
+var12 = NULL;
+struct class_Str var13;
+var13.buf = NULL;
+struct class_Str var14;
+var14.buf = NULL;
+struct class_Str var15;
+var15.buf = NULL;
+struct class_Baz_598fd2f620* var16;
+var16 = NULL;
+struct class_Str var17;
+var17.buf = NULL;
+struct class_Str var18;
+var18.buf = NULL;
+struct class_Str var19;
+var19.buf = NULL;
+bool var20;
+struct class_Foo_313913dcd5* var23;
+var23 = NULL;
+struct class_Str var24;
+var24.buf = NULL;
+struct class_Str var26;
+var26.buf = NULL;
+
+            var2 = (
+                var1.membernum == 2
+            );
+            if (var2) goto label3;
+
+            var2 = (
+                var1.membernum == 0
+            );
+            if (var2) goto label4;
+
+            var2 = (
+                var1.membernum == 1
+            );
+            if (var2) goto label5;
+label3: (void)0;
+
+            if (var1.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var6 = var1.val.item2;
+            incref(var6);
+var7 = string0_Foo__236b2da4d5; string_incref(var7);
+var8 = var6->memb_foo_thing;
+var9 = meth_Int_to_string(var8);
+var10 = oomph_string_concat(var7,var9);
+oomph_print(var10);
+if (oomph_true) goto label11;
+label4: (void)0;
+
+            if (var1.membernum != 0)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var12 = var1.val.item0;
+            incref(var12);
+var13 = string1_Bar__9262a8e5d3; string_incref(var13);
+var14 = meth_Bar_821e9c7c1b_to_string(var12);
+var15 = oomph_string_concat(var13,var14);
+oomph_print(var15);
+if (oomph_true) goto label11;
+label5: (void)0;
+
+            if (var1.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var16 = var1.val.item1;
+            incref(var16);
+var17 = string2_Baz__67ce7166fd; string_incref(var17);
+var18 = meth_Baz_598fd2f620_to_string(var16);
+var19 = oomph_string_concat(var17,var18);
+oomph_print(var19);
+label11: (void)0;
+
+            var20 = (
+                var1.membernum == 2
+            );
+            if (var20) goto label21;
+
+            var20 = (
+                var1.membernum == 0
+            );
+            if (var20) goto label22;
+
+            var20 = (
+                var1.membernum == 1
+            );
+            if (var20) goto label22;
+label21: (void)0;
+
+            if (var1.membernum != 2)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var23 = var1.val.item2;
+            incref(var23);
+var24 = string3___it_s_a_Foo_1ee0ba083a; string_incref(var24);
+oomph_print(var24);
+if (oomph_true) goto label25;
+label22: (void)0;
+var26 = string4___it_s_not_a_Foo_1a93156ebb; string_incref(var26);
+oomph_print(var26);
+label25: (void)0;
+out: (void)0;
+string_decref(var26);
+string_decref(var24);
+decref((var23), dtor_Foo_313913dcd5);
+(void)0;
+string_decref(var19);
+string_decref(var18);
+string_decref(var17);
+decref((var16), dtor_Baz_598fd2f620);
+string_decref(var15);
+string_decref(var14);
+string_decref(var13);
+decref((var12), dtor_Bar_821e9c7c1b);
+string_decref(var10);
+string_decref(var9);
+(void)0;
+string_decref(var7);
+decref((var6), dtor_Foo_313913dcd5);
+(void)0;
+}void oomph_main(void){int64_t var1;
+struct class_Foo_313913dcd5* var2;
+var2 = NULL;
+struct class_Thing_aaeeb95640 var3;
+var3.membernum = -1;
+struct class_Bar_821e9c7c1b* var4;
+var4 = NULL;
+struct class_Thing_aaeeb95640 var5;
+var5.membernum = -1;
+struct class_Baz_598fd2f620* var6;
+var6 = NULL;
+struct class_Thing_aaeeb95640 var7;
+var7.membernum = -1;
+struct class_Str var8;
+var8.buf = NULL;
+int64_t var9;
+struct class_Foo_313913dcd5* var10;
+var10 = NULL;
+struct class_Thing_aaeeb95640 var11;
+var11.membernum = -1;
+struct class_Bar_821e9c7c1b* var12;
+var12 = NULL;
+struct class_Thing_aaeeb95640 var13;
+var13.membernum = -1;
+struct class_Baz_598fd2f620* var14;
+var14 = NULL;
+struct class_Thing_aaeeb95640 var15;
+var15.membernum = -1;
+int64_t var16;
+struct class_Foo_313913dcd5* var17;
+var17 = NULL;
+int64_t var18;
+struct class_Foo_313913dcd5* var19;
+var19 = NULL;
+struct class_Thing_aaeeb95640 var20;
+var20.membernum = -1;
+struct class_Thing_aaeeb95640 var21;
+var21.membernum = -1;
+bool var22;
+struct class_Str var23;
+var23.buf = NULL;
+struct class_Thing_aaeeb95640 var24;
+var24.membernum = -1;
+struct class_Thing_aaeeb95640 var25;
+var25.membernum = -1;
+bool var26;
+struct class_Str var27;
+var27.buf = NULL;
+struct class_Thing_aaeeb95640 var28;
+var28.membernum = -1;
+struct class_Thing_aaeeb95640 var29;
+var29.membernum = -1;
+bool var30;
+struct class_Str var31;
+var31.buf = NULL;
+struct class_Thing_aaeeb95640 var32;
+var32.membernum = -1;
+struct class_Thing_aaeeb95640 var33;
+var33.membernum = -1;
+bool var34;
+struct class_Str var35;
+var35.buf = NULL;
+struct class_Thing_aaeeb95640 var36;
+var36.membernum = -1;
+struct class_Thing_aaeeb95640 var37;
+var37.membernum = -1;
+bool var38;
+struct class_Str var39;
+var39.buf = NULL;
+struct class_Thing_aaeeb95640 var40;
+var40.membernum = -1;
+struct class_Thing_aaeeb95640 var41;
+var41.membernum = -1;
+bool var42;
+struct class_Str var43;
+var43.buf = NULL;
+struct class_Bar_821e9c7c1b* var44;
+var44 = NULL;
+struct class_Thing_aaeeb95640 var45;
+var45.membernum = -1;
+struct class_Thing_aaeeb95640 var46;
+var46.membernum = -1;
+bool var47;
+struct class_Str var48;
+var48.buf = NULL;
+var1 = 69LL;
+var2 = ctor_Foo_313913dcd5(var1);
+var3 = (struct class_Thing_aaeeb95640){ .val = { .item2 = var2 }, .membernum = 2 };
+var2 = NULL;
+union_82cff30ab9_print_thing(var3);
+var4 = ctor_Bar_821e9c7c1b();
+var5 = (struct class_Thing_aaeeb95640){ .val = { .item0 = var4 }, .membernum = 0 };
+var4 = NULL;
+union_82cff30ab9_print_thing(var5);
+var6 = ctor_Baz_598fd2f620();
+var7 = (struct class_Thing_aaeeb95640){ .val = { .item1 = var6 }, .membernum = 1 };
+var6 = NULL;
+union_82cff30ab9_print_thing(var7);
+var8 = string5__With_implicit_conversions___55895112a1; string_incref(var8);
+oomph_print(var8);
+var9 = 69LL;
+var10 = ctor_Foo_313913dcd5(var9);
+var11 = (struct class_Thing_aaeeb95640){ .val = { .item2 = var10 }, .membernum = 2 };
+var10 = NULL;
+union_82cff30ab9_print_thing(var11);
+var12 = ctor_Bar_821e9c7c1b();
+var13 = (struct class_Thing_aaeeb95640){ .val = { .item0 = var12 }, .membernum = 0 };
+var12 = NULL;
+union_82cff30ab9_print_thing(var13);
+var14 = ctor_Baz_598fd2f620();
+var15 = (struct class_Thing_aaeeb95640){ .val = { .item1 = var14 }, .membernum = 1 };
+var14 = NULL;
+union_82cff30ab9_print_thing(var15);
+var16 = 1LL;
+var17 = ctor_Foo_313913dcd5(var16);
+var18 = 1LL;
+var19 = ctor_Foo_313913dcd5(var18);
+var20 = (struct class_Thing_aaeeb95640){ .val = { .item2 = var17 }, .membernum = 2 };
+incref(var17);
+var21 = (struct class_Thing_aaeeb95640){ .val = { .item2 = var17 }, .membernum = 2 };
+incref(var17);
+var22 = meth_Thing_aaeeb95640_equals(var20,var21);
+var23 = meth_Bool_to_string(var22);
+oomph_print(var23);
+var24 = (struct class_Thing_aaeeb95640){ .val = { .item2 = var17 }, .membernum = 2 };
+incref(var17);
+var25 = (struct class_Thing_aaeeb95640){ .val = { .item2 = var19 }, .membernum = 2 };
+incref(var19);
+var26 = meth_Thing_aaeeb95640_equals(var24,var25);
+var27 = meth_Bool_to_string(var26);
+oomph_print(var27);
+var28 = (struct class_Thing_aaeeb95640){ .val = { .item2 = var17 }, .membernum = 2 };
+incref(var17);
+var29 = (struct class_Thing_aaeeb95640){ .val = { .item2 = var17 }, .membernum = 2 };
+incref(var17);
+var30 = meth_Thing_aaeeb95640_equals(var28,var29);
+var31 = meth_Bool_to_string(var30);
+oomph_print(var31);
+var32 = (struct class_Thing_aaeeb95640){ .val = { .item2 = var17 }, .membernum = 2 };
+incref(var17);
+var33 = (struct class_Thing_aaeeb95640){ .val = { .item2 = var19 }, .membernum = 2 };
+incref(var19);
+var34 = meth_Thing_aaeeb95640_equals(var32,var33);
+var35 = meth_Bool_to_string(var34);
+oomph_print(var35);
+var36 = (struct class_Thing_aaeeb95640){ .val = { .item2 = var17 }, .membernum = 2 };
+incref(var17);
+var37 = (struct class_Thing_aaeeb95640){ .val = { .item2 = var17 }, .membernum = 2 };
+incref(var17);
+var38 = meth_Thing_aaeeb95640_equals(var37,var36);
+var39 = meth_Bool_to_string(var38);
+oomph_print(var39);
+var40 = (struct class_Thing_aaeeb95640){ .val = { .item2 = var19 }, .membernum = 2 };
+var19 = NULL;
+var41 = (struct class_Thing_aaeeb95640){ .val = { .item2 = var17 }, .membernum = 2 };
+incref(var17);
+var42 = meth_Thing_aaeeb95640_equals(var41,var40);
+var43 = meth_Bool_to_string(var42);
+oomph_print(var43);
+var44 = ctor_Bar_821e9c7c1b();
+var45 = (struct class_Thing_aaeeb95640){ .val = { .item0 = var44 }, .membernum = 0 };
+var44 = NULL;
+var46 = (struct class_Thing_aaeeb95640){ .val = { .item2 = var17 }, .membernum = 2 };
+var17 = NULL;
+var47 = meth_Thing_aaeeb95640_equals(var46,var45);
+var48 = meth_Bool_to_string(var47);
+oomph_print(var48);
+out: (void)0;
+string_decref(var48);
+(void)0;
+decref_Thing_aaeeb95640(var46);
+decref_Thing_aaeeb95640(var45);
+decref((var44), dtor_Bar_821e9c7c1b);
+string_decref(var43);
+(void)0;
+decref_Thing_aaeeb95640(var41);
+decref_Thing_aaeeb95640(var40);
+string_decref(var39);
+(void)0;
+decref_Thing_aaeeb95640(var37);
+decref_Thing_aaeeb95640(var36);
+string_decref(var35);
+(void)0;
+decref_Thing_aaeeb95640(var33);
+decref_Thing_aaeeb95640(var32);
+string_decref(var31);
+(void)0;
+decref_Thing_aaeeb95640(var29);
+decref_Thing_aaeeb95640(var28);
+string_decref(var27);
+(void)0;
+decref_Thing_aaeeb95640(var25);
+decref_Thing_aaeeb95640(var24);
+string_decref(var23);
+(void)0;
+decref_Thing_aaeeb95640(var21);
+decref_Thing_aaeeb95640(var20);
+decref((var19), dtor_Foo_313913dcd5);
+(void)0;
+decref((var17), dtor_Foo_313913dcd5);
+(void)0;
+decref_Thing_aaeeb95640(var15);
+decref((var14), dtor_Baz_598fd2f620);
+decref_Thing_aaeeb95640(var13);
+decref((var12), dtor_Bar_821e9c7c1b);
+decref_Thing_aaeeb95640(var11);
+decref((var10), dtor_Foo_313913dcd5);
+(void)0;
+string_decref(var8);
+decref_Thing_aaeeb95640(var7);
+decref((var6), dtor_Baz_598fd2f620);
+decref_Thing_aaeeb95640(var5);
+decref((var4), dtor_Bar_821e9c7c1b);
+decref_Thing_aaeeb95640(var3);
+decref((var2), dtor_Foo_313913dcd5);
+(void)0;
+}
@@ -0,0 +1,24 @@
+
+                #ifndef HEADER_GUARD_union_82cff30ab9
+                #define HEADER_GUARD_union_82cff30ab9
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Thing_aaeeb95640.h"
+struct class_Foo_313913dcd5;
+struct class_Bar_821e9c7c1b;
+struct class_Baz_598fd2f620;
+struct class_Foo_313913dcd5;
+struct class_Foo_313913dcd5;
+struct class_Bar_821e9c7c1b;
+struct class_Baz_598fd2f620;
+struct class_Foo_313913dcd5;
+struct class_Bar_821e9c7c1b;
+struct class_Baz_598fd2f620;
+struct class_Foo_313913dcd5;
+struct class_Foo_313913dcd5;
+struct class_Bar_821e9c7c1b;
+void union_82cff30ab9_print_thing(struct class_Thing_aaeeb95640 var1);
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,98 @@
+#include <lib/oomph.h>
+#include "Blah_929edd5fdd.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Blah_90e24014d8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x6c', '\x61', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Blah_90e24014d8 = {
+                .buf = &string0_Blah_90e24014d8_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_Blah_929edd5fdd_to_string(struct class_Blah_929edd5fdd obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_Bool_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Str_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Blah_90e24014d8), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_Blah_90e24014d8;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_Blah_929edd5fdd_equals(struct class_Blah_929edd5fdd a, struct class_Blah_929edd5fdd b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_Bool_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Str_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Blah_90e24014d8), (int)a.membernum);
+                }
+            }
+            
+            void incref_Blah_929edd5fdd(struct class_Blah_929edd5fdd obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    string_incref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_Blah_929edd5fdd(struct class_Blah_929edd5fdd obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    string_decref(obj.val.item1);
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
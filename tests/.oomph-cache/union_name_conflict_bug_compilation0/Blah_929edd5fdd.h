@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_Blah_929edd5fdd
+                #define HEADER_GUARD_Blah_929edd5fdd
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Blah_929edd5fdd {
+                union {
+                    	bool item0;
+	struct class_Str item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_Blah_929edd5fdd_to_string(struct class_Blah_929edd5fdd obj);
+            bool meth_Blah_929edd5fdd_equals(struct class_Blah_929edd5fdd a, struct class_Blah_929edd5fdd b);
+            
+            void incref_Blah_929edd5fdd(struct class_Blah_929edd5fdd obj);
+            void decref_Blah_929edd5fdd(struct class_Blah_929edd5fdd obj);
+            
+                #endif
+                
@@ -0,0 +1,98 @@
+#include <lib/oomph.h>
+#include "Blah_94e19d66d1.h"
+#include "bundle_builtins_c399a735f1.h"
+
+            static struct StringBuf string0_Blah_a1459dda48_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x6c', '\x61', '\x68' },
+                .malloced = false,
+            };
+            static struct class_Str string0_Blah_a1459dda48 = {
+                .buf = &string0_Blah_a1459dda48_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            
+            struct class_Str meth_Blah_94e19d66d1_to_string(struct class_Blah_94e19d66d1 obj)
+            {
+                struct class_Str valstr;
+                switch(obj.membernum) {
+                    
+                case 0:
+                    valstr = meth_Bool_to_string(obj.val.item0);
+                    break;
+                
+                case 1:
+                    valstr = meth_Int_to_string(obj.val.item1);
+                    break;
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Blah_a1459dda48), (int)obj.membernum);
+                }
+
+                struct class_Str res = string0_Blah_a1459dda48;
+                // TODO: missing incref, although doesn't matter since these
+                //       strings are not reference counted
+                oomph_string_concat_inplace_cstr(&res, "(");
+                oomph_string_concat_inplace(&res, valstr);
+                oomph_string_concat_inplace_cstr(&res, ")");
+                string_decref(valstr);
+                return res;
+            }
+
+            bool meth_Blah_94e19d66d1_equals(struct class_Blah_94e19d66d1 a, struct class_Blah_94e19d66d1 b)
+            {
+                if (a.membernum != b.membernum)
+                    return false;
+                switch(a.membernum) {
+                    
+                case 0:
+                    return meth_Bool_equals(
+                        a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Int_equals(
+                        a.val.item1, b.val.item1);
+                
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Blah_a1459dda48), (int)a.membernum);
+                }
+            }
+            
+            void incref_Blah_94e19d66d1(struct class_Blah_94e19d66d1 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    (void)0;
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            void decref_Blah_94e19d66d1(struct class_Blah_94e19d66d1 obj) {
+                switch(obj.membernum) {
+                    case -1:   // variable not in use
+                        break;
+                    
+                case 0:
+                    (void)0;
+                    break;
+                
+                case 1:
+                    (void)0;
+                    break;
+                
+                    default:
+                        assert(0);
+                }
+            }
+            
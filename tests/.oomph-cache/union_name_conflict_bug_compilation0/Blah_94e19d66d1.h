@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_Blah_94e19d66d1
+                #define HEADER_GUARD_Blah_94e19d66d1
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+            struct class_Blah_94e19d66d1 {
+                union {
+                    	bool item0;
+	int64_t item1;
+
+                } val;
+                short membernum;
+            };
+            
+            struct class_Str meth_Blah_94e19d66d1_to_string(struct class_Blah_94e19d66d1 obj);
+            bool meth_Blah_94e19d66d1_equals(struct class_Blah_94e19d66d1 a, struct class_Blah_94e19d66d1 b);
+            
+            void incref_Blah_94e19d66d1(struct class_Blah_94e19d66d1 obj);
+            void decref_Blah_94e19d66d1(struct class_Blah_94e19d66d1 obj);
+            
+                #endif
+                
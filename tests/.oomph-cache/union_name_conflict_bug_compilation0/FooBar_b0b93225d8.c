@@ -0,0 +1,89 @@
+#include <lib/oomph.h>
+#include "FooBar_b0b93225d8.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Blah_929edd5fdd.h"
+#include "Blah_94e19d66d1.h"
+
+            static struct StringBuf string0_FooBar_b7eea3434a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x42', '\x61', '\x72' },
+                .malloced = false,
+            };
+            static struct class_Str string0_FooBar_b7eea3434a = {
+                .buf = &string0_FooBar_b7eea3434a_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            struct class_FooBar_b0b93225d8* ctor_FooBar_b0b93225d8(void)
+            {
+                struct class_FooBar_b0b93225d8* obj = malloc(sizeof(*obj));
+                assert(obj);
+                obj->refcount = 1;
+                
+                
+                return obj;
+            }
+
+            void dtor_FooBar_b0b93225d8(void *ptr)
+            {
+                struct class_FooBar_b0b93225d8 *obj = ptr;
+                
+                free(obj);
+            }
+            
+                struct class_Str meth_FooBar_b0b93225d8_to_string(struct class_FooBar_b0b93225d8* self)
+                {
+                    struct class_Str res = string0_FooBar_b7eea3434a;
+                    struct class_Str tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_FooBar_b0b93225d8_equals(struct class_FooBar_b0b93225d8* var1, struct class_FooBar_b0b93225d8* var2){bool var3;
+bool retval;
+var3 = (var1 == var2);
+(void)0; retval = var3; goto out;
+out: (void)0;
+(void)0;
+return retval;
+}struct class_Blah_94e19d66d1 meth_FooBar_b0b93225d8_bar(struct class_FooBar_b0b93225d8* var1){int64_t var2;
+struct class_Blah_94e19d66d1 var3;
+var3.membernum = -1;
+struct class_Blah_94e19d66d1 retval;
+var2 = 123LL;
+var3 = (struct class_Blah_94e19d66d1){ .val = { .item1 = var2 }, .membernum = 1 };
+retval = var3; var3.membernum = -1;
+goto out;
+out: (void)0;
+decref_Blah_94e19d66d1(var3);
+(void)0;
+return retval;
+}void meth_FooBar_b0b93225d8_baz(struct class_FooBar_b0b93225d8* var1, struct class_Blah_929edd5fdd var2){bool var3;
+struct class_Str var6;
+var6.buf = NULL;
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) goto label4;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) goto label5;
+label4: (void)0;
+
+            if (var2.membernum != 1)
+                panic_printf("'as' failed");   // TODO: better message?
+
+            var6 = var2.val.item1;
+            string_incref(var6);
+if (oomph_true) goto label7;
+label5: (void)0;
+label7: (void)0;
+out: (void)0;
+string_decref(var6);
+(void)0;
+}
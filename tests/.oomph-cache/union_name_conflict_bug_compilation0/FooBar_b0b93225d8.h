@@ -0,0 +1,23 @@
+
+                #ifndef HEADER_GUARD_FooBar_b0b93225d8
+                #define HEADER_GUARD_FooBar_b0b93225d8
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Blah_929edd5fdd.h"
+#include "Blah_94e19d66d1.h"
+
+            struct class_FooBar_b0b93225d8 {
+                REFCOUNT_HEADER
+                
+            };
+            
+            struct class_FooBar_b0b93225d8* ctor_FooBar_b0b93225d8(void);
+            void dtor_FooBar_b0b93225d8(void *ptr);
+            
+                struct class_Str meth_FooBar_b0b93225d8_to_string(struct class_FooBar_b0b93225d8* obj);
+                bool meth_FooBar_b0b93225d8_equals(struct class_FooBar_b0b93225d8* var1, struct class_FooBar_b0b93225d8* var2);
+struct class_Blah_94e19d66d1 meth_FooBar_b0b93225d8_bar(struct class_FooBar_b0b93225d8* var1);
+void meth_FooBar_b0b93225d8_baz(struct class_FooBar_b0b93225d8* var1, struct class_Blah_929edd5fdd var2);
+
+                #endif
+                
@@ -0,0 +1,9 @@
+
+                #ifndef HEADER_GUARD_union_name_conflict_bug_0db9e41eee
+                #define HEADER_GUARD_union_name_conflict_bug_0db9e41eee
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+void oomph_main(void);
+
+                #endif
+                
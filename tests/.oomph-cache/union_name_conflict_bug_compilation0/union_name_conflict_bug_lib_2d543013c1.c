@@ -0,0 +1,4 @@
+#include <lib/oomph.h>
+#include "union_name_conflict_bug_lib_2d543013c1.h"
+#include "bundle_builtins_c399a735f1.h"
+
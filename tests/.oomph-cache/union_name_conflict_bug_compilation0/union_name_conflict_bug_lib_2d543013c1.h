@@ -0,0 +1,8 @@
+
+                #ifndef HEADER_GUARD_union_name_conflict_bug_lib_2d543013c1
+                #define HEADER_GUARD_union_name_conflict_bug_lib_2d543013c1
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+
+                #endif
+                
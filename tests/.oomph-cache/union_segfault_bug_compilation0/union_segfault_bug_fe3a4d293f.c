@@ -0,0 +1,41 @@
+#include <lib/oomph.h>
+#include "union_segfault_bug_fe3a4d293f.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_6cfe0bd2e0.h"
+
+            static struct StringBuf string0_a_cfe2530994_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+            };
+            static struct class_Str string0_a_cfe2530994 = {
+                .buf = &string0_a_cfe2530994_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Foo_6cfe0bd2e0 var2;
+var2.membernum = -1;
+int64_t var3;
+struct class_Foo_6cfe0bd2e0 var4;
+var4.membernum = -1;
+bool var5;
+struct class_Str var6;
+var6.buf = NULL;
+var1 = string0_a_cfe2530994; string_incref(var1);
+var2 = (struct class_Foo_6cfe0bd2e0){ .val = { .item1 = var1 }, .membernum = 1 };
+var1.buf = NULL;
+var3 = 1LL;
+var4 = (struct class_Foo_6cfe0bd2e0){ .val = { .item0 = var3 }, .membernum = 0 };
+var5 = meth_Foo_6cfe0bd2e0_equals(var2,var4);
+var6 = meth_Bool_to_string(var5);
+oomph_print(var6);
+out: (void)0;
+string_decref(var6);
+(void)0;
+decref_Foo_6cfe0bd2e0(var4);
+(void)0;
+decref_Foo_6cfe0bd2e0(var2);
+string_decref(var1);
+}
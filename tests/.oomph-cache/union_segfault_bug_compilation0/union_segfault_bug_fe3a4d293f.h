@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_union_segfault_bug_fe3a4d293f
+                #define HEADER_GUARD_union_segfault_bug_fe3a4d293f
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "Foo_6cfe0bd2e0.h"
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,25 @@
+#include <lib/oomph.h>
+#include "utf8_error_4adec05634.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_io_45f5b8a585.h"
+
+            static struct StringBuf string0_tests_latin1_txt_fcfaa14292_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73', '\x2f', '\x6c', '\x61', '\x74', '\x69', '\x6e', '\x31', '\x2e', '\x74', '\x78', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string0_tests_latin1_txt_fcfaa14292 = {
+                .buf = &string0_tests_latin1_txt_fcfaa14292_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+var1 = string0_tests_latin1_txt_fcfaa14292; string_incref(var1);
+var2 = bundle_io_45f5b8a585_read_file(var1);
+out: (void)0;
+string_decref(var2);
+string_decref(var1);
+}
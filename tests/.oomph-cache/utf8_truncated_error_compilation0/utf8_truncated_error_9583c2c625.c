@@ -0,0 +1,107 @@
+#include <lib/oomph.h>
+#include "utf8_truncated_error_9583c2c625.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "List_Str__43b70c06cb.h"
+#include "bundle_io_45f5b8a585.h"
+#include "bundle_process_e29aff3881.h"
+
+            static struct StringBuf string0_test_out_io_testing_dir_truncated_txt_225d067865_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x5f', '\x6f', '\x75', '\x74', '\x2f', '\x69', '\x6f', '\x5f', '\x74', '\x65', '\x73', '\x74', '\x69', '\x6e', '\x67', '\x5f', '\x64', '\x69', '\x72', '\x2f', '\x74', '\x72', '\x75', '\x6e', '\x63', '\x61', '\x74', '\x65', '\x64', '\x2e', '\x74', '\x78', '\x74' },
+                .malloced = false,
+            };
+            static struct class_Str string0_test_out_io_testing_dir_truncated_txt_225d067865 = {
+                .buf = &string0_test_out_io_testing_dir_truncated_txt_225d067865_buf,
+                .nbytes = 37,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_hell__5565a9489f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\xc3', '\xb8' },
+                .malloced = false,
+            };
+            static struct class_Str string1_hell__5565a9489f = {
+                .buf = &string1_hell__5565a9489f_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string2_truncate_00d15fae88_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x6e', '\x63', '\x61', '\x74', '\x65' },
+                .malloced = false,
+            };
+            static struct class_Str string2_truncate_00d15fae88 = {
+                .buf = &string2_truncate_00d15fae88_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string3__s_21292b53b7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x73' },
+                .malloced = false,
+            };
+            static struct class_Str string3__s_21292b53b7 = {
+                .buf = &string3__s_21292b53b7_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string4__1_b58904bbcc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x31' },
+                .malloced = false,
+            };
+            static struct class_Str string4__1_b58904bbcc = {
+                .buf = &string4__1_b58904bbcc_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+struct class_Str var3;
+var3.buf = NULL;
+struct class_Str var4;
+var4.buf = NULL;
+struct class_Str var5;
+var5.buf = NULL;
+struct class_Str var6;
+var6.buf = NULL;
+struct class_List_Str__43b70c06cb* var7;
+var7 = NULL;
+int64_t var8;
+struct class_Str var9;
+var9.buf = NULL;
+struct class_Str var10;
+var10.buf = NULL;
+var1 = string0_test_out_io_testing_dir_truncated_txt_225d067865; string_incref(var1);
+var2 = string1_hell__5565a9489f; string_incref(var2);
+bundle_io_45f5b8a585_write_file(var1,var2);
+var3 = string2_truncate_00d15fae88; string_incref(var3);
+var4 = string3__s_21292b53b7; string_incref(var4);
+var5 = string4__1_b58904bbcc; string_incref(var5);
+var6 = string0_test_out_io_testing_dir_truncated_txt_225d067865; string_incref(var6);
+var7 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var7,var3);
+meth_List_Str__43b70c06cb_push(var7,var4);
+meth_List_Str__43b70c06cb_push(var7,var5);
+meth_List_Str__43b70c06cb_push(var7,var6);
+var8 = bundle_process_e29aff3881_run(var7);
+var9 = string0_test_out_io_testing_dir_truncated_txt_225d067865; string_incref(var9);
+var10 = bundle_io_45f5b8a585_read_file(var9);
+out: (void)0;
+string_decref(var10);
+string_decref(var9);
+(void)0;
+decref((var7), dtor_List_Str__43b70c06cb);
+string_decref(var6);
+string_decref(var5);
+string_decref(var4);
+string_decref(var3);
+string_decref(var2);
+string_decref(var1);
+}
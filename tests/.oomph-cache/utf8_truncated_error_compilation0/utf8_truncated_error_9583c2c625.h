@@ -0,0 +1,12 @@
+
+                #ifndef HEADER_GUARD_utf8_truncated_error_9583c2c625
+                #define HEADER_GUARD_utf8_truncated_error_9583c2c625
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_io_45f5b8a585.h"
+#include "bundle_process_e29aff3881.h"
+struct class_List_Str__43b70c06cb;
+void oomph_main(void);
+
+                #endif
+                
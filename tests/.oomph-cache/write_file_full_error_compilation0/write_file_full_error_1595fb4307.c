@@ -0,0 +1,37 @@
+#include <lib/oomph.h>
+#include "write_file_full_error_1595fb4307.h"
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_io_45f5b8a585.h"
+
+            static struct StringBuf string0__dev_full_e126b744e9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f', '\x64', '\x65', '\x76', '\x2f', '\x66', '\x75', '\x6c', '\x6c' },
+                .malloced = false,
+            };
+            static struct class_Str string0__dev_full_e126b744e9 = {
+                .buf = &string0__dev_full_e126b744e9_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            
+            static struct StringBuf string1_hello_ce07e8d940_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+            };
+            static struct class_Str string1_hello_ce07e8d940 = {
+                .buf = &string1_hello_ce07e8d940_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            void oomph_main(void){struct class_Str var1;
+var1.buf = NULL;
+struct class_Str var2;
+var2.buf = NULL;
+var1 = string0__dev_full_e126b744e9; string_incref(var1);
+var2 = string1_hello_ce07e8d940; string_incref(var2);
+bundle_io_45f5b8a585_write_file(var1,var2);
+out: (void)0;
+string_decref(var2);
+string_decref(var1);
+}
@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_write_file_full_error_1595fb4307
+                #define HEADER_GUARD_write_file_full_error_1595fb4307
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_io_45f5b8a585.h"
+void oomph_main(void);
+
+                #endif
+                
@@ -0,0 +1,10 @@
+
+                #ifndef HEADER_GUARD_write_file_permission_error_fd37d6dd19
+                #define HEADER_GUARD_write_file_permission_error_fd37d6dd19
+                #include <lib/oomph.h>
+#include "bundle_builtins_c399a735f1.h"
+#include "bundle_io_45f5b8a585.h"
+void oomph_main(void);
+
+                #endif
+                